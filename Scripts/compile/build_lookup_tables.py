@@ -0,0 +1,88 @@
+"""
+Regenerates the compact lookup tables read by sims_ai_chat_scripts/lookup_tables.py.
+
+The dict literals in Scripts/lookup_sources stay the editable source. They live outside the
+mod package so the game never imports them. The generated *_table.py modules do ship inside
+the package, and the game imports them with everything else at startup, which is cheap: they
+only hold bytes constants. Run this after changing one of the sources (and before compile.py):
+
+    python build_lookup_tables.py
+"""
+import os
+import sys
+from array import array
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(SCRIPTS_DIR, 'sims_ai_chat_scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from lookup_sources.moodlet_data import MOODLET_LOOKUP
+from lookup_sources.context_buff_data import CONTEXT_BUFF_LOOKUP
+from lookup_sources.trait_data import TRAIT_LOOKUP
+
+FIELD_SEPARATOR = "\x1f" # Must match lookup_tables.FIELD_SEPARATOR
+BYTES_PER_LINE = 96
+
+TABLES = (
+    ('moodlet_table.py', 'moodlet_data.py', MOODLET_LOOKUP),
+    ('context_buff_table.py', 'context_buff_data.py', CONTEXT_BUFF_LOOKUP),
+    ('trait_table.py', 'trait_data.py', TRAIT_LOOKUP),
+)
+
+def _encode_value(value):
+    if isinstance(value, tuple):
+        if any(FIELD_SEPARATOR in field for field in value):
+            raise ValueError(f"Field contains the separator: {value!r}")
+        return FIELD_SEPARATOR.join(value), len(value)
+    return value, 1
+
+def _bytes_literal(name, data):
+    lines = [f"{name} = ("]
+    for i in range(0, len(data), BYTES_PER_LINE):
+        lines.append(f"    {data[i:i + BYTES_PER_LINE]!r}")
+    if not data:
+        lines.append("    b''")
+    lines.append(")")
+    return "\n".join(lines)
+
+def build_table(lookup):
+    """Returns (ids, offsets, blob, fields) for one id -> str/tuple mapping."""
+    ids = array('Q')
+    offsets = array('I', [0])
+    blob = bytearray()
+    fields = None
+    for key in sorted(lookup):
+        text, value_fields = _encode_value(lookup[key])
+        if fields is None:
+            fields = value_fields
+        elif fields != value_fields:
+            raise ValueError(f"Mixed value shapes at id {key}")
+        ids.append(key)
+        blob += text.encode('utf-8')
+        offsets.append(len(blob))
+    if sys.byteorder != 'little':
+        ids.byteswap()
+        offsets.byteswap()
+    return ids, offsets, bytes(blob), fields or 1
+
+def write_table(file_name, source_name, lookup):
+    ids, offsets, blob, fields = build_table(lookup)
+    parts = [
+        f"# Scripts/sims_ai_chat_scripts/{file_name}",
+        f"# GENERATED from Scripts/lookup_sources/{source_name} by Scripts/compile/build_lookup_tables.py - do not edit.",
+        "",
+        f"FIELDS = {fields}",
+        f"COUNT = {len(ids)}",
+        _bytes_literal("IDS", ids.tobytes()),
+        _bytes_literal("OFFSETS", offsets.tobytes()),
+        _bytes_literal("BLOB", blob),
+        ""
+    ]
+    path = os.path.join(PACKAGE_DIR, file_name)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("\n".join(parts))
+    print(f"{file_name}: {len(ids)} entries, {len(blob) + len(ids) * 8 + len(offsets) * 4} bytes")
+
+if __name__ == '__main__':
+    for file_name, source_name, lookup in TABLES:
+        write_table(file_name, source_name, lookup)
@@ -1,4 +1,4 @@
-#Scripts/sims_ai_chat_scripts/context_buff_data.py
+# Scripts/lookup_sources/context_buff_data.py
 CONTEXT_BUFF_LOOKUP = {
     100087: "Reacted to Grim Reaper during a fire",
     100091: "Reacting to a streaker",
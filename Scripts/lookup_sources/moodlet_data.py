@@ -1,4 +1,4 @@
-# Scripts/sims_ai_chat_scripts/moodlet_data.py
+# Scripts/lookup_sources/moodlet_data.py
 
 MOODLET_LOOKUP = {
     100441: "Frustrated about losing profits in their business career.",
@@ -1,4 +1,4 @@
-# Scripts/sims_ai_chat_scripts/trait_data.py
+# Scripts/lookup_sources/trait_data.py
 
 # Format: GUID (Decimal): ("Display Name", "Type")
 TRAIT_LOOKUP = {
@@ -0,0 +1,37 @@
+# Scripts/sims_ai_chat_scripts/buff_index.py
+
+from sims_ai_chat_scripts.lookup_tables import CONTEXT_BUFF_LOOKUP, TRAIT_LOOKUP
+
+# Lower-cased trait name -> the display names spelled that way (a few traits share a name)
+_TRAIT_NAMES_LOWER = {}
+
+# Context buff id -> frozenset of trait display names its description mentions.
+# Filled per buff on first use: scanning all ~8k descriptions for ~800 trait names up front
+# costs most of a second, while a save only ever meets a few hundred of those buffs.
+BUFF_TRAIT_MENTIONS = {}
+
+def _trait_names_lower():
+    if not _TRAIT_NAMES_LOWER:
+        for trait_name, _ in TRAIT_LOOKUP.values():
+            _TRAIT_NAMES_LOWER.setdefault(trait_name.lower(), set()).add(trait_name)
+    return _TRAIT_NAMES_LOWER
+
+def get_trait_mentions(buff_id):
+    """Trait names mentioned (case-insensitive substring) in the context buff's description."""
+    mentions = BUFF_TRAIT_MENTIONS.get(buff_id)
+    if mentions is None:
+        description = CONTEXT_BUFF_LOOKUP.get(buff_id)
+        if description is None:
+            return frozenset()
+        description = description.lower()
+        mentions = frozenset(
+            trait_name
+            for lower_name, trait_names in _trait_names_lower().items() if lower_name in description
+            for trait_name in trait_names
+        )
+        BUFF_TRAIT_MENTIONS[buff_id] = mentions
+    return mentions
+
+def mentions_any_trait(buff_id, trait_names):
+    """True if the buff's description names one of trait_names (a set of display names)."""
+    return not get_trait_mentions(buff_id).isdisjoint(trait_names)
@@ -0,0 +1,132 @@
+# Scripts/sims_ai_chat_scripts/channel_service.py
+
+import threading
+from collections import deque
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+from sims_ai_chat_scripts.http_sender import SimsAIHttpSender
+from sims_ai_chat_scripts import server_connection
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'ChannelService')
+
+# --- CONFIGURATION ---
+FAST_INTERVAL = 0.5  # Seconds between polls while a chat is open
+IDLE_INTERVAL = 5    # Seconds between polls otherwise (still keeps the server's watchdog fed)
+RETRY_INTERVAL = 2   # Seconds to wait after the server could not be reached
+CHANNEL_TIMEOUT = 2
+
+# Server lease (see /system/lease): polls renew a short one, this covers the long stall of
+# a loading screen, including the save written while travelling or leaving the lot
+LOADING_LEASE = 180  # Seconds
+
+def request_lease(seconds, reason):
+    """Asks the server to stay up for `seconds` without hearing from us. Queued on the sender, never retried."""
+    SimsAIHttpSender.get().post("/system/lease", {"seconds": seconds, "reason": reason}, retries=0)
+
+def release_lease():
+    """Ends a long lease early; the regular polls keep the server up from here."""
+    SimsAIHttpSender.get().post("/system/lease", {"release": True}, retries=0)
+
+class SimsAIChannelService(CommonService):
+    """
+    The single game <-> server link: one thread polls /system/channel, which doubles as the
+    heartbeat, delivers server commands (SCRAPE, RESUME) and carries the id of the last
+    command run back as its acknowledgement. Commands touch game state, so the poll thread only
+    queues them and the next zone update runs them on the game thread. The cadence follows
+    the chat: FAST_INTERVAL while one is open, IDLE_INTERVAL otherwise.
+    """
+    def __init__(self):
+        self._is_running = False
+        self._thread = None
+        self._wake = threading.Event()
+        self._chat_active = False
+        self._last_command_id = 0
+        self._server_instance = None
+        self._commands = deque() # Received, not yet run on the game thread
+
+    def start(self):
+        if self._is_running: return
+
+        self._is_running = True
+        self._thread = threading.Thread(target=self._channel_loop)
+        # Daemon threads die automatically when the main process (The Sims 4) quits
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def stop(self):
+        self._is_running = False
+        self._wake.set()
+
+    def set_chat_active(self, is_active):
+        """Switches the poll cadence. Starting a chat polls immediately instead of finishing an idle wait."""
+        self._chat_active = is_active
+        if is_active:
+            self.start()
+            self._wake.set()
+
+    def _channel_loop(self):
+        while self._is_running:
+            interval = FAST_INTERVAL if self._chat_active else IDLE_INTERVAL
+            try:
+                response = server_connection.request("POST", "/system/channel",
+                                                     {"ack": self._last_command_id, "chat_active": self._chat_active},
+                                                     timeout=CHANNEL_TIMEOUT)
+                if not self._chat_active:
+                    interval = response.get("interval", interval)
+                if response.get("instance") != self._server_instance:
+                    # First contact or a restarted server: commands issued before we knew it are stale
+                    self._server_instance = response.get("instance")
+                    self._last_command_id = response.get("command_id", 0)
+                self._dispatch(response.get("command", "WAIT"), response.get("command_id", 0))
+            except Exception:
+                # Server might be down or starting up; keep trying quietly
+                interval = max(interval, RETRY_INTERVAL)
+
+            self._wake.wait(interval)
+            self._wake.clear()
+        server_connection.close_connection()
+
+    def _dispatch(self, command, command_id):
+        if command == "WAIT" or command_id <= self._last_command_id:
+            return
+        # Acknowledged with the next poll; a command is never run twice even if that poll is lost
+        self._last_command_id = command_id
+        self._commands.append(command)
+
+    def run_commands(self):
+        """Runs the received commands. Called on the game thread."""
+        from sims_ai_chat_scripts.chat_service import SimsAIChatService
+        while self._commands:
+            command = self._commands.popleft()
+            try:
+                SimsAIChatService.get().handle_game_command(command)
+            except Exception as e:
+                log.error(f"Failed to run game command {command}", exception=e)
+
+# --- REGISTER LIFECYCLE HOOK AND GAME THREAD PUMP (S4CL Compliant) ---
+class SimsAIChannelListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_update(event_data: S4CLZoneUpdateEvent):
+        SimsAIChannelService.get().run_commands()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # Triggered when a lot finishes loading
+        SimsAIChannelService.get().start()
+        release_lease()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_teardown(event_data: S4CLZoneTeardownEvent):
+        # Travel, loading another save or quitting: the next poll may be minutes away
+        request_lease(LOADING_LEASE, "zone teardown")
+        return True
@@ -1,10 +1,9 @@
 # Scripts/sims_ai_chat_scripts/chat_service.py
 
 import json
-import urllib.request
-import threading
-import time
+import heapq
 import os 
+import time
 import services
 import sims4.resources
 from sims4communitylib.utils.common_time_utils import CommonTimeUtils
@@ -13,14 +12,23 @@ from sims4communitylib.utils.common_log_registry import CommonLogRegistry
 from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand
 from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
 from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
-from sims4communitylib.utils.sims.common_sim_genealogy_utils import CommonSimGenealogyUtils
 from sims4communitylib.utils.sims.common_gender_utils import CommonGenderUtils
 from sims_ai_chat_scripts.modinfo import ModInfo
-from sims_ai_chat_scripts.trait_data import TRAIT_LOOKUP
+from sims_ai_chat_scripts.game_identity import get_game_identity
+from sims_ai_chat_scripts.genealogy_index import SimsAIGenealogyIndex
+from sims_ai_chat_scripts.http_sender import SimsAIHttpSender
+from sims_ai_chat_scripts.channel_service import SimsAIChannelService
+from sims_ai_chat_scripts.profile_cache import SimsAIProfileCache, SECTION_IDENTITY, SECTION_STATE, SECTION_RELATIONS
+from sims_ai_chat_scripts.skill_names import get_skill_name
+from sims_ai_chat_scripts.residence_cache import SimsAIResidenceCache
+from sims_ai_chat_scripts.location_service import SimsAILocationService
+from sims_ai_chat_scripts.scrape_scheduler import SimsAIScrapeScheduler
+from sims_ai_chat_scripts import perf
 
 # --- IMPORTS ---
-from sims_ai_chat_scripts.moodlet_data import MOODLET_LOOKUP
-from sims_ai_chat_scripts.context_buff_data import CONTEXT_BUFF_LOOKUP
+# Compact tables, loaded on the first chat (see lookup_tables.py)
+from sims_ai_chat_scripts.lookup_tables import MOODLET_LOOKUP, CONTEXT_BUFF_LOOKUP, TRAIT_LOOKUP
+from sims_ai_chat_scripts.buff_index import mentions_any_trait
 from sims4communitylib.utils.sims.common_buff_utils import CommonBuffUtils 
 
 # --- S4CL UTILITIES ---
@@ -30,175 +38,259 @@ from sims4communitylib.utils.sims.common_trait_utils import CommonTraitUtils
 from sims4communitylib.utils.sims.common_relationship_utils import CommonRelationshipUtils
 from sims4communitylib.utils.sims.common_age_utils import CommonAgeUtils
 from sims4communitylib.utils.sims.common_species_utils import CommonSpeciesUtils
-from sims4communitylib.utils.sims.common_sim_skill_utils import CommonSimSkillUtils
 
 log = CommonLogRegistry.get().register_log('SimsAIChat', 'ChatService')
 
+# --- CONFIGURATION ---
+PREFETCH_ENABLED = True # Warm caches when the chat pie menu is shown on a sim
+PREFETCH_COOLDOWN = 15  # Seconds before the same sim is prefetched again
+
 class SimsAIChatService(CommonService):
     def __init__(self):
-        self._polling_thread = None
-        self._is_polling = False
         self.current_targets = [] # Stores SimInfo objects for re-scraping
+        self._last_prefetch = {} # sim id -> monotonic time of its last prefetch
 
     # ------------------------------------------------------------------
     # 1. CHAT SESSIONS
     # ------------------------------------------------------------------
 
     def start_chat_session(self, target_sim_info):
-        try:
-            # 1. Save Target for Dynamic Updates
-            target_sim_info = CommonSimUtils.get_sim_info(target_sim_info)
-            self.current_targets = [target_sim_info] 
+        # 1. Save Target for Dynamic Updates
+        target_sim_info = CommonSimUtils.get_sim_info(target_sim_info)
+        self.current_targets = [target_sim_info] 
 
-            # 2. Initial Scrape
-            active_sim_info = CommonSimUtils.get_active_sim_info()
-            player_profile = self._scrape_player_profile(active_sim_info)
-            location_data = self._scrape_location_data()
-            time_data = self._scrape_time_context()
+        # 2. Scrape over the next few ticks, then send (see scrape_scheduler.py)
+        SimsAIScrapeScheduler.get().submit("chat.start", self._single_scrape_job(target_sim_info),
+                                           on_done=self._send_payload, on_error=self._on_scrape_failed)
 
-            target_profile = self._scrape_sim_profile(target_sim_info, active_sim_info)
+    def start_group_chat_session(self, target_sims_list):
+        # 1. Save Targets
+        self.current_targets = [CommonSimUtils.get_sim_info(t) for t in target_sims_list]
 
-            context_payload = target_profile.copy() 
-            context_payload["sim_name"] = target_profile["name"]
-            context_payload["player_sim"] = player_profile
-            context_payload["location"] = location_data
-            context_payload["time_context"] = time_data
-            context_payload["mode"] = "SINGLE"
+        # 2. Scrape over the next few ticks, then send
+        SimsAIScrapeScheduler.get().submit("chat.start_group", self._group_scrape_job(list(self.current_targets)),
+                                           on_done=self._send_payload, on_error=self._on_scrape_failed)
 
-            self._send_payload(context_payload)
+    def _single_scrape_job(self, target_sim_info):
+        # Freeze the world first: the snapshot is taken over several ticks
+        CommonTimeUtils.pause_the_game()
+        active_sim_info = CommonSimUtils.get_active_sim_info()
+        player_profile = self._scrape_player_profile(active_sim_info)
+        yield
+        location_data = self._scrape_location_data()
+        time_data = self._scrape_time_context()
+        yield
+
+        target_profile = yield from self._scrape_sim_profile_steps(target_sim_info, active_sim_info)
+
+        context_payload = target_profile.copy() 
+        context_payload["sim_name"] = target_profile["name"]
+        context_payload["player_sim"] = player_profile
+        context_payload["location"] = location_data
+        context_payload["time_context"] = time_data
+        context_payload["mode"] = "SINGLE"
+        return context_payload
+
+    def _group_scrape_job(self, targets):
+        CommonTimeUtils.pause_the_game()
+        active_sim_info = CommonSimUtils.get_active_sim_info()
+        player_profile = self._scrape_player_profile(active_sim_info)
+        yield
+        location_data = self._scrape_location_data()
+        time_data = self._scrape_time_context()
+        yield
+
+        participants_data = []
+        participant_names = []
+
+        # Scrape each Sim; relationships inside the group come from one shared matrix
+        for target in targets:
+            profile = yield from self._scrape_sim_profile_steps(target, active_sim_info)
+            participants_data.append(profile)
+            participant_names.append(profile['name'].split()[0])
+        relationship_matrix = self._scrape_relationship_matrix(targets)
+
+        if len(participant_names) > 3: display_name = "Group Chat"
+        else: display_name = ", ".join(participant_names)
 
-        except Exception as e:
-            log.error("Failed to start session", exception=e)
-            CommonTimeUtils.set_game_speed_normal()
+        return {
+            "mode": "GROUP",
+            "sim_name": display_name,
+            "player_sim": player_profile,
+            "location": location_data,
+            "time_context": time_data,
+            "participants": participants_data,
+            "relationship_matrix": relationship_matrix
+        }
 
-    def start_group_chat_session(self, target_sims_list):
+    def prefetch_chat(self, target_sim_info):
+        """
+        Speculatively warms a chat with the sim before the player clicks: the profile cache on
+        this side (sliced like any scrape, without pausing) and the memory block on the server.
+        Called from the pie menu test, so it must stay cheap and never raise. Each sim has its
+        own cooldown, so moving the cursor between sims does not re-send them.
+        """
+        if not PREFETCH_ENABLED or self.current_targets:
+            return
         try:
-            # 1. Save Targets
-            self.current_targets = [CommonSimUtils.get_sim_info(t) for t in target_sims_list]
-
-            # 2. Initial Scrape
-            active_sim_info = CommonSimUtils.get_active_sim_info()
-            player_profile = self._scrape_player_profile(active_sim_info)
-            location_data = self._scrape_location_data()
-            time_data = self._scrape_time_context()
-
-            participants_data = []
-            participant_names = []
-
-            # 3. Scrape each Sim, passing the REST of the group for relationship checks
-            for target in self.current_targets:
-                # Create a list of 'other' sims (excluding the current target)
-                other_sims = [t for t in self.current_targets if t is not target]
-                
-                profile = self._scrape_sim_profile(target, active_sim_info, other_sims)
-                participants_data.append(profile)
-                participant_names.append(profile['name'].split()[0])
-
-            if len(participant_names) > 3: display_name = "Group Chat"
-            else: display_name = ", ".join(participant_names)
-
-            context_payload = {
-                "mode": "GROUP",
-                "sim_name": display_name,
-                "player_sim": player_profile,
-                "location": location_data,
-                "time_context": time_data,
-                "participants": participants_data
-            }
+            target_sim_info = CommonSimUtils.get_sim_info(target_sim_info)
+            sim_id = CommonSimUtils.get_sim_id(target_sim_info)
+            now = time.monotonic()
+            if now - self._last_prefetch.get(sim_id, -PREFETCH_COOLDOWN) < PREFETCH_COOLDOWN:
+                return
+            # Expired entries are dropped, so the map only holds sims of the last few seconds
+            self._last_prefetch = {k: t for k, t in self._last_prefetch.items() if now - t < PREFETCH_COOLDOWN}
+            self._last_prefetch[sim_id] = now
+            SimsAIScrapeScheduler.get().submit("chat.prefetch", self._prefetch_job(target_sim_info),
+                                               on_done=self._send_prefetch)
+        except Exception as e:
+            log.error("Failed to queue chat prefetch", exception=e)
 
-            self._send_payload(context_payload)
+    def _prefetch_job(self, target_sim_info):
+        active_sim_info = CommonSimUtils.get_active_sim_info()
+        yield from self._scrape_sim_profile_steps(target_sim_info, active_sim_info)
+        return {
+            "player_id": CommonSimUtils.get_sim_id(active_sim_info),
+            "sim_ids": [CommonSimUtils.get_sim_id(target_sim_info)],
+            "zone_id": services.current_zone_id()
+        }
 
-        except Exception as e:
-            log.error("Failed to start group session", exception=e)
-            CommonTimeUtils.set_game_speed_normal()
+    def _send_prefetch(self, payload):
+        payload.update(get_game_identity())
+        # Only a hint: never retried, and the real chat start works without it
+        SimsAIHttpSender.get().post("/game/prefetch", payload, retries=0)
+
+    def _on_scrape_failed(self, error):
+        # Logged by the scheduler; the chat never started, so do not leave the game paused
+        # or keep targets around (they would block prefetching until another chat ends)
+        self.current_targets = []
+        CommonTimeUtils.set_game_speed_normal()
 
     # ------------------------------------------------------------------
     # 2. DYNAMIC UPDATE LOGIC (NEW)
     # ------------------------------------------------------------------
     def _perform_context_update(self):
-        """ Re-scrapes current targets and sends update to server. """
-        try:
-            log.debug("Performing Context Update...")
-            
-            # 1. Force Pause (Requested Requirement)
-            CommonTimeUtils.pause_the_game()
-
-            active_sim_info = CommonSimUtils.get_active_sim_info()
-            
-            # 2. Re-Scrape Environment
-            update_payload = {
-                "location": self._scrape_location_data(),
-                "time_context": self._scrape_time_context(),
-                "participants": [] # List of updated profiles
-            }
-
-            # 3. Re-Scrape Sims
-            for target in self.current_targets:
-                # Ensure sim is still valid
-                if target:
-                    # --- FIX: Define the peer group for this target ---
-                    other_sims = [t for t in self.current_targets if t is not target]
-                    
-                    # --- FIX: Pass other_sims to the scraper ---
-                    profile = self._scrape_sim_profile(target, active_sim_info, other_sims)
-                    
-                    update_payload["participants"].append(profile)
-
-            # 4. Send to UPDATE endpoint
-            url = "http://127.0.0.1:3000/game/update"
-            data = json.dumps(update_payload).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-            urllib.request.urlopen(req)
-            log.debug("Context Update Sent.")
+        """ Re-scrapes current targets (in slices on the game thread) and sends update to server. """
+        log.debug("Performing Context Update...")
+        # No on_error: a failed update is only logged by the scheduler, the open chat keeps the game paused
+        SimsAIScrapeScheduler.get().submit("chat.update", self._update_scrape_job(list(self.current_targets)),
+                                           on_done=self._send_update)
+
+    def _update_scrape_job(self, targets):
+        # 1. Force Pause (Requested Requirement)
+        CommonTimeUtils.pause_the_game()
 
-        except Exception as e:
-            log.error("Failed to update context", exception=e)
+        active_sim_info = CommonSimUtils.get_active_sim_info()
+        
+        # 2. Re-Scrape Environment
+        update_payload = {
+            "location": self._scrape_location_data(),
+            "time_context": self._scrape_time_context(),
+            "participants": [] # List of updated profiles
+        }
+        yield
+
+        # 3. Re-Scrape Sims (ensure each sim is still valid)
+        targets = [target for target in targets if target]
+        for target in targets:
+            profile = yield from self._scrape_sim_profile_steps(target, active_sim_info)
+            update_payload["participants"].append(profile)
+        if len(targets) > 1:
+            update_payload["relationship_matrix"] = self._scrape_relationship_matrix(targets)
+        return update_payload
+
+    def _send_update(self, update_payload):
+        # 4. Send to UPDATE endpoint
+        update_payload["perf"] = perf.get_summary()
+        SimsAIHttpSender.get().post("/game/update", update_payload)
+        log.debug("Context Update Queued.")
 
     # ------------------------------------------------------------------
-    # 3. POLLING LOOP
+    # 3. GAME COMMANDS (delivered by SimsAIChannelService)
     # ------------------------------------------------------------------
-    def _start_polling_thread(self):
-        if self._polling_thread is not None and self._polling_thread.is_alive():
-            self._is_polling = False
-            time.sleep(0.5)
-        self._is_polling = True
-        self._polling_thread = threading.Thread(target=self._poll_server_loop)
-        self._polling_thread.setDaemon(True) 
-        self._polling_thread.start()
-
-    def _poll_server_loop(self):
-        url = "http://127.0.0.1:3000/game/status"
-        while self._is_polling:
-            try:
-                time.sleep(0.5) # Poll frequently for responsiveness
-                with urllib.request.urlopen(url) as response:
-                    data = json.loads(response.read().decode('utf-8'))
-                    command = data.get("command")
-                    
-                    if command == "RESUME":
-                        self._resume_game()
-                        break
-                    
-                    elif command == "SCRAPE":
-                        # Server needs fresh data before replying
-                        self._perform_context_update()
-
-            except:
-                # Connection lost or server restarting
-                time.sleep(2) 
+    def _start_chat_channel(self):
+        # Commands of this chat arrive over the shared channel, which polls fast until RESUME
+        SimsAIChannelService.get().set_chat_active(True)
+
+    def handle_game_command(self, command):
+        if command == "RESUME":
+            self._resume_game()
+        elif command == "SCRAPE":
+            # Server needs fresh data before replying
+            self._perform_context_update()
 
     def _resume_game(self):
-        self._is_polling = False
+        SimsAIChannelService.get().set_chat_active(False)
         self.current_targets = [] # Clear memory
         CommonTimeUtils.set_game_speed_normal()
 
     # ------------------------------------------------------------------
     # 4. SCRAPING HELPERS (Existing)
     # ------------------------------------------------------------------
-    def _scrape_sim_profile(self, target_sim_info, active_sim_info, other_sims=None):
+    def _scrape_sim_profile_steps(self, target_sim_info, active_sim_info):
+        """Generator for scrape jobs: yields between profile sections and returns the profile dict."""
         target_sim_info = CommonSimUtils.get_sim_info(target_sim_info)
         sim_id = CommonSimUtils.get_sim_id(target_sim_info)
-           
+
+        # Cached sections are only rebuilt after an S4CL event marked them dirty (see profile_cache.py)
+        cache = SimsAIProfileCache.get()
+        identity = cache.get_section(target_sim_info, SECTION_IDENTITY, self._build_identity_section)
+        yield
+        state = cache.get_section(target_sim_info, SECTION_STATE,
+                                  lambda sim_info: self._build_state_section(sim_info, identity["traits"]))
+        yield
+        relations = cache.get_section(target_sim_info, SECTION_RELATIONS, self._build_relations_section)
+        yield
+
+        # Residence follows household moves without an event; the zone names behind it are cached
+        # Career has no change event and is cheap, so it is always read
+        career_str = self._get_career_string(target_sim_info)
+
+        # --- RELATIONSHIPS WITH PLAYER ---
+        # Relationship tracks move continuously without events, so they are always re-read
+        friendship = CommonRelationshipUtils.get_friendship_level(target_sim_info, active_sim_info)
+        romance = CommonRelationshipUtils.get_romance_level(target_sim_info, active_sim_info)
+
+        return {
+            "sim_id": sim_id,
+            "name": identity["name"],
+            "demographics": identity["demographics"],
+            "residence": SimsAIResidenceCache.get().get_residence(target_sim_info),
+            "mood_id": state["mood_id"],
+            "social_status": relations["social_status"],
+            "active_moodlets": state["active_moodlets"],
+            "active_activity": state["active_activity"],
+            "traits": list(identity["traits"]),             
+            "gender_options": list(identity["gender_options"]), 
+            "preferences": list(identity["preferences"]),
+            "skills": identity["skills"],
+            "career": career_str,
+            "relationship_with_player": {
+                "friendship": friendship,
+                "romance": romance
+            }
+        }
+
+    @perf.timed("scrape.relationship_matrix")
+    def _scrape_relationship_matrix(self, targets):
+        """
+        Friendship and romance between every pair of the group, as N x N rows in the order of
+        sim_ids (the diagonal is 0). Both tracks are shared by the two sims, so each unordered
+        pair is read once and mirrored; the server expands the rows into relationship_with_cast.
+        """
+        sim_ids = [CommonSimUtils.get_sim_id(target) for target in targets]
+        names = [CommonSimNameUtils.get_first_name(target) for target in targets]
+        friend = [[0] * len(targets) for _ in targets]
+        romance = [[0] * len(targets) for _ in targets]
+        for i, sim_a in enumerate(targets):
+            for j in range(i + 1, len(targets)):
+                sim_b = targets[j]
+                friend[i][j] = friend[j][i] = CommonRelationshipUtils.get_friendship_level(sim_a, sim_b)
+                romance[i][j] = romance[j][i] = CommonRelationshipUtils.get_romance_level(sim_a, sim_b)
+        return {"sim_ids": sim_ids, "names": names, "friend": friend, "romance": romance}
+
+    @perf.timed("scrape.identity_section")
+    def _build_identity_section(self, target_sim_info):
         general_traits = []
         gender_orientation_traits = []
         preference_traits = []
@@ -219,8 +311,23 @@ class SimsAIChatService(CommonService):
         if not gender_orientation_traits: gender_orientation_traits.append("Standard")
         if not preference_traits: preference_traits.append("No strong preferences")
 
+        age_name = str(CommonAgeUtils.get_age(target_sim_info)).split('.')[-1].title()
+        species_name = str(CommonSpeciesUtils.get_species(target_sim_info)).split('.')[-1].title()
+
+        return {
+            "name": CommonSimNameUtils.get_full_name(target_sim_info),
+            "demographics": f"{age_name} {species_name}",
+            "traits": general_traits,
+            "gender_options": gender_orientation_traits,
+            "preferences": preference_traits,
+            "skills": self._get_top_skills(target_sim_info, limit=7)
+        }
+
+    @perf.timed("scrape.state_section")
+    def _build_state_section(self, target_sim_info, general_traits):
         active_moodlet_descriptions = [] 
         active_activity_descriptions = [] 
+        trait_names = set(general_traits)
         sim_buffs = list(CommonBuffUtils.get_buffs(target_sim_info))
         if not sim_buffs and hasattr(target_sim_info, 'Buffs'):
              sim_buffs = list(target_sim_info.Buffs)
@@ -234,90 +341,21 @@ class SimsAIChatService(CommonService):
                 desc = MOODLET_LOOKUP[buff_id]
                 active_moodlet_descriptions.append(desc[0] if isinstance(desc, tuple) else desc)
             if buff_id in CONTEXT_BUFF_LOOKUP:
-                raw_desc = CONTEXT_BUFF_LOOKUP[buff_id]
-                is_redundant = False
-                for trait in general_traits:
-                    if trait.lower() in raw_desc.lower():
-                        is_redundant = True
-                        break
-                if not is_redundant:
-                    active_activity_descriptions.append(raw_desc)
-
-        moodlets_str = "; ".join(active_moodlet_descriptions) if active_moodlet_descriptions else "No specific emotional thoughts."
-        activity_str = "; ".join(active_activity_descriptions) if active_activity_descriptions else "Idle / No specific action."
-
-        sim_name = CommonSimNameUtils.get_full_name(target_sim_info)
-        mood_name = self._get_mood_string(target_sim_info)
-        career_str = self._get_career_string(target_sim_info)
-        skills_str = self._get_top_skills(target_sim_info, limit=7)
-        social_status_str = self._get_social_status_string(target_sim_info)
-        
-        age_name = str(CommonAgeUtils.get_age(target_sim_info)).split('.')[-1].title()
-        species_name = str(CommonSpeciesUtils.get_species(target_sim_info)).split('.')[-1].title()
-
-        # --- NEW: RESIDENCE EXTRACTION ---
-        residence_str = "Looking for the home to move in."
-        try:
-            if target_sim_info.household and target_sim_info.household.home_zone_id != 0:
-                p_service = services.get_persistence_service()
-                if p_service:
-                    home_zone_id = target_sim_info.household.home_zone_id
-                    zone_proto = p_service.get_zone_proto_buff(home_zone_id)
-                    
-                    if zone_proto:
-                        lot_name = zone_proto.name
-                        
-                        # Get World Name
-                        neighborhood_id = zone_proto.neighborhood_id
-                        neigh_proto = p_service.get_neighborhood_proto_buff(neighborhood_id)
-                        world_name = neigh_proto.name if neigh_proto else "Unknown World"
-                        
-                        residence_str = f"{world_name}, {lot_name}"
-        except Exception as e:
-            # Fallback in case of error, keeping original flow safe
-            pass
-
-        # --- RELATIONSHIPS WITH PLAYER ---
-        friendship = CommonRelationshipUtils.get_friendship_level(target_sim_info, active_sim_info)
-        romance = CommonRelationshipUtils.get_romance_level(target_sim_info, active_sim_info)
-
-        # --- NEW: RELATIONSHIPS WITH CAST MEMBERS ---
-        cast_relations = []
-        if other_sims:
-            for peer in other_sims:
-                p_name = CommonSimNameUtils.get_full_name(peer).split()[0] # First name only
-                p_friend = CommonRelationshipUtils.get_friendship_level(target_sim_info, peer)
-                p_romance = CommonRelationshipUtils.get_romance_level(target_sim_info, peer)
-                
-                # Only include significant relationships to save tokens
-                if p_friend != 0 or p_romance != 0:
-                    cast_relations.append({
-                        "name": p_name,
-                        "friend": p_friend,
-                        "romance": p_romance
-                    })
+                # Skip activities that just restate a trait ("Feeling Cheerful" for a Cheerful sim)
+                if not mentions_any_trait(buff_id, trait_names):
+                    active_activity_descriptions.append(CONTEXT_BUFF_LOOKUP[buff_id])
 
         return {
-            "sim_id": sim_id,
-            "name": sim_name,
-            "demographics": f"{age_name} {species_name}",
-            "residence": residence_str, 
-            "mood_id": mood_name,
-            "social_status": social_status_str,
-            "active_moodlets": moodlets_str,
-            "active_activity": activity_str,
-            "traits": general_traits,             
-            "gender_options": gender_orientation_traits, 
-            "preferences": preference_traits,
-            "skills": skills_str,
-            "career": career_str,
-            "relationship_with_player": {
-                "friendship": friendship,
-                "romance": romance
-            },
-            "relationship_with_cast": cast_relations # <--- New Data Field
+            "mood_id": self._get_mood_string(target_sim_info),
+            "active_moodlets": "; ".join(active_moodlet_descriptions) if active_moodlet_descriptions else "No specific emotional thoughts.",
+            "active_activity": "; ".join(active_activity_descriptions) if active_activity_descriptions else "Idle / No specific action."
         }
 
+    @perf.timed("scrape.relations_section")
+    def _build_relations_section(self, target_sim_info):
+        return {"social_status": self._get_social_status_string(target_sim_info)}
+
+    @perf.timed("scrape.time_context")
     def _scrape_time_context(self):
         try:
             date_and_time = CommonTimeUtils.get_current_date_and_time()
@@ -348,6 +386,7 @@ class SimsAIChatService(CommonService):
         except Exception as e:
             return "Time Unknown"
 
+    @perf.timed("scrape.player_profile")
     def _scrape_player_profile(self, active_sim_info):
         player_gender = "Unknown"
         if CommonGenderUtils.is_male(active_sim_info): player_gender = "Male"
@@ -369,31 +408,38 @@ class SimsAIChatService(CommonService):
             "age": player_age
         }
 
+    @perf.timed("scrape.location")
     def _scrape_location_data(self):
         current_zone = services.current_zone()
         zone_id = current_zone.id
         raw_val_a = current_zone.neighborhood_id 
-        persistence_service = services.get_persistence_service()
-        raw_val_b = 0
-        if persistence_service:
-            zone_proto = persistence_service.get_zone_proto_buff(zone_id)
-            if zone_proto: raw_val_b = zone_proto.world_id 
+        zone = SimsAIResidenceCache.get().get_zone(zone_id)
+        raw_val_b = zone["world_id"] if zone else 0
         
         return {
             "zone_id": zone_id,
             "world_id": raw_val_a,        
             "neighborhood_id": raw_val_b, 
-            "lot_name": current_zone.lot.get_lot_name() if current_zone.lot else "Unknown"
+            "lot_name": current_zone.lot.get_lot_name() if current_zone.lot else "Unknown",
+            # From the synced copy, so the server need not look it up (None: let the server decide)
+            "lot_description": SimsAILocationService.get().get_description(zone_id)
         }
 
     def _send_payload(self, payload):
         log.debug(f"Payload Mode: {payload.get('mode')}")
         CommonTimeUtils.pause_the_game()
-        url = "http://127.0.0.1:3000/game/init"
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-        urllib.request.urlopen(req)
-        self._start_polling_thread()
+        payload.update(get_game_identity()) # Server keeps one memory database per save
+        payload["perf"] = perf.get_summary() # Logged by the server
+        SimsAIHttpSender.get().post("/game/init", payload, on_done=self._on_payload_sent)
+
+    def _on_payload_sent(self, response, error):
+        # Runs on the game thread once the server accepted (or never received) the chat
+        if error:
+            log.error(f"Failed to start chat on the server: {error}")
+            self.current_targets = []
+            CommonTimeUtils.set_game_speed_normal()
+            return
+        self._start_chat_channel()
 
     def _get_social_status_string(self, target_sim_info):
         try:
@@ -408,18 +454,9 @@ class SimsAIChatService(CommonService):
                 partner_names = [CommonSimNameUtils.get_full_name(p) for p in partners]
                 status_parts.append(f"In a committed relationship with {', '.join(partner_names)}")
 
-            kids_names = []
-            is_male = CommonGenderUtils.is_male(target_sim_info)
-            all_sims_gen = CommonSimUtils.get_sim_info_for_all_sims_generator()
-
-            for potential_child in all_sims_gen:
-                if potential_child is target_sim_info: continue
-                is_parent = False
-                if is_male:
-                    if CommonSimGenealogyUtils.is_father_of(target_sim_info, potential_child): is_parent = True
-                else:
-                    if CommonSimGenealogyUtils.is_mother_of(target_sim_info, potential_child): is_parent = True
-                if is_parent: kids_names.append(CommonSimNameUtils.get_full_name(potential_child))
+            # Indexed lookup instead of testing every sim of the save for parenthood
+            children = SimsAIGenealogyIndex.get().get_children(target_sim_info)
+            kids_names = [CommonSimNameUtils.get_full_name(child) for child in children]
 
             count = len(kids_names)
             if count > 0:
@@ -433,20 +470,14 @@ class SimsAIChatService(CommonService):
             return "Social status unknown."
 
     def _get_top_skills(self, sim_info, limit=5):
-        skill_list = []
         try:
-            all_skills = CommonSimSkillUtils.get_all_skills_available_for_sim_gen(sim_info)
-            for skill in all_skills:
-                if CommonSimSkillUtils.has_skill(sim_info, skill):
-                    level = int(CommonSimSkillUtils.get_current_skill_level(sim_info, skill, use_effective_skill_level=False))
-                    if level > 0:
-                        skill_name = "Unknown Skill"
-                        if hasattr(skill, '__name__'): raw_name = skill.__name__
-                        else: raw_name = str(skill)
-                        clean_name = raw_name.replace("Statistic_", "").replace("Skill_", "").replace("AdultMajor_", "").replace("AdultMinor_", "").replace("Toddler_", "").replace("Child_", "").replace("Species_", "").replace("_", " ")
-                        skill_list.append((clean_name, level))
-            skill_list.sort(key=lambda x: x[1], reverse=True)
-            top_skills = [f"{name} ({level})" for name, level in skill_list[:limit]]
+            # Only the skill statistics the sim actually has, not every skill in the game
+            skill_list = []
+            for skill in sim_info.all_skills():
+                level = int(skill.get_user_value())
+                if level > 0:
+                    skill_list.append((get_skill_name(type(skill)), level))
+            top_skills = [f"{name} ({level})" for name, level in heapq.nlargest(limit, skill_list, key=lambda x: x[1])]
             return ", ".join(top_skills) if top_skills else "None"
         except Exception as e:
             return "Unknown"
@@ -464,38 +495,6 @@ class SimsAIChatService(CommonService):
                  return ", ".join(careers) if careers else "Unemployed"
         except: return "Unemployed"
 
-    def _start_polling_thread(self):
-        if self._polling_thread is not None and self._polling_thread.is_alive():
-            self._is_polling = False
-            time.sleep(0.5)
-        self._is_polling = True
-        self._polling_thread = threading.Thread(target=self._poll_server_loop)
-        self._polling_thread.setDaemon(True) 
-        self._polling_thread.start()
-
-    def _poll_server_loop(self):
-        url = "http://127.0.0.1:3000/game/status"
-        while self._is_polling:
-            try:
-                time.sleep(0.5)
-                with urllib.request.urlopen(url) as response:
-                    data = json.loads(response.read().decode('utf-8'))
-                    command = data.get("command")
-                    
-                    if command == "RESUME":
-                        self._resume_game()
-                        break
-                    elif command == "SCRAPE":
-                        self._perform_context_update()
-
-            except:
-                time.sleep(2)
-
-    def _resume_game(self):
-        self._is_polling = False
-        self.current_targets = []
-        CommonTimeUtils.set_game_speed_normal()
-
 @CommonConsoleCommand(ModInfo.get_identity(), 'ai_chat', 'Force start chat.')
 def _force_start_chat(output: CommonConsoleCommandOutput):
     sim = CommonSimUtils.get_active_sim_info()
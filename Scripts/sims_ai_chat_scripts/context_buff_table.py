@@ -0,0 +1,3436 @@
+# Scripts/sims_ai_chat_scripts/context_buff_table.py
+# GENERATED from Scripts/lookup_sources/context_buff_data.py by Scripts/compile/build_lookup_tables.py - do not edit.
+
+FIELDS = 1
+COUNT = 8206
+IDS = (
+    b'\x8f"\x00\x00\x00\x00\x00\x00\xac"\x00\x00\x00\x00\x00\x00\xc8"\x00\x00\x00\x00\x00\x008$\x00\x00\x00\x00\x00\x009$\x00\x00\x00\x00\x00\x00V$\x00\x00\x00\x00\x00\x00l$\x00\x00\x00\x00\x00\x00p$\x00\x00\x00\x00\x00\x00u$\x00\x00\x00\x00\x00\x00z$\x00\x00\x00\x00\x00\x00\x98$\x00\x00\x00\x00\x00\x00\x99$\x00\x00\x00\x00\x00\x00'
+    b"\x9a$\x00\x00\x00\x00\x00\x00\x80%\x00\x00\x00\x00\x00\x00\x83%\x00\x00\x00\x00\x00\x00\x85%\x00\x00\x00\x00\x00\x00\x92%\x00\x00\x00\x00\x00\x00\x96%\x00\x00\x00\x00\x00\x00e&\x00\x00\x00\x00\x00\x00\xf3&\x00\x00\x00\x00\x00\x00j'\x00\x00\x00\x00\x00\x00\xa20\x00\x00\x00\x00\x00\x00\xc20\x00\x00\x00\x00\x00\x00\xca0\x00\x00\x00\x00\x00\x00"
+    b'\n1\x00\x00\x00\x00\x00\x00\x101\x00\x00\x00\x00\x00\x00H1\x00\x00\x00\x00\x00\x00I1\x00\x00\x00\x00\x00\x00Q1\x00\x00\x00\x00\x00\x00R1\x00\x00\x00\x00\x00\x00S1\x00\x00\x00\x00\x00\x00T1\x00\x00\x00\x00\x00\x00X1\x00\x00\x00\x00\x00\x00Y1\x00\x00\x00\x00\x00\x00Z1\x00\x00\x00\x00\x00\x00[1\x00\x00\x00\x00\x00\x00'
+    b'j1\x00\x00\x00\x00\x00\x00l1\x00\x00\x00\x00\x00\x00o1\x00\x00\x00\x00\x00\x00p1\x00\x00\x00\x00\x00\x00u1\x00\x00\x00\x00\x00\x00x1\x00\x00\x00\x00\x00\x00z1\x00\x00\x00\x00\x00\x00\x801\x00\x00\x00\x00\x00\x00\x831\x00\x00\x00\x00\x00\x00\x8c1\x00\x00\x00\x00\x00\x00\x8f1\x00\x00\x00\x00\x00\x00\x911\x00\x00\x00\x00\x00\x00'
+    b'\x931\x00\x00\x00\x00\x00\x00\x961\x00\x00\x00\x00\x00\x00\x991\x00\x00\x00\x00\x00\x00\x9c1\x00\x00\x00\x00\x00\x00\x9d1\x00\x00\x00\x00\x00\x00\x9e1\x00\x00\x00\x00\x00\x00\xbc1\x00\x00\x00\x00\x00\x00\xbd1\x00\x00\x00\x00\x00\x00\xca1\x00\x00\x00\x00\x00\x00\xcf1\x00\x00\x00\x00\x00\x00\xd01\x00\x00\x00\x00\x00\x00\xd21\x00\x00\x00\x00\x00\x00'
+    b'\xd31\x00\x00\x00\x00\x00\x00\xd41\x00\x00\x00\x00\x00\x00\x0e2\x00\x00\x00\x00\x00\x00\x1b2\x00\x00\x00\x00\x00\x00\x1d2\x00\x00\x00\x00\x00\x00\x1e2\x00\x00\x00\x00\x00\x00\x1f2\x00\x00\x00\x00\x00\x00 2\x00\x00\x00\x00\x00\x00"2\x00\x00\x00\x00\x00\x00#2\x00\x00\x00\x00\x00\x00$2\x00\x00\x00\x00\x00\x00&2\x00\x00\x00\x00\x00\x00'
+    b"'2\x00\x00\x00\x00\x00\x00(2\x00\x00\x00\x00\x00\x00)2\x00\x00\x00\x00\x00\x00*2\x00\x00\x00\x00\x00\x00+2\x00\x00\x00\x00\x00\x00,2\x00\x00\x00\x00\x00\x00-2\x00\x00\x00\x00\x00\x00.2\x00\x00\x00\x00\x00\x00/2\x00\x00\x00\x00\x00\x0002\x00\x00\x00\x00\x00\x0012\x00\x00\x00\x00\x00\x0022\x00\x00\x00\x00\x00\x00"
+    b'32\x00\x00\x00\x00\x00\x0042\x00\x00\x00\x00\x00\x0052\x00\x00\x00\x00\x00\x0062\x00\x00\x00\x00\x00\x0072\x00\x00\x00\x00\x00\x0082\x00\x00\x00\x00\x00\x0092\x00\x00\x00\x00\x00\x00:2\x00\x00\x00\x00\x00\x00\xb2]\x00\x00\x00\x00\x00\x00\xae^\x00\x00\x00\x00\x00\x00\xf8^\x00\x00\x00\x00\x00\x00\x10_\x00\x00\x00\x00\x00\x00'
+    b'\x18`\x00\x00\x00\x00\x00\x00\x19`\x00\x00\x00\x00\x00\x00\x1a`\x00\x00\x00\x00\x00\x00\xf8`\x00\x00\x00\x00\x00\x00;f\x00\x00\x00\x00\x00\x00Jf\x00\x00\x00\x00\x00\x00Mf\x00\x00\x00\x00\x00\x00\x87f\x00\x00\x00\x00\x00\x00\x89f\x00\x00\x00\x00\x00\x00\x8cf\x00\x00\x00\x00\x00\x00\xa4f\x00\x00\x00\x00\x00\x00\xa6f\x00\x00\x00\x00\x00\x00'
+    b'\xa8f\x00\x00\x00\x00\x00\x00\xacf\x00\x00\x00\x00\x00\x00\xaef\x00\x00\x00\x00\x00\x00\xaff\x00\x00\x00\x00\x00\x00\xb1f\x00\x00\x00\x00\x00\x00\x04g\x00\x00\x00\x00\x00\x00\x06g\x00\x00\x00\x00\x00\x00\x07g\x00\x00\x00\x00\x00\x00\x08g\x00\x00\x00\x00\x00\x00\ng\x00\x00\x00\x00\x00\x00\x12g\x00\x00\x00\x00\x00\x00Hg\x00\x00\x00\x00\x00\x00'
+    b'\xfcg\x00\x00\x00\x00\x00\x00\x14h\x00\x00\x00\x00\x00\x00\x18i\x00\x00\x00\x00\x00\x00Ui\x00\x00\x00\x00\x00\x00\x96i\x00\x00\x00\x00\x00\x00\x99i\x00\x00\x00\x00\x00\x00\xb0i\x00\x00\x00\x00\x00\x00\xb2i\x00\x00\x00\x00\x00\x00\xd0i\x00\x00\x00\x00\x00\x00\xe2i\x00\x00\x00\x00\x00\x00\xe3i\x00\x00\x00\x00\x00\x00\xfci\x00\x00\x00\x00\x00\x00'
+    b'\x02j\x00\x00\x00\x00\x00\x00\x03j\x00\x00\x00\x00\x00\x00\x04j\x00\x00\x00\x00\x00\x00\x05j\x00\x00\x00\x00\x00\x00\x06j\x00\x00\x00\x00\x00\x00\x0bj\x00\x00\x00\x00\x00\x00\x12j\x00\x00\x00\x00\x00\x00\x13j\x00\x00\x00\x00\x00\x00\x1fj\x00\x00\x00\x00\x00\x00#j\x00\x00\x00\x00\x00\x00*j\x00\x00\x00\x00\x00\x00\xb8j\x00\x00\x00\x00\x00\x00'
+    b'\xb9j\x00\x00\x00\x00\x00\x00\xbbj\x00\x00\x00\x00\x00\x00\xeaj\x00\x00\x00\x00\x00\x00\xebj\x00\x00\x00\x00\x00\x00\xfaj\x00\x00\x00\x00\x00\x00Pk\x00\x00\x00\x00\x00\x00uk\x00\x00\x00\x00\x00\x00wk\x00\x00\x00\x00\x00\x00\x87k\x00\x00\x00\x00\x00\x00\x88k\x00\x00\x00\x00\x00\x00\x9dk\x00\x00\x00\x00\x00\x00\xb7k\x00\x00\x00\x00\x00\x00'
+    b'\xbak\x00\x00\x00\x00\x00\x00\x05l\x00\x00\x00\x00\x00\x00"l\x00\x00\x00\x00\x00\x00vl\x00\x00\x00\x00\x00\x00\xb9l\x00\x00\x00\x00\x00\x00\xd9m\x00\x00\x00\x00\x00\x00\xd4n\x00\x00\x00\x00\x00\x00\xd5n\x00\x00\x00\x00\x00\x00\xd6n\x00\x00\x00\x00\x00\x00\xdcn\x00\x00\x00\x00\x00\x00\x8bo\x00\x00\x00\x00\x00\x00\xb0o\x00\x00\x00\x00\x00\x00'
+    b'\xb6o\x00\x00\x00\x00\x00\x00\xb3r\x00\x00\x00\x00\x00\x00\x84s\x00\x00\x00\x00\x00\x00\x8bs\x00\x00\x00\x00\x00\x00\x8cs\x00\x00\x00\x00\x00\x00\x8ds\x00\x00\x00\x00\x00\x00\xb8s\x00\x00\x00\x00\x00\x00\xb9s\x00\x00\x00\x00\x00\x00\xbas\x00\x00\x00\x00\x00\x00\xbbs\x00\x00\x00\x00\x00\x00\xcdv\x00\x00\x00\x00\x00\x00\x0bx\x00\x00\x00\x00\x00\x00'
+    b'+y\x00\x00\x00\x00\x00\x00<y\x00\x00\x00\x00\x00\x00=y\x00\x00\x00\x00\x00\x00N{\x00\x00\x00\x00\x00\x00v{\x00\x00\x00\x00\x00\x00\x87{\x00\x00\x00\x00\x00\x00\x88{\x00\x00\x00\x00\x00\x00\x89{\x00\x00\x00\x00\x00\x00\xd1}\x00\x00\x00\x00\x00\x00\xd2}\x00\x00\x00\x00\x00\x00\x84~\x00\x00\x00\x00\x00\x00\x85~\x00\x00\x00\x00\x00\x00'
+    b"\x86~\x00\x00\x00\x00\x00\x00\x87~\x00\x00\x00\x00\x00\x00\x88~\x00\x00\x00\x00\x00\x00\xa9~\x00\x00\x00\x00\x00\x00\xab~\x00\x00\x00\x00\x00\x00\xac~\x00\x00\x00\x00\x00\x00\xcf~\x00\x00\x00\x00\x00\x00\xd0~\x00\x00\x00\x00\x00\x00s\x7f\x00\x00\x00\x00\x00\x00'\x80\x00\x00\x00\x00\x00\x00-\x80\x00\x00\x00\x00\x00\x00/\x80\x00\x00\x00\x00\x00\x00"
+    b'2\x80\x00\x00\x00\x00\x00\x00\xaf\x80\x00\x00\x00\x00\x00\x00\x0b\x84\x00\x00\x00\x00\x00\x00\x80\x84\x00\x00\x00\x00\x00\x00\x81\x84\x00\x00\x00\x00\x00\x00\x82\x84\x00\x00\x00\x00\x00\x00\x8b\x84\x00\x00\x00\x00\x00\x00D\x85\x00\x00\x00\x00\x00\x00M\x85\x00\x00\x00\x00\x00\x00I\x86\x00\x00\x00\x00\x00\x00\x88\x86\x00\x00\x00\x00\x00\x00\x8b\x86\x00\x00\x00\x00\x00\x00'
+    b'\x8d\x86\x00\x00\x00\x00\x00\x00\x92\x86\x00\x00\x00\x00\x00\x00\x92\x87\x00\x00\x00\x00\x00\x00\xa5\x87\x00\x00\x00\x00\x00\x00!\x88\x00\x00\x00\x00\x00\x00\x93\x88\x00\x00\x00\x00\x00\x00\x89\x8a\x00\x00\x00\x00\x00\x00\x8e\x8a\x00\x00\x00\x00\x00\x00\x96\x8a\x00\x00\x00\x00\x00\x00\xb1\x8a\x00\x00\x00\x00\x00\x00X\x8b\x00\x00\x00\x00\x00\x001\x8c\x00\x00\x00\x00\x00\x00'
+    b'y\x8c\x00\x00\x00\x00\x00\x00\x8f\x8c\x00\x00\x00\x00\x00\x00\x90\x8c\x00\x00\x00\x00\x00\x00\x91\x8c\x00\x00\x00\x00\x00\x00\x92\x8c\x00\x00\x00\x00\x00\x00\x93\x8c\x00\x00\x00\x00\x00\x00\xad\x8c\x00\x00\x00\x00\x00\x00\xae\x8c\x00\x00\x00\x00\x00\x00\xaf\x8c\x00\x00\x00\x00\x00\x00\xb0\x8c\x00\x00\x00\x00\x00\x00\xb1\x8c\x00\x00\x00\x00\x00\x00\xb2\x8c\x00\x00\x00\x00\x00\x00'
+    b'\xb3\x8c\x00\x00\x00\x00\x00\x00\xb4\x8c\x00\x00\x00\x00\x00\x00\xb5\x8c\x00\x00\x00\x00\x00\x00%\x8d\x00\x00\x00\x00\x00\x00\xe1\x8e\x00\x00\x00\x00\x00\x00\xed\x8f\x00\x00\x00\x00\x00\x00s\x91\x00\x00\x00\x00\x00\x00\x8b\x91\x00\x00\x00\x00\x00\x00\xad\x91\x00\x00\x00\x00\x00\x00\x17\x92\x00\x00\x00\x00\x00\x00\x18\x92\x00\x00\x00\x00\x00\x00\x19\x92\x00\x00\x00\x00\x00\x00'
+    b'\x1a\x92\x00\x00\x00\x00\x00\x00Y\x92\x00\x00\x00\x00\x00\x00T\x93\x00\x00\x00\x00\x00\x00\xb9\x93\x00\x00\x00\x00\x00\x003\x94\x00\x00\x00\x00\x00\x00\xa2\x94\x00\x00\x00\x00\x00\x00\xac\x94\x00\x00\x00\x00\x00\x00\xdf\x94\x00\x00\x00\x00\x00\x00\xf5\x94\x00\x00\x00\x00\x00\x00\xf6\x94\x00\x00\x00\x00\x00\x00\x9a\x96\x00\x00\x00\x00\x00\x00\xf2\x96\x00\x00\x00\x00\x00\x00'
+    b'J\x97\x00\x00\x00\x00\x00\x00\xfa\x97\x00\x00\x00\x00\x00\x00\x16\x98\x00\x00\x00\x00\x00\x00D\x99\x00\x00\x00\x00\x00\x00~\x99\x00\x00\x00\x00\x00\x00\x87\x99\x00\x00\x00\x00\x00\x00\xba\x99\x00\x00\x00\x00\x00\x00%\x9b\x00\x00\x00\x00\x00\x00\xb9\x9b\x00\x00\x00\x00\x00\x00\xc7\x9b\x00\x00\x00\x00\x00\x00\x9a\x9c\x00\x00\x00\x00\x00\x00\x8d\x9d\x00\x00\x00\x00\x00\x00'
+    b'\xc0\x9d\x00\x00\x00\x00\x00\x00\xd6\x9d\x00\x00\x00\x00\x00\x00\xdb\x9d\x00\x00\x00\x00\x00\x00z\x9e\x00\x00\x00\x00\x00\x00P\x9f\x00\x00\x00\x00\x00\x00\xaf\x9f\x00\x00\x00\x00\x00\x00t \x01\x00\x00\x00\x00\x00h!\x01\x00\x00\x00\x00\x00\xf8!\x01\x00\x00\x00\x00\x00\xf9!\x01\x00\x00\x00\x00\x00\xfb!\x01\x00\x00\x00\x00\x00\xfc!\x01\x00\x00\x00\x00\x00'
+    b'\xfd!\x01\x00\x00\x00\x00\x00\xfe!\x01\x00\x00\x00\x00\x00\x04"\x01\x00\x00\x00\x00\x00c"\x01\x00\x00\x00\x00\x00n"\x01\x00\x00\x00\x00\x00\xb8"\x01\x00\x00\x00\x00\x00\xc8$\x01\x00\x00\x00\x00\x00\x1a%\x01\x00\x00\x00\x00\x00\x08&\x01\x00\x00\x00\x00\x00\n&\x01\x00\x00\x00\x00\x00!&\x01\x00\x00\x00\x00\x00\xb2&\x01\x00\x00\x00\x00\x00'
+    b"\xeb&\x01\x00\x00\x00\x00\x00\x1c'\x01\x00\x00\x00\x00\x00\x1d'\x01\x00\x00\x00\x00\x00$'\x01\x00\x00\x00\x00\x00j'\x01\x00\x00\x00\x00\x00C(\x01\x00\x00\x00\x00\x00')\x01\x00\x00\x00\x00\x00()\x01\x00\x00\x00\x00\x00))\x01\x00\x00\x00\x00\x00+)\x01\x00\x00\x00\x00\x00,)\x01\x00\x00\x00\x00\x00\x94)\x01\x00\x00\x00\x00\x00"
+    b'\r+\x01\x00\x00\x00\x00\x00\x8c+\x01\x00\x00\x00\x00\x00\xa3+\x01\x00\x00\x00\x00\x00\xea+\x01\x00\x00\x00\x00\x00\xec+\x01\x00\x00\x00\x00\x00\xed+\x01\x00\x00\x00\x00\x00\x00,\x01\x00\x00\x00\x00\x00\x10,\x01\x00\x00\x00\x00\x00$,\x01\x00\x00\x00\x00\x00\xe8-\x01\x00\x00\x00\x00\x00\x02.\x01\x00\x00\x00\x00\x00\xb4/\x01\x00\x00\x00\x00\x00'
+    b'\xc7/\x01\x00\x00\x00\x00\x00\x0c0\x01\x00\x00\x00\x00\x00\r0\x01\x00\x00\x00\x00\x00 z\x01\x00\x00\x00\x00\x00\x9az\x01\x00\x00\x00\x00\x00s{\x01\x00\x00\x00\x00\x00\x01|\x01\x00\x00\x00\x00\x00\t|\x01\x00\x00\x00\x00\x00;}\x01\x00\x00\x00\x00\x00\x95}\x01\x00\x00\x00\x00\x00\x96}\x01\x00\x00\x00\x00\x00\x9a}\x01\x00\x00\x00\x00\x00'
+    b'\xa4}\x01\x00\x00\x00\x00\x00\xc8\x7f\x01\x00\x00\x00\x00\x00\xc9\x7f\x01\x00\x00\x00\x00\x00\xca\x7f\x01\x00\x00\x00\x00\x00\x1c\x80\x01\x00\x00\x00\x00\x00\x1e\x80\x01\x00\x00\x00\x00\x00\x1f\x80\x01\x00\x00\x00\x00\x00 \x80\x01\x00\x00\x00\x00\x00!\x80\x01\x00\x00\x00\x00\x00"\x80\x01\x00\x00\x00\x00\x00#\x80\x01\x00\x00\x00\x00\x00$\x80\x01\x00\x00\x00\x00\x00'
+    b"%\x80\x01\x00\x00\x00\x00\x00&\x80\x01\x00\x00\x00\x00\x00'\x80\x01\x00\x00\x00\x00\x00(\x80\x01\x00\x00\x00\x00\x00)\x80\x01\x00\x00\x00\x00\x00*\x80\x01\x00\x00\x00\x00\x00+\x80\x01\x00\x00\x00\x00\x00,\x80\x01\x00\x00\x00\x00\x00-\x80\x01\x00\x00\x00\x00\x00.\x80\x01\x00\x00\x00\x00\x00\xc6\x81\x01\x00\x00\x00\x00\x00\xc7\x81\x01\x00\x00\x00\x00\x00"
+    b'3\x82\x01\x00\x00\x00\x00\x00\x80\x82\x01\x00\x00\x00\x00\x00;\x84\x01\x00\x00\x00\x00\x00\x86\x84\x01\x00\x00\x00\x00\x00\xd6\x84\x01\x00\x00\x00\x00\x00\xe3\x84\x01\x00\x00\x00\x00\x005\x85\x01\x00\x00\x00\x00\x00\x7f\x85\x01\x00\x00\x00\x00\x00\xa1\x85\x01\x00\x00\x00\x00\x00\x00\x86\x01\x00\x00\x00\x00\x00\xf7\x86\x01\x00\x00\x00\x00\x00\xfb\x86\x01\x00\x00\x00\x00\x00'
+    b'\xfd\x86\x01\x00\x00\x00\x00\x00\x1a\x87\x01\x00\x00\x00\x00\x00\x1d\x87\x01\x00\x00\x00\x00\x00(\x87\x01\x00\x00\x00\x00\x00<\x87\x01\x00\x00\x00\x00\x00?\x87\x01\x00\x00\x00\x00\x00*\x88\x01\x00\x00\x00\x00\x00U\x88\x01\x00\x00\x00\x00\x00\x86\x88\x01\x00\x00\x00\x00\x00@\x89\x01\x00\x00\x00\x00\x00P\x89\x01\x00\x00\x00\x00\x00\xf1\x89\x01\x00\x00\x00\x00\x00'
+    b'\x06\x8a\x01\x00\x00\x00\x00\x00\x9d\x8a\x01\x00\x00\x00\x00\x00\xb3\x8a\x01\x00\x00\x00\x00\x00\xb9\x8a\x01\x00\x00\x00\x00\x00Y\x8b\x01\x00\x00\x00\x00\x00s\x8b\x01\x00\x00\x00\x00\x00\x81\x8b\x01\x00\x00\x00\x00\x00\x82\x8b\x01\x00\x00\x00\x00\x00\xe2\x8d\x01\x00\x00\x00\x00\x00z\x8f\x01\x00\x00\x00\x00\x00\x90\x8f\x01\x00\x00\x00\x00\x00\xc3\x8f\x01\x00\x00\x00\x00\x00'
+    b'\xdf\x8f\x01\x00\x00\x00\x00\x00\xe0\x8f\x01\x00\x00\x00\x00\x00\xe1\x8f\x01\x00\x00\x00\x00\x00g\x90\x01\x00\x00\x00\x00\x00~\x90\x01\x00\x00\x00\x00\x00\x9b\x90\x01\x00\x00\x00\x00\x00\xec\x90\x01\x00\x00\x00\x00\x00(\x91\x01\x00\x00\x00\x00\x00u\x91\x01\x00\x00\x00\x00\x00y\x91\x01\x00\x00\x00\x00\x00\x8d\x91\x01\x00\x00\x00\x00\x00\xc7\x91\x01\x00\x00\x00\x00\x00'
+    b"\xd4\x91\x01\x00\x00\x00\x00\x00o\x93\x01\x00\x00\x00\x00\x00\xbe\x93\x01\x00\x00\x00\x00\x00\x87\x94\x01\x00\x00\x00\x00\x00\xb7\x94\x01\x00\x00\x00\x00\x00\xeb\x94\x01\x00\x00\x00\x00\x00v\x96\x01\x00\x00\x00\x00\x00Q\x97\x01\x00\x00\x00\x00\x00z\x98\x01\x00\x00\x00\x00\x00\x8a\x98\x01\x00\x00\x00\x00\x00\x8b\x98\x01\x00\x00\x00\x00\x00'\x99\x01\x00\x00\x00\x00\x00"
+    b'T\x99\x01\x00\x00\x00\x00\x00\x83\x99\x01\x00\x00\x00\x00\x00\xa9\x99\x01\x00\x00\x00\x00\x00\xf8\x9a\x01\x00\x00\x00\x00\x00\xf9\x9a\x01\x00\x00\x00\x00\x00\xfa\x9a\x01\x00\x00\x00\x00\x00\x06\x9c\x01\x00\x00\x00\x00\x006\x9c\x01\x00\x00\x00\x00\x00e\x9c\x01\x00\x00\x00\x00\x00\x85\x9c\x01\x00\x00\x00\x00\x00\x86\x9c\x01\x00\x00\x00\x00\x00\x8f\x9c\x01\x00\x00\x00\x00\x00'
+    b'\x90\x9c\x01\x00\x00\x00\x00\x00\x91\x9c\x01\x00\x00\x00\x00\x00\x92\x9c\x01\x00\x00\x00\x00\x00\x93\x9c\x01\x00\x00\x00\x00\x00\x94\x9c\x01\x00\x00\x00\x00\x00\x95\x9c\x01\x00\x00\x00\x00\x00\xcd\x9c\x01\x00\x00\x00\x00\x00d\x9d\x01\x00\x00\x00\x00\x00g\x9d\x01\x00\x00\x00\x00\x00\xa9\x9d\x01\x00\x00\x00\x00\x00\xd3\x9d\x01\x00\x00\x00\x00\x00}\x9e\x01\x00\x00\x00\x00\x00'
+    b'~\x9e\x01\x00\x00\x00\x00\x00\x8a\x9e\x01\x00\x00\x00\x00\x00\xb8\x9e\x01\x00\x00\x00\x00\x00\xc0\x9e\x01\x00\x00\x00\x00\x00 \xa0\x01\x00\x00\x00\x00\x00!\xa0\x01\x00\x00\x00\x00\x00"\xa0\x01\x00\x00\x00\x00\x00#\xa0\x01\x00\x00\x00\x00\x00$\xa0\x01\x00\x00\x00\x00\x00\xec\xa0\x01\x00\x00\x00\x00\x00\xed\xa0\x01\x00\x00\x00\x00\x00\x96\xa2\x01\x00\x00\x00\x00\x00'
+    b'\x9a\xa2\x01\x00\x00\x00\x00\x00\xfd\xa3\x01\x00\x00\x00\x00\x00\x04\xa4\x01\x00\x00\x00\x00\x00C\xa5\x01\x00\x00\x00\x00\x00c\xa5\x01\x00\x00\x00\x00\x00\xd6\xa5\x01\x00\x00\x00\x00\x00\xd7\xa5\x01\x00\x00\x00\x00\x00\x89\xa6\x01\x00\x00\x00\x00\x00\x8a\xa6\x01\x00\x00\x00\x00\x00\x8b\xa6\x01\x00\x00\x00\x00\x00\x8c\xa6\x01\x00\x00\x00\x00\x00\x8d\xa6\x01\x00\x00\x00\x00\x00'
+    b'\x8e\xa6\x01\x00\x00\x00\x00\x00\x8f\xa6\x01\x00\x00\x00\x00\x00\x90\xa6\x01\x00\x00\x00\x00\x00"\xa7\x01\x00\x00\x00\x00\x00#\xa7\x01\x00\x00\x00\x00\x00$\xa7\x01\x00\x00\x00\x00\x00/\xa7\x01\x00\x00\x00\x00\x00{\xa7\x01\x00\x00\x00\x00\x00\x97\xa8\x01\x00\x00\x00\x00\x00\xa8\xa8\x01\x00\x00\x00\x00\x00\xe9\xa8\x01\x00\x00\x00\x00\x00\xf4\xa8\x01\x00\x00\x00\x00\x00'
+    b'\xf5\xa8\x01\x00\x00\x00\x00\x00.\xa9\x01\x00\x00\x00\x00\x00J\xa9\x01\x00\x00\x00\x00\x00\x85\xa9\x01\x00\x00\x00\x00\x00\x86\xa9\x01\x00\x00\x00\x00\x00\x87\xa9\x01\x00\x00\x00\x00\x00\x88\xa9\x01\x00\x00\x00\x00\x00\x89\xa9\x01\x00\x00\x00\x00\x00\x8a\xa9\x01\x00\x00\x00\x00\x00\x8b\xa9\x01\x00\x00\x00\x00\x00\x8c\xa9\x01\x00\x00\x00\x00\x00\x8d\xa9\x01\x00\x00\x00\x00\x00'
+    b'\x8e\xa9\x01\x00\x00\x00\x00\x00\x8f\xa9\x01\x00\x00\x00\x00\x00\x90\xa9\x01\x00\x00\x00\x00\x00\x91\xa9\x01\x00\x00\x00\x00\x00\x92\xa9\x01\x00\x00\x00\x00\x00\xe8\xa9\x01\x00\x00\x00\x00\x00\x8d\xab\x01\x00\x00\x00\x00\x00\xac\xab\x01\x00\x00\x00\x00\x00\xfc\xab\x01\x00\x00\x00\x00\x00\xfd\xab\x01\x00\x00\x00\x00\x00\xfe\xab\x01\x00\x00\x00\x00\x00\xff\xab\x01\x00\x00\x00\x00\x00'
+    b'e\xac\x01\x00\x00\x00\x00\x00f\xac\x01\x00\x00\x00\x00\x00i\xac\x01\x00\x00\x00\x00\x00\xd0\xac\x01\x00\x00\x00\x00\x00\xd3\xac\x01\x00\x00\x00\x00\x00\xd4\xac\x01\x00\x00\x00\x00\x00\xdb\xac\x01\x00\x00\x00\x00\x00\xdd\xac\x01\x00\x00\x00\x00\x00\x90\xad\x01\x00\x00\x00\x00\x00\x18\xae\x01\x00\x00\x00\x00\x00\x19\xae\x01\x00\x00\x00\x00\x00\x1a\xae\x01\x00\x00\x00\x00\x00'
+    b'\x1b\xae\x01\x00\x00\x00\x00\x00\x1c\xae\x01\x00\x00\x00\x00\x00\x1d\xae\x01\x00\x00\x00\x00\x00\x1e\xae\x01\x00\x00\x00\x00\x00\x1f\xae\x01\x00\x00\x00\x00\x00 \xae\x01\x00\x00\x00\x00\x00!\xae\x01\x00\x00\x00\x00\x00"\xae\x01\x00\x00\x00\x00\x00#\xae\x01\x00\x00\x00\x00\x00$\xae\x01\x00\x00\x00\x00\x00%\xae\x01\x00\x00\x00\x00\x00&\xae\x01\x00\x00\x00\x00\x00'
+    b'<\xae\x01\x00\x00\x00\x00\x00\xbf\xae\x01\x00\x00\x00\x00\x00T\xb0\x01\x00\x00\x00\x00\x00"\xb1\x01\x00\x00\x00\x00\x00y\xb1\x01\x00\x00\x00\x00\x00\xbd\xb1\x01\x00\x00\x00\x00\x00\x87\xb2\x01\x00\x00\x00\x00\x00\xac\xb4\x01\x00\x00\x00\x00\x00\xad\xb4\x01\x00\x00\x00\x00\x00\x02\xb5\x01\x00\x00\x00\x00\x00&\xb5\x01\x00\x00\x00\x00\x00\x94\xb5\x01\x00\x00\x00\x00\x00'
+    b'\x95\xb5\x01\x00\x00\x00\x00\x00\x96\xb5\x01\x00\x00\x00\x00\x00\x97\xb5\x01\x00\x00\x00\x00\x00\x98\xb5\x01\x00\x00\x00\x00\x00\x99\xb5\x01\x00\x00\x00\x00\x00\x9a\xb5\x01\x00\x00\x00\x00\x00\x9b\xb5\x01\x00\x00\x00\x00\x00\x9c\xb5\x01\x00\x00\x00\x00\x00\xc4\xb5\x01\x00\x00\x00\x00\x00\xc5\xb5\x01\x00\x00\x00\x00\x00\xc6\xb5\x01\x00\x00\x00\x00\x00\xc7\xb5\x01\x00\x00\x00\x00\x00'
+    b'\xc8\xb5\x01\x00\x00\x00\x00\x00\xd1\xb5\x01\x00\x00\x00\x00\x00\x02\xb6\x01\x00\x00\x00\x00\x00\x06\xb6\x01\x00\x00\x00\x00\x00\x07\xb6\x01\x00\x00\x00\x00\x00\t\xb6\x01\x00\x00\x00\x00\x00\x18\xb6\x01\x00\x00\x00\x00\x004\xb6\x01\x00\x00\x00\x00\x00:\xb6\x01\x00\x00\x00\x00\x00F\xb6\x01\x00\x00\x00\x00\x00X\xb6\x01\x00\x00\x00\x00\x00w\xb6\x01\x00\x00\x00\x00\x00'
+    b'\xa9\xb6\x01\x00\x00\x00\x00\x00\xeb\xb6\x01\x00\x00\x00\x00\x00?\xb7\x01\x00\x00\x00\x00\x00Z\xb7\x01\x00\x00\x00\x00\x00\xa7\xb7\x01\x00\x00\x00\x00\x00\xa8\xb7\x01\x00\x00\x00\x00\x00\xb2\xb7\x01\x00\x00\x00\x00\x00\xd0\xb7\x01\x00\x00\x00\x00\x00\xd1\xb7\x01\x00\x00\x00\x00\x00\xd2\xb7\x01\x00\x00\x00\x00\x00\xd3\xb7\x01\x00\x00\x00\x00\x00\xdf\xb7\x01\x00\x00\x00\x00\x00'
+    b'\xe0\xb7\x01\x00\x00\x00\x00\x00\xe1\xb7\x01\x00\x00\x00\x00\x00\xe2\xb7\x01\x00\x00\x00\x00\x00\xeb\xb7\x01\x00\x00\x00\x00\x00\xfb\xb7\x01\x00\x00\x00\x00\x00\xfc\xb7\x01\x00\x00\x00\x00\x00\x02\xb8\x01\x00\x00\x00\x00\x00\x1c\xb8\x01\x00\x00\x00\x00\x00\xd4\xb9\x01\x00\x00\x00\x00\x00\xd5\xb9\x01\x00\x00\x00\x00\x00\xd7\xb9\x01\x00\x00\x00\x00\x00\xb4\xba\x01\x00\x00\x00\x00\x00'
+    b':\xbb\x01\x00\x00\x00\x00\x00]\xbb\x01\x00\x00\x00\x00\x00e\xbb\x01\x00\x00\x00\x00\x00\x85\xbb\x01\x00\x00\x00\x00\x00\xdd\xbb\x01\x00\x00\x00\x00\x00\xee\xbb\x01\x00\x00\x00\x00\x00\xef\xbb\x01\x00\x00\x00\x00\x00\xf0\xbb\x01\x00\x00\x00\x00\x00\xf1\xbb\x01\x00\x00\x00\x00\x00\xf2\xbb\x01\x00\x00\x00\x00\x00\xf3\xbb\x01\x00\x00\x00\x00\x00N\xbc\x01\x00\x00\x00\x00\x00'
+    b'P\xbc\x01\x00\x00\x00\x00\x00s\xbc\x01\x00\x00\x00\x00\x00w\xbc\x01\x00\x00\x00\x00\x00\xbe\xbc\x01\x00\x00\x00\x00\x00\xbf\xbc\x01\x00\x00\x00\x00\x00\xdc\xbc\x01\x00\x00\x00\x00\x00\xdd\xbc\x01\x00\x00\x00\x00\x00\xea\xbc\x01\x00\x00\x00\x00\x00\xed\xbc\x01\x00\x00\x00\x00\x00`\xbd\x01\x00\x00\x00\x00\x00i\xbd\x01\x00\x00\x00\x00\x00j\xbd\x01\x00\x00\x00\x00\x00'
+    b'\xa0\xbd\x01\x00\x00\x00\x00\x00\xdb\xbd\x01\x00\x00\x00\x00\x00\xe5\xbd\x01\x00\x00\x00\x00\x00\x06\xbe\x01\x00\x00\x00\x00\x00\x13\xbe\x01\x00\x00\x00\x00\x002\xbe\x01\x00\x00\x00\x00\x00^\xbe\x01\x00\x00\x00\x00\x00\x8e\xbe\x01\x00\x00\x00\x00\x00\x99\xbe\x01\x00\x00\x00\x00\x00\xb3\xbe\x01\x00\x00\x00\x00\x00\xb5\xbe\x01\x00\x00\x00\x00\x00\xee\xbe\x01\x00\x00\x00\x00\x00'
+    b'\xef\xbe\x01\x00\x00\x00\x00\x00\x0f\xbf\x01\x00\x00\x00\x00\x00\x10\xbf\x01\x00\x00\x00\x00\x00\x11\xbf\x01\x00\x00\x00\x00\x00\x12\xbf\x01\x00\x00\x00\x00\x00\x13\xbf\x01\x00\x00\x00\x00\x00\x14\xbf\x01\x00\x00\x00\x00\x00R\xbf\x01\x00\x00\x00\x00\x00\x93\xbf\x01\x00\x00\x00\x00\x00\xd4\xbf\x01\x00\x00\x00\x00\x00\xd5\xbf\x01\x00\x00\x00\x00\x00\xd6\xbf\x01\x00\x00\x00\x00\x00'
+    b'\xd7\xbf\x01\x00\x00\x00\x00\x00\xd8\xbf\x01\x00\x00\x00\x00\x00\xd9\xbf\x01\x00\x00\x00\x00\x00\xda\xbf\x01\x00\x00\x00\x00\x00\xdb\xbf\x01\x00\x00\x00\x00\x00\xdc\xbf\x01\x00\x00\x00\x00\x00\xdd\xbf\x01\x00\x00\x00\x00\x00\xde\xbf\x01\x00\x00\x00\x00\x00\xdf\xbf\x01\x00\x00\x00\x00\x00\xe0\xbf\x01\x00\x00\x00\x00\x00\x8a\xc0\x01\x00\x00\x00\x00\x00\x8b\xc0\x01\x00\x00\x00\x00\x00'
+    b'\xbe\xc0\x01\x00\x00\x00\x00\x00\xc1\xc0\x01\x00\x00\x00\x00\x00\xce\xc0\x01\x00\x00\x00\x00\x00:\xc1\x01\x00\x00\x00\x00\x00M\xc1\x01\x00\x00\x00\x00\x00\xeb\xc1\x01\x00\x00\x00\x00\x00\xec\xc1\x01\x00\x00\x00\x00\x00\xed\xc1\x01\x00\x00\x00\x00\x00\xee\xc1\x01\x00\x00\x00\x00\x00\x01\xc2\x01\x00\x00\x00\x00\x00@\xc2\x01\x00\x00\x00\x00\x00E\xc2\x01\x00\x00\x00\x00\x00'
+    b'Q\xc2\x01\x00\x00\x00\x00\x00R\xc2\x01\x00\x00\x00\x00\x00S\xc2\x01\x00\x00\x00\x00\x00T\xc2\x01\x00\x00\x00\x00\x00\x80\xc2\x01\x00\x00\x00\x00\x00\x94\xc2\x01\x00\x00\x00\x00\x00\x97\xc2\x01\x00\x00\x00\x00\x00.\xc3\x01\x00\x00\x00\x00\x00r\xc3\x01\x00\x00\x00\x00\x00t\xc3\x01\x00\x00\x00\x00\x00\xb1\xc3\x01\x00\x00\x00\x00\x00\xbe\xc3\x01\x00\x00\x00\x00\x00'
+    b'\x1b\xc4\x01\x00\x00\x00\x00\x00/\xc4\x01\x00\x00\x00\x00\x00A\xc4\x01\x00\x00\x00\x00\x00V\xc4\x01\x00\x00\x00\x00\x00a\xc4\x01\x00\x00\x00\x00\x00g\xc4\x01\x00\x00\x00\x00\x00v\xc4\x01\x00\x00\x00\x00\x00\xb5\xc4\x01\x00\x00\x00\x00\x00\xe5\xc4\x01\x00\x00\x00\x00\x00\x01\xc5\x01\x00\x00\x00\x00\x00`\xc5\x01\x00\x00\x00\x00\x00p\xc5\x01\x00\x00\x00\x00\x00'
+    b'x\xc5\x01\x00\x00\x00\x00\x00\xcd\xc5\x01\x00\x00\x00\x00\x00\xdc\xc5\x01\x00\x00\x00\x00\x00\xdd\xc5\x01\x00\x00\x00\x00\x00 \xc6\x01\x00\x00\x00\x00\x00$\xc6\x01\x00\x00\x00\x00\x00{\xc6\x01\x00\x00\x00\x00\x00\xa6\xc6\x01\x00\x00\x00\x00\x00\xea\xc6\x01\x00\x00\x00\x00\x00\xfb\xc6\x01\x00\x00\x00\x00\x00\t\xc7\x01\x00\x00\x00\x00\x00a\xc7\x01\x00\x00\x00\x00\x00'
+    b'w\xc7\x01\x00\x00\x00\x00\x00\x94\xc7\x01\x00\x00\x00\x00\x00\xb0\xc7\x01\x00\x00\x00\x00\x00\xb4\xc7\x01\x00\x00\x00\x00\x00\xb8\xc7\x01\x00\x00\x00\x00\x00\xc4\xc7\x01\x00\x00\x00\x00\x00\xd6\xc7\x01\x00\x00\x00\x00\x00\x02\xc8\x01\x00\x00\x00\x00\x00\xe4\xc8\x01\x00\x00\x00\x00\x00\xf0\xc8\x01\x00\x00\x00\x00\x00\x1d\xc9\x01\x00\x00\x00\x00\x00\xc3\xc9\x01\x00\x00\x00\x00\x00'
+    b"\xbb\xca\x01\x00\x00\x00\x00\x00]\xcb\x01\x00\x00\x00\x00\x00h\xce\x01\x00\x00\x00\x00\x00j\xce\x01\x00\x00\x00\x00\x00'\xcf\x01\x00\x00\x00\x00\x00\x97\xcf\x01\x00\x00\x00\x00\x00\x9e\xcf\x01\x00\x00\x00\x00\x00C\xd0\x01\x00\x00\x00\x00\x00\xe6\xd0\x01\x00\x00\x00\x00\x00\xe7\xd0\x01\x00\x00\x00\x00\x00\xe8\xd0\x01\x00\x00\x00\x00\x00\xe9\xd0\x01\x00\x00\x00\x00\x00"
+    b'\xea\xd0\x01\x00\x00\x00\x00\x00\xeb\xd0\x01\x00\x00\x00\x00\x00\x1a\xd1\x01\x00\x00\x00\x00\x00\x1b\xd1\x01\x00\x00\x00\x00\x00\x1c\xd1\x01\x00\x00\x00\x00\x00\x1d\xd1\x01\x00\x00\x00\x00\x006\xd1\x01\x00\x00\x00\x00\x007\xd1\x01\x00\x00\x00\x00\x00h\xd1\x01\x00\x00\x00\x00\x00l\xd2\x01\x00\x00\x00\x00\x00\x1f\xd3\x01\x00\x00\x00\x00\x00Q\xd3\x01\x00\x00\x00\x00\x00'
+    b'\x88\xd3\x01\x00\x00\x00\x00\x00\x89\xd3\x01\x00\x00\x00\x00\x00\x16\xd4\x01\x00\x00\x00\x00\x00/\xd4\x01\x00\x00\x00\x00\x00\x91\xd4\x01\x00\x00\x00\x00\x00\x92\xd4\x01\x00\x00\x00\x00\x00\xa4\xd4\x01\x00\x00\x00\x00\x00\xd2\xd4\x01\x00\x00\x00\x00\x00?\xd5\x01\x00\x00\x00\x00\x00c\xd5\x01\x00\x00\x00\x00\x00\x89\xd5\x01\x00\x00\x00\x00\x00\x91\xd5\x01\x00\x00\x00\x00\x00'
+    b'\xb1\xd5\x01\x00\x00\x00\x00\x00\xe1\xd5\x01\x00\x00\x00\x00\x00\xa6\xd6\x01\x00\x00\x00\x00\x00\x07\xd7\x01\x00\x00\x00\x00\x00\x08\xd7\x01\x00\x00\x00\x00\x00\x12\xd7\x01\x00\x00\x00\x00\x00$\xd7\x01\x00\x00\x00\x00\x00I\xd7\x01\x00\x00\x00\x00\x00\xc4\xd8\x01\x00\x00\x00\x00\x00\xd0\xd8\x01\x00\x00\x00\x00\x00\xd1\xd8\x01\x00\x00\x00\x00\x00\xec\xd8\x01\x00\x00\x00\x00\x00'
+    b'\xef\xd8\x01\x00\x00\x00\x00\x00"\xd9\x01\x00\x00\x00\x00\x00\xff\xd9\x01\x00\x00\x00\x00\x00\x00\xda\x01\x00\x00\x00\x00\x00\x01\xda\x01\x00\x00\x00\x00\x00\x02\xda\x01\x00\x00\x00\x00\x00\x0f\xda\x01\x00\x00\x00\x00\x00Q\xda\x01\x00\x00\x00\x00\x00a\xda\x01\x00\x00\x00\x00\x00\xd9\xda\x01\x00\x00\x00\x00\x00\xc3\xdb\x01\x00\x00\x00\x00\x00\xcf\xdb\x01\x00\x00\x00\x00\x00'
+    b':\xdc\x01\x00\x00\x00\x00\x00;\xdc\x01\x00\x00\x00\x00\x00<\xdc\x01\x00\x00\x00\x00\x00=\xdc\x01\x00\x00\x00\x00\x00>\xdc\x01\x00\x00\x00\x00\x00?\xdc\x01\x00\x00\x00\x00\x00e\xdd\x01\x00\x00\x00\x00\x00z\xdd\x01\x00\x00\x00\x00\x00\xe2\xdd\x01\x00\x00\x00\x00\x00\x16\xde\x01\x00\x00\x00\x00\x00)\xdf\x01\x00\x00\x00\x00\x002\xdf\x01\x00\x00\x00\x00\x00'
+    b'=\xdf\x01\x00\x00\x00\x00\x00x\xdf\x01\x00\x00\x00\x00\x00\x84\xdf\x01\x00\x00\x00\x00\x00\xc0\xdf\x01\x00\x00\x00\x00\x00\xc6\xdf\x01\x00\x00\x00\x00\x00\xda\xdf\x01\x00\x00\x00\x00\x00\xf4\xdf\x01\x00\x00\x00\x00\x00\xf5\xdf\x01\x00\x00\x00\x00\x00X\xe0\x01\x00\x00\x00\x00\x00\x83\xe0\x01\x00\x00\x00\x00\x00\x01\xe1\x01\x00\x00\x00\x00\x00\x02\xe1\x01\x00\x00\x00\x00\x00'
+    b'\x08\xe1\x01\x00\x00\x00\x00\x00\x0c\xe1\x01\x00\x00\x00\x00\x00\x15\xe2\x01\x00\x00\x00\x00\x00,\xe2\x01\x00\x00\x00\x00\x00\x9a\xe2\x01\x00\x00\x00\x00\x00\xee\xe2\x01\x00\x00\x00\x00\x00\x1d\xe3\x01\x00\x00\x00\x00\x00]\xe3\x01\x00\x00\x00\x00\x00\x8e\xe3\x01\x00\x00\x00\x00\x00\x01\xe4\x01\x00\x00\x00\x00\x00\x06\xe4\x01\x00\x00\x00\x00\x00`\xe5\x01\x00\x00\x00\x00\x00'
+    b'\x94\xe5\x01\x00\x00\x00\x00\x00\xba\xe6\x01\x00\x00\x00\x00\x00\xbb\xe6\x01\x00\x00\x00\x00\x00\xcd\xe6\x01\x00\x00\x00\x00\x00\x8a\xe7\x01\x00\x00\x00\x00\x00\x8e\xe7\x01\x00\x00\x00\x00\x00\x90\xe7\x01\x00\x00\x00\x00\x00\xd0\xe7\x01\x00\x00\x00\x00\x00\xd4\xe7\x01\x00\x00\x00\x00\x00\x08\xe8\x01\x00\x00\x00\x00\x00x\xe8\x01\x00\x00\x00\x00\x00\x02\xe9\x01\x00\x00\x00\x00\x00'
+    b'\xff\xe9\x01\x00\x00\x00\x00\x00\x03\xea\x01\x00\x00\x00\x00\x00:\xea\x01\x00\x00\x00\x00\x00;\xea\x01\x00\x00\x00\x00\x00o\xea\x01\x00\x00\x00\x00\x00\x06\xeb\x01\x00\x00\x00\x00\x00\x08\xeb\x01\x00\x00\x00\x00\x00\t\xeb\x01\x00\x00\x00\x00\x00\r\xeb\x01\x00\x00\x00\x00\x00\x1b\xeb\x01\x00\x00\x00\x00\x00*\xeb\x01\x00\x00\x00\x00\x00\x8a\xeb\x01\x00\x00\x00\x00\x00'
+    b'\xb0\xeb\x01\x00\x00\x00\x00\x00\xb8\xeb\x01\x00\x00\x00\x00\x00\xb9\xeb\x01\x00\x00\x00\x00\x00\xba\xeb\x01\x00\x00\x00\x00\x00\xbb\xeb\x01\x00\x00\x00\x00\x00\xbc\xeb\x01\x00\x00\x00\x00\x00\xbd\xeb\x01\x00\x00\x00\x00\x00\xbe\xeb\x01\x00\x00\x00\x00\x00\xc0\xeb\x01\x00\x00\x00\x00\x00\xc1\xeb\x01\x00\x00\x00\x00\x00\xc3\xeb\x01\x00\x00\x00\x00\x00\xc4\xeb\x01\x00\x00\x00\x00\x00'
+    b'\xc6\xeb\x01\x00\x00\x00\x00\x00\xc8\xeb\x01\x00\x00\x00\x00\x00\xc9\xeb\x01\x00\x00\x00\x00\x00\xcb\xeb\x01\x00\x00\x00\x00\x00\xcc\xeb\x01\x00\x00\x00\x00\x00\xce\xeb\x01\x00\x00\x00\x00\x00\xd2\xeb\x01\x00\x00\x00\x00\x00\xd8\xeb\x01\x00\x00\x00\x00\x00\xdb\xeb\x01\x00\x00\x00\x00\x00\xdc\xeb\x01\x00\x00\x00\x00\x00\xe0\xeb\x01\x00\x00\x00\x00\x00N\xec\x01\x00\x00\x00\x00\x00'
+    b'Z\xec\x01\x00\x00\x00\x00\x00[\xec\x01\x00\x00\x00\x00\x00\\\xec\x01\x00\x00\x00\x00\x00]\xec\x01\x00\x00\x00\x00\x00^\xec\x01\x00\x00\x00\x00\x00\x89\xec\x01\x00\x00\x00\x00\x00\x8e\xec\x01\x00\x00\x00\x00\x00\xf8\xec\x01\x00\x00\x00\x00\x00 \xed\x01\x00\x00\x00\x00\x00*\xed\x01\x00\x00\x00\x00\x00,\xed\x01\x00\x00\x00\x00\x00;\xed\x01\x00\x00\x00\x00\x00'
+    b'>\xed\x01\x00\x00\x00\x00\x00Q\xed\x01\x00\x00\x00\x00\x00f\xed\x01\x00\x00\x00\x00\x00\x81\xed\x01\x00\x00\x00\x00\x00\xce\xed\x01\x00\x00\x00\x00\x00<\xee\x01\x00\x00\x00\x00\x00|\xee\x01\x00\x00\x00\x00\x00\x97\xef\x01\x00\x00\x00\x00\x00\x98\xef\x01\x00\x00\x00\x00\x00\xf2\xef\x01\x00\x00\x00\x00\x00\x10\xf0\x01\x00\x00\x00\x00\x00\x1d\xf0\x01\x00\x00\x00\x00\x00'
+    b'3\xf0\x01\x00\x00\x00\x00\x00V\xf0\x01\x00\x00\x00\x00\x00c\xf0\x01\x00\x00\x00\x00\x00\x8e\xf0\x01\x00\x00\x00\x00\x00\x92\xf0\x01\x00\x00\x00\x00\x00\xf8\xf1\x01\x00\x00\x00\x00\x00\x88\xf3\x01\x00\x00\x00\x00\x00\xcf\xf3\x01\x00\x00\x00\x00\x00\x1d\xf4\x01\x00\x00\x00\x00\x00\x1e\xf4\x01\x00\x00\x00\x00\x00\x1f\xf4\x01\x00\x00\x00\x00\x00!\xf4\x01\x00\x00\x00\x00\x00'
+    b'a\xf4\x01\x00\x00\x00\x00\x004\xf5\x01\x00\x00\x00\x00\x007\xf5\x01\x00\x00\x00\x00\x00E\xf5\x01\x00\x00\x00\x00\x00o\xf5\x01\x00\x00\x00\x00\x00z\xf5\x01\x00\x00\x00\x00\x00\x8f\xf5\x01\x00\x00\x00\x00\x00\x93\xf5\x01\x00\x00\x00\x00\x00\x08\xf6\x01\x00\x00\x00\x00\x00\t\xf6\x01\x00\x00\x00\x00\x00\n\xf6\x01\x00\x00\x00\x00\x00\x0b\xf6\x01\x00\x00\x00\x00\x00'
+    b"'\xf7\x01\x00\x00\x00\x00\x00\x9d\xf7\x01\x00\x00\x00\x00\x00\xd0\xf7\x01\x00\x00\x00\x00\x00\xd1\xf7\x01\x00\x00\x00\x00\x00\xd2\xf7\x01\x00\x00\x00\x00\x00\xd3\xf7\x01\x00\x00\x00\x00\x00\xd4\xf7\x01\x00\x00\x00\x00\x00\xe9\xf7\x01\x00\x00\x00\x00\x00\xea\xf7\x01\x00\x00\x00\x00\x00\xeb\xf7\x01\x00\x00\x00\x00\x00\xec\xf7\x01\x00\x00\x00\x00\x00\xed\xf7\x01\x00\x00\x00\x00\x00"
+    b'\xee\xf7\x01\x00\x00\x00\x00\x009\xf8\x01\x00\x00\x00\x00\x00\x01\xf9\x01\x00\x00\x00\x00\x00\x03\xf9\x01\x00\x00\x00\x00\x00\x04\xf9\x01\x00\x00\x00\x00\x00\x06\xf9\x01\x00\x00\x00\x00\x00#\xf9\x01\x00\x00\x00\x00\x000\xf9\x01\x00\x00\x00\x00\x00o\xf9\x01\x00\x00\x00\x00\x00p\xf9\x01\x00\x00\x00\x00\x00\xb6\xf9\x01\x00\x00\x00\x00\x00\xc1\xf9\x01\x00\x00\x00\x00\x00'
+    b'\xfb\xf9\x01\x00\x00\x00\x00\x00\x0e\xfa\x01\x00\x00\x00\x00\x00U\xfa\x01\x00\x00\x00\x00\x00V\xfa\x01\x00\x00\x00\x00\x00]\xfa\x01\x00\x00\x00\x00\x00G\xfb\x01\x00\x00\x00\x00\x00H\xfb\x01\x00\x00\x00\x00\x00I\xfb\x01\x00\x00\x00\x00\x00b\xfb\x01\x00\x00\x00\x00\x00\x0f\xfc\x01\x00\x00\x00\x00\x00\x13\xfc\x01\x00\x00\x00\x00\x00%\xfc\x01\x00\x00\x00\x00\x00'
+    b'a\xfc\x01\x00\x00\x00\x00\x00\xc5\xfc\x01\x00\x00\x00\x00\x00\xc8\xfc\x01\x00\x00\x00\x00\x00\xd3\xfc\x01\x00\x00\x00\x00\x00\x01\xfd\x01\x00\x00\x00\x00\x00\x0b\xfd\x01\x00\x00\x00\x00\x00X\xfd\x01\x00\x00\x00\x00\x00Z\xfd\x01\x00\x00\x00\x00\x00\xa6\xfd\x01\x00\x00\x00\x00\x00\xce\xfd\x01\x00\x00\x00\x00\x00\xe3\xfd\x01\x00\x00\x00\x00\x005\xfe\x01\x00\x00\x00\x00\x00'
+    b'\x9a\xfe\x01\x00\x00\x00\x00\x00t\x00\x02\x00\x00\x00\x00\x00u\x00\x02\x00\x00\x00\x00\x00}\x00\x02\x00\x00\x00\x00\x00\x9f\x00\x02\x00\x00\x00\x00\x00\xd2\x00\x02\x00\x00\x00\x00\x00\xd5\x00\x02\x00\x00\x00\x00\x00\xe5\x01\x02\x00\x00\x00\x00\x00\x04\x02\x02\x00\x00\x00\x00\x00\xc9\x02\x02\x00\x00\x00\x00\x00%\x03\x02\x00\x00\x00\x00\x00L\x03\x02\x00\x00\x00\x00\x00'
+    b'\xd9\x03\x02\x00\x00\x00\x00\x00\xda\x03\x02\x00\x00\x00\x00\x00\x1b\x04\x02\x00\x00\x00\x00\x00R\x04\x02\x00\x00\x00\x00\x00\xf3\x04\x02\x00\x00\x00\x00\x00\x06\x05\x02\x00\x00\x00\x00\x00\x18\x05\x02\x00\x00\x00\x00\x00=\x05\x02\x00\x00\x00\x00\x00t\x05\x02\x00\x00\x00\x00\x00\x85\x05\x02\x00\x00\x00\x00\x00\x8d\x05\x02\x00\x00\x00\x00\x00\xdc\x05\x02\x00\x00\x00\x00\x00'
+    b'\xe2\x05\x02\x00\x00\x00\x00\x00\xe8\x05\x02\x00\x00\x00\x00\x00\x10\x06\x02\x00\x00\x00\x00\x00.\x06\x02\x00\x00\x00\x00\x00;\x06\x02\x00\x00\x00\x00\x00\x82\x06\x02\x00\x00\x00\x00\x00\xd1\x06\x02\x00\x00\x00\x00\x00\xf1\x06\x02\x00\x00\x00\x00\x00\xfc\x06\x02\x00\x00\x00\x00\x00\x1f\x07\x02\x00\x00\x00\x00\x00^\x07\x02\x00\x00\x00\x00\x00\xf5\x07\x02\x00\x00\x00\x00\x00'
+    b'\xf6\x07\x02\x00\x00\x00\x00\x00\t\x08\x02\x00\x00\x00\x00\x00A\x08\x02\x00\x00\x00\x00\x00b\x08\x02\x00\x00\x00\x00\x00q\x08\x02\x00\x00\x00\x00\x00\xd5\x08\x02\x00\x00\x00\x00\x00\xe6\x08\x02\x00\x00\x00\x00\x00\xf1\x08\x02\x00\x00\x00\x00\x00\xf3\x08\x02\x00\x00\x00\x00\x00\xe0\t\x02\x00\x00\x00\x00\x00\xe1\t\x02\x00\x00\x00\x00\x00\xe2\t\x02\x00\x00\x00\x00\x00'
+    b'\xe3\t\x02\x00\x00\x00\x00\x00\xe4\t\x02\x00\x00\x00\x00\x00H\n\x02\x00\x00\x00\x00\x00y\n\x02\x00\x00\x00\x00\x00\xf5\n\x02\x00\x00\x00\x00\x009\x0c\x02\x00\x00\x00\x00\x00\xb2\x0c\x02\x00\x00\x00\x00\x00\xb3\x0c\x02\x00\x00\x00\x00\x00\xe7\x0c\x02\x00\x00\x00\x00\x00\xea\x0c\x02\x00\x00\x00\x00\x00\x8c\r\x02\x00\x00\x00\x00\x00\x96\r\x02\x00\x00\x00\x00\x00'
+    b'\xaf\x0e\x02\x00\x00\x00\x00\x00\xb0\x0e\x02\x00\x00\x00\x00\x00\xc7\x0e\x02\x00\x00\x00\x00\x00\xc9\x0e\x02\x00\x00\x00\x00\x00<\x0f\x02\x00\x00\x00\x00\x00B\x0f\x02\x00\x00\x00\x00\x00X\x0f\x02\x00\x00\x00\x00\x00\xdb\x0f\x02\x00\x00\x00\x00\x00\xf3\x0f\x02\x00\x00\x00\x00\x00N\x10\x02\x00\x00\x00\x00\x00\xa2\x10\x02\x00\x00\x00\x00\x00\x05\x11\x02\x00\x00\x00\x00\x00'
+    b'\x18\x11\x02\x00\x00\x00\x00\x00l\x11\x02\x00\x00\x00\x00\x00m\x11\x02\x00\x00\x00\x00\x00\xa7\x11\x02\x00\x00\x00\x00\x00\xb4\x11\x02\x00\x00\x00\x00\x00\xb5\x11\x02\x00\x00\x00\x00\x00\xb6\x11\x02\x00\x00\x00\x00\x00\xb7\x11\x02\x00\x00\x00\x00\x00\xb8\x11\x02\x00\x00\x00\x00\x00\xb9\x11\x02\x00\x00\x00\x00\x00\xba\x11\x02\x00\x00\x00\x00\x00\xbb\x11\x02\x00\x00\x00\x00\x00'
+    b'\xbc\x11\x02\x00\x00\x00\x00\x00\xbd\x11\x02\x00\x00\x00\x00\x00\xbe\x11\x02\x00\x00\x00\x00\x00\xbf\x11\x02\x00\x00\x00\x00\x00\xc0\x11\x02\x00\x00\x00\x00\x00\xc1\x11\x02\x00\x00\x00\x00\x00\xc2\x11\x02\x00\x00\x00\x00\x00\xed\x11\x02\x00\x00\x00\x00\x00\xee\x11\x02\x00\x00\x00\x00\x00\x17\x12\x02\x00\x00\x00\x00\x00\x18\x12\x02\x00\x00\x00\x00\x002\x12\x02\x00\x00\x00\x00\x00'
+    b'\x88\x12\x02\x00\x00\x00\x00\x00\x89\x12\x02\x00\x00\x00\x00\x00\xa7\x12\x02\x00\x00\x00\x00\x00\xd7\x12\x02\x00\x00\x00\x00\x00\x9e\x13\x02\x00\x00\x00\x00\x00\x01\x14\x02\x00\x00\x00\x00\x00\x0b\x14\x02\x00\x00\x00\x00\x00\x0e\x14\x02\x00\x00\x00\x00\x00\xe2\x14\x02\x00\x00\x00\x00\x00\x12\x15\x02\x00\x00\x00\x00\x00k\x15\x02\x00\x00\x00\x00\x00\x8e\x15\x02\x00\x00\x00\x00\x00'
+    b"\r\x16\x02\x00\x00\x00\x00\x00$\x16\x02\x00\x00\x00\x00\x00%\x16\x02\x00\x00\x00\x00\x00&\x16\x02\x00\x00\x00\x00\x00'\x16\x02\x00\x00\x00\x00\x00(\x16\x02\x00\x00\x00\x00\x00<\x16\x02\x00\x00\x00\x00\x00@\x16\x02\x00\x00\x00\x00\x00x\x16\x02\x00\x00\x00\x00\x00\xc3\x16\x02\x00\x00\x00\x00\x00\xce\x16\x02\x00\x00\x00\x00\x00\xeb\x16\x02\x00\x00\x00\x00\x00"
+    b'\xec\x16\x02\x00\x00\x00\x00\x00\xed\x16\x02\x00\x00\x00\x00\x00\xee\x16\x02\x00\x00\x00\x00\x00\xff\x16\x02\x00\x00\x00\x00\x00E\x17\x02\x00\x00\x00\x00\x00\x8d\x17\x02\x00\x00\x00\x00\x00\xc0\x17\x02\x00\x00\x00\x00\x00\xc6\x17\x02\x00\x00\x00\x00\x00\xc7\x17\x02\x00\x00\x00\x00\x00\xc8\x17\x02\x00\x00\x00\x00\x00\xc9\x17\x02\x00\x00\x00\x00\x00\xcb\x17\x02\x00\x00\x00\x00\x00'
+    b'\xcc\x17\x02\x00\x00\x00\x00\x00\xcd\x17\x02\x00\x00\x00\x00\x00\xce\x17\x02\x00\x00\x00\x00\x00\xcf\x17\x02\x00\x00\x00\x00\x00\xd3\x17\x02\x00\x00\x00\x00\x00\x1a\x18\x02\x00\x00\x00\x00\x00X\x18\x02\x00\x00\x00\x00\x00p\x18\x02\x00\x00\x00\x00\x00s\x18\x02\x00\x00\x00\x00\x00\xf8\x18\x02\x00\x00\x00\x00\x00\xfc\x18\x02\x00\x00\x00\x00\x00(\x19\x02\x00\x00\x00\x00\x00'
+    b'e\x19\x02\x00\x00\x00\x00\x00\x7f\x19\x02\x00\x00\x00\x00\x00\x05\x1a\x02\x00\x00\x00\x00\x00#\x1a\x02\x00\x00\x00\x00\x00*\x1a\x02\x00\x00\x00\x00\x00+\x1a\x02\x00\x00\x00\x00\x00/\x1a\x02\x00\x00\x00\x00\x00C\x1a\x02\x00\x00\x00\x00\x00\x9f\x1a\x02\x00\x00\x00\x00\x00\xa0\x1a\x02\x00\x00\x00\x00\x00\xa1\x1a\x02\x00\x00\x00\x00\x00\x17\x1b\x02\x00\x00\x00\x00\x00'
+    b'\x18\x1b\x02\x00\x00\x00\x00\x00\x19\x1b\x02\x00\x00\x00\x00\x00,\x1b\x02\x00\x00\x00\x00\x00-\x1b\x02\x00\x00\x00\x00\x00.\x1b\x02\x00\x00\x00\x00\x00N\x1b\x02\x00\x00\x00\x00\x00i\x1b\x02\x00\x00\x00\x00\x00o\x1b\x02\x00\x00\x00\x00\x00z\x1b\x02\x00\x00\x00\x00\x00\xa1\x1b\x02\x00\x00\x00\x00\x00\xc7\x1b\x02\x00\x00\x00\x00\x00\xde\x1b\x02\x00\x00\x00\x00\x00'
+    b"E\x1c\x02\x00\x00\x00\x00\x00&\x1d\x02\x00\x00\x00\x00\x00'\x1d\x02\x00\x00\x00\x00\x00\x1b\x1e\x02\x00\x00\x00\x00\x00\x14\x1f\x02\x00\x00\x00\x00\x00^\x1f\x02\x00\x00\x00\x00\x00\x90\x1f\x02\x00\x00\x00\x00\x00\xd1\x1f\x02\x00\x00\x00\x00\x00\xec\x1f\x02\x00\x00\x00\x00\x00\xfc\x1f\x02\x00\x00\x00\x00\x003 \x02\x00\x00\x00\x00\x00\x1c!\x02\x00\x00\x00\x00\x00"
+    b'L!\x02\x00\x00\x00\x00\x00M!\x02\x00\x00\x00\x00\x00N!\x02\x00\x00\x00\x00\x00?"\x02\x00\x00\x00\x00\x00@"\x02\x00\x00\x00\x00\x00A"\x02\x00\x00\x00\x00\x00B"\x02\x00\x00\x00\x00\x00\xad"\x02\x00\x00\x00\x00\x00<#\x02\x00\x00\x00\x00\x00>#\x02\x00\x00\x00\x00\x00@#\x02\x00\x00\x00\x00\x00@$\x02\x00\x00\x00\x00\x00'
+    b'T$\x02\x00\x00\x00\x00\x00U$\x02\x00\x00\x00\x00\x00`$\x02\x00\x00\x00\x00\x00b$\x02\x00\x00\x00\x00\x00s$\x02\x00\x00\x00\x00\x00u$\x02\x00\x00\x00\x00\x00\xad%\x02\x00\x00\x00\x00\x00\xce%\x02\x00\x00\x00\x00\x00\n&\x02\x00\x00\x00\x00\x00N&\x02\x00\x00\x00\x00\x00O&\x02\x00\x00\x00\x00\x00\x91&\x02\x00\x00\x00\x00\x00'
+    b"\xb4&\x02\x00\x00\x00\x00\x00\xec&\x02\x00\x00\x00\x00\x00$'\x02\x00\x00\x00\x00\x00G'\x02\x00\x00\x00\x00\x00p'\x02\x00\x00\x00\x00\x00q'\x02\x00\x00\x00\x00\x00u'\x02\x00\x00\x00\x00\x00\x8f'\x02\x00\x00\x00\x00\x00\x94'\x02\x00\x00\x00\x00\x00\xaa'\x02\x00\x00\x00\x00\x00\xab'\x02\x00\x00\x00\x00\x00\xac'\x02\x00\x00\x00\x00\x00"
+    b'\xad\'\x02\x00\x00\x00\x00\x00\xae\'\x02\x00\x00\x00\x00\x00\xaf\'\x02\x00\x00\x00\x00\x00\xb0\'\x02\x00\x00\x00\x00\x00\x91(\x02\x00\x00\x00\x00\x00\x92(\x02\x00\x00\x00\x00\x00\x9e(\x02\x00\x00\x00\x00\x00\xe5(\x02\x00\x00\x00\x00\x00")\x02\x00\x00\x00\x00\x00b)\x02\x00\x00\x00\x00\x00m)\x02\x00\x00\x00\x00\x00n)\x02\x00\x00\x00\x00\x00'
+    b'\xa3)\x02\x00\x00\x00\x00\x00\xc9)\x02\x00\x00\x00\x00\x00**\x02\x00\x00\x00\x00\x00V*\x02\x00\x00\x00\x00\x00X*\x02\x00\x00\x00\x00\x00Y*\x02\x00\x00\x00\x00\x00Z*\x02\x00\x00\x00\x00\x00[*\x02\x00\x00\x00\x00\x00\\*\x02\x00\x00\x00\x00\x00b*\x02\x00\x00\x00\x00\x00q*\x02\x00\x00\x00\x00\x00z*\x02\x00\x00\x00\x00\x00'
+    b'\xa0*\x02\x00\x00\x00\x00\x00\xc3*\x02\x00\x00\x00\x00\x00\xcb*\x02\x00\x00\x00\x00\x00\xe4*\x02\x00\x00\x00\x00\x00\xe5*\x02\x00\x00\x00\x00\x00\xfd*\x02\x00\x00\x00\x00\x00?+\x02\x00\x00\x00\x00\x00\x8f+\x02\x00\x00\x00\x00\x00\xeb,\x02\x00\x00\x00\x00\x00\xec,\x02\x00\x00\x00\x00\x00.-\x02\x00\x00\x00\x00\x00a-\x02\x00\x00\x00\x00\x00'
+    b't-\x02\x00\x00\x00\x00\x00\x91.\x02\x00\x00\x00\x00\x00\xfd.\x02\x00\x00\x00\x00\x00\xfe.\x02\x00\x00\x00\x00\x00\x00/\x02\x00\x00\x00\x00\x00\x01/\x02\x00\x00\x00\x00\x00\x05/\x02\x00\x00\x00\x00\x00\x06/\x02\x00\x00\x00\x00\x00\x07/\x02\x00\x00\x00\x00\x00\x08/\x02\x00\x00\x00\x00\x00\t/\x02\x00\x00\x00\x00\x00\x0b/\x02\x00\x00\x00\x00\x00'
+    b'\x0c/\x02\x00\x00\x00\x00\x00\r/\x02\x00\x00\x00\x00\x00\x0e/\x02\x00\x00\x00\x00\x00\x0f/\x02\x00\x00\x00\x00\x00!/\x02\x00\x00\x00\x00\x00;/\x02\x00\x00\x00\x00\x00</\x02\x00\x00\x00\x00\x00B/\x02\x00\x00\x00\x00\x00C/\x02\x00\x00\x00\x00\x00D/\x02\x00\x00\x00\x00\x00E/\x02\x00\x00\x00\x00\x00F/\x02\x00\x00\x00\x00\x00'
+    b'G/\x02\x00\x00\x00\x00\x00H/\x02\x00\x00\x00\x00\x00I/\x02\x00\x00\x00\x00\x00\xab/\x02\x00\x00\x00\x00\x00\xad/\x02\x00\x00\x00\x00\x00\xae/\x02\x00\x00\x00\x00\x00\xcb/\x02\x00\x00\x00\x00\x00\xcc/\x02\x00\x00\x00\x00\x00\xcd/\x02\x00\x00\x00\x00\x00\xce/\x02\x00\x00\x00\x00\x00\xcf/\x02\x00\x00\x00\x00\x00\xd0/\x02\x00\x00\x00\x00\x00'
+    b'\xd1/\x02\x00\x00\x00\x00\x00\xd2/\x02\x00\x00\x00\x00\x00\xd3/\x02\x00\x00\x00\x00\x00\xd4/\x02\x00\x00\x00\x00\x00\x1b0\x02\x00\x00\x00\x00\x00!0\x02\x00\x00\x00\x00\x00&0\x02\x00\x00\x00\x00\x0050\x02\x00\x00\x00\x00\x0060\x02\x00\x00\x00\x00\x00=0\x02\x00\x00\x00\x00\x00D0\x02\x00\x00\x00\x00\x00E0\x02\x00\x00\x00\x00\x00'
+    b'G0\x02\x00\x00\x00\x00\x00H0\x02\x00\x00\x00\x00\x00I0\x02\x00\x00\x00\x00\x00M0\x02\x00\x00\x00\x00\x00N0\x02\x00\x00\x00\x00\x00O0\x02\x00\x00\x00\x00\x00P0\x02\x00\x00\x00\x00\x00Q0\x02\x00\x00\x00\x00\x00~0\x02\x00\x00\x00\x00\x00\x850\x02\x00\x00\x00\x00\x00\x880\x02\x00\x00\x00\x00\x00\x930\x02\x00\x00\x00\x00\x00'
+    b'\x131\x02\x00\x00\x00\x00\x00 1\x02\x00\x00\x00\x00\x00.1\x02\x00\x00\x00\x00\x00=1\x02\x00\x00\x00\x00\x00C1\x02\x00\x00\x00\x00\x00a1\x02\x00\x00\x00\x00\x00q1\x02\x00\x00\x00\x00\x00\xab1\x02\x00\x00\x00\x00\x00\xaf1\x02\x00\x00\x00\x00\x00\xb01\x02\x00\x00\x00\x00\x00\xb11\x02\x00\x00\x00\x00\x00\xb21\x02\x00\x00\x00\x00\x00'
+    b'\xb41\x02\x00\x00\x00\x00\x00\xc91\x02\x00\x00\x00\x00\x00\xe01\x02\x00\x00\x00\x00\x00\xe21\x02\x00\x00\x00\x00\x00\x022\x02\x00\x00\x00\x00\x00#2\x02\x00\x00\x00\x00\x00$2\x02\x00\x00\x00\x00\x00{2\x02\x00\x00\x00\x00\x00|2\x02\x00\x00\x00\x00\x00}2\x02\x00\x00\x00\x00\x00~2\x02\x00\x00\x00\x00\x00\x7f2\x02\x00\x00\x00\x00\x00'
+    b'\x802\x02\x00\x00\x00\x00\x00\x812\x02\x00\x00\x00\x00\x00\x822\x02\x00\x00\x00\x00\x00\xb32\x02\x00\x00\x00\x00\x00\xb62\x02\x00\x00\x00\x00\x00\x0b3\x02\x00\x00\x00\x00\x00+3\x02\x00\x00\x00\x00\x00@3\x02\x00\x00\x00\x00\x00B3\x02\x00\x00\x00\x00\x00C3\x02\x00\x00\x00\x00\x00H3\x02\x00\x00\x00\x00\x00L3\x02\x00\x00\x00\x00\x00'
+    b'Q3\x02\x00\x00\x00\x00\x00\xab3\x02\x00\x00\x00\x00\x00\xef3\x02\x00\x00\x00\x00\x00\x114\x02\x00\x00\x00\x00\x00#5\x02\x00\x00\x00\x00\x00i5\x02\x00\x00\x00\x00\x00{5\x02\x00\x00\x00\x00\x00\x875\x02\x00\x00\x00\x00\x00&6\x02\x00\x00\x00\x00\x00N6\x02\x00\x00\x00\x00\x00O6\x02\x00\x00\x00\x00\x00P6\x02\x00\x00\x00\x00\x00'
+    b'{6\x02\x00\x00\x00\x00\x00\xb86\x02\x00\x00\x00\x00\x00\xc26\x02\x00\x00\x00\x00\x00C7\x02\x00\x00\x00\x00\x00z7\x02\x00\x00\x00\x00\x00\x7f7\x02\x00\x00\x00\x00\x00\x877\x02\x00\x00\x00\x00\x00\xfd7\x02\x00\x00\x00\x00\x00U8\x02\x00\x00\x00\x00\x00Z8\x02\x00\x00\x00\x00\x00[8\x02\x00\x00\x00\x00\x00\\8\x02\x00\x00\x00\x00\x00'
+    b']8\x02\x00\x00\x00\x00\x00^8\x02\x00\x00\x00\x00\x00_8\x02\x00\x00\x00\x00\x00\x1e9\x02\x00\x00\x00\x00\x0019\x02\x00\x00\x00\x00\x00\xd39\x02\x00\x00\x00\x00\x00\xe19\x02\x00\x00\x00\x00\x00\xeb9\x02\x00\x00\x00\x00\x00\xf29\x02\x00\x00\x00\x00\x00\xf39\x02\x00\x00\x00\x00\x00\xf49\x02\x00\x00\x00\x00\x00\xf59\x02\x00\x00\x00\x00\x00'
+    b'\xf69\x02\x00\x00\x00\x00\x00w:\x02\x00\x00\x00\x00\x00\xe1:\x02\x00\x00\x00\x00\x00\xa3;\x02\x00\x00\x00\x00\x00\xa4;\x02\x00\x00\x00\x00\x00><\x02\x00\x00\x00\x00\x00q<\x02\x00\x00\x00\x00\x00r<\x02\x00\x00\x00\x00\x00v<\x02\x00\x00\x00\x00\x00\x91<\x02\x00\x00\x00\x00\x00\xdd<\x02\x00\x00\x00\x00\x00h=\x02\x00\x00\x00\x00\x00'
+    b'\x9d=\x02\x00\x00\x00\x00\x00\xe8=\x02\x00\x00\x00\x00\x00\xe9=\x02\x00\x00\x00\x00\x00\x02>\x02\x00\x00\x00\x00\x00Y>\x02\x00\x00\x00\x00\x00[>\x02\x00\x00\x00\x00\x00a>\x02\x00\x00\x00\x00\x00\x88>\x02\x00\x00\x00\x00\x00\x8a>\x02\x00\x00\x00\x00\x00\xa8>\x02\x00\x00\x00\x00\x00\xa9>\x02\x00\x00\x00\x00\x00\xac>\x02\x00\x00\x00\x00\x00'
+    b'\xad>\x02\x00\x00\x00\x00\x00\xae>\x02\x00\x00\x00\x00\x00\xaf>\x02\x00\x00\x00\x00\x00#?\x02\x00\x00\x00\x00\x00$?\x02\x00\x00\x00\x00\x00+?\x02\x00\x00\x00\x00\x00:?\x02\x00\x00\x00\x00\x00r?\x02\x00\x00\x00\x00\x00s?\x02\x00\x00\x00\x00\x00\x06@\x02\x00\x00\x00\x00\x00\x13@\x02\x00\x00\x00\x00\x00J@\x02\x00\x00\x00\x00\x00'
+    b"\x93A\x02\x00\x00\x00\x00\x00'B\x02\x00\x00\x00\x00\x00\x80B\x02\x00\x00\x00\x00\x00\x83B\x02\x00\x00\x00\x00\x00\xe5B\x02\x00\x00\x00\x00\x00\x1dC\x02\x00\x00\x00\x00\x00\x1eC\x02\x00\x00\x00\x00\x00JC\x02\x00\x00\x00\x00\x00\x04E\x02\x00\x00\x00\x00\x00!E\x02\x00\x00\x00\x00\x00\x1eG\x02\x00\x00\x00\x00\x00\x1fG\x02\x00\x00\x00\x00\x00"
+    b" G\x02\x00\x00\x00\x00\x00\x92G\x02\x00\x00\x00\x00\x00'H\x02\x00\x00\x00\x00\x00\x00I\x02\x00\x00\x00\x00\x00\xa3I\x02\x00\x00\x00\x00\x00\xc9I\x02\x00\x00\x00\x00\x00\xccI\x02\x00\x00\x00\x00\x00\xd6I\x02\x00\x00\x00\x00\x00\xe0I\x02\x00\x00\x00\x00\x00\xebI\x02\x00\x00\x00\x00\x00\rJ\x02\x00\x00\x00\x00\x00$J\x02\x00\x00\x00\x00\x00"
+    b'%J\x02\x00\x00\x00\x00\x00/J\x02\x00\x00\x00\x00\x008J\x02\x00\x00\x00\x00\x009J\x02\x00\x00\x00\x00\x00:J\x02\x00\x00\x00\x00\x00;J\x02\x00\x00\x00\x00\x00>J\x02\x00\x00\x00\x00\x00rJ\x02\x00\x00\x00\x00\x00\xf3J\x02\x00\x00\x00\x00\x00aK\x02\x00\x00\x00\x00\x00kK\x02\x00\x00\x00\x00\x00lK\x02\x00\x00\x00\x00\x00'
+    b'mK\x02\x00\x00\x00\x00\x00\x86K\x02\x00\x00\x00\x00\x00\xd3K\x02\x00\x00\x00\x00\x00\xf0K\x02\x00\x00\x00\x00\x00\x1dL\x02\x00\x00\x00\x00\x00(M\x02\x00\x00\x00\x00\x00+M\x02\x00\x00\x00\x00\x00[M\x02\x00\x00\x00\x00\x00\x06N\x02\x00\x00\x00\x00\x002N\x02\x00\x00\x00\x00\x00CN\x02\x00\x00\x00\x00\x00HN\x02\x00\x00\x00\x00\x00'
+    b'{N\x02\x00\x00\x00\x00\x00\x82N\x02\x00\x00\x00\x00\x00\x83N\x02\x00\x00\x00\x00\x00\x96N\x02\x00\x00\x00\x00\x00\xa0N\x02\x00\x00\x00\x00\x00\xa1N\x02\x00\x00\x00\x00\x00\xdfN\x02\x00\x00\x00\x00\x00\xdaO\x02\x00\x00\x00\x00\x00\xdbO\x02\x00\x00\x00\x00\x00\xdcO\x02\x00\x00\x00\x00\x00\xddO\x02\x00\x00\x00\x00\x00\xdeO\x02\x00\x00\x00\x00\x00'
+    b'\xf9O\x02\x00\x00\x00\x00\x00\xfcO\x02\x00\x00\x00\x00\x00\xd7P\x02\x00\x00\x00\x00\x00\nQ\x02\x00\x00\x00\x00\x00\x0fQ\x02\x00\x00\x00\x00\x00lQ\x02\x00\x00\x00\x00\x00oQ\x02\x00\x00\x00\x00\x00pQ\x02\x00\x00\x00\x00\x00\x95Q\x02\x00\x00\x00\x00\x00\x96Q\x02\x00\x00\x00\x00\x00\x98Q\x02\x00\x00\x00\x00\x00\x7fR\x02\x00\x00\x00\x00\x00'
+    b'\x83R\x02\x00\x00\x00\x00\x00\xb1R\x02\x00\x00\x00\x00\x00\xebR\x02\x00\x00\x00\x00\x00\xedR\x02\x00\x00\x00\x00\x00\xeeR\x02\x00\x00\x00\x00\x00\xefR\x02\x00\x00\x00\x00\x00\xf0R\x02\x00\x00\x00\x00\x00\xf1R\x02\x00\x00\x00\x00\x00\xf2R\x02\x00\x00\x00\x00\x00\x10S\x02\x00\x00\x00\x00\x00"S\x02\x00\x00\x00\x00\x003S\x02\x00\x00\x00\x00\x00'
+    b'ZS\x02\x00\x00\x00\x00\x00_S\x02\x00\x00\x00\x00\x00cS\x02\x00\x00\x00\x00\x00sS\x02\x00\x00\x00\x00\x00zS\x02\x00\x00\x00\x00\x00\xa4S\x02\x00\x00\x00\x00\x00\xbfS\x02\x00\x00\x00\x00\x00\xc3S\x02\x00\x00\x00\x00\x00\xc8S\x02\x00\x00\x00\x00\x00\xc9S\x02\x00\x00\x00\x00\x00\xdbS\x02\x00\x00\x00\x00\x00\xe5S\x02\x00\x00\x00\x00\x00'
+    b'\x14T\x02\x00\x00\x00\x00\x00\x18T\x02\x00\x00\x00\x00\x00\x19T\x02\x00\x00\x00\x00\x00\x1bT\x02\x00\x00\x00\x00\x00\x1cT\x02\x00\x00\x00\x00\x00!T\x02\x00\x00\x00\x00\x00-T\x02\x00\x00\x00\x00\x00\xa2T\x02\x00\x00\x00\x00\x00\xb8T\x02\x00\x00\x00\x00\x00\xd2T\x02\x00\x00\x00\x00\x00\xd8T\x02\x00\x00\x00\x00\x00\xdbT\x02\x00\x00\x00\x00\x00'
+    b'\xe8T\x02\x00\x00\x00\x00\x00\xf6T\x02\x00\x00\x00\x00\x00"U\x02\x00\x00\x00\x00\x00.U\x02\x00\x00\x00\x00\x00\x96U\x02\x00\x00\x00\x00\x00\x97U\x02\x00\x00\x00\x00\x00\xb8U\x02\x00\x00\x00\x00\x00\xccU\x02\x00\x00\x00\x00\x00\xffU\x02\x00\x00\x00\x00\x00\x04V\x02\x00\x00\x00\x00\x00\x7fV\x02\x00\x00\x00\x00\x00\xb3V\x02\x00\x00\x00\x00\x00'
+    b'\xf1V\x02\x00\x00\x00\x00\x00\tW\x02\x00\x00\x00\x00\x00\x1dW\x02\x00\x00\x00\x00\x00SW\x02\x00\x00\x00\x00\x00WW\x02\x00\x00\x00\x00\x00XW\x02\x00\x00\x00\x00\x00YW\x02\x00\x00\x00\x00\x00]W\x02\x00\x00\x00\x00\x00^W\x02\x00\x00\x00\x00\x00_W\x02\x00\x00\x00\x00\x00\xa8W\x02\x00\x00\x00\x00\x00\xdbW\x02\x00\x00\x00\x00\x00'
+    b'\xecW\x02\x00\x00\x00\x00\x00\xf9W\x02\x00\x00\x00\x00\x00\x07X\x02\x00\x00\x00\x00\x00\x08X\x02\x00\x00\x00\x00\x00\tX\x02\x00\x00\x00\x00\x007X\x02\x00\x00\x00\x00\x00?X\x02\x00\x00\x00\x00\x00bX\x02\x00\x00\x00\x00\x00hX\x02\x00\x00\x00\x00\x00iX\x02\x00\x00\x00\x00\x00jX\x02\x00\x00\x00\x00\x00\x8dX\x02\x00\x00\x00\x00\x00'
+    b'\xc0X\x02\x00\x00\x00\x00\x00\xdfX\x02\x00\x00\x00\x00\x00\x03Y\x02\x00\x00\x00\x00\x00>Y\x02\x00\x00\x00\x00\x00]Y\x02\x00\x00\x00\x00\x00CZ\x02\x00\x00\x00\x00\x00GZ\x02\x00\x00\x00\x00\x00JZ\x02\x00\x00\x00\x00\x00^Z\x02\x00\x00\x00\x00\x00aZ\x02\x00\x00\x00\x00\x00\x8dZ\x02\x00\x00\x00\x00\x00\x8fZ\x02\x00\x00\x00\x00\x00'
+    b'\xa2Z\x02\x00\x00\x00\x00\x00\xaaZ\x02\x00\x00\x00\x00\x00\xacZ\x02\x00\x00\x00\x00\x00\xd8Z\x02\x00\x00\x00\x00\x000[\x02\x00\x00\x00\x00\x00L[\x02\x00\x00\x00\x00\x00M[\x02\x00\x00\x00\x00\x00V[\x02\x00\x00\x00\x00\x00h[\x02\x00\x00\x00\x00\x00i[\x02\x00\x00\x00\x00\x00j[\x02\x00\x00\x00\x00\x00k[\x02\x00\x00\x00\x00\x00'
+    b'l[\x02\x00\x00\x00\x00\x00m[\x02\x00\x00\x00\x00\x00n[\x02\x00\x00\x00\x00\x00o[\x02\x00\x00\x00\x00\x00p[\x02\x00\x00\x00\x00\x00q[\x02\x00\x00\x00\x00\x00r[\x02\x00\x00\x00\x00\x00s[\x02\x00\x00\x00\x00\x00t[\x02\x00\x00\x00\x00\x00u[\x02\x00\x00\x00\x00\x00v[\x02\x00\x00\x00\x00\x00w[\x02\x00\x00\x00\x00\x00'
+    b'x[\x02\x00\x00\x00\x00\x00z[\x02\x00\x00\x00\x00\x00{[\x02\x00\x00\x00\x00\x00|[\x02\x00\x00\x00\x00\x00\xa4[\x02\x00\x00\x00\x00\x00\xc3[\x02\x00\x00\x00\x00\x00\xc5[\x02\x00\x00\x00\x00\x00\xca[\x02\x00\x00\x00\x00\x00\xe1[\x02\x00\x00\x00\x00\x00\xe3[\x02\x00\x00\x00\x00\x00\x04\\\x02\x00\x00\x00\x00\x00\x05\\\x02\x00\x00\x00\x00\x00'
+    b'\x1e\\\x02\x00\x00\x00\x00\x00>\\\x02\x00\x00\x00\x00\x00?\\\x02\x00\x00\x00\x00\x00@\\\x02\x00\x00\x00\x00\x00\\\\\x02\x00\x00\x00\x00\x00`\\\x02\x00\x00\x00\x00\x00\x03]\x02\x00\x00\x00\x00\x00\x06]\x02\x00\x00\x00\x00\x00d]\x02\x00\x00\x00\x00\x00v]\x02\x00\x00\x00\x00\x00z]\x02\x00\x00\x00\x00\x00\x80]\x02\x00\x00\x00\x00\x00'
+    b'\x8b]\x02\x00\x00\x00\x00\x00\x90]\x02\x00\x00\x00\x00\x00\x91]\x02\x00\x00\x00\x00\x00\x9d]\x02\x00\x00\x00\x00\x00\xb7]\x02\x00\x00\x00\x00\x00\xfb]\x02\x00\x00\x00\x00\x00\x04^\x02\x00\x00\x00\x00\x00\x07^\x02\x00\x00\x00\x00\x00A^\x02\x00\x00\x00\x00\x00m^\x02\x00\x00\x00\x00\x00\x85^\x02\x00\x00\x00\x00\x00\x8d^\x02\x00\x00\x00\x00\x00'
+    b'\xc1^\x02\x00\x00\x00\x00\x00\xc3^\x02\x00\x00\x00\x00\x008_\x02\x00\x00\x00\x00\x009_\x02\x00\x00\x00\x00\x00p_\x02\x00\x00\x00\x00\x00r_\x02\x00\x00\x00\x00\x00\xa9_\x02\x00\x00\x00\x00\x00\xaa_\x02\x00\x00\x00\x00\x00\xad_\x02\x00\x00\x00\x00\x00\xba_\x02\x00\x00\x00\x00\x00\xce_\x02\x00\x00\x00\x00\x00\xcf_\x02\x00\x00\x00\x00\x00'
+    b'\xd0_\x02\x00\x00\x00\x00\x00\xd1_\x02\x00\x00\x00\x00\x00\xd2_\x02\x00\x00\x00\x00\x00\xd9_\x02\x00\x00\x00\x00\x00\xf4_\x02\x00\x00\x00\x00\x00\x01`\x02\x00\x00\x00\x00\x00\x1b`\x02\x00\x00\x00\x00\x00)`\x02\x00\x00\x00\x00\x00+`\x02\x00\x00\x00\x00\x00<`\x02\x00\x00\x00\x00\x00p`\x02\x00\x00\x00\x00\x00q`\x02\x00\x00\x00\x00\x00'
+    b'~`\x02\x00\x00\x00\x00\x00\xa9`\x02\x00\x00\x00\x00\x00$a\x02\x00\x00\x00\x00\x00&a\x02\x00\x00\x00\x00\x00(a\x02\x00\x00\x00\x00\x002a\x02\x00\x00\x00\x00\x00Ia\x02\x00\x00\x00\x00\x00ha\x02\x00\x00\x00\x00\x00xa\x02\x00\x00\x00\x00\x00\xd4a\x02\x00\x00\x00\x00\x00/b\x02\x00\x00\x00\x00\x00`b\x02\x00\x00\x00\x00\x00'
+    b'\xf8b\x02\x00\x00\x00\x00\x00+c\x02\x00\x00\x00\x00\x00,c\x02\x00\x00\x00\x00\x00\xb1c\x02\x00\x00\x00\x00\x00\xb8c\x02\x00\x00\x00\x00\x00\xc7c\x02\x00\x00\x00\x00\x00\xc9c\x02\x00\x00\x00\x00\x00wd\x02\x00\x00\x00\x00\x00\x95d\x02\x00\x00\x00\x00\x00\xc7d\x02\x00\x00\x00\x00\x00\xded\x02\x00\x00\x00\x00\x00\x10e\x02\x00\x00\x00\x00\x00'
+    b'Oe\x02\x00\x00\x00\x00\x00Xe\x02\x00\x00\x00\x00\x00Ye\x02\x00\x00\x00\x00\x00Ze\x02\x00\x00\x00\x00\x00[e\x02\x00\x00\x00\x00\x00\xc7e\x02\x00\x00\x00\x00\x00\xc9e\x02\x00\x00\x00\x00\x00\xe2e\x02\x00\x00\x00\x00\x00\rf\x02\x00\x00\x00\x00\x00\x16f\x02\x00\x00\x00\x00\x00\x19f\x02\x00\x00\x00\x00\x00\xf5f\x02\x00\x00\x00\x00\x00'
+    b'\xfaf\x02\x00\x00\x00\x00\x00\x0cg\x02\x00\x00\x00\x00\x00\x12g\x02\x00\x00\x00\x00\x00\x1eg\x02\x00\x00\x00\x00\x00Cg\x02\x00\x00\x00\x00\x00Tg\x02\x00\x00\x00\x00\x00\x86g\x02\x00\x00\x00\x00\x00\xd9g\x02\x00\x00\x00\x00\x00\xedg\x02\x00\x00\x00\x00\x00\xf8g\x02\x00\x00\x00\x00\x00\x8eh\x02\x00\x00\x00\x00\x00\xa3h\x02\x00\x00\x00\x00\x00'
+    b'\xb8h\x02\x00\x00\x00\x00\x00\x03i\x02\x00\x00\x00\x00\x00\x1ci\x02\x00\x00\x00\x00\x00\x1di\x02\x00\x00\x00\x00\x00\xbci\x02\x00\x00\x00\x00\x00\xf2i\x02\x00\x00\x00\x00\x00\xfdi\x02\x00\x00\x00\x00\x00\xfei\x02\x00\x00\x00\x00\x00\x06j\x02\x00\x00\x00\x00\x00\x07j\x02\x00\x00\x00\x00\x00Dj\x02\x00\x00\x00\x00\x00Ej\x02\x00\x00\x00\x00\x00'
+    b'Fj\x02\x00\x00\x00\x00\x00Gj\x02\x00\x00\x00\x00\x00Hj\x02\x00\x00\x00\x00\x00Ij\x02\x00\x00\x00\x00\x00Jj\x02\x00\x00\x00\x00\x00Kj\x02\x00\x00\x00\x00\x00Mj\x02\x00\x00\x00\x00\x00Nj\x02\x00\x00\x00\x00\x00\xb2j\x02\x00\x00\x00\x00\x00\xbcj\x02\x00\x00\x00\x00\x00\xc1j\x02\x00\x00\x00\x00\x00\xc3j\x02\x00\x00\x00\x00\x00'
+    b'\xc4j\x02\x00\x00\x00\x00\x00\xc5j\x02\x00\x00\x00\x00\x00_k\x02\x00\x00\x00\x00\x00\xc7k\x02\x00\x00\x00\x00\x00\xf3k\x02\x00\x00\x00\x00\x00Bl\x02\x00\x00\x00\x00\x00Cl\x02\x00\x00\x00\x00\x00Dl\x02\x00\x00\x00\x00\x00El\x02\x00\x00\x00\x00\x00Fl\x02\x00\x00\x00\x00\x00Gl\x02\x00\x00\x00\x00\x00Hl\x02\x00\x00\x00\x00\x00'
+    b"Il\x02\x00\x00\x00\x00\x00rl\x02\x00\x00\x00\x00\x00\x84l\x02\x00\x00\x00\x00\x00\xb7l\x02\x00\x00\x00\x00\x00\xbbl\x02\x00\x00\x00\x00\x00\xd8l\x02\x00\x00\x00\x00\x00\x8am\x02\x00\x00\x00\x00\x00&n\x02\x00\x00\x00\x00\x00'n\x02\x00\x00\x00\x00\x00)n\x02\x00\x00\x00\x00\x00\x84n\x02\x00\x00\x00\x00\x00mo\x02\x00\x00\x00\x00\x00"
+    b'\xaap\x02\x00\x00\x00\x00\x00\xc3p\x02\x00\x00\x00\x00\x00\xefp\x02\x00\x00\x00\x00\x00\xf0p\x02\x00\x00\x00\x00\x00\xf1p\x02\x00\x00\x00\x00\x002q\x02\x00\x00\x00\x00\x003q\x02\x00\x00\x00\x00\x004q\x02\x00\x00\x00\x00\x005q\x02\x00\x00\x00\x00\x006q\x02\x00\x00\x00\x00\x007q\x02\x00\x00\x00\x00\x008q\x02\x00\x00\x00\x00\x00'
+    b'9q\x02\x00\x00\x00\x00\x00:q\x02\x00\x00\x00\x00\x00<q\x02\x00\x00\x00\x00\x00=q\x02\x00\x00\x00\x00\x00>q\x02\x00\x00\x00\x00\x00?q\x02\x00\x00\x00\x00\x00@q\x02\x00\x00\x00\x00\x00Aq\x02\x00\x00\x00\x00\x00Bq\x02\x00\x00\x00\x00\x00Cq\x02\x00\x00\x00\x00\x00Dq\x02\x00\x00\x00\x00\x00Eq\x02\x00\x00\x00\x00\x00'
+    b'Fq\x02\x00\x00\x00\x00\x00Gq\x02\x00\x00\x00\x00\x00~q\x02\x00\x00\x00\x00\x00\xffq\x02\x00\x00\x00\x00\x00\nr\x02\x00\x00\x00\x00\x00\x14r\x02\x00\x00\x00\x00\x00\xf9r\x02\x00\x00\x00\x00\x00\xfcr\x02\x00\x00\x00\x00\x00\xfdr\x02\x00\x00\x00\x00\x00\xfer\x02\x00\x00\x00\x00\x00\xffr\x02\x00\x00\x00\x00\x00\x00s\x02\x00\x00\x00\x00\x00'
+    b'\x01s\x02\x00\x00\x00\x00\x00\x02s\x02\x00\x00\x00\x00\x00\x03s\x02\x00\x00\x00\x00\x00\x04s\x02\x00\x00\x00\x00\x00!s\x02\x00\x00\x00\x00\x00?s\x02\x00\x00\x00\x00\x00@s\x02\x00\x00\x00\x00\x00As\x02\x00\x00\x00\x00\x00Bs\x02\x00\x00\x00\x00\x00Cs\x02\x00\x00\x00\x00\x00ns\x02\x00\x00\x00\x00\x00\x10t\x02\x00\x00\x00\x00\x00'
+    b"$t\x02\x00\x00\x00\x00\x00%t\x02\x00\x00\x00\x00\x00&t\x02\x00\x00\x00\x00\x00't\x02\x00\x00\x00\x00\x00(t\x02\x00\x00\x00\x00\x00)t\x02\x00\x00\x00\x00\x00*t\x02\x00\x00\x00\x00\x00+t\x02\x00\x00\x00\x00\x00,t\x02\x00\x00\x00\x00\x00-t\x02\x00\x00\x00\x00\x00.t\x02\x00\x00\x00\x00\x00/t\x02\x00\x00\x00\x00\x00"
+    b'0t\x02\x00\x00\x00\x00\x001t\x02\x00\x00\x00\x00\x002t\x02\x00\x00\x00\x00\x00Jt\x02\x00\x00\x00\x00\x00Qt\x02\x00\x00\x00\x00\x00_t\x02\x00\x00\x00\x00\x00jt\x02\x00\x00\x00\x00\x00kt\x02\x00\x00\x00\x00\x00lt\x02\x00\x00\x00\x00\x00mt\x02\x00\x00\x00\x00\x00nt\x02\x00\x00\x00\x00\x00ot\x02\x00\x00\x00\x00\x00'
+    b'pt\x02\x00\x00\x00\x00\x00rt\x02\x00\x00\x00\x00\x00st\x02\x00\x00\x00\x00\x00ut\x02\x00\x00\x00\x00\x00vt\x02\x00\x00\x00\x00\x00wt\x02\x00\x00\x00\x00\x00\xbbt\x02\x00\x00\x00\x00\x007u\x02\x00\x00\x00\x00\x008u\x02\x00\x00\x00\x00\x00Vu\x02\x00\x00\x00\x00\x00Wu\x02\x00\x00\x00\x00\x00\x0bv\x02\x00\x00\x00\x00\x00'
+    b'\x8dv\x02\x00\x00\x00\x00\x00\x97v\x02\x00\x00\x00\x00\x00\xeev\x02\x00\x00\x00\x00\x00\x12w\x02\x00\x00\x00\x00\x00\x16w\x02\x00\x00\x00\x00\x00\x94w\x02\x00\x00\x00\x00\x00?x\x02\x00\x00\x00\x00\x00*z\x02\x00\x00\x00\x00\x00\xcez\x02\x00\x00\x00\x00\x00\xf9z\x02\x00\x00\x00\x00\x00\x1d{\x02\x00\x00\x00\x00\x00m{\x02\x00\x00\x00\x00\x00'
+    b'\xa5{\x02\x00\x00\x00\x00\x00\xe8{\x02\x00\x00\x00\x00\x00\x15|\x02\x00\x00\x00\x00\x00\x16|\x02\x00\x00\x00\x00\x00\x17|\x02\x00\x00\x00\x00\x00\x18|\x02\x00\x00\x00\x00\x00\x19|\x02\x00\x00\x00\x00\x00\x1a|\x02\x00\x00\x00\x00\x00S|\x02\x00\x00\x00\x00\x00\xb8|\x02\x00\x00\x00\x00\x00\xed|\x02\x00\x00\x00\x00\x00\xf5|\x02\x00\x00\x00\x00\x00'
+    b'\x1a}\x02\x00\x00\x00\x00\x00\x1b}\x02\x00\x00\x00\x00\x00$}\x02\x00\x00\x00\x00\x00%}\x02\x00\x00\x00\x00\x00(}\x02\x00\x00\x00\x00\x00\xd8}\x02\x00\x00\x00\x00\x00\x0c~\x02\x00\x00\x00\x00\x005~\x02\x00\x00\x00\x00\x00m~\x02\x00\x00\x00\x00\x00\x8b~\x02\x00\x00\x00\x00\x00\xdb~\x02\x00\x00\x00\x00\x00\xdc~\x02\x00\x00\x00\x00\x00'
+    b'\t\x7f\x02\x00\x00\x00\x00\x00%\x7f\x02\x00\x00\x00\x00\x00H\x7f\x02\x00\x00\x00\x00\x00\xbd\x7f\x02\x00\x00\x00\x00\x00\xbe\x7f\x02\x00\x00\x00\x00\x00\xbf\x7f\x02\x00\x00\x00\x00\x00\xc0\x7f\x02\x00\x00\x00\x00\x00\xc1\x7f\x02\x00\x00\x00\x00\x00\xc2\x7f\x02\x00\x00\x00\x00\x00\xc3\x7f\x02\x00\x00\x00\x00\x00\xc4\x7f\x02\x00\x00\x00\x00\x00\xc5\x7f\x02\x00\x00\x00\x00\x00'
+    b'\xc6\x7f\x02\x00\x00\x00\x00\x00\xca\x7f\x02\x00\x00\x00\x00\x00\xd9\x7f\x02\x00\x00\x00\x00\x00\xda\x7f\x02\x00\x00\x00\x00\x00\xdb\x7f\x02\x00\x00\x00\x00\x00\xdc\x7f\x02\x00\x00\x00\x00\x00\xdd\x7f\x02\x00\x00\x00\x00\x00\xde\x7f\x02\x00\x00\x00\x00\x00\xdf\x7f\x02\x00\x00\x00\x00\x00\xe0\x7f\x02\x00\x00\x00\x00\x00\xe1\x7f\x02\x00\x00\x00\x00\x00\xe2\x7f\x02\x00\x00\x00\x00\x00'
+    b'\xe3\x7f\x02\x00\x00\x00\x00\x00\xf3\x7f\x02\x00\x00\x00\x00\x00D\x80\x02\x00\x00\x00\x00\x00E\x80\x02\x00\x00\x00\x00\x00s\x80\x02\x00\x00\x00\x00\x00t\x80\x02\x00\x00\x00\x00\x00u\x80\x02\x00\x00\x00\x00\x00v\x80\x02\x00\x00\x00\x00\x00\xcf\x80\x02\x00\x00\x00\x00\x00\x13\x81\x02\x00\x00\x00\x00\x004\x81\x02\x00\x00\x00\x00\x005\x81\x02\x00\x00\x00\x00\x00'
+    b'P\x81\x02\x00\x00\x00\x00\x00\x12\x82\x02\x00\x00\x00\x00\x00(\x82\x02\x00\x00\x00\x00\x00)\x82\x02\x00\x00\x00\x00\x00;\x82\x02\x00\x00\x00\x00\x00<\x82\x02\x00\x00\x00\x00\x00=\x82\x02\x00\x00\x00\x00\x00>\x82\x02\x00\x00\x00\x00\x00?\x82\x02\x00\x00\x00\x00\x00B\x82\x02\x00\x00\x00\x00\x00=\x83\x02\x00\x00\x00\x00\x00>\x83\x02\x00\x00\x00\x00\x00'
+    b'L\x83\x02\x00\x00\x00\x00\x00\x98\x83\x02\x00\x00\x00\x00\x00\xf4\x83\x02\x00\x00\x00\x00\x00\x10\x84\x02\x00\x00\x00\x00\x00\x11\x84\x02\x00\x00\x00\x00\x00\x1d\x84\x02\x00\x00\x00\x00\x00\x1e\x84\x02\x00\x00\x00\x00\x00\x1f\x84\x02\x00\x00\x00\x00\x00 \x84\x02\x00\x00\x00\x00\x00!\x84\x02\x00\x00\x00\x00\x00"\x84\x02\x00\x00\x00\x00\x00#\x84\x02\x00\x00\x00\x00\x00'
+    b'7\x84\x02\x00\x00\x00\x00\x009\x84\x02\x00\x00\x00\x00\x00I\x85\x02\x00\x00\x00\x00\x00P\x85\x02\x00\x00\x00\x00\x00T\x85\x02\x00\x00\x00\x00\x00U\x85\x02\x00\x00\x00\x00\x00V\x85\x02\x00\x00\x00\x00\x00W\x85\x02\x00\x00\x00\x00\x00\xa2\x85\x02\x00\x00\x00\x00\x00v\x87\x02\x00\x00\x00\x00\x00\x88\x87\x02\x00\x00\x00\x00\x00\x89\x87\x02\x00\x00\x00\x00\x00'
+    b'\x1b\x88\x02\x00\x00\x00\x00\x00 \x88\x02\x00\x00\x00\x00\x00\x86\x88\x02\x00\x00\x00\x00\x00\x87\x88\x02\x00\x00\x00\x00\x00\x88\x88\x02\x00\x00\x00\x00\x00\x89\x88\x02\x00\x00\x00\x00\x00\x8a\x88\x02\x00\x00\x00\x00\x00\x8b\x88\x02\x00\x00\x00\x00\x00\x8c\x88\x02\x00\x00\x00\x00\x00\x8d\x88\x02\x00\x00\x00\x00\x00\x8e\x88\x02\x00\x00\x00\x00\x00\x8f\x88\x02\x00\x00\x00\x00\x00'
+    b'\x90\x88\x02\x00\x00\x00\x00\x00\x95\x88\x02\x00\x00\x00\x00\x00\x96\x88\x02\x00\x00\x00\x00\x00\x97\x88\x02\x00\x00\x00\x00\x00\x98\x88\x02\x00\x00\x00\x00\x00\x99\x88\x02\x00\x00\x00\x00\x00\x9a\x88\x02\x00\x00\x00\x00\x00\x9b\x88\x02\x00\x00\x00\x00\x00\x9c\x88\x02\x00\x00\x00\x00\x00\x9d\x88\x02\x00\x00\x00\x00\x00\x9e\x88\x02\x00\x00\x00\x00\x00\x9f\x88\x02\x00\x00\x00\x00\x00'
+    b'\xe2\x88\x02\x00\x00\x00\x00\x00\xa1\x89\x02\x00\x00\x00\x00\x00^\x8a\x02\x00\x00\x00\x00\x00~\x8a\x02\x00\x00\x00\x00\x00\x7f\x8a\x02\x00\x00\x00\x00\x00\x14\x8b\x02\x00\x00\x00\x00\x00\xa5\x8b\x02\x00\x00\x00\x00\x00\xee\x8b\x02\x00\x00\x00\x00\x00\xf8\x8b\x02\x00\x00\x00\x00\x00\xf9\x8b\x02\x00\x00\x00\x00\x00\xfa\x8b\x02\x00\x00\x00\x00\x00\xfb\x8b\x02\x00\x00\x00\x00\x00'
+    b'\xfe\x8b\x02\x00\x00\x00\x00\x00\xff\x8b\x02\x00\x00\x00\x00\x00\x00\x8c\x02\x00\x00\x00\x00\x00\x01\x8c\x02\x00\x00\x00\x00\x00\x07\x8c\x02\x00\x00\x00\x00\x00;\x8c\x02\x00\x00\x00\x00\x00^\x8c\x02\x00\x00\x00\x00\x00o\x8c\x02\x00\x00\x00\x00\x00\x87\x8c\x02\x00\x00\x00\x00\x00\x88\x8c\x02\x00\x00\x00\x00\x00\xad\x8c\x02\x00\x00\x00\x00\x00\xbd\x8c\x02\x00\x00\x00\x00\x00'
+    b"\xc4\x8c\x02\x00\x00\x00\x00\x00\xc5\x8c\x02\x00\x00\x00\x00\x00\xc6\x8c\x02\x00\x00\x00\x00\x00'\x8d\x02\x00\x00\x00\x00\x00(\x8d\x02\x00\x00\x00\x00\x00+\x8d\x02\x00\x00\x00\x00\x00L\x8d\x02\x00\x00\x00\x00\x00\x14\x8e\x02\x00\x00\x00\x00\x00+\x8e\x02\x00\x00\x00\x00\x00k\x8e\x02\x00\x00\x00\x00\x00\x84\x8e\x02\x00\x00\x00\x00\x00\xca\x8e\x02\x00\x00\x00\x00\x00"
+    b'\xcb\x8e\x02\x00\x00\x00\x00\x00\xcd\x8e\x02\x00\x00\x00\x00\x00\xce\x8e\x02\x00\x00\x00\x00\x00\xcf\x8e\x02\x00\x00\x00\x00\x00\xd0\x8e\x02\x00\x00\x00\x00\x00\xf3\x8e\x02\x00\x00\x00\x00\x00\xf4\x8e\x02\x00\x00\x00\x00\x00\xfa\x8e\x02\x00\x00\x00\x00\x00\xfb\x8e\x02\x00\x00\x00\x00\x00\xfc\x8e\x02\x00\x00\x00\x00\x00\xfd\x8e\x02\x00\x00\x00\x00\x00\xff\x8e\x02\x00\x00\x00\x00\x00'
+    b'3\x8f\x02\x00\x00\x00\x00\x00L\x8f\x02\x00\x00\x00\x00\x00\xa5\x8f\x02\x00\x00\x00\x00\x00\xa7\x8f\x02\x00\x00\x00\x00\x00\xcb\x8f\x02\x00\x00\x00\x00\x00\xda\x8f\x02\x00\x00\x00\x00\x00\xdb\x8f\x02\x00\x00\x00\x00\x00\xde\x8f\x02\x00\x00\x00\x00\x00E\x90\x02\x00\x00\x00\x00\x00F\x90\x02\x00\x00\x00\x00\x00G\x90\x02\x00\x00\x00\x00\x00H\x90\x02\x00\x00\x00\x00\x00'
+    b'^\x90\x02\x00\x00\x00\x00\x00p\x90\x02\x00\x00\x00\x00\x00\xc8\x90\x02\x00\x00\x00\x00\x00\xe8\x90\x02\x00\x00\x00\x00\x00\xed\x90\x02\x00\x00\x00\x00\x00\xf6\x90\x02\x00\x00\x00\x00\x00\x11\x91\x02\x00\x00\x00\x00\x00\x19\x91\x02\x00\x00\x00\x00\x00\x1a\x91\x02\x00\x00\x00\x00\x00\x1d\x91\x02\x00\x00\x00\x00\x00E\x91\x02\x00\x00\x00\x00\x00F\x91\x02\x00\x00\x00\x00\x00'
+    b'G\x91\x02\x00\x00\x00\x00\x00H\x91\x02\x00\x00\x00\x00\x00I\x91\x02\x00\x00\x00\x00\x00J\x91\x02\x00\x00\x00\x00\x00K\x91\x02\x00\x00\x00\x00\x00L\x91\x02\x00\x00\x00\x00\x00N\x91\x02\x00\x00\x00\x00\x00O\x91\x02\x00\x00\x00\x00\x00z\x91\x02\x00\x00\x00\x00\x00}\x91\x02\x00\x00\x00\x00\x00\xb5\x91\x02\x00\x00\x00\x00\x00\xb7\x91\x02\x00\x00\x00\x00\x00'
+    b'\xb8\x91\x02\x00\x00\x00\x00\x00\xb9\x91\x02\x00\x00\x00\x00\x00\xba\x91\x02\x00\x00\x00\x00\x00\xbb\x91\x02\x00\x00\x00\x00\x00\xbc\x91\x02\x00\x00\x00\x00\x00\xbd\x91\x02\x00\x00\x00\x00\x00\xbe\x91\x02\x00\x00\x00\x00\x00\xbf\x91\x02\x00\x00\x00\x00\x00\xc0\x91\x02\x00\x00\x00\x00\x00\xc1\x91\x02\x00\x00\x00\x00\x00\xc2\x91\x02\x00\x00\x00\x00\x00\xc3\x91\x02\x00\x00\x00\x00\x00'
+    b'\xd0\x91\x02\x00\x00\x00\x00\x00\xd5\x91\x02\x00\x00\x00\x00\x00\xd6\x91\x02\x00\x00\x00\x00\x00\xd7\x91\x02\x00\x00\x00\x00\x00\xd8\x91\x02\x00\x00\x00\x00\x00\xd9\x91\x02\x00\x00\x00\x00\x00\xda\x91\x02\x00\x00\x00\x00\x00\xfd\x91\x02\x00\x00\x00\x00\x00\x16\x92\x02\x00\x00\x00\x00\x000\x92\x02\x00\x00\x00\x00\x001\x92\x02\x00\x00\x00\x00\x002\x92\x02\x00\x00\x00\x00\x00'
+    b'3\x92\x02\x00\x00\x00\x00\x004\x92\x02\x00\x00\x00\x00\x005\x92\x02\x00\x00\x00\x00\x008\x92\x02\x00\x00\x00\x00\x00R\x92\x02\x00\x00\x00\x00\x00X\x92\x02\x00\x00\x00\x00\x00a\x92\x02\x00\x00\x00\x00\x00h\x92\x02\x00\x00\x00\x00\x00\xa5\x92\x02\x00\x00\x00\x00\x00\x1d\x93\x02\x00\x00\x00\x00\x00\x1e\x93\x02\x00\x00\x00\x00\x00\x1f\x93\x02\x00\x00\x00\x00\x00'
+    b' \x93\x02\x00\x00\x00\x00\x00!\x93\x02\x00\x00\x00\x00\x00"\x93\x02\x00\x00\x00\x00\x00#\x93\x02\x00\x00\x00\x00\x00$\x93\x02\x00\x00\x00\x00\x00%\x93\x02\x00\x00\x00\x00\x004\x93\x02\x00\x00\x00\x00\x00?\x93\x02\x00\x00\x00\x00\x00L\x93\x02\x00\x00\x00\x00\x00T\x93\x02\x00\x00\x00\x00\x00d\x93\x02\x00\x00\x00\x00\x00e\x93\x02\x00\x00\x00\x00\x00'
+    b'k\x93\x02\x00\x00\x00\x00\x00l\x93\x02\x00\x00\x00\x00\x00\xfc\x93\x02\x00\x00\x00\x00\x00K\x94\x02\x00\x00\x00\x00\x00L\x94\x02\x00\x00\x00\x00\x00T\x94\x02\x00\x00\x00\x00\x00u\x94\x02\x00\x00\x00\x00\x00\x0c\x95\x02\x00\x00\x00\x00\x00\r\x95\x02\x00\x00\x00\x00\x00\x0e\x95\x02\x00\x00\x00\x00\x00\x10\x95\x02\x00\x00\x00\x00\x00\x11\x95\x02\x00\x00\x00\x00\x00'
+    b'\x12\x95\x02\x00\x00\x00\x00\x00\x1f\x95\x02\x00\x00\x00\x00\x00 \x95\x02\x00\x00\x00\x00\x00!\x95\x02\x00\x00\x00\x00\x00"\x95\x02\x00\x00\x00\x00\x00#\x95\x02\x00\x00\x00\x00\x00T\x95\x02\x00\x00\x00\x00\x00U\x95\x02\x00\x00\x00\x00\x00V\x95\x02\x00\x00\x00\x00\x00W\x95\x02\x00\x00\x00\x00\x00X\x95\x02\x00\x00\x00\x00\x00Y\x95\x02\x00\x00\x00\x00\x00'
+    b'Z\x95\x02\x00\x00\x00\x00\x00[\x95\x02\x00\x00\x00\x00\x00\\\x95\x02\x00\x00\x00\x00\x00j\x95\x02\x00\x00\x00\x00\x00x\x95\x02\x00\x00\x00\x00\x00\x80\x95\x02\x00\x00\x00\x00\x00\xdc\x95\x02\x00\x00\x00\x00\x00\xdd\x95\x02\x00\x00\x00\x00\x00\xe0\x95\x02\x00\x00\x00\x00\x00\xe1\x95\x02\x00\x00\x00\x00\x00\xe7\x95\x02\x00\x00\x00\x00\x00\xe8\x95\x02\x00\x00\x00\x00\x00'
+    b'\xf3\x95\x02\x00\x00\x00\x00\x00\xf6\x95\x02\x00\x00\x00\x00\x00\x1c\x96\x02\x00\x00\x00\x00\x00\x1d\x96\x02\x00\x00\x00\x00\x00K\x96\x02\x00\x00\x00\x00\x00U\x96\x02\x00\x00\x00\x00\x00]\x96\x02\x00\x00\x00\x00\x00m\x96\x02\x00\x00\x00\x00\x00|\x96\x02\x00\x00\x00\x00\x00\x92\x96\x02\x00\x00\x00\x00\x00\x93\x96\x02\x00\x00\x00\x00\x00\xdb\x96\x02\x00\x00\x00\x00\x00'
+    b'\x0b\x97\x02\x00\x00\x00\x00\x00\x0c\x97\x02\x00\x00\x00\x00\x00a\x97\x02\x00\x00\x00\x00\x00\x89\x97\x02\x00\x00\x00\x00\x00\xad\x97\x02\x00\x00\x00\x00\x00\x01\x98\x02\x00\x00\x00\x00\x00\x03\x98\x02\x00\x00\x00\x00\x00!\x98\x02\x00\x00\x00\x00\x00G\x98\x02\x00\x00\x00\x00\x00_\x98\x02\x00\x00\x00\x00\x00"\x99\x02\x00\x00\x00\x00\x00*\x99\x02\x00\x00\x00\x00\x00'
+    b'V\x99\x02\x00\x00\x00\x00\x00W\x99\x02\x00\x00\x00\x00\x00\xd3\x99\x02\x00\x00\x00\x00\x00\xd6\x99\x02\x00\x00\x00\x00\x00)\x9a\x02\x00\x00\x00\x00\x00-\x9a\x02\x00\x00\x00\x00\x00\xc7\x9a\x02\x00\x00\x00\x00\x00W\x9b\x02\x00\x00\x00\x00\x00{\x9b\x02\x00\x00\x00\x00\x00\xa3\x9b\x02\x00\x00\x00\x00\x00\xa4\x9b\x02\x00\x00\x00\x00\x00\xf2\x9b\x02\x00\x00\x00\x00\x00'
+    b'\x14\x9c\x02\x00\x00\x00\x00\x00/\x9c\x02\x00\x00\x00\x00\x00F\x9c\x02\x00\x00\x00\x00\x00I\x9c\x02\x00\x00\x00\x00\x00\x8c\x9c\x02\x00\x00\x00\x00\x00\xb6\x9c\x02\x00\x00\x00\x00\x00\x04\x9d\x02\x00\x00\x00\x00\x00=\x9d\x02\x00\x00\x00\x00\x00>\x9d\x02\x00\x00\x00\x00\x00\x1b\x9e\x02\x00\x00\x00\x00\x00\x1c\x9e\x02\x00\x00\x00\x00\x00\x1d\x9e\x02\x00\x00\x00\x00\x00'
+    b'\x1e\x9e\x02\x00\x00\x00\x00\x002\x9e\x02\x00\x00\x00\x00\x007\x9e\x02\x00\x00\x00\x00\x00\x83\x9e\x02\x00\x00\x00\x00\x00\xbb\x9e\x02\x00\x00\x00\x00\x00\xd6\x9e\x02\x00\x00\x00\x00\x00\xde\x9e\x02\x00\x00\x00\x00\x00\xdf\x9e\x02\x00\x00\x00\x00\x00\xe0\x9e\x02\x00\x00\x00\x00\x00\xe5\x9e\x02\x00\x00\x00\x00\x00\x82\x9f\x02\x00\x00\x00\x00\x00\x86\x9f\x02\x00\x00\x00\x00\x00'
+    b'\x87\x9f\x02\x00\x00\x00\x00\x00\x8b\x9f\x02\x00\x00\x00\x00\x00\x99\x9f\x02\x00\x00\x00\x00\x00\x9a\x9f\x02\x00\x00\x00\x00\x00\x9b\x9f\x02\x00\x00\x00\x00\x00\x9c\x9f\x02\x00\x00\x00\x00\x00\xc7\x9f\x02\x00\x00\x00\x00\x00\xfe\x9f\x02\x00\x00\x00\x00\x00h\xa0\x02\x00\x00\x00\x00\x00\x84\xa0\x02\x00\x00\x00\x00\x00\x93\xa0\x02\x00\x00\x00\x00\x00\xa2\xa0\x02\x00\x00\x00\x00\x00'
+    b'\xe0\xa0\x02\x00\x00\x00\x00\x00\x0f\xa1\x02\x00\x00\x00\x00\x00\x10\xa1\x02\x00\x00\x00\x00\x00\x11\xa1\x02\x00\x00\x00\x00\x00\x12\xa1\x02\x00\x00\x00\x00\x00\x13\xa1\x02\x00\x00\x00\x00\x00\x14\xa1\x02\x00\x00\x00\x00\x00\x15\xa1\x02\x00\x00\x00\x00\x00\x16\xa1\x02\x00\x00\x00\x00\x00\x17\xa1\x02\x00\x00\x00\x00\x00\x18\xa1\x02\x00\x00\x00\x00\x00>\xa1\x02\x00\x00\x00\x00\x00'
+    b'v\xa1\x02\x00\x00\x00\x00\x00\xf3\xa1\x02\x00\x00\x00\x00\x00\xf4\xa1\x02\x00\x00\x00\x00\x00\xf5\xa1\x02\x00\x00\x00\x00\x00\x07\xa2\x02\x00\x00\x00\x00\x00\x08\xa2\x02\x00\x00\x00\x00\x00\x13\xa2\x02\x00\x00\x00\x00\x00(\xa2\x02\x00\x00\x00\x00\x002\xa2\x02\x00\x00\x00\x00\x003\xa2\x02\x00\x00\x00\x00\x004\xa2\x02\x00\x00\x00\x00\x005\xa2\x02\x00\x00\x00\x00\x00'
+    b'6\xa2\x02\x00\x00\x00\x00\x00\xe1\xa2\x02\x00\x00\x00\x00\x00\xfd\xa2\x02\x00\x00\x00\x00\x00\x1b\xa3\x02\x00\x00\x00\x00\x002\xa3\x02\x00\x00\x00\x00\x00N\xa3\x02\x00\x00\x00\x00\x00\x87\xa3\x02\x00\x00\x00\x00\x00\xa7\xa3\x02\x00\x00\x00\x00\x00\xb0\xa3\x02\x00\x00\x00\x00\x00\xb6\xa3\x02\x00\x00\x00\x00\x00\xb7\xa3\x02\x00\x00\x00\x00\x00%\xa4\x02\x00\x00\x00\x00\x00'
+    b'R\xa4\x02\x00\x00\x00\x00\x00[\xa4\x02\x00\x00\x00\x00\x00w\xa4\x02\x00\x00\x00\x00\x00\xf5\xa4\x02\x00\x00\x00\x00\x00"\xa5\x02\x00\x00\x00\x00\x00K\xa5\x02\x00\x00\x00\x00\x00\xa5\xa5\x02\x00\x00\x00\x00\x00\xb0\xa5\x02\x00\x00\x00\x00\x00\xb2\xa5\x02\x00\x00\x00\x00\x00\xbc\xa5\x02\x00\x00\x00\x00\x00\xca\xa5\x02\x00\x00\x00\x00\x00\xcc\xa5\x02\x00\x00\x00\x00\x00'
+    b'\xcd\xa5\x02\x00\x00\x00\x00\x00\x1a\xa6\x02\x00\x00\x00\x00\x00(\xa6\x02\x00\x00\x00\x00\x001\xa6\x02\x00\x00\x00\x00\x002\xa6\x02\x00\x00\x00\x00\x003\xa6\x02\x00\x00\x00\x00\x004\xa6\x02\x00\x00\x00\x00\x00W\xa6\x02\x00\x00\x00\x00\x00g\xa6\x02\x00\x00\x00\x00\x00\xca\xa6\x02\x00\x00\x00\x00\x00\xcb\xa6\x02\x00\x00\x00\x00\x00\x12\xa7\x02\x00\x00\x00\x00\x00'
+    b'\x1b\xa7\x02\x00\x00\x00\x00\x00\xc8\xa8\x02\x00\x00\x00\x00\x00\x87\xa9\x02\x00\x00\x00\x00\x00\xb3\xa9\x02\x00\x00\x00\x00\x00\xd3\xa9\x02\x00\x00\x00\x00\x00!\xaa\x02\x00\x00\x00\x00\x00D\xaa\x02\x00\x00\x00\x00\x00E\xaa\x02\x00\x00\x00\x00\x00F\xaa\x02\x00\x00\x00\x00\x00T\xaa\x02\x00\x00\x00\x00\x00U\xaa\x02\x00\x00\x00\x00\x00V\xaa\x02\x00\x00\x00\x00\x00'
+    b'W\xaa\x02\x00\x00\x00\x00\x00X\xaa\x02\x00\x00\x00\x00\x00Y\xaa\x02\x00\x00\x00\x00\x00\\\xaa\x02\x00\x00\x00\x00\x00\xd0\xaa\x02\x00\x00\x00\x00\x005\xab\x02\x00\x00\x00\x00\x007\xab\x02\x00\x00\x00\x00\x008\xab\x02\x00\x00\x00\x00\x00\xba\xab\x02\x00\x00\x00\x00\x00\xbb\xab\x02\x00\x00\x00\x00\x00\xbc\xab\x02\x00\x00\x00\x00\x00M\xac\x02\x00\x00\x00\x00\x00'
+    b'N\xac\x02\x00\x00\x00\x00\x00O\xac\x02\x00\x00\x00\x00\x00s\xac\x02\x00\x00\x00\x00\x00t\xac\x02\x00\x00\x00\x00\x00\x8e\xac\x02\x00\x00\x00\x00\x00\x8f\xac\x02\x00\x00\x00\x00\x00\x91\xac\x02\x00\x00\x00\x00\x00\x92\xac\x02\x00\x00\x00\x00\x00\x93\xac\x02\x00\x00\x00\x00\x00\x9f\xac\x02\x00\x00\x00\x00\x00\xa0\xac\x02\x00\x00\x00\x00\x00\xa1\xac\x02\x00\x00\x00\x00\x00'
+    b'\xdb\xac\x02\x00\x00\x00\x00\x00\xdc\xac\x02\x00\x00\x00\x00\x00\xdd\xac\x02\x00\x00\x00\x00\x00\xf3\xac\x02\x00\x00\x00\x00\x00\xf4\xac\x02\x00\x00\x00\x00\x00\xf5\xac\x02\x00\x00\x00\x00\x00Q\xad\x02\x00\x00\x00\x00\x00R\xad\x02\x00\x00\x00\x00\x00S\xad\x02\x00\x00\x00\x00\x00T\xad\x02\x00\x00\x00\x00\x00\x0e\xae\x02\x00\x00\x00\x00\x00\xfd\xae\x02\x00\x00\x00\x00\x00'
+    b'\x98\xaf\x02\x00\x00\x00\x00\x00%\xb0\x02\x00\x00\x00\x00\x00v\xb0\x02\x00\x00\x00\x00\x00\x86\xb0\x02\x00\x00\x00\x00\x00\x89\xb0\x02\x00\x00\x00\x00\x00\x07\xb1\x02\x00\x00\x00\x00\x00\x08\xb1\x02\x00\x00\x00\x00\x00\t\xb1\x02\x00\x00\x00\x00\x00\x0f\xb1\x02\x00\x00\x00\x00\x00\x10\xb1\x02\x00\x00\x00\x00\x00\x11\xb1\x02\x00\x00\x00\x00\x00P\xb1\x02\x00\x00\x00\x00\x00'
+    b'Q\xb1\x02\x00\x00\x00\x00\x00\xec\xb2\x02\x00\x00\x00\x00\x00T\xb3\x02\x00\x00\x00\x00\x00(\xb4\x02\x00\x00\x00\x00\x00=\xb4\x02\x00\x00\x00\x00\x00\xcc\xb4\x02\x00\x00\x00\x00\x00\xcd\xb4\x02\x00\x00\x00\x00\x00>\xb5\x02\x00\x00\x00\x00\x00\xdb\xb5\x02\x00\x00\x00\x00\x00\xf8\xb5\x02\x00\x00\x00\x00\x00\xf9\xb5\x02\x00\x00\x00\x00\x00\xfa\xb5\x02\x00\x00\x00\x00\x00'
+    b'\xfe\xb5\x02\x00\x00\x00\x00\x00\x04\xb6\x02\x00\x00\x00\x00\x00\x18\xb6\x02\x00\x00\x00\x00\x00H\xb6\x02\x00\x00\x00\x00\x00Y\xb6\x02\x00\x00\x00\x00\x00Z\xb6\x02\x00\x00\x00\x00\x00\x9f\xb6\x02\x00\x00\x00\x00\x00\xa4\xb6\x02\x00\x00\x00\x00\x00\xa5\xb6\x02\x00\x00\x00\x00\x00\xce\xb6\x02\x00\x00\x00\x00\x00Q\xb7\x02\x00\x00\x00\x00\x00a\xb7\x02\x00\x00\x00\x00\x00'
+    b'\x90\xb7\x02\x00\x00\x00\x00\x00\xb9\xb7\x02\x00\x00\x00\x00\x00H\xb8\x02\x00\x00\x00\x00\x00m\xb8\x02\x00\x00\x00\x00\x00n\xb8\x02\x00\x00\x00\x00\x00\x9d\xb8\x02\x00\x00\x00\x00\x00\xae\xb8\x02\x00\x00\x00\x00\x00\xfa\xb8\x02\x00\x00\x00\x00\x00"\xb9\x02\x00\x00\x00\x00\x00:\xb9\x02\x00\x00\x00\x00\x00\xa8\xb9\x02\x00\x00\x00\x00\x00\xac\xb9\x02\x00\x00\x00\x00\x00'
+    b'\xad\xb9\x02\x00\x00\x00\x00\x00\xbe\xb9\x02\x00\x00\x00\x00\x00\xc9\xb9\x02\x00\x00\x00\x00\x00\xca\xb9\x02\x00\x00\x00\x00\x00\xcb\xb9\x02\x00\x00\x00\x00\x00\xcc\xb9\x02\x00\x00\x00\x00\x00\xcd\xb9\x02\x00\x00\x00\x00\x00\xce\xb9\x02\x00\x00\x00\x00\x00\xcf\xb9\x02\x00\x00\x00\x00\x00\xec\xb9\x02\x00\x00\x00\x00\x00\xf6\xb9\x02\x00\x00\x00\x00\x00\xf7\xb9\x02\x00\x00\x00\x00\x00'
+    b'\xfb\xb9\x02\x00\x00\x00\x00\x00F\xba\x02\x00\x00\x00\x00\x00L\xba\x02\x00\x00\x00\x00\x00Q\xba\x02\x00\x00\x00\x00\x00R\xba\x02\x00\x00\x00\x00\x00S\xba\x02\x00\x00\x00\x00\x00\x0e\xbb\x02\x00\x00\x00\x00\x00\x10\xbb\x02\x00\x00\x00\x00\x00\x94\xbb\x02\x00\x00\x00\x00\x00a\xbd\x02\x00\x00\x00\x00\x00t\xbd\x02\x00\x00\x00\x00\x00\xe3\xbd\x02\x00\x00\x00\x00\x00'
+    b'Z\xbe\x02\x00\x00\x00\x00\x00\xa3\xbe\x02\x00\x00\x00\x00\x00\xab\xbe\x02\x00\x00\x00\x00\x00%\xc0\x02\x00\x00\x00\x00\x00&\xc0\x02\x00\x00\x00\x00\x00v\xc0\x02\x00\x00\x00\x00\x00\xd2\xc0\x02\x00\x00\x00\x00\x00\xd6\xc0\x02\x00\x00\x00\x00\x00D\xc1\x02\x00\x00\x00\x00\x00\x8d\xc1\x02\x00\x00\x00\x00\x00B\xc2\x02\x00\x00\x00\x00\x00\x90\xc2\x02\x00\x00\x00\x00\x00'
+    b'\xa7\xc2\x02\x00\x00\x00\x00\x00\n\xc3\x02\x00\x00\x00\x00\x00N\xc3\x02\x00\x00\x00\x00\x00O\xc3\x02\x00\x00\x00\x00\x00_\xc3\x02\x00\x00\x00\x00\x00g\xc3\x02\x00\x00\x00\x00\x00\x8b\xc3\x02\x00\x00\x00\x00\x00\xf3\xc4\x02\x00\x00\x00\x00\x00\x05\xc5\x02\x00\x00\x00\x00\x00\x08\xc5\x02\x00\x00\x00\x00\x00*\xc5\x02\x00\x00\x00\x00\x00@\xc5\x02\x00\x00\x00\x00\x00'
+    b'L\xc5\x02\x00\x00\x00\x00\x00\x95\xc5\x02\x00\x00\x00\x00\x00\x9f\xc6\x02\x00\x00\x00\x00\x00\xa1\xc6\x02\x00\x00\x00\x00\x00\xc2\xc6\x02\x00\x00\x00\x00\x00K\xc7\x02\x00\x00\x00\x00\x00\xaa\xc7\x02\x00\x00\x00\x00\x00\xb1\xc7\x02\x00\x00\x00\x00\x00\xb3\xc7\x02\x00\x00\x00\x00\x00\xd3\xc7\x02\x00\x00\x00\x00\x00\xf7\xc7\x02\x00\x00\x00\x00\x00\xfb\xc7\x02\x00\x00\x00\x00\x00'
+    b'\x11\xc8\x02\x00\x00\x00\x00\x00\x15\xc8\x02\x00\x00\x00\x00\x00\x18\xc8\x02\x00\x00\x00\x00\x00\x1c\xc8\x02\x00\x00\x00\x00\x00 \xc8\x02\x00\x00\x00\x00\x00}\xc9\x02\x00\x00\x00\x00\x00~\xc9\x02\x00\x00\x00\x00\x00\xa2\xc9\x02\x00\x00\x00\x00\x00\xa3\xc9\x02\x00\x00\x00\x00\x00\xa7\xc9\x02\x00\x00\x00\x00\x00\xa8\xc9\x02\x00\x00\x00\x00\x00\xa9\xc9\x02\x00\x00\x00\x00\x00'
+    b'\xaa\xc9\x02\x00\x00\x00\x00\x00\xc7\xca\x02\x00\x00\x00\x00\x00\xe3\xca\x02\x00\x00\x00\x00\x00\xf4\xca\x02\x00\x00\x00\x00\x00\xf6\xca\x02\x00\x00\x00\x00\x00\xf7\xca\x02\x00\x00\x00\x00\x00\xf8\xca\x02\x00\x00\x00\x00\x00\r\xcb\x02\x00\x00\x00\x00\x00\x1e\xcb\x02\x00\x00\x00\x00\x00A\xcb\x02\x00\x00\x00\x00\x00R\xcb\x02\x00\x00\x00\x00\x00S\xcb\x02\x00\x00\x00\x00\x00'
+    b'Z\xcb\x02\x00\x00\x00\x00\x00\x8f\xcb\x02\x00\x00\x00\x00\x00\xc6\xcb\x02\x00\x00\x00\x00\x00\xd5\xcb\x02\x00\x00\x00\x00\x00\x17\xcc\x02\x00\x00\x00\x00\x00\x18\xcc\x02\x00\x00\x00\x00\x00\x19\xcc\x02\x00\x00\x00\x00\x00\x1a\xcc\x02\x00\x00\x00\x00\x00\x1b\xcc\x02\x00\x00\x00\x00\x000\xcc\x02\x00\x00\x00\x00\x00F\xcc\x02\x00\x00\x00\x00\x00\x87\xcc\x02\x00\x00\x00\x00\x00'
+    b'\xb3\xcc\x02\x00\x00\x00\x00\x00\xb4\xcc\x02\x00\x00\x00\x00\x00\xb6\xcc\x02\x00\x00\x00\x00\x00\xb7\xcc\x02\x00\x00\x00\x00\x00\xb8\xcc\x02\x00\x00\x00\x00\x00\xb9\xcc\x02\x00\x00\x00\x00\x00\xba\xcc\x02\x00\x00\x00\x00\x00\xbb\xcc\x02\x00\x00\x00\x00\x00\xeb\xcc\x02\x00\x00\x00\x00\x00\xec\xcc\x02\x00\x00\x00\x00\x00\xed\xcc\x02\x00\x00\x00\x00\x00\xee\xcc\x02\x00\x00\x00\x00\x00'
+    b'\x12\xcd\x02\x00\x00\x00\x00\x00\x13\xcd\x02\x00\x00\x00\x00\x00\xee\xcd\x02\x00\x00\x00\x00\x00=\xce\x02\x00\x00\x00\x00\x00]\xce\x02\x00\x00\x00\x00\x00^\xce\x02\x00\x00\x00\x00\x00d\xce\x02\x00\x00\x00\x00\x00\xc1\xce\x02\x00\x00\x00\x00\x00\x83\xcf\x02\x00\x00\x00\x00\x00\x84\xcf\x02\x00\x00\x00\x00\x00\x85\xcf\x02\x00\x00\x00\x00\x00\xbe\xcf\x02\x00\x00\x00\x00\x00'
+    b'\xc1\xcf\x02\x00\x00\x00\x00\x00[\xd0\x02\x00\x00\x00\x00\x00)\xd2\x02\x00\x00\x00\x00\x00J\xd2\x02\x00\x00\x00\x00\x00a\xd2\x02\x00\x00\x00\x00\x00x\xd2\x02\x00\x00\x00\x00\x00\x87\xd2\x02\x00\x00\x00\x00\x00\xcf\xd2\x02\x00\x00\x00\x00\x00\xe9\xd2\x02\x00\x00\x00\x00\x00\x0f\xd3\x02\x00\x00\x00\x00\x00D\xd3\x02\x00\x00\x00\x00\x00M\xd3\x02\x00\x00\x00\x00\x00'
+    b'U\xd3\x02\x00\x00\x00\x00\x005\xd4\x02\x00\x00\x00\x00\x006\xd4\x02\x00\x00\x00\x00\x00v\xd4\x02\x00\x00\x00\x00\x00{\xd4\x02\x00\x00\x00\x00\x00|\xd4\x02\x00\x00\x00\x00\x00}\xd4\x02\x00\x00\x00\x00\x00\xa6\xd4\x02\x00\x00\x00\x00\x00\xe1\xd4\x02\x00\x00\x00\x00\x00\xe2\xd4\x02\x00\x00\x00\x00\x00o\xd5\x02\x00\x00\x00\x00\x00s\xd5\x02\x00\x00\x00\x00\x00'
+    b'\x86\xd5\x02\x00\x00\x00\x00\x00\x9c\xd5\x02\x00\x00\x00\x00\x00\xe0\xd5\x02\x00\x00\x00\x00\x00\xf1\xd5\x02\x00\x00\x00\x00\x00\xf5\xd5\x02\x00\x00\x00\x00\x00/\xd6\x02\x00\x00\x00\x00\x000\xd6\x02\x00\x00\x00\x00\x00Q\xd6\x02\x00\x00\x00\x00\x00R\xd6\x02\x00\x00\x00\x00\x00r\xd6\x02\x00\x00\x00\x00\x00s\xd6\x02\x00\x00\x00\x00\x00z\xd6\x02\x00\x00\x00\x00\x00'
+    b'{\xd6\x02\x00\x00\x00\x00\x00|\xd6\x02\x00\x00\x00\x00\x00}\xd6\x02\x00\x00\x00\x00\x00\x90\xd6\x02\x00\x00\x00\x00\x00\x91\xd6\x02\x00\x00\x00\x00\x00\x92\xd6\x02\x00\x00\x00\x00\x00\x93\xd6\x02\x00\x00\x00\x00\x00\x94\xd6\x02\x00\x00\x00\x00\x00\xb2\xd6\x02\x00\x00\x00\x00\x00\xc8\xd6\x02\x00\x00\x00\x00\x00\xce\xd6\x02\x00\x00\x00\x00\x00\xcf\xd6\x02\x00\x00\x00\x00\x00'
+    b'\xd1\xd6\x02\x00\x00\x00\x00\x00@\xd7\x02\x00\x00\x00\x00\x00\x82\xd7\x02\x00\x00\x00\x00\x00\xc0\xd7\x02\x00\x00\x00\x00\x00\xc1\xd7\x02\x00\x00\x00\x00\x00\x13\xd9\x02\x00\x00\x00\x00\x00S\xd9\x02\x00\x00\x00\x00\x00?\xda\x02\x00\x00\x00\x00\x00@\xda\x02\x00\x00\x00\x00\x00\xe8\xda\x02\x00\x00\x00\x00\x00\x7f\xdc\x02\x00\x00\x00\x00\x00\xcf\xdc\x02\x00\x00\x00\x00\x00'
+    b' \xdd\x02\x00\x00\x00\x00\x00+\xdd\x02\x00\x00\x00\x00\x007\xdd\x02\x00\x00\x00\x00\x00\x93\xdd\x02\x00\x00\x00\x00\x00\xd9\xdd\x02\x00\x00\x00\x00\x00e\xde\x02\x00\x00\x00\x00\x00\x18\xdf\x02\x00\x00\x00\x00\x00\x19\xdf\x02\x00\x00\x00\x00\x00R\xe0\x02\x00\x00\x00\x00\x00\x8b\xe0\x02\x00\x00\x00\x00\x00\xa3\xe0\x02\x00\x00\x00\x00\x00\x1e\xe1\x02\x00\x00\x00\x00\x00'
+    b'B\xe1\x02\x00\x00\x00\x00\x00[\xe1\x02\x00\x00\x00\x00\x00\\\xe1\x02\x00\x00\x00\x00\x00]\xe1\x02\x00\x00\x00\x00\x00\x86\xe1\x02\x00\x00\x00\x00\x00\xb0\xe1\x02\x00\x00\x00\x00\x00\xb3\xe1\x02\x00\x00\x00\x00\x00\x19\xe2\x02\x00\x00\x00\x00\x00\xee\xe2\x02\x00\x00\x00\x00\x00\xef\xe2\x02\x00\x00\x00\x00\x00\xf6\xe2\x02\x00\x00\x00\x00\x00\xf7\xe2\x02\x00\x00\x00\x00\x00'
+    b')\xe3\x02\x00\x00\x00\x00\x000\xe3\x02\x00\x00\x00\x00\x00b\xe3\x02\x00\x00\x00\x00\x00q\xe3\x02\x00\x00\x00\x00\x00\x9a\xe3\x02\x00\x00\x00\x00\x00\xaa\xe3\x02\x00\x00\x00\x00\x00\xac\xe3\x02\x00\x00\x00\x00\x00\x8c\xe4\x02\x00\x00\x00\x00\x00\x91\xe4\x02\x00\x00\x00\x00\x00\xb3\xe4\x02\x00\x00\x00\x00\x00\xc6\xe4\x02\x00\x00\x00\x00\x00\xd8\xe4\x02\x00\x00\x00\x00\x00'
+    b'\x1a\xe5\x02\x00\x00\x00\x00\x00\x1b\xe5\x02\x00\x00\x00\x00\x00\x1c\xe5\x02\x00\x00\x00\x00\x00 \xe5\x02\x00\x00\x00\x00\x00L\xe5\x02\x00\x00\x00\x00\x00z\xe5\x02\x00\x00\x00\x00\x00}\xe5\x02\x00\x00\x00\x00\x00~\xe5\x02\x00\x00\x00\x00\x00\x80\xe5\x02\x00\x00\x00\x00\x00\x82\xe5\x02\x00\x00\x00\x00\x00\x8d\xe5\x02\x00\x00\x00\x00\x00\x8f\xe5\x02\x00\x00\x00\x00\x00'
+    b'\xb6\xe5\x02\x00\x00\x00\x00\x00\xb7\xe5\x02\x00\x00\x00\x00\x00\x11\xe6\x02\x00\x00\x00\x00\x00#\xe6\x02\x00\x00\x00\x00\x00N\xe6\x02\x00\x00\x00\x00\x00k\xe6\x02\x00\x00\x00\x00\x00\xad\xe6\x02\x00\x00\x00\x00\x00\xae\xe6\x02\x00\x00\x00\x00\x00\xd5\xe6\x02\x00\x00\x00\x00\x00\xef\xe6\x02\x00\x00\x00\x00\x00\xf6\xe6\x02\x00\x00\x00\x00\x00\x0c\xe7\x02\x00\x00\x00\x00\x00'
+    b'B\xe8\x02\x00\x00\x00\x00\x00O\xe8\x02\x00\x00\x00\x00\x00U\xe8\x02\x00\x00\x00\x00\x00Z\xe8\x02\x00\x00\x00\x00\x00\xbb\xe8\x02\x00\x00\x00\x00\x00\xc0\xe8\x02\x00\x00\x00\x00\x00\xc1\xe8\x02\x00\x00\x00\x00\x00\xcf\xe8\x02\x00\x00\x00\x00\x00\xd3\xe8\x02\x00\x00\x00\x00\x00\xe8\xe8\x02\x00\x00\x00\x00\x00\xec\xe8\x02\x00\x00\x00\x00\x00\xee\xe8\x02\x00\x00\x00\x00\x00'
+    b'\xf1\xe8\x02\x00\x00\x00\x00\x00\xf8\xe8\x02\x00\x00\x00\x00\x00\x14\xe9\x02\x00\x00\x00\x00\x003\xe9\x02\x00\x00\x00\x00\x008\xe9\x02\x00\x00\x00\x00\x00H\xe9\x02\x00\x00\x00\x00\x00b\xe9\x02\x00\x00\x00\x00\x00c\xe9\x02\x00\x00\x00\x00\x00j\xe9\x02\x00\x00\x00\x00\x00\x81\xe9\x02\x00\x00\x00\x00\x00\x8e\xe9\x02\x00\x00\x00\x00\x00\x8f\xe9\x02\x00\x00\x00\x00\x00'
+    b"\x98\xe9\x02\x00\x00\x00\x00\x00\x00\xea\x02\x00\x00\x00\x00\x00\x15\xea\x02\x00\x00\x00\x00\x00\x17\xea\x02\x00\x00\x00\x00\x00'\xea\x02\x00\x00\x00\x00\x00b\xea\x02\x00\x00\x00\x00\x00c\xea\x02\x00\x00\x00\x00\x00s\xea\x02\x00\x00\x00\x00\x00x\xea\x02\x00\x00\x00\x00\x00\x98\xea\x02\x00\x00\x00\x00\x00\xd9\xea\x02\x00\x00\x00\x00\x00\xdc\xea\x02\x00\x00\x00\x00\x00"
+    b'\xfe\xea\x02\x00\x00\x00\x00\x00\t\xeb\x02\x00\x00\x00\x00\x00\n\xeb\x02\x00\x00\x00\x00\x00\x0c\xeb\x02\x00\x00\x00\x00\x00"\xeb\x02\x00\x00\x00\x00\x00,\xeb\x02\x00\x00\x00\x00\x00/\xeb\x02\x00\x00\x00\x00\x00]\xeb\x02\x00\x00\x00\x00\x00u\xeb\x02\x00\x00\x00\x00\x00w\xeb\x02\x00\x00\x00\x00\x00\x7f\xeb\x02\x00\x00\x00\x00\x00\x13\xec\x02\x00\x00\x00\x00\x00'
+    b'q\xec\x02\x00\x00\x00\x00\x00u\xec\x02\x00\x00\x00\x00\x00\x85\xec\x02\x00\x00\x00\x00\x00\x86\xec\x02\x00\x00\x00\x00\x00\x87\xec\x02\x00\x00\x00\x00\x00\xb2\xec\x02\x00\x00\x00\x00\x00\xef\xec\x02\x00\x00\x00\x00\x00\xf0\xec\x02\x00\x00\x00\x00\x00\xf1\xec\x02\x00\x00\x00\x00\x00\xf2\xec\x02\x00\x00\x00\x00\x00\xf3\xec\x02\x00\x00\x00\x00\x00\xf4\xec\x02\x00\x00\x00\x00\x00'
+    b'\x04\xed\x02\x00\x00\x00\x00\x00\x08\xed\x02\x00\x00\x00\x00\x00)\xed\x02\x00\x00\x00\x00\x00A\xed\x02\x00\x00\x00\x00\x00C\xed\x02\x00\x00\x00\x00\x00D\xed\x02\x00\x00\x00\x00\x00E\xed\x02\x00\x00\x00\x00\x00F\xed\x02\x00\x00\x00\x00\x00\xc6\xed\x02\x00\x00\x00\x00\x00\xd3\xed\x02\x00\x00\x00\x00\x00\xea\xed\x02\x00\x00\x00\x00\x00w\xee\x02\x00\x00\x00\x00\x00'
+    b'\xb2\xef\x02\x00\x00\x00\x00\x005\xf0\x02\x00\x00\x00\x00\x00;\xf0\x02\x00\x00\x00\x00\x00y\xf0\x02\x00\x00\x00\x00\x00\xb8\xf0\x02\x00\x00\x00\x00\x00\xb9\xf0\x02\x00\x00\x00\x00\x00\xe3\xf0\x02\x00\x00\x00\x00\x00\xea\xf0\x02\x00\x00\x00\x00\x00\x08\xf1\x02\x00\x00\x00\x00\x00\x1f\xf1\x02\x00\x00\x00\x00\x00R\xf1\x02\x00\x00\x00\x00\x00S\xf1\x02\x00\x00\x00\x00\x00'
+    b'T\xf1\x02\x00\x00\x00\x00\x00U\xf1\x02\x00\x00\x00\x00\x00V\xf1\x02\x00\x00\x00\x00\x00W\xf1\x02\x00\x00\x00\x00\x00X\xf1\x02\x00\x00\x00\x00\x00Y\xf1\x02\x00\x00\x00\x00\x00Z\xf1\x02\x00\x00\x00\x00\x00[\xf1\x02\x00\x00\x00\x00\x00\\\xf1\x02\x00\x00\x00\x00\x00\xd4\xf1\x02\x00\x00\x00\x00\x00*\xf2\x02\x00\x00\x00\x00\x00H\xf2\x02\x00\x00\x00\x00\x00'
+    b'h\xf2\x02\x00\x00\x00\x00\x00\xbb\xf2\x02\x00\x00\x00\x00\x00\x12\xf3\x02\x00\x00\x00\x00\x00H\xf3\x02\x00\x00\x00\x00\x00\xbd\xf3\x02\x00\x00\x00\x00\x00\x11\xf4\x02\x00\x00\x00\x00\x00\x16\xf4\x02\x00\x00\x00\x00\x00-\xf4\x02\x00\x00\x00\x00\x00<\xf4\x02\x00\x00\x00\x00\x00\xfc\xf4\x02\x00\x00\x00\x00\x00\xfd\xf4\x02\x00\x00\x00\x00\x00\xff\xf4\x02\x00\x00\x00\x00\x00'
+    b';\xf5\x02\x00\x00\x00\x00\x00R\xf5\x02\x00\x00\x00\x00\x00\x99\xf5\x02\x00\x00\x00\x00\x00\xa3\xf5\x02\x00\x00\x00\x00\x00\xa4\xf5\x02\x00\x00\x00\x00\x00\xa5\xf5\x02\x00\x00\x00\x00\x00\xa6\xf5\x02\x00\x00\x00\x00\x00\xa7\xf5\x02\x00\x00\x00\x00\x00\xa8\xf5\x02\x00\x00\x00\x00\x00\xa9\xf5\x02\x00\x00\x00\x00\x00\xaa\xf5\x02\x00\x00\x00\x00\x00\xab\xf5\x02\x00\x00\x00\x00\x00'
+    b'\xac\xf5\x02\x00\x00\x00\x00\x00\xad\xf5\x02\x00\x00\x00\x00\x00\xae\xf5\x02\x00\x00\x00\x00\x00\xaf\xf5\x02\x00\x00\x00\x00\x00\xb0\xf5\x02\x00\x00\x00\x00\x00\xb1\xf5\x02\x00\x00\x00\x00\x00\xb2\xf5\x02\x00\x00\x00\x00\x00\xb3\xf5\x02\x00\x00\x00\x00\x00\xb4\xf5\x02\x00\x00\x00\x00\x00\xb5\xf5\x02\x00\x00\x00\x00\x00\xb6\xf5\x02\x00\x00\x00\x00\x00\xb7\xf5\x02\x00\x00\x00\x00\x00'
+    b'\xb8\xf5\x02\x00\x00\x00\x00\x00\xba\xf5\x02\x00\x00\x00\x00\x00\xfe\xf5\x02\x00\x00\x00\x00\x00\x0b\xf6\x02\x00\x00\x00\x00\x00\x0c\xf6\x02\x00\x00\x00\x00\x00\r\xf6\x02\x00\x00\x00\x00\x00\x0e\xf6\x02\x00\x00\x00\x00\x00\x0f\xf6\x02\x00\x00\x00\x00\x00\xcf\xf6\x02\x00\x00\x00\x00\x00\xd4\xf6\x02\x00\x00\x00\x00\x00\x84\xf7\x02\x00\x00\x00\x00\x00\xcd\xf7\x02\x00\x00\x00\x00\x00'
+    b'+\xf8\x02\x00\x00\x00\x00\x00>\xf8\x02\x00\x00\x00\x00\x00%\xfa\x02\x00\x00\x00\x00\x00.\xfa\x02\x00\x00\x00\x00\x00?\xfa\x02\x00\x00\x00\x00\x00\xeb\xfa\x02\x00\x00\x00\x00\x00\xf3\xfa\x02\x00\x00\x00\x00\x00\xde\xfb\x02\x00\x00\x00\x00\x00\xdf\xfb\x02\x00\x00\x00\x00\x00*\xfc\x02\x00\x00\x00\x00\x00\x06\xfd\x02\x00\x00\x00\x00\x00\x08\xfd\x02\x00\x00\x00\x00\x00'
+    b'\n\xfd\x02\x00\x00\x00\x00\x00\x0b\xfd\x02\x00\x00\x00\x00\x00\x0c\xfd\x02\x00\x00\x00\x00\x00\r\xfd\x02\x00\x00\x00\x00\x00\x0f\xfd\x02\x00\x00\x00\x00\x00\x10\xfd\x02\x00\x00\x00\x00\x00\x11\xfd\x02\x00\x00\x00\x00\x00\x12\xfd\x02\x00\x00\x00\x00\x00\x13\xfd\x02\x00\x00\x00\x00\x00\x14\xfd\x02\x00\x00\x00\x00\x00!\xfd\x02\x00\x00\x00\x00\x00g\xfd\x02\x00\x00\x00\x00\x00'
+    b'i\xfd\x02\x00\x00\x00\x00\x00\xa5\xfd\x02\x00\x00\x00\x00\x00\xbe\xfd\x02\x00\x00\x00\x00\x00\xe0\xfd\x02\x00\x00\x00\x00\x00\xe7\xfd\x02\x00\x00\x00\x00\x00\xf8\xfd\x02\x00\x00\x00\x00\x00\xfc\xfd\x02\x00\x00\x00\x00\x00\x10\xfe\x02\x00\x00\x00\x00\x00\x11\xfe\x02\x00\x00\x00\x00\x009\xfe\x02\x00\x00\x00\x00\x00O\xfe\x02\x00\x00\x00\x00\x00\xa3\xfe\x02\x00\x00\x00\x00\x00'
+    b'\xab\xfe\x02\x00\x00\x00\x00\x00\xb4\xfe\x02\x00\x00\x00\x00\x00\xb9\xff\x02\x00\x00\x00\x00\x008\x00\x03\x00\x00\x00\x00\x009\x00\x03\x00\x00\x00\x00\x00:\x00\x03\x00\x00\x00\x00\x00;\x00\x03\x00\x00\x00\x00\x00<\x00\x03\x00\x00\x00\x00\x00o\x00\x03\x00\x00\x00\x00\x00\x80\x00\x03\x00\x00\x00\x00\x00\x92\x00\x03\x00\x00\x00\x00\x00\x99\x00\x03\x00\x00\x00\x00\x00'
+    b'\xee\x00\x03\x00\x00\x00\x00\x00\x1e\x01\x03\x00\x00\x00\x00\x00-\x01\x03\x00\x00\x00\x00\x00.\x01\x03\x00\x00\x00\x00\x00/\x01\x03\x00\x00\x00\x00\x00\xa5\x01\x03\x00\x00\x00\x00\x00\xa7\x01\x03\x00\x00\x00\x00\x00\xef\x01\x03\x00\x00\x00\x00\x00\xe0\x02\x03\x00\x00\x00\x00\x00S\x03\x03\x00\x00\x00\x00\x00T\x03\x03\x00\x00\x00\x00\x00U\x03\x03\x00\x00\x00\x00\x00'
+    b'V\x03\x03\x00\x00\x00\x00\x00W\x03\x03\x00\x00\x00\x00\x00j\x03\x03\x00\x00\x00\x00\x00k\x03\x03\x00\x00\x00\x00\x00l\x03\x03\x00\x00\x00\x00\x00m\x03\x03\x00\x00\x00\x00\x00n\x03\x03\x00\x00\x00\x00\x00o\x03\x03\x00\x00\x00\x00\x00p\x03\x03\x00\x00\x00\x00\x00q\x03\x03\x00\x00\x00\x00\x00r\x03\x03\x00\x00\x00\x00\x00s\x03\x03\x00\x00\x00\x00\x00'
+    b't\x03\x03\x00\x00\x00\x00\x00u\x03\x03\x00\x00\x00\x00\x00v\x03\x03\x00\x00\x00\x00\x00w\x03\x03\x00\x00\x00\x00\x00x\x03\x03\x00\x00\x00\x00\x00y\x03\x03\x00\x00\x00\x00\x00z\x03\x03\x00\x00\x00\x00\x00{\x03\x03\x00\x00\x00\x00\x00|\x03\x03\x00\x00\x00\x00\x00}\x03\x03\x00\x00\x00\x00\x00~\x03\x03\x00\x00\x00\x00\x00\x8a\x03\x03\x00\x00\x00\x00\x00'
+    b'\x8b\x03\x03\x00\x00\x00\x00\x00\x8c\x03\x03\x00\x00\x00\x00\x00\x8d\x03\x03\x00\x00\x00\x00\x00\x8e\x03\x03\x00\x00\x00\x00\x00\x8f\x03\x03\x00\x00\x00\x00\x00\x90\x03\x03\x00\x00\x00\x00\x00\x91\x03\x03\x00\x00\x00\x00\x00\x92\x03\x03\x00\x00\x00\x00\x00\x93\x03\x03\x00\x00\x00\x00\x00\x94\x03\x03\x00\x00\x00\x00\x00\x95\x03\x03\x00\x00\x00\x00\x00\x96\x03\x03\x00\x00\x00\x00\x00'
+    b'\x97\x03\x03\x00\x00\x00\x00\x00\x98\x03\x03\x00\x00\x00\x00\x00\x99\x03\x03\x00\x00\x00\x00\x00\x9a\x03\x03\x00\x00\x00\x00\x00\x9b\x03\x03\x00\x00\x00\x00\x00\x9c\x03\x03\x00\x00\x00\x00\x00\x9d\x03\x03\x00\x00\x00\x00\x00\x9e\x03\x03\x00\x00\x00\x00\x00\xdd\x03\x03\x00\x00\x00\x00\x00\xde\x03\x03\x00\x00\x00\x00\x00\xdf\x03\x03\x00\x00\x00\x00\x00\xe0\x03\x03\x00\x00\x00\x00\x00'
+    b'\xe1\x03\x03\x00\x00\x00\x00\x00\xe2\x03\x03\x00\x00\x00\x00\x00\x8e\x04\x03\x00\x00\x00\x00\x00\xbc\x04\x03\x00\x00\x00\x00\x00\xbd\x04\x03\x00\x00\x00\x00\x00\xdf\x04\x03\x00\x00\x00\x00\x00\x11\x05\x03\x00\x00\x00\x00\x00\x15\x05\x03\x00\x00\x00\x00\x00&\x05\x03\x00\x00\x00\x00\x00\x9e\x05\x03\x00\x00\x00\x00\x00\xb0\x05\x03\x00\x00\x00\x00\x00\xa7\x06\x03\x00\x00\x00\x00\x00'
+    b'\xa8\x06\x03\x00\x00\x00\x00\x00\xa9\x06\x03\x00\x00\x00\x00\x00\xaa\x06\x03\x00\x00\x00\x00\x00\xab\x06\x03\x00\x00\x00\x00\x00\xac\x06\x03\x00\x00\x00\x00\x00\xad\x06\x03\x00\x00\x00\x00\x00\xae\x06\x03\x00\x00\x00\x00\x00\xaf\x06\x03\x00\x00\x00\x00\x00\xb0\x06\x03\x00\x00\x00\x00\x00\xb1\x06\x03\x00\x00\x00\x00\x00\xb2\x06\x03\x00\x00\x00\x00\x00\xb3\x06\x03\x00\x00\x00\x00\x00'
+    b'\xb4\x06\x03\x00\x00\x00\x00\x00\xb5\x06\x03\x00\x00\x00\x00\x00\xb6\x06\x03\x00\x00\x00\x00\x00\xb7\x06\x03\x00\x00\x00\x00\x00\xb8\x06\x03\x00\x00\x00\x00\x00\xb9\x06\x03\x00\x00\x00\x00\x00\xba\x06\x03\x00\x00\x00\x00\x00\xbb\x06\x03\x00\x00\x00\x00\x00\xbc\x06\x03\x00\x00\x00\x00\x00\xbd\x06\x03\x00\x00\x00\x00\x00\xbe\x06\x03\x00\x00\x00\x00\x00\xbf\x06\x03\x00\x00\x00\x00\x00'
+    b'\xc0\x06\x03\x00\x00\x00\x00\x00\xc1\x06\x03\x00\x00\x00\x00\x00\xc2\x06\x03\x00\x00\x00\x00\x00\xc3\x06\x03\x00\x00\x00\x00\x00\xc4\x06\x03\x00\x00\x00\x00\x00\xc5\x06\x03\x00\x00\x00\x00\x00\xc6\x06\x03\x00\x00\x00\x00\x00\xcb\x06\x03\x00\x00\x00\x00\x00\xcc\x06\x03\x00\x00\x00\x00\x00\xcd\x06\x03\x00\x00\x00\x00\x00\xce\x06\x03\x00\x00\x00\x00\x00\xcf\x06\x03\x00\x00\x00\x00\x00'
+    b'\xd0\x06\x03\x00\x00\x00\x00\x00\xd1\x06\x03\x00\x00\x00\x00\x00\xd2\x06\x03\x00\x00\x00\x00\x00\xd3\x06\x03\x00\x00\x00\x00\x00\xd4\x06\x03\x00\x00\x00\x00\x00\xd5\x06\x03\x00\x00\x00\x00\x00\xd6\x06\x03\x00\x00\x00\x00\x00\xd7\x06\x03\x00\x00\x00\x00\x00\xd8\x06\x03\x00\x00\x00\x00\x00\xd9\x06\x03\x00\x00\x00\x00\x00\xda\x06\x03\x00\x00\x00\x00\x00\xdb\x06\x03\x00\x00\x00\x00\x00'
+    b'\xdc\x06\x03\x00\x00\x00\x00\x00\xdd\x06\x03\x00\x00\x00\x00\x00\xde\x06\x03\x00\x00\x00\x00\x00\xdf\x06\x03\x00\x00\x00\x00\x00\xe0\x06\x03\x00\x00\x00\x00\x00\xe1\x06\x03\x00\x00\x00\x00\x00\xe2\x06\x03\x00\x00\x00\x00\x00\xd9\x07\x03\x00\x00\x00\x00\x00\x01\x08\x03\x00\x00\x00\x00\x00\x05\x08\x03\x00\x00\x00\x00\x00\r\x08\x03\x00\x00\x00\x00\x00"\x08\x03\x00\x00\x00\x00\x00'
+    b'3\x08\x03\x00\x00\x00\x00\x004\x08\x03\x00\x00\x00\x00\x00=\x08\x03\x00\x00\x00\x00\x00>\x08\x03\x00\x00\x00\x00\x00\x9e\x08\x03\x00\x00\x00\x00\x00\xe2\x08\x03\x00\x00\x00\x00\x00\xe6\x08\x03\x00\x00\x00\x00\x00\xea\x08\x03\x00\x00\x00\x00\x00\x03\t\x03\x00\x00\x00\x00\x00\x1c\t\x03\x00\x00\x00\x00\x00\x86\t\x03\x00\x00\x00\x00\x00\x91\t\x03\x00\x00\x00\x00\x00'
+    b'\xa7\t\x03\x00\x00\x00\x00\x00\xee\t\x03\x00\x00\x00\x00\x00\xef\t\x03\x00\x00\x00\x00\x00\xff\t\x03\x00\x00\x00\x00\x00x\n\x03\x00\x00\x00\x00\x00\xd7\n\x03\x00\x00\x00\x00\x00\xf6\n\x03\x00\x00\x00\x00\x00\xad\x0b\x03\x00\x00\x00\x00\x00\xae\x0b\x03\x00\x00\x00\x00\x00\xeb\x0b\x03\x00\x00\x00\x00\x00\x93\x0c\x03\x00\x00\x00\x00\x00\x94\x0c\x03\x00\x00\x00\x00\x00'
+    b'\x95\x0c\x03\x00\x00\x00\x00\x00\xc8\x0c\x03\x00\x00\x00\x00\x00\xca\x0c\x03\x00\x00\x00\x00\x00\xd0\x0c\x03\x00\x00\x00\x00\x00E\r\x03\x00\x00\x00\x00\x00I\r\x03\x00\x00\x00\x00\x00g\r\x03\x00\x00\x00\x00\x00\x98\x0e\x03\x00\x00\x00\x00\x00\xb4\x0e\x03\x00\x00\x00\x00\x00H\x0f\x03\x00\x00\x00\x00\x00K\x0f\x03\x00\x00\x00\x00\x00\x87\x0f\x03\x00\x00\x00\x00\x00'
+    b"\xbc\x0f\x03\x00\x00\x00\x00\x00\x02\x10\x03\x00\x00\x00\x00\x00U\x10\x03\x00\x00\x00\x00\x00q\x10\x03\x00\x00\x00\x00\x00\x8a\x10\x03\x00\x00\x00\x00\x00\xae\x10\x03\x00\x00\x00\x00\x00\xb9\x10\x03\x00\x00\x00\x00\x00\xf3\x10\x03\x00\x00\x00\x00\x00\x00\x11\x03\x00\x00\x00\x00\x00\x18\x11\x03\x00\x00\x00\x00\x00'\x11\x03\x00\x00\x00\x00\x00(\x11\x03\x00\x00\x00\x00\x00"
+    b'6\x11\x03\x00\x00\x00\x00\x00G\x11\x03\x00\x00\x00\x00\x00J\x11\x03\x00\x00\x00\x00\x00j\x11\x03\x00\x00\x00\x00\x00v\x11\x03\x00\x00\x00\x00\x00\xb1\x11\x03\x00\x00\x00\x00\x00\xf4\x11\x03\x00\x00\x00\x00\x00\x18\x12\x03\x00\x00\x00\x00\x00\xc8\x12\x03\x00\x00\x00\x00\x00\xd1\x12\x03\x00\x00\x00\x00\x00\xe4\x12\x03\x00\x00\x00\x00\x00\xf1\x12\x03\x00\x00\x00\x00\x00'
+    b'\x08\x13\x03\x00\x00\x00\x00\x00?\x13\x03\x00\x00\x00\x00\x00D\x13\x03\x00\x00\x00\x00\x00R\x13\x03\x00\x00\x00\x00\x00h\x13\x03\x00\x00\x00\x00\x00\x82\x13\x03\x00\x00\x00\x00\x00E\x14\x03\x00\x00\x00\x00\x00F\x14\x03\x00\x00\x00\x00\x00G\x14\x03\x00\x00\x00\x00\x00H\x14\x03\x00\x00\x00\x00\x00I\x14\x03\x00\x00\x00\x00\x00J\x14\x03\x00\x00\x00\x00\x00'
+    b'K\x14\x03\x00\x00\x00\x00\x00L\x14\x03\x00\x00\x00\x00\x00M\x14\x03\x00\x00\x00\x00\x00N\x14\x03\x00\x00\x00\x00\x00O\x14\x03\x00\x00\x00\x00\x00P\x14\x03\x00\x00\x00\x00\x00Q\x14\x03\x00\x00\x00\x00\x00R\x14\x03\x00\x00\x00\x00\x00S\x14\x03\x00\x00\x00\x00\x00T\x14\x03\x00\x00\x00\x00\x00X\x14\x03\x00\x00\x00\x00\x00Y\x14\x03\x00\x00\x00\x00\x00'
+    b'Z\x14\x03\x00\x00\x00\x00\x00[\x14\x03\x00\x00\x00\x00\x00\\\x14\x03\x00\x00\x00\x00\x00]\x14\x03\x00\x00\x00\x00\x00c\x14\x03\x00\x00\x00\x00\x00d\x14\x03\x00\x00\x00\x00\x00e\x14\x03\x00\x00\x00\x00\x00f\x14\x03\x00\x00\x00\x00\x00g\x14\x03\x00\x00\x00\x00\x00h\x14\x03\x00\x00\x00\x00\x00\xb4\x14\x03\x00\x00\x00\x00\x00\xf5\x14\x03\x00\x00\x00\x00\x00'
+    b'\xe6\x15\x03\x00\x00\x00\x00\x00\xec\x15\x03\x00\x00\x00\x00\x00&\x16\x03\x00\x00\x00\x00\x00=\x16\x03\x00\x00\x00\x00\x00R\x16\x03\x00\x00\x00\x00\x00u\x16\x03\x00\x00\x00\x00\x00v\x16\x03\x00\x00\x00\x00\x00w\x16\x03\x00\x00\x00\x00\x00x\x16\x03\x00\x00\x00\x00\x00y\x16\x03\x00\x00\x00\x00\x00{\x16\x03\x00\x00\x00\x00\x00|\x16\x03\x00\x00\x00\x00\x00'
+    b'}\x16\x03\x00\x00\x00\x00\x00~\x16\x03\x00\x00\x00\x00\x00\x12\x17\x03\x00\x00\x00\x00\x00g\x17\x03\x00\x00\x00\x00\x00\x88\x17\x03\x00\x00\x00\x00\x00\xb8\x17\x03\x00\x00\x00\x00\x00\xb9\x17\x03\x00\x00\x00\x00\x00\xba\x17\x03\x00\x00\x00\x00\x00\xbb\x17\x03\x00\x00\x00\x00\x00\xbc\x17\x03\x00\x00\x00\x00\x00\xbd\x17\x03\x00\x00\x00\x00\x00\xff\x17\x03\x00\x00\x00\x00\x00'
+    b'\x1f\x18\x03\x00\x00\x00\x00\x00A\x18\x03\x00\x00\x00\x00\x00B\x18\x03\x00\x00\x00\x00\x00C\x18\x03\x00\x00\x00\x00\x00\x96\x18\x03\x00\x00\x00\x00\x00\xcf\x18\x03\x00\x00\x00\x00\x00&\x19\x03\x00\x00\x00\x00\x00p\x19\x03\x00\x00\x00\x00\x00r\x19\x03\x00\x00\x00\x00\x00\x96\x19\x03\x00\x00\x00\x00\x00\xd0\x19\x03\x00\x00\x00\x00\x00\xf7\x19\x03\x00\x00\x00\x00\x00'
+    b'\xfa\x19\x03\x00\x00\x00\x00\x00%\x1a\x03\x00\x00\x00\x00\x00D\x1a\x03\x00\x00\x00\x00\x00E\x1a\x03\x00\x00\x00\x00\x00}\x1a\x03\x00\x00\x00\x00\x00\xa2\x1a\x03\x00\x00\x00\x00\x00\xd6\x1a\x03\x00\x00\x00\x00\x00\xd7\x1a\x03\x00\x00\x00\x00\x00\xdb\x1a\x03\x00\x00\x00\x00\x00\x02\x1b\x03\x00\x00\x00\x00\x00\x19\x1b\x03\x00\x00\x00\x00\x00\x87\x1b\x03\x00\x00\x00\x00\x00'
+    b'\x95\x1b\x03\x00\x00\x00\x00\x00\xaa\x1b\x03\x00\x00\x00\x00\x00\xab\x1b\x03\x00\x00\x00\x00\x00\xb6\x1b\x03\x00\x00\x00\x00\x00\xf2\x1b\x03\x00\x00\x00\x00\x00\xf2\x1c\x03\x00\x00\x00\x00\x00"\x1d\x03\x00\x00\x00\x00\x005\x1d\x03\x00\x00\x00\x00\x00R\x1d\x03\x00\x00\x00\x00\x00W\x1d\x03\x00\x00\x00\x00\x00\x80\x1d\x03\x00\x00\x00\x00\x00\xd9\x1d\x03\x00\x00\x00\x00\x00'
+    b'\x0e\x1e\x03\x00\x00\x00\x00\x00K\x1e\x03\x00\x00\x00\x00\x00S\x1e\x03\x00\x00\x00\x00\x00T\x1e\x03\x00\x00\x00\x00\x00\\\x1e\x03\x00\x00\x00\x00\x00]\x1e\x03\x00\x00\x00\x00\x00a\x1e\x03\x00\x00\x00\x00\x00s\x1e\x03\x00\x00\x00\x00\x00t\x1e\x03\x00\x00\x00\x00\x00u\x1e\x03\x00\x00\x00\x00\x00\x93\x1e\x03\x00\x00\x00\x00\x00\x94\x1e\x03\x00\x00\x00\x00\x00'
+    b'\x95\x1e\x03\x00\x00\x00\x00\x00\x96\x1e\x03\x00\x00\x00\x00\x00\x97\x1e\x03\x00\x00\x00\x00\x00\x98\x1e\x03\x00\x00\x00\x00\x00\xd0\x1e\x03\x00\x00\x00\x00\x00\xd1\x1e\x03\x00\x00\x00\x00\x00\xd6\x1e\x03\x00\x00\x00\x00\x00\xe0\x1e\x03\x00\x00\x00\x00\x00\xe3\x1e\x03\x00\x00\x00\x00\x00\xf8\x1e\x03\x00\x00\x00\x00\x00\xf9\x1e\x03\x00\x00\x00\x00\x00\xff\x1e\x03\x00\x00\x00\x00\x00'
+    b'\x1d\x1f\x03\x00\x00\x00\x00\x00\xb9\x1f\x03\x00\x00\x00\x00\x00\xe7\x1f\x03\x00\x00\x00\x00\x00( \x03\x00\x00\x00\x00\x00\x81 \x03\x00\x00\x00\x00\x00\xcb!\x03\x00\x00\x00\x00\x00\xe2!\x03\x00\x00\x00\x00\x00("\x03\x00\x00\x00\x00\x00L"\x03\x00\x00\x00\x00\x00_"\x03\x00\x00\x00\x00\x00\x9a"\x03\x00\x00\x00\x00\x00\xb3"\x03\x00\x00\x00\x00\x00'
+    b'\xc1"\x03\x00\x00\x00\x00\x00\xf3"\x03\x00\x00\x00\x00\x00\x8b#\x03\x00\x00\x00\x00\x00\x18$\x03\x00\x00\x00\x00\x00\x19$\x03\x00\x00\x00\x00\x00\x1a$\x03\x00\x00\x00\x00\x00\x1b$\x03\x00\x00\x00\x00\x00($\x03\x00\x00\x00\x00\x00)$\x03\x00\x00\x00\x00\x00*$\x03\x00\x00\x00\x00\x00+$\x03\x00\x00\x00\x00\x00-$\x03\x00\x00\x00\x00\x00'
+    b'\xf2$\x03\x00\x00\x00\x00\x00N%\x03\x00\x00\x00\x00\x00\\%\x03\x00\x00\x00\x00\x00\xe1%\x03\x00\x00\x00\x00\x00\x94&\x03\x00\x00\x00\x00\x00\x99&\x03\x00\x00\x00\x00\x00\xcc&\x03\x00\x00\x00\x00\x00\xd5&\x03\x00\x00\x00\x00\x00\xd6&\x03\x00\x00\x00\x00\x00\xd7&\x03\x00\x00\x00\x00\x00\xd8&\x03\x00\x00\x00\x00\x00\xed&\x03\x00\x00\x00\x00\x00'
+    b"\xf9&\x03\x00\x00\x00\x00\x00\xfa&\x03\x00\x00\x00\x00\x00\xfb&\x03\x00\x00\x00\x00\x00/'\x03\x00\x00\x00\x00\x000'\x03\x00\x00\x00\x00\x001'\x03\x00\x00\x00\x00\x00\xaf'\x03\x00\x00\x00\x00\x00\xac(\x03\x00\x00\x00\x00\x00\xcf(\x03\x00\x00\x00\x00\x00\xdc(\x03\x00\x00\x00\x00\x00\xdd(\x03\x00\x00\x00\x00\x00\xe0(\x03\x00\x00\x00\x00\x00"
+    b'/)\x03\x00\x00\x00\x00\x00Q)\x03\x00\x00\x00\x00\x00Z)\x03\x00\x00\x00\x00\x00^)\x03\x00\x00\x00\x00\x00\xbe)\x03\x00\x00\x00\x00\x00\xd2)\x03\x00\x00\x00\x00\x00\x15*\x03\x00\x00\x00\x00\x00.*\x03\x00\x00\x00\x00\x00B*\x03\x00\x00\x00\x00\x00C*\x03\x00\x00\x00\x00\x00_*\x03\x00\x00\x00\x00\x00\xe2*\x03\x00\x00\x00\x00\x00'
+    b'9+\x03\x00\x00\x00\x00\x00\xbe+\x03\x00\x00\x00\x00\x00\xbf+\x03\x00\x00\x00\x00\x00\xc0+\x03\x00\x00\x00\x00\x00\xc2+\x03\x00\x00\x00\x00\x00\xc3+\x03\x00\x00\x00\x00\x00\xc7+\x03\x00\x00\x00\x00\x00\xef+\x03\x00\x00\x00\x00\x000,\x03\x00\x00\x00\x00\x001,\x03\x00\x00\x00\x00\x002,\x03\x00\x00\x00\x00\x003,\x03\x00\x00\x00\x00\x00'
+    b'6,\x03\x00\x00\x00\x00\x007,\x03\x00\x00\x00\x00\x008,\x03\x00\x00\x00\x00\x009,\x03\x00\x00\x00\x00\x00\x18-\x03\x00\x00\x00\x00\x00 -\x03\x00\x00\x00\x00\x00\xa1-\x03\x00\x00\x00\x00\x00\xa6-\x03\x00\x00\x00\x00\x00\xd0-\x03\x00\x00\x00\x00\x00\xdc-\x03\x00\x00\x00\x00\x00\xe3-\x03\x00\x00\x00\x00\x00\xee-\x03\x00\x00\x00\x00\x00'
+    b'\xef-\x03\x00\x00\x00\x00\x00\x03.\x03\x00\x00\x00\x00\x00\xfe.\x03\x00\x00\x00\x00\x00\\/\x03\x00\x00\x00\x00\x00\x7f/\x03\x00\x00\x00\x00\x00\xe3/\x03\x00\x00\x00\x00\x00\xe4/\x03\x00\x00\x00\x00\x00\xca0\x03\x00\x00\x00\x00\x00\xda0\x03\x00\x00\x00\x00\x00\x1f1\x03\x00\x00\x00\x00\x0041\x03\x00\x00\x00\x00\x00\xa11\x03\x00\x00\x00\x00\x00'
+    b'\xac1\x03\x00\x00\x00\x00\x00\xdd1\x03\x00\x00\x00\x00\x00\xe31\x03\x00\x00\x00\x00\x00\x152\x03\x00\x00\x00\x00\x00$2\x03\x00\x00\x00\x00\x00v2\x03\x00\x00\x00\x00\x00\x7f2\x03\x00\x00\x00\x00\x00\x812\x03\x00\x00\x00\x00\x00\x862\x03\x00\x00\x00\x00\x00\x872\x03\x00\x00\x00\x00\x00\t3\x03\x00\x00\x00\x00\x00\x8d3\x03\x00\x00\x00\x00\x00'
+    b'\xd04\x03\x00\x00\x00\x00\x00\xd34\x03\x00\x00\x00\x00\x00\xe84\x03\x00\x00\x00\x00\x00\xea4\x03\x00\x00\x00\x00\x00\xeb4\x03\x00\x00\x00\x00\x00\x885\x03\x00\x00\x00\x00\x00\x895\x03\x00\x00\x00\x00\x00\xab5\x03\x00\x00\x00\x00\x00\xf65\x03\x00\x00\x00\x00\x00\x1c6\x03\x00\x00\x00\x00\x00\x1d6\x03\x00\x00\x00\x00\x00\x1e6\x03\x00\x00\x00\x00\x00'
+    b'\x1f6\x03\x00\x00\x00\x00\x00 6\x03\x00\x00\x00\x00\x00!6\x03\x00\x00\x00\x00\x00"6\x03\x00\x00\x00\x00\x00#6\x03\x00\x00\x00\x00\x00(6\x03\x00\x00\x00\x00\x00)6\x03\x00\x00\x00\x00\x00*6\x03\x00\x00\x00\x00\x00+6\x03\x00\x00\x00\x00\x00-6\x03\x00\x00\x00\x00\x00.6\x03\x00\x00\x00\x00\x00/6\x03\x00\x00\x00\x00\x00'
+    b'06\x03\x00\x00\x00\x00\x0046\x03\x00\x00\x00\x00\x0056\x03\x00\x00\x00\x00\x0066\x03\x00\x00\x00\x00\x0076\x03\x00\x00\x00\x00\x0086\x03\x00\x00\x00\x00\x0096\x03\x00\x00\x00\x00\x00:6\x03\x00\x00\x00\x00\x00;6\x03\x00\x00\x00\x00\x00\xd36\x03\x00\x00\x00\x00\x00\xe66\x03\x00\x00\x00\x00\x00 7\x03\x00\x00\x00\x00\x00'
+    b'#7\x03\x00\x00\x00\x00\x00%7\x03\x00\x00\x00\x00\x00\x967\x03\x00\x00\x00\x00\x00\xa57\x03\x00\x00\x00\x00\x00\xa87\x03\x00\x00\x00\x00\x00\xa97\x03\x00\x00\x00\x00\x00\xab7\x03\x00\x00\x00\x00\x00\x818\x03\x00\x00\x00\x00\x00\x838\x03\x00\x00\x00\x00\x00\x848\x03\x00\x00\x00\x00\x00\x8c8\x03\x00\x00\x00\x00\x00\xa38\x03\x00\x00\x00\x00\x00'
+    b'\xfc8\x03\x00\x00\x00\x00\x00\x139\x03\x00\x00\x00\x00\x00-9\x03\x00\x00\x00\x00\x00.9\x03\x00\x00\x00\x00\x0009\x03\x00\x00\x00\x00\x0019\x03\x00\x00\x00\x00\x0049\x03\x00\x00\x00\x00\x0079\x03\x00\x00\x00\x00\x00\x8f9\x03\x00\x00\x00\x00\x00\x919\x03\x00\x00\x00\x00\x00\x929\x03\x00\x00\x00\x00\x00\x939\x03\x00\x00\x00\x00\x00'
+    b'\x949\x03\x00\x00\x00\x00\x00\x969\x03\x00\x00\x00\x00\x00\xd69\x03\x00\x00\x00\x00\x00E:\x03\x00\x00\x00\x00\x00G:\x03\x00\x00\x00\x00\x00P:\x03\x00\x00\x00\x00\x00Q:\x03\x00\x00\x00\x00\x00R:\x03\x00\x00\x00\x00\x00S:\x03\x00\x00\x00\x00\x00}:\x03\x00\x00\x00\x00\x00\x7f:\x03\x00\x00\x00\x00\x00\x8a:\x03\x00\x00\x00\x00\x00'
+    b"\x99:\x03\x00\x00\x00\x00\x00\x9b:\x03\x00\x00\x00\x00\x00\xa6:\x03\x00\x00\x00\x00\x00\xc9:\x03\x00\x00\x00\x00\x00\xd3:\x03\x00\x00\x00\x00\x00\xd6:\x03\x00\x00\x00\x00\x00\xe6:\x03\x00\x00\x00\x00\x00\xe8:\x03\x00\x00\x00\x00\x00';\x03\x00\x00\x00\x00\x00(;\x03\x00\x00\x00\x00\x00*;\x03\x00\x00\x00\x00\x00+;\x03\x00\x00\x00\x00\x00"
+    b',;\x03\x00\x00\x00\x00\x00-;\x03\x00\x00\x00\x00\x00/;\x03\x00\x00\x00\x00\x000;\x03\x00\x00\x00\x00\x001;\x03\x00\x00\x00\x00\x00\x9b;\x03\x00\x00\x00\x00\x00\xc0;\x03\x00\x00\x00\x00\x00\xc9;\x03\x00\x00\x00\x00\x00\xfa;\x03\x00\x00\x00\x00\x00\x0e<\x03\x00\x00\x00\x00\x00\x0f<\x03\x00\x00\x00\x00\x00\x10<\x03\x00\x00\x00\x00\x00'
+    b'W<\x03\x00\x00\x00\x00\x00m<\x03\x00\x00\x00\x00\x00p<\x03\x00\x00\x00\x00\x00r<\x03\x00\x00\x00\x00\x00v<\x03\x00\x00\x00\x00\x00\xf6<\x03\x00\x00\x00\x00\x00\xf7<\x03\x00\x00\x00\x00\x00\r=\x03\x00\x00\x00\x00\x00\x1e=\x03\x00\x00\x00\x00\x00,=\x03\x00\x00\x00\x00\x00e=\x03\x00\x00\x00\x00\x00m=\x03\x00\x00\x00\x00\x00'
+    b'x=\x03\x00\x00\x00\x00\x00\x8d=\x03\x00\x00\x00\x00\x00\xc4=\x03\x00\x00\x00\x00\x00\xf3=\x03\x00\x00\x00\x00\x00\n>\x03\x00\x00\x00\x00\x00\x17>\x03\x00\x00\x00\x00\x00\x85>\x03\x00\x00\x00\x00\x00\x92>\x03\x00\x00\x00\x00\x00\xaf>\x03\x00\x00\x00\x00\x00\xc1>\x03\x00\x00\x00\x00\x00\xd4>\x03\x00\x00\x00\x00\x00\x80?\x03\x00\x00\x00\x00\x00'
+    b'\x82?\x03\x00\x00\x00\x00\x00\x85?\x03\x00\x00\x00\x00\x00\x99?\x03\x00\x00\x00\x00\x00/@\x03\x00\x00\x00\x00\x00?@\x03\x00\x00\x00\x00\x00G@\x03\x00\x00\x00\x00\x00\xb7A\x03\x00\x00\x00\x00\x00\xc1A\x03\x00\x00\x00\x00\x00\xc4A\x03\x00\x00\x00\x00\x00\xc7A\x03\x00\x00\x00\x00\x00[B\x03\x00\x00\x00\x00\x00\\B\x03\x00\x00\x00\x00\x00'
+    b'\xadB\x03\x00\x00\x00\x00\x00\xb1B\x03\x00\x00\x00\x00\x00\xb2B\x03\x00\x00\x00\x00\x00\x16D\x03\x00\x00\x00\x00\x00\x8cD\x03\x00\x00\x00\x00\x00\x8dD\x03\x00\x00\x00\x00\x00\x90D\x03\x00\x00\x00\x00\x00]E\x03\x00\x00\x00\x00\x00\rF\x03\x00\x00\x00\x00\x00\x0fF\x03\x00\x00\x00\x00\x00\x10F\x03\x00\x00\x00\x00\x00\x11F\x03\x00\x00\x00\x00\x00'
+    b'\x12F\x03\x00\x00\x00\x00\x00:F\x03\x00\x00\x00\x00\x00<G\x03\x00\x00\x00\x00\x00=G\x03\x00\x00\x00\x00\x00vG\x03\x00\x00\x00\x00\x00\xdfG\x03\x00\x00\x00\x00\x00 H\x03\x00\x00\x00\x00\x00+H\x03\x00\x00\x00\x00\x00^H\x03\x00\x00\x00\x00\x00\x81H\x03\x00\x00\x00\x00\x00\xb8H\x03\x00\x00\x00\x00\x00\xb9H\x03\x00\x00\x00\x00\x00'
+    b'\xd5H\x03\x00\x00\x00\x00\x00\xdeH\x03\x00\x00\x00\x00\x00\xecH\x03\x00\x00\x00\x00\x00\xf5H\x03\x00\x00\x00\x00\x00\x08I\x03\x00\x00\x00\x00\x00\x18I\x03\x00\x00\x00\x00\x00"I\x03\x00\x00\x00\x00\x00SI\x03\x00\x00\x00\x00\x00_I\x03\x00\x00\x00\x00\x00tI\x03\x00\x00\x00\x00\x00yI\x03\x00\x00\x00\x00\x00\x7fI\x03\x00\x00\x00\x00\x00'
+    b'\x80I\x03\x00\x00\x00\x00\x00\xb6I\x03\x00\x00\x00\x00\x00\xc8I\x03\x00\x00\x00\x00\x00\xccI\x03\x00\x00\x00\x00\x00\xd4I\x03\x00\x00\x00\x00\x00\xdaI\x03\x00\x00\x00\x00\x008J\x03\x00\x00\x00\x00\x00BJ\x03\x00\x00\x00\x00\x00yJ\x03\x00\x00\x00\x00\x00\xbdJ\x03\x00\x00\x00\x00\x00\xcbJ\x03\x00\x00\x00\x00\x00\xd1J\x03\x00\x00\x00\x00\x00'
+    b'~K\x03\x00\x00\x00\x00\x00\x83K\x03\x00\x00\x00\x00\x00\x85K\x03\x00\x00\x00\x00\x00\x89K\x03\x00\x00\x00\x00\x00\xa6K\x03\x00\x00\x00\x00\x00\xb7K\x03\x00\x00\x00\x00\x00\xb8K\x03\x00\x00\x00\x00\x00\xbdK\x03\x00\x00\x00\x00\x005L\x03\x00\x00\x00\x00\x00hL\x03\x00\x00\x00\x00\x00pL\x03\x00\x00\x00\x00\x00qL\x03\x00\x00\x00\x00\x00'
+    b'rL\x03\x00\x00\x00\x00\x00sL\x03\x00\x00\x00\x00\x00tL\x03\x00\x00\x00\x00\x00\x84L\x03\x00\x00\x00\x00\x00\x85L\x03\x00\x00\x00\x00\x00\x86L\x03\x00\x00\x00\x00\x00\x87L\x03\x00\x00\x00\x00\x00\x88L\x03\x00\x00\x00\x00\x00\x89L\x03\x00\x00\x00\x00\x00\x8aL\x03\x00\x00\x00\x00\x00\x8bL\x03\x00\x00\x00\x00\x00\xadL\x03\x00\x00\x00\x00\x00'
+    b'\xc3L\x03\x00\x00\x00\x00\x00\xc4L\x03\x00\x00\x00\x00\x00\xc5L\x03\x00\x00\x00\x00\x00\xdcL\x03\x00\x00\x00\x00\x00\xe6L\x03\x00\x00\x00\x00\x00\xebL\x03\x00\x00\x00\x00\x00\xf8L\x03\x00\x00\x00\x00\x00\xf9L\x03\x00\x00\x00\x00\x00\x05M\x03\x00\x00\x00\x00\x00\x06M\x03\x00\x00\x00\x00\x00\xddM\x03\x00\x00\x00\x00\x00GN\x03\x00\x00\x00\x00\x00'
+    b'HN\x03\x00\x00\x00\x00\x00\xedN\x03\x00\x00\x00\x00\x002O\x03\x00\x00\x00\x00\x00CO\x03\x00\x00\x00\x00\x00\x94O\x03\x00\x00\x00\x00\x00\xc4O\x03\x00\x00\x00\x00\x00\xe2O\x03\x00\x00\x00\x00\x00\xe3O\x03\x00\x00\x00\x00\x00 P\x03\x00\x00\x00\x00\x00\x1eQ\x03\x00\x00\x00\x00\x00AQ\x03\x00\x00\x00\x00\x00BQ\x03\x00\x00\x00\x00\x00'
+    b'ER\x03\x00\x00\x00\x00\x00eR\x03\x00\x00\x00\x00\x00HS\x03\x00\x00\x00\x00\x00\xa1S\x03\x00\x00\x00\x00\x00\xceS\x03\x00\x00\x00\x00\x00\xddS\x03\x00\x00\x00\x00\x00\xdeS\x03\x00\x00\x00\x00\x00\xdfS\x03\x00\x00\x00\x00\x00\xb8T\x03\x00\x00\x00\x00\x00\xdcT\x03\x00\x00\x00\x00\x00\xe5T\x03\x00\x00\x00\x00\x00:U\x03\x00\x00\x00\x00\x00'
+    b'CU\x03\x00\x00\x00\x00\x00MU\x03\x00\x00\x00\x00\x00\xedU\x03\x00\x00\x00\x00\x00HV\x03\x00\x00\x00\x00\x00\x1eW\x03\x00\x00\x00\x00\x00rW\x03\x00\x00\x00\x00\x00sW\x03\x00\x00\x00\x00\x00tW\x03\x00\x00\x00\x00\x00uW\x03\x00\x00\x00\x00\x00vW\x03\x00\x00\x00\x00\x00wW\x03\x00\x00\x00\x00\x00\xd7W\x03\x00\x00\x00\x00\x00'
+    b'\xe6W\x03\x00\x00\x00\x00\x00\xe9W\x03\x00\x00\x00\x00\x00 X\x03\x00\x00\x00\x00\x00oX\x03\x00\x00\x00\x00\x00\xf6Y\x03\x00\x00\x00\x00\x00!Z\x03\x00\x00\x00\x00\x00@Z\x03\x00\x00\x00\x00\x00\xa6Z\x03\x00\x00\x00\x00\x00\xa7Z\x03\x00\x00\x00\x00\x00\xa8Z\x03\x00\x00\x00\x00\x00\xa9Z\x03\x00\x00\x00\x00\x00\xaaZ\x03\x00\x00\x00\x00\x00'
+    b'\xabZ\x03\x00\x00\x00\x00\x00\xb4Z\x03\x00\x00\x00\x00\x00\xfbZ\x03\x00\x00\x00\x00\x00\x13[\x03\x00\x00\x00\x00\x00\x14[\x03\x00\x00\x00\x00\x00\x15[\x03\x00\x00\x00\x00\x00\x16[\x03\x00\x00\x00\x00\x00\x17[\x03\x00\x00\x00\x00\x00\x18[\x03\x00\x00\x00\x00\x00\x19[\x03\x00\x00\x00\x00\x00\x1a[\x03\x00\x00\x00\x00\x00\x1b[\x03\x00\x00\x00\x00\x00'
+    b'\x1c[\x03\x00\x00\x00\x00\x00\xbd[\x03\x00\x00\x00\x00\x00\xe9[\x03\x00\x00\x00\x00\x00=\\\x03\x00\x00\x00\x00\x00\xba\\\x03\x00\x00\x00\x00\x00\xbb\\\x03\x00\x00\x00\x00\x00\xea\\\x03\x00\x00\x00\x00\x00\xf3\\\x03\x00\x00\x00\x00\x00\xf4\\\x03\x00\x00\x00\x00\x00\xf5\\\x03\x00\x00\x00\x00\x00\xf6\\\x03\x00\x00\x00\x00\x00\xf7\\\x03\x00\x00\x00\x00\x00'
+    b'\x06]\x03\x00\x00\x00\x00\x00\x07]\x03\x00\x00\x00\x00\x003]\x03\x00\x00\x00\x00\x00e]\x03\x00\x00\x00\x00\x00k^\x03\x00\x00\x00\x00\x00<_\x03\x00\x00\x00\x00\x00\x80_\x03\x00\x00\x00\x00\x00\x85_\x03\x00\x00\x00\x00\x00\x86_\x03\x00\x00\x00\x00\x00\xb9_\x03\x00\x00\x00\x00\x00\xd4_\x03\x00\x00\x00\x00\x00\xf2_\x03\x00\x00\x00\x00\x00'
+    b'\x00`\x03\x00\x00\x00\x00\x00Ua\x03\x00\x00\x00\x00\x00ea\x03\x00\x00\x00\x00\x00\xcaa\x03\x00\x00\x00\x00\x00\xd8a\x03\x00\x00\x00\x00\x00\xd9a\x03\x00\x00\x00\x00\x00\xdaa\x03\x00\x00\x00\x00\x00\xdca\x03\x00\x00\x00\x00\x00Eb\x03\x00\x00\x00\x00\x00\x92b\x03\x00\x00\x00\x00\x00\x93b\x03\x00\x00\x00\x00\x00\xd1b\x03\x00\x00\x00\x00\x00'
+    b'\xd6b\x03\x00\x00\x00\x00\x00\x12c\x03\x00\x00\x00\x00\x00\xa5c\x03\x00\x00\x00\x00\x00\xc7c\x03\x00\x00\x00\x00\x00\xd6c\x03\x00\x00\x00\x00\x00\xe9c\x03\x00\x00\x00\x00\x00\xf5c\x03\x00\x00\x00\x00\x00\x16d\x03\x00\x00\x00\x00\x00\x17d\x03\x00\x00\x00\x00\x00\x18d\x03\x00\x00\x00\x00\x00\x1ad\x03\x00\x00\x00\x00\x00\x1fd\x03\x00\x00\x00\x00\x00'
+    b' d\x03\x00\x00\x00\x00\x00!d\x03\x00\x00\x00\x00\x00hd\x03\x00\x00\x00\x00\x00\x96d\x03\x00\x00\x00\x00\x00\x97d\x03\x00\x00\x00\x00\x00\x9ad\x03\x00\x00\x00\x00\x00\x9bd\x03\x00\x00\x00\x00\x00\x9dd\x03\x00\x00\x00\x00\x00\xe4d\x03\x00\x00\x00\x00\x00 e\x03\x00\x00\x00\x00\x00\xd2e\x03\x00\x00\x00\x00\x00\xdbe\x03\x00\x00\x00\x00\x00'
+    b'$f\x03\x00\x00\x00\x00\x00}f\x03\x00\x00\x00\x00\x00\xdcf\x03\x00\x00\x00\x00\x00\xddf\x03\x00\x00\x00\x00\x00\xe4f\x03\x00\x00\x00\x00\x00Wg\x03\x00\x00\x00\x00\x00kg\x03\x00\x00\x00\x00\x00\xb1g\x03\x00\x00\x00\x00\x00vh\x03\x00\x00\x00\x00\x00|h\x03\x00\x00\x00\x00\x00\x82h\x03\x00\x00\x00\x00\x00\xb1h\x03\x00\x00\x00\x00\x00'
+    b'\xb2h\x03\x00\x00\x00\x00\x00\xcfh\x03\x00\x00\x00\x00\x00\xd1h\x03\x00\x00\x00\x00\x00\xddh\x03\x00\x00\x00\x00\x00\x10i\x03\x00\x00\x00\x00\x00Ei\x03\x00\x00\x00\x00\x00Fi\x03\x00\x00\x00\x00\x00\xb2i\x03\x00\x00\x00\x00\x00\xf7i\x03\x00\x00\x00\x00\x00\xfei\x03\x00\x00\x00\x00\x00\xcej\x03\x00\x00\x00\x00\x00\xd3j\x03\x00\x00\x00\x00\x00'
+    b"\xdbj\x03\x00\x00\x00\x00\x00\xdcj\x03\x00\x00\x00\x00\x00&k\x03\x00\x00\x00\x00\x00'k\x03\x00\x00\x00\x00\x00(k\x03\x00\x00\x00\x00\x00)k\x03\x00\x00\x00\x00\x00*k\x03\x00\x00\x00\x00\x001k\x03\x00\x00\x00\x00\x002k\x03\x00\x00\x00\x00\x003k\x03\x00\x00\x00\x00\x00\x80k\x03\x00\x00\x00\x00\x00\x81k\x03\x00\x00\x00\x00\x00"
+    b'\x82k\x03\x00\x00\x00\x00\x00\x83k\x03\x00\x00\x00\x00\x00\x8ek\x03\x00\x00\x00\x00\x00\x90k\x03\x00\x00\x00\x00\x00\xd6k\x03\x00\x00\x00\x00\x00$l\x03\x00\x00\x00\x00\x00\x85l\x03\x00\x00\x00\x00\x00\xael\x03\x00\x00\x00\x00\x00\xcfl\x03\x00\x00\x00\x00\x00wm\x03\x00\x00\x00\x00\x00}m\x03\x00\x00\x00\x00\x00kn\x03\x00\x00\x00\x00\x00'
+    b'\xden\x03\x00\x00\x00\x00\x00\xf1n\x03\x00\x00\x00\x00\x00\xf3n\x03\x00\x00\x00\x00\x00\x18o\x03\x00\x00\x00\x00\x00Jo\x03\x00\x00\x00\x00\x00Ko\x03\x00\x00\x00\x00\x00Lo\x03\x00\x00\x00\x00\x00eo\x03\x00\x00\x00\x00\x00fo\x03\x00\x00\x00\x00\x00}o\x03\x00\x00\x00\x00\x00\x81o\x03\x00\x00\x00\x00\x00\xc8o\x03\x00\x00\x00\x00\x00'
+    b'1p\x03\x00\x00\x00\x00\x002p\x03\x00\x00\x00\x00\x003p\x03\x00\x00\x00\x00\x00\xf4p\x03\x00\x00\x00\x00\x00\xf7p\x03\x00\x00\x00\x00\x00\xfap\x03\x00\x00\x00\x00\x00\xfcp\x03\x00\x00\x00\x00\x00\xfep\x03\x00\x00\x00\x00\x00\xffp\x03\x00\x00\x00\x00\x00\tq\x03\x00\x00\x00\x00\x00\x83q\x03\x00\x00\x00\x00\x00\xa2q\x03\x00\x00\x00\x00\x00'
+    b'\xa3q\x03\x00\x00\x00\x00\x00\xa4q\x03\x00\x00\x00\x00\x00\xa5q\x03\x00\x00\x00\x00\x00\xa6q\x03\x00\x00\x00\x00\x00\xc0q\x03\x00\x00\x00\x00\x00\xdaq\x03\x00\x00\x00\x00\x00\xf6q\x03\x00\x00\x00\x00\x00\xf7q\x03\x00\x00\x00\x00\x00\xf8q\x03\x00\x00\x00\x00\x00\xf9q\x03\x00\x00\x00\x00\x001r\x03\x00\x00\x00\x00\x001s\x03\x00\x00\x00\x00\x00'
+    b'\xf7s\x03\x00\x00\x00\x00\x00nt\x03\x00\x00\x00\x00\x00pt\x03\x00\x00\x00\x00\x00\xdft\x03\x00\x00\x00\x00\x00\x89u\x03\x00\x00\x00\x00\x00\x8au\x03\x00\x00\x00\x00\x00\xcfu\x03\x00\x00\x00\x00\x00\x03v\x03\x00\x00\x00\x00\x00Lv\x03\x00\x00\x00\x00\x00Rv\x03\x00\x00\x00\x00\x00sv\x03\x00\x00\x00\x00\x00kw\x03\x00\x00\x00\x00\x00'
+    b'\x1dx\x03\x00\x00\x00\x00\x00$x\x03\x00\x00\x00\x00\x00&x\x03\x00\x00\x00\x00\x00)x\x03\x00\x00\x00\x00\x00yx\x03\x00\x00\x00\x00\x00\x9ex\x03\x00\x00\x00\x00\x00\xa1x\x03\x00\x00\x00\x00\x00\xc5x\x03\x00\x00\x00\x00\x00\xc6x\x03\x00\x00\x00\x00\x00\xc8x\x03\x00\x00\x00\x00\x00\xc9x\x03\x00\x00\x00\x00\x00ty\x03\x00\x00\x00\x00\x00'
+    b'\xa9y\x03\x00\x00\x00\x00\x00\xaay\x03\x00\x00\x00\x00\x00\xaby\x03\x00\x00\x00\x00\x00\xacy\x03\x00\x00\x00\x00\x00\xf5y\x03\x00\x00\x00\x00\x00\xf6y\x03\x00\x00\x00\x00\x00\xf7y\x03\x00\x00\x00\x00\x00\xf8y\x03\x00\x00\x00\x00\x00\xf9y\x03\x00\x00\x00\x00\x00\xfay\x03\x00\x00\x00\x00\x00:z\x03\x00\x00\x00\x00\x00Sz\x03\x00\x00\x00\x00\x00'
+    b'\x90z\x03\x00\x00\x00\x00\x00({\x03\x00\x00\x00\x00\x00g{\x03\x00\x00\x00\x00\x00j{\x03\x00\x00\x00\x00\x00\x96{\x03\x00\x00\x00\x00\x00\x98{\x03\x00\x00\x00\x00\x00\xf3{\x03\x00\x00\x00\x00\x00\x1e|\x03\x00\x00\x00\x00\x00E|\x03\x00\x00\x00\x00\x00\\|\x03\x00\x00\x00\x00\x00_|\x03\x00\x00\x00\x00\x00`|\x03\x00\x00\x00\x00\x00'
+    b'a|\x03\x00\x00\x00\x00\x00\xc6|\x03\x00\x00\x00\x00\x00\xc7|\x03\x00\x00\x00\x00\x00\xc8|\x03\x00\x00\x00\x00\x00\x13}\x03\x00\x00\x00\x00\x00\xbc}\x03\x00\x00\x00\x00\x00\x1e~\x03\x00\x00\x00\x00\x009~\x03\x00\x00\x00\x00\x00:~\x03\x00\x00\x00\x00\x00;~\x03\x00\x00\x00\x00\x00<~\x03\x00\x00\x00\x00\x00x~\x03\x00\x00\x00\x00\x00'
+    b'y~\x03\x00\x00\x00\x00\x00z~\x03\x00\x00\x00\x00\x00{~\x03\x00\x00\x00\x00\x00|~\x03\x00\x00\x00\x00\x00}~\x03\x00\x00\x00\x00\x00\x9f~\x03\x00\x00\x00\x00\x00\xb3~\x03\x00\x00\x00\x00\x00\xb8~\x03\x00\x00\x00\x00\x00\xb9~\x03\x00\x00\x00\x00\x00\xba~\x03\x00\x00\x00\x00\x00m\x7f\x03\x00\x00\x00\x00\x00n\x7f\x03\x00\x00\x00\x00\x00'
+    b'\xca\x7f\x03\x00\x00\x00\x00\x00\xcb\x7f\x03\x00\x00\x00\x00\x00\xcc\x7f\x03\x00\x00\x00\x00\x00\x01\x80\x03\x00\x00\x00\x00\x002\x80\x03\x00\x00\x00\x00\x00?\x80\x03\x00\x00\x00\x00\x00T\x80\x03\x00\x00\x00\x00\x00\xc5\x80\x03\x00\x00\x00\x00\x00\xc8\x80\x03\x00\x00\x00\x00\x00\x11\x81\x03\x00\x00\x00\x00\x00\xb1\x81\x03\x00\x00\x00\x00\x00\xc3\x81\x03\x00\x00\x00\x00\x00'
+    b'\xe4\x81\x03\x00\x00\x00\x00\x00\xe5\x81\x03\x00\x00\x00\x00\x00\xeb\x81\x03\x00\x00\x00\x00\x00\x0f\x82\x03\x00\x00\x00\x00\x00#\x82\x03\x00\x00\x00\x00\x00\xa5\x82\x03\x00\x00\x00\x00\x00\xdb\x82\x03\x00\x00\x00\x00\x00?\x83\x03\x00\x00\x00\x00\x00@\x83\x03\x00\x00\x00\x00\x00\x8c\x83\x03\x00\x00\x00\x00\x00\xa2\x83\x03\x00\x00\x00\x00\x00\xff\x83\x03\x00\x00\x00\x00\x00'
+    b'\x16\x84\x03\x00\x00\x00\x00\x00#\x84\x03\x00\x00\x00\x00\x00.\x84\x03\x00\x00\x00\x00\x00/\x84\x03\x00\x00\x00\x00\x000\x84\x03\x00\x00\x00\x00\x001\x84\x03\x00\x00\x00\x00\x00]\x84\x03\x00\x00\x00\x00\x00j\x84\x03\x00\x00\x00\x00\x00\x9c\x84\x03\x00\x00\x00\x00\x00\x07\x85\x03\x00\x00\x00\x00\x00Z\x85\x03\x00\x00\x00\x00\x00\xe9\x85\x03\x00\x00\x00\x00\x00'
+    b"+\x86\x03\x00\x00\x00\x00\x00'\x87\x03\x00\x00\x00\x00\x00\xce\x87\x03\x00\x00\x00\x00\x00\xde\x87\x03\x00\x00\x00\x00\x00\x8a\x89\x03\x00\x00\x00\x00\x00\x8e\x89\x03\x00\x00\x00\x00\x00\x07\x8a\x03\x00\x00\x00\x00\x00\x17\x8b\x03\x00\x00\x00\x00\x00\x18\x8b\x03\x00\x00\x00\x00\x00\x19\x8b\x03\x00\x00\x00\x00\x00\x1a\x8b\x03\x00\x00\x00\x00\x00\x1b\x8b\x03\x00\x00\x00\x00\x00"
+    b"\x1e\x8b\x03\x00\x00\x00\x00\x00r\x8b\x03\x00\x00\x00\x00\x00s\x8b\x03\x00\x00\x00\x00\x00u\x8b\x03\x00\x00\x00\x00\x00$\x8c\x03\x00\x00\x00\x00\x00%\x8c\x03\x00\x00\x00\x00\x00\n\x8d\x03\x00\x00\x00\x00\x00'\x8d\x03\x00\x00\x00\x00\x00X\x8d\x03\x00\x00\x00\x00\x00w\x8d\x03\x00\x00\x00\x00\x00x\x8d\x03\x00\x00\x00\x00\x00y\x8d\x03\x00\x00\x00\x00\x00"
+    b'z\x8d\x03\x00\x00\x00\x00\x00~\x8d\x03\x00\x00\x00\x00\x00\x80\x8d\x03\x00\x00\x00\x00\x00\x82\x8d\x03\x00\x00\x00\x00\x00\xcb\x8e\x03\x00\x00\x00\x00\x00\xd9\x8e\x03\x00\x00\x00\x00\x00p\x8f\x03\x00\x00\x00\x00\x00q\x8f\x03\x00\x00\x00\x00\x00\xd4\x8f\x03\x00\x00\x00\x00\x00/\x90\x03\x00\x00\x00\x00\x00\xfc\x90\x03\x00\x00\x00\x00\x005\x91\x03\x00\x00\x00\x00\x00'
+    b'6\x91\x03\x00\x00\x00\x00\x008\x91\x03\x00\x00\x00\x00\x009\x91\x03\x00\x00\x00\x00\x00D\x91\x03\x00\x00\x00\x00\x00F\x91\x03\x00\x00\x00\x00\x00H\x91\x03\x00\x00\x00\x00\x00W\x91\x03\x00\x00\x00\x00\x00m\x92\x03\x00\x00\x00\x00\x00p\x92\x03\x00\x00\x00\x00\x00q\x92\x03\x00\x00\x00\x00\x00s\x92\x03\x00\x00\x00\x00\x00\x1d\x93\x03\x00\x00\x00\x00\x00'
+    b"\x1e\x93\x03\x00\x00\x00\x00\x00'\x93\x03\x00\x00\x00\x00\x001\x93\x03\x00\x00\x00\x00\x002\x93\x03\x00\x00\x00\x00\x006\x93\x03\x00\x00\x00\x00\x00O\x93\x03\x00\x00\x00\x00\x00P\x93\x03\x00\x00\x00\x00\x00^\x93\x03\x00\x00\x00\x00\x00}\x93\x03\x00\x00\x00\x00\x00\xc4\x93\x03\x00\x00\x00\x00\x00U\x94\x03\x00\x00\x00\x00\x00X\x94\x03\x00\x00\x00\x00\x00"
+    b'\x9e\x94\x03\x00\x00\x00\x00\x00\xc2\x94\x03\x00\x00\x00\x00\x00\xf6\x94\x03\x00\x00\x00\x00\x00\xf7\x94\x03\x00\x00\x00\x00\x00a\x95\x03\x00\x00\x00\x00\x00\x8a\x95\x03\x00\x00\x00\x00\x00\x8b\x95\x03\x00\x00\x00\x00\x00\x8c\x95\x03\x00\x00\x00\x00\x00\xa2\x95\x03\x00\x00\x00\x00\x005\x96\x03\x00\x00\x00\x00\x00B\x96\x03\x00\x00\x00\x00\x00C\x96\x03\x00\x00\x00\x00\x00'
+    b'E\x96\x03\x00\x00\x00\x00\x00F\x96\x03\x00\x00\x00\x00\x00W\x96\x03\x00\x00\x00\x00\x00_\x96\x03\x00\x00\x00\x00\x00g\x96\x03\x00\x00\x00\x00\x001\x98\x03\x00\x00\x00\x00\x00\x1f\x99\x03\x00\x00\x00\x00\x00$\x99\x03\x00\x00\x00\x00\x00k\x99\x03\x00\x00\x00\x00\x00y\x99\x03\x00\x00\x00\x00\x00\xa8\x99\x03\x00\x00\x00\x00\x00\xaf\x99\x03\x00\x00\x00\x00\x00'
+    b'\xde\x9a\x03\x00\x00\x00\x00\x001\x9c\x03\x00\x00\x00\x00\x002\x9c\x03\x00\x00\x00\x00\x003\x9c\x03\x00\x00\x00\x00\x00\x8b\x9c\x03\x00\x00\x00\x00\x00\x1a\x9d\x03\x00\x00\x00\x00\x00\x1b\x9d\x03\x00\x00\x00\x00\x00\x1c\x9d\x03\x00\x00\x00\x00\x00\x1d\x9d\x03\x00\x00\x00\x00\x00\x1e\x9d\x03\x00\x00\x00\x00\x00\x97\x9d\x03\x00\x00\x00\x00\x00\xca\x9d\x03\x00\x00\x00\x00\x00'
+    b'\xd5\x9d\x03\x00\x00\x00\x00\x00\xfb\x9d\x03\x00\x00\x00\x00\x00\xfd\x9d\x03\x00\x00\x00\x00\x00\x15\x9e\x03\x00\x00\x00\x00\x001\x9e\x03\x00\x00\x00\x00\x006\x9e\x03\x00\x00\x00\x00\x00\xb9\x9e\x03\x00\x00\x00\x00\x00\xba\x9e\x03\x00\x00\x00\x00\x00\xcb\x9e\x03\x00\x00\x00\x00\x00\x87\x9f\x03\x00\x00\x00\x00\x00\xf3\x9f\x03\x00\x00\x00\x00\x00\x85\xa0\x03\x00\x00\x00\x00\x00'
+    b'\xb7\xa0\x03\x00\x00\x00\x00\x00\xc2\xa0\x03\x00\x00\x00\x00\x00\xe2\xa0\x03\x00\x00\x00\x00\x00*\xa1\x03\x00\x00\x00\x00\x00+\xa1\x03\x00\x00\x00\x00\x00\xac\xa1\x03\x00\x00\x00\x00\x00\xdc\xa1\x03\x00\x00\x00\x00\x00B\xa3\x03\x00\x00\x00\x00\x00F\xa3\x03\x00\x00\x00\x00\x00g\xa3\x03\x00\x00\x00\x00\x00m\xa3\x03\x00\x00\x00\x00\x00n\xa3\x03\x00\x00\x00\x00\x00'
+    b'\x0e\xa4\x03\x00\x00\x00\x00\x00D\xa4\x03\x00\x00\x00\x00\x00E\xa4\x03\x00\x00\x00\x00\x00g\xa4\x03\x00\x00\x00\x00\x00\xd2\xa4\x03\x00\x00\x00\x00\x00\xfc\xa4\x03\x00\x00\x00\x00\x009\xa5\x03\x00\x00\x00\x00\x00Z\xa5\x03\x00\x00\x00\x00\x00\x89\xa5\x03\x00\x00\x00\x00\x00\x8a\xa5\x03\x00\x00\x00\x00\x00\x8b\xa5\x03\x00\x00\x00\x00\x00\x8c\xa5\x03\x00\x00\x00\x00\x00'
+    b'\xc2\xa5\x03\x00\x00\x00\x00\x00\xdc\xa5\x03\x00\x00\x00\x00\x00\xf8\xa5\x03\x00\x00\x00\x00\x00\xf9\xa5\x03\x00\x00\x00\x00\x00N\xa6\x03\x00\x00\x00\x00\x00Y\xa6\x03\x00\x00\x00\x00\x00\x83\xa6\x03\x00\x00\x00\x00\x00\xb0\xa6\x03\x00\x00\x00\x00\x00\xb1\xa6\x03\x00\x00\x00\x00\x00\xb2\xa6\x03\x00\x00\x00\x00\x00\x10\xa7\x03\x00\x00\x00\x00\x00\x12\xa7\x03\x00\x00\x00\x00\x00'
+    b'S\xa7\x03\x00\x00\x00\x00\x00 \xa8\x03\x00\x00\x00\x00\x00!\xa8\x03\x00\x00\x00\x00\x00"\xa8\x03\x00\x00\x00\x00\x00(\xa8\x03\x00\x00\x00\x00\x00U\xa8\x03\x00\x00\x00\x00\x00\xa6\xa8\x03\x00\x00\x00\x00\x00\x84\xa9\x03\x00\x00\x00\x00\x00j\xaa\x03\x00\x00\x00\x00\x00l\xaa\x03\x00\x00\x00\x00\x00\xcc\xaa\x03\x00\x00\x00\x00\x00\xcd\xaa\x03\x00\x00\x00\x00\x00'
+    b'\x16\xab\x03\x00\x00\x00\x00\x00l\xab\x03\x00\x00\x00\x00\x00m\xab\x03\x00\x00\x00\x00\x00+\xac\x03\x00\x00\x00\x00\x007\xac\x03\x00\x00\x00\x00\x00m\xac\x03\x00\x00\x00\x00\x00n\xac\x03\x00\x00\x00\x00\x00o\xac\x03\x00\x00\x00\x00\x00\x8e\xac\x03\x00\x00\x00\x00\x00\xc7\xac\x03\x00\x00\x00\x00\x00\x82\xad\x03\x00\x00\x00\x00\x00\x83\xad\x03\x00\x00\x00\x00\x00'
+    b'\xb1\xad\x03\x00\x00\x00\x00\x00\xb2\xad\x03\x00\x00\x00\x00\x00\xb4\xad\x03\x00\x00\x00\x00\x00\xb5\xad\x03\x00\x00\x00\x00\x00\xb6\xad\x03\x00\x00\x00\x00\x00\xb7\xad\x03\x00\x00\x00\x00\x00\xb8\xad\x03\x00\x00\x00\x00\x00\xb9\xad\x03\x00\x00\x00\x00\x00\xba\xad\x03\x00\x00\x00\x00\x00\xbb\xad\x03\x00\x00\x00\x00\x00\xbc\xad\x03\x00\x00\x00\x00\x00\xbd\xad\x03\x00\x00\x00\x00\x00'
+    b'\x17\xae\x03\x00\x00\x00\x00\x00y\xae\x03\x00\x00\x00\x00\x00z\xae\x03\x00\x00\x00\x00\x00{\xae\x03\x00\x00\x00\x00\x00}\xae\x03\x00\x00\x00\x00\x00\x94\xaf\x03\x00\x00\x00\x00\x00\xa1\xaf\x03\x00\x00\x00\x00\x00\xcc\xaf\x03\x00\x00\x00\x00\x00\xd9\xaf\x03\x00\x00\x00\x00\x00\xe5\xaf\x03\x00\x00\x00\x00\x00\x1c\xb0\x03\x00\x00\x00\x00\x000\xb0\x03\x00\x00\x00\x00\x00'
+    b'1\xb0\x03\x00\x00\x00\x00\x004\xb0\x03\x00\x00\x00\x00\x00`\xb0\x03\x00\x00\x00\x00\x00h\xb0\x03\x00\x00\x00\x00\x00m\xb0\x03\x00\x00\x00\x00\x00\x7f\xb0\x03\x00\x00\x00\x00\x00\x90\xb0\x03\x00\x00\x00\x00\x00\x97\xb0\x03\x00\x00\x00\x00\x00?\xb1\x03\x00\x00\x00\x00\x00S\xb1\x03\x00\x00\x00\x00\x00W\xb1\x03\x00\x00\x00\x00\x00]\xb1\x03\x00\x00\x00\x00\x00'
+    b'b\xb1\x03\x00\x00\x00\x00\x00\xb7\xb1\x03\x00\x00\x00\x00\x00\xd0\xb1\x03\x00\x00\x00\x00\x00A\xb2\x03\x00\x00\x00\x00\x00I\xb2\x03\x00\x00\x00\x00\x00\xc4\xb2\x03\x00\x00\x00\x00\x00\xe6\xb2\x03\x00\x00\x00\x00\x00=\xb3\x03\x00\x00\x00\x00\x00X\xb3\x03\x00\x00\x00\x00\x00\x83\xb4\x03\x00\x00\x00\x00\x00\xda\xb4\x03\x00\x00\x00\x00\x00\xdf\xb4\x03\x00\x00\x00\x00\x00'
+    b'<\xb5\x03\x00\x00\x00\x00\x00B\xb5\x03\x00\x00\x00\x00\x00C\xb5\x03\x00\x00\x00\x00\x00Y\xb5\x03\x00\x00\x00\x00\x00Z\xb5\x03\x00\x00\x00\x00\x00[\xb5\x03\x00\x00\x00\x00\x00\\\xb5\x03\x00\x00\x00\x00\x00c\xb5\x03\x00\x00\x00\x00\x00d\xb5\x03\x00\x00\x00\x00\x00e\xb5\x03\x00\x00\x00\x00\x00f\xb5\x03\x00\x00\x00\x00\x00h\xb5\x03\x00\x00\x00\x00\x00'
+    b'i\xb5\x03\x00\x00\x00\x00\x00j\xb5\x03\x00\x00\x00\x00\x00k\xb5\x03\x00\x00\x00\x00\x00\xa0\xb5\x03\x00\x00\x00\x00\x00\xf9\xb5\x03\x00\x00\x00\x00\x00#\xb6\x03\x00\x00\x00\x00\x00W\xb6\x03\x00\x00\x00\x00\x00\x05\xb7\x03\x00\x00\x00\x00\x00\x1b\xb7\x03\x00\x00\x00\x00\x00C\xb7\x03\x00\x00\x00\x00\x00{\xb7\x03\x00\x00\x00\x00\x00\xd0\xb7\x03\x00\x00\x00\x00\x00'
+    b'+\xb8\x03\x00\x00\x00\x00\x00\xb7\xb8\x03\x00\x00\x00\x00\x00\xe3\xb8\x03\x00\x00\x00\x00\x00\xec\xb8\x03\x00\x00\x00\x00\x00\x19\xba\x03\x00\x00\x00\x00\x00y\xba\x03\x00\x00\x00\x00\x00\xa9\xba\x03\x00\x00\x00\x00\x00\xaf\xba\x03\x00\x00\x00\x00\x00\xbb\xba\x03\x00\x00\x00\x00\x00\xbc\xba\x03\x00\x00\x00\x00\x00\xbd\xba\x03\x00\x00\x00\x00\x00\xc7\xba\x03\x00\x00\x00\x00\x00'
+    b'\xe0\xba\x03\x00\x00\x00\x00\x00\xe2\xba\x03\x00\x00\x00\x00\x00\xe3\xba\x03\x00\x00\x00\x00\x00u\xbb\x03\x00\x00\x00\x00\x00\xd3\xbb\x03\x00\x00\x00\x00\x00\xd5\xbb\x03\x00\x00\x00\x00\x00\xd6\xbb\x03\x00\x00\x00\x00\x00\xdb\xbb\x03\x00\x00\x00\x00\x00\x10\xbc\x03\x00\x00\x00\x00\x00\x17\xbc\x03\x00\x00\x00\x00\x00\x95\xbc\x03\x00\x00\x00\x00\x00L\xbd\x03\x00\x00\x00\x00\x00'
+    b'\x8c\xbd\x03\x00\x00\x00\x00\x00\x8d\xbd\x03\x00\x00\x00\x00\x00\x9a\xbd\x03\x00\x00\x00\x00\x00\xe0\xbd\x03\x00\x00\x00\x00\x00\xfe\xbd\x03\x00\x00\x00\x00\x00\x00\xbe\x03\x00\x00\x00\x00\x00\x03\xbe\x03\x00\x00\x00\x00\x00\x04\xbe\x03\x00\x00\x00\x00\x00?\xbe\x03\x00\x00\x00\x00\x00]\xbe\x03\x00\x00\x00\x00\x00\xd8\xbe\x03\x00\x00\x00\x00\x00\xde\xbe\x03\x00\x00\x00\x00\x00'
+    b'\xe5\xbe\x03\x00\x00\x00\x00\x00\xe7\xbe\x03\x00\x00\x00\x00\x00\xe8\xbe\x03\x00\x00\x00\x00\x00\xe9\xbe\x03\x00\x00\x00\x00\x00\xeb\xbe\x03\x00\x00\x00\x00\x00\xec\xbe\x03\x00\x00\x00\x00\x00\xed\xbe\x03\x00\x00\x00\x00\x00\xee\xbe\x03\x00\x00\x00\x00\x00\xef\xbe\x03\x00\x00\x00\x00\x00\x0b\xbf\x03\x00\x00\x00\x00\x004\xbf\x03\x00\x00\x00\x00\x00:\xbf\x03\x00\x00\x00\x00\x00'
+    b'S\xbf\x03\x00\x00\x00\x00\x00t\xbf\x03\x00\x00\x00\x00\x00\x8b\xbf\x03\x00\x00\x00\x00\x00\xc7\xbf\x03\x00\x00\x00\x00\x00\xfa\xbf\x03\x00\x00\x00\x00\x00I\xc0\x03\x00\x00\x00\x00\x00T\xc0\x03\x00\x00\x00\x00\x00[\xc0\x03\x00\x00\x00\x00\x00\xdc\xc0\x03\x00\x00\x00\x00\x00\xde\xc0\x03\x00\x00\x00\x00\x00\xee\xc0\x03\x00\x00\x00\x00\x00\xf6\xc0\x03\x00\x00\x00\x00\x00'
+    b'.\xc1\x03\x00\x00\x00\x00\x00b\xc1\x03\x00\x00\x00\x00\x00o\xc2\x03\x00\x00\x00\x00\x00\x8c\xc2\x03\x00\x00\x00\x00\x00\x8d\xc2\x03\x00\x00\x00\x00\x00\x8e\xc2\x03\x00\x00\x00\x00\x00\xd6\xc2\x03\x00\x00\x00\x00\x00\xd7\xc2\x03\x00\x00\x00\x00\x00\xd9\xc2\x03\x00\x00\x00\x00\x00\xe6\xc2\x03\x00\x00\x00\x00\x00\xe7\xc2\x03\x00\x00\x00\x00\x00\xf2\xc2\x03\x00\x00\x00\x00\x00'
+    b'\xf4\xc2\x03\x00\x00\x00\x00\x00A\xc3\x03\x00\x00\x00\x00\x00b\xc3\x03\x00\x00\x00\x00\x00k\xc3\x03\x00\x00\x00\x00\x00q\xc3\x03\x00\x00\x00\x00\x00\xee\xc3\x03\x00\x00\x00\x00\x00\x0c\xc4\x03\x00\x00\x00\x00\x00L\xc4\x03\x00\x00\x00\x00\x00t\xc4\x03\x00\x00\x00\x00\x00\x90\xc4\x03\x00\x00\x00\x00\x00\xac\xc4\x03\x00\x00\x00\x00\x00y\xc5\x03\x00\x00\x00\x00\x00'
+    b'{\xc5\x03\x00\x00\x00\x00\x00|\xc5\x03\x00\x00\x00\x00\x00}\xc5\x03\x00\x00\x00\x00\x00~\xc5\x03\x00\x00\x00\x00\x00\x7f\xc5\x03\x00\x00\x00\x00\x00\x80\xc5\x03\x00\x00\x00\x00\x00\x81\xc5\x03\x00\x00\x00\x00\x00\x82\xc5\x03\x00\x00\x00\x00\x00\x89\xc5\x03\x00\x00\x00\x00\x00\x8a\xc5\x03\x00\x00\x00\x00\x00\x8b\xc5\x03\x00\x00\x00\x00\x00\xdb\xc5\x03\x00\x00\x00\x00\x00'
+    b'\xef\xc5\x03\x00\x00\x00\x00\x00\r\xc6\x03\x00\x00\x00\x00\x00\x0e\xc6\x03\x00\x00\x00\x00\x00\x0f\xc6\x03\x00\x00\x00\x00\x00$\xc6\x03\x00\x00\x00\x00\x00j\xc6\x03\x00\x00\x00\x00\x00l\xc6\x03\x00\x00\x00\x00\x00w\xc6\x03\x00\x00\x00\x00\x00y\xc6\x03\x00\x00\x00\x00\x006\xc7\x03\x00\x00\x00\x00\x007\xc7\x03\x00\x00\x00\x00\x00\xae\xc7\x03\x00\x00\x00\x00\x00'
+    b'4\xc8\x03\x00\x00\x00\x00\x007\xc8\x03\x00\x00\x00\x00\x00D\xc8\x03\x00\x00\x00\x00\x00Y\xc8\x03\x00\x00\x00\x00\x00[\xc8\x03\x00\x00\x00\x00\x00e\xc8\x03\x00\x00\x00\x00\x00u\xc8\x03\x00\x00\x00\x00\x00v\xc8\x03\x00\x00\x00\x00\x00\xcd\xc8\x03\x00\x00\x00\x00\x00A\xc9\x03\x00\x00\x00\x00\x00G\xc9\x03\x00\x00\x00\x00\x00S\xc9\x03\x00\x00\x00\x00\x00'
+    b'T\xc9\x03\x00\x00\x00\x00\x00_\xc9\x03\x00\x00\x00\x00\x00\xd6\xc9\x03\x00\x00\x00\x00\x00\xd7\xc9\x03\x00\x00\x00\x00\x00\xdf\xc9\x03\x00\x00\x00\x00\x00\xe0\xc9\x03\x00\x00\x00\x00\x00,\xca\x03\x00\x00\x00\x00\x00\xbc\xca\x03\x00\x00\x00\x00\x00\xd4\xca\x03\x00\x00\x00\x00\x00\xd5\xca\x03\x00\x00\x00\x00\x00\xd6\xca\x03\x00\x00\x00\x00\x00\xd7\xca\x03\x00\x00\x00\x00\x00'
+    b'-\xcb\x03\x00\x00\x00\x00\x00\x9f\xcb\x03\x00\x00\x00\x00\x00\xb2\xcb\x03\x00\x00\x00\x00\x00\xb3\xcb\x03\x00\x00\x00\x00\x00\xb4\xcb\x03\x00\x00\x00\x00\x00\xb5\xcb\x03\x00\x00\x00\x00\x00\xb7\xcb\x03\x00\x00\x00\x00\x00\xc2\xcb\x03\x00\x00\x00\x00\x00\xe2\xcb\x03\x00\x00\x00\x00\x00\xf6\xcb\x03\x00\x00\x00\x00\x00\x02\xcc\x03\x00\x00\x00\x00\x00\x03\xcc\x03\x00\x00\x00\x00\x00'
+    b'\x04\xcc\x03\x00\x00\x00\x00\x00|\xcc\x03\x00\x00\x00\x00\x00~\xcc\x03\x00\x00\x00\x00\x00\x7f\xcc\x03\x00\x00\x00\x00\x00\xa2\xcc\x03\x00\x00\x00\x00\x00\xb6\xcc\x03\x00\x00\x00\x00\x00\xb7\xcc\x03\x00\x00\x00\x00\x00R\xcd\x03\x00\x00\x00\x00\x00W\xcd\x03\x00\x00\x00\x00\x00[\xcd\x03\x00\x00\x00\x00\x00i\xcd\x03\x00\x00\x00\x00\x00j\xcd\x03\x00\x00\x00\x00\x00'
+    b't\xcd\x03\x00\x00\x00\x00\x00\x05\xce\x03\x00\x00\x00\x00\x00M\xce\x03\x00\x00\x00\x00\x00N\xce\x03\x00\x00\x00\x00\x00\x88\xce\x03\x00\x00\x00\x00\x00\xa3\xce\x03\x00\x00\x00\x00\x00\xdc\xce\x03\x00\x00\x00\x00\x00I\xcf\x03\x00\x00\x00\x00\x00J\xcf\x03\x00\x00\x00\x00\x00K\xcf\x03\x00\x00\x00\x00\x00L\xcf\x03\x00\x00\x00\x00\x00\xac\xcf\x03\x00\x00\x00\x00\x00'
+    b'\xae\xcf\x03\x00\x00\x00\x00\x00\xb4\xcf\x03\x00\x00\x00\x00\x00\xbc\xcf\x03\x00\x00\x00\x00\x00\xee\xcf\x03\x00\x00\x00\x00\x00\x12\xd0\x03\x00\x00\x00\x00\x009\xd0\x03\x00\x00\x00\x00\x00:\xd0\x03\x00\x00\x00\x00\x00;\xd0\x03\x00\x00\x00\x00\x00<\xd0\x03\x00\x00\x00\x00\x00>\xd0\x03\x00\x00\x00\x00\x00\xe0\xd0\x03\x00\x00\x00\x00\x00&\xd1\x03\x00\x00\x00\x00\x00'
+    b's\xd1\x03\x00\x00\x00\x00\x00\x84\xd1\x03\x00\x00\x00\x00\x00\xda\xd1\x03\x00\x00\x00\x00\x00\xec\xd1\x03\x00\x00\x00\x00\x00\x0f\xd2\x03\x00\x00\x00\x00\x00\x10\xd2\x03\x00\x00\x00\x00\x00p\xd2\x03\x00\x00\x00\x00\x00q\xd2\x03\x00\x00\x00\x00\x00|\xd2\x03\x00\x00\x00\x00\x00}\xd2\x03\x00\x00\x00\x00\x00~\xd2\x03\x00\x00\x00\x00\x00\x7f\xd2\x03\x00\x00\x00\x00\x00'
+    b'\x94\xd2\x03\x00\x00\x00\x00\x00\xa7\xd2\x03\x00\x00\x00\x00\x00\xa8\xd2\x03\x00\x00\x00\x00\x00\xa9\xd2\x03\x00\x00\x00\x00\x00\xaa\xd2\x03\x00\x00\x00\x00\x00\xbe\xd2\x03\x00\x00\x00\x00\x00\xbf\xd2\x03\x00\x00\x00\x00\x00\xc0\xd2\x03\x00\x00\x00\x00\x00\xc1\xd2\x03\x00\x00\x00\x00\x00\xc2\xd2\x03\x00\x00\x00\x00\x00\xc3\xd2\x03\x00\x00\x00\x00\x00\xc4\xd2\x03\x00\x00\x00\x00\x00'
+    b'\xc5\xd2\x03\x00\x00\x00\x00\x00\xc6\xd2\x03\x00\x00\x00\x00\x00\xc8\xd2\x03\x00\x00\x00\x00\x00\xcb\xd2\x03\x00\x00\x00\x00\x00\xcc\xd2\x03\x00\x00\x00\x00\x00\xcd\xd2\x03\x00\x00\x00\x00\x00\xce\xd2\x03\x00\x00\x00\x00\x00\xcf\xd2\x03\x00\x00\x00\x00\x00\xd0\xd2\x03\x00\x00\x00\x00\x00\xd1\xd2\x03\x00\x00\x00\x00\x00\xe7\xd2\x03\x00\x00\x00\x00\x00\xee\xd2\x03\x00\x00\x00\x00\x00'
+    b"\xf4\xd2\x03\x00\x00\x00\x00\x00\xf9\xd2\x03\x00\x00\x00\x00\x00\xfe\xd2\x03\x00\x00\x00\x00\x00\x04\xd3\x03\x00\x00\x00\x00\x00'\xd3\x03\x00\x00\x00\x00\x00(\xd3\x03\x00\x00\x00\x00\x00:\xd3\x03\x00\x00\x00\x00\x00F\xd3\x03\x00\x00\x00\x00\x00n\xd3\x03\x00\x00\x00\x00\x00\x85\xd3\x03\x00\x00\x00\x00\x00\xca\xd3\x03\x00\x00\x00\x00\x00\xd9\xd3\x03\x00\x00\x00\x00\x00"
+    b'\xda\xd3\x03\x00\x00\x00\x00\x00\xdb\xd3\x03\x00\x00\x00\x00\x00\xec\xd3\x03\x00\x00\x00\x00\x00\x06\xd4\x03\x00\x00\x00\x00\x00\x0b\xd4\x03\x00\x00\x00\x00\x00\r\xd4\x03\x00\x00\x00\x00\x00]\xd4\x03\x00\x00\x00\x00\x00b\xd4\x03\x00\x00\x00\x00\x00\x80\xd4\x03\x00\x00\x00\x00\x00\x8c\xd4\x03\x00\x00\x00\x00\x00\xc1\xd4\x03\x00\x00\x00\x00\x00\xd6\xd4\x03\x00\x00\x00\x00\x00'
+    b'\xd7\xd4\x03\x00\x00\x00\x00\x00\xd8\xd4\x03\x00\x00\x00\x00\x00,\xd5\x03\x00\x00\x00\x00\x002\xd5\x03\x00\x00\x00\x00\x004\xd5\x03\x00\x00\x00\x00\x00y\xd5\x03\x00\x00\x00\x00\x00z\xd5\x03\x00\x00\x00\x00\x00|\xd5\x03\x00\x00\x00\x00\x00}\xd5\x03\x00\x00\x00\x00\x00\x7f\xd5\x03\x00\x00\x00\x00\x00@\xd6\x03\x00\x00\x00\x00\x00V\xd6\x03\x00\x00\x00\x00\x00'
+    b'W\xd6\x03\x00\x00\x00\x00\x00\xfa\xd6\x03\x00\x00\x00\x00\x00"\xd7\x03\x00\x00\x00\x00\x00@\xd7\x03\x00\x00\x00\x00\x00J\xd7\x03\x00\x00\x00\x00\x00K\xd7\x03\x00\x00\x00\x00\x00[\xd7\x03\x00\x00\x00\x00\x00k\xd7\x03\x00\x00\x00\x00\x00\x94\xd7\x03\x00\x00\x00\x00\x00\xd7\xd7\x03\x00\x00\x00\x00\x00\xd8\xd7\x03\x00\x00\x00\x00\x00\xde\xd7\x03\x00\x00\x00\x00\x00'
+    b'\xdf\xd7\x03\x00\x00\x00\x00\x00\xe0\xd7\x03\x00\x00\x00\x00\x00\xe1\xd7\x03\x00\x00\x00\x00\x00\xe2\xd7\x03\x00\x00\x00\x00\x00\xe3\xd7\x03\x00\x00\x00\x00\x00E\xd8\x03\x00\x00\x00\x00\x00S\xd8\x03\x00\x00\x00\x00\x00V\xd8\x03\x00\x00\x00\x00\x00\xb6\xd8\x03\x00\x00\x00\x00\x00\xb8\xd8\x03\x00\x00\x00\x00\x00\xda\xd8\x03\x00\x00\x00\x00\x00\xdb\xd8\x03\x00\x00\x00\x00\x00'
+    b'\x08\xd9\x03\x00\x00\x00\x00\x00>\xd9\x03\x00\x00\x00\x00\x00X\xd9\x03\x00\x00\x00\x00\x00\\\xd9\x03\x00\x00\x00\x00\x00]\xd9\x03\x00\x00\x00\x00\x00^\xd9\x03\x00\x00\x00\x00\x00_\xd9\x03\x00\x00\x00\x00\x00`\xd9\x03\x00\x00\x00\x00\x00a\xd9\x03\x00\x00\x00\x00\x00b\xd9\x03\x00\x00\x00\x00\x00c\xd9\x03\x00\x00\x00\x00\x00d\xd9\x03\x00\x00\x00\x00\x00'
+    b'e\xd9\x03\x00\x00\x00\x00\x00f\xd9\x03\x00\x00\x00\x00\x00g\xd9\x03\x00\x00\x00\x00\x00h\xd9\x03\x00\x00\x00\x00\x00i\xd9\x03\x00\x00\x00\x00\x00j\xd9\x03\x00\x00\x00\x00\x00k\xd9\x03\x00\x00\x00\x00\x00l\xd9\x03\x00\x00\x00\x00\x00v\xd9\x03\x00\x00\x00\x00\x00$\xda\x03\x00\x00\x00\x00\x00[\xda\x03\x00\x00\x00\x00\x00^\xda\x03\x00\x00\x00\x00\x00'
+    b'c\xda\x03\x00\x00\x00\x00\x00r\xda\x03\x00\x00\x00\x00\x005\xdb\x03\x00\x00\x00\x00\x006\xdb\x03\x00\x00\x00\x00\x00\xc5\xdb\x03\x00\x00\x00\x00\x00\xc9\xdb\x03\x00\x00\x00\x00\x00\xcb\xdb\x03\x00\x00\x00\x00\x00\xec\xdb\x03\x00\x00\x00\x00\x00#\xdc\x03\x00\x00\x00\x00\x008\xdc\x03\x00\x00\x00\x00\x00\x8e\xdc\x03\x00\x00\x00\x00\x00\xb1\xdc\x03\x00\x00\x00\x00\x00'
+    b'\xd4\xdc\x03\x00\x00\x00\x00\x00\xe9\xdc\x03\x00\x00\x00\x00\x00\xea\xdc\x03\x00\x00\x00\x00\x00\xeb\xdc\x03\x00\x00\x00\x00\x006\xdd\x03\x00\x00\x00\x00\x00V\xdd\x03\x00\x00\x00\x00\x00W\xdd\x03\x00\x00\x00\x00\x00\x8f\xdd\x03\x00\x00\x00\x00\x00\x9f\xdd\x03\x00\x00\x00\x00\x00\xef\xdd\x03\x00\x00\x00\x00\x00F\xde\x03\x00\x00\x00\x00\x00\xa9\xde\x03\x00\x00\x00\x00\x00'
+    b'\xc5\xde\x03\x00\x00\x00\x00\x00\xe7\xde\x03\x00\x00\x00\x00\x00\xe9\xde\x03\x00\x00\x00\x00\x00\xed\xde\x03\x00\x00\x00\x00\x00\x02\xdf\x03\x00\x00\x00\x00\x00\x13\xdf\x03\x00\x00\x00\x00\x00X\xdf\x03\x00\x00\x00\x00\x00\x93\xdf\x03\x00\x00\x00\x00\x00\x95\xdf\x03\x00\x00\x00\x00\x00\xaa\xdf\x03\x00\x00\x00\x00\x00\xe8\xdf\x03\x00\x00\x00\x00\x00\x04\xe0\x03\x00\x00\x00\x00\x00'
+    b'\x05\xe0\x03\x00\x00\x00\x00\x00\x08\xe0\x03\x00\x00\x00\x00\x00\t\xe0\x03\x00\x00\x00\x00\x00\n\xe0\x03\x00\x00\x00\x00\x00\x0b\xe0\x03\x00\x00\x00\x00\x00v\xe0\x03\x00\x00\x00\x00\x00\x7f\xe0\x03\x00\x00\x00\x00\x00\x80\xe0\x03\x00\x00\x00\x00\x00\x9e\xe0\x03\x00\x00\x00\x00\x00\xc3\xe0\x03\x00\x00\x00\x00\x00\xe1\xe0\x03\x00\x00\x00\x00\x00\x06\xe1\x03\x00\x00\x00\x00\x00'
+    b'\x7f\xe1\x03\x00\x00\x00\x00\x00\x81\xe1\x03\x00\x00\x00\x00\x00\x91\xe1\x03\x00\x00\x00\x00\x00\xbd\xe1\x03\x00\x00\x00\x00\x00@\xe2\x03\x00\x00\x00\x00\x00A\xe2\x03\x00\x00\x00\x00\x00\x99\xe2\x03\x00\x00\x00\x00\x00Q\xe3\x03\x00\x00\x00\x00\x00\xb5\xe3\x03\x00\x00\x00\x00\x00\xc5\xe3\x03\x00\x00\x00\x00\x00\xc8\xe3\x03\x00\x00\x00\x00\x00\xf2\xe3\x03\x00\x00\x00\x00\x00'
+    b'1\xe4\x03\x00\x00\x00\x00\x00Q\xe4\x03\x00\x00\x00\x00\x00U\xe4\x03\x00\x00\x00\x00\x00j\xe4\x03\x00\x00\x00\x00\x00\xd9\xe4\x03\x00\x00\x00\x00\x00\xda\xe4\x03\x00\x00\x00\x00\x00\x1a\xe5\x03\x00\x00\x00\x00\x00\x1b\xe5\x03\x00\x00\x00\x00\x00&\xe5\x03\x00\x00\x00\x00\x00c\xe5\x03\x00\x00\x00\x00\x00\x84\xe5\x03\x00\x00\x00\x00\x00L\xe9\x03\x00\x00\x00\x00\x00'
+    b'b\xe9\x03\x00\x00\x00\x00\x00k\xe9\x03\x00\x00\x00\x00\x00\xce\xe9\x03\x00\x00\x00\x00\x00\xcf\xe9\x03\x00\x00\x00\x00\x00\xd0\xe9\x03\x00\x00\x00\x00\x00\xd1\xe9\x03\x00\x00\x00\x00\x00\xd2\xe9\x03\x00\x00\x00\x00\x00\xf2\xe9\x03\x00\x00\x00\x00\x00\x17\xea\x03\x00\x00\x00\x00\x00*\xea\x03\x00\x00\x00\x00\x005\xea\x03\x00\x00\x00\x00\x00F\xea\x03\x00\x00\x00\x00\x00'
+    b'\x86\xea\x03\x00\x00\x00\x00\x00\xa6\xea\x03\x00\x00\x00\x00\x00\xa7\xea\x03\x00\x00\x00\x00\x00\r\xeb\x03\x00\x00\x00\x00\x00n\xeb\x03\x00\x00\x00\x00\x00o\xeb\x03\x00\x00\x00\x00\x00\x98\xeb\x03\x00\x00\x00\x00\x00\xb3\xeb\x03\x00\x00\x00\x00\x00D\xec\x03\x00\x00\x00\x00\x00K\xec\x03\x00\x00\x00\x00\x00y\xec\x03\x00\x00\x00\x00\x00z\xec\x03\x00\x00\x00\x00\x00'
+    b'~\xec\x03\x00\x00\x00\x00\x00\x12\xed\x03\x00\x00\x00\x00\x007\xed\x03\x00\x00\x00\x00\x008\xed\x03\x00\x00\x00\x00\x009\xed\x03\x00\x00\x00\x00\x00`\xed\x03\x00\x00\x00\x00\x00\x98\xed\x03\x00\x00\x00\x00\x00Z\xee\x03\x00\x00\x00\x00\x00d\xee\x03\x00\x00\x00\x00\x00e\xee\x03\x00\x00\x00\x00\x00h\xee\x03\x00\x00\x00\x00\x00\xfb\xee\x03\x00\x00\x00\x00\x00'
+    b'\xcb\xef\x03\x00\x00\x00\x00\x00\x01\xf0\x03\x00\x00\x00\x00\x00\x03\xf0\x03\x00\x00\x00\x00\x00\x1b\xf0\x03\x00\x00\x00\x00\x00\xb2\xf0\x03\x00\x00\x00\x00\x00\xc6\xf0\x03\x00\x00\x00\x00\x00\xcd\xf0\x03\x00\x00\x00\x00\x00%\xf1\x03\x00\x00\x00\x00\x00=\xf1\x03\x00\x00\x00\x00\x00\x98\xf1\x03\x00\x00\x00\x00\x00\x9f\xf1\x03\x00\x00\x00\x00\x00\xa9\xf1\x03\x00\x00\x00\x00\x00'
+    b'\x1e\xf2\x03\x00\x00\x00\x00\x00t\xf2\x03\x00\x00\x00\x00\x00u\xf2\x03\x00\x00\x00\x00\x00\x81\xf2\x03\x00\x00\x00\x00\x00\xc5\xf2\x03\x00\x00\x00\x00\x00\x0e\xf3\x03\x00\x00\x00\x00\x00$\xf3\x03\x00\x00\x00\x00\x00<\xf3\x03\x00\x00\x00\x00\x00_\xf3\x03\x00\x00\x00\x00\x00s\xf3\x03\x00\x00\x00\x00\x00\x9d\xf5\x03\x00\x00\x00\x00\x00\x9f\xf5\x03\x00\x00\x00\x00\x00'
+    b'\xa0\xf5\x03\x00\x00\x00\x00\x00\xa2\xf5\x03\x00\x00\x00\x00\x00\xa3\xf5\x03\x00\x00\x00\x00\x00\xa4\xf5\x03\x00\x00\x00\x00\x00\xa5\xf5\x03\x00\x00\x00\x00\x00\xa6\xf5\x03\x00\x00\x00\x00\x00\xa8\xf5\x03\x00\x00\x00\x00\x00\xa9\xf5\x03\x00\x00\x00\x00\x00\xaa\xf5\x03\x00\x00\x00\x00\x00"\xf6\x03\x00\x00\x00\x00\x00,\xf6\x03\x00\x00\x00\x00\x000\xf6\x03\x00\x00\x00\x00\x00'
+    b'\xd3\xf6\x03\x00\x00\x00\x00\x00S\xf7\x03\x00\x00\x00\x00\x00d\xf7\x03\x00\x00\x00\x00\x00\xb6\xf7\x03\x00\x00\x00\x00\x00\xc5\xf7\x03\x00\x00\x00\x00\x00\xc6\xf7\x03\x00\x00\x00\x00\x00b\xfa\x03\x00\x00\x00\x00\x00d\xfa\x03\x00\x00\x00\x00\x00e\xfa\x03\x00\x00\x00\x00\x00f\xfa\x03\x00\x00\x00\x00\x00Y\xfc\x03\x00\x00\x00\x00\x00\xba\xfc\x03\x00\x00\x00\x00\x00'
+    b'\xd7\xfc\x03\x00\x00\x00\x00\x00\x84\xfd\x03\x00\x00\x00\x00\x00\x14\xfe\x03\x00\x00\x00\x00\x00\xeb\xfe\x03\x00\x00\x00\x00\x00\xa1\xff\x03\x00\x00\x00\x00\x00\xf0\xff\x03\x00\x00\x00\x00\x00\xf1\xff\x03\x00\x00\x00\x00\x00\xf2\xff\x03\x00\x00\x00\x00\x00\xf3\xff\x03\x00\x00\x00\x00\x00\xf5\xff\x03\x00\x00\x00\x00\x00\xf6\xff\x03\x00\x00\x00\x00\x00\xf7\xff\x03\x00\x00\x00\x00\x00'
+    b'\xf8\xff\x03\x00\x00\x00\x00\x00\xf9\xff\x03\x00\x00\x00\x00\x00\xfa\xff\x03\x00\x00\x00\x00\x00\xfb\xff\x03\x00\x00\x00\x00\x00\xfc\xff\x03\x00\x00\x00\x00\x00\xfd\xff\x03\x00\x00\x00\x00\x00\xff\xff\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00@\x00\x04\x00\x00\x00\x00\x00H\x00\x04\x00\x00\x00\x00\x00O\x00\x04\x00\x00\x00\x00\x00\x9f\x00\x04\x00\x00\x00\x00\x00'
+    b'\xd0\x00\x04\x00\x00\x00\x00\x00\xfa\x02\x04\x00\x00\x00\x00\x00\x02\x03\x04\x00\x00\x00\x00\x00\x03\x03\x04\x00\x00\x00\x00\x00\x04\x03\x04\x00\x00\x00\x00\x00\x05\x03\x04\x00\x00\x00\x00\x00\x06\x03\x04\x00\x00\x00\x00\x00\x07\x03\x04\x00\x00\x00\x00\x00V\x04\x04\x00\x00\x00\x00\x00\x85\x04\x04\x00\x00\x00\x00\x00\xbe\x05\x04\x00\x00\x00\x00\x00\xe5\x05\x04\x00\x00\x00\x00\x00'
+    b'\xef\x05\x04\x00\x00\x00\x00\x00\xf2\x05\x04\x00\x00\x00\x00\x00\xf3\x05\x04\x00\x00\x00\x00\x00K\x06\x04\x00\x00\x00\x00\x00T\x06\x04\x00\x00\x00\x00\x00W\x06\x04\x00\x00\x00\x00\x00\x9f\x06\x04\x00\x00\x00\x00\x00\xd8\x06\x04\x00\x00\x00\x00\x00\xda\x06\x04\x00\x00\x00\x00\x00\xeb\x06\x04\x00\x00\x00\x00\x00r\x07\x04\x00\x00\x00\x00\x00\xaa\x08\x04\x00\x00\x00\x00\x00'
+    b'\xab\x08\x04\x00\x00\x00\x00\x00\xac\x08\x04\x00\x00\x00\x00\x00\xad\x08\x04\x00\x00\x00\x00\x00\xae\x08\x04\x00\x00\x00\x00\x00\xaf\x08\x04\x00\x00\x00\x00\x00\xb0\x08\x04\x00\x00\x00\x00\x00\xb1\x08\x04\x00\x00\x00\x00\x00\xb2\x08\x04\x00\x00\x00\x00\x00\xb3\x08\x04\x00\x00\x00\x00\x00\xb4\x08\x04\x00\x00\x00\x00\x00\xb5\x08\x04\x00\x00\x00\x00\x00\xb6\x08\x04\x00\x00\x00\x00\x00'
+    b'\xb7\x08\x04\x00\x00\x00\x00\x00\xb8\x08\x04\x00\x00\x00\x00\x00\xb9\x08\x04\x00\x00\x00\x00\x00\xba\x08\x04\x00\x00\x00\x00\x00\xbb\x08\x04\x00\x00\x00\x00\x00\xbc\x08\x04\x00\x00\x00\x00\x00\xbd\x08\x04\x00\x00\x00\x00\x00\xbe\x08\x04\x00\x00\x00\x00\x00\xbf\x08\x04\x00\x00\x00\x00\x00\xc0\x08\x04\x00\x00\x00\x00\x00\xc1\x08\x04\x00\x00\x00\x00\x00\xc2\x08\x04\x00\x00\x00\x00\x00'
+    b'\xc3\x08\x04\x00\x00\x00\x00\x00\xc4\x08\x04\x00\x00\x00\x00\x00\xc5\x08\x04\x00\x00\x00\x00\x00\xc6\x08\x04\x00\x00\x00\x00\x00\xc7\x08\x04\x00\x00\x00\x00\x00\xc8\x08\x04\x00\x00\x00\x00\x00\xc9\x08\x04\x00\x00\x00\x00\x00\xca\x08\x04\x00\x00\x00\x00\x00\xcb\x08\x04\x00\x00\x00\x00\x00\xcc\x08\x04\x00\x00\x00\x00\x00\xcd\x08\x04\x00\x00\x00\x00\x00\xce\x08\x04\x00\x00\x00\x00\x00'
+    b'\xcf\x08\x04\x00\x00\x00\x00\x00\xd0\x08\x04\x00\x00\x00\x00\x00\xd1\x08\x04\x00\x00\x00\x00\x00\xd2\x08\x04\x00\x00\x00\x00\x00\xd3\x08\x04\x00\x00\x00\x00\x00\xd4\x08\x04\x00\x00\x00\x00\x00\xd5\x08\x04\x00\x00\x00\x00\x00\xd6\x08\x04\x00\x00\x00\x00\x00\xd8\x08\x04\x00\x00\x00\x00\x00\xd9\x08\x04\x00\x00\x00\x00\x00\xda\x08\x04\x00\x00\x00\x00\x00\xdb\x08\x04\x00\x00\x00\x00\x00'
+    b'\xdc\x08\x04\x00\x00\x00\x00\x00\x1a\t\x04\x00\x00\x00\x00\x00C\t\x04\x00\x00\x00\x00\x00H\t\x04\x00\x00\x00\x00\x00X\t\x04\x00\x00\x00\x00\x00_\t\x04\x00\x00\x00\x00\x00e\t\x04\x00\x00\x00\x00\x00r\t\x04\x00\x00\x00\x00\x00\x1e\n\x04\x00\x00\x00\x00\x00>\n\x04\x00\x00\x00\x00\x00?\n\x04\x00\x00\x00\x00\x00@\n\x04\x00\x00\x00\x00\x00'
+    b'A\n\x04\x00\x00\x00\x00\x00Q\n\x04\x00\x00\x00\x00\x00R\n\x04\x00\x00\x00\x00\x00?\x0b\x04\x00\x00\x00\x00\x00\x8b\x0b\x04\x00\x00\x00\x00\x00\x8e\x0b\x04\x00\x00\x00\x00\x00\x8f\x0b\x04\x00\x00\x00\x00\x00\x92\x0b\x04\x00\x00\x00\x00\x00s\x0c\x04\x00\x00\x00\x00\x009\x0e\x04\x00\x00\x00\x00\x00j\x10\x04\x00\x00\x00\x00\x00\x8c\x10\x04\x00\x00\x00\x00\x00'
+    b'\x8d\x10\x04\x00\x00\x00\x00\x00D\x11\x04\x00\x00\x00\x00\x00E\x11\x04\x00\x00\x00\x00\x00t\x12\x04\x00\x00\x00\x00\x00(\x13\x04\x00\x00\x00\x00\x004\x13\x04\x00\x00\x00\x00\x005\x13\x04\x00\x00\x00\x00\x006\x13\x04\x00\x00\x00\x00\x007\x13\x04\x00\x00\x00\x00\x00J\x13\x04\x00\x00\x00\x00\x00K\x13\x04\x00\x00\x00\x00\x00a\x13\x04\x00\x00\x00\x00\x00'
+    b']\x14\x04\x00\x00\x00\x00\x00\xd6\x14\x04\x00\x00\x00\x00\x00\x16\x15\x04\x00\x00\x00\x00\x00\x17\x15\x04\x00\x00\x00\x00\x00\x18\x15\x04\x00\x00\x00\x00\x00\x19\x15\x04\x00\x00\x00\x00\x00\x1a\x15\x04\x00\x00\x00\x00\x00\x1b\x15\x04\x00\x00\x00\x00\x00\x1c\x15\x04\x00\x00\x00\x00\x00\x1d\x15\x04\x00\x00\x00\x00\x00\x1e\x15\x04\x00\x00\x00\x00\x00\x1f\x15\x04\x00\x00\x00\x00\x00'
+    b' \x15\x04\x00\x00\x00\x00\x00!\x15\x04\x00\x00\x00\x00\x00"\x15\x04\x00\x00\x00\x00\x00#\x15\x04\x00\x00\x00\x00\x00$\x15\x04\x00\x00\x00\x00\x00%\x15\x04\x00\x00\x00\x00\x00&\x15\x04\x00\x00\x00\x00\x00\'\x15\x04\x00\x00\x00\x00\x00(\x15\x04\x00\x00\x00\x00\x00)\x15\x04\x00\x00\x00\x00\x00*\x15\x04\x00\x00\x00\x00\x00+\x15\x04\x00\x00\x00\x00\x00'
+    b',\x15\x04\x00\x00\x00\x00\x00-\x15\x04\x00\x00\x00\x00\x00.\x15\x04\x00\x00\x00\x00\x00/\x15\x04\x00\x00\x00\x00\x000\x15\x04\x00\x00\x00\x00\x001\x15\x04\x00\x00\x00\x00\x002\x15\x04\x00\x00\x00\x00\x003\x15\x04\x00\x00\x00\x00\x007\x15\x04\x00\x00\x00\x00\x00d\x15\x04\x00\x00\x00\x00\x00w\x15\x04\x00\x00\x00\x00\x00\xfe\x15\x04\x00\x00\x00\x00\x00'
+    b'\x1b\x16\x04\x00\x00\x00\x00\x00\x1c\x16\x04\x00\x00\x00\x00\x00\x1d\x16\x04\x00\x00\x00\x00\x00\x1e\x16\x04\x00\x00\x00\x00\x00\x1f\x16\x04\x00\x00\x00\x00\x00^\x16\x04\x00\x00\x00\x00\x00\x92\x16\x04\x00\x00\x00\x00\x00\x93\x16\x04\x00\x00\x00\x00\x00\xaa\x16\x04\x00\x00\x00\x00\x00\xab\x16\x04\x00\x00\x00\x00\x00\xac\x16\x04\x00\x00\x00\x00\x00\xad\x16\x04\x00\x00\x00\x00\x00'
+    b'\xae\x16\x04\x00\x00\x00\x00\x00\xaf\x16\x04\x00\x00\x00\x00\x00\xb0\x16\x04\x00\x00\x00\x00\x00\xb1\x16\x04\x00\x00\x00\x00\x00\xd0\x16\x04\x00\x00\x00\x00\x00\xda\x16\x04\x00\x00\x00\x00\x00\xf9\x16\x04\x00\x00\x00\x00\x00^\x17\x04\x00\x00\x00\x00\x00\xfc\x17\x04\x00\x00\x00\x00\x00\x03\x18\x04\x00\x00\x00\x00\x00S\x18\x04\x00\x00\x00\x00\x00\x88\x18\x04\x00\x00\x00\x00\x00'
+    b'\xb7\x18\x04\x00\x00\x00\x00\x00\xfd\x18\x04\x00\x00\x00\x00\x00\x04\x19\x04\x00\x00\x00\x00\x00\x17\x19\x04\x00\x00\x00\x00\x00S\x19\x04\x00\x00\x00\x00\x00\x97\x19\x04\x00\x00\x00\x00\x00\xc5\x19\x04\x00\x00\x00\x00\x00\xe1\x19\x04\x00\x00\x00\x00\x00\xe2\x19\x04\x00\x00\x00\x00\x00\xe3\x19\x04\x00\x00\x00\x00\x00J\x1a\x04\x00\x00\x00\x00\x00M\x1a\x04\x00\x00\x00\x00\x00'
+    b'\x85\x1a\x04\x00\x00\x00\x00\x00\x8d\x1a\x04\x00\x00\x00\x00\x00\xab\x1a\x04\x00\x00\x00\x00\x00!\x1b\x04\x00\x00\x00\x00\x00"\x1b\x04\x00\x00\x00\x00\x00#\x1b\x04\x00\x00\x00\x00\x00$\x1b\x04\x00\x00\x00\x00\x00x\x1b\x04\x00\x00\x00\x00\x00\xc5\x1b\x04\x00\x00\x00\x00\x00\xe6\x1b\x04\x00\x00\x00\x00\x00\x01\x1c\x04\x00\x00\x00\x00\x00\x0c\x1c\x04\x00\x00\x00\x00\x00'
+    b'5\x1c\x04\x00\x00\x00\x00\x00;\x1c\x04\x00\x00\x00\x00\x00<\x1c\x04\x00\x00\x00\x00\x00=\x1c\x04\x00\x00\x00\x00\x00C\x1d\x04\x00\x00\x00\x00\x00K\x1d\x04\x00\x00\x00\x00\x00V\x1d\x04\x00\x00\x00\x00\x00\xb7\x1d\x04\x00\x00\x00\x00\x00\xc4\x1d\x04\x00\x00\x00\x00\x00\xc5\x1d\x04\x00\x00\x00\x00\x00\xc6\x1d\x04\x00\x00\x00\x00\x00\xc7\x1d\x04\x00\x00\x00\x00\x00'
+    b'\xc8\x1d\x04\x00\x00\x00\x00\x00\xf7\x1d\x04\x00\x00\x00\x00\x00\x03\x1e\x04\x00\x00\x00\x00\x00w\x1e\x04\x00\x00\x00\x00\x00x\x1e\x04\x00\x00\x00\x00\x00y\x1e\x04\x00\x00\x00\x00\x00\x98\x1e\x04\x00\x00\x00\x00\x00\xe6\x1e\x04\x00\x00\x00\x00\x00\xe7\x1e\x04\x00\x00\x00\x00\x00\xe8\x1e\x04\x00\x00\x00\x00\x00\xe9\x1e\x04\x00\x00\x00\x00\x00\xea\x1e\x04\x00\x00\x00\x00\x00'
+    b'\xec\x1e\x04\x00\x00\x00\x00\x00\xed\x1e\x04\x00\x00\x00\x00\x00\xee\x1e\x04\x00\x00\x00\x00\x00\xef\x1e\x04\x00\x00\x00\x00\x00\xf0\x1e\x04\x00\x00\x00\x00\x00\xf1\x1e\x04\x00\x00\x00\x00\x00\xf4\x1e\x04\x00\x00\x00\x00\x00\xf5\x1e\x04\x00\x00\x00\x00\x00\xf6\x1e\x04\x00\x00\x00\x00\x00\xf7\x1e\x04\x00\x00\x00\x00\x00\xf8\x1e\x04\x00\x00\x00\x00\x00\x1e\x1f\x04\x00\x00\x00\x00\x00'
+    b'\x1f\x1f\x04\x00\x00\x00\x00\x00 \x1f\x04\x00\x00\x00\x00\x00M\x1f\x04\x00\x00\x00\x00\x00\x8f\x1f\x04\x00\x00\x00\x00\x00\x90\x1f\x04\x00\x00\x00\x00\x00\x06 \x04\x00\x00\x00\x00\x00\x07 \x04\x00\x00\x00\x00\x00\x08 \x04\x00\x00\x00\x00\x00H \x04\x00\x00\x00\x00\x00\x94 \x04\x00\x00\x00\x00\x00\x0f!\x04\x00\x00\x00\x00\x00/!\x04\x00\x00\x00\x00\x00'
+    b'\x97!\x04\x00\x00\x00\x00\x00\xbc!\x04\x00\x00\x00\x00\x00\xc0!\x04\x00\x00\x00\x00\x00\xc5!\x04\x00\x00\x00\x00\x00\xd9!\x04\x00\x00\x00\x00\x00\xdc"\x04\x00\x00\x00\x00\x00A#\x04\x00\x00\x00\x00\x00r#\x04\x00\x00\x00\x00\x00\x93#\x04\x00\x00\x00\x00\x00\x94#\x04\x00\x00\x00\x00\x00\x95#\x04\x00\x00\x00\x00\x00\x97#\x04\x00\x00\x00\x00\x00'
+    b'\x98#\x04\x00\x00\x00\x00\x00\x99#\x04\x00\x00\x00\x00\x00\xa3#\x04\x00\x00\x00\x00\x00\xa4#\x04\x00\x00\x00\x00\x00\xa5#\x04\x00\x00\x00\x00\x00\xa6#\x04\x00\x00\x00\x00\x00\xa7#\x04\x00\x00\x00\x00\x00\xa8#\x04\x00\x00\x00\x00\x00\xfb#\x04\x00\x00\x00\x00\x00\xfc#\x04\x00\x00\x00\x00\x00\x00$\x04\x00\x00\x00\x00\x00\x01$\x04\x00\x00\x00\x00\x00'
+    b'\x03$\x04\x00\x00\x00\x00\x00\x04$\x04\x00\x00\x00\x00\x00\x06$\x04\x00\x00\x00\x00\x00\x07$\x04\x00\x00\x00\x00\x00\x08$\x04\x00\x00\x00\x00\x00\n$\x04\x00\x00\x00\x00\x00\x0b$\x04\x00\x00\x00\x00\x00\r$\x04\x00\x00\x00\x00\x00\x0e$\x04\x00\x00\x00\x00\x00\x10$\x04\x00\x00\x00\x00\x00\x11$\x04\x00\x00\x00\x00\x00\x13$\x04\x00\x00\x00\x00\x00'
+    b'\x14$\x04\x00\x00\x00\x00\x00\x16$\x04\x00\x00\x00\x00\x00\x17$\x04\x00\x00\x00\x00\x00\x19$\x04\x00\x00\x00\x00\x00\x1a$\x04\x00\x00\x00\x00\x00\x1c$\x04\x00\x00\x00\x00\x00\x1d$\x04\x00\x00\x00\x00\x00\x1f$\x04\x00\x00\x00\x00\x00 $\x04\x00\x00\x00\x00\x00"$\x04\x00\x00\x00\x00\x00#$\x04\x00\x00\x00\x00\x00%$\x04\x00\x00\x00\x00\x00'
+    b'&$\x04\x00\x00\x00\x00\x00($\x04\x00\x00\x00\x00\x00)$\x04\x00\x00\x00\x00\x00+$\x04\x00\x00\x00\x00\x00,$\x04\x00\x00\x00\x00\x00.$\x04\x00\x00\x00\x00\x00/$\x04\x00\x00\x00\x00\x001$\x04\x00\x00\x00\x00\x002$\x04\x00\x00\x00\x00\x00\x9c$\x04\x00\x00\x00\x00\x00\xb3$\x04\x00\x00\x00\x00\x00\xb5$\x04\x00\x00\x00\x00\x00'
+    b'\xbf$\x04\x00\x00\x00\x00\x00\xc4$\x04\x00\x00\x00\x00\x00\xc5$\x04\x00\x00\x00\x00\x00\xc6$\x04\x00\x00\x00\x00\x00\x05%\x04\x00\x00\x00\x00\x00\x06%\x04\x00\x00\x00\x00\x00\x12%\x04\x00\x00\x00\x00\x00!%\x04\x00\x00\x00\x00\x00V%\x04\x00\x00\x00\x00\x00W%\x04\x00\x00\x00\x00\x00X%\x04\x00\x00\x00\x00\x00Y%\x04\x00\x00\x00\x00\x00'
+    b'Z%\x04\x00\x00\x00\x00\x00[%\x04\x00\x00\x00\x00\x00\\%\x04\x00\x00\x00\x00\x00]%\x04\x00\x00\x00\x00\x00^%\x04\x00\x00\x00\x00\x00_%\x04\x00\x00\x00\x00\x00`%\x04\x00\x00\x00\x00\x00a%\x04\x00\x00\x00\x00\x00b%\x04\x00\x00\x00\x00\x00d%\x04\x00\x00\x00\x00\x00e%\x04\x00\x00\x00\x00\x00f%\x04\x00\x00\x00\x00\x00'
+    b'g%\x04\x00\x00\x00\x00\x00i%\x04\x00\x00\x00\x00\x00j%\x04\x00\x00\x00\x00\x00k%\x04\x00\x00\x00\x00\x00l%\x04\x00\x00\x00\x00\x00m%\x04\x00\x00\x00\x00\x00n%\x04\x00\x00\x00\x00\x00o%\x04\x00\x00\x00\x00\x00p%\x04\x00\x00\x00\x00\x00q%\x04\x00\x00\x00\x00\x00\x81%\x04\x00\x00\x00\x00\x00\x82%\x04\x00\x00\x00\x00\x00'
+    b'\x83%\x04\x00\x00\x00\x00\x00\x84%\x04\x00\x00\x00\x00\x00\x85%\x04\x00\x00\x00\x00\x00\x86%\x04\x00\x00\x00\x00\x00\x87%\x04\x00\x00\x00\x00\x00\x88%\x04\x00\x00\x00\x00\x00\x89%\x04\x00\x00\x00\x00\x00\x8a%\x04\x00\x00\x00\x00\x00\x8b%\x04\x00\x00\x00\x00\x00\x8c%\x04\x00\x00\x00\x00\x00\x8e%\x04\x00\x00\x00\x00\x00\x8f%\x04\x00\x00\x00\x00\x00'
+    b'\x90%\x04\x00\x00\x00\x00\x00\x91%\x04\x00\x00\x00\x00\x00\x92%\x04\x00\x00\x00\x00\x00\x93%\x04\x00\x00\x00\x00\x00\x94%\x04\x00\x00\x00\x00\x00\x95%\x04\x00\x00\x00\x00\x00\x96%\x04\x00\x00\x00\x00\x00\x97%\x04\x00\x00\x00\x00\x00\x98%\x04\x00\x00\x00\x00\x00\x99%\x04\x00\x00\x00\x00\x00\x9b%\x04\x00\x00\x00\x00\x00\x9c%\x04\x00\x00\x00\x00\x00'
+    b'\x9d%\x04\x00\x00\x00\x00\x00\x9e%\x04\x00\x00\x00\x00\x00\x9f%\x04\x00\x00\x00\x00\x00\xa0%\x04\x00\x00\x00\x00\x00\xa2%\x04\x00\x00\x00\x00\x00\xa3%\x04\x00\x00\x00\x00\x00\xa4%\x04\x00\x00\x00\x00\x00\xa5%\x04\x00\x00\x00\x00\x00\xa6%\x04\x00\x00\x00\x00\x00\xa7%\x04\x00\x00\x00\x00\x00\xab%\x04\x00\x00\x00\x00\x00\xac%\x04\x00\x00\x00\x00\x00'
+    b'\xad%\x04\x00\x00\x00\x00\x00\xae%\x04\x00\x00\x00\x00\x00\xaf%\x04\x00\x00\x00\x00\x00\xb0%\x04\x00\x00\x00\x00\x00\xb1%\x04\x00\x00\x00\x00\x00\xb2%\x04\x00\x00\x00\x00\x00\xb3%\x04\x00\x00\x00\x00\x00\xb4%\x04\x00\x00\x00\x00\x00\xb5%\x04\x00\x00\x00\x00\x00\xb6%\x04\x00\x00\x00\x00\x00\xbf%\x04\x00\x00\x00\x00\x00\xc3%\x04\x00\x00\x00\x00\x00'
+    b'\xcb%\x04\x00\x00\x00\x00\x00\xd0%\x04\x00\x00\x00\x00\x00\xd4%\x04\x00\x00\x00\x00\x00\xd5%\x04\x00\x00\x00\x00\x00\xd6%\x04\x00\x00\x00\x00\x00\xd7%\x04\x00\x00\x00\x00\x00\xd8%\x04\x00\x00\x00\x00\x00\xda%\x04\x00\x00\x00\x00\x00\xdb%\x04\x00\x00\x00\x00\x00\xdc%\x04\x00\x00\x00\x00\x00\xdd%\x04\x00\x00\x00\x00\x00\xde%\x04\x00\x00\x00\x00\x00'
+    b'\xdf%\x04\x00\x00\x00\x00\x00\xe0%\x04\x00\x00\x00\x00\x00\xe1%\x04\x00\x00\x00\x00\x00\xe2%\x04\x00\x00\x00\x00\x00\xe3%\x04\x00\x00\x00\x00\x00\xe4%\x04\x00\x00\x00\x00\x00\xe5%\x04\x00\x00\x00\x00\x00\xe6%\x04\x00\x00\x00\x00\x00\xe7%\x04\x00\x00\x00\x00\x00\xe8%\x04\x00\x00\x00\x00\x00\xe9%\x04\x00\x00\x00\x00\x00\xeb%\x04\x00\x00\x00\x00\x00'
+    b'\xec%\x04\x00\x00\x00\x00\x00\xed%\x04\x00\x00\x00\x00\x00\xf0%\x04\x00\x00\x00\x00\x00\xf1%\x04\x00\x00\x00\x00\x00\xf2%\x04\x00\x00\x00\x00\x00\xf3%\x04\x00\x00\x00\x00\x00\xf4%\x04\x00\x00\x00\x00\x00\xf5%\x04\x00\x00\x00\x00\x00\xf6%\x04\x00\x00\x00\x00\x00\xf7%\x04\x00\x00\x00\x00\x00\xf8%\x04\x00\x00\x00\x00\x00\xf9%\x04\x00\x00\x00\x00\x00'
+    b'\xfa%\x04\x00\x00\x00\x00\x00\xfb%\x04\x00\x00\x00\x00\x00\xfc%\x04\x00\x00\x00\x00\x00\xfd%\x04\x00\x00\x00\x00\x00\xfe%\x04\x00\x00\x00\x00\x00\x01&\x04\x00\x00\x00\x00\x00\x02&\x04\x00\x00\x00\x00\x00\x03&\x04\x00\x00\x00\x00\x00\x04&\x04\x00\x00\x00\x00\x00\x05&\x04\x00\x00\x00\x00\x00\x06&\x04\x00\x00\x00\x00\x00\x07&\x04\x00\x00\x00\x00\x00'
+    b'\x08&\x04\x00\x00\x00\x00\x00\t&\x04\x00\x00\x00\x00\x00\x0e&\x04\x00\x00\x00\x00\x00\x0f&\x04\x00\x00\x00\x00\x00\x10&\x04\x00\x00\x00\x00\x00\x11&\x04\x00\x00\x00\x00\x00\x12&\x04\x00\x00\x00\x00\x00\x13&\x04\x00\x00\x00\x00\x00\x14&\x04\x00\x00\x00\x00\x00\x15&\x04\x00\x00\x00\x00\x00\x16&\x04\x00\x00\x00\x00\x00\x17&\x04\x00\x00\x00\x00\x00'
+    b'\x18&\x04\x00\x00\x00\x00\x00\x19&\x04\x00\x00\x00\x00\x00\x1a&\x04\x00\x00\x00\x00\x00\x1b&\x04\x00\x00\x00\x00\x00\x1c&\x04\x00\x00\x00\x00\x00\x1d&\x04\x00\x00\x00\x00\x00\x1e&\x04\x00\x00\x00\x00\x00\x1f&\x04\x00\x00\x00\x00\x00 &\x04\x00\x00\x00\x00\x00!&\x04\x00\x00\x00\x00\x00"&\x04\x00\x00\x00\x00\x00#&\x04\x00\x00\x00\x00\x00'
+    b'$&\x04\x00\x00\x00\x00\x00%&\x04\x00\x00\x00\x00\x00*&\x04\x00\x00\x00\x00\x00+&\x04\x00\x00\x00\x00\x00,&\x04\x00\x00\x00\x00\x00-&\x04\x00\x00\x00\x00\x00.&\x04\x00\x00\x00\x00\x00/&\x04\x00\x00\x00\x00\x000&\x04\x00\x00\x00\x00\x001&\x04\x00\x00\x00\x00\x002&\x04\x00\x00\x00\x00\x003&\x04\x00\x00\x00\x00\x00'
+    b'4&\x04\x00\x00\x00\x00\x005&\x04\x00\x00\x00\x00\x006&\x04\x00\x00\x00\x00\x007&\x04\x00\x00\x00\x00\x008&\x04\x00\x00\x00\x00\x009&\x04\x00\x00\x00\x00\x00:&\x04\x00\x00\x00\x00\x00;&\x04\x00\x00\x00\x00\x00<&\x04\x00\x00\x00\x00\x00=&\x04\x00\x00\x00\x00\x00>&\x04\x00\x00\x00\x00\x00?&\x04\x00\x00\x00\x00\x00'
+    b'@&\x04\x00\x00\x00\x00\x00A&\x04\x00\x00\x00\x00\x00D&\x04\x00\x00\x00\x00\x00E&\x04\x00\x00\x00\x00\x00F&\x04\x00\x00\x00\x00\x00G&\x04\x00\x00\x00\x00\x00H&\x04\x00\x00\x00\x00\x00I&\x04\x00\x00\x00\x00\x00J&\x04\x00\x00\x00\x00\x00K&\x04\x00\x00\x00\x00\x00L&\x04\x00\x00\x00\x00\x00M&\x04\x00\x00\x00\x00\x00'
+    b'N&\x04\x00\x00\x00\x00\x00R&\x04\x00\x00\x00\x00\x00S&\x04\x00\x00\x00\x00\x00T&\x04\x00\x00\x00\x00\x00U&\x04\x00\x00\x00\x00\x00V&\x04\x00\x00\x00\x00\x00W&\x04\x00\x00\x00\x00\x00X&\x04\x00\x00\x00\x00\x00Y&\x04\x00\x00\x00\x00\x00Z&\x04\x00\x00\x00\x00\x00[&\x04\x00\x00\x00\x00\x00\\&\x04\x00\x00\x00\x00\x00'
+    b']&\x04\x00\x00\x00\x00\x00^&\x04\x00\x00\x00\x00\x00_&\x04\x00\x00\x00\x00\x00`&\x04\x00\x00\x00\x00\x00a&\x04\x00\x00\x00\x00\x00b&\x04\x00\x00\x00\x00\x00c&\x04\x00\x00\x00\x00\x00d&\x04\x00\x00\x00\x00\x00e&\x04\x00\x00\x00\x00\x00f&\x04\x00\x00\x00\x00\x00g&\x04\x00\x00\x00\x00\x00h&\x04\x00\x00\x00\x00\x00'
+    b'i&\x04\x00\x00\x00\x00\x00o&\x04\x00\x00\x00\x00\x00w&\x04\x00\x00\x00\x00\x00x&\x04\x00\x00\x00\x00\x00y&\x04\x00\x00\x00\x00\x00z&\x04\x00\x00\x00\x00\x00}&\x04\x00\x00\x00\x00\x00~&\x04\x00\x00\x00\x00\x00\x7f&\x04\x00\x00\x00\x00\x00\x80&\x04\x00\x00\x00\x00\x00\x81&\x04\x00\x00\x00\x00\x00\x82&\x04\x00\x00\x00\x00\x00'
+    b'\x83&\x04\x00\x00\x00\x00\x00\x84&\x04\x00\x00\x00\x00\x00\x85&\x04\x00\x00\x00\x00\x00\x86&\x04\x00\x00\x00\x00\x00\x87&\x04\x00\x00\x00\x00\x00\x88&\x04\x00\x00\x00\x00\x00\x89&\x04\x00\x00\x00\x00\x00\x8a&\x04\x00\x00\x00\x00\x00\x8b&\x04\x00\x00\x00\x00\x00\x8c&\x04\x00\x00\x00\x00\x00\x8d&\x04\x00\x00\x00\x00\x00\x8e&\x04\x00\x00\x00\x00\x00'
+    b"\x8f&\x04\x00\x00\x00\x00\x00\xf5&\x04\x00\x00\x00\x00\x00\x0c'\x04\x00\x00\x00\x00\x00\x0e'\x04\x00\x00\x00\x00\x00\x0f'\x04\x00\x00\x00\x00\x00\x1c'\x04\x00\x00\x00\x00\x00$'\x04\x00\x00\x00\x00\x00R'\x04\x00\x00\x00\x00\x00S'\x04\x00\x00\x00\x00\x00T'\x04\x00\x00\x00\x00\x00U'\x04\x00\x00\x00\x00\x00g'\x04\x00\x00\x00\x00\x00"
+    b"\x8c'\x04\x00\x00\x00\x00\x00\x8e'\x04\x00\x00\x00\x00\x00\x97'\x04\x00\x00\x00\x00\x00\x9d'\x04\x00\x00\x00\x00\x00\xa5'\x04\x00\x00\x00\x00\x00\xb9'\x04\x00\x00\x00\x00\x00\xbc'\x04\x00\x00\x00\x00\x00\x00(\x04\x00\x00\x00\x00\x00-(\x04\x00\x00\x00\x00\x00=(\x04\x00\x00\x00\x00\x00>(\x04\x00\x00\x00\x00\x00?(\x04\x00\x00\x00\x00\x00"
+    b'@(\x04\x00\x00\x00\x00\x00A(\x04\x00\x00\x00\x00\x00B(\x04\x00\x00\x00\x00\x00D(\x04\x00\x00\x00\x00\x00H(\x04\x00\x00\x00\x00\x00J(\x04\x00\x00\x00\x00\x00n(\x04\x00\x00\x00\x00\x00\x87(\x04\x00\x00\x00\x00\x00\x99(\x04\x00\x00\x00\x00\x00\x9a(\x04\x00\x00\x00\x00\x00\xa0(\x04\x00\x00\x00\x00\x00\xae(\x04\x00\x00\x00\x00\x00'
+    b'\xb9(\x04\x00\x00\x00\x00\x00\xc0(\x04\x00\x00\x00\x00\x00\x0c)\x04\x00\x00\x00\x00\x00-)\x04\x00\x00\x00\x00\x00.)\x04\x00\x00\x00\x00\x003)\x04\x00\x00\x00\x00\x004)\x04\x00\x00\x00\x00\x005)\x04\x00\x00\x00\x00\x006)\x04\x00\x00\x00\x00\x007)\x04\x00\x00\x00\x00\x008)\x04\x00\x00\x00\x00\x009)\x04\x00\x00\x00\x00\x00'
+    b':)\x04\x00\x00\x00\x00\x00;)\x04\x00\x00\x00\x00\x00<)\x04\x00\x00\x00\x00\x00=)\x04\x00\x00\x00\x00\x00>)\x04\x00\x00\x00\x00\x00?)\x04\x00\x00\x00\x00\x00@)\x04\x00\x00\x00\x00\x00A)\x04\x00\x00\x00\x00\x00B)\x04\x00\x00\x00\x00\x00C)\x04\x00\x00\x00\x00\x00D)\x04\x00\x00\x00\x00\x00E)\x04\x00\x00\x00\x00\x00'
+    b'F)\x04\x00\x00\x00\x00\x00R)\x04\x00\x00\x00\x00\x00[)\x04\x00\x00\x00\x00\x00\\)\x04\x00\x00\x00\x00\x00])\x04\x00\x00\x00\x00\x00^)\x04\x00\x00\x00\x00\x00x)\x04\x00\x00\x00\x00\x00\x88)\x04\x00\x00\x00\x00\x00\xa2)\x04\x00\x00\x00\x00\x00\xa3)\x04\x00\x00\x00\x00\x00\xa4)\x04\x00\x00\x00\x00\x00\xa5)\x04\x00\x00\x00\x00\x00'
+    b'\xa6)\x04\x00\x00\x00\x00\x00\xa7)\x04\x00\x00\x00\x00\x00\xa8)\x04\x00\x00\x00\x00\x00\xa9)\x04\x00\x00\x00\x00\x00\xaa)\x04\x00\x00\x00\x00\x00\xab)\x04\x00\x00\x00\x00\x00\xac)\x04\x00\x00\x00\x00\x00\xad)\x04\x00\x00\x00\x00\x00\xae)\x04\x00\x00\x00\x00\x00\xaf)\x04\x00\x00\x00\x00\x00\xb0)\x04\x00\x00\x00\x00\x00\xb1)\x04\x00\x00\x00\x00\x00'
+    b'\xb2)\x04\x00\x00\x00\x00\x00\xb3)\x04\x00\x00\x00\x00\x00\xb4)\x04\x00\x00\x00\x00\x00\xb5)\x04\x00\x00\x00\x00\x00\xb6)\x04\x00\x00\x00\x00\x00\xb7)\x04\x00\x00\x00\x00\x00\xb8)\x04\x00\x00\x00\x00\x00\xb9)\x04\x00\x00\x00\x00\x00\xba)\x04\x00\x00\x00\x00\x00\xbb)\x04\x00\x00\x00\x00\x00\xd5)\x04\x00\x00\x00\x00\x00\xd6)\x04\x00\x00\x00\x00\x00'
+    b'\xf6)\x04\x00\x00\x00\x00\x00\x03*\x04\x00\x00\x00\x00\x00\x93*\x04\x00\x00\x00\x00\x00\x95*\x04\x00\x00\x00\x00\x00\x96*\x04\x00\x00\x00\x00\x00\x97*\x04\x00\x00\x00\x00\x00\x98*\x04\x00\x00\x00\x00\x00\xa2*\x04\x00\x00\x00\x00\x00\xa6*\x04\x00\x00\x00\x00\x00\xc0*\x04\x00\x00\x00\x00\x00\xc4*\x04\x00\x00\x00\x00\x00\xca*\x04\x00\x00\x00\x00\x00'
+    b'\xe4+\x04\x00\x00\x00\x00\x00\xfd+\x04\x00\x00\x00\x00\x00\n,\x04\x00\x00\x00\x00\x00\x10,\x04\x00\x00\x00\x00\x00U,\x04\x00\x00\x00\x00\x00},\x04\x00\x00\x00\x00\x00\xa8,\x04\x00\x00\x00\x00\x00\xab,\x04\x00\x00\x00\x00\x00\xb3,\x04\x00\x00\x00\x00\x00\xef,\x04\x00\x00\x00\x00\x00\xc8.\x04\x00\x00\x00\x00\x00p0\x04\x00\x00\x00\x00\x00'
+    b'q0\x04\x00\x00\x00\x00\x00x0\x04\x00\x00\x00\x00\x00y0\x04\x00\x00\x00\x00\x00\x970\x04\x00\x00\x00\x00\x00O1\x04\x00\x00\x00\x00\x00l1\x04\x00\x00\x00\x00\x00\x851\x04\x00\x00\x00\x00\x00U3\x04\x00\x00\x00\x00\x00\xde3\x04\x00\x00\x00\x00\x00\xe33\x04\x00\x00\x00\x00\x00\xe43\x04\x00\x00\x00\x00\x00\xe53\x04\x00\x00\x00\x00\x00'
+    b'\xe63\x04\x00\x00\x00\x00\x00\xe73\x04\x00\x00\x00\x00\x00\xe83\x04\x00\x00\x00\x00\x00\xe93\x04\x00\x00\x00\x00\x00\x0c4\x04\x00\x00\x00\x00\x00Y4\x04\x00\x00\x00\x00\x00]4\x04\x00\x00\x00\x00\x00\xa84\x04\x00\x00\x00\x00\x00\x035\x04\x00\x00\x00\x00\x00w5\x04\x00\x00\x00\x00\x00}5\x04\x00\x00\x00\x00\x00\xde5\x04\x00\x00\x00\x00\x00'
+    b'$6\x04\x00\x00\x00\x00\x00+6\x04\x00\x00\x00\x00\x0046\x04\x00\x00\x00\x00\x00:7\x04\x00\x00\x00\x00\x00X7\x04\x00\x00\x00\x00\x00Y7\x04\x00\x00\x00\x00\x00\x9e7\x04\x00\x00\x00\x00\x00\xb57\x04\x00\x00\x00\x00\x00\xcd7\x04\x00\x00\x00\x00\x00\xda7\x04\x00\x00\x00\x00\x00\xdd7\x04\x00\x00\x00\x00\x0088\x04\x00\x00\x00\x00\x00'
+    b"L8\x04\x00\x00\x00\x00\x00\xa28\x04\x00\x00\x00\x00\x00\xe38\x04\x00\x00\x00\x00\x00\xe68\x04\x00\x00\x00\x00\x00\xe98\x04\x00\x00\x00\x00\x00':\x04\x00\x00\x00\x00\x009:\x04\x00\x00\x00\x00\x00::\x04\x00\x00\x00\x00\x00;:\x04\x00\x00\x00\x00\x00<:\x04\x00\x00\x00\x00\x00{:\x04\x00\x00\x00\x00\x00\xd8:\x04\x00\x00\x00\x00\x00"
+    b'\x04;\x04\x00\x00\x00\x00\x00\n;\x04\x00\x00\x00\x00\x00E;\x04\x00\x00\x00\x00\x006<\x04\x00\x00\x00\x00\x00s<\x04\x00\x00\x00\x00\x00\xb8<\x04\x00\x00\x00\x00\x005=\x04\x00\x00\x00\x00\x006=\x04\x00\x00\x00\x00\x007=\x04\x00\x00\x00\x00\x008=\x04\x00\x00\x00\x00\x009=\x04\x00\x00\x00\x00\x00@=\x04\x00\x00\x00\x00\x00'
+    b'A=\x04\x00\x00\x00\x00\x00I=\x04\x00\x00\x00\x00\x00L=\x04\x00\x00\x00\x00\x00M=\x04\x00\x00\x00\x00\x00N=\x04\x00\x00\x00\x00\x00X=\x04\x00\x00\x00\x00\x00\x90=\x04\x00\x00\x00\x00\x00\xd4=\x04\x00\x00\x00\x00\x00\xe9=\x04\x00\x00\x00\x00\x00\xf5=\x04\x00\x00\x00\x00\x00\xff=\x04\x00\x00\x00\x00\x00\x00>\x04\x00\x00\x00\x00\x00'
+    b'\x01>\x04\x00\x00\x00\x00\x00\x02>\x04\x00\x00\x00\x00\x00\x03>\x04\x00\x00\x00\x00\x00\x04>\x04\x00\x00\x00\x00\x00\x05>\x04\x00\x00\x00\x00\x00\x06>\x04\x00\x00\x00\x00\x00\x07>\x04\x00\x00\x00\x00\x00\x08>\x04\x00\x00\x00\x00\x00\t>\x04\x00\x00\x00\x00\x00\x0b>\x04\x00\x00\x00\x00\x00\x0c>\x04\x00\x00\x00\x00\x00\r>\x04\x00\x00\x00\x00\x00'
+    b'\x0e>\x04\x00\x00\x00\x00\x00\x0f>\x04\x00\x00\x00\x00\x00\x10>\x04\x00\x00\x00\x00\x00\x11>\x04\x00\x00\x00\x00\x00\x12>\x04\x00\x00\x00\x00\x00\x13>\x04\x00\x00\x00\x00\x00\x14>\x04\x00\x00\x00\x00\x00\x15>\x04\x00\x00\x00\x00\x00\x16>\x04\x00\x00\x00\x00\x00\x17>\x04\x00\x00\x00\x00\x00\x18>\x04\x00\x00\x00\x00\x00\x19>\x04\x00\x00\x00\x00\x00'
+    b'\x1a>\x04\x00\x00\x00\x00\x00\x1b>\x04\x00\x00\x00\x00\x00\x1c>\x04\x00\x00\x00\x00\x00\x1d>\x04\x00\x00\x00\x00\x00\x1e>\x04\x00\x00\x00\x00\x00\x1f>\x04\x00\x00\x00\x00\x00 >\x04\x00\x00\x00\x00\x00!>\x04\x00\x00\x00\x00\x00">\x04\x00\x00\x00\x00\x00#>\x04\x00\x00\x00\x00\x00$>\x04\x00\x00\x00\x00\x00%>\x04\x00\x00\x00\x00\x00'
+    b"&>\x04\x00\x00\x00\x00\x00'>\x04\x00\x00\x00\x00\x00(>\x04\x00\x00\x00\x00\x00)>\x04\x00\x00\x00\x00\x00*>\x04\x00\x00\x00\x00\x00+>\x04\x00\x00\x00\x00\x00,>\x04\x00\x00\x00\x00\x00->\x04\x00\x00\x00\x00\x00.>\x04\x00\x00\x00\x00\x00/>\x04\x00\x00\x00\x00\x000>\x04\x00\x00\x00\x00\x001>\x04\x00\x00\x00\x00\x00"
+    b'2>\x04\x00\x00\x00\x00\x003>\x04\x00\x00\x00\x00\x004>\x04\x00\x00\x00\x00\x005>\x04\x00\x00\x00\x00\x006>\x04\x00\x00\x00\x00\x007>\x04\x00\x00\x00\x00\x008>\x04\x00\x00\x00\x00\x009>\x04\x00\x00\x00\x00\x00:>\x04\x00\x00\x00\x00\x00;>\x04\x00\x00\x00\x00\x00<>\x04\x00\x00\x00\x00\x00=>\x04\x00\x00\x00\x00\x00'
+    b'>>\x04\x00\x00\x00\x00\x00?>\x04\x00\x00\x00\x00\x00@>\x04\x00\x00\x00\x00\x00A>\x04\x00\x00\x00\x00\x00B>\x04\x00\x00\x00\x00\x00C>\x04\x00\x00\x00\x00\x00D>\x04\x00\x00\x00\x00\x00E>\x04\x00\x00\x00\x00\x00F>\x04\x00\x00\x00\x00\x00G>\x04\x00\x00\x00\x00\x00H>\x04\x00\x00\x00\x00\x00I>\x04\x00\x00\x00\x00\x00'
+    b'J>\x04\x00\x00\x00\x00\x00K>\x04\x00\x00\x00\x00\x00L>\x04\x00\x00\x00\x00\x00M>\x04\x00\x00\x00\x00\x00N>\x04\x00\x00\x00\x00\x00O>\x04\x00\x00\x00\x00\x00P>\x04\x00\x00\x00\x00\x00Q>\x04\x00\x00\x00\x00\x00R>\x04\x00\x00\x00\x00\x00S>\x04\x00\x00\x00\x00\x00T>\x04\x00\x00\x00\x00\x00U>\x04\x00\x00\x00\x00\x00'
+    b'V>\x04\x00\x00\x00\x00\x00W>\x04\x00\x00\x00\x00\x00X>\x04\x00\x00\x00\x00\x00Y>\x04\x00\x00\x00\x00\x00Z>\x04\x00\x00\x00\x00\x00[>\x04\x00\x00\x00\x00\x00\\>\x04\x00\x00\x00\x00\x00]>\x04\x00\x00\x00\x00\x00\xc0>\x04\x00\x00\x00\x00\x00B?\x04\x00\x00\x00\x00\x00\x99?\x04\x00\x00\x00\x00\x00\xaa?\x04\x00\x00\x00\x00\x00'
+    b'\xd3?\x04\x00\x00\x00\x00\x00\x16@\x04\x00\x00\x00\x00\x007A\x04\x00\x00\x00\x00\x00\xa8A\x04\x00\x00\x00\x00\x00!B\x04\x00\x00\x00\x00\x005E\x04\x00\x00\x00\x00\x00`E\x04\x00\x00\x00\x00\x00aE\x04\x00\x00\x00\x00\x00bE\x04\x00\x00\x00\x00\x00xE\x04\x00\x00\x00\x00\x00yE\x04\x00\x00\x00\x00\x009F\x04\x00\x00\x00\x00\x00'
+    b'\xd8F\x04\x00\x00\x00\x00\x00\xd9F\x04\x00\x00\x00\x00\x00\xdaF\x04\x00\x00\x00\x00\x00\xe2F\x04\x00\x00\x00\x00\x00\xe3F\x04\x00\x00\x00\x00\x00\xe4F\x04\x00\x00\x00\x00\x00\xe5F\x04\x00\x00\x00\x00\x00\xe6F\x04\x00\x00\x00\x00\x00\xe7F\x04\x00\x00\x00\x00\x00\xe8F\x04\x00\x00\x00\x00\x00\xeaF\x04\x00\x00\x00\x00\x00\xebF\x04\x00\x00\x00\x00\x00'
+    b'\xecF\x04\x00\x00\x00\x00\x00\xedF\x04\x00\x00\x00\x00\x00\xeeF\x04\x00\x00\x00\x00\x00\xefF\x04\x00\x00\x00\x00\x00\xf0F\x04\x00\x00\x00\x00\x00\xf1F\x04\x00\x00\x00\x00\x00\x02H\x04\x00\x00\x00\x00\x00\x04H\x04\x00\x00\x00\x00\x009H\x04\x00\x00\x00\x00\x00mH\x04\x00\x00\x00\x00\x00\x9fH\x04\x00\x00\x00\x00\x00\xbcH\x04\x00\x00\x00\x00\x00'
+    b'\xd3H\x04\x00\x00\x00\x00\x00\xf3H\x04\x00\x00\x00\x00\x00CI\x04\x00\x00\x00\x00\x00DI\x04\x00\x00\x00\x00\x00EI\x04\x00\x00\x00\x00\x00FI\x04\x00\x00\x00\x00\x00eI\x04\x00\x00\x00\x00\x00iI\x04\x00\x00\x00\x00\x00jI\x04\x00\x00\x00\x00\x00\xa0I\x04\x00\x00\x00\x00\x00\xa6I\x04\x00\x00\x00\x00\x00\xbbI\x04\x00\x00\x00\x00\x00'
+    b'\xbcI\x04\x00\x00\x00\x00\x00\xd0I\x04\x00\x00\x00\x00\x00\x15J\x04\x00\x00\x00\x00\x00\x81J\x04\x00\x00\x00\x00\x00\x83J\x04\x00\x00\x00\x00\x00\x84J\x04\x00\x00\x00\x00\x00\x85J\x04\x00\x00\x00\x00\x00\x86J\x04\x00\x00\x00\x00\x00\x87J\x04\x00\x00\x00\x00\x00\x88J\x04\x00\x00\x00\x00\x00\x89J\x04\x00\x00\x00\x00\x00\x8aJ\x04\x00\x00\x00\x00\x00'
+    b'\x8bJ\x04\x00\x00\x00\x00\x00\xc4M\x04\x00\x00\x00\x00\x00\xeeM\x04\x00\x00\x00\x00\x00\xf0M\x04\x00\x00\x00\x00\x00\x14N\x04\x00\x00\x00\x00\x00\x1aN\x04\x00\x00\x00\x00\x00\x1eN\x04\x00\x00\x00\x00\x00-N\x04\x00\x00\x00\x00\x000N\x04\x00\x00\x00\x00\x003N\x04\x00\x00\x00\x00\x00BN\x04\x00\x00\x00\x00\x00DN\x04\x00\x00\x00\x00\x00'
+    b'IN\x04\x00\x00\x00\x00\x00JN\x04\x00\x00\x00\x00\x00ON\x04\x00\x00\x00\x00\x00QN\x04\x00\x00\x00\x00\x00\x9bN\x04\x00\x00\x00\x00\x00\x9fN\x04\x00\x00\x00\x00\x00\xa1N\x04\x00\x00\x00\x00\x00lO\x04\x00\x00\x00\x00\x00\x80O\x04\x00\x00\x00\x00\x00\x82O\x04\x00\x00\x00\x00\x00\x94O\x04\x00\x00\x00\x00\x00\xd6O\x04\x00\x00\x00\x00\x00'
+    b'VP\x04\x00\x00\x00\x00\x00\x94P\x04\x00\x00\x00\x00\x00\xefP\x04\x00\x00\x00\x00\x00\xf2P\x04\x00\x00\x00\x00\x001Q\x04\x00\x00\x00\x00\x00aQ\x04\x00\x00\x00\x00\x00pQ\x04\x00\x00\x00\x00\x00\x87Q\x04\x00\x00\x00\x00\x00\x88Q\x04\x00\x00\x00\x00\x00\x89Q\x04\x00\x00\x00\x00\x00\xeaQ\x04\x00\x00\x00\x00\x00\xebQ\x04\x00\x00\x00\x00\x00'
+    b'\xecQ\x04\x00\x00\x00\x00\x00\xedQ\x04\x00\x00\x00\x00\x00\xeeQ\x04\x00\x00\x00\x00\x00\xefQ\x04\x00\x00\x00\x00\x00\xf0Q\x04\x00\x00\x00\x00\x00\xf1Q\x04\x00\x00\x00\x00\x00\xf2Q\x04\x00\x00\x00\x00\x00\xf3Q\x04\x00\x00\x00\x00\x00\xf8Q\x04\x00\x00\x00\x00\x00\xf9Q\x04\x00\x00\x00\x00\x00\xfaQ\x04\x00\x00\x00\x00\x00\xfbQ\x04\x00\x00\x00\x00\x00'
+    b'\xfcQ\x04\x00\x00\x00\x00\x00\xfdQ\x04\x00\x00\x00\x00\x00,R\x04\x00\x00\x00\x00\x00.R\x04\x00\x00\x00\x00\x001R\x04\x00\x00\x00\x00\x005R\x04\x00\x00\x00\x00\x00\x13S\x04\x00\x00\x00\x00\x00\x14S\x04\x00\x00\x00\x00\x00\x15S\x04\x00\x00\x00\x00\x00\x16S\x04\x00\x00\x00\x00\x00\x17S\x04\x00\x00\x00\x00\x00\x18S\x04\x00\x00\x00\x00\x00'
+    b']S\x04\x00\x00\x00\x00\x00cS\x04\x00\x00\x00\x00\x00dS\x04\x00\x00\x00\x00\x00\xdcS\x04\x00\x00\x00\x00\x00\x13T\x04\x00\x00\x00\x00\x00:T\x04\x00\x00\x00\x00\x00<T\x04\x00\x00\x00\x00\x00=T\x04\x00\x00\x00\x00\x00HT\x04\x00\x00\x00\x00\x00\x8dT\x04\x00\x00\x00\x00\x00\xbeT\x04\x00\x00\x00\x00\x00\xd3T\x04\x00\x00\x00\x00\x00'
+    b'\xf7T\x04\x00\x00\x00\x00\x00\xf8T\x04\x00\x00\x00\x00\x00\xadU\x04\x00\x00\x00\x00\x00\xceU\x04\x00\x00\x00\x00\x00\xcdV\x04\x00\x00\x00\x00\x00\xceV\x04\x00\x00\x00\x00\x00\xddV\x04\x00\x00\x00\x00\x00\xdeV\x04\x00\x00\x00\x00\x00ZW\x04\x00\x00\x00\x00\x00aW\x04\x00\x00\x00\x00\x00\x93W\x04\x00\x00\x00\x00\x00\x9cW\x04\x00\x00\x00\x00\x00'
+    b'\xd4W\x04\x00\x00\x00\x00\x00\xd5W\x04\x00\x00\x00\x00\x00\x1aX\x04\x00\x00\x00\x00\x00\xa0X\x04\x00\x00\x00\x00\x00\xaaX\x04\x00\x00\x00\x00\x00\xf2X\x04\x00\x00\x00\x00\x00\xf4X\x04\x00\x00\x00\x00\x00=Y\x04\x00\x00\x00\x00\x00\x7fY\x04\x00\x00\x00\x00\x00\x80Y\x04\x00\x00\x00\x00\x00\x9dY\x04\x00\x00\x00\x00\x00\x9eY\x04\x00\x00\x00\x00\x00'
+    b'\xc0Y\x04\x00\x00\x00\x00\x00<[\x04\x00\x00\x00\x00\x00z[\x04\x00\x00\x00\x00\x00\x9f[\x04\x00\x00\x00\x00\x00\xc7[\x04\x00\x00\x00\x00\x00\xf0[\x04\x00\x00\x00\x00\x00\x04\\\x04\x00\x00\x00\x00\x00\r\\\x04\x00\x00\x00\x00\x00j\\\x04\x00\x00\x00\x00\x00k\\\x04\x00\x00\x00\x00\x00l\\\x04\x00\x00\x00\x00\x00o\\\x04\x00\x00\x00\x00\x00'
+    b'z\\\x04\x00\x00\x00\x00\x00\xb1\\\x04\x00\x00\x00\x00\x00\xf3\\\x04\x00\x00\x00\x00\x00\x06]\x04\x00\x00\x00\x00\x00\x07]\x04\x00\x00\x00\x00\x00\xa5]\x04\x00\x00\x00\x00\x00\xa7]\x04\x00\x00\x00\x00\x00\xa8]\x04\x00\x00\x00\x00\x00\xa9]\x04\x00\x00\x00\x00\x00\xad]\x04\x00\x00\x00\x00\x00D^\x04\x00\x00\x00\x00\x00T^\x04\x00\x00\x00\x00\x00'
+    b'Z^\x04\x00\x00\x00\x00\x00\xeb^\x04\x00\x00\x00\x00\x00\n_\x04\x00\x00\x00\x00\x00"_\x04\x00\x00\x00\x00\x00\x10a\x04\x00\x00\x00\x00\x00\x11a\x04\x00\x00\x00\x00\x00\x13a\x04\x00\x00\x00\x00\x00\x14a\x04\x00\x00\x00\x00\x00Ca\x04\x00\x00\x00\x00\x00Da\x04\x00\x00\x00\x00\x00\x91a\x04\x00\x00\x00\x00\x00Vb\x04\x00\x00\x00\x00\x00'
+    b'\xa3b\x04\x00\x00\x00\x00\x00\xacb\x04\x00\x00\x00\x00\x00\xf2b\x04\x00\x00\x00\x00\x00\xf4b\x04\x00\x00\x00\x00\x00\xf5b\x04\x00\x00\x00\x00\x00\x02c\x04\x00\x00\x00\x00\x00Mc\x04\x00\x00\x00\x00\x00Nc\x04\x00\x00\x00\x00\x00Oc\x04\x00\x00\x00\x00\x00Pc\x04\x00\x00\x00\x00\x00Uc\x04\x00\x00\x00\x00\x00Vc\x04\x00\x00\x00\x00\x00'
+    b'\xd3c\x04\x00\x00\x00\x00\x00\xdfc\x04\x00\x00\x00\x00\x00\xe0c\x04\x00\x00\x00\x00\x00td\x04\x00\x00\x00\x00\x00\x8ed\x04\x00\x00\x00\x00\x00\x90d\x04\x00\x00\x00\x00\x00\x97d\x04\x00\x00\x00\x00\x00\x9dd\x04\x00\x00\x00\x00\x00Me\x04\x00\x00\x00\x00\x00Ne\x04\x00\x00\x00\x00\x00Oe\x04\x00\x00\x00\x00\x00^e\x04\x00\x00\x00\x00\x00'
+    b'\x0ff\x04\x00\x00\x00\x00\x00Xf\x04\x00\x00\x00\x00\x00Yf\x04\x00\x00\x00\x00\x00Zf\x04\x00\x00\x00\x00\x00\xb9f\x04\x00\x00\x00\x00\x00\xdaf\x04\x00\x00\x00\x00\x00\xdff\x04\x00\x00\x00\x00\x00\xe7f\x04\x00\x00\x00\x00\x00\xe8f\x04\x00\x00\x00\x00\x00\xe9f\x04\x00\x00\x00\x00\x00\xebf\x04\x00\x00\x00\x00\x00\xf7f\x04\x00\x00\x00\x00\x00'
+    b':g\x04\x00\x00\x00\x00\x00?g\x04\x00\x00\x00\x00\x00Dg\x04\x00\x00\x00\x00\x00Eg\x04\x00\x00\x00\x00\x00Zg\x04\x00\x00\x00\x00\x00[g\x04\x00\x00\x00\x00\x00\\g\x04\x00\x00\x00\x00\x00]g\x04\x00\x00\x00\x00\x00^g\x04\x00\x00\x00\x00\x00_g\x04\x00\x00\x00\x00\x00hg\x04\x00\x00\x00\x00\x00~g\x04\x00\x00\x00\x00\x00'
+    b'\x7fg\x04\x00\x00\x00\x00\x00\x80g\x04\x00\x00\x00\x00\x00\x81g\x04\x00\x00\x00\x00\x00\x82g\x04\x00\x00\x00\x00\x00\x83g\x04\x00\x00\x00\x00\x00\x9dg\x04\x00\x00\x00\x00\x00\x9eg\x04\x00\x00\x00\x00\x00\x9fg\x04\x00\x00\x00\x00\x00\xa0g\x04\x00\x00\x00\x00\x00\xa1g\x04\x00\x00\x00\x00\x00\xa2g\x04\x00\x00\x00\x00\x00\xa3g\x04\x00\x00\x00\x00\x00'
+    b'\xa4g\x04\x00\x00\x00\x00\x00\xb0g\x04\x00\x00\x00\x00\x00\xd3g\x04\x00\x00\x00\x00\x00\xd4g\x04\x00\x00\x00\x00\x00\xe5g\x04\x00\x00\x00\x00\x00\x14h\x04\x00\x00\x00\x00\x00Gh\x04\x00\x00\x00\x00\x00rh\x04\x00\x00\x00\x00\x00\x85h\x04\x00\x00\x00\x00\x00\xe5h\x04\x00\x00\x00\x00\x00\xfeh\x04\x00\x00\x00\x00\x00Ki\x04\x00\x00\x00\x00\x00'
+    b'Li\x04\x00\x00\x00\x00\x00Mi\x04\x00\x00\x00\x00\x00Ri\x04\x00\x00\x00\x00\x00ri\x04\x00\x00\x00\x00\x00fj\x04\x00\x00\x00\x00\x00\x82j\x04\x00\x00\x00\x00\x00\xc3j\x04\x00\x00\x00\x00\x00\xefj\x04\x00\x00\x00\x00\x00\xf9j\x04\x00\x00\x00\x00\x00\x12k\x04\x00\x00\x00\x00\x00+k\x04\x00\x00\x00\x00\x00,k\x04\x00\x00\x00\x00\x00'
+    b'Sk\x04\x00\x00\x00\x00\x00\\k\x04\x00\x00\x00\x00\x00]k\x04\x00\x00\x00\x00\x00\x91k\x04\x00\x00\x00\x00\x00\xadk\x04\x00\x00\x00\x00\x00\xb5k\x04\x00\x00\x00\x00\x00\xb6k\x04\x00\x00\x00\x00\x00\xf5k\x04\x00\x00\x00\x00\x00\xfek\x04\x00\x00\x00\x00\x00dl\x04\x00\x00\x00\x00\x00\xd3l\x04\x00\x00\x00\x00\x00\rm\x04\x00\x00\x00\x00\x00'
+    b';m\x04\x00\x00\x00\x00\x00<m\x04\x00\x00\x00\x00\x00=m\x04\x00\x00\x00\x00\x00>m\x04\x00\x00\x00\x00\x00?m\x04\x00\x00\x00\x00\x00Rm\x04\x00\x00\x00\x00\x00Sm\x04\x00\x00\x00\x00\x00[m\x04\x00\x00\x00\x00\x00\x87m\x04\x00\x00\x00\x00\x00\x95m\x04\x00\x00\x00\x00\x00\x96m\x04\x00\x00\x00\x00\x00\x98m\x04\x00\x00\x00\x00\x00'
+    b'\x99m\x04\x00\x00\x00\x00\x00\x9am\x04\x00\x00\x00\x00\x00\x9bm\x04\x00\x00\x00\x00\x00\x9cm\x04\x00\x00\x00\x00\x00\x9dm\x04\x00\x00\x00\x00\x00\x9em\x04\x00\x00\x00\x00\x00\xa7m\x04\x00\x00\x00\x00\x00\xaem\x04\x00\x00\x00\x00\x00\x08n\x04\x00\x00\x00\x00\x00\x1bn\x04\x00\x00\x00\x00\x00\x1cn\x04\x00\x00\x00\x00\x00Ln\x04\x00\x00\x00\x00\x00'
+    b'Rn\x04\x00\x00\x00\x00\x00\xd5n\x04\x00\x00\x00\x00\x00\xdfn\x04\x00\x00\x00\x00\x00\xfbn\x04\x00\x00\x00\x00\x00\xfcn\x04\x00\x00\x00\x00\x00\xfdn\x04\x00\x00\x00\x00\x00\xfen\x04\x00\x00\x00\x00\x00\xffn\x04\x00\x00\x00\x00\x00\x00o\x04\x00\x00\x00\x00\x00\x01o\x04\x00\x00\x00\x00\x00\x02o\x04\x00\x00\x00\x00\x00\x03o\x04\x00\x00\x00\x00\x00'
+    b'\to\x04\x00\x00\x00\x00\x00\x10o\x04\x00\x00\x00\x00\x00\x12o\x04\x00\x00\x00\x00\x00\x15o\x04\x00\x00\x00\x00\x00Lo\x04\x00\x00\x00\x00\x00Mo\x04\x00\x00\x00\x00\x00\xd1o\x04\x00\x00\x00\x00\x00\xd2o\x04\x00\x00\x00\x00\x002p\x04\x00\x00\x00\x00\x006p\x04\x00\x00\x00\x00\x00jp\x04\x00\x00\x00\x00\x00\xbcp\x04\x00\x00\x00\x00\x00'
+    b'\xe6p\x04\x00\x00\x00\x00\x00\xf9p\x04\x00\x00\x00\x00\x00\xfap\x04\x00\x00\x00\x00\x00{q\x04\x00\x00\x00\x00\x00|q\x04\x00\x00\x00\x00\x00\x98q\x04\x00\x00\x00\x00\x00\xcaq\x04\x00\x00\x00\x00\x00\xd7q\x04\x00\x00\x00\x00\x00\xfdq\x04\x00\x00\x00\x00\x00\x02r\x04\x00\x00\x00\x00\x00\rr\x04\x00\x00\x00\x00\x00\xd2r\x04\x00\x00\x00\x00\x00'
+    b'\xdbr\x04\x00\x00\x00\x00\x00\ts\x04\x00\x00\x00\x00\x00\ns\x04\x00\x00\x00\x00\x00\x0bs\x04\x00\x00\x00\x00\x00\x0cs\x04\x00\x00\x00\x00\x00\rs\x04\x00\x00\x00\x00\x002s\x04\x00\x00\x00\x00\x00Ls\x04\x00\x00\x00\x00\x00Ms\x04\x00\x00\x00\x00\x00Ns\x04\x00\x00\x00\x00\x00`s\x04\x00\x00\x00\x00\x00]t\x04\x00\x00\x00\x00\x00'
+    b'\xe8t\x04\x00\x00\x00\x00\x00\x1cu\x04\x00\x00\x00\x00\x00ku\x04\x00\x00\x00\x00\x00lu\x04\x00\x00\x00\x00\x00\x93u\x04\x00\x00\x00\x00\x00\x94u\x04\x00\x00\x00\x00\x00\x95u\x04\x00\x00\x00\x00\x00\x96u\x04\x00\x00\x00\x00\x00\x97u\x04\x00\x00\x00\x00\x00\x98u\x04\x00\x00\x00\x00\x00\x9au\x04\x00\x00\x00\x00\x00\xaau\x04\x00\x00\x00\x00\x00'
+    b'\xabu\x04\x00\x00\x00\x00\x00\xe2u\x04\x00\x00\x00\x00\x008v\x04\x00\x00\x00\x00\x00\x94v\x04\x00\x00\x00\x00\x00\x95v\x04\x00\x00\x00\x00\x00\x97v\x04\x00\x00\x00\x00\x00\x98v\x04\x00\x00\x00\x00\x00\x99v\x04\x00\x00\x00\x00\x00\x9av\x04\x00\x00\x00\x00\x00\x9bv\x04\x00\x00\x00\x00\x00\x9cv\x04\x00\x00\x00\x00\x00\x9dv\x04\x00\x00\x00\x00\x00'
+    b'\x9ev\x04\x00\x00\x00\x00\x00\x9fv\x04\x00\x00\x00\x00\x00\xa0v\x04\x00\x00\x00\x00\x00\xa1v\x04\x00\x00\x00\x00\x00\xa2v\x04\x00\x00\x00\x00\x00\xdbv\x04\x00\x00\x00\x00\x00\x0cw\x04\x00\x00\x00\x00\x00rw\x04\x00\x00\x00\x00\x00\x94w\x04\x00\x00\x00\x00\x00\xc3y\x04\x00\x00\x00\x00\x00\xf0y\x04\x00\x00\x00\x00\x00\xabz\x04\x00\x00\x00\x00\x00'
+    b'\xcez\x04\x00\x00\x00\x00\x00\xf9z\x04\x00\x00\x00\x00\x00\xfbz\x04\x00\x00\x00\x00\x00P{\x04\x00\x00\x00\x00\x00Q{\x04\x00\x00\x00\x00\x00[{\x04\x00\x00\x00\x00\x00f{\x04\x00\x00\x00\x00\x00j{\x04\x00\x00\x00\x00\x00k{\x04\x00\x00\x00\x00\x00\x90{\x04\x00\x00\x00\x00\x00\xb9{\x04\x00\x00\x00\x00\x00\xc2{\x04\x00\x00\x00\x00\x00'
+    b"\xca{\x04\x00\x00\x00\x00\x00\xd0{\x04\x00\x00\x00\x00\x00\xf2{\x04\x00\x00\x00\x00\x00\xf4{\x04\x00\x00\x00\x00\x00'|\x04\x00\x00\x00\x00\x00p|\x04\x00\x00\x00\x00\x00s|\x04\x00\x00\x00\x00\x00\xa9|\x04\x00\x00\x00\x00\x00\xef|\x04\x00\x00\x00\x00\x00I}\x04\x00\x00\x00\x00\x00]}\x04\x00\x00\x00\x00\x00o}\x04\x00\x00\x00\x00\x00"
+    b'\xb2}\x04\x00\x00\x00\x00\x00\xb3}\x04\x00\x00\x00\x00\x00\xb4}\x04\x00\x00\x00\x00\x00\xb5}\x04\x00\x00\x00\x00\x00o~\x04\x00\x00\x00\x00\x00\x83~\x04\x00\x00\x00\x00\x00\xac~\x04\x00\x00\x00\x00\x00\x1e\x7f\x04\x00\x00\x00\x00\x00Z\x7f\x04\x00\x00\x00\x00\x00\\\x7f\x04\x00\x00\x00\x00\x00\xc0\x7f\x04\x00\x00\x00\x00\x00\xed\x7f\x04\x00\x00\x00\x00\x00'
+    b'\xee\x7f\x04\x00\x00\x00\x00\x00\xf0\x7f\x04\x00\x00\x00\x00\x00\xd5\x80\x04\x00\x00\x00\x00\x00\xa9\x81\x04\x00\x00\x00\x00\x00\xc0\x81\x04\x00\x00\x00\x00\x00\xd4\x81\x04\x00\x00\x00\x00\x00\xe7\x81\x04\x00\x00\x00\x00\x00\xec\x81\x04\x00\x00\x00\x00\x00\x16\x82\x04\x00\x00\x00\x00\x00C\x82\x04\x00\x00\x00\x00\x00X\x82\x04\x00\x00\x00\x00\x00Y\x82\x04\x00\x00\x00\x00\x00'
+    b'i\x82\x04\x00\x00\x00\x00\x00j\x82\x04\x00\x00\x00\x00\x00\xa1\x82\x04\x00\x00\x00\x00\x00\x8b\x83\x04\x00\x00\x00\x00\x00\x8d\x83\x04\x00\x00\x00\x00\x00\xe6\x84\x04\x00\x00\x00\x00\x00\x14\x85\x04\x00\x00\x00\x00\x00\xa3\x85\x04\x00\x00\x00\x00\x00 \x86\x04\x00\x00\x00\x00\x00&\x86\x04\x00\x00\x00\x00\x00(\x86\x04\x00\x00\x00\x00\x00^\x86\x04\x00\x00\x00\x00\x00'
+    b'`\x86\x04\x00\x00\x00\x00\x00b\x86\x04\x00\x00\x00\x00\x00d\x86\x04\x00\x00\x00\x00\x00f\x86\x04\x00\x00\x00\x00\x00h\x86\x04\x00\x00\x00\x00\x00j\x86\x04\x00\x00\x00\x00\x00k\x86\x04\x00\x00\x00\x00\x00\x88\x86\x04\x00\x00\x00\x00\x00\x89\x86\x04\x00\x00\x00\x00\x00\x8a\x86\x04\x00\x00\x00\x00\x00\x8b\x86\x04\x00\x00\x00\x00\x00\x8c\x86\x04\x00\x00\x00\x00\x00'
+    b'\x8d\x86\x04\x00\x00\x00\x00\x00\x8e\x86\x04\x00\x00\x00\x00\x00\x8f\x86\x04\x00\x00\x00\x00\x00\xb2\x86\x04\x00\x00\x00\x00\x00\x15\x87\x04\x00\x00\x00\x00\x00q\x87\x04\x00\x00\x00\x00\x00r\x87\x04\x00\x00\x00\x00\x00s\x87\x04\x00\x00\x00\x00\x00t\x87\x04\x00\x00\x00\x00\x00x\x87\x04\x00\x00\x00\x00\x00y\x87\x04\x00\x00\x00\x00\x00\xb5\x87\x04\x00\x00\x00\x00\x00'
+    b',\x88\x04\x00\x00\x00\x00\x00-\x88\x04\x00\x00\x00\x00\x00/\x88\x04\x00\x00\x00\x00\x00B\x88\x04\x00\x00\x00\x00\x00d\x88\x04\x00\x00\x00\x00\x00z\x88\x04\x00\x00\x00\x00\x00\x86\x88\x04\x00\x00\x00\x00\x00\x87\x88\x04\x00\x00\x00\x00\x00\x88\x88\x04\x00\x00\x00\x00\x00\x89\x88\x04\x00\x00\x00\x00\x00\x8a\x88\x04\x00\x00\x00\x00\x00\xc1\x88\x04\x00\x00\x00\x00\x00'
+    b'\x7f\x89\x04\x00\x00\x00\x00\x00\x10\x8a\x04\x00\x00\x00\x00\x00q\x8a\x04\x00\x00\x00\x00\x00\x04\x8b\x04\x00\x00\x00\x00\x00\x05\x8b\x04\x00\x00\x00\x00\x00\x18\x8b\x04\x00\x00\x00\x00\x00*\x8b\x04\x00\x00\x00\x00\x001\x8b\x04\x00\x00\x00\x00\x00y\x8b\x04\x00\x00\x00\x00\x00z\x8b\x04\x00\x00\x00\x00\x00\xb0\x8b\x04\x00\x00\x00\x00\x00\xfd\x8b\x04\x00\x00\x00\x00\x00'
+    b'R\x8c\x04\x00\x00\x00\x00\x00S\x8c\x04\x00\x00\x00\x00\x00\xee\x8c\x04\x00\x00\x00\x00\x00\xef\x8c\x04\x00\x00\x00\x00\x00p\x8d\x04\x00\x00\x00\x00\x00\xdf\x8d\x04\x00\x00\x00\x00\x00\xf8\x8d\x04\x00\x00\x00\x00\x00\x04\x8e\x04\x00\x00\x00\x00\x00H\x8e\x04\x00\x00\x00\x00\x00r\x8e\x04\x00\x00\x00\x00\x000\x8f\x04\x00\x00\x00\x00\x00D\x8f\x04\x00\x00\x00\x00\x00'
+    b'\x98\x8f\x04\x00\x00\x00\x00\x00\xd9\x8f\x04\x00\x00\x00\x00\x00\xdd\x8f\x04\x00\x00\x00\x00\x00\x93\x91\x04\x00\x00\x00\x00\x00\xf4\x91\x04\x00\x00\x00\x00\x00!\x92\x04\x00\x00\x00\x00\x00"\x92\x04\x00\x00\x00\x00\x00G\x92\x04\x00\x00\x00\x00\x00\x96\x92\x04\x00\x00\x00\x00\x00\x9a\x92\x04\x00\x00\x00\x00\x00\xdd\x92\x04\x00\x00\x00\x00\x00\xf6\x92\x04\x00\x00\x00\x00\x00'
+    b'\xfa\x92\x04\x00\x00\x00\x00\x00\t\x93\x04\x00\x00\x00\x00\x00\x1d\x93\x04\x00\x00\x00\x00\x00\xd6\x93\x04\x00\x00\x00\x00\x00\x1b\x94\x04\x00\x00\x00\x00\x00k\x94\x04\x00\x00\x00\x00\x00}\x94\x04\x00\x00\x00\x00\x00\xb9\x94\x04\x00\x00\x00\x00\x00\xc3\x94\x04\x00\x00\x00\x00\x00\xe0\x94\x04\x00\x00\x00\x00\x00<\x95\x04\x00\x00\x00\x00\x00\xfc\x95\x04\x00\x00\x00\x00\x00'
+    b'\xfd\x95\x04\x00\x00\x00\x00\x00\x1b\x96\x04\x00\x00\x00\x00\x00\xa7\x96\x04\x00\x00\x00\x00\x00\xdf\x96\x04\x00\x00\x00\x00\x00\xe0\x96\x04\x00\x00\x00\x00\x00#\x97\x04\x00\x00\x00\x00\x00_\x97\x04\x00\x00\x00\x00\x00\x89\x97\x04\x00\x00\x00\x00\x00\xda\x97\x04\x00\x00\x00\x00\x00\xdb\x97\x04\x00\x00\x00\x00\x00\xdc\x97\x04\x00\x00\x00\x00\x00\x14\x98\x04\x00\x00\x00\x00\x00'
+    b'1\x98\x04\x00\x00\x00\x00\x00V\x99\x04\x00\x00\x00\x00\x00Z\x99\x04\x00\x00\x00\x00\x00[\x99\x04\x00\x00\x00\x00\x00\\\x99\x04\x00\x00\x00\x00\x00g\x99\x04\x00\x00\x00\x00\x00h\x99\x04\x00\x00\x00\x00\x00i\x99\x04\x00\x00\x00\x00\x00j\x99\x04\x00\x00\x00\x00\x00k\x99\x04\x00\x00\x00\x00\x00l\x99\x04\x00\x00\x00\x00\x00m\x99\x04\x00\x00\x00\x00\x00'
+    b'n\x99\x04\x00\x00\x00\x00\x00o\x99\x04\x00\x00\x00\x00\x00p\x99\x04\x00\x00\x00\x00\x00r\x99\x04\x00\x00\x00\x00\x00s\x99\x04\x00\x00\x00\x00\x00t\x99\x04\x00\x00\x00\x00\x00u\x99\x04\x00\x00\x00\x00\x00v\x99\x04\x00\x00\x00\x00\x00w\x99\x04\x00\x00\x00\x00\x00x\x99\x04\x00\x00\x00\x00\x00z\x99\x04\x00\x00\x00\x00\x00{\x99\x04\x00\x00\x00\x00\x00'
+    b'|\x99\x04\x00\x00\x00\x00\x00}\x99\x04\x00\x00\x00\x00\x00~\x99\x04\x00\x00\x00\x00\x00\x7f\x99\x04\x00\x00\x00\x00\x00\x80\x99\x04\x00\x00\x00\x00\x00\x81\x99\x04\x00\x00\x00\x00\x00\x82\x99\x04\x00\x00\x00\x00\x00\x83\x99\x04\x00\x00\x00\x00\x00\x8f\x99\x04\x00\x00\x00\x00\x00\x90\x99\x04\x00\x00\x00\x00\x00\xec\x99\x04\x00\x00\x00\x00\x00\x1f\x9a\x04\x00\x00\x00\x00\x00'
+    b'\x85\x9b\x04\x00\x00\x00\x00\x00\x86\x9b\x04\x00\x00\x00\x00\x00\x87\x9b\x04\x00\x00\x00\x00\x00\x88\x9b\x04\x00\x00\x00\x00\x00\x89\x9b\x04\x00\x00\x00\x00\x00\xeb\x9b\x04\x00\x00\x00\x00\x00\xf8\x9b\x04\x00\x00\x00\x00\x00!\x9c\x04\x00\x00\x00\x00\x00%\x9c\x04\x00\x00\x00\x00\x008\x9c\x04\x00\x00\x00\x00\x00\xaf\x9c\x04\x00\x00\x00\x00\x00\x03\x9d\x04\x00\x00\x00\x00\x00'
+    b'Q\x9d\x04\x00\x00\x00\x00\x00\xc6\x9d\x04\x00\x00\x00\x00\x00\xf8\x9d\x04\x00\x00\x00\x00\x00\x14\x9e\x04\x00\x00\x00\x00\x00P\x9e\x04\x00\x00\x00\x00\x00R\x9e\x04\x00\x00\x00\x00\x00\xbf\x9e\x04\x00\x00\x00\x00\x00\xc0\x9e\x04\x00\x00\x00\x00\x00\xdc\x9e\x04\x00\x00\x00\x00\x00U\x9f\x04\x00\x00\x00\x00\x00\x98\x9f\x04\x00\x00\x00\x00\x00\xe4\x9f\x04\x00\x00\x00\x00\x00'
+    b'\x1f\xa0\x04\x00\x00\x00\x00\x00\xc4\xa0\x04\x00\x00\x00\x00\x00\xe3\xa1\x04\x00\x00\x00\x00\x00\xe4\xa1\x04\x00\x00\x00\x00\x00\xe5\xa1\x04\x00\x00\x00\x00\x00\xe6\xa1\x04\x00\x00\x00\x00\x00\\\xa2\x04\x00\x00\x00\x00\x00w\xa2\x04\x00\x00\x00\x00\x00\x8a\xa2\x04\x00\x00\x00\x00\x00!\xa3\x04\x00\x00\x00\x00\x00e\xa3\x04\x00\x00\x00\x00\x00\xbf\xa3\x04\x00\x00\x00\x00\x00'
+    b'\xc2\xa3\x04\x00\x00\x00\x00\x00\xd2\xa3\x04\x00\x00\x00\x00\x00\x94\xa4\x04\x00\x00\x00\x00\x00 \xa5\x04\x00\x00\x00\x00\x00!\xa5\x04\x00\x00\x00\x00\x00/\xa5\x04\x00\x00\x00\x00\x00\x9f\xa5\x04\x00\x00\x00\x00\x00\xa0\xa5\x04\x00\x00\x00\x00\x00\xa1\xa5\x04\x00\x00\x00\x00\x00\xa2\xa5\x04\x00\x00\x00\x00\x00\xa3\xa5\x04\x00\x00\x00\x00\x00\xa4\xa5\x04\x00\x00\x00\x00\x00'
+    b'\xa5\xa5\x04\x00\x00\x00\x00\x00\xa6\xa5\x04\x00\x00\x00\x00\x00\xc5\xa5\x04\x00\x00\x00\x00\x00\xc6\xa5\x04\x00\x00\x00\x00\x00\xc7\xa5\x04\x00\x00\x00\x00\x00\xd0\xa5\x04\x00\x00\x00\x00\x00:\xa6\x04\x00\x00\x00\x00\x00@\xa6\x04\x00\x00\x00\x00\x00D\xa6\x04\x00\x00\x00\x00\x00U\xa6\x04\x00\x00\x00\x00\x00r\xa6\x04\x00\x00\x00\x00\x00t\xa6\x04\x00\x00\x00\x00\x00'
+    b'\xae\xa7\x04\x00\x00\x00\x00\x00\xaf\xa7\x04\x00\x00\x00\x00\x00\xb0\xa7\x04\x00\x00\x00\x00\x00\xb1\xa7\x04\x00\x00\x00\x00\x00\xe5\xa7\x04\x00\x00\x00\x00\x00~\xa8\x04\x00\x00\x00\x00\x00\xa6\xa8\x04\x00\x00\x00\x00\x00\x93\xa9\x04\x00\x00\x00\x00\x00 \xab\x04\x00\x00\x00\x00\x00$\xab\x04\x00\x00\x00\x00\x00%\xab\x04\x00\x00\x00\x00\x00\x92\xab\x04\x00\x00\x00\x00\x00'
+    b'\x93\xab\x04\x00\x00\x00\x00\x00D\xad\x04\x00\x00\x00\x00\x00E\xad\x04\x00\x00\x00\x00\x00l\xad\x04\x00\x00\x00\x00\x00m\xad\x04\x00\x00\x00\x00\x00p\xad\x04\x00\x00\x00\x00\x00u\xad\x04\x00\x00\x00\x00\x00v\xad\x04\x00\x00\x00\x00\x00w\xad\x04\x00\x00\x00\x00\x00y\xad\x04\x00\x00\x00\x00\x00z\xad\x04\x00\x00\x00\x00\x00\xc2\xad\x04\x00\x00\x00\x00\x00'
+    b'\x19\xae\x04\x00\x00\x00\x00\x00\x1a\xae\x04\x00\x00\x00\x00\x00\x1b\xae\x04\x00\x00\x00\x00\x00[\xae\x04\x00\x00\x00\x00\x00\\\xae\x04\x00\x00\x00\x00\x00]\xae\x04\x00\x00\x00\x00\x00j\xae\x04\x00\x00\x00\x00\x00r\xae\x04\x00\x00\x00\x00\x00\x0f\xb0\x04\x00\x00\x00\x00\x00\x10\xb0\x04\x00\x00\x00\x00\x00\xe6\xb0\x04\x00\x00\x00\x00\x00\xe7\xb0\x04\x00\x00\x00\x00\x00'
+    b'\xe8\xb0\x04\x00\x00\x00\x00\x00\xe9\xb0\x04\x00\x00\x00\x00\x00\xea\xb0\x04\x00\x00\x00\x00\x00\xeb\xb0\x04\x00\x00\x00\x00\x00\xae\xb1\x04\x00\x00\x00\x00\x00\xaf\xb1\x04\x00\x00\x00\x00\x00\xb0\xb1\x04\x00\x00\x00\x00\x00\xb1\xb1\x04\x00\x00\x00\x00\x00\xb2\xb1\x04\x00\x00\x00\x00\x00\xb3\xb1\x04\x00\x00\x00\x00\x00\xb4\xb1\x04\x00\x00\x00\x00\x00\xb5\xb1\x04\x00\x00\x00\x00\x00'
+    b'\xb6\xb1\x04\x00\x00\x00\x00\x00\xb7\xb1\x04\x00\x00\x00\x00\x00\xb8\xb1\x04\x00\x00\x00\x00\x00\xb9\xb1\x04\x00\x00\x00\x00\x00\xba\xb1\x04\x00\x00\x00\x00\x00\xbb\xb1\x04\x00\x00\x00\x00\x00\xbc\xb1\x04\x00\x00\x00\x00\x00\xbd\xb1\x04\x00\x00\x00\x00\x00\xbe\xb1\x04\x00\x00\x00\x00\x00\xbf\xb1\x04\x00\x00\x00\x00\x00\r\xb2\x04\x00\x00\x00\x00\x001\xb2\x04\x00\x00\x00\x00\x00'
+    b'\xeb\xb2\x04\x00\x00\x00\x00\x00\x8e\xb3\x04\x00\x00\x00\x00\x00\xac\xb3\x04\x00\x00\x00\x00\x00\xfc\xb3\x04\x00\x00\x00\x00\x00c\xb4\x04\x00\x00\x00\x00\x00Q\xb5\x04\x00\x00\x00\x00\x00V\xb5\x04\x00\x00\x00\x00\x00X\xb5\x04\x00\x00\x00\x00\x00Y\xb5\x04\x00\x00\x00\x00\x00Z\xb5\x04\x00\x00\x00\x00\x00\x85\xb5\x04\x00\x00\x00\x00\x00\xe7\xb5\x04\x00\x00\x00\x00\x00'
+    b'\x02\xb6\x04\x00\x00\x00\x00\x00_\xb6\x04\x00\x00\x00\x00\x00`\xb6\x04\x00\x00\x00\x00\x00a\xb6\x04\x00\x00\x00\x00\x00l\xb6\x04\x00\x00\x00\x00\x00m\xb6\x04\x00\x00\x00\x00\x00\xf6\xb6\x04\x00\x00\x00\x00\x00n\xb7\x04\x00\x00\x00\x00\x00\x11\xb8\x04\x00\x00\x00\x00\x00\x12\xb8\x04\x00\x00\x00\x00\x00\x99\xb9\x04\x00\x00\x00\x00\x00\xd1\xb9\x04\x00\x00\x00\x00\x00'
+    b'\xf3\xba\x04\x00\x00\x00\x00\x00\xf8\xba\x04\x00\x00\x00\x00\x00!\xbb\x04\x00\x00\x00\x00\x00\x81\xbc\x04\x00\x00\x00\x00\x00\x84\xbc\x04\x00\x00\x00\x00\x00\xba\xbc\x04\x00\x00\x00\x00\x00\x8e\xbd\x04\x00\x00\x00\x00\x000\xbf\x04\x00\x00\x00\x00\x001\xbf\x04\x00\x00\x00\x00\x00\xe4\xbf\x04\x00\x00\x00\x00\x00\xe4\xc0\x04\x00\x00\x00\x00\x00\xf0\xc0\x04\x00\x00\x00\x00\x00'
+    b'\xf1\xc0\x04\x00\x00\x00\x00\x00\t\xc1\x04\x00\x00\x00\x00\x00F\xc3\x04\x00\x00\x00\x00\x00\xc7\xc3\x04\x00\x00\x00\x00\x00\xee\xc3\x04\x00\x00\x00\x00\x00n\xc4\x04\x00\x00\x00\x00\x00\x90\xc4\x04\x00\x00\x00\x00\x00\x92\xc4\x04\x00\x00\x00\x00\x00\xfc\xc4\x04\x00\x00\x00\x00\x00U\xc5\x04\x00\x00\x00\x00\x00\xab\xc5\x04\x00\x00\x00\x00\x00\xae\xc5\x04\x00\x00\x00\x00\x00'
+    b'\xaf\xc5\x04\x00\x00\x00\x00\x00\xb0\xc5\x04\x00\x00\x00\x00\x00\xb1\xc5\x04\x00\x00\x00\x00\x00\xc2\xc5\x04\x00\x00\x00\x00\x00[\xc6\x04\x00\x00\x00\x00\x00/\xc7\x04\x00\x00\x00\x00\x000\xc7\x04\x00\x00\x00\x00\x001\xc7\x04\x00\x00\x00\x00\x00x\xc7\x04\x00\x00\x00\x00\x00y\xc7\x04\x00\x00\x00\x00\x00z\xc7\x04\x00\x00\x00\x00\x00\xf8\xc7\x04\x00\x00\x00\x00\x00'
+    b'u\xc8\x04\x00\x00\x00\x00\x00v\xc8\x04\x00\x00\x00\x00\x00w\xc8\x04\x00\x00\x00\x00\x00x\xc8\x04\x00\x00\x00\x00\x00z\xc8\x04\x00\x00\x00\x00\x00{\xc8\x04\x00\x00\x00\x00\x00\x0e\xc9\x04\x00\x00\x00\x00\x00\x0f\xc9\x04\x00\x00\x00\x00\x00\x1a\xc9\x04\x00\x00\x00\x00\x00Z\xc9\x04\x00\x00\x00\x00\x00s\xc9\x04\x00\x00\x00\x00\x00t\xc9\x04\x00\x00\x00\x00\x00'
+    b'\xb1\xc9\x04\x00\x00\x00\x00\x00\xba\xc9\x04\x00\x00\x00\x00\x00\xb8\xca\x04\x00\x00\x00\x00\x00d\xcb\x04\x00\x00\x00\x00\x00\xe3\xcb\x04\x00\x00\x00\x00\x00\xb7\xcc\x04\x00\x00\x00\x00\x00\xb8\xcc\x04\x00\x00\x00\x00\x00\xb2\xcd\x04\x00\x00\x00\x00\x00\xd0\xcd\x04\x00\x00\x00\x00\x00\xf2\xcd\x04\x00\x00\x00\x00\x00\x95\xce\x04\x00\x00\x00\x00\x00\xd6\xce\x04\x00\x00\x00\x00\x00'
+    b'\xdc\xcf\x04\x00\x00\x00\x00\x00\xdd\xcf\x04\x00\x00\x00\x00\x00\x05\xd1\x04\x00\x00\x00\x00\x00W\xd1\x04\x00\x00\x00\x00\x00\xac\xd7\x04\x00\x00\x00\x00\x00\xd7\xd7\x04\x00\x00\x00\x00\x00\xd8\xd7\x04\x00\x00\x00\x00\x00X\xd8\x04\x00\x00\x00\x00\x00Y\xd8\x04\x00\x00\x00\x00\x00a\xd8\x04\x00\x00\x00\x00\x00b\xd8\x04\x00\x00\x00\x00\x00\x92\xd8\x04\x00\x00\x00\x00\x00'
+    b'\xe0\xd8\x04\x00\x00\x00\x00\x00J\xd9\x04\x00\x00\x00\x00\x00\xd5\xd9\x04\x00\x00\x00\x00\x00b\xda\x04\x00\x00\x00\x00\x00~\xda\x04\x00\x00\x00\x00\x00\x80\xda\x04\x00\x00\x00\x00\x00\x83\xda\x04\x00\x00\x00\x00\x00\x85\xda\x04\x00\x00\x00\x00\x00\xdd\xda\x04\x00\x00\x00\x00\x00\xdf\xda\x04\x00\x00\x00\x00\x00J\xdb\x04\x00\x00\x00\x00\x00K\xdb\x04\x00\x00\x00\x00\x00'
+    b"i\xdc\x04\x00\x00\x00\x00\x00\xf2\xdc\x04\x00\x00\x00\x00\x00'\xdd\x04\x00\x00\x00\x00\x00(\xdd\x04\x00\x00\x00\x00\x00C\xde\x04\x00\x00\x00\x00\x00\xec\xde\x04\x00\x00\x00\x00\x00\x08\xdf\x04\x00\x00\x00\x00\x00\x05\xe0\x04\x00\x00\x00\x00\x00\xcb\xe1\x04\x00\x00\x00\x00\x00/\xe2\x04\x00\x00\x00\x00\x000\xe2\x04\x00\x00\x00\x00\x001\xe2\x04\x00\x00\x00\x00\x00"
+    b'2\xe2\x04\x00\x00\x00\x00\x00\x99\xe2\x04\x00\x00\x00\x00\x00\x9a\xe2\x04\x00\x00\x00\x00\x00\x19\xe3\x04\x00\x00\x00\x00\x00J\xe3\x04\x00\x00\x00\x00\x00K\xe3\x04\x00\x00\x00\x00\x00\x9a\xe3\x04\x00\x00\x00\x00\x004\xe4\x04\x00\x00\x00\x00\x00\x8c\xe4\x04\x00\x00\x00\x00\x00\xbc\xe4\x04\x00\x00\x00\x00\x00\xc0\xe4\x04\x00\x00\x00\x00\x00\xc1\xe4\x04\x00\x00\x00\x00\x00'
+    b'\xc2\xe4\x04\x00\x00\x00\x00\x00\xc3\xe4\x04\x00\x00\x00\x00\x00\xc4\xe4\x04\x00\x00\x00\x00\x00\xc5\xe4\x04\x00\x00\x00\x00\x00(\xe5\x04\x00\x00\x00\x00\x00\x83\xe5\x04\x00\x00\x00\x00\x00\xcc\xe5\x04\x00\x00\x00\x00\x00<\xe6\x04\x00\x00\x00\x00\x00v\xe7\x04\x00\x00\x00\x00\x00]\xe8\x04\x00\x00\x00\x00\x00\xa2\xe8\x04\x00\x00\x00\x00\x00H\xeb\x04\x00\x00\x00\x00\x00'
+    b'I\xeb\x04\x00\x00\x00\x00\x00z\xeb\x04\x00\x00\x00\x00\x00\xb2\xec\x04\x00\x00\x00\x00\x00\xd9\xec\x04\x00\x00\x00\x00\x00\x11\xed\x04\x00\x00\x00\x00\x00\x13\xed\x04\x00\x00\x00\x00\x00\x15\xed\x04\x00\x00\x00\x00\x00=\xed\x04\x00\x00\x00\x00\x00?\xed\x04\x00\x00\x00\x00\x00A\xed\x04\x00\x00\x00\x00\x00C\xed\x04\x00\x00\x00\x00\x00E\xed\x04\x00\x00\x00\x00\x00'
+    b'\xcc\xed\x04\x00\x00\x00\x00\x00\xeb\xed\x04\x00\x00\x00\x00\x00\xf0\xed\x04\x00\x00\x00\x00\x006\xee\x04\x00\x00\x00\x00\x00\xe6\xee\x04\x00\x00\x00\x00\x00\x91\xef\x04\x00\x00\x00\x00\x00\x92\xef\x04\x00\x00\x00\x00\x00&\xf0\x04\x00\x00\x00\x00\x003\xf0\x04\x00\x00\x00\x00\x004\xf0\x04\x00\x00\x00\x00\x00\x8c\xf0\x04\x00\x00\x00\x00\x00\xaf\xf0\x04\x00\x00\x00\x00\x00'
+    b'\xcc\xf0\x04\x00\x00\x00\x00\x00\xf1\xf0\x04\x00\x00\x00\x00\x00\xf3\xf0\x04\x00\x00\x00\x00\x00\xf4\xf0\x04\x00\x00\x00\x00\x00\xf5\xf0\x04\x00\x00\x00\x00\x00\x00\xf1\x04\x00\x00\x00\x00\x00\r\xf1\x04\x00\x00\x00\x00\x00\xe3\xf1\x04\x00\x00\x00\x00\x00\xfc\xf1\x04\x00\x00\x00\x00\x00\xb4\xf2\x04\x00\x00\x00\x00\x00\x16\xf3\x04\x00\x00\x00\x00\x00F\xf3\x04\x00\x00\x00\x00\x00'
+    b'#\xf4\x04\x00\x00\x00\x00\x00*\xf5\x04\x00\x00\x00\x00\x00+\xf5\x04\x00\x00\x00\x00\x00,\xf5\x04\x00\x00\x00\x00\x00-\xf5\x04\x00\x00\x00\x00\x00\xa1\xf5\x04\x00\x00\x00\x00\x00:\xf8\x04\x00\x00\x00\x00\x00\x8c\xf8\x04\x00\x00\x00\x00\x00\xf4\xf8\x04\x00\x00\x00\x00\x00\xf5\xf8\x04\x00\x00\x00\x00\x00\xf6\xf8\x04\x00\x00\x00\x00\x00\xf7\xf8\x04\x00\x00\x00\x00\x00'
+    b'\xf8\xf8\x04\x00\x00\x00\x00\x00\x84\xf9\x04\x00\x00\x00\x00\x00 \xfb\x04\x00\x00\x00\x00\x00!\xfb\x04\x00\x00\x00\x00\x005\xfd\x04\x00\x00\x00\x00\x006\xfd\x04\x00\x00\x00\x00\x007\xfd\x04\x00\x00\x00\x00\x00S\xfd\x04\x00\x00\x00\x00\x00\x00\xfe\x04\x00\x00\x00\x00\x00\x01\xfe\x04\x00\x00\x00\x00\x00q\xfe\x04\x00\x00\x00\x00\x00\xac\xff\x04\x00\x00\x00\x00\x00'
+    b'N\x00\x05\x00\x00\x00\x00\x00\x8a\x00\x05\x00\x00\x00\x00\x00\xce\x00\x05\x00\x00\x00\x00\x00\x19\x01\x05\x00\x00\x00\x00\x003\x01\x05\x00\x00\x00\x00\x00a\x01\x05\x00\x00\x00\x00\x00b\x01\x05\x00\x00\x00\x00\x00P\x02\x05\x00\x00\x00\x00\x00\xd0\x02\x05\x00\x00\x00\x00\x003\x04\x05\x00\x00\x00\x00\x00>\x04\x05\x00\x00\x00\x00\x00f\x04\x05\x00\x00\x00\x00\x00'
+    b'p\x04\x05\x00\x00\x00\x00\x00\xbd\x05\x05\x00\x00\x00\x00\x00 \x06\x05\x00\x00\x00\x00\x00"\x06\x05\x00\x00\x00\x00\x00#\x06\x05\x00\x00\x00\x00\x00\x98\x06\x05\x00\x00\x00\x00\x00\xca\x06\x05\x00\x00\x00\x00\x00\n\x07\x05\x00\x00\x00\x00\x00L\x08\x05\x00\x00\x00\x00\x00\xc9\x0b\x05\x00\x00\x00\x00\x000\x0c\x05\x00\x00\x00\x00\x001\x0c\x05\x00\x00\x00\x00\x00'
+    b'3\x0c\x05\x00\x00\x00\x00\x00U\x0c\x05\x00\x00\x00\x00\x00V\x0c\x05\x00\x00\x00\x00\x00;\r\x05\x00\x00\x00\x00\x00\x0e\x0e\x05\x00\x00\x00\x00\x00E\x0e\x05\x00\x00\x00\x00\x00\xe1\x0e\x05\x00\x00\x00\x00\x00\xef\x0e\x05\x00\x00\x00\x00\x00\xf0\x0e\x05\x00\x00\x00\x00\x00\xf1\x0e\x05\x00\x00\x00\x00\x00\x84\x0f\x05\x00\x00\x00\x00\x00k\x10\x05\x00\x00\x00\x00\x00'
+    b'\xd7\x10\x05\x00\x00\x00\x00\x00\xd9\x10\x05\x00\x00\x00\x00\x00\xdb\x10\x05\x00\x00\x00\x00\x00\xdc\x10\x05\x00\x00\x00\x00\x00\xdd\x10\x05\x00\x00\x00\x00\x00\x1a\x11\x05\x00\x00\x00\x00\x006\x11\x05\x00\x00\x00\x00\x009\x11\x05\x00\x00\x00\x00\x00D\x11\x05\x00\x00\x00\x00\x00N\x11\x05\x00\x00\x00\x00\x00X\x11\x05\x00\x00\x00\x00\x00m\x11\x05\x00\x00\x00\x00\x00'
+    b'\xf2\x11\x05\x00\x00\x00\x00\x00\t\x12\x05\x00\x00\x00\x00\x00/\x12\x05\x00\x00\x00\x00\x00\x0c\x13\x05\x00\x00\x00\x00\x00\xcc\x13\x05\x00\x00\x00\x00\x00\xcd\x13\x05\x00\x00\x00\x00\x00}\x14\x05\x00\x00\x00\x00\x00\x92\x14\x05\x00\x00\x00\x00\x00G\x15\x05\x00\x00\x00\x00\x00n\x15\x05\x00\x00\x00\x00\x00\x8c\x15\x05\x00\x00\x00\x00\x00\xb5\x15\x05\x00\x00\x00\x00\x00'
+    b'\xb9\x15\x05\x00\x00\x00\x00\x00@\x16\x05\x00\x00\x00\x00\x00K\x16\x05\x00\x00\x00\x00\x00\x90\x16\x05\x00\x00\x00\x00\x00\xe2\x16\x05\x00\x00\x00\x00\x00;\x17\x05\x00\x00\x00\x00\x00b\x17\x05\x00\x00\x00\x00\x00f\x17\x05\x00\x00\x00\x00\x00v\x17\x05\x00\x00\x00\x00\x00\xc6\x17\x05\x00\x00\x00\x00\x00t\x18\x05\x00\x00\x00\x00\x00\x9c\x18\x05\x00\x00\x00\x00\x00'
+    b'\x9d\x18\x05\x00\x00\x00\x00\x00\x9e\x18\x05\x00\x00\x00\x00\x00\xa0\x18\x05\x00\x00\x00\x00\x00\xa1\x18\x05\x00\x00\x00\x00\x00\xce\x18\x05\x00\x00\x00\x00\x00\xf2\x18\x05\x00\x00\x00\x00\x00c\x19\x05\x00\x00\x00\x00\x00d\x19\x05\x00\x00\x00\x00\x00w\x19\x05\x00\x00\x00\x00\x00\xb2\x19\x05\x00\x00\x00\x00\x00\xef\x19\x05\x00\x00\x00\x00\x00 \x1a\x05\x00\x00\x00\x00\x00'
+    b'"\x1a\x05\x00\x00\x00\x00\x00#\x1a\x05\x00\x00\x00\x00\x00$\x1a\x05\x00\x00\x00\x00\x00}\x1a\x05\x00\x00\x00\x00\x00\x91\x1a\x05\x00\x00\x00\x00\x00\xab\x1a\x05\x00\x00\x00\x00\x00\xac\x1a\x05\x00\x00\x00\x00\x00\xe0\x1a\x05\x00\x00\x00\x00\x00\t\x1b\x05\x00\x00\x00\x00\x00\x0c\x1b\x05\x00\x00\x00\x00\x00\r\x1b\x05\x00\x00\x00\x00\x00\x0e\x1b\x05\x00\x00\x00\x00\x00'
+    b'E\x1b\x05\x00\x00\x00\x00\x00\x0e\x1c\x05\x00\x00\x00\x00\x00\x11\x1c\x05\x00\x00\x00\x00\x00\x9d\x1c\x05\x00\x00\x00\x00\x00\xa0\x1c\x05\x00\x00\x00\x00\x00&\x1d\x05\x00\x00\x00\x00\x00\xca\x1d\x05\x00\x00\x00\x00\x00\xd2\x1d\x05\x00\x00\x00\x00\x00\xe7\x1d\x05\x00\x00\x00\x00\x00\xe8\x1d\x05\x00\x00\x00\x00\x00\xf2\x1d\x05\x00\x00\x00\x00\x00\x1f\x1e\x05\x00\x00\x00\x00\x00'
+    b'(\x1e\x05\x00\x00\x00\x00\x00\x8c\x1e\x05\x00\x00\x00\x00\x00\x8d\x1e\x05\x00\x00\x00\x00\x00\xcb\x1e\x05\x00\x00\x00\x00\x00\xe4\x1e\x05\x00\x00\x00\x00\x00\xe5\x1e\x05\x00\x00\x00\x00\x00}\x1f\x05\x00\x00\x00\x00\x00\xa3\x1f\x05\x00\x00\x00\x00\x00u \x05\x00\x00\x00\x00\x00\xb1 \x05\x00\x00\x00\x00\x00\xbc \x05\x00\x00\x00\x00\x00Z"\x05\x00\x00\x00\x00\x00'
+    b'\x18#\x05\x00\x00\x00\x00\x00\x02%\x05\x00\x00\x00\x00\x00\xc7&\x05\x00\x00\x00\x00\x00\x9b)\x05\x00\x00\x00\x00\x00\x9c)\x05\x00\x00\x00\x00\x00\x9d)\x05\x00\x00\x00\x00\x00;*\x05\x00\x00\x00\x00\x00\xbd+\x05\x00\x00\x00\x00\x00 ,\x05\x00\x00\x00\x00\x00$,\x05\x00\x00\x00\x00\x00%,\x05\x00\x00\x00\x00\x005-\x05\x00\x00\x00\x00\x00'
+    b"C-\x05\x00\x00\x00\x00\x00j-\x05\x00\x00\x00\x00\x00p-\x05\x00\x00\x00\x00\x00\x84-\x05\x00\x00\x00\x00\x00\x88-\x05\x00\x00\x00\x00\x00\xd0-\x05\x00\x00\x00\x00\x00?.\x05\x00\x00\x00\x00\x00'0\x05\x00\x00\x00\x00\x00(0\x05\x00\x00\x00\x00\x0030\x05\x00\x00\x00\x00\x0040\x05\x00\x00\x00\x00\x00%1\x05\x00\x00\x00\x00\x00"
+    b'W1\x05\x00\x00\x00\x00\x00\xa12\x05\x00\x00\x00\x00\x00\xf32\x05\x00\x00\x00\x00\x00[3\x05\x00\x00\x00\x00\x00\xb23\x05\x00\x00\x00\x00\x00\xf53\x05\x00\x00\x00\x00\x00\xa34\x05\x00\x00\x00\x00\x00\xa54\x05\x00\x00\x00\x00\x00\xa74\x05\x00\x00\x00\x00\x00\xd14\x05\x00\x00\x00\x00\x00\x855\x05\x00\x00\x00\x00\x00z7\x05\x00\x00\x00\x00\x00'
+    b'\xed7\x05\x00\x00\x00\x00\x00\xd98\x05\x00\x00\x00\x00\x00\xda8\x05\x00\x00\x00\x00\x00:9\x05\x00\x00\x00\x00\x00B:\x05\x00\x00\x00\x00\x00^:\x05\x00\x00\x00\x00\x00\x8d<\x05\x00\x00\x00\x00\x00\x02=\x05\x00\x00\x00\x00\x00\r=\x05\x00\x00\x00\x00\x00 =\x05\x00\x00\x00\x00\x00\x82=\x05\x00\x00\x00\x00\x00\x9e=\x05\x00\x00\x00\x00\x00'
+    b'\xa2=\x05\x00\x00\x00\x00\x00\xa8=\x05\x00\x00\x00\x00\x00\xb5=\x05\x00\x00\x00\x00\x00\x14>\x05\x00\x00\x00\x00\x00\xab>\x05\x00\x00\x00\x00\x00>?\x05\x00\x00\x00\x00\x00x?\x05\x00\x00\x00\x00\x00u@\x05\x00\x00\x00\x00\x00v@\x05\x00\x00\x00\x00\x00\x90@\x05\x00\x00\x00\x00\x00\xa9@\x05\x00\x00\x00\x00\x00\xac@\x05\x00\x00\x00\x00\x00'
+    b'\x03A\x05\x00\x00\x00\x00\x00\xa7A\x05\x00\x00\x00\x00\x00\xa9A\x05\x00\x00\x00\x00\x00\xd8A\x05\x00\x00\x00\x00\x00@B\x05\x00\x00\x00\x00\x00vB\x05\x00\x00\x00\x00\x00wB\x05\x00\x00\x00\x00\x00\x8cB\x05\x00\x00\x00\x00\x00\xb2B\x05\x00\x00\x00\x00\x00\xb5B\x05\x00\x00\x00\x00\x00\xe3B\x05\x00\x00\x00\x00\x00\x19D\x05\x00\x00\x00\x00\x00'
+    b'\x1aD\x05\x00\x00\x00\x00\x00\x1bD\x05\x00\x00\x00\x00\x00\x1cD\x05\x00\x00\x00\x00\x00\x1dD\x05\x00\x00\x00\x00\x00\x1eD\x05\x00\x00\x00\x00\x00XD\x05\x00\x00\x00\x00\x00\xc6D\x05\x00\x00\x00\x00\x00\x0eE\x05\x00\x00\x00\x00\x00\xa4E\x05\x00\x00\x00\x00\x00\xa9E\x05\x00\x00\x00\x00\x00\xb9E\x05\x00\x00\x00\x00\x00\xc7E\x05\x00\x00\x00\x00\x00'
+    b'\x04F\x05\x00\x00\x00\x00\x00KF\x05\x00\x00\x00\x00\x00\x9dH\x05\x00\x00\x00\x00\x00\x9fH\x05\x00\x00\x00\x00\x00\xb1H\x05\x00\x00\x00\x00\x00\xb2H\x05\x00\x00\x00\x00\x00\x17I\x05\x00\x00\x00\x00\x00\x18I\x05\x00\x00\x00\x00\x00,I\x05\x00\x00\x00\x00\x00\xd5I\x05\x00\x00\x00\x00\x00)K\x05\x00\x00\x00\x00\x00*K\x05\x00\x00\x00\x00\x00'
+    b'\x86K\x05\x00\x00\x00\x00\x00#L\x05\x00\x00\x00\x00\x00\x0bO\x05\x00\x00\x00\x00\x00\xa3O\x05\x00\x00\x00\x00\x00\xa4O\x05\x00\x00\x00\x00\x00gP\x05\x00\x00\x00\x00\x00hP\x05\x00\x00\x00\x00\x00iP\x05\x00\x00\x00\x00\x00uP\x05\x00\x00\x00\x00\x00\x94P\x05\x00\x00\x00\x00\x00\xbbP\x05\x00\x00\x00\x00\x00\xe4P\x05\x00\x00\x00\x00\x00'
+    b'\xc8Q\x05\x00\x00\x00\x00\x00\xc0R\x05\x00\x00\x00\x00\x00\xc2R\x05\x00\x00\x00\x00\x00\xf8R\x05\x00\x00\x00\x00\x00*S\x05\x00\x00\x00\x00\x00\x91S\x05\x00\x00\x00\x00\x00\xdaT\x05\x00\x00\x00\x00\x00\xdbT\x05\x00\x00\x00\x00\x00\xe3T\x05\x00\x00\x00\x00\x00\x01U\x05\x00\x00\x00\x00\x00\tU\x05\x00\x00\x00\x00\x00}U\x05\x00\x00\x00\x00\x00'
+    b'\x9cU\x05\x00\x00\x00\x00\x00\xa5V\x05\x00\x00\x00\x00\x00;X\x05\x00\x00\x00\x00\x00<X\x05\x00\x00\x00\x00\x00=X\x05\x00\x00\x00\x00\x00>X\x05\x00\x00\x00\x00\x00\xcbX\x05\x00\x00\x00\x00\x00\xccX\x05\x00\x00\x00\x00\x00!Y\x05\x00\x00\x00\x00\x00\xd8Y\x05\x00\x00\x00\x00\x00\xd9Y\x05\x00\x00\x00\x00\x00\x00[\x05\x00\x00\x00\x00\x00'
+    b'%[\x05\x00\x00\x00\x00\x00\x8d[\x05\x00\x00\x00\x00\x00\x96[\x05\x00\x00\x00\x00\x00\x11\\\x05\x00\x00\x00\x00\x00\xc7\\\x05\x00\x00\x00\x00\x00\xe3\\\x05\x00\x00\x00\x00\x003]\x05\x00\x00\x00\x00\x00\xd5]\x05\x00\x00\x00\x00\x00~^\x05\x00\x00\x00\x00\x00\x85_\x05\x00\x00\x00\x00\x00"`\x05\x00\x00\x00\x00\x00/`\x05\x00\x00\x00\x00\x00'
+    b"\x7f`\x05\x00\x00\x00\x00\x00\x80`\x05\x00\x00\x00\x00\x00\xb4a\x05\x00\x00\x00\x00\x00~c\x05\x00\x00\x00\x00\x00\x05d\x05\x00\x00\x00\x00\x007d\x05\x00\x00\x00\x00\x00\xe0d\x05\x00\x00\x00\x00\x00'e\x05\x00\x00\x00\x00\x00\xe4e\x05\x00\x00\x00\x00\x00\xe6f\x05\x00\x00\x00\x00\x00\xe8f\x05\x00\x00\x00\x00\x00&g\x05\x00\x00\x00\x00\x00"
+    b"'g\x05\x00\x00\x00\x00\x00Wg\x05\x00\x00\x00\x00\x00\xb8g\x05\x00\x00\x00\x00\x00\xd5g\x05\x00\x00\x00\x00\x00\xdeg\x05\x00\x00\x00\x00\x00si\x05\x00\x00\x00\x00\x00\xa6i\x05\x00\x00\x00\x00\x00\xa7i\x05\x00\x00\x00\x00\x00\xeci\x05\x00\x00\x00\x00\x00\xf9j\x05\x00\x00\x00\x00\x00}k\x05\x00\x00\x00\x00\x00\x90l\x05\x00\x00\x00\x00\x00"
+    b'\xf6l\x05\x00\x00\x00\x00\x00\xfbm\x05\x00\x00\x00\x00\x00~n\x05\x00\x00\x00\x00\x00\x07o\x05\x00\x00\x00\x00\x00\xf0o\x05\x00\x00\x00\x00\x00\xb9p\x05\x00\x00\x00\x00\x00\xccp\x05\x00\x00\x00\x00\x00\xcdp\x05\x00\x00\x00\x00\x00\xcep\x05\x00\x00\x00\x00\x00Yq\x05\x00\x00\x00\x00\x00\x93q\x05\x00\x00\x00\x00\x00\xbfq\x05\x00\x00\x00\x00\x00'
+    b';r\x05\x00\x00\x00\x00\x00\xecs\x05\x00\x00\x00\x00\x00\xe1t\x05\x00\x00\x00\x00\x00\xe2t\x05\x00\x00\x00\x00\x00\xe3t\x05\x00\x00\x00\x00\x00\xe5t\x05\x00\x00\x00\x00\x00\xe6t\x05\x00\x00\x00\x00\x00\xe7t\x05\x00\x00\x00\x00\x00\xe8t\x05\x00\x00\x00\x00\x00Qu\x05\x00\x00\x00\x00\x00hu\x05\x00\x00\x00\x00\x00\xa8u\x05\x00\x00\x00\x00\x00'
+    b'\xabu\x05\x00\x00\x00\x00\x00vv\x05\x00\x00\x00\x00\x00\xc4v\x05\x00\x00\x00\x00\x00\xc7v\x05\x00\x00\x00\x00\x00\x91w\x05\x00\x00\x00\x00\x00\rx\x05\x00\x00\x00\x00\x00`x\x05\x00\x00\x00\x00\x00ax\x05\x00\x00\x00\x00\x00bx\x05\x00\x00\x00\x00\x00\xd7x\x05\x00\x00\x00\x00\x00Fy\x05\x00\x00\x00\x00\x00Gy\x05\x00\x00\x00\x00\x00'
+    b'\xcby\x05\x00\x00\x00\x00\x00\xe9y\x05\x00\x00\x00\x00\x00\x08{\x05\x00\x00\x00\x00\x00\n{\x05\x00\x00\x00\x00\x00\x0b{\x05\x00\x00\x00\x00\x00.{\x05\x00\x00\x00\x00\x000{\x05\x00\x00\x00\x00\x00\xc4{\x05\x00\x00\x00\x00\x00\x13|\x05\x00\x00\x00\x00\x00%|\x05\x00\x00\x00\x00\x00i|\x05\x00\x00\x00\x00\x00\x9f|\x05\x00\x00\x00\x00\x00'
+    b'\xa0|\x05\x00\x00\x00\x00\x00\xa5|\x05\x00\x00\x00\x00\x00\xeb|\x05\x00\x00\x00\x00\x00k\x7f\x05\x00\x00\x00\x00\x00m\x7f\x05\x00\x00\x00\x00\x00\xfb\x7f\x05\x00\x00\x00\x00\x00K\x80\x05\x00\x00\x00\x00\x00\x9b\x80\x05\x00\x00\x00\x00\x00\xc7\x80\x05\x00\x00\x00\x00\x00\x1f\x81\x05\x00\x00\x00\x00\x00\xf8\x81\x05\x00\x00\x00\x00\x00\x0c\x82\x05\x00\x00\x00\x00\x00'
+    b'4\x82\x05\x00\x00\x00\x00\x00H\x82\x05\x00\x00\x00\x00\x00\x98\x82\x05\x00\x00\x00\x00\x00\xda\x82\x05\x00\x00\x00\x00\x00\xb2\x83\x05\x00\x00\x00\x00\x00\xb3\x83\x05\x00\x00\x00\x00\x00\xc9\x83\x05\x00\x00\x00\x00\x00\xca\x83\x05\x00\x00\x00\x00\x00\xcb\x83\x05\x00\x00\x00\x00\x00\xcc\x83\x05\x00\x00\x00\x00\x00\xcd\x83\x05\x00\x00\x00\x00\x00\xce\x83\x05\x00\x00\x00\x00\x00'
+    b'\xcf\x83\x05\x00\x00\x00\x00\x00\xd0\x83\x05\x00\x00\x00\x00\x00\xd1\x83\x05\x00\x00\x00\x00\x00\xd2\x83\x05\x00\x00\x00\x00\x00\xd3\x83\x05\x00\x00\x00\x00\x00\xd4\x83\x05\x00\x00\x00\x00\x00\xd5\x83\x05\x00\x00\x00\x00\x00\xd6\x83\x05\x00\x00\x00\x00\x00\xd7\x83\x05\x00\x00\x00\x00\x00\xd8\x83\x05\x00\x00\x00\x00\x00\xd9\x83\x05\x00\x00\x00\x00\x00\xda\x83\x05\x00\x00\x00\x00\x00'
+    b'\xdb\x83\x05\x00\x00\x00\x00\x00\xdd\x83\x05\x00\x00\x00\x00\x00\xde\x83\x05\x00\x00\x00\x00\x00\xdf\x83\x05\x00\x00\x00\x00\x00\x91\x84\x05\x00\x00\x00\x00\x00\xb0\x84\x05\x00\x00\x00\x00\x00\xb1\x84\x05\x00\x00\x00\x00\x00\xaa\x87\x05\x00\x00\x00\x00\x00\xf5\x87\x05\x00\x00\x00\x00\x00\xf6\x87\x05\x00\x00\x00\x00\x00\x01\x88\x05\x00\x00\x00\x00\x00\x02\x88\x05\x00\x00\x00\x00\x00'
+    b'e\x89\x05\x00\x00\x00\x00\x00S\x8a\x05\x00\x00\x00\x00\x00e\x8a\x05\x00\x00\x00\x00\x00{\x8a\x05\x00\x00\x00\x00\x00\x9d\x8a\x05\x00\x00\x00\x00\x00^\x8b\x05\x00\x00\x00\x00\x00_\x8b\x05\x00\x00\x00\x00\x00\xc7\x8e\x05\x00\x00\x00\x00\x00_\x8f\x05\x00\x00\x00\x00\x00\xd4\x8f\x05\x00\x00\x00\x00\x00\xd5\x8f\x05\x00\x00\x00\x00\x00Z\x90\x05\x00\x00\x00\x00\x00'
+    b'h\x90\x05\x00\x00\x00\x00\x00i\x90\x05\x00\x00\x00\x00\x00j\x90\x05\x00\x00\x00\x00\x00{\x91\x05\x00\x00\x00\x00\x00#\x92\x05\x00\x00\x00\x00\x00$\x92\x05\x00\x00\x00\x00\x00%\x92\x05\x00\x00\x00\x00\x000\x92\x05\x00\x00\x00\x00\x001\x92\x05\x00\x00\x00\x00\x002\x92\x05\x00\x00\x00\x00\x004\x92\x05\x00\x00\x00\x00\x005\x92\x05\x00\x00\x00\x00\x00'
+    b'd\x92\x05\x00\x00\x00\x00\x00i\x92\x05\x00\x00\x00\x00\x00\xfb\x92\x05\x00\x00\x00\x00\x00\xfc\x92\x05\x00\x00\x00\x00\x00\xfd\x92\x05\x00\x00\x00\x00\x00\xfe\x92\x05\x00\x00\x00\x00\x00\xff\x92\x05\x00\x00\x00\x00\x00\n\x93\x05\x00\x00\x00\x00\x00u\x93\x05\x00\x00\x00\x00\x00y\x93\x05\x00\x00\x00\x00\x00\xaa\x93\x05\x00\x00\x00\x00\x00\xb6\x93\x05\x00\x00\x00\x00\x00'
+    b'\xd3\x94\x05\x00\x00\x00\x00\x00\xd4\x94\x05\x00\x00\x00\x00\x006\x95\x05\x00\x00\x00\x00\x005\x96\x05\x00\x00\x00\x00\x00\xc1\x96\x05\x00\x00\x00\x00\x00\xc2\x96\x05\x00\x00\x00\x00\x00\xed\x9e\x05\x00\x00\x00\x00\x00o\x9f\x05\x00\x00\x00\x00\x00s\x9f\x05\x00\x00\x00\x00\x00\xfa\x9f\x05\x00\x00\x00\x00\x00\xfb\x9f\x05\x00\x00\x00\x00\x00^\xa2\x05\x00\x00\x00\x00\x00'
+    b'\r\xa3\x05\x00\x00\x00\x00\x00I\xa4\x05\x00\x00\x00\x00\x00z\xa4\x05\x00\x00\x00\x00\x00\xa3\xa4\x05\x00\x00\x00\x00\x00\xa4\xa4\x05\x00\x00\x00\x00\x00\xa5\xa4\x05\x00\x00\x00\x00\x00\\\xa5\x05\x00\x00\x00\x00\x00]\xa5\x05\x00\x00\x00\x00\x00\xc6\xa6\x05\x00\x00\x00\x00\x00\xf8\xa6\x05\x00\x00\x00\x00\x00\xf9\xa6\x05\x00\x00\x00\x00\x00\xfa\xa6\x05\x00\x00\x00\x00\x00'
+    b'\xab\xa7\x05\x00\x00\x00\x00\x00\xac\xa7\x05\x00\x00\x00\x00\x00\xcb\xa7\x05\x00\x00\x00\x00\x00/\xa8\x05\x00\x00\x00\x00\x000\xa8\x05\x00\x00\x00\x00\x001\xa8\x05\x00\x00\x00\x00\x002\xa8\x05\x00\x00\x00\x00\x00\x7f\xa8\x05\x00\x00\x00\x00\x00i\xa9\x05\x00\x00\x00\x00\x00}\xa9\x05\x00\x00\x00\x00\x00~\xa9\x05\x00\x00\x00\x00\x00\x7f\xa9\x05\x00\x00\x00\x00\x00'
+    b"\xaf\xa9\x05\x00\x00\x00\x00\x00\xc3\xa9\x05\x00\x00\x00\x00\x00\xc4\xa9\x05\x00\x00\x00\x00\x00\xc5\xa9\x05\x00\x00\x00\x00\x00\xc8\xa9\x05\x00\x00\x00\x00\x00\xc9\xa9\x05\x00\x00\x00\x00\x00\t\xaa\x05\x00\x00\x00\x00\x00\x0b\xaa\x05\x00\x00\x00\x00\x00\r\xaa\x05\x00\x00\x00\x00\x00\x0e\xaa\x05\x00\x00\x00\x00\x00\x15\xaa\x05\x00\x00\x00\x00\x00'\xaa\x05\x00\x00\x00\x00\x00"
+    b'(\xaa\x05\x00\x00\x00\x00\x00*\xaa\x05\x00\x00\x00\x00\x00+\xaa\x05\x00\x00\x00\x00\x00,\xaa\x05\x00\x00\x00\x00\x00-\xaa\x05\x00\x00\x00\x00\x00.\xaa\x05\x00\x00\x00\x00\x000\xaa\x05\x00\x00\x00\x00\x001\xaa\x05\x00\x00\x00\x00\x002\xaa\x05\x00\x00\x00\x00\x003\xaa\x05\x00\x00\x00\x00\x004\xaa\x05\x00\x00\x00\x00\x00\xfc\xaa\x05\x00\x00\x00\x00\x00'
+    b'\xcd\xac\x05\x00\x00\x00\x00\x00\xce\xac\x05\x00\x00\x00\x00\x00\xcf\xac\x05\x00\x00\x00\x00\x00\t\xad\x05\x00\x00\x00\x00\x00\xa1\xad\x05\x00\x00\x00\x00\x00\xbc\xad\x05\x00\x00\x00\x00\x00n\xae\x05\x00\x00\x00\x00\x00\x0f\xaf\x05\x00\x00\x00\x00\x00\x10\xaf\x05\x00\x00\x00\x00\x00\x8d\xaf\x05\x00\x00\x00\x00\x00\xdf\xaf\x05\x00\x00\x00\x00\x00\x05\xb1\x05\x00\x00\x00\x00\x00'
+    b'\xc5\xb1\x05\x00\x00\x00\x00\x00\xc6\xb1\x05\x00\x00\x00\x00\x00\xe7\xb2\x05\x00\x00\x00\x00\x00\xee\xb2\x05\x00\x00\x00\x00\x00V\xb3\x05\x00\x00\x00\x00\x00u\xb3\x05\x00\x00\x00\x00\x00\xb1\xb4\x05\x00\x00\x00\x00\x00\xb2\xb4\x05\x00\x00\x00\x00\x00\xb3\xb4\x05\x00\x00\x00\x00\x00\xb4\xb4\x05\x00\x00\x00\x00\x00\xb5\xb4\x05\x00\x00\x00\x00\x00\xb6\xb4\x05\x00\x00\x00\x00\x00'
+    b"'\xb5\x05\x00\x00\x00\x00\x00\xe7\xb5\x05\x00\x00\x00\x00\x00\xe8\xb5\x05\x00\x00\x00\x00\x00\xe9\xb5\x05\x00\x00\x00\x00\x00\xea\xb5\x05\x00\x00\x00\x00\x00\xeb\xb5\x05\x00\x00\x00\x00\x00\xd0\xb6\x05\x00\x00\x00\x00\x00\xb4\xb7\x05\x00\x00\x00\x00\x00\xb7\xb7\x05\x00\x00\x00\x00\x00\xb8\xb7\x05\x00\x00\x00\x00\x00\xb9\xb7\x05\x00\x00\x00\x00\x00\xba\xb7\x05\x00\x00\x00\x00\x00"
+    b'\xbb\xb7\x05\x00\x00\x00\x00\x00 \xb8\x05\x00\x00\x00\x00\x00!\xb8\x05\x00\x00\x00\x00\x00"\xb8\x05\x00\x00\x00\x00\x00#\xb8\x05\x00\x00\x00\x00\x00$\xb8\x05\x00\x00\x00\x00\x00%\xb8\x05\x00\x00\x00\x00\x00&\xb8\x05\x00\x00\x00\x00\x00\'\xb8\x05\x00\x00\x00\x00\x00(\xb8\x05\x00\x00\x00\x00\x00)\xb8\x05\x00\x00\x00\x00\x00*\xb8\x05\x00\x00\x00\x00\x00'
+    b'+\xb8\x05\x00\x00\x00\x00\x00,\xb8\x05\x00\x00\x00\x00\x00-\xb8\x05\x00\x00\x00\x00\x00\xbe\xb8\x05\x00\x00\x00\x00\x00\xf0\xb8\x05\x00\x00\x00\x00\x00d\xb9\x05\x00\x00\x00\x00\x00\xed\xb9\x05\x00\x00\x00\x00\x006\xbb\x05\x00\x00\x00\x00\x00v\xbc\x05\x00\x00\x00\x00\x00\xaa\xbc\x05\x00\x00\x00\x00\x00\x1f\xbd\x05\x00\x00\x00\x00\x00 \xbd\x05\x00\x00\x00\x00\x00'
+    b'+\xbd\x05\x00\x00\x00\x00\x00-\xbd\x05\x00\x00\x00\x00\x00\xa0\xbd\x05\x00\x00\x00\x00\x00\xd7\xbd\x05\x00\x00\x00\x00\x00\xd8\xbd\x05\x00\x00\x00\x00\x00S\xbe\x05\x00\x00\x00\x00\x00T\xbe\x05\x00\x00\x00\x00\x00\x81\xbe\x05\x00\x00\x00\x00\x00B\xc0\x05\x00\x00\x00\x00\x00\x91\xc0\x05\x00\x00\x00\x00\x00\x92\xc0\x05\x00\x00\x00\x00\x00\xf0\xc0\x05\x00\x00\x00\x00\x00'
+    b'\xf1\xc0\x05\x00\x00\x00\x00\x00\xf2\xc0\x05\x00\x00\x00\x00\x00\xf3\xc0\x05\x00\x00\x00\x00\x00\xf4\xc0\x05\x00\x00\x00\x00\x00\xf5\xc0\x05\x00\x00\x00\x00\x00\xeb\xc1\x05\x00\x00\x00\x00\x00\xec\xc1\x05\x00\x00\x00\x00\x00\xed\xc1\x05\x00\x00\x00\x00\x00\xee\xc1\x05\x00\x00\x00\x00\x00\xef\xc1\x05\x00\x00\x00\x00\x00\xf0\xc1\x05\x00\x00\x00\x00\x00\xf1\xc1\x05\x00\x00\x00\x00\x00'
+    b'\xfc\xc1\x05\x00\x00\x00\x00\x00\xfd\xc1\x05\x00\x00\x00\x00\x00\xf2\xc3\x05\x00\x00\x00\x00\x00\xf3\xc3\x05\x00\x00\x00\x00\x00\xf4\xc3\x05\x00\x00\x00\x00\x00\xf5\xc3\x05\x00\x00\x00\x00\x00\xf7\xc3\x05\x00\x00\x00\x00\x00\x00\xc4\x05\x00\x00\x00\x00\x00z\xc5\x05\x00\x00\x00\x00\x00{\xc5\x05\x00\x00\x00\x00\x00\x98\xc5\x05\x00\x00\x00\x00\x00\xb5\xc7\x05\x00\x00\x00\x00\x00'
+    b'\xb6\xc7\x05\x00\x00\x00\x00\x00\x07\xc9\x05\x00\x00\x00\x00\x00\x08\xc9\x05\x00\x00\x00\x00\x00\t\xc9\x05\x00\x00\x00\x00\x00\n\xc9\x05\x00\x00\x00\x00\x00\x0b\xc9\x05\x00\x00\x00\x00\x00\x0c\xc9\x05\x00\x00\x00\x00\x00\r\xc9\x05\x00\x00\x00\x00\x00\x0e\xc9\x05\x00\x00\x00\x00\x00\x0f\xc9\x05\x00\x00\x00\x00\x00\x10\xc9\x05\x00\x00\x00\x00\x00\x11\xc9\x05\x00\x00\x00\x00\x00'
+    b'\x12\xc9\x05\x00\x00\x00\x00\x00\x13\xc9\x05\x00\x00\x00\x00\x00\x14\xc9\x05\x00\x00\x00\x00\x00\x16\xc9\x05\x00\x00\x00\x00\x00\x17\xc9\x05\x00\x00\x00\x00\x00\x18\xc9\x05\x00\x00\x00\x00\x00\x19\xc9\x05\x00\x00\x00\x00\x00\x1a\xc9\x05\x00\x00\x00\x00\x00\x1b\xc9\x05\x00\x00\x00\x00\x00\x1c\xc9\x05\x00\x00\x00\x00\x00\x1d\xc9\x05\x00\x00\x00\x00\x00\x1e\xc9\x05\x00\x00\x00\x00\x00'
+    b'*\xc9\x05\x00\x00\x00\x00\x00\xe6\xca\x05\x00\x00\x00\x00\x00\xef\xca\x05\x00\x00\x00\x00\x00\x07\xcb\x05\x00\x00\x00\x00\x00\xb5\xcb\x05\x00\x00\x00\x00\x00\xc2\xcb\x05\x00\x00\x00\x00\x00\xc3\xcb\x05\x00\x00\x00\x00\x00l\xcc\x05\x00\x00\x00\x00\x00T\xcd\x05\x00\x00\x00\x00\x00\xde\xcd\x05\x00\x00\x00\x00\x00\xdf\xcd\x05\x00\x00\x00\x00\x00\xe0\xcd\x05\x00\x00\x00\x00\x00'
+    b'\xff\xcd\x05\x00\x00\x00\x00\x00\x00\xce\x05\x00\x00\x00\x00\x00\x01\xce\x05\x00\x00\x00\x00\x00\x02\xce\x05\x00\x00\x00\x00\x00\x03\xce\x05\x00\x00\x00\x00\x00\x04\xce\x05\x00\x00\x00\x00\x00\x05\xce\x05\x00\x00\x00\x00\x00\x06\xce\x05\x00\x00\x00\x00\x00\x07\xce\x05\x00\x00\x00\x00\x00\x08\xce\x05\x00\x00\x00\x00\x00\t\xce\x05\x00\x00\x00\x00\x00\n\xce\x05\x00\x00\x00\x00\x00'
+    b'\x0b\xce\x05\x00\x00\x00\x00\x00\x0c\xce\x05\x00\x00\x00\x00\x00\r\xce\x05\x00\x00\x00\x00\x00\x0e\xce\x05\x00\x00\x00\x00\x00\xaa\xce\x05\x00\x00\x00\x00\x00\xab\xce\x05\x00\x00\x00\x00\x00\xf1\xce\x05\x00\x00\x00\x00\x00\xcd\xcf\x05\x00\x00\x00\x00\x00\xeb\xcf\x05\x00\x00\x00\x00\x00\x99\xd0\x05\x00\x00\x00\x00\x00\x1d\xd1\x05\x00\x00\x00\x00\x00e\xd1\x05\x00\x00\x00\x00\x00'
+    b'g\xd1\x05\x00\x00\x00\x00\x00h\xd1\x05\x00\x00\x00\x00\x00\x8a\xd2\x05\x00\x00\x00\x00\x00\x8b\xd2\x05\x00\x00\x00\x00\x00\xa0\xd2\x05\x00\x00\x00\x00\x00\xa1\xd2\x05\x00\x00\x00\x00\x00\xd6\xd2\x05\x00\x00\x00\x00\x00\xdf\xd2\x05\x00\x00\x00\x00\x00\xe0\xd2\x05\x00\x00\x00\x00\x00\xe1\xd2\x05\x00\x00\x00\x00\x00_\xd3\x05\x00\x00\x00\x00\x00{\xd3\x05\x00\x00\x00\x00\x00'
+    b'\xaf\xd3\x05\x00\x00\x00\x00\x00\xb6\xd3\x05\x00\x00\x00\x00\x00\xb8\xd3\x05\x00\x00\x00\x00\x00\x9d\xd4\x05\x00\x00\x00\x00\x00\x9e\xd4\x05\x00\x00\x00\x00\x00\x9f\xd4\x05\x00\x00\x00\x00\x00\xa3\xd4\x05\x00\x00\x00\x00\x00\xa4\xd4\x05\x00\x00\x00\x00\x00\xa5\xd4\x05\x00\x00\x00\x00\x00%\xd5\x05\x00\x00\x00\x00\x00\x8e\xd5\x05\x00\x00\x00\x00\x00\xdb\xd6\x05\x00\x00\x00\x00\x00'
+    b'\x02\xd7\x05\x00\x00\x00\x00\x009\xd7\x05\x00\x00\x00\x00\x00:\xd7\x05\x00\x00\x00\x00\x00;\xd7\x05\x00\x00\x00\x00\x00<\xd7\x05\x00\x00\x00\x00\x00=\xd7\x05\x00\x00\x00\x00\x00>\xd7\x05\x00\x00\x00\x00\x00?\xd7\x05\x00\x00\x00\x00\x00@\xd7\x05\x00\x00\x00\x00\x00A\xd7\x05\x00\x00\x00\x00\x00B\xd7\x05\x00\x00\x00\x00\x00C\xd7\x05\x00\x00\x00\x00\x00'
+    b'D\xd7\x05\x00\x00\x00\x00\x00E\xd7\x05\x00\x00\x00\x00\x00F\xd7\x05\x00\x00\x00\x00\x00G\xd7\x05\x00\x00\x00\x00\x00H\xd7\x05\x00\x00\x00\x00\x00\xdd\xd7\x05\x00\x00\x00\x00\x00\xde\xd7\x05\x00\x00\x00\x00\x00\xef\xd7\x05\x00\x00\x00\x00\x00\xba\xd8\x05\x00\x00\x00\x00\x00\xe4\xd8\x05\x00\x00\x00\x00\x00\xfd\xd8\x05\x00\x00\x00\x00\x00\x05\xd9\x05\x00\x00\x00\x00\x00'
+    b'X\xd9\x05\x00\x00\x00\x00\x00\xe5\xd9\x05\x00\x00\x00\x00\x00Y\xda\x05\x00\x00\x00\x00\x00k\xdb\x05\x00\x00\x00\x00\x00\xb8\xdb\x05\x00\x00\x00\x00\x00\xcd\xdb\x05\x00\x00\x00\x00\x00\xce\xdb\x05\x00\x00\x00\x00\x00\xb7\xdc\x05\x00\x00\x00\x00\x00)\xdd\x05\x00\x00\x00\x00\x00r\xde\x05\x00\x00\x00\x00\x00\x8c\xde\x05\x00\x00\x00\x00\x00\xc1\xde\x05\x00\x00\x00\x00\x00'
+    b'\x05\xdf\x05\x00\x00\x00\x00\x00\xb0\xe0\x05\x00\x00\x00\x00\x00\xe1\xe0\x05\x00\x00\x00\x00\x00\xe6\xe0\x05\x00\x00\x00\x00\x00\xf7\xe0\x05\x00\x00\x00\x00\x009\xe2\x05\x00\x00\x00\x00\x00\xac\xe2\x05\x00\x00\x00\x00\x00G\xe3\x05\x00\x00\x00\x00\x00H\xe3\x05\x00\x00\x00\x00\x00J\xe3\x05\x00\x00\x00\x00\x00\xd2\xe5\x05\x00\x00\x00\x00\x00K\xe6\x05\x00\x00\x00\x00\x00'
+    b'\x02\xe7\x05\x00\x00\x00\x00\x00\x03\xe7\x05\x00\x00\x00\x00\x00\x07\xe8\x05\x00\x00\x00\x00\x00\t\xe8\x05\x00\x00\x00\x00\x00!\xe8\x05\x00\x00\x00\x00\x00V\xe8\x05\x00\x00\x00\x00\x00z\xe8\x05\x00\x00\x00\x00\x008\xea\x05\x00\x00\x00\x00\x00\xa0\xea\x05\x00\x00\x00\x00\x00\xe2\xea\x05\x00\x00\x00\x00\x00\xe3\xea\x05\x00\x00\x00\x00\x00\xe4\xea\x05\x00\x00\x00\x00\x00'
+    b'\xe5\xea\x05\x00\x00\x00\x00\x00\xe6\xea\x05\x00\x00\x00\x00\x00\xe7\xea\x05\x00\x00\x00\x00\x00\xe8\xea\x05\x00\x00\x00\x00\x00\xe9\xea\x05\x00\x00\x00\x00\x00\xea\xea\x05\x00\x00\x00\x00\x00\xeb\xea\x05\x00\x00\x00\x00\x00\xee\xea\x05\x00\x00\x00\x00\x00\xf5\xea\x05\x00\x00\x00\x00\x00\xf8\xea\x05\x00\x00\x00\x00\x00\xf9\xea\x05\x00\x00\x00\x00\x00*\xeb\x05\x00\x00\x00\x00\x00'
+    b'j\xeb\x05\x00\x00\x00\x00\x00{\xec\x05\x00\x00\x00\x00\x00\x9e\xec\x05\x00\x00\x00\x00\x00\xa1\xec\x05\x00\x00\x00\x00\x00\xfd\xec\x05\x00\x00\x00\x00\x00\xfe\xec\x05\x00\x00\x00\x00\x00\x06\xed\x05\x00\x00\x00\x00\x00/\xed\x05\x00\x00\x00\x00\x00\x89\xed\x05\x00\x00\x00\x00\x00\x8b\xed\x05\x00\x00\x00\x00\x00\x00\xef\x05\x00\x00\x00\x00\x00\x01\xef\x05\x00\x00\x00\x00\x00'
+    b'\x02\xef\x05\x00\x00\x00\x00\x00\x03\xef\x05\x00\x00\x00\x00\x00r\xef\x05\x00\x00\x00\x00\x00\x81\xef\x05\x00\x00\x00\x00\x00\xa9\xef\x05\x00\x00\x00\x00\x00\xfc\xef\x05\x00\x00\x00\x00\x00\xff\xef\x05\x00\x00\x00\x00\x00D\xf0\x05\x00\x00\x00\x00\x00\xa3\xf0\x05\x00\x00\x00\x00\x00\xa4\xf0\x05\x00\x00\x00\x00\x00\xa5\xf0\x05\x00\x00\x00\x00\x00\xa7\xf0\x05\x00\x00\x00\x00\x00'
+    b'\xa8\xf0\x05\x00\x00\x00\x00\x00\xa9\xf0\x05\x00\x00\x00\x00\x00\xc7\xf0\x05\x00\x00\x00\x00\x00\xe0\xf0\x05\x00\x00\x00\x00\x00\xff\xf0\x05\x00\x00\x00\x00\x001\xf1\x05\x00\x00\x00\x00\x00\xb8\xf2\x05\x00\x00\x00\x00\x00\xec\xf2\x05\x00\x00\x00\x00\x00\xee\xf2\x05\x00\x00\x00\x00\x00\xef\xf2\x05\x00\x00\x00\x00\x00\xfc\xf2\x05\x00\x00\x00\x00\x00x\xf3\x05\x00\x00\x00\x00\x00'
+    b'&\xf4\x05\x00\x00\x00\x00\x00h\xf4\x05\x00\x00\x00\x00\x00i\xf4\x05\x00\x00\x00\x00\x00\xbb\xf4\x05\x00\x00\x00\x00\x00\x93\xf5\x05\x00\x00\x00\x00\x00\xb0\xf5\x05\x00\x00\x00\x00\x00\xb2\xf5\x05\x00\x00\x00\x00\x00\xb3\xf5\x05\x00\x00\x00\x00\x00\xb5\xf5\x05\x00\x00\x00\x00\x00\xb6\xf5\x05\x00\x00\x00\x00\x00\xb9\xf5\x05\x00\x00\x00\x00\x00\xe3\xf5\x05\x00\x00\x00\x00\x00'
+    b'\xff\xf5\x05\x00\x00\x00\x00\x00\x00\xf6\x05\x00\x00\x00\x00\x00\x02\xf6\x05\x00\x00\x00\x00\x00\x15\xf6\x05\x00\x00\x00\x00\x00\x16\xf6\x05\x00\x00\x00\x00\x00\xa2\xf6\x05\x00\x00\x00\x00\x00\xba\xf6\x05\x00\x00\x00\x00\x00\xf7\xf6\x05\x00\x00\x00\x00\x00\xfa\xf6\x05\x00\x00\x00\x00\x00\xfb\xf6\x05\x00\x00\x00\x00\x00U\xf7\x05\x00\x00\x00\x00\x00\xfd\xf8\x05\x00\x00\x00\x00\x00'
+    b">\xf9\x05\x00\x00\x00\x00\x00\x8e\xf9\x05\x00\x00\x00\x00\x00\x9e\xf9\x05\x00\x00\x00\x00\x00'\xfa\x05\x00\x00\x00\x00\x00(\xfa\x05\x00\x00\x00\x00\x00)\xfa\x05\x00\x00\x00\x00\x00]\xfa\x05\x00\x00\x00\x00\x00\x9d\xfa\x05\x00\x00\x00\x00\x00\t\xfb\x05\x00\x00\x00\x00\x00\xec\xfb\x05\x00\x00\x00\x00\x00L\xfc\x05\x00\x00\x00\x00\x00\xbd\xfc\x05\x00\x00\x00\x00\x00"
+    b'\xbe\xfc\x05\x00\x00\x00\x00\x00\xbf\xfc\x05\x00\x00\x00\x00\x00\xc0\xfc\x05\x00\x00\x00\x00\x00\xf3\xfc\x05\x00\x00\x00\x00\x00/\xfd\x05\x00\x00\x00\x00\x00\x8c\xfd\x05\x00\x00\x00\x00\x00\x91\xfd\x05\x00\x00\x00\x00\x00\xd4\xfd\x05\x00\x00\x00\x00\x00\xd5\xfd\x05\x00\x00\x00\x00\x00\x10\xfe\x05\x00\x00\x00\x00\x00\xcf\xfe\x05\x00\x00\x00\x00\x00\xe4\xfe\x05\x00\x00\x00\x00\x00'
+    b'\xe5\xfe\x05\x00\x00\x00\x00\x00\xf2\xfe\x05\x00\x00\x00\x00\x00\xf3\xfe\x05\x00\x00\x00\x00\x00k\xff\x05\x00\x00\x00\x00\x00\xdb\xff\x05\x00\x00\x00\x00\x00#\x00\x06\x00\x00\x00\x00\x00%\x00\x06\x00\x00\x00\x00\x00/\x00\x06\x00\x00\x00\x00\x00B\x00\x06\x00\x00\x00\x00\x00C\x00\x06\x00\x00\x00\x00\x00D\x00\x06\x00\x00\x00\x00\x00G\x00\x06\x00\x00\x00\x00\x00'
+    b'H\x00\x06\x00\x00\x00\x00\x00I\x00\x06\x00\x00\x00\x00\x00K\x00\x06\x00\x00\x00\x00\x00L\x00\x06\x00\x00\x00\x00\x00M\x00\x06\x00\x00\x00\x00\x00N\x00\x06\x00\x00\x00\x00\x00O\x00\x06\x00\x00\x00\x00\x00P\x00\x06\x00\x00\x00\x00\x00Q\x00\x06\x00\x00\x00\x00\x00`\x00\x06\x00\x00\x00\x00\x00\xa2\x00\x06\x00\x00\x00\x00\x00\xb0\x00\x06\x00\x00\x00\x00\x00'
+    b'\xbb\x00\x06\x00\x00\x00\x00\x00\xbc\x00\x06\x00\x00\x00\x00\x00\xbd\x00\x06\x00\x00\x00\x00\x00\xc7\x00\x06\x00\x00\x00\x00\x00\xd8\x00\x06\x00\x00\x00\x00\x00T\x01\x06\x00\x00\x00\x00\x00\x94\x01\x06\x00\x00\x00\x00\x00\x95\x01\x06\x00\x00\x00\x00\x00\x96\x01\x06\x00\x00\x00\x00\x00\xb6\x01\x06\x00\x00\x00\x00\x00\xd0\x01\x06\x00\x00\x00\x00\x00\xf6\x01\x06\x00\x00\x00\x00\x00'
+    b'\x04\x02\x06\x00\x00\x00\x00\x00\x05\x02\x06\x00\x00\x00\x00\x00\n\x02\x06\x00\x00\x00\x00\x00s\x02\x06\x00\x00\x00\x00\x00\xcf\x02\x06\x00\x00\x00\x00\x006\x03\x06\x00\x00\x00\x00\x00A\x03\x06\x00\x00\x00\x00\x00\x8b\x04\x06\x00\x00\x00\x00\x00\xd9\x04\x06\x00\x00\x00\x00\x00G\x05\x06\x00\x00\x00\x00\x00h\x05\x06\x00\x00\x00\x00\x00\xa1\x05\x06\x00\x00\x00\x00\x00'
+    b'\x15\x06\x06\x00\x00\x00\x00\x00E\x06\x06\x00\x00\x00\x00\x00H\x06\x06\x00\x00\x00\x00\x00I\x06\x06\x00\x00\x00\x00\x00J\x06\x06\x00\x00\x00\x00\x00K\x06\x06\x00\x00\x00\x00\x00\x8b\x06\x06\x00\x00\x00\x00\x00\x85\x07\x06\x00\x00\x00\x00\x00&\x08\x06\x00\x00\x00\x00\x00\x94\x08\x06\x00\x00\x00\x00\x00\x95\x08\x06\x00\x00\x00\x00\x00\xa6\x08\x06\x00\x00\x00\x00\x00'
+    b'\x13\n\x06\x00\x00\x00\x00\x00\x14\n\x06\x00\x00\x00\x00\x00\x1c\n\x06\x00\x00\x00\x00\x00\x1f\n\x06\x00\x00\x00\x00\x00 \n\x06\x00\x00\x00\x00\x00!\n\x06\x00\x00\x00\x00\x00"\n\x06\x00\x00\x00\x00\x00#\n\x06\x00\x00\x00\x00\x00$\n\x06\x00\x00\x00\x00\x00%\n\x06\x00\x00\x00\x00\x000\n\x06\x00\x00\x00\x00\x001\n\x06\x00\x00\x00\x00\x00'
+    b'2\n\x06\x00\x00\x00\x00\x00)\x0b\x06\x00\x00\x00\x00\x00g\x0c\x06\x00\x00\x00\x00\x00\xce\x0e\x06\x00\x00\x00\x00\x00\xcf\x0e\x06\x00\x00\x00\x00\x00\xd0\x0e\x06\x00\x00\x00\x00\x00\xd1\x0e\x06\x00\x00\x00\x00\x00\xd2\x0e\x06\x00\x00\x00\x00\x00\xd3\x0e\x06\x00\x00\x00\x00\x00\xd4\x0e\x06\x00\x00\x00\x00\x00\xd5\x0e\x06\x00\x00\x00\x00\x00\xd6\x0e\x06\x00\x00\x00\x00\x00'
+    b'\xd7\x0e\x06\x00\x00\x00\x00\x00\xd8\x0e\x06\x00\x00\x00\x00\x00\xd9\x0e\x06\x00\x00\x00\x00\x00\xda\x0e\x06\x00\x00\x00\x00\x00\xdb\x0e\x06\x00\x00\x00\x00\x00\xdc\x0e\x06\x00\x00\x00\x00\x00\xdd\x0e\x06\x00\x00\x00\x00\x00\xde\x0e\x06\x00\x00\x00\x00\x00\xdf\x0e\x06\x00\x00\x00\x00\x00\xe0\x0e\x06\x00\x00\x00\x00\x00\xe1\x0e\x06\x00\x00\x00\x00\x00\xe2\x0e\x06\x00\x00\x00\x00\x00'
+    b'\xe3\x0e\x06\x00\x00\x00\x00\x00\xee\x0e\x06\x00\x00\x00\x00\x00\xf7\x0e\x06\x00\x00\x00\x00\x00\xf8\x0e\x06\x00\x00\x00\x00\x00%\x0f\x06\x00\x00\x00\x00\x00@\x0f\x06\x00\x00\x00\x00\x00H\x10\x06\x00\x00\x00\x00\x00I\x10\x06\x00\x00\x00\x00\x00J\x10\x06\x00\x00\x00\x00\x00K\x10\x06\x00\x00\x00\x00\x00L\x10\x06\x00\x00\x00\x00\x00M\x10\x06\x00\x00\x00\x00\x00'
+    b'N\x10\x06\x00\x00\x00\x00\x00O\x10\x06\x00\x00\x00\x00\x00P\x10\x06\x00\x00\x00\x00\x00Q\x10\x06\x00\x00\x00\x00\x00R\x10\x06\x00\x00\x00\x00\x00S\x10\x06\x00\x00\x00\x00\x00Z\x10\x06\x00\x00\x00\x00\x00\x81\x10\x06\x00\x00\x00\x00\x00\xa9\x11\x06\x00\x00\x00\x00\x00%\x12\x06\x00\x00\x00\x00\x00\x9e\x12\x06\x00\x00\x00\x00\x00<\x13\x06\x00\x00\x00\x00\x00'
+    b'\xa1\x13\x06\x00\x00\x00\x00\x00\x1b\x14\x06\x00\x00\x00\x00\x000\x14\x06\x00\x00\x00\x00\x00~\x14\x06\x00\x00\x00\x00\x00\x94\x15\x06\x00\x00\x00\x00\x00\xe6\x15\x06\x00\x00\x00\x00\x00\xf3\x15\x06\x00\x00\x00\x00\x00\xc7\x16\x06\x00\x00\x00\x00\x00\x0b\x17\x06\x00\x00\x00\x00\x00\x0c\x17\x06\x00\x00\x00\x00\x00\r\x17\x06\x00\x00\x00\x00\x00\x0e\x17\x06\x00\x00\x00\x00\x00'
+    b'\x0f\x17\x06\x00\x00\x00\x00\x00\x10\x17\x06\x00\x00\x00\x00\x00\x11\x17\x06\x00\x00\x00\x00\x00\x12\x17\x06\x00\x00\x00\x00\x00\x13\x17\x06\x00\x00\x00\x00\x00\x14\x17\x06\x00\x00\x00\x00\x00\x15\x17\x06\x00\x00\x00\x00\x00\x16\x17\x06\x00\x00\x00\x00\x00\x17\x17\x06\x00\x00\x00\x00\x00\x18\x17\x06\x00\x00\x00\x00\x00\x19\x17\x06\x00\x00\x00\x00\x00\x1a\x17\x06\x00\x00\x00\x00\x00'
+    b'\x1b\x17\x06\x00\x00\x00\x00\x00\x1c\x17\x06\x00\x00\x00\x00\x00\x1d\x17\x06\x00\x00\x00\x00\x00G\x17\x06\x00\x00\x00\x00\x00O\x17\x06\x00\x00\x00\x00\x00]\x18\x06\x00\x00\x00\x00\x00^\x18\x06\x00\x00\x00\x00\x00\xb7\x18\x06\x00\x00\x00\x00\x006\x19\x06\x00\x00\x00\x00\x00\x80\x19\x06\x00\x00\x00\x00\x00\x01\x1b\x06\x00\x00\x00\x00\x00\x8b\x1b\x06\x00\x00\x00\x00\x00'
+    b'\x9f\x1b\x06\x00\x00\x00\x00\x00\xa0\x1b\x06\x00\x00\x00\x00\x00\xa1\x1b\x06\x00\x00\x00\x00\x00\xd0\x1b\x06\x00\x00\x00\x00\x00\x1a\x1c\x06\x00\x00\x00\x00\x00[\x1c\x06\x00\x00\x00\x00\x00\\\x1c\x06\x00\x00\x00\x00\x00]\x1c\x06\x00\x00\x00\x00\x00^\x1c\x06\x00\x00\x00\x00\x00_\x1c\x06\x00\x00\x00\x00\x00`\x1c\x06\x00\x00\x00\x00\x00a\x1c\x06\x00\x00\x00\x00\x00'
+    b'b\x1c\x06\x00\x00\x00\x00\x00c\x1c\x06\x00\x00\x00\x00\x00d\x1c\x06\x00\x00\x00\x00\x00e\x1c\x06\x00\x00\x00\x00\x00f\x1c\x06\x00\x00\x00\x00\x009\x1d\x06\x00\x00\x00\x00\x00G\x1d\x06\x00\x00\x00\x00\x00\x8f\x1d\x06\x00\x00\x00\x00\x00\xa4\x1d\x06\x00\x00\x00\x00\x00\xa5\x1d\x06\x00\x00\x00\x00\x00\xa6\x1d\x06\x00\x00\x00\x00\x00\xb1\x1d\x06\x00\x00\x00\x00\x00'
+    b'\xdb\x1d\x06\x00\x00\x00\x00\x00\xed\x1d\x06\x00\x00\x00\x00\x004\x1e\x06\x00\x00\x00\x00\x00\xb8\x1e\x06\x00\x00\x00\x00\x00\xc3\x1e\x06\x00\x00\x00\x00\x00\xbf\x1f\x06\x00\x00\x00\x00\x00\xd8\x1f\x06\x00\x00\x00\x00\x00\xf1\x1f\x06\x00\x00\x00\x00\x00\r \x06\x00\x00\x00\x00\x00\x13 \x06\x00\x00\x00\x00\x007 \x06\x00\x00\x00\x00\x00\x90 \x06\x00\x00\x00\x00\x00'
+    b'\x92 \x06\x00\x00\x00\x00\x00\x93 \x06\x00\x00\x00\x00\x00\x9a \x06\x00\x00\x00\x00\x00\xa1 \x06\x00\x00\x00\x00\x00\xe9 \x06\x00\x00\x00\x00\x00\x8a!\x06\x00\x00\x00\x00\x00\x9c!\x06\x00\x00\x00\x00\x00\xc7!\x06\x00\x00\x00\x00\x00\xe2!\x06\x00\x00\x00\x00\x00\xe5!\x06\x00\x00\x00\x00\x00\xe8!\x06\x00\x00\x00\x00\x00\xed!\x06\x00\x00\x00\x00\x00'
+    b'\x13"\x06\x00\x00\x00\x00\x00_"\x06\x00\x00\x00\x00\x00`"\x06\x00\x00\x00\x00\x00s"\x06\x00\x00\x00\x00\x00t"\x06\x00\x00\x00\x00\x00\xb8"\x06\x00\x00\x00\x00\x00\xb9"\x06\x00\x00\x00\x00\x00(#\x06\x00\x00\x00\x00\x00n#\x06\x00\x00\x00\x00\x00o#\x06\x00\x00\x00\x00\x00u#\x06\x00\x00\x00\x00\x00\xf0#\x06\x00\x00\x00\x00\x00'
+    b"\x11$\x06\x00\x00\x00\x00\x00\x12$\x06\x00\x00\x00\x00\x00\x13$\x06\x00\x00\x00\x00\x00\x14$\x06\x00\x00\x00\x00\x00!$\x06\x00\x00\x00\x00\x00'$\x06\x00\x00\x00\x00\x00*$\x06\x00\x00\x00\x00\x00\xca$\x06\x00\x00\x00\x00\x00\x11&\x06\x00\x00\x00\x00\x009&\x06\x00\x00\x00\x00\x00u&\x06\x00\x00\x00\x00\x00\xa9&\x06\x00\x00\x00\x00\x00"
+    b":'\x06\x00\x00\x00\x00\x00='\x06\x00\x00\x00\x00\x00B'\x06\x00\x00\x00\x00\x00\x19(\x06\x00\x00\x00\x00\x00!(\x06\x00\x00\x00\x00\x007(\x06\x00\x00\x00\x00\x008(\x06\x00\x00\x00\x00\x009(\x06\x00\x00\x00\x00\x00:(\x06\x00\x00\x00\x00\x00\xe8(\x06\x00\x00\x00\x00\x00\xe9(\x06\x00\x00\x00\x00\x00\xea(\x06\x00\x00\x00\x00\x00"
+    b'\xeb(\x06\x00\x00\x00\x00\x00\xec(\x06\x00\x00\x00\x00\x00\xed(\x06\x00\x00\x00\x00\x00\xee(\x06\x00\x00\x00\x00\x00I)\x06\x00\x00\x00\x00\x00\x0e*\x06\x00\x00\x00\x00\x00q*\x06\x00\x00\x00\x00\x00\xc1*\x06\x00\x00\x00\x00\x00\xd0*\x06\x00\x00\x00\x00\x00\xd2*\x06\x00\x00\x00\x00\x00\t,\x06\x00\x00\x00\x00\x00\xf7,\x06\x00\x00\x00\x00\x00'
+    b'\xf8,\x06\x00\x00\x00\x00\x00\xf9,\x06\x00\x00\x00\x00\x00\xfa,\x06\x00\x00\x00\x00\x00\xfb,\x06\x00\x00\x00\x00\x00\xfc,\x06\x00\x00\x00\x00\x00\r-\x06\x00\x00\x00\x00\x000-\x06\x00\x00\x00\x00\x001-\x06\x00\x00\x00\x00\x00{-\x06\x00\x00\x00\x00\x00K.\x06\x00\x00\x00\x00\x00Z.\x06\x00\x00\x00\x00\x00v.\x06\x00\x00\x00\x00\x00'
+    b'^/\x06\x00\x00\x00\x00\x00\xbc/\x06\x00\x00\x00\x00\x00\xbd/\x06\x00\x00\x00\x00\x00\xc0/\x06\x00\x00\x00\x00\x00\xc4/\x06\x00\x00\x00\x00\x00\xc5/\x06\x00\x00\x00\x00\x00\xe3/\x06\x00\x00\x00\x00\x00\x0c0\x06\x00\x00\x00\x00\x00k0\x06\x00\x00\x00\x00\x00\xab0\x06\x00\x00\x00\x00\x00(1\x06\x00\x00\x00\x00\x00)1\x06\x00\x00\x00\x00\x00'
+    b'*1\x06\x00\x00\x00\x00\x00\xa15\x06\x00\x00\x00\x00\x00\xcf6\x06\x00\x00\x00\x00\x00\x00=\x06\x00\x00\x00\x00\x00\x01=\x06\x00\x00\x00\x00\x00\x82D\x06\x00\x00\x00\x00\x00\xfdD\x06\x00\x00\x00\x00\x00*E\x06\x00\x00\x00\x00\x00_E\x06\x00\x00\x00\x00\x00~E\x06\x00\x00\x00\x00\x00\x80E\x06\x00\x00\x00\x00\x00OH\x06\x00\x00\x00\x00\x00'
+    b'dH\x06\x00\x00\x00\x00\x00eH\x06\x00\x00\x00\x00\x00fH\x06\x00\x00\x00\x00\x00gH\x06\x00\x00\x00\x00\x00hH\x06\x00\x00\x00\x00\x00iH\x06\x00\x00\x00\x00\x00\x82H\x06\x00\x00\x00\x00\x00\x92H\x06\x00\x00\x00\x00\x00\x1aK\x06\x00\x00\x00\x00\x00]K\x06\x00\x00\x00\x00\x00_K\x06\x00\x00\x00\x00\x00\xbeL\x06\x00\x00\x00\x00\x00'
+    b'\xbfL\x06\x00\x00\x00\x00\x00;N\x06\x00\x00\x00\x00\x00WN\x06\x00\x00\x00\x00\x00EQ\x06\x00\x00\x00\x00\x00\xb1Q\x06\x00\x00\x00\x00\x00\xc7Q\x06\x00\x00\x00\x00\x00\xf0Q\x06\x00\x00\x00\x00\x00\x0bR\x06\x00\x00\x00\x00\x00\xfbR\x06\x00\x00\x00\x00\x00\x0fS\x06\x00\x00\x00\x00\x00-S\x06\x00\x00\x00\x00\x00/S\x06\x00\x00\x00\x00\x00'
+    b'bS\x06\x00\x00\x00\x00\x00\x1eT\x06\x00\x00\x00\x00\x00\x91T\x06\x00\x00\x00\x00\x00\xa1T\x06\x00\x00\x00\x00\x00\xa2T\x06\x00\x00\x00\x00\x00\x8bW\x06\x00\x00\x00\x00\x00\x99W\x06\x00\x00\x00\x00\x00\xb7Z\x06\x00\x00\x00\x00\x00\x02^\x06\x00\x00\x00\x00\x00$^\x06\x00\x00\x00\x00\x00K^\x06\x00\x00\x00\x00\x00\xb3_\x06\x00\x00\x00\x00\x00'
+    b'\xb4_\x06\x00\x00\x00\x00\x005f\x06\x00\x00\x00\x00\x00;f\x06\x00\x00\x00\x00\x00?f\x06\x00\x00\x00\x00\x00Af\x06\x00\x00\x00\x00\x00Pf\x06\x00\x00\x00\x00\x00Qf\x06\x00\x00\x00\x00\x00%i\x06\x00\x00\x00\x00\x00ii\x06\x00\x00\x00\x00\x00\x85i\x06\x00\x00\x00\x00\x00\x86i\x06\x00\x00\x00\x00\x00\x87i\x06\x00\x00\x00\x00\x00'
+    b'\x88i\x06\x00\x00\x00\x00\x00\x89i\x06\x00\x00\x00\x00\x00\x8ai\x06\x00\x00\x00\x00\x00\x8bi\x06\x00\x00\x00\x00\x00\x8di\x06\x00\x00\x00\x00\x00\x8ei\x06\x00\x00\x00\x00\x00!l\x06\x00\x00\x00\x00\x00el\x06\x00\x00\x00\x00\x00nl\x06\x00\x00\x00\x00\x00\x8el\x06\x00\x00\x00\x00\x00\x92l\x06\x00\x00\x00\x00\x00\x93l\x06\x00\x00\x00\x00\x00'
+    b'\x94l\x06\x00\x00\x00\x00\x00\x95l\x06\x00\x00\x00\x00\x00\x96l\x06\x00\x00\x00\x00\x00\xc1l\x06\x00\x00\x00\x00\x00\xc2l\x06\x00\x00\x00\x00\x00\xc3l\x06\x00\x00\x00\x00\x00\xc4l\x06\x00\x00\x00\x00\x00\xc9l\x06\x00\x00\x00\x00\x00\xcal\x06\x00\x00\x00\x00\x00\xf1l\x06\x00\x00\x00\x00\x00 m\x06\x00\x00\x00\x00\x00\xa3m\x06\x00\x00\x00\x00\x00'
+    b'\xdam\x06\x00\x00\x00\x00\x00\xddm\x06\x00\x00\x00\x00\x00\xf5m\x06\x00\x00\x00\x00\x00\xf6m\x06\x00\x00\x00\x00\x00\x01o\x06\x00\x00\x00\x00\x00Ro\x06\x00\x00\x00\x00\x00\x9bo\x06\x00\x00\x00\x00\x00\x9co\x06\x00\x00\x00\x00\x00\xa0o\x06\x00\x00\x00\x00\x00\xd8o\x06\x00\x00\x00\x00\x00#p\x06\x00\x00\x00\x00\x007p\x06\x00\x00\x00\x00\x00'
+    b'Kp\x06\x00\x00\x00\x00\x00\xafp\x06\x00\x00\x00\x00\x00\xbbp\x06\x00\x00\x00\x00\x00\xbcp\x06\x00\x00\x00\x00\x00\xecp\x06\x00\x00\x00\x00\x00\xedp\x06\x00\x00\x00\x00\x00\xeep\x06\x00\x00\x00\x00\x00?q\x06\x00\x00\x00\x00\x00\xbaq\x06\x00\x00\x00\x00\x00\x80r\x06\x00\x00\x00\x00\x00\xd8r\x06\x00\x00\x00\x00\x00\xf6r\x06\x00\x00\x00\x00\x00'
+    b'es\x06\x00\x00\x00\x00\x00\xb0s\x06\x00\x00\x00\x00\x00\xe2s\x06\x00\x00\x00\x00\x00]t\x06\x00\x00\x00\x00\x00\x82t\x06\x00\x00\x00\x00\x00\xe9t\x06\x00\x00\x00\x00\x00\xebt\x06\x00\x00\x00\x00\x00\x12u\x06\x00\x00\x00\x00\x00qu\x06\x00\x00\x00\x00\x00su\x06\x00\x00\x00\x00\x00{u\x06\x00\x00\x00\x00\x00}u\x06\x00\x00\x00\x00\x00'
+    b'\x9du\x06\x00\x00\x00\x00\x00\xc5u\x06\x00\x00\x00\x00\x00\xddu\x06\x00\x00\x00\x00\x00Jv\x06\x00\x00\x00\x00\x00\x87v\x06\x00\x00\x00\x00\x00\x88v\x06\x00\x00\x00\x00\x00\x89v\x06\x00\x00\x00\x00\x00\x8cv\x06\x00\x00\x00\x00\x00?w\x06\x00\x00\x00\x00\x00Sw\x06\x00\x00\x00\x00\x00^w\x06\x00\x00\x00\x00\x00jw\x06\x00\x00\x00\x00\x00'
+    b'nw\x06\x00\x00\x00\x00\x00tw\x06\x00\x00\x00\x00\x00\x88w\x06\x00\x00\x00\x00\x00\x89w\x06\x00\x00\x00\x00\x00\xb3w\x06\x00\x00\x00\x00\x00\xb4w\x06\x00\x00\x00\x00\x00\xb5w\x06\x00\x00\x00\x00\x00\xb6w\x06\x00\x00\x00\x00\x00\xc4w\x06\x00\x00\x00\x00\x00\x16x\x06\x00\x00\x00\x00\x00 x\x06\x00\x00\x00\x00\x00\x87x\x06\x00\x00\x00\x00\x00'
+    b'\xacx\x06\x00\x00\x00\x00\x00\xf2x\x06\x00\x00\x00\x00\x00\x1cy\x06\x00\x00\x00\x00\x00&y\x06\x00\x00\x00\x00\x00*y\x06\x00\x00\x00\x00\x000y\x06\x00\x00\x00\x00\x00\xa3y\x06\x00\x00\x00\x00\x00\xa7y\x06\x00\x00\x00\x00\x00\xb9y\x06\x00\x00\x00\x00\x00\x07z\x06\x00\x00\x00\x00\x00\x11z\x06\x00\x00\x00\x00\x00\x13z\x06\x00\x00\x00\x00\x00'
+    b'\x16z\x06\x00\x00\x00\x00\x00bz\x06\x00\x00\x00\x00\x00cz\x06\x00\x00\x00\x00\x00\x84z\x06\x00\x00\x00\x00\x00\x87z\x06\x00\x00\x00\x00\x00\x8az\x06\x00\x00\x00\x00\x00\xa9z\x06\x00\x00\x00\x00\x00\xaaz\x06\x00\x00\x00\x00\x00\xabz\x06\x00\x00\x00\x00\x00\xacz\x06\x00\x00\x00\x00\x00\xadz\x06\x00\x00\x00\x00\x00\xaez\x06\x00\x00\x00\x00\x00'
+    b'\xafz\x06\x00\x00\x00\x00\x00\xb0z\x06\x00\x00\x00\x00\x00\xb1z\x06\x00\x00\x00\x00\x00\xb2z\x06\x00\x00\x00\x00\x00\xb3z\x06\x00\x00\x00\x00\x00\xb4z\x06\x00\x00\x00\x00\x00\xb5z\x06\x00\x00\x00\x00\x00\xb6z\x06\x00\x00\x00\x00\x00\xb7z\x06\x00\x00\x00\x00\x00\xb8z\x06\x00\x00\x00\x00\x00\x8f{\x06\x00\x00\x00\x00\x00\xf3{\x06\x00\x00\x00\x00\x00'
+    b'\xfd{\x06\x00\x00\x00\x00\x00\x10|\x06\x00\x00\x00\x00\x00\x12|\x06\x00\x00\x00\x00\x00\x84|\x06\x00\x00\x00\x00\x00\x98}\x06\x00\x00\x00\x00\x00\xfd}\x06\x00\x00\x00\x00\x00"~\x06\x00\x00\x00\x00\x00\x86~\x06\x00\x00\x00\x00\x00\xd2~\x06\x00\x00\x00\x00\x00\xe4~\x06\x00\x00\x00\x00\x009\x7f\x06\x00\x00\x00\x00\x00\x9a\x7f\x06\x00\x00\x00\x00\x00'
+    b'\xba\x7f\x06\x00\x00\x00\x00\x00\xbb\x7f\x06\x00\x00\x00\x00\x00\xce\x7f\x06\x00\x00\x00\x00\x00\x00\x80\x06\x00\x00\x00\x00\x004\x80\x06\x00\x00\x00\x00\x00\r\x81\x06\x00\x00\x00\x00\x00\x12\x81\x06\x00\x00\x00\x00\x00q\x81\x06\x00\x00\x00\x00\x00\xc7\x81\x06\x00\x00\x00\x00\x00\xed\x81\x06\x00\x00\x00\x00\x00\x16\x82\x06\x00\x00\x00\x00\x00\x17\x82\x06\x00\x00\x00\x00\x00'
+    b'"\x82\x06\x00\x00\x00\x00\x00A\x82\x06\x00\x00\x00\x00\x00B\x82\x06\x00\x00\x00\x00\x00\x90\x82\x06\x00\x00\x00\x00\x00\xdc\x82\x06\x00\x00\x00\x00\x003\x83\x06\x00\x00\x00\x00\x00v\x83\x06\x00\x00\x00\x00\x00\xdc\x83\x06\x00\x00\x00\x00\x00\xdf\x83\x06\x00\x00\x00\x00\x00\x02\x84\x06\x00\x00\x00\x00\x00\r\x84\x06\x00\x00\x00\x00\x00\x16\x84\x06\x00\x00\x00\x00\x00'
+    b'\x17\x84\x06\x00\x00\x00\x00\x00>\x84\x06\x00\x00\x00\x00\x00\x11\x85\x06\x00\x00\x00\x00\x00\x17\x85\x06\x00\x00\x00\x00\x00\xa6\x85\x06\x00\x00\x00\x00\x00\xba\x85\x06\x00\x00\x00\x00\x00\x15\x86\x06\x00\x00\x00\x00\x00F\x86\x06\x00\x00\x00\x00\x00\\\x86\x06\x00\x00\x00\x00\x00\x07\x88\x06\x00\x00\x00\x00\x00\x08\x88\x06\x00\x00\x00\x00\x00\t\x88\x06\x00\x00\x00\x00\x00'
+    b'\n\x88\x06\x00\x00\x00\x00\x00m\x8a\x06\x00\x00\x00\x00\x00r\x8a\x06\x00\x00\x00\x00\x00t\x8a\x06\x00\x00\x00\x00\x00\x17\x8b\x06\x00\x00\x00\x00\x00\x90\x8b\x06\x00\x00\x00\x00\x00\xc9\x8b\x06\x00\x00\x00\x00\x00\xcb\x8b\x06\x00\x00\x00\x00\x00\x11\x8f\x06\x00\x00\x00\x00\x00\xe7\x8f\x06\x00\x00\x00\x00\x00\x06\x90\x06\x00\x00\x00\x00\x00\xe4\x90\x06\x00\x00\x00\x00\x00'
+    b'\x17\x94\x06\x00\x00\x00\x00\x00p\x94\x06\x00\x00\x00\x00\x00\x07\x95\x06\x00\x00\x00\x00\x00L\x95\x06\x00\x00\x00\x00\x00M\x95\x06\x00\x00\x00\x00\x00F\x96\x06\x00\x00\x00\x00\x00r\x96\x06\x00\x00\x00\x00\x00\xf2\x96\x06\x00\x00\x00\x00\x00\xee\x97\x06\x00\x00\x00\x00\x00\x0b\x99\x06\x00\x00\x00\x00\x00\x0c\x99\x06\x00\x00\x00\x00\x00C\x9a\x06\x00\x00\x00\x00\x00'
+    b'\x81\x9a\x06\x00\x00\x00\x00\x008\x9b\x06\x00\x00\x00\x00\x00\xfc\x9b\x06\x00\x00\x00\x00\x00\n\x9c\x06\x00\x00\x00\x00\x00\x11\x9c\x06\x00\x00\x00\x00\x00~\x9c\x06\x00\x00\x00\x00\x00\x84\x9c\x06\x00\x00\x00\x00\x00\x85\x9c\x06\x00\x00\x00\x00\x00\x89\x9c\x06\x00\x00\x00\x00\x00\x8b\x9c\x06\x00\x00\x00\x00\x00\x8c\x9c\x06\x00\x00\x00\x00\x00\xcd\x9c\x06\x00\x00\x00\x00\x00'
+    b'\x88\x9d\x06\x00\x00\x00\x00\x00\x8b\x9d\x06\x00\x00\x00\x00\x00\xa7\x9d\x06\x00\x00\x00\x00\x00\xd2\x9d\x06\x00\x00\x00\x00\x00\xe7\x9d\x06\x00\x00\x00\x00\x00\xe8\x9d\x06\x00\x00\x00\x00\x00\xf2\x9d\x06\x00\x00\x00\x00\x00\x90\x9e\x06\x00\x00\x00\x00\x00\xca\x9e\x06\x00\x00\x00\x00\x00\xcb\x9e\x06\x00\x00\x00\x00\x00\xcc\x9e\x06\x00\x00\x00\x00\x00\xcd\x9e\x06\x00\x00\x00\x00\x00'
+    b'\xce\x9e\x06\x00\x00\x00\x00\x00\xef\x9e\x06\x00\x00\x00\x00\x00\x94\x9f\x06\x00\x00\x00\x00\x00\x98\x9f\x06\x00\x00\x00\x00\x00\xe1\xa0\x06\x00\x00\x00\x00\x00`\xa3\x06\x00\x00\x00\x00\x00\x82\xa4\x06\x00\x00\x00\x00\x00\xaf\xa4\x06\x00\x00\x00\x00\x00\xaf\xa5\x06\x00\x00\x00\x00\x00\x1b\xa7\x06\x00\x00\x00\x00\x00\x8a\xaa\x06\x00\x00\x00\x00\x00\x8b\xaa\x06\x00\x00\x00\x00\x00'
+    b'\x96\xaa\x06\x00\x00\x00\x00\x00\x97\xaa\x06\x00\x00\x00\x00\x00\x98\xaa\x06\x00\x00\x00\x00\x00\x99\xaa\x06\x00\x00\x00\x00\x00\xbd\xaa\x06\x00\x00\x00\x00\x00\x93\xab\x06\x00\x00\x00\x00\x00\xd7\xac\x06\x00\x00\x00\x00\x00\xac\xad\x06\x00\x00\x00\x00\x00v\xae\x06\x00\x00\x00\x00\x00w\xae\x06\x00\x00\x00\x00\x00x\xae\x06\x00\x00\x00\x00\x00y\xae\x06\x00\x00\x00\x00\x00'
+    b'\x89\xb0\x06\x00\x00\x00\x00\x00\x17\xb1\x06\x00\x00\x00\x00\x00\xb2\xb1\x06\x00\x00\x00\x00\x00\n\xb2\x06\x00\x00\x00\x00\x00\xa2\xb3\x06\x00\x00\x00\x00\x00$\xb5\x06\x00\x00\x00\x00\x00@\xb5\x06\x00\x00\x00\x00\x00\xd1\xb5\x06\x00\x00\x00\x00\x00\xd2\xb5\x06\x00\x00\x00\x00\x00\xd3\xb5\x06\x00\x00\x00\x00\x00\xd4\xb5\x06\x00\x00\x00\x00\x00\xd5\xb5\x06\x00\x00\x00\x00\x00'
+    b'\xec\xb5\x06\x00\x00\x00\x00\x00\xed\xb5\x06\x00\x00\x00\x00\x00\xee\xb5\x06\x00\x00\x00\x00\x00\xef\xb5\x06\x00\x00\x00\x00\x00\xf0\xb5\x06\x00\x00\x00\x00\x00\xf1\xb5\x06\x00\x00\x00\x00\x00\x83\xb6\x06\x00\x00\x00\x00\x00\x84\xb6\x06\x00\x00\x00\x00\x00\x85\xb6\x06\x00\x00\x00\x00\x00\x86\xb6\x06\x00\x00\x00\x00\x00\x87\xb6\x06\x00\x00\x00\x00\x00\x88\xb6\x06\x00\x00\x00\x00\x00'
+    b'\x89\xb6\x06\x00\x00\x00\x00\x00\x8a\xb6\x06\x00\x00\x00\x00\x00\x8b\xb6\x06\x00\x00\x00\x00\x00:\xb7\x06\x00\x00\x00\x00\x00\x8f\xb8\x06\x00\x00\x00\x00\x00\x90\xb8\x06\x00\x00\x00\x00\x00#\xb9\x06\x00\x00\x00\x00\x00\x14\xba\x06\x00\x00\x00\x00\x00\xe3\xba\x06\x00\x00\x00\x00\x00\xa6\xbb\x06\x00\x00\x00\x00\x00\xa8\xbb\x06\x00\x00\x00\x00\x00\xa9\xbb\x06\x00\x00\x00\x00\x00'
+    b'\xc8\xbb\x06\x00\x00\x00\x00\x00\xa5\xbc\x06\x00\x00\x00\x00\x00\xa8\xbc\x06\x00\x00\x00\x00\x00\x82\xbd\x06\x00\x00\x00\x00\x00\x83\xbd\x06\x00\x00\x00\x00\x00\xb2\xbd\x06\x00\x00\x00\x00\x00\x0f\xbe\x06\x00\x00\x00\x00\x00\x1f\xbe\x06\x00\x00\x00\x00\x00 \xbe\x06\x00\x00\x00\x00\x00!\xbe\x06\x00\x00\x00\x00\x00"\xbe\x06\x00\x00\x00\x00\x00D\xbf\x06\x00\x00\x00\x00\x00'
+    b'o\xc0\x06\x00\x00\x00\x00\x00q\xc0\x06\x00\x00\x00\x00\x00r\xc0\x06\x00\x00\x00\x00\x00s\xc0\x06\x00\x00\x00\x00\x00t\xc0\x06\x00\x00\x00\x00\x00u\xc0\x06\x00\x00\x00\x00\x00v\xc0\x06\x00\x00\x00\x00\x00w\xc0\x06\x00\x00\x00\x00\x002\xc1\x06\x00\x00\x00\x00\x003\xc1\x06\x00\x00\x00\x00\x004\xc1\x06\x00\x00\x00\x00\x00u\xc1\x06\x00\x00\x00\x00\x00'
+    b'\xda\xc1\x06\x00\x00\x00\x00\x00$\xc2\x06\x00\x00\x00\x00\x00%\xc2\x06\x00\x00\x00\x00\x00\x91\xc2\x06\x00\x00\x00\x00\x00\x99\xc2\x06\x00\x00\x00\x00\x004\xc3\x06\x00\x00\x00\x00\x00<\xc3\x06\x00\x00\x00\x00\x00?\xc3\x06\x00\x00\x00\x00\x00@\xc3\x06\x00\x00\x00\x00\x00\x9a\xc3\x06\x00\x00\x00\x00\x00,\xc4\x06\x00\x00\x00\x00\x00\xd4\xc4\x06\x00\x00\x00\x00\x00'
+    b'\xd5\xc4\x06\x00\x00\x00\x00\x00\xd6\xc4\x06\x00\x00\x00\x00\x00\x94\xc5\x06\x00\x00\x00\x00\x00\xa5\xc5\x06\x00\x00\x00\x00\x00\xe3\xc5\x06\x00\x00\x00\x00\x00\xe4\xc5\x06\x00\x00\x00\x00\x00~\xc6\x06\x00\x00\x00\x00\x00\x99\xc6\x06\x00\x00\x00\x00\x00\xc3\xc6\x06\x00\x00\x00\x00\x00\xc4\xc6\x06\x00\x00\x00\x00\x00\xc8\xc6\x06\x00\x00\x00\x00\x00\xca\xc6\x06\x00\x00\x00\x00\x00'
+    b'\xcb\xc6\x06\x00\x00\x00\x00\x00-\xc7\x06\x00\x00\x00\x00\x006\xc7\x06\x00\x00\x00\x00\x00k\xc7\x06\x00\x00\x00\x00\x00\xef\xc7\x06\x00\x00\x00\x00\x00\xf0\xc7\x06\x00\x00\x00\x00\x00\xf1\xc7\x06\x00\x00\x00\x00\x00\xf2\xc7\x06\x00\x00\x00\x00\x00\xf3\xc7\x06\x00\x00\x00\x00\x00\x17\xc8\x06\x00\x00\x00\x00\x00I\xc8\x06\x00\x00\x00\x00\x00\xe7\xc8\x06\x00\x00\x00\x00\x00'
+    b'\xe8\xc8\x06\x00\x00\x00\x00\x00\xe9\xc8\x06\x00\x00\x00\x00\x00\x1f\xca\x06\x00\x00\x00\x00\x00;\xca\x06\x00\x00\x00\x00\x00\xfd\xca\x06\x00\x00\x00\x00\x00\x00\xcb\x06\x00\x00\x00\x00\x009\xcb\x06\x00\x00\x00\x00\x00\x83\xcb\x06\x00\x00\x00\x00\x00\xb7\xcb\x06\x00\x00\x00\x00\x00\xf1\xcb\x06\x00\x00\x00\x00\x00\x86\xcc\x06\x00\x00\x00\x00\x00\xbc\xcc\x06\x00\x00\x00\x00\x00'
+    b'\t\xcd\x06\x00\x00\x00\x00\x00s\xcd\x06\x00\x00\x00\x00\x00\x84\xcd\x06\x00\x00\x00\x00\x00\x87\xcd\x06\x00\x00\x00\x00\x00h\xcf\x06\x00\x00\x00\x00\x00n\xcf\x06\x00\x00\x00\x00\x00o\xcf\x06\x00\x00\x00\x00\x00\xe1\xd0\x06\x00\x00\x00\x00\x00\xe2\xd0\x06\x00\x00\x00\x00\x00\xaa\xd1\x06\x00\x00\x00\x00\x00\xd4\xd1\x06\x00\x00\x00\x00\x00\xe5\xd1\x06\x00\x00\x00\x00\x00'
+    b'\x02\xd2\x06\x00\x00\x00\x00\x00\xde\xd4\x06\x00\x00\x00\x00\x00\x90\xd7\x06\x00\x00\x00\x00\x00\x83\xe2\x06\x00\x00\x00\x00\x00\xd5\xe6\x06\x00\x00\x00\x00\x00\xd7\xe6\x06\x00\x00\x00\x00\x00\xf8\xe6\x06\x00\x00\x00\x00\x00\xf9\xe6\x06\x00\x00\x00\x00\x00\xfc\xe6\x06\x00\x00\x00\x00\x00\x01\xe7\x06\x00\x00\x00\x00\x00\xba\xea\x06\x00\x00\x00\x00\x00\xbf\xea\x06\x00\x00\x00\x00\x00'
+    b'\xc0\xea\x06\x00\x00\x00\x00\x00\xb5\xeb\x06\x00\x00\x00\x00\x00\xad\xed\x06\x00\x00\x00\x00\x00\xfb\xee\x06\x00\x00\x00\x00\x00^\xf0\x06\x00\x00\x00\x00\x00\xb4\xf0\x06\x00\x00\x00\x00\x00\xb5\xf0\x06\x00\x00\x00\x00\x00\xb6\xf0\x06\x00\x00\x00\x00\x00\xb7\xf0\x06\x00\x00\x00\x00\x00\xcb\xf1\x06\x00\x00\x00\x00\x00\xcc\xf1\x06\x00\x00\x00\x00\x00H\xf4\x06\x00\x00\x00\x00\x00'
+    b'I\xf4\x06\x00\x00\x00\x00\x00J\xf4\x06\x00\x00\x00\x00\x00\x0b\xf7\x06\x00\x00\x00\x00\x00\x0c\xf7\x06\x00\x00\x00\x00\x00\r\xf7\x06\x00\x00\x00\x00\x00\x0e\xf7\x06\x00\x00\x00\x00\x00\x0f\xf7\x06\x00\x00\x00\x00\x00\xfd\xfa\x06\x00\x00\x00\x00\x00\xed\x00\x07\x00\x00\x00\x00\x00)\x01\x07\x00\x00\x00\x00\x00\x8b\x02\x07\x00\x00\x00\x00\x00\xf3\x05\x07\x00\x00\x00\x00\x00'
+    b'U\x08\x07\x00\x00\x00\x00\x00M\n\x07\x00\x00\x00\x00\x00N\n\x07\x00\x00\x00\x00\x00\xa5\x0f\x07\x00\x00\x00\x00\x00\xd8\x17\x07\x00\x00\x00\x00\x00\xd9\x17\x07\x00\x00\x00\x00\x00#\x1a\x07\x00\x00\x00\x00\x00s\x1a\x07\x00\x00\x00\x00\x00v\x1a\x07\x00\x00\x00\x00\x00w\x1a\x07\x00\x00\x00\x00\x00x\x1a\x07\x00\x00\x00\x00\x00y\x1a\x07\x00\x00\x00\x00\x00'
+    b"z\x1a\x07\x00\x00\x00\x00\x00{\x1a\x07\x00\x00\x00\x00\x00|\x1a\x07\x00\x00\x00\x00\x00\x1d\x1d\x07\x00\x00\x00\x00\x00\xcb \x07\x00\x00\x00\x00\x00\x98$\x07\x00\x00\x00\x00\x00\x86'\x07\x00\x00\x00\x00\x009)\x07\x00\x00\x00\x00\x00\x9b*\x07\x00\x00\x00\x00\x00\xe21\x07\x00\x00\x00\x00\x00\xd43\x07\x00\x00\x00\x00\x00\xe83\x07\x00\x00\x00\x00\x00"
+    b"\xc76\x07\x00\x00\x00\x00\x00\x807\x07\x00\x00\x00\x00\x00\xb7\xdd\xa0\x17\x00\x00\x00\x00\xb3Yf\xf8\x00\x00\x00\x00\xe8\xbb\x96\xc2\xeb;n\x185\x9f\x82g\xa4\xbc\xad\x19\x89\xf6\xe61v\x00\xfe\x19\xfbB\x06\xceN\xbei\x1d\x14(\x1b\xe9\x00\xe7\xa6\x1f;0\x92\x0f5\xe2U!\x9b\xa0\xb5\xc7\xc3\x9a\x04&\x11\xb8\xd5\xd4\xf6#\xcb'"
+    b"s\x99S\xc2y\xe1\xcb'V\xdc\x85X.\x95\xce9\xab$sx\x83\xebk<-\xd0\xe1\xbd\x90\xb2i?\xa1q\x7fc`\xf7\nF\x7f\xd7\x13X\x1a\xe4\xa3F8\xbf\x82\x03u&\xf3L\x10{\xd2\x0b\x92''R\x8f\xf2\xdd<\xd4&eR\xa6\xd8\x84\xb7U\x97\xd4_\x1e\xe1\xc2\xbe\x11\xed\xefe\rV \xcb\x7f\xf7\x87j"
+    b'"\x9e4Z\xc2\xf0\xb2r\\nq+ki\xf8s\xe2\x9fBY\xdc\xc4"t\xedPSE\xb1\xa6Yy{\xfc\xaczL\xb8\x11\x80]H\xc5\xfc\xbe\xbaH\x80\x9e\t\xb0*\x8e\x8c\xa5\x80g\xe6\x8d\xb6)9{\x81\xf3\x81\xfa\xc2\xce\xb7\xb0\x81M}ih\x93\xc6\xe0\x81\xdc;\xb3\xdf\xe1\x0c\x8f\x82\x0b\x87\xbf/\xaa\x07\xa6\x82'
+    b'\x89\x82K\x91k\xe0\xee\x82\xdf\xf7\xa2lV\xfc\xf9\x82\r\x921\xd4\x05%\xe1\x83\xba\xa8p8\xae\x14}\x84j)O\xc7\x95\xac\x0b\x85\x89\xf8\r\xady\x17\x16\x85\xb6\x98j#\xbb"V\x85\xb7\xc0\x8e\xdbl\x13\x94\x85`\x86\x84+%\x82\x9a\x85\x8dJP\xb9\xe1\xa2\xdc\x85\xe5\xf9c.\xa1\xcc\xde\x85\x80\xae\xf5\xea\x1c\x81\xe9\x85'
+    b'\xc3\xd3\x05\xd0\xccL2\x86\xa8\x0eM8qZa\x86\xa9\x0eM8qZa\x86\xab\x0eM8qZa\x86"d\x8e\xff\xc2_\x8d\x86\x0c\x1c_\xc5\x1d\xf3\xa3\x86\xe2\xa2\xb9\x95\xd4\x04\xb7\x86\xac1P\x02t\xe3\xf3\x86$\xf7~\x00x\x14\xba\x87\xf4\xca\xd0j\xb436\x88)i`F\xf3\xafR\x88\x9em\x0cI\x08y\xd8\x88'
+    b'\x0cc}aba1\x89\xd6\xf0E|\x8c\xc6\xa1\x89,\xe1\x89[\xdd \xc8\x89\x19\xb2U\xe7#a\x17\x8a\x04Ld\x00%a\xa6\x8a\xd9\xaf\xe2\xbe\x0e\xe9~\x8bU\t\x0e\x1f\t\x8b\xaf\x8b\x92\xb94\xf4\xad\xc6\x17\x8cj\xf5\xad\xda\x95\xed\x19\x8c\xd0io\xfe\xa7\xdch\x8c\xf4_\x06\x81,\xea\x97\x8cu\xa5\xad\xe0\xbc\xd1\xe6\x8c'
+    b'\x98\x829\x1e\xf6\xe6\x0f\x8d\x9e%\xef\xe7\x103"\x8d^\xf0^T\xf7\xe8\x97\x8d"o\x7f\xbf\x7f4\x9e\x8d\xd2\x0e\xc9\xdd\xbd\x9f\xf5\x8dU\xf1\x9e\xce4\x1b\x14\x8e\xac\xe2G\xe6\xed\xa5-\x8e\xc8\x9aJ\xa02\xee\xa3\x8e\xf9B\xc7\xe2\x18\x17\xbd\x8e\xb8Q\xd4:X\x9b^\x8f\\5\tH\xa7\xd2m\x8f^5\tH\xa7\xd2m\x8f'
+    b'_5\tH\xa7\xd2m\x8f\x1d`\xa4\x18\xec\x0fn\x8f\x8c\x9b\x82\x19\x87\x8c\xad\x8fw\xc3+U\x14\x0f\xb4\x8fj\x8b\x9e<Qw\x04\x90\xd0ih\xce"\xd2\x85\x90\x9c\xef\xd2\r\t.\xe3\x90\xcfU\xe5\xed\xa3\x92\x9f\x91\x9eD\xe1#S\x8f\xe3\x91\xf0\xd5\xb3\xfe\xd1P$\x92\xc5tH\x89@W\x85\x92\xb5\xea;T\xf7\xf2\x86\x92'
+    b"\xd7\xbd)Z2a\xa5\x92\x9a\xbd\x05\xd5\xf2\xb5\xe2\x92>P\x91\x01g\xb5\xe3\x92|>\xecg\x12)\xe9\x92(\xb0\x19\x1f'\xb7\xfe\x92\x07\xd65\xf0\\\x8b\xb6\x93LR<G[\xd3E\x94\xd4\xc2\xd1\xcc\x075\xdb\x94g\xda_\xad\xd5!\x93\x95PT(%\xb3\x07\xac\x95\xa3\xe60\x0c\xc9\xb5\xcc\x95\x06!\x01Or\x0e\xe4\x95"
+    b"<Gu.>\xd4a\x96\x96;\x1d\xbc,\x13\xb1\x968\x80\x93\xaf=\x01\xcb\x96\x10\xec\x81\x9d\xf2C\x8c\x97\xbfGJ\xee8\x9e\x8f\x97@/I\xf2\xad\xe9\xa0\x97\xc6\xb2)\x0b\x9dW\xee\x97K\xc9\xe05\x88\xee;\x98'r\xc9sG\xf5\xa7\x98H\xf2\xca\xdb,K\xde\x98\xed\x04\xc2\xdb\x97\xfb\xf7\x98\x88\xc8\xbd\xe0F\x93?\x99"
+    b"\xf0\x9bb:\xf2\xf2\x81\x99\xed\xd2}(\xad\xf2\x02\x9a\xafO?\x16V6N\x9ap\xaa\x83\x7f:\x0cl\x9a.\x83fLc\x86x\x9a\xfd\x12\x92?\n\x0f\xaa\x9a+\xa3j\xe6`\x81\xff\x9a\x88\xa3@V\x06\xc22\x9b\xee\xd9\x1dNkF\x01\x9c~\xb5\xc04V\x99\n\x9c\xa8b\x0b\xa8\xa9\xf1'\x9c\xe3\xda='\xb0K\xb7\x9c"
+    b'\xa5\xbe\xd3X\x00FG\x9d}\xa5\xa9c\x99\xabe\x9d5M\x9c\'57\x8f\x9d(\xd6&\xb3\xa7C\xb6\x9d\xc8\xf0\xd9J2"3\x9e\xb7\x0e\x8a@z?B\x9e\xec\xa6`\x12w%G\x9edW\x9d\xcfT\xe2\x01\x9f\xa2^\xc4\x14L\x9b|\x9f5\x95d\xb9>B%\xa0\xa20\xc6:\x1e(/\xa0\xaa\xa0vU\'S\xcd\xa0'
+    b'\xc8\x9b\x99U\'M\xf6\xa0|\x16\xdf4\xbd\x88\x15\xa1\xc2I\x03\x1f\xc0h\x95\xa1\x18\xfd\xe6\xc6\x84\x93\x9d\xa1\x12\x0cFN\xc2\t\xa1\xa1\xe3\xb0\xc3\xfa\xc29\xa4\xa1\xab\xccp\xca\xa7\x08Q\xa2\x1b)|/fnX\xa2\x13$\xed\x04\x1c"\xd0\xa2,V\x86\xcf\xd2?\x1e\xa3&\x7f\xbcb\xffc\x1c\xa4\x84\xc9\x9b\xd6\xc1\x196\xa4'
+    b'\x12\xe6$x\'\x1d\x03\xa5\x92\xd6\xa8K\xfcp\x10\xa5\xab\x8bi\x18\\\x9a"\xa5\xcbH\xf4\xe2)\xa2\xc4\xa5\x10\xbc\r<2r\x02\xa6\xd5\xadB[SJ?\xa6\x05\xbf\xff\x05\t\x94l\xa6U\xf2\xe5>\xad9\xcc\xa6\xa9\xea4_\xcdH\xff\xa6\xd5\xd8\x14\xe4M\xa9\xb0\xa7\xfa\xf6\x01V\xb3\xe6\xfa\xa75\xe3Y!a\x81:\xa8'
+    b'\x89\x81\xae\x89\x9f\x9c\x8e\xa8\xe8o\xf1\x8d\x18\xee\xca\xa8\x89\x1c\xd0\xd8\x00\xb1\x1e\xa9I\x10q\x9bj\xe9N\xa9\xeak.N\xa1t\xc7\xa9W\x11\xdeLY\xa7\xf5\xa9H\xa6TF\xc9\xe9\x82\xaa6\xb1\xfcU\xbe\xb7\xe4\xaa\xcbQ<\xa4\xf3\x07\xed\xaa0\x0e\xdd#D~\xf0\xaa6<c\xa65\xa4^\xab\n8G\x874\xfd\xfd\xab'
+    b'\xfd\xde=\xe7\x13O\xdd\xac(\xd1r\xf1\x00\xff+\xad\x94d\x18\n\x00:<\xadV\x1e\xeb\x19\xcezO\xad\xc6C\xb4\xa0\x94&\x9b\xad\xa3\xa3\x97zQ\x00M\xae\xf0\x8d\xa8\xabi_u\xae\xdb\xc1b\xf2\x14B\xc3\xae)\xed\x81\xf2\x14K\xe8\xae\x872\xc3\xf5@VV\xaf\x971g\xec\x0e\xe4\xd9\xafRcb\x9a\xab~7\xb0'
+    b' Y\xdd\xbd\xbe\x17M\xb0:\xe3h9\xce}d\xb0<\xc8\xf1\xd1\x14%~\xb0\xbc\x9f\x839\xce\x84\x83\xb0\xd6dW\x84\xad\x94\x90\xb0=D\xc0\xd0\xce5\xe8\xb0\xe4`\xb5\x13\xe3\xe6\x07\xb1\x8f \xf7!\x93\xe64\xb1\x7f\xc3\xcf)B\tN\xb1\x1b\xcf\xf2\xc2\xf1\xa0[\xb1vB\x13\x08\xbcqz\xb1\xc9\xdf\x83\xe1\xaf\x06~\xb1'
+    b'\x90\xae\xf2\xd4?e\x8f\xb1\x92\xe3\xe0"R!E\xb2\x8d\x05\n\x97m\x9eT\xb2\x1e\xa8\xc0\xc1\x13w\x9f\xb2wd\x8a \x95+\xa0\xb2\xdc\xdez\x99\xe1\x900\xb3\x0f<\xc9\x98\x85\xe61\xb3\xe8\x00 \x08Cqp\xb3x\xc0\xd3J2\xb6\xa8\xb3g\xa1L\x8d\xa3B\xe1\xb4\xf5\x0bm0\x8d\xbeW\xb5\x83\x98\x9ai\xfb~s\xb5'
+    b'\xd2\x99\xeaCu)\x81\xb5\x0b#L\xfe\xfa\xa2\xe1\xb5{\x97\xeez\xc2)\xa4\xb6\xc6\x0b\x9aq\x16|\x12\xb7\xb6#\x14?\x9c\x9f\x1a\xb7t\xd0KbS@.\xb7b\xa6?xl\xf1H\xb7\xd1\xd7W\xc1\x94\x8e\xae\xb7\x0b\xd0\x83,\x85e+\xb8Te\x90\xa7\xedGT\xb8\x12{|<\xfc\xb3\x8f\xb8\xad\x91V@\x8c\xd3\xeb\xb8'
+    b'\xaa\xd2G\xc8\x88:M\xb9\xb7\x05h\xcd\x94\x10_\xb9p\xf2Ecl&\xe7\xb9\x0b\x91\x9f\x95\xd6\xb5\x1e\xbaLMI\xb0\xb7\x859\xba\x04\x0fhu\x92\xba\xa7\xba`O* o\x95\xf0\xba\x055\xe5\xa8\x11\xd9\xfb\xba\x81\xc0\xf07\xb0},\xbb\x92.\xda\xc2\xac5B\xbb^\xf5\xb4\xa7\xeb\xcd[\xbb\xa2-\xf1\xb4j\x00\x8f\xbb'
+    b' \xb3N=DZ\xc7\xbb\xc6\x15\xe5[\xee\x94/\xbc\x93Xc_\xdeR\x8b\xbc\r\x15\xba\x08>~$\xbd:\xb16\x125mP\xbd7\xbc\x15k\x8e\nk\xbdb\xf5\x9c\xcdl\xc2\x86\xbd\x91\x9b\xc3\x7f\xe3W\x8d\xbe\x95i\x81X\x0bF\xa6\xbe\x11\xeb\x8c\xe6\x1f\xbb\xcb\xbeh\xaf`\xadg\xc4\xcc\xbe\xe1\x1b\nkJm\xd2\xbe'
+    b"\xe30&\xa9\xc8\xdc\xda\xbe}\x8b\xc1\xf3\x15v\x0e\xbfa\xb1\x90\xd00<A\xbf-\xd9_\xeb\xdc\xa0\xb6\xbf\x04\x9f\xc3g\xb6\xd6\xc5\xbf+Ra\xaf\xf5\xe2\xf4\xbfFJ\xd6\x9a\x19)\x15\xc0'\x9f\xa0Y\x04^|\xc0\xe5h\x9cQ\xeb\x12\x80\xc0VF\xc1]\x8f@\x96\xc0@\xc3gN\xc0V\xb0\xc0p\xb5\x0b\x83D\x94\xf1\xc0"
+    b'\x8c\x1f\xb5\x1a\x94{u\xc1\xd5\xb4\xae\xae\xc1\x92"\xc2\x1a\xdcA\xb8m\xdf%\xc2\x9b`\xe3\x02\x99\xeb\xb1\xc2\x90\xe2\x1ez\xc6\xb8\xb8\xc2\xa5e\xb17[>\xbc\xc2\xc0\xa5I\xb8\xcc\xba\xe2\xc2\x95\x1f\xd6\x84\xe56\xf8\xc2\xec\xd7\xa7S\xa6\x84f\xc3d\xdbA\x16\x92\xb5o\xc3\xae\x02\x1c\x15m\tv\xc3\x91\xc9\xd3f\x03\xef\xb2\xc3'
+    b'\xb0\x8b\xb12\xae~I\xc4\xfd\x83\xa9\xcf\xd4\xf5K\xc45o\xd1|Q\xcb{\xc4\xf1\xdd1`/\xd9\x80\xc4\xa2)\xbc\x91>\xf2\xdf\xc4\x19uo\xd1\xf3\x15\xef\xc4\xf8\xa7\xd2\xab\xf4[\x15\xc5\xde\x9c\xb8o@\x0bX\xc5\x8d\xc9\x9e&\x1f3\x7f\xc5\x1c\xecc\xc8t\x9d\x9e\xc5\xa9\x94\xe9\xa3.&\x00\xc63\x00\xed\xb1\xfbsc\xc6'
+    b'"`Hm2/~\xc6\xcabS\x96\xa25\x16\xc7#\xbb;<1\xc8%\xc7\xee\xe3dlr\x8a8\xc7\xe8\xf4\xdfHj\xa7r\xc7\xe9\xf4\xdfHj\xa7r\xc7\xeb\xf4\xdfHj\xa7r\xc7\xee\xf4\xdfHj\xa7r\xc7\xef\xf4\xdfHj\xa7r\xc7\xe7:\xf8\xa3\x86\xf8\x99\xc7\xb9\xbfzB\xba\xcc\xf1\xc7\x1e\x98\xabO\xbf&\x06\xc8'
+    b'\xe0\xb5.C\xff\xb1j\xc80\xdb\xd1\xb7xc\xc2\xc82\xdb\xd1\xb7xc\xc2\xc83\xdb\xd1\xb7xc\xc2\xc8\xdf\xbb\x8e\x96\n8(\xc9}Sv\xe51\xc3h\xc9\x02\xf6\x90\xe5\xb2\xd6\x86\xc9\xbav\xb8\x83\xdd\xd4\x12\xca\xd2\x98f\xed\x85wv\xca=\x10\n\x14Fd\xb2\xca\xf7\xc0^\x08\xdd\x07p\xcb@\x81\xcav\x08\x87\xa2\xcb'
+    b'\xf5]\x89Z\x1cI\xc2\xcb>\xc3^SS\xf5\xd0\xcb\x91\xc4\xa8<\xa6\xcf\xd8\xcb3\xc8\x9dZ\x1c2\xda\xcb\\\x99\xd0\xa4\x04=\xe3\xcbOR`V\xd6\xa5\\\xcc\xf2\x84\xff\xd5~\xfbm\xcc\x04\x9d\xe2G\x95\x90\xa6\xcc\xac\xbd=\xa0\xbfJ\xb5\xcc\x7fA7\xf3\xc72\xc1\xcc\xbfC+MC5\xe0\xcc)\xa9\xdf\x92\xeb%W\xcd'
+    b'$W\x90\xabDI\x88\xcdMb\r\xed\x90#\x96\xcd\xb6\x17\x9fI\x0f?\xac\xcd:\x91\x19_\xa5\t\x9d\xce\xfbdMP3\xe4\xbd\xceE\xdb"\xc2\x16,\xf3\xce8\x16\xd1v\xea\x1a8\xcf\x0e\xa5\xf3R\xdd\nP\xcf\xb2\'\xb5\x9c\xf9e.\xd0l\xe9\xfa:\x96\xb3\x92\xd0\x17\xc2\xed\xcd\xb4\xf1\x9d\xd0\x96\xc9\x83\xbdQ\x82e\xd1'
+    b'\xfc8)sF%o\xd1YH\xe5\x9ar\x90z\xd1\x9a\x1dP\xd4^\x07|\xd2G\xb6\xd6\x91a*\x9e\xd2lk#\x1a\xadU\x91\xd34P\x1c\x0b@\xa2\xac\xd3>\x82K\x8f\xc9L\xc0\xd3\xeb\xde\x01\xe6\xcd\x95\x1f\xd4_\xbf\x95\xa3\xc3\xbe\x93\xd4\n%\xf3\x00\xc5\xac\xe9\xd4\xe2\xf5\n\x1e\x18a\x1f\xd5\x1by\xdf\x82b\xc8\x8e\xd5'
+    b"\n\x8eJ\xf1O\xe9\\\xd6\x7f\x96\x9aR\x89\xec\xfc\xd6\rh@\x80\x87\xb4\x99\xd72\xd1\xa7}'T\xe4\xd7\xa0\xb20\xf7\xe7P\x82\xd8e\x12\x11\xf1\xd9\x85\xef\xd8\xb5\xb0\x92#i\xb5+\xd9\xcfjd\x02\xf4\x82\x8d\xd9P\xd7yO\xf3\x7f\xbb\xd9\xea.\xe2\x0e\xf33\x01\xda{k\xcc\xa6\\M.\xdb\xe2\xac\xc6'\x84\x9d1\xdb"
+    b'\xda7\xe5\x0e3U5\xdc\xe1;\xb5~\xb8/V\xdc\x18\x1d\xf0HVI\xd9\xdc\xe1~\x8bs\x94\x8f\xfd\xdc\xe6\xaa]G\xc2\xaaM\xdd\x19\\\x0b\x01\x81\xd2k\xdd\xe6G\xf3\xa3\xdf\xba\x8f\xdd\xf7\x15\x9fx\xe3\xe3\r\xde\x19a\xe7x\xe3\xeab\xde\x90\xc4UC\xbe\x06\x16\xdf\xad\x13d$\xf5\x18\x1a\xdf"=y#\xb7\x89$\xdf'
+    b'\xd42\x90ue\x9d$\xdfa\x86fQ6\xdfG\xdfOc\xba\xa4\x95\xeed\xdf\x9e\xe9\xbd\xe4\xc5\x1bt\xdf\xfb\xfe3:\n\xd4\xa9\xdf\xed\xf6\x95&dB\x06\xe0\x08\x8c\\\x83%\xd1\x07\xe0\xd5S\x98i\xc45d\xe0aO\x01<\x10$\xac\xe0/\xfbZSk\xf8~\xe1\x0c\x84^\xee\x83\xee\xb5\xe1\xe7\xabv\xfecV\xe7\xe1'
+    b'Y\x15~\x19\x9d\xec,\xe2l\xdf\x13\x97\xddZN\xe2\xc1\xeb&*\xd6\x0c\xb9\xe2$\xa4Zb&^\x1d\xe3\x92\x1e\xe5U\x14\xe15\xe3\xb6\x9e8\xf8\x02L)\xe4\xef\x9d&]!\xf4s\xe4\x95X)\x1e\x98&\x90\xe4g\xac\x95\xe8\xb2\xb9\x0c\xe5\xf6\xf3b+@x3\xe5\xceU1x\xeb%G\xe5\xb5\x1f\xe2f\xdd\xef]\xe5'
+    b"\xe8\xbdz\xcf}\xc5\x9e\xe5\xf0\x03=C\xbfV\xd0\xe5\x03w\xe9\xee\x07\t\xe6\xe5\xf7\xbc\xc9yHf\r\xe6\x95\x03l\xa7j\xe64\xe6\xe0\xb8\x03|\xd2fa\xe6\x84\xbb\xd5:\x0cv\xd3\xe6\xd4\x8bY\x8ak,\x8c\xe7\x95\x13\xf5P\xd16s\xe8\xf5+\xab'!e\x80\xe8\xbb\xf68\xa2$\x0f\xb2\xe8<\xcfo\x15+\xbd0\xe9"
+    b'\xaf]+\xd5\x0ckX\xe9\xbb\xd5\x7f\x13\xb7\x93\xcf\xe9\xec\x13\x9a\xbc\xf6\x1f\xd0\xe9w]\xb65\xd1\xb2\x0e\xeaW\xb7\xaf\x0ey\x9e+\xeaG\xe3u$\xa1\x1e\x85\xea+\\)\xcc\xc2w\xd3\xea{\x13O\xb0\xd2\x8d\xd7\xea\xc2\x1aITkZ\x80\xeb\xfa\x126\xa0\xcd\xd8\x80\xeb\xe5\x05CGs\x0e\xba\xeb\x9cm\xe8D\xd0c\xdb\xeb'
+    b'\xffp\x93WAo\xe0\xeb\xbf\xba\xdeh@\xdb \xec`\x12\x17\x83\xfc\xb6=\xec\x00\xbf\n\xfa*7A\xec{pl\xe9\xda;b\xec\xbf\xef\xad\xe86\xcb9\xed\xeb\x1b\x15\x80\xbfz\x86\xed_\xe9\xa6\xcd\x0b\r\x1d\xee\xd1ga\x80\xa2"\x1e\xee\xfcn\x96\xb5\xdd\xd6b\xee\x91\x17\x9b\xec\xa7\x9e\xdb\xeeH\xa5\xfa\x9a/\xe0l\xef'
+    b'\xcd\x14@\xea\xc4\xe0\xc4\xefx$\xaac\x83\x8b\xc6\xf0\x15\xae\xbcU\x8f\xcd\xec\xf0!K{6o\xfa\xa7\xf1\xe2\x97E>\xbe\xfd\xf6\xf1\x9b\xdc\x8c\xc7\xf7\xd3%\xf4\xaf\xb0O\x80\xbcq1\xf4\xa8\xf0!\x17x\xf9U\xf46\xaf^\xe4\x98\xfc\xa9\xf4\xf38\x07\x10\xac=\xc2\xf4\xba{~\xbb\xce\x87\r\xf5\xcb\t9Y\xcf\x90.\xf5'
+    b'\xbbU\xe2\xd1\xa5\x0b<\xf5~\xef>\xe8\xe5\x16f\xf5.\x05\xfbYw\x9bH\xf6\x07^\xcf\xda-=^\xf6\x11B\xb6\xe9g,\xa5\xf6\xa4O8)D\xb6\xe8\xf6\xb1\xba\xe6A\xed#\xeb\xf6\xacu\x8b\x05\x91\x84/\xf7\xd6IN\x90\x1e\xe8m\xf7\xb9\x80!Ia\xbf\xd4\xf7\xcc\xec\xf0VX?\xe6\xf7X8\x18\xaaCK"\xf8'
+    b'\xdf\x80\xe9\x87\xc2\x02x\xf8"\xf9\x11\xde\x8a#\x96\xf8|I\x96\x8c\xefN\xc0\xf8\xff.\x8d4}\x9d\x15\xf9$mM/\xd0\tq\xf9%mM/\xd0\tq\xf9\'mM/\xd0\tq\xf9\xe8\x9f\x17\xcc\xef(s\xf9q.fa\'\x0b\x11\xfa\xaf\xb5\xb6S\x03\xe4\x19\xfa\xef\\\x1b\xcd\xfdW)\xfa|~\t\xb1\xe6[\x8a\xfa'
+    b'\x1c\xe6"p\x07\xd9\xb3\xfa1n\xd7\\\xf7\x8b.\xfb\xb3\xcbs.\xf8\x1d\x93\xfb\x834\x179\x16\x83\xc0\xfc\xa3L\xdb+#\xa5\xdc\xfcH^\xa3~Hw\xa3\xfd\x1c,\xabap\xa5$\xfetU\x9d#\t\xb99\xfe\x83\xb45\xc5\xad 4\xffp^\xa5@$\xc4\x8d\xff'
+)
+OFFSETS = (
+    b'\x00\x00\x00\x00\x0f\x00\x00\x00\x17\x00\x00\x00"\x00\x00\x00+\x00\x00\x002\x00\x00\x00O\x00\x00\x00l\x00\x00\x00\x87\x00\x00\x00\xa2\x00\x00\x00\xbf\x00\x00\x00\xda\x00\x00\x00\xf0\x00\x00\x00\x05\x01\x00\x00\x1e\x01\x00\x008\x01\x00\x00X\x01\x00\x00z\x01\x00\x00\x93\x01\x00\x00\xa4\x01\x00\x00\xb7\x01\x00\x00\xc8\x01\x00\x00\xe1\x01\x00\x00\xf9\x01\x00\x00'
+    b'\x0b\x02\x00\x00!\x02\x00\x007\x02\x00\x00M\x02\x00\x00\\\x02\x00\x00x\x02\x00\x00\x98\x02\x00\x00\xb3\x02\x00\x00\xd2\x02\x00\x00\xe6\x02\x00\x00\xfa\x02\x00\x00\x0b\x03\x00\x00\x1f\x03\x00\x000\x03\x00\x00D\x03\x00\x00T\x03\x00\x00c\x03\x00\x00s\x03\x00\x00\x81\x03\x00\x00\x9a\x03\x00\x00\xa6\x03\x00\x00\xbb\x03\x00\x00\xc8\x03\x00\x00\xdd\x03\x00\x00'
+    b'\xef\x03\x00\x00\x01\x04\x00\x00\x10\x04\x00\x00 \x04\x00\x00,\x04\x00\x008\x04\x00\x00H\x04\x00\x00X\x04\x00\x00m\x04\x00\x00\x8d\x04\x00\x00\xa7\x04\x00\x00\xbc\x04\x00\x00\xd6\x04\x00\x00\xf1\x04\x00\x00\x0c\x05\x00\x00\x1c\x05\x00\x00+\x05\x00\x008\x05\x00\x00I\x05\x00\x00V\x05\x00\x00g\x05\x00\x00u\x05\x00\x00\x88\x05\x00\x00\x99\x05\x00\x00'
+    b'\xa7\x05\x00\x00\xb6\x05\x00\x00\xc5\x05\x00\x00\xd2\x05\x00\x00\xe4\x05\x00\x00\xf6\x05\x00\x00\t\x06\x00\x00\x19\x06\x00\x00$\x06\x00\x005\x06\x00\x00F\x06\x00\x00U\x06\x00\x00g\x06\x00\x00v\x06\x00\x00\x84\x06\x00\x00\x8f\x06\x00\x00\x9c\x06\x00\x00\xb3\x06\x00\x00\xc3\x06\x00\x00\xd0\x06\x00\x00\xe5\x06\x00\x00\x02\x07\x00\x00\x11\x07\x00\x00)\x07\x00\x00'
+    b'<\x07\x00\x00U\x07\x00\x00o\x07\x00\x00\x87\x07\x00\x00\x97\x07\x00\x00\x9f\x07\x00\x00\xb6\x07\x00\x00\xc4\x07\x00\x00\xd3\x07\x00\x00\xe8\x07\x00\x00\xf7\x07\x00\x00\x07\x08\x00\x00\x15\x08\x00\x00/\x08\x00\x00S\x08\x00\x00`\x08\x00\x00n\x08\x00\x00\x82\x08\x00\x00\xaf\x08\x00\x00\xde\x08\x00\x00\xed\x08\x00\x00\x07\t\x00\x00 \t\x00\x00T\t\x00\x00'
+    b'p\t\x00\x00\x84\t\x00\x00\x95\t\x00\x00\xa5\t\x00\x00\xb7\t\x00\x00\xc7\t\x00\x00\xd2\t\x00\x00\xe1\t\x00\x00\xf1\t\x00\x00\x14\n\x00\x00*\n\x00\x00K\n\x00\x00e\n\x00\x00\x7f\n\x00\x00\x98\n\x00\x00\xb1\n\x00\x00\xc7\n\x00\x00\xe0\n\x00\x00\xe8\n\x00\x00\xf6\n\x00\x00\t\x0b\x00\x00-\x0b\x00\x00>\x0b\x00\x00Y\x0b\x00\x00'
+    b'~\x0b\x00\x00\xa3\x0b\x00\x00\xc8\x0b\x00\x00\xd8\x0b\x00\x00\xe7\x0b\x00\x00\x02\x0c\x00\x00\x0f\x0c\x00\x006\x0c\x00\x00N\x0c\x00\x00X\x0c\x00\x00o\x0c\x00\x00\x8a\x0c\x00\x00\x97\x0c\x00\x00\xa5\x0c\x00\x00\xb5\x0c\x00\x00\xc3\x0c\x00\x00\xd5\x0c\x00\x00\xe9\x0c\x00\x00\x07\r\x00\x00\x19\r\x00\x00*\r\x00\x00E\r\x00\x00U\r\x00\x00d\r\x00\x00'
+    b'\x82\r\x00\x00\x90\r\x00\x00\x9f\r\x00\x00\xb4\r\x00\x00\xc3\r\x00\x00\xd5\r\x00\x00\xe4\r\x00\x00\x00\x0e\x00\x00\x1e\x0e\x00\x00<\x0e\x00\x00X\x0e\x00\x00i\x0e\x00\x00\x7f\x0e\x00\x00\x90\x0e\x00\x00\x9d\x0e\x00\x00\xab\x0e\x00\x00\xc7\x0e\x00\x00\xd4\x0e\x00\x00\xeb\x0e\x00\x00\t\x0f\x00\x00"\x0f\x00\x00<\x0f\x00\x00P\x0f\x00\x00`\x0f\x00\x00'
+    b'p\x0f\x00\x00\x80\x0f\x00\x00\x90\x0f\x00\x00\xa0\x0f\x00\x00\xb7\x0f\x00\x00\xd3\x0f\x00\x00\xea\x0f\x00\x00\x12\x10\x00\x009\x10\x00\x00S\x10\x00\x00o\x10\x00\x00\x87\x10\x00\x00\x95\x10\x00\x00\xb4\x10\x00\x00\xc2\x10\x00\x00\xdc\x10\x00\x00\xf4\x10\x00\x00\x1f\x11\x00\x009\x11\x00\x00V\x11\x00\x00u\x11\x00\x00\x97\x11\x00\x00\xad\x11\x00\x00\xd2\x11\x00\x00'
+    b'\xf7\x11\x00\x00\x16\x12\x00\x000\x12\x00\x00G\x12\x00\x00g\x12\x00\x00\x86\x12\x00\x00\xa6\x12\x00\x00\xb7\x12\x00\x00\xc4\x12\x00\x00\xd2\x12\x00\x00\xee\x12\x00\x00\x18\x13\x00\x001\x13\x00\x00[\x13\x00\x00y\x13\x00\x00\x9b\x13\x00\x00\xbd\x13\x00\x00\xdc\x13\x00\x00\xfc\x13\x00\x00"\x14\x00\x00@\x14\x00\x00m\x14\x00\x00\x88\x14\x00\x00\xb0\x14\x00\x00'
+    b'\xd3\x14\x00\x00\xf9\x14\x00\x00 \x15\x00\x00C\x15\x00\x00_\x15\x00\x00v\x15\x00\x00\x8c\x15\x00\x00\xa6\x15\x00\x00\xcc\x15\x00\x00\xd9\x15\x00\x00\xf4\x15\x00\x00\x15\x16\x00\x00.\x16\x00\x00M\x16\x00\x00r\x16\x00\x00\x8d\x16\x00\x00\xb6\x16\x00\x00\xd7\x16\x00\x00\xe5\x16\x00\x00\xf8\x16\x00\x00\x0b\x17\x00\x00 \x17\x00\x006\x17\x00\x00M\x17\x00\x00'
+    b'f\x17\x00\x00w\x17\x00\x00\x8f\x17\x00\x00\xb8\x17\x00\x00\xd1\x17\x00\x00\xed\x17\x00\x00\t\x18\x00\x00"\x18\x00\x00C\x18\x00\x00Y\x18\x00\x00t\x18\x00\x00\x87\x18\x00\x00\xa4\x18\x00\x00\xbe\x18\x00\x00\xe1\x18\x00\x00\xff\x18\x00\x00\x0e\x19\x00\x00&\x19\x00\x00H\x19\x00\x00_\x19\x00\x00m\x19\x00\x00}\x19\x00\x00\x8c\x19\x00\x00\xa1\x19\x00\x00'
+    b'\xbd\x19\x00\x00\xd2\x19\x00\x00\xe6\x19\x00\x00\xfa\x19\x00\x00\x10\x1a\x00\x004\x1a\x00\x00P\x1a\x00\x00l\x1a\x00\x00u\x1a\x00\x00\x92\x1a\x00\x00\xae\x1a\x00\x00\xc1\x1a\x00\x00\xd7\x1a\x00\x00\xe4\x1a\x00\x00\xf4\x1a\x00\x00\x07\x1b\x00\x00\x1d\x1b\x00\x00*\x1b\x00\x009\x1b\x00\x00P\x1b\x00\x00g\x1b\x00\x00\x7f\x1b\x00\x00\x97\x1b\x00\x00\xa8\x1b\x00\x00'
+    b'\xb5\x1b\x00\x00\xc7\x1b\x00\x00\xde\x1b\x00\x00\xf8\x1b\x00\x00\x0c\x1c\x00\x00\x1e\x1c\x00\x00/\x1c\x00\x00>\x1c\x00\x00L\x1c\x00\x00a\x1c\x00\x00v\x1c\x00\x00\x8e\x1c\x00\x00\xab\x1c\x00\x00\xc5\x1c\x00\x00\xd6\x1c\x00\x00\xe6\x1c\x00\x00\xf6\x1c\x00\x00\x05\x1d\x00\x00!\x1d\x00\x00/\x1d\x00\x00=\x1d\x00\x00I\x1d\x00\x00_\x1d\x00\x00r\x1d\x00\x00'
+    b'\x84\x1d\x00\x00\x95\x1d\x00\x00\xa8\x1d\x00\x00\xbb\x1d\x00\x00\xcc\x1d\x00\x00\xee\x1d\x00\x00\x08\x1e\x00\x00"\x1e\x00\x004\x1e\x00\x00C\x1e\x00\x00U\x1e\x00\x00l\x1e\x00\x00\x81\x1e\x00\x00\x92\x1e\x00\x00\xa3\x1e\x00\x00\xb7\x1e\x00\x00\xca\x1e\x00\x00\xdc\x1e\x00\x00\xf3\x1e\x00\x00\n\x1f\x00\x00\x19\x1f\x00\x00*\x1f\x00\x007\x1f\x00\x00H\x1f\x00\x00'
+    b'^\x1f\x00\x00u\x1f\x00\x00\x89\x1f\x00\x00\x98\x1f\x00\x00\xab\x1f\x00\x00\xbe\x1f\x00\x00\xde\x1f\x00\x00\xfd\x1f\x00\x00\r \x00\x00\x14 \x00\x00( \x00\x00L \x00\x00b \x00\x00u \x00\x00\x92 \x00\x00\xa0 \x00\x00\xb8 \x00\x00\xd0 \x00\x00\xe2 \x00\x00\x07!\x00\x00+!\x00\x00:!\x00\x00V!\x00\x00p!\x00\x00'
+    b'\x87!\x00\x00\x9e!\x00\x00\xaf!\x00\x00\xcb!\x00\x00\xd7!\x00\x00\xee!\x00\x00\x15"\x00\x00("\x00\x002"\x00\x00Q"\x00\x00X"\x00\x00b"\x00\x00s"\x00\x00\x8a"\x00\x00\xa9"\x00\x00\xbf"\x00\x00\xd9"\x00\x00\xf8"\x00\x00\x0c#\x00\x00%#\x00\x00C#\x00\x00U#\x00\x00p#\x00\x00\x88#\x00\x00'
+    b"\xa2#\x00\x00\xc0#\x00\x00\xdd#\x00\x00\xe8#\x00\x00\x0b$\x00\x00'$\x00\x00A$\x00\x00S$\x00\x00g$\x00\x00v$\x00\x00\x94$\x00\x00\xa9$\x00\x00\xba$\x00\x00\xed$\x00\x00\t%\x00\x00!%\x00\x00I%\x00\x00v%\x00\x00\xa2%\x00\x00\xb7%\x00\x00\xd4%\x00\x00\xef%\x00\x00\x01&\x00\x00\x15&\x00\x00"
+    b",&\x00\x00D&\x00\x00Y&\x00\x00l&\x00\x00\x83&\x00\x00\x9c&\x00\x00\xb3&\x00\x00\xd3&\x00\x00\xe1&\x00\x00\x01'\x00\x00\x11'\x00\x00)'\x00\x00A'\x00\x00^'\x00\x00v'\x00\x00\x86'\x00\x00\x9d'\x00\x00\xb5'\x00\x00\xcf'\x00\x00\xe6'\x00\x00\xf7'\x00\x00\x0e(\x00\x001(\x00\x00E(\x00\x00"
+    b'^(\x00\x00\x84(\x00\x00\x9c(\x00\x00\xc1(\x00\x00\xe1(\x00\x00\x00)\x00\x00\x1a)\x00\x004)\x00\x00N)\x00\x00j)\x00\x00\x88)\x00\x00\xa4)\x00\x00\xbc)\x00\x00\xd6)\x00\x00\xf2)\x00\x00\x0f*\x00\x000*\x00\x00P*\x00\x00o*\x00\x00~*\x00\x00\x9e*\x00\x00\xb2*\x00\x00\xc5*\x00\x00\xde*\x00\x00'
+    b'\x01+\x00\x00\x1b+\x00\x004+\x00\x00H+\x00\x00a+\x00\x00x+\x00\x00\x97+\x00\x00\xb4+\x00\x00\xce+\x00\x00\xe9+\x00\x00\x02,\x00\x00\x1e,\x00\x009,\x00\x00U,\x00\x00n,\x00\x00\x8b,\x00\x00\xa4,\x00\x00\xc5,\x00\x00\xe8,\x00\x00\xfd,\x00\x00\x14-\x00\x00--\x00\x00F-\x00\x00_-\x00\x00'
+    b'x-\x00\x00\x83-\x00\x00\x9b-\x00\x00\xc2-\x00\x00\xe3-\x00\x00\xff-\x00\x00%.\x00\x00>.\x00\x00Z.\x00\x00l.\x00\x00\x8a.\x00\x00\xa8.\x00\x00\xc7.\x00\x00\xe6.\x00\x00\x03/\x00\x00 /\x00\x00=/\x00\x00X/\x00\x00s/\x00\x00\x8e/\x00\x00\xac/\x00\x00\xc8/\x00\x00\xe4/\x00\x00\x000\x00\x00'
+    b'\x1f0\x00\x0010\x00\x00G0\x00\x00^0\x00\x00\x7f0\x00\x00\xa00\x00\x00\xb20\x00\x00\xcb0\x00\x00\xde0\x00\x00\xff0\x00\x00\x151\x00\x0031\x00\x00K1\x00\x00d1\x00\x00u1\x00\x00\x8b1\x00\x00\xa51\x00\x00\xbe1\x00\x00\xd51\x00\x00\xe51\x00\x00\xfa1\x00\x00\x122\x00\x00)2\x00\x00;2\x00\x00'
+    b'O2\x00\x00h2\x00\x00~2\x00\x00\x912\x00\x00\xa92\x00\x00\xc62\x00\x00\xe02\x00\x00\xff2\x00\x00\x143\x00\x00:3\x00\x00N3\x00\x00`3\x00\x00u3\x00\x00\x893\x00\x00\xa13\x00\x00\xb83\x00\x00\xd93\x00\x00\xee3\x00\x00\x044\x00\x00\x1f4\x00\x0074\x00\x00J4\x00\x00]4\x00\x00i4\x00\x00'
+    b'\x834\x00\x00\x964\x00\x00\xaf4\x00\x00\xc54\x00\x00\xde4\x00\x00\x065\x00\x00#5\x00\x00<5\x00\x00\\5\x00\x00m5\x00\x00\x835\x00\x00\x9c5\x00\x00\xb55\x00\x00\xd15\x00\x00\xf75\x00\x00\x126\x00\x00&6\x00\x00J6\x00\x00p6\x00\x00\x936\x00\x00\xb36\x00\x00\xcf6\x00\x00\xf36\x00\x00\x197\x00\x00'
+    b'07\x00\x00A7\x00\x00S7\x00\x00j7\x00\x00\x8b7\x00\x00\xa97\x00\x00\xbd7\x00\x00\xdc7\x00\x00\xf77\x00\x00\x138\x00\x00.8\x00\x00V8\x00\x00t8\x00\x00\x848\x00\x00\x9e8\x00\x00\xaf8\x00\x00\xc08\x00\x00\xd78\x00\x00\xf08\x00\x00\x0e9\x00\x00)9\x00\x00L9\x00\x00j9\x00\x00\x829\x00\x00'
+    b"\x929\x00\x00\xa19\x00\x00\xca9\x00\x00\xf39\x00\x00\x1c:\x00\x00E:\x00\x00n:\x00\x00\x97:\x00\x00\xb5:\x00\x00\xc4:\x00\x00\xe3:\x00\x00\x02;\x00\x00';\x00\x00J;\x00\x00i;\x00\x00\x8a;\x00\x00\xac;\x00\x00\xcd;\x00\x00\xea;\x00\x00\x0c<\x00\x00/<\x00\x00V<\x00\x00h<\x00\x00\x86<\x00\x00"
+    b'\x9f<\x00\x00\xc1<\x00\x00\xe3<\x00\x00\xf7<\x00\x00\x0c=\x00\x004=\x00\x00V=\x00\x00s=\x00\x00\x93=\x00\x00\xb6=\x00\x00\xde=\x00\x00\xf3=\x00\x00\r>\x00\x00->\x00\x00S>\x00\x00u>\x00\x00\x97>\x00\x00\xb3>\x00\x00\xc6>\x00\x00\xe0>\x00\x00\xff>\x00\x00(?\x00\x007?\x00\x00L?\x00\x00'
+    b'`?\x00\x00v?\x00\x00\x92?\x00\x00\xab?\x00\x00\xbc?\x00\x00\xcf?\x00\x00\xe9?\x00\x00\xfa?\x00\x00\x16@\x00\x008@\x00\x00U@\x00\x00n@\x00\x00}@\x00\x00\x9b@\x00\x00\xab@\x00\x00\xb9@\x00\x00\xc7@\x00\x00\xe4@\x00\x00\xfa@\x00\x00\x14A\x00\x00\x1dA\x00\x00:A\x00\x00[A\x00\x00uA\x00\x00'
+    b'\x90A\x00\x00\xa6A\x00\x00\xb5A\x00\x00\xcfA\x00\x00\xf5A\x00\x00\x11B\x00\x00!B\x00\x008B\x00\x00CB\x00\x00aB\x00\x00\x88B\x00\x00\xa4B\x00\x00\xc1B\x00\x00\xddB\x00\x00\xf8B\x00\x00\x0eC\x00\x00&C\x00\x00;C\x00\x00NC\x00\x00aC\x00\x00qC\x00\x00\x85C\x00\x00\xa1C\x00\x00\xb9C\x00\x00'
+    b'\xccC\x00\x00\xe1C\x00\x00\xf8C\x00\x00\x17D\x00\x00 D\x00\x00.D\x00\x006D\x00\x00MD\x00\x00fD\x00\x00\x81D\x00\x00\x90D\x00\x00\xabD\x00\x00\xc1D\x00\x00\xd0D\x00\x00\xdbD\x00\x00\xebD\x00\x00\xfbD\x00\x00\x12E\x00\x00/E\x00\x00BE\x00\x00]E\x00\x00\x8cE\x00\x00\x94E\x00\x00\xb4E\x00\x00'
+    b'\xe3E\x00\x00\xfbE\x00\x00\x13F\x00\x005F\x00\x00DF\x00\x00]F\x00\x00pF\x00\x00\x82F\x00\x00\x95F\x00\x00\xaeF\x00\x00\xc6F\x00\x00\xe9F\x00\x00\x10G\x00\x009G\x00\x00WG\x00\x00mG\x00\x00\x86G\x00\x00\x9dG\x00\x00\xb0G\x00\x00\xc4G\x00\x00\xe1G\x00\x00\x00H\x00\x00\x1cH\x00\x00/H\x00\x00'
+    b'@H\x00\x00XH\x00\x00nH\x00\x00\x86H\x00\x00\x98H\x00\x00\xadH\x00\x00\xbeH\x00\x00\xd7H\x00\x00\xf0H\x00\x00\xfeH\x00\x00\x11I\x00\x00!I\x00\x009I\x00\x00FI\x00\x00YI\x00\x00}I\x00\x00\x8eI\x00\x00\x9dI\x00\x00\xbbI\x00\x00\xd3I\x00\x00\xebI\x00\x00\xffI\x00\x00\x13J\x00\x00,J\x00\x00'
+    b'EJ\x00\x00VJ\x00\x00fJ\x00\x00}J\x00\x00\x8fJ\x00\x00\xa5J\x00\x00\xb3J\x00\x00\xc1J\x00\x00\xd4J\x00\x00\xe5J\x00\x00\xfcJ\x00\x00\x10K\x00\x00\x1dK\x00\x009K\x00\x00FK\x00\x00QK\x00\x00eK\x00\x00mK\x00\x00\x83K\x00\x00\x93K\x00\x00\xa2K\x00\x00\xcdK\x00\x00\xf3K\x00\x00\x13L\x00\x00'
+    b'3L\x00\x00JL\x00\x00dL\x00\x00\x83L\x00\x00\xa8L\x00\x00\xb9L\x00\x00\xcbL\x00\x00\xe0L\x00\x00\xffL\x00\x00\x1eM\x00\x00+M\x00\x00BM\x00\x00[M\x00\x00tM\x00\x00\x8bM\x00\x00\xa5M\x00\x00\xbdM\x00\x00\xd5M\x00\x00\xefM\x00\x00\x0fN\x00\x00&N\x00\x00@N\x00\x00XN\x00\x00nN\x00\x00'
+    b'\x87N\x00\x00\xa0N\x00\x00\xb6N\x00\x00\xd2N\x00\x00\xf1N\x00\x00\x0eO\x00\x00%O\x00\x00=O\x00\x00^O\x00\x00{O\x00\x00\x97O\x00\x00\xb4O\x00\x00\xd4O\x00\x00\xf5O\x00\x00\x16P\x00\x007P\x00\x00UP\x00\x00rP\x00\x00\x84P\x00\x00\x96P\x00\x00\xb8P\x00\x00\xd1P\x00\x00\xedP\x00\x00\x04Q\x00\x00'
+    b'\x1eQ\x00\x007Q\x00\x00SQ\x00\x00oQ\x00\x00\x86Q\x00\x00\x95Q\x00\x00\xa8Q\x00\x00\xc3Q\x00\x00\xd8Q\x00\x00\xecQ\x00\x00\x06R\x00\x00 R\x00\x006R\x00\x00NR\x00\x00tR\x00\x00\x8dR\x00\x00\xaaR\x00\x00\xcdR\x00\x00\xddR\x00\x00\x00S\x00\x00\rS\x00\x00$S\x00\x00=S\x00\x00WS\x00\x00'
+    b'oS\x00\x00\x89S\x00\x00\x9aS\x00\x00\xb2S\x00\x00\xc5S\x00\x00\xd6S\x00\x00\xebS\x00\x00\x03T\x00\x00\x1cT\x00\x00:T\x00\x00XT\x00\x00vT\x00\x00\x94T\x00\x00\xa3T\x00\x00\xb7T\x00\x00\xcbT\x00\x00\xdfT\x00\x00\xf3T\x00\x00\x07U\x00\x00\x1cU\x00\x008U\x00\x00TU\x00\x00nU\x00\x00\x87U\x00\x00'
+    b'\x9dU\x00\x00\xb2U\x00\x00\xd3U\x00\x00\xe5U\x00\x00\xfaU\x00\x00\tV\x00\x00&V\x00\x00<V\x00\x00ZV\x00\x00uV\x00\x00\x8eV\x00\x00\xa6V\x00\x00\xc2V\x00\x00\xd8V\x00\x00\xf7V\x00\x00\x0eW\x00\x00-W\x00\x00OW\x00\x00iW\x00\x00\x8aW\x00\x00\xadW\x00\x00\xc0W\x00\x00\xd5W\x00\x00\xf5W\x00\x00'
+    b'\x08X\x00\x00!X\x00\x00:X\x00\x00RX\x00\x00jX\x00\x00}X\x00\x00\x99X\x00\x00\xc0X\x00\x00\xd8X\x00\x00\xfcX\x00\x00\x11Y\x00\x00&Y\x00\x008Y\x00\x00KY\x00\x00iY\x00\x00\x93Y\x00\x00\x9bY\x00\x00\xb3Y\x00\x00\xc4Y\x00\x00\xe5Y\x00\x00\xfdY\x00\x00\x16Z\x00\x001Z\x00\x00MZ\x00\x00'
+    b'dZ\x00\x00\x7fZ\x00\x00\x9cZ\x00\x00\xc0Z\x00\x00\xdaZ\x00\x00\xeaZ\x00\x00\x0e[\x00\x00/[\x00\x00;[\x00\x00V[\x00\x00q[\x00\x00\x8f[\x00\x00\xa5[\x00\x00\xbe[\x00\x00\xce[\x00\x00\xe0[\x00\x00\xf3[\x00\x00\x0b\\\x00\x00\x1e\\\x00\x006\\\x00\x00L\\\x00\x00]\\\x00\x00s\\\x00\x00\x8a\\\x00\x00'
+    b"\x9a\\\x00\x00\xb8\\\x00\x00\xce\\\x00\x00\xe3\\\x00\x00\x00]\x00\x00\x11]\x00\x00']\x00\x00D]\x00\x00d]\x00\x00r]\x00\x00\x8e]\x00\x00\xab]\x00\x00\xcd]\x00\x00\xeb]\x00\x00\n^\x00\x00(^\x00\x00>^\x00\x00[^\x00\x00~^\x00\x00\x98^\x00\x00\xab^\x00\x00\xcb^\x00\x00\xf1^\x00\x00\x07_\x00\x00"
+    b'\x17_\x00\x00+_\x00\x00A_\x00\x00Z_\x00\x00u_\x00\x00\x95_\x00\x00\xb5_\x00\x00\xd9_\x00\x00\xf3_\x00\x00\x03`\x00\x00&`\x00\x00?`\x00\x00[`\x00\x00t`\x00\x00\x82`\x00\x00\x91`\x00\x00\xaa`\x00\x00\xbe`\x00\x00\xd1`\x00\x00\xe4`\x00\x00\xf7`\x00\x00\na\x00\x00\x1da\x00\x000a\x00\x00'
+    b"Ca\x00\x00Va\x00\x00ia\x00\x00\x87a\x00\x00\xa6a\x00\x00\xc4a\x00\x00\xe3a\x00\x00\x01b\x00\x00\x19b\x00\x00;b\x00\x00^b\x00\x00sb\x00\x00\x98b\x00\x00\xaab\x00\x00\xbcb\x00\x00\xd1b\x00\x00\xdbb\x00\x00\xedb\x00\x00\x0bc\x00\x00'c\x00\x00Cc\x00\x00^c\x00\x00vc\x00\x00\x8fc\x00\x00"
+    b'\xa8c\x00\x00\xb8c\x00\x00\xd4c\x00\x00\xecc\x00\x00\x04d\x00\x00\x1dd\x00\x008d\x00\x00Hd\x00\x00ad\x00\x00rd\x00\x00\x90d\x00\x00\xb2d\x00\x00\xcbd\x00\x00\xe8d\x00\x00\x07e\x00\x00)e\x00\x00>e\x00\x00Ne\x00\x00ie\x00\x00~e\x00\x00\x8fe\x00\x00\xa5e\x00\x00\xbfe\x00\x00\xd8e\x00\x00'
+    b'\xe8e\x00\x00\xfde\x00\x00\x16f\x00\x00.f\x00\x00Ef\x00\x00]f\x00\x00~f\x00\x00\x94f\x00\x00\xb6f\x00\x00\xcef\x00\x00\xeaf\x00\x00\ng\x00\x00\x16g\x00\x00"g\x00\x007g\x00\x00Vg\x00\x00\x7fg\x00\x00\x9cg\x00\x00\xbag\x00\x00\xd2g\x00\x00\xecg\x00\x00\xfcg\x00\x00\rh\x00\x00\x1ch\x00\x00'
+    b'4h\x00\x00Ph\x00\x00kh\x00\x00\x84h\x00\x00\x9ch\x00\x00\xc5h\x00\x00\xd4h\x00\x00\xf5h\x00\x00\x19i\x00\x007i\x00\x00Si\x00\x00}i\x00\x00\x98i\x00\x00\xb3i\x00\x00\xc9i\x00\x00\xdbi\x00\x00\xfei\x00\x00\x14j\x00\x007j\x00\x00Yj\x00\x00{j\x00\x00\x98j\x00\x00\xbej\x00\x00\xd8j\x00\x00'
+    b'\xf4j\x00\x00\x11k\x00\x00/k\x00\x00Ok\x00\x00ak\x00\x00sk\x00\x00\x87k\x00\x00\x93k\x00\x00\xb2k\x00\x00\xd6k\x00\x00\xebk\x00\x00\xfdk\x00\x00\x1fl\x00\x008l\x00\x00Ql\x00\x00yl\x00\x00\x92l\x00\x00\xaal\x00\x00\xbdl\x00\x00\xdel\x00\x00\xf3l\x00\x00\tm\x00\x00*m\x00\x00Nm\x00\x00'
+    b'qm\x00\x00\x95m\x00\x00\xaam\x00\x00\xc5m\x00\x00\xd8m\x00\x00\xf8m\x00\x00!n\x00\x00;n\x00\x00[n\x00\x00vn\x00\x00\x9cn\x00\x00\xb8n\x00\x00\xd4n\x00\x00\xeen\x00\x00\x08o\x00\x00!o\x00\x00@o\x00\x00ao\x00\x00\x85o\x00\x00\x94o\x00\x00\xb0o\x00\x00\xd3o\x00\x00\xf9o\x00\x00\rp\x00\x00'
+    b'#p\x00\x00Np\x00\x00Zp\x00\x00lp\x00\x00\x86p\x00\x00\xa6p\x00\x00\xc3p\x00\x00\xe1p\x00\x00\xfep\x00\x00\x1fq\x00\x007q\x00\x00Yq\x00\x00hq\x00\x00\x90q\x00\x00\xacq\x00\x00\xc7q\x00\x00\xdcq\x00\x00\xf1q\x00\x00\x0cr\x00\x00(r\x00\x00Cr\x00\x00kr\x00\x00\x87r\x00\x00\xa1r\x00\x00'
+    b'\xbfr\x00\x00\xcdr\x00\x00\xebr\x00\x00\ts\x00\x00\x1fs\x00\x00:s\x00\x00Ws\x00\x00ps\x00\x00\x85s\x00\x00\x9bs\x00\x00\xb0s\x00\x00\xc9s\x00\x00\xebs\x00\x00\x07t\x00\x00$t\x00\x00@t\x00\x00`t\x00\x00zt\x00\x00\x96t\x00\x00\xact\x00\x00\xcct\x00\x00\xeat\x00\x00\x07u\x00\x00#u\x00\x00'
+    b'Gu\x00\x00du\x00\x00\x88u\x00\x00\xa7u\x00\x00\xb9u\x00\x00\xd8u\x00\x00\xf9u\x00\x00\x18v\x00\x006v\x00\x00`v\x00\x00~v\x00\x00\x95v\x00\x00\xb8v\x00\x00\xd7v\x00\x00\xfdv\x00\x00!w\x00\x00Fw\x00\x00hw\x00\x00\x92w\x00\x00\xa4w\x00\x00\xc3w\x00\x00\xdew\x00\x00\x01x\x00\x00"x\x00\x00'
+    b'Hx\x00\x00fx\x00\x00\x85x\x00\x00\xa2x\x00\x00\xc1x\x00\x00\xdex\x00\x00\xfcx\x00\x00"y\x00\x00Cy\x00\x00cy\x00\x00~y\x00\x00\x9by\x00\x00\xb2y\x00\x00\xcby\x00\x00\xeby\x00\x00\x05z\x00\x00&z\x00\x00Oz\x00\x00`z\x00\x00\x80z\x00\x00\x9cz\x00\x00\xaez\x00\x00\xc0z\x00\x00\xcdz\x00\x00'
+    b"\xdcz\x00\x00\xf7z\x00\x00\x13{\x00\x00.{\x00\x00G{\x00\x00\\{\x00\x00x{\x00\x00\x92{\x00\x00\xa7{\x00\x00\xba{\x00\x00\xcd{\x00\x00\xe2{\x00\x00\xf8{\x00\x00\x10|\x00\x00+|\x00\x00H|\x00\x00`|\x00\x00\x81|\x00\x00\xa1|\x00\x00\xc1|\x00\x00\xdd|\x00\x00\xf8|\x00\x00\x13}\x00\x00'}\x00\x00"
+    b'C}\x00\x00c}\x00\x00\x80}\x00\x00\xa0}\x00\x00\xbf}\x00\x00\xc7}\x00\x00\xde}\x00\x00\xf5}\x00\x00\x06~\x00\x00\x1e~\x00\x001~\x00\x00T~\x00\x00w~\x00\x00\x94~\x00\x00\xa5~\x00\x00\xc4~\x00\x00\xd7~\x00\x00\xf6~\x00\x00\x12\x7f\x00\x00-\x7f\x00\x00@\x7f\x00\x00V\x7f\x00\x00o\x7f\x00\x00\x8d\x7f\x00\x00'
+    b'\x9e\x7f\x00\x00\xb5\x7f\x00\x00\xcb\x7f\x00\x00\xe3\x7f\x00\x00\xf7\x7f\x00\x00\x11\x80\x00\x006\x80\x00\x00L\x80\x00\x00g\x80\x00\x00\x85\x80\x00\x00\xa8\x80\x00\x00\xc8\x80\x00\x00\xe8\x80\x00\x00\x00\x81\x00\x00\x11\x81\x00\x003\x81\x00\x00P\x81\x00\x00i\x81\x00\x00\x8c\x81\x00\x00\xa2\x81\x00\x00\xba\x81\x00\x00\xdc\x81\x00\x00\x01\x82\x00\x00\x11\x82\x00\x00'
+    b'1\x82\x00\x00D\x82\x00\x00i\x82\x00\x00\x8f\x82\x00\x00\xb0\x82\x00\x00\xd1\x82\x00\x00\xf2\x82\x00\x00\x13\x83\x00\x004\x83\x00\x00U\x83\x00\x00q\x83\x00\x00\x95\x83\x00\x00\xaa\x83\x00\x00\xc8\x83\x00\x00\xde\x83\x00\x00\xfb\x83\x00\x00\x1b\x84\x00\x00:\x84\x00\x00U\x84\x00\x00s\x84\x00\x00\x85\x84\x00\x00\xa4\x84\x00\x00\xb4\x84\x00\x00\xc6\x84\x00\x00'
+    b'\xdd\x84\x00\x00\xef\x84\x00\x00\x11\x85\x00\x00!\x85\x00\x00-\x85\x00\x00H\x85\x00\x00O\x85\x00\x00_\x85\x00\x00q\x85\x00\x00\x92\x85\x00\x00\xaf\x85\x00\x00\xc6\x85\x00\x00\xdd\x85\x00\x00\xf4\x85\x00\x00\x0e\x86\x00\x00\x1a\x86\x00\x000\x86\x00\x00B\x86\x00\x00Y\x86\x00\x00k\x86\x00\x00{\x86\x00\x00\x9f\x86\x00\x00\xbd\x86\x00\x00\xd1\x86\x00\x00'
+    b'\xe5\x86\x00\x00\xf9\x86\x00\x00\x0e\x87\x00\x00#\x87\x00\x004\x87\x00\x00F\x87\x00\x00\\\x87\x00\x00|\x87\x00\x00\x83\x87\x00\x00\xa0\x87\x00\x00\xb3\x87\x00\x00\xcc\x87\x00\x00\xe4\x87\x00\x00\xf9\x87\x00\x00\x08\x88\x00\x00#\x88\x00\x006\x88\x00\x00L\x88\x00\x00o\x88\x00\x00\x93\x88\x00\x00\xa6\x88\x00\x00\xbb\x88\x00\x00\xca\x88\x00\x00\xe7\x88\x00\x00'
+    b'\xf8\x88\x00\x00\r\x89\x00\x00\x1f\x89\x00\x00C\x89\x00\x00R\x89\x00\x00g\x89\x00\x00y\x89\x00\x00\x99\x89\x00\x00\xbb\x89\x00\x00\xdd\x89\x00\x00\xff\x89\x00\x00!\x8a\x00\x00C\x8a\x00\x00U\x8a\x00\x00k\x8a\x00\x00\x8b\x8a\x00\x00\x98\x8a\x00\x00\xaa\x8a\x00\x00\xc8\x8a\x00\x00\xdf\x8a\x00\x00\xf9\x8a\x00\x00\x0c\x8b\x00\x00\x1c\x8b\x00\x002\x8b\x00\x00'
+    b'J\x8b\x00\x00_\x8b\x00\x00\x89\x8b\x00\x00\xa2\x8b\x00\x00\xbe\x8b\x00\x00\xe2\x8b\x00\x00\xf3\x8b\x00\x00\x0c\x8c\x00\x00\x1c\x8c\x00\x004\x8c\x00\x00D\x8c\x00\x00a\x8c\x00\x00r\x8c\x00\x00\x87\x8c\x00\x00\x96\x8c\x00\x00\xa5\x8c\x00\x00\xbf\x8c\x00\x00\xe6\x8c\x00\x00\xfc\x8c\x00\x00\x16\x8d\x00\x005\x8d\x00\x00L\x8d\x00\x00b\x8d\x00\x00x\x8d\x00\x00'
+    b'\x8b\x8d\x00\x00\x9f\x8d\x00\x00\xad\x8d\x00\x00\xbe\x8d\x00\x00\xd0\x8d\x00\x00\xe1\x8d\x00\x00\xfa\x8d\x00\x00\x12\x8e\x00\x00!\x8e\x00\x00<\x8e\x00\x00Y\x8e\x00\x00k\x8e\x00\x00}\x8e\x00\x00\x98\x8e\x00\x00\xb2\x8e\x00\x00\xca\x8e\x00\x00\xdc\x8e\x00\x00\xf5\x8e\x00\x00\n\x8f\x00\x00"\x8f\x00\x00;\x8f\x00\x00E\x8f\x00\x00_\x8f\x00\x00v\x8f\x00\x00'
+    b'\x90\x8f\x00\x00\xa0\x8f\x00\x00\xba\x8f\x00\x00\xd4\x8f\x00\x00\xea\x8f\x00\x00\x06\x90\x00\x00"\x90\x00\x00>\x90\x00\x00]\x90\x00\x00|\x90\x00\x00\x9b\x90\x00\x00\xbb\x90\x00\x00\xd0\x90\x00\x00\xe8\x90\x00\x00\n\x91\x00\x00\x18\x91\x00\x005\x91\x00\x00M\x91\x00\x00a\x91\x00\x00t\x91\x00\x00\x81\x91\x00\x00\x9e\x91\x00\x00\xc1\x91\x00\x00\xdd\x91\x00\x00'
+    b'\xee\x91\x00\x00\xff\x91\x00\x00\x18\x92\x00\x00-\x92\x00\x00D\x92\x00\x00Z\x92\x00\x00\x80\x92\x00\x00\x93\x92\x00\x00\xa3\x92\x00\x00\xb6\x92\x00\x00\xca\x92\x00\x00\xe0\x92\x00\x00\xff\x92\x00\x00\x14\x93\x00\x001\x93\x00\x00T\x93\x00\x00h\x93\x00\x00o\x93\x00\x00\x7f\x93\x00\x00\x9e\x93\x00\x00\xb0\x93\x00\x00\xd8\x93\x00\x00\x00\x94\x00\x00(\x94\x00\x00'
+    b'P\x94\x00\x00x\x94\x00\x00\x9e\x94\x00\x00\xc4\x94\x00\x00\xea\x94\x00\x00\x10\x95\x00\x006\x95\x00\x00Y\x95\x00\x00|\x95\x00\x00\x9f\x95\x00\x00\xc2\x95\x00\x00\xe5\x95\x00\x00\x08\x96\x00\x00+\x96\x00\x00K\x96\x00\x00k\x96\x00\x00\x8b\x96\x00\x00\x9f\x96\x00\x00\xbb\x96\x00\x00\xcb\x96\x00\x00\xe2\x96\x00\x00\xf0\x96\x00\x00\x04\x97\x00\x00\x14\x97\x00\x00'
+    b'$\x97\x00\x006\x97\x00\x00Y\x97\x00\x00|\x97\x00\x00\x9f\x97\x00\x00\xb2\x97\x00\x00\xcc\x97\x00\x00\xdb\x97\x00\x00\xea\x97\x00\x00\xfc\x97\x00\x00\x18\x98\x00\x00(\x98\x00\x000\x98\x00\x00?\x98\x00\x00L\x98\x00\x00a\x98\x00\x00{\x98\x00\x00\x96\x98\x00\x00\xaf\x98\x00\x00\xc3\x98\x00\x00\xd3\x98\x00\x00\xe5\x98\x00\x00\xfa\x98\x00\x00\x0f\x99\x00\x00'
+    b"#\x99\x00\x004\x99\x00\x00C\x99\x00\x00_\x99\x00\x00{\x99\x00\x00\x96\x99\x00\x00\xb1\x99\x00\x00\xca\x99\x00\x00\xd9\x99\x00\x00\xe9\x99\x00\x00\xff\x99\x00\x00\x1c\x9a\x00\x009\x9a\x00\x00Y\x9a\x00\x00y\x9a\x00\x00\x99\x9a\x00\x00\xab\x9a\x00\x00\xbf\x9a\x00\x00\xce\x9a\x00\x00\xe5\x9a\x00\x00\x00\x9b\x00\x00\x14\x9b\x00\x00'\x9b\x00\x00?\x9b\x00\x00"
+    b'U\x9b\x00\x00j\x9b\x00\x00z\x9b\x00\x00\x90\x9b\x00\x00\xab\x9b\x00\x00\xc0\x9b\x00\x00\xd5\x9b\x00\x00\xeb\x9b\x00\x00\x03\x9c\x00\x00\x15\x9c\x00\x00$\x9c\x00\x00*\x9c\x00\x00J\x9c\x00\x00]\x9c\x00\x00w\x9c\x00\x00\x93\x9c\x00\x00\xa5\x9c\x00\x00\xb6\x9c\x00\x00\xd7\x9c\x00\x00\xf7\x9c\x00\x00\xfe\x9c\x00\x00\x05\x9d\x00\x00!\x9d\x00\x00(\x9d\x00\x00'
+    b'9\x9d\x00\x00K\x9d\x00\x00R\x9d\x00\x00Y\x9d\x00\x00`\x9d\x00\x00g\x9d\x00\x00q\x9d\x00\x00\x83\x9d\x00\x00\x99\x9d\x00\x00\xa7\x9d\x00\x00\xb6\x9d\x00\x00\xc6\x9d\x00\x00\xd8\x9d\x00\x00\xed\x9d\x00\x00\xff\x9d\x00\x00\x18\x9e\x00\x00/\x9e\x00\x00?\x9e\x00\x00\\\x9e\x00\x00o\x9e\x00\x00v\x9e\x00\x00\x91\x9e\x00\x00\xa7\x9e\x00\x00\xc1\x9e\x00\x00'
+    b'\xd9\x9e\x00\x00\xe6\x9e\x00\x00\xf8\x9e\x00\x00\x02\x9f\x00\x00\x0c\x9f\x00\x00\x1e\x9f\x00\x001\x9f\x00\x00?\x9f\x00\x00K\x9f\x00\x00Z\x9f\x00\x00j\x9f\x00\x00}\x9f\x00\x00\x8c\x9f\x00\x00\x9d\x9f\x00\x00\xb0\x9f\x00\x00\xc1\x9f\x00\x00\xd3\x9f\x00\x00\xe5\x9f\x00\x00\xf6\x9f\x00\x00\x00\xa0\x00\x00\x13\xa0\x00\x00,\xa0\x00\x00>\xa0\x00\x00O\xa0\x00\x00'
+    b'a\xa0\x00\x00s\xa0\x00\x00\x84\xa0\x00\x00\x8e\xa0\x00\x00\x9d\xa0\x00\x00\xaf\xa0\x00\x00\xc0\xa0\x00\x00\xd1\xa0\x00\x00\xdf\xa0\x00\x00\xf3\xa0\x00\x00\x01\xa1\x00\x00\x16\xa1\x00\x00)\xa1\x00\x007\xa1\x00\x00L\xa1\x00\x00]\xa1\x00\x00p\xa1\x00\x00\x89\xa1\x00\x00\x9f\xa1\x00\x00\xac\xa1\x00\x00\xc0\xa1\x00\x00\xd5\xa1\x00\x00\xe6\xa1\x00\x00\xfc\xa1\x00\x00'
+    b'\x1b\xa2\x00\x001\xa2\x00\x00;\xa2\x00\x00K\xa2\x00\x00[\xa2\x00\x00j\xa2\x00\x00~\xa2\x00\x00\x93\xa2\x00\x00\xa9\xa2\x00\x00\xbf\xa2\x00\x00\xd2\xa2\x00\x00\xee\xa2\x00\x00\x0c\xa3\x00\x00%\xa3\x00\x00:\xa3\x00\x00M\xa3\x00\x00d\xa3\x00\x00x\xa3\x00\x00\x89\xa3\x00\x00\xa0\xa3\x00\x00\xb9\xa3\x00\x00\xd4\xa3\x00\x00\xec\xa3\x00\x00\x04\xa4\x00\x00'
+    b'\x1e\xa4\x00\x000\xa4\x00\x00D\xa4\x00\x00K\xa4\x00\x00b\xa4\x00\x00y\xa4\x00\x00\x8c\xa4\x00\x00\xad\xa4\x00\x00\xcf\xa4\x00\x00\xf0\xa4\x00\x00\x11\xa5\x00\x002\xa5\x00\x00S\xa5\x00\x00t\xa5\x00\x00\x95\xa5\x00\x00\xb6\xa5\x00\x00\xd7\xa5\x00\x00\xf6\xa5\x00\x00\x0b\xa6\x00\x00\x1f\xa6\x00\x00;\xa6\x00\x00W\xa6\x00\x00p\xa6\x00\x00\x82\xa6\x00\x00'
+    b'\x96\xa6\x00\x00\xaa\xa6\x00\x00\xc0\xa6\x00\x00\xd7\xa6\x00\x00\xf6\xa6\x00\x00\n\xa7\x00\x00\x1e\xa7\x00\x006\xa7\x00\x00M\xa7\x00\x00a\xa7\x00\x00u\xa7\x00\x00\x8a\xa7\x00\x00\xa2\xa7\x00\x00\xb8\xa7\x00\x00\xca\xa7\x00\x00\xde\xa7\x00\x00\xee\xa7\x00\x00\xfd\xa7\x00\x00\x12\xa8\x00\x00"\xa8\x00\x004\xa8\x00\x00D\xa8\x00\x00X\xa8\x00\x00k\xa8\x00\x00'
+    b'{\xa8\x00\x00\x8b\xa8\x00\x00\x9b\xa8\x00\x00\xa7\xa8\x00\x00\xbb\xa8\x00\x00\xc9\xa8\x00\x00\xe4\xa8\x00\x00\xf5\xa8\x00\x00\t\xa9\x00\x00\x1d\xa9\x00\x001\xa9\x00\x00E\xa9\x00\x00U\xa9\x00\x00j\xa9\x00\x00t\xa9\x00\x00}\xa9\x00\x00\x8f\xa9\x00\x00\x9b\xa9\x00\x00\xab\xa9\x00\x00\xca\xa9\x00\x00\xdd\xa9\x00\x00\xf6\xa9\x00\x00\x05\xaa\x00\x00\x0b\xaa\x00\x00'
+    b'\x18\xaa\x00\x00(\xaa\x00\x00G\xaa\x00\x00m\xaa\x00\x00\x91\xaa\x00\x00\xbb\xaa\x00\x00\xdb\xaa\x00\x00\xfd\xaa\x00\x00 \xab\x00\x00+\xab\x00\x00B\xab\x00\x00R\xab\x00\x00f\xab\x00\x00z\xab\x00\x00\x8f\xab\x00\x00\xa6\xab\x00\x00\xbd\xab\x00\x00\xce\xab\x00\x00\xda\xab\x00\x00\xef\xab\x00\x00\x07\xac\x00\x00\x1f\xac\x00\x00@\xac\x00\x00O\xac\x00\x00'
+    b']\xac\x00\x00s\xac\x00\x00{\xac\x00\x00\x8e\xac\x00\x00\xa8\xac\x00\x00\xc3\xac\x00\x00\xdc\xac\x00\x00\xf4\xac\x00\x00\x03\xad\x00\x00\x11\xad\x00\x00 \xad\x00\x00.\xad\x00\x00D\xad\x00\x00Y\xad\x00\x00l\xad\x00\x00\x82\xad\x00\x00\x99\xad\x00\x00\xb4\xad\x00\x00\xda\xad\x00\x00\xf4\xad\x00\x00\x08\xae\x00\x00\x1e\xae\x00\x00=\xae\x00\x00V\xae\x00\x00'
+    b'q\xae\x00\x00\x8b\xae\x00\x00\x99\xae\x00\x00\xa7\xae\x00\x00\xbb\xae\x00\x00\xd4\xae\x00\x00\xed\xae\x00\x00\x07\xaf\x00\x00\x1f\xaf\x00\x00.\xaf\x00\x00K\xaf\x00\x00b\xaf\x00\x00y\xaf\x00\x00\x81\xaf\x00\x00\x97\xaf\x00\x00\xa4\xaf\x00\x00\xaf\xaf\x00\x00\xba\xaf\x00\x00\xc7\xaf\x00\x00\xd2\xaf\x00\x00\xdb\xaf\x00\x00\xe4\xaf\x00\x00\xfb\xaf\x00\x00\x08\xb0\x00\x00'
+    b'\x13\xb0\x00\x00!\xb0\x00\x00@\xb0\x00\x00W\xb0\x00\x00j\xb0\x00\x00|\xb0\x00\x00\x96\xb0\x00\x00\xb2\xb0\x00\x00\xcf\xb0\x00\x00\xe2\xb0\x00\x00\xfc\xb0\x00\x00\x16\xb1\x00\x006\xb1\x00\x00@\xb1\x00\x00E\xb1\x00\x00Z\xb1\x00\x00p\xb1\x00\x00\x83\xb1\x00\x00\x96\xb1\x00\x00\xa9\xb1\x00\x00\xbc\xb1\x00\x00\xd6\xb1\x00\x00\xec\xb1\x00\x00\xfd\xb1\x00\x00'
+    b'\x0e\xb2\x00\x00%\xb2\x00\x006\xb2\x00\x00L\xb2\x00\x00k\xb2\x00\x00\x7f\xb2\x00\x00\x9a\xb2\x00\x00\xb4\xb2\x00\x00\xca\xb2\x00\x00\xe4\xb2\x00\x00\xff\xb2\x00\x00\x18\xb3\x00\x00>\xb3\x00\x00U\xb3\x00\x00k\xb3\x00\x00\x8a\xb3\x00\x00\x9e\xb3\x00\x00\xb9\xb3\x00\x00\xd3\xb3\x00\x00\xe9\xb3\x00\x00\x03\xb4\x00\x00\x1e\xb4\x00\x007\xb4\x00\x00]\xb4\x00\x00'
+    b't\xb4\x00\x00{\xb4\x00\x00\x86\xb4\x00\x00\xb1\xb4\x00\x00\xd3\xb4\x00\x00\xf3\xb4\x00\x00\x19\xb5\x00\x00<\xb5\x00\x00\\\xb5\x00\x00z\xb5\x00\x00\x98\xb5\x00\x00\xb6\xb5\x00\x00\xd4\xb5\x00\x00\xf2\xb5\x00\x00\x10\xb6\x00\x00.\xb6\x00\x00L\xb6\x00\x00t\xb6\x00\x00\x8d\xb6\x00\x00\x9c\xb6\x00\x00\xbd\xb6\x00\x00\xd4\xb6\x00\x00\xeb\xb6\x00\x00\x19\xb7\x00\x00'
+    b'6\xb7\x00\x00@\xb7\x00\x00K\xb7\x00\x00V\xb7\x00\x00v\xb7\x00\x00\x91\xb7\x00\x00\xaa\xb7\x00\x00\xc3\xb7\x00\x00\xd1\xb7\x00\x00\xf1\xb7\x00\x00\n\xb8\x00\x00\x1d\xb8\x00\x000\xb8\x00\x00C\xb8\x00\x00V\xb8\x00\x00i\xb8\x00\x00|\xb8\x00\x00\x8f\xb8\x00\x00\xa6\xb8\x00\x00\xbd\xb8\x00\x00\xd4\xb8\x00\x00\xeb\xb8\x00\x00\x02\xb9\x00\x00\x19\xb9\x00\x00'
+    b';\xb9\x00\x00K\xb9\x00\x00b\xb9\x00\x00\x86\xb9\x00\x00\xa1\xb9\x00\x00\xc5\xb9\x00\x00\xe3\xb9\x00\x00\xfe\xb9\x00\x00%\xba\x00\x00=\xba\x00\x00Y\xba\x00\x00s\xba\x00\x00\x9c\xba\x00\x00\xb9\xba\x00\x00\xd5\xba\x00\x00\xe9\xba\x00\x00\xfb\xba\x00\x00\x07\xbb\x00\x00\x14\xbb\x00\x00.\xbb\x00\x00@\xbb\x00\x00M\xbb\x00\x00k\xbb\x00\x00\x88\xbb\x00\x00'
+    b'\xa5\xbb\x00\x00\xc0\xbb\x00\x00\xdb\xbb\x00\x00\xec\xbb\x00\x00\xfd\xbb\x00\x00\x0e\xbc\x00\x00\x1f\xbc\x00\x007\xbc\x00\x00O\xbc\x00\x00k\xbc\x00\x00\x81\xbc\x00\x00\xa5\xbc\x00\x00\xc5\xbc\x00\x00\xe7\xbc\x00\x00\x03\xbd\x00\x00,\xbd\x00\x00J\xbd\x00\x00l\xbd\x00\x00\x8d\xbd\x00\x00\xab\xbd\x00\x00\xc9\xbd\x00\x00\xe6\xbd\x00\x00\x06\xbe\x00\x00$\xbe\x00\x00'
+    b'>\xbe\x00\x00^\xbe\x00\x00\x84\xbe\x00\x00\xa6\xbe\x00\x00\xcc\xbe\x00\x00\xf4\xbe\x00\x00\x16\xbf\x00\x00:\xbf\x00\x00Z\xbf\x00\x00l\xbf\x00\x00\x96\xbf\x00\x00\xbd\xbf\x00\x00\xe5\xbf\x00\x00\x0f\xc0\x00\x006\xc0\x00\x00a\xc0\x00\x00v\xc0\x00\x00\x9d\xc0\x00\x00\xae\xc0\x00\x00\xc1\xc0\x00\x00\xdd\xc0\x00\x00\xf3\xc0\x00\x00\x05\xc1\x00\x00\x18\xc1\x00\x00'
+    b",\xc1\x00\x00>\xc1\x00\x00Q\xc1\x00\x00c\xc1\x00\x00t\xc1\x00\x00\x86\xc1\x00\x00\x99\xc1\x00\x00\xad\xc1\x00\x00\xca\xc1\x00\x00\xe4\xc1\x00\x00\n\xc2\x00\x00!\xc2\x00\x007\xc2\x00\x00G\xc2\x00\x00W\xc2\x00\x00\x83\xc2\x00\x00\x9f\xc2\x00\x00\xbc\xc2\x00\x00\xd7\xc2\x00\x00\xf6\xc2\x00\x00\x12\xc3\x00\x00'\xc3\x00\x00<\xc3\x00\x00_\xc3\x00\x00"
+    b'\x82\xc3\x00\x00\xa5\xc3\x00\x00\xc8\xc3\x00\x00\xeb\xc3\x00\x00\x0e\xc4\x00\x00#\xc4\x00\x008\xc4\x00\x00K\xc4\x00\x00]\xc4\x00\x00o\xc4\x00\x00\x82\xc4\x00\x00\x96\xc4\x00\x00\xa8\xc4\x00\x00\xb9\xc4\x00\x00\xcb\xc4\x00\x00\xde\xc4\x00\x00\xf6\xc4\x00\x00\x0f\xc5\x00\x005\xc5\x00\x00J\xc5\x00\x00_\xc5\x00\x00z\xc5\x00\x00\x95\xc5\x00\x00\xae\xc5\x00\x00'
+    b'\xc7\xc5\x00\x00\xe5\xc5\x00\x00\x00\xc6\x00\x00\x10\xc6\x00\x00 \xc6\x00\x00A\xc6\x00\x00U\xc6\x00\x00n\xc6\x00\x00\x8b\xc6\x00\x00\xa9\xc6\x00\x00\xc1\xc6\x00\x00\xd9\xc6\x00\x00\xf7\xc6\x00\x00\x0b\xc7\x00\x00$\xc7\x00\x00N\xc7\x00\x00c\xc7\x00\x00v\xc7\x00\x00\x8a\xc7\x00\x00\xa8\xc7\x00\x00\xba\xc7\x00\x00\xe2\xc7\x00\x00\xf0\xc7\x00\x00\r\xc8\x00\x00'
+    b'&\xc8\x00\x003\xc8\x00\x00@\xc8\x00\x00R\xc8\x00\x00j\xc8\x00\x00\x8a\xc8\x00\x00\x9b\xc8\x00\x00\xb4\xc8\x00\x00\xd5\xc8\x00\x00\xe9\xc8\x00\x00\x0e\xc9\x00\x003\xc9\x00\x00W\xc9\x00\x00r\xc9\x00\x00\x89\xc9\x00\x00\xa4\xc9\x00\x00\xba\xc9\x00\x00\xda\xc9\x00\x00\xf6\xc9\x00\x00\x0b\xca\x00\x00%\xca\x00\x00C\xca\x00\x00^\xca\x00\x00\x80\xca\x00\x00'
+    b"\x9b\xca\x00\x00\xbd\xca\x00\x00\xca\xca\x00\x00\xe2\xca\x00\x00\xfb\xca\x00\x00\x12\xcb\x00\x00'\xcb\x00\x00E\xcb\x00\x00g\xcb\x00\x00\x8d\xcb\x00\x00\xa3\xcb\x00\x00\xbf\xcb\x00\x00\xda\xcb\x00\x00\xec\xcb\x00\x00\x04\xcc\x00\x00(\xcc\x00\x00?\xcc\x00\x00V\xcc\x00\x00g\xcc\x00\x00y\xcc\x00\x00\x9d\xcc\x00\x00\xb6\xcc\x00\x00\xc9\xcc\x00\x00\xe1\xcc\x00\x00"
+    b'\xff\xcc\x00\x00\x13\xcd\x00\x00*\xcd\x00\x00@\xcd\x00\x00W\xcd\x00\x00n\xcd\x00\x00\x85\xcd\x00\x00\x9c\xcd\x00\x00\xb3\xcd\x00\x00\xca\xcd\x00\x00\xe1\xcd\x00\x00\xf6\xcd\x00\x00\r\xce\x00\x00\x1c\xce\x00\x003\xce\x00\x00J\xce\x00\x00a\xce\x00\x00\x7f\xce\x00\x00\x9d\xce\x00\x00\xb7\xce\x00\x00\xce\xce\x00\x00\xe2\xce\x00\x00\xf7\xce\x00\x00\n\xcf\x00\x00'
+    b'"\xcf\x00\x00:\xcf\x00\x00R\xcf\x00\x00k\xcf\x00\x00{\xcf\x00\x00\x98\xcf\x00\x00\xa8\xcf\x00\x00\xbe\xcf\x00\x00\xd4\xcf\x00\x00\xe9\xcf\x00\x00\xfe\xcf\x00\x00\x13\xd0\x00\x00(\xd0\x00\x00D\xd0\x00\x00`\xd0\x00\x00z\xd0\x00\x00\x8f\xd0\x00\x00\xb4\xd0\x00\x00\xd8\xd0\x00\x00\xfb\xd0\x00\x00\x08\xd1\x00\x00\x15\xd1\x00\x00.\xd1\x00\x00C\xd1\x00\x00'
+    b'c\xd1\x00\x00\x85\xd1\x00\x00\xa2\xd1\x00\x00\xc2\xd1\x00\x00\xcb\xd1\x00\x00\xd4\xd1\x00\x00\xdd\xd1\x00\x00\xe6\xd1\x00\x00\x03\xd2\x00\x00\x1f\xd2\x00\x00-\xd2\x00\x00;\xd2\x00\x00X\xd2\x00\x00d\xd2\x00\x00\x88\xd2\x00\x00\x9e\xd2\x00\x00\xb1\xd2\x00\x00\xcd\xd2\x00\x00\xde\xd2\x00\x00\xf3\xd2\x00\x00\x0c\xd3\x00\x00#\xd3\x00\x008\xd3\x00\x00M\xd3\x00\x00'
+    b'f\xd3\x00\x00\x7f\xd3\x00\x00\x96\xd3\x00\x00\xad\xd3\x00\x00\xd9\xd3\x00\x00\xf3\xd3\x00\x00\x19\xd4\x00\x00?\xd4\x00\x00e\xd4\x00\x00\x88\xd4\x00\x00\xab\xd4\x00\x00\xce\xd4\x00\x00\xed\xd4\x00\x00\x0c\xd5\x00\x00+\xd5\x00\x00N\xd5\x00\x00q\xd5\x00\x00~\xd5\x00\x00\x8e\xd5\x00\x00\xa1\xd5\x00\x00\xae\xd5\x00\x00\xbd\xd5\x00\x00\xdd\xd5\x00\x00\xfd\xd5\x00\x00'
+    b'\x1d\xd6\x00\x00/\xd6\x00\x00A\xd6\x00\x00S\xd6\x00\x00m\xd6\x00\x00\x87\xd6\x00\x00\xa1\xd6\x00\x00\xb6\xd6\x00\x00\xd0\xd6\x00\x00\xed\xd6\x00\x00\x08\xd7\x00\x00$\xd7\x00\x001\xd7\x00\x00E\xd7\x00\x00U\xd7\x00\x00v\xd7\x00\x00\x89\xd7\x00\x00\xa1\xd7\x00\x00\xb7\xd7\x00\x00\xcd\xd7\x00\x00\xe3\xd7\x00\x00\xf9\xd7\x00\x00\x0f\xd8\x00\x00%\xd8\x00\x00'
+    b';\xd8\x00\x00Q\xd8\x00\x00^\xd8\x00\x00v\xd8\x00\x00\x8d\xd8\x00\x00\xa4\xd8\x00\x00\xbd\xd8\x00\x00\xd7\xd8\x00\x00\xe7\xd8\x00\x00\x01\xd9\x00\x00\x1c\xd9\x00\x007\xd9\x00\x00R\xd9\x00\x00d\xd9\x00\x00n\xd9\x00\x00\x86\xd9\x00\x00\x97\xd9\x00\x00\xb3\xd9\x00\x00\xca\xd9\x00\x00\xe5\xd9\x00\x00\x01\xda\x00\x00\x1d\xda\x00\x00.\xda\x00\x00B\xda\x00\x00'
+    b'c\xda\x00\x00z\xda\x00\x00\x8e\xda\x00\x00\xb6\xda\x00\x00\xd7\xda\x00\x00\xf3\xda\x00\x00\x07\xdb\x00\x00\x18\xdb\x00\x00+\xdb\x00\x009\xdb\x00\x00L\xdb\x00\x00T\xdb\x00\x00n\xdb\x00\x00v\xdb\x00\x00\x8f\xdb\x00\x00\xaf\xdb\x00\x00\xd6\xdb\x00\x00\xfc\xdb\x00\x00"\xdc\x00\x00G\xdc\x00\x00m\xdc\x00\x00\x8c\xdc\x00\x00\xa5\xdc\x00\x00\xc1\xdc\x00\x00'
+    b'\xdb\xdc\x00\x00\xf0\xdc\x00\x00\x00\xdd\x00\x00\x18\xdd\x00\x003\xdd\x00\x00N\xdd\x00\x00i\xdd\x00\x00\x81\xdd\x00\x00\x99\xdd\x00\x00\xaf\xdd\x00\x00\xd6\xdd\x00\x00\xf4\xdd\x00\x00\x03\xde\x00\x00\x18\xde\x00\x00/\xde\x00\x00O\xde\x00\x00i\xde\x00\x00~\xde\x00\x00\x94\xde\x00\x00\xab\xde\x00\x00\xc4\xde\x00\x00\xd2\xde\x00\x00\xec\xde\x00\x00\x14\xdf\x00\x00'
+    b'#\xdf\x00\x00<\xdf\x00\x00N\xdf\x00\x00a\xdf\x00\x00z\xdf\x00\x00\x97\xdf\x00\x00\xa9\xdf\x00\x00\xbf\xdf\x00\x00\xd2\xdf\x00\x00\xe8\xdf\x00\x00\x01\xe0\x00\x00 \xe0\x00\x00<\xe0\x00\x00K\xe0\x00\x00j\xe0\x00\x00\x8a\xe0\x00\x00\xaa\xe0\x00\x00\xc4\xe0\x00\x00\xdd\xe0\x00\x00\xf5\xe0\x00\x00\x13\xe1\x00\x00,\xe1\x00\x00D\xe1\x00\x00f\xe1\x00\x00'
+    b"\x83\xe1\x00\x00\xa1\xe1\x00\x00\xbc\xe1\x00\x00\xd6\xe1\x00\x00\xf9\xe1\x00\x00\x15\xe2\x00\x00'\xe2\x00\x009\xe2\x00\x00L\xe2\x00\x00c\xe2\x00\x00\x80\xe2\x00\x00\x9c\xe2\x00\x00\xb9\xe2\x00\x00\xce\xe2\x00\x00\xf4\xe2\x00\x00\x0e\xe3\x00\x00%\xe3\x00\x00;\xe3\x00\x00Q\xe3\x00\x00h\xe3\x00\x00\x80\xe3\x00\x00\x8f\xe3\x00\x00\xaf\xe3\x00\x00\xce\xe3\x00\x00"
+    b'\xed\xe3\x00\x00\x0c\xe4\x00\x00)\xe4\x00\x00J\xe4\x00\x00V\xe4\x00\x00\x85\xe4\x00\x00\xb4\xe4\x00\x00\xe3\xe4\x00\x00\x12\xe5\x00\x00A\xe5\x00\x00X\xe5\x00\x00t\xe5\x00\x00\x87\xe5\x00\x00\xac\xe5\x00\x00\xd1\xe5\x00\x00\xf6\xe5\x00\x00\x15\xe6\x00\x00-\xe6\x00\x00C\xe6\x00\x00Z\xe6\x00\x00}\xe6\x00\x00\x96\xe6\x00\x00\xb0\xe6\x00\x00\xcc\xe6\x00\x00'
+    b'\xe4\xe6\x00\x00\xf9\xe6\x00\x00\n\xe7\x00\x00 \xe7\x00\x007\xe7\x00\x00T\xe7\x00\x00p\xe7\x00\x00\x87\xe7\x00\x00\xa1\xe7\x00\x00\xb4\xe7\x00\x00\xc7\xe7\x00\x00\xda\xe7\x00\x00\xe9\xe7\x00\x00\xf8\xe7\x00\x00\x14\xe8\x00\x00/\xe8\x00\x00K\xe8\x00\x00^\xe8\x00\x00{\xe8\x00\x00\x93\xe8\x00\x00\xa3\xe8\x00\x00\xc0\xe8\x00\x00\xd4\xe8\x00\x00\xe1\xe8\x00\x00'
+    b'\xf1\xe8\x00\x00\x02\xe9\x00\x00\x1b\xe9\x00\x00:\xe9\x00\x00K\xe9\x00\x00`\xe9\x00\x00y\xe9\x00\x00\x8e\xe9\x00\x00\xb3\xe9\x00\x00\xc3\xe9\x00\x00\xdb\xe9\x00\x00\xf1\xe9\x00\x00\xfe\xe9\x00\x00\r\xea\x00\x00"\xea\x00\x00/\xea\x00\x00F\xea\x00\x00V\xea\x00\x00e\xea\x00\x00\x83\xea\x00\x00\x92\xea\x00\x00\xb3\xea\x00\x00\xce\xea\x00\x00\xe8\xea\x00\x00'
+    b'\xfe\xea\x00\x00\x0e\xeb\x00\x00\x1f\xeb\x00\x00/\xeb\x00\x00K\xeb\x00\x00q\xeb\x00\x00\x90\xeb\x00\x00\xab\xeb\x00\x00\xd0\xeb\x00\x00\xe0\xeb\x00\x00\xf7\xeb\x00\x00\x08\xec\x00\x00+\xec\x00\x00\\\xec\x00\x00n\xec\x00\x00\x86\xec\x00\x00\xac\xec\x00\x00\xd1\xec\x00\x00\xee\xec\x00\x00\xfe\xec\x00\x00\x12\xed\x00\x00*\xed\x00\x004\xed\x00\x00K\xed\x00\x00'
+    b"i\xed\x00\x00\x82\xed\x00\x00\x9c\xed\x00\x00\xc0\xed\x00\x00\xd1\xed\x00\x00\xe6\xed\x00\x00\x01\xee\x00\x00'\xee\x00\x00M\xee\x00\x00^\xee\x00\x00s\xee\x00\x00\x8a\xee\x00\x00\xa6\xee\x00\x00\xb5\xee\x00\x00\xdc\xee\x00\x00\xf8\xee\x00\x00\x13\xef\x00\x00.\xef\x00\x00G\xef\x00\x00\\\xef\x00\x00q\xef\x00\x00\x87\xef\x00\x00\xa1\xef\x00\x00\xb5\xef\x00\x00"
+    b'\xcd\xef\x00\x00\xd7\xef\x00\x00\xe1\xef\x00\x00\xfc\xef\x00\x00\x17\xf0\x00\x00(\xf0\x00\x00@\xf0\x00\x00P\xf0\x00\x00g\xf0\x00\x00x\xf0\x00\x00\x96\xf0\x00\x00\xa8\xf0\x00\x00\xba\xf0\x00\x00\xcc\xf0\x00\x00\xd9\xf0\x00\x00\xe9\xf0\x00\x00\x04\xf1\x00\x00\x16\xf1\x00\x00-\xf1\x00\x00=\xf1\x00\x00Z\xf1\x00\x00q\xf1\x00\x00\x86\xf1\x00\x00\xa1\xf1\x00\x00'
+    b'\xb8\xf1\x00\x00\xc7\xf1\x00\x00\xe8\xf1\x00\x00\x00\xf2\x00\x00\x15\xf2\x00\x00>\xf2\x00\x00S\xf2\x00\x00n\xf2\x00\x00\x88\xf2\x00\x00\x98\xf2\x00\x00\xa9\xf2\x00\x00\xbe\xf2\x00\x00\xe2\xf2\x00\x00\xf8\xf2\x00\x00\x0c\xf3\x00\x00\x1d\xf3\x00\x00/\xf3\x00\x00E\xf3\x00\x00Z\xf3\x00\x00r\xf3\x00\x00\x96\xf3\x00\x00\xbc\xf3\x00\x00\xda\xf3\x00\x00\xf6\xf3\x00\x00'
+    b'\x18\xf4\x00\x00%\xf4\x00\x00<\xf4\x00\x00K\xf4\x00\x00]\xf4\x00\x00u\xf4\x00\x00\x8d\xf4\x00\x00\xb0\xf4\x00\x00\xd3\xf4\x00\x00\xe6\xf4\x00\x00\x01\xf5\x00\x00\x0b\xf5\x00\x00\x15\xf5\x00\x00"\xf5\x00\x00E\xf5\x00\x00U\xf5\x00\x00l\xf5\x00\x00\x83\xf5\x00\x00\x95\xf5\x00\x00\xae\xf5\x00\x00\xd2\xf5\x00\x00\xeb\xf5\x00\x00\xfb\xf5\x00\x00\x1d\xf6\x00\x00'
+    b';\xf6\x00\x00V\xf6\x00\x00n\xf6\x00\x00\x87\xf6\x00\x00\xb2\xf6\x00\x00\xcd\xf6\x00\x00\xe8\xf6\x00\x00\x0f\xf7\x00\x00)\xf7\x00\x00C\xf7\x00\x00Y\xf7\x00\x00o\xf7\x00\x00\x93\xf7\x00\x00\xac\xf7\x00\x00\xc5\xf7\x00\x00\xe1\xf7\x00\x00\xfa\xf7\x00\x00\x15\xf8\x00\x00(\xf8\x00\x00L\xf8\x00\x00n\xf8\x00\x00\x93\xf8\x00\x00\xb5\xf8\x00\x00\xd6\xf8\x00\x00'
+    b'\xf7\xf8\x00\x00\x14\xf9\x00\x001\xf9\x00\x00?\xf9\x00\x00K\xf9\x00\x00W\xf9\x00\x00c\xf9\x00\x00o\xf9\x00\x00{\xf9\x00\x00\x9b\xf9\x00\x00\xb0\xf9\x00\x00\xce\xf9\x00\x00\xe7\xf9\x00\x00\xff\xf9\x00\x00\x12\xfa\x00\x00*\xfa\x00\x00E\xfa\x00\x00Y\xfa\x00\x00r\xfa\x00\x00\x81\xfa\x00\x00\x8e\xfa\x00\x00\xa8\xfa\x00\x00\xc8\xfa\x00\x00\xd6\xfa\x00\x00'
+    b'\xe8\xfa\x00\x00\x03\xfb\x00\x00\x1c\xfb\x00\x002\xfb\x00\x00G\xfb\x00\x00\\\xfb\x00\x00t\xfb\x00\x00\x8b\xfb\x00\x00\xa6\xfb\x00\x00\xc0\xfb\x00\x00\xd0\xfb\x00\x00\xe9\xfb\x00\x00\x00\xfc\x00\x00\x1f\xfc\x00\x00<\xfc\x00\x00O\xfc\x00\x00k\xfc\x00\x00\x8d\xfc\x00\x00\xaf\xfc\x00\x00\xcf\xfc\x00\x00\xe3\xfc\x00\x00\x10\xfd\x00\x00*\xfd\x00\x00?\xfd\x00\x00'
+    b'W\xfd\x00\x00n\xfd\x00\x00\x83\xfd\x00\x00\xa6\xfd\x00\x00\xcb\xfd\x00\x00\xee\xfd\x00\x00\x0f\xfe\x00\x004\xfe\x00\x00U\xfe\x00\x00v\xfe\x00\x00\x99\xfe\x00\x00\xbb\xfe\x00\x00\xd8\xfe\x00\x00\xfc\xfe\x00\x00\x1e\xff\x00\x00D\xff\x00\x00c\xff\x00\x00\x85\xff\x00\x00\xa5\xff\x00\x00\xc7\xff\x00\x00\xe5\xff\x00\x00\x03\x00\x01\x00%\x00\x01\x00H\x00\x01\x00'
+    b'j\x00\x01\x00\x8d\x00\x01\x00\xa5\x00\x01\x00\xc1\x00\x01\x00\xe2\x00\x01\x00\x03\x01\x01\x00$\x01\x01\x00E\x01\x01\x00f\x01\x01\x00z\x01\x01\x00\x94\x01\x01\x00\xac\x01\x01\x00\xd2\x01\x01\x00\xf2\x01\x01\x00\x07\x02\x01\x00\x1b\x02\x01\x007\x02\x01\x00O\x02\x01\x00`\x02\x01\x00i\x02\x01\x00|\x02\x01\x00\xa1\x02\x01\x00\xae\x02\x01\x00\xd4\x02\x01\x00'
+    b"\x04\x03\x01\x00.\x03\x01\x00T\x03\x01\x00w\x03\x01\x00\xa1\x03\x01\x00\xc4\x03\x01\x00\xe7\x03\x01\x00\n\x04\x01\x00-\x04\x01\x00O\x04\x01\x00s\x04\x01\x00\x7f\x04\x01\x00\x9e\x04\x01\x00\xbd\x04\x01\x00\xcc\x04\x01\x00\xdc\x04\x01\x00\xeb\x04\x01\x00\xf9\x04\x01\x00\x04\x05\x01\x00\x10\x05\x01\x00'\x05\x01\x008\x05\x01\x00I\x05\x01\x00^\x05\x01\x00"
+    b'n\x05\x01\x00x\x05\x01\x00\x88\x05\x01\x00\x9c\x05\x01\x00\xbb\x05\x01\x00\xdf\x05\x01\x00\xff\x05\x01\x00#\x06\x01\x00E\x06\x01\x00o\x06\x01\x00\x92\x06\x01\x00\xb0\x06\x01\x00\xc1\x06\x01\x00\xe5\x06\x01\x00\xfe\x06\x01\x00\x10\x07\x01\x00$\x07\x01\x006\x07\x01\x00G\x07\x01\x00X\x07\x01\x00v\x07\x01\x00\x98\x07\x01\x00\xbb\x07\x01\x00\xe4\x07\x01\x00'
+    b'\x0b\x08\x01\x00/\x08\x01\x00R\x08\x01\x00|\x08\x01\x00\xa9\x08\x01\x00\xd7\x08\x01\x00\x08\t\x01\x000\t\x01\x00]\t\x01\x00\x8d\t\x01\x00\xb6\t\x01\x00\xde\t\x01\x00\x0c\n\x01\x00>\n\x01\x00c\n\x01\x00\x8f\n\x01\x00\xc0\n\x01\x00\xf0\n\x01\x00\x17\x0b\x01\x00B\x0b\x01\x00p\x0b\x01\x00\x9f\x0b\x01\x00\xc5\x0b\x01\x00\xfc\x0b\x01\x00'
+    b'$\x0c\x01\x00O\x0c\x01\x00{\x0c\x01\x00\xaa\x0c\x01\x00\xd0\x0c\x01\x00\xfb\x0c\x01\x00)\r\x01\x00U\r\x01\x00{\r\x01\x00\xa2\r\x01\x00\xd2\r\x01\x00\xf5\r\x01\x00\x1f\x0e\x01\x00N\x0e\x01\x00|\x0e\x01\x00\xa1\x0e\x01\x00\xca\x0e\x01\x00\xf6\x0e\x01\x00#\x0f\x01\x00G\x0f\x01\x00|\x0f\x01\x00\x97\x0f\x01\x00\xb8\x0f\x01\x00\xe2\x0f\x01\x00'
+    b'\x05\x10\x01\x00(\x10\x01\x00R\x10\x01\x00o\x10\x01\x00\x9b\x10\x01\x00\xc5\x10\x01\x00\xf6\x10\x01\x00\x19\x11\x01\x00?\x11\x01\x00a\x11\x01\x00z\x11\x01\x00\xa0\x11\x01\x00\xcf\x11\x01\x00\xff\x11\x01\x00*\x12\x01\x00[\x12\x01\x00\x84\x12\x01\x00\xae\x12\x01\x00\xdc\x12\x01\x00\x0b\x13\x01\x004\x13\x01\x00a\x13\x01\x00\x8c\x13\x01\x00\xbd\x13\x01\x00'
+    b'\xed\x13\x01\x00\x1c\x14\x01\x00@\x14\x01\x00h\x14\x01\x00\x92\x14\x01\x00\xbd\x14\x01\x00\xe2\x14\x01\x00\x0b\x15\x01\x008\x15\x01\x00f\x15\x01\x00\x8e\x15\x01\x00\xba\x15\x01\x00\xe9\x15\x01\x00\x12\x16\x01\x00?\x16\x01\x00o\x16\x01\x00\xa0\x16\x01\x00\xcb\x16\x01\x00\xfa\x16\x01\x00(\x17\x01\x00U\x17\x01\x00\x84\x17\x01\x00\xac\x17\x01\x00\xd5\x17\x01\x00'
+    b'\x01\x18\x01\x00.\x18\x01\x00W\x18\x01\x00\x82\x18\x01\x00\xab\x18\x01\x00\xcf\x18\x01\x00\xf4\x18\x01\x00\x1c\x19\x01\x00K\x19\x01\x00|\x19\x01\x00\xab\x19\x01\x00\xd5\x19\x01\x00\x00\x1a\x01\x00.\x1a\x01\x00\\\x1a\x01\x00\x8c\x1a\x01\x00\xba\x1a\x01\x00\xe7\x1a\x01\x00\x11\x1b\x01\x00:\x1b\x01\x00i\x1b\x01\x00\x91\x1b\x01\x00\xbb\x1b\x01\x00\xd8\x1b\x01\x00'
+    b'\xf7\x1b\x01\x00\x1a\x1c\x01\x00=\x1c\x01\x00S\x1c\x01\x00x\x1c\x01\x00\x9f\x1c\x01\x00\xb5\x1c\x01\x00\xe3\x1c\x01\x00\x12\x1d\x01\x00=\x1d\x01\x00T\x1d\x01\x00o\x1d\x01\x00\x95\x1d\x01\x00\xc1\x1d\x01\x00\xd9\x1d\x01\x00\xf1\x1d\x01\x00\x13\x1e\x01\x00<\x1e\x01\x00d\x1e\x01\x00\x86\x1e\x01\x00\xab\x1e\x01\x00\xca\x1e\x01\x00\xf1\x1e\x01\x00\x17\x1f\x01\x00'
+    b';\x1f\x01\x00a\x1f\x01\x00\x82\x1f\x01\x00\x9a\x1f\x01\x00\xc3\x1f\x01\x00\xdf\x1f\x01\x00\x07 \x01\x00- \x01\x00T \x01\x00h \x01\x00\x86 \x01\x00\x9c \x01\x00\xb2 \x01\x00\xd9 \x01\x00\xfb \x01\x00\x0f!\x01\x006!\x01\x00Y!\x01\x00\x82!\x01\x00\x9f!\x01\x00\xc2!\x01\x00\xe5!\x01\x00\x08"\x01\x002"\x01\x00'
+    b'V"\x01\x00t"\x01\x00\xa1"\x01\x00\xc4"\x01\x00\xde"\x01\x00\xfc"\x01\x00\x13#\x01\x00+#\x01\x00O#\x01\x00i#\x01\x00\x87#\x01\x00\xac#\x01\x00\xd7#\x01\x00\xfd#\x01\x00\x18$\x01\x00)$\x01\x00>$\x01\x00X$\x01\x00~$\x01\x00\xb0$\x01\x00\xe4$\x01\x00\x17%\x01\x00N%\x01\x00\x82%\x01\x00'
+    b"\xbf%\x01\x00\xf4%\x01\x00,&\x01\x00b&\x01\x00\x97&\x01\x00\xce&\x01\x00\x02'\x01\x00<'\x01\x00u'\x01\x00\xad'\x01\x00\xe3'\x01\x00\x0e(\x01\x00;(\x01\x00g(\x01\x00\x95(\x01\x00\xc3(\x01\x00\xec(\x01\x00\x19)\x01\x00H)\x01\x00v)\x01\x00\xa6)\x01\x00\xd6)\x01\x00\x01*\x01\x00 *\x01\x00"
+    b'?*\x01\x00b*\x01\x00{*\x01\x00\x96*\x01\x00\xb6*\x01\x00\xd0*\x01\x00\xf1*\x01\x00\x12+\x01\x003+\x01\x00T+\x01\x00u+\x01\x00\x96+\x01\x00\xb7+\x01\x00\xd8+\x01\x00\xef+\x01\x00\r,\x01\x00",\x01\x00<,\x01\x00V,\x01\x00p,\x01\x00\x8a,\x01\x00\xa4,\x01\x00\xbe,\x01\x00\xd8,\x01\x00'
+    b'\xf9,\x01\x00$-\x01\x00V-\x01\x00\x86-\x01\x00\xb8-\x01\x00\xda-\x01\x00\xf8-\x01\x00\x06.\x01\x00\x1d.\x01\x00C.\x01\x00h.\x01\x00\x87.\x01\x00\xa2.\x01\x00\xb9.\x01\x00\xe7.\x01\x00\x1b/\x01\x00K/\x01\x00t/\x01\x00\x9a/\x01\x00\xad/\x01\x00\xc0/\x01\x00\xd4/\x01\x00\xea/\x01\x00\xfa/\x01\x00'
+    b"\x180\x01\x0070\x01\x00V0\x01\x00\x860\x01\x00\xc80\x01\x00\xec0\x01\x00\x061\x01\x00G1\x01\x00\x831\x01\x00\x981\x01\x00\xb31\x01\x00\xcf1\x01\x00\xf91\x01\x00\x0c2\x01\x00'2\x01\x00T2\x01\x00\x862\x01\x00\xb12\x01\x00\xdc2\x01\x00\x073\x01\x0093\x01\x00k3\x01\x00\x9d3\x01\x00\xbc3\x01\x00"
+    b'\xda3\x01\x00\xfa3\x01\x00\x1d4\x01\x00@4\x01\x00h4\x01\x00\x894\x01\x00\xac4\x01\x00\xdc4\x01\x00\xfe4\x01\x00+5\x01\x00R5\x01\x00s5\x01\x00\x9f5\x01\x00\xbb5\x01\x00\xe15\x01\x00\xfb5\x01\x00\x186\x01\x00;6\x01\x00Z6\x01\x00\x896\x01\x00\xa86\x01\x00\xbf6\x01\x00\xd36\x01\x00\x077\x01\x00'
+    b'\x197\x01\x00=7\x01\x00Y7\x01\x00t7\x01\x00\x957\x01\x00\xb87\x01\x00\xda7\x01\x00\xfb7\x01\x00!8\x01\x00E8\x01\x00k8\x01\x00\x908\x01\x00\xbd8\x01\x00\xd18\x01\x00\xf68\x01\x00\x139\x01\x00@9\x01\x00Q9\x01\x00l9\x01\x00\x8d9\x01\x00\xb09\x01\x00\xcf9\x01\x00\xee9\x01\x00\x0c:\x01\x00'
+    b'\x1e:\x01\x008:\x01\x00P:\x01\x00j:\x01\x00\x8d:\x01\x00\xa2:\x01\x00\xb3:\x01\x00\xcb:\x01\x00\xe9:\x01\x00\x18;\x01\x00:;\x01\x00[;\x01\x00k;\x01\x00\x8e;\x01\x00\xbf;\x01\x00\xe9;\x01\x00\x17<\x01\x00B<\x01\x00W<\x01\x00u<\x01\x00\x95<\x01\x00\xb7<\x01\x00\xdb<\x01\x00\xfe<\x01\x00'
+    b'&=\x01\x005=\x01\x00P=\x01\x00k=\x01\x00\x8a=\x01\x00\xaa=\x01\x00\xc0=\x01\x00\xe8=\x01\x00\x16>\x01\x009>\x01\x00\\>\x01\x00\x86>\x01\x00\xac>\x01\x00\xc8>\x01\x00\xe8>\x01\x00\x08?\x01\x004?\x01\x00S?\x01\x00m?\x01\x00\x9b?\x01\x00\xc9?\x01\x00\xf0?\x01\x00\x19@\x01\x00C@\x01\x00'
+    b'h@\x01\x00\x97@\x01\x00\xb1@\x01\x00\xd3@\x01\x00\xf6@\x01\x00\x10A\x01\x00&A\x01\x00=A\x01\x00^A\x01\x00xA\x01\x00\x8eA\x01\x00\xb1A\x01\x00\xe2A\x01\x00\xf7A\x01\x00\x17B\x01\x00=B\x01\x00WB\x01\x00sB\x01\x00\x8eB\x01\x00\xb2B\x01\x00\xd7B\x01\x00\x08C\x01\x00*C\x01\x00KC\x01\x00'
+    b'_C\x01\x00\x87C\x01\x00\xa5C\x01\x00\xc3C\x01\x00\xe0C\x01\x00\xfdC\x01\x00\x19D\x01\x007D\x01\x00_D\x01\x00yD\x01\x00\xa2D\x01\x00\xcbD\x01\x00\xf3D\x01\x00\x1bE\x01\x00CE\x01\x00kE\x01\x00\x93E\x01\x00\xbbE\x01\x00\xe7E\x01\x00\x13F\x01\x008F\x01\x00]F\x01\x00\x8aF\x01\x00\xb7F\x01\x00'
+    b'\xdfF\x01\x00\x07G\x01\x00,G\x01\x00QG\x01\x00|G\x01\x00\xa7G\x01\x00\xd2G\x01\x00\xfdG\x01\x00"H\x01\x00GH\x01\x00mH\x01\x00\x97H\x01\x00\xbeH\x01\x00\xd6H\x01\x00\x04I\x01\x00(I\x01\x00HI\x01\x00fI\x01\x00\x8eI\x01\x00\xacI\x01\x00\xd5I\x01\x00\tJ\x01\x00;J\x01\x00RJ\x01\x00'
+    b'|J\x01\x00\x89J\x01\x00\xb0J\x01\x00\xd2J\x01\x00\xedJ\x01\x00\x0fK\x01\x004K\x01\x00XK\x01\x00|K\x01\x00\x99K\x01\x00\xb9K\x01\x00\xdeK\x01\x00\x04L\x01\x00(L\x01\x00HL\x01\x00bL\x01\x00\x89L\x01\x00\xa4L\x01\x00\xc2L\x01\x00\xe0L\x01\x00\x02M\x01\x00\x1fM\x01\x00HM\x01\x00`M\x01\x00'
+    b'\x82M\x01\x00\xa0M\x01\x00\xbdM\x01\x00\xe0M\x01\x00\xffM\x01\x00\x18N\x01\x008N\x01\x00VN\x01\x00\x84N\x01\x00\xabN\x01\x00\xcfN\x01\x00\xeeN\x01\x00\x0bO\x01\x00%O\x01\x00CO\x01\x00]O\x01\x00{O\x01\x00\x98O\x01\x00\xb9O\x01\x00\xe0O\x01\x00\xe9O\x01\x00\x0eP\x01\x00.P\x01\x00MP\x01\x00'
+    b'dP\x01\x00\x83P\x01\x00\xa0P\x01\x00\xbfP\x01\x00\xd9P\x01\x00\xf6P\x01\x00\x13Q\x01\x00.Q\x01\x00LQ\x01\x00lQ\x01\x00\x86Q\x01\x00\xb5Q\x01\x00\xe1Q\x01\x00\tR\x01\x00*R\x01\x00OR\x01\x00wR\x01\x00\xa7R\x01\x00\xbfR\x01\x00\xd0R\x01\x00\xf2R\x01\x00\x08S\x01\x00\x1fS\x01\x00ES\x01\x00'
+    b'[S\x01\x00}S\x01\x00\x9dS\x01\x00\xb4S\x01\x00\xcaS\x01\x00\xe6S\x01\x00\xf7S\x01\x00\x0cT\x01\x00.T\x01\x00@T\x01\x00UT\x01\x00kT\x01\x00\x89T\x01\x00\xa9T\x01\x00\xcaT\x01\x00\xe9T\x01\x00\xf9T\x01\x00\x0fU\x01\x00$U\x01\x00:U\x01\x00SU\x01\x00lU\x01\x00\x85U\x01\x00\x9eU\x01\x00'
+    b'\xb7U\x01\x00\xd0U\x01\x00\xecU\x01\x00\rV\x01\x00.V\x01\x00HV\x01\x00`V\x01\x00|V\x01\x00\x9dV\x01\x00\xb7V\x01\x00\xd1V\x01\x00\xe6V\x01\x00\x04W\x01\x00"W\x01\x00>W\x01\x00YW\x01\x00vW\x01\x00\x8fW\x01\x00\x9fW\x01\x00\xbaW\x01\x00\xcdW\x01\x00\xe4W\x01\x00\x02X\x01\x00\x15X\x01\x00'
+    b'0X\x01\x00NX\x01\x00aX\x01\x00zX\x01\x00\x95X\x01\x00\xb0X\x01\x00\xcaX\x01\x00\xe4X\x01\x00\x0eY\x01\x00!Y\x01\x00=Y\x01\x00[Y\x01\x00mY\x01\x00\x89Y\x01\x00\x98Y\x01\x00\xc7Y\x01\x00\xd5Y\x01\x00\xe2Y\x01\x00\xfaY\x01\x00\x18Z\x01\x00.Z\x01\x00CZ\x01\x00]Z\x01\x00zZ\x01\x00'
+    b'\x9bZ\x01\x00\xbcZ\x01\x00\xdaZ\x01\x00\xf6Z\x01\x00\x12[\x01\x000[\x01\x00N[\x01\x00i[\x01\x00\x82[\x01\x00\x9d[\x01\x00\xb9[\x01\x00\xdf[\x01\x00\xf9[\x01\x00\x1e\\\x01\x00?\\\x01\x00c\\\x01\x00n\\\x01\x00\x8a\\\x01\x00\xac\\\x01\x00\xc3\\\x01\x00\xdc\\\x01\x00\xfe\\\x01\x00\x1c]\x01\x004]\x01\x00'
+    b'O]\x01\x00g]\x01\x00\x7f]\x01\x00\x9d]\x01\x00\xb2]\x01\x00\xc9]\x01\x00\xea]\x01\x00\xff]\x01\x00\x19^\x01\x00;^\x01\x00^^\x01\x00u^\x01\x00\x8e^\x01\x00\xb3^\x01\x00\xc8^\x01\x00\xe9^\x01\x00\r_\x01\x00+_\x01\x00?_\x01\x00U_\x01\x00l_\x01\x00\x8d_\x01\x00\xb1_\x01\x00\xce_\x01\x00'
+    b"\xf1_\x01\x00\x15`\x01\x006`\x01\x00O`\x01\x00y`\x01\x00\x93`\x01\x00\xb8`\x01\x00\xde`\x01\x00\x03a\x01\x00'a\x01\x00Ja\x01\x00pa\x01\x00\x93a\x01\x00\xb9a\x01\x00\xdca\x01\x00\x01b\x01\x00\x18b\x01\x007b\x01\x00Rb\x01\x00tb\x01\x00\x9db\x01\x00\xc6b\x01\x00\xeab\x01\x00\x0ec\x01\x00"
+    b'7c\x01\x00`c\x01\x00xc\x01\x00\x9cc\x01\x00\xbfc\x01\x00\xe1c\x01\x00\x03d\x01\x00%d\x01\x00Gd\x01\x00id\x01\x00\x8bd\x01\x00\xadd\x01\x00\xcfd\x01\x00\xf1d\x01\x00\x08e\x01\x00)e\x01\x00Ne\x01\x00ne\x01\x00\x8fe\x01\x00\xa0e\x01\x00\xb9e\x01\x00\xdae\x01\x00\xf5e\x01\x00\x13f\x01\x00'
+    b'3f\x01\x00Nf\x01\x00zf\x01\x00\xb4f\x01\x00\xd5f\x01\x00\xecf\x01\x00\xfef\x01\x00\rg\x01\x006g\x01\x00`g\x01\x00\x7fg\x01\x00\x9bg\x01\x00\xc1g\x01\x00\xe7g\x01\x00\nh\x01\x00\x1dh\x01\x00Ch\x01\x00\\h\x01\x00sh\x01\x00\x88h\x01\x00\x9fh\x01\x00\xc5h\x01\x00\xefh\x01\x00\x12i\x01\x00'
+    b';i\x01\x00ci\x01\x00\x9ci\x01\x00\xc8i\x01\x00\xe8i\x01\x00\tj\x01\x00$j\x01\x00Hj\x01\x00aj\x01\x00\x81j\x01\x00\x96j\x01\x00\xafj\x01\x00\xc8j\x01\x00\xe1j\x01\x00\xfaj\x01\x00\x1ek\x01\x00<k\x01\x00[k\x01\x00~k\x01\x00\x9ek\x01\x00\xbfk\x01\x00\xe0k\x01\x00\xf5k\x01\x00\x07l\x01\x00'
+    b'$l\x01\x00@l\x01\x00Wl\x01\x00rl\x01\x00\x9el\x01\x00\xcal\x01\x00\xe0l\x01\x00\x03m\x01\x00$m\x01\x00Cm\x01\x00im\x01\x00\x8bm\x01\x00\xb3m\x01\x00\xdbm\x01\x00\x02n\x01\x00&n\x01\x00An\x01\x00Wn\x01\x00wn\x01\x00\x98n\x01\x00\xb1n\x01\x00\xd8n\x01\x00\xf5n\x01\x00\x0bo\x01\x00'
+    b'8o\x01\x00Mo\x01\x00so\x01\x00\x93o\x01\x00\xafo\x01\x00\xcbo\x01\x00\xe7o\x01\x00\x03p\x01\x00&p\x01\x00Hp\x01\x00lp\x01\x00zp\x01\x00\x91p\x01\x00\xa3p\x01\x00\xc1p\x01\x00\xd5p\x01\x00\xfbp\x01\x00\x0bq\x01\x00&q\x01\x00Uq\x01\x00sq\x01\x00\x95q\x01\x00\xa8q\x01\x00\xc3q\x01\x00'
+    b'\xd9q\x01\x00\xf5q\x01\x00\x16r\x01\x002r\x01\x00Ir\x01\x00fr\x01\x00\x83r\x01\x00\xa1r\x01\x00\xbbr\x01\x00\xd5r\x01\x00\xf4r\x01\x00\x13s\x01\x003s\x01\x00Zs\x01\x00ys\x01\x00\x97s\x01\x00\xa9s\x01\x00\xbbs\x01\x00\xd1s\x01\x00\xe6s\x01\x00\xf9s\x01\x00\x0ct\x01\x00*t\x01\x00Dt\x01\x00'
+    b'et\x01\x00\x86t\x01\x00\xa7t\x01\x00\xc8t\x01\x00\xe0t\x01\x00\xf6t\x01\x00\ru\x01\x003u\x01\x00Yu\x01\x00\x7fu\x01\x00\xa5u\x01\x00\xb7u\x01\x00\xd5u\x01\x00\xf3u\x01\x00\x0ev\x01\x00+v\x01\x00Xv\x01\x00qv\x01\x00\x91v\x01\x00\xa3v\x01\x00\xccv\x01\x00\xe7v\x01\x00\x0fw\x01\x00(w\x01\x00'
+    b'Bw\x01\x00cw\x01\x00\x81w\x01\x00\xa2w\x01\x00\xbbw\x01\x00\xddw\x01\x00\xf1w\x01\x00\xffw\x01\x00"x\x01\x00Hx\x01\x00kx\x01\x00\x91x\x01\x00\xa9x\x01\x00\xc9x\x01\x00\xe9x\x01\x00\ty\x01\x00)y\x01\x00Ry\x01\x00zy\x01\x00\xa2y\x01\x00\xcby\x01\x00\xf2y\x01\x00\x1cz\x01\x00>z\x01\x00'
+    b'[z\x01\x00tz\x01\x00\x93z\x01\x00\xa9z\x01\x00\xc5z\x01\x00\xe8z\x01\x00\x0b{\x01\x00&{\x01\x00C{\x01\x00]{\x01\x00y{\x01\x00\x8f{\x01\x00\xa8{\x01\x00\xc3{\x01\x00\xf5{\x01\x00\x1f|\x01\x00E|\x01\x00a|\x01\x00{|\x01\x00\xa6|\x01\x00\xd0|\x01\x00\xfc|\x01\x00%}\x01\x00N}\x01\x00'
+    b'm}\x01\x00\x8a}\x01\x00\xa9}\x01\x00\xc9}\x01\x00\xe7}\x01\x00\x08~\x01\x00*~\x01\x00W~\x01\x00u~\x01\x00\x8f~\x01\x00\xaa~\x01\x00\xc4~\x01\x00\xdf~\x01\x00\x00\x7f\x01\x00$\x7f\x01\x00F\x7f\x01\x00e\x7f\x01\x00\x7f\x7f\x01\x00\x99\x7f\x01\x00\xaf\x7f\x01\x00\xd5\x7f\x01\x00\xfe\x7f\x01\x00*\x80\x01\x00E\x80\x01\x00'
+    b'_\x80\x01\x00y\x80\x01\x00\x95\x80\x01\x00\xbd\x80\x01\x00\xdb\x80\x01\x00\xe8\x80\x01\x00\r\x81\x01\x00#\x81\x01\x00J\x81\x01\x00j\x81\x01\x00\x8f\x81\x01\x00\xae\x81\x01\x00\xd5\x81\x01\x00\xf5\x81\x01\x00\x1c\x82\x01\x001\x82\x01\x00F\x82\x01\x00[\x82\x01\x00p\x82\x01\x00\x8c\x82\x01\x00\x9d\x82\x01\x00\xb3\x82\x01\x00\xce\x82\x01\x00\xe0\x82\x01\x00'
+    b'\xfb\x82\x01\x00\t\x83\x01\x00%\x83\x01\x00K\x83\x01\x00]\x83\x01\x00\x87\x83\x01\x00\xb3\x83\x01\x00\xdb\x83\x01\x00\xf5\x83\x01\x00\x0f\x84\x01\x00(\x84\x01\x00E\x84\x01\x00\\\x84\x01\x00\x7f\x84\x01\x00\x99\x84\x01\x00\xb8\x84\x01\x00\xd0\x84\x01\x00\xeb\x84\x01\x00\x01\x85\x01\x00\x1e\x85\x01\x00A\x85\x01\x00T\x85\x01\x00k\x85\x01\x00~\x85\x01\x00'
+    b'\x96\x85\x01\x00\xa9\x85\x01\x00\xb8\x85\x01\x00\xc4\x85\x01\x00\xd6\x85\x01\x00\xef\x85\x01\x00\x07\x86\x01\x00-\x86\x01\x00L\x86\x01\x00^\x86\x01\x00\x86\x86\x01\x00\x9e\x86\x01\x00\xbe\x86\x01\x00\xdb\x86\x01\x00\xfe\x86\x01\x00\x18\x87\x01\x00/\x87\x01\x00F\x87\x01\x00\\\x87\x01\x00o\x87\x01\x00\x8b\x87\x01\x00\xa8\x87\x01\x00\xc4\x87\x01\x00\xe6\x87\x01\x00'
+    b'\xfc\x87\x01\x00\x12\x88\x01\x00)\x88\x01\x00F\x88\x01\x00_\x88\x01\x00\x82\x88\x01\x00\x9b\x88\x01\x00\xb8\x88\x01\x00\xd7\x88\x01\x00\xfe\x88\x01\x00\x12\x89\x01\x005\x89\x01\x00N\x89\x01\x00|\x89\x01\x00\x8a\x89\x01\x00\xa0\x89\x01\x00\xbc\x89\x01\x00\xd7\x89\x01\x00\xee\x89\x01\x00\x07\x8a\x01\x00\x1d\x8a\x01\x00:\x8a\x01\x00U\x8a\x01\x00r\x8a\x01\x00'
+    b'\x94\x8a\x01\x00\xb5\x8a\x01\x00\xcc\x8a\x01\x00\xea\x8a\x01\x00\x02\x8b\x01\x00\x17\x8b\x01\x003\x8b\x01\x00G\x8b\x01\x00d\x8b\x01\x00\x82\x8b\x01\x00\x99\x8b\x01\x00\xb5\x8b\x01\x00\xd3\x8b\x01\x00\xe6\x8b\x01\x00\xfb\x8b\x01\x00\x0e\x8c\x01\x00\x1e\x8c\x01\x00>\x8c\x01\x00^\x8c\x01\x00|\x8c\x01\x00\xa0\x8c\x01\x00\xc2\x8c\x01\x00\xe6\x8c\x01\x00\xfc\x8c\x01\x00'
+    b'\x17\x8d\x01\x00&\x8d\x01\x00G\x8d\x01\x00g\x8d\x01\x00\x82\x8d\x01\x00\x99\x8d\x01\x00\xb6\x8d\x01\x00\xd0\x8d\x01\x00\xe8\x8d\x01\x00\xf9\x8d\x01\x00\x1d\x8e\x01\x00?\x8e\x01\x00\\\x8e\x01\x00t\x8e\x01\x00\x87\x8e\x01\x00\x9a\x8e\x01\x00\xb4\x8e\x01\x00\xcb\x8e\x01\x00\xe2\x8e\x01\x00\xf3\x8e\x01\x00\x04\x8f\x01\x00\x19\x8f\x01\x00,\x8f\x01\x00F\x8f\x01\x00'
+    b'm\x8f\x01\x00\x87\x8f\x01\x00\xa9\x8f\x01\x00\xca\x8f\x01\x00\xee\x8f\x01\x00\x01\x90\x01\x00\x1b\x90\x01\x00E\x90\x01\x00l\x90\x01\x00\x81\x90\x01\x00\x95\x90\x01\x00\xac\x90\x01\x00\xc2\x90\x01\x00\xe0\x90\x01\x00\n\x91\x01\x00)\x91\x01\x00Q\x91\x01\x00h\x91\x01\x00y\x91\x01\x00\xa0\x91\x01\x00\xc4\x91\x01\x00\xe9\x91\x01\x00\r\x92\x01\x00\x1f\x92\x01\x00'
+    b'<\x92\x01\x00L\x92\x01\x00_\x92\x01\x00s\x92\x01\x00\x8a\x92\x01\x00\xa3\x92\x01\x00\xbf\x92\x01\x00\xd9\x92\x01\x00\x02\x93\x01\x00$\x93\x01\x00F\x93\x01\x00c\x93\x01\x00\x88\x93\x01\x00\xab\x93\x01\x00\xc9\x93\x01\x00\xe8\x93\x01\x00\x0e\x94\x01\x00(\x94\x01\x00=\x94\x01\x00J\x94\x01\x00X\x94\x01\x00p\x94\x01\x00\x8f\x94\x01\x00\x9b\x94\x01\x00'
+    b'\xaa\x94\x01\x00\xbd\x94\x01\x00\xd1\x94\x01\x00\xe9\x94\x01\x00\xff\x94\x01\x00\x1b\x95\x01\x000\x95\x01\x00I\x95\x01\x00a\x95\x01\x00}\x95\x01\x00\x95\x95\x01\x00\xb3\x95\x01\x00\xcd\x95\x01\x00\xe9\x95\x01\x00\t\x96\x01\x00"\x96\x01\x00<\x96\x01\x00X\x96\x01\x00p\x96\x01\x00\x9b\x96\x01\x00\xb4\x96\x01\x00\xde\x96\x01\x00\xf7\x96\x01\x00\x1c\x97\x01\x00'
+    b'3\x97\x01\x00]\x97\x01\x00\x81\x97\x01\x00\xa3\x97\x01\x00\xc7\x97\x01\x00\xf3\x97\x01\x00\x11\x98\x01\x00\x1e\x98\x01\x00;\x98\x01\x00Y\x98\x01\x00h\x98\x01\x00\x91\x98\x01\x00\xa3\x98\x01\x00\xc2\x98\x01\x00\xdd\x98\x01\x00\xf2\x98\x01\x00\x0c\x99\x01\x001\x99\x01\x00R\x99\x01\x00h\x99\x01\x00\x89\x99\x01\x00\xa4\x99\x01\x00\xb9\x99\x01\x00\xd8\x99\x01\x00'
+    b'\x01\x9a\x01\x001\x9a\x01\x00b\x9a\x01\x00\x91\x9a\x01\x00\xc2\x9a\x01\x00\xf3\x9a\x01\x00$\x9b\x01\x00U\x9b\x01\x00\x85\x9b\x01\x00\xb5\x9b\x01\x00\xe5\x9b\x01\x00\x15\x9c\x01\x00D\x9c\x01\x00s\x9c\x01\x00\xa2\x9c\x01\x00\xd1\x9c\x01\x00\xe4\x9c\x01\x00\x06\x9d\x01\x00!\x9d\x01\x00H\x9d\x01\x00c\x9d\x01\x00\x88\x9d\x01\x00\xad\x9d\x01\x00\xce\x9d\x01\x00'
+    b'\xe9\x9d\x01\x00\xfb\x9d\x01\x00\x10\x9e\x01\x00*\x9e\x01\x00H\x9e\x01\x00V\x9e\x01\x00z\x9e\x01\x00\x92\x9e\x01\x00\xae\x9e\x01\x00\xd3\x9e\x01\x00\xf8\x9e\x01\x00\x1f\x9f\x01\x00F\x9f\x01\x00l\x9f\x01\x00\x92\x9f\x01\x00\xba\x9f\x01\x00\xd5\x9f\x01\x00\xf2\x9f\x01\x00\x0e\xa0\x01\x00)\xa0\x01\x00C\xa0\x01\x00Z\xa0\x01\x00p\xa0\x01\x00\x8a\xa0\x01\x00'
+    b'\xa6\xa0\x01\x00\xbb\xa0\x01\x00\xcf\xa0\x01\x00\xe5\xa0\x01\x00\x01\xa1\x01\x00\x1a\xa1\x01\x00,\xa1\x01\x00?\xa1\x01\x00W\xa1\x01\x00i\xa1\x01\x00\x86\xa1\x01\x00\x91\xa1\x01\x00\xa6\xa1\x01\x00\xc8\xa1\x01\x00\xf0\xa1\x01\x00\x1c\xa2\x01\x00C\xa2\x01\x00n\xa2\x01\x00\x8f\xa2\x01\x00\xb6\xa2\x01\x00\xe1\xa2\x01\x00\x02\xa3\x01\x00\x16\xa3\x01\x00.\xa3\x01\x00'
+    b'>\xa3\x01\x00O\xa3\x01\x00d\xa3\x01\x00x\xa3\x01\x00\x8d\xa3\x01\x00\xab\xa3\x01\x00\xc6\xa3\x01\x00\xe1\xa3\x01\x00\xf9\xa3\x01\x00\x17\xa4\x01\x00.\xa4\x01\x00J\xa4\x01\x00Z\xa4\x01\x00w\xa4\x01\x00\x93\xa4\x01\x00\xa5\xa4\x01\x00\xc1\xa4\x01\x00\xdc\xa4\x01\x00\x11\xa5\x01\x00&\xa5\x01\x00=\xa5\x01\x00`\xa5\x01\x00x\xa5\x01\x00\x93\xa5\x01\x00'
+    b'\xb5\xa5\x01\x00\xda\xa5\x01\x00\xfc\xa5\x01\x00\x1f\xa6\x01\x002\xa6\x01\x00H\xa6\x01\x00`\xa6\x01\x00\x86\xa6\x01\x00\x94\xa6\x01\x00\xa1\xa6\x01\x00\xb6\xa6\x01\x00\xd4\xa6\x01\x00\xe3\xa6\x01\x00\xfd\xa6\x01\x00\x15\xa7\x01\x001\xa7\x01\x00I\xa7\x01\x00d\xa7\x01\x00\x81\xa7\x01\x00\x9a\xa7\x01\x00\xb1\xa7\x01\x00\xcb\xa7\x01\x00\xe3\xa7\x01\x00\xff\xa7\x01\x00'
+    b'\x10\xa8\x01\x00!\xa8\x01\x00<\xa8\x01\x00X\xa8\x01\x00v\xa8\x01\x00\x90\xa8\x01\x00\xb1\xa8\x01\x00\xd2\xa8\x01\x00\xee\xa8\x01\x00\x01\xa9\x01\x00!\xa9\x01\x00D\xa9\x01\x00c\xa9\x01\x00}\xa9\x01\x00\x91\xa9\x01\x00\xaa\xa9\x01\x00\xbf\xa9\x01\x00\xda\xa9\x01\x00\xea\xa9\x01\x00\x02\xaa\x01\x00\x1f\xaa\x01\x000\xaa\x01\x00F\xaa\x01\x00`\xaa\x01\x00'
+    b't\xaa\x01\x00\x90\xaa\x01\x00\xaa\xaa\x01\x00\xc7\xaa\x01\x00\xe5\xaa\x01\x00\xfa\xaa\x01\x00\x12\xab\x01\x00+\xab\x01\x005\xab\x01\x00O\xab\x01\x00i\xab\x01\x00\x82\xab\x01\x00\x9c\xab\x01\x00\xb8\xab\x01\x00\xc6\xab\x01\x00\xe6\xab\x01\x00\x06\xac\x01\x00&\xac\x01\x00F\xac\x01\x00a\xac\x01\x00x\xac\x01\x00\xa3\xac\x01\x00\xc5\xac\x01\x00\xe7\xac\x01\x00'
+    b'\x00\xad\x01\x00\x1a\xad\x01\x00:\xad\x01\x00L\xad\x01\x00_\xad\x01\x00o\xad\x01\x00\x84\xad\x01\x00\x9d\xad\x01\x00\xbd\xad\x01\x00\xdb\xad\x01\x00\xef\xad\x01\x00\x10\xae\x01\x00,\xae\x01\x00D\xae\x01\x00Y\xae\x01\x00t\xae\x01\x00\x94\xae\x01\x00\xb3\xae\x01\x00\xc8\xae\x01\x00\xde\xae\x01\x00\xf3\xae\x01\x00\x0b\xaf\x01\x00!\xaf\x01\x00/\xaf\x01\x00'
+    b'X\xaf\x01\x00h\xaf\x01\x00\x90\xaf\x01\x00\xb2\xaf\x01\x00\xd0\xaf\x01\x00\xf8\xaf\x01\x00\x1f\xb0\x01\x00Q\xb0\x01\x00x\xb0\x01\x00\xaa\xb0\x01\x00\xc8\xb0\x01\x00\xd7\xb0\x01\x00\xf7\xb0\x01\x00\x15\xb1\x01\x001\xb1\x01\x00K\xb1\x01\x00l\xb1\x01\x00\x92\xb1\x01\x00\xb2\xb1\x01\x00\xcc\xb1\x01\x00\xe5\xb1\x01\x00\xfe\xb1\x01\x00\x1d\xb2\x01\x006\xb2\x01\x00'
+    b'U\xb2\x01\x00o\xb2\x01\x00\x85\xb2\x01\x00\xa0\xb2\x01\x00\xb9\xb2\x01\x00\xd3\xb2\x01\x00\xfa\xb2\x01\x00 \xb3\x01\x00F\xb3\x01\x00d\xb3\x01\x00\x81\xb3\x01\x00\x9e\xb3\x01\x00\xbe\xb3\x01\x00\xdd\xb3\x01\x00\xfc\xb3\x01\x00\x19\xb4\x01\x003\xb4\x01\x00P\xb4\x01\x00i\xb4\x01\x00\x86\xb4\x01\x00\xa2\xb4\x01\x00\xc4\xb4\x01\x00\xd9\xb4\x01\x00\xf2\xb4\x01\x00'
+    b'\x0b\xb5\x01\x008\xb5\x01\x00Z\xb5\x01\x00x\xb5\x01\x00\x90\xb5\x01\x00\xb3\xb5\x01\x00\xd2\xb5\x01\x00\xed\xb5\x01\x00\x0c\xb6\x01\x00%\xb6\x01\x00I\xb6\x01\x00e\xb6\x01\x00\x86\xb6\x01\x00\x9e\xb6\x01\x00\xb7\xb6\x01\x00\xc8\xb6\x01\x00\xd9\xb6\x01\x00\xfb\xb6\x01\x00\x11\xb7\x01\x00,\xb7\x01\x00M\xb7\x01\x00f\xb7\x01\x00\x91\xb7\x01\x00\xab\xb7\x01\x00'
+    b'\xc2\xb7\x01\x00\xe1\xb7\x01\x00\xf8\xb7\x01\x00\x1b\xb8\x01\x00?\xb8\x01\x00`\xb8\x01\x00~\xb8\x01\x00\xa4\xb8\x01\x00\xcb\xb8\x01\x00\xed\xb8\x01\x00\x1c\xb9\x01\x00F\xb9\x01\x00f\xb9\x01\x00\x86\xb9\x01\x00\x9a\xb9\x01\x00\xb3\xb9\x01\x00\xd3\xb9\x01\x00\xe1\xb9\x01\x00\xf2\xb9\x01\x00\x0f\xba\x01\x00 \xba\x01\x004\xba\x01\x00I\xba\x01\x00]\xba\x01\x00'
+    b'\x82\xba\x01\x00\xa5\xba\x01\x00\xb8\xba\x01\x00\xcc\xba\x01\x00\xf0\xba\x01\x00\x14\xbb\x01\x00"\xbb\x01\x005\xbb\x01\x00V\xbb\x01\x00n\xbb\x01\x00\x8d\xbb\x01\x00\xad\xbb\x01\x00\xca\xbb\x01\x00\xe8\xbb\x01\x00\xfe\xbb\x01\x00\x13\xbc\x01\x00!\xbc\x01\x000\xbc\x01\x00B\xbc\x01\x00]\xbc\x01\x00q\xbc\x01\x00\x86\xbc\x01\x00\x9c\xbc\x01\x00\xb3\xbc\x01\x00'
+    b"\xc8\xbc\x01\x00\xdc\xbc\x01\x00\xed\xbc\x01\x00\xfe\xbc\x01\x00\x11\xbd\x01\x00$\xbd\x01\x00:\xbd\x01\x00I\xbd\x01\x00`\xbd\x01\x00u\xbd\x01\x00\x98\xbd\x01\x00\xbd\xbd\x01\x00\xe5\xbd\x01\x00\x02\xbe\x01\x00'\xbe\x01\x00A\xbe\x01\x00`\xbe\x01\x00\x7f\xbe\x01\x00\x9e\xbe\x01\x00\xae\xbe\x01\x00\xd0\xbe\x01\x00\xf0\xbe\x01\x00\x0b\xbf\x01\x00/\xbf\x01\x00"
+    b'R\xbf\x01\x00w\xbf\x01\x00\x8e\xbf\x01\x00\xaa\xbf\x01\x00\xc7\xbf\x01\x00\xdd\xbf\x01\x00\xef\xbf\x01\x00\n\xc0\x01\x00\x1f\xc0\x01\x00<\xc0\x01\x00h\xc0\x01\x00\x8e\xc0\x01\x00\xab\xc0\x01\x00\xc4\xc0\x01\x00\xee\xc0\x01\x00\x01\xc1\x01\x00\x1c\xc1\x01\x005\xc1\x01\x00M\xc1\x01\x00g\xc1\x01\x00\x8a\xc1\x01\x00\xa6\xc1\x01\x00\xb5\xc1\x01\x00\xcd\xc1\x01\x00'
+    b'\xe0\xc1\x01\x00\xf8\xc1\x01\x00\x0f\xc2\x01\x00%\xc2\x01\x00F\xc2\x01\x00b\xc2\x01\x00z\xc2\x01\x00\xa6\xc2\x01\x00\xca\xc2\x01\x00\xe2\xc2\x01\x00\xfc\xc2\x01\x00\x18\xc3\x01\x000\xc3\x01\x00I\xc3\x01\x00Z\xc3\x01\x00p\xc3\x01\x00\x93\xc3\x01\x00\xa7\xc3\x01\x00\xb5\xc3\x01\x00\xce\xc3\x01\x00\xf6\xc3\x01\x00\x17\xc4\x01\x00/\xc4\x01\x00L\xc4\x01\x00'
+    b'j\xc4\x01\x00\x86\xc4\x01\x00\x8d\xc4\x01\x00\xaa\xc4\x01\x00\xb3\xc4\x01\x00\xe4\xc4\x01\x00\x0e\xc5\x01\x00%\xc5\x01\x006\xc5\x01\x00G\xc5\x01\x00\\\xc5\x01\x00o\xc5\x01\x00\x86\xc5\x01\x00\xab\xc5\x01\x00\xd7\xc5\x01\x00\xef\xc5\x01\x00\x06\xc6\x01\x00\x1f\xc6\x01\x007\xc6\x01\x00T\xc6\x01\x00n\xc6\x01\x00\x85\xc6\x01\x00\x9c\xc6\x01\x00\xb6\xc6\x01\x00'
+    b'\xcd\xc6\x01\x00\xe7\xc6\x01\x00\x03\xc7\x01\x00\x1e\xc7\x01\x00D\xc7\x01\x00h\xc7\x01\x00\x8e\xc7\x01\x00\xa2\xc7\x01\x00\xb1\xc7\x01\x00\xc2\xc7\x01\x00\xe1\xc7\x01\x00\xfb\xc7\x01\x00\x1a\xc8\x01\x00=\xc8\x01\x00T\xc8\x01\x00f\xc8\x01\x00\x8c\xc8\x01\x00\xac\xc8\x01\x00\xd3\xc8\x01\x00\xfb\xc8\x01\x00\x19\xc9\x01\x008\xc9\x01\x00V\xc9\x01\x00n\xc9\x01\x00'
+    b'\x8b\xc9\x01\x00\xa6\xc9\x01\x00\xbd\xc9\x01\x00\xd4\xc9\x01\x00\xe2\xc9\x01\x00\xf2\xc9\x01\x00\x0b\xca\x01\x00*\xca\x01\x00A\xca\x01\x00T\xca\x01\x00s\xca\x01\x00\x91\xca\x01\x00\xad\xca\x01\x00\xbe\xca\x01\x00\xe6\xca\x01\x00\x0f\xcb\x01\x00,\xcb\x01\x00N\xcb\x01\x00g\xcb\x01\x00\x83\xcb\x01\x00\x9c\xcb\x01\x00\xbb\xcb\x01\x00\xce\xcb\x01\x00\xe2\xcb\x01\x00'
+    b'\xf2\xcb\x01\x00\x03\xcc\x01\x00\x13\xcc\x01\x00"\xcc\x01\x00/\xcc\x01\x00<\xcc\x01\x00J\xcc\x01\x00[\xcc\x01\x00g\xcc\x01\x00\x7f\xcc\x01\x00\x96\xcc\x01\x00\xb5\xcc\x01\x00\xc8\xcc\x01\x00\xe3\xcc\x01\x00\xec\xcc\x01\x00\x05\xcd\x01\x00\x1b\xcd\x01\x006\xcd\x01\x00Q\xcd\x01\x00e\xcd\x01\x00\x80\xcd\x01\x00\x9b\xcd\x01\x00\xae\xcd\x01\x00\xd3\xcd\x01\x00'
+    b'\xf5\xcd\x01\x00\x05\xce\x01\x00\x13\xce\x01\x00)\xce\x01\x00>\xce\x01\x00\\\xce\x01\x00q\xce\x01\x00\x84\xce\x01\x00\x9f\xce\x01\x00\xb6\xce\x01\x00\xd3\xce\x01\x00\xe8\xce\x01\x00\x07\xcf\x01\x00\x1c\xcf\x01\x002\xcf\x01\x00G\xcf\x01\x00[\xcf\x01\x00t\xcf\x01\x00\x9c\xcf\x01\x00\xbc\xcf\x01\x00\xd0\xcf\x01\x00\xe9\xcf\x01\x00\x06\xd0\x01\x00 \xd0\x01\x00'
+    b'1\xd0\x01\x00I\xd0\x01\x00t\xd0\x01\x00\x8a\xd0\x01\x00\xa0\xd0\x01\x00\xbe\xd0\x01\x00\xd8\xd0\x01\x00\xe4\xd0\x01\x00\xf4\xd0\x01\x00\x17\xd1\x01\x007\xd1\x01\x00X\xd1\x01\x00n\xd1\x01\x00\x8b\xd1\x01\x00\xa7\xd1\x01\x00\xc5\xd1\x01\x00\xe6\xd1\x01\x00\x06\xd2\x01\x003\xd2\x01\x00=\xd2\x01\x00[\xd2\x01\x00o\xd2\x01\x00\x8e\xd2\x01\x00\xa6\xd2\x01\x00'
+    b'\xcb\xd2\x01\x00\xf0\xd2\x01\x00\x16\xd3\x01\x00;\xd3\x01\x00a\xd3\x01\x00\x88\xd3\x01\x00\xb0\xd3\x01\x00\xd6\xd3\x01\x00\xfe\xd3\x01\x00#\xd4\x01\x00K\xd4\x01\x00z\xd4\x01\x00\xa1\xd4\x01\x00\xc8\xd4\x01\x00\xf2\xd4\x01\x00\x16\xd5\x01\x00=\xd5\x01\x00j\xd5\x01\x00\x90\xd5\x01\x00\xb5\xd5\x01\x00\xe0\xd5\x01\x00\x07\xd6\x01\x00-\xd6\x01\x00Q\xd6\x01\x00'
+    b'u\xd6\x01\x00\x9a\xd6\x01\x00\xbe\xd6\x01\x00\xe3\xd6\x01\x00\t\xd7\x01\x000\xd7\x01\x00W\xd7\x01\x00{\xd7\x01\x00\xa2\xd7\x01\x00\xd0\xd7\x01\x00\xf6\xd7\x01\x00\x1c\xd8\x01\x00E\xd8\x01\x00h\xd8\x01\x00\x8e\xd8\x01\x00\xba\xd8\x01\x00\xdf\xd8\x01\x00\x03\xd9\x01\x00-\xd9\x01\x00S\xd9\x01\x00x\xd9\x01\x00\xa1\xd9\x01\x00\xc9\xd9\x01\x00\xf5\xd9\x01\x00'
+    b' \xda\x01\x00E\xda\x01\x00X\xda\x01\x00\x80\xda\x01\x00\xbb\xda\x01\x00\xd3\xda\x01\x00\xf4\xda\x01\x00\x10\xdb\x01\x000\xdb\x01\x00G\xdb\x01\x00o\xdb\x01\x00\x8a\xdb\x01\x00\xa4\xdb\x01\x00\xcf\xdb\x01\x00\xf8\xdb\x01\x00"\xdc\x01\x00P\xdc\x01\x00i\xdc\x01\x00\x81\xdc\x01\x00\x9a\xdc\x01\x00\xbd\xdc\x01\x00\xdd\xdc\x01\x00\xf6\xdc\x01\x00\x15\xdd\x01\x00'
+    b'8\xdd\x01\x00Y\xdd\x01\x00t\xdd\x01\x00\x8f\xdd\x01\x00\xad\xdd\x01\x00\xcc\xdd\x01\x00\xeb\xdd\x01\x00\x0c\xde\x01\x00(\xde\x01\x00D\xde\x01\x00l\xde\x01\x00\x95\xde\x01\x00\xbf\xde\x01\x00\xde\xde\x01\x00\xfd\xde\x01\x00#\xdf\x01\x00G\xdf\x01\x00j\xdf\x01\x00\x8c\xdf\x01\x00\xac\xdf\x01\x00\xd0\xdf\x01\x00\xf9\xdf\x01\x00\x1f\xe0\x01\x00?\xe0\x01\x00'
+    b'a\xe0\x01\x00\x82\xe0\x01\x00\xaa\xe0\x01\x00\xc9\xe0\x01\x00\xe8\xe0\x01\x00\x08\xe1\x01\x00,\xe1\x01\x00P\xe1\x01\x00p\xe1\x01\x00\x92\xe1\x01\x00\xb4\xe1\x01\x00\xd2\xe1\x01\x00\xf2\xe1\x01\x00\x14\xe2\x01\x00@\xe2\x01\x00a\xe2\x01\x00\x89\xe2\x01\x00\xb0\xe2\x01\x00\xd4\xe2\x01\x00\xfd\xe2\x01\x00\x1d\xe3\x01\x00=\xe3\x01\x00W\xe3\x01\x00p\xe3\x01\x00'
+    b'\x97\xe3\x01\x00\xb2\xe3\x01\x00\xcd\xe3\x01\x00\xe8\xe3\x01\x00\x03\xe4\x01\x00\x1e\xe4\x01\x00K\xe4\x01\x00h\xe4\x01\x00\x82\xe4\x01\x00\xac\xe4\x01\x00\xd9\xe4\x01\x00\x03\xe5\x01\x002\xe5\x01\x00^\xe5\x01\x00\x8f\xe5\x01\x00\xc8\xe5\x01\x00\x05\xe6\x01\x00!\xe6\x01\x00?\xe6\x01\x00]\xe6\x01\x00\x88\xe6\x01\x00\xae\xe6\x01\x00\xc9\xe6\x01\x00\xda\xe6\x01\x00'
+    b'\xfa\xe6\x01\x00\x11\xe7\x01\x004\xe7\x01\x00X\xe7\x01\x00z\xe7\x01\x00\x98\xe7\x01\x00\xb8\xe7\x01\x00\xd3\xe7\x01\x00\xef\xe7\x01\x00\n\xe8\x01\x00)\xe8\x01\x00S\xe8\x01\x00w\xe8\x01\x00\x9f\xe8\x01\x00\xb2\xe8\x01\x00\xd7\xe8\x01\x00\xf3\xe8\x01\x00\x0f\xe9\x01\x00+\xe9\x01\x00G\xe9\x01\x00Y\xe9\x01\x00]\xe9\x01\x00~\xe9\x01\x00\x93\xe9\x01\x00'
+    b'\xb1\xe9\x01\x00\xcd\xe9\x01\x00\xf2\xe9\x01\x00\x15\xea\x01\x00=\xea\x01\x00R\xea\x01\x00l\xea\x01\x00\x89\xea\x01\x00\xa7\xea\x01\x00\xc1\xea\x01\x00\xeb\xea\x01\x00\x03\xeb\x01\x00\x1b\xeb\x01\x003\xeb\x01\x00G\xeb\x01\x00[\xeb\x01\x00w\xeb\x01\x00\x93\xeb\x01\x00\xb0\xeb\x01\x00\xc7\xeb\x01\x00\xe3\xeb\x01\x00\xff\xeb\x01\x00\x1b\xec\x01\x007\xec\x01\x00'
+    b"S\xec\x01\x00n\xec\x01\x00\x89\xec\x01\x00\xa4\xec\x01\x00\xbf\xec\x01\x00\xda\xec\x01\x00\xf5\xec\x01\x00\x14\xed\x01\x003\xed\x01\x00R\xed\x01\x00q\xed\x01\x00\x90\xed\x01\x00\xb4\xed\x01\x00\xd8\xed\x01\x00\xfc\xed\x01\x00\x19\xee\x01\x00'\xee\x01\x004\xee\x01\x00R\xee\x01\x00o\xee\x01\x00\x8c\xee\x01\x00\xa2\xee\x01\x00\xb4\xee\x01\x00\xd6\xee\x01\x00"
+    b'\xee\xee\x01\x00\x08\xef\x01\x001\xef\x01\x00Q\xef\x01\x00a\xef\x01\x00\x83\xef\x01\x00\x9c\xef\x01\x00\xa8\xef\x01\x00\xd8\xef\x01\x00\xf4\xef\x01\x00\x10\xf0\x01\x00+\xf0\x01\x00H\xf0\x01\x00e\xf0\x01\x00\x81\xf0\x01\x00\x9e\xf0\x01\x00\xbb\xf0\x01\x00\xd7\xf0\x01\x00\xf3\xf0\x01\x00\x0f\xf1\x01\x00*\xf1\x01\x00L\xf1\x01\x00m\xf1\x01\x00\x8f\xf1\x01\x00'
+    b'\xb0\xf1\x01\x00\xcd\xf1\x01\x00\xe9\xf1\x01\x00\x05\xf2\x01\x00"\xf2\x01\x00>\xf2\x01\x00[\xf2\x01\x00w\xf2\x01\x00\x94\xf2\x01\x00\xb0\xf2\x01\x00\xcc\xf2\x01\x00\xe7\xf2\x01\x00\x03\xf3\x01\x00\x1e\xf3\x01\x00<\xf3\x01\x00Y\xf3\x01\x00w\xf3\x01\x00\x94\xf3\x01\x00\xaf\xf3\x01\x00\xc9\xf3\x01\x00\xe4\xf3\x01\x00\xfe\xf3\x01\x00\x1c\xf4\x01\x009\xf4\x01\x00'
+    b'W\xf4\x01\x00t\xf4\x01\x00\x91\xf4\x01\x00\xad\xf4\x01\x00\xca\xf4\x01\x00\xe6\xf4\x01\x00\x04\xf5\x01\x00!\xf5\x01\x00?\xf5\x01\x00\\\xf5\x01\x00\x80\xf5\x01\x00\x9b\xf5\x01\x00\xb6\xf5\x01\x00\xd5\xf5\x01\x00\xf6\xf5\x01\x00\x0e\xf6\x01\x00+\xf6\x01\x00?\xf6\x01\x00S\xf6\x01\x00z\xf6\x01\x00\x8c\xf6\x01\x00\xa9\xf6\x01\x00\xc6\xf6\x01\x00\xe2\xf6\x01\x00'
+    b'\x04\xf7\x01\x00!\xf7\x01\x00>\xf7\x01\x00[\xf7\x01\x00w\xf7\x01\x00\x95\xf7\x01\x00\xb0\xf7\x01\x00\xce\xf7\x01\x00\xeb\xf7\x01\x00\t\xf8\x01\x00&\xf8\x01\x00C\xf8\x01\x00_\xf8\x01\x00\x81\xf8\x01\x00\x9e\xf8\x01\x00\xbb\xf8\x01\x00\xd8\xf8\x01\x00\xf4\xf8\x01\x00\x12\xf9\x01\x00-\xf9\x01\x00K\xf9\x01\x00h\xf9\x01\x00\x86\xf9\x01\x00\xa9\xf9\x01\x00'
+    b'\xcc\xf9\x01\x00\xee\xf9\x01\x00\x16\xfa\x01\x009\xfa\x01\x00\\\xfa\x01\x00~\xfa\x01\x00\xa2\xfa\x01\x00\xc3\xfa\x01\x00\xe7\xfa\x01\x00\n\xfb\x01\x00.\xfb\x01\x00Q\xfb\x01\x00t\xfb\x01\x00\x96\xfb\x01\x00\xbe\xfb\x01\x00\xe1\xfb\x01\x00\x04\xfc\x01\x00&\xfc\x01\x00J\xfc\x01\x00k\xfc\x01\x00\x8f\xfc\x01\x00\xb2\xfc\x01\x00\xd6\xfc\x01\x00\xf6\xfc\x01\x00'
+    b"\x16\xfd\x01\x006\xfd\x01\x00V\xfd\x01\x00v\xfd\x01\x00\x96\xfd\x01\x00\xb6\xfd\x01\x00\xd6\xfd\x01\x00\xf6\xfd\x01\x00\x16\xfe\x01\x006\xfe\x01\x00V\xfe\x01\x00y\xfe\x01\x00\x9b\xfe\x01\x00\xbe\xfe\x01\x00\xe0\xfe\x01\x00\x04\xff\x01\x00'\xff\x01\x00J\xff\x01\x00l\xff\x01\x00\x8f\xff\x01\x00\xb1\xff\x01\x00\xd5\xff\x01\x00\xf8\xff\x01\x00 \x00\x02\x00"
+    b'I\x00\x02\x00q\x00\x02\x00\x9a\x00\x02\x00\xc2\x00\x02\x00\xea\x00\x02\x00\x11\x01\x02\x00>\x01\x02\x00f\x01\x02\x00\x8e\x01\x02\x00\xb5\x01\x02\x00\xde\x01\x02\x00\x04\x02\x02\x00-\x02\x02\x00U\x02\x02\x00~\x02\x02\x00\xa6\x02\x02\x00\xce\x02\x02\x00\xf5\x02\x02\x00"\x03\x02\x00J\x03\x02\x00r\x03\x02\x00\x99\x03\x02\x00\xc2\x03\x02\x00\xe8\x03\x02\x00'
+    b'\x11\x04\x02\x009\x04\x02\x00b\x04\x02\x00\x87\x04\x02\x00\xac\x04\x02\x00\xd1\x04\x02\x00\xf6\x04\x02\x00\x1a\x05\x02\x00>\x05\x02\x00h\x05\x02\x00\x92\x05\x02\x00\xb7\x05\x02\x00\xdc\x05\x02\x00\x01\x06\x02\x00&\x06\x02\x00J\x06\x02\x00n\x06\x02\x00\x94\x06\x02\x00\xb7\x06\x02\x00\xdd\x06\x02\x00\x00\x07\x02\x00&\x07\x02\x00L\x07\x02\x00q\x07\x02\x00'
+    b'\x97\x07\x02\x00\xbc\x07\x02\x00\xe2\x07\x02\x00\x0e\x08\x02\x00;\x08\x02\x00_\x08\x02\x00\x83\x08\x02\x00\xaf\x08\x02\x00\xde\x08\x02\x00\x04\t\x02\x002\t\x02\x00X\t\x02\x00|\t\x02\x00\xa6\t\x02\x00\xd0\t\x02\x00\xfc\t\x02\x00)\n\x02\x00M\n\x02\x00q\n\x02\x00\x9d\n\x02\x00\xcc\n\x02\x00\xf2\n\x02\x00 \x0b\x02\x00F\x0b\x02\x00'
+    b'j\x0b\x02\x00\x94\x0b\x02\x00\xbe\x0b\x02\x00\xf0\x0b\x02\x00#\x0c\x02\x00M\x0c\x02\x00w\x0c\x02\x00\xa9\x0c\x02\x00\xde\x0c\x02\x00\n\r\x02\x00>\r\x02\x00j\r\x02\x00\x94\r\x02\x00\xc4\r\x02\x00\xf4\r\x02\x00&\x0e\x02\x00Y\x0e\x02\x00\x83\x0e\x02\x00\xad\x0e\x02\x00\xdf\x0e\x02\x00\x14\x0f\x02\x00@\x0f\x02\x00t\x0f\x02\x00\xa0\x0f\x02\x00'
+    b'\xca\x0f\x02\x00\xfa\x0f\x02\x00*\x10\x02\x00L\x10\x02\x00m\x10\x02\x00\x8f\x10\x02\x00\xb6\x10\x02\x00\xd8\x10\x02\x00\xfa\x10\x02\x00\x1b\x11\x02\x00>\x11\x02\x00^\x11\x02\x00\x81\x11\x02\x00\xa3\x11\x02\x00\xb9\x11\x02\x00\xcf\x11\x02\x00\xe4\x11\x02\x00\xff\x11\x02\x00\x15\x12\x02\x00+\x12\x02\x00@\x12\x02\x00W\x12\x02\x00n\x12\x02\x00\x84\x12\x02\x00'
+    b'\x9b\x12\x02\x00\xb1\x12\x02\x00\xc6\x12\x02\x00\xe1\x12\x02\x00\xf7\x12\x02\x00\r\x13\x02\x00"\x13\x02\x009\x13\x02\x00P\x13\x02\x00f\x13\x02\x00}\x13\x02\x00\x93\x13\x02\x00\xa9\x13\x02\x00\xbf\x13\x02\x00\xd9\x13\x02\x00\xf6\x13\x02\x00\x19\x14\x02\x006\x14\x02\x00Y\x14\x02\x00|\x14\x02\x00\x9e\x14\x02\x00\xc0\x14\x02\x00\xe1\x14\x02\x00\x08\x15\x02\x00'
+    b'*\x15\x02\x00L\x15\x02\x00m\x15\x02\x00\x90\x15\x02\x00\xb0\x15\x02\x00\xd3\x15\x02\x00\xf5\x15\x02\x00\x18\x16\x02\x00@\x16\x02\x00h\x16\x02\x00\x8d\x16\x02\x00\xb2\x16\x02\x00\xd1\x16\x02\x00\xf0\x16\x02\x00\x05\x17\x02\x00$\x17\x02\x00C\x17\x02\x00m\x17\x02\x00\x8a\x17\x02\x00\xa6\x17\x02\x00\xbd\x17\x02\x00\xd4\x17\x02\x00\xe7\x17\x02\x00\xfa\x17\x02\x00'
+    b'\x1f\x18\x02\x00:\x18\x02\x00S\x18\x02\x00s\x18\x02\x00\x94\x18\x02\x00\xaf\x18\x02\x00\xc1\x18\x02\x00\xd3\x18\x02\x00\xef\x18\x02\x00\xff\x18\x02\x00$\x19\x02\x00G\x19\x02\x00h\x19\x02\x00\x86\x19\x02\x00\xa3\x19\x02\x00\xc2\x19\x02\x00\xe1\x19\x02\x00\x00\x1a\x02\x000\x1a\x02\x00Z\x1a\x02\x00~\x1a\x02\x00\x97\x1a\x02\x00\xad\x1a\x02\x00\xc5\x1a\x02\x00'
+    b"\xe3\x1a\x02\x00\x10\x1b\x02\x005\x1b\x02\x00O\x1b\x02\x00{\x1b\x02\x00\xa6\x1b\x02\x00\xc6\x1b\x02\x00\xe8\x1b\x02\x00\x08\x1c\x02\x00'\x1c\x02\x00H\x1c\x02\x00g\x1c\x02\x00\x86\x1c\x02\x00\xa7\x1c\x02\x00\xc5\x1c\x02\x00\xe6\x1c\x02\x00\x06\x1d\x02\x00(\x1d\x02\x00H\x1d\x02\x00g\x1d\x02\x00\x88\x1d\x02\x00\xa7\x1d\x02\x00\xc6\x1d\x02\x00\xe7\x1d\x02\x00"
+    b'\x05\x1e\x02\x00&\x1e\x02\x00C\x1e\x02\x00q\x1e\x02\x00\xa5\x1e\x02\x00\xd9\x1e\x02\x00\x02\x1f\x02\x00\x1d\x1f\x02\x002\x1f\x02\x00[\x1f\x02\x00\x83\x1f\x02\x00\xab\x1f\x02\x00\xd5\x1f\x02\x00\x03 \x02\x002 \x02\x00` \x02\x00\x90 \x02\x00\xb8 \x02\x00\xe1 \x02\x00\t!\x02\x003!\x02\x00a!\x02\x00\x90!\x02\x00\xbe!\x02\x00'
+    b'\xee!\x02\x00\x14"\x02\x006"\x02\x00]"\x02\x00\x7f"\x02\x00\xa5"\x02\x00\xcc"\x02\x00\xee"\x02\x00\x11#\x02\x004#\x02\x00V#\x02\x00w#\x02\x00\x8b#\x02\x00\xa3#\x02\x00\xc4#\x02\x00\xdd#\x02\x00\xf7#\x02\x00\x13$\x02\x00+$\x02\x00F$\x02\x00Z$\x02\x00v$\x02\x00\x8a$\x02\x00\x95$\x02\x00'
+    b'\xaa$\x02\x00\xc3$\x02\x00\xe0$\x02\x00\xf0$\x02\x00\r%\x02\x00\x1b%\x02\x00)%\x02\x007%\x02\x00S%\x02\x00h%\x02\x00\x81%\x02\x00\xa8%\x02\x00\xcf%\x02\x00\xf5%\x02\x00 &\x02\x00J&\x02\x00q&\x02\x00\x89&\x02\x00\xb7&\x02\x00\xe9&\x02\x00\xf6&\x02\x00"\'\x02\x00N\'\x02\x00z\'\x02\x00'
+    b"\x93'\x02\x00\xb3'\x02\x00\xd2'\x02\x00\xec'\x02\x00\x0c(\x02\x002(\x02\x00F(\x02\x00N(\x02\x00_(\x02\x00\x8a(\x02\x00\xa9(\x02\x00\xbe(\x02\x00\xd5(\x02\x00\xf2(\x02\x00\x03)\x02\x00\x1d)\x02\x000)\x02\x00L)\x02\x00\\)\x02\x00x)\x02\x00\x85)\x02\x00\x9f)\x02\x00\xb8)\x02\x00\xd4)\x02\x00"
+    b'\xf0)\x02\x00\x11*\x02\x00(*\x02\x00I*\x02\x00d*\x02\x00u*\x02\x00\x91*\x02\x00\xa5*\x02\x00\xbc*\x02\x00\xd0*\x02\x00\xe7*\x02\x00\x00+\x02\x00\x13+\x02\x005+\x02\x00\\+\x02\x00j+\x02\x00\x81+\x02\x00\x91+\x02\x00\xa3+\x02\x00\xb8+\x02\x00\xcd+\x02\x00\xe2+\x02\x00\xf7+\x02\x00\x0c,\x02\x00'
+    b'\x1d,\x02\x004,\x02\x00O,\x02\x00n,\x02\x00\x93,\x02\x00\xbd,\x02\x00\xd6,\x02\x00\xed,\x02\x00\x0b-\x02\x00(-\x02\x00:-\x02\x00Z-\x02\x00x-\x02\x00\x92-\x02\x00\xb3-\x02\x00\xc9-\x02\x00\xeb-\x02\x00\x10.\x02\x00*.\x02\x00O.\x02\x00w.\x02\x00\x94.\x02\x00\xb2.\x02\x00\xd5.\x02\x00'
+    b'\xf6.\x02\x00#/\x02\x00>/\x02\x00k/\x02\x00\x95/\x02\x00\xc1/\x02\x00\xe0/\x02\x00\x050\x02\x00+0\x02\x00O0\x02\x00z0\x02\x00\xad0\x02\x00\xd50\x02\x00\xfd0\x02\x00\x1b1\x02\x00@1\x02\x00Z1\x02\x00\x801\x02\x00\xa91\x02\x00\xc71\x02\x00\xf01\x02\x00\x152\x02\x00.2\x02\x00Y2\x02\x00'
+    b'|2\x02\x00\xa42\x02\x00\xce2\x02\x00\xf12\x02\x00\x153\x02\x0073\x02\x00`3\x02\x00\x913\x02\x00\xb73\x02\x00\xdd3\x02\x00\xf93\x02\x00\x1c4\x02\x0044\x02\x00X4\x02\x00\x7f4\x02\x00\x9b4\x02\x00\xc24\x02\x00\xdd4\x02\x00\n5\x02\x0045\x02\x00`5\x02\x00\x7f5\x02\x00\xa45\x02\x00\xca5\x02\x00'
+    b'\xee5\x02\x00\x196\x02\x00L6\x02\x00t6\x02\x00\x9c6\x02\x00\xba6\x02\x00\xdf6\x02\x00\xf96\x02\x00\x1f7\x02\x00H7\x02\x00f7\x02\x00\x8f7\x02\x00\xb47\x02\x00\xc97\x02\x00\xf07\x02\x00\x148\x02\x00:8\x02\x00S8\x02\x00r8\x02\x00\x928\x02\x00\xa28\x02\x00\xb98\x02\x00\xc98\x02\x00\xeb8\x02\x00'
+    b"\r9\x02\x00%9\x02\x00D9\x02\x00X9\x02\x00x9\x02\x00\x9b9\x02\x00\xb39\x02\x00\xd69\x02\x00\xf59\x02\x00\x14:\x02\x00.:\x02\x00R:\x02\x00o:\x02\x00\x84:\x02\x00\xab:\x02\x00\xc2:\x02\x00\xdb:\x02\x00\xf0:\x02\x00\x0b;\x02\x00';\x02\x00<;\x02\x00R;\x02\x00l;\x02\x00\x82;\x02\x00"
+    b'\x99;\x02\x00\xb0;\x02\x00\xca;\x02\x00\xde;\x02\x00\xf7;\x02\x00\x10<\x02\x00)<\x02\x00B<\x02\x00[<\x02\x00t<\x02\x00\x8d<\x02\x00\xa6<\x02\x00\xbf<\x02\x00\xd8<\x02\x00\xf1<\x02\x00\n=\x02\x00#=\x02\x00<=\x02\x00U=\x02\x00n=\x02\x00\x9e=\x02\x00\xb4=\x02\x00\xc0=\x02\x00\xd9=\x02\x00'
+    b'\xf3=\x02\x00\x0c>\x02\x003>\x02\x00\\>\x02\x00}>\x02\x00\x9e>\x02\x00\xc7>\x02\x00\xea>\x02\x00\x07?\x02\x00$?\x02\x00A?\x02\x00j?\x02\x00\x86?\x02\x00\xa3?\x02\x00\xad?\x02\x00\xc0?\x02\x00\xe3?\x02\x00\x05@\x02\x00(@\x02\x00H@\x02\x00n@\x02\x00\x94@\x02\x00\xb6@\x02\x00\xd8@\x02\x00'
+    b'\xf4@\x02\x00\x18A\x02\x006A\x02\x00\\A\x02\x00|A\x02\x00\x95A\x02\x00\xb5A\x02\x00\xd0A\x02\x00\xf0A\x02\x00\x0fB\x02\x00/B\x02\x00TB\x02\x00qB\x02\x00\x8fB\x02\x00\xadB\x02\x00\xcbB\x02\x00\xefB\x02\x00\x14C\x02\x00-C\x02\x00DC\x02\x00[C\x02\x00pC\x02\x00\x84C\x02\x00\xa7C\x02\x00'
+    b'\xbeC\x02\x00\xd9C\x02\x00\xffC\x02\x00\x16D\x02\x00:D\x02\x00QD\x02\x00\x7fD\x02\x00\xa3D\x02\x00\xb8D\x02\x00\xcfD\x02\x00\xeaD\x02\x00\xffD\x02\x00\x17E\x02\x00/E\x02\x00IE\x02\x00bE\x02\x00yE\x02\x00\x90E\x02\x00\xabE\x02\x00\xbdE\x02\x00\xd2E\x02\x00\xe7E\x02\x00\xfeE\x02\x00\x14F\x02\x00'
+    b'(F\x02\x00<F\x02\x00TF\x02\x00gF\x02\x00\x83F\x02\x00\x9eF\x02\x00\xc3F\x02\x00\xe3F\x02\x00\x05G\x02\x00!G\x02\x00CG\x02\x00fG\x02\x00\x85G\x02\x00\x97G\x02\x00\xb0G\x02\x00\xcaG\x02\x00\xe6G\x02\x00\x0fH\x02\x00#H\x02\x00=H\x02\x00gH\x02\x00vH\x02\x00\x90H\x02\x00\xa0H\x02\x00'
+    b'\xb0H\x02\x00\xc8H\x02\x00\xebH\x02\x00\nI\x02\x00\x1cI\x02\x00.I\x02\x00@I\x02\x00VI\x02\x00lI\x02\x00\x97I\x02\x00\xbeI\x02\x00\xd3I\x02\x00\xf3I\x02\x00\x08J\x02\x00\x1eJ\x02\x00<J\x02\x00YJ\x02\x00|J\x02\x00\x9bJ\x02\x00\xaaJ\x02\x00\xd7J\x02\x00\xe9J\x02\x00\xfbJ\x02\x00\x18K\x02\x00'
+    b'4K\x02\x00OK\x02\x00gK\x02\x00\x8dK\x02\x00\x9fK\x02\x00\xb2K\x02\x00\xc7K\x02\x00\xd9K\x02\x00\xebK\x02\x00\xfcK\x02\x00\x10L\x02\x00"L\x02\x00?L\x02\x00RL\x02\x00\\L\x02\x00sL\x02\x00\x80L\x02\x00\x8bL\x02\x00\x9dL\x02\x00\xacL\x02\x00\xc0L\x02\x00\xcfL\x02\x00\xe9L\x02\x00\x04M\x02\x00'
+    b'+M\x02\x00GM\x02\x00ZM\x02\x00rM\x02\x00\x87M\x02\x00\xa7M\x02\x00\xc7M\x02\x00\xe7M\x02\x00\x07N\x02\x00\x1bN\x02\x00/N\x02\x00?N\x02\x00KN\x02\x00\\N\x02\x00uN\x02\x00\x8fN\x02\x00\xa3N\x02\x00\xb7N\x02\x00\xc3N\x02\x00\xe3N\x02\x00\nO\x02\x00*O\x02\x00QO\x02\x00lO\x02\x00'
+    b'\x84O\x02\x00\xa0O\x02\x00\xbbO\x02\x00\xd5O\x02\x00\xf5O\x02\x00\rP\x02\x00\x14P\x02\x00(P\x02\x00FP\x02\x00yP\x02\x00\x96P\x02\x00\xc3P\x02\x00\xf0P\x02\x00\x12Q\x02\x00*Q\x02\x00IQ\x02\x00gQ\x02\x00\x81Q\x02\x00\x9dQ\x02\x00\xb9Q\x02\x00\xddQ\x02\x00\xecQ\x02\x00\x04R\x02\x00)R\x02\x00'
+    b'@R\x02\x00SR\x02\x00iR\x02\x00\x8aR\x02\x00\xa1R\x02\x00\xbbR\x02\x00\xd5R\x02\x00\xefR\x02\x00\nS\x02\x00%S\x02\x00@S\x02\x00VS\x02\x00pS\x02\x00\x8aS\x02\x00\xa4S\x02\x00\xbfS\x02\x00\xdaS\x02\x00\xf5S\x02\x00\x03T\x02\x00\x1dT\x02\x005T\x02\x00NT\x02\x00]T\x02\x00vT\x02\x00'
+    b'\x8eT\x02\x00\xa8T\x02\x00\xcbT\x02\x00\xe5T\x02\x00\xfaT\x02\x00\x1cU\x02\x007U\x02\x00UU\x02\x00lU\x02\x00\x7fU\x02\x00\x94U\x02\x00\xa7U\x02\x00\xc3U\x02\x00\xdfU\x02\x00\xfbU\x02\x00\x1aV\x02\x00;V\x02\x00[V\x02\x00iV\x02\x00\x83V\x02\x00\xa0V\x02\x00\xbdV\x02\x00\xd0V\x02\x00\xf1V\x02\x00'
+    b"\x12W\x02\x00)W\x02\x00JW\x02\x00kW\x02\x00\x87W\x02\x00\xa8W\x02\x00\xc8W\x02\x00\xe9W\x02\x00\xfeW\x02\x00'X\x02\x00AX\x02\x00^X\x02\x00sX\x02\x00\x8bX\x02\x00\xa2X\x02\x00\xc0X\x02\x00\xdeX\x02\x00\xf9X\x02\x00\x10Y\x02\x00,Y\x02\x00;Y\x02\x00RY\x02\x00jY\x02\x00}Y\x02\x00"
+    b'\x91Y\x02\x00\xa5Y\x02\x00\xb8Y\x02\x00\xc9Y\x02\x00\xd9Y\x02\x00\xe8Y\x02\x00\xf9Y\x02\x00\x0cZ\x02\x00\x1fZ\x02\x00:Z\x02\x00QZ\x02\x00\\Z\x02\x00{Z\x02\x00\x91Z\x02\x00\xa5Z\x02\x00\xc3Z\x02\x00\xe5Z\x02\x00\xf9Z\x02\x00\r[\x02\x00,[\x02\x00K[\x02\x00o[\x02\x00\x93[\x02\x00\xa4[\x02\x00'
+    b"\xb5[\x02\x00\xcd[\x02\x00\xe3[\x02\x00\xf6[\x02\x00\x0c\\\x02\x00%\\\x02\x00>\\\x02\x00X\\\x02\x00o\\\x02\x00\x83\\\x02\x00\x9d\\\x02\x00\xb5\\\x02\x00\xd5\\\x02\x00\xed\\\x02\x00\n]\x02\x00']\x02\x00@]\x02\x00Z]\x02\x00p]\x02\x00\x92]\x02\x00\xa6]\x02\x00\xb5]\x02\x00\xd5]\x02\x00\xf3]\x02\x00"
+    b'\x01^\x02\x00*^\x02\x00>^\x02\x00^^\x02\x00|^\x02\x00\x9b^\x02\x00\xb0^\x02\x00\xc9^\x02\x00\xe8^\x02\x00\x06_\x02\x00&_\x02\x00<_\x02\x00V_\x02\x00i_\x02\x00w_\x02\x00\x82_\x02\x00\xa1_\x02\x00\xbb_\x02\x00\xd5_\x02\x00\xeb_\x02\x00\x01`\x02\x00\x16`\x02\x00+`\x02\x00=`\x02\x00'
+    b'U`\x02\x00m`\x02\x00\x8a`\x02\x00\x99`\x02\x00\xb5`\x02\x00\xc8`\x02\x00\xe6`\x02\x00\xfd`\x02\x00\x16a\x02\x00-a\x02\x00Ia\x02\x00`a\x02\x00|a\x02\x00\x96a\x02\x00\xb1a\x02\x00\xcda\x02\x00\xe9a\x02\x00\x08b\x02\x00\x12b\x02\x00*b\x02\x00=b\x02\x00Jb\x02\x00[b\x02\x00wb\x02\x00'
+    b'\x89b\x02\x00\x99b\x02\x00\x9fb\x02\x00\xa6b\x02\x00\xc6b\x02\x00\xe7b\x02\x00\tc\x02\x00 c\x02\x002c\x02\x00Dc\x02\x00Tc\x02\x00dc\x02\x00xc\x02\x00\x8dc\x02\x00\xa7c\x02\x00\xc3c\x02\x00\xdcc\x02\x00\xf4c\x02\x00\x0fd\x02\x00+d\x02\x00Kd\x02\x00od\x02\x00|d\x02\x00\x90d\x02\x00'
+    b'\xacd\x02\x00\xc2d\x02\x00\xd9d\x02\x00\xf1d\x02\x00\x07e\x02\x00$e\x02\x008e\x02\x00Fe\x02\x00ce\x02\x00se\x02\x00\x86e\x02\x00\xa4e\x02\x00\xbae\x02\x00\xd4e\x02\x00\xece\x02\x00\x08f\x02\x00\x1cf\x02\x00,f\x02\x00>f\x02\x00Nf\x02\x00jf\x02\x00\x93f\x02\x00\xadf\x02\x00\xbef\x02\x00'
+    b'\xdbf\x02\x00\xeaf\x02\x00\x05g\x02\x00\x15g\x02\x00Ag\x02\x00og\x02\x00\x89g\x02\x00\x91g\x02\x00\xafg\x02\x00\xceg\x02\x00\xedg\x02\x00\nh\x02\x00\x1dh\x02\x00<h\x02\x00Yh\x02\x00wh\x02\x00\x95h\x02\x00\xb2h\x02\x00\xd1h\x02\x00\xe7h\x02\x00\x07i\x02\x00&i\x02\x00Di\x02\x00ci\x02\x00'
+    b'\x89i\x02\x00\xadi\x02\x00\xcfi\x02\x00\xefi\x02\x00\x02j\x02\x00\x0fj\x02\x006j\x02\x00ej\x02\x00\x8cj\x02\x00\xbbj\x02\x00\xebj\x02\x00\x1bk\x02\x005k\x02\x00Nk\x02\x00ek\x02\x00{k\x02\x00\x9fk\x02\x00\xcbk\x02\x00\xe3k\x02\x00\xfdk\x02\x00\x19l\x02\x00<l\x02\x00Yl\x02\x00rl\x02\x00'
+    b'\x92l\x02\x00\xb8l\x02\x00\xcdl\x02\x00\xe1l\x02\x00\xfel\x02\x00\x1em\x02\x00Am\x02\x00fm\x02\x00\x7fm\x02\x00\x9cm\x02\x00\xb9m\x02\x00\xdam\x02\x00\xedm\x02\x00\x06n\x02\x00"n\x02\x00<n\x02\x00Vn\x02\x00nn\x02\x00\x8an\x02\x00\xa3n\x02\x00\xc1n\x02\x00\xcfn\x02\x00\xden\x02\x00\xffn\x02\x00'
+    b'\x16o\x02\x00(o\x02\x00Ro\x02\x00\x84o\x02\x00\xa6o\x02\x00\xc7o\x02\x00\xf9o\x02\x00+p\x02\x00Dp\x02\x00Xp\x02\x00up\x02\x00\x84p\x02\x00\x9dp\x02\x00\xc1p\x02\x00\xe4p\x02\x00\xfbp\x02\x00\x10q\x02\x009q\x02\x00Pq\x02\x00Wq\x02\x00`q\x02\x00uq\x02\x00\x8aq\x02\x00\xb1q\x02\x00'
+    b'\xc9q\x02\x00\xe1q\x02\x00\x02r\x02\x00\x1fr\x02\x00Ar\x02\x00fr\x02\x00sr\x02\x00\x88r\x02\x00\xadr\x02\x00\xc8r\x02\x00\xear\x02\x00\x0bs\x02\x00\x1fs\x02\x003s\x02\x00Qs\x02\x00is\x02\x00\x85s\x02\x00\xa3s\x02\x00\xbds\x02\x00\xd4s\x02\x00\xeas\x02\x00\x00t\x02\x00\x18t\x02\x002t\x02\x00'
+    b'Kt\x02\x00ct\x02\x00|t\x02\x00\x94t\x02\x00\xb5t\x02\x00\xd0t\x02\x00\xeat\x02\x00\xfft\x02\x00\x16u\x02\x000u\x02\x00Lu\x02\x00du\x02\x00\x80u\x02\x00\x9au\x02\x00\xbeu\x02\x00\xddu\x02\x00\xf6u\x02\x00\x12v\x02\x002v\x02\x00Jv\x02\x00bv\x02\x00\x81v\x02\x00\x9bv\x02\x00\xc0v\x02\x00'
+    b'\xe5v\x02\x00\xfav\x02\x00\x0fw\x02\x00$w\x02\x009w\x02\x00Nw\x02\x00\x7fw\x02\x00\x8ew\x02\x00\xb5w\x02\x00\xe9w\x02\x00\x07x\x02\x00,x\x02\x00Hx\x02\x00jx\x02\x00\x82x\x02\x00\x97x\x02\x00\xb9x\x02\x00\xd3x\x02\x00\xe1x\x02\x00\xfex\x02\x00\x0fy\x02\x00&y\x02\x004y\x02\x00My\x02\x00'
+    b'gy\x02\x00oy\x02\x00\x81y\x02\x00\x90y\x02\x00\xa0y\x02\x00\xaey\x02\x00\xc2y\x02\x00\xd7y\x02\x00\xeby\x02\x00\xf8y\x02\x00\x0fz\x02\x00$z\x02\x006z\x02\x00Iz\x02\x00[z\x02\x00\x84z\x02\x00\x9fz\x02\x00\xbaz\x02\x00\xd9z\x02\x00\xf5z\x02\x00\x11{\x02\x00-{\x02\x00H{\x02\x00k{\x02\x00'
+    b'\x8a{\x02\x00\xa7{\x02\x00\xc4{\x02\x00\xde{\x02\x00\xfa{\x02\x00\x1b|\x02\x00,|\x02\x00B|\x02\x00`|\x02\x00j|\x02\x00\x81|\x02\x00\xa1|\x02\x00\xb8|\x02\x00\xcd|\x02\x00\xe6|\x02\x00\xfc|\x02\x00\x17}\x02\x001}\x02\x00D}\x02\x00b}\x02\x00\x82}\x02\x00\x9b}\x02\x00\xbc}\x02\x00\xdd}\x02\x00'
+    b'\xe3}\x02\x00\xf3}\x02\x00\x12~\x02\x003~\x02\x00R~\x02\x00r~\x02\x00\x9a~\x02\x00\xb5~\x02\x00\xd4~\x02\x00\xf4~\x02\x00\x16\x7f\x02\x008\x7f\x02\x00N\x7f\x02\x00r\x7f\x02\x00\x9b\x7f\x02\x00\xbf\x7f\x02\x00\xe6\x7f\x02\x00\x08\x80\x02\x00/\x80\x02\x00F\x80\x02\x00h\x80\x02\x00\x88\x80\x02\x00\xad\x80\x02\x00\xcb\x80\x02\x00'
+    b'\xeb\x80\x02\x00\r\x81\x02\x002\x81\x02\x00V\x81\x02\x00{\x81\x02\x00\x8c\x81\x02\x00\xa1\x81\x02\x00\xbb\x81\x02\x00\xd3\x81\x02\x00\xeb\x81\x02\x00\xff\x81\x02\x00\x12\x82\x02\x00)\x82\x02\x00G\x82\x02\x00_\x82\x02\x00w\x82\x02\x00\x90\x82\x02\x00\xad\x82\x02\x00\xc7\x82\x02\x00\xde\x82\x02\x00\xf8\x82\x02\x00\x0f\x83\x02\x00%\x83\x02\x00B\x83\x02\x00'
+    b'S\x83\x02\x00}\x83\x02\x00\xa0\x83\x02\x00\xc5\x83\x02\x00\xd8\x83\x02\x00\x08\x84\x02\x00"\x84\x02\x00C\x84\x02\x00X\x84\x02\x00x\x84\x02\x00\x96\x84\x02\x00\xb3\x84\x02\x00\xbd\x84\x02\x00\xdb\x84\x02\x00\xf9\x84\x02\x00\x16\x85\x02\x007\x85\x02\x00G\x85\x02\x00`\x85\x02\x00x\x85\x02\x00\x9e\x85\x02\x00\xce\x85\x02\x00\x08\x86\x02\x00!\x86\x02\x00'
+    b'9\x86\x02\x00Y\x86\x02\x00v\x86\x02\x00\x84\x86\x02\x00\x95\x86\x02\x00\x9e\x86\x02\x00\xae\x86\x02\x00\xc0\x86\x02\x00\xcd\x86\x02\x00\xe8\x86\x02\x00\xfa\x86\x02\x00\x10\x87\x02\x00 \x87\x02\x006\x87\x02\x00[\x87\x02\x00j\x87\x02\x00\x83\x87\x02\x00\xa2\x87\x02\x00\xbc\x87\x02\x00\xdd\x87\x02\x00\x04\x88\x02\x00)\x88\x02\x00L\x88\x02\x00i\x88\x02\x00'
+    b'\x8a\x88\x02\x00\xa4\x88\x02\x00\xbf\x88\x02\x00\xe2\x88\x02\x00\xec\x88\x02\x00\x04\x89\x02\x00\x11\x89\x02\x00\x1e\x89\x02\x003\x89\x02\x00H\x89\x02\x00Y\x89\x02\x00k\x89\x02\x00\x82\x89\x02\x00\xa7\x89\x02\x00\xc9\x89\x02\x00\xeb\x89\x02\x00\n\x8a\x02\x00\x1b\x8a\x02\x00;\x8a\x02\x00M\x8a\x02\x00^\x8a\x02\x00n\x8a\x02\x00\x93\x8a\x02\x00\xbc\x8a\x02\x00'
+    b'\xd6\x8a\x02\x00\xe6\x8a\x02\x00\t\x8b\x02\x00\x1d\x8b\x02\x00<\x8b\x02\x00d\x8b\x02\x00\x8e\x8b\x02\x00\xa1\x8b\x02\x00\xb9\x8b\x02\x00\xda\x8b\x02\x00\xeb\x8b\x02\x00\xfd\x8b\x02\x00\x13\x8c\x02\x00+\x8c\x02\x00J\x8c\x02\x00X\x8c\x02\x00l\x8c\x02\x00\x89\x8c\x02\x00\xa3\x8c\x02\x00\xbd\x8c\x02\x00\xcc\x8c\x02\x00\xe8\x8c\x02\x00\xf8\x8c\x02\x00\n\x8d\x02\x00'
+    b'\x11\x8d\x02\x003\x8d\x02\x00N\x8d\x02\x00~\x8d\x02\x00\x94\x8d\x02\x00\xb5\x8d\x02\x00\xd8\x8d\x02\x00\xfb\x8d\x02\x00\x1e\x8e\x02\x000\x8e\x02\x00D\x8e\x02\x00^\x8e\x02\x00~\x8e\x02\x00\x8e\x8e\x02\x00\xa5\x8e\x02\x00\xb8\x8e\x02\x00\xd4\x8e\x02\x00\xf6\x8e\x02\x00\x08\x8f\x02\x00.\x8f\x02\x00K\x8f\x02\x00p\x8f\x02\x00\x95\x8f\x02\x00\xba\x8f\x02\x00'
+    b'\xdf\x8f\x02\x00\x04\x90\x02\x00$\x90\x02\x00F\x90\x02\x00Y\x90\x02\x00u\x90\x02\x00\x95\x90\x02\x00\xb4\x90\x02\x00\xd2\x90\x02\x00\xf0\x90\x02\x00\x08\x91\x02\x00*\x91\x02\x00@\x91\x02\x00R\x91\x02\x00e\x91\x02\x00\x81\x91\x02\x00\x94\x91\x02\x00\xb2\x91\x02\x00\xca\x91\x02\x00\xde\x91\x02\x00\xf1\x91\x02\x00\x0c\x92\x02\x00$\x92\x02\x00D\x92\x02\x00'
+    b'f\x92\x02\x00\x83\x92\x02\x00\x9e\x92\x02\x00\xb5\x92\x02\x00\xd4\x92\x02\x00\xf1\x92\x02\x00\x10\x93\x02\x002\x93\x02\x00R\x93\x02\x00t\x93\x02\x00\x92\x93\x02\x00\xb6\x93\x02\x00\xd5\x93\x02\x00\xef\x93\x02\x00\x17\x94\x02\x00/\x94\x02\x00N\x94\x02\x00h\x94\x02\x00\x8a\x94\x02\x00\xa7\x94\x02\x00\xd5\x94\x02\x00\xf5\x94\x02\x00\x13\x95\x02\x00<\x95\x02\x00'
+    b'W\x95\x02\x00\x97\x95\x02\x00\xba\x95\x02\x00\xdd\x95\x02\x00\x01\x96\x02\x00 \x96\x02\x00`\x96\x02\x00\x7f\x96\x02\x00\x9e\x96\x02\x00\xb3\x96\x02\x00\xd5\x96\x02\x00\x05\x97\x02\x00!\x97\x02\x00F\x97\x02\x00e\x97\x02\x00\x82\x97\x02\x00\xae\x97\x02\x00\xda\x97\x02\x00\xf4\x97\x02\x00\x1e\x98\x02\x00.\x98\x02\x00H\x98\x02\x00^\x98\x02\x00t\x98\x02\x00'
+    b'\x90\x98\x02\x00\xa9\x98\x02\x00\xc1\x98\x02\x00\xe1\x98\x02\x00\xf9\x98\x02\x00\r\x99\x02\x00\x1f\x99\x02\x002\x99\x02\x00T\x99\x02\x00x\x99\x02\x00\xa0\x99\x02\x00\xc2\x99\x02\x00\xe3\x99\x02\x00\x1a\x9a\x02\x007\x9a\x02\x00]\x9a\x02\x00y\x9a\x02\x00\x98\x9a\x02\x00\xb0\x9a\x02\x00\xc2\x9a\x02\x00\xed\x9a\x02\x00\x00\x9b\x02\x00)\x9b\x02\x00<\x9b\x02\x00'
+    b"a\x9b\x02\x00\x8a\x9b\x02\x00\xab\x9b\x02\x00\xc3\x9b\x02\x00\xd5\x9b\x02\x00\x00\x9c\x02\x00\x19\x9c\x02\x00'\x9c\x02\x00O\x9c\x02\x00p\x9c\x02\x00\x8b\x9c\x02\x00\xb1\x9c\x02\x00\xd4\x9c\x02\x00\xe2\x9c\x02\x00\x04\x9d\x02\x00 \x9d\x02\x008\x9d\x02\x00W\x9d\x02\x00\x80\x9d\x02\x00\x96\x9d\x02\x00\xa8\x9d\x02\x00\xbb\x9d\x02\x00\xd5\x9d\x02\x00\xfc\x9d\x02\x00"
+    b'\x1a\x9e\x02\x009\x9e\x02\x00W\x9e\x02\x00t\x9e\x02\x00\x9f\x9e\x02\x00\xc9\x9e\x02\x00\xf0\x9e\x02\x00\x02\x9f\x02\x00\x1a\x9f\x02\x001\x9f\x02\x00G\x9f\x02\x00`\x9f\x02\x00v\x9f\x02\x00\x89\x9f\x02\x00\xac\x9f\x02\x00\xd0\x9f\x02\x00\x00\xa0\x02\x00\x12\xa0\x02\x002\xa0\x02\x00Z\xa0\x02\x00|\xa0\x02\x00\x9b\xa0\x02\x00\xb5\xa0\x02\x00\xc4\xa0\x02\x00'
+    b'\xdf\xa0\x02\x00\x04\xa1\x02\x00\x1f\xa1\x02\x00Q\xa1\x02\x00j\xa1\x02\x00\x8b\xa1\x02\x00\xa6\xa1\x02\x00\xc1\xa1\x02\x00\xe8\xa1\x02\x00\x04\xa2\x02\x00\x13\xa2\x02\x003\xa2\x02\x00h\xa2\x02\x00\x9a\xa2\x02\x00\xcc\xa2\x02\x00\x01\xa3\x02\x003\xa3\x02\x00Y\xa3\x02\x00l\xa3\x02\x00\x95\xa3\x02\x00\xc1\xa3\x02\x00\xec\xa3\x02\x00\x08\xa4\x02\x00\x1e\xa4\x02\x00'
+    b';\xa4\x02\x00U\xa4\x02\x00s\xa4\x02\x00\x8f\xa4\x02\x00\xa9\xa4\x02\x00\xc7\xa4\x02\x00\xe8\xa4\x02\x00\x07\xa5\x02\x00+\xa5\x02\x00I\xa5\x02\x00_\xa5\x02\x00t\xa5\x02\x00\x96\xa5\x02\x00\xb1\xa5\x02\x00\xd1\xa5\x02\x00\xf5\xa5\x02\x00\x18\xa6\x02\x00A\xa6\x02\x00e\xa6\x02\x00\x85\xa6\x02\x00\xa0\xa6\x02\x00\xb0\xa6\x02\x00\xc8\xa6\x02\x00\xe8\xa6\x02\x00'
+    b'\x04\xa7\x02\x00+\xa7\x02\x00E\xa7\x02\x00_\xa7\x02\x00}\xa7\x02\x00\xa0\xa7\x02\x00\xbb\xa7\x02\x00\xd7\xa7\x02\x00\xf0\xa7\x02\x00&\xa8\x02\x00;\xa8\x02\x00Q\xa8\x02\x00u\xa8\x02\x00\x98\xa8\x02\x00\xb8\xa8\x02\x00\xe0\xa8\x02\x00\xfa\xa8\x02\x00\x13\xa9\x02\x004\xa9\x02\x00J\xa9\x02\x00n\xa9\x02\x00\x91\xa9\x02\x00\xb3\xa9\x02\x00\xdb\xa9\x02\x00'
+    b'\xf9\xa9\x02\x00\x0f\xaa\x02\x00"\xaa\x02\x009\xaa\x02\x00T\xaa\x02\x00`\xaa\x02\x00|\xaa\x02\x00\xa5\xaa\x02\x00\xbe\xaa\x02\x00\xd4\xaa\x02\x00\xea\xaa\x02\x00\xfd\xaa\x02\x00"\xab\x02\x00L\xab\x02\x00g\xab\x02\x00\x86\xab\x02\x00\xa6\xab\x02\x00\xb9\xab\x02\x00\xe1\xab\x02\x00\xf5\xab\x02\x00\x07\xac\x02\x00\x19\xac\x02\x00/\xac\x02\x00d\xac\x02\x00'
+    b'\x82\xac\x02\x00\xaa\xac\x02\x00\xb3\xac\x02\x00\xbb\xac\x02\x00\xcf\xac\x02\x00\xe0\xac\x02\x00\xfb\xac\x02\x00\x1d\xad\x02\x004\xad\x02\x00R\xad\x02\x00l\xad\x02\x00\x92\xad\x02\x00\xb9\xad\x02\x00\xe1\xad\x02\x00\xf1\xad\x02\x00\x15\xae\x02\x00:\xae\x02\x00Y\xae\x02\x00r\xae\x02\x00\x81\xae\x02\x00\x9c\xae\x02\x00\xba\xae\x02\x00\xdb\xae\x02\x00\xf0\xae\x02\x00'
+    b"\x0f\xaf\x02\x00'\xaf\x02\x00^\xaf\x02\x00\x97\xaf\x02\x00\xbe\xaf\x02\x00\xd8\xaf\x02\x00\xed\xaf\x02\x00\x11\xb0\x02\x004\xb0\x02\x00H\xb0\x02\x00f\xb0\x02\x00~\xb0\x02\x00\x91\xb0\x02\x00\xb0\xb0\x02\x00\xc4\xb0\x02\x00\xe4\xb0\x02\x00\xf9\xb0\x02\x00\x1a\xb1\x02\x00 \xb1\x02\x00I\xb1\x02\x00]\xb1\x02\x00\x86\xb1\x02\x00\xb6\xb1\x02\x00\xdc\xb1\x02\x00"
+    b'\xf9\xb1\x02\x00\x12\xb2\x02\x00D\xb2\x02\x00g\xb2\x02\x00\x89\xb2\x02\x00\xa1\xb2\x02\x00\xbd\xb2\x02\x00\xdd\xb2\x02\x00\x01\xb3\x02\x00\x1c\xb3\x02\x00G\xb3\x02\x00d\xb3\x02\x00\x7f\xb3\x02\x00\x95\xb3\x02\x00\xb6\xb3\x02\x00\xe3\xb3\x02\x00\x07\xb4\x02\x00+\xb4\x02\x00K\xb4\x02\x00_\xb4\x02\x00w\xb4\x02\x00\xa0\xb4\x02\x00\xc1\xb4\x02\x00\xe8\xb4\x02\x00'
+    b'\x06\xb5\x02\x00!\xb5\x02\x00?\xb5\x02\x00`\xb5\x02\x00t\xb5\x02\x00\x8f\xb5\x02\x00\xa6\xb5\x02\x00\xc8\xb5\x02\x00\xfc\xb5\x02\x00\x15\xb6\x02\x00;\xb6\x02\x00V\xb6\x02\x00|\xb6\x02\x00\x99\xb6\x02\x00\xb7\xb6\x02\x00\xe6\xb6\x02\x00\x07\xb7\x02\x00\x1a\xb7\x02\x00G\xb7\x02\x00]\xb7\x02\x00x\xb7\x02\x00\x94\xb7\x02\x00\xa8\xb7\x02\x00\xba\xb7\x02\x00'
+    b'\xe0\xb7\x02\x00\xfa\xb7\x02\x00\x1f\xb8\x02\x002\xb8\x02\x00f\xb8\x02\x00\x90\xb8\x02\x00\xa4\xb8\x02\x00\xcb\xb8\x02\x00\xd3\xb8\x02\x00\xf3\xb8\x02\x00\x0b\xb9\x02\x00*\xb9\x02\x00P\xb9\x02\x00g\xb9\x02\x00{\xb9\x02\x00\x9f\xb9\x02\x00\xb5\xb9\x02\x00\xda\xb9\x02\x00\xfe\xb9\x02\x00\x1a\xba\x02\x00)\xba\x02\x00H\xba\x02\x00_\xba\x02\x00u\xba\x02\x00'
+    b'\x92\xba\x02\x00\xad\xba\x02\x00\xd6\xba\x02\x00\xf5\xba\x02\x00\x1a\xbb\x02\x00;\xbb\x02\x00t\xbb\x02\x00\x98\xbb\x02\x00\xb9\xbb\x02\x00\xdb\xbb\x02\x00\xe7\xbb\x02\x00\x04\xbc\x02\x00\x13\xbc\x02\x003\xbc\x02\x00X\xbc\x02\x00\x81\xbc\x02\x00\x9a\xbc\x02\x00\xb5\xbc\x02\x00\xd7\xbc\x02\x00\xf8\xbc\x02\x00\x1b\xbd\x02\x00;\xbd\x02\x00X\xbd\x02\x00a\xbd\x02\x00'
+    b'\x7f\xbd\x02\x00\xa3\xbd\x02\x00\xbd\xbd\x02\x00\xcd\xbd\x02\x00\xdd\xbd\x02\x00\xed\xbd\x02\x00\x06\xbe\x02\x00\x1f\xbe\x02\x008\xbe\x02\x00Q\xbe\x02\x00y\xbe\x02\x00\x9c\xbe\x02\x00\xb9\xbe\x02\x00\xd0\xbe\x02\x00\xed\xbe\x02\x00\x10\xbf\x02\x00"\xbf\x02\x00>\xbf\x02\x00d\xbf\x02\x00\x84\xbf\x02\x00\x9c\xbf\x02\x00\xb7\xbf\x02\x00\xcf\xbf\x02\x00\xed\xbf\x02\x00'
+    b'\x0f\xc0\x02\x00+\xc0\x02\x00Q\xc0\x02\x00i\xc0\x02\x00\x83\xc0\x02\x00\x9e\xc0\x02\x00\xaa\xc0\x02\x00\xb6\xc0\x02\x00\xde\xc0\x02\x00\xf3\xc0\x02\x00\x01\xc1\x02\x00\x1c\xc1\x02\x001\xc1\x02\x00A\xc1\x02\x00s\xc1\x02\x00\x99\xc1\x02\x00\xaf\xc1\x02\x00\xc8\xc1\x02\x00\xf2\xc1\x02\x00\x05\xc2\x02\x00 \xc2\x02\x00=\xc2\x02\x00T\xc2\x02\x00o\xc2\x02\x00'
+    b"\x86\xc2\x02\x00\xaa\xc2\x02\x00\xd1\xc2\x02\x00\xf2\xc2\x02\x00\x0f\xc3\x02\x00'\xc3\x02\x00>\xc3\x02\x00W\xc3\x02\x00n\xc3\x02\x00\x8b\xc3\x02\x00\xa2\xc3\x02\x00\xbf\xc3\x02\x00\xd5\xc3\x02\x00\xf3\xc3\x02\x00\x0f\xc4\x02\x00*\xc4\x02\x00A\xc4\x02\x00[\xc4\x02\x00x\xc4\x02\x00\x98\xc4\x02\x00\xb5\xc4\x02\x00\xd1\xc4\x02\x00\xec\xc4\x02\x00\n\xc5\x02\x00"
+    b"$\xc5\x02\x00D\xc5\x02\x00c\xc5\x02\x00\x82\xc5\x02\x00\x9b\xc5\x02\x00\xbe\xc5\x02\x00\xe1\xc5\x02\x00\x04\xc6\x02\x00\x1d\xc6\x02\x008\xc6\x02\x00V\xc6\x02\x00x\xc6\x02\x00\x95\xc6\x02\x00\xb2\xc6\x02\x00\xc9\xc6\x02\x00\xea\xc6\x02\x00\x06\xc7\x02\x00'\xc7\x02\x00B\xc7\x02\x00[\xc7\x02\x00{\xc7\x02\x00\x97\xc7\x02\x00\xae\xc7\x02\x00\xc7\xc7\x02\x00"
+    b'\xe2\xc7\x02\x00\xfa\xc7\x02\x00\x12\xc8\x02\x00*\xc8\x02\x00G\xc8\x02\x00f\xc8\x02\x00}\xc8\x02\x00\x94\xc8\x02\x00\xac\xc8\x02\x00\xc5\xc8\x02\x00\xdc\xc8\x02\x00\xf3\xc8\x02\x00\n\xc9\x02\x00"\xc9\x02\x00<\xc9\x02\x00Q\xc9\x02\x00m\xc9\x02\x00\x87\xc9\x02\x00\x9e\xc9\x02\x00\xbc\xc9\x02\x00\xe1\xc9\x02\x00\xf7\xc9\x02\x00\x0f\xca\x02\x00\'\xca\x02\x00'
+    b'=\xca\x02\x00O\xca\x02\x00`\xca\x02\x00n\xca\x02\x00\x85\xca\x02\x00\xaa\xca\x02\x00\xcc\xca\x02\x00\xe1\xca\x02\x00\x03\xcb\x02\x00&\xcb\x02\x00<\xcb\x02\x00N\xcb\x02\x00r\xcb\x02\x00\x96\xcb\x02\x00\xb2\xcb\x02\x00\xca\xcb\x02\x00\xeb\xcb\x02\x00\x13\xcc\x02\x007\xcc\x02\x00r\xcc\x02\x00\xad\xcc\x02\x00\xbd\xcc\x02\x00\xda\xcc\x02\x00\xf7\xcc\x02\x00'
+    b'\x1b\xcd\x02\x00>\xcd\x02\x00W\xcd\x02\x00~\xcd\x02\x00\x8c\xcd\x02\x00\xa0\xcd\x02\x00\xb1\xcd\x02\x00\xc7\xcd\x02\x00\xe6\xcd\x02\x00\t\xce\x02\x000\xce\x02\x00W\xce\x02\x00~\xce\x02\x00\x9d\xce\x02\x00\xc2\xce\x02\x00\xe7\xce\x02\x00\x0c\xcf\x02\x003\xcf\x02\x00Z\xcf\x02\x00s\xcf\x02\x00\x8c\xcf\x02\x00\xa5\xcf\x02\x00\xc5\xcf\x02\x00\xe5\xcf\x02\x00'
+    b'\n\xd0\x02\x00/\xd0\x02\x00V\xd0\x02\x00}\xd0\x02\x00\xa4\xd0\x02\x00\xcb\xd0\x02\x00\xf2\xd0\x02\x00\x17\xd1\x02\x00<\xd1\x02\x00a\xd1\x02\x00\x86\xd1\x02\x00\xab\xd1\x02\x00\xca\xd1\x02\x00\xec\xd1\x02\x00\x0c\xd2\x02\x00,\xd2\x02\x00N\xd2\x02\x00w\xd2\x02\x00\x9b\xd2\x02\x00\xb1\xd2\x02\x00\xd3\xd2\x02\x00\xfe\xd2\x02\x00"\xd3\x02\x00L\xd3\x02\x00'
+    b'^\xd3\x02\x00{\xd3\x02\x00\xa2\xd3\x02\x00\xbf\xd3\x02\x00\xe3\xd3\x02\x00\xf9\xd3\x02\x00\x1a\xd4\x02\x00B\xd4\x02\x00k\xd4\x02\x00\x94\xd4\x02\x00\xbe\xd4\x02\x00\xe7\xd4\x02\x00\x10\xd5\x02\x00.\xd5\x02\x00N\xd5\x02\x00n\xd5\x02\x00\x8e\xd5\x02\x00\xae\xd5\x02\x00\xce\xd5\x02\x00\xe2\xd5\x02\x00\x04\xd6\x02\x00$\xd6\x02\x00Q\xd6\x02\x00~\xd6\x02\x00'
+    b'\xa2\xd6\x02\x00\xc8\xd6\x02\x00\xec\xd6\x02\x00\x10\xd7\x02\x004\xd7\x02\x00\\\xd7\x02\x00\x87\xd7\x02\x00\xb4\xd7\x02\x00\xdf\xd7\x02\x00\n\xd8\x02\x005\xd8\x02\x00Y\xd8\x02\x00~\xd8\x02\x00\xa2\xd8\x02\x00\xcc\xd8\x02\x00\xf3\xd8\x02\x00\x15\xd9\x02\x00>\xd9\x02\x00_\xd9\x02\x00\x82\xd9\x02\x00\x99\xd9\x02\x00\xc1\xd9\x02\x00\xdd\xd9\x02\x00\x06\xda\x02\x00'
+    b'/\xda\x02\x00G\xda\x02\x00h\xda\x02\x00\x81\xda\x02\x00\x97\xda\x02\x00\xb3\xda\x02\x00\xd7\xda\x02\x00\xfa\xda\x02\x00%\xdb\x02\x00M\xdb\x02\x00e\xdb\x02\x00z\xdb\x02\x00\xa3\xdb\x02\x00\xcc\xdb\x02\x00\xf5\xdb\x02\x00\x1e\xdc\x02\x00G\xdc\x02\x00p\xdc\x02\x00\x8b\xdc\x02\x00\xa8\xdc\x02\x00\xc6\xdc\x02\x00\xe0\xdc\x02\x00\xfb\xdc\x02\x00\x19\xdd\x02\x00'
+    b'4\xdd\x02\x00P\xdd\x02\x00f\xdd\x02\x00\x7f\xdd\x02\x00\x98\xdd\x02\x00\xb2\xdd\x02\x00\xc7\xdd\x02\x00\xe9\xdd\x02\x00\x04\xde\x02\x00%\xde\x02\x005\xde\x02\x00P\xde\x02\x00y\xde\x02\x00\xa5\xde\x02\x00\xc3\xde\x02\x00\xe2\xde\x02\x00\x03\xdf\x02\x00!\xdf\x02\x00;\xdf\x02\x00T\xdf\x02\x00m\xdf\x02\x00\x84\xdf\x02\x00\x9b\xdf\x02\x00\xc3\xdf\x02\x00'
+    b'\xea\xdf\x02\x00\x07\xe0\x02\x00#\xe0\x02\x00A\xe0\x02\x00W\xe0\x02\x00n\xe0\x02\x00\x87\xe0\x02\x00\x9f\xe0\x02\x00\xb5\xe0\x02\x00\xcb\xe0\x02\x00\xe7\xe0\x02\x00\xfb\xe0\x02\x00\x11\xe1\x02\x006\xe1\x02\x00Q\xe1\x02\x00f\xe1\x02\x00\x80\xe1\x02\x00\x9a\xe1\x02\x00\xbf\xe1\x02\x00\xda\xe1\x02\x00\xf7\xe1\x02\x00\x10\xe2\x02\x00*\xe2\x02\x00K\xe2\x02\x00'
+    b'p\xe2\x02\x00\x92\xe2\x02\x00\xb4\xe2\x02\x00\xcd\xe2\x02\x00\xe8\xe2\x02\x00\x05\xe3\x02\x00#\xe3\x02\x00?\xe3\x02\x00]\xe3\x02\x00x\xe3\x02\x00\x92\xe3\x02\x00\xab\xe3\x02\x00\xcc\xe3\x02\x00\xeb\xe3\x02\x00\x0b\xe4\x02\x00.\xe4\x02\x00Q\xe4\x02\x00l\xe4\x02\x00\x87\xe4\x02\x00\xa3\xe4\x02\x00\xc0\xe4\x02\x00\xda\xe4\x02\x00\xf3\xe4\x02\x00\x17\xe5\x02\x00'
+    b"@\xe5\x02\x00j\xe5\x02\x00\x92\xe5\x02\x00\xaf\xe5\x02\x00\xd1\xe5\x02\x00\xef\xe5\x02\x00\x0f\xe6\x02\x00;\xe6\x02\x00f\xe6\x02\x00\x90\xe6\x02\x00\xbf\xe6\x02\x00\xd8\xe6\x02\x00\xec\xe6\x02\x00\x0e\xe7\x02\x00 \xe7\x02\x00@\xe7\x02\x00d\xe7\x02\x00\x88\xe7\x02\x00\xac\xe7\x02\x00\xd5\xe7\x02\x00\xfe\xe7\x02\x00'\xe8\x02\x00E\xe8\x02\x00r\xe8\x02\x00"
+    b'\x84\xe8\x02\x00\x9e\xe8\x02\x00\xc8\xe8\x02\x00\xf2\xe8\x02\x00\x1b\xe9\x02\x00H\xe9\x02\x00m\xe9\x02\x00\x98\xe9\x02\x00\xc3\xe9\x02\x00\xf3\xe9\x02\x00\x1c\xea\x02\x00F\xea\x02\x00s\xea\x02\x00\x9a\xea\x02\x00\xc9\xea\x02\x00\xf1\xea\x02\x00\x1d\xeb\x02\x00H\xeb\x02\x00W\xeb\x02\x00y\xeb\x02\x00\x90\xeb\x02\x00\xac\xeb\x02\x00\xc3\xeb\x02\x00\xdb\xeb\x02\x00'
+    b'\xf5\xeb\x02\x00\x0c\xec\x02\x00\x1a\xec\x02\x002\xec\x02\x00F\xec\x02\x00_\xec\x02\x00}\xec\x02\x00\x9a\xec\x02\x00\xb7\xec\x02\x00\xd5\xec\x02\x00\xec\xec\x02\x00\x15\xed\x02\x002\xed\x02\x00W\xed\x02\x00t\xed\x02\x00\x90\xed\x02\x00\xa8\xed\x02\x00\xd2\xed\x02\x00\xf6\xed\x02\x00!\xee\x02\x00@\xee\x02\x00j\xee\x02\x00\x91\xee\x02\x00\xb8\xee\x02\x00'
+    b"\xca\xee\x02\x00\xeb\xee\x02\x00\x08\xef\x02\x00'\xef\x02\x00@\xef\x02\x00d\xef\x02\x00\x84\xef\x02\x00\x9d\xef\x02\x00\xb6\xef\x02\x00\xd5\xef\x02\x00\xf4\xef\x02\x00\x13\xf0\x02\x000\xf0\x02\x00N\xf0\x02\x00l\xf0\x02\x00\x8c\xf0\x02\x00\xa8\xf0\x02\x00\xc7\xf0\x02\x00\xe9\xf0\x02\x00\r\xf1\x02\x00+\xf1\x02\x00I\xf1\x02\x00g\xf1\x02\x00\x89\xf1\x02\x00"
+    b'\xa0\xf1\x02\x00\xb7\xf1\x02\x00\xd4\xf1\x02\x00\xf4\xf1\x02\x00\x11\xf2\x02\x001\xf2\x02\x00P\xf2\x02\x00n\xf2\x02\x00\x85\xf2\x02\x00\xaf\xf2\x02\x00\xe0\xf2\x02\x00\x03\xf3\x02\x00\x1c\xf3\x02\x00=\xf3\x02\x00Z\xf3\x02\x00{\xf3\x02\x00\x95\xf3\x02\x00\xae\xf3\x02\x00\xbd\xf3\x02\x00\xe2\xf3\x02\x00\xf5\xf3\x02\x00\x07\xf4\x02\x00!\xf4\x02\x00:\xf4\x02\x00'
+    b'Y\xf4\x02\x00z\xf4\x02\x00\x99\xf4\x02\x00\xbd\xf4\x02\x00\xd9\xf4\x02\x00\xf4\xf4\x02\x00\t\xf5\x02\x003\xf5\x02\x00E\xf5\x02\x00h\xf5\x02\x00\x8c\xf5\x02\x00\xa3\xf5\x02\x00\xcd\xf5\x02\x00\xdf\xf5\x02\x00\x04\xf6\x02\x00)\xf6\x02\x00L\xf6\x02\x00d\xf6\x02\x00}\xf6\x02\x00\x95\xf6\x02\x00\xae\xf6\x02\x00\xc6\xf6\x02\x00\xdf\xf6\x02\x00\xf6\xf6\x02\x00'
+    b'\x08\xf7\x02\x00 \xf7\x02\x009\xf7\x02\x00g\xf7\x02\x00\x81\xf7\x02\x00\x9a\xf7\x02\x00\xb9\xf7\x02\x00\xe0\xf7\x02\x00\x04\xf8\x02\x00$\xf8\x02\x00L\xf8\x02\x00i\xf8\x02\x00\x81\xf8\x02\x00\xa1\xf8\x02\x00\xca\xf8\x02\x00\xea\xf8\x02\x00\t\xf9\x02\x00(\xf9\x02\x00=\xf9\x02\x00X\xf9\x02\x00{\xf9\x02\x00\x92\xf9\x02\x00\xa7\xf9\x02\x00\xca\xf9\x02\x00'
+    b"\xda\xf9\x02\x00\xf2\xf9\x02\x00\x12\xfa\x02\x00)\xfa\x02\x00R\xfa\x02\x00o\xfa\x02\x00\x95\xfa\x02\x00\xbf\xfa\x02\x00\xe7\xfa\x02\x00\r\xfb\x02\x00*\xfb\x02\x00D\xfb\x02\x00`\xfb\x02\x00~\xfb\x02\x00\x99\xfb\x02\x00\xb4\xfb\x02\x00\xcd\xfb\x02\x00\xdf\xfb\x02\x00\x00\xfc\x02\x00'\xfc\x02\x00Q\xfc\x02\x00w\xfc\x02\x00\xad\xfc\x02\x00\xd3\xfc\x02\x00"
+    b'\xfa\xfc\x02\x00"\xfd\x02\x00W\xfd\x02\x00}\xfd\x02\x00\xb4\xfd\x02\x00\xdd\xfd\x02\x00\r\xfe\x02\x003\xfe\x02\x00Y\xfe\x02\x00\x8a\xfe\x02\x00\xa9\xfe\x02\x00\xcb\xfe\x02\x00\xf8\xfe\x02\x00\x0c\xff\x02\x00\'\xff\x02\x00;\xff\x02\x00f\xff\x02\x00\x81\xff\x02\x00\xa0\xff\x02\x00\xc8\xff\x02\x00\xf1\xff\x02\x00\x18\x00\x03\x00+\x00\x03\x00F\x00\x03\x00'
+    b'g\x00\x03\x00\x8a\x00\x03\x00\xae\x00\x03\x00\xce\x00\x03\x00\xf7\x00\x03\x00\x18\x01\x03\x003\x01\x03\x00C\x01\x03\x00\\\x01\x03\x00\x82\x01\x03\x00\xab\x01\x03\x00\xc4\x01\x03\x00\xe4\x01\x03\x00\xfd\x01\x03\x00(\x02\x03\x00E\x02\x03\x00^\x02\x03\x00\x80\x02\x03\x00\xa2\x02\x03\x00\xc0\x02\x03\x00\xd1\x02\x03\x00\xeb\x02\x03\x00\xff\x02\x03\x00 \x03\x03\x00'
+    b'?\x03\x03\x00m\x03\x03\x00\x9e\x03\x03\x00\xae\x03\x03\x00\xd6\x03\x03\x00\xf0\x03\x03\x00\r\x04\x03\x003\x04\x03\x00Q\x04\x03\x00r\x04\x03\x00\x98\x04\x03\x00\xb9\x04\x03\x00\xdb\x04\x03\x00\xfc\x04\x03\x00\x14\x05\x03\x003\x05\x03\x00K\x05\x03\x00d\x05\x03\x00}\x05\x03\x00\x97\x05\x03\x00\xb3\x05\x03\x00\xc9\x05\x03\x00\xe1\x05\x03\x00\xf8\x05\x03\x00'
+    b'\x0f\x06\x03\x00.\x06\x03\x00O\x06\x03\x00d\x06\x03\x00\x7f\x06\x03\x00\x9d\x06\x03\x00\xb5\x06\x03\x00\xcb\x06\x03\x00\xe0\x06\x03\x00\xf6\x06\x03\x00\r\x07\x03\x00(\x07\x03\x00A\x07\x03\x00X\x07\x03\x00{\x07\x03\x00\x9e\x07\x03\x00\xc4\x07\x03\x00\xdd\x07\x03\x00\x04\x08\x03\x00\x1a\x08\x03\x001\x08\x03\x00Q\x08\x03\x00r\x08\x03\x00\x8a\x08\x03\x00'
+    b"\xa5\x08\x03\x00\xbf\x08\x03\x00\xd7\x08\x03\x00\xee\x08\x03\x00\t\t\x03\x00!\t\x03\x00=\t\x03\x00\\\t\x03\x00z\t\x03\x00\x99\t\x03\x00\xb1\t\x03\x00\xd1\t\x03\x00\xeb\t\x03\x00\x04\n\x03\x00 \n\x03\x00N\n\x03\x00~\n\x03\x00\x9f\n\x03\x00\xb0\n\x03\x00\xd8\n\x03\x00\xf5\n\x03\x00\x0b\x0b\x03\x00'\x0b\x03\x00>\x0b\x03\x00"
+    b'[\x0b\x03\x00w\x0b\x03\x00\x93\x0b\x03\x00\xb0\x0b\x03\x00\xcc\x0b\x03\x00\xe5\x0b\x03\x00\xfb\x0b\x03\x00\x16\x0c\x03\x002\x0c\x03\x00O\x0c\x03\x00f\x0c\x03\x00\x83\x0c\x03\x00\x9a\x0c\x03\x00\xb3\x0c\x03\x00\xd3\x0c\x03\x00\xef\x0c\x03\x00%\r\x03\x00:\r\x03\x00\\\r\x03\x00~\r\x03\x00\x99\r\x03\x00\xb9\r\x03\x00\xe6\r\x03\x00\x00\x0e\x03\x00'
+    b' \x0e\x03\x00B\x0e\x03\x00`\x0e\x03\x00\x80\x0e\x03\x00\xa8\x0e\x03\x00\xc3\x0e\x03\x00\xe9\x0e\x03\x00\x10\x0f\x03\x00:\x0f\x03\x00i\x0f\x03\x00\x8f\x0f\x03\x00\xb9\x0f\x03\x00\xd8\x0f\x03\x00\xfa\x0f\x03\x00\x19\x10\x03\x002\x10\x03\x00I\x10\x03\x00k\x10\x03\x00\x8c\x10\x03\x00\xb2\x10\x03\x00\xd5\x10\x03\x00\xfa\x10\x03\x00\x1c\x11\x03\x004\x11\x03\x00'
+    b'P\x11\x03\x00f\x11\x03\x00\x84\x11\x03\x00\xa2\x11\x03\x00\xbc\x11\x03\x00\xe5\x11\x03\x00\xfd\x11\x03\x00\x1b\x12\x03\x00=\x12\x03\x00a\x12\x03\x00\x84\x12\x03\x00\xa0\x12\x03\x00\xbe\x12\x03\x00\xdf\x12\x03\x00\x03\x13\x03\x00"\x13\x03\x00B\x13\x03\x00e\x13\x03\x00~\x13\x03\x00\xa6\x13\x03\x00\xc6\x13\x03\x00\xe3\x13\x03\x00\xfc\x13\x03\x00\x1d\x14\x03\x00'
+    b'<\x14\x03\x00P\x14\x03\x00u\x14\x03\x00\x92\x14\x03\x00\x9e\x14\x03\x00\xc0\x14\x03\x00\xde\x14\x03\x00\x06\x15\x03\x00"\x15\x03\x00E\x15\x03\x00a\x15\x03\x00\x81\x15\x03\x00\x9d\x15\x03\x00\xb6\x15\x03\x00\xd6\x15\x03\x00\xfa\x15\x03\x00\x1e\x16\x03\x006\x16\x03\x00U\x16\x03\x00l\x16\x03\x00}\x16\x03\x00\x96\x16\x03\x00\xbf\x16\x03\x00\xda\x16\x03\x00'
+    b'\xf5\x16\x03\x00\x0c\x17\x03\x00*\x17\x03\x00H\x17\x03\x00k\x17\x03\x00\x86\x17\x03\x00\xa4\x17\x03\x00\xc2\x17\x03\x00\xe6\x17\x03\x00\n\x18\x03\x00*\x18\x03\x00K\x18\x03\x00o\x18\x03\x00\x94\x18\x03\x00\xb9\x18\x03\x00\xdd\x18\x03\x00\x02\x19\x03\x00&\x19\x03\x00@\x19\x03\x00b\x19\x03\x00|\x19\x03\x00\xa1\x19\x03\x00\xc0\x19\x03\x00\xe1\x19\x03\x00'
+    b'\x04\x1a\x03\x00\x18\x1a\x03\x00-\x1a\x03\x00I\x1a\x03\x00_\x1a\x03\x00s\x1a\x03\x00\x97\x1a\x03\x00\xbf\x1a\x03\x00\xd8\x1a\x03\x00\xf0\x1a\x03\x00\r\x1b\x03\x00=\x1b\x03\x00`\x1b\x03\x00\x8d\x1b\x03\x00\xb4\x1b\x03\x00\xda\x1b\x03\x00\xff\x1b\x03\x008\x1c\x03\x00\\\x1c\x03\x00\x83\x1c\x03\x00\x9a\x1c\x03\x00\xb6\x1c\x03\x00\xd0\x1c\x03\x00\xe6\x1c\x03\x00'
+    b"\xfb\x1c\x03\x00\x12\x1d\x03\x00'\x1d\x03\x005\x1d\x03\x00Q\x1d\x03\x00o\x1d\x03\x00\x84\x1d\x03\x00\xb0\x1d\x03\x00\xc5\x1d\x03\x00\xe0\x1d\x03\x00\xfe\x1d\x03\x00\x1a\x1e\x03\x009\x1e\x03\x00P\x1e\x03\x00h\x1e\x03\x00z\x1e\x03\x00\x8d\x1e\x03\x00\xab\x1e\x03\x00\xc4\x1e\x03\x00\xdd\x1e\x03\x00\xfb\x1e\x03\x00\x19\x1f\x03\x001\x1f\x03\x00A\x1f\x03\x00"
+    b'S\x1f\x03\x00p\x1f\x03\x00\x92\x1f\x03\x00\xb2\x1f\x03\x00\xd9\x1f\x03\x00\x04 \x03\x00& \x03\x00E \x03\x00a \x03\x00| \x03\x00\x97 \x03\x00\xb3 \x03\x00\xcd \x03\x00\xe8 \x03\x00\n!\x03\x00.!\x03\x00K!\x03\x00f!\x03\x00\x8b!\x03\x00\xb2!\x03\x00\xc5!\x03\x00\xec!\x03\x00\x0b"\x03\x00 "\x03\x00'
+    b'?"\x03\x00m"\x03\x00\x8c"\x03\x00\xb4"\x03\x00\xcf"\x03\x00\xf3"\x03\x00\x07#\x03\x00\x1c#\x03\x005#\x03\x00\\#\x03\x00v#\x03\x00\x90#\x03\x00\xa2#\x03\x00\xb8#\x03\x00\xcd#\x03\x00\xe3#\x03\x00\xf9#\x03\x00\x0f$\x03\x00($\x03\x00@$\x03\x00\\$\x03\x00\x7f$\x03\x00\x93$\x03\x00\xae$\x03\x00'
+    b"\xc7$\x03\x00\xe1$\x03\x00\xf6$\x03\x00\x10%\x03\x00/%\x03\x00M%\x03\x00k%\x03\x00\x8d%\x03\x00\xa6%\x03\x00\xc1%\x03\x00\xe2%\x03\x00\x02&\x03\x00\x0b&\x03\x00!&\x03\x00@&\x03\x00]&\x03\x00z&\x03\x00\x9a&\x03\x00\xb4&\x03\x00\xe6&\x03\x00\x17'\x03\x00&'\x03\x00C'\x03\x00_'\x03\x00"
+    b"u'\x03\x00\x9a'\x03\x00\xb6'\x03\x00\xdc'\x03\x00\x08(\x03\x00\x19(\x03\x00/(\x03\x00O(\x03\x00k(\x03\x00\x80(\x03\x00\x9f(\x03\x00\xc3(\x03\x00\xd8(\x03\x00\x03)\x03\x00\x15)\x03\x00=)\x03\x00a)\x03\x00v)\x03\x00\x94)\x03\x00\xb1)\x03\x00\xc8)\x03\x00\xf2)\x03\x00\x1b*\x03\x00:*\x03\x00"
+    b'^*\x03\x00y*\x03\x00\x8b*\x03\x00\xa7*\x03\x00\xc9*\x03\x00\xe8*\x03\x00\x05+\x03\x00\x1f+\x03\x00:+\x03\x00R+\x03\x00v+\x03\x00\x94+\x03\x00\xa4+\x03\x00\xb6+\x03\x00\xd1+\x03\x00\xef+\x03\x00\x07,\x03\x00",\x03\x00>,\x03\x00X,\x03\x00u,\x03\x00\x8f,\x03\x00\xb4,\x03\x00\xd4,\x03\x00'
+    b'\xfd,\x03\x00\x11-\x03\x00#-\x03\x00C-\x03\x00g-\x03\x00}-\x03\x00\x93-\x03\x00\xb5-\x03\x00\xd4-\x03\x00\xeb-\x03\x00\x02.\x03\x00\x1d.\x03\x00:.\x03\x00_.\x03\x00}.\x03\x00\x9c.\x03\x00\xb3.\x03\x00\xcf.\x03\x00\xe9.\x03\x00\x04/\x03\x00 /\x03\x008/\x03\x00T/\x03\x00l/\x03\x00'
+    b'\x83/\x03\x00\xa2/\x03\x00\xbc/\x03\x00\xd7/\x03\x00\xf0/\x03\x00\t0\x03\x00"0\x03\x0060\x03\x00L0\x03\x00f0\x03\x00~0\x03\x00\x9b0\x03\x00\xc20\x03\x00\xde0\x03\x00\xfb0\x03\x00\x1a1\x03\x0091\x03\x00G1\x03\x00d1\x03\x00\x871\x03\x00\xa81\x03\x00\xc21\x03\x00\xe51\x03\x00\x082\x03\x00'
+    b'%2\x03\x00N2\x03\x00u2\x03\x00\x992\x03\x00\xb52\x03\x00\xd22\x03\x00\xe02\x03\x00\xf02\x03\x00\r3\x03\x00%3\x03\x00J3\x03\x00i3\x03\x00\x8b3\x03\x00\x9e3\x03\x00\xbe3\x03\x00\xdb3\x03\x00\xfd3\x03\x00\x154\x03\x0084\x03\x00Z4\x03\x00w4\x03\x00\x8d4\x03\x00\xb54\x03\x00\xcd4\x03\x00'
+    b'\xed4\x03\x00\x125\x03\x00$5\x03\x00A5\x03\x00^5\x03\x00y5\x03\x00\x945\x03\x00\xae5\x03\x00\xd75\x03\x00\xed5\x03\x00\t6\x03\x00*6\x03\x00?6\x03\x00R6\x03\x00k6\x03\x00y6\x03\x00\x8d6\x03\x00\xaa6\x03\x00\xd06\x03\x00\xeb6\x03\x00\xff6\x03\x00\x167\x03\x00+7\x03\x00B7\x03\x00'
+    b'd7\x03\x00\x847\x03\x00\x987\x03\x00\xb37\x03\x00\xd77\x03\x00\xf67\x03\x00\x158\x03\x0068\x03\x00R8\x03\x00e8\x03\x00x8\x03\x00\x898\x03\x00\xa18\x03\x00\xb88\x03\x00\xc38\x03\x00\xdd8\x03\x00\xe88\x03\x00\x089\x03\x00%9\x03\x00B9\x03\x00_9\x03\x00w9\x03\x00\x8d9\x03\x00\x9d9\x03\x00'
+    b"\xba9\x03\x00\xd79\x03\x00\xf19\x03\x00\xfd9\x03\x00':\x03\x00B:\x03\x00Y:\x03\x00t:\x03\x00\x93:\x03\x00\xbb:\x03\x00\xe2:\x03\x00\x0b;\x03\x004;\x03\x00\\;\x03\x00x;\x03\x00\x9c;\x03\x00\xc2;\x03\x00\xda;\x03\x00\x00<\x03\x00\x16<\x03\x004<\x03\x00L<\x03\x00u<\x03\x00\x8b<\x03\x00"
+    b'\xa8<\x03\x00\xc4<\x03\x00\xdb<\x03\x00\xf7<\x03\x00\x14=\x03\x00+=\x03\x00C=\x03\x00U=\x03\x00q=\x03\x00\x8f=\x03\x00\xab=\x03\x00\xc7=\x03\x00\xdf=\x03\x00\xf5=\x03\x00\x0c>\x03\x00+>\x03\x00G>\x03\x00U>\x03\x00p>\x03\x00\x8c>\x03\x00\xa7>\x03\x00\xc2>\x03\x00\xdd>\x03\x00\xf8>\x03\x00'
+    b'\x13?\x03\x00-?\x03\x00F?\x03\x00b?\x03\x00\x82?\x03\x00\xa0?\x03\x00\xbe?\x03\x00\xe1?\x03\x00\x0f@\x03\x00=@\x03\x00d@\x03\x00\x8b@\x03\x00\xad@\x03\x00\xd0@\x03\x00\xf7@\x03\x00\x1aA\x03\x001A\x03\x00_A\x03\x00\x8cA\x03\x00\xadA\x03\x00\xc5A\x03\x00\xd8A\x03\x00\xfcA\x03\x00\x13B\x03\x00'
+    b'*B\x03\x00BB\x03\x00bB\x03\x00\x83B\x03\x00\x96B\x03\x00\xa9B\x03\x00\xbeB\x03\x00\xd5B\x03\x00\xe2B\x03\x00\xefB\x03\x00\xfcB\x03\x00\tC\x03\x00\x1eC\x03\x003C\x03\x00IC\x03\x00_C\x03\x00wC\x03\x00\x8dC\x03\x00\xa4C\x03\x00\xbcC\x03\x00\xd5C\x03\x00\xf0C\x03\x00\x01D\x03\x00\x1cD\x03\x00'
+    b'1D\x03\x00GD\x03\x00cD\x03\x00\x85D\x03\x00\x95D\x03\x00\xadD\x03\x00\xcdD\x03\x00\xf3D\x03\x00\rE\x03\x00$E\x03\x00>E\x03\x00\\E\x03\x00zE\x03\x00\x9fE\x03\x00\xbaE\x03\x00\xcbE\x03\x00\xeaE\x03\x00\tF\x03\x00*F\x03\x00LF\x03\x00pF\x03\x00\x8cF\x03\x00\xa8F\x03\x00\xc1F\x03\x00'
+    b'\xdaF\x03\x00\xf3F\x03\x00\x16G\x03\x001G\x03\x00DG\x03\x00]G\x03\x00wG\x03\x00\x8cG\x03\x00\xabG\x03\x00\xccG\x03\x00\xecG\x03\x00\x14H\x03\x00\x1cH\x03\x00.H\x03\x00BH\x03\x00]H\x03\x00\x86H\x03\x00\xa8H\x03\x00\xbbH\x03\x00\xd4H\x03\x00\xfaH\x03\x00 I\x03\x00GI\x03\x00mI\x03\x00'
+    b"\x97I\x03\x00\xafI\x03\x00\xd0I\x03\x00\xf8I\x03\x00'J\x03\x00DJ\x03\x00dJ\x03\x00\x7fJ\x03\x00\x95J\x03\x00\xa7J\x03\x00\xc9J\x03\x00\xeaJ\x03\x00\x01K\x03\x00\x15K\x03\x00*K\x03\x005K\x03\x00GK\x03\x00]K\x03\x00tK\x03\x00\x93K\x03\x00\xaaK\x03\x00\xcaK\x03\x00\xe9K\x03\x00\x07L\x03\x00"
+    b')L\x03\x00ML\x03\x00mL\x03\x00\x8aL\x03\x00\x9cL\x03\x00\xc0L\x03\x00\xdfL\x03\x00\xffL\x03\x00\x1dM\x03\x00CM\x03\x00mM\x03\x00\x9aM\x03\x00\xb9M\x03\x00\xd7M\x03\x00\xf4M\x03\x00\tN\x03\x00\x15N\x03\x00\x1eN\x03\x00*N\x03\x002N\x03\x00KN\x03\x00bN\x03\x00}N\x03\x00\x96N\x03\x00'
+    b'\xb4N\x03\x00\xc1N\x03\x00\xd8N\x03\x00\xf9N\x03\x00\x12O\x03\x00\x1dO\x03\x00)O\x03\x00CO\x03\x00^O\x03\x00wO\x03\x00\x8cO\x03\x00\xa4O\x03\x00\xbeO\x03\x00\xdaO\x03\x00\xf4O\x03\x00\x0eP\x03\x00-P\x03\x00@P\x03\x00^P\x03\x00xP\x03\x00\x8bP\x03\x00\xbeP\x03\x00\xc6P\x03\x00\xe0P\x03\x00'
+    b'\xfdP\x03\x00\x10Q\x03\x00.Q\x03\x00`Q\x03\x00rQ\x03\x00\x99Q\x03\x00\xb7Q\x03\x00\xd5Q\x03\x00\xf4Q\x03\x00\rR\x03\x00.R\x03\x00CR\x03\x00TR\x03\x00iR\x03\x00\x81R\x03\x00\x9aR\x03\x00\xb2R\x03\x00\xc3R\x03\x00\xdfR\x03\x00\xfeR\x03\x00\x17S\x03\x00+S\x03\x00DS\x03\x00gS\x03\x00'
+    b'uS\x03\x00\x8eS\x03\x00\x9eS\x03\x00\xb2S\x03\x00\xc3S\x03\x00\xd5S\x03\x00\xebS\x03\x00\x01T\x03\x00\x18T\x03\x007T\x03\x00GT\x03\x00\\T\x03\x00wT\x03\x00\x8bT\x03\x00\xa2T\x03\x00\xb2T\x03\x00\xcfT\x03\x00\xefT\x03\x00\x11U\x03\x00/U\x03\x00CU\x03\x00_U\x03\x00{U\x03\x00\x91U\x03\x00'
+    b'\xa9U\x03\x00\xbfU\x03\x00\xdcU\x03\x00\xf9U\x03\x00\x16V\x03\x00,V\x03\x00EV\x03\x00]V\x03\x00qV\x03\x00\x97V\x03\x00\xadV\x03\x00\xc3V\x03\x00\xd1V\x03\x00\xe1V\x03\x00\xfbV\x03\x00\x0bW\x03\x00!W\x03\x00;W\x03\x00XW\x03\x00\x83W\x03\x00\x95W\x03\x00\xadW\x03\x00\xbdW\x03\x00\xddW\x03\x00'
+    b"\xefW\x03\x00\x0fX\x03\x003X\x03\x00MX\x03\x00gX\x03\x00\x81X\x03\x00\xa6X\x03\x00\xd0X\x03\x00\xf0X\x03\x00\x04Y\x03\x00\x1bY\x03\x00PY\x03\x00vY\x03\x00\x9dY\x03\x00\xbfY\x03\x00\xe7Y\x03\x00\x05Z\x03\x00'Z\x03\x00=Z\x03\x00jZ\x03\x00\x94Z\x03\x00\xb8Z\x03\x00\xdeZ\x03\x00\xfcZ\x03\x00"
+    b'"[\x03\x00A[\x03\x00S[\x03\x00e[\x03\x00r[\x03\x00\x87[\x03\x00\xb2[\x03\x00\xd7[\x03\x00\xfe[\x03\x00\x1f\\\x03\x00<\\\x03\x00N\\\x03\x00v\\\x03\x00\x8d\\\x03\x00\x9e\\\x03\x00\xac\\\x03\x00\xcf\\\x03\x00\xea\\\x03\x00\x01]\x03\x00\x15]\x03\x002]\x03\x00J]\x03\x00a]\x03\x00r]\x03\x00'
+    b'\x8c]\x03\x00\x9f]\x03\x00\xac]\x03\x00\xcd]\x03\x00\xed]\x03\x00\x10^\x03\x00)^\x03\x00B^\x03\x00Y^\x03\x00z^\x03\x00\x97^\x03\x00\xad^\x03\x00\xca^\x03\x00\xdb^\x03\x00\xfc^\x03\x00\x1c_\x03\x00:_\x03\x00b_\x03\x00~_\x03\x00\x8d_\x03\x00\x9f_\x03\x00\xce_\x03\x00\xfa_\x03\x00\x17`\x03\x00'
+    b'0`\x03\x00G`\x03\x00Y`\x03\x00|`\x03\x00\x9e`\x03\x00\xb7`\x03\x00\xd2`\x03\x00\xf0`\x03\x00\xff`\x03\x00\x18a\x03\x00Da\x03\x00ba\x03\x00ta\x03\x00\x85a\x03\x00\xa1a\x03\x00\xb0a\x03\x00\xd2a\x03\x00\x01b\x03\x00%b\x03\x00Db\x03\x00eb\x03\x00\x7fb\x03\x00\xa5b\x03\x00\xc2b\x03\x00'
+    b'\xdfb\x03\x00\xefb\x03\x00\x0ec\x03\x009c\x03\x00Yc\x03\x00\x88c\x03\x00\xacc\x03\x00\xc3c\x03\x00\xd4c\x03\x00\xeac\x03\x00\rd\x03\x00=d\x03\x00bd\x03\x00\x80d\x03\x00\xa2d\x03\x00\xbfd\x03\x00\xd6d\x03\x00\xefd\x03\x00\x13e\x03\x00,e\x03\x00Ae\x03\x00Te\x03\x00ne\x03\x00\x8de\x03\x00'
+    b"\xabe\x03\x00\xbde\x03\x00\xd5e\x03\x00\xf0e\x03\x00\x06f\x03\x00\x1ef\x03\x00Jf\x03\x00df\x03\x00}f\x03\x00\x9af\x03\x00\xb8f\x03\x00\xe2f\x03\x00\x0bg\x03\x00'g\x03\x00Lg\x03\x00cg\x03\x00\x8cg\x03\x00\xaeg\x03\x00\xcdg\x03\x00\xe3g\x03\x00\xf9g\x03\x00\x1eh\x03\x007h\x03\x00Nh\x03\x00"
+    b'fh\x03\x00\x85h\x03\x00\x9ah\x03\x00\xa7h\x03\x00\xc2h\x03\x00\xddh\x03\x00\x02i\x03\x00$i\x03\x00Ii\x03\x00ii\x03\x00\x8di\x03\x00\xa1i\x03\x00\xc3i\x03\x00\xe2i\x03\x00\xf4i\x03\x00\x0bj\x03\x00!j\x03\x007j\x03\x00Uj\x03\x00mj\x03\x00\x8dj\x03\x00\xa9j\x03\x00\xcej\x03\x00\xddj\x03\x00'
+    b'\xf8j\x03\x00\x1ck\x03\x00-k\x03\x00=k\x03\x00Jk\x03\x00^k\x03\x00\x80k\x03\x00\x97k\x03\x00\xc4k\x03\x00\xeak\x03\x00\xf9k\x03\x00 l\x03\x00=l\x03\x00Tl\x03\x00hl\x03\x00\x84l\x03\x00\x9fl\x03\x00\xc8l\x03\x00\xecl\x03\x00\x01m\x03\x00\x1am\x03\x004m\x03\x00Lm\x03\x00om\x03\x00'
+    b'\x7fm\x03\x00\xa3m\x03\x00\xc5m\x03\x00\xdcm\x03\x00\xfem\x03\x00"n\x03\x00Fn\x03\x00an\x03\x00wn\x03\x00\x8cn\x03\x00\xb1n\x03\x00\xd3n\x03\x00\xf6n\x03\x00\x06o\x03\x00,o\x03\x00Ao\x03\x00]o\x03\x00zo\x03\x00\x98o\x03\x00\xb3o\x03\x00\xdao\x03\x00\xfdo\x03\x00\x19p\x03\x005p\x03\x00'
+    b'Yp\x03\x00op\x03\x00~p\x03\x00\x96p\x03\x00\xb2p\x03\x00\xcap\x03\x00\xe2p\x03\x00\xfap\x03\x00\x12q\x03\x00*q\x03\x00Gq\x03\x00_q\x03\x00\x83q\x03\x00\x9eq\x03\x00\xb5q\x03\x00\xccq\x03\x00\xe3q\x03\x00\xfcq\x03\x00\x1er\x03\x00@r\x03\x00_r\x03\x00\x83r\x03\x00\xa6r\x03\x00\xc2r\x03\x00'
+    b'\xdbr\x03\x00\xf9r\x03\x00\x02s\x03\x00\x1cs\x03\x00:s\x03\x00Ys\x03\x00ns\x03\x00\x87s\x03\x00\xa2s\x03\x00\xb4s\x03\x00\xccs\x03\x00\xe8s\x03\x00\x05t\x03\x00 t\x03\x00?t\x03\x00Qt\x03\x00mt\x03\x00\x91t\x03\x00\x9dt\x03\x00\xb7t\x03\x00\xcct\x03\x00\xdet\x03\x00\xf6t\x03\x00\x11u\x03\x00'
+    b'$u\x03\x007u\x03\x00Iu\x03\x00]u\x03\x00vu\x03\x00\x86u\x03\x00\xaau\x03\x00\xb9u\x03\x00\xd0u\x03\x00\xe2u\x03\x00\xf7u\x03\x00\x08v\x03\x00\x18v\x03\x00 v\x03\x003v\x03\x00Uv\x03\x00dv\x03\x00~v\x03\x00\x8cv\x03\x00\x9dv\x03\x00\xbav\x03\x00\xcfv\x03\x00\xe9v\x03\x00\xf8v\x03\x00'
+    b'\x13w\x03\x00,w\x03\x00@w\x03\x00Xw\x03\x00pw\x03\x00\x83w\x03\x00\xa2w\x03\x00\xb1w\x03\x00\xbcw\x03\x00\xc7w\x03\x00\xd4w\x03\x00\xedw\x03\x00\x03x\x03\x00\x19x\x03\x002x\x03\x00Rx\x03\x00vx\x03\x00\x89x\x03\x00\x9dx\x03\x00\xb2x\x03\x00\xc7x\x03\x00\xdbx\x03\x00\xf5x\x03\x00\x0cy\x03\x00'
+    b'(y\x03\x00@y\x03\x00Vy\x03\x00fy\x03\x00\x83y\x03\x00\x93y\x03\x00\xb5y\x03\x00\xc5y\x03\x00\xd6y\x03\x00\xf1y\x03\x00\x0ez\x03\x00*z\x03\x00@z\x03\x00Uz\x03\x00jz\x03\x00|z\x03\x00\x90z\x03\x00\xa8z\x03\x00\xcaz\x03\x00\xd8z\x03\x00\x07{\x03\x002{\x03\x00E{\x03\x00_{\x03\x00'
+    b'\x89{\x03\x00\xa2{\x03\x00\xcf{\x03\x00\xf1{\x03\x00\x08|\x03\x00\x1c|\x03\x00D|\x03\x00m|\x03\x00\x8f|\x03\x00\xa9|\x03\x00\xc9|\x03\x00\xf4|\x03\x00\x0f}\x03\x000}\x03\x00N}\x03\x00r}\x03\x00\x90}\x03\x00\xa5}\x03\x00\xb7}\x03\x00\xd7}\x03\x00\xf7}\x03\x00\x0f~\x03\x000~\x03\x00Y~\x03\x00'
+    b"q~\x03\x00\x8a~\x03\x00\xb0~\x03\x00\xc8~\x03\x00\xf2~\x03\x00\t\x7f\x03\x00\x12\x7f\x03\x00'\x7f\x03\x00B\x7f\x03\x00j\x7f\x03\x00\x8b\x7f\x03\x00\xb1\x7f\x03\x00\xce\x7f\x03\x00\xdd\x7f\x03\x00\xe8\x7f\x03\x00\x14\x80\x03\x004\x80\x03\x00V\x80\x03\x00z\x80\x03\x00\x8c\x80\x03\x00\xa7\x80\x03\x00\xbe\x80\x03\x00\xe0\x80\x03\x00\x03\x81\x03\x00"
+    b',\x81\x03\x00;\x81\x03\x00R\x81\x03\x00i\x81\x03\x00\x82\x81\x03\x00\xa1\x81\x03\x00\xc0\x81\x03\x00\xdf\x81\x03\x00\xeb\x81\x03\x00\xfc\x81\x03\x00 \x82\x03\x00E\x82\x03\x00`\x82\x03\x00\x85\x82\x03\x00\xaf\x82\x03\x00\xc3\x82\x03\x00\xe5\x82\x03\x00\x02\x83\x03\x00+\x83\x03\x00A\x83\x03\x00\\\x83\x03\x00l\x83\x03\x00{\x83\x03\x00'
+)
+BLOB = (
+    b'Slightly tired.Talking.Very tired.Drinking.Eating.Has the Romantic personality.Has the Cheerful '
+    b'personality.Has the Active personality.Has the Gloomy personality.Has the Goofball personality.G'
+    b'etting married (Ceremony).Gathering for wedding.At wedding reception.Has the Lazy personality.Ha'
+    b's the Loner personality.Has the Music Lover personality.Has the Perfectionist personality.Has th'
+    b'e Snob personality.Delivering pizza.Immune to sickness.Currently cookingActing as the Grim Reape'
+    b'rResting after sex in bedSitting on a chairVisiting a foreign lotPregnant (not showing)Working a'
+    b's a bartenderBreaking thingsDinner party guest (Arrival)Dinner party guest (Socializing)Dinner p'
+    b'arty host (Arrival)Dinner party host (Socializing)Mingling with othersArriving service NPCWorkin'
+    b'g as a maidWorking as a mailmanFeeling ambitiousFeeling self-assuredFeeling bro-likeNear other B'
+    b'rosFeeling childishFeeling clumsyFearing career commitmentFeeling evilThinking about familyFeeli'
+    b'ng geekyFeeling like a geniusFeeling gluttonousFeeling hot-headedFeeling erraticFeeling creative'
+    b'Feeling meanFeeling neatFeeling slobbishRinging doorbellStanding idle outsidePrepping food as we'
+    b'dding catererAttending wedding ceremonyGathering for weddingWedding guest (after cake)Wedding gu'
+    b'est (before cake)Attending wedding receptionFeeling fearlessFeeling furiousFeeling boredFeeling '
+    b'confidentFeeling angryFeeling depressedFeeling elatedFeeling embarrassedFeeling energizedFeeling'
+    b' flirtyFeeling focusedFeeling enragedFeeling happyFeeling humiliatedFeeling hystericalFeeling im'
+    b'aginativeFeeling inspiredIn the zoneFeeling miserableFeeling mortifiedFeeling neutralFeeling pas'
+    b'sionateFeeling playfulFeeling pumpedFeeling sadFeeling sillyFeeling sloshed (drunk)Feeling stres'
+    b'sedFeeling tenseFeeling uncomfortablePotentially sore from fitnessLeaving lot nowLeaving lot now'
+    b' must runBeing inappropriateWalking with snooty styleWalking with swagger styleWalking with perk'
+    b'y styleVisiting mailboxIs dyingEssence of flavor traitAlluring traitGetting a drinkGetting coffe'
+    b'e or teaGetting dessertDancing to musicMaking a drinkCooking a meal for a groupThanking the host'
+    b' for the invitationGrabbing foodMaking dessertMaking coffee or teaHygiene decays slower due to A'
+    b'ntiseptic traitHunger decays slower due to Hardly Hungry traitFeeling patientBladder need rarely'
+    b' decaysEnergy need rarely decaysNeeds less social attention due to Independent traitMood is curr'
+    b'ently overriddenCleaning much fasterIs a Great KisserActing sincerelyPerforming a prankOrdering '
+    b'a drinkWatching TVTending the barCleaning the barHungry often due to High MetabolismLearning ski'
+    b'lls fasterInspired often due to Muser traitBladder need is medium-lowHygiene need is medium-lowE'
+    b'nergy need is medium-lowSocial need is medium-lowFun need is medium-lowHunger need is medium-low'
+    b'SleepingFeeling gloomyFeeling very gloomyBored from lack of creative activityJokes are funnierEn'
+    b'joys fine food and drinksFeeling angry due to Hot-Headed traitFeeling angry due to Hot-Headed tr'
+    b'aitFeeling angry due to Hot-Headed traitCleaning glassesCleaning platesCooking a high quality me'
+    b'alPlaying chessPlaying on outdoor playground equipmentPlaying with indoor toysExercisingPlaying '
+    b'on a gaming rigBored due to lack of gamingReading booksUsing a tabletTutoring someoneDoing homew'
+    b'orkUsing the computerHiding current needsRecently broken up or divorcedViewing a paintingPaintin'
+    b'g on easelMentoring painting on easelLeaving lot soonArt Lover traitDo not disturb while showeri'
+    b'ngBookworm traitTending the barOutgoing trait activeGoofy walkstyleFeminine walkstyleButch walks'
+    b'tyleSocially Gifted trait activeCreatively Gifted trait activePhysically Gifted trait activeMent'
+    b'ally Gifted trait activeGood trait activePlayed hooky from workWatching ceremonyBaking a cakeTop'
+    b'ping a cakeIs in heavily subdued state.Hacked targetPoor comedy performanceOutstanding comedy pe'
+    b'rformanceNormal comedy performanceCelebrating birthday guestMaking birthday cakeHacking target 2'
+    b'Hacking target 3Hacking target 4Hacking target 5Hacking target 6Has the Night Owl traitHas the M'
+    b'orning Person traitHas the Memorable traitPlaying musical instruments autonomouslyPerforming sta'
+    b'nd-up comedy autonomouslyHas the Speed Reader traitNear a friendly acquaintanceNear a romantic i'
+    b'nterestNear a partnerNear an unfriendly acquaintanceNear own childHomework has an answer keyRole'
+    b': Family dinner chefRole: Family dinner eater (suppress hunger)Role: Family dinner eatingSociali'
+    b'zing more autonomouslyMaking one dessert autonomouslyMaking one group meal autonomouslyBeating w'
+    b"riter's blockEating one slice of cake autonomouslyWatching stand-up comedy autonomouslyListening"
+    b' to music autonomouslyPlaying games autonomouslyBaked one birthday cakeUngreeted player visiting'
+    b' an NPCComplimenting more autonomouslyCongratulating more autonomouslyReady to tend barReady to '
+    b'cookReady to sleepHas the Always Welcome traitMischief: Wrapping bacon around everythingMischief'
+    b': Water cup prankNeed to admire possessions (Materialistic)Mischief: Selling test answersMischie'
+    b'f: Stuffing geeks in lockerMischief: Stuffing jocks in lockerMischief: Starting a food fightMisc'
+    b'hief: Unleashing the gerbilsMischief: Luring a llama to the officeMischief: Faking alien contact'
+    b"Mischief: Filling boss's office with balloonsMischief: Freeing the frogsMischief: Putting silly "
+    b'putty in the micMischief: Drawing mustaches for artMischief: Making invisible ink visibleMischie'
+    b"f: Hacking into coworker's emailMischief: Rearranging keyboard keysDoing extra homework (Prank)F"
+    b'inished reading a bookHacked a supercomputerPleaded to the Grim ReaperPlaying piano at a Black &'
+    b' White partyHacked gradesMaking costume party drinksMaking Black & White party drinksMaking cost'
+    b'ume party foodMaking Black & White party foodWondering if outside (Loves Outdoors)Has the Materi'
+    b'alistic traitHas the Ambitious trait (Low advancement)Has the Muser trait (Replacement)Being men'
+    b'toredHas maximum fitnessHas maximum fatnessNo sleep for 24 hoursNo social for 24 hoursHacked wor'
+    b'k performanceSpoke with painting agentNot feeling alonePlaying instrument badlyUsing outdoor gar'
+    b'den objects autonomouslyIdling and doing nothing.Avoiding career discussions.Immune to privacy i'
+    b'nvasions.Adding candles to a cake.Running a microphone performance.Waiting to kiss again.Possess'
+    b'es the Savant trait.putting away books.Mentoring someone in fitness.Working out on the street.Fi'
+    b'nished working out on the street.Behaving autonomously off-lot.Done pondering.Using a public res'
+    b'troom.Currently inactive (Active trait).Panicking about a fire.Needing music.Family oriented.Hat'
+    b'es children.Evil and near misery.Good and feeling good vibes.Loner near strangers.Snob feeling u'
+    b'nited.Missing family time.Has commitment issues.Feeling committed to a relationship.Behaving ver'
+    b'y appropriately.Needing to play video games.Lovelorn.Friends acting appropriately.Lovers acting '
+    b'appropriately.Loves the outdoors.Stuck inside too long.Bored genius.Using frog bait.Using organi'
+    b'c bait.Using small fish bait.Just had sex.Singed by fire.Using medium fish bait.Using fresh frui'
+    b't bait.Using fresh flower bait.Using rotten fruit bait.Using trash bait.Sitting down.Fishing at '
+    b'a spot.Grim Reaper is present.Insane and feeling pretty.Checking if outside.Currently outside.Cu'
+    b'rrently inside.Hates children.Caught a fish.Washing dirty dishes.Waking up in X hours.Caught a f'
+    b'ish with bait.Checking investment interest.Neutral mood for 48 hours.Minimum body fat.Minimum fi'
+    b'tness.Having less fun.Browsing books.Holding a fire extinguisher.Renewing vows.Near own baby.Wor'
+    b'king out.Morning person active.Near a new sibling.Met a new sibling.Night owl active.Using eleme'
+    b'nt bait.Using crystal bait.Using metal bait.Quit job due to commitment issues.Prank: Fake Alien '
+    b'Contact.Prank: Balloons in Office.Prank: Free Frogs.Prank: Generic.Prank: Hack Email.Prank: Llam'
+    b'a in Office.Prank: Invisible Ink.Prank: Mustaches.Prank: Keyboards.Prank: Sell Answers.Prank: Si'
+    b'lly Putty.Prank: Food Fight.Prank: Geeks in Locker.Prank: Jocks in Locker.Prank: Gerbils.Prank: '
+    b'Water Cup.Prank: Bacon.Walking sleepily.Walking energetically.Being called to a meal.Cuddling a '
+    b'new baby.Grungy hygiene.Drank energy juice.Fire panic is over.StrangerVille situation request.Ma'
+    b'king connections on computer.Getting married.Hungry.Has The Knack trait.Reacted to Grim Reaper d'
+    b'uring a fireReacting to a streakerCaught a large fishUsing toilet without a tabletSafe from fire'
+    b'Currently making a drinkRecently rang a doorbellNo longer inspiredNear a birthday cake with lit '
+    b'candlesWaiting to write another excuse noteReceived a bookRecently sent a text messageGained sat'
+    b'isfaction pointsWitnessed a recent firePreventing love lettersDrinking at a barRecently extingui'
+    b'shed a fireSaid goodbyeAsked to stay the nightEngaging in romantic social interactionTrying to l'
+    b'ook busyImprisonedUsing herbalist outdoor objectsCampingIs a ghostFeeling squeamishGhost who die'
+    b'd of angerGhost who died by electrocutionGhost who died by fireGhost who died of hysteriaGhost w'
+    b'ho died of embarrassmentAte Franks and BeansGhost who died of old ageGhost who died of overexert'
+    b'ionSexed with a ghostHaunting objects as a ghostGhost who died of hungerGhost who died by Cowpla'
+    b'ntHigh chance of alien abductionReturning to work after laborIs an alienRecovering from using al'
+    b'ien empathyChild ghost who died by fireGhost who died by drowningActing as a hermitGained campin'
+    b'g traitUsing skin balmUsed tummy fixer herbal remedyUsed fertility potionDressed as a bearRecent'
+    b'ly consumed a beneficial scientist-made serumIn the camping forest regionLocked in a holding cel'
+    b'lUnder effects of normal fertility potionUnder effects of outstanding fertility potionUnder effe'
+    b'cts of masterwork fertility potionSick with Bloaty HeadExperiencing illness symptomsContracted a'
+    b' severe illnessHas a mild illnessHas a severe illnessSick with Triple ThreatSick with Sweaty Shi'
+    b'versSick with Starry EyesSick with Llama FluSick with Itchy PlumbobSick with Gas and GigglesSick'
+    b' with Burning TummyChild ghost who died by drowningGrilling mealsGrabbing a drink from the coole'
+    b'rUsing a campfireActing as a grill masterTime out of holding cellAsking to be put back in cellUs'
+    b'ing the ranger stationLeaving the poolIs a police officer NPCIllness is in mild stateIllness is '
+    b'in severe stateIllness is in remissionImmune to illnessRecovering from illnessSuccessfully inter'
+    b'rogated a suspectFailed interrogationSafe from alien abductionHigh abduction chance due to satel'
+    b'liteReacted to sex in a tentControlled by alien hivemind to danceUsing outdoor restroom or showe'
+    b'rHygiene decaying fast in forestPatient examined (stage 1)Patient examined (stage 2)Diagnosed wi'
+    b'th Bloaty HeadDiagnosed with Burning TummyDiagnosed with Gas and GigglesDiagnosed with Itchy Plu'
+    b'mbobDiagnosed with Llama FluDiagnosed with Starry EyesDiagnosed with Triple ThreatDiagnosed with'
+    b' Sweaty ShiversHaunting forest as a gloomy ghostHaunting forest as a goofy ghostHaunting forest '
+    b'as a mean ghostHaunting forestHaving a scientific breakthroughActing as a coworkerSummoned as a '
+    b'ghostActing as a forest rangerActing appropriately for a coworkerHaving lunch as a coworkerDoing'
+    b' science as coworkerDetecting alien auraEmitting angry alien auraEmitting sad alien auraEmitting'
+    b' embarrassed alien auraEmitting energized alien auraEmitting flirty alien auraEmitting focused a'
+    b'lien auraEmitting happy alien auraEmitting inspired alien auraEmitting playful alien auraEmittin'
+    b'g stressed alien auraEmitting bored alien auraEmitting confident alien auraEmitting dazed alien '
+    b'auraEmitting uncomfortable alien auraArriving at vacation spot as rangerBrowsing retail storeEli'
+    b'gible for a citationPatient diagnosis stage 1Patient diagnosis stage 2Patient diagnosis stage 3P'
+    b'atient diagnosis stage 4UndiagnosedUnlikely to have illnessExpertly repairing objects as scienti'
+    b'stCleaning retail store as employeeRestocking items as employeeSocializing with customers as emp'
+    b'loyeeClocking in to retail jobBuying items at retail storePlaying horseshoesLost a small investm'
+    b'ent (1000)Lost a small investment (2000)Broke even on investment (2000)Broke even on investment '
+    b'(5000)Won a small investment (1000)Won a small investment (2000)Won a small investment (5000)Won'
+    b' a big investment (1000)Won a big investment (2000)Won a big investment (5000)Lost a small inves'
+    b'tment (5000)Lost a big investment (1000)Lost a big investment (2000)Lost a big investment (5000)'
+    b'Broke even on investment (1000)Has invested moneyBothered by mosquitoesStaffing the front deskDi'
+    b'scharging patient from exam bedRecently laughed at a broken signSpouse is pregnantSample taken f'
+    b'rom patientActing as a patientWorking as a medical receptionistIssued APB for suspectBeing check'
+    b'ed in at front deskFeeling grossly overpaidFeeling severely overpaidFeeling underpaidFeeling ver'
+    b'y underpaidFeeling severely underpaidFeeling grossly underpaidFeeling paid adequatelyFeeling ove'
+    b'rpaidFeeling very overpaidNeutral job satisfactionVery satisfied with jobSatisfied with jobUnsat'
+    b'isfied with jobVery unsatisfied with jobUsing campfire off-lotAt work as a doctorWaiting to purc'
+    b'hase itemTired of waiting to be servedRecently purchased an itemRecovering from faking sicknessC'
+    b'heckout timer frozenAt hospital for birth but not in laborWaiting for checkoutWorking as a nurse'
+    b'Working as an orderlySlacking off at workon sure sale interactionBadged in at front deskIn polic'
+    b'e station as criminal NPCWent to a crime sceneUsed chemical analyzerDrank fizzy explosion serumH'
+    b'aving temperature takenHaving eyes checkedHaving ears checkedBeing probedWaiting for fingerprint'
+    b'ingWaiting for mugshotWaiting for interrogationWaiting to be searchedBeing put in holding cellUp'
+    b'dating medical records after treatmentEntering sample analysis dataDiagnosed with no illnessRece'
+    b'ntly researched medical infoRecently promotedRecently solved a caseRecently delivered a babyColl'
+    b'apsed due to sicknessOrdering coworkers to gardenRecently had a scientific breakthroughWalking i'
+    b'nside as a patientVisiting as an alienOrdering coworkers to collect metalsOrdering coworkers to '
+    b'collect crystalsOrdering coworkers to collect floraOrdering coworkers to experimentOrdering cowo'
+    b'rkers to inventOrdering coworkers to work on rocketOrdering coworkers to deal with aliensCollaps'
+    b'ing as a patientLow level patientHigh level patientPatient with no illnessInterrogating an innoc'
+    b'ent suspectInterrogating a guilty suspectAdmitted to exam bedWaiting to check in at hospitalExam'
+    b'ined patient while awayPatient collapsed while awayHandling patient away eventDoctor chatting wh'
+    b'ile seated at exam bedDoctor chatting while reclinedPregnant patientAnalyzing emergency sampleVi'
+    b'siting as alienVisiting as alienTriggering a house callDoctor found no diagnosisTriggering an il'
+    b'lness outbreakPregnant patient walking inPatient collapsed during away eventMaking sick with Tri'
+    b'ple ThreatPregnant patient waitingPatient admittedPatient treatedScientist breakthrough progress'
+    b' (Stage 0)Scientist breakthrough progress (Stage 1)Scientist breakthrough progress (Stage 3)Scie'
+    b'ntist breakthrough progress (Stage 4)Scientist breakthrough progress (Stage 5)Scientist breakthr'
+    b'ough progress (Stage 6)Acting as police assistant NPCTook NPC reportChild emitting angry alien a'
+    b'uraChild emitting bored alien auraChild emitting embarrassed alien auraChild emitting energized '
+    b'alien auraChild emitting happy alien auraChild emitting focused alien auraChild emitting inspire'
+    b'd alien auraChild emitting playful alien auraChild emitting sad alien auraChild emitting stresse'
+    b'd alien auraChild emitting confident alien auraChild emitting uncomfortable alien auraAlien aura'
+    b' removedWorking as police receptionistPatient diagnosis stage 0Patient diagnosis stage 0 complet'
+    b"ePatient diagnosis stage 0 receivedRinging up customersIs a doctor's patientRecently used satell"
+    b'ite to detect aliensVery low chance of alien abductionLow chance of alien abductionMedium chance'
+    b' of alien abductionVery high chance of alien abductionRecovering from mind control sit commandRe'
+    b'clining in exam bedLow level admitted patientPatient diagnosed with Llama FluPatient diagnosed w'
+    b'ith Gas and GigglesPatient diagnosed with Starry EyesPatient diagnosed with Bloaty HeadRecently '
+    b'praised an employeeWorking as a doctorFailed cloning (evil twin)Supporting partner during birthS'
+    b'cientist breakthrough progress (Stage 2)Greeting othersPatient at away eventPatient glowing blue'
+    b'Ordering a small drinkDetective NPC at crime sceneBadgeing in at front deskPatient diagnosedFirs'
+    b't day as doctorWorking as police lab techPlaying as doctorWorking scientist front deskRevived a '
+    b'friend with Reaper serumMight slack off at retail jobLoitering in retail storeWalking angrilySoc'
+    b'ializing as employee backupWorking as OBGYNFrozen (Adult)Frozen (Child)Working as doctor (diagno'
+    b'ser)Walking like a patientCivilian in police stationOn patrolEmergency data entry analysisStarti'
+    b'ng alien world portal eventArrested at police stationSubject of alien brainpowerEmployee leaving'
+    b' shiftDoctor autonomyDoctor recently had a babyCollected items for emergency analysisRecently ch'
+    b'ecked on employeePatient arrivingWorking as police chiefIssuing APBSabotaged fruit punch fountai'
+    b'nWaiting to dip finger in fountain againEmployees avoiding lot ownerChecking fruit punch fountai'
+    b'nBlowing out birthday candlesPassed gas on massage tableStanding near registerFocused on retail '
+    b'dutiesSocializing on a dateStarting yoga classPracticing wellnessSmelling incenseDoing spa activ'
+    b'itiesWorking as massage therapistWorking as reflexologistBored reflexologistBored yoga instructo'
+    b'rBored massage therapistDiscovered something about selfCan floatGoing to floatFloatingRemoved fo'
+    b'otwear (Male)Removed footwear (Female)Used thioacetone in hot tubWearing a towelFinished first h'
+    b'and massageRelaxing in steam roomArriving at spaLeaving spaDying from steamStopped floatingGhost'
+    b' who died by steamChild ghost who died by steamFinished yoga classParticipating in yoga classPut'
+    b'ting down fruitcake (Welcoming new neighbor)FightingUngreeted welcome wagon neighborFollowing do'
+    b'or knocker (Welcoming new neighbor)Yoga instructor arrivingRecently read a magazineWearing a fac'
+    b'e mask in the bathtubTaking a showerSkinny dipping in hot tubRelaxing at the gymSitting in hot t'
+    b'ubIn a broken hot tubMind askew from ice creamEating haunted ice creamGiving haunted vibes from '
+    b'ice creamWaiting to remove footwear again (Male)Waiting to remove footwear again (Female)Keeping'
+    b' new outfit from closetMeditating (Low Skill)Meditating (Medium Skill)Meditating (High Skill)Med'
+    b'itating (Master)Motives frozen (NPC)Rubbing tummy after ice creamUsed chilling touch (Ice Cream)'
+    b'Yoga class available to joinTeaching yoga classTaking a mud bathTracking everyday outfitTracking'
+    b' formal outfitTracking athletic outfitTracking sleepwearTracking party outfitTracking swimwearGe'
+    b'tting out of steam roomActing as a cafe customerBeing annoyingAnchored to spa lotIt is Happy Hou'
+    b"rOrdering a drink at cafeDJ performingUsing media at cafeRecently used 'Feel the Crowd' as DJDan"
+    b'cing to NPC DJDJing at a clubRecently got hyped at DJ boothCheered at foosball gameHeckled at fo'
+    b'osball gamePart of the DJ crowdWatching the club DJPlaying foosball (Side A)Playing foosball (Si'
+    b'de B)Dancing at a clubSocializing lessDancing as a party goerBrawling in EuropeDancing at a nigh'
+    b'tclubPlaying guitarPlaying violinNot greeting anyoneBroke a club ruleOrdering favorite drinkPrac'
+    b'ticing DJ skillsAt Prom NightOrdering drink to go at cafeDancing to DJWatching DJWorking as a ba'
+    b'ristaSwimmingChallenged to foosballRecently brawledFeeling jealousJealous trait active near sign'
+    b'ificant otherFeeling neglected by significant otherHanging out with friends at cafeMeeting busin'
+    b'ess partner at cafeFeeling like an insiderRecently matchmade someoneShowing off moves on dancefl'
+    b'oorWatching someone show off dance movesCarving a pumpkinEarned a promotionDislikes the DJ music'
+    b'Taking a break from DJ audienceInterrupted sex due to jealousyGot a new jobRecently had a birthd'
+    b'ayClub Perk: Mixology BoostClub Perk: Charisma BoostClub Perk: Comedy BoostClub Perk: DJ Mixing '
+    b'BoostClub Perk: Fishing BoostClub Perk: Fitness BoostClub Perk: Gardening BoostClub Perk: Gourme'
+    b't Cooking BoostClub Perk: Guitar BoostClub Perk: Handiness BoostClub Perk: Cooking BoostClub Per'
+    b'k: Logic BoostClub Perk: Mischief BoostClub Perk: Painting BoostClub Perk: Piano BoostClub Perk:'
+    b' Programming BoostClub Perk: Rocket Science BoostClub Perk: Video Gaming BoostClub Perk: Violin '
+    b'BoostClub Perk: Writing BoostClub Perk: Child Creativity BoostClub Perk: Child Mental BoostClub '
+    b'Perk: Child Motor BoostClub Perk: Child Social BoostHaunting chalet as painter ghostClub Perk: F'
+    b'riendly Socials BonusClub Perk: Romantic Socials BonusClub Perk: Mischief Socials BonusClub Perk'
+    b': Funny Socials BonusClub Perk: Mean Socials BonusIs a Dance MachineMaking spooky foodEnergized '
+    b'from Dance Machine traitWandering the Chalet mazeClub Perk: Photography BoostClub Perk: Baking B'
+    b'oostClub Perk: Herbalism BoostListening to spooky musicParty pooper at a dance clubChallenging c'
+    b'lub to foosballUsing a bush (outdoors)Using a bonfireBreaking off a chatBonfire fire holding ste'
+    b'adyGoing dancing off-lotGoing dancing on-lotMourning a witnessed deathWitnessing the Grim Reaper'
+    b'Witnessing a dead bodyNPC DJ performing on-lotInteracting with items as Chalet ghostGardening as'
+    b' Chalet ghostCarving pumpkins autonomouslySuppressing jealousy while speakingLost arcade gameCha'
+    b"llenged to Don't Wake Llama gamePlaying dartsWatching DJ (Low Decay)Dancing to DJ (Low Decay)Dan"
+    b'cing to DJ (High Decay)Watching DJ (High Decay)Collected tips at DJ boothLooking in mirrorScarin'
+    b'g someone spookilyActing as bartenderFeeling the crowdEnjoying the DJ musicClub Perk: Dancing Bo'
+    b'ostClub Perk: Wellness BoostPlaying arcade game (Player 4)Playing arcade game (Player 1)Playing '
+    b'arcade game (Player 2)Playing arcade game (Player 3)Completely nudeShocked by somethingWatched a'
+    b'ction movieWatched comedy movieWatched horror movieWatched family movieWatched romance movieRece'
+    b'ntly saw athletic outfitRecently saw everyday outfitRecently saw formal outfitRecently saw party'
+    b' outfitRecently saw sleepwearRecently saw swimwearGroup dancing without socializingWitnessed che'
+    b'atingLabelled as a cheaterWon arcade gameShushing someone during movieCompleted dance battleWait'
+    b'ing for work with espressoReacting to being talked upReacting to being trashedFell asleep during'
+    b' movieWorking as repair technicianContinuing arcade gameWon arcade game and walked awayWatching '
+    b'a dance battleParticipating in a dance battleInterrupted inappropriate behaviorRecently broke up'
+    b' a coupleRecently trashed someone sociallyRecently talked up someone sociallyDressed as a knight'
+    b"Ordering food at cafeStopped playing Don't Wake LlamaActing as a visitorRecently played in close"
+    b"tWaiting for turn at dartsDefault off-lot autonomyPlaying Don't Wake LlamaStopped watching TVLea"
+    b'ving closet after playingWaiting to invite NPC to club gatheringAddedfor NPC club inviteBroke a '
+    b'club rule (post-interaction)Cuddling during movieWorking as a gardenerJust tipped the DJInside a'
+    b' restaurantBlackmailing with Wishing WellUsing ultimate pick-up line (Wishing Well)Is a dogWishi'
+    b'ng to always reviveCooking as a chefCannot be revived by Wishing WellEating experimental foodChe'
+    b'f has an order to cookFeeling like a kleptomaniacInfected with food poisoningReported food poiso'
+    b'ningDrinking red nectar pairingDrinking white nectar pairingGiving unhappiness near Wishing Well'
+    b'Already wished at the wellIs a Melt MasterEating grilled cheese as Melt MasterWitnessed stealing'
+    b' (Kleptomaniac)Recently ateHost arriving at restaurantRecently sexed autonomouslyArriving at res'
+    b'taurant to dineAdded soap to fountainChecking in at restaurantFeeling unflirtyOrdering from chef'
+    b'Waiting for a tablePreparing to place orderAte meat substituteWearing food stall shirtBanned fro'
+    b'm restaurantDeciding on orderTending a market stallBrowsing a market stallWaiting for foodSittin'
+    b'g still waiting for foodEating vegetarian foodBrowsing wall mailboxReady to place order (Player)'
+    b'Just placed orderViewing a dynamic signPreparing to leave restaurantHappy about restaurant break'
+    b'fastWaitstaff idleHappy about restaurant lunchHappy about restaurant dinnerFlirty during restaur'
+    b'ant breakfastFlirty during restaurant lunchFlirty during restaurant dinnerReceiving tips for per'
+    b'formanceStarting cooking shiftMade a mistake in puppet showDiscarded Voidcritter card recentlyBu'
+    b'sking as a living statueActing as a touristWaiting for waiter to bring foodWaiting for waiter to'
+    b' bring food (NPC)Eating restaurant foodWaiting for foodEating at a festivalDrinking at a festiva'
+    b'lRecently talked to toiletRecently used bubble blowerWaiter recently checked on tableConsumed Pu'
+    b'fferfish (Death Risk)Recently vomited from food poisoningShowing customers to tableEncouraging t'
+    b'ipsCooling down from bubble blower useFixing things as landlordGiving Growfruit (Challenge)Voidc'
+    b'ritter attack missedDrank Dark TeaDrank Light TeaGiving pristine GrowfruitVoidcritter Level 10Vo'
+    b'idcritter Level 1Voidcritter Level 2Voidcritter Level 3Voidcritter Level 4Voidcritter Level 5Voi'
+    b'dcritter Level 6Voidcritter Level 7Voidcritter Level 8Voidcritter Level 9Using Fire element Void'
+    b'critterUsing Water element VoidcritterUsing Void element VoidcritterUsing Earth element Voidcrit'
+    b'terUsing Wind element VoidcritterIn Home Studio apartmentIn apartment with Great AtmosphereThrow'
+    b'ing petals at Blossom FestivalRecently threw petalsRestricted to autonomy marker off-lotWatching'
+    b' fireworksLighting fireworksCleaning as waitstaffProtestingWatching a protestWorking as market s'
+    b'tall vendorPainting at Blossom FestivalWatching festival activitiesOvereating at Food FestivalDi'
+    b'scouraged from sittingParticipating in an eventVomiting at Food FestivalFeeling romanticAte terr'
+    b'ible restaurant foodAte poor restaurant foodAte good restaurant foodAte great restaurant foodAte'
+    b' amazing restaurant foodFeeling friendlyTable checked on by staffWatching a speechSpraying for m'
+    b'onster under bedChecked in at venue (Social Media)Watching a speech angrilyWatching a speech con'
+    b'fidentlyWatching a speech energeticallyWatching a speech with inspirationReceived podium eventGa'
+    b'ining less fatTaking out trash (Neighbor)Recently sampled foodFeeling underpaidFeeling very unde'
+    b'rpaidFeeling severely underpaidFeeling grossly underpaidFeeling overpaidFeeling very overpaidFee'
+    b'ling severely overpaidFeeling grossly overpaidFeeling paid adequatelyNeutral job satisfactionBui'
+    b'lding rocket at Logic FestivalFilling bladder motivesexing in rocket at Logic FestivalChecking m'
+    b'ail (Neighbor)Ghost who died by PufferfishEnthusiastic about food (Critic)Feeling meanRecently a'
+    b'teChecked up on by bossCheering for Voidcritter battleRecently gained inspiration from critiqueR'
+    b'ecently uploaded viral videoRecently shared promoted imageRecently recorded a rantReviewing food'
+    b' as a criticCooking normallyCooking carefullyCooking quicklyUnderwent brief trainingUnderwent ex'
+    b'tensive trainingUnderwent standard trainingStaying on restaurant lotStuck in restaurant seatChal'
+    b'lenging someone to Voidcritter battleSinging KaraokeInteracting with a talking toiletWants to so'
+    b'cialize with dining groupFeeling social at a restaurantSinging in a karaoke contestRecently part'
+    b'icipated in a karaoke contestWorking as restaurant staffVisited a festival recentlyComplimenting'
+    b' the chefInsulting the chefWoken up by a monster under the bedEating food at a dinerSpraying for'
+    b' monsters under the bedNeeds a hug due to fear of monsterCheering for a Voidcritter victoryWalki'
+    b"ng to the apartment doorAnswering a neighbor's noise complaintHanging out with neighborsInvited "
+    b'inside by a neighborWearing a festival lamp shirtWearing a logic festival shirtWearing a romance'
+    b' festival shirtCooking with a panCooking with a potPrepping ingredientsServing foodWorking as a '
+    b"flea market vendorFeeling inspired by a chef's kitchenUsing a bubble blowerLighting fireworksFai"
+    b'led to slide on the water slideWearing Tragic Clown hairWearing Tragic Clown hairAttending the H'
+    b'umor and Hijinks FestivalAttending the Flea MarketWaiting for food to cookLeaving the kitchenBei'
+    b'ng complained to by a neighborBusking on the streetSinging a karaoke duetWatched someone fail on'
+    b' the slideWatched someone succeed on the slideUsing a rocket ship at the festivalRecovering from'
+    b' sex in a rocket shipDrawing on a placematRecently hacked a satelliteHacking a satelliteParticip'
+    b'ating in a hacking eventParticipating in the Ultimate Gaming TestChoosing a political causePlayi'
+    b"ng the Ultimate Gaming TestSampling food at a festivalTaking a flirty shower at a neighbor'sBrai"
+    b'nstorming with neighborsEating snacks with neighborsGeeking out with neighborsWorking out with n'
+    b"eighborsComplaining about a childPlaying with a neighbor's childFailed a trick on the water slid"
+    b'ePerformed a trick on the water slideCritiquing foodFeeling defiant and refusingWaiting for a ta'
+    b'ble at a restaurantPreventing showing off at market stallShocked by an objectDisgusted by an obj'
+    b'ectPicked someone to represent on social mediaIs a toddlerWorking as a nannyFinished waiting for'
+    b' tableAte amazing food at a restaurantAte good food at a restaurantAte great food at a restauran'
+    b'tAte poor food at a restaurantAte terrible food at a restaurantSliding on a soapy slideDealing w'
+    b'ith an uninvited neighborTaking a showerFocused, suppressing social interactionsWaiting a long t'
+    b'ime for foodRefraining from using phoneBusking with a violinBusking with a guitarWants a dish re'
+    b'commendationConvinced to leave a protestHaggling at the flea marketGetting ready for a party wit'
+    b'h neighborsPlaying games with neighborsSliding on the water slideFocused on cooking, not eatingE'
+    b'ating quicklyQuitting job due to exhaustionAttending the Romance FestivalThrowing flower petalsR'
+    b'ecently played with a babyRecently made food as a nannyDrank an amazing beverageDrank a good bev'
+    b'erageDrank a great beverageDrank a poor beverageDrank a terrible beverageDrinking an amazingly v'
+    b'alued drinkDrinking a good valued drinkDrinking a great valued drinkDrinking a poor valued drink'
+    b'Drinking a terrible valued drinkOrder has been prioritizedIs a generally happy toddlerIs a top-n'
+    b'otch toddlerBehaving like an angelic toddlerBehaving like a clingy toddlerBehaving like a fussy '
+    b'toddlerBehaving like a wild toddlerBehaving like an independent toddlerBehaving like a silly tod'
+    b'dlerBehaving like an inquisitive toddlerBehaving like a charmer toddlerHolding flashcardsGuessed'
+    b' correctly on flashcardsGuessed incorrectly on flashcardsEnjoying good music at businessNear a h'
+    b'eat source at businessHearing bad instrument playing at businessIn a nicely decorated businessIn'
+    b' a decorated businessIn a beautifully decorated businessIn bad surroundings at businessIn unplea'
+    b'sant surroundings at businessIn wretched surroundings at businessListening to stereo music at bu'
+    b'sinessEnvironment effect already appliedStopping conversation to tend market stallWorking as a n'
+    b'annyIgnoring physical needs to workFinished working as a nannySliding on a soapy slide as a chil'
+    b'dLearning bartending while workingLearning gourmet cooking while workingLearning fitness while w'
+    b'orkingLearning charisma while workingLearning comedy while workingLearning charisma while workin'
+    b'gLearning comedy while workingLearning fitness while workingLearning gourmet cooking while worki'
+    b'ngLearning bartending while workingGroup was welcomed at restaurantArriving to work as a nannyWa'
+    b'tching a street performanceUsing an activity tableBuying a festival t-shirtCannot train employee'
+    b's right nowPreventing training backupLeaving the lot after nanny shiftPreparing to leave restaur'
+    b'ant as a criticWatching the kidsViewing blossoms at the festivalAttending the Logic FestivalMent'
+    b'oring swimmingMentoring homeworkMentoring artMentoring musicLogic Festival timer activeReceiving'
+    b' tips while buskingWorking overtime as a nannyWaiting to place an orderUsing a bubble blowerRece'
+    b'ntly shared a funny memeRecently pranked streamersFestival timer activeFestival buff addedFestiv'
+    b'al buff addedFestival timer activeFlea Market buff addedFlea Market timer activeBlossom Festival'
+    b' buff addedBlossom Festival timer activeTaking a basketball shotTaunting while playing basketbal'
+    b'lActing as a living statue (body)Acting as a living statue (head)Won the Ultimate Gaming TestWon'
+    b' silver in the HackathonWon bronze in the HackathonIn home neighborhoodLooking to eat at restaur'
+    b'antChecking if in home neighborhoodRepairing city infrastructureTaking a selfie with a cosplayer'
+    b'Waiting to trade at flea marketIs a catSitting in a high chairWorking at a restaurantDoing woodw'
+    b'orkingFeeling happy to be homeScrapping a drawingCalculating interaction probabilityCalculating '
+    b'interaction probabilityWandering the city in a towelClearing an easelScrapping a woodworking pro'
+    b'jectBeing potty trainedSelling items at a street tableBrowsing a street sale tableTending a stre'
+    b'et sale tableWorking as a butlerIn a homey environmentUsing high speed internetIn a room with gr'
+    b'eat acousticsIn a science lairIn a social environmentEnjoying natural lightEnjoying bracing bree'
+    b'zesFinding loose changePlaying video game consoleDreaming big while playing basketballWaiting to'
+    b' use bubblesChecking the bulletin boardTaking a close basketball shotTaking a free throw basketb'
+    b'all shotTaking a 2-point basketball shotTaking a 3-point basketball shotTaking a basketball shot'
+    b'Feeding a toddlerRecovering from eating spicy curryBeing reprimanded as a butlerBeing praised as'
+    b' a butlerActing as a caregiver for a toddlerMade a basketball shotMissed a basketball shotPartic'
+    b'ipating in the Curry ContestBoosting handiness skill due to lightPainting a muralFeeling romanti'
+    b'c at the festivalWearing a face maskJoining the Dark Side at the festivalJoining the Light Side '
+    b'at the festivalStocking items on the sales tableLearning movement skill (Level 2)Learning moveme'
+    b'nt skill (Level 4)Learning movement skill (Level 1)Intrigued by noise from neighborsIntrigued by'
+    b' smell from neighborsGlowing pink from Sakura teaGlowing pink from Sakura tea (Child)Glowing dar'
+    b'k from teaGlowing light from tea (Child)Glowing light from teaGlowing dark from tea (Child)Compe'
+    b'ting in basketball shootingCompeting in basketball dunkingMoving while painting muralCaught not '
+    b'working as a butlerAllowing guests inPreventing guests from enteringStarting a muralRecently ate'
+    b' curryClosing the sales tableWatching a protestCreating items for the sales tableCleaning a mura'
+    b'lMolding clayPlaying with nesting blocksBarkingBegging for foodGreeting neighborsActing professi'
+    b'onally as a butlerReturning to work as a butlerTraveling to a festivalTraveling to a festivalTra'
+    b'veling to a festivalTucking a toddler into bedIs a vampireRecently prepared foodDrawn to a prote'
+    b'stHibernating in a coffinPlaying basketballPainting a muralSleeping in a coffin (not a vampire)S'
+    b'colding someone about a muralCharmed by a vampireCharmed by a vampireCharmed by a vampireRaging '
+    b'uncontrollablyWorking as a gardenerWorking as a maidWorking as a nannyWorking as a repairmanPlay'
+    b"ing the Grim Reaper's guitarDancingRunning low on vampire energyBeing read to sleepLosing humani"
+    b'ty (Hygiene)Losing humanity (Social)Losing humanity (Fun)Being tucked inComplaining to the landl'
+    b"ordWorking as a butlerPutting toddler to bedAngrily knocking on neighbor's doorPolitely knocking"
+    b" on neighbor's doorDrinking Sakura teaLiving on the streetsDrinking plasmaWeakened from a vampir"
+    b'e fightWatching a buskerUsing the trash chuteBurning in the sunExisting during the day as a vamp'
+    b'ireSmelling garlicOverwhelmed by garlicSickened by garlicRecently hosted a charity streamSleepin'
+    b'g deeply (Vampiric Slumber)Sleeping deeply (Vampiric Slumber)Sleeping deeply (Vampiric Slumber)S'
+    b'leeping deeply (Vampiric Slumber)Sleeping deeply (Vampiric Slumber)Killed by sunlightInstructed '
+    b'not to cookWorking as a hired market vendorBeing watchedPlaying with a toyBoosting singing skill'
+    b" at clubBeing drunk from deeplyHaving life spirit drainedIn a Chef's KitchenIn a Home StudioIn a"
+    b" Child's Play areaBoosting handiness skillIn a dirty restaurantHas a withered stomach and cannot"
+    b' eat foodRepairs objects as butlerCares for children as butlerDoes not care for children as butl'
+    b'erGardens as butlerDoes not garden as butlerCleans as butlerDoes not clean as butlerWriting a co'
+    b'lumnWearing a curry contest shirtReceived an orderFeeling eternally sadSinging karaokeSinging ka'
+    b'raokeFeeling good about singingOffering to turn someone into a vampireDrinking inefficientlyEvan'
+    b'gelizing vegetarianismCooking a vegetarian group mealTransforming into a batTransforming into mi'
+    b'stHissing uncontrollablyChecking on a childFeeling urge to hissRemoving blushRemoving eyelinerRe'
+    b'moving eyeshadowRemoving lipstickFeeling insatiable thirstRunning at vampire speedGiving a eulog'
+    b'yBeing turned into a vampireFailed a trade at flea marketCreating fireworksFocused on cookingEmi'
+    b'tting an unpleasant auraShowing off vampire powersGiving a toddler a drinkHaving a nightmareWatc'
+    b'hing vampire creationVisiting as a touristCovered in flower petalsPersuaded by social mediaProte'
+    b'stingFeeling a minor earthquakeAsked for a sugar skullPainting a political muralImmune to garlic'
+    b'Feeling a major earthquakeWaiting to use rocket shipCreating a voodoo dollFeeling potent vampire'
+    b' powerFeeling potent vampire powerFeeling potent vampire powerWeak against sunlight (Level 3)Wea'
+    b'k against sunlight (Level 1)Weak against sunlight (Level 2)Living on the streets as a childWon t'
+    b'he curry contestFailed the curry contestAsking the Romance Guru for adviceBiting someoneArriving'
+    b' as a vampire visitorBreaking in as a vampireSinging in a contestEnjoying happy hourBeing read t'
+    b'oTaking a trick shot (3-Point)Taking a trick shot (Double Clutch)Taking a trick shot (Flying)Dre'
+    b'ssed as a bearAsking for wisdomShooting a long 3-pointerArriving at penthouseFeeding toddler des'
+    b'sertPreparing for a streamPreferring vampire social interactionsIs an awake toddlerWatching kara'
+    b'okeAte vegetarian foodShooting a 2-pointerNeeds to use the pottyNeeds to use the potty urgentlyL'
+    b'istening to a balladReady to complain about noiseOn a Ley Line (increased fertility)Ignoring ven'
+    b'ue typesKaraokeStarting a muralOrdering a drink at Arts CenterStocking paintingsDeveloping commu'
+    b'nication skill (Level 5)Developing communication skill (Level 1)Developing communication skill ('
+    b'Level 2)Developing communication skill (Level 3)Developing communication skill (Level 4)Developi'
+    b'ng imagination skill (Level 5)Developing imagination skill (Level 1)Developing imagination skill'
+    b' (Level 2)Developing imagination skill (Level 3)Developing imagination skill (Level 4)Developing'
+    b' thinking skill (Level 5)Developing thinking skill (Level 1)Developing thinking skill (Level 2)D'
+    b'eveloping thinking skill (Level 3)Developing thinking skill (Level 4)Developing movement skill ('
+    b'Level 3)Developing movement skill (Level 5)Developing potty skill (Level 1)Developing potty skil'
+    b'l (Level 2)Developing potty skill (Level 3)Quit activist careerBeing potty trained (Clingy)Danci'
+    b'ng (Clingy)Playing blocks (Clingy)Feeling cursedWaiting for neighborRemoving costumeRemoving cos'
+    b'tumeMourning at an urnFeeling vampiric strength (Level 3)Feeling vampiric strength (Level 1)Feel'
+    b'ing vampiric strength (Level 2)Coaching basketballDone greeting at penthouseChecked mailboxIdlin'
+    b'g at eventGreeting caregiverCaregiver returned from workStopped coachingSleepingGreeting guestsB'
+    b'eing greetedArriving at penthouseUsing plasma fruit as baitRefraining from watching TVHit on by '
+    b'a sleazy personWaiting for neighborRemoving costumeChecked on toddlerResistant to sunlightUsing '
+    b'vampire routingAttracted to protestChatting on phoneReading a guideFeeling the call of politicsL'
+    b'istening to a boring speechCelebrating Day of the DeadCelebrating Day of the DeadSunlight effect'
+    b's reversedHas eaten todayWalking creepilyTaking a tourist photoSunlight resistance (Level 1)Sunl'
+    b'ight resistance (Level 2)Vulnerable to sunlight (Level 1)Vulnerable to sunlight (Level 2)Vulnera'
+    b'ble to sunlight (Level 3)Watching a protestPanicking about fireTalking to selfBeing carried to s'
+    b'afetyResting from being a statueSinging with a childViewing city sightsTeaching toddler to talkR'
+    b'esponding to teachingResistant to sunlightKnocked politelyListening to lullabiesAvoiding social '
+    b'interactionEnjoying a great viewOut of vampire energyPlaying the pipe organIs a Vampire True Mas'
+    b'terFighting a vampireLeaving the lotsexingRecovering from vampire creationWashing in the poolWat'
+    b'ching TV with a toddlerPlaying dolls with a toddlerCaught misbehavingStopped mentoringDrank vamp'
+    b'ire resistance cocktailDrank sunlight reversal cocktailWaitingPlayingLeaving after being startle'
+    b'dDancingRecently snuggledRecently comfortedPlayingPlayingPlayingPlayingAt daycareLeft in high ch'
+    b'airIn a homey environmentHates toddlersOn family leaveWanting to learnIs a naked toddlerDancing '
+    b'(Independent)Caregiver is awakeSleeping (Do Not Disturb)Was acting as caregiverCleaning up toysW'
+    b'atching a distressed toddlerLying down to sleepPlayingRecovering from a nightmareCelebrating a b'
+    b'irthdayFailed to check on toddlerHugging a stuffed animalFeeling hyperFishing peacefullyLoves ca'
+    b'tsLoves dogsCat feeling drowsyCat feeling anxiousFeeling activeFeeling lazyFeeling curiousFeelin'
+    b'g stubbornDog feeling excitedDog feeling sadDog feeling mopeyDog feeling anxiousDog feeling angr'
+    b'yDog feeling flirtyDog feeling scaredDog feeling happyDog asleepDog feeling ashamedPicking up a '
+    b'bowling ballCat is complainingCat feeling angryCat feeling flirtyCat feeling scaredCat feeling h'
+    b'appyCat asleepWoken up by petFeeling wanderlustIs a friendly petIs a skittish petIs a vocal petI'
+    b's an aggressive petIs a smart petIs an independent petIs a protective petIs a hairy petFailed a '
+    b'bowling shotAt the vet clinicCheating at bowlingPerforming bowling tricksAte spoiled food (Pet)C'
+    b'at wanderingPrefers being insidePrefers being outsideHas litter breathArguing about politicsDist'
+    b'ressed by lack of affectionStopping investigationWas shovedIs a glutton petIs a naughty petIs a '
+    b'hunter petArguing about careerArguing about sharingArguing about childrenArguing about kindnessA'
+    b"rguing about humorArguing about social anxietyArguing about nature's wondersArguing about cleanl"
+    b'inessArguing about romanceArguing about musicArguing about argumentsArguing about schoolArguing '
+    b'about jobArguing about parentingArguing about house rulesArguing about who is betterArguing abou'
+    b't exercisingArguing about life goalsArguing about life outlookArguing about foodArguing about mo'
+    b'ralsBowlingCaught someone snoopingEmotions out of controlEmotions in controlParenting skill leve'
+    b'l 1 out of 10Parenting skill level 10 out of 10Parenting skill level 9 out of 10Parenting skill '
+    b'level 2 out of 10Parenting skill level 3 out of 10Parenting skill level 4 out of 10Parenting ski'
+    b'll level 5 out of 10Parenting skill level 6 out of 10Parenting skill level 7 out of 10Parenting '
+    b'skill level 8 out of 10Completed a volunteer adventureVolunteering at beachVolunteering at walkV'
+    b'olunteering at nursing homeVolunteering at soup kitchenVolunteering at bake saleOn fire at bowli'
+    b'ngObsessed with the TVObsessed with brewerObsessed with computerObsessed with fish tankObsessed '
+    b'with fitness equipmentObsessed with fridgeObsessed with gamingObsessed with instrumentObsessed w'
+    b'ith microwaveObsessed with showerObsessed with stereoObsessed with cookingObsessed with dishwash'
+    b'erObsessed with doorbellObsessed with fireObsessed with toiletHas good mannersHas bad mannersFee'
+    b'ling compassionateAfraid of brewerAfraid of computerAfraid of gamingAfraid of instrumentAfraid o'
+    b'f microwaveAfraid of showerAfraid of stereoAfraid of toiletAfraid of TVAfraid of dishwasherAfrai'
+    b'd of fireAfraid of fitness equipmentFeeling unfeelingBowling with a groupBowling with a groupBow'
+    b'ling with a groupBowling with a groupCat done playingWearing bowling shoesIs a ghostDebuggingRea'
+    b'dy to help cookReady to napRecently scoldedWearing bowling glove and shoesHaving a mood swingInt'
+    b'eracting with pet poopLearned a trickBitingIs a PlantSimSolved a problemEarning extra credit on '
+    b'projectFeeling confident due to PlantSim auraFeeling playful due to PlantSim auraFeeling uncomfo'
+    b'rtable due to PlantSim auraFeeling sad due to PlantSim auraFeeling angry due to PlantSim auraFee'
+    b'ling flirty due to PlantSim auraNeeds waterFinished school projectGave magic beansActing as a Pl'
+    b'antSimActing as a mediatorFeeling argumentativeReading a positive noteReading a negative noteRea'
+    b'ding a drawingBroke curfewBowling skill boostedDrinking from the toiletVisible PlantSim effectsM'
+    b'aking progress on school projectGot good gradesGot bad gradesDoing well at teen jobQuit jobAte f'
+    b'orbidden fruitLosing conflict resolutionGaining conflict resolutionGaining emotional controlLosi'
+    b'ng emotional controlGaining empathyLosing empathyGaining mannersLosing mannersGaining responsibi'
+    b'lityLosing responsibilityTook a turn bowlingSuffering from icy furSuffering from hot feetSufferi'
+    b'ng from rainbow poopSuffering from uncontrollable droolingSuffering from mouth mothsSuffering fr'
+    b'om fleasSuffering from barfingSuffering from extreme lethargySuffering from stinky furSuffering '
+    b'from glowing noseSuffering from golden poopStopped hidingDo not disturbStopped volunteeringWande'
+    b'ring due to sicknessWandering due to carryingWandering due to pregnancyWandering due to nothingF'
+    b'eeling playfulParent interacting with childPet care worker arrivedPet care worker leavingWatchin'
+    b'gAte with gross mannersDog wanderingCat in heatDog in heatCat wanderingCat fishingCat ghostDog g'
+    b'hostPlaying with a toy ballBit a toddlerBit a childGoing to crateListening to music with earbuds'
+    b'Absorbing water in poolPet service arrivedPet going to crateGoing through a bear phaseGoing thro'
+    b'ugh a clingy phaseGoing through a distant phaseBeing a picky eaterGoing through a loud phaseGoin'
+    b"g through a mean phaseGoing through a rebellious phaseOn a leashDyingHolding a dog's leashActing"
+    b' as a role modelBeing a picky eaterBeing a picky eaterBeing a picky eaterBeing a picky eaterRock'
+    b' climbing on treadmillShowing off dog tricksDressed as a bearDressed as a bearParenting skill bo'
+    b'ostedPerforming tricksSuffering from barfingSuffering from extreme lethargySuffering from fleasS'
+    b'uffering from glowing noseSuffering from golden poopSuffering from icy furSuffering from mouth m'
+    b'othsSuffering from rainbow poopSuffering from stinky furSuffering from uncontrollable droolingSu'
+    b'ffering from hot feetSuffering from barfingSuffering from extreme lethargySuffering from fleasSu'
+    b'ffering from glowing noseSuffering from golden poopSuffering from icy furSuffering from mouth mo'
+    b'thsSuffering from rainbow poopSuffering from stinky furSuffering from uncontrollable droolingSuf'
+    b'fering from hot feetWalkingDog walkingPet is feeling stubborn after being scoldedJogging while l'
+    b'istening to earbudsJogging through the neighborhoodGhost pet yowling due to old age deathIgnorin'
+    b'g the lack of a bear costumeRecently super-soothed an infantCompleted a workout video poseComple'
+    b'ted a workout video poseCompleted a workout video poseCompleted a workout video poseCompleted a '
+    b'workout video poseCompleted a workout video poseCompleted a workout video poseCompleted a workou'
+    b't video poseArriving at the vet clinic as a customerKicked a pet out of a bedWalking at heelExam'
+    b'ining a pet as a vet employeeSelf-regulating motivesSelf-regulating motivesFocused on vet duties'
+    b', suppressing socializingRecently fixed a relationshipIs a childIs an elderIs an adultWaiting to'
+    b' be greeted at the vetHas been greeted at the vetGetting bored of trainingRecently received a tr'
+    b'eatRecently sworeMentoring a child in life skillsWalking by and not hungryAttacking somethingNos'
+    b'e is glowing redNose is glowing redNose is glowing redNose is glowing redNose is glowing redNose'
+    b' is glowing redDrooling uncontrollablyDrooling uncontrollablyFur is stinky and dirtyFur is stink'
+    b'y and dirtyFur is stinky and dirtyFur is stinky and dirtyFocused on vet tasks, not trainingLearn'
+    b'ed to fetchBeing examined by a vetRecently disciplined for misbehaviorJournal is being snooped o'
+    b'nCustomers tolerate longer wait timesWaiting for service at the vetFinished waiting at the vetFa'
+    b'iled the final climb on the rock wallBriefly trained employeeExtensively trained employeeStandar'
+    b'd employee trainingSuppressing backup duties during trainingAutonomously going for a walkCanceli'
+    b'ng laying down actionArguing about curfewMotives are frozenFeeling sickWalking a dogBeing a pati'
+    b'ent at the vetExtremely stressedVery stressedGreeting a returning caregiverActing on Conflict Re'
+    b'solutionActing on Conflict ResolutionActing on Emotional ControlActing on Emotional ControlActin'
+    b'g on EmpathyActing on EmpathyActing on MannersActing on MannersActing on ResponsibilityActing on'
+    b' ResponsibilityBeing walked by a dog walkerCleaned up a hair pileRecovering from fear of coffee '
+    b'makerRecovering from fear of computerRecovering from fear of dishwasherRecovering from fear of f'
+    b'ireRecovering from fear of fitness equipmentRecovering from fear of gamingRecovering from fear o'
+    b'f instrumentRecovering from fear of microwaveRecovering from fear of showerRecovering from fear '
+    b'of stereoRecovering from fear of stoveRecovering from fear of swimmingRecovering from fear of to'
+    b'iletRecovering from fear of TVRecovering from fear of doorbellUsing friendly bedside manner gree'
+    b'tingUsing mean bedside manner greetingUsing friendly bedside manner with petUsing friendly bedsi'
+    b'de manner with ownerUsing mean bedside manner with petUsing mean bedside manner with ownerPreven'
+    b'ting critical motive decayRecently tucked inPerceiving the value of service as amazingPerceiving'
+    b' the value of service as goodPerceiving the value of service as greatPerceiving the value of ser'
+    b'vice as neutralPerceiving the value of service as poorPerceiving the value of service as terribl'
+    b'eBilling the pet ownerThinking about running away due to fearBeing disciplinedWoken up by earbud'
+    b'sReceived incorrect treatmentBored of playing fetchUsing blue earbudsUsing black earbudsUsing or'
+    b'ange earbudsUsing gold earbudsUsing green earbudsUsing pink earbudsUsing red earbudsUsing teal e'
+    b'arbudsUsing white earbudsRecently made a messHelping with a school projectHunting in the open st'
+    b'reetSocializing with pet owners at the vetWearing a cone of shameReceived great serviceFollowing'
+    b' curfewFollowing curfewAlert and not getting comfortable at the vetIn heat and attracting matesR'
+    b'ecovering from being in heatStaying near pet at the vetArriving as an adoption officerRecently g'
+    b'ave birth to a petLaboring with kittensPregnant with kittensPregnant with kittens (Trimester 1)P'
+    b'regnant with kittens (Trimester 2)Pregnant with kittens (Trimester 3)Pregnant with puppies (Trim'
+    b'ester 3)Pregnant with puppies (Trimester 2)Pregnant with puppies (Trimester 1)Pregnant with pupp'
+    b'iesLaboring with puppiesUsing black earbudsUsing blue earbudsUsing gold earbudsUsing green earbu'
+    b'dsUsing orange earbudsUsing pink earbudsUsing red earbudsUsing teal earbudsUsing white earbudsRe'
+    b'cently sniffed outsideSuccessful adoption visitRecently investigated fishing locationFur is icy '
+    b'and frozenFur is icy and frozenFeeling extremely lethargicFeeling extremely lethargicMoths flyin'
+    b'g out of mouthMoths flying out of mouthRecently stood near the podiumStaying near the vet podium'
+    b'Drooling heavilyDrooling heavilyNear a toddler from the householdAdoption pet leavingNeeds to di'
+    b'scipline a petHas minty breath from a treatTaking away the adoption crateFeet are hot and burnin'
+    b'gFeet are hot and burningTemporarily immune to sicknessExercised while sickAte human food while '
+    b'sickBeing routed to crate for sale or adoptionPerforming a check-upAutonomy suppressedRouting to'
+    b' litterboxHungry and moving towards foodShowing off tricksPerforming vet employee responsibiliti'
+    b'esHas bad breathParticipating in dog trainingArriving for pet adoptionChasing a catChasing a dog'
+    b'Just prepared foodEating prepared pet foodRecently obsessed over the mixerSold for adoptionPlasm'
+    b'a recently extractedRecently felt the love from ownerStopped watching petClub perk boosting Vete'
+    b'rinarian skillClub perk boosting Dog Training skillWatching pet run the obstacle courseRunning t'
+    b'he obstacle courseSpinning before poopingExcited owner returned homeSpinning before peeingGreeti'
+    b'ng pet upon returning homeFinding the pet for adoptionBeing sold or adoptedAfraid of the robot v'
+    b'acuumObsessed with the robot vacuumClinic setting: Clean stateClinic setting: Do not clean state'
+    b'Clinic setting: Treat stateClinic setting: Do not treat stateStalking preyCrafted Relaxation Ser'
+    b'umWorking as a vet employeeWearing a cone of shameCrafted Calming AgentCone of shame removed by '
+    b'ownerRemoved cone of shame autonomouslyWaiting out the cone of shame durationCrafted Simulation '
+    b'GelSprayed by a skunk in a bushCaught a squirrel in a bushAfraid of swimmingMisbehaving on a sur'
+    b'faceFailed to catch a squirrel in a bushChased a bird in a bushFound an item in a bushPlaying in'
+    b' a bushBlocking a surfaceRecovering from fear of robot vacuumCrafting Relaxation SerumCuriously '
+    b'searchingRecently shook off waterHas the Animal Whisperer traitDiscovered a symptomCrafting Simu'
+    b'lation GelCrafting Calming AgentCrafting Wellness TreatCrafting Sickness TreatCrafting Sickness '
+    b'TreatCrafting Sickness TreatCrafting Sickness TreatCrafting Sickness TreatCrafting Age Down Trea'
+    b'tCrafting Age Up TreatCrafting Ambrosia TreatTelling a storyWearing a cone of shameWearing a con'
+    b'e of shameWearing a cone of shamePassed obstacle course elementFailed obstacle course elementFai'
+    b'led jump with fire tailRecently tried to breedPracticing hoop jumpPracticing tunnel runPracticin'
+    b'g ramp runPracticing weaving flagsPracticing platform jumpNeeds to play after walkLooking to eat'
+    b' human foodBegging for foodCatching toddler at the slideRecently brushedIn a pet breeding zoneIn'
+    b' a pet training zoneFur is icy and frozenFur is icy and frozenFur is icy and frozenFur is icy an'
+    b'd frozenCalming down from aggressionAggressive towards strangersDiscovered a major symptomFailed'
+    b' to imitate petPracticing tricks on the skating rinkUsing the vending machine at the vetStarting'
+    b' make-believe on jungle gymNeeds to playNeeds to playUsing the vending machineGoing on an advent'
+    b'urePlaying make-believe as a piratePlaying make-believe with a rocketRecovering from Madnip atta'
+    b'ckPet is missing due to wanderlustHas fleasHas fleasHas fleasHas fleasComforted after being miss'
+    b'ingRecently lectured or scoldedIs a large dogIs a small dogReacting to finding somethingDog is d'
+    b'irtyClub perk boosting Archaeology skillEmployee recently quitEncouraged to breedWelcoming back '
+    b'a missing petDog needs to playWearing plaid overlayWearing polka dot overlayWearing rainbow over'
+    b'layWearing plaid overlayWearing plaid overlayWearing polka dot overlayWearing polka dot overlayW'
+    b'earing rainbow overlayWearing rainbow overlayStopped eating because another pet is nearbyRecentl'
+    b'y greeted a patientAfflicted by Personal Rain Cloud curseAfflicted by Personal Rain Cloud curseA'
+    b'fflicted by Personal Rain Cloud curseAfflicted by Ancient Sickness curseAfflicted by Ancient Sic'
+    b'kness curseAfflicted by Ancient Sickness curseAfflicted by Greedy Needs curseAfflicted by Greedy'
+    b' Needs curseAfflicted by Greedy Needs curseAfflicted by Marked For Death curseAfflicted by Marke'
+    b'd For Death curseCat is filthyKitten is filthySmall dog is filthyDog is filthyPuppy is filthyAff'
+    b'licted by Seeing Things curseAfflicted by Seeing Things curseAfflicted by Seeing Things curseBle'
+    b'ssed with MoneyBlessed with MoneyBlessed with MoneyBlessed with RelationshipsBlessed with Relati'
+    b'onshipsBlessed with RelationshipsStray explored a bushStray explored a fish pileStray explored a'
+    b' seaweed pileStray explored a dirt moundPerformed successful surgeryLow affectionBilling the cus'
+    b'tomerActive cat traitProviding a welcome back greetingGot dirty in a bushGhost who died of poiso'
+    b'nTurned into a skeletonTurned into a skeletonTurned into a skeletonTurned into a skeletonTurned '
+    b'into a skeletonTurned into a skeletonAll motives suppressedAll motives suppressedBeing carriedPl'
+    b'aying with another dogLearning potty trainingLearning potty trainingRecently hunted in a bushRec'
+    b'ently dug in the groundLetting self outRecently surveyed the areaSummoned a service skeletonSumm'
+    b'oned a service skeletonSummoned a service skeletonJogging with a dogCat hungerRecently returned '
+    b'to lotLazy pet relaxingActing as a service skeletonAggressive trait activeRecently rummaged in a'
+    b' pileActing as a service skeletonActing as a service skeletonCannot access petRecently lazed abo'
+    b'utWorking as a vendor in the jungleRecently smoothed a petRunning away in fearGoing on an advent'
+    b'ure in the Town SquarePunished by temple trap bone dustPunished by temple trap fireDismissing a '
+    b'patientBeing played withBarking misbehaviorUnleashing petJumping on countersSleepingWaiting duri'
+    b'ng vet serviceSleepingBeing billed for pet careReceived worst treatment qualityReceived second w'
+    b'orst treatment qualityReceived third worst treatment qualityReceived fourth best treatment quali'
+    b'tyReceived third best treatment qualityReceived second best treatment qualityReceived best treat'
+    b'ment qualityOn vacation in the JunglePet is amazingly stress-freePet is largely stress-freePet i'
+    b's good on stressWas recently wetEvaluating vet wait timeEvaluating pet stress levelEvaluating pe'
+    b't stress levelEvaluating pet stress levelBlessed with Ancient JoyService skeleton leavingWorking'
+    b' as an employeeRelic glowing while passing temple gateDestressing in peace and quietDying of poi'
+    b'sonUsed neutral greetingAware of climate changeRecovering from a natural dangerImmune to Ancient'
+    b' SicknessImmune to Ancient JoySkating with low skillRollerblading backwardsWatching the skating '
+    b'rinkTaking a photoCursed with Mark for DeathEncountering natural danger while movingSocializing '
+    b'nowRecently opened a presentIdling in the snowEngaging in skatingEngaging in raking leavesRecove'
+    b'ring from electrocutionRecently stargazedBrowsing market stallsPlaying in the snowFather Winter '
+    b'arrivingFather Winter hanging outWearing service skeleton outfitFather Winter adding presentLott'
+    b'ery holidayBlocked an attack from wildlifeGhost who died of rodent diseaseGhost who died of rode'
+    b'nt diseasePerforming holiday socialsImmune to slipping in mudGhost who froze to deathGhost child'
+    b' who froze to deathGoing to holiday servicesNear holiday decorationsParticipating in Night on th'
+    b'e TownParticipating in Discount DayParticipating in Battle RoyaleParticipating in Pirate DayPart'
+    b'icipating in Prank DayIncreasing skill gain for Skill DayParticipating in TV PremiereWeather is '
+    b'snowingWeather is rainingWeather is blizzardWeather is thunderstormWearing cold weather clothing'
+    b'Wearing hot weather clothingImmune to temperature effectsSnow is on the groundClub perk boosting'
+    b' Local Culture skillPicked to build a Snow PalHas Seldom Sleepy traitHas Needs No One traitHas F'
+    b'orever Full traitHas Forever Fresh traitTurned into a snow driftDog in the snowReceiving Jungle '
+    b'welcome packageExperiencing light rain outsideExperiencing heavy rain outsideReceived jungle wel'
+    b'come packageExperiencing blizzard outsideRecently looked around the templeGiving giftsThrowing s'
+    b'nowballs or balloons at skill level 5Throwing snowballs or balloons at skill level 1Throwing sno'
+    b'wballs or balloons at skill level 2Throwing snowballs or balloons at skill level 3Throwing snowb'
+    b'alls or balloons at skill level 4Acting as Father WinterActing as Father Winter BabyWatched TV p'
+    b'remiereExperiencing light rain and is insideExperiencing heavy rain and is insideExperiencing st'
+    b'orm rain and is insideExperiencing storm rain outsideHearing thunder anywhereHearing thunder ins'
+    b'ideHearing thunder outsideExperiencing blizzard and is insideBlessed with Personal SunBlessed wi'
+    b"th It's All GoodBlessed with Glorious TastesBlessed with Ancient JoyHas Burning Man traitHas Ice"
+    b' Man traitShoveling a snow driftSkating with high skillRollerblading with high skillRollerbladin'
+    b'g with low skillRollerblading backwardsWatching the NYE countdownVisible cold breathVisible cold'
+    b' breathVisible cold breathPet feeling hotPet feeling hotObsessed with small pet cageProtecting a'
+    b'gainst freezingParticipating in the lotteryPlaying in the rainGhost who died of overheatingRecen'
+    b'tly ran in the rainAppeasing gnomesImmune to temperature effectsSkating rink routineInside a ten'
+    b'tFrozen by SimRayChilled by SimRaySkating with medium skillRollerblading with medium skillComple'
+    b'ted fastingSwimming in cold poolSwimming in freezing poolSwimming in warm poolRecently received '
+    b'a gift from mailboxHunting for eggsAdoring a holiday objectWearing rodent costumeUmbrella openUm'
+    b'brella closedFasting for a holidayBeing festiveCured of rodent diseaseFeeling thankfulAdmiring g'
+    b'hostsInteracting with Father WinterFeeling chilledRodent disease progression frozenThe temperatu'
+    b're is freezingThe temperature is burningThe temperature is hotWeather is sunnyWeather is cloudyW'
+    b'eather is windyBody temperature is freezingBody temperature is extremely freezingBody temperatur'
+    b'e is overheatingBody temperature is meltingBody temperature is extremely meltingNPC giving gifts'
+    b'The temperature is coldThrowing confettiParticipating in party interactionsDiscouraged from goin'
+    b'g outside due to temperatureWearing a bee suitPet standing in the rainRecently tried on cold wea'
+    b'ther clothesRecently tried on hot weather clothesUsing umbrella during a stormResolution checkFl'
+    b'ower Bunny leavingFlower Bunny hanging outIs a ghostInside a warming objectArriving for trick or'
+    b' treatingWaiting to trick or treatFinished trick or treatingReceived faithful flower arrangement'
+    b"Wearing a costumeHas Scouting aptitudeHas a New Year's resolutionDisrespected by Snapdragon arra"
+    b'ngementDisrespected by Snapdragon arrangementWearing a costumeWalking by as a scoutWalking by in'
+    b' a costumeCursed by flower arrangementGiven a presentAffected by Christmas Rose sleep desireAsle'
+    b'ep due to Christmas RoseWoke up from Christmas RoseInteracting with a Snow PalFlower arrangement'
+    b' effectFather Winter leavingBoosted by Snow DriftLoves cold and is coldLoves cold and is freezin'
+    b'gLoves hot and is hotLoves hot and is burningLoves RainLoves SnowMoving to mark as Co-Star 1Wear'
+    b'ing Flower Bunny outfitPracticed a sceneGot into hair and makeupGot into costumeAdding snow to S'
+    b'now PalBuilding Snow PalReacting to thermostat settingWet from sprinklerWet from sprinklerWorkin'
+    b'g as stylistBored stylistStylist arrivingCooling down in kiddie poolWet from sprinklerBody tempe'
+    b'rature risingSinging to gnomeSinging to box of decorationsSinging to present pileSinging to gran'
+    b'd mealSinging to lighting candlesSinging to holiday treeSkating routinePracticing tricks on skat'
+    b'ing rinkWarming up from exerciseKeeping current styleClub perk boosting Flower Arranging skillAc'
+    b'ting as a scarecrowMoving to mark as Co-Star 2Moving to mark as DirectorIs the ScarecrowExiting '
+    b'swing setImmune to getting wetJust befriended Patchy the ScarecrowOperating dolly cameraSinging '
+    b'to fireworksHoliday is activeSinging on terrainThermostat set to highThermostat set to lowThermo'
+    b'stat set to mediumTemperature rising due to thermostatTemperature dropping due to thermostatDisc'
+    b'iplining for snow behaviorRecently stepped in a puddleSabotaging discipline interactionsGiving a'
+    b' giftStreaking for a holidayGiving a flowerEquipping umbrellaWearing scouting uniformRunning ins'
+    b'ide from rainReacting to skating routine successReacting to skating routine failureVisible cold '
+    b'breathBody temperature is neutralPet is wetPet is wetRaking leavesRecently sneaked a peek at pre'
+    b'sentsOpening presentsPlayful pet interactionSkating backwards timerConvivial lot auraPreparing f'
+    b'or performanceEnjoying company during a grand mealPreparing for performanceWatching a movieRecei'
+    b'ving a forged break-up letterWorking as background producerUmbrella closed for an hourLeaving th'
+    b'e holiday treeWatching the holiday treeRecently asked Scarecrow for gardening tipsRecently playe'
+    b'd in the rainOperating stationary cameraPreparing as stationary camera operatorInteracting with '
+    b'ScarecrowOn vacation during holidayReady to perform sceneWet from water balloonDisrespecting Sna'
+    b'pdragon arrangementGardening with high skillGardening with high skillStylist arriving at wardrob'
+    b'eStylist bored at wardrobeStylist working at wardrobeObsessed with phoneHanging out at museum as'
+    b' a celebrityHanging out at pool as a celebrityHanging out at library as a celebrityHanging out a'
+    b't park as a celebrityHanging out at bar as a celebrityHanging out at gym as a celebrityHanging o'
+    b'ut at low fame venueVampire resisting urge to eatIs a PaparazziFame Level 1Fame Level 4Fame Leve'
+    b'l 5Fame Level 2Fame Level 3Sitting in hair and makeup chairReacting to PaparazziArriving as a VI'
+    b'P rope bouncerOperating special effectsViewing festive lightingPosted video updatePosted video u'
+    b'pdate hypeAcquainted with a celebrityHosting lounge eventParticipating in open micAccepting awar'
+    b'dNo more awardWearing the Crystal HelmetPreparing as background producerHas Stan quirkHas Fan Ma'
+    b'il quirkHas Brushes With Fame quirkHas A Serious Actor quirkHas Emotion Bomb quirkHas Vain Stree'
+    b't quirkHas No Touching quirkHas Refined Palate quirkHas Public Number quirkHas Paparazzi Darling'
+    b' quirkHas Juice Enthusiast quirkNear a celebrityAwarding drinks at loungeTaking turn at open mic'
+    b'Participating in club gatheringPreparing as background actorStreaming via droneDestroying crysta'
+    b'l in helmetWanting to interact with celebrityCrystal Helmet channeling AmethystMotives frozen by'
+    b' Crystal HelmetFame Perk NetworkingFame Perk Corporate Partnership Royalty BonusFame Perk Play T'
+    b'he VillainFame Perk Giving BackFame Perk Star TreatmentChecking celebrity feudEnding celebrity f'
+    b'eudCrystal Helmet channeling AlabasterCrystal Helmet channeling AlexandriteCrystal Helmet channe'
+    b'ling AmazoniteCrystal Helmet channeling CitrineCrystal Helmet channeling CrandestineCrystal Helm'
+    b'et channeling DiamondCrystal Helmet channeling EmeraldCrystal Helmet channeling Fire OpalCrystal'
+    b' Helmet channeling HematiteCrystal Helmet channeling JetCrystal Helmet channeling JonquilystCrys'
+    b'tal Helmet channeling NiteliteCrystal Helmet channeling Orange TopazCrystal Helmet channeling Pe'
+    b'achCrystal Helmet channeling PlumbiteCrystal Helmet channeling QuartzCrystal Helmet channeling R'
+    b'ainborzCrystal Helmet channeling RoseCrystal Helmet channeling RubyCrystal Helmet channeling Sap'
+    b'phireCrystal Helmet channeling ShinaliteCrystal Helmet channeling SimaniteCrystal Helmet channel'
+    b'ing TurquoiseFeud bringer perk activeCorporate Partnership dialogReceiving corporate royalty bon'
+    b'usReceiving corporate royalty bonusReceiving corporate royalty bonusReceiving corporate royalty '
+    b'bonusReceiving corporate royalty bonusIn a celebrity squadOwner of a celebrity squadStan targeti'
+    b'ng celebritySuccessfully took picture of celebrityWaiting for CelebuSerum deliveryTaking care of'
+    b' a babyContacting PR personPerforming an acting routineBecoming instant bestiesIdling as bouncer'
+    b'PR personPerforming for tipsPerformed successful inspired routineTaking a bathGathering for cele'
+    b'brity tile placementWaiting impatiently for celebrity tile placementStarting celebrity tile plac'
+    b'ement ceremonyGathering as crowd member for ceremonyWaiting impatiently as crowd memberWatching '
+    b'celebrity tile placement ceremonyPerformed successful action routinePerformed successful horror '
+    b'routinePerformed successful sci-fi routinePerformed successful flirty routinePerformed successfu'
+    b'l happy routinePerformed successful playful routineQuirk-B-GonePulled an all-nighter for brandPu'
+    b'lled an all-nighter for brandHopping careersWatching a rallyHolding a rallyHas Rally perkBeing a'
+    b' fanStyling hairHas pristine reputationSquad perk activeIs a fan favoriteReputation decreasingIs'
+    b' an influencerSquad perkJuice enthusiastCelebrity at a venueCelebrity near other charactersFreez'
+    b'ing bladder with Crystal HelmetFreezing fun with Crystal HelmetFreezing hygiene with Crystal Hel'
+    b'metFreezing water with Crystal HelmetFreezing vampire power with Crystal HelmetFreezing thirst w'
+    b'ith Crystal HelmetEasy Street career perk activeVideo is trendingActing appropriately for a cele'
+    b'brityUsing celebrity walkstyleDealing with stansStar treatment delayFan acting nervousFan acting'
+    b' touchyFan acting socialTourist viewing celebrity tilePaparazzi seeing photo opportunityAttendin'
+    b'g award ceremony for a bookAttending award ceremony for a career gigAttending award ceremony for'
+    b' a paintingAttending award ceremony for a videoAttending award ceremony for a songWearing pirate'
+    b' makeup for a commercial gigWearing pirate makeup for a low budget TV gigWearing nice house make'
+    b'up for a commercial gigWearing Victorian makeup for a high budget TV gigWearing Victorian makeup'
+    b' for a movie gigWearing kids show makeup for a commercial gigWearing kids show makeup for a low '
+    b'budget TV gigWearing city theme makeup for a movie gigWearing superhero makeup for a movie gigWe'
+    b'aring police makeup for a high budget TV gigWearing apocalypse makeup for a high budget TV gigWe'
+    b'aring pirate makeup for a movie gigWearing hospital makeup for a commercial gigWearing nice hous'
+    b'e makeup for a low budget TV gigWearing hospital makeup for a high budget TV gigWearing medieval'
+    b' makeup for a movie gigWearing western makeup for a commercial gigWearing western makeup for a l'
+    b'ow budget TV gigWearing western makeup for a high budget TV gigWearing western makeup for a movi'
+    b'e gigWearing low budget house makeup for a low budget TV gigWearing pirate hair for a commercial'
+    b' gigWearing pirate hair for a low budget TV gigWearing nice house hair for a commercial gigWeari'
+    b'ng Victorian hair for a high budget TV gigWearing Victorian hair for a movie gigWearing kids sho'
+    b'w hair for a commercial gigWearing kids show hair for a low budget TV gigWearing police hair for'
+    b' a high budget TV gigWearing superhero hair for a movie gigWearing city theme hair for a movie g'
+    b'igWearing apocalypse hair for a high budget TV gigWearing pirate hair for a movie gigWearing hos'
+    b'pital hair for a commercial gigWearing nice house hair for a low budget TV gigWearing hospital h'
+    b'air for a high budget TV gigWearing medieval hair for a movie gigWearing western hair for a comm'
+    b'ercial gigWearing western hair for a low budget TV gigWearing western hair for a high budget TV '
+    b'gigWearing western hair for a movie gigWearing low budget house hair for a low budget TV gigUsin'
+    b'g CelebuSerum fame perkBeing noticeable due to fame perkBenefiting from established name fame pe'
+    b'rkBeing a trailblazer brand fame perkRunning a lifestyle brand fame perkManaging a corporate par'
+    b'tnership fame perkFeeling like an over-achieverAttending silver level charity benefit partyAtten'
+    b'ding gold level charity benefit partyExperiencing a hair styling failure at acting gigPerforming'
+    b' at open mic lounge eventParticipating in open mic player eventFocusing on main actor career goa'
+    b'lActing as a cook roommateAffected by charity drama node outcomeWearing athletic outfit infused '
+    b'with confidenceWearing athletic outfit infused with inspirationWearing athletic outfit infused w'
+    b'ith energyWearing athletic outfit infused with flirty vibesWearing swimwear infused with inspira'
+    b'tionWearing swimwear infused with flirty vibesWearing formal outfit infused with inspirationWear'
+    b'ing career outfit infused with flirty vibesWearing career outfit infused with energyWearing care'
+    b'er outfit infused with confidenceWearing athletic outfit infused with energyWearing athletic out'
+    b'fit infused with flirty vibesWearing athletic outfit infused with inspirationWearing athletic ou'
+    b'tfit infused with confidenceWearing swimwear infused with energyWearing swimwear infused with co'
+    b'nfidenceWearing sleepwear infused with inspirationWearing sleepwear infused with flirty vibesWea'
+    b'ring sleepwear infused with energyWearing sleepwear infused with confidenceWearing party outfit '
+    b'infused with inspirationWearing party outfit infused with flirty vibesWearing party outfit infus'
+    b'ed with energyWearing party outfit infused with confidenceWearing formal outfit infused with fli'
+    b'rty vibesWearing formal outfit infused with energyWearing formal outfit infused with confidenceW'
+    b'earing everyday outfit infused with inspirationWearing everyday outfit infused with flirty vibes'
+    b'Wearing everyday outfit infused with energyWearing everyday outfit infused with confidenceWearin'
+    b'g career outfit infused with inspirationWearing career outfit infused with confidenceWearing eve'
+    b'ryday outfit infused with confidenceWearing swimwear infused with confidenceWearing sleepwear in'
+    b'fused with confidenceWearing party outfit infused with confidenceWearing formal outfit infused w'
+    b'ith confidenceWearing career outfit infused with energyWearing everyday outfit infused with ener'
+    b'gyWearing formal outfit infused with energyWearing swimwear infused with energyWearing sleepwear'
+    b' infused with energyWearing party outfit infused with energyWearing career outfit infused with f'
+    b'lirty vibesWearing everyday outfit infused with flirty vibesWearing formal outfit infused with f'
+    b'lirty vibesWearing swimwear infused with flirty vibesWearing sleepwear infused with flirty vibes'
+    b'Wearing party outfit infused with flirty vibesWearing career outfit infused with inspirationWear'
+    b'ing everyday outfit infused with inspirationWearing formal outfit infused with inspirationWearin'
+    b'g party outfit infused with inspirationWearing sleepwear infused with inspirationWearing swimwea'
+    b'r infused with inspirationWearing crystal helmet with incompatible outfitWearing crystal helmet '
+    b'as celebrity roleChance to wear crystal helmet as celebrityGiving a gift during tutorialWaiting '
+    b'for public number quirkRestricted from performance tippingRestricted from playing instrumentsWai'
+    b'ting for fan socialRecovering from fainting as celebrityWaiting for style influencer model lookW'
+    b'aiting for fame rallyParticipating in kindness ambassador challengeChallenged to positivity by k'
+    b'indness ambassadorModeling a look for style influencer careerTurning off stage soundSwimming wit'
+    b'h mermaid styleWaiting for study trends video stationParticipating in positivity challenge as NP'
+    b'CShining with rank 4 fameShining with rank 5 fameWaiting for box of kindness searchPreparing spe'
+    b'cial effects for acting rolePerforming successful dramatic monologueWaving to roommate during tu'
+    b'torialAttending meet and greet as celebrityAttending meet and greet as fanGiving gift to roommat'
+    b'e during tutorialAchieved bronze fame at meet and greetAchieved gold fame at meet and greetAchie'
+    b'ved silver fame at meet and greetAttempting to enter VIP rope areaBribing VIP rope bouncerSucces'
+    b'sfully entered VIP rope area as NPCWaiting for wave interactionAttending acting gig while self-a'
+    b'bsorbedRemoving hat for hair and makeup chairParticipating in Friday drama club showCurrently pe'
+    b'rformingHousehold attending drama clubArriving at drama clubsexing in sleeping podUsing circadia'
+    b'n tweaker in sleeping podAchieved gold at fame social eventCurrently sunbathingHosting lampoon p'
+    b'arty as guest of honorRemoving quirk using crystal helmetWaiting to attempt entering VIP rope ar'
+    b'eaBreaking into an unowned safeWitnessing sabotage in sleeping podUsing Up-N-Atomizer in sleepin'
+    b'g podWatching award ceremony as attendeeRemoving hat for gig hair and makeup chairSleeping as ro'
+    b'ommate during tutorialReceiving drama club promotionBoosting media production skill via club per'
+    b'kBoosting acting skill via club perkWearing celebrity disguiseNoticed defaced celebrity tileTaki'
+    b'ng photo as touristWaiting for fan favoriteFocusing on career-minded aspirationInfected by stran'
+    b'ge sporesWatching open mic lounge eventPosing for pictures at meet and greetPlaying as player ch'
+    b'aracter during tutorialPreventing sleep during day 1 tutorialFeeling possessed intensityFeeling '
+    b'possessedGave gift to roommateStanding idle as paparazziWaiting for style influencer interviewWo'
+    b'rking with co-star in hospital commercial makeupWorking with co-star in nice house commercial ma'
+    b'keupWorking with co-star in pirate low budget TV makeupWorking with co-star in nice house low bu'
+    b'dget TV makeupWorking with co-star in western low budget TV makeupWorking with co-star in low bu'
+    b'dget house low budget TV makeupWorking with co-star 2 in pirate low budget TV makeupWorking with'
+    b' co-star in apocalypse high budget TV makeupWorking with co-star in hospital high budget TV make'
+    b'upWorking with co-star in western high budget TV makeupWorking with co-star in Victorian high bu'
+    b'dget TV makeupWorking with co-star in police high budget TV makeupWorking with co-star 2 in apoc'
+    b'alypse high budget TV makeupWorking with co-star 2 in Victorian high budget TV makeupWorking wit'
+    b'h co-star 2 in hospital high budget TV makeupWorking with co-star 2 in police high budget TV mak'
+    b'eupWorking with co-star in pirate movie makeupWorking with co-star in medieval movie makeupWorki'
+    b'ng with co-star in western movie makeupWorking with co-star in Victorian movie makeupWorking wit'
+    b'h co-star in superhero movie makeupWorking with co-star in city movie makeupWorking with co-star'
+    b' 2 in pirate movie makeupWorking with co-star 2 in medieval movie makeupWorking with co-star 2 i'
+    b'n western movie makeupWorking with co-star 2 in Victorian movie makeupWorking with co-star 2 in '
+    b'superhero movie makeupWorking with co-star 2 in city movie makeupMaking it rain money from vault'
+    b'Waiting for reputation donationWaiting for star treatment reactionQuitting fame opportunityPosse'
+    b'ssed by strange entityPlaying guitar as celebrity roleListening device is buggedExperiencing gen'
+    b'der makeup fail 0Experiencing gender makeup fail 1Experiencing gender makeup fail 2Experiencing '
+    b'gender makeup fail 3Experiencing gender makeup fail 4Experiencing unisex makeup fail 0Experienci'
+    b'ng unisex makeup fail 1Experiencing unisex makeup fail 2Waiting for money phoneRecently mocked i'
+    b'nfected plantHosting lampoon partyHas been reputation rank 0Has been reputation rank 1Has been r'
+    b'eputation rank 2Has been reputation rank 3Has been reputation rank 4Has been reputation rank 5Ha'
+    b's been reputation rank 6Waiting for new friend drama nodeDealing with terrible reputation friend'
+    b'shipAchieved bronze meet and greet with bad reputationAchieved gold meet and greet with bad repu'
+    b'tationAchieved silver meet and greet with bad reputationWaiting for plant spore possessionAchiev'
+    b'ed gold at lampoon partyBeing woken upInfecting house as roleBehaving possessed from infection t'
+    b'imeEating infected fruit while possessedWaiting for curio shop questionTook turn on training dum'
+    b'myWatching training dummyRejection letter from music production stationActing under Strangervill'
+    b'e government agent autonomyActing under Strangerville conspiracist autonomyBehaving possessed fr'
+    b'om infection scannerActing under Secret Lab venue autonomyWearing hazmat suitIn Secret Lab venue'
+    b'Tending bar casuallyActing as secret agentFeeling paranoidHelping in Mother Plant battleFighting'
+    b' Mother Plant as playerFighting Mother Plant as zombieWarbling warcry as zombie in Mother Plant '
+    b'battlePossessed due to passing through or being inside a "spore hallway"Checking underground due'
+    b' to paranoiaWalking by while possessedSuccessfully impressed with physical prowess during invest'
+    b'igationFailed to impress with physical prowess during investigationReviving Mother PlantKnocked '
+    b'out by Mother PlantGhost of Mother Plant victimTemporarily immune to infection after cureGoing t'
+    b'o front doorMother Plant made a requestBehaving possessed from alluring Mother PlantReasoning wi'
+    b'th hostile Mother Plant while infectedStarting helper role in Mother Plant battleStarting zombie'
+    b' role in Mother Plant battleStarting player role in Mother Plant battleHelper attacking location'
+    b' 3 in Mother Plant battleHelper attacking location 1 in Mother Plant battleHelper attacking loca'
+    b'tion 2 in Mother Plant battleWaiting for Mother Plant attackWaiting for Mother Plant rallyWaitin'
+    b'g for Mother Plant inspireWaiting for Mother Plant mega sprayWaiting for Mother Plant throw cure'
+    b'Waiting for Mother Plant warbling warcryChanneling Island Ancestors traitChanneling Child of the'
+    b' Ocean traitHelper throwing cure next in Mother Plant battleHero of Strangerville trait activeHe'
+    b'ro of Strangerville package schedule activeBehaving possessed during welcome wagonPre-welcome wa'
+    b'gon possessed stateSecret agent acting like nothing to see hereApplying celebrity walkstyleAttac'
+    b'king while possessed by infectionConnected to spore hallwayDoing tricks on water scooterPizza se'
+    b'rvice provided by smart hubWaiting for Mother Plant battleBehaving possessed after losing to Mot'
+    b'her PlantWaiting for tend infected plantSwimming at beach venueMermaid trait activeWatching turt'
+    b'le hatching under conservation autonomyVisibly possessed.Possessed during timed welcome wagonWai'
+    b'ting for archive evidenceWaiting for pet interactionWaiting for mermaid charmer powerWaiting for'
+    b' mermaid inspiring powerWaiting for mermaid question powerWaiting for mermaid requiem powerWaiti'
+    b'ng for mermaid aquatic lure powerWaiting for mermaid call storm powerWaiting for mermaid merfolk'
+    b' kiss powerWaiting for mermaid sirens call powerWaiting for mermaid summon ocean threat powerLoc'
+    b'king suntan decayGetting nude in clothing optional lotReacting strangely as mermaidStopped fishi'
+    b'ng due to overfishing regulationSwimming in waterSurveying beachcombing areaWaiting for infected'
+    b' plant attackWaiting for dolphin rub belly trickWaiting for dolphin dance trickWaiting for dolph'
+    b'in fetch trickWaiting for dolphin kiss trickTending curio shopWearing adult snorkel maskWearing '
+    b'scuba rebreatherWearing freediving wetsuitNever nude in clothing optional lotCombing for seashel'
+    b'lsCombing for trashIn phase 2 of kava partyDozed off on the lounge chair.Fined for fishing due t'
+    b'o overfishing regulationWalking with military style normalWalking with military style toughIn sp'
+    b'ore hallwayChild nude in clothing optional lotParticipating in Mother Plant battle as other simT'
+    b'riggered possession via infection scannerFighting scanning sim due to infection scannerRecently '
+    b'commanded to fight by Mother PlantAlmost always runningWaiting for craft spore filterTested expe'
+    b'rimental cure on selfCatching frogs at island waterfallAttracting frogs at island waterfallWaiti'
+    b'ng for infected plant reactionWaiting for military requisition keycardWading in waterBeachcombin'
+    b'g at beach venueLifeguarding at beach venueMerfolk behavior at beach venueCreating sand art at b'
+    b'each venueTanning at beach venueWater enthusiast behavior at beach venueFriend of the Sea conser'
+    b'vationist trait activeSuperneat roommate archetype activeMealmaker roommate archetype activeClin'
+    b'gy socialite roommate archetype activeCouch potato roommate archetype activeRoommate interested '
+    b'in musicRoommate interested in computersRoommate with bathroom hog quirkRoommate with public aff'
+    b'ection display quirkScrapping painting autonomouslyStandard roommate behaviorCreating object on '
+    b'table at island celebrationDoing fire dance at island celebration bonfireFinished fishing at fis'
+    b'hing competitionDolphin feed relationship modifier activeWaiting for dolphin rub belly relations'
+    b'hipVending at island fishing competitionAnnouncing winner of island fishing competitionOutside i'
+    b'n rain as mermaidComforting death as island visitorAngling for big catch while fishingWearing ch'
+    b'ild snorkel maskNPC poaching on islandNPC littering on islandMerfolk discovered at beach venueSa'
+    b'iling canoe with flowersSwimming in warm waterMerfolk undiscovered at beach venueCompleted extra'
+    b' food objective for island cultureIslander trait activeOutside in heavy rain as mermaidOutside i'
+    b'n rain as mermaid no modifierWading in oceanic paradiseSwimming in oceanic paradiseWater scooter'
+    b' walkby activeParenting at island family fun eventParticipating in potluck island eventParticipa'
+    b'ting as child in island family fun eventVending at island family fun eventWaiting for beach attr'
+    b'actor pointPranking with suntanSwimming in ocean with mermaid walkstyleBenevolent island spirit '
+    b'childBenevolent island spirit adultMalicious island spirit adultMalicious island spirit childDry'
+    b'ing off under ceiling fanCooling down under ceiling fanConservationist watching turtle hatchingV'
+    b'isiting town autonomouslyOutcome 1 of enchanted song in beach caveOutcome 2 of enchanted song in'
+    b' beach caveOutcome 1 of cave graffiti in beach caveOutcome 2 of cave graffiti in beach caveOutco'
+    b'me 1 of light in dark in beach caveOutcome 2 of light in dark in beach caveOutcome 1 of strange '
+    b'noise in beach caveOutcome 2 of strange noise in beach caveOutcome 1 of underground pools in bea'
+    b'ch caveOutcome 2 of underground pools in beach caveOutcome 1 of lava tubes in beach caveOutcome '
+    b'2 of lava tubes in beach caveOutcome 1 of glint out of reach in beach caveOutcome 2 of glint out'
+    b' of reach in beach caveOutcome 1 of ancient wreck in beach caveOutcome 2 of ancient wreck in bea'
+    b'ch caveOutcome 1 of bat colony in beach caveOutcome 2 of bat colony in beach caveOutcome 1 of sh'
+    b'ell collection in beach caveOutcome 2 of shell collection in beach caveOutcome 1 of playful dolp'
+    b'hins in beach caveOutcome 2 of playful dolphins in beach caveOutcome 1 of glow worms in beach ca'
+    b'veOutcome 2 of glow worms in beach caveRepairing item for island culture needWaiting for repair '
+    b'for island culture needWaiting for conservationist take sampleWaiting for beachcombingUsing effe'
+    b'ctive skill for mermaid aquatic lureParticipating in college study groupPartying as school spiri'
+    b't memberActing as school spirit mascotPartying as student on school spirit dayPlaying in college'
+    b' study groupSwimming with medium skill style as childSwimming with medium skill style as teen/ad'
+    b'ult/elderSwimming with high skill style as teen/adult/elderFeeling tropical warmthDolphin talk r'
+    b'elationship minimizer activeRiding a bikeStung by something while ocean swimmingSighted shark wh'
+    b'ile ocean swimmingSlimed while ocean swimmingStunning view while ocean swimmingTickled by ocean '
+    b'while ocean swimmingSwallowed water while ocean swimmingSummoning via Island Ancestors traitVend'
+    b'ing at island celebrationCramping while swimming in oceanLost swimsuit while swimming in oceanTh'
+    b'alassophobia while swimming in oceanSudden chill while swimming in oceanSplashed while swimming '
+    b'in oceanWaiting for dolphin summonActing as island welcome wagon neighborPutting down kava as be'
+    b'arerFirst attempt at dolphin danceFirst attempt at dolphin fetchFirst attempt at dolphin rub bel'
+    b'lyFirst attempt at dolphin kissDolphin pet relationship minimizer activeWaiting for dolphin feed'
+    b'Channeling elemental island spiritWaiting for dolphin jump trickFirst attempt at dolphin jumpExp'
+    b'eriencing partial cloudy weatherWaiting for island spirit blessActing as conservationistWaiting '
+    b'for island spirit meteorParticipating in beach bonfireWaiting for conservationist regulation con'
+    b'sultParty planner roommate archetype activeLoud music roommate archetype activeFixer roommate ar'
+    b'chetype activeRoommate interested in bakingRoommate interested in artRoommate interested in fitn'
+    b'essRoommate with absent quirkRoommate with big closet quirkRoommate with prankster quirkUpdating'
+    b' clothing optional statusFeeling blue from sudden chill in oceanSuntannedMet with client for fre'
+    b'elancer careerDoing cannonball on ocean ladderDoing swan dive on ocean ladderJumping on ocean la'
+    b'dderUsing pit BBQ at town BBQ eventMaking kava at town BBQ eventGrabbing kava at town BBQ eventW'
+    b'aiting for roommate partyNude in clothing optional lotHaving medium fitness staminaHaving high f'
+    b'itness staminaHas eaten within the last hourWaiting for island spirit puddleDisappointed island '
+    b'spiritWaiting for conservationist accuse of litteringRecovering from negative ocean swimming buf'
+    b'fExperiencing thalassophobia while wadingConstrained at island celebrationChecking for shallow w'
+    b'ater as mermaidHanging out at pit BBQ during town eventMaximizing relationship from mean dolphin'
+    b' splashSplashing while swimmingWading as mermaidTold to fish via skill interactionCaught endange'
+    b'red fishBuilding sand sculptureExperiencing sudden chill while wadingPranking as magic sagePract'
+    b'icing practical magic as sagePracticing untamed magic as sageCaught in water currentNovice magic'
+    b' venue NPCIntermediate magic venue NPCIs a witch occultClimbing ocean ladderFeeling burning weat'
+    b'her as mermaidBeing siren calledHypnotized by mermaidResurrecting via spellResurrecting via char'
+    b'ged spellWaiting for teach mischief spellWaiting for teach practical spellWaiting for teach unta'
+    b'med spellWalking by canoeWearing adult flippersWearing scuba wetsuitWearing child flippersGiving'
+    b' expert fishing tipPlaying sand activities 1Playing sand activities 2Playing sand activities 3Pl'
+    b'aying sand activities 4Playing sand activities 5Wading as Child of the OceanPositive judging by '
+    b'island spiritNegative judging by island spiritWaiting for spell reactionPracticing learned spell'
+    b'Removing repulsiveness curseTrash slimed while ocean swimmingWaiting for ocean activityLeaving a'
+    b's temporary cloneResurrecting familiarWaiting for familiar resurrectChecking for mermaid discove'
+    b'ryAutonomous wave tag in oceanHaving punchable face curseWaiting for rite of ascensionActing as '
+    b'fashion subjectUsing magic wandGiving punchable face curseNo swimming allowedStopping magic trai'
+    b'ningMermaid temporarily discoveredDreaming as mermaidWaiting for magic dischargeWaiting for magi'
+    b'c build chargeMermaid came of ageHaving touchy feely cursePanicking run away as witchWaiting for'
+    b' charge reactionHaving sweaty stench curseHaving night stalker curseHygiene decaying slowly due '
+    b'to clean spellFailed summon ghostTemporarily immune to cursesFountain of magic curse activeWaiti'
+    b'ng for splashEnthusing about baby turtlesWaiting for hugTemporarily immune to infectious laughte'
+    b'r curseClone cleaningClone cookingWaiting for remove curseWaiting for short remove curseClone sp'
+    b'ell successfulEvil clone spell failWaiting for learned potionCasting clean spell on objectCastin'
+    b'g duplicate spell on objectCasting lightning spell on objectCasting repair spell on objectCastin'
+    b'g fire spell on objectCasting sadness spell on simCasting lightning spell on simCasting transfor'
+    b'm spell on simCasting freeze spell on simCasting fire spell on simCasting clone spell on selfCas'
+    b'ting confuse spell on simCasting change appearance spell on simWaiting for sand sculptureCasting'
+    b' conjure food spell on terrainCasting teleport spell on terrainCasting spawn plant spell on terr'
+    b'ainAt Magic HQWaiting for search for tomesWaiting for clone mean interactionNight stalker role i'
+    b'dleNight stalker role screamWaiting for clone autonomous fightWaiting for clone break objectNigh'
+    b't stalker role leaveSpell debug success outcomeSpell debug fail outcomeDueling as magic duelistG'
+    b'oing to duel as magic duelistCaught excellent fishGhost of witch overloadAdd spectral look at ma'
+    b'rket stallRecently not promotedTimer for career promotionControlling charge with witch perkSling'
+    b'er of spells aspiration activeSubject of tripod photoPhotographer using tripodRemoving counter f'
+    b'or search for tomesIs a witch at any agePotent potables witch perk activeKnowledge is magic witc'
+    b'h perk activePranked by server at cafeteriaWeak witch bloodlineStrong witch bloodlineAncient wit'
+    b'ch bloodlineDischarging magic with witch perkPushing opponent with hex of duelistWearing humanoi'
+    b'd robot outfitTaking photo as tripod photographerIn photo mode as tripod photographerChallenging'
+    b' duel as magic duelistWitnessing stealing spellHumanoid robot waking up due to durabilityNo pani'
+    b'c from casting fireHumanoid robot security module activeHumanoid robot childcare module activeHu'
+    b'manoid robot cleaning module activeHumanoid robot fighter module activeHumanoid robot repair mod'
+    b'ule activeHumanoid robot gardening module activeMagical resonance witch perk activeWaiting for b'
+    b'uild chargewith resonanceWaiting for dischargewith resonanceBoosting robotics skill via club per'
+    b'kDebating at podium pairMain humanoid robot buff activeSocialite witch perk activeHumanoid robot'
+    b' party module activeUniversity enrollment connections successUniversity enrollment connections f'
+    b'ailureUniversity enrollment donate successUniversity enrollment donate failureUniversity enrollm'
+    b'ent flaunt fame successUniversity enrollment flaunt fame failureWaiting for glimmerstoneSuccessf'
+    b'ul immortality potion effectHumanoid robot enhancement level 10Humanoid robot enhancement level '
+    b'1Humanoid robot enhancement level 2Humanoid robot enhancement level 3Humanoid robot enhancement '
+    b'level 4Humanoid robot enhancement level 5Humanoid robot enhancement level 6Humanoid robot enhanc'
+    b'ement level 7Humanoid robot enhancement level 8Humanoid robot enhancement level 9Frozen by chill'
+    b'ed spellWaiting for practice spellcastingFinished tutoring in education careerRoommate with late'
+    b' on rent quirkBreaker roommate archetype activeStirring cauldronRoommate recently cleanedRoommat'
+    b'e recently fixed somethingRoommate recently made foodRoommate recently complimentedRoommate rece'
+    b'ntly took out trashRoommate recently left noteRoommate recently displayed public affectionComple'
+    b'ted style influencer meeting as fashion photographerWaiting for secret society summonWaiting for'
+    b' mural scootPotential roommateIs an owned petWaiting for education career donation askWaiting fo'
+    b'r education career volunteer askNear backdrop in fashion studioNear light in fashion studioEngin'
+    b'eer career object reward 1 activeEngineer career object reward 2 activeRandom loot from secret s'
+    b'ociety NPCFrozen spell failedParticipating in secret society ritualRoommate locked out eventRoom'
+    b'mate get hype eventRoommate wooing eventRoommate whispers eventReading poetry at arts student co'
+    b'mmonsWaiting for poetry at arts student commonsServing tea at arts student commonsCreator marker'
+    b' on humanoid robot creationPresented poetry at arts student commonsParticipating in esports even'
+    b't at science student commonsJuice keg bearer arriving at student commonsWearing beige white robo'
+    b'tics armPartying at student commons mixerStudying at student commonsCramming for exam at student'
+    b' commonsActive large dog familiarActive cat or small dog familiarActive child familiarWaiting fo'
+    b'r office hoursAWaiting for office hoursBWaiting for office hoursCWaiting for office hoursDWaitin'
+    b'g for powersipat esports eventSocializing at student commonsSlacking off at student commonsGrump'
+    b'y professor at student commonsHip professor at student commonsGood professor at student commonsW'
+    b'aiting for magic HQ browse booksEating keg party foodFinished juice kegEating juice keg party sn'
+    b'acksJoining secret society eventUsing wand as witch NPCStudent in university worldConstrained to'
+    b' attractor in university worldVehicle exit delay due to global temperatureWaiting for magic duel'
+    b'Rank 3 robotics organization memberPlaying robotics exhibition eventRefused late rent from roomm'
+    b'ateWaiting for magic venue NPC experimentPlaying painting in the park eventPainting prank at cre'
+    b'ativity celebrationPartying prank at creativity celebrationPlaying prank at creativity celebrati'
+    b'onMember of painting in the park eventClean convince debate skillRoommate clean up timeRival par'
+    b'tying at game day partyMember partying at game day partyRank 3 art society memberHover mode walk'
+    b'style for humanoid robotHumanoid Robot is recharging.Studying at universitySocial counter for co'
+    b'llege organization eventCommunity garden roleAdding org progress via social counterWaiting for e'
+    b'mail professorphoneWaiting for email professorAWaiting for email professorBWaiting for email pro'
+    b'fessorCWaiting for email professorDPost-judging at robotics exhibitionPre-judging at robotics ex'
+    b'hibitionParticipating in robotics exhibitionJudging debateParticipating in debateAudience at deb'
+    b'ateServing refreshments at debateGathering for debateDebating at college organization eventDivin'
+    b'g for trashDebating at community boardTracking humanoid robot broken state durabilityGoing to se'
+    b'cret society ritualGoing to robotics exhibition eventKicking soccer ballWaiting for statue offer'
+    b'ingWinning ping pong gameWearing red computer glassesMember partying at game day partyParty goer'
+    b' at game day partyPerforming school cheerWearing pink computer glassesWearing blue computer glas'
+    b'sesWearing green computer glassesWearing arts mascot outfitWearing tech mascot outfitWearing ora'
+    b'nge computer glassesWearing yellow computer glassesWaiting for school spirit streakParticipating'
+    b' in robot building sessionGoing to robot building sessionPlaying robot building sessionHanging o'
+    b'ut at barHanging out at gymHanging out at libraryHanging out at museumHanging out at parkHanging'
+    b' out at poolActivating organization cheatsDeclaring winner of debateWaiting for ask for higher g'
+    b'radeAWaiting for ask for higher gradeBWaiting for ask for higher gradeCWaiting for ask for highe'
+    b'r gradeDDeclaring debate outcomeWaiting for build botsUsing portable computerWaiting for ask for'
+    b' higher grade termAWaiting for ask for higher grade termBWaiting for ask for higher grade termCW'
+    b'aiting for ask for higher grade termDIn study spot zoneVending coffee at market stallHover mode '
+    b'for mechanical suitExiting interaction genericCanceling interaction genericParticipating in art '
+    b'society bar night meetupPranking rival universityLeaving university rivalry eventLosing mascot m'
+    b'askWaiting for secret society sprite visitorRank 3 honor society memberParticipating in honor so'
+    b'ciety bar nightPlayed with e-sports teamE-sports match coming soonWaiting for secret society att'
+    b'ackTeammate autonomy for e-sportsModeling for painting in the parkWaiting for assemble teamMaid '
+    b'service in university housingPlaying debate eventPlaying debateArts connections enrollment succe'
+    b'ssScience connections enrollment successArts connections enrollment failureScience connections e'
+    b'nrollment failureGathering for graduationWaiting for homework helpclass AWaiting for homework he'
+    b'lpclass BWaiting for homework helpclass CWaiting for homework helpclass DWearing beige white hum'
+    b'anoid robot outfitWearing black blue humanoid robot outfitWearing gray brown humanoid robot outf'
+    b'itWearing green brown humanoid robot outfitWearing red green humanoid robot outfitWearing white '
+    b'copper humanoid robot outfitChecking scholarship picker resultAttending graduation ceremonyWaiti'
+    b'ng for signing bonusWaiting for withdraw universityWaiting for study tipsRisky research machine '
+    b'usageReceived drama node Fri for esportsReceived drama node Sat for esportsDebtor repo autonomy '
+    b'activeCaught cheating at universityConvince cook debate skillPlaying game day party prankPlaying'
+    b' game day partyPlaying school spirit dayConvince bathe debate skillSocializing more at secret so'
+    b'ciety ritual (member)Playing secret society ritual (non-member)Playing secret society ritual (me'
+    b'mber)Waiting for juice keg socialWaiting for mascot pump upGeneral college organization bar nigh'
+    b't roleDebate college organization bar night roleRobotics college organization bar night rolePran'
+    b'k college organization bar night roleParty college organization bar night roleWearing black blue'
+    b' robotics armWearing blue red robotics armWearing gray brown robotics armWearing green brown rob'
+    b'otics armWearing red green robotics armWearing white copper robotics armPracticing final exam pr'
+    b'esentationWatching TV with children/teens/adults/eldersServing breakfast at cafeteriaServing lun'
+    b'ch at cafeteriaServing dinner at cafeteriaLow studying in study spotHigh studying in study spotL'
+    b'ow reaction to term presentationMedium reaction to term presentationHigh reaction to term presen'
+    b'tationWaiting for debate extra creditWaiting for class autonomyGhost of Murphy bed victimWearing'
+    b' graduation capWaiting for honor society extra creditHigh durability loss from water for robotBo'
+    b'osting research debate skill via club perkWatching podium pair debateSoccer ball picked alreadyS'
+    b'topping robot enhancementWaiting for poetry tea serveLow durability loss from water for robotSto'
+    b'pping robot durability lossRepo man idleHumanoid robot at robotics exhibitionAutonomous soccer b'
+    b'allGetting refreshments at student commonsSleeping more at student commonsWearing robe at secret'
+    b' society ritualWearing debate showdown uniformTemporary stop of robot durability lossPlaying jui'
+    b'ce pong against rivalWearing science debate showdown uniformFinished final exam AFinished final '
+    b'exam BFinished final exam CFinished final exam DWent to class for final examIdle in tiny homeGoi'
+    b'ng home after classRobotics society event roleMaker trait activeWearing helmet while bikingPlayi'
+    b'ng sabaccDumpster sex autonomy activeFirst Order stormtrooper on high alertChecking ID targetEff'
+    b'ective temperature from geothermal zoneEffective temperature from natural well zoneBoosting fabr'
+    b'ication skill via club perkNPC creative arts autonomyNPC fun community autonomyNPC home cooking '
+    b'autonomyNPC juiced community autonomyNPC music arts autonomyNPC technological progress autonomyF'
+    b'irst Order officer walkbyFirst Order stormtrooper walkbyResistance member walkbyIn industrial ec'
+    b'o footprintIn green eco footprintRecycle disciple trait activeCaught stealing as recycle discipl'
+    b'eWaiting for rummageMaker space mentor roleRecycling guru roleFabricator recycler roleCandle cra'
+    b'fter roleWoodworker rolePainter roleChild creator roleFirst Order mission giverResistance missio'
+    b'n giverFirst Order stormtrooper patrol walkbyResistance member patrol walkbyInsect farmer roleWa'
+    b'tching rally for civil designer careerGreen fiend trait activePicking up trash as trash helperBe'
+    b'ing handy as handy neighborGiving gift as random gift neighborRecycling spare recyclingsHondo id'
+    b'entifier activeWaiting for Hondo stealCan ask Hondo to stealSabacc table foldedGiving small civi'
+    b'c influenceGiving medium civic influenceGiving large civic influenceGiving extra large civic inf'
+    b'luenceSubmitted poor conceptSubmitted okay conceptSubmitted great conceptSubmitted outstanding c'
+    b'onceptSubmitted perfect conceptHanging out for community closenessFailed concept submissionSucce'
+    b'ssful concept submissionSubmitted eco invention conceptWaiting for ask for recycling materialsFr'
+    b'eegan trait activeChampion of the people trait activeEco engineer trait activeGiving small civic'
+    b' influence for fun communityScrounger roleFirefighter route failFighting fire as firefighterGhos'
+    b't of flies trash updateEco master trait activeEntrepreneur trait activeMaker NPC trait activeGra'
+    b'bbed cards at sabacc tableRepoman lockout always failRepoman lockout fight the manRepoman lockou'
+    b't appeal to humanityIncreasing repoman failure chanceBribing repoman lockoutWaste manager pickin'
+    b'g up trashWaste manager consultingWaste manager leavingUnlocked food reward recipesBatuu citizen'
+    b' walkbyWaste manager player autonomyInvisible beetle juice drink 1Scoundrel member walkbyWaste m'
+    b'anager taking paymentInvisible beetle juice drink 3Sliding down ladderEnergized by kombuchaFocus'
+    b'ed by kombuchaGrimbucha effectPossessed juice fizzer walkstyleJuice fizzing evaluation averageJu'
+    b'ice fizzing evaluation awfulJuice fizzing evaluation outstandingJuice fizzing evaluation very go'
+    b'odJuice fizzing evaluation world classFizzyhead trait activeWaiting for check freshnessIn Batuu '
+    b'regionWaiting for off grid gather waterWaiting for off grid gather snowWaiting for freegan rumma'
+    b'geFreegan discount deniedFreegan discount denied finalPlaying sabacc confidentlyPlaying sabacc l'
+    b'ogicallyCheated at sabaccRecently professed fabrication skillRecently dove for meals as freeganF'
+    b'ighting fire as fire brigadeWaiting for fire brigadeCalled firefightersFlirty firefightersBarten'
+    b"der at Oga's CantinaBarfly at Oga's CantinaCandle crafting timeoutOn parental visitWearing paper"
+    b' bagNeat sim on trash lotWaiting for swindleStocking craft sales tableStocking paintings on craf'
+    b't sales tableMake pregnant trait activePrepared voyager aspiration activeSleight of hand aspirat'
+    b'ion activeWaiting for maker mentor share ideasNear solar panel onSlob/lazy sim on trash lotWaiti'
+    b'ng for invitation (interactions only)Heroic presence actor aspiration activeRey identifier activ'
+    b'eVi identifier activeAgnon identifier activeKylo identifier activeFeeding compost to insect farm'
+    b'Boosting juice fizzing skill via club perkWaiting for utilities interviewKnocking on door for co'
+    b'mmunity closenessRepairing starship roleWaiting for rallyWaiting for influence points(paper bag)'
+    b'Slob small environment effect activeSlob medium environment effect activeSlob large environment '
+    b'effect activeEco inspector roleExploring space with starshipRecycle discipleLT Agnon NPC activeV'
+    b'i Moradi NPC activeHondo Ohnaka NPC activeFined for phony fire callWaiting for Batuu NPC walkbyH'
+    b'ondo allowed on whitelistResponding to surveillance alarm on BatuuPositive environment effect ac'
+    b'tiveNegative environment effect activeTracking community space voteTracking neighborhood renovat'
+    b'ion voteLord of the Knits aspiration activeResistance restricted area NPCFirst Order restricted '
+    b'area NPCWaiting for Batuu NPC move to positionWaiting for Batuu NPC scanGeneric NPC whitelistRey'
+    b' whitelistKylo whitelistWearing knitted clothingRecovering from dumpster divingVi whitelistAgnon'
+    b' whitelistFirefighter startupFirefighter finishedDonating knitted beaniesDonating knitted socksD'
+    b'onating knitted furnishingsDonating knitted rugsDonating knitted sweatersDonating knitted pouffe'
+    b'sDonating knitted decorationsDonating knitted onesiesDonating knitted sweater scarfDonating knit'
+    b'ted child toyPaying bills via debtor repoHas info on criminal whereaboutsMaker NPC headline acti'
+    b'veEco master headline activeEntrepreneur headline activeCitizen scientist walkbyCitizen scientis'
+    b't joined First Order walkbySuspicious citizen walkbyWaiting for recycle disciple scolded timerCi'
+    b'tizen identifier activeFirst Order officer identifier activeSharing fake rumor infoSharing fake '
+    b'holo table security flaw infoSharing fake anti-FO sentiments infoGroup member of mountain excurs'
+    b'ionWaiting for mountain excursion fightWaiting for mountain excursion inspect climbAccusing of c'
+    b'heating at sabaccGoing to KyloAccused of cheating at sabaccReacting to mountain excursionIS spy '
+    b'on BatuuFirst Order officer resistance spy walkbyFound spy on BatuuBronze act 3 mountain excursi'
+    b'onWearing resistance disguiseErasing mind with ReyDelivered spy successfullyBoosting knitting sk'
+    b'ill via club perkSitting in rocking chair as elderWaiting for Batuu exitResistance member patrol'
+    b' 2 walkbyOriginal target of ID checkBatuuan mission giverDiscussed schematics with droidFirst Or'
+    b'der stormtrooper timed high alertResistance negative interaction modifier level 5First Order neg'
+    b'ative interaction modifier level 5Scoundrel negative interaction modifier level 5First Order neg'
+    b'ative interaction modifier level 4First Order negative interaction modifier level 1First Order n'
+    b'egative interaction modifier level 2First Order negative interaction modifier level 3Resistance '
+    b'negative interaction modifier level 4Resistance negative interaction modifier level 1Resistance '
+    b'negative interaction modifier level 2Resistance negative interaction modifier level 3Scoundrel n'
+    b'egative interaction modifier level 4Scoundrel negative interaction modifier level 1Scoundrel neg'
+    b'ative interaction modifier level 2Scoundrel negative interaction modifier level 3Waiting for rec'
+    b'ruitCompleted Batuu mission aspirationWalking like a stormtrooperIncreasing Batuu SNPC relations'
+    b'hip gainWearing First Order uniformBeing investigated in restricted areaResistance sympathizer c'
+    b'itizen walkbyWrong person for defector missionEveryone folded, won sabaccNPC has lightsaberLight'
+    b'saber NPC activeReceived food in Batuu RR3Completed lightsaber challengePlaying sabaccRecently t'
+    b'argeted for mission socialScoundrel mission activeWaiting for knitting yell atPlayed sabacc tour'
+    b'nament 1st opponentPlayed sabacc tournament 2nd opponentPlayed sabacc tournament final opponentF'
+    b'irst Order stormtrooper high alert RS6Sabacc tournament 1st opponent missionSabacc tournament 2n'
+    b'd opponent missionSabacc tournament final opponent missionWaiting for reveal passcodeCompleted F'
+    b'irst Order missionCompleted Resistance missionCompleted Scoundrel missionRescuing with droid in '
+    b'RS8Rescued prisoner in RS8Waiting for pickpocketStarship mission crew roleWaiting for starship e'
+    b'xploreShort resistance caveLong resistance cavePlayer in Batuu regionResistance identifier activ'
+    b'eResistance contact activeEscorting prisonerDespawning prisonerUsing droid aural sensorFighting '
+    b'inspectorBought droid aspiration checkIs knittingFailed to extol mightTracking average practice '
+    b'climbingTracking average breaking point climbingTracking average meticulous session climbingTrac'
+    b'king master breaking point climbingTracking master meticulous session climbingTracking master pr'
+    b'actice climbingTracking novice breaking point climbingTracking novice meticulous session climbin'
+    b'gTracking novice practice climbingEnded patrol in FR13Scoundrel contact activeScored in sabaccWa'
+    b'iting for charmWaiting for NPC bribeDeath cookie warningRich scoundrel activeWaiting for ask abo'
+    b'ut criminalAdvice on avoiding wipeoutsWorkaholic lifestyle activeCelebration over in SS10Waiting'
+    b' to access data in RR15Waiting for chalk handsGaining small climbing skillDistracted droidWaitin'
+    b'g for restricted patrolGaining large climbing skillWaiting for patrolWaiting for make protein ba'
+    b'rWaiting for make energy barMaking progress in visit region for frequent travelerShoes off due t'
+    b'o signSlippers on due to signBoosting skiing skill via club perkCompliant with shoe signNoncompl'
+    b'iant with shoe signFailed to convince to bet valuableCoffee fanatic lifestyle trait activeFreque'
+    b'nt traveler lifestyle activeVisiting cafe for frequent travelerOffer ski expertiseWaiting for in'
+    b'timidatePreparing for the momentBoosting snowboard skill via club perkProviding tipsGetting hype'
+    b'dAsking to be snow broGaining coached climbing skillWaiting in lineClimbing cautiously noviceCli'
+    b'mbing normally noviceClimbing courageously noviceAttempting average climbClimbing cautiously ave'
+    b'rageClimbing courageously averageClimbing normally averageAttempting master climbClimbing cautio'
+    b'usly masterClimbing normally masterClimbing courageously masterStretching it outEnduring the bur'
+    b'nLow intensity on snow slopeHigh intensity on snow slopeMedium intensity on snow slopeWearing ro'
+    b'ck climbing gearCoached snowboarding with successCoached snowboarding with failureCitizen scient'
+    b'ist doing workBatuu til the spireHealth food nut lifestyle activeJunk food devourer lifestyle ac'
+    b'tiveRepairing electronics as techieArriving as onsen employeeAttacked by wildlifeWorking as onse'
+    b'n employeePreferring chopsticksTalking to simbot as techiePreferring forksAt tech career as tech'
+    b'ieAt tech career as technophobeNear climbing mapSnow on ground weatherSedentary lifestyle active'
+    b'Barefoot due to signWearing slippers due to signEnergetic lifestyle activeChanging in to bathe a'
+    b't onsenChanging out of bathe at onsenSoaking in hot springBrowsing vending machineRecently heard'
+    b' propagandaHot springFeeling cold under kotatsuFeeling cool under kotatsuFeeling hot under kotat'
+    b'suFeeling warm under kotatsuInterstellar upgrade exploreStarship breakAt sedentary career as sed'
+    b'entaryAt energetic career as sedentaryAt energetic career as energeticAt sedentary career as ene'
+    b'rgeticIcy weather outside (elder)Icy weather (non-elder)Working overtime in corporate worker car'
+    b'eerWaiting for droid distracted swipeAdrenaline seeker lifestyle activeIndoorsy lifestyle active'
+    b'Outdoorsy lifestyle activeTracking time inside hot springsSpy delivered trueSpy delivered falseU'
+    b'nlocked amazakeUnlocked energy crushUnlocked chicken yakitoriCharismatic crooner trait activeLeg'
+    b'endary stamina trait activeAt clean hot springsRecently recruited or paid in FS8Recently eavesdr'
+    b'opped in FS8Town mascot trait activeVisiting off grid lotUsing electronics as techieUsing electr'
+    b'onics as technophobeWaiting for hiking trail attackPower soaker at onsenWaiting for data spikeGa'
+    b'thering for hot potStarting to cook hot potWaiting to eat hot potEating hot potFirst Order alarm'
+    b' raised at control panelKylo role activeResistance alarm raised at control panelWaiting for SNPC'
+    b' get into positionWorldly knowledge trait activeAt dangerous career as adrenaline seekerGaining '
+    b'fun from energetic interactionsLosing fun from sedentary interactions (energetic)Gaining fun fro'
+    b'm sedentary interactionsLosing fun from energetic interactions (sedentary)Survival instinct trai'
+    b't activeRey role activeChecking ID target for NPC actorGhost of climbing route victimWaiting for'
+    b' demand promotionNeglect level 0 workaholicNeglect level 0 frequent travelerAt mundane career as'
+    b' adrenaline seekerGaining fun as adrenaline seekerNeglect level 0 health nutNeglect level 0 junk'
+    b' foodTracking climbing successTracking climbing large successTracking climbing failureTracking c'
+    b'limbing large failureRey stop and go mind eraseNeglect level 0 techieNeglect level 0 technophobe'
+    b'Neglect level 0 networkerNeglect level 0 close knitTracking average breaking point reachedTracki'
+    b'ng master breaking point reachedTracking novice breaking point reachedTracking average peak trai'
+    b'ningTracking master peak trainingTracking novice peak trainingTracking average slow and steadyTr'
+    b'acking master slow and steadyTracking novice slow and steadyTracking spectacular climbingTrackin'
+    b'g summit or plummetTracking less talk more chalkTracking failed slip gripTracking reaching rock '
+    b'bottomTracking excels at elevatingTracking practice not make perfectTracking peak failureNeglect'
+    b' level 0 sedentaryNeglect level 0 energeticLosing fun from sedentary posture (energetic)Gaining '
+    b'fun from sedentary postureWaiting for onsen no socializeWaiting for onsen showerNeglect level 0 '
+    b'no need for romanceNeglect level 0 hungry for loveVisiting town mascot statueWaiting for autonom'
+    b'ous knittingNo snow shoveling allowedIn a relationship as hungry for loveIn a fight during inspe'
+    b'ctionNeglect level 0 adrenaline seekerNeglect level 0 indoorsyNeglect level 0 outdoorsyEnded sab'
+    b'acc gameWarm from hot potWaiting for take selfieon mountainStarted eating hot potRomantic media '
+    b'timer activeWaiting for take photoon mountainHolotable alarm triggeredConsuming romantic media a'
+    b's hungry for loveSleep timer for lifestylesJogging on hiking trailMeditative walk on hiking trai'
+    b'lWalking on hiking trailLocked out of capsule due to mascotVending machine always succeed debugV'
+    b'ending machine always fail debugPerformed romantic interactionNo relationship as no need for rom'
+    b'anceHas relationship as no need for romanceNo relationship as hungry for loveConsuming romantic '
+    b'media as no need for romanceFlirty conversation as no need for romanceForcing success outcome on'
+    b' slopeForcing failure outcome on slopeInvited NPC on BatuuLeader of tandem sleddingBetween betti'
+    b'ng phases in sabaccFeeling scaredFeeling terrifiedWaiting for intimidatein FR13Betting in sabacc'
+    b'Failed recruit heistOutdoors as outdoorsyIndoors as outdoorsyGaining fun from outdoor interactio'
+    b'nsLosing fun from indoor interactionsIndoors as indoorsyOutdoors as indoorsyGaining fun from ind'
+    b'oor interactionsLosing fun from outdoor interactionsExiting seanceProper trait activeSlope setti'
+    b'ngs clear timer activeAdventurous trait activeGhost of vending machine victimForcing X event suc'
+    b'cess on slopeForcing X event fail on slopeNeglect level 0 coffee fanaticAt generic destinationCr'
+    b'ashed on snow slopeDid sex as batDid sex in bushDid sex in hot tubDid sex in island waterfallDid'
+    b' sex in leaf pileDid sex in lighthouseDid sex in rocket shipDid sex in sleeping podDid sex in st'
+    b'eam roomDid sex in telescopeDid sex in closetDid sex in coffinDid sex in dumpsterDid sex in dwel'
+    b'lingDid sex in hot springsDid sex in tentDid sex in walk-in safeIn alien world regionLocked out '
+    b'of hanging around statueBonus skill for low skill adventurousGaining bored for high skill advent'
+    b'urousRecently skied or snowboardedWaiting for rock climbing gear repairVoidcritter hunt availabl'
+    b'eReceived voidcritter hunt prizeRecent extreme success on slopeRecent extreme success on climbRe'
+    b'cently climbedVoidcritter hunt available for NPCAt outdoorsy career as outdoorsyFirst time in ha'
+    b'unted houseWaiting for offer rock climbing tipsSuccessful ceremony at seance tableAt mundane ven'
+    b'ue as adrenaline seekerWearing festival kimonoWearing festival snow outfitWearing festival paper'
+    b' kabutoBonehilda trait activeBrave trait activeUnblessed check at festivalSleeping while scaredW'
+    b'aiting for dangerous weatherRemove count after voidcritter hunt festivalAt exciting venue as adr'
+    b'enaline seekerAt outdoor career as indoorsyStressed from indoor workBoosting rock climbing skill'
+    b' via club perkChecking conditionsWaiting for forbidden candyProtein bar consume timerEnergy bar '
+    b'consume timerUsing rental gear on slopePreventing immediate hiking scoringMindful walk on hiking'
+    b' trailWalking slowestPanic run from centipedeTechie trait activeTechnophobe trait activeClose kn'
+    b'it trait activeNetworker trait activeSingle and loving it trait activeHungry for love trait acti'
+    b'veWaiting for visit regionGaining fun from thrill seeking interactionsLosing fun from mundane in'
+    b'teractionsWaiting for near partnerImmune to specter reactionWaiting for wake up(romance)Particip'
+    b'ating in hot potCan ask about home regionNot wearing shoesRecent injury on slopeOut late timer f'
+    b'or corporate workerWear snowboard bootsWear ski bootsTracking hot springs buffAdjusting motives '
+    b'for mountain excursionInteracting with toddler mentoreeGood weather at festivalGood weather at s'
+    b'now festivalParanormal investigator activeWaiting for specter reactionShakingWaiting for accurse'
+    b'd reactionIn seanceLetter pending for interior decorator client callAt commercial venue for inte'
+    b'rior decoratorWearing snowboard bootsWearing ski bootsSledding on slopeGuidry goodbye activeChec'
+    b'king ghost formWaiting for heroic modeTemperance haunted house trait activeWaiting for paranorma'
+    b'l investigator reactionWaiting for Guidry drinkWaiting for Guidry helpWaiting for Guidry hungryW'
+    b'aiting for Guidry sleepWaiting for Guidry too scaredEncouragement while scaredRemoving turns on '
+    b'slopeWaiting for doll createBrowsing craft sales tableWaiting for Guidry soulWaiting for specter'
+    b' summonWaiting for Temperance breakWaiting for Bonehilda nannyLeaving now as paranormal investig'
+    b'atorHosting interior decorator interviewClient at interior decorator interviewScrap of soul acti'
+    b'veHigh fun motiveGuidry gig activeOvermax paranormal investigatorWaiting for fear of vacuumFear '
+    b'of vacuum pet quirk activeObsess over vacuum pet quirk activeDirty filthy dust stateUsed filthy '
+    b'toiletDid not wash hands after filthy toiletWashed hands after filthy toiletFire me bad behavior'
+    b' interior decoratorTracking bad behavior interior decoratorExploring renovation as clientLactose'
+    b' intolerant trait activeAnimal enthusiast trait activeDid sex in livestock penGhost of killer ra'
+    b'bbit victimSponsorship package pendingWaiting for sponsorshipFeatured on TV positiveWaiting for '
+    b'TVWaiting for slipNeat neurotic clean traitWaiting for solve hard problemsFeatured on TV negativ'
+    b'eEureka moment skillWaiting for look at bright sideHappy bonus for cheerful traitVaporizing puls'
+    b'e from vacuumWaiting for retryFinal reaction to renovation explorationNormal reaction to renovat'
+    b'ion explorationWaiting for autonomous vacuumQuality increase for perfectionistHave required ingr'
+    b'edientsExploring renovation as hostShared final verdict trueWaiting as client during revealNear '
+    b'ghost (gloomy)Dislikes videogamingDislikes cookingDislikes paintingDislikes fitnessDislikes viol'
+    b'inLikes cookingLikes fitnessLikes paintingLikes videogamingLikes violinExiting to watch TV showF'
+    b'reeze missing SO timerWaiting for talk through issuesNotified by TV showFled child (hates childr'
+    b'en)Fox traitWaiting for client socialWatching target as foxLearned info 1 at interviewLearned in'
+    b'fo 2 at interviewJudging village fairSubmitted A at village fairSubmitted B at village fairJudge'
+    b'd village fairGeneric festival goer at village fairDo something debug for client callIn a client'
+    b' roleGiant crop cryStealing situation foxIn a client situationArriving at venue as celebrityBasi'
+    b'cs decor reactionBoho decor reactionContemporary decor reactionCosmolux decor reactionFrench cou'
+    b'ntry decor reactionGarden decor reactionGothic farmhouse decor reactionIsland decor reactionMiss'
+    b'ion decor reactionModern decor reactionPatio decor reactionQueen Anne decor reactionScandinavian'
+    b' contemporary decor reactionSuburban contempo decor reactionTudor decor reactionDropping bag for'
+    b' deliveryWaiting for delivery customerWorking as delivery personWaiting for a tipRecently asked '
+    b"for a tipWaiting for client's reaction to renovationIs Agnes CrumplebottomIs the Creature Keeper"
+    b'Is the Grocery Delivery personIs the Grocery Stall OwnerIs the MayorIs the Pub OwnerRecently tau'
+    b'ght others about plantsInspecting the renovation revealWaiting outside during renovationStalking'
+    b' prey as a foxSwimming in Henford-on-BagleyFishing in Henford-on-BagleyGardening in Henford-on-B'
+    b'agleyFinished revealing the renovationSocializing in Henford-on-BagleyLearning Cross-stitch fast'
+    b'er due to club perkPicnickingGathering to cook with a groupCooking with a groupLeading a group c'
+    b'ooking sessionGossiping with villagersRecently expressed dislike for actingRecently expressed di'
+    b'slike for bakingRecently expressed dislike for bowlingRecently expressed dislike for comedyRecen'
+    b'tly expressed dislike for dancingRecently expressed dislike for debatingRecently expressed disli'
+    b'ke for DJ mixingRecently expressed dislike for fishingRecently expressed dislike for gardeningRe'
+    b'cently expressed dislike for guitarRecently expressed dislike for handinessRecently expressed di'
+    b'slike for media productionRecently expressed dislike for mischiefRecently expressed dislike for '
+    b'mixologyRecently expressed dislike for photographyRecently expressed dislike for pianoRecently e'
+    b'xpressed dislike for roboticsRecently expressed dislike for rocket scienceRecently expressed dis'
+    b'like for singingRecently expressed dislike for skiingRecently expressed dislike for snowboarding'
+    b'Recently expressed dislike for wellnessRecently expressed dislike for writingRecently expressed '
+    b'liking for actingRecently expressed liking for bakingRecently expressed liking for bowlingRecent'
+    b'ly expressed liking for comedyRecently expressed liking for dancingRecently expressed liking for'
+    b' debatingRecently expressed liking for DJ mixingRecently expressed liking for gardeningRecently '
+    b'expressed liking for guitarRecently expressed liking for handinessRecently expressed liking for '
+    b'media productionRecently expressed liking for mischiefRecently expressed liking for mixologyRece'
+    b'ntly expressed liking for photographyRecently expressed liking for pianoRecently expressed likin'
+    b'g for roboticsRecently expressed liking for rocket scienceRecently expressed liking for singingR'
+    b'ecently expressed liking for skiingRecently expressed liking for snowboardingRecently expressed '
+    b'liking for wellnessRecently expressed liking for writingRecently expressed dislike for pipe orga'
+    b'nRecently expressed liking for pipe organRecently expressed dislike for rock climbingRecently ex'
+    b'pressed liking for rock climbingRecently expressed liking for fishingLeading the cookingAbout to'
+    b' die from a killer rabbit attackWaiting outside during renovation without household membersWande'
+    b'ring near the woodsParticipating in the Village FairGossiping in the open streetRecently visited'
+    b' the town squareForaging for wild itemsTending to the garden as Creature KeeperForaging as Creat'
+    b'ure KeeperCooking as Creature KeeperInteracting with animals as Creature KeeperRecently expresse'
+    b'd liking for programmingRecently expressed dislike for programmingCompleted the final verdict fo'
+    b'r the renovationStopped stalking as a foxRecently offered a favorRecently received a favorRecent'
+    b'ly learned client informationFeels at home in the countrysideRecently made picnic foodViewing an'
+    b'imal pens at the fairFocused on stealing an egg as a foxFocused on stalking prey as a foxViewing'
+    b' competition stand AViewing competition stand BRecently received a free drinkListening to music '
+    b'in the woodsFailed the renovation gig badlyRenovation gig was a huge successRenovation gig was a'
+    b' successRenovation gig was a failureRecently dealt with a garden mystery boxRecently dealt with '
+    b'a grocery mystery boxWaiting for the renovation reveal to startGaining professional reputationCh'
+    b'ecking for festival blessingsRecently listened to Alternative musicRecently listened to American'
+    b'a musicRecently listened to Backyard musicRecently listened to Baroque musicRecently listened to'
+    b' Blues musicRecently listened to Classical musicRecently listened to Easy Listening musicRecentl'
+    b'y listened to Electronica musicRecently listened to Focus musicRecently listened to Hip Hop musi'
+    b'cRecently listened to Island musicRecently listened to Japanese Folk musicRecently listened to J'
+    b'azz musicRecently listened to Kids musicRecently listened to Latin musicRecently listened to Lat'
+    b'in Pop musicRecently listened to Lullabies musicRecently listened to Metal musicRecently listene'
+    b'd to New Age musicRecently listened to NuDisco musicRecently listened to Pop musicRecently liste'
+    b'ned to Retro musicRecently listened to Romance musicRecently listened to Singer-Songwriter music'
+    b'Recently listened to Spooky musicRecently listened to Strange Tunes musicRecently listened to Su'
+    b'mmer Strut musicRecently listened to Tween Pop musicRecently listened to Winter Holiday musicRec'
+    b'ently listened to World musicRecently listened to S-Pop musicRedeemed a delivery couponBeing men'
+    b"tored in cookingWatching a renovation reveal as a guestPlaying inside a kid's tentPlaying inside"
+    b" a kid's tentPlaying inside a kid's tentPlaying inside a kid's tentPlaying inside a kid's tentGa"
+    b'thering the group for the renovation revealExpressing a color preferenceExpressing a color disli'
+    b'keTaking a break from social villager questsTaking a break from livestock villager questsTaking '
+    b'a break from garden villager questsTaking a break from wild animal villager questsTaking a break'
+    b' from foraging villager questsTaking a break from medium social villager questsTaking a break fr'
+    b'om long livestock/garden villager questsTaking a break from long wild animal/foraging villager q'
+    b'uestsRoaming the streets as a foxIs a ghost killed by a chickenWindow shopping in the villageDis'
+    b'liking the environment due to Snob traitEnvironment does not match preferencesHas been bribed at'
+    b' the fairPlaying in a tentRecently interacted with a snailRecently used a cowbellNear the ruins '
+    b'in Henford-on-BagleyViewed a notification about the fairScared by an Evil Chicken as a foxCurren'
+    b'tly on a villager errandChicken defeated the Grim ReaperWandering on a lot as a foxWearing Grand'
+    b'ma fox clothingWearing Robber fox clothingWearing Robin Hood fox clothingJust kicked out during '
+    b'a renovation revealHas not shared the final verdict yetTracking relationship with pounce targetf'
+    b'or fair traditionsMeeting a villager for the first timeCheating at the village fairCheating at t'
+    b'he village fairCheating at the village fairCheating at the village fairSinging with birdsIdleRen'
+    b'ovation reveal kickoff delayedStopped group cookingRecently contacted by a clientScared by a roo'
+    b'ster as a foxStarting a music festival performanceEnding a music festival performanceReacting to'
+    b' the crowd during performanceStole an egg as a foxSitting as Creature KeeperGoing home as Creatu'
+    b're KeeperPerforming at a music festivalAttending a music festivalHanging out after the festival '
+    b'performanceWatching the opening actWatching the opening actWatching the main artistDelivering gr'
+    b'oceriesIn Henford-on-BagleyPerforming as an opening actPerforming as an opening actPerforming as'
+    b' the main artistNear the festival stageWearing Grandma fox clothingWearing Grandma fox clothingW'
+    b'earing Grandma fox clothingWearing Grandma fox clothingWearing Grandma fox clothingWearing Robbe'
+    b'r fox clothingWearing Robber fox clothingWearing Robber fox clothingWearing Robber fox clothingW'
+    b'earing Robber fox clothingWearing Robber fox clothingWearing Robin Hood fox clothingWearing Robi'
+    b'n Hood fox clothingWearing Robin Hood fox clothingWearing Robin Hood fox clothingWearing Robin H'
+    b'ood fox clothingWatching the opening act performanceWatching the opening act performanceWatching'
+    b' the main artist performanceStarting to cook with a groupFeeling filthyFeeling dirtyFinishing wa'
+    b'tching the concertReacting to the concert musicStarting to watch the concertWalking onto the sta'
+    b'geWaking up as a foxRecently played music to an animalLeaving the lot as a foxLeaving the music '
+    b'festivalRecently bought something at the festivalAttending the festival as an NPCUsing fox cheat'
+    b'sRecently got hyped at the festivalLeaving the area as a foxIs an InfantHad an epiphany about ho'
+    b'mework during meditationWearing round beige manicureWearing round black manicureWearing round bl'
+    b'ue manicureWearing coffin beige manicureWearing coffin black manicureWearing coffin blue manicur'
+    b'eWearing coffin beige manicureWearing coffin black manicureWearing coffin blue manicureWearing r'
+    b'ound beige manicureWearing round black manicureWearing round blue manicureWearing coffin light b'
+    b'lue manicureWearing round light blue manicureWearing coffin light blue manicureWearing round lig'
+    b'ht blue manicureWearing coffin green manicureWearing round green manicureWearing a relaxing face'
+    b' maskWearing coffin green manicureWearing round green manicureWearing coffin lilac manicureWeari'
+    b'ng round lilac manicureWearing coffin lilac manicureWearing round lilac manicureWearing coffin p'
+    b'ink manicureWearing round pink manicureWearing coffin pink manicureWearing round pink manicureWe'
+    b'aring coffin purple manicureWearing round purple manicureWearing coffin purple manicureWearing r'
+    b'ound purple manicureWearing coffin red manicureWearing round red manicureWearing coffin red mani'
+    b'cureWearing round red manicureWearing coffin silver manicureWearing round silver manicureWearing'
+    b' coffin silver manicureWearing round silver manicureWearing coffin white manicureWearing round w'
+    b'hite manicureWearing coffin white manicureWearing round white manicureWearing coffin yellow mani'
+    b'cureWearing round yellow manicureWearing coffin yellow manicureWearing round yellow manicureFini'
+    b'shed one massage chair treatmentWearing an animal face maskWearing a toddler face maskWearing an'
+    b' anti-aging face maskWearing a UV protection face maskWearing a gold face maskWearing a hydratin'
+    b'g face maskWearing red pedicureWearing red pedicureFeeling refreshed from a cold face maskNails '
+    b'are worn outWearing almond beige manicureWearing almond black manicureWearing almond blue manicu'
+    b'reWearing almond light blue manicureWearing almond cream manicureWearing almond green manicureWe'
+    b'aring almond lilac manicureWearing almond pink manicureWearing almond purple manicureWearing alm'
+    b'ond red manicureWearing almond silver manicureWearing almond white manicureWearing almond yellow'
+    b' manicureWearing almond beige manicureWearing almond black manicureWearing almond blue manicureW'
+    b'earing almond light blue manicureWearing almond cream manicureWearing almond green manicureWeari'
+    b'ng almond lilac manicureWearing almond pink manicureWearing almond purple manicureWearing almond'
+    b' red manicureWearing almond silver manicureWearing almond white manicureWearing almond yellow ma'
+    b'nicureWearing matte coffin beige manicureWearing matte coffin black manicureWearing matte coffin'
+    b' blue manicureWearing matte coffin light blue manicureWearing matte coffin green manicureWearing'
+    b' matte coffin lilac manicureWearing matte coffin pink manicureWearing matte coffin purple manicu'
+    b'reWearing matte coffin red manicureWearing matte coffin silver manicureWearing matte coffin whit'
+    b'e manicureWearing matte coffin yellow manicureWearing matte coffin beige manicureWearing matte c'
+    b'offin black manicureWearing matte coffin blue manicureWearing matte coffin light blue manicureWe'
+    b'aring matte coffin green manicureWearing matte coffin lilac manicureWearing matte coffin pink ma'
+    b'nicureWearing matte coffin purple manicureWearing matte coffin red manicureWearing matte coffin '
+    b'silver manicureWearing matte coffin white manicureWearing matte coffin yellow manicureWearing ar'
+    b'tistic coffin manicureWearing artistic coffin manicureWearing artistic coffin manicureWearing ar'
+    b'tistic coffin manicureWearing artistic coffin manicureWearing artistic coffin manicureWearing ar'
+    b'tistic coffin manicureWearing artistic coffin manicureWearing artistic coffin manicureWearing ar'
+    b'tistic coffin manicureWearing artistic coffin manicureWearing artistic coffin manicureWearing bl'
+    b'ack swirl coffin manicureWearing blue swirl coffin manicureWearing cream swirl coffin manicureWe'
+    b'aring pink swirl coffin manicureWearing purple swirl coffin manicureWearing white swirl coffin m'
+    b'anicureWearing black swirl coffin manicureWearing blue swirl coffin manicureWearing cream swirl '
+    b'coffin manicureWearing pink swirl coffin manicureWearing purple swirl coffin manicureWearing whi'
+    b'te swirl coffin manicureWearing pink buffed short round manicureWearing white buffed short round'
+    b' manicureWearing pink buffed short round manicureWearing white buffed short round manicureWearin'
+    b'g gradient stiletto beige manicureWearing gradient stiletto black manicureWearing gradient stile'
+    b'tto blue manicureWearing gradient stiletto light blue manicureWearing gradient stiletto green ma'
+    b'nicureWearing gradient stiletto lilac manicureWearing gradient stiletto pink manicureWearing gra'
+    b'dient stiletto purple manicureWearing gradient stiletto red manicureWearing gradient stiletto si'
+    b'lver manicureWearing gradient stiletto white manicureWearing gradient stiletto yellow manicureWe'
+    b'aring gradient stiletto beige manicureWearing gradient stiletto black manicureWearing gradient s'
+    b'tiletto blue manicureWearing gradient stiletto light blue manicureWearing gradient stiletto gree'
+    b'n manicureWearing gradient stiletto lilac manicureWearing gradient stiletto pink manicureWearing'
+    b' gradient stiletto purple manicureWearing gradient stiletto red manicureWearing gradient stilett'
+    b'o silver manicureWearing gradient stiletto white manicureWearing gradient stiletto yellow manicu'
+    b'reWearing split stiletto beige manicureWearing split stiletto beige manicureWearing split stilet'
+    b'to black manicureWearing split stiletto black manicureWearing split stiletto blue manicureWearin'
+    b'g split stiletto blue manicureWearing split stiletto light blue manicureWearing split stiletto l'
+    b'ight blue manicureWearing split stiletto green manicureWearing split stiletto green manicureWear'
+    b'ing split stiletto lilac manicureWearing split stiletto lilac manicureWearing split stiletto pin'
+    b'k manicureWearing split stiletto pink manicureWearing split stiletto purple manicureWearing spli'
+    b't stiletto red manicureWearing split stiletto purple manicureWearing split stiletto red manicure'
+    b'Wearing split stiletto silver manicureWearing split stiletto silver manicureWearing split stilet'
+    b'to white manicureWearing split stiletto yellow manicureWearing split stiletto white manicureWear'
+    b'ing split stiletto yellow manicureWearing round contrast asexual flag manicureWearing round cont'
+    b'rast bisexual flag manicureWearing round contrast blue manicureWearing round contrast gray manic'
+    b'ureWearing round contrast leather flag manicureWearing round contrast non-binary flag manicureWe'
+    b'aring round contrast orange manicureWearing round contrast pansexual flag manicureWearing round '
+    b'contrast pastel manicureWearing round contrast pink manicureWearing round contrast pride flag ma'
+    b'nicureWearing round contrast trans flag manicureWearing round contrast asexual flag manicureWear'
+    b'ing round contrast bisexual flag manicureWearing round contrast blue manicureWearing round contr'
+    b'ast gray manicureWearing round contrast leather flag manicureWearing round contrast non-binary f'
+    b'lag manicureWearing round contrast orange manicureWearing round contrast pansexual flag manicure'
+    b'Wearing round contrast pastel manicureWearing round contrast pink manicureWearing round contrast'
+    b' pride flag manicureWearing round contrast trans flag manicureWearing short round contrast asexu'
+    b'al flag manicureWearing short round contrast bisexual flag manicureWearing short round contrast '
+    b'blue manicureWearing short round contrast gray manicureWearing short round contrast leather flag'
+    b' manicureWearing short round contrast non-binary flag manicureWearing short round contrast orang'
+    b'e manicureWearing short round contrast pansexual flag manicureWearing short round contrast paste'
+    b'l manicureWearing short round contrast pink manicureWearing short round contrast pride flag mani'
+    b'cureWearing short round contrast trans flag manicureWearing short round contrast asexual flag ma'
+    b'nicureWearing short round contrast bisexual flag manicureWearing short round contrast blue manic'
+    b'ureWearing short round contrast gray manicureWearing short round contrast leather flag manicureW'
+    b'earing short round contrast non-binary flag manicureWearing short round contrast orange manicure'
+    b'Wearing short round contrast pansexual flag manicureWearing short round contrast pastel manicure'
+    b'Wearing short round contrast pink manicureWearing short round contrast pride flag manicureWearin'
+    b'g short round contrast trans flag manicureWearing short round beige manicureWearing short round '
+    b'blue manicureWearing short round black manicureWearing short round light blue manicureWearing sh'
+    b'ort round green manicureWearing short round lilac manicureWearing short round pink manicureWeari'
+    b'ng short round purple manicureWearing short round red manicureWearing short round silver manicur'
+    b'eWearing short round white manicureWearing beige pedicureWearing black pedicureWearing blue pedi'
+    b'cureWearing light blue pedicureWearing green pedicureWearing lilac pedicureWearing pink pedicure'
+    b'Wearing purple pedicureWearing silver pedicureWearing white pedicureWearing yellow pedicureWeari'
+    b'ng beige pedicureWearing blue pedicureWearing light blue pedicureWearing green pedicureWearing l'
+    b'ilac pedicureWearing pink pedicureWearing purple pedicureWearing silver pedicureWearing white pe'
+    b'dicureWearing yellow pedicureWearing cream pedicureWearing cream pedicureWearing black pedicureC'
+    b'arrying an infant on backWearing cream coffin manicureWearing matte cream coffin manicureWearing'
+    b' cream coffin manicureWearing matte cream coffin manicureWearing short round yellow manicureWear'
+    b'ing short round beige manicureWearing short round black manicureWearing short round blue manicur'
+    b'eWearing short round light blue manicureWearing short round green manicureWearing short round li'
+    b'lac manicureWearing short round pink manicureWearing short round purple manicureWearing short ro'
+    b'und red manicureWearing short round silver manicureWearing short round white manicureWearing sho'
+    b'rt round yellow manicureWearing cream gradient stiletto manicureWearing cream gradient stiletto '
+    b'manicureWearing cream split stiletto manicureWearing cream split stiletto manicureBeing carried '
+    b"on someone's backWaiting for yoga class to startMeditating on a stoolWearing community blue mani"
+    b'cureWearing community blue manicureParticipating in a guided meditation classPreparing to teach '
+    b'meditationWorking at the massage chairOffering a foot massageOffering a hand massageOffering a m'
+    b'anicureOffering a pedicureWaiting for meditation class to beginFinished a meditation classRequir'
+    b'es high maintenanceRecently had a moment of clarityRecently projected a calming auraWearing a sp'
+    b'oiled face maskDoing yoga outsideMeditating outsideWorking at the massage tableFeeling peacefulJ'
+    b'ust received an aromatherapy massageJust received a deep tissue massageJust received a fertility'
+    b' massageJust received a sports massageJust received a stone massageJust received a Swedish massa'
+    b'geFeeling satisfied with wellnessFeeling regular wellness levelsUncomfortable in the sun due to '
+    b'High MaintenanceRecovering from a high maintenance episodeRecovering from having the worst dayMa'
+    b'intaining inner harmonyAchieved inner harmonyMastered wellness skillsFocused on wellness activit'
+    b'iesFocused on wellness activities for a set timeResolving a high maintenance struggleRecently pr'
+    b'omoted wellnessRecently expressed dislike for Basic fashionRecently expressed liking for Basic f'
+    b'ashionWearing community black manicureWearing community fuchsia manicureWearing community green '
+    b'manicureWearing community mint manicureWearing community orange manicureWearing community pink m'
+    b'anicureWearing community plum manicureWearing community purple manicureWearing community red man'
+    b'icureWearing community yellow manicureWearing community black manicureWearing community fuchsia '
+    b'manicureWearing community green manicureWearing community mint manicureWearing community orange '
+    b'manicureWearing community pink manicureWearing community plum manicureWearing community purple m'
+    b'anicureWearing community red manicureWearing community yellow manicureHustling for wellness clie'
+    b'ntsReceived no payment for meditation instructionReceived negative feedback on meditation instru'
+    b'ctionReceived positive feedback on meditation instructionReceived a tip for meditation instructi'
+    b'onAttending high school classDrinking wellness teaWearing blue and yellow contrast manicureWeari'
+    b'ng black and pink contrast manicureWearing pink and white contrast manicureWearing purple and ma'
+    b'uve contrast manicureWearing short black and pink contrast manicureWearing short blue and yellow'
+    b' contrast manicureWearing short pink and white contrast manicureWearing short purple and mauve c'
+    b'ontrast manicureWearing black and pink contrast manicureWearing blue and yellow contrast manicur'
+    b'eWearing pink and white contrast manicureWearing purple and mauve contrast manicureWearing short'
+    b' black and pink contrast manicureWearing short blue and yellow contrast manicureWearing short pi'
+    b'nk and white contrast manicureWearing short purple and mauve contrast manicureWearing short choc'
+    b'olate round manicureWearing short mauve round manicureWearing short dusty pink round manicureWea'
+    b'ring short mauve round manicureWearing short chocolate round manicureWearing short dusty pink ro'
+    b'und manicureWearing teal swirl coffin manicureWearing space swirl coffin manicureWearing space s'
+    b'wirl coffin manicureWearing teal swirl coffin manicureRecently served a repeat customerBrewing w'
+    b'ellness teaFeeling socially awkwardComforting self about awkwardnessGetting a coffin manicureGet'
+    b'ting an almond manicureGetting a community manicureGetting a round manicureGetting a stiletto ma'
+    b'nicureReady for a manicureCurrently getting a manicureRemoving nail polishLost a gameAfraid of b'
+    b'eing wrongRelaxing with a foot soakWaiting to change into a robeVisiting the spaWaiting to chang'
+    b'e into a robeTook off shoesTook off shoesTook off shoesCompleted an aspiration goalCompleted a w'
+    b'ork taskUsing phone while walkingRecently discussed expanding the familyRecently expressed disli'
+    b'ke for knittingRecently expressed liking for knittingRecently expressed dislike for cross-stitch'
+    b'Recently expressed liking for cross-stitchRecently listened to Cottage Core musicVisiting a wedd'
+    b'ing venueFailed to convince someone to pursue dream jobSuccessfully convinced someone to pursue '
+    b'dream jobIs a newlywedMotives decaying slowly during wedding partyArriving at a Bachelor or Bach'
+    b'elorette partyHanging out at the bar during Bachelor partyDancing at Bachelor partyEating desser'
+    b't at Bachelor partyEating dinner at Bachelor partyDrinking at Bachelor partyMaking a toast at Ba'
+    b'chelor partyDistressed due to low attachment needsFeeling cold-heartedSleepingFinished sleepingS'
+    b'uccessfully discussed expanding the familyStudying with a buddy at schoolWiggling as an infantAr'
+    b'riving at own weddingCarrying infant on right sideCaring for a babyRecently carried an infantPre'
+    b'paring for classAttending class as a studentTeaching a classStarting a Town Hall weddingIs a Wer'
+    b'ewolfFinished Town Hall weddingBullying others at schoolGetting married at Town HallUsing social'
+    b' media at schoolRecruiting for a high school teamStopping an interactionAttending High School or'
+    b'ientationAttending High School classServing detentionObserving class as PrincipalIs on the Cheer'
+    b' teamIs on the Football teamIs on the Chess teamIs on the Computer teamRecently conquered a fear'
+    b'Afraid of CowplantsPosting on social media frequentlyPosting on social media less frequentlyAfra'
+    b'id of fireAfraid of nearby ghostsIs a Calm infantAfraid of swimmingMingling at a weddingMingling'
+    b' at a weddingMingling at a weddingMingling at a weddingMingling at a weddingIs a Sunny infantArr'
+    b'iving at own weddingSitting down at own weddingCutting the cake at own weddingWalking down the a'
+    b'isle at own weddingWalking back down the aisle at own weddingRegaining passion for jobSitting do'
+    b'wn at weddingFeeling fear of a dead-end jobHas entrepreneurial knowledgeAfraid of the darkGather'
+    b'ing bouquet at own weddingTossing bouquet at own weddingEating cake at own weddingGathering for '
+    b'cake at own weddingDancing at own weddingGathering for dance at own weddingDancing on dance floo'
+    b'r at own weddingEating meal at own weddingPost-ceremony activity at own weddingGathering for rec'
+    b'essional at own weddingMaking a toast at own weddingExchanging vows at own weddingGathering for '
+    b'toasts at own weddingMaking vows speech at own weddingExchanging vows with officiant at own wedd'
+    b'ingArriving as flower spreaderGathering for bouquet toss as flower spreaderWalking back down ais'
+    b'le as flower spreaderGathering for recessional as flower spreaderSitting down as flower spreader'
+    b'Listening to toast as flower spreaderGathering for toast as flower spreaderListening to vows as '
+    b'flower spreaderListening to vows speech as flower spreaderListening to vows with officiant as fl'
+    b'ower spreaderWatching bouquet toss as flower spreaderWatching cake cutting as flower spreaderEat'
+    b'ing cake as flower spreaderGathering for cake as flower spreaderDancing as flower spreaderGather'
+    b'ing for dance as flower spreaderDancing on dance floor as flower spreaderEating meal as flower s'
+    b'preaderPost-ceremony activity as flower spreaderWalking down aisle as flower spreaderArriving as'
+    b' wedding guestGathering for bouquet toss as wedding guestWalking down aisle as wedding guestWalk'
+    b'ing back down aisle as wedding guestGathering for recessional as wedding guestListening to toast'
+    b' as wedding guestGathering for toast as wedding guestListening to vows as wedding guestListening'
+    b' to vows speech as wedding guestListening to vows with officiant as wedding guestWatching cake c'
+    b'utting as wedding guestWatching bouquet toss as wedding guestEating cake as wedding guestGatheri'
+    b'ng for cake as wedding guestDancing as wedding guestGathering for dance as wedding guestDancing '
+    b'on dance floor as wedding guestEating meal as wedding guestPost-ceremony activity as wedding gue'
+    b'stArriving as honor attendantGathering for bouquet toss as honor attendantWalking back down aisl'
+    b'e as honor attendantGathering for recessional as honor attendantSitting down as honor attendantL'
+    b'istening to toast as honor attendantGathering for toast as honor attendantListening to vows as h'
+    b'onor attendantListening to vows speech as honor attendantListening to vows with officiant as hon'
+    b'or attendantWatching bouquet toss as honor attendantWatching cake cutting as honor attendantEati'
+    b'ng cake as honor attendantGathering for cake as honor attendantDancing as honor attendantGatheri'
+    b'ng for dance as honor attendantDancing on dance floor as honor attendantEating meal as honor att'
+    b'endantPost-ceremony activity as honor attendantWalking down aisle as honor attendantArriving as '
+    b'officiantGathering for bouquet toss as officiantWalking back down aisle as officiantGathering fo'
+    b'r recessional as officiantSitting down as officiantListening to toast as officiantGathering for '
+    b'toast as officiantOfficiating vowsOfficiating vows speechOfficiating vowsWatching bouquet toss a'
+    b's officiantWatching cake cutting as officiantEating cake as officiantGathering for cake as offic'
+    b'iantDancing as officiantGathering for dance as officiantDancing on dance floor as officiantEatin'
+    b'g meal as officiantPost-ceremony activity as officiantWalking down aisle as officiantDancing in '
+    b'a group at a weddingAfraid of being cheated onReviewing a product as a SimfluencerHaving tea at '
+    b'a wedding partyGained a new followerConfronting partner about cheating fearGetting lunch at scho'
+    b'olFinished officiant speechDoing a victory danceSad because of dirty diaperListening to a bedtim'
+    b'e storyBeing lulled to sleepBeing soothed to sleepNear a fountain in TartosaNear a tree in Tarto'
+    b'saGoing to the whiteboardSitting in a high chairSitting or lying in a cribPlaying on a playmatHo'
+    b'lding a wedding bouquetHolding a wedding bouquetHolding a wedding bouquetHolding a wedding bouqu'
+    b'etHolding a wedding bouquetHolding a wedding bouquetHolding a wedding bouquetHolding a wedding b'
+    b'ouquetHolding a wedding bouquetHolding a wedding bouquetHolding a wedding bouquetHolding a weddi'
+    b'ng bouquetHolding a wedding bouquetHolding a wedding bouquetHolding a wedding bouquetThinking ab'
+    b'out commitmentJust had romantic time while married on vacationTalking about marriageJust married'
+    b'Browsing the thrift storeLeading a T-Pose challengeVisiting the thrift storeDrinking Bubble Tea '
+    b'at the thrift storeWaiting to perform comedy at thrift storePerforming comedy at thrift storePer'
+    b'forming poetry at thrift storeWaiting to perform poetry at thrift storePerformed at the thrift s'
+    b'tore eventParticipating in a fire drillParticipating in a fire drillDiscussing wedding tradition'
+    b'sShowing off an outfit at the thrift storePassively watching an infantActively caring for an inf'
+    b'antIs engagedCooked a group mealKnowing a Country fashion trend tipKnowing a Preppy fashion tren'
+    b'd tipKnowing a Hipster fashion trend tipKnowing a Boho fashion trend tipKnowing a Streetwear fas'
+    b'hion trend tipKnowing an Outdoorsy fashion trend tipKnowing a Basics fashion trend tipKnowing a '
+    b'Rocker fashion trend tipKnowing no fashion trend tipKnowing a Polished fashion trend tipAttendin'
+    b'g Career Day at schoolSolving a chess puzzle at Science FairDoing a Game Jam at Science FairFini'
+    b'shed a wedding speechIn the auditorium for Career DayParticipating in Career DayDoing a solo che'
+    b'er at Sports DayWatching a festival competitionSubmitting a score at a festivalPlaying with a ta'
+    b'blet at Science FairPlaying chess at Science FairCausing mischief at a festivalPlaying football '
+    b'at Sports DayJudging a festival competitionTaking photos at a festival photo opDoing competitive'
+    b' cheer at Sports DayWatching festival resultsChecking skill progressIs currently Career DayEnter'
+    b'ing the festivalEntered the festivalRecently asked about career detailsReceived class scheduleSt'
+    b'opped holding the bouquetBuilding friendly relationships fasterStarting a school fightConcerned '
+    b'about leaving infant aloneUsing phone or computerParticipating in No Skills No Problem scenarioA'
+    b'ccepted invitation to college partySneaking out to eventRouting to event openlyCleared to leave '
+    b'via windowDislikes Boho fashionDislikes Country fashionDislikes Hipster fashionDislikes Outdoors'
+    b'y fashionDislikes Polished fashionDislikes Preppy fashionDislikes Rocker fashionDislikes Streetw'
+    b'ear fashionLikes Boho fashionLikes Country fashionLikes Hipster fashionLikes Outdoorsy fashionLi'
+    b'kes Polished fashionLikes Preppy fashionLikes Rocker fashionLikes Streetwear fashionAttending a '
+    b'weddingServed as Honor Party memberAttended a wedding recentlyServed as Honor Party member recen'
+    b'tlyAccepted invitation to sleepoverAccepted invitation to school gameAccepted invitation to movi'
+    b'eAccepted invitation to pop concertAccepted invitation to go loiteringAccepted invitation to han'
+    b'g outChecking on infantWearing Prom Jester crownWearing Prom Royalty crownTalked about on social'
+    b' mediaConfronting fear of disappointing parentsIn bath with bubblesExperiencing fear of deathExp'
+    b'eriencing fear of disappointing parentsDauntless traitDeveloping fear of failureUntroubled trait'
+    b'Accessing windowFear of failure show offWaiting to show off fear of failureWaiting for Prom voti'
+    b'ng resultsWearing Prom crownParty Animal traitOverachiever traitGhost using stink bombGhost usin'
+    b'g urban mythCan post about pillow fight on social mediaExtra credit available for OverachieverCa'
+    b'utious infant traitInfant checking home environmentVoted for Prom JesterVoted for Prom RoyaltyCa'
+    b'utious infant being put downTracking sex for Party AnimalLarge social group for Party AnimalPran'
+    b'king without getting caughtCaught prankingSubmitted to High School Festival competitionPresentin'
+    b'g at PromGathering for PromWedding couple eating dessertWedding guest eating dessertParticipatin'
+    b'g in fire drillRecently pranked someoneHigh School Festival results announcedTruant from schoolS'
+    b'ent back to schoolDared to pull a prankFramed for a prankPranked by someoneLow werewolf furyMedi'
+    b'um werewolf furyHigh werewolf furyRampaging due to extreme furyDancing at CarnivalIn TartosaGett'
+    b'ing ready for classFootball ballReward ballInfant has hiccupsInfant sneezingInfant self-soothing'
+    b'Infant babblingInfant obsessed with soundConcealed acne successfullyWearing outfit from Fashion '
+    b'MarketplaceConfronting fear of homeworkUsing school lockerSupported during pubertyMocked during '
+    b'pubertyMember of Werewolf Pack Friend AMember of Werewolf Pack Friend BRisk of losing trust with'
+    b' Pack ARisk of losing trust with Pack BPack A trust warningPack B trust warningIn Moonwood MillI'
+    b'conic traitPunching fountainTracking social followersMaking connections at workSlacking off at w'
+    b'orkWorking hard at workMissing workGave food to Pack A during trialGave collectible to Pack A du'
+    b'ring trialGave food to Pack B during trialGave collectible to Pack B during trialReached an infa'
+    b'nt milestoneInfant learned to sit upReceived high school diplomaAttending high school classSkipp'
+    b'ing high school classConfronting fear of failing testDoing mischief at schoolMarriedIntense infa'
+    b'nt traitIntense infant refusing to eatFear of failing after-school activity confrontationFear of'
+    b' failing class triggerFear of failing after-school activity triggerExtra credit available due to'
+    b' fear of failureCalling out diplomas at graduationReady to use mine portalReady to use porta-sew'
+    b'er portalReady to use sewer-mine portalWatching graduation speechFear of being judged effectsFea'
+    b'r of being judged trackerParticipating in graduation ceremonyGetting diplomaGiving graduation sp'
+    b'eechExchanging pleasantries at graduationThrowing graduation capWerewolf rabbitholeExiting mine '
+    b'adventureExiting portable toilet adventureExiting sewer adventureExploring Wolf Town area AExplo'
+    b'ring Wolf Town area BExploring Wolf Town area CExploring Wolf Town split AExploring Wolf Town sp'
+    b'lit BExploring Wolf Town split CRemoved graduation capMoving to Wolf Town area AMoving to Wolf T'
+    b'own area BMoving to Wolf Town area CMoving to Wolf Town split AMoving to Wolf Town split CMoving'
+    b' to Wolf Town split BNew Moon phaseWaxing Crescent Moon phaseFirst Quarter Moon phaseWaxing Gibb'
+    b'ous Moon phaseFull Moon phaseWaning Gibbous Moon phaseThird Quarter Moon phaseWaning Crescent Mo'
+    b'on phaseFinished watching graduation speechWolf Town sculpture secretWolf Town open rewardTrying'
+    b' not to be a jerk (Werewolf)Completed daily career taskExplored Wolf Town for a whileAfter schoo'
+    b'l activitiesInfant released gasShowing werewolf formRecently moonbathedWatched Career Day speake'
+    b'r 3Watched Career Day speaker 1Watched Career Day speaker 2Career Day professional presentVisiti'
+    b'ng to expand pack influenceGained pack influence from visitAttending PromHanging out with Princi'
+    b'palPack participation A modifierPack participation B modifierCrushing on someoneSparring with Pa'
+    b'ck A during trialSparring with Pack B during trialChecking pack resourcesChecking pack resources'
+    b' special AChecking pack resources special BTransforming into a werewolfNeutral in werewolf allia'
+    b'nce feudAllied in werewolf alliance feudFeuding in werewolf alliance feudBroken up with friendPa'
+    b'ssion returning after dead-end job fearReceived Prom notificationPrideful werewolf temperamentIn'
+    b'teracting with GregBig Bad Wolf temperamentGrumpy Wolf temperamentWracked With Guilt temperament'
+    b'Survival Instincts temperamentRestless Animal temperamentCommunicating with GregCommunicating mo'
+    b're with GregGreg is in townSmelling generic scentsAuto-sexfor Party AnimalSmelling angry SimsSme'
+    b'lling scared SimsSmelling flirty SimsSmelling werewolvesSmelling vampiresSmelling witchesSmellin'
+    b'g aliensSmelling mermaidsWerewolf resistanceCleaning as JanitorServing food at high schoolDreami'
+    b'ng of moonbathingSomber howlSneaking back in through windowCleared to go to eventUsing werewolf '
+    b'speedUsing werewolf natural healingAnti-Capitalist Canine temperamentRecently left Pack ARecentl'
+    b'y left Pack BRecently lost trust with Pack ARecently lost trust with Pack BRecently declined inv'
+    b'ite from Pack ARecently declined invite from Pack BAt Pack A hangoutAt Pack B hangoutChilling at'
+    b' pack hangoutEating at pack hangoutEntering pack shellActive at pack hangoutMember of Werewolf P'
+    b'ack AMember of Werewolf Pack BExtreme werewolf fury glowHigh werewolf fury glowActor about to fi'
+    b'ghtShould rampage after fightDecorating school lockerRecently gave up pack leadershipBanned from'
+    b' Ferris WheelRecently kicked out of Pack ARecently kicked out of Pack BBanned from Haunted House'
+    b'Banned from Tunnel of LoveFinished wedding toastWalking to podium for presentationWolf eyes ever'
+    b'ywhereCreating objectAspiration: Experience Full MoonAspiration: Win Werewolf FightWerewolf trai'
+    b'tTeleporting via portal for the first timeNew Moon approachingWaxing Crescent Moon approachingFi'
+    b'rst Quarter Moon approachingWaxing Gibbous Moon approachingFull Moon approachingAspiration: Frie'
+    b'ndly WolfWaning Gibbous Moon approachingThird Quarter Moon approachingWaning Crescent Moon appro'
+    b'achingGave graduation speechWaiting to present at PromWandering Wolf TownPacify abilityGiving gi'
+    b'ftRecently received gift from NPCLunar Epiphany with Pack ALunar Epiphany with Pack BScavenging '
+    b'with Pack AScavenging with Pack BPack Howl with Pack APack Howl with Pack BPreparing for examPac'
+    b'k A trial in progressPack B trial in progressRecently mentored by werewolfWerebies pausedCan pos'
+    b't about family dinnerCan post about workCan post about changing outfitCan post about vacationCan'
+    b' post about engagementCan post about marriageCan post about hosting partyCan post about new baby'
+    b'Can post about travel returnCan post about book reviewCan post about media reviewCan post about '
+    b'shopping tripCan post about vacation tripCan post about witnessing deathLunar HowlExiting advent'
+    b'ure on lotFull Moon fury rateWet dog smellWerewolf sympathyRecently disciplined by packFated Mat'
+    b'es activeLeader to leaderHarassZoomiesAsked to be turned into werewolfAsking to be turned into w'
+    b'erewolfPlantSim scenario reward invisibleChallenging pack leaderPack B NPC presentPack A NPC pre'
+    b'sentGoing to class 1Going to class 2Commanded to workoutCarnivore temperamentEasy Excitable temp'
+    b'eramentRestricted outside Wolf TownDefault outside Wolf TownFull Moon hunger speedupFeels Outcas'
+    b'ted temperamentFeels Outcasted trait activeHungry Like The Wolf temperamentRemoving Restless Ani'
+    b'mal temperamentPlaying fetchBeat Greg in a fightCan ask about career detailsLunar Wolf temperame'
+    b'ntLunar Night temperamentLunar Forest temperamentLunar Hunt temperamentSensitive Hearing tempera'
+    b'mentProm voting finishedGreg auto-howlOrdering food at thrift storeGreg is confusedGreg wants to'
+    b" leaveMotive change from Greg's giftMouthing off at schoolActive high school studentWarning for "
+    b'mouthing offSocially Awkward nervousnessSparring with friendHit by meteoriteFrisky temperamentVa'
+    b'mpire New MoonVampire New Moon approachingStuck In Their Shadow scenario with rivalTaking exam a'
+    b't high schoolMermaid Full MoonMermaid Full Moon approachingWitch Full MoonWitch Full Moon approa'
+    b'chingTeaching to howlDrank moodlet solver in New In Town scenarioBought Observant trait in New I'
+    b'n Town scenarioFainted from werewolf furyGreg napIn The Moodlet scenario activeWearing black gra'
+    b'duation outfitWearing white graduation outfitWearing red graduation outfitBlessed by New MoonBle'
+    b'ssed by Waxing Crescent MoonBlessed by First Quarter MoonBlessed by Waxing Gibbous MoonBlessed b'
+    b'y Waning Gibbous MoonBlessed by Third Quarter MoonBlessed by Waning Crescent MoonBlessed by Luna'
+    b'r CycleWearing purple graduation outfitWearing brown graduation outfitWearing gray graduation ou'
+    b'tfitWearing coral graduation outfitWearing green-yellow graduation outfitWearing white-blue grad'
+    b'uation outfitWearing navy-red graduation outfitWearing orange graduation outfitFriendly tug of w'
+    b'arSmash abilityNegative effect from First Quarter MoonNegative effect from Blessed First Quarter'
+    b' MoonNegative effect from Third Quarter MoonNegative effect from Blessed Third Quarter MoonNegat'
+    b'ive effect from First Quarter Moon approachNegative effect from Third Quarter Moon approachReady'
+    b' to use portal on lotJanitor cleaning bathroomJanitor cleaning puddleJanitor cleaning tableStuck'
+    b' In Their Shadow scenario startGaining relationship in New In Town scenarioStreamer side hustle '
+    b'tipSudden Craving temperamentWalls Closing In temperamentOverwhelming Aggression temperamentNeed'
+    b' To Hibernate temperamentNeed For Love temperamentGotta Mark Something temperamentDebug force ch'
+    b'ance card at high schoolUsing vending machineMonitoring detentionFormer Lycan during Full MoonFo'
+    b'rmer Lycan Full Moon telegraphResisted werewolf fury successfullyInspired Explorer reward trait '
+    b'activeGoing to class as teacherAccepted proposal in scenarioRejected proposal in scenarioNew In '
+    b'Town scenario party goaledUsing scent abilityInvited rival in scenarioKicked out rival in scenar'
+    b'ioPausing Pack A value decayPausing Pack B value decayUsing Lunar Howl abilityActing as werewolf'
+    b' repairmanSnacking at school lockerBottom of the Pack temperamentGreg short napEnraging targetHa'
+    b'nging out as werewolf repairmanGetting lunch at schoolWerewolf repairmanCelebrating birthday in '
+    b'parenting scenarioHas a parenting predicament with their teen datingRival making purchases in sc'
+    b'enarioChildhood Friends scenario rewardCompleted goal 1 in Stuck In Their Shadow scenarioComplet'
+    b'ed goal 2 in Stuck In Their Shadow scenarioGardening at pack hangoutWerewolf fury frozenSensitiv'
+    b'e Hearing temperamentAt werewolf barGaining lunar temperamentTransforming in Wolf Town rabbithol'
+    b'eInvite/Kick goal active in scenarioPreventing running awayBatuu werewolf activeCompleted Improv'
+    b'e/Worsen goal in scenarioWorked hard in scenarioDisgustGreg frogSchmoozed in scenarioClaimed sch'
+    b'ool lockerCan quit Stuck In Their Shadow scenarioHigh school goal count 1High school goal count '
+    b'2Finished thrift store performanceAutonomously socializing lessChose date in New In Town scenari'
+    b'oChose hangout in New In Town scenarioIn beast formCheerleading in groupAdopted baby in Proud Pa'
+    b'rent scenarioUsing temporary mine portalUsing temporary porta-sewer portalUsing temporary sewer-'
+    b'mine portalWatching Prom awardsGuest at baby showerListening to Alternative musicListening to Bl'
+    b'ues musicListening to Classical musicListening to Electronica musicListening to Hip Hop musicLis'
+    b'tening to Kids musicListening to LullabiesListening to Pop musicListening to Retro musicListenin'
+    b'g to Romance musicListening to Spooky musicListening to S-Pop musicListening to Winter musicList'
+    b'ening to World musicListening to Easy Listening musicListening to Backyard musicListening to New'
+    b' Age musicListening to DJ musicListening to Jazz musicListening to Baroque musicListening to Twe'
+    b'en Pop musicListening to Latin musicListening to Latin Pop musicListening to Strange TunesListen'
+    b'ing to Singer-Songwriter musicListening to Summer Strut musicListening to Island musicListening '
+    b'to Americana musicListening to Japanese Folk musicListening to Focus musicListening to Metal mus'
+    b'icListening to Cottage Core musicListening to NuDisco musicDeciding between propane and charcoal'
+    b'Accepted Astronaut career in scenarioSelecting Prom sign 1Selecting Prom sign 2Selecting Prom si'
+    b'gn 3Selecting Prom sign 4Selecting Prom sign 5Stayed up all night in Explore The Night scenarioH'
+    b'osting a partyNighttime in Explore The Night scenarioSleeping or passed out in Explore The Night'
+    b' scenarioAsked about career in scenarioRejected Astronaut career in scenarioOwns voodoo doll in '
+    b'scenarioInitiating photo booth interactionHigh motives in scenarioUsing facial cleanserDisallowi'
+    b'ng reaction to first snowSitting on bed interactingSitting on bedFaculty member at high schoolSi'
+    b'tting on groundWaiting to give diplomaIn San SequoiaSocial media app disabledDancing in pairs to'
+    b' stereoHas acneStaying as a guestBathroom patrolCafeteria patrolHallway patrolMiscellaneous patr'
+    b'olPlaying at splash padAsking to clean dustPlaying pianoSocial media panel openHas visible body '
+    b'hairGoing to exam prepAttending exam prepTeaching exam prepCreative burnout increasing significa'
+    b'ntlyDoing Career Day activity 2Doing Career Day activity 3Disallowing watching Career DayWearing'
+    b' black graduation hatWearing brown graduation hatWearing coral graduation hatWearing gray gradua'
+    b'tion hatWearing green-yellow graduation hatWearing navy-red graduation hatWearing orange graduat'
+    b'ion hatWearing purple graduation hatWearing red graduation hatWearing white graduation hatWearin'
+    b'g white-blue graduation hatAttending class 2Staying late at schoolCaught playing hooky at school'
+    b'Tidying upRepairing as Ranch HandCaring for animals as Ranch HandGardening as Ranch HandRanch Ha'
+    b'nd NPC activeRanch Hand gardening roleRanch Hand repair roleRanch Hand animal care roleParents a'
+    b'bducted by aliensShaving facial hairCleaning up graduation outfitsWater Lover toddler trait acti'
+    b'veBanned from movie theaterMovie theater enjoyment increasedMovie theater enjoyment decreasedLay'
+    b'offChance of layoffSlacking off boost after layoffWorking harder boost after layoffAggressive to'
+    b'ddler trait activeAudio Lover toddler trait activeLoves Being Carried toddler trait activeSinger'
+    b' toddler trait activeBook Lover toddler trait activeDestructive toddler trait activeGood Appetit'
+    b'e toddler trait activeHates Bedtime toddler trait activeFamily trope adventureCreative burnout i'
+    b'ncreasing slightlyCreative burnout decreasing significantlyCreative burnout decreasing slightlyM'
+    b'ental burnout decreasing significantlyMental burnout decreasing slightlyMental burnout increasin'
+    b'g significantlyHigh confidence (Child)Mental burnout increasing slightlyHelping boost for tempor'
+    b'ary stayStopped helping during temporary stayGaining confidence from schoolGaining confidence fr'
+    b'om homeworkGaining confidence from creativityGaining confidence from mental skillsGaining confid'
+    b'ence from motor skillsGaining confidence from social skillsInfant ate yogurtInfant ate applesauc'
+    b'eInfant ate crushed carrotsInfant ate pumpkin pureeInfant ate smashed lemonInfant ate ice creamI'
+    b"nfant ate Oaty O'sInfant ate yogurt meltsInfant ate peanut butter puffsInfant ate banana slicesI"
+    b'nfant ate rice porridgeInfant ate oatmeal cerealInfant ate sweet potato pureeInfant ate homemade'
+    b' hummusInfant ate mashed mangoInfant ate smashed avocadoInfant ate papaya pasteInfant ate mashed'
+    b' peasFamily reunion temporary stayRecently lost jobAged up in Parenting Predicaments scenarioGue'
+    b'st helping during temporary stayConfidence gain from confronting fearHosting baby showerAge up q'
+    b'ueued in Parenting Predicaments scenarioOn vacation during burnoutProfessional Slacker trait act'
+    b'iveCarefree trait activeLaid Back Beach Bum trait activeClear Perspective trait activeHigher Edu'
+    b'cation trait activeWork rivalIdea Person child skill activePack Animal child skill activeHeadstr'
+    b'ong child skill activeMentoring Pack Animal child skillJob loss consoleJob loss looking for work'
+    b'NPC guest at baby showerImprove/Worsen goal active in scenarioPraised after confronting fear of '
+    b'being inferiorPartially praised after confronting fear of being inferiorBartending at baby showe'
+    b'rInfant has stinky diaperWelcome me temporary stay activeGoodbye temporary stay activeAsk to mov'
+    b'e inRecently moved inMoving inBaby shower giftsexed in treehouseSummon snacksSplash pad statisti'
+    b'c activeLoyal trait activeSpecial guest behaviorWalking on trailPower walking on trailPreventing'
+    b' immediate scoring on trailMissing a toothListening to Oldies musicLoyal Sim romanced by taken S'
+    b'imMopey guest temporary stayDisapproves of child discipliningDisapproves of lack of child discip'
+    b'lineListening to Oldies music (Want/Fear)Rebuilt trust with Loyal Sim targetDisaster guest tempo'
+    b'rary stayCouch surfer guest temporary stayClone guest temporary stayFriend guest temporary stayH'
+    b'ousehold loss guest temporary stayWelcome meFound parent interactionLying on backBeing carriedBe'
+    b'ing carried on backSleeping at sleepoverHosting sleepoverGuest at sleepoverMentoring child on bi'
+    b'keHeavy Sleeper toddler sleeping safelyHeavy Sleeper toddler trait activeLight Sleeper toddler t'
+    b'rait activeLight Sleeper toddler waking upForced to wake upPicky Eater toddler trait activePract'
+    b'icing on bikeHonking bike hornDoing bike trickHates Bedtime toddler energy overrideNo bad mood f'
+    b'rom Mind and Body aspirationCompleted No Bad Mood goalSleepover snacksPicky Eater toddler hunger'
+    b' overrideBeing held (Toddler)Hates Bedtime toddler waking upHates Being Carried toddler trait ac'
+    b'tiveLoyal friend is target of mean interactionLoyal confrontationReflective walk on trailForced '
+    b'to wake up (Hates Bedtime)Tooth Fairy visitMisadventure delayDiaper change disasterBeing mean (L'
+    b'oyal trait)In a relationship (Loyal trait)Layoff expiredPlaying on treehouseToddler attention ne'
+    b'ed yellowSelf-Absorbed trait activeIrresponsible trait activePlaying SimblesCleaning up recreati'
+    b'on tableMounted on horseHorse being riddenAdoptedInfant hygiene need angry overrideClose family '
+    b'dynamic activeCreative quality increased during midlife crisisStress about lost timeEngaged in d'
+    b'istant family dynamicEngaged in compliant family dynamicEngaged in difficult family dynamicEngag'
+    b'ed in jokesters family dynamicReading to toddlerAsking to be carriedRunning away from scary TVTo'
+    b'ddler having nightmare from TVJogging on trailReaction to dust levelsPuzzles pile backupSimbles/'
+    b'Dominoes tray backupConfronting fear of being inferiorDrank spoiled milkFinishing watching infan'
+    b't anticipationMysterious Rancher NPC activeFriendship bracelet applied (Stage 5)Friendship brace'
+    b'let applied (Stage 4)Friendship bracelet applied (Stage 1)Friendship bracelet applied (Stage 2)F'
+    b'riendship bracelet applied (Stage 3)Happy Infant reward trait activeUnhappy Infant reward trait '
+    b'activeInvited infant overLoving family dynamic activePermissive family dynamic activeInfant mile'
+    b'stone unlock triggerPondering meaning of keepsake About to do sleeping bag prankPondering being '
+    b"togetherPondering if this isn't everythingPondering nobody knowsPondering patiencePondering tole"
+    b'rancePondering unconditional lovePondering weirdnessPraising mess (Family Dynamic)Horse Lover tr'
+    b'ait activeRancher trait activeCelebration cannon Master Trainer trait activeHorse Trainer NPC ac'
+    b'tiveNoisy neighbor disturbing infantParental help guest temporary stayParental boost temporary s'
+    b'tayAsk for nectar ingredients Infant learned to crawlToddler being held by caregiverHas a brave '
+    b'horse personalityHas a fearful horse personalityPondering the meaning of obedienceHas a friendly'
+    b' horse personalityHas an energetic horse personalityHas a mellow horse personalityHas an intelli'
+    b'gent horse personalityHas a playful horse personalityBeing summoned temporarilyPregnant with a f'
+    b'oal but not showing yetRecovering from breedingHas champion genes for breedingWaiting on parenta'
+    b'l boost Identified as a Mysterious RancherIdentified as a Horse TrainerGoing on a golden date du'
+    b'ring a midlife crisisFeeling effects of Potato NectarFeeling effects of Aged NectarWanting a sma'
+    b'rt hub during midlife crisisExperiencing fear of horsesStuck in Their Shadow scenario: Phase 1 A'
+    b'nswer Phone goal activeHas an aggressive horse personalityHas a free spirit horse personalityHas'
+    b' an independent horse personalityHas a defiant horse personalityStuck in Their Shadow scenario: '
+    b'Phase 3 Answer Phone goal activeHas a curious horse personalityRecovering from crying reactionVi'
+    b'siting a park venueVisiting as a special infant guestRecovering from bragging about infant miles'
+    b'tonesStarting infant introductionGhost of a horse that died of old ageExperiencing severe burnou'
+    b't fogExperiencing mild burnout fogRecovering from burnout mental block (minor)Recovering from bu'
+    b'rnout mental block (major)Failed to explore the caveCompleted an aspiration (invisible effect)Ex'
+    b'iting the caveReacting to Art Deco decorReacting to Cute decorReacting to Luxe decorReacting to '
+    b'Industrial decorReacting to Vintage decorReacting to Shabby decorDancing Country Dance in a grou'
+    b'pWatching Country DancingCantering on a horseWalking on a horseTrotting on a horseBeing let out '
+    b'of a crib or carrierAnticipating just grabbing an objectAnticipating just reaching for an object'
+    b'Following a parental help scheduleHas a resilient horse personalityRecovering from mood improvem'
+    b'ent by mini goats or sheepHas a needy horse personalitySelling nectar as a Mysterious RancherFat'
+    b'igued from horse trainingWiggling a missing tooth in bedSocializing with a horseSleeping (Stage '
+    b'3)Recovering from talking to a stuffed animalWoken up by a horseRiding a horse in the ranch worl'
+    b'd (Rider)Reading to childrenRecently unlocked an infant milestoneRiding a horse in the ranch wor'
+    b'ld (Horse)Friendship bracelet needs cleanupDiaper is partially fullDiaper is overfullSleeping as'
+    b' an infant (awake buffs allowed)Has the Responsible traitReady to ride Foal being mentored in Te'
+    b'mperament skillAdvertising the Equestrian CenterPracticing Simbles DominoesStaying as a couch su'
+    b"rfer guest (Kyle)Waiting on Candy's special behaviorNanny check-onRecovering from teaching to ca"
+    b'nterHas the Top Notch Foal traitWaking up to go to sleepInfant sleeping (motive adjust)Infant mi'
+    b'lestone: Slept through the nightGuest has met the hostHosting Animal DayGuest at Animal DayRanch'
+    b' Helper at Animal DayChampion horse at the Equestrian CenterMini goat or sheep saw a trickCanter'
+    b'ing with low riding skillTrotting with low riding skillWalking with low riding skillCantering wi'
+    b'th low riding skill (Buck Wild)Trotting with low riding skill (Buck Wild)Successfully used horse'
+    b' obstacle cheatsThrowing the riderNever throwing the riderPuzzles smashed timeoutInfant stopping'
+    b' cryingAlways throwing the riderHorse wearing a saddleHorse wearing reinsJust stopped playing on'
+    b' the playmatRecovering from fixing a loose toothTrying to befriend a stray during midlife crisis'
+    b'Asked about horsesRecently interacted with a horseBoost to Equestrian skill from club perkRiding'
+    b' a bike while being mentoredWatching a movie in the theaterBeing carried protectivelyInfant reac'
+    b'tionWork rival chance increasedRecovering from autonomous Peek-a-BooHas the Hates Infants traitG'
+    b'aining small amount of horse skill from obstaclesSetting up a sleeping bagChampionship horse in '
+    b'competitionTime for bed at a sleepoverInfant element reveal delayToddler personality update reve'
+    b'al delayInfant only sleeps when heldBeing breastfedUnicorn horn active autonomouslyGaining stand'
+    b'ard amount of horse skill from obstaclesGaining large amount of horse skill from obstaclesGainin'
+    b'g small amount of rider skill from obstaclesGaining standard amount of rider skill from obstacle'
+    b'sGaining large amount of rider skill from obstaclesInfant has a good appetite and is fullInfant '
+    b'self-soothedGaining small amount of temperament skillGaining standard amount of temperament skil'
+    b'lTrying to max a skill during midlife crisisUnicorn horn active (Type C)Toddler singing a songIn'
+    b'fant soothed while sleepingInfant reacting with angerInfant reacting with happinessInfant reacti'
+    b'ng with sadnessBreathing cold air visiblyPlaying on the playmat trackerFeeling angry from self-d'
+    b'iscoveryFeeling sad from self-discoveryAlready fed first bite in high chairCautious infant near '
+    b'caregiverPrefers bottle feedingPrefers breastfeedingCautious infant in a strange placeCalm infan'
+    b't exiting boredomRecently listened to Ranch musicListening to Ranch music (Want/Fear)Acting prop'
+    b'er due to self-discoveryActing erratic due to self-discovery fearPushing block anticipation mile'
+    b'stoneHorse breathing cold air visiblyEntered a horse competitionCalm infant moveInfant wiggling '
+    b'to musicInfant check-on clash preventionHorse looks wet from weatherHorse standing in the rain a'
+    b'utonomouslySelf-discovery: Dog personSelf-discovery: Cat personVisiting the Equestrian CenterEnt'
+    b'ering a Master horse competitionWinning a horse competitionWork rival delayed bit addedInfant is'
+    b' being cared forInfant involved in special multi-character interactionGaining infant quirksGaini'
+    b'ng toddler quirksRecovering from serving Ranch NectarFree spirit horse inside a buildingHorse en'
+    b'durance fatigue decayingGaining Simoleons from street food tableGuest at a Ranch GatheringHost o'
+    b'f a Ranch GatheringGrill Master at a Ranch GatheringWitnessed a foal birthStopping training on h'
+    b'orse obstaclesInheritance scenario: Donated moneyInheritance scenario: Burned moneyInheritance s'
+    b'cenario: Donate inheritanceSold a mini goat/sheep trackerHorse carrying a riderRanch Hand arrivi'
+    b'ngRanch Hand shift endingViewing the community boardInfant chompReacting with fear to horsesInhe'
+    b'ritance scenario: Received drama nodeDislikes Equestrian skillDislikes Nectar MakingLikes Equest'
+    b'rian skillLikes Nectar MakingCurrently aging up with missing teethWon a Master or Ultimate horse'
+    b' competitionJust failed a hopscotch hopSharing desire for independenceHas the Nectar Know-It-All'
+    b' traitHorse will not buckRecovering from basking in horse braveryHas the Cringe traitHas the Nos'
+    b'y traitHas the Wise traitHas the Generous traitRecovering from convincing someone to buy street '
+    b'foodHas the Child of the Sea traitRecovering from Child of the Sea kinshipSqueamishParanoidHorse'
+    b' reins are downPlaying HopscotchReady to tell a group storyListening to R&B music (Want/Fear)Ten'
+    b'ding a shared gardenRecently listened to R&B musicHas the Local trait (EP15)Getting mail at a mu'
+    b'lti-unit communityUsing objects at a multi-unit communityUsing a toilet at a multi-unit communit'
+    b'ySitting poolsideCompleted a primary Multi-Unit eventConsidering to eat for a limited timeSnoopi'
+    b'ng without getting caughtGhost that died from moldCaught snoopingDealing with trash overloadPart'
+    b'icipating in a trash driveCooking at a multi-unit communityGuest at a pool partyGuest at a neigh'
+    b'borhood potluckRecovering from snoopingParticipating in cultural activities (Child of the Sea)Pa'
+    b'rticipating as a community contender (Child of the Sea)Recovering from villager help discoveryDe'
+    b'aling with a sewage leakGhost haunting a unitRecovering from possessing an objectRecovering from'
+    b' confronting a ghostCanceling possessionTenant experiencing a hauntingParticipating in Pet DayGh'
+    b'ost horse walkingGhost horse walking (low skill)Ghost horse trottingGhost horse trotting (low sk'
+    b'ill)Ghost horse canteringGhost horse cantering (low skill)CursedBlocking browsing while convinci'
+    b'ng to buyActing as a landlordParticipating in a charity drive (Player)Performing property mainte'
+    b'nance remedy (Primary)Participating in a charity drive (NPC)Recovering from charity driveBanned '
+    b'from the sanctuaryPerforming property maintenance remedy (Secondary)Breaking and entering (Playe'
+    b'r role)Occupant returning during break-inListening to Batuu musicListening to Brazilian musicRec'
+    b'ently listened to Batuu musicRecently listened to Brazilian musicBeing evicted (Tenant role)Conf'
+    b'ronted while snooping (Bribe available)Mean horse interaction(Horse)Mean horse interaction(Sim)N'
+    b'eighbor trait: CringeSeeker of Secrets: Found a secretInheritance scenario: Phase 1 sentiment de'
+    b'cayHorse recovering from drinking waterHorse recovering from running aroundNeighbor trait: Contr'
+    b'ibute fundsNeighbor trait: WiseNeighbor trait: GenerousHas the Fountain of Local Knowledge trait'
+    b'Removing rider before rabbit holeHorse reacting to winning a competitionHorse intellectual chat '
+    b'pickerAllowing horse hygiene careMarbles: Anted player pre-gameMarbles: Anted player during game'
+    b'Neighbor trait: NosyTraining on horse obstaclesHorse trainer advertiseMoving away from Equestria'
+    b'n CenterMoving away from Equestrian Center (from spectating)Has the Horse Lover traitRecovering '
+    b'from horse fatigue reactionFoal looks wet from weatherNeighbor trait: Tea deprived countdownActi'
+    b'ng as a nuisance (Player)Neighbor trait: Learn a secretHas the Legendary Landlord trait (Home Ma'
+    b'nager)Achieving gold events as landlordTenant broke a ruleHas the Discerning Dweller trait (Neig'
+    b'hborly)Snooping trait: MenaceSnooping trait: Safe KeeperLandlord maintenance successStarting tra'
+    b'sh driveEnding trash driveVisiting mailbox (Property Management)Landlord emergency successSeeker'
+    b' of Secrets: Earned Tiger BadgeTriggering evictionFountain of Local Knowledge: Pressure Cooker t'
+    b'rackerProperty owner at owned rental residentialCarrying trash fruitRecovering from placing mini'
+    b' goat/sheepGrillingNuisance Property Owner knockingFeeling fear of evictionChild of the Sea kins'
+    b'hip activeCompleted a secondary Multi-Unit eventDislikes Gemology skillLikes Gemology skillHorse'
+    b' recovering from frolicking runTenant performed a fixBurning mold pile (do not extinguish)Disabl'
+    b'e horse running through portalChild of the Sea sky lanternAdopted a tigerLandlord asked about co'
+    b'nditionsChatting with neighborsLandlord neighbor chatClassical music stereo effectNew Age music '
+    b'stereo effectCompleted a Gold social event as landlordNeighbor trait: Blicblock danceHandyperson'
+    b' career: Ready to complainHandyperson career: Complain doneHandyperson career: Recovering from a'
+    b'ttending local issueNeighbor trait: Spreading the cringeNeighbor trait: Spreading the joyGuarant'
+    b'eed success turn in marblesJust evictedRecovering from coffee or teaPivotal MomentsPivotal Momen'
+    b'ts reward purchasedConfronting fear of eviction progressArriving at property management situatio'
+    b'nGemology table club rulesPivotal Moments photo takenSpreading mold spores autonomouslyMold fung'
+    b'al overgrowth autonomousSpoiling food via mold autonomouslyBlowing mold spores autonomouslyPivot'
+    b'al Moments whim completeSanctuaryAlexandrite gem effect refreshRecovering from flushing sewage l'
+    b'eakPet blocking mold sicknessPivotal Moments2Pivotal Moments3Pivotal Moments4Pivotal Moments tri'
+    b'gger 1Pivotal Moments trigger 2Pivotal Moments trigger 3Pivotal Moments trigger 4Pivotal Moments'
+    b" aspiration goal completeFeeling effects of air conditioningHosting a Cupid's Corner datePivotal"
+    b' Moments has jobTenant revolt autonomy activePerforming maintenance autonomouslyActing as a tena'
+    b"ntNear a date (Cupid's Corner)Boost to Gemology skill from club perkTrivia Box: Sweating smile g"
+    b'uessTrivia Box: Scream guessTrivia Box: Surprised guessCompleted a cross-stitchWaiting angrily f'
+    b'or invitationWaiting angrily for Property OwnerDelivering fine autonomouslyCompleted a community'
+    b' Multi-Unit eventRecently moved householdMoving household: Owes feePreparing to move householdDe'
+    b'liver rentDeliver fineNeighbor trait: Contribute funds(Family)Check rules for visitProsecute fin'
+    b'eLandlord handiness modifierMarbles: Trade marbleMarbles: RummageFountain of Local Knowledge: Re'
+    b'gional food trackerDid sex (Adventurous/Romantic Blanket)Blight uproot completeBlight uproot del'
+    b'ay checkLandlord inspection/maintenance autonomousRepoman take objectRefusing death interactions'
+    b'Going to sleep while cuddlingCuddling in bed (awake)Unit rating maintenance dayWearing charged j'
+    b'ewelryForced to leave sleep while cuddlingGemology: Crystal Crafter gem cut valueExperiencing a '
+    b'break-in situationStaying asleep while cuddlingWearing an Apron costumeWearing a Cupid costumeWe'
+    b'aring a Hot Dog costumeWearing a Clown costumeWearing a Firefighter costumeWearing a Robot costu'
+    b'meWearing a Grim Reaper costumeWearing a Maid costumeWearing a Mail Carrier costumeWearing an As'
+    b'tronaut costumeWearing an Eggplant costumeWearing a Peach costumeWearing a Luchador costumeWeari'
+    b'ng a Cheerleader costumeWearing a Pizza Delivery costumeWearing a Darth Vader costumeWearing a D'
+    b'arth Maul costumeWearing a Boba Fett costumeWearing a Space Ranger costumeWearing a Smuggler cos'
+    b'tumeWearing a Luke Skywalker costumeWearing an Aayla Secura costumeWearing a Princess Leia costu'
+    b'meWearing a Villain costumeBuilding up nausea in the heart bedHas the Romantically Reserved trai'
+    b'tHas the Romantically Reserved traitHas the Love Struck traitIn a Steamy romance dynamicIn a Who'
+    b'lesome romance dynamicIn a Unpredictable romance dynamicIn a Strained romance dynamicExperiencin'
+    b'g fear of intimacyRomance trope adventureTrivia Box: WooWho answer trackerWearing a Ranch Hand c'
+    b'ostumeTrivia Box: WooWho question askerAsking to change date venueAsking to keep date goingExper'
+    b'iencing fear of being aloneEating on a romantic blanketWearing a Panda costumeWearing a Raccoon '
+    b'costumeWearing a Victorian costumeWearing an Alien costumeWearing a Doctor costumeWearing a Poli'
+    b'ce costumeChanging relationship outlookWearing a Father Winter costumeWearing a Bunny costumeWea'
+    b'ring a Gnome costumeWearing a Pirate costumeWearing a Spartan costumeWearing a Ninja costumeWear'
+    b'ing a Fairy costumeWearing a Witch costumeWearing a Knight costumeWearing a Skeleton costumeTriv'
+    b'ia Box: Cry guessTrivia Box: Mind blown guessTrivia Box: Thinking guessTrivia Box: Vomit guessTr'
+    b'ivia Box: Zipper mouth guessLow relationship satisfaction on dateWearing a Bear costumeWearing a'
+    b' Mascot costumeWearing a Butler costumeTrivia Box: Game endedVisiting a LibraryVisiting a Museum'
+    b'Visiting a GymSleeping while cuddlingFear of being alone: Proximity effectFear of being alone: F'
+    b'eeling aloneCalled Property OwnerRomance Consultant: Heart to HeartNear happy couples (Heart to '
+    b'Heart)Has the Explorer traitHas the Poly traitHas the Practice Makes Perfect traitStealing from '
+    b'the Fountain of DreamsHanging out as The Ring BearAutonomy at a venue dateScanning the room (Rom'
+    b'ance skill)Increased romance chance (Romance skill)Increased sex chance (Romance skill)Romance C'
+    b'onsultant: Relationship satisfaction tips increaseRomance Consultant: Relationship satisfaction '
+    b'tips decreaseVisiting a BeachWearing a Park Ranger costumeWearing a Flirty Maid costumeWearing a'
+    b' Flirty Firefighter costumeRomantically Reserved: Near romanceLove Struck: Near partnerRejected '
+    b'food sharing (Sad eat allowed)Visiting a BarVisiting a NightclubVisiting a LoungeVisiting a Kara'
+    b"oke BarOn a Gold Date (Cupid's Corner)Recently asked a question on a datePractice Makes Perfect:"
+    b' Creative Tier 1Practice Makes Perfect: Creative Tier 2Practice Makes Perfect: Creative Tier 3Ma'
+    b'stery Perk: Stronger With AgePractice Makes Perfect: Mental Tier 1Practice Makes Perfect: Mental'
+    b' Tier 2Practice Makes Perfect: Mental Tier 3Practice Makes Perfect: Creative Tier 0Practice Make'
+    b's Perfect: Creative Tier 4Mastery Perk: Second WindMastery Perk: In The ZoneMastery Perk: In The'
+    b' ZoneMastery Perk: Pigeonholed MentalMastery Perk: Powerful PerformerPractice Makes Perfect: Men'
+    b'tal Tier 4Practice Makes Perfect: Mental Tier 0Practice Makes Perfect: Physical Tier 0Practice M'
+    b'akes Perfect: Physical Tier 1Practice Makes Perfect: Physical Tier 2Practice Makes Perfect: Phys'
+    b'ical Tier 3Practice Makes Perfect: Physical Tier 4Practice Makes Perfect: Social Tier 0Practice '
+    b'Makes Perfect: Social Tier 1Practice Makes Perfect: Social Tier 2Practice Makes Perfect: Social '
+    b'Tier 3Practice Makes Perfect: Social Tier 4Wearing a Flirty Butler costumeMastery Perk: Pigeonho'
+    b'led CreativeMastery Perk: Pigeonholed ActiveMastery Perk: Pigeonholed SocialMastery Perk: Second'
+    b' Wind (Active)Practice Makes Perfect: Pause for claritySmall business interaction forbiddenWeari'
+    b'ng a Mask costumeMastery Perk: Aspirational ThinkerMastery Perk: Aspirational Thinker increasePr'
+    b'actice Makes Perfect: Whim trackerBlocked by The Wealthy Weirdo (Phone call)Had a perfect dateMa'
+    b'stery Perk: Mental ExerciseMastery Perk: Mental Exercise (Workout)College party trigger(Window)R'
+    b'omantic phone call: Free counselingCollege party no partySmall business perk: Wutant boostMentor'
+    b'ee skill multiplier (Mentor trait)Mentoree skill multiplier (Skill level 6)Mentoree skill multip'
+    b'lier (Skill level 7)Mentoree skill multiplier (Skill level 10)Mentoree skill multiplier (Skill l'
+    b'evel 8)Mentoree skill multiplier (Skill level 9)Practice Makes Perfect (Child)Managing a Rank 5 '
+    b'small businessManaging a Rank 1 small businessManaging a Rank 2 small businessManaging a Rank 3 '
+    b'small businessManaging a Rank 4 small businessUsed matchmaking appMastery Perk: Guaranteed Adven'
+    b'tureMastery Perk: Adventure(Generic)Mastery Perk: Adventure(Aspirational Creator)Mastery Perk: A'
+    b'dventure(Aspirational Thinker)Mastery Perk: Adventure(Aura Active)Mastery Perk: Adventure(Aura C'
+    b'reative)Mastery Perk: Adventure(Aura Mental)Mastery Perk: Adventure(Final Touch)Mastery Perk: Ad'
+    b'venture(In The Zone)Mastery Perk: Adventure(Mental Exercise)Mastery Perk: Adventure(Pigeonholed '
+    b'Active)Mastery Perk: Adventure(Pigeonholed Creative)Mastery Perk: Adventure(Pigeonholed Mental)M'
+    b'astery Perk: Adventure(Pigeonholed Social)Mastery Perk: Adventure(Powerful Performer)Mastery Per'
+    b'k: Adventure(Second Wind)Mastery Perk: Adventure(Secret Spice)Mastery Perk: Adventure(Spacebende'
+    b'r)Mastery Perk: Adventure(Stronger With Age)Mastery Perk: Adventure(Skillful Sleep)Small busines'
+    b's: Inspire with storyMentoree tracker: Multi-super interactionAttending relationship counselingM'
+    b'entoree tracker: Homestyle CookingRelationship counselingRejected romance social (Self-Discovery'
+    b')Club grilled cheese craftingOff-lot autonomy: Small business customerOff-lot autonomy: Small bu'
+    b'siness employeeMentoree tracker: BakingMentoree tracker: Gourmet CookingCatfished on a blind dat'
+    b'eVisiting a motel shellVisiting a flower shop shellSmall business customer deliberatingSmall bus'
+    b'iness customer checking inPractice Makes Perfect: Practice skill whimThinking about partner (Rom'
+    b'ance dynamic)Dislikes Tattooing skillLikes Tattooing skillSmall business reputation history: Ran'
+    b'k 0Small business reputation history: Rank 1Small business reputation history: Rank 2Small busin'
+    b'ess reputation history: Rank 3Small business reputation history: Rank 4Small business reputation'
+    b' history: Rank 5Crypt tracking: Alice ChildCrypt tracking: Hissing soundCrypt tracking: Hissing '
+    b'friendCrypt tracking: It FollowsCrypt tracking: Loose brickCrypt tracking: Musical puzzleCrypt t'
+    b'racking: Mystery boxCrypt tracking: Resting spotCrypt tracking: WaylonMoving On: The Road AheadM'
+    b'oving On: Making HeadwayMoving On: Finding PurposeMoving On: No RegretsMastery Perk: Skillful Sl'
+    b'eep cloneMoving On: Newfound PurposeGhost that died of a broken heartAxolotl breedingHas the Rom'
+    b'antic Sage traitHas committed to making relationship workHas satisfied or very satisfied relatio'
+    b'nshipFuneral activity: Viewing bodyFuneral activity: Bringing foodFuneral activity: Giving speec'
+    b'hesFuneral activity: Having musicFuneral activity: PlantingFuneral activity: SilenceFuneral acti'
+    b'vity: CandlesFuneral activity: ToastFuneral activity: DanceFuneral activity: Ghost good interact'
+    b'ionFuneral activity: Ghost bad interactionFuneral activity: InstrumentsFuneral activity: Sad eul'
+    b'ogyFuneral activity: Happy eulogyFuneral emotion: HappyFuneral emotion: FlirtyFuneral emotion: I'
+    b'nspiredFuneral emotion: PlayfulFuneral emotion: AngryFuneral emotion: BoredFuneral emotion: Emba'
+    b"rrassedFuneral emotion: SadFuneral emotion: TenseReaper's Rewards Event: Thrill SeekerMoving On:"
+    b' Wanting progressHas the Macabre traitVisiting cemetery (Player)Disgusted by sun (Macabre)Cemete'
+    b'ry Keeper: Telling spooky storyCemetery Keeper: PatrollingMacabre: Witching Hour activeSmall bus'
+    b'iness rebrandingGhost tracker: Anger deathGhost tracker: Death Flower deathGhost tracker: Elder '
+    b'exhaustion deathGhost tracker: Electrocution deathGhost tracker: Embarrassment deathGhost tracke'
+    b'r: Fire deathGhost tracker: Hunger deathGhost tracker: Laughter deathGhost tracker: Lightning de'
+    b'athGhost tracker: Old age deathGhost tracker: Meteorite deathGhost tracker: Frozen deathGhost tr'
+    b'acker: Flies deathGhost tracker: Mold deathGhost tracker: Broken heart deathGhost tracker: Steam'
+    b' room deathGhost tracker: Vampire sun deathGhost tracker: Witch overload deathGhost tracker: Rod'
+    b'ent disease deathLingering exhaustion Tier 1Lingering exhaustion Tier 2Cemetery mourner: Eulogiz'
+    b"ingReaper's Rewards quest activeCemetery mourner: WatchingWearing a Catfish costumeSmall busines"
+    b's customer checking outGaining Unfinished Business goals (Short)Gaining Unfinished Business goal'
+    b's (Medium)Gaining Unfinished Business goals (Long)Experiencing anger from griefExperiencing depr'
+    b'ession from griefExperiencing denial from griefHolding it together during griefGreat customer re'
+    b'lationship (Small Business)Good customer relationship (Small Business)Bad customer relationship '
+    b'(Small Business)Terrible customer relationship (Small Business)Acting as the Grim ReaperAsked ab'
+    b'out AmbrosiaHas the Ghost Whisperer aspirationSummon Grim ReaperSummon Grim Reaper(Event active)'
+    b'Small Business Perk: Muscle Memory 1Small Business Perk: Muscle Memory 2Small Business Perk: Mus'
+    b'cle Memory 3Small Business Perk: Viral Social Media 1Small Business Perk: Viral Social Media 2Sm'
+    b'all Business Perk: Viral Social Media 3Reflecting on former long lifeUnfinished Business: Travel'
+    b' to Brindleton BayWell of Souls wishPracticing tattoo on frontUnfinished Business: Travel to Sel'
+    b'vadoradaUnfinished Business: Travel to San MyshunoUnfinished Business: Travel to WindenburgUnfin'
+    b'ished Business: Travel to Del Sol ValleyUnfinished Business: Travel to SulaniUnfinished Business'
+    b': Travel to BritechesterUnfinished Business: Travel to Mt. KomorebiUnfinished Business: Travel t'
+    b'o Henford-on-BagleyUnfinished Business: Travel to CopperdaleUnfinished Business: Travel to San S'
+    b'equoiaUnfinished Business: Travel to Chestnut RidgeUnfinished Business: Travel to TomarangUnfini'
+    b'shed Business: Travel to Ciudad EnamoradaUnfinished Business: Travel to RavenwoodUnfinished Busi'
+    b'ness: Travel to Oasis SpringsUnfinished Business: Travel to Willow CreekConquered griefLasting e'
+    b'ffects of conquered griefAutonomy: No ghost signReaper career: On assignmentHas the Skeptical tr'
+    b'aitReaper career: Co-workerReaper career: Grim ReaperReaper career: Dead SimGhost pet crowTrivia'
+    b' Box: Game abortedTending tattoo tablePracticing tattoo on backPracticing tattoo on right legPra'
+    b'cticing tattoo on left legHas the Chased by Death traitFestival ghost autonomy activeGhost power'
+    b's manifestedUnfinished Business: Travel goal finishedReaper career: Reaping a soulSuccessfully a'
+    b'sked to keep date goingGhost powers: Already faintedFestival autonomy: AA PlayerReaper career: T'
+    b'ravelingGhost powers: Already lost bladder controlFestival autonomy: Family Day LawyerSmall busi'
+    b'ness customer affordance providedUnfinished Business: Go campingUnfinished Business: Proclaim pe'
+    b'rfect dateUnfinished Business: Be a cool musicianAlice Quest 1: Deimos objective trackerPlaying '
+    b'Trivia BoxUnfinished Business: Stay outsideUnfinished Business: Quit jobWalkby role: Being Waylo'
+    b'n WarezWalkby role: Waylon WarezGhost Whisperer: Crypt rare findingsUnfinished Business: Jungle '
+    b'goalWaylon Warez read epitaphFamily recipes motivatingSummoning Grim Reaper via TarotMentoring M'
+    b'ixology autonomouslyMentoring Charisma autonomouslyMentoring Comedy autonomouslyMentoring Cookin'
+    b'g autonomouslyMentoring Fishing autonomouslyMentoring Gardening autonomouslyMentoring Logic auto'
+    b'nomouslyMentoring Mischief autonomouslyMentoring Programming autonomouslyFamily recipes exhausti'
+    b'on preventionFamily recipes low maintenanceMentoring Writing autonomouslyMentoring Singing auton'
+    b'omouslyMentoring Instruments autonomouslyRocket ship explore NPCWalkby role: Edith BasuWalkby ro'
+    b'le: Being Edith BasuEdith Basu communication defaultEdith Basu communication openPerforming misc'
+    b'hief autonomouslyPracticing singing autonomouslyPracticing skills autonomouslyTarot NPC on quest'
+    b' helpTattooing: Blocking bladder/energy failureTattooing: Blocking bladder/energy failure (Temp)'
+    b'Cemetery mourner: Tending gravesiteCemetery mourner: WeepingCemetery mourner: Pouring one outCem'
+    b'etery mourner: ReminiscingCemetery mourner: Lighting candleIn Ciudad Enamorada regionAdmit probl'
+    b'ems autonomousExecuted a willHas the Insider trait (Max statistic)Edith Basu waypointMastery Per'
+    b'k: AuraMastery Perk: Secret SpiceMastery Perk: Final TouchMastery Perk: Aura VFX (Active)Mastery'
+    b' Perk: Aura VFX (Creative)Mastery Perk: Aura VFX (Mental)Mastery Perk: Skillful Sleep cookingDat'
+    b"e target (Cupid's Corner)Grab snack from netherworldCreate food(Festival)Festival autonomy: Fami"
+    b'ly Day Crow HandlerFamily Day specterFestival autonomy: Family Day ChildFestival autonomy: Famil'
+    b'y Day PlayerFeeling low social needFestival autonomy: Tree Spree Tarot ReaderWalkby role: AliceT'
+    b'attoo recipient uniform (Lower body)Tattoo recipient uniform (Upper body)Recently received a men'
+    b"torship giftReaper's Rewards Quest 2Reaper's Rewards Quest 2BReaper's Rewards Quest 4Reaper's Re"
+    b"wards Quest 4BReaper's Rewards Quest 6Reaper's Rewards Quest 6BPet crow reconnaissanceSwimming o"
+    b"n a dateReaper's Rewards Quest 8Reaper's Rewards Quest 8BMastery Perk: Skillful Sleep clone doin"
+    b"g stuffReaper's Rewards Quest 10BReaper's Rewards Quest 10Full ghostly stamina available.Recentl"
+    b'y stared unnervingly at someone.Waiting to summon tarot cards again.Waiting to heal via tarot ag'
+    b'ain.Waiting to induce sleep via tarot again.Recently shrieked at someone.Putting away the scythe'
+    b'.Recently emitted a ghostly aura.Waiting to perform another tarot reading.Chatting for a shorter'
+    b' duration.Stuck inside a washing machine.Ready to be moved to the dryer.Stuck inside a dryer.Alr'
+    b'eady levitated recently.Already absorbed or drained energy.Tending to a gravesite.Waiting to be '
+    b'reaped.Waking someone up with a nightmare.Mourning a loss.Giving a funeral speech.Celebrating a '
+    b'life at a funeral.Mingling with mourners.Writing a horror book on hallowed ground.Performing a s'
+    b'eductive dance.Discussing fears with the Grim Reaper.Born with a connection to the Grim Reaper.I'
+    b'nteracted with zero customers recently.Interacted with one customer recently.Mocking others in t'
+    b'he street.Already embraced recently.Feeling flirty aura effects.Scanning the room for romance.Pl'
+    b'eading to revive someone.Pleading to collect a soul.Being revived from death.Exploring a crypt.T'
+    b"ending to a Cowplant as a ghost.Tracking an objective for Alice's Tree.Strained from a recent ro"
+    b'mantic adventure.Read the Chariot card: feeling driven.Read the Chariot card reversed: feeling d'
+    b'irectionless.Read the Cups card: feeling emotional.Read the Lovers card: feeling romantic.Read t'
+    b'he Magician card: feeling capable.Read the Magician card reversed: feeling manipulated.Read the '
+    b'Coins card: expecting wealth.Read the Coins card reversed: expecting financial loss.Read the Str'
+    b'ength card: feeling powerful.Read the Tower card reversed: avoiding disaster.Read the Wands card'
+    b': feeling creative.Read the World card: feeling complete.Read the Wheel of Fortune card: luck is'
+    b" changing.Tending to the Reaper's garden.Already boosted someone's motives.Feeling romantic skil"
+    b'l boost from club perks.Pleading for a life.Soothing a grieving person.Existing as a ghost.Read '
+    b'the Spellcaster card: feeling magical.Asking to end a mentorship.Embodying the essence of Death.'
+    b'Interacted with four customers recently.Interacted with three customers recently.Interacted with'
+    b' two customers recently.Playing the violin.Walking to play the violin.Dealing with a breakup via'
+    b' phone.Leaving the Reaper career location.Waiting for a promotion opportunity.Watching static on'
+    b' a TV channel.Helping a ghost with unfinished business.Waiting to possess someone again.Successf'
+    b'ully gave a tattoo.Enjoying a hike.Wearing a mascot costume.Participating in a Cowplant challeng'
+    b'e.Experiencing a slowed perception of time.Walking by as a gardener.Finished listening to a serv'
+    b'ice.Jogging through the area.Giving a lighthearted eulogy from a podium.Giving a lighthearted eu'
+    b'logy.Giving a mournful eulogy.Briefly waiting to eulogize again.Waiting a while to eulogize agai'
+    b'n.Reacted to witnessing a death.Behaving shadily.Rushing to check the mail.Napping in a coffin.W'
+    b'aiting to nap in a coffin again.Ignoring trash cans as a ghost.Feeling tattooing skill boost fro'
+    b'm club perks.Preventing autonomous targeting during tattooing.Exiting a crypt.Encountering a gho'
+    b'stly child in a crypt.Exiting via debug command.Hearing hissing in the crypt.Hearing friendly hi'
+    b'ssing in the crypt.Feeling followed in the crypt.Found a loose brick in the crypt.Solving a musi'
+    b'cal puzzle in the crypt.Found a mystery box in the crypt.Found a resting spot in the crypt.Encou'
+    b'ntering Waylon in the crypt.Has a shady personality.Waiting to break pottery again.Taking a Char'
+    b'isma class.Taking a Gardening class.Taking a Handiness class.Taking a Bartending class.Taking a '
+    b'Video Gaming class.Taking a Comedy class.Taking a Painting class.Taking a Writing class.Taking a'
+    b' Fishing class.Taking a Gourmet Cooking class.Taking a Homestyle Cooking class.Taking a Logic cl'
+    b'ass.Taking a Programming class.Taking a Rocket Science class.Taking a Mischief class.Taking a Gu'
+    b'itar class.Taking a Piano class.Taking a Violin class.Taking a Fitness class.Taking a Photograph'
+    b'y class.Taking a Tattooing class.Taking a Pottery class.Being socialized with during class.Recen'
+    b'tly decided they like Pottery.Recently decided they dislike Pottery.Hanging out suspiciously.Wai'
+    b'ting to offer a tarot reading again.Taking a Baking class.Taking a Singing class.Taking a Flower'
+    b' Arranging class.Taking a Research & Debate class.Taking a Robotics class.Taking a Fabrication c'
+    b'lass.Taking a Pipe Organ class.Taking a Knitting class.Taking a Dancing class.Taking an Equestri'
+    b'an class.Taking a Wellness class.Taking a Vampire Lore class.Attending class as a classmate.Thin'
+    b'king about family recipes.Ghostly stamina is running low.Taking a Gemology class.Walking by as a'
+    b' macabre tourist.Not scared despite danger.Taking a DJ Mixing class.Recently targeted for theft.'
+    b'Ready to resolve specific unfinished business.Feeling thanatology skill boost from club perks.At'
+    b'tending a generic hobby meetup.Exploring a cave.Focusing solely on the wedding ceremony.Waiting '
+    b'for a business event.Taking a Skiing class.Taking a Snowboarding class.Taking a Bowling class.Ta'
+    b'king a Rock Climbing class.Taking a Cross Stitch class.Taking a Ranch Nectar class.Taking a Juic'
+    b'e Fizzing class.Taking an Archaeology class.Taking a Herbalism class.Taking a Medium class.Takin'
+    b'g a Thanatology class.Taking a Veterinarian class.Taking an Entrepreneur class.Taking an Acting '
+    b'class.Taking a Local Culture class.Taking a Romance class.Taking a Parenting class.Taking a Medi'
+    b'a Production class.Taking a Dog Training class.Recently targeted for theft but can be asked abou'
+    b't it.Has a raccoon tattoo.Waiting to rummage for food again.Waiting to rummage in trash again.Wa'
+    b'iting for class to start.Recently received a stolen gift.Waiting to gain sentiment from class fr'
+    b'iends.Tracking lecture progress.Delayed reaction to a new ghost.Waiting to practice reaping agai'
+    b'n.Waiting to assign souls again.Waiting to use the scythe again.Experiencing d\xc3\xa9j\xc3\xa0 vu from a pa'
+    b'st life.Compelled to collect items.Waiting to check expression on a body.Waiting to check for br'
+    b'uises on a body.Waiting to check for crow pecks on a body.Waiting to check for lightning marks o'
+    b'n a body.Waiting to check for stains on a body.Waiting to check for vibrations on a body.Waiting'
+    b' to check body position.Waiting to check for rigor mortis.Waiting to check limb position.Waiting'
+    b' to check pockets.Waiting to check pulse.Waiting to check body temperature.Waiting to get an exp'
+    b'ert opinion.Selling caskets as a funeral director.Thinking about grim fashion advice.Interacting'
+    b' with the memorial cannon.Hanging out with a gang of ghosts.Cosplaying as Bonehilda.Stargazing a'
+    b's an astronomer.Cleaning up the canal.Checked into a small business.Recently rejected from a sho'
+    b'p.Grilling at a funeral BBQ.Received a reward from the Reaper career.Attending a funeral BBQ.Act'
+    b'ing as a mischievous ghost.Attending a creative hobby meetup.Playing in the area during a meetup'
+    b'.Attending a funeral BBQ as a guest.Counting souls reaped today.Attending a book hobby meetup.At'
+    b'tending a fitness hobby meetup.Waiting to take a photo at a meetup.Waiting to lecture at a meetu'
+    b'p.Waiting to exercise at a meetup.Waiting to play soccer at a meetup.Owner of a beloved brand.At'
+    b'tending a food and drink hobby meetup.Tracking temporary ghost status.Performing at a hobby meet'
+    b'up.Waiting to perform again.Attending a pottery hobby meetup.Attending a logic hobby meetup.Canc'
+    b'eling an action.Watching someone perform at a meetup.Waiting to use the telescope.Moonbathing.At'
+    b'tending the Tree Spree festival.Challenged by the Grim Reaper.Flagged for a Grim challenge via s'
+    b'ocial.Giving Ambrosia ingredients.Found all the frogs for Family Day.Waiting to find frogs again'
+    b'.Looking for frogs on Family Day.Improving Thanatology skill.Waiting to review an urn.Waiting to'
+    b' interview bystanders.Self-assessment of reaping was good.Self-assessment of reaping was poor.Gr'
+    b'illing for Family Day.Collecting items at a festival.Waiting to grill again.Haunting a house.Loo'
+    b'king for Waylon Warez.Gaining satisfaction from escaping death.Working at a massage chair.Workin'
+    b'g as a tattoo artist.Moonbathing while nude.Moonbathing under a full moon.Cowplant acting as a d'
+    b'ead sim.Feeling lucky after the Tree Spree.Acting as a Grim underling.Needs decay reduced (Stage'
+    b' A).Needs decay reduced (Stage B).Needs decay transitioning (Stage A).Needs decay transitioning '
+    b'(Stage B).Botched a temporary back tattoo.Botched a temporary front tattoo.Botched a temporary l'
+    b'eft leg tattoo.Botched a temporary right leg tattoo.Applied a temporary right arm tattoo.Applied'
+    b' a temporary left arm tattoo.Botched a temporary right arm tattoo.Botched a temporary left arm t'
+    b'attoo.Sleeping during a funeral.Waiting to swim while moonbathing.Reacting to reincarnation.Wait'
+    b'ing for the next tattoo customer.Currently tattooing a customer.Reincarnated with a burning soul'
+    b'.Witnessed angry yelling at a death.Confused by a death.Disgusted by a death.Neutral reaction to'
+    b' a death.Gleeful about a death.Smirking at a death.Shopping secretly as a shady person.Waiting t'
+    b"o grab a drink from the cooler.Waiting to do yoga again.Visiting Caster's Alley.Asking about Emi"
+    b"t's location.Trying to give a good dream but target is awake.Business rank is currently level 0."
+    b'Refusing to extinguish fires (Arsonist perk).Waiting to use the pottery wheel again.Waiting to u'
+    b'se the pottery kiln again.Waiting to use the dance floor again.Existing as a parallel temporary '
+    b'ghost in the River Styx.Returning from ghost transformation.Experiencing d\xc3\xa9j\xc3\xa0 vu with a soulma'
+    b'te.Seeing a cold spot VFX.Using an ultrasonic whistle.Sketching a tattoo design.Born as a Grim i'
+    b'nfant.Born as a Grim child.Born as a Grim toddler.Mentoring in pottery.Doing pottery.Being mento'
+    b'red consequences.Teaching a class consequences.Sold a ceramic piece.Feeling pottery skill boost '
+    b'from club perks.Currently on a quest.Pet crow provoking a ghost.Edith Basu using a water pump.Ed'
+    b'ith Basu using a frog log.Edith Basu viewing a tombstone.Surrounded by darkness.Standing in a co'
+    b'ld spot.Surrounded by fog.Watching static TV.Standing near ground fissures.Seeing flickering lig'
+    b'hts.Waiting to rummage again.Confused by a death (Toddler).Waking up from a ghostly bang.Walking'
+    b' to mock someone.Mocking someone.Sad about a death.Witnessed a sim passing away.Robbing a busine'
+    b'ss (White Collar).Finished a mentorship objective.Waiting to stay near household members.Learnin'
+    b'g faster due to mentor relationship.Hosting Customer Appreciation Day.Waking up from a nightmare'
+    b' nap.Attending a bar night event.Giving a motivating speech.Asking about missing items.Waiting t'
+    b'o sleep skillfully.Ready to sleep skillfully.Accusing sims of something.Currently speaking motiv'
+    b'ationally.Finished playing violin and leaving.Hosting a Silver level event.Hosting a Gold level '
+    b'event.Finished mentoring another objective.Resolving unfinished business: Singing.Fishing as a g'
+    b'host.Recognized as a beloved brand customer.Waiting to give another speech.Hiding inside a cake.'
+    b'Starting the Alice walkby role.Waiting for Alice to return from a rabbithole.Jumping out of a su'
+    b'rprise cake.Playing on outdoor equipment as a ghost.Completed a quest on Alice.Waiting to commun'
+    b'e with Alice again.Roleplaying as Zain.Roleplaying as Freya.Roleplaying as the Canal.Waiting to '
+    b"scavenge Alice's Tree again.Cheat: Solo Reaping event.Cheat: Grim Reaping event.Cheat: Plea even"
+    b't.Cheat: Haunting event.Cheat: Capture event.Cheat: Comedian event.Cheat: Cowplant event.Cheat: '
+    b'Training event.Cheat: HQ Sabotage event.Gained a happy customer.Checking for no lunar cycle.Wait'
+    b'ing to check lunar cycle again.Communing(New Moon).Communing(Waxing Crescent).Communing(First Qu'
+    b'arter).Communing(Waxing Gibbous).Communing(Full Moon).Communing(Waning Gibbous).Investigating de'
+    b'ath by old age.Investigating death by hunger.Investigating death by rabbit.Investigating death b'
+    b'y exhaustion.Communing(Third Quarter).Communing(Waning Crescent).Grief processing speed increase'
+    b'd.Memorial cannon is cooling down.Pregnant.Waiting to scry again.Resisting the sun as a vampire.'
+    b'Walking as a macabre tourist.Leaving as a macabre tourist.Improved relationship with Grim.Waitin'
+    b'g to use a waypoint.Waylon waiting to offer a mysterious item (Final).Waylon waiting to offer a '
+    b'mysterious item (Temp).Grim challenge.Preparing to fight a burglar.Waiting to dispel paparazzi.S'
+    b'ituation has started.Failed to find anything in the trash.Finished fighting a burglar.Resolving '
+    b'unfinished business: Skiing.Resolving unfinished business: Snowboarding.Burgling a house.Arreste'
+    b'd for burglary.Leaving the scene of a burglary.Starting the shady tutorial.Already life-drained.'
+    b'Listening to a funeral service.Recently started an accidental fire.Acting as a roommate.Successf'
+    b'ully asked about the Well of Souls.Spotted a burglar.Acting as a player in the Reaper career.Del'
+    b'iberating on a business decision.Waiting to give loot.Reacting to a burglar (Short).Reacting to '
+    b'a burglar (Long).Waiting for timed mail.Waiting to show off a new tattoo (Target).Waiting to sho'
+    b'w off a new tattoo (Actor).Small business quality is poor.Small business quality is excellent.Ch'
+    b'allenged to mock someone.Burglar just left.Challenging the Grim Reaper.Mentorship trip multiplie'
+    b'r active.Time-out buffer for crypt exit.Interaction running in crypt.Safety net for crypt exit.D'
+    b'elayed removal from crypt.Wearing a dummy uniform.Attending Customer Appreciation Day.Decided to'
+    b' attend to business.Tattoo is itchy.Tattoo is healing.Decided to reject business.Reincarnated fa'
+    b'mily is nearby.Currently reincarnating.Questing for Ekade (Tarot).Questing for Esther (Tarot).Qu'
+    b'esting for Nyon (Tarot).Questing for Zelmira (Tarot).Preventing delay in crypt.Focusing only on '
+    b'social interactions.Waiting to upgrade ghost powers.Checked in for Customer Appreciation Day.Ser'
+    b'ving free drinks.Ignoring homework.Triggering funeral start dialog.Waiting to go near the funera'
+    b'l area.Stopped playing music.Won a basketball game.Waylon waiting to possess someone.Waylon tend'
+    b'ing to his pet crow.Acting as Waylon Warez.Waiting to rate a soul.Waylon staying near crypts.Way'
+    b'lon staying near pet crow.Waylon waiting to visit crypts again.Business pricing value is bad.Bus'
+    b'iness pricing value is good.Sim is still traveling.Traveling to Brindleton Bay.Traveling to Brit'
+    b'echester.Traveling to Granite Falls.Traveling to Chestnut Ridge.Traveling to Copperdale.Travelin'
+    b'g to Del Sol Valley.Traveling to EP16 World.Traveling to Ravenwood.Traveling to Henford-on-Bagle'
+    b'y.Traveling to Mt. Komorebi.Traveling to Oasis Springs.Traveling to San Myshuno.Traveling to San'
+    b' Sequoia.Traveling to Selvadorada.Traveling to Sulani.Traveling to Tomarang.Traveling to Willow '
+    b'Creek.Traveling to Windenburg.Merchant selling shady goods.Waiting to use a generic ghost abilit'
+    b'y.Working as a business owner.Has the Idealist personality.Gathering with other Idealists.Possib'
+    b'ly lost on a Tarot quest.Spawning Emit.Waiting to summon Grim again.Customer has not been welcom'
+    b'ed yet.Active in a December event quest.Entertaining at a funeral.Delayed win at hopscotch with '
+    b'Grim.Waiting to go near the funeral BBQ.Socializing for the holidays.Read the Empress card: feel'
+    b'ing nurturing.Read the Moon card: feeling mysterious.Playing chess with Grim (Non-Plead).Sexing '
+    b'as a temporary ghost.Can try for a baby with Grim.Mark of Edith.Crystalin crypt.Burglar distract'
+    b'ed by player.Waylon ending his visit.Customer influenced by business talk.Waiting to request mus'
+    b'ic again.Playing an instrument temporarily.Reading an epitaph.Employee successfully got a tip.Em'
+    b'ployee failed to get a tip.Waiting for mentorship onboarding.Arrested after burglary.Waiting for'
+    b' burglar to visit again.Setting customer starting motives.Stopping panic about burglar.Going to '
+    b'holding cell.Customer holding bladder to stay longer.Grim summoned via tarot.Waiting to light a '
+    b'candle again.Waiting to pour a drink for the dead.In a holding cell.Major imbalance in the force'
+    b'.Minor imbalance in the force.Has the Grouch personality.Cleaning up business state.Ready to jum'
+    b'p out of cake.Gaining reputation from a happy customer.Confronting a burglar.Customer acting uni'
+    b'quely ().Customer acting like a prankster.Customer acting rude.Customer littering.Grouch near ot'
+    b'her people.Being grouchy.Grouch is not alone.Making amends as an Idealist.Customer asked to stop'
+    b' behaving badly.Grouch witnessing sabotage.Witnessing sabotage.Asked for a free drink.Offered a '
+    b'free drink.Repaying an investment.Onboarding for running a business.Waiting to flicker lights ag'
+    b'ain.Welcomed a customer.Gaining muscle, losing fat.Business quality is excellent (Big).Business '
+    b'quality is poor (Big).Working as a business employee.Listening to the holiday channel.Obsessed w'
+    b'ith fire recently.Burglar(Lot Trait).Burglar(Won Fight).Burglar(Cop Won).Triggering a party vibe'
+    b'.Is a guest at an event.Is a Fairy.Has the Rogue personality.Is a Rogue.Marked for sleep due to '
+    b'ailment.On Quest 1 of December Event.On Quest 2 of December Event.On Quest 3 of December Event.F'
+    b'rom a High Fae lineage.Is a Fairy (All ages).Walks by flying.On Quest 5 of December Event.Has th'
+    b'e Mystical personality.Pitch of voice is altered.Is Mystical.Waiting to gain sentiment from ment'
+    b'orship.Asking about holiday songs.Talking about holidays.Customer wait time is good.Received fru'
+    b'it from a PlantSim.Interacted with five customers recently.Interacted with six customers recentl'
+    b'y.Interacted with seven customers recently.Interacted with eight customers recently.Interacted w'
+    b'ith nine customers recently.Waiting to receive an offer.Sleeping to regenerate fairy energy.Wait'
+    b'ing to help manage emotions again.Gnome is scared of Grim.Receiving a prank call from a burglar.'
+    b'Meeting Mother Nature.Rummaging through shady trash.Mother Nature wandering.Waiting to regenerat'
+    b'e emotional appetite.Fairy cycle: New Moon.Fairy cycle: Waxing Crescent.Fairy cycle: Waxing Gibb'
+    b'ous.Fairy cycle: Full Moon.Fairy cycle: Waning Gibbous.Fairy cycle: Waning Crescent.On the Green'
+    b' Man quest.Business reached Rank 6.Checking in timer.Active in an R5 Event quest.Burnout from Cr'
+    b'eative mastery.Burnout from Mental mastery.Burnout from Active mastery.Tracking Active mastery.A'
+    b'cting as a Green Man.Wearing a raccoon suit.Horse moving around a business.Burglar situation is '
+    b'active.In Fairy form.Spreading ailment by touch.Checking outside conditions.Naturopath ailment s'
+    b'tage 0.Naturopath ailment stage 1.Naturopath ailment stage 3.Naturopath ailment stage 4.Naturopa'
+    b'th ailment stage 2.Diagnosed with no ailment.Diagnosed with Luck Suck.Diagnosed with Gnome Magne'
+    b't.Diagnosed with Creation Impulse.Diagnosed with Emotional Void.Diagnosed with Greenie Meanie.Pa'
+    b'ssive Ability: Improved Foraging.Passive Ability: Energy from Positive Socials.Passive Ability: '
+    b'Energy from Negative Socials.Passive Ability: Siphon Positive Moods.Passive Ability: Siphon Nega'
+    b'tive Moods.Passive Ability: Resist Spillover.Passive Ability: Embrace Spillover.Passive Ability:'
+    b' Improved Regeneration.Passive Ability: Energy from Sleep.Teleporting to a stone.Passive Ability'
+    b': Embrace Relationship Changes.Passive Ability: Negate Relationship Changes.Waiting to perform a'
+    b' heist again.Found a ring on a quest.On the Gnome quest.Checking outside conditions (Event).Comp'
+    b'leted outside goal.Inside during an event.On the Apothecary quest.Mother Nature acting as a fair'
+    b'y.Meeting Mother Nature as a fairy.On the Trade quest.On the Fairy quest.On the Liaison quest.Wa'
+    b'iting during a heist.Found Item A.Found Item B.Found Item C.Found Item D.Currently on a heist.Ra'
+    b'diating a red aura.Radiating a blue aura.Radiating a pink aura.Radiating a yellow aura.Radiating'
+    b' a grey aura.Radiating a green aura.Radiating a purple aura.Radiating an orange aura.Teaching a '
+    b'class as an NPC.Teaching a class.Preparing to teach a class.Asked about whispers.Asked about Pla'
+    b'ntSims.Protected by an Aura Shield.Protected by Celestial Protection.Shared findings.Wearing a s'
+    b'wimming suit.Waiting to use fairy dust again.Afflicted with a naturopathic ailment.Diagnosed wit'
+    b'h an ailment.Treated for an ailment.Suffering from an ailment.Afraid of magic (Fairy story).Plan'
+    b'tSim wandering the street.Coastal tourist wandering the street.Fairy wandering the street.Is Mot'
+    b'her Nature.Triggered a large dream reward.Recently enjoyed nature sounds.Wants to listen to natu'
+    b're sounds.Waiting to bottle emotion springs.Waiting to ask for fairy dust again.Gnome quest: Cof'
+    b'fee success.Gnome quest: Coffee failure.Gnome quest: Pie failure.Gnome quest: Pie success.Gnome '
+    b'quest: Toy success.Waiting to ask Mother Nature again.Listening to nature sounds.Consumed an eli'
+    b'xir.Teleporting to the Glade.Teleporting to the Grotto.Teleporting to Sixam.Teleporting to the M'
+    b'agic Realm.Teleporting to the Mountain Peak.Starving for emotion as a ghost.Waiting to ask the G'
+    b'reat Gnome for luck.Trading.Doing fairy tasks.Acting as a liaison.Taking an Apothecary class.Rec'
+    b'ently decided they dislike Apothecary.Balancing nature needs (Bohemian).Off-lot (Bohemian).Putti'
+    b'ng down a dependent.Waiting to relieve ailment at springs.Recently decided they like Apothecary.'
+    b'Gained relationship with a Light Pixie.Waiting to enter the fairy home again.Boosted relationshi'
+    b'p with a Fay Impresser.Afraid of magic effects.Working overtime as a Naturopath.Waiting to craft'
+    b' apothecary items again.Feeling apothecary skill boost from club perks.Completed running a busin'
+    b'ess.Completed setting up a business.Completed a business venue.Burglars in formation.Burglars ar'
+    b'riving.Waiting to search for frogs again.Waiting to arrange flowers again.All-Cure potion active'
+    b'.Potion timer active.Completed event goal.Ring quest.Mentoree has paid.Experiencing bad luck.Exp'
+    b'eriencing good luck.Waiting to research fairy lore.Waiting to ask a fairy.Waiting to purchase fa'
+    b'iry items.Waiting to receive a seed gift.Acting as a naturopath client.Diagnosed with a Physical'
+    b' ailment.Diagnosed with an Emotional ailment.Has the Plant Lover personality.Socializing as a Pl'
+    b'ant Lover.Completed a quest.Taking a Natural Living Style class.Triggered a small dream reward.T'
+    b'riggered a medium dream reward.Triggered a tiny dream reward.Triggered an extra large dream rewa'
+    b'rd.Recently decided they like Natural Living.Recently decided they dislike Natural Living.Diagno'
+    b'sed with Burning Passion.Diagnosed with Simoleon Fever.Diagnosed with Sonic Sinuses.Fishing auto'
+    b'nomously.Woodworking.Grilling.Cloudgazing.Digging.Holding an Emotion Stone.At a fairy dance part'
+    b'y.Supporting problem fairies.Green Man can be greeted.Waiting to extract fairy dust.Cosmosactive'
+    b'.Taking a client intake.Performing a holistic assessment.Starting a dream tracker.Trade talk.Nat'
+    b'ure talk.Extreme weather (no rain).Incubating Burning Passion.Incubating Sonic Sinuses.Incubatin'
+    b'g Luck Suck.Incubating Gnome Magnet.Incubating Greenie Meanie.Incubating Creation Impulse.Incuba'
+    b'ting Emotional Void.Incubating Simoleon Fever.PlantSim water need increasing.Hosting a teleport.'
+    b'Reacting to Gnome Magnet pull.Natural Living onboarding.Acting as a client.Feeling Natural Livin'
+    b'g skill boost from club perks.Ailment.Werewolf smelling a fairy.Showing off an Emotion Stone.Rev'
+    b'italizing needs.Visible PlantSim improvements.Enjoys being naked in public due to exhibitionism.'
+    b'Enjoys being nude.Stealing panties without getting caughtIgnoring nearby nude characterAsked to '
+    b'exchange sex for MDMANudity towel timeout after bathPeeping enthusiast activeSpeed buying drugs '
+    b'via basementalDealing drugs quicklyWeed Dealer traitRecently bought speedCaught stealing panties'
+    b'.Weirdo staying at a spot.Recently bought shrooms.Is a drug dealer.Is a high level drug dealer.W'
+    b'aiting to steal panties again.Refused to trade panties.Abstaining from sex.Persistently wanting '
+    b'sex.Asking to exchange sex for cocaine.Sexual desire.Paused hygiene in shower.Caught cheating.Ju'
+    b'st traded panties.Is a sex cheater.Vampire XP frozen.Dancing as a stripper.Confessed to cheating'
+    b'.Ayahuasca timer active.Lightweight tolerance to pills.Nude on holiday.Wearing a shaman top.High'
+    b' on cocaine (Autonomy).Diagnosed with ADHD.Researching psilocybin.On testosterone.Leaving premis'
+    b'es during raid.Checking on strip club employee.Gambling is legal in Willow Creek.Drugs legal in '
+    b'Chestnut Ridge.Researching cocaine.Wearing police raid bottoms.Viewing a dispensary plaque.Hungo'
+    b'ver from cocaine.Researching amphetamine.Recently bought speed.High on psilocybin (Stage 2).High'
+    b' on psilocybin (Stage 3).High on psilocybin (Stage 1).Purchased Raver trait.Immune to crab treat'
+    b'ment.Doing the walk of shame.Is a cocaine dealer.Gambling is legal in Lovestruck World.Summoned '
+    b'by porcelain.Working as a stripper.Using tobacco.Robbed recently.Drugs legal in Copperdale.Ayahu'
+    b'asca timer.Removed sabotage buff.Drugs legal in Windenburg.Recently researched AyahuascaShamed b'
+    b'y a video after a drunken adventureHaving lewd dreamsTripping on psychedelicsHigh on cannabisDra'
+    b'nk a beverage at a strip clubDog motives frozenWearing Shaman wrist accessoriesReceived negative'
+    b' reaction to nudityReady to make amends in AATemporarily remaining nudeSummoned via dealing phon'
+    b'eWaiting to read more picture commentsIn Magic Realm where gambling is legalizedHolding back vom'
+    b'it at strip clubWearing Shaman shoesRecently smoked tobaccoFeeling negative effects of magic mus'
+    b'hrooms (Stage 2)Experiencing bad mushroom trip effectsStruggling with mushroom trip intensityWor'
+    b'king as NPC strip club employeeResisting peer pressure regarding nudityUntrustworthy due to drug'
+    b' debtCelebrity waiting to do MDMA againUndressing temporarilyIn Evergreen Harbor where drugs are'
+    b' legalizedIn Strangerville where drugs are legalizedReceived positive reaction to nudityPanickin'
+    b'g and hiding drugs from policeSmuggling drugs in SelvadoradaCelebrity waiting to use cocaine aga'
+    b'inFeeling underpaid at strip clubReached AA Level 7Is a weed customerBreastfeedingActing as a cr'
+    b'eep NPCIn Mt. Komorebi where gambling is legalizedModerately influenced by amphetaminesWaiting f'
+    b'or private picture suggestionsCaught in a police bust at a raveWearing big shot dealer pantsIs a'
+    b' former inmateWaiting to buy drugs from pharmacy againRecently bought cocainePeeping on othersCo'
+    b'vered in cumDrug debt repo triggered while awayWearing drug thug hairstyleArresting a drug deale'
+    b'rGained an AA sponseePolice shutting down the raveDrug debt repo triggeredWearing drug thug shir'
+    b'tGiving rave vibesHungover from amphetaminesIs an MDMA customerHigh on XanaxModerately influence'
+    b'd by KetamineModerately influenced by CodeineCooling down from serving moonshineRecently researc'
+    b'hed XanaxWearing drug dealer shirtRecently covered bottomDying from tobacco-related cancerDrug s'
+    b'elling error preventionHungover from AdderallGrace period for buying drugsIs currently nudeBruis'
+    b'ed after a drunken adventureWearing cocaine companion outfitDelivering strip club suppliesIn San'
+    b' Myshuno where drugs are legalizedAt risk of Adderall overdoseCraving tobaccoAt a Juice Bar lotI'
+    b'n Evergreen Harbor where gambling is legalizedIn Moonwood Mill where gambling is legalizedWearin'
+    b'g big shot dealer watchWearing police raid shirtWearing police raid hatCat motives frozenThinkin'
+    b'g about an attractive personVery satisfied strip club employeeWearing drug dealer shoesUpdating '
+    b'miscarriage statusPolice present while smugglingFeeling asocialClocking in at strip clubIn Oasis'
+    b' Springs where gambling is legalizedExchanged sex for speed (drug)Hungover from MDMASilent durin'
+    b'g sexHas permanent steroid damageFeeling lustfulVanishing due to Ketamine (K-hole)In Magnolia Pr'
+    b'omenade where drugs are legalizedRecently spoke to Ben about cannabisSeverely overpaid at strip '
+    b'clubWearing shoes while nude outdoorsMildly influenced by XanaxNeutral satisfaction at strip clu'
+    b'b jobLooking like a porcelain dollCocaine companion staying putCraving KetamineTrip sitting for '
+    b'Ayahuasca userRecovering from non-fatal cannabis overdoseWatched April Fools TV broadcastIn Forg'
+    b'otten Hollow where gambling is legalizedRejected from dispensary applicationRecently researched '
+    b'AmyResting after sexHungover from KetamineRecently praised by strip club bossIn Henford-on-Bagle'
+    b'y where gambling is legalizedIn Newcrest where drugs are legalizedMenstrual cycle active (delay)'
+    b'Using dark web (glitch prevention)Satisfied strip club employeeMildly high on cannabisDeducted i'
+    b'tem from careerCannot deal to non-friends currentlyDying from Xanax overdoseRegular MDMA custome'
+    b'rLoyal MDMA customerGiving fight vibes at raveAt risk of amphetamine overdoseWaiting to go home '
+    b'from prisonDrunk and hungoverRegular cocaine customerNear a Straight Edge personLoyal cocaine cu'
+    b'stomerHiding high from parentsIn Strangerville where gambling is legalizedIs an amphetamine cust'
+    b'omerWearing drug dealer pantsWearing big shot dealer shoesTriggering a drunken adventureIn San M'
+    b'yshuno where gambling is legalizedDispensary application complete (Off Lot)Took a chill pill for'
+    b' periodIn Tomarang where drugs are legalizedon drug debt collectionIn Windenburg where gambling '
+    b'is legalizedWaiting to socialize at strip clubHigh on tobacco (nicotine buzz)Too poor to deal dr'
+    b'ugsNauseous at strip clubRecent cum on body (delayed reaction)Wearing drug dealer watchWearing d'
+    b'rug thug shoesAt risk of MDMA overdoseCelebrity recently bought speedTeen drinking alcoholCravin'
+    b'g XanaxDying from cocaine overdoseVery overpaid at strip clubSuffering medium steroid side effec'
+    b'tsLong-term smuggling in SelvadoradaLightweight tolerance to amphetaminesWearing police sergeant'
+    b' raid hatSuffering minor steroid side effectsCraving amphetaminesSocializing as strip club custo'
+    b'merAdderall managing ADHD symptomsNagged for cocaineAyahuasca Shaman activeFeeling like a clubbe'
+    b'rProcessed after arrestWorking as a maid (Basemental)At risk of Lean overdoseSeverely underpaid '
+    b'at strip clubDying from Adderall overdoseTemporarily fighting off cancer deathCraving CodeineGai'
+    b'ned a real sponsee in AASuffering major steroid side effectsTobacco dispenserHigh on KetamineSki'
+    b'lls frozenRecently covered topRecently bought a brick of cocaineUpdating peeping statusIn Ciudad'
+    b' Enamorada where drugs are legalizedIn Tartosa where gambling is legalizedCraving cocaineIn Newc'
+    b'rest where gambling is legalizedUsing Adderall for ADHD focusActing as a drug dealerHorse motive'
+    b's frozenFocused on strip club dutiesEngaging in sexual activityLiving in an area where gambling '
+    b'is legalIn an area with legalized substancesWearing shaman outfitFocused on current actionSuffer'
+    b'ing a fatal overdoseChecking ID as a bouncerFeeling underpaid at the strip clubRave party endedI'
+    b'n an area with legalized substancesRecently convinced someone for sexStarting a prison trialIn a'
+    b'n area with legalized gamblingHas a sexually transmitted infectionIn an area with legalized subs'
+    b'tancesTrying to avoid being nakedArrested for smugglingWatching a stripteaseWaiting for interact'
+    b'ion at strip clubIn an area with legalized gamblingSuffering from acne due to steroidsPlanning a'
+    b' partyWorking as a bartender at a strip clubVisiting a strip clubUnder the influence of XanaxEng'
+    b'aging in sex while on MDMADiagnosed with terminal cancerUnder the influence of MDMAActing like a'
+    b' celebrity on amphetaminesUnder the influence of psychedelicsActing like a porcelain dollWearing'
+    b' a drug dealer outfitIn an area with legalized substancesIdling at a strip clubSmoking tobaccoDr'
+    b'inking at a strip clubRecovering from chemotherapyEmbracing level 2 nudismEmbracing level 3 nudi'
+    b'smEmbracing level 1 nudismEmbracing level 4 nudismEmbracing level 5 nudismIn a polyamorous relat'
+    b'ionshipConducting a police raidIn an area with legalized substancesNagging someone for cocaineHi'
+    b'gh on magic mushroomsHigh on magic mushroomsHigh on magic mushroomsCleaning up bodily fluidsFeel'
+    b'ing nervous as a former inmateIn an area with legalized gamblingUnder the influence of cannabisI'
+    b'n an area with legalized substancesTrying to shoo someone away at workEngaging in casual sex vis'
+    b'itOn a low dose of steroidsFeeling effects of amphetamineIn prisonWorking with a dealer teamFeel'
+    b'ing effects of amphetamineActing like a celebrity on weedLosing weight rapidlySuffering from a h'
+    b'angoverManaging ADHD with AdderallRemoving underwearOn a low dose of cocaineDealing with menstru'
+    b'al cycleBeing raided as a drug dealerFollowing someone for drugsSlurring speech due to KetamineT'
+    b'ripping on PeyoteRecovering from doctor visitWorking as a janitor at a strip clubIncarceratedFee'
+    b'ling brave about nudityOn a low dose of MDMAPeeping on someoneOn Trenbolone (steroids)On a mediu'
+    b'm dose of cocaineAspiring to be nudeAfterglow from MDMASearching for soulHigh on amphetaminesOn '
+    b'a low dose of KetamineResearching MDMAIn an area with legalized substancesSmuggling drugsPlaying'
+    b' a clicking gameManufacturing MDMATripping on AyahuascaDressed as a thugFeeling overpaidSweating'
+    b'In the mood for sexPursuing a straight-edge lifestyleTaking AdderallDeducting items for careerBu'
+    b'ying cocaineDressed as policeIs a ghost who died of cancerMotives frozen by modOn a high dose of'
+    b' steroidsSmoking outsideFeeling pressure to be nudeReceiving a private danceRecently bought MDMA'
+    b'On high dose of AdderallSuffering fatal overdoseInvited to have sexHanging out with a cocaine us'
+    b'erHigh on codeineBuying weedBuying weedCraving drugsCleaning up after dancingOn medium dose of M'
+    b'DMAOn low dose of CodeineOverheating from steroidsTaking a break from masturbationIn an area wit'
+    b'h legalized substancesHungover from XanaxResearching KetamineVomiting from alcoholVisiting a str'
+    b'ip clubPolice raid startingWorking security at a raveWearing drug thug shoesRecovering from chem'
+    b'otherapyBeing followed by a thugEngaging in casual sexDancing publiclyAccepted apology from pare'
+    b'ntsFlashing someoneExperiencing alcohol-related dramaWalking barefootMust remain nakedRipped off'
+    b' during drug dealPaid adequately at strip clubDressed as a big shot dealerWasted and not at home'
+    b'Dancing at strip clubTriggered by cannabisTripping on PeyotePolice raid startingGiving a suggest'
+    b'ive lookIn an area with legalized gamblingAt a sex partyMasturbating while watching adult conten'
+    b't on TVFeeling grossly underpaid at the strip clubCraving a substanceWearing police raid glovesS'
+    b'muggling event in progress in SelvadoradaWearing police raid shoesEmbarrassed after an alcohol-f'
+    b'ueled adventureRecently propositioned to buy MDMAFeeling dizzy and drunkWorking as a bouncerActi'
+    b'ng charming as a strip club employeeAware drugs are legalized in Willow CreekUnsatisfied with jo'
+    b'b at strip clubPassed out from a hangoverFeeling overactive on TrenboloneAware drugs are legaliz'
+    b'ed in Del Sol ValleyXanax overdose delay activeAware gambling is legal in SulaniHigh tolerance t'
+    b'o amphetaminesAware gambling is legal in NordhavenDying from a Ketamine overdoseCleaned off lubr'
+    b'icantHungover from LeanAdmiring self nude in the mirrorLiving a straight-edge lifestyleRecently '
+    b'researched LeanDealing with drug debt collectorsAware drugs are legalized in Mt. KomorebiDrug de'
+    b'bt deadline is upWearing drug dealer pantsDied of an overdose and is now a ghostHigh tolerance f'
+    b'or pillsFeeling grossly overpaid at the strip clubOn a heroic Peyote tripOvulatingBlasting Testo'
+    b'steroneTriggered Adderall autonomyAware drugs are legal in the Magic RealmPolice officer arresti'
+    b'ng a dealerAware drugs are legal in Oasis SpringsWearing Ayahuasca Shaman hairOn psychedelicsOn '
+    b'AdderallCelebrity recently bought a brick of cocaineWorking as a strip club employeeCollected mo'
+    b'ney for party planningAware gambling is legal in RavenwoodWearing police hatCreeping on nude cha'
+    b'ractersParty supplies purchaseGreeting a smuggler in SelvadoradaIncreasing raid risk in Selvador'
+    b'adaAware drugs are legal in Forgotten HollowBeing cuckoldedSteroid autonomy activeSteroid autono'
+    b'my activeExchanged sex for cocaineExperiencing psilocybin effectsExperiencing psilocybin effects'
+    b'Experiencing psilocybin effectsHigh on MDMATipsy and dancingVery unsatisfied with strip club job'
+    b'Being followed by an Ayahuasca ShamanManaging ADHD with AdderallAware gambling is legal in Coppe'
+    b'rdaleParent reacting to apology regarding drugsRecently bought weedTriggered Thai Stick travel e'
+    b'ffectNPC smoking tobacco at schoolAware gambling is legal in Chestnut RidgeDying of Lean overdos'
+    b'eUsing a fake ID for alcoholHad a lewd dreamOn amphetamines'
+)
@@ -11,62 +11,100 @@ from sims4communitylib.utils.sims.common_sim_genealogy_utils import CommonSimGen
 from sims4communitylib.utils.sims.common_relationship_utils import CommonRelationshipUtils
 from sims4communitylib.utils.common_log_registry import CommonLogRegistry
 from sims_ai_chat_scripts.modinfo import ModInfo
+from sims_ai_chat_scripts.lookup_tables import MOODLET_LOOKUP, CONTEXT_BUFF_LOOKUP, TRAIT_LOOKUP, get_lookup_stats
+from sims_ai_chat_scripts.scrape_scheduler import SimsAIScrapeScheduler
+from sims_ai_chat_scripts.profile_cache import SimsAIProfileCache
+from sims_ai_chat_scripts.residence_cache import SimsAIResidenceCache
+from sims_ai_chat_scripts import perf, server_connection
 
 log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'DebugCmds')
 
 # --- STEP 1: GLOBAL EXTRACTOR (UPDATED) ---
-@CommonConsoleCommand(ModInfo.get_identity(), 'ai_dump_buffs', 'Extracts ALL game buffs with Decimal IDs to a text file.')
-def _ai_dump_all_buffs(output: CommonConsoleCommandOutput):
-    output("Starting Global Buff Dump... this may take a moment.")
-    
-    # Get the Instance Manager for Buffs
-    buff_manager = services.get_instance_manager(sims4.resources.Types.BUFF)
-    
-    results = []
-    
-    # Iterate through every loaded buff in the game
-    for resource_key, buff_type in buff_manager.types.items():
+DUMP_CHUNK_SIZE = 200 # Tuning instances handled per step; the scrape scheduler runs a few steps per tick
+DUMP_FILE_NAME = 'sims_ai_tuning_dump.tsv'
+
+def _dump_rows(kind, tuning_types, get_id, describe, tables, seen):
+    """Yields (chunk of TSV lines) for one instance manager, sorted by decimal id."""
+    chunk = []
+    for tuning_type in tuning_types:
         try:
-            # 1. Get Decimal ID using S4CL
-            decimal_id = CommonBuffUtils.get_buff_id(buff_type)
-            
-            # Skip if valid ID not found
+            decimal_id = get_id(tuning_type)
             if not decimal_id:
                 continue
+            seen.add(decimal_id)
+            shipped = [table_name for table_name, table in tables if decimal_id in table]
+            chunk.append("\t".join([kind, str(decimal_id), tuning_type.__name__] + describe(tuning_type)
+                                    + ["+".join(shipped) or "-"]))
+        except Exception:
+            # Silently skip broken tuning to prevent crash
+            pass
+        if len(chunk) >= DUMP_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
-            # 2. Get Metadata
-            name = buff_type.__name__
-            visible = getattr(buff_type, 'visible', False)
-            
-            mood_type = getattr(buff_type, 'mood_type', None)
-            mood_name = mood_type.__name__ if mood_type else "None"
-            
-            # 3. Format Entry
-            # Format: 12345: ("BuffName", "Mood"), # Visible: True
-            entry = f"{decimal_id}: (\"{name}\", \"{mood_name}\"), # Visible: {visible}"
-            results.append(entry)
-            
-        except Exception as e:
-            # Silently skip broken buffs to prevent crash
-            continue
+def _describe_buff(buff_type):
+    mood_type = getattr(buff_type, 'mood_type', None)
+    return [mood_type.__name__ if mood_type else "None", str(bool(getattr(buff_type, 'visible', False)))]
+
+def _describe_trait(trait_type):
+    category = getattr(trait_type, 'trait_type', None)
+    return [getattr(category, 'name', str(category)), ""]
+
+def _tuning_dump_job(file_path):
+    """
+    Scheduler job: streams every buff and trait of the game to a TSV file, DUMP_CHUNK_SIZE at a
+    time, marking which shipped lookup tables know each id. Rows are sorted by id within each
+    kind and table ids the game no longer has are listed at the end, so two dumps (or a dump and
+    the lookup sources) diff cleanly. Returns the row counts.
+    """
+    buff_tables = (("MOODLET", MOODLET_LOOKUP), ("CONTEXT_BUFF", CONTEXT_BUFF_LOOKUP))
+    trait_tables = (("TRAIT", TRAIT_LOOKUP),)
+    managers = (
+        ("buff", sims4.resources.Types.BUFF, CommonBuffUtils.get_buff_id, _describe_buff, buff_tables),
+        ("trait", sims4.resources.Types.TRAIT, lambda trait_type: getattr(trait_type, 'guid64', None), _describe_trait, trait_tables),
+    )
+    counts = {}
+    seen = set()
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("# kind\tdecimal_id\ttuning_name\tmood_or_trait_type\tvisible\tshipped_in\n")
+        for kind, resource_type, get_id, describe, tables in managers:
+            tuning_types = list(services.get_instance_manager(resource_type).types.values())
+            tuning_types.sort(key=lambda tuning_type: getattr(tuning_type, 'guid64', 0) or 0)
+            yield
+            counts[kind] = 0
+            for chunk in _dump_rows(kind, tuning_types, get_id, describe, tables, seen):
+                f.write("\n".join(chunk) + "\n")
+                counts[kind] += len(chunk)
+                yield
 
-    # Sort by ID for tidiness
-    # (Or sort by Name if you prefer: results.sort(key=lambda x: x.split('"')[1]))
-    results.sort()
+        # Shipped entries the game does not know (removed or mistyped ids)
+        for table_name, table in buff_tables + trait_tables:
+            stale = [decimal_id for decimal_id in table if decimal_id not in seen]
+            for decimal_id in stale:
+                f.write(f"# stale\t{decimal_id}\t{table_name}\n")
+            counts[f"stale_{table_name.lower()}"] = len(stale)
+            yield
+    return counts
 
+@CommonConsoleCommand(ModInfo.get_identity(), 'ai_dump_buffs', 'Streams ALL game buffs and traits (Decimal IDs) to a TSV file, a chunk per tick.')
+def _ai_dump_all_buffs(output: CommonConsoleCommandOutput):
     # Write to file in Mods folder
     base_path = os.path.join(os.path.expanduser('~'), 'Documents', 'Electronic Arts', 'The Sims 4', 'Mods')
-    file_path = os.path.join(base_path, 'all_game_buffs_decimal.txt')
-    
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# FORMAT: DECIMAL_ID: (\"Name\", \"Mood\")\n")
-            f.write("MOODLET_LOOKUP = {\n")
-            f.write('\n'.join(results))
-            f.write("\n}")
-        output(f"Dump successful! Saved to: {file_path}")
-    except Exception as e:
-        output(f"Could not write file to {file_path}. Error: {e}")
+    file_path = os.path.join(base_path, DUMP_FILE_NAME)
+
+    def _on_done(counts):
+        summary = ", ".join(f"{key}: {value}" for key, value in counts.items())
+        log.debug(f"Tuning dump finished ({summary})")
+        output(f"Dump successful! Saved to: {file_path} ({summary})")
+
+    def _on_error(error):
+        output(f"Could not write file to {file_path}. Error: {error}")
+
+    output("Starting Global Buff Dump... the game keeps running while it is written.")
+    SimsAIScrapeScheduler.get().submit("debug.dump_buffs", _tuning_dump_job(file_path),
+                                       on_done=_on_done, on_error=_on_error)
 
 
 # --- STEP 2: TARGET SIM BUFF INSPECTOR ---
@@ -214,4 +252,37 @@ def _ai_test_residence(output: CommonConsoleCommandOutput):
 
     # 5. Output Result
     result_str = f"Lives in {world_name}, {lot_name}"
-    output(f"SUCCESS: {result_str}")
\ No newline at end of file
+    output(f"SUCCESS: {result_str}")
+
+# --- PERFORMANCE COMMAND ---
+@CommonConsoleCommand(ModInfo.get_identity(), 'ai_perf', 'Print scrape and HTTP timings (p50/p95 per section) and cache stats.')
+def _ai_perf(output: CommonConsoleCommandOutput):
+    """
+    Prints the timing spans recorded by perf.py since the game started (last RING_SIZE per section),
+    then the state of the mod's caches.
+    """
+    summary = perf.get_summary()
+    if not summary:
+        output("No timings recorded yet. Start a chat first.")
+    else:
+        output(f"{'Section':<28} {'n':>4} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        for section in sorted(summary):
+            s = summary[section]
+            output(f"{section:<28} {s['n']:>4} {s['p50']:>8} {s['p95']:>8} {s['max']:>8}")
+
+    output("Lookup tables:")
+    for name, stats in get_lookup_stats().items():
+        if stats["loaded"]:
+            output(f"  {name}: {stats['entries']} entries, {stats['bytes'] // 1024} KB, loaded in {stats['load_ms']} ms")
+        else:
+            output(f"  {name}: not loaded yet")
+
+    http = server_connection.get_connection_stats()
+    output(f"HTTP: {http['requests']} requests over {http['connections_opened']} connections "
+           f"({http['reconnects']} reconnects, {http['errors']} errors)")
+
+    profiles = SimsAIProfileCache.get().get_stats()
+    output(f"Profile cache: {profiles['sections']} sections, {profiles['hits']} hits / {profiles['misses']} misses")
+    zones = SimsAIResidenceCache.get().get_stats()
+    output(f"Residence cache: {zones['zones']} zones, {zones['hits']} hits / {zones['misses']} misses")
+    output(f"Scrape queue: {'busy' if SimsAIScrapeScheduler.get().is_busy else 'idle'}")
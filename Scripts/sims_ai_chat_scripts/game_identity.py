@@ -0,0 +1,33 @@
+# Scripts/sims_ai_chat_scripts/game_identity.py
+
+import services
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims_ai_chat_scripts.modinfo import ModInfo
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'GameIdentity')
+
+def get_save_id():
+    """
+    Stable identifier of the loaded save game. The server keeps one memory database per save.
+    Returns 0 if the save slot is unknown (e.g. a brand new, never saved game).
+    """
+    try:
+        persistence_service = services.get_persistence_service()
+        if persistence_service:
+            return persistence_service.get_save_slot_proto_guid() or 0
+    except Exception as e:
+        log.error("Failed to read save slot guid", exception=e)
+    return 0
+
+def get_household_id():
+    try:
+        return services.active_household_id() or 0
+    except:
+        return 0
+
+def get_game_identity():
+    """ Fields merged into every payload so the server can pick the right database. """
+    return {
+        "save_id": get_save_id(),
+        "household_id": get_household_id()
+    }
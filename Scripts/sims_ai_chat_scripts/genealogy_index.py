@@ -0,0 +1,105 @@
+# Scripts/sims_ai_chat_scripts/genealogy_index.py
+
+from sims.genealogy_tracker import FamilyRelationshipIndex
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+from sims4communitylib.utils.sims.common_sim_genealogy_utils import CommonSimGenealogyUtils
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.events.sim.events.sim_initialized import S4CLSimInitializedEvent
+from sims4communitylib.events.relationship.events.relationship_bit_added import S4CLRelationshipBitAddedEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'GenealogyIndex')
+
+class SimsAIGenealogyIndex(CommonService):
+    """
+    Parent -> children lookup for profile scraping.
+    Built with one pass over every SimInfo per zone load, then kept current from S4CL events
+    (births on sim initialization, adoptions through the family relationship bits).
+    Deaths need no update: children are stored as ids and resolved on lookup, so dead sims
+    stay listed as long as the game keeps their SimInfo and culled ones simply drop out.
+    """
+    def __init__(self):
+        self._children = {} # parent sim id -> {child sim id: None} (dict keeps insertion order)
+        self._parents = {}  # child sim id -> (mother id, father id) as last indexed
+        self._is_built = False
+
+    def rebuild(self):
+        self._children = {}
+        self._parents = {}
+        count = 0
+        for sim_info in CommonSimUtils.get_sim_info_for_all_sims_generator():
+            self.index_sim(sim_info)
+            count += 1
+        self._is_built = True
+        log.debug(f"Genealogy index built from {count} sims.")
+
+    @property
+    def is_built(self):
+        return self._is_built
+
+    def index_sim(self, sim_info):
+        """(Re)records the parents of one sim."""
+        try:
+            child_id = CommonSimUtils.get_sim_id(sim_info)
+            tracker = CommonSimGenealogyUtils.get_genealogy_tracker(sim_info)
+            if not child_id or tracker is None:
+                return
+            parents = (tracker.get_relation(FamilyRelationshipIndex.MOTHER),
+                       tracker.get_relation(FamilyRelationshipIndex.FATHER))
+        except Exception as e:
+            log.error("Failed to index sim genealogy", exception=e)
+            return
+
+        previous = self._parents.get(child_id)
+        if previous == parents:
+            return
+        for parent_id in previous or ():
+            if parent_id and parent_id not in parents:
+                self._children.get(parent_id, {}).pop(child_id, None)
+        for parent_id in parents:
+            if parent_id:
+                self._children.setdefault(parent_id, {})[child_id] = None
+        self._parents[child_id] = parents
+
+    def get_children(self, sim_info):
+        """SimInfos of the sim's (biological or adopted) children that still exist."""
+        if not self._is_built:
+            self.rebuild()
+        parent_id = CommonSimUtils.get_sim_id(sim_info)
+        children = []
+        for child_id in self._children.get(parent_id, ()):
+            child = CommonSimUtils.get_sim_info(child_id)
+            if child is not None and child is not sim_info:
+                children.append(child)
+        return children
+
+# --- REGISTER LIFECYCLE HOOKS (S4CL Compliant) ---
+class SimsAIGenealogyListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # Sims of the whole save are loaded by now, and the loading screen hides the full pass
+        SimsAIGenealogyIndex.get().rebuild()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_sim_initialized(event_data: S4CLSimInitializedEvent):
+        # Newborns (and sims created by the game mid-session)
+        index = SimsAIGenealogyIndex.get()
+        if index.is_built:
+            index.index_sim(event_data.sim_info)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_relationship_bit_added(event_data: S4CLRelationshipBitAddedEvent):
+        # Adoption (and late genealogy fix-ups) show up as family relationship bits
+        index = SimsAIGenealogyIndex.get()
+        if index.is_built:
+            index.index_sim(event_data.sim_info)
+            index.index_sim(event_data.target_sim_info)
+        return True
@@ -0,0 +1,101 @@
+# Scripts/sims_ai_chat_scripts/http_sender.py
+
+import queue
+import threading
+import time
+from collections import deque
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+from sims_ai_chat_scripts import server_connection
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'HttpSender')
+
+# --- CONFIGURATION ---
+SENDER_QUEUE_SIZE = 64   # Requests waiting for the worker; beyond this, new requests fail fast
+REQUEST_TIMEOUT = 5      # Seconds per attempt
+MAX_RETRIES = 2          # Extra attempts when the server could not be reached at all
+RETRY_DELAY = 0.5        # Seconds, doubled after every failed attempt
+MAX_CALLBACKS_PER_TICK = 8
+
+class SimsAIHttpSender(CommonService):
+    """
+    One background worker for all mod -> server requests.
+    Gameplay code enqueues a request and returns at once. When the request finishes, its
+    callback(response_dict, error) is queued and run on the game thread by the next zone
+    update, so callbacks may safely touch game state (pause, dialogs, notifications).
+    """
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=SENDER_QUEUE_SIZE)
+        self._completed = deque()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def post(self, path, payload=None, on_done=None, retries=MAX_RETRIES):
+        """Queues a JSON POST (payload None sends {}). Returns False (and reports the error to on_done) if the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((path, payload, on_done, retries))
+            return True
+        except queue.Full:
+            log.error(f"Sender queue full, dropping request to {path}")
+            if on_done:
+                self._completed.append((on_done, None, "Sender queue full"))
+            return False
+
+    def drain_callbacks(self, limit=MAX_CALLBACKS_PER_TICK):
+        """Runs finished request callbacks. Called on the game thread."""
+        for _ in range(limit):
+            try:
+                callback, response, error = self._completed.popleft()
+            except IndexError:
+                return
+            try:
+                callback(response, error)
+            except Exception as e:
+                log.error("Error in request callback", exception=e)
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker_loop)
+                self._thread.setDaemon(True)
+                self._thread.start()
+
+    def _worker_loop(self):
+        while True:
+            path, payload, on_done, retries = self._queue.get()
+            response, error = None, None
+            delay = RETRY_DELAY
+            for attempt in range(retries + 1):
+                try:
+                    response = server_connection.request("POST", path, payload, timeout=REQUEST_TIMEOUT)
+                    error = None
+                    break
+                except server_connection.ServerNotReachedError as e:
+                    # Nothing was sent (server still starting, or restarting), so trying again is safe
+                    error = str(e)
+                    if attempt < retries:
+                        time.sleep(delay)
+                        delay *= 2
+                except Exception as e:
+                    # An HTTP error, or a timeout/reset after the request went out: the server may
+                    # already be acting on it (/game/init, a chat turn), so it is never sent twice
+                    error = str(e)
+                    break
+            if error:
+                log.debug(f"Request to {path} failed: {error}")
+            if on_done:
+                self._completed.append((on_done, response, error))
+
+# --- REGISTER GAME THREAD PUMP (S4CL Compliant) ---
+class SimsAIHttpSenderListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_update(event_data: S4CLZoneUpdateEvent):
+        SimsAIHttpSender.get().drain_callbacks()
+        return True
@@ -3,6 +3,7 @@
 # --- STANDARD IMPORTS ---
 from typing import Tuple, Any, List
 from sims.sim_info import SimInfo
+from interactions.context import InteractionContext
 import services
 
 # --- S4CL IMPORTS ---
@@ -32,6 +33,8 @@ log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'debug_intera
 AI_CHAT_INTERACTION_ID = 3473934492 
 EDIT_LOCATION_INTERACTION_ID = 2232829793 
 GROUP_CHAT_INTERACTION_ID = 3809631617 
+GROUP_PICKER_RADIUS = 25          # Meters (ground distance) around the active sim; None = whole lot
+GROUP_PICKER_MAX_CANDIDATES = 12  # Nearest sims shown in the group picker
 
 # ==============================================================================
 # 1. SINGLE CHAT INTERACTION
@@ -58,6 +61,10 @@ class ChatWithAIInteraction(CommonImmediateSuperInteraction):
              return CommonTestResult.NONE
         # -------------------
 
+        # The player is looking at the chat option: warm the caches before the click. Other
+        # tests of the interaction (autonomy, queue checks) do not mean a chat is coming.
+        if getattr(interaction_context, 'source', None) == InteractionContext.SOURCE_PIE_MENU:
+            SimsAIChatService.get().prefetch_chat(interaction_target)
         return CommonTestResult.TRUE
 
     def on_started(self, interaction_sim, interaction_target):
@@ -90,6 +97,35 @@ class EditLocationContextInteraction(CommonImmediateSuperInteraction):
 # ==============================================================================
 # 3. GROUP CHAT INTERACTION
 # ==============================================================================
+def get_group_chat_candidates(active_sim_info, radius=GROUP_PICKER_RADIUS, limit=GROUP_PICKER_MAX_CANDIDATES):
+    """
+    Teen+ humans spawned in the zone, nearest to the active sim first.
+    Starts from the zone's instanced sims instead of every SimInfo of the save.
+    """
+    active_sim = CommonSimUtils.get_sim_instance(active_sim_info)
+    if active_sim is None:
+        return []
+    origin = active_sim.position
+    max_distance_sq = radius * radius if radius is not None else None
+
+    candidates = []
+    for sim in services.sim_info_manager().instanced_sims_gen():
+        sim_info = sim.sim_info
+        if sim_info is active_sim_info:
+            continue
+        # Must be Human, Teen or Older
+        if not CommonSpeciesUtils.is_human(sim_info) or not CommonAgeUtils.is_teen_adult_or_elder(sim_info):
+            continue
+        # Ground distance; the level a sim stands on does not matter
+        position = sim.position
+        distance_sq = (position.x - origin.x) ** 2 + (position.z - origin.z) ** 2
+        if max_distance_sq is not None and distance_sq > max_distance_sq:
+            continue
+        candidates.append((distance_sq, sim_info))
+
+    candidates.sort(key=lambda candidate: candidate[0])
+    return [sim_info for _, sim_info in candidates[:limit]]
+
 class GroupChatInteraction(CommonImmediateSuperInteraction):
     @classmethod
     def get_mod_identity(cls): return ModInfo.get_identity()
@@ -105,30 +141,10 @@ class GroupChatInteraction(CommonImmediateSuperInteraction):
         try:
             active_sim_info = CommonSimUtils.get_sim_info(interaction_sim)
 
-            # 1. Build the list of nearby Sims manually
+            # 1. Build the list of nearby Sims, nearest first
             option_rows = []
             
-            for sim_info in CommonSimUtils.get_sim_info_for_all_sims_generator():
-                
-                # Filter A: Don't pick yourself
-                if sim_info is active_sim_info:
-                    continue
-                
-                # Filter B: Must be "Instanced" (Spawned/Nearby/Visible)
-                if CommonSimUtils.get_sim_instance(sim_info) is None:
-                    continue
-                
-                # --- NEW FILTERS FOR PICKER ---
-                # Filter C: Must be Human
-                if not CommonSpeciesUtils.is_human(sim_info):
-                    continue
-                    
-                # Filter D: Must be Teen or Older
-                if not CommonAgeUtils.is_teen_adult_or_elder(sim_info):
-                    continue
-                # ------------------------------
-
-                # Create the Row
+            for sim_info in get_group_chat_candidates(active_sim_info):
                 sim_id = CommonSimUtils.get_sim_id(sim_info)
                 # S4CL uses 'tag' internally to resolve the selection back to the object
                 row = SimPickerRow(sim_id, select_default=False, tag=sim_info)
@@ -1,12 +1,14 @@
 # Scripts/sims_ai_chat_scripts/location_service.py
 
 import services
-import json
-import urllib.request
 from sims4communitylib.services.common_service import CommonService
 from sims4communitylib.utils.common_log_registry import CommonLogRegistry
 from sims4communitylib.dialogs.common_input_text_dialog import CommonInputTextDialog
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
 from sims_ai_chat_scripts.modinfo import ModInfo
+from sims_ai_chat_scripts.game_identity import get_game_identity
+from sims_ai_chat_scripts.http_sender import SimsAIHttpSender
 
 # --- NEW IMPORTS FOR CONSOLE COMMAND ---
 from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand
@@ -15,6 +17,37 @@ from sims4communitylib.services.commands.common_console_command_output import Co
 log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'LocationService')
 
 class SimsAILocationService(CommonService):
+    """
+    Lot descriptions live on the server; the mod keeps a copy of all of them for the loaded
+    save, fetched once per zone load with /location/all and updated by its own edits. Until
+    that copy arrived (server down at load), the dialog asks the server as before.
+    """
+    def __init__(self):
+        self._descriptions = {} # zone_id -> description (described lots only)
+        self._is_synced = False
+
+    def sync_descriptions(self):
+        """Replaces the local copy with the server's descriptions for this save (asynchronous)."""
+        self._is_synced = False
+        SimsAIHttpSender.get().post("/location/all", get_game_identity(), on_done=self._on_descriptions_synced)
+
+    def _on_descriptions_synced(self, response, error):
+        if error:
+            log.error(f"Failed to sync location descriptions: {error}")
+            return
+        # JSON object keys are strings
+        self._descriptions = {int(zone_id): desc for zone_id, desc in (response or {}).get("locations", {}).items()}
+        self._is_synced = True
+        log.debug(f"Synced {len(self._descriptions)} location descriptions.")
+
+    def get_description(self, zone_id):
+        """Description of the zone from the local copy, or None if unknown or not synced yet."""
+        return self._descriptions.get(zone_id)
+
+    @property
+    def is_synced(self):
+        return self._is_synced
+
     def edit_location_description(self):
         """
         Opens a dialog to edit the description of the current lot.
@@ -29,18 +62,28 @@ class SimsAILocationService(CommonService):
             if current_zone and current_zone.lot:
                 lot_name = current_zone.lot.get_lot_name()
 
-            # 2. Check Server for existing description
-            existing_desc = ""
-            try:
-                url = "http://127.0.0.1:3000/location/get"
-                data = json.dumps({"zone_id": zone_id}).encode('utf-8')
-                req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-                with urllib.request.urlopen(req) as response:
-                     resp_data = json.loads(response.read().decode('utf-8'))
-                     existing_desc = resp_data.get("description", "")
-            except Exception as e:
-                log.error("Failed to fetch existing description", exception=e)
-                existing_desc = ""
+            # 2. Open straight from the synced copy
+            if self._is_synced:
+                existing_desc = self._descriptions.get(zone_id, "")
+                self._show_description_dialog(zone_id, lot_name, {"description": existing_desc}, None)
+                return
+
+            # Not synced: ask the server for the existing description; the dialog opens when it answers
+            payload = {"zone_id": zone_id}
+            payload.update(get_game_identity())
+            SimsAIHttpSender.get().post(
+                "/location/get", payload,
+                on_done=lambda response, error: self._show_description_dialog(zone_id, lot_name, response, error)
+            )
+
+        except Exception as e:
+            log.error("Error in edit_location_description", exception=e)
+
+    def _show_description_dialog(self, zone_id, lot_name, response, error):
+        try:
+            if error:
+                log.error(f"Failed to fetch existing description: {error}")
+            existing_desc = (response or {}).get("description", "") or ""
 
             # 3. Prepare Dialog Info
             status_text = "Described" if existing_desc else "Undescribed"
@@ -71,19 +114,32 @@ class SimsAILocationService(CommonService):
         if not value or value.strip() == "":
             return
 
-        try:
-            # 5. Send Update to Server
-            url = "http://127.0.0.1:3000/location/update"
-            payload = {
-                "zone_id": zone_id,
-                "description": value
-            }
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-            urllib.request.urlopen(req)
+        # 5. Send Update to Server
+        payload = {
+            "zone_id": zone_id,
+            "description": value
+        }
+        payload.update(get_game_identity())
+        SimsAIHttpSender.get().post(
+            "/location/update", payload,
+            on_done=lambda response, error: self._on_description_saved(zone_id, value, error)
+        )
+
+    def _on_description_saved(self, zone_id, description, error):
+        if error:
+            log.error(f"Failed to save description to server: {error}")
+        else:
+            self._descriptions[zone_id] = description
             log.debug(f"Updated description for zone {zone_id}")
-        except Exception as e:
-            log.error("Failed to save description to server", exception=e)
+
+# --- REGISTER LIFECYCLE HOOK (S4CL Compliant) ---
+class SimsAILocationListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # A different save (or household) may have been loaded
+        SimsAILocationService.get().sync_descriptions()
+        return True
 
 # --- NEW CONSOLE COMMAND PLACED HERE (OUTSIDE THE CLASS) ---
 
@@ -0,0 +1,95 @@
+# Scripts/sims_ai_chat_scripts/lookup_tables.py
+
+import importlib
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+# Separates the fields of tuple values (e.g. trait name and category) inside the blob
+FIELD_SEPARATOR = "\x1f"
+
+class CompactLookup(Mapping):
+    """
+    Read-only id -> text mapping backed by a generated table module (see Scripts/compile/build_lookup_tables.py):
+    a sorted array of 64-bit ids, an array of offsets into one UTF-8 blob, and the blob itself.
+    The game imports every module of the package at startup, table modules included, but each
+    one holds just three bytes constants, so that import is a plain unmarshal of a few hundred KB
+    (the dict literals it replaces built one object per entry). The arrays are only built on
+    first access, and a lookup is a bisect plus one slice decode, so no per-entry Python objects
+    exist until a value is actually read.
+    """
+    def __init__(self, module_name):
+        self._module_name = module_name
+        self._ids = None
+        self._offsets = None
+        self._blob = None
+        self._fields = 1
+        self.load_ms = None
+
+    def _load(self):
+        start = time.perf_counter()
+        table = importlib.import_module(self._module_name)
+        ids = array('Q')
+        ids.frombytes(table.IDS)
+        offsets = array('I')
+        offsets.frombytes(table.OFFSETS)
+        if sys.byteorder != 'little': # Tables are generated little-endian
+            ids.byteswap()
+            offsets.byteswap()
+        self._ids, self._offsets, self._blob, self._fields = ids, offsets, table.BLOB, table.FIELDS
+        self.load_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    def _index(self, key):
+        if self._ids is None:
+            self._load()
+        if not isinstance(key, int) or key < 0:
+            return -1
+        i = bisect_left(self._ids, key)
+        return i if i < len(self._ids) and self._ids[i] == key else -1
+
+    def _value(self, i):
+        text = self._blob[self._offsets[i]:self._offsets[i + 1]].decode('utf-8')
+        return tuple(text.split(FIELD_SEPARATOR)) if self._fields > 1 else text
+
+    def __getitem__(self, key):
+        i = self._index(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._value(i)
+
+    def __contains__(self, key):
+        return self._index(key) >= 0
+
+    def __iter__(self):
+        if self._ids is None:
+            self._load()
+        return iter(self._ids)
+
+    def __len__(self):
+        if self._ids is None:
+            self._load()
+        return len(self._ids)
+
+    def get_stats(self):
+        """Entries, bytes held and load time (None until first use)."""
+        if self._ids is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "entries": len(self._ids),
+            "bytes": len(self._blob) + self._ids.itemsize * len(self._ids) + self._offsets.itemsize * len(self._offsets),
+            "load_ms": self.load_ms
+        }
+
+MOODLET_LOOKUP = CompactLookup('sims_ai_chat_scripts.moodlet_table')
+CONTEXT_BUFF_LOOKUP = CompactLookup('sims_ai_chat_scripts.context_buff_table')
+TRAIT_LOOKUP = CompactLookup('sims_ai_chat_scripts.trait_table')
+
+def get_lookup_stats():
+    return {
+        "moodlets": MOODLET_LOOKUP.get_stats(),
+        "context_buffs": CONTEXT_BUFF_LOOKUP.get_stats(),
+        "traits": TRAIT_LOOKUP.get_stats()
+    }
@@ -0,0 +1,4945 @@
+# Scripts/sims_ai_chat_scripts/moodlet_table.py
+# GENERATED from Scripts/lookup_sources/moodlet_data.py by Scripts/compile/build_lookup_tables.py - do not edit.
+
+FIELDS = 1
+COUNT = 9270
+IDS = (
+    b"' \x00\x00\x00\x00\x00\x00A \x00\x00\x00\x00\x00\x00q \x00\x00\x00\x00\x00\x00\xf0 \x00\x00\x00\x00\x00\x00\xf4 \x00\x00\x00\x00\x00\x00\xf8 \x00\x00\x00\x00\x00\x00\x84!\x00\x00\x00\x00\x00\x00\x85!\x00\x00\x00\x00\x00\x00\x87!\x00\x00\x00\x00\x00\x00\x88!\x00\x00\x00\x00\x00\x00\x94!\x00\x00\x00\x00\x00\x00\xa7!\x00\x00\x00\x00\x00\x00"
+    b'\xda!\x00\x00\x00\x00\x00\x00\xdb!\x00\x00\x00\x00\x00\x00\xdc!\x00\x00\x00\x00\x00\x00\xdd!\x00\x00\x00\x00\x00\x00\xdf!\x00\x00\x00\x00\x00\x00\xe0!\x00\x00\x00\x00\x00\x00\xe1!\x00\x00\x00\x00\x00\x00\xe2!\x00\x00\x00\x00\x00\x00\xe3!\x00\x00\x00\x00\x00\x00\xe4!\x00\x00\x00\x00\x00\x00\xe5!\x00\x00\x00\x00\x00\x00\xe6!\x00\x00\x00\x00\x00\x00'
+    b'\xe7!\x00\x00\x00\x00\x00\x00\xe8!\x00\x00\x00\x00\x00\x00\xee!\x00\x00\x00\x00\x00\x00\x8a#\x00\x00\x00\x00\x00\x00\xa2#\x00\x00\x00\x00\x00\x00\xcb#\x00\x00\x00\x00\x00\x00\xcf#\x00\x00\x00\x00\x00\x00\xd3#\x00\x00\x00\x00\x00\x00I$\x00\x00\x00\x00\x00\x00N$\x00\x00\x00\x00\x00\x00T$\x00\x00\x00\x00\x00\x00Y$\x00\x00\x00\x00\x00\x00'
+    b'k$\x00\x00\x00\x00\x00\x00s$\x00\x00\x00\x00\x00\x00x$\x00\x00\x00\x00\x00\x00}$\x00\x00\x00\x00\x00\x00\xe8$\x00\x00\x00\x00\x00\x00)%\x00\x00\x00\x00\x00\x00h%\x00\x00\x00\x00\x00\x00l%\x00\x00\x00\x00\x00\x00m%\x00\x00\x00\x00\x00\x00n%\x00\x00\x00\x00\x00\x00o%\x00\x00\x00\x00\x00\x00+&\x00\x00\x00\x00\x00\x00'
+    b"\xb8&\x00\x00\x00\x00\x00\x00\xee&\x00\x00\x00\x00\x00\x00\xef&\x00\x00\x00\x00\x00\x00\x96'\x00\x00\x00\x00\x00\x00\x97'\x00\x00\x00\x00\x00\x00\xb5'\x00\x00\x00\x00\x00\x00\x04(\x00\x00\x00\x00\x00\x00\x05(\x00\x00\x00\x00\x00\x00:(\x00\x00\x00\x00\x00\x00;(\x00\x00\x00\x00\x00\x00t(\x00\x00\x00\x00\x00\x00u(\x00\x00\x00\x00\x00\x00"
+    b'z(\x00\x00\x00\x00\x00\x00\x7f(\x00\x00\x00\x00\x00\x00\xa2(\x00\x00\x00\x00\x00\x00\xa4(\x00\x00\x00\x00\x00\x00\xa5(\x00\x00\x00\x00\x00\x00\xa6(\x00\x00\x00\x00\x00\x00\xb9(\x00\x00\x00\x00\x00\x00\xd2(\x00\x00\x00\x00\x00\x00\xd6(\x00\x00\x00\x00\x00\x00\xfb(\x00\x00\x00\x00\x00\x00_)\x00\x00\x00\x00\x00\x00`)\x00\x00\x00\x00\x00\x00'
+    b'a)\x00\x00\x00\x00\x00\x00e)\x00\x00\x00\x00\x00\x00i)\x00\x00\x00\x00\x00\x00j)\x00\x00\x00\x00\x00\x00m)\x00\x00\x00\x00\x00\x00r)\x00\x00\x00\x00\x00\x00\x97)\x00\x00\x00\x00\x00\x00\x99)\x00\x00\x00\x00\x00\x00\x9b)\x00\x00\x00\x00\x00\x00\x9d)\x00\x00\x00\x00\x00\x00\x9f)\x00\x00\x00\x00\x00\x00\xa2)\x00\x00\x00\x00\x00\x00'
+    b'\xb6)\x00\x00\x00\x00\x00\x00c0\x00\x00\x00\x00\x00\x00d0\x00\x00\x00\x00\x00\x00i0\x00\x00\x00\x00\x00\x00l0\x00\x00\x00\x00\x00\x00o0\x00\x00\x00\x00\x00\x00q0\x00\x00\x00\x00\x00\x00r0\x00\x00\x00\x00\x00\x00s0\x00\x00\x00\x00\x00\x00t0\x00\x00\x00\x00\x00\x00u0\x00\x00\x00\x00\x00\x00v0\x00\x00\x00\x00\x00\x00'
+    b'w0\x00\x00\x00\x00\x00\x00x0\x00\x00\x00\x00\x00\x00y0\x00\x00\x00\x00\x00\x00z0\x00\x00\x00\x00\x00\x00{0\x00\x00\x00\x00\x00\x00|0\x00\x00\x00\x00\x00\x00}0\x00\x00\x00\x00\x00\x00~0\x00\x00\x00\x00\x00\x00\x7f0\x00\x00\x00\x00\x00\x00\x800\x00\x00\x00\x00\x00\x00\x810\x00\x00\x00\x00\x00\x00\x820\x00\x00\x00\x00\x00\x00'
+    b'\x830\x00\x00\x00\x00\x00\x00\x840\x00\x00\x00\x00\x00\x00\x850\x00\x00\x00\x00\x00\x00\x860\x00\x00\x00\x00\x00\x00\x870\x00\x00\x00\x00\x00\x00\x880\x00\x00\x00\x00\x00\x00\x890\x00\x00\x00\x00\x00\x00\x8a0\x00\x00\x00\x00\x00\x00\x8b0\x00\x00\x00\x00\x00\x00\x8c0\x00\x00\x00\x00\x00\x00\x8d0\x00\x00\x00\x00\x00\x00\x8e0\x00\x00\x00\x00\x00\x00'
+    b'\x8f0\x00\x00\x00\x00\x00\x00\x900\x00\x00\x00\x00\x00\x00\x910\x00\x00\x00\x00\x00\x00\x920\x00\x00\x00\x00\x00\x00\x930\x00\x00\x00\x00\x00\x00\x940\x00\x00\x00\x00\x00\x00\x950\x00\x00\x00\x00\x00\x00\x960\x00\x00\x00\x00\x00\x00\x970\x00\x00\x00\x00\x00\x00\x980\x00\x00\x00\x00\x00\x00\x9a0\x00\x00\x00\x00\x00\x00\x9b0\x00\x00\x00\x00\x00\x00'
+    b'\x9f0\x00\x00\x00\x00\x00\x00\xa30\x00\x00\x00\x00\x00\x00\xa40\x00\x00\x00\x00\x00\x00\xa80\x00\x00\x00\x00\x00\x00\xb00\x00\x00\x00\x00\x00\x00\xb20\x00\x00\x00\x00\x00\x00\xb30\x00\x00\x00\x00\x00\x00\xb80\x00\x00\x00\x00\x00\x00\xba0\x00\x00\x00\x00\x00\x00\xbc0\x00\x00\x00\x00\x00\x00\xcc0\x00\x00\x00\x00\x00\x00\xeb0\x00\x00\x00\x00\x00\x00'
+    b'\xf20\x00\x00\x00\x00\x00\x00\xf80\x00\x00\x00\x00\x00\x00\xfc0\x00\x00\x00\x00\x00\x00\xfd0\x00\x00\x00\x00\x00\x00\xfe0\x00\x00\x00\x00\x00\x00\xff0\x00\x00\x00\x00\x00\x00\x111\x00\x00\x00\x00\x00\x00\x121\x00\x00\x00\x00\x00\x00\x131\x00\x00\x00\x00\x00\x00\x151\x00\x00\x00\x00\x00\x00\x161\x00\x00\x00\x00\x00\x00\x171\x00\x00\x00\x00\x00\x00'
+    b'\x181\x00\x00\x00\x00\x00\x00\x191\x00\x00\x00\x00\x00\x00\x1a1\x00\x00\x00\x00\x00\x00\x1b1\x00\x00\x00\x00\x00\x00\x1c1\x00\x00\x00\x00\x00\x00\x1d1\x00\x00\x00\x00\x00\x00\x1e1\x00\x00\x00\x00\x00\x00\x1f1\x00\x00\x00\x00\x00\x00 1\x00\x00\x00\x00\x00\x00+1\x00\x00\x00\x00\x00\x00<1\x00\x00\x00\x00\x00\x00>1\x00\x00\x00\x00\x00\x00'
+    b'?1\x00\x00\x00\x00\x00\x00@1\x00\x00\x00\x00\x00\x00A1\x00\x00\x00\x00\x00\x00B1\x00\x00\x00\x00\x00\x00C1\x00\x00\x00\x00\x00\x00D1\x00\x00\x00\x00\x00\x00E1\x00\x00\x00\x00\x00\x00y1\x00\x00\x00\x00\x00\x00\x891\x00\x00\x00\x00\x00\x00\x8d1\x00\x00\x00\x00\x00\x00\xa51\x00\x00\x00\x00\x00\x00\xa61\x00\x00\x00\x00\x00\x00'
+    b'\xa71\x00\x00\x00\x00\x00\x00\xa81\x00\x00\x00\x00\x00\x00\xa91\x00\x00\x00\x00\x00\x00\xaa1\x00\x00\x00\x00\x00\x00\xab1\x00\x00\x00\x00\x00\x00\xad1\x00\x00\x00\x00\x00\x00\xae1\x00\x00\x00\x00\x00\x00\xaf1\x00\x00\x00\x00\x00\x00\xb01\x00\x00\x00\x00\x00\x00\xb11\x00\x00\x00\x00\x00\x00\xbb1\x00\x00\x00\x00\x00\x00\xc01\x00\x00\x00\x00\x00\x00'
+    b'\xc11\x00\x00\x00\x00\x00\x00\xc21\x00\x00\x00\x00\x00\x00\xc31\x00\x00\x00\x00\x00\x00\xc41\x00\x00\x00\x00\x00\x00\xd11\x00\x00\x00\x00\x00\x00\xd51\x00\x00\x00\x00\x00\x00\xd61\x00\x00\x00\x00\x00\x00\xd71\x00\x00\x00\x00\x00\x00\xd81\x00\x00\x00\x00\x00\x00\xdb1\x00\x00\x00\x00\x00\x00\xea1\x00\x00\x00\x00\x00\x00\xef1\x00\x00\x00\x00\x00\x00'
+    b'\xf01\x00\x00\x00\x00\x00\x00\xf11\x00\x00\x00\x00\x00\x00\xf21\x00\x00\x00\x00\x00\x00\xf31\x00\x00\x00\x00\x00\x00\xf41\x00\x00\x00\x00\x00\x00\xf51\x00\x00\x00\x00\x00\x00\xf61\x00\x00\x00\x00\x00\x00\xf71\x00\x00\x00\x00\x00\x00\xf81\x00\x00\x00\x00\x00\x00\xf91\x00\x00\x00\x00\x00\x00\xfa1\x00\x00\x00\x00\x00\x00\xfb1\x00\x00\x00\x00\x00\x00'
+    b'\xfc1\x00\x00\x00\x00\x00\x00\xfd1\x00\x00\x00\x00\x00\x00\xfe1\x00\x00\x00\x00\x00\x00\xff1\x00\x00\x00\x00\x00\x00\x002\x00\x00\x00\x00\x00\x00\x012\x00\x00\x00\x00\x00\x00\x022\x00\x00\x00\x00\x00\x00\x032\x00\x00\x00\x00\x00\x00\x042\x00\x00\x00\x00\x00\x00\x052\x00\x00\x00\x00\x00\x00\x062\x00\x00\x00\x00\x00\x00\x072\x00\x00\x00\x00\x00\x00'
+    b'\x082\x00\x00\x00\x00\x00\x00\t2\x00\x00\x00\x00\x00\x00\n2\x00\x00\x00\x00\x00\x00\x0b2\x00\x00\x00\x00\x00\x00\x0f2\x00\x00\x00\x00\x00\x00\x102\x00\x00\x00\x00\x00\x00\x122\x00\x00\x00\x00\x00\x00\x132\x00\x00\x00\x00\x00\x00\x142\x00\x00\x00\x00\x00\x00\x152\x00\x00\x00\x00\x00\x00\x172\x00\x00\x00\x00\x00\x00\x192\x00\x00\x00\x00\x00\x00'
+    b'\x1a2\x00\x00\x00\x00\x00\x00\xb6\\\x00\x00\x00\x00\x00\x00\xb8\\\x00\x00\x00\x00\x00\x00\x16]\x00\x00\x00\x00\x00\x00G]\x00\x00\x00\x00\x00\x00H]\x00\x00\x00\x00\x00\x00a]\x00\x00\x00\x00\x00\x00f]\x00\x00\x00\x00\x00\x00\xb1]\x00\x00\x00\x00\x00\x00\xb3]\x00\x00\x00\x00\x00\x00\xc3]\x00\x00\x00\x00\x00\x00\xc4]\x00\x00\x00\x00\x00\x00'
+    b"\xcb]\x00\x00\x00\x00\x00\x00\x00^\x00\x00\x00\x00\x00\x00\x81^\x00\x00\x00\x00\x00\x00\x18_\x00\x00\x00\x00\x00\x00\x19_\x00\x00\x00\x00\x00\x00-_\x00\x00\x00\x00\x00\x00\xae_\x00\x00\x00\x00\x00\x00\x06`\x00\x00\x00\x00\x00\x00\x14`\x00\x00\x00\x00\x00\x00'`\x00\x00\x00\x00\x00\x00-`\x00\x00\x00\x00\x00\x00/`\x00\x00\x00\x00\x00\x00"
+    b'\xa7a\x00\x00\x00\x00\x00\x00\xaba\x00\x00\x00\x00\x00\x00\xeca\x00\x00\x00\x00\x00\x00\xbff\x00\x00\x00\x00\x00\x00\xd8f\x00\x00\x00\x00\x00\x00\xd9f\x00\x00\x00\x00\x00\x00\xdaf\x00\x00\x00\x00\x00\x00\xdcf\x00\x00\x00\x00\x00\x00\xdef\x00\x00\x00\x00\x00\x00\xeaf\x00\x00\x00\x00\x00\x00\xebf\x00\x00\x00\x00\x00\x00\xeef\x00\x00\x00\x00\x00\x00'
+    b'\xeff\x00\x00\x00\x00\x00\x00\xfdf\x00\x00\x00\x00\x00\x00\xd0g\x00\x00\x00\x00\x00\x009h\x00\x00\x00\x00\x00\x00Bh\x00\x00\x00\x00\x00\x00Lh\x00\x00\x00\x00\x00\x00\x8ch\x00\x00\x00\x00\x00\x00\xa3h\x00\x00\x00\x00\x00\x00\x06i\x00\x00\x00\x00\x00\x00\xe4i\x00\x00\x00\x00\x00\x00\xe5i\x00\x00\x00\x00\x00\x00\xe9i\x00\x00\x00\x00\x00\x00'
+    b'\xeai\x00\x00\x00\x00\x00\x00\xeci\x00\x00\x00\x00\x00\x004j\x00\x00\x00\x00\x00\x00Gj\x00\x00\x00\x00\x00\x00Lj\x00\x00\x00\x00\x00\x00Nj\x00\x00\x00\x00\x00\x00\xf7j\x00\x00\x00\x00\x00\x00\xf8j\x00\x00\x00\x00\x00\x00\xfbj\x00\x00\x00\x00\x00\x00\xfcj\x00\x00\x00\x00\x00\x00\tk\x00\x00\x00\x00\x00\x00\nk\x00\x00\x00\x00\x00\x00'
+    b'\x0bk\x00\x00\x00\x00\x00\x00\x0ck\x00\x00\x00\x00\x00\x00Ak\x00\x00\x00\x00\x00\x00~k\x00\x00\x00\x00\x00\x00\x97k\x00\x00\x00\x00\x00\x007l\x00\x00\x00\x00\x00\x00al\x00\x00\x00\x00\x00\x00\x1fm\x00\x00\x00\x00\x00\x00\xa5m\x00\x00\x00\x00\x00\x00\xc6m\x00\x00\x00\x00\x00\x00\xcam\x00\x00\x00\x00\x00\x00\xccm\x00\x00\x00\x00\x00\x00'
+    b'\xd0m\x00\x00\x00\x00\x00\x001n\x00\x00\x00\x00\x00\x002n\x00\x00\x00\x00\x00\x00mn\x00\x00\x00\x00\x00\x00on\x00\x00\x00\x00\x00\x00\x08o\x00\x00\x00\x00\x00\x00\x0fo\x00\x00\x00\x00\x00\x00\x18o\x00\x00\x00\x00\x00\x00qo\x00\x00\x00\x00\x00\x00xo\x00\x00\x00\x00\x00\x00\x91o\x00\x00\x00\x00\x00\x00\xa6o\x00\x00\x00\x00\x00\x00'
+    b'\xb7o\x00\x00\x00\x00\x00\x00\xbdo\x00\x00\x00\x00\x00\x00\x16p\x00\x00\x00\x00\x00\x00np\x00\x00\x00\x00\x00\x00\xbdp\x00\x00\x00\x00\x00\x00\xebp\x00\x00\x00\x00\x00\x00\x10q\x00\x00\x00\x00\x00\x00\x13q\x00\x00\x00\x00\x00\x00\x15q\x00\x00\x00\x00\x00\x004q\x00\x00\x00\x00\x00\x005q\x00\x00\x00\x00\x00\x00\xe2q\x00\x00\x00\x00\x00\x00'
+    b'or\x00\x00\x00\x00\x00\x00\x83r\x00\x00\x00\x00\x00\x00\x9cr\x00\x00\x00\x00\x00\x00\xa6r\x00\x00\x00\x00\x00\x00\xd0r\x00\x00\x00\x00\x00\x00\xd7r\x00\x00\x00\x00\x00\x00\xd8r\x00\x00\x00\x00\x00\x00\\s\x00\x00\x00\x00\x00\x00\x86s\x00\x00\x00\x00\x00\x00\x87s\x00\x00\x00\x00\x00\x00\x8as\x00\x00\x00\x00\x00\x00\xees\x00\x00\x00\x00\x00\x00'
+    b'\xefs\x00\x00\x00\x00\x00\x00\xf0s\x00\x00\x00\x00\x00\x00\xf1s\x00\x00\x00\x00\x00\x00\xf2s\x00\x00\x00\x00\x00\x00\xf3s\x00\x00\x00\x00\x00\x00\xf4s\x00\x00\x00\x00\x00\x00\xf5s\x00\x00\x00\x00\x00\x00\xf6s\x00\x00\x00\x00\x00\x00\xf7s\x00\x00\x00\x00\x00\x00\xf8s\x00\x00\x00\x00\x00\x000t\x00\x00\x00\x00\x00\x001t\x00\x00\x00\x00\x00\x00'
+    b'\x9ct\x00\x00\x00\x00\x00\x00\xa2t\x00\x00\x00\x00\x00\x00\xa3t\x00\x00\x00\x00\x00\x00\xa4t\x00\x00\x00\x00\x00\x00\xa7t\x00\x00\x00\x00\x00\x00\xb4t\x00\x00\x00\x00\x00\x00\xd6t\x00\x00\x00\x00\x00\x00\xe7t\x00\x00\x00\x00\x00\x00#u\x00\x00\x00\x00\x00\x00Hu\x00\x00\x00\x00\x00\x00Ju\x00\x00\x00\x00\x00\x00\xe6u\x00\x00\x00\x00\x00\x00'
+    b'\xe7u\x00\x00\x00\x00\x00\x00\xe8u\x00\x00\x00\x00\x00\x00\xe9u\x00\x00\x00\x00\x00\x00\xeau\x00\x00\x00\x00\x00\x00\xebu\x00\x00\x00\x00\x00\x00\xecu\x00\x00\x00\x00\x00\x00\xedu\x00\x00\x00\x00\x00\x00\xeeu\x00\x00\x00\x00\x00\x00\xefu\x00\x00\x00\x00\x00\x00\xf0u\x00\x00\x00\x00\x00\x00\xf1u\x00\x00\x00\x00\x00\x00\xf2u\x00\x00\x00\x00\x00\x00'
+    b'\xf3u\x00\x00\x00\x00\x00\x00\xf5u\x00\x00\x00\x00\x00\x00\xf7u\x00\x00\x00\x00\x00\x00\xf8u\x00\x00\x00\x00\x00\x00\xf9u\x00\x00\x00\x00\x00\x00\xfau\x00\x00\x00\x00\x00\x00{v\x00\x00\x00\x00\x00\x00\x8av\x00\x00\x00\x00\x00\x00\x8bv\x00\x00\x00\x00\x00\x00\x8cv\x00\x00\x00\x00\x00\x00\x8dv\x00\x00\x00\x00\x00\x00\x8ev\x00\x00\x00\x00\x00\x00'
+    b'\x12w\x00\x00\x00\x00\x00\x00\xe7w\x00\x00\x00\x00\x00\x00\xe8w\x00\x00\x00\x00\x00\x00\xf8w\x00\x00\x00\x00\x00\x00ox\x00\x00\x00\x00\x00\x00px\x00\x00\x00\x00\x00\x00\xacx\x00\x00\x00\x00\x00\x00\xb1x\x00\x00\x00\x00\x00\x00\xd1x\x00\x00\x00\x00\x00\x00\x0fy\x00\x00\x00\x00\x00\x00>y\x00\x00\x00\x00\x00\x00uy\x00\x00\x00\x00\x00\x00'
+    b'xy\x00\x00\x00\x00\x00\x00yy\x00\x00\x00\x00\x00\x00\x92y\x00\x00\x00\x00\x00\x00\x99y\x00\x00\x00\x00\x00\x00\xd5y\x00\x00\x00\x00\x00\x00\xe8y\x00\x00\x00\x00\x00\x00\xf5y\x00\x00\x00\x00\x00\x00\xf8y\x00\x00\x00\x00\x00\x00\xfey\x00\x00\x00\x00\x00\x00\x05z\x00\x00\x00\x00\x00\x00\x07z\x00\x00\x00\x00\x00\x00Ez\x00\x00\x00\x00\x00\x00'
+    b'Iz\x00\x00\x00\x00\x00\x00mz\x00\x00\x00\x00\x00\x00oz\x00\x00\x00\x00\x00\x00qz\x00\x00\x00\x00\x00\x00rz\x00\x00\x00\x00\x00\x00sz\x00\x00\x00\x00\x00\x00tz\x00\x00\x00\x00\x00\x00\x81z\x00\x00\x00\x00\x00\x00\x82z\x00\x00\x00\x00\x00\x00\x84z\x00\x00\x00\x00\x00\x00\x8dz\x00\x00\x00\x00\x00\x00\x91z\x00\x00\x00\x00\x00\x00'
+    b'\xafz\x00\x00\x00\x00\x00\x00\xb4z\x00\x00\x00\x00\x00\x00\x13{\x00\x00\x00\x00\x00\x00){\x00\x00\x00\x00\x00\x00*{\x00\x00\x00\x00\x00\x00+{\x00\x00\x00\x00\x00\x00,{\x00\x00\x00\x00\x00\x005{\x00\x00\x00\x00\x00\x00>{\x00\x00\x00\x00\x00\x00e{\x00\x00\x00\x00\x00\x00g{\x00\x00\x00\x00\x00\x00\x8e{\x00\x00\x00\x00\x00\x00'
+    b'\x90{\x00\x00\x00\x00\x00\x00\xa1{\x00\x00\x00\x00\x00\x00\xe9{\x00\x00\x00\x00\x00\x00\xf9{\x00\x00\x00\x00\x00\x00\xfa{\x00\x00\x00\x00\x00\x00\xfb{\x00\x00\x00\x00\x00\x00\x0e|\x00\x00\x00\x00\x00\x00"|\x00\x00\x00\x00\x00\x00\xa1|\x00\x00\x00\x00\x00\x00\xa5|\x00\x00\x00\x00\x00\x00\xa6|\x00\x00\x00\x00\x00\x00\xb1|\x00\x00\x00\x00\x00\x00'
+    b'x}\x00\x00\x00\x00\x00\x00\xa5}\x00\x00\x00\x00\x00\x00\xaa}\x00\x00\x00\x00\x00\x00\xb8}\x00\x00\x00\x00\x00\x00\x1f~\x00\x00\x00\x00\x00\x00"~\x00\x00\x00\x00\x00\x000~\x00\x00\x00\x00\x00\x003~\x00\x00\x00\x00\x00\x00Q~\x00\x00\x00\x00\x00\x00o~\x00\x00\x00\x00\x00\x00s~\x00\x00\x00\x00\x00\x00\x15\x7f\x00\x00\x00\x00\x00\x00'
+    b'%\x7f\x00\x00\x00\x00\x00\x00)\x7f\x00\x00\x00\x00\x00\x00*\x7f\x00\x00\x00\x00\x00\x00+\x7f\x00\x00\x00\x00\x00\x00,\x7f\x00\x00\x00\x00\x00\x00-\x7f\x00\x00\x00\x00\x00\x00.\x7f\x00\x00\x00\x00\x00\x00/\x7f\x00\x00\x00\x00\x00\x003\x7f\x00\x00\x00\x00\x00\x007\x7f\x00\x00\x00\x00\x00\x008\x7f\x00\x00\x00\x00\x00\x00g\x7f\x00\x00\x00\x00\x00\x00'
+    b'h\x7f\x00\x00\x00\x00\x00\x00\xb3\x80\x00\x00\x00\x00\x00\x00\xb4\x80\x00\x00\x00\x00\x00\x00\xb5\x80\x00\x00\x00\x00\x00\x00\xb6\x80\x00\x00\x00\x00\x00\x00\xb7\x80\x00\x00\x00\x00\x00\x00\xbe\x80\x00\x00\x00\x00\x00\x00\xbf\x80\x00\x00\x00\x00\x00\x00\x00\x81\x00\x00\x00\x00\x00\x00\x12\x81\x00\x00\x00\x00\x00\x00\x13\x81\x00\x00\x00\x00\x00\x00\x15\x81\x00\x00\x00\x00\x00\x00'
+    b"\x18\x81\x00\x00\x00\x00\x00\x00\x19\x81\x00\x00\x00\x00\x00\x00\x1a\x81\x00\x00\x00\x00\x00\x00\x1c\x81\x00\x00\x00\x00\x00\x00\x1d\x81\x00\x00\x00\x00\x00\x00'\x81\x00\x00\x00\x00\x00\x00)\x81\x00\x00\x00\x00\x00\x00+\x81\x00\x00\x00\x00\x00\x00.\x81\x00\x00\x00\x00\x00\x00/\x81\x00\x00\x00\x00\x00\x000\x81\x00\x00\x00\x00\x00\x005\x81\x00\x00\x00\x00\x00\x00"
+    b'6\x81\x00\x00\x00\x00\x00\x007\x81\x00\x00\x00\x00\x00\x008\x81\x00\x00\x00\x00\x00\x00A\x81\x00\x00\x00\x00\x00\x00B\x81\x00\x00\x00\x00\x00\x00Z\x81\x00\x00\x00\x00\x00\x00\xd9\x81\x00\x00\x00\x00\x00\x00\xf4\x81\x00\x00\x00\x00\x00\x00\x19\x82\x00\x00\x00\x00\x00\x00>\x82\x00\x00\x00\x00\x00\x00?\x82\x00\x00\x00\x00\x00\x00@\x82\x00\x00\x00\x00\x00\x00'
+    b'A\x82\x00\x00\x00\x00\x00\x00B\x82\x00\x00\x00\x00\x00\x00C\x82\x00\x00\x00\x00\x00\x00D\x82\x00\x00\x00\x00\x00\x00\xa4\x82\x00\x00\x00\x00\x00\x00\xad\x82\x00\x00\x00\x00\x00\x00\xc5\x82\x00\x00\x00\x00\x00\x00\xc6\x82\x00\x00\x00\x00\x00\x00\xcc\x82\x00\x00\x00\x00\x00\x00\xd0\x82\x00\x00\x00\x00\x00\x00\xd8\x82\x00\x00\x00\x00\x00\x00o\x83\x00\x00\x00\x00\x00\x00'
+    b"\xd2\x83\x00\x00\x00\x00\x00\x00\xd3\x83\x00\x00\x00\x00\x00\x00\xd4\x83\x00\x00\x00\x00\x00\x00\xf1\x83\x00\x00\x00\x00\x00\x00\xf2\x83\x00\x00\x00\x00\x00\x00\x07\x84\x00\x00\x00\x00\x00\x00&\x84\x00\x00\x00\x00\x00\x00'\x84\x00\x00\x00\x00\x00\x00)\x84\x00\x00\x00\x00\x00\x00+\x84\x00\x00\x00\x00\x00\x003\x84\x00\x00\x00\x00\x00\x005\x84\x00\x00\x00\x00\x00\x00"
+    b'\xa1\x84\x00\x00\x00\x00\x00\x00\xaf\x84\x00\x00\x00\x00\x00\x00\xb3\x84\x00\x00\x00\x00\x00\x00\xc2\x84\x00\x00\x00\x00\x00\x00\xc7\x84\x00\x00\x00\x00\x00\x00\xc9\x84\x00\x00\x00\x00\x00\x00\xd9\x84\x00\x00\x00\x00\x00\x00\xda\x84\x00\x00\x00\x00\x00\x00\xdb\x84\x00\x00\x00\x00\x00\x00\xdd\x84\x00\x00\x00\x00\x00\x00\xde\x84\x00\x00\x00\x00\x00\x00\xdf\x84\x00\x00\x00\x00\x00\x00'
+    b'\xe0\x84\x00\x00\x00\x00\x00\x00\xe1\x84\x00\x00\x00\x00\x00\x00\xe4\x84\x00\x00\x00\x00\x00\x00\xe5\x84\x00\x00\x00\x00\x00\x00\xe6\x84\x00\x00\x00\x00\x00\x00\xe7\x84\x00\x00\x00\x00\x00\x00\xea\x84\x00\x00\x00\x00\x00\x00\xeb\x84\x00\x00\x00\x00\x00\x00\xec\x84\x00\x00\x00\x00\x00\x00\xee\x84\x00\x00\x00\x00\x00\x00\xf0\x84\x00\x00\x00\x00\x00\x00\xf2\x84\x00\x00\x00\x00\x00\x00'
+    b'\xf3\x84\x00\x00\x00\x00\x00\x00\xf4\x84\x00\x00\x00\x00\x00\x00\xf5\x84\x00\x00\x00\x00\x00\x00\xf6\x84\x00\x00\x00\x00\x00\x00\xf8\x84\x00\x00\x00\x00\x00\x00\xf9\x84\x00\x00\x00\x00\x00\x00\xfe\x84\x00\x00\x00\x00\x00\x00\x11\x85\x00\x00\x00\x00\x00\x00&\x85\x00\x00\x00\x00\x00\x00)\x85\x00\x00\x00\x00\x00\x00S\x85\x00\x00\x00\x00\x00\x00d\x85\x00\x00\x00\x00\x00\x00'
+    b'e\x85\x00\x00\x00\x00\x00\x00f\x85\x00\x00\x00\x00\x00\x00v\x85\x00\x00\x00\x00\x00\x00y\x85\x00\x00\x00\x00\x00\x00\x96\x85\x00\x00\x00\x00\x00\x00\x14\x86\x00\x00\x00\x00\x00\x00\xc1\x86\x00\x00\x00\x00\x00\x00\xc2\x86\x00\x00\x00\x00\x00\x00\xc3\x86\x00\x00\x00\x00\x00\x00\xd7\x86\x00\x00\x00\x00\x00\x00\xf4\x86\x00\x00\x00\x00\x00\x00\xf6\x86\x00\x00\x00\x00\x00\x00'
+    b'@\x88\x00\x00\x00\x00\x00\x00A\x88\x00\x00\x00\x00\x00\x00B\x88\x00\x00\x00\x00\x00\x00C\x88\x00\x00\x00\x00\x00\x00D\x88\x00\x00\x00\x00\x00\x00E\x88\x00\x00\x00\x00\x00\x00F\x88\x00\x00\x00\x00\x00\x00G\x88\x00\x00\x00\x00\x00\x00H\x88\x00\x00\x00\x00\x00\x00I\x88\x00\x00\x00\x00\x00\x00J\x88\x00\x00\x00\x00\x00\x00K\x88\x00\x00\x00\x00\x00\x00'
+    b'\xcb\x88\x00\x00\x00\x00\x00\x00\xfc\x88\x00\x00\x00\x00\x00\x00\xfd\x88\x00\x00\x00\x00\x00\x000\x89\x00\x00\x00\x00\x00\x005\x89\x00\x00\x00\x00\x00\x00:\x89\x00\x00\x00\x00\x00\x00=\x89\x00\x00\x00\x00\x00\x00{\x8a\x00\x00\x00\x00\x00\x00\xbe\x8a\x00\x00\x00\x00\x00\x00\x91\x8b\x00\x00\x00\x00\x00\x00\x94\x8b\x00\x00\x00\x00\x00\x00\xbe\x8b\x00\x00\x00\x00\x00\x00'
+    b'\n\x8c\x00\x00\x00\x00\x00\x007\x8c\x00\x00\x00\x00\x00\x00g\x8c\x00\x00\x00\x00\x00\x00x\x8c\x00\x00\x00\x00\x00\x00}\x8c\x00\x00\x00\x00\x00\x00\x9b\x8c\x00\x00\x00\x00\x00\x00\xcd\x8c\x00\x00\x00\x00\x00\x00\xce\x8c\x00\x00\x00\x00\x00\x00\xcf\x8c\x00\x00\x00\x00\x00\x00\xd0\x8c\x00\x00\x00\x00\x00\x00!\x8d\x00\x00\x00\x00\x00\x003\x8d\x00\x00\x00\x00\x00\x00'
+    b'%\x8e\x00\x00\x00\x00\x00\x00(\x8e\x00\x00\x00\x00\x00\x00\xf0\x8e\x00\x00\x00\x00\x00\x00\xf1\x8e\x00\x00\x00\x00\x00\x00\\\x90\x00\x00\x00\x00\x00\x00k\x90\x00\x00\x00\x00\x00\x00l\x90\x00\x00\x00\x00\x00\x00m\x90\x00\x00\x00\x00\x00\x00o\x90\x00\x00\x00\x00\x00\x00\x92\x90\x00\x00\x00\x00\x00\x00\xf7\x90\x00\x00\x00\x00\x00\x00g\x91\x00\x00\x00\x00\x00\x00'
+    b't\x91\x00\x00\x00\x00\x00\x00v\x91\x00\x00\x00\x00\x00\x00\xae\x91\x00\x00\x00\x00\x00\x00\xb0\x91\x00\x00\x00\x00\x00\x00\xd1\x91\x00\x00\x00\x00\x00\x00\xd6\x91\x00\x00\x00\x00\x00\x00\xdb\x91\x00\x00\x00\x00\x00\x00\xdc\x91\x00\x00\x00\x00\x00\x00\xdd\x91\x00\x00\x00\x00\x00\x00P\x92\x00\x00\x00\x00\x00\x00d\x92\x00\x00\x00\x00\x00\x00e\x92\x00\x00\x00\x00\x00\x00'
+    b'h\x92\x00\x00\x00\x00\x00\x00i\x92\x00\x00\x00\x00\x00\x00j\x92\x00\x00\x00\x00\x00\x00k\x92\x00\x00\x00\x00\x00\x00y\x92\x00\x00\x00\x00\x00\x00\xa5\x92\x00\x00\x00\x00\x00\x00\xa9\x92\x00\x00\x00\x00\x00\x00\xab\x92\x00\x00\x00\x00\x00\x00\xac\x92\x00\x00\x00\x00\x00\x00\xad\x92\x00\x00\x00\x00\x00\x00\xae\x92\x00\x00\x00\x00\x00\x00\xaf\x92\x00\x00\x00\x00\x00\x00'
+    b'\x16\x93\x00\x00\x00\x00\x00\x00\x18\x93\x00\x00\x00\x00\x00\x00\x19\x93\x00\x00\x00\x00\x00\x00\x1a\x93\x00\x00\x00\x00\x00\x00\x1b\x93\x00\x00\x00\x00\x00\x00 \x93\x00\x00\x00\x00\x00\x004\x93\x00\x00\x00\x00\x00\x00e\x93\x00\x00\x00\x00\x00\x00g\x93\x00\x00\x00\x00\x00\x00j\x93\x00\x00\x00\x00\x00\x00m\x93\x00\x00\x00\x00\x00\x00r\x93\x00\x00\x00\x00\x00\x00'
+    b's\x93\x00\x00\x00\x00\x00\x00u\x93\x00\x00\x00\x00\x00\x00x\x93\x00\x00\x00\x00\x00\x00{\x93\x00\x00\x00\x00\x00\x00~\x93\x00\x00\x00\x00\x00\x00\x7f\x93\x00\x00\x00\x00\x00\x00\x85\x93\x00\x00\x00\x00\x00\x00\x87\x93\x00\x00\x00\x00\x00\x00\x8a\x93\x00\x00\x00\x00\x00\x00\x8c\x93\x00\x00\x00\x00\x00\x00\x8e\x93\x00\x00\x00\x00\x00\x00\x90\x93\x00\x00\x00\x00\x00\x00'
+    b'\x92\x93\x00\x00\x00\x00\x00\x00\x95\x93\x00\x00\x00\x00\x00\x00\x97\x93\x00\x00\x00\x00\x00\x00\x9a\x93\x00\x00\x00\x00\x00\x00\x9b\x93\x00\x00\x00\x00\x00\x00\xa5\x93\x00\x00\x00\x00\x00\x00\xa7\x93\x00\x00\x00\x00\x00\x00\xa9\x93\x00\x00\x00\x00\x00\x00\xad\x93\x00\x00\x00\x00\x00\x00\xaf\x93\x00\x00\x00\x00\x00\x00\xb1\x93\x00\x00\x00\x00\x00\x00\xb3\x93\x00\x00\x00\x00\x00\x00'
+    b'\xc4\x93\x00\x00\x00\x00\x00\x00)\x94\x00\x00\x00\x00\x00\x002\x94\x00\x00\x00\x00\x00\x004\x94\x00\x00\x00\x00\x00\x006\x94\x00\x00\x00\x00\x00\x00F\x94\x00\x00\x00\x00\x00\x00H\x94\x00\x00\x00\x00\x00\x00J\x94\x00\x00\x00\x00\x00\x00L\x94\x00\x00\x00\x00\x00\x00M\x94\x00\x00\x00\x00\x00\x00O\x94\x00\x00\x00\x00\x00\x00P\x94\x00\x00\x00\x00\x00\x00'
+    b'V\x94\x00\x00\x00\x00\x00\x00W\x94\x00\x00\x00\x00\x00\x00X\x94\x00\x00\x00\x00\x00\x00Y\x94\x00\x00\x00\x00\x00\x00Z\x94\x00\x00\x00\x00\x00\x00[\x94\x00\x00\x00\x00\x00\x00\\\x94\x00\x00\x00\x00\x00\x00^\x94\x00\x00\x00\x00\x00\x00_\x94\x00\x00\x00\x00\x00\x00i\x94\x00\x00\x00\x00\x00\x00j\x94\x00\x00\x00\x00\x00\x00k\x94\x00\x00\x00\x00\x00\x00'
+    b'l\x94\x00\x00\x00\x00\x00\x00m\x94\x00\x00\x00\x00\x00\x00o\x94\x00\x00\x00\x00\x00\x00q\x94\x00\x00\x00\x00\x00\x00s\x94\x00\x00\x00\x00\x00\x00t\x94\x00\x00\x00\x00\x00\x00u\x94\x00\x00\x00\x00\x00\x00v\x94\x00\x00\x00\x00\x00\x00w\x94\x00\x00\x00\x00\x00\x00x\x94\x00\x00\x00\x00\x00\x00\x85\x94\x00\x00\x00\x00\x00\x00\x88\x94\x00\x00\x00\x00\x00\x00'
+    b'\x8a\x94\x00\x00\x00\x00\x00\x00\x8b\x94\x00\x00\x00\x00\x00\x00\x8c\x94\x00\x00\x00\x00\x00\x00\x8e\x94\x00\x00\x00\x00\x00\x00\xa3\x94\x00\x00\x00\x00\x00\x00\xa4\x94\x00\x00\x00\x00\x00\x00\xa5\x94\x00\x00\x00\x00\x00\x00\xa6\x94\x00\x00\x00\x00\x00\x00\xa8\x94\x00\x00\x00\x00\x00\x00\xaa\x94\x00\x00\x00\x00\x00\x00\xab\x94\x00\x00\x00\x00\x00\x00\xad\x94\x00\x00\x00\x00\x00\x00'
+    b'\xae\x94\x00\x00\x00\x00\x00\x00\xaf\x94\x00\x00\x00\x00\x00\x00\xb0\x94\x00\x00\x00\x00\x00\x00\xb1\x94\x00\x00\x00\x00\x00\x00\xcc\x94\x00\x00\x00\x00\x00\x00\xce\x94\x00\x00\x00\x00\x00\x00\xcf\x94\x00\x00\x00\x00\x00\x00\xd0\x94\x00\x00\x00\x00\x00\x00\xd1\x94\x00\x00\x00\x00\x00\x00\xd3\x94\x00\x00\x00\x00\x00\x00\xd4\x94\x00\x00\x00\x00\x00\x00\xd5\x94\x00\x00\x00\x00\x00\x00'
+    b'\xd6\x94\x00\x00\x00\x00\x00\x00\xd7\x94\x00\x00\x00\x00\x00\x00\xd8\x94\x00\x00\x00\x00\x00\x00\xd9\x94\x00\x00\x00\x00\x00\x00\xda\x94\x00\x00\x00\x00\x00\x00\xdb\x94\x00\x00\x00\x00\x00\x00\xdc\x94\x00\x00\x00\x00\x00\x00\xe0\x94\x00\x00\x00\x00\x00\x00\x04\x95\x00\x00\x00\x00\x00\x00\x05\x95\x00\x00\x00\x00\x00\x00\x06\x95\x00\x00\x00\x00\x00\x00\t\x95\x00\x00\x00\x00\x00\x00'
+    b'\r\x95\x00\x00\x00\x00\x00\x00\x0e\x95\x00\x00\x00\x00\x00\x00\x10\x95\x00\x00\x00\x00\x00\x00\x11\x95\x00\x00\x00\x00\x00\x00\x12\x95\x00\x00\x00\x00\x00\x00\x13\x95\x00\x00\x00\x00\x00\x00\x14\x95\x00\x00\x00\x00\x00\x00\x15\x95\x00\x00\x00\x00\x00\x00\x16\x95\x00\x00\x00\x00\x00\x00\x17\x95\x00\x00\x00\x00\x00\x00\x1d\x95\x00\x00\x00\x00\x00\x00\x1e\x95\x00\x00\x00\x00\x00\x00'
+    b'\x1f\x95\x00\x00\x00\x00\x00\x00!\x95\x00\x00\x00\x00\x00\x00"\x95\x00\x00\x00\x00\x00\x00#\x95\x00\x00\x00\x00\x00\x00:\x95\x00\x00\x00\x00\x00\x00;\x95\x00\x00\x00\x00\x00\x00<\x95\x00\x00\x00\x00\x00\x00=\x95\x00\x00\x00\x00\x00\x00@\x95\x00\x00\x00\x00\x00\x00A\x95\x00\x00\x00\x00\x00\x00C\x95\x00\x00\x00\x00\x00\x00I\x95\x00\x00\x00\x00\x00\x00'
+    b'K\x95\x00\x00\x00\x00\x00\x00L\x95\x00\x00\x00\x00\x00\x00M\x95\x00\x00\x00\x00\x00\x00N\x95\x00\x00\x00\x00\x00\x00S\x95\x00\x00\x00\x00\x00\x00T\x95\x00\x00\x00\x00\x00\x00U\x95\x00\x00\x00\x00\x00\x00V\x95\x00\x00\x00\x00\x00\x00W\x95\x00\x00\x00\x00\x00\x00Y\x95\x00\x00\x00\x00\x00\x00\\\x95\x00\x00\x00\x00\x00\x00^\x95\x00\x00\x00\x00\x00\x00'
+    b'_\x95\x00\x00\x00\x00\x00\x00\xb5\x95\x00\x00\x00\x00\x00\x00\xb8\x95\x00\x00\x00\x00\x00\x00\x18\x96\x00\x00\x00\x00\x00\x00\x1c\x96\x00\x00\x00\x00\x00\x00 \x96\x00\x00\x00\x00\x00\x00"\x96\x00\x00\x00\x00\x00\x00G\x96\x00\x00\x00\x00\x00\x00S\x96\x00\x00\x00\x00\x00\x00\x83\x96\x00\x00\x00\x00\x00\x00\x84\x96\x00\x00\x00\x00\x00\x00\x90\x96\x00\x00\x00\x00\x00\x00'
+    b'\x93\x96\x00\x00\x00\x00\x00\x00\x96\x96\x00\x00\x00\x00\x00\x00\x9d\x96\x00\x00\x00\x00\x00\x00\xa2\x96\x00\x00\x00\x00\x00\x00\xa3\x96\x00\x00\x00\x00\x00\x00\xa4\x96\x00\x00\x00\x00\x00\x00\xa7\x96\x00\x00\x00\x00\x00\x00\xaa\x96\x00\x00\x00\x00\x00\x00\xae\x96\x00\x00\x00\x00\x00\x00\xb2\x96\x00\x00\x00\x00\x00\x00\xb3\x96\x00\x00\x00\x00\x00\x00\xb7\x96\x00\x00\x00\x00\x00\x00'
+    b'\xfa\x96\x00\x00\x00\x00\x00\x00\xfc\x96\x00\x00\x00\x00\x00\x00\xfd\x96\x00\x00\x00\x00\x00\x00\xff\x96\x00\x00\x00\x00\x00\x00K\x97\x00\x00\x00\x00\x00\x00Q\x97\x00\x00\x00\x00\x00\x00\x8d\x97\x00\x00\x00\x00\x00\x00\xb6\x97\x00\x00\x00\x00\x00\x00\xb7\x97\x00\x00\x00\x00\x00\x00\xb8\x97\x00\x00\x00\x00\x00\x00\xdd\x97\x00\x00\x00\x00\x00\x00\xf2\x97\x00\x00\x00\x00\x00\x00'
+    b'\xfe\x97\x00\x00\x00\x00\x00\x00C\x98\x00\x00\x00\x00\x00\x00\x84\x98\x00\x00\x00\x00\x00\x00\x86\x98\x00\x00\x00\x00\x00\x00\x8b\x98\x00\x00\x00\x00\x00\x00I\x99\x00\x00\x00\x00\x00\x00\x86\x99\x00\x00\x00\x00\x00\x00\xb5\x99\x00\x00\x00\x00\x00\x00\xe4\x99\x00\x00\x00\x00\x00\x00\xed\x99\x00\x00\x00\x00\x00\x00\x0f\x9a\x00\x00\x00\x00\x00\x00\x13\x9a\x00\x00\x00\x00\x00\x00'
+    b'\x15\x9a\x00\x00\x00\x00\x00\x00\x18\x9a\x00\x00\x00\x00\x00\x00\x1b\x9a\x00\x00\x00\x00\x00\x00\x1e\x9a\x00\x00\x00\x00\x00\x00\x1f\x9a\x00\x00\x00\x00\x00\x00"\x9a\x00\x00\x00\x00\x00\x00#\x9a\x00\x00\x00\x00\x00\x00%\x9a\x00\x00\x00\x00\x00\x00&\x9a\x00\x00\x00\x00\x00\x00\'\x9a\x00\x00\x00\x00\x00\x00(\x9a\x00\x00\x00\x00\x00\x00)\x9a\x00\x00\x00\x00\x00\x00'
+    b'-\x9a\x00\x00\x00\x00\x00\x00/\x9a\x00\x00\x00\x00\x00\x003\x9a\x00\x00\x00\x00\x00\x005\x9a\x00\x00\x00\x00\x00\x008\x9a\x00\x00\x00\x00\x00\x00:\x9a\x00\x00\x00\x00\x00\x00@\x9a\x00\x00\x00\x00\x00\x00A\x9a\x00\x00\x00\x00\x00\x00B\x9a\x00\x00\x00\x00\x00\x00C\x9a\x00\x00\x00\x00\x00\x00D\x9a\x00\x00\x00\x00\x00\x00E\x9a\x00\x00\x00\x00\x00\x00'
+    b'F\x9a\x00\x00\x00\x00\x00\x00G\x9a\x00\x00\x00\x00\x00\x00H\x9a\x00\x00\x00\x00\x00\x00K\x9a\x00\x00\x00\x00\x00\x00L\x9a\x00\x00\x00\x00\x00\x00M\x9a\x00\x00\x00\x00\x00\x00N\x9a\x00\x00\x00\x00\x00\x00O\x9a\x00\x00\x00\x00\x00\x00P\x9a\x00\x00\x00\x00\x00\x00Q\x9a\x00\x00\x00\x00\x00\x00R\x9a\x00\x00\x00\x00\x00\x00S\x9a\x00\x00\x00\x00\x00\x00'
+    b'T\x9a\x00\x00\x00\x00\x00\x00Y\x9a\x00\x00\x00\x00\x00\x00Z\x9a\x00\x00\x00\x00\x00\x00[\x9a\x00\x00\x00\x00\x00\x00a\x9a\x00\x00\x00\x00\x00\x00b\x9a\x00\x00\x00\x00\x00\x00c\x9a\x00\x00\x00\x00\x00\x00e\x9a\x00\x00\x00\x00\x00\x00f\x9a\x00\x00\x00\x00\x00\x00g\x9a\x00\x00\x00\x00\x00\x00h\x9a\x00\x00\x00\x00\x00\x00j\x9a\x00\x00\x00\x00\x00\x00'
+    b'k\x9a\x00\x00\x00\x00\x00\x00l\x9a\x00\x00\x00\x00\x00\x00m\x9a\x00\x00\x00\x00\x00\x00n\x9a\x00\x00\x00\x00\x00\x00q\x9a\x00\x00\x00\x00\x00\x00r\x9a\x00\x00\x00\x00\x00\x00t\x9a\x00\x00\x00\x00\x00\x00u\x9a\x00\x00\x00\x00\x00\x00v\x9a\x00\x00\x00\x00\x00\x00w\x9a\x00\x00\x00\x00\x00\x00x\x9a\x00\x00\x00\x00\x00\x00y\x9a\x00\x00\x00\x00\x00\x00'
+    b'{\x9a\x00\x00\x00\x00\x00\x00|\x9a\x00\x00\x00\x00\x00\x00}\x9a\x00\x00\x00\x00\x00\x00~\x9a\x00\x00\x00\x00\x00\x00\x7f\x9a\x00\x00\x00\x00\x00\x00\x80\x9a\x00\x00\x00\x00\x00\x00\x81\x9a\x00\x00\x00\x00\x00\x00\x82\x9a\x00\x00\x00\x00\x00\x00\x83\x9a\x00\x00\x00\x00\x00\x00\x84\x9a\x00\x00\x00\x00\x00\x00\x85\x9a\x00\x00\x00\x00\x00\x00\x86\x9a\x00\x00\x00\x00\x00\x00'
+    b'\x1f\x9b\x00\x00\x00\x00\x00\x00\xa9\x9b\x00\x00\x00\x00\x00\x00\xb7\x9b\x00\x00\x00\x00\x00\x00\xd0\x9b\x00\x00\x00\x00\x00\x00\xd7\x9b\x00\x00\x00\x00\x00\x00\xd8\x9b\x00\x00\x00\x00\x00\x00\xde\x9b\x00\x00\x00\x00\x00\x00\xe2\x9b\x00\x00\x00\x00\x00\x00\xe8\x9b\x00\x00\x00\x00\x00\x00\xe9\x9b\x00\x00\x00\x00\x00\x00\xeb\x9b\x00\x00\x00\x00\x00\x00\xfa\x9b\x00\x00\x00\x00\x00\x00'
+    b'\r\x9c\x00\x00\x00\x00\x00\x00\x1b\x9c\x00\x00\x00\x00\x00\x00"\x9c\x00\x00\x00\x00\x00\x00\x85\x9c\x00\x00\x00\x00\x00\x00\x8b\x9c\x00\x00\x00\x00\x00\x00\x90\x9c\x00\x00\x00\x00\x00\x00\xad\x9c\x00\x00\x00\x00\x00\x00\xc3\x9c\x00\x00\x00\x00\x00\x00\xa0\x9d\x00\x00\x00\x00\x00\x00\xa4\x9d\x00\x00\x00\x00\x00\x00\xa8\x9d\x00\x00\x00\x00\x00\x00&\x9e\x00\x00\x00\x00\x00\x00'
+    b"'\x9e\x00\x00\x00\x00\x00\x00F\x9e\x00\x00\x00\x00\x00\x00J\x9e\x00\x00\x00\x00\x00\x00\x93\x9e\x00\x00\x00\x00\x00\x00:\x9f\x00\x00\x00\x00\x00\x00p\x9f\x00\x00\x00\x00\x00\x00\xb2\x9f\x00\x00\x00\x00\x00\x00\xb3\x9f\x00\x00\x00\x00\x00\x00\xb4\x9f\x00\x00\x00\x00\x00\x00\xb5\x9f\x00\x00\x00\x00\x00\x00\xb6\x9f\x00\x00\x00\x00\x00\x00\xba\x9f\x00\x00\x00\x00\x00\x00"
+    b'\xbd\x9f\x00\x00\x00\x00\x00\x00\xbe\x9f\x00\x00\x00\x00\x00\x00\xa9 \x01\x00\x00\x00\x00\x00\xab \x01\x00\x00\x00\x00\x00\xac \x01\x00\x00\x00\x00\x00\xb4 \x01\x00\x00\x00\x00\x00\xb8 \x01\x00\x00\x00\x00\x00\xb9 \x01\x00\x00\x00\x00\x00\xba \x01\x00\x00\x00\x00\x00\xbb \x01\x00\x00\x00\x00\x00Z!\x01\x00\x00\x00\x00\x00v"\x01\x00\x00\x00\x00\x00'
+    b'\x97"\x01\x00\x00\x00\x00\x00\x98"\x01\x00\x00\x00\x00\x00\x99"\x01\x00\x00\x00\x00\x00\x9a"\x01\x00\x00\x00\x00\x00\x9b"\x01\x00\x00\x00\x00\x00\x9c"\x01\x00\x00\x00\x00\x00\x9d"\x01\x00\x00\x00\x00\x00\xa7"\x01\x00\x00\x00\x00\x00\xab"\x01\x00\x00\x00\x00\x00\xac"\x01\x00\x00\x00\x00\x00\xad"\x01\x00\x00\x00\x00\x00\xae"\x01\x00\x00\x00\x00\x00'
+    b'\xaf"\x01\x00\x00\x00\x00\x00\xb1"\x01\x00\x00\x00\x00\x00\xb2"\x01\x00\x00\x00\x00\x00\xb3"\x01\x00\x00\x00\x00\x00\xb4"\x01\x00\x00\x00\x00\x00\xb5"\x01\x00\x00\x00\x00\x00\xbe"\x01\x00\x00\x00\x00\x00\xc0"\x01\x00\x00\x00\x00\x00\xc1"\x01\x00\x00\x00\x00\x00\xc2"\x01\x00\x00\x00\x00\x00\xc3"\x01\x00\x00\x00\x00\x00\xc4"\x01\x00\x00\x00\x00\x00'
+    b'\xc5"\x01\x00\x00\x00\x00\x00\xac#\x01\x00\x00\x00\x00\x002$\x01\x00\x00\x00\x00\x003$\x01\x00\x00\x00\x00\x004$\x01\x00\x00\x00\x00\x005$\x01\x00\x00\x00\x00\x006$\x01\x00\x00\x00\x00\x007$\x01\x00\x00\x00\x00\x008$\x01\x00\x00\x00\x00\x009$\x01\x00\x00\x00\x00\x00:$\x01\x00\x00\x00\x00\x00;$\x01\x00\x00\x00\x00\x00'
+    b"C%\x01\x00\x00\x00\x00\x00\x07&\x01\x00\x00\x00\x00\x00\x03'\x01\x00\x00\x00\x00\x00;'\x01\x00\x00\x00\x00\x00<'\x01\x00\x00\x00\x00\x00?'\x01\x00\x00\x00\x00\x00@'\x01\x00\x00\x00\x00\x00A'\x01\x00\x00\x00\x00\x00B'\x01\x00\x00\x00\x00\x00C'\x01\x00\x00\x00\x00\x00D'\x01\x00\x00\x00\x00\x00F'\x01\x00\x00\x00\x00\x00"
+    b"G'\x01\x00\x00\x00\x00\x00H'\x01\x00\x00\x00\x00\x00I'\x01\x00\x00\x00\x00\x00J'\x01\x00\x00\x00\x00\x00K'\x01\x00\x00\x00\x00\x00L'\x01\x00\x00\x00\x00\x00M'\x01\x00\x00\x00\x00\x00N'\x01\x00\x00\x00\x00\x00O'\x01\x00\x00\x00\x00\x00P'\x01\x00\x00\x00\x00\x00Q'\x01\x00\x00\x00\x00\x00R'\x01\x00\x00\x00\x00\x00"
+    b"S'\x01\x00\x00\x00\x00\x00T'\x01\x00\x00\x00\x00\x00U'\x01\x00\x00\x00\x00\x00V'\x01\x00\x00\x00\x00\x00W'\x01\x00\x00\x00\x00\x00X'\x01\x00\x00\x00\x00\x00Y'\x01\x00\x00\x00\x00\x00Z'\x01\x00\x00\x00\x00\x00['\x01\x00\x00\x00\x00\x00\\'\x01\x00\x00\x00\x00\x00^'\x01\x00\x00\x00\x00\x00_'\x01\x00\x00\x00\x00\x00"
+    b"`'\x01\x00\x00\x00\x00\x00a'\x01\x00\x00\x00\x00\x00b'\x01\x00\x00\x00\x00\x00c'\x01\x00\x00\x00\x00\x00d'\x01\x00\x00\x00\x00\x00e'\x01\x00\x00\x00\x00\x00f'\x01\x00\x00\x00\x00\x00g'\x01\x00\x00\x00\x00\x00m'\x01\x00\x00\x00\x00\x00n'\x01\x00\x00\x00\x00\x00o'\x01\x00\x00\x00\x00\x00p'\x01\x00\x00\x00\x00\x00"
+    b"q'\x01\x00\x00\x00\x00\x00r'\x01\x00\x00\x00\x00\x00s'\x01\x00\x00\x00\x00\x00t'\x01\x00\x00\x00\x00\x00u'\x01\x00\x00\x00\x00\x00v'\x01\x00\x00\x00\x00\x00w'\x01\x00\x00\x00\x00\x00x'\x01\x00\x00\x00\x00\x00y'\x01\x00\x00\x00\x00\x00{'\x01\x00\x00\x00\x00\x00|'\x01\x00\x00\x00\x00\x00}'\x01\x00\x00\x00\x00\x00"
+    b"~'\x01\x00\x00\x00\x00\x00\x7f'\x01\x00\x00\x00\x00\x00\x80'\x01\x00\x00\x00\x00\x00\x81'\x01\x00\x00\x00\x00\x00\x82'\x01\x00\x00\x00\x00\x00\x84'\x01\x00\x00\x00\x00\x00\x85'\x01\x00\x00\x00\x00\x00\x86'\x01\x00\x00\x00\x00\x00\x87'\x01\x00\x00\x00\x00\x00\xd3'\x01\x00\x00\x00\x00\x00\xdd'\x01\x00\x00\x00\x00\x00\xde'\x01\x00\x00\x00\x00\x00"
+    b"\xe6'\x01\x00\x00\x00\x00\x00\x1a(\x01\x00\x00\x00\x00\x00S(\x01\x00\x00\x00\x00\x00V*\x01\x00\x00\x00\x00\x00W*\x01\x00\x00\x00\x00\x00X*\x01\x00\x00\x00\x00\x00Y*\x01\x00\x00\x00\x00\x00Z*\x01\x00\x00\x00\x00\x00`*\x01\x00\x00\x00\x00\x00a*\x01\x00\x00\x00\x00\x00c*\x01\x00\x00\x00\x00\x00d*\x01\x00\x00\x00\x00\x00"
+    b'h*\x01\x00\x00\x00\x00\x00o*\x01\x00\x00\x00\x00\x00\x7f*\x01\x00\x00\x00\x00\x00\x80*\x01\x00\x00\x00\x00\x00\x8b*\x01\x00\x00\x00\x00\x00\x8c*\x01\x00\x00\x00\x00\x00\x0f+\x01\x00\x00\x00\x00\x00\x17+\x01\x00\x00\x00\x00\x00\x1e+\x01\x00\x00\x00\x00\x00v+\x01\x00\x00\x00\x00\x00w+\x01\x00\x00\x00\x00\x00x+\x01\x00\x00\x00\x00\x00'
+    b'}+\x01\x00\x00\x00\x00\x00~+\x01\x00\x00\x00\x00\x00\x7f+\x01\x00\x00\x00\x00\x00\x81+\x01\x00\x00\x00\x00\x00\x82+\x01\x00\x00\x00\x00\x00\x83+\x01\x00\x00\x00\x00\x00\x8d+\x01\x00\x00\x00\x00\x00\x8f+\x01\x00\x00\x00\x00\x00\x91+\x01\x00\x00\x00\x00\x00\x92+\x01\x00\x00\x00\x00\x00\x93+\x01\x00\x00\x00\x00\x00\x94+\x01\x00\x00\x00\x00\x00'
+    b"\xaa+\x01\x00\x00\x00\x00\x00\xe2+\x01\x00\x00\x00\x00\x00\xe6+\x01\x00\x00\x00\x00\x00\xf8+\x01\x00\x00\x00\x00\x00\x07,\x01\x00\x00\x00\x00\x00\x12,\x01\x00\x00\x00\x00\x00\x1c,\x01\x00\x00\x00\x00\x00',\x01\x00\x00\x00\x00\x00*,\x01\x00\x00\x00\x00\x00-,\x01\x00\x00\x00\x00\x00/,\x01\x00\x00\x00\x00\x002,\x01\x00\x00\x00\x00\x00"
+    b'7,\x01\x00\x00\x00\x00\x00:,\x01\x00\x00\x00\x00\x00=,\x01\x00\x00\x00\x00\x00?,\x01\x00\x00\x00\x00\x00@,\x01\x00\x00\x00\x00\x00B,\x01\x00\x00\x00\x00\x00D,\x01\x00\x00\x00\x00\x00F,\x01\x00\x00\x00\x00\x00I,\x01\x00\x00\x00\x00\x00L,\x01\x00\x00\x00\x00\x00O,\x01\x00\x00\x00\x00\x00\xc2,\x01\x00\x00\x00\x00\x00'
+    b'\r-\x01\x00\x00\x00\x00\x00\x8a-\x01\x00\x00\x00\x00\x00\x8c-\x01\x00\x00\x00\x00\x00\x97-\x01\x00\x00\x00\x00\x00\x98-\x01\x00\x00\x00\x00\x00\x99-\x01\x00\x00\x00\x00\x00\x9a-\x01\x00\x00\x00\x00\x00\x9c-\x01\x00\x00\x00\x00\x00\x9d-\x01\x00\x00\x00\x00\x00\x9e-\x01\x00\x00\x00\x00\x00\x9f-\x01\x00\x00\x00\x00\x00\xc1-\x01\x00\x00\x00\x00\x00'
+    b'\xc5-\x01\x00\x00\x00\x00\x00\xca-\x01\x00\x00\x00\x00\x00\xcd-\x01\x00\x00\x00\x00\x00\xce-\x01\x00\x00\x00\x00\x00\xd1-\x01\x00\x00\x00\x00\x00\xd4-\x01\x00\x00\x00\x00\x00\xd5-\x01\x00\x00\x00\x00\x00\xd6-\x01\x00\x00\x00\x00\x00\xe2-\x01\x00\x00\x00\x00\x00\xe3-\x01\x00\x00\x00\x00\x00\xe4-\x01\x00\x00\x00\x00\x00\xe5-\x01\x00\x00\x00\x00\x00'
+    b'\xe6-\x01\x00\x00\x00\x00\x00\xe7-\x01\x00\x00\x00\x00\x00\xea-\x01\x00\x00\x00\x00\x00\xf1-\x01\x00\x00\x00\x00\x00\xf2-\x01\x00\x00\x00\x00\x00\xf7-\x01\x00\x00\x00\x00\x00\xf9-\x01\x00\x00\x00\x00\x00\xfb-\x01\x00\x00\x00\x00\x00\xfc-\x01\x00\x00\x00\x00\x00\x04.\x01\x00\x00\x00\x00\x00Q/\x01\x00\x00\x00\x00\x00S/\x01\x00\x00\x00\x00\x00'
+    b'\x080\x01\x00\x00\x00\x00\x00,z\x01\x00\x00\x00\x00\x00\xc8z\x01\x00\x00\x00\x00\x00*{\x01\x00\x00\x00\x00\x00+{\x01\x00\x00\x00\x00\x00\x8e{\x01\x00\x00\x00\x00\x00\x9d{\x01\x00\x00\x00\x00\x00\xdb{\x01\x00\x00\x00\x00\x00\x1d|\x01\x00\x00\x00\x00\x00\x1e|\x01\x00\x00\x00\x00\x00\x1f|\x01\x00\x00\x00\x00\x00B|\x01\x00\x00\x00\x00\x00'
+    b']|\x01\x00\x00\x00\x00\x00\xa9|\x01\x00\x00\x00\x00\x00\xaa|\x01\x00\x00\x00\x00\x00\xb3|\x01\x00\x00\x00\x00\x00\xd8|\x01\x00\x00\x00\x00\x004}\x01\x00\x00\x00\x00\x00r}\x01\x00\x00\x00\x00\x00\x89}\x01\x00\x00\x00\x00\x00\x8f}\x01\x00\x00\x00\x00\x00\x9c}\x01\x00\x00\x00\x00\x00\x9e}\x01\x00\x00\x00\x00\x00\x9f}\x01\x00\x00\x00\x00\x00'
+    b'\xa2}\x01\x00\x00\x00\x00\x00\xeb}\x01\x00\x00\x00\x00\x00\xee}\x01\x00\x00\x00\x00\x00\x95~\x01\x00\x00\x00\x00\x00!\x7f\x01\x00\x00\x00\x00\x00)\x7f\x01\x00\x00\x00\x00\x00,\x7f\x01\x00\x00\x00\x00\x00-\x7f\x01\x00\x00\x00\x00\x00>\x7f\x01\x00\x00\x00\x00\x00k\x7f\x01\x00\x00\x00\x00\x00l\x7f\x01\x00\x00\x00\x00\x00m\x7f\x01\x00\x00\x00\x00\x00'
+    b'n\x7f\x01\x00\x00\x00\x00\x00\xdb\x7f\x01\x00\x00\x00\x00\x00\xfd\x7f\x01\x00\x00\x00\x00\x00\x0b\x80\x01\x00\x00\x00\x00\x00\x16\x80\x01\x00\x00\x00\x00\x00\x18\x80\x01\x00\x00\x00\x00\x002\x80\x01\x00\x00\x00\x00\x00L\x80\x01\x00\x00\x00\x00\x00\xda\x80\x01\x00\x00\x00\x00\x00\xd4\x81\x01\x00\x00\x00\x00\x00\xd6\x81\x01\x00\x00\x00\x00\x00\xe2\x81\x01\x00\x00\x00\x00\x00'
+    b'\xff\x81\x01\x00\x00\x00\x00\x00>\x82\x01\x00\x00\x00\x00\x00e\x82\x01\x00\x00\x00\x00\x00\x87\x82\x01\x00\x00\x00\x00\x00\x9f\x82\x01\x00\x00\x00\x00\x00\xa5\x82\x01\x00\x00\x00\x00\x00\x90\x83\x01\x00\x00\x00\x00\x00\x9f\x83\x01\x00\x00\x00\x00\x00\xbf\x83\x01\x00\x00\x00\x00\x00\xc1\x83\x01\x00\x00\x00\x00\x00\xc2\x83\x01\x00\x00\x00\x00\x00\xc3\x83\x01\x00\x00\x00\x00\x00'
+    b'\xc4\x83\x01\x00\x00\x00\x00\x00\xc5\x83\x01\x00\x00\x00\x00\x00\xc6\x83\x01\x00\x00\x00\x00\x00~\x84\x01\x00\x00\x00\x00\x00\x89\x84\x01\x00\x00\x00\x00\x00\x92\x84\x01\x00\x00\x00\x00\x00\xad\x84\x01\x00\x00\x00\x00\x00\xb4\x84\x01\x00\x00\x00\x00\x00\xb7\x84\x01\x00\x00\x00\x00\x00\xcd\x84\x01\x00\x00\x00\x00\x00\xcf\x84\x01\x00\x00\x00\x00\x00\xd8\x84\x01\x00\x00\x00\x00\x00'
+    b'\x04\x85\x01\x00\x00\x00\x00\x00"\x85\x01\x00\x00\x00\x00\x00\xa5\x85\x01\x00\x00\x00\x00\x00\xc3\x85\x01\x00\x00\x00\x00\x00\xc7\x85\x01\x00\x00\x00\x00\x00\xcd\x85\x01\x00\x00\x00\x00\x00\x10\x86\x01\x00\x00\x00\x00\x00\x1e\x87\x01\x00\x00\x00\x00\x00,\x87\x01\x00\x00\x00\x00\x002\x87\x01\x00\x00\x00\x00\x00\\\x87\x01\x00\x00\x00\x00\x00\xec\x87\x01\x00\x00\x00\x00\x00'
+    b'\x04\x88\x01\x00\x00\x00\x00\x00W\x88\x01\x00\x00\x00\x00\x00Y\x88\x01\x00\x00\x00\x00\x00Z\x88\x01\x00\x00\x00\x00\x00\xb8\x88\x01\x00\x00\x00\x00\x00\xb0\x89\x01\x00\x00\x00\x00\x00\xb1\x89\x01\x00\x00\x00\x00\x00\xe3\x89\x01\x00\x00\x00\x00\x00j\x8a\x01\x00\x00\x00\x00\x00m\x8a\x01\x00\x00\x00\x00\x00_\x8b\x01\x00\x00\x00\x00\x006\x8e\x01\x00\x00\x00\x00\x00'
+    b'\xc5\x8e\x01\x00\x00\x00\x00\x00\xd2\x8e\x01\x00\x00\x00\x00\x00\xd5\x8e\x01\x00\x00\x00\x00\x00\xea\x8e\x01\x00\x00\x00\x00\x00\xeb\x8e\x01\x00\x00\x00\x00\x00\xfe\x8e\x01\x00\x00\x00\x00\x00\x82\x8f\x01\x00\x00\x00\x00\x00\x01\x90\x01\x00\x00\x00\x00\x00>\x90\x01\x00\x00\x00\x00\x00?\x90\x01\x00\x00\x00\x00\x00@\x90\x01\x00\x00\x00\x00\x00A\x90\x01\x00\x00\x00\x00\x00'
+    b'B\x90\x01\x00\x00\x00\x00\x00C\x90\x01\x00\x00\x00\x00\x00X\x90\x01\x00\x00\x00\x00\x00h\x90\x01\x00\x00\x00\x00\x00m\x90\x01\x00\x00\x00\x00\x00\x7f\x90\x01\x00\x00\x00\x00\x00\x99\x90\x01\x00\x00\x00\x00\x00\t\x91\x01\x00\x00\x00\x00\x00G\x91\x01\x00\x00\x00\x00\x00\t\x92\x01\x00\x00\x00\x00\x00\x1b\x92\x01\x00\x00\x00\x00\x00G\x92\x01\x00\x00\x00\x00\x00'
+    b'H\x92\x01\x00\x00\x00\x00\x00J\x92\x01\x00\x00\x00\x00\x00\xe0\x92\x01\x00\x00\x00\x00\x00\xe1\x92\x01\x00\x00\x00\x00\x00\xe5\x92\x01\x00\x00\x00\x00\x00\xe6\x92\x01\x00\x00\x00\x00\x00\xe7\x92\x01\x00\x00\x00\x00\x00\xe8\x92\x01\x00\x00\x00\x00\x00\x16\x93\x01\x00\x00\x00\x00\x00\x1e\x93\x01\x00\x00\x00\x00\x00\x1f\x93\x01\x00\x00\x00\x00\x00 \x93\x01\x00\x00\x00\x00\x00'
+    b'\xa5\x93\x01\x00\x00\x00\x00\x00\xc1\x93\x01\x00\x00\x00\x00\x00\xc2\x93\x01\x00\x00\x00\x00\x00\xdb\x93\x01\x00\x00\x00\x00\x002\x94\x01\x00\x00\x00\x00\x003\x94\x01\x00\x00\x00\x00\x004\x94\x01\x00\x00\x00\x00\x005\x94\x01\x00\x00\x00\x00\x006\x94\x01\x00\x00\x00\x00\x007\x94\x01\x00\x00\x00\x00\x008\x94\x01\x00\x00\x00\x00\x009\x94\x01\x00\x00\x00\x00\x00'
+    b':\x94\x01\x00\x00\x00\x00\x00;\x94\x01\x00\x00\x00\x00\x00<\x94\x01\x00\x00\x00\x00\x00=\x94\x01\x00\x00\x00\x00\x00>\x94\x01\x00\x00\x00\x00\x00?\x94\x01\x00\x00\x00\x00\x00\x98\x94\x01\x00\x00\x00\x00\x00\x01\x95\x01\x00\x00\x00\x00\x00\x86\x95\x01\x00\x00\x00\x00\x00\x93\x95\x01\x00\x00\x00\x00\x00\x94\x95\x01\x00\x00\x00\x00\x00\x95\x95\x01\x00\x00\x00\x00\x00'
+    b'\xd3\x95\x01\x00\x00\x00\x00\x00:\x96\x01\x00\x00\x00\x00\x00@\x96\x01\x00\x00\x00\x00\x00_\x98\x01\x00\x00\x00\x00\x00\x7f\x98\x01\x00\x00\x00\x00\x00\x80\x98\x01\x00\x00\x00\x00\x00\x81\x98\x01\x00\x00\x00\x00\x00\x82\x98\x01\x00\x00\x00\x00\x00\x83\x98\x01\x00\x00\x00\x00\x00\x84\x98\x01\x00\x00\x00\x00\x00\x85\x98\x01\x00\x00\x00\x00\x00\x86\x98\x01\x00\x00\x00\x00\x00'
+    b'\x87\x98\x01\x00\x00\x00\x00\x00\x88\x98\x01\x00\x00\x00\x00\x00\x89\x98\x01\x00\x00\x00\x00\x00\x96\x98\x01\x00\x00\x00\x00\x00\xcb\x98\x01\x00\x00\x00\x00\x00R\x99\x01\x00\x00\x00\x00\x00S\x99\x01\x00\x00\x00\x00\x00U\x99\x01\x00\x00\x00\x00\x00V\x99\x01\x00\x00\x00\x00\x00W\x99\x01\x00\x00\x00\x00\x00X\x99\x01\x00\x00\x00\x00\x00Y\x99\x01\x00\x00\x00\x00\x00'
+    b'Z\x99\x01\x00\x00\x00\x00\x00[\x99\x01\x00\x00\x00\x00\x00\\\x99\x01\x00\x00\x00\x00\x00]\x99\x01\x00\x00\x00\x00\x00^\x99\x01\x00\x00\x00\x00\x00_\x99\x01\x00\x00\x00\x00\x00`\x99\x01\x00\x00\x00\x00\x00a\x99\x01\x00\x00\x00\x00\x00b\x99\x01\x00\x00\x00\x00\x00c\x99\x01\x00\x00\x00\x00\x00d\x99\x01\x00\x00\x00\x00\x00e\x99\x01\x00\x00\x00\x00\x00'
+    b'f\x99\x01\x00\x00\x00\x00\x00g\x99\x01\x00\x00\x00\x00\x00h\x99\x01\x00\x00\x00\x00\x00i\x99\x01\x00\x00\x00\x00\x00\x8e\x99\x01\x00\x00\x00\x00\x00\x93\x99\x01\x00\x00\x00\x00\x00,\x9a\x01\x00\x00\x00\x00\x00?\x9a\x01\x00\x00\x00\x00\x00@\x9a\x01\x00\x00\x00\x00\x00A\x9a\x01\x00\x00\x00\x00\x00B\x9a\x01\x00\x00\x00\x00\x00C\x9a\x01\x00\x00\x00\x00\x00'
+    b'~\x9a\x01\x00\x00\x00\x00\x00\x81\x9a\x01\x00\x00\x00\x00\x00\xc9\x9a\x01\x00\x00\x00\x00\x00\x14\x9b\x01\x00\x00\x00\x00\x00\x16\x9b\x01\x00\x00\x00\x00\x00\\\x9b\x01\x00\x00\x00\x00\x00f\x9b\x01\x00\x00\x00\x00\x00g\x9b\x01\x00\x00\x00\x00\x00y\x9b\x01\x00\x00\x00\x00\x00z\x9b\x01\x00\x00\x00\x00\x00\x84\x9b\x01\x00\x00\x00\x00\x00\x8a\x9b\x01\x00\x00\x00\x00\x00'
+    b'\x95\x9b\x01\x00\x00\x00\x00\x00\x9a\x9b\x01\x00\x00\x00\x00\x00\xc7\x9b\x01\x00\x00\x00\x00\x00\xc8\x9b\x01\x00\x00\x00\x00\x00\xc9\x9b\x01\x00\x00\x00\x00\x00\xdc\x9b\x01\x00\x00\x00\x00\x00\xed\x9b\x01\x00\x00\x00\x00\x00\xbd\x9c\x01\x00\x00\x00\x00\x00\x12\x9d\x01\x00\x00\x00\x00\x00\x13\x9d\x01\x00\x00\x00\x00\x00\x14\x9d\x01\x00\x00\x00\x00\x00\x15\x9d\x01\x00\x00\x00\x00\x00'
+    b'!\x9d\x01\x00\x00\x00\x00\x00"\x9d\x01\x00\x00\x00\x00\x00#\x9d\x01\x00\x00\x00\x00\x00$\x9d\x01\x00\x00\x00\x00\x00%\x9d\x01\x00\x00\x00\x00\x00&\x9d\x01\x00\x00\x00\x00\x00\'\x9d\x01\x00\x00\x00\x00\x00(\x9d\x01\x00\x00\x00\x00\x00)\x9d\x01\x00\x00\x00\x00\x00,\x9d\x01\x00\x00\x00\x00\x00F\x9d\x01\x00\x00\x00\x00\x00\xa3\x9d\x01\x00\x00\x00\x00\x00'
+    b'\xac\x9d\x01\x00\x00\x00\x00\x00\xb0\x9d\x01\x00\x00\x00\x00\x00\xe7\x9d\x01\x00\x00\x00\x00\x00\x01\x9e\x01\x00\x00\x00\x00\x00N\x9e\x01\x00\x00\x00\x00\x00g\x9e\x01\x00\x00\x00\x00\x00\x8f\x9e\x01\x00\x00\x00\x00\x00\xc1\x9e\x01\x00\x00\x00\x00\x00\xd7\x9e\x01\x00\x00\x00\x00\x00\xeb\x9e\x01\x00\x00\x00\x00\x00\xf1\x9e\x01\x00\x00\x00\x00\x00\x82\xa1\x01\x00\x00\x00\x00\x00'
+    b'\x83\xa1\x01\x00\x00\x00\x00\x00\x84\xa1\x01\x00\x00\x00\x00\x00\x90\xa1\x01\x00\x00\x00\x00\x00\x91\xa1\x01\x00\x00\x00\x00\x00\x92\xa1\x01\x00\x00\x00\x00\x00\x93\xa1\x01\x00\x00\x00\x00\x00\x94\xa1\x01\x00\x00\x00\x00\x00\xa0\xa1\x01\x00\x00\x00\x00\x00\xa1\xa1\x01\x00\x00\x00\x00\x00\xa2\xa1\x01\x00\x00\x00\x00\x00\xd4\xa1\x01\x00\x00\x00\x00\x00\x02\xa2\x01\x00\x00\x00\x00\x00'
+    b'\x03\xa2\x01\x00\x00\x00\x00\x00\x04\xa2\x01\x00\x00\x00\x00\x00\x18\xa2\x01\x00\x00\x00\x00\x00\x8f\xa2\x01\x00\x00\x00\x00\x00\x9e\xa2\x01\x00\x00\x00\x00\x00\xab\xa2\x01\x00\x00\x00\x00\x00\xac\xa2\x01\x00\x00\x00\x00\x00\xad\xa2\x01\x00\x00\x00\x00\x00\xae\xa2\x01\x00\x00\x00\x00\x00\xaf\xa2\x01\x00\x00\x00\x00\x00\xe4\xa2\x01\x00\x00\x00\x00\x00|\xa3\x01\x00\x00\x00\x00\x00'
+    b'\xaf\xa3\x01\x00\x00\x00\x00\x00\xb0\xa3\x01\x00\x00\x00\x00\x00\xb1\xa3\x01\x00\x00\x00\x00\x00\xb2\xa3\x01\x00\x00\x00\x00\x00\xc3\xa3\x01\x00\x00\x00\x00\x00\xc5\xa3\x01\x00\x00\x00\x00\x00\xcd\xa3\x01\x00\x00\x00\x00\x00\xda\xa3\x01\x00\x00\x00\x00\x00\xdb\xa3\x01\x00\x00\x00\x00\x00\xdc\xa3\x01\x00\x00\x00\x00\x00\xdd\xa3\x01\x00\x00\x00\x00\x00\xde\xa3\x01\x00\x00\x00\x00\x00'
+    b'\x05\xa4\x01\x00\x00\x00\x00\x00\x06\xa4\x01\x00\x00\x00\x00\x00\x0e\xa4\x01\x00\x00\x00\x00\x00\x1e\xa4\x01\x00\x00\x00\x00\x00\xc8\xa4\x01\x00\x00\x00\x00\x00\xc9\xa4\x01\x00\x00\x00\x00\x00\xca\xa4\x01\x00\x00\x00\x00\x00\xcb\xa4\x01\x00\x00\x00\x00\x00\x08\xa5\x01\x00\x00\x00\x00\x00\t\xa5\x01\x00\x00\x00\x00\x00\n\xa5\x01\x00\x00\x00\x00\x002\xa5\x01\x00\x00\x00\x00\x00'
+    b'3\xa5\x01\x00\x00\x00\x00\x004\xa5\x01\x00\x00\x00\x00\x00n\xa5\x01\x00\x00\x00\x00\x00\xb2\xa5\x01\x00\x00\x00\x00\x00\xb8\xa5\x01\x00\x00\x00\x00\x00\xe1\xa5\x01\x00\x00\x00\x00\x00\xe2\xa5\x01\x00\x00\x00\x00\x00\xe3\xa5\x01\x00\x00\x00\x00\x00\xe5\xa5\x01\x00\x00\x00\x00\x00\xe6\xa5\x01\x00\x00\x00\x00\x00\xee\xa5\x01\x00\x00\x00\x00\x00\xf0\xa5\x01\x00\x00\x00\x00\x00'
+    b'\xf1\xa5\x01\x00\x00\x00\x00\x00\xf2\xa5\x01\x00\x00\x00\x00\x00\xf7\xa5\x01\x00\x00\x00\x00\x00\xf8\xa5\x01\x00\x00\x00\x00\x00\xf9\xa5\x01\x00\x00\x00\x00\x00F\xa6\x01\x00\x00\x00\x00\x00G\xa6\x01\x00\x00\x00\x00\x00H\xa6\x01\x00\x00\x00\x00\x00\xca\xa6\x01\x00\x00\x00\x00\x00\xda\xa6\x01\x00\x00\x00\x00\x00\xdb\xa6\x01\x00\x00\x00\x00\x00\xdc\xa6\x01\x00\x00\x00\x00\x00'
+    b'\xdd\xa6\x01\x00\x00\x00\x00\x00\xe0\xa6\x01\x00\x00\x00\x00\x00\xe2\xa6\x01\x00\x00\x00\x00\x00\xe4\xa6\x01\x00\x00\x00\x00\x00\xe7\xa6\x01\x00\x00\x00\x00\x00\x87\xa7\x01\x00\x00\x00\x00\x00\x88\xa7\x01\x00\x00\x00\x00\x00\xf1\xa7\x01\x00\x00\x00\x00\x00\xf2\xa7\x01\x00\x00\x00\x00\x00\xf3\xa7\x01\x00\x00\x00\x00\x00\xf4\xa7\x01\x00\x00\x00\x00\x00\xff\xa7\x01\x00\x00\x00\x00\x00'
+    b'\x80\xa8\x01\x00\x00\x00\x00\x00\xac\xa8\x01\x00\x00\x00\x00\x00\xf7\xa8\x01\x00\x00\x00\x00\x00O\xa9\x01\x00\x00\x00\x00\x00u\xa9\x01\x00\x00\x00\x00\x00{\xa9\x01\x00\x00\x00\x00\x00\xa6\xa9\x01\x00\x00\x00\x00\x00\x05\xaa\x01\x00\x00\x00\x00\x00\x06\xaa\x01\x00\x00\x00\x00\x00\x07\xaa\x01\x00\x00\x00\x00\x00\x1a\xaa\x01\x00\x00\x00\x00\x00D\xab\x01\x00\x00\x00\x00\x00'
+    b'f\xab\x01\x00\x00\x00\x00\x00\xa2\xac\x01\x00\x00\x00\x00\x00\xa4\xac\x01\x00\x00\x00\x00\x00\xa6\xac\x01\x00\x00\x00\x00\x00\xaa\xac\x01\x00\x00\x00\x00\x00\xac\xac\x01\x00\x00\x00\x00\x00\xaf\xac\x01\x00\x00\x00\x00\x00\xb1\xac\x01\x00\x00\x00\x00\x00\xb3\xac\x01\x00\x00\x00\x00\x00\xb5\xac\x01\x00\x00\x00\x00\x00\xb7\xac\x01\x00\x00\x00\x00\x00\r\xad\x01\x00\x00\x00\x00\x00'
+    b',\xad\x01\x00\x00\x00\x00\x00-\xad\x01\x00\x00\x00\x00\x00a\xad\x01\x00\x00\x00\x00\x00b\xad\x01\x00\x00\x00\x00\x00L\xae\x01\x00\x00\x00\x00\x00O\xae\x01\x00\x00\x00\x00\x00Q\xae\x01\x00\x00\x00\x00\x00S\xae\x01\x00\x00\x00\x00\x00s\xae\x01\x00\x00\x00\x00\x00\x9d\xaf\x01\x00\x00\x00\x00\x00\xbe\xaf\x01\x00\x00\x00\x00\x00\xc2\xaf\x01\x00\x00\x00\x00\x00'
+    b'/\xb0\x01\x00\x00\x00\x00\x00B\xb0\x01\x00\x00\x00\x00\x00\x9e\xb0\x01\x00\x00\x00\x00\x00\x9f\xb0\x01\x00\x00\x00\x00\x00{\xb1\x01\x00\x00\x00\x00\x00\x06\xb2\x01\x00\x00\x00\x00\x00\x07\xb2\x01\x00\x00\x00\x00\x00\x08\xb2\x01\x00\x00\x00\x00\x00\xcd\xb2\x01\x00\x00\x00\x00\x00\xa8\xb3\x01\x00\x00\x00\x00\x00\xa9\xb3\x01\x00\x00\x00\x00\x00\xaa\xb3\x01\x00\x00\x00\x00\x00'
+    b'I\xb4\x01\x00\x00\x00\x00\x00K\xb4\x01\x00\x00\x00\x00\x00L\xb4\x01\x00\x00\x00\x00\x00N\xb4\x01\x00\x00\x00\x00\x00O\xb4\x01\x00\x00\x00\x00\x00Q\xb4\x01\x00\x00\x00\x00\x00R\xb4\x01\x00\x00\x00\x00\x00\x1b\xb8\x01\x00\x00\x00\x00\x00^\xbc\x01\x00\x00\x00\x00\x00\xf8\xbf\x01\x00\x00\x00\x00\x00\xe9\xc0\x01\x00\x00\x00\x00\x00\xea\xc0\x01\x00\x00\x00\x00\x00'
+    b'\xeb\xc0\x01\x00\x00\x00\x00\x00G\xc1\x01\x00\x00\x00\x00\x00\xc5\xc1\x01\x00\x00\x00\x00\x00\x06\xc4\x01\x00\x00\x00\x00\x00\xeb\xc5\x01\x00\x00\x00\x00\x00\xee\xc5\x01\x00\x00\x00\x00\x003\xc6\x01\x00\x00\x00\x00\x005\xc6\x01\x00\x00\x00\x00\x00\xd1\xc8\x01\x00\x00\x00\x00\x00\xd2\xc8\x01\x00\x00\x00\x00\x00\xd3\xc8\x01\x00\x00\x00\x00\x00\xd4\xc8\x01\x00\x00\x00\x00\x00'
+    b'\xd5\xc8\x01\x00\x00\x00\x00\x00\xd6\xc8\x01\x00\x00\x00\x00\x00\xd7\xc8\x01\x00\x00\x00\x00\x00\xd8\xc8\x01\x00\x00\x00\x00\x00\xd9\xc8\x01\x00\x00\x00\x00\x00\xc1\xc9\x01\x00\x00\x00\x00\x00\xbd\xca\x01\x00\x00\x00\x00\x00\xbe\xca\x01\x00\x00\x00\x00\x00\xbf\xca\x01\x00\x00\x00\x00\x00\xc0\xca\x01\x00\x00\x00\x00\x00\xc1\xca\x01\x00\x00\x00\x00\x00T\xcb\x01\x00\x00\x00\x00\x00'
+    b'U\xcb\x01\x00\x00\x00\x00\x00V\xcb\x01\x00\x00\x00\x00\x00W\xcb\x01\x00\x00\x00\x00\x00X\xcb\x01\x00\x00\x00\x00\x00Y\xcb\x01\x00\x00\x00\x00\x00Z\xcb\x01\x00\x00\x00\x00\x00\\\xcb\x01\x00\x00\x00\x00\x00^\xcb\x01\x00\x00\x00\x00\x00_\xcb\x01\x00\x00\x00\x00\x00`\xcb\x01\x00\x00\x00\x00\x00h\xcb\x01\x00\x00\x00\x00\x00i\xcb\x01\x00\x00\x00\x00\x00'
+    b'j\xcb\x01\x00\x00\x00\x00\x00\x05\xcd\x01\x00\x00\x00\x00\x00U\xcd\x01\x00\x00\x00\x00\x00V\xcd\x01\x00\x00\x00\x00\x00y\xce\x01\x00\x00\x00\x00\x00\xa4\xce\x01\x00\x00\x00\x00\x00\xde\xce\x01\x00\x00\x00\x00\x00\xdf\xce\x01\x00\x00\x00\x00\x00\xe0\xce\x01\x00\x00\x00\x00\x00\xe1\xce\x01\x00\x00\x00\x00\x00\xe2\xce\x01\x00\x00\x00\x00\x00\xe3\xce\x01\x00\x00\x00\x00\x00'
+    b'\xe4\xce\x01\x00\x00\x00\x00\x00\xe5\xce\x01\x00\x00\x00\x00\x00\xe6\xce\x01\x00\x00\x00\x00\x00\xe7\xce\x01\x00\x00\x00\x00\x00\xe8\xce\x01\x00\x00\x00\x00\x00\xe9\xce\x01\x00\x00\x00\x00\x00\xef\xce\x01\x00\x00\x00\x00\x00\xf0\xce\x01\x00\x00\x00\x00\x00\xf1\xce\x01\x00\x00\x00\x00\x00\xf2\xce\x01\x00\x00\x00\x00\x00\xf4\xce\x01\x00\x00\x00\x00\x00\x84\xcf\x01\x00\x00\x00\x00\x00'
+    b'\x89\xcf\x01\x00\x00\x00\x00\x00\x8b\xcf\x01\x00\x00\x00\x00\x00\x8d\xcf\x01\x00\x00\x00\x00\x00\x90\xcf\x01\x00\x00\x00\x00\x00\x96\xcf\x01\x00\x00\x00\x00\x00\xaf\xcf\x01\x00\x00\x00\x00\x00\xb0\xcf\x01\x00\x00\x00\x00\x00\xb1\xcf\x01\x00\x00\x00\x00\x00\xb2\xcf\x01\x00\x00\x00\x00\x00M\xd0\x01\x00\x00\x00\x00\x00W\xd0\x01\x00\x00\x00\x00\x00r\xd0\x01\x00\x00\x00\x00\x00'
+    b's\xd0\x01\x00\x00\x00\x00\x00t\xd0\x01\x00\x00\x00\x00\x00u\xd0\x01\x00\x00\x00\x00\x00v\xd0\x01\x00\x00\x00\x00\x00w\xd0\x01\x00\x00\x00\x00\x00x\xd0\x01\x00\x00\x00\x00\x00z\xd0\x01\x00\x00\x00\x00\x00{\xd0\x01\x00\x00\x00\x00\x00\x8b\xd0\x01\x00\x00\x00\x00\x00\x8c\xd0\x01\x00\x00\x00\x00\x00\x8d\xd0\x01\x00\x00\x00\x00\x00\x90\xd0\x01\x00\x00\x00\x00\x00'
+    b"\x91\xd0\x01\x00\x00\x00\x00\x00\n\xd1\x01\x00\x00\x00\x00\x00\x12\xd1\x01\x00\x00\x00\x00\x00b\xd1\x01\x00\x00\x00\x00\x00c\xd1\x01\x00\x00\x00\x00\x00d\xd1\x01\x00\x00\x00\x00\x00e\xd1\x01\x00\x00\x00\x00\x00f\xd1\x01\x00\x00\x00\x00\x00g\xd1\x01\x00\x00\x00\x00\x00#\xd2\x01\x00\x00\x00\x00\x00'\xd2\x01\x00\x00\x00\x00\x00a\xd2\x01\x00\x00\x00\x00\x00"
+    b'b\xd2\x01\x00\x00\x00\x00\x00c\xd2\x01\x00\x00\x00\x00\x00d\xd2\x01\x00\x00\x00\x00\x00e\xd2\x01\x00\x00\x00\x00\x00f\xd2\x01\x00\x00\x00\x00\x00v\xd2\x01\x00\x00\x00\x00\x00\xe4\xd3\x01\x00\x00\x00\x00\x00\xe5\xd3\x01\x00\x00\x00\x00\x00\xe6\xd3\x01\x00\x00\x00\x00\x00\xe7\xd3\x01\x00\x00\x00\x00\x00\x87\xd4\x01\x00\x00\x00\x00\x00\x88\xd4\x01\x00\x00\x00\x00\x00'
+    b'\x8a\xd4\x01\x00\x00\x00\x00\x00\x8b\xd4\x01\x00\x00\x00\x00\x00\xe8\xd4\x01\x00\x00\x00\x00\x00\xe9\xd4\x01\x00\x00\x00\x00\x00\xea\xd4\x01\x00\x00\x00\x00\x00o\xd5\x01\x00\x00\x00\x00\x003\xd6\x01\x00\x00\x00\x00\x004\xd6\x01\x00\x00\x00\x00\x00\x9d\xd6\x01\x00\x00\x00\x00\x00\xa0\xd6\x01\x00\x00\x00\x00\x00\xa1\xd6\x01\x00\x00\x00\x00\x00\xa2\xd6\x01\x00\x00\x00\x00\x00'
+    b'\xa3\xd6\x01\x00\x00\x00\x00\x00\xa4\xd6\x01\x00\x00\x00\x00\x00\xa5\xd6\x01\x00\x00\x00\x00\x00\xad\xd6\x01\x00\x00\x00\x00\x00\xae\xd6\x01\x00\x00\x00\x00\x00\xaf\xd6\x01\x00\x00\x00\x00\x00\xb0\xd6\x01\x00\x00\x00\x00\x00\xb1\xd6\x01\x00\x00\x00\x00\x00\xb2\xd6\x01\x00\x00\x00\x00\x00\xb4\xd6\x01\x00\x00\x00\x00\x00\xc1\xd8\x01\x00\x00\x00\x00\x00\xc2\xd8\x01\x00\x00\x00\x00\x00'
+    b'\xc6\xd8\x01\x00\x00\x00\x00\x00\xc7\xd8\x01\x00\x00\x00\x00\x00\xc8\xd8\x01\x00\x00\x00\x00\x00\xc9\xd8\x01\x00\x00\x00\x00\x00\xcb\xd8\x01\x00\x00\x00\x00\x00\xcc\xd8\x01\x00\x00\x00\x00\x00\xcd\xd8\x01\x00\x00\x00\x00\x00\xce\xd8\x01\x00\x00\x00\x00\x00\xcf\xd8\x01\x00\x00\x00\x00\x00\xd3\xd8\x01\x00\x00\x00\x00\x00\xd4\xd8\x01\x00\x00\x00\x00\x00\xd5\xd8\x01\x00\x00\x00\x00\x00'
+    b'\xd6\xd8\x01\x00\x00\x00\x00\x00\xd7\xd8\x01\x00\x00\x00\x00\x00\xd8\xd8\x01\x00\x00\x00\x00\x00\xd9\xd8\x01\x00\x00\x00\x00\x00\xda\xd8\x01\x00\x00\x00\x00\x00\xdb\xd8\x01\x00\x00\x00\x00\x00\xdc\xd8\x01\x00\x00\x00\x00\x00\xdd\xd8\x01\x00\x00\x00\x00\x00\xde\xd8\x01\x00\x00\x00\x00\x00\xdf\xd8\x01\x00\x00\x00\x00\x00\xe0\xd8\x01\x00\x00\x00\x00\x00\xe9\xd8\x01\x00\x00\x00\x00\x00'
+    b'\xfc\xda\x01\x00\x00\x00\x00\x00\t\xdb\x01\x00\x00\x00\x00\x00\x0b\xdb\x01\x00\x00\x00\x00\x00\xeb\xdb\x01\x00\x00\x00\x00\x00X\xdf\x01\x00\x00\x00\x00\x00{\xdf\x01\x00\x00\x00\x00\x00|\xdf\x01\x00\x00\x00\x00\x00}\xdf\x01\x00\x00\x00\x00\x00\x86\xdf\x01\x00\x00\x00\x00\x00\x87\xdf\x01\x00\x00\x00\x00\x00\x88\xdf\x01\x00\x00\x00\x00\x00\x89\xdf\x01\x00\x00\x00\x00\x00'
+    b'\x8a\xdf\x01\x00\x00\x00\x00\x00E\xe0\x01\x00\x00\x00\x00\x00F\xe0\x01\x00\x00\x00\x00\x00G\xe0\x01\x00\x00\x00\x00\x00H\xe0\x01\x00\x00\x00\x00\x00I\xe0\x01\x00\x00\x00\x00\x00J\xe0\x01\x00\x00\x00\x00\x00K\xe0\x01\x00\x00\x00\x00\x00L\xe0\x01\x00\x00\x00\x00\x00M\xe0\x01\x00\x00\x00\x00\x00U\xe0\x01\x00\x00\x00\x00\x00\x16\xe3\x01\x00\x00\x00\x00\x00'
+    b'\xab\xe3\x01\x00\x00\x00\x00\x00\xac\xe3\x01\x00\x00\x00\x00\x00\xad\xe3\x01\x00\x00\x00\x00\x00\xae\xe3\x01\x00\x00\x00\x00\x00\xaf\xe3\x01\x00\x00\x00\x00\x00\xb0\xe3\x01\x00\x00\x00\x00\x00\xbb\xe5\x01\x00\x00\x00\x00\x00;\xe6\x01\x00\x00\x00\x00\x00<\xe6\x01\x00\x00\x00\x00\x00\x84\xe6\x01\x00\x00\x00\x00\x00\x87\xe6\x01\x00\x00\x00\x00\x00\xdc\xe6\x01\x00\x00\x00\x00\x00'
+    b'\xe9\xe6\x01\x00\x00\x00\x00\x00\xf0\xe6\x01\x00\x00\x00\x00\x00\xf1\xe6\x01\x00\x00\x00\x00\x00\xf2\xe6\x01\x00\x00\x00\x00\x00\n\xe7\x01\x00\x00\x00\x00\x00\x18\xe7\x01\x00\x00\x00\x00\x00#\xe7\x01\x00\x00\x00\x00\x00@\xe7\x01\x00\x00\x00\x00\x00\x8c\xe7\x01\x00\x00\x00\x00\x00\xc5\xe7\x01\x00\x00\x00\x00\x00\xd2\xe7\x01\x00\x00\x00\x00\x00\xd8\xe7\x01\x00\x00\x00\x00\x00'
+    b'\xe6\xe7\x01\x00\x00\x00\x00\x00\xe7\xe7\x01\x00\x00\x00\x00\x00\x82\xe8\x01\x00\x00\x00\x00\x00\x84\xe8\x01\x00\x00\x00\x00\x00\x85\xe8\x01\x00\x00\x00\x00\x00\x86\xe9\x01\x00\x00\x00\x00\x00\x87\xe9\x01\x00\x00\x00\x00\x00\xbf\xe9\x01\x00\x00\x00\x00\x00\xc1\xe9\x01\x00\x00\x00\x00\x00\xc6\xe9\x01\x00\x00\x00\x00\x00\xd0\xe9\x01\x00\x00\x00\x00\x00\xd1\xe9\x01\x00\x00\x00\x00\x00'
+    b'\xd5\xe9\x01\x00\x00\x00\x00\x00\xd6\xe9\x01\x00\x00\x00\x00\x00s\xea\x01\x00\x00\x00\x00\x00t\xea\x01\x00\x00\x00\x00\x00u\xea\x01\x00\x00\x00\x00\x00\x9d\xea\x01\x00\x00\x00\x00\x00&\xeb\x01\x00\x00\x00\x00\x00d\xec\x01\x00\x00\x00\x00\x00e\xec\x01\x00\x00\x00\x00\x00f\xec\x01\x00\x00\x00\x00\x00h\xec\x01\x00\x00\x00\x00\x00i\xec\x01\x00\x00\x00\x00\x00'
+    b'j\xec\x01\x00\x00\x00\x00\x00l\xec\x01\x00\x00\x00\x00\x00m\xec\x01\x00\x00\x00\x00\x00n\xec\x01\x00\x00\x00\x00\x00p\xec\x01\x00\x00\x00\x00\x00q\xec\x01\x00\x00\x00\x00\x00r\xec\x01\x00\x00\x00\x00\x00t\xec\x01\x00\x00\x00\x00\x00u\xec\x01\x00\x00\x00\x00\x00v\xec\x01\x00\x00\x00\x00\x00x\xec\x01\x00\x00\x00\x00\x00y\xec\x01\x00\x00\x00\x00\x00'
+    b'z\xec\x01\x00\x00\x00\x00\x00|\xec\x01\x00\x00\x00\x00\x00}\xec\x01\x00\x00\x00\x00\x00~\xec\x01\x00\x00\x00\x00\x00\x80\xec\x01\x00\x00\x00\x00\x00\x81\xec\x01\x00\x00\x00\x00\x00\x82\xec\x01\x00\x00\x00\x00\x00\x84\xec\x01\x00\x00\x00\x00\x00\x85\xec\x01\x00\x00\x00\x00\x00\x86\xec\x01\x00\x00\x00\x00\x00\x97\xec\x01\x00\x00\x00\x00\x00\xa0\xec\x01\x00\x00\x00\x00\x00'
+    b'\xab\xec\x01\x00\x00\x00\x00\x00\xad\xec\x01\x00\x00\x00\x00\x00\xe5\xec\x01\x00\x00\x00\x00\x00c\xed\x01\x00\x00\x00\x00\x00g\xed\x01\x00\x00\x00\x00\x00\xb4\xee\x01\x00\x00\x00\x00\x00\xdf\xee\x01\x00\x00\x00\x00\x00\x0b\xef\x01\x00\x00\x00\x00\x00\x0c\xef\x01\x00\x00\x00\x00\x00\x91\xef\x01\x00\x00\x00\x00\x00\xb5\xef\x01\x00\x00\x00\x00\x00s\xf0\x01\x00\x00\x00\x00\x00'
+    b'\x8b\xf0\x01\x00\x00\x00\x00\x00\xa5\xf0\x01\x00\x00\x00\x00\x00V\xf3\x01\x00\x00\x00\x00\x00W\xf3\x01\x00\x00\x00\x00\x00X\xf3\x01\x00\x00\x00\x00\x00#\xf5\x01\x00\x00\x00\x00\x00$\xf5\x01\x00\x00\x00\x00\x00%\xf5\x01\x00\x00\x00\x00\x00\xe0\xf5\x01\x00\x00\x00\x00\x00\xe1\xf5\x01\x00\x00\x00\x00\x00\x8e\xf6\x01\x00\x00\x00\x00\x00\x8f\xf6\x01\x00\x00\x00\x00\x00'
+    b'\x90\xf6\x01\x00\x00\x00\x00\x00\x91\xf6\x01\x00\x00\x00\x00\x00\x92\xf6\x01\x00\x00\x00\x00\x00\x1b\xf7\x01\x00\x00\x00\x00\x00\x82\xf7\x01\x00\x00\x00\x00\x00\xf8\xf7\x01\x00\x00\x00\x00\x00\xf9\xf7\x01\x00\x00\x00\x00\x00\xfa\xf7\x01\x00\x00\x00\x00\x00\xfb\xf7\x01\x00\x00\x00\x00\x00\xfc\xf7\x01\x00\x00\x00\x00\x00\xfd\xf7\x01\x00\x00\x00\x00\x00$\xf8\x01\x00\x00\x00\x00\x00'
+    b'\xa0\xf8\x01\x00\x00\x00\x00\x00\xa1\xf8\x01\x00\x00\x00\x00\x00z\xf9\x01\x00\x00\x00\x00\x00\x8b\xf9\x01\x00\x00\x00\x00\x001\xfa\x01\x00\x00\x00\x00\x00;\xfa\x01\x00\x00\x00\x00\x00\xd6\xfc\x01\x00\x00\x00\x00\x00\xdd\xfd\x01\x00\x00\x00\x00\x00\xde\xfd\x01\x00\x00\x00\x00\x00\xdf\xfd\x01\x00\x00\x00\x00\x00\x9d\xfe\x01\x00\x00\x00\x00\x00\x9e\xfe\x01\x00\x00\x00\x00\x00'
+    b'\xa8\xfe\x01\x00\x00\x00\x00\x00\xc9\xff\x01\x00\x00\x00\x00\x00\xca\xff\x01\x00\x00\x00\x00\x00\xcb\xff\x01\x00\x00\x00\x00\x00\xcc\xff\x01\x00\x00\x00\x00\x00\xcd\xff\x01\x00\x00\x00\x00\x00\xce\xff\x01\x00\x00\x00\x00\x00\xcf\xff\x01\x00\x00\x00\x00\x00\xd0\xff\x01\x00\x00\x00\x00\x00\xd1\xff\x01\x00\x00\x00\x00\x00\xd3\xff\x01\x00\x00\x00\x00\x00\xd4\xff\x01\x00\x00\x00\x00\x00'
+    b'\xd5\xff\x01\x00\x00\x00\x00\x00\xd6\xff\x01\x00\x00\x00\x00\x00\xd7\xff\x01\x00\x00\x00\x00\x00\xd8\xff\x01\x00\x00\x00\x00\x00\xd9\xff\x01\x00\x00\x00\x00\x00\xdb\xff\x01\x00\x00\x00\x00\x00\xdc\xff\x01\x00\x00\x00\x00\x00\xdd\xff\x01\x00\x00\x00\x00\x00\xde\xff\x01\x00\x00\x00\x00\x00\xdf\xff\x01\x00\x00\x00\x00\x00\xe0\xff\x01\x00\x00\x00\x00\x00\xe1\xff\x01\x00\x00\x00\x00\x00'
+    b'\xe2\xff\x01\x00\x00\x00\x00\x00\xe3\xff\x01\x00\x00\x00\x00\x00\xe4\xff\x01\x00\x00\x00\x00\x00\xe5\xff\x01\x00\x00\x00\x00\x00\xe6\xff\x01\x00\x00\x00\x00\x00\xe7\xff\x01\x00\x00\x00\x00\x00\xe8\xff\x01\x00\x00\x00\x00\x00\xe9\xff\x01\x00\x00\x00\x00\x00\xea\xff\x01\x00\x00\x00\x00\x00\xeb\xff\x01\x00\x00\x00\x00\x00\xec\xff\x01\x00\x00\x00\x00\x00\xed\xff\x01\x00\x00\x00\x00\x00'
+    b'\xee\xff\x01\x00\x00\x00\x00\x00\xef\xff\x01\x00\x00\x00\x00\x00\xf0\xff\x01\x00\x00\x00\x00\x00\xf1\xff\x01\x00\x00\x00\x00\x00\xf2\xff\x01\x00\x00\x00\x00\x00\xf3\xff\x01\x00\x00\x00\x00\x00\xf4\xff\x01\x00\x00\x00\x00\x00\x9d\x00\x02\x00\x00\x00\x00\x00\xa0\x00\x02\x00\x00\x00\x00\x00\xce\x00\x02\x00\x00\x00\x00\x00/\x01\x02\x00\x00\x00\x00\x001\x01\x02\x00\x00\x00\x00\x00'
+    b'4\x01\x02\x00\x00\x00\x00\x006\x01\x02\x00\x00\x00\x00\x007\x01\x02\x00\x00\x00\x00\x00\xa5\x01\x02\x00\x00\x00\x00\x00\xa7\x01\x02\x00\x00\x00\x00\x00\xa8\x01\x02\x00\x00\x00\x00\x00\xa9\x01\x02\x00\x00\x00\x00\x00\xaa\x01\x02\x00\x00\x00\x00\x00\xba\x02\x02\x00\x00\x00\x00\x00\xc5\x02\x02\x00\x00\x00\x00\x00\xea\x02\x02\x00\x00\x00\x00\x00)\x03\x02\x00\x00\x00\x00\x00'
+    b'2\x03\x02\x00\x00\x00\x00\x003\x03\x02\x00\x00\x00\x00\x00D\x03\x02\x00\x00\x00\x00\x00J\x03\x02\x00\x00\x00\x00\x00\xaa\x03\x02\x00\x00\x00\x00\x00\xb3\x03\x02\x00\x00\x00\x00\x00\xec\x03\x02\x00\x00\x00\x00\x00\xed\x03\x02\x00\x00\x00\x00\x00\xee\x03\x02\x00\x00\x00\x00\x00\xef\x03\x02\x00\x00\x00\x00\x00\xf0\x03\x02\x00\x00\x00\x00\x00\xf5\x03\x02\x00\x00\x00\x00\x00'
+    b'\xf7\x03\x02\x00\x00\x00\x00\x00\xf9\x03\x02\x00\x00\x00\x00\x00\xfb\x03\x02\x00\x00\x00\x00\x00\xfd\x03\x02\x00\x00\x00\x00\x00\xff\x03\x02\x00\x00\x00\x00\x00\x06\x04\x02\x00\x00\x00\x00\x00\t\x04\x02\x00\x00\x00\x00\x00\x0b\x04\x02\x00\x00\x00\x00\x00\r\x04\x02\x00\x00\x00\x00\x00\x0f\x04\x02\x00\x00\x00\x00\x00\x11\x04\x02\x00\x00\x00\x00\x00\x13\x04\x02\x00\x00\x00\x00\x00'
+    b'\x15\x04\x02\x00\x00\x00\x00\x00\x17\x04\x02\x00\x00\x00\x00\x00\x19\x04\x02\x00\x00\x00\x00\x00<\x04\x02\x00\x00\x00\x00\x00\x80\x04\x02\x00\x00\x00\x00\x00\x86\x04\x02\x00\x00\x00\x00\x00\x8d\x04\x02\x00\x00\x00\x00\x00\x91\x04\x02\x00\x00\x00\x00\x00\x02\x05\x02\x00\x00\x00\x00\x00\x16\x05\x02\x00\x00\x00\x00\x00\x9f\x05\x02\x00\x00\x00\x00\x00\xd4\x05\x02\x00\x00\x00\x00\x00'
+    b'\xf1\x05\x02\x00\x00\x00\x00\x00\xf2\x05\x02\x00\x00\x00\x00\x00\xf3\x05\x02\x00\x00\x00\x00\x00\xf4\x05\x02\x00\x00\x00\x00\x00\xf5\x05\x02\x00\x00\x00\x00\x00 \x06\x02\x00\x00\x00\x00\x00$\x06\x02\x00\x00\x00\x00\x00%\x06\x02\x00\x00\x00\x00\x00^\x06\x02\x00\x00\x00\x00\x00\x83\x06\x02\x00\x00\x00\x00\x00\x84\x06\x02\x00\x00\x00\x00\x00\x85\x06\x02\x00\x00\x00\x00\x00'
+    b'\x86\x06\x02\x00\x00\x00\x00\x00\x8e\x06\x02\x00\x00\x00\x00\x00\x8f\x06\x02\x00\x00\x00\x00\x00\xc5\x06\x02\x00\x00\x00\x00\x00\xc6\x06\x02\x00\x00\x00\x00\x00\xe3\x07\x02\x00\x00\x00\x00\x00\xe4\x07\x02\x00\x00\x00\x00\x00\xe5\x07\x02\x00\x00\x00\x00\x00\xe6\x07\x02\x00\x00\x00\x00\x00\xe7\x07\x02\x00\x00\x00\x00\x00\xe8\x07\x02\x00\x00\x00\x00\x00\xe9\x07\x02\x00\x00\x00\x00\x00'
+    b'\xf1\x07\x02\x00\x00\x00\x00\x00\xeb\x08\x02\x00\x00\x00\x00\x00\xec\x08\x02\x00\x00\x00\x00\x00\xed\x08\x02\x00\x00\x00\x00\x00\xee\x08\x02\x00\x00\x00\x00\x00\xef\x08\x02\x00\x00\x00\x00\x00\xf0\x08\x02\x00\x00\x00\x00\x00\x0b\t\x02\x00\x00\x00\x00\x00\xd5\t\x02\x00\x00\x00\x00\x00o\n\x02\x00\x00\x00\x00\x00\xca\n\x02\x00\x00\x00\x00\x00\xcb\n\x02\x00\x00\x00\x00\x00'
+    b'\xcc\n\x02\x00\x00\x00\x00\x00\xcd\n\x02\x00\x00\x00\x00\x00\xce\n\x02\x00\x00\x00\x00\x00\xa2\x0b\x02\x00\x00\x00\x00\x00\xb1\x0c\x02\x00\x00\x00\x00\x00\x89\r\x02\x00\x00\x00\x00\x00\xac\r\x02\x00\x00\x00\x00\x00\xad\r\x02\x00\x00\x00\x00\x00O\x0f\x02\x00\x00\x00\x00\x00\xdd\x0f\x02\x00\x00\x00\x00\x00\xde\x0f\x02\x00\x00\x00\x00\x00\xdf\x0f\x02\x00\x00\x00\x00\x00'
+    b'\xe0\x0f\x02\x00\x00\x00\x00\x00\xe1\x0f\x02\x00\x00\x00\x00\x00F\x10\x02\x00\x00\x00\x00\x00G\x10\x02\x00\x00\x00\x00\x00H\x10\x02\x00\x00\x00\x00\x00I\x10\x02\x00\x00\x00\x00\x00\x8a\x10\x02\x00\x00\x00\x00\x00\x8b\x10\x02\x00\x00\x00\x00\x00\x8c\x10\x02\x00\x00\x00\x00\x00\x8d\x10\x02\x00\x00\x00\x00\x00\x8e\x10\x02\x00\x00\x00\x00\x00\x8f\x10\x02\x00\x00\x00\x00\x00'
+    b'\x9c\x10\x02\x00\x00\x00\x00\x00\x9d\x10\x02\x00\x00\x00\x00\x00\x9e\x10\x02\x00\x00\x00\x00\x00\x9f\x10\x02\x00\x00\x00\x00\x00\xf1\x10\x02\x00\x00\x00\x00\x00\xf2\x10\x02\x00\x00\x00\x00\x00t\x11\x02\x00\x00\x00\x00\x00\xf3\x11\x02\x00\x00\x00\x00\x00\xf4\x11\x02\x00\x00\x00\x00\x00\xf7\x11\x02\x00\x00\x00\x00\x00\x10\x12\x02\x00\x00\x00\x00\x00\x11\x12\x02\x00\x00\x00\x00\x00'
+    b'\x13\x12\x02\x00\x00\x00\x00\x00\x91\x12\x02\x00\x00\x00\x00\x00\xbc\x12\x02\x00\x00\x00\x00\x00\xdf\x12\x02\x00\x00\x00\x00\x00\xe0\x12\x02\x00\x00\x00\x00\x007\x13\x02\x00\x00\x00\x00\x008\x13\x02\x00\x00\x00\x00\x009\x13\x02\x00\x00\x00\x00\x00V\x13\x02\x00\x00\x00\x00\x00W\x13\x02\x00\x00\x00\x00\x00\x18\x14\x02\x00\x00\x00\x00\x00@\x14\x02\x00\x00\x00\x00\x00'
+    b'j\x14\x02\x00\x00\x00\x00\x00k\x14\x02\x00\x00\x00\x00\x00\xca\x14\x02\x00\x00\x00\x00\x00\xcb\x14\x02\x00\x00\x00\x00\x00\xcc\x14\x02\x00\x00\x00\x00\x00\xcd\x14\x02\x00\x00\x00\x00\x00\xce\x14\x02\x00\x00\x00\x00\x00\x11\x15\x02\x00\x00\x00\x00\x00f\x15\x02\x00\x00\x00\x00\x00g\x15\x02\x00\x00\x00\x00\x00h\x15\x02\x00\x00\x00\x00\x00\xa5\x15\x02\x00\x00\x00\x00\x00'
+    b'\xa6\x15\x02\x00\x00\x00\x00\x00\xa7\x15\x02\x00\x00\x00\x00\x00\xc9\x15\x02\x00\x00\x00\x00\x00\xca\x15\x02\x00\x00\x00\x00\x00\xcb\x15\x02\x00\x00\x00\x00\x00\xcc\x15\x02\x00\x00\x00\x00\x00\xcd\x15\x02\x00\x00\x00\x00\x00\xce\x15\x02\x00\x00\x00\x00\x00\xcf\x15\x02\x00\x00\x00\x00\x00\xd0\x15\x02\x00\x00\x00\x00\x00\xd1\x15\x02\x00\x00\x00\x00\x00\xe7\x15\x02\x00\x00\x00\x00\x00'
+    b'\xea\x15\x02\x00\x00\x00\x00\x00\xeb\x15\x02\x00\x00\x00\x00\x005\x16\x02\x00\x00\x00\x00\x006\x16\x02\x00\x00\x00\x00\x007\x16\x02\x00\x00\x00\x00\x00?\x16\x02\x00\x00\x00\x00\x00A\x16\x02\x00\x00\x00\x00\x00B\x16\x02\x00\x00\x00\x00\x00C\x16\x02\x00\x00\x00\x00\x00\\\x16\x02\x00\x00\x00\x00\x00\x83\x16\x02\x00\x00\x00\x00\x00\xb2\x16\x02\x00\x00\x00\x00\x00'
+    b'\xb3\x16\x02\x00\x00\x00\x00\x00\xb4\x16\x02\x00\x00\x00\x00\x00\xb7\x16\x02\x00\x00\x00\x00\x00\xb8\x16\x02\x00\x00\x00\x00\x00\xb9\x16\x02\x00\x00\x00\x00\x00\xcd\x16\x02\x00\x00\x00\x00\x00\xf5\x16\x02\x00\x00\x00\x00\x00\xf6\x16\x02\x00\x00\x00\x00\x00\xf8\x16\x02\x00\x00\x00\x00\x00\xf9\x16\x02\x00\x00\x00\x00\x00\xfa\x16\x02\x00\x00\x00\x00\x00\xfb\x16\x02\x00\x00\x00\x00\x00'
+    b'\x03\x17\x02\x00\x00\x00\x00\x00\x07\x17\x02\x00\x00\x00\x00\x00\x08\x17\x02\x00\x00\x00\x00\x00\t\x17\x02\x00\x00\x00\x00\x00O\x17\x02\x00\x00\x00\x00\x00P\x17\x02\x00\x00\x00\x00\x00o\x17\x02\x00\x00\x00\x00\x00p\x17\x02\x00\x00\x00\x00\x00q\x17\x02\x00\x00\x00\x00\x00r\x17\x02\x00\x00\x00\x00\x00s\x17\x02\x00\x00\x00\x00\x00w\x17\x02\x00\x00\x00\x00\x00'
+    b'x\x17\x02\x00\x00\x00\x00\x00y\x17\x02\x00\x00\x00\x00\x00z\x17\x02\x00\x00\x00\x00\x00{\x17\x02\x00\x00\x00\x00\x00|\x17\x02\x00\x00\x00\x00\x00\x8f\x17\x02\x00\x00\x00\x00\x00\x90\x17\x02\x00\x00\x00\x00\x00\xd4\x17\x02\x00\x00\x00\x00\x00\xd5\x17\x02\x00\x00\x00\x00\x00\xd6\x17\x02\x00\x00\x00\x00\x00\xd7\x17\x02\x00\x00\x00\x00\x00/\x18\x02\x00\x00\x00\x00\x00'
+    b'Q\x18\x02\x00\x00\x00\x00\x00T\x18\x02\x00\x00\x00\x00\x00\xf0\x18\x02\x00\x00\x00\x00\x00X\x19\x02\x00\x00\x00\x00\x00\xb1\x19\x02\x00\x00\x00\x00\x00\xfa\x19\x02\x00\x00\x00\x00\x00F\x1a\x02\x00\x00\x00\x00\x00G\x1a\x02\x00\x00\x00\x00\x00\xb3\x1a\x02\x00\x00\x00\x00\x00\xb4\x1a\x02\x00\x00\x00\x00\x00\x03\x1c\x02\x00\x00\x00\x00\x00!\x1c\x02\x00\x00\x00\x00\x00'
+    b'"\x1c\x02\x00\x00\x00\x00\x00#\x1c\x02\x00\x00\x00\x00\x00$\x1c\x02\x00\x00\x00\x00\x00%\x1c\x02\x00\x00\x00\x00\x00&\x1c\x02\x00\x00\x00\x00\x001\x1c\x02\x00\x00\x00\x00\x002\x1c\x02\x00\x00\x00\x00\x003\x1c\x02\x00\x00\x00\x00\x004\x1c\x02\x00\x00\x00\x00\x00V!\x02\x00\x00\x00\x00\x00[!\x02\x00\x00\x00\x00\x00]!\x02\x00\x00\x00\x00\x00'
+    b'^!\x02\x00\x00\x00\x00\x00\x86"\x02\x00\x00\x00\x00\x00\xa9"\x02\x00\x00\x00\x00\x00\xaf"\x02\x00\x00\x00\x00\x00A$\x02\x00\x00\x00\x00\x00B$\x02\x00\x00\x00\x00\x00C$\x02\x00\x00\x00\x00\x00D$\x02\x00\x00\x00\x00\x00a$\x02\x00\x00\x00\x00\x00\xbf%\x02\x00\x00\x00\x00\x00\xd2%\x02\x00\x00\x00\x00\x00\xd7%\x02\x00\x00\x00\x00\x00'
+    b"\xde%\x02\x00\x00\x00\x00\x00\xdf%\x02\x00\x00\x00\x00\x00-&\x02\x00\x00\x00\x00\x00}'\x02\x00\x00\x00\x00\x00~'\x02\x00\x00\x00\x00\x00\xf9'\x02\x00\x00\x00\x00\x00\xfa'\x02\x00\x00\x00\x00\x00\xfb'\x02\x00\x00\x00\x00\x00\xfc'\x02\x00\x00\x00\x00\x00\xfd'\x02\x00\x00\x00\x00\x00\xfe'\x02\x00\x00\x00\x00\x00c(\x02\x00\x00\x00\x00\x00"
+    b'\x8a(\x02\x00\x00\x00\x00\x00\x8b(\x02\x00\x00\x00\x00\x00\xe9(\x02\x00\x00\x00\x00\x00\xf6(\x02\x00\x00\x00\x00\x00\xfd(\x02\x00\x00\x00\x00\x00\\)\x02\x00\x00\x00\x00\x00g)\x02\x00\x00\x00\x00\x00h)\x02\x00\x00\x00\x00\x00~*\x02\x00\x00\x00\x00\x00\x8a*\x02\x00\x00\x00\x00\x00\x8b*\x02\x00\x00\x00\x00\x00\x8c*\x02\x00\x00\x00\x00\x00'
+    b"\x8d*\x02\x00\x00\x00\x00\x00\xdd*\x02\x00\x00\x00\x00\x00\xfb*\x02\x00\x00\x00\x00\x00\x0e+\x02\x00\x00\x00\x00\x00\x0f+\x02\x00\x00\x00\x00\x00\x10+\x02\x00\x00\x00\x00\x00\x15+\x02\x00\x00\x00\x00\x00\x16+\x02\x00\x00\x00\x00\x00%+\x02\x00\x00\x00\x00\x00&+\x02\x00\x00\x00\x00\x00'+\x02\x00\x00\x00\x00\x00(+\x02\x00\x00\x00\x00\x00"
+    b'/+\x02\x00\x00\x00\x00\x000+\x02\x00\x00\x00\x00\x003+\x02\x00\x00\x00\x00\x004+\x02\x00\x00\x00\x00\x005+\x02\x00\x00\x00\x00\x006+\x02\x00\x00\x00\x00\x00\x8b+\x02\x00\x00\x00\x00\x00\xa0+\x02\x00\x00\x00\x00\x00\xa1+\x02\x00\x00\x00\x00\x00\xa2+\x02\x00\x00\x00\x00\x00\xa3+\x02\x00\x00\x00\x00\x00\xd2-\x02\x00\x00\x00\x00\x00'
+    b'\xd3-\x02\x00\x00\x00\x00\x00>/\x02\x00\x00\x00\x00\x00\x93/\x02\x00\x00\x00\x00\x00\xa7/\x02\x00\x00\x00\x00\x00\xb4/\x02\x00\x00\x00\x00\x00\xba/\x02\x00\x00\x00\x00\x00\xc0/\x02\x00\x00\x00\x00\x00\xe3/\x02\x00\x00\x00\x00\x00\xe4/\x02\x00\x00\x00\x00\x00\xe5/\x02\x00\x00\x00\x00\x00\xf2/\x02\x00\x00\x00\x00\x00\xf3/\x02\x00\x00\x00\x00\x00'
+    b'\xf4/\x02\x00\x00\x00\x00\x00\x160\x02\x00\x00\x00\x00\x00\x170\x02\x00\x00\x00\x00\x00\x800\x02\x00\x00\x00\x00\x00\xa00\x02\x00\x00\x00\x00\x00\xa10\x02\x00\x00\x00\x00\x00\xb20\x02\x00\x00\x00\x00\x00\xde0\x02\x00\x00\x00\x00\x00\xe20\x02\x00\x00\x00\x00\x00\xe40\x02\x00\x00\x00\x00\x00\xe50\x02\x00\x00\x00\x00\x00\xe70\x02\x00\x00\x00\x00\x00'
+    b'\xe90\x02\x00\x00\x00\x00\x00\xeb0\x02\x00\x00\x00\x00\x00\x0b1\x02\x00\x00\x00\x00\x00?1\x02\x00\x00\x00\x00\x00@1\x02\x00\x00\x00\x00\x00I1\x02\x00\x00\x00\x00\x0032\x02\x00\x00\x00\x00\x00h2\x02\x00\x00\x00\x00\x00i2\x02\x00\x00\x00\x00\x00j2\x02\x00\x00\x00\x00\x00=3\x02\x00\x00\x00\x00\x00S3\x02\x00\x00\x00\x00\x00'
+    b'\x9a3\x02\x00\x00\x00\x00\x00\x9b3\x02\x00\x00\x00\x00\x00\xdc3\x02\x00\x00\x00\x00\x00\xdd3\x02\x00\x00\x00\x00\x00\xe03\x02\x00\x00\x00\x00\x00\xe13\x02\x00\x00\x00\x00\x00\x1a5\x02\x00\x00\x00\x00\x00\x1b5\x02\x00\x00\x00\x00\x00\x1c5\x02\x00\x00\x00\x00\x00\x1d5\x02\x00\x00\x00\x00\x00\x1e5\x02\x00\x00\x00\x00\x00@6\x02\x00\x00\x00\x00\x00'
+    b'o6\x02\x00\x00\x00\x00\x00x6\x02\x00\x00\x00\x00\x00z6\x02\x00\x00\x00\x00\x00\x966\x02\x00\x00\x00\x00\x00\x976\x02\x00\x00\x00\x00\x00\x986\x02\x00\x00\x00\x00\x00\x996\x02\x00\x00\x00\x00\x00\xa66\x02\x00\x00\x00\x00\x00\xb16\x02\x00\x00\x00\x00\x00\xb26\x02\x00\x00\x00\x00\x00\xb36\x02\x00\x00\x00\x00\x00F7\x02\x00\x00\x00\x00\x00'
+    b'\xc17\x02\x00\x00\x00\x00\x00\xc27\x02\x00\x00\x00\x00\x00V8\x02\x00\x00\x00\x00\x00o8\x02\x00\x00\x00\x00\x00r8\x02\x00\x00\x00\x00\x00s8\x02\x00\x00\x00\x00\x00t8\x02\x00\x00\x00\x00\x00u8\x02\x00\x00\x00\x00\x00x8\x02\x00\x00\x00\x00\x00z8\x02\x00\x00\x00\x00\x00{8\x02\x00\x00\x00\x00\x00|8\x02\x00\x00\x00\x00\x00'
+    b'\x7f8\x02\x00\x00\x00\x00\x00\x808\x02\x00\x00\x00\x00\x00\x8f8\x02\x00\x00\x00\x00\x00\xbc8\x02\x00\x00\x00\x00\x00\xd38\x02\x00\x00\x00\x00\x00\xd48\x02\x00\x00\x00\x00\x00\x189\x02\x00\x00\x00\x00\x00\x1d9\x02\x00\x00\x00\x00\x00.9\x02\x00\x00\x00\x00\x00/9\x02\x00\x00\x00\x00\x00\xdc9\x02\x00\x00\x00\x00\x00\xdd9\x02\x00\x00\x00\x00\x00'
+    b'\xde9\x02\x00\x00\x00\x00\x00\xdf9\x02\x00\x00\x00\x00\x00\xe09\x02\x00\x00\x00\x00\x00B:\x02\x00\x00\x00\x00\x00X:\x02\x00\x00\x00\x00\x00\xf4;\x02\x00\x00\x00\x00\x00$<\x02\x00\x00\x00\x00\x00\xe6<\x02\x00\x00\x00\x00\x00\xe7<\x02\x00\x00\x00\x00\x00\xba=\x02\x00\x00\x00\x00\x00\xbb=\x02\x00\x00\x00\x00\x00\xbc=\x02\x00\x00\x00\x00\x00'
+    b'\xbd=\x02\x00\x00\x00\x00\x00\xc0=\x02\x00\x00\x00\x00\x00\xc1=\x02\x00\x00\x00\x00\x00\xc4=\x02\x00\x00\x00\x00\x00\xc5=\x02\x00\x00\x00\x00\x00\xc6=\x02\x00\x00\x00\x00\x00\xc7=\x02\x00\x00\x00\x00\x00\xc8=\x02\x00\x00\x00\x00\x00\xc9=\x02\x00\x00\x00\x00\x00I?\x02\x00\x00\x00\x00\x00J?\x02\x00\x00\x00\x00\x00K?\x02\x00\x00\x00\x00\x00'
+    b'\xaa?\x02\x00\x00\x00\x00\x00\xe3@\x02\x00\x00\x00\x00\x00\xe5@\x02\x00\x00\x00\x00\x00\xe6@\x02\x00\x00\x00\x00\x00\xe9@\x02\x00\x00\x00\x00\x00@A\x02\x00\x00\x00\x00\x00\x97A\x02\x00\x00\x00\x00\x00\xa4A\x02\x00\x00\x00\x00\x00\xa9B\x02\x00\x00\x00\x00\x00\x04C\x02\x00\x00\x00\x00\x00\x11C\x02\x00\x00\x00\x00\x00\x12C\x02\x00\x00\x00\x00\x00'
+    b'\x13C\x02\x00\x00\x00\x00\x00\x14C\x02\x00\x00\x00\x00\x00\x15C\x02\x00\x00\x00\x00\x00\x16C\x02\x00\x00\x00\x00\x00\xa3C\x02\x00\x00\x00\x00\x00\xd3D\x02\x00\x00\x00\x00\x00\xd4D\x02\x00\x00\x00\x00\x00\xd5D\x02\x00\x00\x00\x00\x00\xd6D\x02\x00\x00\x00\x00\x00\x97G\x02\x00\x00\x00\x00\x00\x98G\x02\x00\x00\x00\x00\x00\xafG\x02\x00\x00\x00\x00\x00'
+    b'\xb3G\x02\x00\x00\x00\x00\x00\xb4G\x02\x00\x00\x00\x00\x00\xcbG\x02\x00\x00\x00\x00\x00\xceG\x02\x00\x00\x00\x00\x00 H\x02\x00\x00\x00\x00\x00>H\x02\x00\x00\x00\x00\x00?H\x02\x00\x00\x00\x00\x00@H\x02\x00\x00\x00\x00\x00MH\x02\x00\x00\x00\x00\x00yH\x02\x00\x00\x00\x00\x00{H\x02\x00\x00\x00\x00\x00\xb1H\x02\x00\x00\x00\x00\x00'
+    b'\xdbI\x02\x00\x00\x00\x00\x00\xdcI\x02\x00\x00\x00\x00\x00\xdfI\x02\x00\x00\x00\x00\x00\xe1I\x02\x00\x00\x00\x00\x00\x07J\x02\x00\x00\x00\x00\x00\x14J\x02\x00\x00\x00\x00\x00\x15J\x02\x00\x00\x00\x00\x00\x83J\x02\x00\x00\x00\x00\x00\x8cJ\x02\x00\x00\x00\x00\x00\x8eJ\x02\x00\x00\x00\x00\x00\x8fJ\x02\x00\x00\x00\x00\x00\x90J\x02\x00\x00\x00\x00\x00'
+    b'\x91J\x02\x00\x00\x00\x00\x00\x92J\x02\x00\x00\x00\x00\x00\x93J\x02\x00\x00\x00\x00\x00\xa1J\x02\x00\x00\x00\x00\x00\xd4J\x02\x00\x00\x00\x00\x00\xe0J\x02\x00\x00\x00\x00\x00\x17K\x02\x00\x00\x00\x00\x00\x7fK\x02\x00\x00\x00\x00\x00\x81K\x02\x00\x00\x00\x00\x00\x87K\x02\x00\x00\x00\x00\x00\x9dK\x02\x00\x00\x00\x00\x00\xcbK\x02\x00\x00\x00\x00\x00'
+    b'\x07L\x02\x00\x00\x00\x00\x00\x08L\x02\x00\x00\x00\x00\x00\tL\x02\x00\x00\x00\x00\x00\nL\x02\x00\x00\x00\x00\x00\x0cL\x02\x00\x00\x00\x00\x00*L\x02\x00\x00\x00\x00\x006L\x02\x00\x00\x00\x00\x007L\x02\x00\x00\x00\x00\x009L\x02\x00\x00\x00\x00\x00:L\x02\x00\x00\x00\x00\x00;L\x02\x00\x00\x00\x00\x00?L\x02\x00\x00\x00\x00\x00'
+    b'@L\x02\x00\x00\x00\x00\x00AL\x02\x00\x00\x00\x00\x00FL\x02\x00\x00\x00\x00\x00GL\x02\x00\x00\x00\x00\x00HL\x02\x00\x00\x00\x00\x00LL\x02\x00\x00\x00\x00\x00ML\x02\x00\x00\x00\x00\x00NL\x02\x00\x00\x00\x00\x00RL\x02\x00\x00\x00\x00\x00SL\x02\x00\x00\x00\x00\x00TL\x02\x00\x00\x00\x00\x00XL\x02\x00\x00\x00\x00\x00'
+    b'YL\x02\x00\x00\x00\x00\x00ZL\x02\x00\x00\x00\x00\x00^L\x02\x00\x00\x00\x00\x00_L\x02\x00\x00\x00\x00\x00`L\x02\x00\x00\x00\x00\x00iL\x02\x00\x00\x00\x00\x00jL\x02\x00\x00\x00\x00\x00kL\x02\x00\x00\x00\x00\x00nL\x02\x00\x00\x00\x00\x00pL\x02\x00\x00\x00\x00\x00qL\x02\x00\x00\x00\x00\x00xL\x02\x00\x00\x00\x00\x00'
+    b'yL\x02\x00\x00\x00\x00\x00zL\x02\x00\x00\x00\x00\x00\x86L\x02\x00\x00\x00\x00\x00\x87L\x02\x00\x00\x00\x00\x00\x88L\x02\x00\x00\x00\x00\x00\x89L\x02\x00\x00\x00\x00\x00\x8aL\x02\x00\x00\x00\x00\x00\x8bL\x02\x00\x00\x00\x00\x00\x8cL\x02\x00\x00\x00\x00\x00\x8dL\x02\x00\x00\x00\x00\x00\x8eL\x02\x00\x00\x00\x00\x00\xdcL\x02\x00\x00\x00\x00\x00'
+    b'\xddL\x02\x00\x00\x00\x00\x00\xe3L\x02\x00\x00\x00\x00\x00\x19M\x02\x00\x00\x00\x00\x00\x86M\x02\x00\x00\x00\x00\x00\xd7M\x02\x00\x00\x00\x00\x00\x10N\x02\x00\x00\x00\x00\x00\x11N\x02\x00\x00\x00\x00\x00\x12N\x02\x00\x00\x00\x00\x00+N\x02\x00\x00\x00\x00\x00,N\x02\x00\x00\x00\x00\x00-N\x02\x00\x00\x00\x00\x00\x87N\x02\x00\x00\x00\x00\x00'
+    b'\x89N\x02\x00\x00\x00\x00\x00\x8aN\x02\x00\x00\x00\x00\x00\x99N\x02\x00\x00\x00\x00\x00\xb2N\x02\x00\x00\x00\x00\x00\xc5N\x02\x00\x00\x00\x00\x00\xe2N\x02\x00\x00\x00\x00\x00\x02O\x02\x00\x00\x00\x00\x00\x07O\x02\x00\x00\x00\x00\x00bO\x02\x00\x00\x00\x00\x00}O\x02\x00\x00\x00\x00\x00\x9aO\x02\x00\x00\x00\x00\x00\x9bO\x02\x00\x00\x00\x00\x00'
+    b'\xa3O\x02\x00\x00\x00\x00\x00\xd8O\x02\x00\x00\x00\x00\x00\x12P\x02\x00\x00\x00\x00\x00\xd3P\x02\x00\x00\x00\x00\x00\xd4P\x02\x00\x00\x00\x00\x00\xdfP\x02\x00\x00\x00\x00\x00fQ\x02\x00\x00\x00\x00\x00gQ\x02\x00\x00\x00\x00\x00sQ\x02\x00\x00\x00\x00\x00tQ\x02\x00\x00\x00\x00\x00{R\x02\x00\x00\x00\x00\x00|R\x02\x00\x00\x00\x00\x00'
+    b'\xceR\x02\x00\x00\x00\x00\x00\xd0R\x02\x00\x00\x00\x00\x00\xd1R\x02\x00\x00\x00\x00\x00\xd8R\x02\x00\x00\x00\x00\x00\xd9R\x02\x00\x00\x00\x00\x00\xdaR\x02\x00\x00\x00\x00\x00\xdbR\x02\x00\x00\x00\x00\x00\xdcR\x02\x00\x00\x00\x00\x00\xddR\x02\x00\x00\x00\x00\x00\xdeR\x02\x00\x00\x00\x00\x00\xdfR\x02\x00\x00\x00\x00\x00\xe0R\x02\x00\x00\x00\x00\x00'
+    b'\xe1R\x02\x00\x00\x00\x00\x00\xe2R\x02\x00\x00\x00\x00\x00\xe3R\x02\x00\x00\x00\x00\x00\xe4R\x02\x00\x00\x00\x00\x00\xe5R\x02\x00\x00\x00\x00\x00\xe6R\x02\x00\x00\x00\x00\x00\xe7R\x02\x00\x00\x00\x00\x00\xe8R\x02\x00\x00\x00\x00\x00\xe9R\x02\x00\x00\x00\x00\x00%S\x02\x00\x00\x00\x00\x009S\x02\x00\x00\x00\x00\x00:S\x02\x00\x00\x00\x00\x00'
+    b';S\x02\x00\x00\x00\x00\x00<S\x02\x00\x00\x00\x00\x00?S\x02\x00\x00\x00\x00\x00@S\x02\x00\x00\x00\x00\x00AS\x02\x00\x00\x00\x00\x00BS\x02\x00\x00\x00\x00\x00[S\x02\x00\x00\x00\x00\x00\xb6S\x02\x00\x00\x00\x00\x00\xb7S\x02\x00\x00\x00\x00\x00\xb8S\x02\x00\x00\x00\x00\x00\xb9S\x02\x00\x00\x00\x00\x00\xbaS\x02\x00\x00\x00\x00\x00'
+    b'\xbbS\x02\x00\x00\x00\x00\x00\xd5S\x02\x00\x00\x00\x00\x00\xe0S\x02\x00\x00\x00\x00\x00\xe1S\x02\x00\x00\x00\x00\x00\xe2S\x02\x00\x00\x00\x00\x00*T\x02\x00\x00\x00\x00\x00\xacT\x02\x00\x00\x00\x00\x00\xfdT\x02\x00\x00\x00\x00\x00*U\x02\x00\x00\x00\x00\x000U\x02\x00\x00\x00\x00\x00\xb9U\x02\x00\x00\x00\x00\x00\xbaU\x02\x00\x00\x00\x00\x00'
+    b'\xbbU\x02\x00\x00\x00\x00\x00\xbcU\x02\x00\x00\x00\x00\x00\xbdU\x02\x00\x00\x00\x00\x00\xbeU\x02\x00\x00\x00\x00\x00\xe6U\x02\x00\x00\x00\x00\x00\xe7U\x02\x00\x00\x00\x00\x00\x03V\x02\x00\x00\x00\x00\x00SV\x02\x00\x00\x00\x00\x00TV\x02\x00\x00\x00\x00\x00\xdaV\x02\x00\x00\x00\x00\x00\xf9V\x02\x00\x00\x00\x00\x005W\x02\x00\x00\x00\x00\x00'
+    b'8W\x02\x00\x00\x00\x00\x00<W\x02\x00\x00\x00\x00\x00@W\x02\x00\x00\x00\x00\x00\x8eW\x02\x00\x00\x00\x00\x00\xbbW\x02\x00\x00\x00\x00\x00\xbcW\x02\x00\x00\x00\x00\x00nX\x02\x00\x00\x00\x00\x00\xd0X\x02\x00\x00\x00\x00\x00\xe2X\x02\x00\x00\x00\x00\x00-Y\x02\x00\x00\x00\x00\x00:Z\x02\x00\x00\x00\x00\x00;Z\x02\x00\x00\x00\x00\x00'
+    b'<Z\x02\x00\x00\x00\x00\x00=Z\x02\x00\x00\x00\x00\x00XZ\x02\x00\x00\x00\x00\x00\x80Z\x02\x00\x00\x00\x00\x00\x84Z\x02\x00\x00\x00\x00\x00\xa3Z\x02\x00\x00\x00\x00\x00\xa4Z\x02\x00\x00\x00\x00\x00\xc5Z\x02\x00\x00\x00\x00\x00\xc7Z\x02\x00\x00\x00\x00\x00\xc9Z\x02\x00\x00\x00\x00\x00\xd7Z\x02\x00\x00\x00\x00\x00\x14[\x02\x00\x00\x00\x00\x00'
+    b"\x15[\x02\x00\x00\x00\x00\x00\x18[\x02\x00\x00\x00\x00\x00\x1a[\x02\x00\x00\x00\x00\x00\x1e[\x02\x00\x00\x00\x00\x00'[\x02\x00\x00\x00\x00\x00([\x02\x00\x00\x00\x00\x00\\[\x02\x00\x00\x00\x00\x00\x7f[\x02\x00\x00\x00\x00\x00\xb7[\x02\x00\x00\x00\x00\x00\xd0[\x02\x00\x00\x00\x00\x00\xe8[\x02\x00\x00\x00\x00\x00\xf6[\x02\x00\x00\x00\x00\x00"
+    b'\xf7[\x02\x00\x00\x00\x00\x00\xf9[\x02\x00\x00\x00\x00\x00\xfa[\x02\x00\x00\x00\x00\x00\xfb[\x02\x00\x00\x00\x00\x00U\\\x02\x00\x00\x00\x00\x00Z\\\x02\x00\x00\x00\x00\x00b\\\x02\x00\x00\x00\x00\x00\x8e\\\x02\x00\x00\x00\x00\x00\x8f\\\x02\x00\x00\x00\x00\x00\x90\\\x02\x00\x00\x00\x00\x00\xb9]\x02\x00\x00\x00\x00\x00\xd1]\x02\x00\x00\x00\x00\x00'
+    b'\xde]\x02\x00\x00\x00\x00\x00\xdf]\x02\x00\x00\x00\x00\x00\xe0]\x02\x00\x00\x00\x00\x00\xe3]\x02\x00\x00\x00\x00\x00\x06^\x02\x00\x00\x00\x00\x00T_\x02\x00\x00\x00\x00\x00U_\x02\x00\x00\x00\x00\x00V_\x02\x00\x00\x00\x00\x00W_\x02\x00\x00\x00\x00\x00X_\x02\x00\x00\x00\x00\x00__\x02\x00\x00\x00\x00\x00\x8a_\x02\x00\x00\x00\x00\x00'
+    b'\x06`\x02\x00\x00\x00\x00\x00B`\x02\x00\x00\x00\x00\x00Z`\x02\x00\x00\x00\x00\x00[`\x02\x00\x00\x00\x00\x00\x83`\x02\x00\x00\x00\x00\x00\x84`\x02\x00\x00\x00\x00\x00\x85`\x02\x00\x00\x00\x00\x00\x9c`\x02\x00\x00\x00\x00\x00\xbb`\x02\x00\x00\x00\x00\x00\xcf`\x02\x00\x00\x00\x00\x00\x04a\x02\x00\x00\x00\x00\x00fa\x02\x00\x00\x00\x00\x00'
+    b'ka\x02\x00\x00\x00\x00\x00\xcaa\x02\x00\x00\x00\x00\x00\x11b\x02\x00\x00\x00\x00\x00Cb\x02\x00\x00\x00\x00\x00Db\x02\x00\x00\x00\x00\x00!c\x02\x00\x00\x00\x00\x00vc\x02\x00\x00\x00\x00\x00zc\x02\x00\x00\x00\x00\x00\xd3c\x02\x00\x00\x00\x00\x003d\x02\x00\x00\x00\x00\x004d\x02\x00\x00\x00\x00\x005d\x02\x00\x00\x00\x00\x00'
+    b'6d\x02\x00\x00\x00\x00\x00Cd\x02\x00\x00\x00\x00\x00Dd\x02\x00\x00\x00\x00\x00Ed\x02\x00\x00\x00\x00\x00Fd\x02\x00\x00\x00\x00\x00Gd\x02\x00\x00\x00\x00\x00Hd\x02\x00\x00\x00\x00\x00Ud\x02\x00\x00\x00\x00\x00Zd\x02\x00\x00\x00\x00\x00\\d\x02\x00\x00\x00\x00\x00ad\x02\x00\x00\x00\x00\x00cd\x02\x00\x00\x00\x00\x00'
+    b'fd\x02\x00\x00\x00\x00\x00|d\x02\x00\x00\x00\x00\x00}d\x02\x00\x00\x00\x00\x00\x0fe\x02\x00\x00\x00\x00\x005e\x02\x00\x00\x00\x00\x006e\x02\x00\x00\x00\x00\x009e\x02\x00\x00\x00\x00\x00`e\x02\x00\x00\x00\x00\x00\xefg\x02\x00\x00\x00\x00\x00Gi\x02\x00\x00\x00\x00\x00Hi\x02\x00\x00\x00\x00\x00\xadi\x02\x00\x00\x00\x00\x00'
+    b'\x1am\x02\x00\x00\x00\x00\x00\x1bm\x02\x00\x00\x00\x00\x00\x1cm\x02\x00\x00\x00\x00\x00\x1dm\x02\x00\x00\x00\x00\x00\x1em\x02\x00\x00\x00\x00\x00Rn\x02\x00\x00\x00\x00\x00\x9cn\x02\x00\x00\x00\x00\x00\x9dn\x02\x00\x00\x00\x00\x00\ro\x02\x00\x00\x00\x00\x00\x0eo\x02\x00\x00\x00\x00\x00Tq\x02\x00\x00\x00\x00\x00\x92q\x02\x00\x00\x00\x00\x00'
+    b'\x94q\x02\x00\x00\x00\x00\x00\x95q\x02\x00\x00\x00\x00\x00\x96q\x02\x00\x00\x00\x00\x00\x97q\x02\x00\x00\x00\x00\x00\x98q\x02\x00\x00\x00\x00\x00\xa9q\x02\x00\x00\x00\x00\x00\xacq\x02\x00\x00\x00\x00\x00\xaeq\x02\x00\x00\x00\x00\x00\xafq\x02\x00\x00\x00\x00\x00\xb0q\x02\x00\x00\x00\x00\x00\xefq\x02\x00\x00\x00\x00\x00\x01r\x02\x00\x00\x00\x00\x00'
+    b'\x02r\x02\x00\x00\x00\x00\x00ar\x02\x00\x00\x00\x00\x00br\x02\x00\x00\x00\x00\x00.s\x02\x00\x00\x00\x00\x001s\x02\x00\x00\x00\x00\x00Gs\x02\x00\x00\x00\x00\x00Hs\x02\x00\x00\x00\x00\x00\x8cs\x02\x00\x00\x00\x00\x00\x8ds\x02\x00\x00\x00\x00\x00\x8es\x02\x00\x00\x00\x00\x00\xfas\x02\x00\x00\x00\x00\x00zt\x02\x00\x00\x00\x00\x00'
+    b'|t\x02\x00\x00\x00\x00\x00}t\x02\x00\x00\x00\x00\x00\x8et\x02\x00\x00\x00\x00\x00\x94t\x02\x00\x00\x00\x00\x00\x95t\x02\x00\x00\x00\x00\x00\x96t\x02\x00\x00\x00\x00\x00\x97t\x02\x00\x00\x00\x00\x00\xc5t\x02\x00\x00\x00\x00\x00\xc7t\x02\x00\x00\x00\x00\x00\xc8t\x02\x00\x00\x00\x00\x00\xc9t\x02\x00\x00\x00\x00\x00^u\x02\x00\x00\x00\x00\x00'
+    b'\xc6u\x02\x00\x00\x00\x00\x00\xc7u\x02\x00\x00\x00\x00\x00\xc8u\x02\x00\x00\x00\x00\x00\xc9u\x02\x00\x00\x00\x00\x00\xcau\x02\x00\x00\x00\x00\x00\xf6u\x02\x00\x00\x00\x00\x00\xc7v\x02\x00\x00\x00\x00\x00\xc8v\x02\x00\x00\x00\x00\x00\xc9v\x02\x00\x00\x00\x00\x00\x86w\x02\x00\x00\x00\x00\x00\x88w\x02\x00\x00\x00\x00\x00\x89w\x02\x00\x00\x00\x00\x00'
+    b'\x8aw\x02\x00\x00\x00\x00\x00\x8cw\x02\x00\x00\x00\x00\x00\xb5w\x02\x00\x00\x00\x00\x00\xb7w\x02\x00\x00\x00\x00\x00\xb8w\x02\x00\x00\x00\x00\x00\xbdw\x02\x00\x00\x00\x00\x00\xbfw\x02\x00\x00\x00\x00\x00\xc1w\x02\x00\x00\x00\x00\x00\xc2w\x02\x00\x00\x00\x00\x00\xc6w\x02\x00\x00\x00\x00\x00\xc7w\x02\x00\x00\x00\x00\x00\xc9w\x02\x00\x00\x00\x00\x00'
+    b'\xccw\x02\x00\x00\x00\x00\x00\xcew\x02\x00\x00\x00\x00\x00\xcfw\x02\x00\x00\x00\x00\x00\xd2w\x02\x00\x00\x00\x00\x00\xd8w\x02\x00\x00\x00\x00\x00\xdaw\x02\x00\x00\x00\x00\x00\xdbw\x02\x00\x00\x00\x00\x00\xddw\x02\x00\x00\x00\x00\x00\xdfw\x02\x00\x00\x00\x00\x00\xe1w\x02\x00\x00\x00\x00\x00\xe2w\x02\x00\x00\x00\x00\x00\xe4w\x02\x00\x00\x00\x00\x00'
+    b'\xe6w\x02\x00\x00\x00\x00\x00\xe8w\x02\x00\x00\x00\x00\x00\xe9w\x02\x00\x00\x00\x00\x00\xfdw\x02\x00\x00\x00\x00\x002x\x02\x00\x00\x00\x00\x003x\x02\x00\x00\x00\x00\x00\xc4x\x02\x00\x00\x00\x00\x00\xe7x\x02\x00\x00\x00\x00\x00\xf4x\x02\x00\x00\x00\x00\x00\x1ez\x02\x00\x00\x00\x00\x00\x1fz\x02\x00\x00\x00\x00\x00 z\x02\x00\x00\x00\x00\x00'
+    b'!z\x02\x00\x00\x00\x00\x00\x86z\x02\x00\x00\x00\x00\x00\x87z\x02\x00\x00\x00\x00\x00\x88z\x02\x00\x00\x00\x00\x00\x9az\x02\x00\x00\x00\x00\x00G{\x02\x00\x00\x00\x00\x00H{\x02\x00\x00\x00\x00\x00\x8e{\x02\x00\x00\x00\x00\x00\x8f{\x02\x00\x00\x00\x00\x00\x91{\x02\x00\x00\x00\x00\x00\xa8{\x02\x00\x00\x00\x00\x00\xaa{\x02\x00\x00\x00\x00\x00'
+    b'\x1c|\x02\x00\x00\x00\x00\x00\xaf|\x02\x00\x00\x00\x00\x00\xf8|\x02\x00\x00\x00\x00\x00\xf9|\x02\x00\x00\x00\x00\x00\xfa|\x02\x00\x00\x00\x00\x00\xfb|\x02\x00\x00\x00\x00\x00\xfc|\x02\x00\x00\x00\x00\x00\xfd|\x02\x00\x00\x00\x00\x00w}\x02\x00\x00\x00\x00\x00\x87}\x02\x00\x00\x00\x00\x00\x88}\x02\x00\x00\x00\x00\x00\x89}\x02\x00\x00\x00\x00\x00'
+    b'\x9f}\x02\x00\x00\x00\x00\x00\xa0}\x02\x00\x00\x00\x00\x00\xa1}\x02\x00\x00\x00\x00\x000~\x02\x00\x00\x00\x00\x006~\x02\x00\x00\x00\x00\x00G~\x02\x00\x00\x00\x00\x00\x8e~\x02\x00\x00\x00\x00\x00\x90~\x02\x00\x00\x00\x00\x00\x91~\x02\x00\x00\x00\x00\x00\x92~\x02\x00\x00\x00\x00\x00\x94~\x02\x00\x00\x00\x00\x00\x11\x7f\x02\x00\x00\x00\x00\x00'
+    b'\x12\x7f\x02\x00\x00\x00\x00\x001\x7f\x02\x00\x00\x00\x00\x002\x7f\x02\x00\x00\x00\x00\x00I\x7f\x02\x00\x00\x00\x00\x00\xe5\x7f\x02\x00\x00\x00\x00\x00Y\x80\x02\x00\x00\x00\x00\x00\xc7\x80\x02\x00\x00\x00\x00\x00\xd7\x80\x02\x00\x00\x00\x00\x00S\x81\x02\x00\x00\x00\x00\x00T\x81\x02\x00\x00\x00\x00\x00\xfb\x81\x02\x00\x00\x00\x00\x00\x14\x82\x02\x00\x00\x00\x00\x00'
+    b'"\x82\x02\x00\x00\x00\x00\x00#\x82\x02\x00\x00\x00\x00\x00\x18\x83\x02\x00\x00\x00\x00\x00\x1a\x83\x02\x00\x00\x00\x00\x00\x1c\x83\x02\x00\x00\x00\x00\x00\x1e\x83\x02\x00\x00\x00\x00\x00C\x83\x02\x00\x00\x00\x00\x00\x81\x83\x02\x00\x00\x00\x00\x00\xff\x84\x02\x00\x00\x00\x00\x00?\x85\x02\x00\x00\x00\x00\x00@\x85\x02\x00\x00\x00\x00\x00g\x85\x02\x00\x00\x00\x00\x00'
+    b'\xee\x85\x02\x00\x00\x00\x00\x00\xf5\x85\x02\x00\x00\x00\x00\x00:\x86\x02\x00\x00\x00\x00\x00T\x86\x02\x00\x00\x00\x00\x00W\x86\x02\x00\x00\x00\x00\x00`\x86\x02\x00\x00\x00\x00\x00w\x86\x02\x00\x00\x00\x00\x00\xe2\x86\x02\x00\x00\x00\x00\x00\xe7\x86\x02\x00\x00\x00\x00\x00\xe8\x86\x02\x00\x00\x00\x00\x005\x87\x02\x00\x00\x00\x00\x00\x8a\x87\x02\x00\x00\x00\x00\x00'
+    b'\xb1\x87\x02\x00\x00\x00\x00\x00\xb3\x87\x02\x00\x00\x00\x00\x00\xb4\x87\x02\x00\x00\x00\x00\x00\xb5\x87\x02\x00\x00\x00\x00\x00\xb6\x87\x02\x00\x00\x00\x00\x00\xb7\x87\x02\x00\x00\x00\x00\x00\xb8\x87\x02\x00\x00\x00\x00\x00\xb9\x87\x02\x00\x00\x00\x00\x00\x1c\x88\x02\x00\x00\x00\x00\x00n\x88\x02\x00\x00\x00\x00\x00\xd9\x88\x02\x00\x00\x00\x00\x00\xdc\x88\x02\x00\x00\x00\x00\x00'
+    b'|\x8b\x02\x00\x00\x00\x00\x00}\x8b\x02\x00\x00\x00\x00\x00~\x8b\x02\x00\x00\x00\x00\x00\x7f\x8b\x02\x00\x00\x00\x00\x00\x80\x8b\x02\x00\x00\x00\x00\x00_\x8c\x02\x00\x00\x00\x00\x00\xcb\x8c\x02\x00\x00\x00\x00\x00\xcc\x8c\x02\x00\x00\x00\x00\x00\xa1\x8f\x02\x00\x00\x00\x00\x00\xd3\x8f\x02\x00\x00\x00\x00\x00\xd4\x8f\x02\x00\x00\x00\x00\x00\xd9\x8f\x02\x00\x00\x00\x00\x00'
+    b'\x1d\x92\x02\x00\x00\x00\x00\x00I\x92\x02\x00\x00\x00\x00\x00\x01\x93\x02\x00\x00\x00\x00\x00\xfb\x93\x02\x00\x00\x00\x00\x00V\x94\x02\x00\x00\x00\x00\x00\x7f\x94\x02\x00\x00\x00\x00\x00l\x96\x02\x00\x00\x00\x00\x00n\x96\x02\x00\x00\x00\x00\x00o\x96\x02\x00\x00\x00\x00\x00\x84\x97\x02\x00\x00\x00\x00\x00\x1e\x98\x02\x00\x00\x00\x00\x00\n\x9b\x02\x00\x00\x00\x00\x00'
+    b'Y\x9b\x02\x00\x00\x00\x00\x00\xaa\x9b\x02\x00\x00\x00\x00\x00\xab\x9b\x02\x00\x00\x00\x00\x00\xf8\x9b\x02\x00\x00\x00\x00\x00\xf9\x9b\x02\x00\x00\x00\x00\x00\xfa\x9b\x02\x00\x00\x00\x00\x00\xfb\x9b\x02\x00\x00\x00\x00\x00\xbb\x9f\x02\x00\x00\x00\x00\x00\xd6\x9f\x02\x00\x00\x00\x00\x00\xe4\x9f\x02\x00\x00\x00\x00\x00i\xa1\x02\x00\x00\x00\x00\x00\x90\xa1\x02\x00\x00\x00\x00\x00'
+    b'\x95\xa2\x02\x00\x00\x00\x00\x00\x96\xa2\x02\x00\x00\x00\x00\x00\xe7\xa2\x02\x00\x00\x00\x00\x00[\xa3\x02\x00\x00\x00\x00\x00\\\xa3\x02\x00\x00\x00\x00\x00\x89\xa3\x02\x00\x00\x00\x00\x00\xa0\xa3\x02\x00\x00\x00\x00\x00\x00\xa5\x02\x00\x00\x00\x00\x00\xec\xa5\x02\x00\x00\x00\x00\x00\xf8\xa5\x02\x00\x00\x00\x00\x00\x82\xa6\x02\x00\x00\x00\x00\x00\x84\xa6\x02\x00\x00\x00\x00\x00'
+    b'\x86\xa6\x02\x00\x00\x00\x00\x00\x87\xa6\x02\x00\x00\x00\x00\x00\x0e\xa7\x02\x00\x00\x00\x00\x00\xac\xa8\x02\x00\x00\x00\x00\x00\xb2\xa8\x02\x00\x00\x00\x00\x00\xb4\xa8\x02\x00\x00\x00\x00\x00\xb5\xa8\x02\x00\x00\x00\x00\x00\xe3\xa8\x02\x00\x00\x00\x00\x00o\xa9\x02\x00\x00\x00\x00\x00p\xa9\x02\x00\x00\x00\x00\x00q\xa9\x02\x00\x00\x00\x00\x00r\xa9\x02\x00\x00\x00\x00\x00'
+    b's\xa9\x02\x00\x00\x00\x00\x00t\xa9\x02\x00\x00\x00\x00\x00\xee\xa9\x02\x00\x00\x00\x00\x00\xef\xa9\x02\x00\x00\x00\x00\x00\xf0\xa9\x02\x00\x00\x00\x00\x00\xf1\xa9\x02\x00\x00\x00\x00\x00\xf2\xa9\x02\x00\x00\x00\x00\x00\xf3\xa9\x02\x00\x00\x00\x00\x00\xf4\xa9\x02\x00\x00\x00\x00\x00\x0b\xaa\x02\x00\x00\x00\x00\x00\x0c\xaa\x02\x00\x00\x00\x00\x00\xed\xaa\x02\x00\x00\x00\x00\x00'
+    b'\xee\xaa\x02\x00\x00\x00\x00\x00\xef\xaa\x02\x00\x00\x00\x00\x00\xf0\xaa\x02\x00\x00\x00\x00\x00\xf1\xaa\x02\x00\x00\x00\x00\x00\xf2\xaa\x02\x00\x00\x00\x00\x00\x07\xab\x02\x00\x00\x00\x00\x00\x08\xab\x02\x00\x00\x00\x00\x00&\xab\x02\x00\x00\x00\x00\x00)\xab\x02\x00\x00\x00\x00\x00:\xab\x02\x00\x00\x00\x00\x00;\xab\x02\x00\x00\x00\x00\x00<\xab\x02\x00\x00\x00\x00\x00'
+    b'?\xab\x02\x00\x00\x00\x00\x00U\xab\x02\x00\x00\x00\x00\x00W\xab\x02\x00\x00\x00\x00\x00X\xab\x02\x00\x00\x00\x00\x00Y\xab\x02\x00\x00\x00\x00\x00Z\xab\x02\x00\x00\x00\x00\x00[\xab\x02\x00\x00\x00\x00\x00\\\xab\x02\x00\x00\x00\x00\x00]\xab\x02\x00\x00\x00\x00\x00^\xab\x02\x00\x00\x00\x00\x00_\xab\x02\x00\x00\x00\x00\x00`\xab\x02\x00\x00\x00\x00\x00'
+    b'a\xab\x02\x00\x00\x00\x00\x00b\xab\x02\x00\x00\x00\x00\x00d\xab\x02\x00\x00\x00\x00\x00\xa6\xab\x02\x00\x00\x00\x00\x00\xae\xab\x02\x00\x00\x00\x00\x00\xaf\xab\x02\x00\x00\x00\x00\x00\xb0\xab\x02\x00\x00\x00\x00\x00\xdc\xab\x02\x00\x00\x00\x00\x00\xdf\xab\x02\x00\x00\x00\x00\x00\xf0\xab\x02\x00\x00\x00\x00\x00\xfa\xab\x02\x00\x00\x00\x00\x00T\xac\x02\x00\x00\x00\x00\x00'
+    b'U\xac\x02\x00\x00\x00\x00\x00V\xac\x02\x00\x00\x00\x00\x00g\xac\x02\x00\x00\x00\x00\x00w\xac\x02\x00\x00\x00\x00\x00x\xac\x02\x00\x00\x00\x00\x00\xa3\xac\x02\x00\x00\x00\x00\x00\xa4\xac\x02\x00\x00\x00\x00\x00\xa5\xac\x02\x00\x00\x00\x00\x00\xb4\xac\x02\x00\x00\x00\x00\x00\xc3\xac\x02\x00\x00\x00\x00\x00Z\xad\x02\x00\x00\x00\x00\x00[\xad\x02\x00\x00\x00\x00\x00'
+    b'7\xae\x02\x00\x00\x00\x00\x009\xae\x02\x00\x00\x00\x00\x00:\xae\x02\x00\x00\x00\x00\x00;\xae\x02\x00\x00\x00\x00\x00<\xae\x02\x00\x00\x00\x00\x00O\xae\x02\x00\x00\x00\x00\x00|\xae\x02\x00\x00\x00\x00\x00S\xaf\x02\x00\x00\x00\x00\x00T\xaf\x02\x00\x00\x00\x00\x00c\xaf\x02\x00\x00\x00\x00\x00\xcd\xaf\x02\x00\x00\x00\x00\x00\xce\xaf\x02\x00\x00\x00\x00\x00'
+    b'\xe0\xaf\x02\x00\x00\x00\x00\x00\r\xb0\x02\x00\x00\x00\x00\x000\xb0\x02\x00\x00\x00\x00\x00;\xb0\x02\x00\x00\x00\x00\x00<\xb0\x02\x00\x00\x00\x00\x00=\xb0\x02\x00\x00\x00\x00\x00\x9e\xb0\x02\x00\x00\x00\x00\x00\x9f\xb0\x02\x00\x00\x00\x00\x00\xa1\xb0\x02\x00\x00\x00\x00\x00\xa2\xb0\x02\x00\x00\x00\x00\x00\xa3\xb0\x02\x00\x00\x00\x00\x00\xa4\xb0\x02\x00\x00\x00\x00\x00'
+    b'\xa5\xb0\x02\x00\x00\x00\x00\x00\xba\xb1\x02\x00\x00\x00\x00\x00"\xb3\x02\x00\x00\x00\x00\x00W\xb3\x02\x00\x00\x00\x00\x00\xe5\xb3\x02\x00\x00\x00\x00\x00\xe6\xb3\x02\x00\x00\x00\x00\x00\xe7\xb3\x02\x00\x00\x00\x00\x00\xe8\xb3\x02\x00\x00\x00\x00\x00\xe9\xb3\x02\x00\x00\x00\x00\x00\xf0\xb3\x02\x00\x00\x00\x00\x00\x11\xb4\x02\x00\x00\x00\x00\x00\x12\xb4\x02\x00\x00\x00\x00\x00'
+    b'\x13\xb4\x02\x00\x00\x00\x00\x00\x1b\xb6\x02\x00\x00\x00\x00\x00\x1c\xb6\x02\x00\x00\x00\x00\x00\xa9\xb6\x02\x00\x00\x00\x00\x00\xab\xb6\x02\x00\x00\x00\x00\x00\x1f\xb7\x02\x00\x00\x00\x00\x00 \xb7\x02\x00\x00\x00\x00\x00!\xb7\x02\x00\x00\x00\x00\x00#\xb7\x02\x00\x00\x00\x00\x00%\xb7\x02\x00\x00\x00\x00\x00+\xb7\x02\x00\x00\x00\x00\x004\xb7\x02\x00\x00\x00\x00\x00'
+    b'=\xb7\x02\x00\x00\x00\x00\x00C\xb7\x02\x00\x00\x00\x00\x00G\xb7\x02\x00\x00\x00\x00\x00K\xb7\x02\x00\x00\x00\x00\x00L\xb7\x02\x00\x00\x00\x00\x00R\xb7\x02\x00\x00\x00\x00\x00S\xb7\x02\x00\x00\x00\x00\x00Z\xb7\x02\x00\x00\x00\x00\x00\x85\xb7\x02\x00\x00\x00\x00\x00\xbd\xb7\x02\x00\x00\x00\x00\x00\xbe\xb7\x02\x00\x00\x00\x00\x00\xd5\xb8\x02\x00\x00\x00\x00\x00'
+    b'\xea\xb8\x02\x00\x00\x00\x00\x00\xec\xb8\x02\x00\x00\x00\x00\x00Z\xb9\x02\x00\x00\x00\x00\x00[\xb9\x02\x00\x00\x00\x00\x00\\\xb9\x02\x00\x00\x00\x00\x00]\xb9\x02\x00\x00\x00\x00\x00\x90\xbb\x02\x00\x00\x00\x00\x00\x91\xbb\x02\x00\x00\x00\x00\x00\x97\xbb\x02\x00\x00\x00\x00\x00\xa3\xbb\x02\x00\x00\x00\x00\x00\xb1\xbc\x02\x00\x00\x00\x00\x00\x07\xbd\x02\x00\x00\x00\x00\x00'
+    b'M\xbd\x02\x00\x00\x00\x00\x00f\xbd\x02\x00\x00\x00\x00\x00\x88\xbd\x02\x00\x00\x00\x00\x00\x89\xbd\x02\x00\x00\x00\x00\x00\x8a\xbd\x02\x00\x00\x00\x00\x00\x8b\xbd\x02\x00\x00\x00\x00\x00\x8c\xbd\x02\x00\x00\x00\x00\x00\x1b\xbe\x02\x00\x00\x00\x00\x00\x1c\xbe\x02\x00\x00\x00\x00\x00\x1d\xbe\x02\x00\x00\x00\x00\x00\x1e\xbe\x02\x00\x00\x00\x00\x00\x1f\xbe\x02\x00\x00\x00\x00\x00'
+    b' \xbe\x02\x00\x00\x00\x00\x00!\xbe\x02\x00\x00\x00\x00\x00"\xbe\x02\x00\x00\x00\x00\x00#\xbe\x02\x00\x00\x00\x00\x00$\xbe\x02\x00\x00\x00\x00\x00%\xbe\x02\x00\x00\x00\x00\x00&\xbe\x02\x00\x00\x00\x00\x00\'\xbe\x02\x00\x00\x00\x00\x00(\xbe\x02\x00\x00\x00\x00\x00)\xbe\x02\x00\x00\x00\x00\x00;\xbe\x02\x00\x00\x00\x00\x00q\xbe\x02\x00\x00\x00\x00\x00'
+    b'y\xbe\x02\x00\x00\x00\x00\x00\x7f\xbe\x02\x00\x00\x00\x00\x00\x9b\xbe\x02\x00\x00\x00\x00\x00\xd2\xbe\x02\x00\x00\x00\x00\x00.\xbf\x02\x00\x00\x00\x00\x00/\xbf\x02\x00\x00\x00\x00\x000\xbf\x02\x00\x00\x00\x00\x00\x9c\xbf\x02\x00\x00\x00\x00\x00\x9d\xbf\x02\x00\x00\x00\x00\x00\x9e\xbf\x02\x00\x00\x00\x00\x00\x9f\xbf\x02\x00\x00\x00\x00\x00\xa0\xbf\x02\x00\x00\x00\x00\x00'
+    b'\xa1\xbf\x02\x00\x00\x00\x00\x00\xa2\xbf\x02\x00\x00\x00\x00\x00\xa3\xbf\x02\x00\x00\x00\x00\x00\xdd\xbf\x02\x00\x00\x00\x00\x00\xed\xbf\x02\x00\x00\x00\x00\x00\xee\xbf\x02\x00\x00\x00\x00\x00\xef\xbf\x02\x00\x00\x00\x00\x00\xf0\xbf\x02\x00\x00\x00\x00\x00\x01\xc0\x02\x00\x00\x00\x00\x00\x02\xc0\x02\x00\x00\x00\x00\x00#\xc0\x02\x00\x00\x00\x00\x00$\xc0\x02\x00\x00\x00\x00\x00'
+    b'>\xc0\x02\x00\x00\x00\x00\x00?\xc0\x02\x00\x00\x00\x00\x00e\xc0\x02\x00\x00\x00\x00\x00f\xc0\x02\x00\x00\x00\x00\x00h\xc0\x02\x00\x00\x00\x00\x00i\xc0\x02\x00\x00\x00\x00\x00j\xc0\x02\x00\x00\x00\x00\x00k\xc0\x02\x00\x00\x00\x00\x00l\xc0\x02\x00\x00\x00\x00\x00n\xc0\x02\x00\x00\x00\x00\x00o\xc0\x02\x00\x00\x00\x00\x00p\xc0\x02\x00\x00\x00\x00\x00'
+    b'\xcc\xc0\x02\x00\x00\x00\x00\x00?\xc1\x02\x00\x00\x00\x00\x00X\xc1\x02\x00\x00\x00\x00\x00\x83\xc1\x02\x00\x00\x00\x00\x00\x9c\xc1\x02\x00\x00\x00\x00\x00\xa1\xc1\x02\x00\x00\x00\x00\x00\xa3\xc1\x02\x00\x00\x00\x00\x00&\xc2\x02\x00\x00\x00\x00\x00\xdc\xc2\x02\x00\x00\x00\x00\x00\xe1\xc2\x02\x00\x00\x00\x00\x00\x08\xc3\x02\x00\x00\x00\x00\x00\x0e\xc3\x02\x00\x00\x00\x00\x00'
+    b'\x8c\xc3\x02\x00\x00\x00\x00\x00\x8d\xc3\x02\x00\x00\x00\x00\x00\x8e\xc3\x02\x00\x00\x00\x00\x00\x99\xc3\x02\x00\x00\x00\x00\x00\x9b\xc3\x02\x00\x00\x00\x00\x00\x9f\xc3\x02\x00\x00\x00\x00\x00\xf2\xc3\x02\x00\x00\x00\x00\x00\xf4\xc3\x02\x00\x00\x00\x00\x00\xf5\xc3\x02\x00\x00\x00\x00\x00\xf7\xc3\x02\x00\x00\x00\x00\x00\xa6\xc4\x02\x00\x00\x00\x00\x00\xe1\xc4\x02\x00\x00\x00\x00\x00'
+    b'\xe2\xc4\x02\x00\x00\x00\x00\x00\xe3\xc4\x02\x00\x00\x00\x00\x00\xe4\xc4\x02\x00\x00\x00\x00\x008\xc5\x02\x00\x00\x00\x00\x009\xc5\x02\x00\x00\x00\x00\x00:\xc5\x02\x00\x00\x00\x00\x00;\xc5\x02\x00\x00\x00\x00\x00<\xc5\x02\x00\x00\x00\x00\x00=\xc5\x02\x00\x00\x00\x00\x00>\xc5\x02\x00\x00\x00\x00\x00N\xc5\x02\x00\x00\x00\x00\x00\xa8\xc5\x02\x00\x00\x00\x00\x00'
+    b'\xa9\xc5\x02\x00\x00\x00\x00\x00\xaa\xc5\x02\x00\x00\x00\x00\x00K\xc6\x02\x00\x00\x00\x00\x00L\xc6\x02\x00\x00\x00\x00\x00\x8c\xc6\x02\x00\x00\x00\x00\x00\x91\xc6\x02\x00\x00\x00\x00\x00\xa4\xc7\x02\x00\x00\x00\x00\x00\xa6\xc7\x02\x00\x00\x00\x00\x00\xa7\xc7\x02\x00\x00\x00\x00\x00\xa8\xc7\x02\x00\x00\x00\x00\x00\xb6\xc7\x02\x00\x00\x00\x00\x00\xbd\xc7\x02\x00\x00\x00\x00\x00'
+    b'\xbf\xc7\x02\x00\x00\x00\x00\x00\x96\xc9\x02\x00\x00\x00\x00\x00\x97\xc9\x02\x00\x00\x00\x00\x00k\xca\x02\x00\x00\x00\x00\x00\xc0\xca\x02\x00\x00\x00\x00\x00\x18\xcb\x02\x00\x00\x00\x00\x00\x19\xcb\x02\x00\x00\x00\x00\x00\x01\xcc\x02\x00\x00\x00\x00\x00\x02\xcc\x02\x00\x00\x00\x00\x00\x86\xcc\x02\x00\x00\x00\x00\x00\xc0\xcc\x02\x00\x00\x00\x00\x00\x15\xcd\x02\x00\x00\x00\x00\x00'
+    b'\x16\xcd\x02\x00\x00\x00\x00\x00\x17\xcd\x02\x00\x00\x00\x00\x00\x18\xcd\x02\x00\x00\x00\x00\x006\xcd\x02\x00\x00\x00\x00\x00i\xcd\x02\x00\x00\x00\x00\x00j\xcd\x02\x00\x00\x00\x00\x00k\xcd\x02\x00\x00\x00\x00\x00\x84\xcd\x02\x00\x00\x00\x00\x00\xd1\xcd\x02\x00\x00\x00\x00\x00\xc3\xce\x02\x00\x00\x00\x00\x00\xc4\xce\x02\x00\x00\x00\x00\x00\xc5\xce\x02\x00\x00\x00\x00\x00'
+    b'P\xcf\x02\x00\x00\x00\x00\x00Q\xcf\x02\x00\x00\x00\x00\x00R\xcf\x02\x00\x00\x00\x00\x00S\xcf\x02\x00\x00\x00\x00\x00i\xcf\x02\x00\x00\x00\x00\x00j\xcf\x02\x00\x00\x00\x00\x00k\xcf\x02\x00\x00\x00\x00\x00e\xd0\x02\x00\x00\x00\x00\x00f\xd0\x02\x00\x00\x00\x00\x00\x1d\xd2\x02\x00\x00\x00\x00\x00T\xd3\x02\x00\x00\x00\x00\x00\xf5\xd3\x02\x00\x00\x00\x00\x00'
+    b'\xf7\xd3\x02\x00\x00\x00\x00\x00\xf8\xd3\x02\x00\x00\x00\x00\x00\xfa\xd3\x02\x00\x00\x00\x00\x00\xfb\xd3\x02\x00\x00\x00\x00\x00\xfc\xd3\x02\x00\x00\x00\x00\x00\xfd\xd3\x02\x00\x00\x00\x00\x00\xff\xd3\x02\x00\x00\x00\x00\x00\x00\xd4\x02\x00\x00\x00\x00\x00\x02\xd4\x02\x00\x00\x00\x00\x00\x03\xd4\x02\x00\x00\x00\x00\x00\x05\xd4\x02\x00\x00\x00\x00\x00\x06\xd4\x02\x00\x00\x00\x00\x00'
+    b'\x08\xd4\x02\x00\x00\x00\x00\x00\t\xd4\x02\x00\x00\x00\x00\x00\n\xd4\x02\x00\x00\x00\x00\x00\x0c\xd4\x02\x00\x00\x00\x00\x00\r\xd4\x02\x00\x00\x00\x00\x00\x0f\xd4\x02\x00\x00\x00\x00\x00\x10\xd4\x02\x00\x00\x00\x00\x00x\xd4\x02\x00\x00\x00\x00\x00\x80\xd4\x02\x00\x00\x00\x00\x00\xa4\xd4\x02\x00\x00\x00\x00\x00\xc4\xd4\x02\x00\x00\x00\x00\x00\xe0\xd4\x02\x00\x00\x00\x00\x00'
+    b'\x87\xd5\x02\x00\x00\x00\x00\x00\xa0\xd5\x02\x00\x00\x00\x00\x00\xc5\xd5\x02\x00\x00\x00\x00\x00\xc6\xd5\x02\x00\x00\x00\x00\x00\xf6\xd5\x02\x00\x00\x00\x00\x00E\xd6\x02\x00\x00\x00\x00\x00H\xd6\x02\x00\x00\x00\x00\x00\xac\xd6\x02\x00\x00\x00\x00\x00\xad\xd6\x02\x00\x00\x00\x00\x00\xe3\xd6\x02\x00\x00\x00\x00\x00\xe4\xd6\x02\x00\x00\x00\x00\x00=\xd7\x02\x00\x00\x00\x00\x00'
+    b'\\\xd7\x02\x00\x00\x00\x00\x00\xe6\xd7\x02\x00\x00\x00\x00\x00\xe8\xd7\x02\x00\x00\x00\x00\x00\xe9\xd7\x02\x00\x00\x00\x00\x00\x10\xd8\x02\x00\x00\x00\x00\x00\xca\xd8\x02\x00\x00\x00\x00\x00\x11\xd9\x02\x00\x00\x00\x00\x00$\xd9\x02\x00\x00\x00\x00\x00P\xd9\x02\x00\x00\x00\x00\x00\x9e\xda\x02\x00\x00\x00\x00\x00\x9f\xda\x02\x00\x00\x00\x00\x00\xa0\xda\x02\x00\x00\x00\x00\x00'
+    b'\xa1\xda\x02\x00\x00\x00\x00\x00\xa2\xda\x02\x00\x00\x00\x00\x00\xa3\xda\x02\x00\x00\x00\x00\x00\xa4\xda\x02\x00\x00\x00\x00\x00\x0b\xdb\x02\x00\x00\x00\x00\x00\x0c\xdb\x02\x00\x00\x00\x00\x00\x0e\xdb\x02\x00\x00\x00\x00\x00\xd6\xdc\x02\x00\x00\x00\x00\x00\xd8\xdc\x02\x00\x00\x00\x00\x00\xda\xdc\x02\x00\x00\x00\x00\x00\xdb\xdc\x02\x00\x00\x00\x00\x00\xdc\xdc\x02\x00\x00\x00\x00\x00'
+    b'\xdd\xdc\x02\x00\x00\x00\x00\x00\xde\xdc\x02\x00\x00\x00\x00\x00\xdf\xdc\x02\x00\x00\x00\x00\x00\xe0\xdc\x02\x00\x00\x00\x00\x00\r\xdd\x02\x00\x00\x00\x00\x00\x0e\xdd\x02\x00\x00\x00\x00\x00\x10\xdd\x02\x00\x00\x00\x00\x00\x11\xdd\x02\x00\x00\x00\x00\x00@\xdd\x02\x00\x00\x00\x00\x00F\xdd\x02\x00\x00\x00\x00\x00G\xdd\x02\x00\x00\x00\x00\x00H\xdd\x02\x00\x00\x00\x00\x00'
+    b'I\xdd\x02\x00\x00\x00\x00\x00J\xdd\x02\x00\x00\x00\x00\x00L\xdd\x02\x00\x00\x00\x00\x00M\xdd\x02\x00\x00\x00\x00\x00u\xdd\x02\x00\x00\x00\x00\x00w\xdd\x02\x00\x00\x00\x00\x00x\xdd\x02\x00\x00\x00\x00\x00z\xdd\x02\x00\x00\x00\x00\x00{\xdd\x02\x00\x00\x00\x00\x00\xb1\xdd\x02\x00\x00\x00\x00\x00\xb2\xdd\x02\x00\x00\x00\x00\x00\xb3\xdd\x02\x00\x00\x00\x00\x00'
+    b'\xb4\xdd\x02\x00\x00\x00\x00\x00\xb6\xdd\x02\x00\x00\x00\x00\x00\xb7\xdd\x02\x00\x00\x00\x00\x00\xb8\xdd\x02\x00\x00\x00\x00\x00\xb9\xdd\x02\x00\x00\x00\x00\x00\xba\xdd\x02\x00\x00\x00\x00\x00\xbb\xdd\x02\x00\x00\x00\x00\x00\xbc\xdd\x02\x00\x00\x00\x00\x00\xbd\xdd\x02\x00\x00\x00\x00\x00\xbe\xdd\x02\x00\x00\x00\x00\x00\xbf\xdd\x02\x00\x00\x00\x00\x00\xa7\xde\x02\x00\x00\x00\x00\x00'
+    b';\xdf\x02\x00\x00\x00\x00\x00\x14\xe0\x02\x00\x00\x00\x00\x00"\xe0\x02\x00\x00\x00\x00\x00)\xe0\x02\x00\x00\x00\x00\x00+\xe0\x02\x00\x00\x00\x00\x00-\xe0\x02\x00\x00\x00\x00\x00.\xe0\x02\x00\x00\x00\x00\x00/\xe0\x02\x00\x00\x00\x00\x00h\xe0\x02\x00\x00\x00\x00\x00\x95\xe0\x02\x00\x00\x00\x00\x00y\xe1\x02\x00\x00\x00\x00\x00z\xe1\x02\x00\x00\x00\x00\x00'
+    b'\x0e\xe2\x02\x00\x00\x00\x00\x002\xe2\x02\x00\x00\x00\x00\x003\xe2\x02\x00\x00\x00\x00\x004\xe2\x02\x00\x00\x00\x00\x005\xe2\x02\x00\x00\x00\x00\x00V\xe2\x02\x00\x00\x00\x00\x00\x14\xe3\x02\x00\x00\x00\x00\x00\x15\xe3\x02\x00\x00\x00\x00\x00\x89\xe3\x02\x00\x00\x00\x00\x00\x8a\xe3\x02\x00\x00\x00\x00\x00\x8b\xe3\x02\x00\x00\x00\x00\x00\x8c\xe3\x02\x00\x00\x00\x00\x00'
+    b'\x8d\xe3\x02\x00\x00\x00\x00\x00\x02\xe4\x02\x00\x00\x00\x00\x00\x03\xe4\x02\x00\x00\x00\x00\x00\x04\xe4\x02\x00\x00\x00\x00\x00\x05\xe4\x02\x00\x00\x00\x00\x00\x06\xe4\x02\x00\x00\x00\x00\x00\x08\xe4\x02\x00\x00\x00\x00\x00\t\xe4\x02\x00\x00\x00\x00\x00\n\xe4\x02\x00\x00\x00\x00\x00\x0b\xe4\x02\x00\x00\x00\x00\x00\x0c\xe4\x02\x00\x00\x00\x00\x00\x12\xe4\x02\x00\x00\x00\x00\x00'
+    b'\x13\xe4\x02\x00\x00\x00\x00\x00\x14\xe4\x02\x00\x00\x00\x00\x00\x15\xe4\x02\x00\x00\x00\x00\x00\x16\xe4\x02\x00\x00\x00\x00\x00\x18\xe4\x02\x00\x00\x00\x00\x00\x19\xe4\x02\x00\x00\x00\x00\x00\x1a\xe4\x02\x00\x00\x00\x00\x00\x1b\xe4\x02\x00\x00\x00\x00\x00\x1c\xe4\x02\x00\x00\x00\x00\x00\xba\xe4\x02\x00\x00\x00\x00\x00\xbd\xe4\x02\x00\x00\x00\x00\x00\xbe\xe4\x02\x00\x00\x00\x00\x00'
+    b'\xc1\xe4\x02\x00\x00\x00\x00\x00\xc3\xe4\x02\x00\x00\x00\x00\x00Y\xe5\x02\x00\x00\x00\x00\x00n\xe5\x02\x00\x00\x00\x00\x00p\xe5\x02\x00\x00\x00\x00\x00\x86\xe5\x02\x00\x00\x00\x00\x00\t\xe7\x02\x00\x00\x00\x00\x00\n\xe7\x02\x00\x00\x00\x00\x00\x0b\xe7\x02\x00\x00\x00\x00\x00J\xe7\x02\x00\x00\x00\x00\x00\x80\xe7\x02\x00\x00\x00\x00\x00\x81\xe7\x02\x00\x00\x00\x00\x00'
+    b'\x83\xe7\x02\x00\x00\x00\x00\x00\xd6\xe7\x02\x00\x00\x00\x00\x00\xf5\xe7\x02\x00\x00\x00\x00\x00\xcc\xe8\x02\x00\x00\x00\x00\x00)\xe9\x02\x00\x00\x00\x00\x006\xe9\x02\x00\x00\x00\x00\x007\xe9\x02\x00\x00\x00\x00\x00\x0f\xea\x02\x00\x00\x00\x00\x00\xd7\xea\x02\x00\x00\x00\x00\x00\xd8\xea\x02\x00\x00\x00\x00\x00\x88\xec\x02\x00\x00\x00\x00\x00\xdb\xec\x02\x00\x00\x00\x00\x00'
+    b'\xd6\xed\x02\x00\x00\x00\x00\x00\xe6\xed\x02\x00\x00\x00\x00\x00\xe7\xed\x02\x00\x00\x00\x00\x00\x01\xef\x02\x00\x00\x00\x00\x00\x02\xef\x02\x00\x00\x00\x00\x00\x03\xef\x02\x00\x00\x00\x00\x00\x04\xef\x02\x00\x00\x00\x00\x00\x05\xef\x02\x00\x00\x00\x00\x00%\xf0\x02\x00\x00\x00\x00\x00U\xf0\x02\x00\x00\x00\x00\x00r\xf1\x02\x00\x00\x00\x00\x00\x95\xf1\x02\x00\x00\x00\x00\x00'
+    b'\xc1\xf1\x02\x00\x00\x00\x00\x00\xc2\xf1\x02\x00\x00\x00\x00\x00\xc3\xf1\x02\x00\x00\x00\x00\x00\xc5\xf1\x02\x00\x00\x00\x00\x00\xc6\xf1\x02\x00\x00\x00\x00\x00\xc7\xf1\x02\x00\x00\x00\x00\x00\xc8\xf1\x02\x00\x00\x00\x00\x00\xc3\xf3\x02\x00\x00\x00\x00\x00\xca\xf3\x02\x00\x00\x00\x00\x00\xcb\xf3\x02\x00\x00\x00\x00\x00\xcc\xf3\x02\x00\x00\x00\x00\x00\xce\xf3\x02\x00\x00\x00\x00\x00'
+    b'\xcf\xf3\x02\x00\x00\x00\x00\x00\xd0\xf3\x02\x00\x00\x00\x00\x00\xd1\xf3\x02\x00\x00\x00\x00\x00\xd2\xf3\x02\x00\x00\x00\x00\x00\xd3\xf3\x02\x00\x00\x00\x00\x00\xe1\xf3\x02\x00\x00\x00\x00\x00\xe2\xf3\x02\x00\x00\x00\x00\x00\xe3\xf3\x02\x00\x00\x00\x00\x00\x07\xf5\x02\x00\x00\x00\x00\x00\x08\xf5\x02\x00\x00\x00\x00\x00Z\xf5\x02\x00\x00\x00\x00\x00[\xf5\x02\x00\x00\x00\x00\x00'
+    b'\\\xf5\x02\x00\x00\x00\x00\x00]\xf5\x02\x00\x00\x00\x00\x00^\xf5\x02\x00\x00\x00\x00\x00_\xf5\x02\x00\x00\x00\x00\x00\x1e\xf6\x02\x00\x00\x00\x00\x00\x1f\xf6\x02\x00\x00\x00\x00\x00"\xf6\x02\x00\x00\x00\x00\x00#\xf6\x02\x00\x00\x00\x00\x001\xf6\x02\x00\x00\x00\x00\x002\xf6\x02\x00\x00\x00\x00\x00\x00\xf7\x02\x00\x00\x00\x00\x00\x01\xf7\x02\x00\x00\x00\x00\x00'
+    b'\x02\xf7\x02\x00\x00\x00\x00\x00\x03\xf7\x02\x00\x00\x00\x00\x00\x04\xf7\x02\x00\x00\x00\x00\x00\x11\xf7\x02\x00\x00\x00\x00\x00\x19\xf7\x02\x00\x00\x00\x00\x00\x1d\xf8\x02\x00\x00\x00\x00\x00"\xf8\x02\x00\x00\x00\x00\x00#\xf8\x02\x00\x00\x00\x00\x00%\xf8\x02\x00\x00\x00\x00\x00&\xf8\x02\x00\x00\x00\x00\x00\'\xf8\x02\x00\x00\x00\x00\x00 \xf9\x02\x00\x00\x00\x00\x00'
+    b'!\xf9\x02\x00\x00\x00\x00\x00"\xf9\x02\x00\x00\x00\x00\x00#\xf9\x02\x00\x00\x00\x00\x00$\xf9\x02\x00\x00\x00\x00\x00+\xf9\x02\x00\x00\x00\x00\x00I\xf9\x02\x00\x00\x00\x00\x00J\xf9\x02\x00\x00\x00\x00\x00K\xf9\x02\x00\x00\x00\x00\x00L\xf9\x02\x00\x00\x00\x00\x00M\xf9\x02\x00\x00\x00\x00\x00N\xf9\x02\x00\x00\x00\x00\x00O\xf9\x02\x00\x00\x00\x00\x00'
+    b'P\xf9\x02\x00\x00\x00\x00\x00h\xf9\x02\x00\x00\x00\x00\x00\x8c\xf9\x02\x00\x00\x00\x00\x00\xae\xf9\x02\x00\x00\x00\x00\x00\xf7\xfa\x02\x00\x00\x00\x00\x00*\xfb\x02\x00\x00\x00\x00\x00,\xfb\x02\x00\x00\x00\x00\x00-\xfb\x02\x00\x00\x00\x00\x00.\xfb\x02\x00\x00\x00\x00\x00/\xfb\x02\x00\x00\x00\x00\x000\xfb\x02\x00\x00\x00\x00\x001\xfb\x02\x00\x00\x00\x00\x00'
+    b'2\xfb\x02\x00\x00\x00\x00\x00K\xfb\x02\x00\x00\x00\x00\x00L\xfb\x02\x00\x00\x00\x00\x00M\xfb\x02\x00\x00\x00\x00\x00N\xfb\x02\x00\x00\x00\x00\x00O\xfb\x02\x00\x00\x00\x00\x00P\xfb\x02\x00\x00\x00\x00\x00Q\xfb\x02\x00\x00\x00\x00\x00\x9a\xfb\x02\x00\x00\x00\x00\x00/\xfc\x02\x00\x00\x00\x00\x00o\xfc\x02\x00\x00\x00\x00\x00\xe3\xfc\x02\x00\x00\x00\x00\x00'
+    b'\xee\xfc\x02\x00\x00\x00\x00\x00\xef\xfc\x02\x00\x00\x00\x00\x00\xf0\xfc\x02\x00\x00\x00\x00\x00\xf1\xfc\x02\x00\x00\x00\x00\x00\xf2\xfc\x02\x00\x00\x00\x00\x00\xf3\xfc\x02\x00\x00\x00\x00\x00D\xfd\x02\x00\x00\x00\x00\x00E\xfd\x02\x00\x00\x00\x00\x00m\xfd\x02\x00\x00\x00\x00\x00\x97\xfd\x02\x00\x00\x00\x00\x00\x98\xfd\x02\x00\x00\x00\x00\x00\xd0\xfd\x02\x00\x00\x00\x00\x00'
+    b'\xd1\xfd\x02\x00\x00\x00\x00\x00\xd2\xfd\x02\x00\x00\x00\x00\x00\xdd\xfd\x02\x00\x00\x00\x00\x00\xed\xfd\x02\x00\x00\x00\x00\x00\xef\xfd\x02\x00\x00\x00\x00\x00\xf1\xfd\x02\x00\x00\x00\x00\x000\xfe\x02\x00\x00\x00\x00\x00\x7f\xfe\x02\x00\x00\x00\x00\x00\xa7\xfe\x02\x00\x00\x00\x00\x00\xa8\xfe\x02\x00\x00\x00\x00\x00\xe6\xfe\x02\x00\x00\x00\x00\x00T\xff\x02\x00\x00\x00\x00\x00'
+    b'V\xff\x02\x00\x00\x00\x00\x00\xbe\xff\x02\x00\x00\x00\x00\x00\xbf\xff\x02\x00\x00\x00\x00\x00\x84\x00\x03\x00\x00\x00\x00\x00\x85\x00\x03\x00\x00\x00\x00\x00\x86\x00\x03\x00\x00\x00\x00\x00\x87\x00\x03\x00\x00\x00\x00\x00\x88\x00\x03\x00\x00\x00\x00\x00\x89\x00\x03\x00\x00\x00\x00\x00\x8a\x00\x03\x00\x00\x00\x00\x00\x8c\x00\x03\x00\x00\x00\x00\x00W\x01\x03\x00\x00\x00\x00\x00'
+    b'X\x01\x03\x00\x00\x00\x00\x00Y\x01\x03\x00\x00\x00\x00\x00Z\x01\x03\x00\x00\x00\x00\x00[\x01\x03\x00\x00\x00\x00\x00\xfb\x01\x03\x00\x00\x00\x00\x00\xae\x03\x03\x00\x00\x00\x00\x00\xaf\x03\x03\x00\x00\x00\x00\x00\xb0\x03\x03\x00\x00\x00\x00\x00\xb1\x03\x03\x00\x00\x00\x00\x00\xb2\x03\x03\x00\x00\x00\x00\x00\xb3\x03\x03\x00\x00\x00\x00\x00\xb4\x03\x03\x00\x00\x00\x00\x00'
+    b'\xb6\x03\x03\x00\x00\x00\x00\x00\xb7\x03\x03\x00\x00\x00\x00\x00\xb8\x03\x03\x00\x00\x00\x00\x00\xb9\x03\x03\x00\x00\x00\x00\x00\xdc\x03\x03\x00\x00\x00\x00\x00\xbe\x04\x03\x00\x00\x00\x00\x00\xf4\x04\x03\x00\x00\x00\x00\x00\xfa\x04\x03\x00\x00\x00\x00\x00\xfb\x04\x03\x00\x00\x00\x00\x00\xfc\x04\x03\x00\x00\x00\x00\x00\x00\x05\x03\x00\x00\x00\x00\x00=\x05\x03\x00\x00\x00\x00\x00'
+    b'>\x05\x03\x00\x00\x00\x00\x00Y\x07\x03\x00\x00\x00\x00\x00Z\x07\x03\x00\x00\x00\x00\x00[\x07\x03\x00\x00\x00\x00\x00\\\x07\x03\x00\x00\x00\x00\x00\x8a\x07\x03\x00\x00\x00\x00\x00\x91\x07\x03\x00\x00\x00\x00\x00\x92\x07\x03\x00\x00\x00\x00\x00\x93\x07\x03\x00\x00\x00\x00\x00\x94\x07\x03\x00\x00\x00\x00\x00\x95\x07\x03\x00\x00\x00\x00\x00\x96\x07\x03\x00\x00\x00\x00\x00'
+    b'\x97\x07\x03\x00\x00\x00\x00\x00\xcb\x07\x03\x00\x00\x00\x00\x00\xec\x07\x03\x00\x00\x00\x00\x00\x08\x08\x03\x00\x00\x00\x00\x00\x1c\x08\x03\x00\x00\x00\x00\x00#\x08\x03\x00\x00\x00\x00\x00$\x08\x03\x00\x00\x00\x00\x00?\x08\x03\x00\x00\x00\x00\x00\x9d\x08\x03\x00\x00\x00\x00\x00\x10\t\x03\x00\x00\x00\x00\x00\x11\t\x03\x00\x00\x00\x00\x00\x12\t\x03\x00\x00\x00\x00\x00'
+    b'(\t\x03\x00\x00\x00\x00\x00)\t\x03\x00\x00\x00\x00\x00*\t\x03\x00\x00\x00\x00\x00+\t\x03\x00\x00\x00\x00\x00,\t\x03\x00\x00\x00\x00\x00-\t\x03\x00\x00\x00\x00\x00.\t\x03\x00\x00\x00\x00\x00/\t\x03\x00\x00\x00\x00\x000\t\x03\x00\x00\x00\x00\x002\t\x03\x00\x00\x00\x00\x00\xc9\n\x03\x00\x00\x00\x00\x00\xdc\n\x03\x00\x00\x00\x00\x00'
+    b'\xef\n\x03\x00\x00\x00\x00\x00\xf1\n\x03\x00\x00\x00\x00\x00\x88\x0b\x03\x00\x00\x00\x00\x00\xa3\x0b\x03\x00\x00\x00\x00\x00\x1b\x0c\x03\x00\x00\x00\x00\x00\x1c\x0c\x03\x00\x00\x00\x00\x00\x1e\x0c\x03\x00\x00\x00\x00\x00"\x0c\x03\x00\x00\x00\x00\x00#\x0c\x03\x00\x00\x00\x00\x001\x0c\x03\x00\x00\x00\x00\x00`\x0c\x03\x00\x00\x00\x00\x00a\x0c\x03\x00\x00\x00\x00\x00'
+    b'b\x0c\x03\x00\x00\x00\x00\x00c\x0c\x03\x00\x00\x00\x00\x00e\x0c\x03\x00\x00\x00\x00\x00f\x0c\x03\x00\x00\x00\x00\x00g\x0c\x03\x00\x00\x00\x00\x00\xdd\x0c\x03\x00\x00\x00\x00\x00\xde\x0c\x03\x00\x00\x00\x00\x00\xfe\r\x03\x00\x00\x00\x00\x00\x00\x0e\x03\x00\x00\x00\x00\x00K\x0e\x03\x00\x00\x00\x00\x00\x85\x0e\x03\x00\x00\x00\x00\x00\xd0\x0e\x03\x00\x00\x00\x00\x00'
+    b'\xd1\x0e\x03\x00\x00\x00\x00\x00\xd2\x0e\x03\x00\x00\x00\x00\x00\xd3\x0e\x03\x00\x00\x00\x00\x00\xd4\x0e\x03\x00\x00\x00\x00\x00\xd5\x0e\x03\x00\x00\x00\x00\x00\xd6\x0e\x03\x00\x00\x00\x00\x00\xd7\x0e\x03\x00\x00\x00\x00\x00\xda\x0e\x03\x00\x00\x00\x00\x00\xdb\x0e\x03\x00\x00\x00\x00\x00\xdc\x0e\x03\x00\x00\x00\x00\x00\xdd\x0e\x03\x00\x00\x00\x00\x00\xe9\x0e\x03\x00\x00\x00\x00\x00'
+    b'2\x0f\x03\x00\x00\x00\x00\x003\x0f\x03\x00\x00\x00\x00\x004\x0f\x03\x00\x00\x00\x00\x00\x82\x0f\x03\x00\x00\x00\x00\x00\x83\x0f\x03\x00\x00\x00\x00\x00`\x10\x03\x00\x00\x00\x00\x00a\x10\x03\x00\x00\x00\x00\x00b\x10\x03\x00\x00\x00\x00\x00\xbe\x10\x03\x00\x00\x00\x00\x00\xbf\x10\x03\x00\x00\x00\x00\x00.\x11\x03\x00\x00\x00\x00\x00K\x11\x03\x00\x00\x00\x00\x00'
+    b'\xba\x12\x03\x00\x00\x00\x00\x00`\x15\x03\x00\x00\x00\x00\x00a\x15\x03\x00\x00\x00\x00\x00\xfb\x19\x03\x00\x00\x00\x00\x00n\x1b\x03\x00\x00\x00\x00\x00\x88\x1b\x03\x00\x00\x00\x00\x00\x89\x1b\x03\x00\x00\x00\x00\x00\x8a\x1b\x03\x00\x00\x00\x00\x00\x8b\x1b\x03\x00\x00\x00\x00\x00\x8c\x1b\x03\x00\x00\x00\x00\x00\x96\x1b\x03\x00\x00\x00\x00\x00\x97\x1b\x03\x00\x00\x00\x00\x00'
+    b'\x98\x1b\x03\x00\x00\x00\x00\x00\x99\x1b\x03\x00\x00\x00\x00\x00\x9a\x1b\x03\x00\x00\x00\x00\x00\xf9\x1b\x03\x00\x00\x00\x00\x00\xfa\x1b\x03\x00\x00\x00\x00\x00\xfb\x1b\x03\x00\x00\x00\x00\x00\xbb\x1c\x03\x00\x00\x00\x00\x00\xe3\x1c\x03\x00\x00\x00\x00\x00\xe4\x1c\x03\x00\x00\x00\x00\x00\x93\x1d\x03\x00\x00\x00\x00\x00(\x1e\x03\x00\x00\x00\x00\x00,\x1e\x03\x00\x00\x00\x00\x00'
+    b'L\x1e\x03\x00\x00\x00\x00\x00V\x1e\x03\x00\x00\x00\x00\x00\x02\x1f\x03\x00\x00\x00\x00\x00\x03\x1f\x03\x00\x00\x00\x00\x00\x97\x1f\x03\x00\x00\x00\x00\x00\x98\x1f\x03\x00\x00\x00\x00\x00\xcf \x03\x00\x00\x00\x00\x00g!\x03\x00\x00\x00\x00\x00h!\x03\x00\x00\x00\x00\x00m!\x03\x00\x00\x00\x00\x00n!\x03\x00\x00\x00\x00\x00\xad#\x03\x00\x00\x00\x00\x00'
+    b'\x12$\x03\x00\x00\x00\x00\x002$\x03\x00\x00\x00\x00\x003$\x03\x00\x00\x00\x00\x00F$\x03\x00\x00\x00\x00\x00J$\x03\x00\x00\x00\x00\x00K$\x03\x00\x00\x00\x00\x00L$\x03\x00\x00\x00\x00\x00c$\x03\x00\x00\x00\x00\x00d$\x03\x00\x00\x00\x00\x00e$\x03\x00\x00\x00\x00\x00k$\x03\x00\x00\x00\x00\x00\xc9$\x03\x00\x00\x00\x00\x00'
+    b'\xcb$\x03\x00\x00\x00\x00\x00\xcf$\x03\x00\x00\x00\x00\x00\xd5$\x03\x00\x00\x00\x00\x00\xd8$\x03\x00\x00\x00\x00\x00I%\x03\x00\x00\x00\x00\x00\x88%\x03\x00\x00\x00\x00\x00\xc3%\x03\x00\x00\x00\x00\x00\xc8%\x03\x00\x00\x00\x00\x00\xe3%\x03\x00\x00\x00\x00\x00\xe4%\x03\x00\x00\x00\x00\x000&\x03\x00\x00\x00\x00\x00A&\x03\x00\x00\x00\x00\x00'
+    b'B&\x03\x00\x00\x00\x00\x00g&\x03\x00\x00\x00\x00\x00i&\x03\x00\x00\x00\x00\x00j&\x03\x00\x00\x00\x00\x00\x8b&\x03\x00\x00\x00\x00\x00\x8c&\x03\x00\x00\x00\x00\x00\x8d&\x03\x00\x00\x00\x00\x00\x9d&\x03\x00\x00\x00\x00\x00\xb9&\x03\x00\x00\x00\x00\x00\xd2&\x03\x00\x00\x00\x00\x00\xd3&\x03\x00\x00\x00\x00\x00\xe1&\x03\x00\x00\x00\x00\x00'
+    b"\xef&\x03\x00\x00\x00\x00\x00\x1e'\x03\x00\x00\x00\x00\x00\x1f'\x03\x00\x00\x00\x00\x00 '\x03\x00\x00\x00\x00\x00\x8d'\x03\x00\x00\x00\x00\x00\x8f'\x03\x00\x00\x00\x00\x00\x90'\x03\x00\x00\x00\x00\x00\x9f'\x03\x00\x00\x00\x00\x00\xa0'\x03\x00\x00\x00\x00\x00\xa1'\x03\x00\x00\x00\x00\x00\xa3'\x03\x00\x00\x00\x00\x00\xa4'\x03\x00\x00\x00\x00\x00"
+    b"\xa5'\x03\x00\x00\x00\x00\x00\xb7'\x03\x00\x00\x00\x00\x00\x00(\x03\x00\x00\x00\x00\x00\xb8(\x03\x00\x00\x00\x00\x00E)\x03\x00\x00\x00\x00\x002*\x03\x00\x00\x00\x00\x003*\x03\x00\x00\x00\x00\x004*\x03\x00\x00\x00\x00\x006*\x03\x00\x00\x00\x00\x00:*\x03\x00\x00\x00\x00\x00\x07+\x03\x00\x00\x00\x00\x00\x0c+\x03\x00\x00\x00\x00\x00"
+    b'\xa4+\x03\x00\x00\x00\x00\x00d-\x03\x00\x00\x00\x00\x00e-\x03\x00\x00\x00\x00\x00n-\x03\x00\x00\x00\x00\x00o-\x03\x00\x00\x00\x00\x00\xea-\x03\x00\x00\x00\x00\x00\xec-\x03\x00\x00\x00\x00\x00t.\x03\x00\x00\x00\x00\x00u.\x03\x00\x00\x00\x00\x00\x83.\x03\x00\x00\x00\x00\x00\x85.\x03\x00\x00\x00\x00\x00\xc8.\x03\x00\x00\x00\x00\x00'
+    b'\xc9.\x03\x00\x00\x00\x00\x00\xca.\x03\x00\x00\x00\x00\x00\xcb.\x03\x00\x00\x00\x00\x00\xcc.\x03\x00\x00\x00\x00\x00\xcd.\x03\x00\x00\x00\x00\x00\xce.\x03\x00\x00\x00\x00\x00\xcf.\x03\x00\x00\x00\x00\x00\xd0.\x03\x00\x00\x00\x00\x00\xd1.\x03\x00\x00\x00\x00\x00\xd2.\x03\x00\x00\x00\x00\x00\xd3.\x03\x00\x00\x00\x00\x00\xd9.\x03\x00\x00\x00\x00\x00'
+    b'\xe8.\x03\x00\x00\x00\x00\x00\x1f/\x03\x00\x00\x00\x00\x008/\x03\x00\x00\x00\x00\x00A/\x03\x00\x00\x00\x00\x00B/\x03\x00\x00\x00\x00\x00D/\x03\x00\x00\x00\x00\x00E/\x03\x00\x00\x00\x00\x00N/\x03\x00\x00\x00\x00\x00z/\x03\x00\x00\x00\x00\x00{/\x03\x00\x00\x00\x00\x00\x84/\x03\x00\x00\x00\x00\x00\x86/\x03\x00\x00\x00\x00\x00'
+    b'\x87/\x03\x00\x00\x00\x00\x00\xb0/\x03\x00\x00\x00\x00\x00\xd8/\x03\x00\x00\x00\x00\x00\xe5/\x03\x00\x00\x00\x00\x00\xc60\x03\x00\x00\x00\x00\x00\xc90\x03\x00\x00\x00\x00\x00\xcc0\x03\x00\x00\x00\x00\x00\xce0\x03\x00\x00\x00\x00\x00\xd20\x03\x00\x00\x00\x00\x00\xd40\x03\x00\x00\x00\x00\x00\xd60\x03\x00\x00\x00\x00\x00\x081\x03\x00\x00\x00\x00\x00'
+    b'\x1e1\x03\x00\x00\x00\x00\x00 1\x03\x00\x00\x00\x00\x00!1\x03\x00\x00\x00\x00\x00"1\x03\x00\x00\x00\x00\x00#1\x03\x00\x00\x00\x00\x00$1\x03\x00\x00\x00\x00\x00>1\x03\x00\x00\x00\x00\x0022\x03\x00\x00\x00\x00\x00C2\x03\x00\x00\x00\x00\x00R2\x03\x00\x00\x00\x00\x00\x902\x03\x00\x00\x00\x00\x00\x922\x03\x00\x00\x00\x00\x00'
+    b'\xbe2\x03\x00\x00\x00\x00\x00\xbf2\x03\x00\x00\x00\x00\x00\xc02\x03\x00\x00\x00\x00\x00\xc12\x03\x00\x00\x00\x00\x00h3\x03\x00\x00\x00\x00\x00\x8c3\x03\x00\x00\x00\x00\x00\x9e3\x03\x00\x00\x00\x00\x00\x9f3\x03\x00\x00\x00\x00\x00\xa13\x03\x00\x00\x00\x00\x00\xa63\x03\x00\x00\x00\x00\x00\xa83\x03\x00\x00\x00\x00\x00\xa93\x03\x00\x00\x00\x00\x00'
+    b'\x044\x03\x00\x00\x00\x00\x0035\x03\x00\x00\x00\x00\x00N5\x03\x00\x00\x00\x00\x00Q5\x03\x00\x00\x00\x00\x00[5\x03\x00\x00\x00\x00\x00\x0e6\x03\x00\x00\x00\x00\x00%6\x03\x00\x00\x00\x00\x00&6\x03\x00\x00\x00\x00\x00=6\x03\x00\x00\x00\x00\x00\x986\x03\x00\x00\x00\x00\x00\xa36\x03\x00\x00\x00\x00\x00\xa56\x03\x00\x00\x00\x00\x00'
+    b'\xe36\x03\x00\x00\x00\x00\x00\x1a7\x03\x00\x00\x00\x00\x00\x1b7\x03\x00\x00\x00\x00\x00\x1c7\x03\x00\x00\x00\x00\x00!7\x03\x00\x00\x00\x00\x00"7\x03\x00\x00\x00\x00\x00$7\x03\x00\x00\x00\x00\x0017\x03\x00\x00\x00\x00\x00\xdc8\x03\x00\x00\x00\x00\x00\xdd8\x03\x00\x00\x00\x00\x00\xde8\x03\x00\x00\x00\x00\x00\xdf8\x03\x00\x00\x00\x00\x00'
+    b"\xe08\x03\x00\x00\x00\x00\x00\x029\x03\x00\x00\x00\x00\x00\x039\x03\x00\x00\x00\x00\x00\x049\x03\x00\x00\x00\x00\x00\x189\x03\x00\x00\x00\x00\x00\x199\x03\x00\x00\x00\x00\x00\x1f9\x03\x00\x00\x00\x00\x00'9\x03\x00\x00\x00\x00\x00(9\x03\x00\x00\x00\x00\x00)9\x03\x00\x00\x00\x00\x00\x989\x03\x00\x00\x00\x00\x00\xc19\x03\x00\x00\x00\x00\x00"
+    b'\xd19\x03\x00\x00\x00\x00\x00\xe9:\x03\x00\x00\x00\x00\x00\xff:\x03\x00\x00\x00\x00\x00\x16;\x03\x00\x00\x00\x00\x00&;\x03\x00\x00\x00\x00\x00);\x03\x00\x00\x00\x00\x00`;\x03\x00\x00\x00\x00\x00\xd0;\x03\x00\x00\x00\x00\x00\xd5;\x03\x00\x00\x00\x00\x00\xdb;\x03\x00\x00\x00\x00\x00\xfd;\x03\x00\x00\x00\x00\x00:<\x03\x00\x00\x00\x00\x00'
+    b'<<\x03\x00\x00\x00\x00\x00=<\x03\x00\x00\x00\x00\x00><\x03\x00\x00\x00\x00\x00h<\x03\x00\x00\x00\x00\x00q<\x03\x00\x00\x00\x00\x00t<\x03\x00\x00\x00\x00\x00u<\x03\x00\x00\x00\x00\x00y<\x03\x00\x00\x00\x00\x00\x90<\x03\x00\x00\x00\x00\x00\x94<\x03\x00\x00\x00\x00\x00\xcc<\x03\x00\x00\x00\x00\x00\x0c=\x03\x00\x00\x00\x00\x00'
+    b'\x0e=\x03\x00\x00\x00\x00\x00%=\x03\x00\x00\x00\x00\x00)=\x03\x00\x00\x00\x00\x00/=\x03\x00\x00\x00\x00\x001=\x03\x00\x00\x00\x00\x002=\x03\x00\x00\x00\x00\x003=\x03\x00\x00\x00\x00\x00J=\x03\x00\x00\x00\x00\x00R=\x03\x00\x00\x00\x00\x00V=\x03\x00\x00\x00\x00\x00[=\x03\x00\x00\x00\x00\x00j=\x03\x00\x00\x00\x00\x00'
+    b'o=\x03\x00\x00\x00\x00\x00\xec=\x03\x00\x00\x00\x00\x00K>\x03\x00\x00\x00\x00\x00u>\x03\x00\x00\x00\x00\x00v>\x03\x00\x00\x00\x00\x00\xb7>\x03\x00\x00\x00\x00\x00\xee>\x03\x00\x00\x00\x00\x00\x0c?\x03\x00\x00\x00\x00\x00\xf3?\x03\x00\x00\x00\x00\x00"@\x03\x00\x00\x00\x00\x00$@\x03\x00\x00\x00\x00\x00%@\x03\x00\x00\x00\x00\x00'
+    b'HA\x03\x00\x00\x00\x00\x00KA\x03\x00\x00\x00\x00\x00|A\x03\x00\x00\x00\x00\x00~A\x03\x00\x00\x00\x00\x00kB\x03\x00\x00\x00\x00\x00xB\x03\x00\x00\x00\x00\x00\xb7B\x03\x00\x00\x00\x00\x00\xedB\x03\x00\x00\x00\x00\x00QD\x03\x00\x00\x00\x00\x00RD\x03\x00\x00\x00\x00\x00SD\x03\x00\x00\x00\x00\x00\xe1D\x03\x00\x00\x00\x00\x00'
+    b'\xe2D\x03\x00\x00\x00\x00\x00\xeaD\x03\x00\x00\x00\x00\x00\xebD\x03\x00\x00\x00\x00\x00\xecD\x03\x00\x00\x00\x00\x00\xf5D\x03\x00\x00\x00\x00\x00\xf6D\x03\x00\x00\x00\x00\x00\xf7D\x03\x00\x00\x00\x00\x00\x82E\x03\x00\x00\x00\x00\x00\x83E\x03\x00\x00\x00\x00\x00\xbfE\x03\x00\x00\x00\x00\x00\xc2E\x03\x00\x00\x00\x00\x00\xc3E\x03\x00\x00\x00\x00\x00'
+    b'\xd3E\x03\x00\x00\x00\x00\x00\xd5E\x03\x00\x00\x00\x00\x00\xd7E\x03\x00\x00\x00\x00\x00\xd8E\x03\x00\x00\x00\x00\x00\xd9E\x03\x00\x00\x00\x00\x00\xdaE\x03\x00\x00\x00\x00\x00\xdbE\x03\x00\x00\x00\x00\x00\xdcE\x03\x00\x00\x00\x00\x00\xddE\x03\x00\x00\x00\x00\x00\xdeE\x03\x00\x00\x00\x00\x00\xdfE\x03\x00\x00\x00\x00\x00\xe0E\x03\x00\x00\x00\x00\x00'
+    b'\xe1E\x03\x00\x00\x00\x00\x00\xe2E\x03\x00\x00\x00\x00\x00\xe4E\x03\x00\x00\x00\x00\x00\x01F\x03\x00\x00\x00\x00\x00\x03F\x03\x00\x00\x00\x00\x00\x08F\x03\x00\x00\x00\x00\x00\tF\x03\x00\x00\x00\x00\x00\x9cG\x03\x00\x00\x00\x00\x00\x9dG\x03\x00\x00\x00\x00\x00\xa0G\x03\x00\x00\x00\x00\x00\rH\x03\x00\x00\x00\x00\x00~H\x03\x00\x00\x00\x00\x00'
+    b'@I\x03\x00\x00\x00\x00\x00HI\x03\x00\x00\x00\x00\x00iI\x03\x00\x00\x00\x00\x00\xc2I\x03\x00\x00\x00\x00\x00\xcaI\x03\x00\x00\x00\x00\x00#J\x03\x00\x00\x00\x00\x00\x8aJ\x03\x00\x00\x00\x00\x00\x92J\x03\x00\x00\x00\x00\x00\xdbJ\x03\x00\x00\x00\x00\x00\xdcJ\x03\x00\x00\x00\x00\x00\xdfJ\x03\x00\x00\x00\x00\x00\xe0J\x03\x00\x00\x00\x00\x00'
+    b'\xe4J\x03\x00\x00\x00\x00\x00KL\x03\x00\x00\x00\x00\x00NL\x03\x00\x00\x00\x00\x00aM\x03\x00\x00\x00\x00\x00\xc2M\x03\x00\x00\x00\x00\x00\xc4M\x03\x00\x00\x00\x00\x00\xc9M\x03\x00\x00\x00\x00\x00\xdfN\x03\x00\x00\x00\x00\x00\xe0N\x03\x00\x00\x00\x00\x00\x87O\x03\x00\x00\x00\x00\x00\x92P\x03\x00\x00\x00\x00\x00\x97P\x03\x00\x00\x00\x00\x00'
+    b'\x99P\x03\x00\x00\x00\x00\x00\xb0P\x03\x00\x00\x00\x00\x00\xf6P\x03\x00\x00\x00\x00\x00\xfaP\x03\x00\x00\x00\x00\x00=Q\x03\x00\x00\x00\x00\x00?Q\x03\x00\x00\x00\x00\x00XR\x03\x00\x00\x00\x00\x00oU\x03\x00\x00\x00\x00\x00\xeaU\x03\x00\x00\x00\x00\x00\xf0U\x03\x00\x00\x00\x00\x004V\x03\x00\x00\x00\x00\x007V\x03\x00\x00\x00\x00\x00'
+    b'8V\x03\x00\x00\x00\x00\x009V\x03\x00\x00\x00\x00\x00:V\x03\x00\x00\x00\x00\x00;V\x03\x00\x00\x00\x00\x00=V\x03\x00\x00\x00\x00\x00?V\x03\x00\x00\x00\x00\x00CV\x03\x00\x00\x00\x00\x00EV\x03\x00\x00\x00\x00\x00FV\x03\x00\x00\x00\x00\x00\xc0V\x03\x00\x00\x00\x00\x004W\x03\x00\x00\x00\x00\x00FW\x03\x00\x00\x00\x00\x00'
+    b'IW\x03\x00\x00\x00\x00\x00JW\x03\x00\x00\x00\x00\x00KW\x03\x00\x00\x00\x00\x00XW\x03\x00\x00\x00\x00\x00\xc7W\x03\x00\x00\x00\x00\x00\xc8W\x03\x00\x00\x00\x00\x00\xc9W\x03\x00\x00\x00\x00\x00\xcaW\x03\x00\x00\x00\x00\x00\xcbW\x03\x00\x00\x00\x00\x00GX\x03\x00\x00\x00\x00\x00gX\x03\x00\x00\x00\x00\x00hX\x03\x00\x00\x00\x00\x00'
+    b'rX\x03\x00\x00\x00\x00\x00zX\x03\x00\x00\x00\x00\x00\x82X\x03\x00\x00\x00\x00\x00\x95X\x03\x00\x00\x00\x00\x00\xa0X\x03\x00\x00\x00\x00\x00\x8e[\x03\x00\x00\x00\x00\x00D\\\x03\x00\x00\x00\x00\x00\x82\\\x03\x00\x00\x00\x00\x00\x84\\\x03\x00\x00\x00\x00\x00\x86\\\x03\x00\x00\x00\x00\x00\x87\\\x03\x00\x00\x00\x00\x00\x8e\\\x03\x00\x00\x00\x00\x00'
+    b'\x92\\\x03\x00\x00\x00\x00\x00\x93\\\x03\x00\x00\x00\x00\x00\x9a\\\x03\x00\x00\x00\x00\x00B_\x03\x00\x00\x00\x00\x00\xe3_\x03\x00\x00\x00\x00\x00\xe5_\x03\x00\x00\x00\x00\x00\xe6_\x03\x00\x00\x00\x00\x00\xeb_\x03\x00\x00\x00\x00\x00]`\x03\x00\x00\x00\x00\x00\xc0a\x03\x00\x00\x00\x00\x00\xc3a\x03\x00\x00\x00\x00\x00\xc4a\x03\x00\x00\x00\x00\x00'
+    b'\xc5a\x03\x00\x00\x00\x00\x00\xc6a\x03\x00\x00\x00\x00\x00\xc7a\x03\x00\x00\x00\x00\x00\xc8a\x03\x00\x00\x00\x00\x00\xd0a\x03\x00\x00\x00\x00\x00\xdba\x03\x00\x00\x00\x00\x00;b\x03\x00\x00\x00\x00\x00Ab\x03\x00\x00\x00\x00\x00Lc\x03\x00\x00\x00\x00\x00\x0fd\x03\x00\x00\x00\x00\x00\x19d\x03\x00\x00\x00\x00\x00Ad\x03\x00\x00\x00\x00\x00'
+    b'\x95d\x03\x00\x00\x00\x00\x00\xcad\x03\x00\x00\x00\x00\x00\xcbd\x03\x00\x00\x00\x00\x00\xd8d\x03\x00\x00\x00\x00\x00\xdbd\x03\x00\x00\x00\x00\x00\xddd\x03\x00\x00\x00\x00\x00\xded\x03\x00\x00\x00\x00\x00\xe0d\x03\x00\x00\x00\x00\x00\xcfe\x03\x00\x00\x00\x00\x00\xf4e\x03\x00\x00\x00\x00\x00Tf\x03\x00\x00\x00\x00\x00nf\x03\x00\x00\x00\x00\x00'
+    b"\xb3f\x03\x00\x00\x00\x00\x00\xe6g\x03\x00\x00\x00\x00\x00\xe7g\x03\x00\x00\x00\x00\x00\xe9g\x03\x00\x00\x00\x00\x00\x1bh\x03\x00\x00\x00\x00\x00\x1dh\x03\x00\x00\x00\x00\x00&h\x03\x00\x00\x00\x00\x00'h\x03\x00\x00\x00\x00\x00zh\x03\x00\x00\x00\x00\x00\xa2h\x03\x00\x00\x00\x00\x00\xc4h\x03\x00\x00\x00\x00\x00\xc5h\x03\x00\x00\x00\x00\x00"
+    b'\xc7h\x03\x00\x00\x00\x00\x00\xcah\x03\x00\x00\x00\x00\x00\xcbh\x03\x00\x00\x00\x00\x00\xefh\x03\x00\x00\x00\x00\x00\xf0h\x03\x00\x00\x00\x00\x00\xf1h\x03\x00\x00\x00\x00\x00\xf2h\x03\x00\x00\x00\x00\x00\xf3h\x03\x00\x00\x00\x00\x00\xf4h\x03\x00\x00\x00\x00\x00\xf5h\x03\x00\x00\x00\x00\x00\xf6h\x03\x00\x00\x00\x00\x006i\x03\x00\x00\x00\x00\x00'
+    b'\xf5i\x03\x00\x00\x00\x00\x00\xfei\x03\x00\x00\x00\x00\x00`j\x03\x00\x00\x00\x00\x00aj\x03\x00\x00\x00\x00\x00bj\x03\x00\x00\x00\x00\x00cj\x03\x00\x00\x00\x00\x00\xc6j\x03\x00\x00\x00\x00\x00\xc7j\x03\x00\x00\x00\x00\x00\x1ck\x03\x00\x00\x00\x00\x00\x15l\x03\x00\x00\x00\x00\x00\x18l\x03\x00\x00\x00\x00\x00\x19l\x03\x00\x00\x00\x00\x00'
+    b'\x1al\x03\x00\x00\x00\x00\x00\x1bl\x03\x00\x00\x00\x00\x00\x1cl\x03\x00\x00\x00\x00\x00\x1dl\x03\x00\x00\x00\x00\x00tl\x03\x00\x00\x00\x00\x00\xb6l\x03\x00\x00\x00\x00\x00\xcbl\x03\x00\x00\x00\x00\x00\xcel\x03\x00\x00\x00\x00\x00\x0bm\x03\x00\x00\x00\x00\x00\x1dm\x03\x00\x00\x00\x00\x00\x1em\x03\x00\x00\x00\x00\x00dm\x03\x00\x00\x00\x00\x00'
+    b'im\x03\x00\x00\x00\x00\x00jm\x03\x00\x00\x00\x00\x00km\x03\x00\x00\x00\x00\x00\x83m\x03\x00\x00\x00\x00\x00\x8fn\x03\x00\x00\x00\x00\x00\x90n\x03\x00\x00\x00\x00\x00yo\x03\x00\x00\x00\x00\x00\xf1o\x03\x00\x00\x00\x00\x00\xf2o\x03\x00\x00\x00\x00\x00\xf3o\x03\x00\x00\x00\x00\x00\xf4o\x03\x00\x00\x00\x00\x00\tp\x03\x00\x00\x00\x00\x00'
+    b'\np\x03\x00\x00\x00\x00\x00\x0bp\x03\x00\x00\x00\x00\x00\x0cp\x03\x00\x00\x00\x00\x00\rp\x03\x00\x00\x00\x00\x00\x0ep\x03\x00\x00\x00\x00\x00\x0fp\x03\x00\x00\x00\x00\x00\x13p\x03\x00\x00\x00\x00\x00\x14p\x03\x00\x00\x00\x00\x00hp\x03\x00\x00\x00\x00\x00\xb3r\x03\x00\x00\x00\x00\x00\xe5s\x03\x00\x00\x00\x00\x00\xeas\x03\x00\x00\x00\x00\x00'
+    b'\xebs\x03\x00\x00\x00\x00\x00\xf5s\x03\x00\x00\x00\x00\x00\xf6s\x03\x00\x00\x00\x00\x00\x94t\x03\x00\x00\x00\x00\x00\x96t\x03\x00\x00\x00\x00\x00\x0eu\x03\x00\x00\x00\x00\x00\x0fu\x03\x00\x00\x00\x00\x00 u\x03\x00\x00\x00\x00\x00!u\x03\x00\x00\x00\x00\x00#u\x03\x00\x00\x00\x00\x00$u\x03\x00\x00\x00\x00\x00%u\x03\x00\x00\x00\x00\x00'
+    b"&u\x03\x00\x00\x00\x00\x00'u\x03\x00\x00\x00\x00\x00)u\x03\x00\x00\x00\x00\x00,u\x03\x00\x00\x00\x00\x00-u\x03\x00\x00\x00\x00\x00.u\x03\x00\x00\x00\x00\x00/u\x03\x00\x00\x00\x00\x00@u\x03\x00\x00\x00\x00\x00\x9fu\x03\x00\x00\x00\x00\x00\xa0u\x03\x00\x00\x00\x00\x00\xa1u\x03\x00\x00\x00\x00\x00\xa2u\x03\x00\x00\x00\x00\x00"
+    b'\xa3u\x03\x00\x00\x00\x00\x00\xa4u\x03\x00\x00\x00\x00\x00\xa5u\x03\x00\x00\x00\x00\x00\xa6u\x03\x00\x00\x00\x00\x00\xa7u\x03\x00\x00\x00\x00\x00\xa8u\x03\x00\x00\x00\x00\x00\xa9u\x03\x00\x00\x00\x00\x00\xaau\x03\x00\x00\x00\x00\x00\xaeu\x03\x00\x00\x00\x00\x00)v\x03\x00\x00\x00\x00\x00.w\x03\x00\x00\x00\x00\x00Ew\x03\x00\x00\x00\x00\x00'
+    b'ox\x03\x00\x00\x00\x00\x00\xcdx\x03\x00\x00\x00\x00\x00\xd9x\x03\x00\x00\x00\x00\x00,y\x03\x00\x00\x00\x00\x00Ay\x03\x00\x00\x00\x00\x00uy\x03\x00\x00\x00\x00\x00vy\x03\x00\x00\x00\x00\x00wy\x03\x00\x00\x00\x00\x00xy\x03\x00\x00\x00\x00\x00\x83y\x03\x00\x00\x00\x00\x00\x1dz\x03\x00\x00\x00\x00\x009z\x03\x00\x00\x00\x00\x00'
+    b'/{\x03\x00\x00\x00\x00\x000{\x03\x00\x00\x00\x00\x00@{\x03\x00\x00\x00\x00\x00B{\x03\x00\x00\x00\x00\x00C{\x03\x00\x00\x00\x00\x00M{\x03\x00\x00\x00\x00\x00O{\x03\x00\x00\x00\x00\x00e{\x03\x00\x00\x00\x00\x00\xf5{\x03\x00\x00\x00\x00\x00K|\x03\x00\x00\x00\x00\x00\xb8|\x03\x00\x00\x00\x00\x00\xe3|\x03\x00\x00\x00\x00\x00'
+    b'\xe5|\x03\x00\x00\x00\x00\x00\xe8|\x03\x00\x00\x00\x00\x00\xee|\x03\x00\x00\x00\x00\x00\xef|\x03\x00\x00\x00\x00\x00\\\x7f\x03\x00\x00\x00\x00\x00]\x7f\x03\x00\x00\x00\x00\x00^\x7f\x03\x00\x00\x00\x00\x00a\x7f\x03\x00\x00\x00\x00\x00b\x7f\x03\x00\x00\x00\x00\x00c\x7f\x03\x00\x00\x00\x00\x00d\x7f\x03\x00\x00\x00\x00\x00\x8e\x7f\x03\x00\x00\x00\x00\x00'
+    b'7\x80\x03\x00\x00\x00\x00\x00$\x81\x03\x00\x00\x00\x00\x00\xb1\x82\x03\x00\x00\x00\x00\x00\xb3\x82\x03\x00\x00\x00\x00\x00\xaa\x83\x03\x00\x00\x00\x00\x00\xab\x83\x03\x00\x00\x00\x00\x00\xae\x83\x03\x00\x00\x00\x00\x00\xc4\x83\x03\x00\x00\x00\x00\x00\xc5\x83\x03\x00\x00\x00\x00\x00\xc6\x83\x03\x00\x00\x00\x00\x00^\x85\x03\x00\x00\x00\x00\x00_\x85\x03\x00\x00\x00\x00\x00'
+    b'\x8c\x87\x03\x00\x00\x00\x00\x00\xda\x87\x03\x00\x00\x00\x00\x00\xdb\x87\x03\x00\x00\x00\x00\x00 \x88\x03\x00\x00\x00\x00\x00!\x88\x03\x00\x00\x00\x00\x00\x00\x89\x03\x00\x00\x00\x00\x00\x11\x89\x03\x00\x00\x00\x00\x00\x12\x89\x03\x00\x00\x00\x00\x00\x91\x89\x03\x00\x00\x00\x00\x00\x92\x89\x03\x00\x00\x00\x00\x00\xab\x8a\x03\x00\x00\x00\x00\x00\xad\x8a\x03\x00\x00\x00\x00\x00'
+    b'\xc6\x8a\x03\x00\x00\x00\x00\x00\xc7\x8a\x03\x00\x00\x00\x00\x00<\x8b\x03\x00\x00\x00\x00\x00?\x8b\x03\x00\x00\x00\x00\x00@\x8b\x03\x00\x00\x00\x00\x00A\x8b\x03\x00\x00\x00\x00\x00\x8d\x8b\x03\x00\x00\x00\x00\x00!\x8c\x03\x00\x00\x00\x00\x00p\x8c\x03\x00\x00\x00\x00\x00Z\x8d\x03\x00\x00\x00\x00\x00[\x8d\x03\x00\x00\x00\x00\x00\\\x8d\x03\x00\x00\x00\x00\x00'
+    b']\x8d\x03\x00\x00\x00\x00\x00\x14\x8e\x03\x00\x00\x00\x00\x00?\x8e\x03\x00\x00\x00\x00\x00F\x8e\x03\x00\x00\x00\x00\x00G\x8e\x03\x00\x00\x00\x00\x00H\x8e\x03\x00\x00\x00\x00\x00I\x8e\x03\x00\x00\x00\x00\x00J\x8e\x03\x00\x00\x00\x00\x00K\x8e\x03\x00\x00\x00\x00\x00\xdb\x8e\x03\x00\x00\x00\x00\x00\xdc\x8e\x03\x00\x00\x00\x00\x00T\x8f\x03\x00\x00\x00\x00\x00'
+    b'\xb9\x8f\x03\x00\x00\x00\x00\x00\xba\x8f\x03\x00\x00\x00\x00\x00s\x90\x03\x00\x00\x00\x00\x00{\x90\x03\x00\x00\x00\x00\x00|\x90\x03\x00\x00\x00\x00\x00}\x90\x03\x00\x00\x00\x00\x00\x16\x91\x03\x00\x00\x00\x00\x00\x17\x91\x03\x00\x00\x00\x00\x00\x18\x91\x03\x00\x00\x00\x00\x00\x19\x91\x03\x00\x00\x00\x00\x00\x1a\x91\x03\x00\x00\x00\x00\x00\x1b\x91\x03\x00\x00\x00\x00\x00'
+    b'\x1c\x91\x03\x00\x00\x00\x00\x00\x1d\x91\x03\x00\x00\x00\x00\x00\x1e\x91\x03\x00\x00\x00\x00\x00\x1f\x91\x03\x00\x00\x00\x00\x007\x91\x03\x00\x00\x00\x00\x00\t\x94\x03\x00\x00\x00\x00\x00u\x94\x03\x00\x00\x00\x00\x00v\x94\x03\x00\x00\x00\x00\x00x\x94\x03\x00\x00\x00\x00\x00y\x94\x03\x00\x00\x00\x00\x00z\x94\x03\x00\x00\x00\x00\x00{\x94\x03\x00\x00\x00\x00\x00'
+    b'|\x94\x03\x00\x00\x00\x00\x00}\x94\x03\x00\x00\x00\x00\x00~\x94\x03\x00\x00\x00\x00\x00\x7f\x94\x03\x00\x00\x00\x00\x00\x80\x94\x03\x00\x00\x00\x00\x00\xce\x94\x03\x00\x00\x00\x00\x00\xf5\x94\x03\x00\x00\x00\x00\x00=\x96\x03\x00\x00\x00\x00\x00?\x96\x03\x00\x00\x00\x00\x00w\x96\x03\x00\x00\x00\x00\x00\xd7\x96\x03\x00\x00\x00\x00\x00\xd8\x96\x03\x00\x00\x00\x00\x00'
+    b'\xd9\x96\x03\x00\x00\x00\x00\x00\xda\x96\x03\x00\x00\x00\x00\x00\xe0\x96\x03\x00\x00\x00\x00\x00\xe1\x96\x03\x00\x00\x00\x00\x00\xe2\x96\x03\x00\x00\x00\x00\x00\xe3\x96\x03\x00\x00\x00\x00\x00\xe4\x96\x03\x00\x00\x00\x00\x00\xe5\x96\x03\x00\x00\x00\x00\x00\xe6\x96\x03\x00\x00\x00\x00\x00\xe7\x96\x03\x00\x00\x00\x00\x00\xb1\x98\x03\x00\x00\x00\x00\x00\xe6\x98\x03\x00\x00\x00\x00\x00'
+    b'\xe7\x98\x03\x00\x00\x00\x00\x00\xe8\x98\x03\x00\x00\x00\x00\x00l\x99\x03\x00\x00\x00\x00\x00m\x99\x03\x00\x00\x00\x00\x00n\x99\x03\x00\x00\x00\x00\x00T\x9b\x03\x00\x00\x00\x00\x00W\x9b\x03\x00\x00\x00\x00\x00Y\x9b\x03\x00\x00\x00\x00\x00~\x9b\x03\x00\x00\x00\x00\x00\x7f\x9b\x03\x00\x00\x00\x00\x00\x80\x9b\x03\x00\x00\x00\x00\x00\x81\x9b\x03\x00\x00\x00\x00\x00'
+    b'\x82\x9b\x03\x00\x00\x00\x00\x00\x83\x9b\x03\x00\x00\x00\x00\x00\x85\x9b\x03\x00\x00\x00\x00\x00\x86\x9b\x03\x00\x00\x00\x00\x00\x87\x9b\x03\x00\x00\x00\x00\x00\x8d\x9b\x03\x00\x00\x00\x00\x00\x8e\x9b\x03\x00\x00\x00\x00\x00\x8f\x9b\x03\x00\x00\x00\x00\x00\x91\x9b\x03\x00\x00\x00\x00\x00\x92\x9b\x03\x00\x00\x00\x00\x00\x93\x9b\x03\x00\x00\x00\x00\x00\x95\x9b\x03\x00\x00\x00\x00\x00'
+    b'\x96\x9b\x03\x00\x00\x00\x00\x00\x97\x9b\x03\x00\x00\x00\x00\x00\x11\x9c\x03\x00\x00\x00\x00\x00\x1a\x9c\x03\x00\x00\x00\x00\x00\x1b\x9c\x03\x00\x00\x00\x00\x00\x1c\x9c\x03\x00\x00\x00\x00\x00\x1d\x9c\x03\x00\x00\x00\x00\x00\x1e\x9c\x03\x00\x00\x00\x00\x00\x1f\x9c\x03\x00\x00\x00\x00\x00<\x9c\x03\x00\x00\x00\x00\x00=\x9c\x03\x00\x00\x00\x00\x00>\x9c\x03\x00\x00\x00\x00\x00'
+    b'?\x9c\x03\x00\x00\x00\x00\x00F\x9c\x03\x00\x00\x00\x00\x00N\x9c\x03\x00\x00\x00\x00\x00O\x9c\x03\x00\x00\x00\x00\x00P\x9c\x03\x00\x00\x00\x00\x00m\x9c\x03\x00\x00\x00\x00\x00\xbf\x9c\x03\x00\x00\x00\x00\x00\xc0\x9c\x03\x00\x00\x00\x00\x00\xc1\x9c\x03\x00\x00\x00\x00\x00\xc2\x9c\x03\x00\x00\x00\x00\x00\xc3\x9c\x03\x00\x00\x00\x00\x00\xc4\x9c\x03\x00\x00\x00\x00\x00'
+    b'\xc5\x9c\x03\x00\x00\x00\x00\x00\xc6\x9c\x03\x00\x00\x00\x00\x00\xc7\x9c\x03\x00\x00\x00\x00\x00\xc8\x9c\x03\x00\x00\x00\x00\x00\xc9\x9c\x03\x00\x00\x00\x00\x00\x99\x9d\x03\x00\x00\x00\x00\x00\xb9\x9d\x03\x00\x00\x00\x00\x00\xfa\x9d\x03\x00\x00\x00\x00\x00\x96\x9e\x03\x00\x00\x00\x00\x00\xbe\x9e\x03\x00\x00\x00\x00\x00\x16\x9f\x03\x00\x00\x00\x00\x00\x17\x9f\x03\x00\x00\x00\x00\x00'
+    b'@\x9f\x03\x00\x00\x00\x00\x00A\x9f\x03\x00\x00\x00\x00\x00C\x9f\x03\x00\x00\x00\x00\x00E\x9f\x03\x00\x00\x00\x00\x00F\x9f\x03\x00\x00\x00\x00\x00G\x9f\x03\x00\x00\x00\x00\x00H\x9f\x03\x00\x00\x00\x00\x00Q\x9f\x03\x00\x00\x00\x00\x00R\x9f\x03\x00\x00\x00\x00\x00S\x9f\x03\x00\x00\x00\x00\x00^\x9f\x03\x00\x00\x00\x00\x00\xac\x9f\x03\x00\x00\x00\x00\x00'
+    b'\xd3\x9f\x03\x00\x00\x00\x00\x00\x06\xa0\x03\x00\x00\x00\x00\x00\x87\xa0\x03\x00\x00\x00\x00\x00\xb9\xa0\x03\x00\x00\x00\x00\x00\xba\xa0\x03\x00\x00\x00\x00\x00\xbb\xa0\x03\x00\x00\x00\x00\x00\xbc\xa0\x03\x00\x00\x00\x00\x00\xbd\xa0\x03\x00\x00\x00\x00\x00\xbe\xa0\x03\x00\x00\x00\x00\x00\xc0\xa0\x03\x00\x00\x00\x00\x00\xce\xa0\x03\x00\x00\x00\x00\x00\xdb\xa0\x03\x00\x00\x00\x00\x00'
+    b'\xd7\xa1\x03\x00\x00\x00\x00\x00\xda\xa1\x03\x00\x00\x00\x00\x00\xdb\xa1\x03\x00\x00\x00\x00\x00\xe0\xa1\x03\x00\x00\x00\x00\x00\xfc\xa1\x03\x00\x00\x00\x00\x00\t\xa2\x03\x00\x00\x00\x00\x00\n\xa2\x03\x00\x00\x00\x00\x00C\xa2\x03\x00\x00\x00\x00\x00H\xa3\x03\x00\x00\x00\x00\x00I\xa3\x03\x00\x00\x00\x00\x00J\xa3\x03\x00\x00\x00\x00\x00L\xa3\x03\x00\x00\x00\x00\x00'
+    b'M\xa3\x03\x00\x00\x00\x00\x00N\xa3\x03\x00\x00\x00\x00\x00R\xa3\x03\x00\x00\x00\x00\x00S\xa3\x03\x00\x00\x00\x00\x00T\xa3\x03\x00\x00\x00\x00\x00\x9a\xa3\x03\x00\x00\x00\x00\x00\x9b\xa3\x03\x00\x00\x00\x00\x00\x9c\xa3\x03\x00\x00\x00\x00\x00\x9d\xa3\x03\x00\x00\x00\x00\x00\x9e\xa3\x03\x00\x00\x00\x00\x00\x9f\xa3\x03\x00\x00\x00\x00\x00\xa2\xa3\x03\x00\x00\x00\x00\x00'
+    b'\xa3\xa3\x03\x00\x00\x00\x00\x00\xa4\xa3\x03\x00\x00\x00\x00\x00B\xa4\x03\x00\x00\x00\x00\x00h\xa4\x03\x00\x00\x00\x00\x00i\xa4\x03\x00\x00\x00\x00\x00\xc3\xa4\x03\x00\x00\x00\x00\x00\xff\xa4\x03\x00\x00\x00\x00\x00U\xa5\x03\x00\x00\x00\x00\x00\x8d\xa5\x03\x00\x00\x00\x00\x00\x8e\xa5\x03\x00\x00\x00\x00\x00\x8f\xa5\x03\x00\x00\x00\x00\x00\x90\xa5\x03\x00\x00\x00\x00\x00'
+    b'\x91\xa5\x03\x00\x00\x00\x00\x00\x92\xa5\x03\x00\x00\x00\x00\x00\x93\xa5\x03\x00\x00\x00\x00\x00\x94\xa5\x03\x00\x00\x00\x00\x00\xa9\xa5\x03\x00\x00\x00\x00\x00\xaa\xa5\x03\x00\x00\x00\x00\x00\xbf\xa8\x03\x00\x00\x00\x00\x00\xc0\xa8\x03\x00\x00\x00\x00\x00\xc1\xa8\x03\x00\x00\x00\x00\x00\xc2\xa8\x03\x00\x00\x00\x00\x00\xc3\xa8\x03\x00\x00\x00\x00\x00\xc4\xa8\x03\x00\x00\x00\x00\x00'
+    b'\xc5\xa8\x03\x00\x00\x00\x00\x00\xce\xa8\x03\x00\x00\x00\x00\x00\xcf\xa8\x03\x00\x00\x00\x00\x00\xd0\xa8\x03\x00\x00\x00\x00\x00\xfe\xa8\x03\x00\x00\x00\x00\x00\x1b\xa9\x03\x00\x00\x00\x00\x00<\xaa\x03\x00\x00\x00\x00\x00x\xaa\x03\x00\x00\x00\x00\x00y\xaa\x03\x00\x00\x00\x00\x00z\xaa\x03\x00\x00\x00\x00\x00\x9f\xaa\x03\x00\x00\x00\x00\x00\xa0\xaa\x03\x00\x00\x00\x00\x00'
+    b'\xcd\xab\x03\x00\x00\x00\x00\x00\xce\xab\x03\x00\x00\x00\x00\x00\xcf\xab\x03\x00\x00\x00\x00\x00\xd0\xab\x03\x00\x00\x00\x00\x00\xee\xab\x03\x00\x00\x00\x00\x00\xef\xab\x03\x00\x00\x00\x00\x00\xf0\xab\x03\x00\x00\x00\x00\x00\xf1\xab\x03\x00\x00\x00\x00\x00\xf2\xab\x03\x00\x00\x00\x00\x00\x1a\xac\x03\x00\x00\x00\x00\x00\xd3\xac\x03\x00\x00\x00\x00\x00\xdd\xac\x03\x00\x00\x00\x00\x00'
+    b'\xe5\xac\x03\x00\x00\x00\x00\x00\xe7\xac\x03\x00\x00\x00\x00\x00\xe8\xac\x03\x00\x00\x00\x00\x00_\xad\x03\x00\x00\x00\x00\x00b\xad\x03\x00\x00\x00\x00\x00d\xad\x03\x00\x00\x00\x00\x00e\xad\x03\x00\x00\x00\x00\x00k\xad\x03\x00\x00\x00\x00\x00m\xad\x03\x00\x00\x00\x00\x00o\xad\x03\x00\x00\x00\x00\x00q\xad\x03\x00\x00\x00\x00\x00z\xad\x03\x00\x00\x00\x00\x00'
+    b'|\xad\x03\x00\x00\x00\x00\x00~\xad\x03\x00\x00\x00\x00\x00\xdf\xad\x03\x00\x00\x00\x00\x00\xe0\xad\x03\x00\x00\x00\x00\x00\xe1\xad\x03\x00\x00\x00\x00\x00\xe2\xad\x03\x00\x00\x00\x00\x00\xe4\xad\x03\x00\x00\x00\x00\x00\xe5\xad\x03\x00\x00\x00\x00\x00\xe6\xad\x03\x00\x00\x00\x00\x00\xea\xad\x03\x00\x00\x00\x00\x00\xec\xad\x03\x00\x00\x00\x00\x00\x19\xae\x03\x00\x00\x00\x00\x00'
+    b'K\xae\x03\x00\x00\x00\x00\x00\xa5\xae\x03\x00\x00\x00\x00\x00a\xb0\x03\x00\x00\x00\x00\x00\x02\xb1\x03\x00\x00\x00\x00\x00\x03\xb1\x03\x00\x00\x00\x00\x00\x04\xb1\x03\x00\x00\x00\x00\x00\x05\xb1\x03\x00\x00\x00\x00\x00\xab\xb2\x03\x00\x00\x00\x00\x00\xac\xb2\x03\x00\x00\x00\x00\x00\xc2\xb2\x03\x00\x00\x00\x00\x00\xca\xb4\x03\x00\x00\x00\x00\x00\xcb\xb4\x03\x00\x00\x00\x00\x00'
+    b'\xcc\xb4\x03\x00\x00\x00\x00\x00\x1b\xb5\x03\x00\x00\x00\x00\x005\xb5\x03\x00\x00\x00\x00\x00\x9c\xb5\x03\x00\x00\x00\x00\x00\xa9\xb5\x03\x00\x00\x00\x00\x00\xab\xb5\x03\x00\x00\x00\x00\x00\xaf\xb5\x03\x00\x00\x00\x00\x00\xb6\xb5\x03\x00\x00\x00\x00\x00\xb7\xb5\x03\x00\x00\x00\x00\x00\xb8\xb5\x03\x00\x00\x00\x00\x00\xb9\xb5\x03\x00\x00\x00\x00\x00\xba\xb5\x03\x00\x00\x00\x00\x00'
+    b'\xbb\xb5\x03\x00\x00\x00\x00\x00\xbc\xb5\x03\x00\x00\x00\x00\x00\xbe\xb5\x03\x00\x00\x00\x00\x00\xbf\xb5\x03\x00\x00\x00\x00\x00\xc0\xb5\x03\x00\x00\x00\x00\x00\xc1\xb5\x03\x00\x00\x00\x00\x00\xc8\xb5\x03\x00\x00\x00\x00\x00%\xb6\x03\x00\x00\x00\x00\x00&\xb6\x03\x00\x00\x00\x00\x00\xb1\xb6\x03\x00\x00\x00\x00\x00\xb2\xb6\x03\x00\x00\x00\x00\x00\xb3\xb6\x03\x00\x00\x00\x00\x00'
+    b'\xb4\xb6\x03\x00\x00\x00\x00\x00\xb5\xb6\x03\x00\x00\x00\x00\x00\xb6\xb6\x03\x00\x00\x00\x00\x00\xcf\xb7\x03\x00\x00\x00\x00\x00\x16\xb8\x03\x00\x00\x00\x00\x00\xbf\xb9\x03\x00\x00\x00\x00\x00\x00\xbb\x03\x00\x00\x00\x00\x00\x83\xbb\x03\x00\x00\x00\x00\x00\x86\xbb\x03\x00\x00\x00\x00\x00\x87\xbb\x03\x00\x00\x00\x00\x00\x8a\xbb\x03\x00\x00\x00\x00\x00\x8b\xbb\x03\x00\x00\x00\x00\x00'
+    b'\x95\xbb\x03\x00\x00\x00\x00\x00<\xbd\x03\x00\x00\x00\x00\x00M\xbd\x03\x00\x00\x00\x00\x00N\xbd\x03\x00\x00\x00\x00\x00P\xbd\x03\x00\x00\x00\x00\x00Q\xbd\x03\x00\x00\x00\x00\x00R\xbd\x03\x00\x00\x00\x00\x00S\xbd\x03\x00\x00\x00\x00\x00\x88\xbd\x03\x00\x00\x00\x00\x00\x89\xbd\x03\x00\x00\x00\x00\x00\x8a\xbd\x03\x00\x00\x00\x00\x00\x8b\xbd\x03\x00\x00\x00\x00\x00'
+    b'#\xbe\x03\x00\x00\x00\x00\x00$\xbe\x03\x00\x00\x00\x00\x00]\xbf\x03\x00\x00\x00\x00\x00v\xbf\x03\x00\x00\x00\x00\x00y\xbf\x03\x00\x00\x00\x00\x00\x8a\xbf\x03\x00\x00\x00\x00\x00\xb2\xbf\x03\x00\x00\x00\x00\x00\xb3\xbf\x03\x00\x00\x00\x00\x00\xb4\xbf\x03\x00\x00\x00\x00\x00\xb5\xbf\x03\x00\x00\x00\x00\x00\xb6\xbf\x03\x00\x00\x00\x00\x00\xb7\xbf\x03\x00\x00\x00\x00\x00'
+    b'\xb8\xbf\x03\x00\x00\x00\x00\x00\xb9\xbf\x03\x00\x00\x00\x00\x00\xba\xbf\x03\x00\x00\x00\x00\x00\xbb\xbf\x03\x00\x00\x00\x00\x00\xbc\xbf\x03\x00\x00\x00\x00\x00\xbd\xbf\x03\x00\x00\x00\x00\x00\xbe\xbf\x03\x00\x00\x00\x00\x00\xbf\xbf\x03\x00\x00\x00\x00\x00\xc4\xbf\x03\x00\x00\x00\x00\x00C\xc0\x03\x00\x00\x00\x00\x00\xe2\xc0\x03\x00\x00\x00\x00\x00\xe4\xc0\x03\x00\x00\x00\x00\x00'
+    b'\xe5\xc0\x03\x00\x00\x00\x00\x00\xe6\xc0\x03\x00\x00\x00\x00\x00\xe7\xc0\x03\x00\x00\x00\x00\x00\xe8\xc0\x03\x00\x00\x00\x00\x00\xe9\xc0\x03\x00\x00\x00\x00\x00\xeb\xc0\x03\x00\x00\x00\x00\x00\xec\xc0\x03\x00\x00\x00\x00\x00\xed\xc0\x03\x00\x00\x00\x00\x005\xc1\x03\x00\x00\x00\x00\x009\xc1\x03\x00\x00\x00\x00\x00^\xc1\x03\x00\x00\x00\x00\x00e\xc1\x03\x00\x00\x00\x00\x00'
+    b'f\xc1\x03\x00\x00\x00\x00\x00g\xc1\x03\x00\x00\x00\x00\x00h\xc1\x03\x00\x00\x00\x00\x00i\xc1\x03\x00\x00\x00\x00\x00j\xc1\x03\x00\x00\x00\x00\x00k\xc1\x03\x00\x00\x00\x00\x00l\xc1\x03\x00\x00\x00\x00\x00m\xc1\x03\x00\x00\x00\x00\x00n\xc1\x03\x00\x00\x00\x00\x00o\xc1\x03\x00\x00\x00\x00\x00p\xc1\x03\x00\x00\x00\x00\x00q\xc1\x03\x00\x00\x00\x00\x00'
+    b'r\xc1\x03\x00\x00\x00\x00\x00s\xc1\x03\x00\x00\x00\x00\x00t\xc1\x03\x00\x00\x00\x00\x00u\xc1\x03\x00\x00\x00\x00\x00v\xc1\x03\x00\x00\x00\x00\x00w\xc1\x03\x00\x00\x00\x00\x00x\xc1\x03\x00\x00\x00\x00\x00y\xc1\x03\x00\x00\x00\x00\x00z\xc1\x03\x00\x00\x00\x00\x00\x11\xc2\x03\x00\x00\x00\x00\x007\xc2\x03\x00\x00\x00\x00\x008\xc2\x03\x00\x00\x00\x00\x00'
+    b'N\xc2\x03\x00\x00\x00\x00\x00w\xc2\x03\x00\x00\x00\x00\x00y\xc2\x03\x00\x00\x00\x00\x00|\xc2\x03\x00\x00\x00\x00\x00}\xc2\x03\x00\x00\x00\x00\x00~\xc2\x03\x00\x00\x00\x00\x00\xaa\xc2\x03\x00\x00\x00\x00\x00\xab\xc2\x03\x00\x00\x00\x00\x00\xac\xc2\x03\x00\x00\x00\x00\x00\xad\xc2\x03\x00\x00\x00\x00\x00\xae\xc2\x03\x00\x00\x00\x00\x00\xaf\xc2\x03\x00\x00\x00\x00\x00'
+    b'\xb0\xc2\x03\x00\x00\x00\x00\x00\xb2\xc2\x03\x00\x00\x00\x00\x00\xb3\xc2\x03\x00\x00\x00\x00\x00\xb4\xc2\x03\x00\x00\x00\x00\x00\xb5\xc2\x03\x00\x00\x00\x00\x00\xb6\xc2\x03\x00\x00\x00\x00\x00\xb7\xc2\x03\x00\x00\x00\x00\x00\xb8\xc2\x03\x00\x00\x00\x00\x00\xb9\xc2\x03\x00\x00\x00\x00\x00\xba\xc2\x03\x00\x00\x00\x00\x00\xbb\xc2\x03\x00\x00\x00\x00\x00\xbc\xc2\x03\x00\x00\x00\x00\x00'
+    b'\xc5\xc2\x03\x00\x00\x00\x00\x00\xf9\xc2\x03\x00\x00\x00\x00\x00\x0c\xc3\x03\x00\x00\x00\x00\x00\x15\xc3\x03\x00\x00\x00\x00\x00 \xc3\x03\x00\x00\x00\x00\x00+\xc3\x03\x00\x00\x00\x00\x00]\xc3\x03\x00\x00\x00\x00\x00\xd3\xc3\x03\x00\x00\x00\x00\x00\xd4\xc3\x03\x00\x00\x00\x00\x00\xec\xc3\x03\x00\x00\x00\x00\x00\xed\xc3\x03\x00\x00\x00\x00\x00\x18\xc4\x03\x00\x00\x00\x00\x00'
+    b']\xc4\x03\x00\x00\x00\x00\x00^\xc4\x03\x00\x00\x00\x00\x00c\xc4\x03\x00\x00\x00\x00\x00f\xc4\x03\x00\x00\x00\x00\x00k\xc4\x03\x00\x00\x00\x00\x00u\xc4\x03\x00\x00\x00\x00\x00v\xc4\x03\x00\x00\x00\x00\x00y\xc4\x03\x00\x00\x00\x00\x00\x92\xc4\x03\x00\x00\x00\x00\x00\xa4\xc4\x03\x00\x00\x00\x00\x00\xaa\xc4\x03\x00\x00\x00\x00\x00\xab\xc4\x03\x00\x00\x00\x00\x00'
+    b'\xad\xc4\x03\x00\x00\x00\x00\x00\xae\xc4\x03\x00\x00\x00\x00\x00\xaf\xc4\x03\x00\x00\x00\x00\x00\xb2\xc4\x03\x00\x00\x00\x00\x00X\xc5\x03\x00\x00\x00\x00\x00Y\xc5\x03\x00\x00\x00\x00\x00\x84\xc5\x03\x00\x00\x00\x00\x00\x85\xc5\x03\x00\x00\x00\x00\x00\x99\xc5\x03\x00\x00\x00\x00\x00\x9a\xc5\x03\x00\x00\x00\x00\x00\x9e\xc5\x03\x00\x00\x00\x00\x00\x9f\xc5\x03\x00\x00\x00\x00\x00'
+    b'\xa0\xc5\x03\x00\x00\x00\x00\x00\xa1\xc5\x03\x00\x00\x00\x00\x00\xc2\xc5\x03\x00\x00\x00\x00\x00\xc5\xc5\x03\x00\x00\x00\x00\x00\xc6\xc5\x03\x00\x00\x00\x00\x00\xc7\xc5\x03\x00\x00\x00\x00\x00\xc8\xc5\x03\x00\x00\x00\x00\x00\xc9\xc5\x03\x00\x00\x00\x00\x00\xf0\xc5\x03\x00\x00\x00\x00\x00\xf1\xc5\x03\x00\x00\x00\x00\x00\xf2\xc5\x03\x00\x00\x00\x00\x00\xf5\xc5\x03\x00\x00\x00\x00\x00'
+    b"\x04\xc6\x03\x00\x00\x00\x00\x00\x06\xc6\x03\x00\x00\x00\x00\x00\x08\xc6\x03\x00\x00\x00\x00\x00\n\xc6\x03\x00\x00\x00\x00\x00\x0b\xc6\x03\x00\x00\x00\x00\x00\x14\xc6\x03\x00\x00\x00\x00\x00\x15\xc6\x03\x00\x00\x00\x00\x00%\xc6\x03\x00\x00\x00\x00\x00'\xc6\x03\x00\x00\x00\x00\x00)\xc6\x03\x00\x00\x00\x00\x006\xc6\x03\x00\x00\x00\x00\x00M\xc6\x03\x00\x00\x00\x00\x00"
+    b'O\xc6\x03\x00\x00\x00\x00\x00W\xc6\x03\x00\x00\x00\x00\x00Y\xc6\x03\x00\x00\x00\x00\x00Z\xc6\x03\x00\x00\x00\x00\x00[\xc6\x03\x00\x00\x00\x00\x00\\\xc6\x03\x00\x00\x00\x00\x00]\xc6\x03\x00\x00\x00\x00\x00_\xc6\x03\x00\x00\x00\x00\x00`\xc6\x03\x00\x00\x00\x00\x00d\xc6\x03\x00\x00\x00\x00\x00i\xc6\x03\x00\x00\x00\x00\x00t\xc6\x03\x00\x00\x00\x00\x00'
+    b'\x7f\xc6\x03\x00\x00\x00\x00\x00\xa0\xc6\x03\x00\x00\x00\x00\x00\xa1\xc6\x03\x00\x00\x00\x00\x00\xa2\xc6\x03\x00\x00\x00\x00\x00\xa6\xc6\x03\x00\x00\x00\x00\x00\xa7\xc6\x03\x00\x00\x00\x00\x00\xab\xc6\x03\x00\x00\x00\x00\x00\xad\xc6\x03\x00\x00\x00\x00\x00\xaf\xc6\x03\x00\x00\x00\x00\x00\xb0\xc6\x03\x00\x00\x00\x00\x00\xb3\xc6\x03\x00\x00\x00\x00\x00\xf4\xc6\x03\x00\x00\x00\x00\x00'
+    b'\xf5\xc6\x03\x00\x00\x00\x00\x00\xf8\xc6\x03\x00\x00\x00\x00\x00\x03\xc7\x03\x00\x00\x00\x00\x00\t\xc7\x03\x00\x00\x00\x00\x00\x0b\xc7\x03\x00\x00\x00\x00\x00\x10\xc7\x03\x00\x00\x00\x00\x00\x12\xc7\x03\x00\x00\x00\x00\x00\x16\xc7\x03\x00\x00\x00\x00\x00\x19\xc7\x03\x00\x00\x00\x00\x00\x1f\xc7\x03\x00\x00\x00\x00\x00 \xc7\x03\x00\x00\x00\x00\x00!\xc7\x03\x00\x00\x00\x00\x00'
+    b'"\xc7\x03\x00\x00\x00\x00\x00#\xc7\x03\x00\x00\x00\x00\x00$\xc7\x03\x00\x00\x00\x00\x00%\xc7\x03\x00\x00\x00\x00\x00&\xc7\x03\x00\x00\x00\x00\x00\'\xc7\x03\x00\x00\x00\x00\x00(\xc7\x03\x00\x00\x00\x00\x00)\xc7\x03\x00\x00\x00\x00\x00*\xc7\x03\x00\x00\x00\x00\x00T\xc7\x03\x00\x00\x00\x00\x00W\xc7\x03\x00\x00\x00\x00\x00\xaf\xc7\x03\x00\x00\x00\x00\x00'
+    b'\x02\xc8\x03\x00\x00\x00\x00\x00\x03\xc8\x03\x00\x00\x00\x00\x00\\\xc8\x03\x00\x00\x00\x00\x00f\xc8\x03\x00\x00\x00\x00\x00\x06\xc9\x03\x00\x00\x00\x00\x00\x07\xc9\x03\x00\x00\x00\x00\x00\x08\xc9\x03\x00\x00\x00\x00\x00\t\xc9\x03\x00\x00\x00\x00\x00\n\xc9\x03\x00\x00\x00\x00\x00\x0b\xc9\x03\x00\x00\x00\x00\x00\x0c\xc9\x03\x00\x00\x00\x00\x00\r\xc9\x03\x00\x00\x00\x00\x00'
+    b'\x0e\xc9\x03\x00\x00\x00\x00\x00\x0f\xc9\x03\x00\x00\x00\x00\x00\x10\xc9\x03\x00\x00\x00\x00\x00\x11\xc9\x03\x00\x00\x00\x00\x00\x12\xc9\x03\x00\x00\x00\x00\x00\x13\xc9\x03\x00\x00\x00\x00\x00p\xc9\x03\x00\x00\x00\x00\x00\x9b\xc9\x03\x00\x00\x00\x00\x00\xc9\xc9\x03\x00\x00\x00\x00\x00\xca\xc9\x03\x00\x00\x00\x00\x00\xcb\xc9\x03\x00\x00\x00\x00\x00\xcc\xc9\x03\x00\x00\x00\x00\x00'
+    b'\xcd\xc9\x03\x00\x00\x00\x00\x00\xce\xc9\x03\x00\x00\x00\x00\x00\xcf\xc9\x03\x00\x00\x00\x00\x00\xd0\xc9\x03\x00\x00\x00\x00\x00\xe7\xc9\x03\x00\x00\x00\x00\x00\xed\xc9\x03\x00\x00\x00\x00\x00\xef\xc9\x03\x00\x00\x00\x00\x00\xf0\xc9\x03\x00\x00\x00\x00\x00\xfe\xc9\x03\x00\x00\x00\x00\x00\x06\xca\x03\x00\x00\x00\x00\x00\x17\xca\x03\x00\x00\x00\x00\x00\x18\xca\x03\x00\x00\x00\x00\x00'
+    b'"\xca\x03\x00\x00\x00\x00\x00#\xca\x03\x00\x00\x00\x00\x00$\xca\x03\x00\x00\x00\x00\x00%\xca\x03\x00\x00\x00\x00\x00\xd1\xca\x03\x00\x00\x00\x00\x00\xd2\xca\x03\x00\x00\x00\x00\x00\xd3\xca\x03\x00\x00\x00\x00\x00\xd8\xca\x03\x00\x00\x00\x00\x00\xee\xca\x03\x00\x00\x00\x00\x00\xf8\xca\x03\x00\x00\x00\x00\x00\xfd\xca\x03\x00\x00\x00\x00\x00 \xcb\x03\x00\x00\x00\x00\x00'
+    b'!\xcb\x03\x00\x00\x00\x00\x00"\xcb\x03\x00\x00\x00\x00\x00#\xcb\x03\x00\x00\x00\x00\x00$\xcb\x03\x00\x00\x00\x00\x00.\xcb\x03\x00\x00\x00\x00\x00>\xcb\x03\x00\x00\x00\x00\x00G\xcb\x03\x00\x00\x00\x00\x00T\xcb\x03\x00\x00\x00\x00\x00]\xcb\x03\x00\x00\x00\x00\x00^\xcb\x03\x00\x00\x00\x00\x00\xb0\xcb\x03\x00\x00\x00\x00\x00\xb1\xcb\x03\x00\x00\x00\x00\x00'
+    b'\xc8\xcb\x03\x00\x00\x00\x00\x00\xc9\xcb\x03\x00\x00\x00\x00\x00\xd9\xcb\x03\x00\x00\x00\x00\x00\xe9\xcb\x03\x00\x00\x00\x00\x00\xeb\xcb\x03\x00\x00\x00\x00\x00\r\xcc\x03\x00\x00\x00\x00\x00\x0e\xcc\x03\x00\x00\x00\x00\x002\xcc\x03\x00\x00\x00\x00\x00F\xcc\x03\x00\x00\x00\x00\x00G\xcc\x03\x00\x00\x00\x00\x00H\xcc\x03\x00\x00\x00\x00\x00I\xcc\x03\x00\x00\x00\x00\x00'
+    b'\xf8\xcc\x03\x00\x00\x00\x00\x00\x02\xcd\x03\x00\x00\x00\x00\x00;\xcd\x03\x00\x00\x00\x00\x00<\xcd\x03\x00\x00\x00\x00\x00?\xcd\x03\x00\x00\x00\x00\x00k\xcd\x03\x00\x00\x00\x00\x00l\xcd\x03\x00\x00\x00\x00\x00\xcf\xcd\x03\x00\x00\x00\x00\x00\xd0\xcd\x03\x00\x00\x00\x00\x00\x15\xce\x03\x00\x00\x00\x00\x00\x16\xce\x03\x00\x00\x00\x00\x00\x17\xce\x03\x00\x00\x00\x00\x00'
+    b'C\xce\x03\x00\x00\x00\x00\x00O\xce\x03\x00\x00\x00\x00\x00Q\xce\x03\x00\x00\x00\x00\x00W\xce\x03\x00\x00\x00\x00\x00Y\xce\x03\x00\x00\x00\x00\x00d\xce\x03\x00\x00\x00\x00\x00e\xce\x03\x00\x00\x00\x00\x00f\xce\x03\x00\x00\x00\x00\x00g\xce\x03\x00\x00\x00\x00\x00h\xce\x03\x00\x00\x00\x00\x00i\xce\x03\x00\x00\x00\x00\x00j\xce\x03\x00\x00\x00\x00\x00'
+    b'k\xce\x03\x00\x00\x00\x00\x00l\xce\x03\x00\x00\x00\x00\x00m\xce\x03\x00\x00\x00\x00\x00s\xce\x03\x00\x00\x00\x00\x00\x9d\xce\x03\x00\x00\x00\x00\x00\x9e\xce\x03\x00\x00\x00\x00\x00\x9f\xce\x03\x00\x00\x00\x00\x00\xa0\xce\x03\x00\x00\x00\x00\x00\xa1\xce\x03\x00\x00\x00\x00\x00\xb6\xce\x03\x00\x00\x00\x00\x00\xb7\xce\x03\x00\x00\x00\x00\x00\xb8\xce\x03\x00\x00\x00\x00\x00'
+    b'\xb9\xce\x03\x00\x00\x00\x00\x00\xba\xce\x03\x00\x00\x00\x00\x00\xc0\xce\x03\x00\x00\x00\x00\x00\xc2\xce\x03\x00\x00\x00\x00\x00\xc3\xce\x03\x00\x00\x00\x00\x00\xc4\xce\x03\x00\x00\x00\x00\x00\xd7\xce\x03\x00\x00\x00\x00\x00\xd8\xce\x03\x00\x00\x00\x00\x00\xdb\xce\x03\x00\x00\x00\x00\x00\xff\xce\x03\x00\x00\x00\x00\x005\xcf\x03\x00\x00\x00\x00\x00\xf0\xcf\x03\x00\x00\x00\x00\x00'
+    b'\x19\xd0\x03\x00\x00\x00\x00\x00\x1a\xd0\x03\x00\x00\x00\x00\x00\x1b\xd0\x03\x00\x00\x00\x00\x00\x1c\xd0\x03\x00\x00\x00\x00\x00\x1d\xd0\x03\x00\x00\x00\x00\x00\x1e\xd0\x03\x00\x00\x00\x00\x00\x1f\xd0\x03\x00\x00\x00\x00\x00 \xd0\x03\x00\x00\x00\x00\x00!\xd0\x03\x00\x00\x00\x00\x00e\xd0\x03\x00\x00\x00\x00\x00\xcd\xd0\x03\x00\x00\x00\x00\x00\xce\xd0\x03\x00\x00\x00\x00\x00'
+    b'\xd5\xd0\x03\x00\x00\x00\x00\x00\xe5\xd0\x03\x00\x00\x00\x00\x00\xeb\xd0\x03\x00\x00\x00\x00\x00\xee\xd0\x03\x00\x00\x00\x00\x00\xef\xd0\x03\x00\x00\x00\x00\x00)\xd1\x03\x00\x00\x00\x00\x00\xf0\xd1\x03\x00\x00\x00\x00\x00\xf4\xd1\x03\x00\x00\x00\x00\x00\xff\xd1\x03\x00\x00\x00\x00\x00\x00\xd2\x03\x00\x00\x00\x00\x00\x11\xd2\x03\x00\x00\x00\x00\x00\x13\xd2\x03\x00\x00\x00\x00\x00'
+    b'*\xd2\x03\x00\x00\x00\x00\x002\xd2\x03\x00\x00\x00\x00\x00r\xd2\x03\x00\x00\x00\x00\x00s\xd2\x03\x00\x00\x00\x00\x00t\xd2\x03\x00\x00\x00\x00\x00u\xd2\x03\x00\x00\x00\x00\x00\xac\xd2\x03\x00\x00\x00\x00\x00\xad\xd2\x03\x00\x00\x00\x00\x00\xaf\xd2\x03\x00\x00\x00\x00\x00\xb0\xd2\x03\x00\x00\x00\x00\x00\xb1\xd2\x03\x00\x00\x00\x00\x00\xb3\xd2\x03\x00\x00\x00\x00\x00'
+    b'\xb4\xd2\x03\x00\x00\x00\x00\x00\xb6\xd2\x03\x00\x00\x00\x00\x00\xb7\xd2\x03\x00\x00\x00\x00\x00\xbb\xd2\x03\x00\x00\x00\x00\x00\xdf\xd2\x03\x00\x00\x00\x00\x00\xe9\xd2\x03\x00\x00\x00\x00\x00\xec\xd2\x03\x00\x00\x00\x00\x00\xed\xd2\x03\x00\x00\x00\x00\x00*\xd3\x03\x00\x00\x00\x00\x00+\xd3\x03\x00\x00\x00\x00\x00-\xd3\x03\x00\x00\x00\x00\x00.\xd3\x03\x00\x00\x00\x00\x00'
+    b'\x84\xd3\x03\x00\x00\x00\x00\x00\xe1\xd3\x03\x00\x00\x00\x00\x00\xe4\xd3\x03\x00\x00\x00\x00\x00\xe5\xd3\x03\x00\x00\x00\x00\x00\xe6\xd3\x03\x00\x00\x00\x00\x00\xea\xd3\x03\x00\x00\x00\x00\x00\xeb\xd3\x03\x00\x00\x00\x00\x00\x1a\xd4\x03\x00\x00\x00\x00\x004\xd4\x03\x00\x00\x00\x00\x00|\xd4\x03\x00\x00\x00\x00\x00}\xd4\x03\x00\x00\x00\x00\x00\xc3\xd4\x03\x00\x00\x00\x00\x00'
+    b';\xd5\x03\x00\x00\x00\x00\x00?\xd5\x03\x00\x00\x00\x00\x00\xa9\xd5\x03\x00\x00\x00\x00\x00\xb6\xd5\x03\x00\x00\x00\x00\x00\xb7\xd5\x03\x00\x00\x00\x00\x00\xba\xd5\x03\x00\x00\x00\x00\x00\xbb\xd5\x03\x00\x00\x00\x00\x00\xc5\xd5\x03\x00\x00\x00\x00\x00\xc6\xd5\x03\x00\x00\x00\x00\x00\xc7\xd5\x03\x00\x00\x00\x00\x00\xc8\xd5\x03\x00\x00\x00\x00\x00\xc9\xd5\x03\x00\x00\x00\x00\x00'
+    b'\xca\xd5\x03\x00\x00\x00\x00\x00\xcb\xd5\x03\x00\x00\x00\x00\x00\xcc\xd5\x03\x00\x00\x00\x00\x00\xcd\xd5\x03\x00\x00\x00\x00\x00\xce\xd5\x03\x00\x00\x00\x00\x00\xcf\xd5\x03\x00\x00\x00\x00\x00\xd0\xd5\x03\x00\x00\x00\x00\x00\xd1\xd5\x03\x00\x00\x00\x00\x00\xd2\xd5\x03\x00\x00\x00\x00\x00\xd3\xd5\x03\x00\x00\x00\x00\x00\xd6\xd5\x03\x00\x00\x00\x00\x00\xd7\xd5\x03\x00\x00\x00\x00\x00'
+    b'\xd8\xd5\x03\x00\x00\x00\x00\x00\xd9\xd5\x03\x00\x00\x00\x00\x00\xda\xd5\x03\x00\x00\x00\x00\x00f\xd6\x03\x00\x00\x00\x00\x00k\xd6\x03\x00\x00\x00\x00\x00\xe6\xd6\x03\x00\x00\x00\x00\x00\xe7\xd6\x03\x00\x00\x00\x00\x00\xe8\xd6\x03\x00\x00\x00\x00\x00\xe9\xd6\x03\x00\x00\x00\x00\x00\xea\xd6\x03\x00\x00\x00\x00\x00\xeb\xd6\x03\x00\x00\x00\x00\x00\xec\xd6\x03\x00\x00\x00\x00\x00'
+    b'\xed\xd6\x03\x00\x00\x00\x00\x005\xd7\x03\x00\x00\x00\x00\x006\xd7\x03\x00\x00\x00\x00\x00M\xd7\x03\x00\x00\x00\x00\x00O\xd7\x03\x00\x00\x00\x00\x00P\xd7\x03\x00\x00\x00\x00\x00Y\xd7\x03\x00\x00\x00\x00\x00Z\xd7\x03\x00\x00\x00\x00\x00\xd3\xd7\x03\x00\x00\x00\x00\x00\x03\xd8\x03\x00\x00\x00\x00\x00\x04\xd8\x03\x00\x00\x00\x00\x00\x05\xd8\x03\x00\x00\x00\x00\x00'
+    b'\r\xd8\x03\x00\x00\x00\x00\x00\x0e\xd8\x03\x00\x00\x00\x00\x00\x18\xd8\x03\x00\x00\x00\x00\x00\x19\xd8\x03\x00\x00\x00\x00\x00?\xd8\x03\x00\x00\x00\x00\x00M\xd8\x03\x00\x00\x00\x00\x00N\xd8\x03\x00\x00\x00\x00\x00\xae\xd8\x03\x00\x00\x00\x00\x00\xb0\xd8\x03\x00\x00\x00\x00\x00\xb1\xd8\x03\x00\x00\x00\x00\x00\xb2\xd8\x03\x00\x00\x00\x00\x00\xb3\xd8\x03\x00\x00\x00\x00\x00'
+    b'\xb4\xd8\x03\x00\x00\x00\x00\x00\xba\xd8\x03\x00\x00\x00\x00\x00\x10\xd9\x03\x00\x00\x00\x00\x00\x14\xd9\x03\x00\x00\x00\x00\x00=\xd9\x03\x00\x00\x00\x00\x00E\xd9\x03\x00\x00\x00\x00\x00\x83\xd9\x03\x00\x00\x00\x00\x00\x84\xd9\x03\x00\x00\x00\x00\x00\x88\xd9\x03\x00\x00\x00\x00\x00\x8a\xd9\x03\x00\x00\x00\x00\x00\x92\xd9\x03\x00\x00\x00\x00\x00\x15\xda\x03\x00\x00\x00\x00\x00'
+    b'\x16\xda\x03\x00\x00\x00\x00\x00\x1b\xda\x03\x00\x00\x00\x00\x00\x1c\xda\x03\x00\x00\x00\x00\x00\x1e\xda\x03\x00\x00\x00\x00\x00\x1f\xda\x03\x00\x00\x00\x00\x00`\xda\x03\x00\x00\x00\x00\x00\xa6\xda\x03\x00\x00\x00\x00\x00\xa8\xda\x03\x00\x00\x00\x00\x00d\xdb\x03\x00\x00\x00\x00\x00e\xdb\x03\x00\x00\x00\x00\x00f\xdb\x03\x00\x00\x00\x00\x00g\xdb\x03\x00\x00\x00\x00\x00'
+    b'h\xdb\x03\x00\x00\x00\x00\x00j\xdb\x03\x00\x00\x00\x00\x00r\xdb\x03\x00\x00\x00\x00\x00s\xdb\x03\x00\x00\x00\x00\x00t\xdb\x03\x00\x00\x00\x00\x00v\xdb\x03\x00\x00\x00\x00\x00w\xdb\x03\x00\x00\x00\x00\x00y\xdb\x03\x00\x00\x00\x00\x00z\xdb\x03\x00\x00\x00\x00\x00|\xdb\x03\x00\x00\x00\x00\x00}\xdb\x03\x00\x00\x00\x00\x00\x7f\xdb\x03\x00\x00\x00\x00\x00'
+    b'\x81\xdb\x03\x00\x00\x00\x00\x00\x82\xdb\x03\x00\x00\x00\x00\x00\x84\xdb\x03\x00\x00\x00\x00\x00\xb6\xdb\x03\x00\x00\x00\x00\x00\xba\xdb\x03\x00\x00\x00\x00\x00\xc1\xdb\x03\x00\x00\x00\x00\x00\xc3\xdb\x03\x00\x00\x00\x00\x00\xcf\xdb\x03\x00\x00\x00\x00\x00\xdd\xdb\x03\x00\x00\x00\x00\x00\xde\xdb\x03\x00\x00\x00\x00\x00\x10\xdc\x03\x00\x00\x00\x00\x00\x11\xdc\x03\x00\x00\x00\x00\x00'
+    b'\xbd\xdc\x03\x00\x00\x00\x00\x00\xbf\xdc\x03\x00\x00\x00\x00\x00\xd6\xdc\x03\x00\x00\x00\x00\x00\x06\xdd\x03\x00\x00\x00\x00\x00\x07\xdd\x03\x00\x00\x00\x00\x00\x0b\xdd\x03\x00\x00\x00\x00\x00\x0c\xdd\x03\x00\x00\x00\x00\x00\x10\xdd\x03\x00\x00\x00\x00\x00\x15\xdd\x03\x00\x00\x00\x00\x00\x16\xdd\x03\x00\x00\x00\x00\x00 \xdd\x03\x00\x00\x00\x00\x00!\xdd\x03\x00\x00\x00\x00\x00'
+    b')\xdd\x03\x00\x00\x00\x00\x00*\xdd\x03\x00\x00\x00\x00\x00A\xdd\x03\x00\x00\x00\x00\x00B\xdd\x03\x00\x00\x00\x00\x00C\xdd\x03\x00\x00\x00\x00\x00D\xdd\x03\x00\x00\x00\x00\x00h\xdd\x03\x00\x00\x00\x00\x00i\xdd\x03\x00\x00\x00\x00\x00\xb0\xdd\x03\x00\x00\x00\x00\x00\xc5\xdd\x03\x00\x00\x00\x00\x00:\xde\x03\x00\x00\x00\x00\x00;\xde\x03\x00\x00\x00\x00\x00'
+    b'T\xde\x03\x00\x00\x00\x00\x00W\xde\x03\x00\x00\x00\x00\x00X\xde\x03\x00\x00\x00\x00\x00Z\xde\x03\x00\x00\x00\x00\x00\x91\xde\x03\x00\x00\x00\x00\x00\xb9\xde\x03\x00\x00\x00\x00\x00\xbb\xde\x03\x00\x00\x00\x00\x00\xc7\xde\x03\x00\x00\x00\x00\x00\xc8\xde\x03\x00\x00\x00\x00\x00\xeb\xde\x03\x00\x00\x00\x00\x00\xec\xde\x03\x00\x00\x00\x00\x00\xef\xde\x03\x00\x00\x00\x00\x00'
+    b'\xfc\xde\x03\x00\x00\x00\x00\x00\x04\xdf\x03\x00\x00\x00\x00\x00:\xdf\x03\x00\x00\x00\x00\x00<\xdf\x03\x00\x00\x00\x00\x00\x80\xdf\x03\x00\x00\x00\x00\x00\x92\xdf\x03\x00\x00\x00\x00\x00\xa5\xdf\x03\x00\x00\x00\x00\x001\xe0\x03\x00\x00\x00\x00\x003\xe0\x03\x00\x00\x00\x00\x00\x91\xe0\x03\x00\x00\x00\x00\x00\x92\xe0\x03\x00\x00\x00\x00\x00\x93\xe0\x03\x00\x00\x00\x00\x00'
+    b'\x94\xe0\x03\x00\x00\x00\x00\x00\x95\xe0\x03\x00\x00\x00\x00\x00\x96\xe0\x03\x00\x00\x00\x00\x00\x98\xe0\x03\x00\x00\x00\x00\x00\xab\xe0\x03\x00\x00\x00\x00\x00\xad\xe0\x03\x00\x00\x00\x00\x00\xaf\xe0\x03\x00\x00\x00\x00\x00\xb0\xe0\x03\x00\x00\x00\x00\x00\xb1\xe0\x03\x00\x00\x00\x00\x00\xb3\xe0\x03\x00\x00\x00\x00\x00\xb5\xe0\x03\x00\x00\x00\x00\x00\xb6\xe0\x03\x00\x00\x00\x00\x00'
+    b'\xb7\xe0\x03\x00\x00\x00\x00\x00\xb8\xe0\x03\x00\x00\x00\x00\x00\xb9\xe0\x03\x00\x00\x00\x00\x00\x10\xe1\x03\x00\x00\x00\x00\x00\x0c\xe2\x03\x00\x00\x00\x00\x00\r\xe2\x03\x00\x00\x00\x00\x00\x0e\xe2\x03\x00\x00\x00\x00\x00\x0f\xe2\x03\x00\x00\x00\x00\x00\x15\xe2\x03\x00\x00\x00\x00\x00\x19\xe2\x03\x00\x00\x00\x00\x00\x1a\xe2\x03\x00\x00\x00\x00\x00\x1b\xe2\x03\x00\x00\x00\x00\x00'
+    b'\x1c\xe2\x03\x00\x00\x00\x00\x00\x1d\xe2\x03\x00\x00\x00\x00\x00\x1e\xe2\x03\x00\x00\x00\x00\x00\x1f\xe2\x03\x00\x00\x00\x00\x00!\xe2\x03\x00\x00\x00\x00\x00"\xe2\x03\x00\x00\x00\x00\x00#\xe2\x03\x00\x00\x00\x00\x00%\xe2\x03\x00\x00\x00\x00\x00&\xe2\x03\x00\x00\x00\x00\x00D\xe2\x03\x00\x00\x00\x00\x00Y\xe2\x03\x00\x00\x00\x00\x00E\xe3\x03\x00\x00\x00\x00\x00'
+    b'`\xe4\x03\x00\x00\x00\x00\x00a\xe4\x03\x00\x00\x00\x00\x00\xdb\xe4\x03\x00\x00\x00\x00\x00!\xe5\x03\x00\x00\x00\x00\x00R\xe5\x03\x00\x00\x00\x00\x00S\xe5\x03\x00\x00\x00\x00\x00T\xe5\x03\x00\x00\x00\x00\x00U\xe5\x03\x00\x00\x00\x00\x00V\xe5\x03\x00\x00\x00\x00\x00q\xe5\x03\x00\x00\x00\x00\x00y\xe5\x03\x00\x00\x00\x00\x00\x7f\xe5\x03\x00\x00\x00\x00\x00'
+    b'\x8a\xe5\x03\x00\x00\x00\x00\x00\x92\xe5\x03\x00\x00\x00\x00\x00\xbd\xe7\x03\x00\x00\x00\x00\x00i\xe9\x03\x00\x00\x00\x00\x00u\xe9\x03\x00\x00\x00\x00\x00\x05\xeb\x03\x00\x00\x00\x00\x00J\xeb\x03\x00\x00\x00\x00\x00\x82\xeb\x03\x00\x00\x00\x00\x00\xa1\xeb\x03\x00\x00\x00\x00\x00,\xed\x03\x00\x00\x00\x00\x00n\xed\x03\x00\x00\x00\x00\x00o\xed\x03\x00\x00\x00\x00\x00'
+    b'p\xed\x03\x00\x00\x00\x00\x00\x8b\xed\x03\x00\x00\x00\x00\x00\xb0\xed\x03\x00\x00\x00\x00\x00]\xee\x03\x00\x00\x00\x00\x00^\xee\x03\x00\x00\x00\x00\x00\xa2\xee\x03\x00\x00\x00\x00\x00\xa3\xee\x03\x00\x00\x00\x00\x00\xb7\xee\x03\x00\x00\x00\x00\x00\xbc\xee\x03\x00\x00\x00\x00\x00\xbe\xee\x03\x00\x00\x00\x00\x00\xbf\xee\x03\x00\x00\x00\x00\x00\xc1\xee\x03\x00\x00\x00\x00\x00'
+    b'\xc4\xee\x03\x00\x00\x00\x00\x00\xc5\xee\x03\x00\x00\x00\x00\x00\xc7\xee\x03\x00\x00\x00\x00\x00\xca\xee\x03\x00\x00\x00\x00\x00\xcd\xee\x03\x00\x00\x00\x00\x00\xce\xee\x03\x00\x00\x00\x00\x00\xd0\xee\x03\x00\x00\x00\x00\x00\xd1\xee\x03\x00\x00\x00\x00\x00\xd2\xee\x03\x00\x00\x00\x00\x00\xd3\xee\x03\x00\x00\x00\x00\x00\xd5\xee\x03\x00\x00\x00\x00\x00\xd7\xee\x03\x00\x00\x00\x00\x00'
+    b'\xd9\xee\x03\x00\x00\x00\x00\x00\xda\xee\x03\x00\x00\x00\x00\x00\xdc\xee\x03\x00\x00\x00\x00\x00\xdd\xee\x03\x00\x00\x00\x00\x00\xe1\xee\x03\x00\x00\x00\x00\x00\xe2\xee\x03\x00\x00\x00\x00\x00\xe4\xee\x03\x00\x00\x00\x00\x00\xe6\xee\x03\x00\x00\x00\x00\x00\xe7\xee\x03\x00\x00\x00\x00\x00\xe8\xee\x03\x00\x00\x00\x00\x00\xe9\xee\x03\x00\x00\x00\x00\x00\xea\xee\x03\x00\x00\x00\x00\x00'
+    b'\xec\xee\x03\x00\x00\x00\x00\x00\xed\xee\x03\x00\x00\x00\x00\x00\xee\xee\x03\x00\x00\x00\x00\x00\xef\xee\x03\x00\x00\x00\x00\x00\xf0\xee\x03\x00\x00\x00\x00\x00\xf1\xee\x03\x00\x00\x00\x00\x00\xf2\xee\x03\x00\x00\x00\x00\x00\xf3\xee\x03\x00\x00\x00\x00\x00\xf4\xee\x03\x00\x00\x00\x00\x00\xf5\xee\x03\x00\x00\x00\x00\x00\xf8\xee\x03\x00\x00\x00\x00\x00\xf9\xee\x03\x00\x00\x00\x00\x00'
+    b'\x05\xef\x03\x00\x00\x00\x00\x00\x0c\xef\x03\x00\x00\x00\x00\x00\r\xef\x03\x00\x00\x00\x00\x00\x0e\xef\x03\x00\x00\x00\x00\x00\x0f\xef\x03\x00\x00\x00\x00\x00p\xef\x03\x00\x00\x00\x00\x00q\xef\x03\x00\x00\x00\x00\x00r\xef\x03\x00\x00\x00\x00\x00s\xef\x03\x00\x00\x00\x00\x00\x07\xf1\x03\x00\x00\x00\x00\x00Z\xf1\x03\x00\x00\x00\x00\x00]\xf1\x03\x00\x00\x00\x00\x00'
+    b'\x8a\xf1\x03\x00\x00\x00\x00\x00\x8b\xf1\x03\x00\x00\x00\x00\x00\x9a\xf1\x03\x00\x00\x00\x00\x00\xb2\xf1\x03\x00\x00\x00\x00\x00\xc3\xf1\x03\x00\x00\x00\x00\x00\xc4\xf1\x03\x00\x00\x00\x00\x00\x15\xf2\x03\x00\x00\x00\x00\x00\x16\xf2\x03\x00\x00\x00\x00\x00\x17\xf2\x03\x00\x00\x00\x00\x00\x18\xf2\x03\x00\x00\x00\x00\x00I\xf2\x03\x00\x00\x00\x00\x00\x8b\xf2\x03\x00\x00\x00\x00\x00'
+    b'\x8d\xf2\x03\x00\x00\x00\x00\x00\xae\xf2\x03\x00\x00\x00\x00\x00\xaf\xf2\x03\x00\x00\x00\x00\x00\xc3\xf2\x03\x00\x00\x00\x00\x00\xd1\xf2\x03\x00\x00\x00\x00\x00\xd2\xf2\x03\x00\x00\x00\x00\x00\xd3\xf2\x03\x00\x00\x00\x00\x00\xd4\xf2\x03\x00\x00\x00\x00\x00\xd5\xf2\x03\x00\x00\x00\x00\x00\xd6\xf2\x03\x00\x00\x00\x00\x00\xd7\xf2\x03\x00\x00\x00\x00\x00\xd8\xf2\x03\x00\x00\x00\x00\x00'
+    b'\xe6\xf2\x03\x00\x00\x00\x00\x00\xe7\xf2\x03\x00\x00\x00\x00\x00\xe8\xf2\x03\x00\x00\x00\x00\x00\xe9\xf2\x03\x00\x00\x00\x00\x00\xea\xf2\x03\x00\x00\x00\x00\x00\xeb\xf2\x03\x00\x00\x00\x00\x00\xec\xf2\x03\x00\x00\x00\x00\x00\xed\xf2\x03\x00\x00\x00\x00\x00\xee\xf2\x03\x00\x00\x00\x00\x00\xef\xf2\x03\x00\x00\x00\x00\x00\xf0\xf2\x03\x00\x00\x00\x00\x00\xf1\xf2\x03\x00\x00\x00\x00\x00'
+    b'\xf2\xf2\x03\x00\x00\x00\x00\x00\xf3\xf2\x03\x00\x00\x00\x00\x00\xf4\xf2\x03\x00\x00\x00\x00\x00\xf5\xf2\x03\x00\x00\x00\x00\x00\xf6\xf2\x03\x00\x00\x00\x00\x00\xf7\xf2\x03\x00\x00\x00\x00\x00\xf8\xf2\x03\x00\x00\x00\x00\x00\xf9\xf2\x03\x00\x00\x00\x00\x00\xfa\xf2\x03\x00\x00\x00\x00\x00\xfb\xf2\x03\x00\x00\x00\x00\x002\xf3\x03\x00\x00\x00\x00\x00u\xf3\x03\x00\x00\x00\x00\x00'
+    b"\xa0\xf3\x03\x00\x00\x00\x00\x00\xab\xf7\x03\x00\x00\x00\x00\x00\xac\xf7\x03\x00\x00\x00\x00\x00\x01\xf8\x03\x00\x00\x00\x00\x00\x05\xf8\x03\x00\x00\x00\x00\x00\x1a\xf8\x03\x00\x00\x00\x00\x00\x1b\xf8\x03\x00\x00\x00\x00\x00\x1c\xf8\x03\x00\x00\x00\x00\x00'\xf9\x03\x00\x00\x00\x00\x00(\xf9\x03\x00\x00\x00\x00\x00*\xf9\x03\x00\x00\x00\x00\x00+\xf9\x03\x00\x00\x00\x00\x00"
+    b',\xf9\x03\x00\x00\x00\x00\x00D\xfc\x03\x00\x00\x00\x00\x00F\xfc\x03\x00\x00\x00\x00\x00G\xfc\x03\x00\x00\x00\x00\x00L\xfc\x03\x00\x00\x00\x00\x00x\xfc\x03\x00\x00\x00\x00\x00y\xfc\x03\x00\x00\x00\x00\x00\x97\xfc\x03\x00\x00\x00\x00\x00\xa4\xfc\x03\x00\x00\x00\x00\x00\xa5\xfc\x03\x00\x00\x00\x00\x00\xa6\xfc\x03\x00\x00\x00\x00\x00\xa7\xfc\x03\x00\x00\x00\x00\x00'
+    b'\xc1\xfc\x03\x00\x00\x00\x00\x00\xc2\xfc\x03\x00\x00\x00\x00\x00\xc3\xfc\x03\x00\x00\x00\x00\x00$\x00\x04\x00\x00\x00\x00\x00)\x00\x04\x00\x00\x00\x00\x00*\x00\x04\x00\x00\x00\x00\x00+\x00\x04\x00\x00\x00\x00\x00,\x00\x04\x00\x00\x00\x00\x00-\x00\x04\x00\x00\x00\x00\x00\xab\x00\x04\x00\x00\x00\x00\x00\xb0\x00\x04\x00\x00\x00\x00\x00\xf6\x02\x04\x00\x00\x00\x00\x00'
+    b'\xf7\x02\x04\x00\x00\x00\x00\x00\xf8\x02\x04\x00\x00\x00\x00\x00\xf9\x02\x04\x00\x00\x00\x00\x00\x01\x03\x04\x00\x00\x00\x00\x00C\x03\x04\x00\x00\x00\x00\x00M\x03\x04\x00\x00\x00\x00\x00N\x03\x04\x00\x00\x00\x00\x00O\x03\x04\x00\x00\x00\x00\x00R\x03\x04\x00\x00\x00\x00\x00S\x03\x04\x00\x00\x00\x00\x00U\x03\x04\x00\x00\x00\x00\x00\xac\x03\x04\x00\x00\x00\x00\x00'
+    b'\xad\x03\x04\x00\x00\x00\x00\x00\xd5\x03\x04\x00\x00\x00\x00\x00\xd6\x03\x04\x00\x00\x00\x00\x00\xdd\x03\x04\x00\x00\x00\x00\x00\xef\x03\x04\x00\x00\x00\x00\x00\xf7\x03\x04\x00\x00\x00\x00\x00\xb6\x04\x04\x00\x00\x00\x00\x00\xb8\x04\x04\x00\x00\x00\x00\x00\xe8\x05\x04\x00\x00\x00\x00\x00\xe9\x05\x04\x00\x00\x00\x00\x00\xf7\x05\x04\x00\x00\x00\x00\x00\xf8\x05\x04\x00\x00\x00\x00\x00'
+    b'\xf9\x05\x04\x00\x00\x00\x00\x00\xfa\x05\x04\x00\x00\x00\x00\x00\xfc\x05\x04\x00\x00\x00\x00\x00\xfd\x05\x04\x00\x00\x00\x00\x00\xfe\x05\x04\x00\x00\x00\x00\x00\x12\x06\x04\x00\x00\x00\x00\x00\x13\x06\x04\x00\x00\x00\x00\x00\x14\x06\x04\x00\x00\x00\x00\x00\x15\x06\x04\x00\x00\x00\x00\x00\x16\x06\x04\x00\x00\x00\x00\x00\x17\x06\x04\x00\x00\x00\x00\x00!\x06\x04\x00\x00\x00\x00\x00'
+    b'"\x06\x04\x00\x00\x00\x00\x00#\x06\x04\x00\x00\x00\x00\x00$\x06\x04\x00\x00\x00\x00\x00n\x06\x04\x00\x00\x00\x00\x00o\x06\x04\x00\x00\x00\x00\x00p\x06\x04\x00\x00\x00\x00\x00q\x06\x04\x00\x00\x00\x00\x00s\x06\x04\x00\x00\x00\x00\x00t\x06\x04\x00\x00\x00\x00\x00u\x06\x04\x00\x00\x00\x00\x00v\x06\x04\x00\x00\x00\x00\x00w\x06\x04\x00\x00\x00\x00\x00'
+    b'x\x06\x04\x00\x00\x00\x00\x00y\x06\x04\x00\x00\x00\x00\x00z\x06\x04\x00\x00\x00\x00\x00{\x06\x04\x00\x00\x00\x00\x00}\x06\x04\x00\x00\x00\x00\x00~\x06\x04\x00\x00\x00\x00\x00\x80\x06\x04\x00\x00\x00\x00\x00\x81\x06\x04\x00\x00\x00\x00\x00\x82\x06\x04\x00\x00\x00\x00\x00\x83\x06\x04\x00\x00\x00\x00\x00\x87\x06\x04\x00\x00\x00\x00\x00\x88\x06\x04\x00\x00\x00\x00\x00'
+    b'\x8a\x06\x04\x00\x00\x00\x00\x00\x8b\x06\x04\x00\x00\x00\x00\x00\x8c\x06\x04\x00\x00\x00\x00\x00\x8d\x06\x04\x00\x00\x00\x00\x00\x8e\x06\x04\x00\x00\x00\x00\x00\x8f\x06\x04\x00\x00\x00\x00\x00\x90\x06\x04\x00\x00\x00\x00\x00\x92\x06\x04\x00\x00\x00\x00\x00\x93\x06\x04\x00\x00\x00\x00\x00\xb6\x06\x04\x00\x00\x00\x00\x00\xb1\x07\x04\x00\x00\x00\x00\x00\xb2\x07\x04\x00\x00\x00\x00\x00'
+    b'\xb3\x07\x04\x00\x00\x00\x00\x00\xb5\x07\x04\x00\x00\x00\x00\x00\xb6\x07\x04\x00\x00\x00\x00\x00\xb7\x07\x04\x00\x00\x00\x00\x00\xb8\x07\x04\x00\x00\x00\x00\x00\xb9\x07\x04\x00\x00\x00\x00\x00\xba\x07\x04\x00\x00\x00\x00\x00\xbb\x07\x04\x00\x00\x00\x00\x00\xbc\x07\x04\x00\x00\x00\x00\x00\xbd\x07\x04\x00\x00\x00\x00\x00\xbe\x07\x04\x00\x00\x00\x00\x00\xbf\x07\x04\x00\x00\x00\x00\x00'
+    b'\xc0\x07\x04\x00\x00\x00\x00\x00\xc1\x07\x04\x00\x00\x00\x00\x00\xc2\x07\x04\x00\x00\x00\x00\x00\xc3\x07\x04\x00\x00\x00\x00\x00\xc4\x07\x04\x00\x00\x00\x00\x00\xc5\x07\x04\x00\x00\x00\x00\x00\xc6\x07\x04\x00\x00\x00\x00\x00\xc7\x07\x04\x00\x00\x00\x00\x00\xc8\x07\x04\x00\x00\x00\x00\x00\xc9\x07\x04\x00\x00\x00\x00\x00\xca\x07\x04\x00\x00\x00\x00\x00\xd9\x07\x04\x00\x00\x00\x00\x00'
+    b'\t\x08\x04\x00\x00\x00\x00\x00\n\x08\x04\x00\x00\x00\x00\x00\x0b\x08\x04\x00\x00\x00\x00\x00\x0c\x08\x04\x00\x00\x00\x00\x00\r\x08\x04\x00\x00\x00\x00\x00\x0e\x08\x04\x00\x00\x00\x00\x00\x0f\x08\x04\x00\x00\x00\x00\x00\x10\x08\x04\x00\x00\x00\x00\x00\x11\x08\x04\x00\x00\x00\x00\x00\x12\x08\x04\x00\x00\x00\x00\x00\x13\x08\x04\x00\x00\x00\x00\x00\x14\x08\x04\x00\x00\x00\x00\x00'
+    b'\x15\x08\x04\x00\x00\x00\x00\x00\x16\x08\x04\x00\x00\x00\x00\x00\x17\x08\x04\x00\x00\x00\x00\x00\x18\x08\x04\x00\x00\x00\x00\x00\x19\x08\x04\x00\x00\x00\x00\x00\x1a\x08\x04\x00\x00\x00\x00\x00\x1b\x08\x04\x00\x00\x00\x00\x00\x1c\x08\x04\x00\x00\x00\x00\x00\x1d\x08\x04\x00\x00\x00\x00\x00\x1e\x08\x04\x00\x00\x00\x00\x00\x1f\x08\x04\x00\x00\x00\x00\x00 \x08\x04\x00\x00\x00\x00\x00'
+    b'!\x08\x04\x00\x00\x00\x00\x00\xd7\x08\x04\x00\x00\x00\x00\x00\x14\t\x04\x00\x00\x00\x00\x00\x15\t\x04\x00\x00\x00\x00\x00L\n\x04\x00\x00\x00\x00\x00M\n\x04\x00\x00\x00\x00\x00\xfb\n\x04\x00\x00\x00\x00\x00\xfc\n\x04\x00\x00\x00\x00\x00\x12\x0b\x04\x00\x00\x00\x00\x00\xaf\x0b\x04\x00\x00\x00\x00\x00\xb0\x0b\x04\x00\x00\x00\x00\x00\xb1\x0b\x04\x00\x00\x00\x00\x00'
+    b'\xb2\x0b\x04\x00\x00\x00\x00\x00:\x0c\x04\x00\x00\x00\x00\x00;\x0c\x04\x00\x00\x00\x00\x00<\x0c\x04\x00\x00\x00\x00\x00=\x0c\x04\x00\x00\x00\x00\x00>\x0c\x04\x00\x00\x00\x00\x00?\x0c\x04\x00\x00\x00\x00\x00@\x0c\x04\x00\x00\x00\x00\x00A\x0c\x04\x00\x00\x00\x00\x00B\x0c\x04\x00\x00\x00\x00\x00C\x0c\x04\x00\x00\x00\x00\x00D\x0c\x04\x00\x00\x00\x00\x00'
+    b'E\x0c\x04\x00\x00\x00\x00\x00F\x0c\x04\x00\x00\x00\x00\x00G\x0c\x04\x00\x00\x00\x00\x00H\x0c\x04\x00\x00\x00\x00\x00I\x0c\x04\x00\x00\x00\x00\x00J\x0c\x04\x00\x00\x00\x00\x00K\x0c\x04\x00\x00\x00\x00\x00L\x0c\x04\x00\x00\x00\x00\x00M\x0c\x04\x00\x00\x00\x00\x00N\x0c\x04\x00\x00\x00\x00\x00O\x0c\x04\x00\x00\x00\x00\x00Q\x0c\x04\x00\x00\x00\x00\x00'
+    b'R\x0c\x04\x00\x00\x00\x00\x00S\x0c\x04\x00\x00\x00\x00\x00T\x0c\x04\x00\x00\x00\x00\x00U\x0c\x04\x00\x00\x00\x00\x00V\x0c\x04\x00\x00\x00\x00\x00W\x0c\x04\x00\x00\x00\x00\x00X\x0c\x04\x00\x00\x00\x00\x00Z\x0c\x04\x00\x00\x00\x00\x00[\x0c\x04\x00\x00\x00\x00\x00\\\x0c\x04\x00\x00\x00\x00\x00]\x0c\x04\x00\x00\x00\x00\x00\xb3\x0c\x04\x00\x00\x00\x00\x00'
+    b'\xb4\x0c\x04\x00\x00\x00\x00\x00\xb1\r\x04\x00\x00\x00\x00\x00\xb2\r\x04\x00\x00\x00\x00\x00\xb3\r\x04\x00\x00\x00\x00\x00\r\x10\x04\x00\x00\x00\x00\x00\x0e\x10\x04\x00\x00\x00\x00\x00\x82\x10\x04\x00\x00\x00\x00\x00\x83\x10\x04\x00\x00\x00\x00\x00\xab\x10\x04\x00\x00\x00\x00\x00\xac\x10\x04\x00\x00\x00\x00\x00\xad\x10\x04\x00\x00\x00\x00\x00\xae\x10\x04\x00\x00\x00\x00\x00'
+    b'\xaf\x10\x04\x00\x00\x00\x00\x00\xd1\x11\x04\x00\x00\x00\x00\x00\xd4\x11\x04\x00\x00\x00\x00\x00\xd6\x11\x04\x00\x00\x00\x00\x00\xd8\x11\x04\x00\x00\x00\x00\x00\xda\x11\x04\x00\x00\x00\x00\x00\xdc\x11\x04\x00\x00\x00\x00\x00\xde\x11\x04\x00\x00\x00\x00\x00\xe0\x11\x04\x00\x00\x00\x00\x00\xe2\x11\x04\x00\x00\x00\x00\x00\xf6\x11\x04\x00\x00\x00\x00\x00\x07\x13\x04\x00\x00\x00\x00\x00'
+    b'\x08\x13\x04\x00\x00\x00\x00\x00|\x13\x04\x00\x00\x00\x00\x00\xff\x13\x04\x00\x00\x00\x00\x00\x00\x14\x04\x00\x00\x00\x00\x00z\x14\x04\x00\x00\x00\x00\x00\x83\x14\x04\x00\x00\x00\x00\x00\x84\x14\x04\x00\x00\x00\x00\x00\xe4\x14\x04\x00\x00\x00\x00\x00\xe5\x14\x04\x00\x00\x00\x00\x00\xe6\x14\x04\x00\x00\x00\x00\x00\xe7\x14\x04\x00\x00\x00\x00\x00\xfd\x14\x04\x00\x00\x00\x00\x00'
+    b'\x0c\x15\x04\x00\x00\x00\x00\x00\r\x15\x04\x00\x00\x00\x00\x00\xa0\x15\x04\x00\x00\x00\x00\x00\xa1\x15\x04\x00\x00\x00\x00\x00\xa2\x15\x04\x00\x00\x00\x00\x00\xe0\x16\x04\x00\x00\x00\x00\x00\xe1\x16\x04\x00\x00\x00\x00\x00\xe2\x16\x04\x00\x00\x00\x00\x00\xf8\x16\x04\x00\x00\x00\x00\x00\x07\x17\x04\x00\x00\x00\x00\x00\x08\x17\x04\x00\x00\x00\x00\x00\x1f\x17\x04\x00\x00\x00\x00\x00'
+    b':\x17\x04\x00\x00\x00\x00\x00;\x17\x04\x00\x00\x00\x00\x00C\x17\x04\x00\x00\x00\x00\x00E\x17\x04\x00\x00\x00\x00\x00\xe5\x17\x04\x00\x00\x00\x00\x00\xed\x17\x04\x00\x00\x00\x00\x00p\x18\x04\x00\x00\x00\x00\x00\x86\x18\x04\x00\x00\x00\x00\x00\x8e\x18\x04\x00\x00\x00\x00\x00\xbd\x18\x04\x00\x00\x00\x00\x00\xc4\x18\x04\x00\x00\x00\x00\x00\xc6\x18\x04\x00\x00\x00\x00\x00'
+    b'\xc7\x18\x04\x00\x00\x00\x00\x00\x07\x19\x04\x00\x00\x00\x00\x00\x10\x19\x04\x00\x00\x00\x00\x00F\x19\x04\x00\x00\x00\x00\x00M\x19\x04\x00\x00\x00\x00\x00\x14\x1a\x04\x00\x00\x00\x00\x00\x15\x1a\x04\x00\x00\x00\x00\x00\x19\x1a\x04\x00\x00\x00\x00\x00i\x1a\x04\x00\x00\x00\x00\x00\x83\x1a\x04\x00\x00\x00\x00\x00\xbd\x1b\x04\x00\x00\x00\x00\x00\xfc\x1c\x04\x00\x00\x00\x00\x00'
+    b'l \x04\x00\x00\x00\x00\x00m \x04\x00\x00\x00\x00\x00n \x04\x00\x00\x00\x00\x00o \x04\x00\x00\x00\x00\x00p \x04\x00\x00\x00\x00\x00\r#\x04\x00\x00\x00\x00\x00\x0e#\x04\x00\x00\x00\x00\x00\x0f#\x04\x00\x00\x00\x00\x00\x12#\x04\x00\x00\x00\x00\x00\x13#\x04\x00\x00\x00\x00\x00\x14#\x04\x00\x00\x00\x00\x00U#\x04\x00\x00\x00\x00\x00'
+    b'V#\x04\x00\x00\x00\x00\x00`#\x04\x00\x00\x00\x00\x00\xaf#\x04\x00\x00\x00\x00\x00\xb0#\x04\x00\x00\x00\x00\x00\xb1#\x04\x00\x00\x00\x00\x00\xb2#\x04\x00\x00\x00\x00\x00\xb3#\x04\x00\x00\x00\x00\x00\xdf#\x04\x00\x00\x00\x00\x00\xe1#\x04\x00\x00\x00\x00\x00\xe3#\x04\x00\x00\x00\x00\x00\xe4#\x04\x00\x00\x00\x00\x00\xef#\x04\x00\x00\x00\x00\x00'
+    b'\xf4#\x04\x00\x00\x00\x00\x00\xf7#\x04\x00\x00\x00\x00\x00B$\x04\x00\x00\x00\x00\x00C$\x04\x00\x00\x00\x00\x00D$\x04\x00\x00\x00\x00\x00E$\x04\x00\x00\x00\x00\x00F$\x04\x00\x00\x00\x00\x00H$\x04\x00\x00\x00\x00\x00I$\x04\x00\x00\x00\x00\x00J$\x04\x00\x00\x00\x00\x00K$\x04\x00\x00\x00\x00\x00L$\x04\x00\x00\x00\x00\x00'
+    b'f$\x04\x00\x00\x00\x00\x00\xa8$\x04\x00\x00\x00\x00\x00\xa9$\x04\x00\x00\x00\x00\x00\xaa$\x04\x00\x00\x00\x00\x00\xab$\x04\x00\x00\x00\x00\x00\xad$\x04\x00\x00\x00\x00\x00\xae$\x04\x00\x00\x00\x00\x00\xaf$\x04\x00\x00\x00\x00\x00\xb1$\x04\x00\x00\x00\x00\x00\xb2$\x04\x00\x00\x00\x00\x00\xc7$\x04\x00\x00\x00\x00\x00\xc8$\x04\x00\x00\x00\x00\x00'
+    b'\xc9$\x04\x00\x00\x00\x00\x00\xca$\x04\x00\x00\x00\x00\x00\xcb$\x04\x00\x00\x00\x00\x00\xcc$\x04\x00\x00\x00\x00\x00\xcd$\x04\x00\x00\x00\x00\x00\xce$\x04\x00\x00\x00\x00\x00\xcf$\x04\x00\x00\x00\x00\x00\xd0$\x04\x00\x00\x00\x00\x00\xd1$\x04\x00\x00\x00\x00\x00\xd4$\x04\x00\x00\x00\x00\x00\xd5$\x04\x00\x00\x00\x00\x00\xd6$\x04\x00\x00\x00\x00\x00'
+    b'\xdc$\x04\x00\x00\x00\x00\x00\xdd$\x04\x00\x00\x00\x00\x00\xde$\x04\x00\x00\x00\x00\x00\xdf$\x04\x00\x00\x00\x00\x00\xe1$\x04\x00\x00\x00\x00\x00\xe2$\x04\x00\x00\x00\x00\x00\xe6$\x04\x00\x00\x00\x00\x00\xe7$\x04\x00\x00\x00\x00\x00\xe8$\x04\x00\x00\x00\x00\x00\xe9$\x04\x00\x00\x00\x00\x00\xf4$\x04\x00\x00\x00\x00\x00\xf5$\x04\x00\x00\x00\x00\x00'
+    b"\xf6$\x04\x00\x00\x00\x00\x00\x1f%\x04\x00\x00\x00\x00\x00 %\x04\x00\x00\x00\x00\x00l&\x04\x00\x00\x00\x00\x00m&\x04\x00\x00\x00\x00\x00o'\x04\x00\x00\x00\x00\x00p'\x04\x00\x00\x00\x00\x00\x89'\x04\x00\x00\x00\x00\x00\x8a'\x04\x00\x00\x00\x00\x00\x96'\x04\x00\x00\x00\x00\x00\x9c'\x04\x00\x00\x00\x00\x00\x9e'\x04\x00\x00\x00\x00\x00"
+    b"\xa3'\x04\x00\x00\x00\x00\x00\xa7'\x04\x00\x00\x00\x00\x00\xa8'\x04\x00\x00\x00\x00\x00\xaa'\x04\x00\x00\x00\x00\x00\xac'\x04\x00\x00\x00\x00\x00\xae'\x04\x00\x00\x00\x00\x00\xd5'\x04\x00\x00\x00\x00\x00\xd6'\x04\x00\x00\x00\x00\x00\xd8'\x04\x00\x00\x00\x00\x00\xd9'\x04\x00\x00\x00\x00\x00\xda'\x04\x00\x00\x00\x00\x00\xdb'\x04\x00\x00\x00\x00\x00"
+    b"\xdc'\x04\x00\x00\x00\x00\x00\xdd'\x04\x00\x00\x00\x00\x00\xde'\x04\x00\x00\x00\x00\x00\x89(\x04\x00\x00\x00\x00\x00\xfe(\x04\x00\x00\x00\x00\x00\r)\x04\x00\x00\x00\x00\x00T)\x04\x00\x00\x00\x00\x00\x8e)\x04\x00\x00\x00\x00\x00\xd0)\x04\x00\x00\x00\x00\x00\xd1)\x04\x00\x00\x00\x00\x00\xfd)\x04\x00\x00\x00\x00\x00\xfe)\x04\x00\x00\x00\x00\x00"
+    b'\xff)\x04\x00\x00\x00\x00\x00\x00*\x04\x00\x00\x00\x00\x00\x01*\x04\x00\x00\x00\x00\x00\x05*\x04\x00\x00\x00\x00\x00\x06*\x04\x00\x00\x00\x00\x00\x07*\x04\x00\x00\x00\x00\x00\x08*\x04\x00\x00\x00\x00\x00b*\x04\x00\x00\x00\x00\x00c*\x04\x00\x00\x00\x00\x00d*\x04\x00\x00\x00\x00\x00\x85*\x04\x00\x00\x00\x00\x00\x87*\x04\x00\x00\x00\x00\x00'
+    b'\x89*\x04\x00\x00\x00\x00\x00\xb1-\x04\x00\x00\x00\x00\x00\xb3-\x04\x00\x00\x00\x00\x00\xb4-\x04\x00\x00\x00\x00\x00\xf0-\x04\x00\x00\x00\x00\x00\xf1-\x04\x00\x00\x00\x00\x00\xf2-\x04\x00\x00\x00\x00\x00\xf4-\x04\x00\x00\x00\x00\x00\xfc-\x04\x00\x00\x00\x00\x00\xfd-\x04\x00\x00\x00\x00\x00\xfe-\x04\x00\x00\x00\x00\x00\x91.\x04\x00\x00\x00\x00\x00'
+    b'\xe5.\x04\x00\x00\x00\x00\x00\xe6.\x04\x00\x00\x00\x00\x00\x1c/\x04\x00\x00\x00\x00\x00$/\x04\x00\x00\x00\x00\x00%/\x04\x00\x00\x00\x00\x00&/\x04\x00\x00\x00\x00\x00(/\x04\x00\x00\x00\x00\x00*/\x04\x00\x00\x00\x00\x00-/\x04\x00\x00\x00\x00\x004/\x04\x00\x00\x00\x00\x005/\x04\x00\x00\x00\x00\x006/\x04\x00\x00\x00\x00\x00'
+    b'@/\x04\x00\x00\x00\x00\x00\x88/\x04\x00\x00\x00\x00\x00\x89/\x04\x00\x00\x00\x00\x00\xdc/\x04\x00\x00\x00\x00\x00\xde/\x04\x00\x00\x00\x00\x00\xe1/\x04\x00\x00\x00\x00\x00\xe2/\x04\x00\x00\x00\x00\x00\xe3/\x04\x00\x00\x00\x00\x00[0\x04\x00\x00\x00\x00\x00m0\x04\x00\x00\x00\x00\x00n0\x04\x00\x00\x00\x00\x00v0\x04\x00\x00\x00\x00\x00'
+    b'w0\x04\x00\x00\x00\x00\x00\x950\x04\x00\x00\x00\x00\x00\x960\x04\x00\x00\x00\x00\x00?1\x04\x00\x00\x00\x00\x00\x861\x04\x00\x00\x00\x00\x00\xae1\x04\x00\x00\x00\x00\x00\xaf1\x04\x00\x00\x00\x00\x00\xb01\x04\x00\x00\x00\x00\x00\x052\x04\x00\x00\x00\x00\x00\x062\x04\x00\x00\x00\x00\x00\xfa3\x04\x00\x00\x00\x00\x00\xfb3\x04\x00\x00\x00\x00\x00'
+    b"\xfc3\x04\x00\x00\x00\x00\x00!4\x04\x00\x00\x00\x00\x00#4\x04\x00\x00\x00\x00\x00'4\x04\x00\x00\x00\x00\x00(4\x04\x00\x00\x00\x00\x00*4\x04\x00\x00\x00\x00\x00?4\x04\x00\x00\x00\x00\x00@4\x04\x00\x00\x00\x00\x00B4\x04\x00\x00\x00\x00\x00C4\x04\x00\x00\x00\x00\x00o4\x04\x00\x00\x00\x00\x00p4\x04\x00\x00\x00\x00\x00"
+    b'q4\x04\x00\x00\x00\x00\x00\x9c4\x04\x00\x00\x00\x00\x00\xaa4\x04\x00\x00\x00\x00\x00\xab4\x04\x00\x00\x00\x00\x00\xac4\x04\x00\x00\x00\x00\x00\xbb4\x04\x00\x00\x00\x00\x00\xbc4\x04\x00\x00\x00\x00\x00\xbd4\x04\x00\x00\x00\x00\x00\xbe4\x04\x00\x00\x00\x00\x00\xbf4\x04\x00\x00\x00\x00\x00\xc04\x04\x00\x00\x00\x00\x00\xcb4\x04\x00\x00\x00\x00\x00'
+    b'\x7f5\x04\x00\x00\x00\x00\x00\x805\x04\x00\x00\x00\x00\x00\x815\x04\x00\x00\x00\x00\x00\x835\x04\x00\x00\x00\x00\x00\x875\x04\x00\x00\x00\x00\x00\x885\x04\x00\x00\x00\x00\x00\x895\x04\x00\x00\x00\x00\x00\x8a5\x04\x00\x00\x00\x00\x00\x8b5\x04\x00\x00\x00\x00\x00\x8d5\x04\x00\x00\x00\x00\x00\x915\x04\x00\x00\x00\x00\x00\xae5\x04\x00\x00\x00\x00\x00'
+    b'^6\x04\x00\x00\x00\x00\x00`6\x04\x00\x00\x00\x00\x00n7\x04\x00\x00\x00\x00\x00\xcc7\x04\x00\x00\x00\x00\x00\xf37\x04\x00\x00\x00\x00\x00\xf47\x04\x00\x00\x00\x00\x00\xf57\x04\x00\x00\x00\x00\x00\xf67\x04\x00\x00\x00\x00\x00\xf77\x04\x00\x00\x00\x00\x00\xf87\x04\x00\x00\x00\x00\x00\xf97\x04\x00\x00\x00\x00\x00\xfa7\x04\x00\x00\x00\x00\x00'
+    b'\xfd8\x04\x00\x00\x00\x00\x00\x009\x04\x00\x00\x00\x00\x00\x029\x04\x00\x00\x00\x00\x00i9\x04\x00\x00\x00\x00\x00j9\x04\x00\x00\x00\x00\x00k9\x04\x00\x00\x00\x00\x00>:\x04\x00\x00\x00\x00\x00A:\x04\x00\x00\x00\x00\x00M:\x04\x00\x00\x00\x00\x00\xcc:\x04\x00\x00\x00\x00\x00\xcd:\x04\x00\x00\x00\x00\x00\xce:\x04\x00\x00\x00\x00\x00'
+    b'\xd9:\x04\x00\x00\x00\x00\x00k;\x04\x00\x00\x00\x00\x00\xea;\x04\x00\x00\x00\x00\x00\xeb;\x04\x00\x00\x00\x00\x00\xec;\x04\x00\x00\x00\x00\x00\xed;\x04\x00\x00\x00\x00\x00\xee;\x04\x00\x00\x00\x00\x00\xef;\x04\x00\x00\x00\x00\x00\xf0;\x04\x00\x00\x00\x00\x00\x03<\x04\x00\x00\x00\x00\x007<\x04\x00\x00\x00\x00\x00I<\x04\x00\x00\x00\x00\x00'
+    b'W<\x04\x00\x00\x00\x00\x00Z<\x04\x00\x00\x00\x00\x00[<\x04\x00\x00\x00\x00\x00t<\x04\x00\x00\x00\x00\x00\x86<\x04\x00\x00\x00\x00\x00\xbf<\x04\x00\x00\x00\x00\x00\xf6<\x04\x00\x00\x00\x00\x00\xf7<\x04\x00\x00\x00\x00\x00W=\x04\x00\x00\x00\x00\x00]=\x04\x00\x00\x00\x00\x00^=\x04\x00\x00\x00\x00\x00_=\x04\x00\x00\x00\x00\x00'
+    b'\xf3=\x04\x00\x00\x00\x00\x00\xfe=\x04\x00\x00\x00\x00\x00\x8a>\x04\x00\x00\x00\x00\x00:?\x04\x00\x00\x00\x00\x00D?\x04\x00\x00\x00\x00\x00E?\x04\x00\x00\x00\x00\x00\t@\x04\x00\x00\x00\x00\x00\n@\x04\x00\x00\x00\x00\x00\x0b@\x04\x00\x00\x00\x00\x00\x04A\x04\x00\x00\x00\x00\x00XA\x04\x00\x00\x00\x00\x00YA\x04\x00\x00\x00\x00\x00'
+    b'\x94A\x04\x00\x00\x00\x00\x00\x96A\x04\x00\x00\x00\x00\x00\x97A\x04\x00\x00\x00\x00\x00\xa3B\x04\x00\x00\x00\x00\x00\xd8B\x04\x00\x00\x00\x00\x00\xd9B\x04\x00\x00\x00\x00\x00\xdaB\x04\x00\x00\x00\x00\x00\xe1B\x04\x00\x00\x00\x00\x00\xe2B\x04\x00\x00\x00\x00\x00\xe3B\x04\x00\x00\x00\x00\x00\xe4B\x04\x00\x00\x00\x00\x00\xe5B\x04\x00\x00\x00\x00\x00'
+    b'\xe6B\x04\x00\x00\x00\x00\x00\xe7B\x04\x00\x00\x00\x00\x00\xe8B\x04\x00\x00\x00\x00\x00\xe9B\x04\x00\x00\x00\x00\x00\xeaB\x04\x00\x00\x00\x00\x00\xebB\x04\x00\x00\x00\x00\x00\xecB\x04\x00\x00\x00\x00\x00\xedB\x04\x00\x00\x00\x00\x00\xeeB\x04\x00\x00\x00\x00\x00\xefB\x04\x00\x00\x00\x00\x00\xf0B\x04\x00\x00\x00\x00\x00\xf6B\x04\x00\x00\x00\x00\x00'
+    b'\xf7B\x04\x00\x00\x00\x00\x00\xf8B\x04\x00\x00\x00\x00\x00eD\x04\x00\x00\x00\x00\x00fD\x04\x00\x00\x00\x00\x00\xd6D\x04\x00\x00\x00\x00\x006E\x04\x00\x00\x00\x00\x007E\x04\x00\x00\x00\x00\x008E\x04\x00\x00\x00\x00\x009E\x04\x00\x00\x00\x00\x00:E\x04\x00\x00\x00\x00\x00<E\x04\x00\x00\x00\x00\x00=E\x04\x00\x00\x00\x00\x00'
+    b'nE\x04\x00\x00\x00\x00\x00oE\x04\x00\x00\x00\x00\x00pE\x04\x00\x00\x00\x00\x00qE\x04\x00\x00\x00\x00\x00rE\x04\x00\x00\x00\x00\x00sE\x04\x00\x00\x00\x00\x00tE\x04\x00\x00\x00\x00\x00uE\x04\x00\x00\x00\x00\x00\xa7E\x04\x00\x00\x00\x00\x00\xa9E\x04\x00\x00\x00\x00\x00\xcdF\x04\x00\x00\x00\x00\x00\xceF\x04\x00\x00\x00\x00\x00'
+    b"\xd0F\x04\x00\x00\x00\x00\x00\xd2F\x04\x00\x00\x00\x00\x00!G\x04\x00\x00\x00\x00\x00&H\x04\x00\x00\x00\x00\x00'H\x04\x00\x00\x00\x00\x00(H\x04\x00\x00\x00\x00\x002H\x04\x00\x00\x00\x00\x00\x12I\x04\x00\x00\x00\x00\x00\x15I\x04\x00\x00\x00\x00\x00\x16I\x04\x00\x00\x00\x00\x00\x17I\x04\x00\x00\x00\x00\x00\x18I\x04\x00\x00\x00\x00\x00"
+    b'\x8bI\x04\x00\x00\x00\x00\x00\x96I\x04\x00\x00\x00\x00\x00\x97I\x04\x00\x00\x00\x00\x00\x98I\x04\x00\x00\x00\x00\x00\x99I\x04\x00\x00\x00\x00\x00\xe8I\x04\x00\x00\x00\x00\x00\xebI\x04\x00\x00\x00\x00\x00\xeeI\x04\x00\x00\x00\x00\x00\x7fJ\x04\x00\x00\x00\x00\x00\xd9O\x04\x00\x00\x00\x00\x00\xf0O\x04\x00\x00\x00\x00\x00,P\x04\x00\x00\x00\x00\x00'
+    b'-P\x04\x00\x00\x00\x00\x00\x17Q\x04\x00\x00\x00\x00\x00\x19Q\x04\x00\x00\x00\x00\x00\x1bQ\x04\x00\x00\x00\x00\x00\x1dQ\x04\x00\x00\x00\x00\x00\x1eQ\x04\x00\x00\x00\x00\x00sQ\x04\x00\x00\x00\x00\x00tQ\x04\x00\x00\x00\x00\x00\x8fQ\x04\x00\x00\x00\x00\x00\x90Q\x04\x00\x00\x00\x00\x00\x91Q\x04\x00\x00\x00\x00\x00\xacQ\x04\x00\x00\x00\x00\x00'
+    b'\xadQ\x04\x00\x00\x00\x00\x00\xcfQ\x04\x00\x00\x00\x00\x00\xd2Q\x04\x00\x00\x00\x00\x00\xd3Q\x04\x00\x00\x00\x00\x00\xd4Q\x04\x00\x00\x00\x00\x00\xd5Q\x04\x00\x00\x00\x00\x00\xd6Q\x04\x00\x00\x00\x00\x00\xd7Q\x04\x00\x00\x00\x00\x00\xd8Q\x04\x00\x00\x00\x00\x00\xdaQ\x04\x00\x00\x00\x00\x00\xdcQ\x04\x00\x00\x00\x00\x00\xddQ\x04\x00\x00\x00\x00\x00'
+    b'\xdeQ\x04\x00\x00\x00\x00\x00\xdfQ\x04\x00\x00\x00\x00\x00\xe0Q\x04\x00\x00\x00\x00\x00\xe1Q\x04\x00\x00\x00\x00\x00\xe3Q\x04\x00\x00\x00\x00\x00BR\x04\x00\x00\x00\x00\x00CR\x04\x00\x00\x00\x00\x00DR\x04\x00\x00\x00\x00\x00ER\x04\x00\x00\x00\x00\x00FR\x04\x00\x00\x00\x00\x00GR\x04\x00\x00\x00\x00\x00HR\x04\x00\x00\x00\x00\x00'
+    b'IR\x04\x00\x00\x00\x00\x00JR\x04\x00\x00\x00\x00\x00KR\x04\x00\x00\x00\x00\x001S\x04\x00\x00\x00\x00\x002S\x04\x00\x00\x00\x00\x00\xacS\x04\x00\x00\x00\x00\x00\xadS\x04\x00\x00\x00\x00\x00\xaeS\x04\x00\x00\x00\x00\x00\xafS\x04\x00\x00\x00\x00\x00\xb0S\x04\x00\x00\x00\x00\x00\xb1S\x04\x00\x00\x00\x00\x00\xb2S\x04\x00\x00\x00\x00\x00'
+    b'\xb3S\x04\x00\x00\x00\x00\x00\xb4S\x04\x00\x00\x00\x00\x00\xc5S\x04\x00\x00\x00\x00\x00\xc6S\x04\x00\x00\x00\x00\x00\xc7S\x04\x00\x00\x00\x00\x00\xc8S\x04\x00\x00\x00\x00\x00\xc9S\x04\x00\x00\x00\x00\x00\xcaS\x04\x00\x00\x00\x00\x00\xcbS\x04\x00\x00\x00\x00\x00\xccS\x04\x00\x00\x00\x00\x00IT\x04\x00\x00\x00\x00\x00\x94T\x04\x00\x00\x00\x00\x00'
+    b"\x95T\x04\x00\x00\x00\x00\x00\xb1T\x04\x00\x00\x00\x00\x00\xb2T\x04\x00\x00\x00\x00\x00\xc4T\x04\x00\x00\x00\x00\x00\xd8T\x04\x00\x00\x00\x00\x00\xdbT\x04\x00\x00\x00\x00\x00\xdcT\x04\x00\x00\x00\x00\x00'U\x04\x00\x00\x00\x00\x00(U\x04\x00\x00\x00\x00\x00)U\x04\x00\x00\x00\x00\x00\xc2U\x04\x00\x00\x00\x00\x00\xc3U\x04\x00\x00\x00\x00\x00"
+    b'\xc6U\x04\x00\x00\x00\x00\x00\xc7U\x04\x00\x00\x00\x00\x00\xdcU\x04\x00\x00\x00\x00\x00\xddU\x04\x00\x00\x00\x00\x00\xdeU\x04\x00\x00\x00\x00\x00\xdfU\x04\x00\x00\x00\x00\x00\xe0U\x04\x00\x00\x00\x00\x00\xe1U\x04\x00\x00\x00\x00\x00\xe2U\x04\x00\x00\x00\x00\x00\xe3U\x04\x00\x00\x00\x00\x00\xe4U\x04\x00\x00\x00\x00\x00\xe5U\x04\x00\x00\x00\x00\x00'
+    b'\xe6U\x04\x00\x00\x00\x00\x00\xe7U\x04\x00\x00\x00\x00\x00\xe8U\x04\x00\x00\x00\x00\x00\xe9U\x04\x00\x00\x00\x00\x00\xeaU\x04\x00\x00\x00\x00\x00\xebU\x04\x00\x00\x00\x00\x00\xecU\x04\x00\x00\x00\x00\x00\xedU\x04\x00\x00\x00\x00\x00\xeeU\x04\x00\x00\x00\x00\x00\xefU\x04\x00\x00\x00\x00\x00\xf0U\x04\x00\x00\x00\x00\x00\xf1U\x04\x00\x00\x00\x00\x00'
+    b'\xf6U\x04\x00\x00\x00\x00\x00\xf7U\x04\x00\x00\x00\x00\x00+V\x04\x00\x00\x00\x00\x00,V\x04\x00\x00\x00\x00\x00\xc5V\x04\x00\x00\x00\x00\x00\xc6V\x04\x00\x00\x00\x00\x00bW\x04\x00\x00\x00\x00\x00cW\x04\x00\x00\x00\x00\x00\x8cW\x04\x00\x00\x00\x00\x00\x8dW\x04\x00\x00\x00\x00\x00\x8eW\x04\x00\x00\x00\x00\x00\xa6W\x04\x00\x00\x00\x00\x00'
+    b'\xb6X\x04\x00\x00\x00\x00\x00\xccX\x04\x00\x00\x00\x00\x00\xddX\x04\x00\x00\x00\x00\x00\xdeX\x04\x00\x00\x00\x00\x00\xe0X\x04\x00\x00\x00\x00\x00\xe2X\x04\x00\x00\x00\x00\x00\x05Y\x04\x00\x00\x00\x00\x00\x07Y\x04\x00\x00\x00\x00\x00\x0bY\x04\x00\x00\x00\x00\x00\rY\x04\x00\x00\x00\x00\x00\x1bY\x04\x00\x00\x00\x00\x00 Y\x04\x00\x00\x00\x00\x00'
+    b'"Y\x04\x00\x00\x00\x00\x00$Y\x04\x00\x00\x00\x00\x00\'Y\x04\x00\x00\x00\x00\x00*Y\x04\x00\x00\x00\x00\x00\xacY\x04\x00\x00\x00\x00\x00\xadY\x04\x00\x00\x00\x00\x00\xaeY\x04\x00\x00\x00\x00\x00\xafY\x04\x00\x00\x00\x00\x00\xb0Y\x04\x00\x00\x00\x00\x00\xb1Y\x04\x00\x00\x00\x00\x00\xb2Y\x04\x00\x00\x00\x00\x00\xb3Y\x04\x00\x00\x00\x00\x00'
+    b'\xb4Y\x04\x00\x00\x00\x00\x00\xf2[\x04\x00\x00\x00\x00\x00S\\\x04\x00\x00\x00\x00\x00U\\\x04\x00\x00\x00\x00\x00m\\\x04\x00\x00\x00\x00\x00r\\\x04\x00\x00\x00\x00\x00\x87]\x04\x00\x00\x00\x00\x00\x88]\x04\x00\x00\x00\x00\x00\xa6]\x04\x00\x00\x00\x00\x00\xc8]\x04\x00\x00\x00\x00\x00\xc9]\x04\x00\x00\x00\x00\x00\xf3]\x04\x00\x00\x00\x00\x00'
+    b'\xf4]\x04\x00\x00\x00\x00\x00\xf5]\x04\x00\x00\x00\x00\x00\xf6]\x04\x00\x00\x00\x00\x00\xfa]\x04\x00\x00\x00\x00\x00\xfb]\x04\x00\x00\x00\x00\x00\xfc]\x04\x00\x00\x00\x00\x00\xfd]\x04\x00\x00\x00\x00\x00\x08^\x04\x00\x00\x00\x00\x00\t^\x04\x00\x00\x00\x00\x00\n^\x04\x00\x00\x00\x00\x00C^\x04\x00\x00\x00\x00\x00\x87^\x04\x00\x00\x00\x00\x00'
+    b'\x89^\x04\x00\x00\x00\x00\x00\xce^\x04\x00\x00\x00\x00\x00\xd8^\x04\x00\x00\x00\x00\x00\xd9^\x04\x00\x00\x00\x00\x00\xda^\x04\x00\x00\x00\x00\x00\xdb^\x04\x00\x00\x00\x00\x00\xdc^\x04\x00\x00\x00\x00\x00\xdd^\x04\x00\x00\x00\x00\x00\xde^\x04\x00\x00\x00\x00\x00\xdf^\x04\x00\x00\x00\x00\x00!_\x04\x00\x00\x00\x00\x00\xbd_\x04\x00\x00\x00\x00\x00'
+    b'\xf7_\x04\x00\x00\x00\x00\x00?`\x04\x00\x00\x00\x00\x00na\x04\x00\x00\x00\x00\x00oa\x04\x00\x00\x00\x00\x00ac\x04\x00\x00\x00\x00\x00ec\x04\x00\x00\x00\x00\x00ic\x04\x00\x00\x00\x00\x00jc\x04\x00\x00\x00\x00\x00\xdec\x04\x00\x00\x00\x00\x00\xe1c\x04\x00\x00\x00\x00\x00\x10d\x04\x00\x00\x00\x00\x00\x11d\x04\x00\x00\x00\x00\x00'
+    b'\x9fd\x04\x00\x00\x00\x00\x00\xc2d\x04\x00\x00\x00\x00\x00\xded\x04\x00\x00\x00\x00\x00\xdfd\x04\x00\x00\x00\x00\x00\xe0d\x04\x00\x00\x00\x00\x00\xe1d\x04\x00\x00\x00\x00\x00\xe2d\x04\x00\x00\x00\x00\x00\xe3d\x04\x00\x00\x00\x00\x00\xe4d\x04\x00\x00\x00\x00\x00\xe5d\x04\x00\x00\x00\x00\x00\xe6d\x04\x00\x00\x00\x00\x00\xe7d\x04\x00\x00\x00\x00\x00'
+    b'We\x04\x00\x00\x00\x00\x00re\x04\x00\x00\x00\x00\x00xe\x04\x00\x00\x00\x00\x00}e\x04\x00\x00\x00\x00\x00;f\x04\x00\x00\x00\x00\x00>f\x04\x00\x00\x00\x00\x00?f\x04\x00\x00\x00\x00\x00@f\x04\x00\x00\x00\x00\x00Af\x04\x00\x00\x00\x00\x00Bf\x04\x00\x00\x00\x00\x00Lf\x04\x00\x00\x00\x00\x00\xd2f\x04\x00\x00\x00\x00\x00'
+    b'\xd3f\x04\x00\x00\x00\x00\x00\xd4f\x04\x00\x00\x00\x00\x00\xd5f\x04\x00\x00\x00\x00\x00\xfaf\x04\x00\x00\x00\x00\x00Ng\x04\x00\x00\x00\x00\x00Pg\x04\x00\x00\x00\x00\x00Vg\x04\x00\x00\x00\x00\x00yg\x04\x00\x00\x00\x00\x00\x02h\x04\x00\x00\x00\x00\x00\th\x04\x00\x00\x00\x00\x00-h\x04\x00\x00\x00\x00\x00.h\x04\x00\x00\x00\x00\x00'
+    b'Nh\x04\x00\x00\x00\x00\x00\xffh\x04\x00\x00\x00\x00\x00\x00i\x04\x00\x00\x00\x00\x00\x02i\x04\x00\x00\x00\x00\x00Qj\x04\x00\x00\x00\x00\x00hj\x04\x00\x00\x00\x00\x00ij\x04\x00\x00\x00\x00\x00jj\x04\x00\x00\x00\x00\x00kj\x04\x00\x00\x00\x00\x00lj\x04\x00\x00\x00\x00\x00mj\x04\x00\x00\x00\x00\x00\x8dj\x04\x00\x00\x00\x00\x00'
+    b'\x94j\x04\x00\x00\x00\x00\x00\x95j\x04\x00\x00\x00\x00\x00\xc9j\x04\x00\x00\x00\x00\x00\xcaj\x04\x00\x00\x00\x00\x00\xcbj\x04\x00\x00\x00\x00\x00\xccj\x04\x00\x00\x00\x00\x00\xcdj\x04\x00\x00\x00\x00\x00\xcej\x04\x00\x00\x00\x00\x00\xcfj\x04\x00\x00\x00\x00\x00\xd2j\x04\x00\x00\x00\x00\x00\xeaj\x04\x00\x00\x00\x00\x00\xebj\x04\x00\x00\x00\x00\x00'
+    b'\x8ck\x04\x00\x00\x00\x00\x00\xb8k\x04\x00\x00\x00\x00\x00\xb9k\x04\x00\x00\x00\x00\x00\xcfk\x04\x00\x00\x00\x00\x00\xd0k\x04\x00\x00\x00\x00\x00\xd1k\x04\x00\x00\x00\x00\x00\xd2k\x04\x00\x00\x00\x00\x00Fl\x04\x00\x00\x00\x00\x00\x8al\x04\x00\x00\x00\x00\x00\x02m\x04\x00\x00\x00\x00\x00\x03m\x04\x00\x00\x00\x00\x00Hm\x04\x00\x00\x00\x00\x00'
+    b'Im\x04\x00\x00\x00\x00\x00Km\x04\x00\x00\x00\x00\x00\x81m\x04\x00\x00\x00\x00\x00\x82m\x04\x00\x00\x00\x00\x00\x84m\x04\x00\x00\x00\x00\x00\x8am\x04\x00\x00\x00\x00\x00\x8bm\x04\x00\x00\x00\x00\x00\xa2m\x04\x00\x00\x00\x00\x00\xaam\x04\x00\x00\x00\x00\x00\xc3m\x04\x00\x00\x00\x00\x00\xc5m\x04\x00\x00\x00\x00\x00\xf6m\x04\x00\x00\x00\x00\x00'
+    b'\xf7m\x04\x00\x00\x00\x00\x00\xf8m\x04\x00\x00\x00\x00\x00\xf9m\x04\x00\x00\x00\x00\x00\x0fn\x04\x00\x00\x00\x00\x00\x14n\x04\x00\x00\x00\x00\x00\x15n\x04\x00\x00\x00\x00\x00\x18n\x04\x00\x00\x00\x00\x00Vn\x04\x00\x00\x00\x00\x00Wn\x04\x00\x00\x00\x00\x00Xn\x04\x00\x00\x00\x00\x00\x90n\x04\x00\x00\x00\x00\x00\xa7n\x04\x00\x00\x00\x00\x00'
+    b'\xa8n\x04\x00\x00\x00\x00\x00\xa9n\x04\x00\x00\x00\x00\x00\xaan\x04\x00\x00\x00\x00\x00\xcbn\x04\x00\x00\x00\x00\x00\xccn\x04\x00\x00\x00\x00\x00\xcdn\x04\x00\x00\x00\x00\x00\xcen\x04\x00\x00\x00\x00\x00(o\x04\x00\x00\x00\x00\x00)o\x04\x00\x00\x00\x00\x007p\x04\x00\x00\x00\x00\x00mp\x04\x00\x00\x00\x00\x00qp\x04\x00\x00\x00\x00\x00'
+    b'yp\x04\x00\x00\x00\x00\x00\x80p\x04\x00\x00\x00\x00\x00\x81p\x04\x00\x00\x00\x00\x00\xcap\x04\x00\x00\x00\x00\x00\xcep\x04\x00\x00\x00\x00\x00\xd0p\x04\x00\x00\x00\x00\x00\xdap\x04\x00\x00\x00\x00\x00\xddp\x04\x00\x00\x00\x00\x00\xdfp\x04\x00\x00\x00\x00\x00\xe5p\x04\x00\x00\x00\x00\x00\xecp\x04\x00\x00\x00\x00\x00\xf3p\x04\x00\x00\x00\x00\x00'
+    b'\xf5p\x04\x00\x00\x00\x00\x00\xf8p\x04\x00\x00\x00\x00\x00\x02q\x04\x00\x00\x00\x00\x00\x07q\x04\x00\x00\x00\x00\x00\nq\x04\x00\x00\x00\x00\x00\x16q\x04\x00\x00\x00\x00\x00"q\x04\x00\x00\x00\x00\x00&q\x04\x00\x00\x00\x00\x00(q\x04\x00\x00\x00\x00\x00*q\x04\x00\x00\x00\x00\x005q\x04\x00\x00\x00\x00\x008q\x04\x00\x00\x00\x00\x00'
+    b';q\x04\x00\x00\x00\x00\x00Cq\x04\x00\x00\x00\x00\x00Yq\x04\x00\x00\x00\x00\x00Zq\x04\x00\x00\x00\x00\x00]q\x04\x00\x00\x00\x00\x00_q\x04\x00\x00\x00\x00\x00jq\x04\x00\x00\x00\x00\x00mq\x04\x00\x00\x00\x00\x00qq\x04\x00\x00\x00\x00\x00tq\x04\x00\x00\x00\x00\x00\x83q\x04\x00\x00\x00\x00\x00\x85q\x04\x00\x00\x00\x00\x00'
+    b'\x88q\x04\x00\x00\x00\x00\x00\x95q\x04\x00\x00\x00\x00\x00\x97q\x04\x00\x00\x00\x00\x00\xa4q\x04\x00\x00\x00\x00\x00\xa6q\x04\x00\x00\x00\x00\x00\xa9q\x04\x00\x00\x00\x00\x00\xaaq\x04\x00\x00\x00\x00\x00\xc0q\x04\x00\x00\x00\x00\x00\xc1q\x04\x00\x00\x00\x00\x00\xc2q\x04\x00\x00\x00\x00\x00\xc3q\x04\x00\x00\x00\x00\x00\xc5q\x04\x00\x00\x00\x00\x00'
+    b'\xc6q\x04\x00\x00\x00\x00\x00\xcfq\x04\x00\x00\x00\x00\x00\xd1q\x04\x00\x00\x00\x00\x00\xd2q\x04\x00\x00\x00\x00\x00\xd4q\x04\x00\x00\x00\x00\x00\xb6r\x04\x00\x00\x00\x00\x00\xb7r\x04\x00\x00\x00\x00\x00\xb8r\x04\x00\x00\x00\x00\x00\xb9r\x04\x00\x00\x00\x00\x00\xbar\x04\x00\x00\x00\x00\x00\xbbr\x04\x00\x00\x00\x00\x00\xbcr\x04\x00\x00\x00\x00\x00'
+    b'\xbdr\x04\x00\x00\x00\x00\x00\xc1r\x04\x00\x00\x00\x00\x00\xb6s\x04\x00\x00\x00\x00\x00\xb7s\x04\x00\x00\x00\x00\x00\xb8s\x04\x00\x00\x00\x00\x00\xb9s\x04\x00\x00\x00\x00\x00\xbas\x04\x00\x00\x00\x00\x00\xbbs\x04\x00\x00\x00\x00\x00it\x04\x00\x00\x00\x00\x00\x9dt\x04\x00\x00\x00\x00\x00\xdbt\x04\x00\x00\x00\x00\x00\xdft\x04\x00\x00\x00\x00\x00'
+    b'\xe1t\x04\x00\x00\x00\x00\x00\x1du\x04\x00\x00\x00\x00\x00\x1eu\x04\x00\x00\x00\x00\x00&u\x04\x00\x00\x00\x00\x00Du\x04\x00\x00\x00\x00\x00Eu\x04\x00\x00\x00\x00\x00Fu\x04\x00\x00\x00\x00\x00\x1av\x04\x00\x00\x00\x00\x00 v\x04\x00\x00\x00\x00\x00\x93w\x04\x00\x00\x00\x00\x00\xa0w\x04\x00\x00\x00\x00\x00\xa2w\x04\x00\x00\x00\x00\x00'
+    b'\xa3w\x04\x00\x00\x00\x00\x00\xa4w\x04\x00\x00\x00\x00\x00Lx\x04\x00\x00\x00\x00\x00Nx\x04\x00\x00\x00\x00\x00Qx\x04\x00\x00\x00\x00\x00Sx\x04\x00\x00\x00\x00\x00\x89x\x04\x00\x00\x00\x00\x00\x9bx\x04\x00\x00\x00\x00\x00\x9cx\x04\x00\x00\x00\x00\x00\x9dx\x04\x00\x00\x00\x00\x00\x9ex\x04\x00\x00\x00\x00\x00\x9fx\x04\x00\x00\x00\x00\x00'
+    b'\xa0x\x04\x00\x00\x00\x00\x00\xa1x\x04\x00\x00\x00\x00\x00\xa2x\x04\x00\x00\x00\x00\x00$y\x04\x00\x00\x00\x00\x00\xc4y\x04\x00\x00\x00\x00\x00\xf1y\x04\x00\x00\x00\x00\x00<z\x04\x00\x00\x00\x00\x00\xacz\x04\x00\x00\x00\x00\x00\xc1z\x04\x00\x00\x00\x00\x00\xc2z\x04\x00\x00\x00\x00\x00\x10{\x04\x00\x00\x00\x00\x00\x11{\x04\x00\x00\x00\x00\x00'
+    b'U{\x04\x00\x00\x00\x00\x00\xcc{\x04\x00\x00\x00\x00\x00\xce{\x04\x00\x00\x00\x00\x00\xfc{\x04\x00\x00\x00\x00\x00j|\x04\x00\x00\x00\x00\x00l|\x04\x00\x00\x00\x00\x00n|\x04\x00\x00\x00\x00\x00o|\x04\x00\x00\x00\x00\x00q|\x04\x00\x00\x00\x00\x00r|\x04\x00\x00\x00\x00\x00\xab|\x04\x00\x00\x00\x00\x00\xac|\x04\x00\x00\x00\x00\x00'
+    b'\xad|\x04\x00\x00\x00\x00\x00\xec|\x04\x00\x00\x00\x00\x00\xf1|\x04\x00\x00\x00\x00\x00E}\x04\x00\x00\x00\x00\x00^}\x04\x00\x00\x00\x00\x00\xb6}\x04\x00\x00\x00\x00\x00\xb7}\x04\x00\x00\x00\x00\x00\xb9}\x04\x00\x00\x00\x00\x00\xc6}\x04\x00\x00\x00\x00\x00q~\x04\x00\x00\x00\x00\x00}~\x04\x00\x00\x00\x00\x00~~\x04\x00\x00\x00\x00\x00'
+    b'\x98~\x04\x00\x00\x00\x00\x00\xdf\x7f\x04\x00\x00\x00\x00\x00\xfd\x7f\x04\x00\x00\x00\x00\x00\x99\x81\x04\x00\x00\x00\x00\x00\x9b\x81\x04\x00\x00\x00\x00\x00\x9e\x81\x04\x00\x00\x00\x00\x00\xd6\x81\x04\x00\x00\x00\x00\x00\xd7\x81\x04\x00\x00\x00\x00\x00<\x82\x04\x00\x00\x00\x00\x00\x89\x83\x04\x00\x00\x00\x00\x00\x8a\x83\x04\x00\x00\x00\x00\x00\xbe\x83\x04\x00\x00\x00\x00\x00'
+    b'\xbf\x83\x04\x00\x00\x00\x00\x00\xc0\x83\x04\x00\x00\x00\x00\x00\xcb\x83\x04\x00\x00\x00\x00\x00\xd5\x83\x04\x00\x00\x00\x00\x00\xd6\x83\x04\x00\x00\x00\x00\x00\xd7\x83\x04\x00\x00\x00\x00\x00\xd8\x83\x04\x00\x00\x00\x00\x00\xd9\x83\x04\x00\x00\x00\x00\x00\xda\x83\x04\x00\x00\x00\x00\x00\xdb\x83\x04\x00\x00\x00\x00\x00\xe6\x83\x04\x00\x00\x00\x00\x006\x84\x04\x00\x00\x00\x00\x00'
+    b"7\x84\x04\x00\x00\x00\x00\x008\x84\x04\x00\x00\x00\x00\x009\x84\x04\x00\x00\x00\x00\x00:\x84\x04\x00\x00\x00\x00\x00;\x84\x04\x00\x00\x00\x00\x00=\x84\x04\x00\x00\x00\x00\x00\xb8\x84\x04\x00\x00\x00\x00\x00'\x85\x04\x00\x00\x00\x00\x001\x85\x04\x00\x00\x00\x00\x002\x85\x04\x00\x00\x00\x00\x00\x98\x85\x04\x00\x00\x00\x00\x00\xaa\x85\x04\x00\x00\x00\x00\x00"
+    b'\xab\x85\x04\x00\x00\x00\x00\x00\xac\x85\x04\x00\x00\x00\x00\x00\xad\x85\x04\x00\x00\x00\x00\x00\xae\x85\x04\x00\x00\x00\x00\x00T\x88\x04\x00\x00\x00\x00\x00\xc0\x88\x04\x00\x00\x00\x00\x00B\x89\x04\x00\x00\x00\x00\x00\x83\x8a\x04\x00\x00\x00\x00\x00\xd5\x8a\x04\x00\x00\x00\x00\x00\x1c\x8b\x04\x00\x00\x00\x00\x00\x1d\x8b\x04\x00\x00\x00\x00\x00\x1e\x8b\x04\x00\x00\x00\x00\x00'
+    b'M\x8b\x04\x00\x00\x00\x00\x00k\x8b\x04\x00\x00\x00\x00\x00\xdc\x8b\x04\x00\x00\x00\x00\x00\x1f\x8c\x04\x00\x00\x00\x00\x00\xb0\x8c\x04\x00\x00\x00\x00\x00\xb1\x8c\x04\x00\x00\x00\x00\x00!\x8d\x04\x00\x00\x00\x00\x00H\x8d\x04\x00\x00\x00\x00\x00\xbf\x8e\x04\x00\x00\x00\x00\x00\xcd\x94\x04\x00\x00\x00\x00\x00\x8e\x95\x04\x00\x00\x00\x00\x00"\x9c\x04\x00\x00\x00\x00\x00'
+    b'\x95\xa4\x04\x00\x00\x00\x00\x00\xc3\xa4\x04\x00\x00\x00\x00\x00\xc4\xa4\x04\x00\x00\x00\x00\x00\xc5\xa4\x04\x00\x00\x00\x00\x00\xc6\xa4\x04\x00\x00\x00\x00\x00\xc7\xa4\x04\x00\x00\x00\x00\x00\xc8\xa4\x04\x00\x00\x00\x00\x00\xd0\xa8\x04\x00\x00\x00\x00\x00\xa4\xa9\x04\x00\x00\x00\x00\x00\x0e\xaa\x04\x00\x00\x00\x00\x00\x1f\xaa\x04\x00\x00\x00\x00\x00 \xaa\x04\x00\x00\x00\x00\x00'
+    b'A\xaa\x04\x00\x00\x00\x00\x00B\xaa\x04\x00\x00\x00\x00\x00C\xaa\x04\x00\x00\x00\x00\x00b\xaa\x04\x00\x00\x00\x00\x00c\xaa\x04\x00\x00\x00\x00\x00d\xaa\x04\x00\x00\x00\x00\x00l\xaa\x04\x00\x00\x00\x00\x00m\xaa\x04\x00\x00\x00\x00\x00n\xaa\x04\x00\x00\x00\x00\x00o\xaa\x04\x00\x00\x00\x00\x00p\xaa\x04\x00\x00\x00\x00\x00q\xaa\x04\x00\x00\x00\x00\x00'
+    b'r\xaa\x04\x00\x00\x00\x00\x00s\xaa\x04\x00\x00\x00\x00\x00\xa4\xaa\x04\x00\x00\x00\x00\x00\t\xab\x04\x00\x00\x00\x00\x00\x0b\xab\x04\x00\x00\x00\x00\x00\x0c\xab\x04\x00\x00\x00\x00\x00\r\xab\x04\x00\x00\x00\x00\x00\x0e\xab\x04\x00\x00\x00\x00\x00\x1e\xab\x04\x00\x00\x00\x00\x00!\xab\x04\x00\x00\x00\x00\x00"\xab\x04\x00\x00\x00\x00\x00#\xab\x04\x00\x00\x00\x00\x00'
+    b'\xda\xab\x04\x00\x00\x00\x00\x00\xdb\xab\x04\x00\x00\x00\x00\x00\xdc\xab\x04\x00\x00\x00\x00\x00\xdd\xab\x04\x00\x00\x00\x00\x00\xde\xab\x04\x00\x00\x00\x00\x00\xdf\xab\x04\x00\x00\x00\x00\x00\xe0\xab\x04\x00\x00\x00\x00\x00\xe1\xab\x04\x00\x00\x00\x00\x00\xe2\xab\x04\x00\x00\x00\x00\x00\xe3\xab\x04\x00\x00\x00\x00\x00\xe5\xab\x04\x00\x00\x00\x00\x00\xe6\xab\x04\x00\x00\x00\x00\x00'
+    b'\xe7\xab\x04\x00\x00\x00\x00\x00\xe8\xab\x04\x00\x00\x00\x00\x00\xe9\xab\x04\x00\x00\x00\x00\x00\xea\xab\x04\x00\x00\x00\x00\x00\xec\xab\x04\x00\x00\x00\x00\x00\xed\xab\x04\x00\x00\x00\x00\x00\xee\xab\x04\x00\x00\x00\x00\x00\xf0\xab\x04\x00\x00\x00\x00\x00\xf1\xab\x04\x00\x00\x00\x00\x00\xf2\xab\x04\x00\x00\x00\x00\x00\xf3\xab\x04\x00\x00\x00\x00\x00\xaa\xac\x04\x00\x00\x00\x00\x00'
+    b'\xca\xac\x04\x00\x00\x00\x00\x00\xe8\xad\x04\x00\x00\x00\x00\x00\xf6\xad\x04\x00\x00\x00\x00\x00\xf8\xad\x04\x00\x00\x00\x00\x00.\xae\x04\x00\x00\x00\x00\x00:\xae\x04\x00\x00\x00\x00\x00;\xae\x04\x00\x00\x00\x00\x00A\xae\x04\x00\x00\x00\x00\x00X\xae\x04\x00\x00\x00\x00\x00`\xae\x04\x00\x00\x00\x00\x00a\xae\x04\x00\x00\x00\x00\x00b\xae\x04\x00\x00\x00\x00\x00'
+    b'c\xae\x04\x00\x00\x00\x00\x00f\xae\x04\x00\x00\x00\x00\x00g\xae\x04\x00\x00\x00\x00\x00h\xae\x04\x00\x00\x00\x00\x00i\xae\x04\x00\x00\x00\x00\x00s\xae\x04\x00\x00\x00\x00\x00\xad\xae\x04\x00\x00\x00\x00\x00\x11\xb0\x04\x00\x00\x00\x00\x00\x12\xb0\x04\x00\x00\x00\x00\x00\x13\xb0\x04\x00\x00\x00\x00\x00\x14\xb0\x04\x00\x00\x00\x00\x00\x16\xb0\x04\x00\x00\x00\x00\x00'
+    b'\x18\xb0\x04\x00\x00\x00\x00\x00_\xb0\x04\x00\x00\x00\x00\x00`\xb0\x04\x00\x00\x00\x00\x00a\xb0\x04\x00\x00\x00\x00\x00\xf1\xb0\x04\x00\x00\x00\x00\x00\xf2\xb0\x04\x00\x00\x00\x00\x00\xf3\xb0\x04\x00\x00\x00\x00\x00\xf4\xb0\x04\x00\x00\x00\x00\x00\xf5\xb0\x04\x00\x00\x00\x00\x00\xf8\xb0\x04\x00\x00\x00\x00\x00\xf9\xb0\x04\x00\x00\x00\x00\x00\xfa\xb0\x04\x00\x00\x00\x00\x00'
+    b'\xfb\xb0\x04\x00\x00\x00\x00\x00\xfc\xb0\x04\x00\x00\x00\x00\x00\xfd\xb0\x04\x00\x00\x00\x00\x00\n\xb3\x04\x00\x00\x00\x00\x00\x0b\xb3\x04\x00\x00\x00\x00\x00R\xb4\x04\x00\x00\x00\x00\x00\xd5\xb4\x04\x00\x00\x00\x00\x00\xd6\xb4\x04\x00\x00\x00\x00\x00\xd7\xb4\x04\x00\x00\x00\x00\x00\xd8\xb4\x04\x00\x00\x00\x00\x00[\xb5\x04\x00\x00\x00\x00\x00\\\xb5\x04\x00\x00\x00\x00\x00'
+    b'h\xb5\x04\x00\x00\x00\x00\x00i\xb5\x04\x00\x00\x00\x00\x00o\xb5\x04\x00\x00\x00\x00\x00\x1d\xb7\x04\x00\x00\x00\x00\x00\x1e\xb7\x04\x00\x00\x00\x00\x00\xb3\xb8\x04\x00\x00\x00\x00\x00\xb4\xb8\x04\x00\x00\x00\x00\x00\xc9\xb8\x04\x00\x00\x00\x00\x00\xca\xb8\x04\x00\x00\x00\x00\x00\x1c\xb9\x04\x00\x00\x00\x00\x00\x1d\xb9\x04\x00\x00\x00\x00\x00\x1e\xb9\x04\x00\x00\x00\x00\x00'
+    b'\x8f\xbc\x04\x00\x00\x00\x00\x00g\xbd\x04\x00\x00\x00\x00\x00\xa6\xbd\x04\x00\x00\x00\x00\x00\xa8\xbd\x04\x00\x00\x00\x00\x00\xaa\xbd\x04\x00\x00\x00\x00\x00<\xbf\x04\x00\x00\x00\x00\x00\xa5\xc0\x04\x00\x00\x00\x00\x00\xa7\xc0\x04\x00\x00\x00\x00\x00;\xc1\x04\x00\x00\x00\x00\x00<\xc1\x04\x00\x00\x00\x00\x00\x8b\xc1\x04\x00\x00\x00\x00\x00\x8c\xc1\x04\x00\x00\x00\x00\x00'
+    b'\xd1\xc1\x04\x00\x00\x00\x00\x00\xd2\xc1\x04\x00\x00\x00\x00\x00\xd3\xc1\x04\x00\x00\x00\x00\x00\xd4\xc1\x04\x00\x00\x00\x00\x00Q\xc2\x04\x00\x00\x00\x00\x00S\xc2\x04\x00\x00\x00\x00\x00T\xc2\x04\x00\x00\x00\x00\x00U\xc2\x04\x00\x00\x00\x00\x00V\xc2\x04\x00\x00\x00\x00\x00W\xc2\x04\x00\x00\x00\x00\x00X\xc2\x04\x00\x00\x00\x00\x00f\xc2\x04\x00\x00\x00\x00\x00'
+    b'g\xc2\x04\x00\x00\x00\x00\x00h\xc2\x04\x00\x00\x00\x00\x00i\xc2\x04\x00\x00\x00\x00\x00j\xc2\x04\x00\x00\x00\x00\x00\x97\xc2\x04\x00\x00\x00\x00\x00\x98\xc2\x04\x00\x00\x00\x00\x00\x99\xc2\x04\x00\x00\x00\x00\x00\x9a\xc2\x04\x00\x00\x00\x00\x00\x9b\xc2\x04\x00\x00\x00\x00\x00\x9c\xc2\x04\x00\x00\x00\x00\x00\x9d\xc2\x04\x00\x00\x00\x00\x00\x9e\xc2\x04\x00\x00\x00\x00\x00'
+    b'\x9f\xc2\x04\x00\x00\x00\x00\x00\xea\xc2\x04\x00\x00\x00\x00\x00\xeb\xc2\x04\x00\x00\x00\x00\x00\xf7\xc2\x04\x00\x00\x00\x00\x00\xf8\xc2\x04\x00\x00\x00\x00\x00\x15\xc3\x04\x00\x00\x00\x00\x00E\xc3\x04\x00\x00\x00\x00\x00q\xc3\x04\x00\x00\x00\x00\x00\xaa\xc3\x04\x00\x00\x00\x00\x00\xc5\xc3\x04\x00\x00\x00\x00\x00\xc6\xc3\x04\x00\x00\x00\x00\x00\xed\xc3\x04\x00\x00\x00\x00\x00'
+    b'T\xc5\x04\x00\x00\x00\x00\x00e\xc5\x04\x00\x00\x00\x00\x00f\xc5\x04\x00\x00\x00\x00\x00g\xc5\x04\x00\x00\x00\x00\x00~\xc5\x04\x00\x00\x00\x00\x00\x82\xc5\x04\x00\x00\x00\x00\x00\x83\xc5\x04\x00\x00\x00\x00\x00\x98\xc5\x04\x00\x00\x00\x00\x00\x99\xc5\x04\x00\x00\x00\x00\x00\x9b\xc5\x04\x00\x00\x00\x00\x00\x9c\xc5\x04\x00\x00\x00\x00\x00\x9d\xc5\x04\x00\x00\x00\x00\x00'
+    b'\x9e\xc5\x04\x00\x00\x00\x00\x00\xb6\xc5\x04\x00\x00\x00\x00\x00\xb7\xc5\x04\x00\x00\x00\x00\x00\xb8\xc5\x04\x00\x00\x00\x00\x00q\xc6\x04\x00\x00\x00\x00\x00r\xc6\x04\x00\x00\x00\x00\x00s\xc6\x04\x00\x00\x00\x00\x00t\xc6\x04\x00\x00\x00\x00\x00u\xc6\x04\x00\x00\x00\x00\x00v\xc6\x04\x00\x00\x00\x00\x00w\xc6\x04\x00\x00\x00\x00\x00y\xc6\x04\x00\x00\x00\x00\x00'
+    b'z\xc6\x04\x00\x00\x00\x00\x00{\xc6\x04\x00\x00\x00\x00\x00\xaa\xc6\x04\x00\x00\x00\x00\x00\xdc\xc6\x04\x00\x00\x00\x00\x00\xe1\xc6\x04\x00\x00\x00\x00\x00\x9d\xc7\x04\x00\x00\x00\x00\x00\x9f\xc7\x04\x00\x00\x00\x00\x00\xa0\xc7\x04\x00\x00\x00\x00\x00\xa1\xc7\x04\x00\x00\x00\x00\x00\xa2\xc7\x04\x00\x00\x00\x00\x00\xa3\xc7\x04\x00\x00\x00\x00\x00\xa4\xc7\x04\x00\x00\x00\x00\x00'
+    b'\xa8\xc7\x04\x00\x00\x00\x00\x00\xa9\xc7\x04\x00\x00\x00\x00\x00\xac\xc7\x04\x00\x00\x00\x00\x00\xad\xc7\x04\x00\x00\x00\x00\x00\xae\xc7\x04\x00\x00\x00\x00\x00|\xc8\x04\x00\x00\x00\x00\x00\x8d\xc8\x04\x00\x00\x00\x00\x00\x8e\xc8\x04\x00\x00\x00\x00\x00\xdf\xc8\x04\x00\x00\x00\x00\x00\xe0\xc8\x04\x00\x00\x00\x00\x00\xf3\xc8\x04\x00\x00\x00\x00\x009\xc9\x04\x00\x00\x00\x00\x00'
+    b'W\xc9\x04\x00\x00\x00\x00\x00\x1b\xca\x04\x00\x00\x00\x00\x00B\xca\x04\x00\x00\x00\x00\x00C\xca\x04\x00\x00\x00\x00\x00D\xca\x04\x00\x00\x00\x00\x00E\xca\x04\x00\x00\x00\x00\x00\x9f\xca\x04\x00\x00\x00\x00\x00\xa0\xca\x04\x00\x00\x00\x00\x00\xad\xca\x04\x00\x00\x00\x00\x00\xae\xca\x04\x00\x00\x00\x00\x006\xcb\x04\x00\x00\x00\x00\x007\xcb\x04\x00\x00\x00\x00\x00'
+    b'8\xcb\x04\x00\x00\x00\x00\x009\xcb\x04\x00\x00\x00\x00\x00U\xcb\x04\x00\x00\x00\x00\x00\x9f\xcb\x04\x00\x00\x00\x00\x00\xa0\xcb\x04\x00\x00\x00\x00\x00\x9a\xcd\x04\x00\x00\x00\x00\x00\x9d\xcd\x04\x00\x00\x00\x00\x00\x9e\xcd\x04\x00\x00\x00\x00\x00\x9f\xcd\x04\x00\x00\x00\x00\x00.\xce\x04\x00\x00\x00\x00\x00\xc4\xce\x04\x00\x00\x00\x00\x00\xcb\xce\x04\x00\x00\x00\x00\x00'
+    b'\xcc\xce\x04\x00\x00\x00\x00\x00{\xcf\x04\x00\x00\x00\x00\x00\x84\xd1\x04\x00\x00\x00\x00\x00\x85\xd1\x04\x00\x00\x00\x00\x00\x86\xd1\x04\x00\x00\x00\x00\x00\x88\xd1\x04\x00\x00\x00\x00\x00\x89\xd1\x04\x00\x00\x00\x00\x00\x8a\xd1\x04\x00\x00\x00\x00\x00\x8c\xd1\x04\x00\x00\x00\x00\x00\x8d\xd1\x04\x00\x00\x00\x00\x00\x8e\xd1\x04\x00\x00\x00\x00\x00\x90\xd1\x04\x00\x00\x00\x00\x00'
+    b'\x91\xd1\x04\x00\x00\x00\x00\x00\x92\xd1\x04\x00\x00\x00\x00\x00\x94\xd1\x04\x00\x00\x00\x00\x00\x95\xd1\x04\x00\x00\x00\x00\x00\x96\xd1\x04\x00\x00\x00\x00\x00`\xd2\x04\x00\x00\x00\x00\x00b\xd2\x04\x00\x00\x00\x00\x00\x98\xd2\x04\x00\x00\x00\x00\x00\x0e\xd3\x04\x00\x00\x00\x00\x00\x0f\xd3\x04\x00\x00\x00\x00\x00\x10\xd3\x04\x00\x00\x00\x00\x00\x11\xd3\x04\x00\x00\x00\x00\x00'
+    b'*\xd3\x04\x00\x00\x00\x00\x00<\xd3\x04\x00\x00\x00\x00\x00=\xd3\x04\x00\x00\x00\x00\x00f\xd3\x04\x00\x00\x00\x00\x00\x19\xd4\x04\x00\x00\x00\x00\x00\x1a\xd4\x04\x00\x00\x00\x00\x00)\xd5\x04\x00\x00\x00\x00\x00*\xd5\x04\x00\x00\x00\x00\x00\xc8\xd6\x04\x00\x00\x00\x00\x00\xde\xd7\x04\x00\x00\x00\x00\x00\xe0\xd7\x04\x00\x00\x00\x00\x00\x9d\xd8\x04\x00\x00\x00\x00\x00'
+    b'\x9e\xd8\x04\x00\x00\x00\x00\x00\xe1\xd8\x04\x00\x00\x00\x00\x00\xe3\xd8\x04\x00\x00\x00\x00\x00\xe4\xd8\x04\x00\x00\x00\x00\x00\x02\xd9\x04\x00\x00\x00\x00\x00\x13\xda\x04\x00\x00\x00\x00\x00\x15\xda\x04\x00\x00\x00\x00\x00\x16\xda\x04\x00\x00\x00\x00\x00\x17\xda\x04\x00\x00\x00\x00\x00\x18\xda\x04\x00\x00\x00\x00\x00\x19\xda\x04\x00\x00\x00\x00\x00\x1a\xda\x04\x00\x00\x00\x00\x00'
+    b'}\xda\x04\x00\x00\x00\x00\x00\x7f\xda\x04\x00\x00\x00\x00\x00\x82\xda\x04\x00\x00\x00\x00\x00\x84\xda\x04\x00\x00\x00\x00\x00\x05\xdb\x04\x00\x00\x00\x00\x00@\xdb\x04\x00\x00\x00\x00\x00F\xdb\x04\x00\x00\x00\x00\x00G\xdb\x04\x00\x00\x00\x00\x00H\xdb\x04\x00\x00\x00\x00\x00I\xdb\x04\x00\x00\x00\x00\x00\x9d\xdb\x04\x00\x00\x00\x00\x00\xde\xdc\x04\x00\x00\x00\x00\x00'
+    b'\xdf\xdc\x04\x00\x00\x00\x00\x00\x1e\xdd\x04\x00\x00\x00\x00\x00O\xdd\x04\x00\x00\x00\x00\x00\xd6\xde\x04\x00\x00\x00\x00\x00\xd8\xde\x04\x00\x00\x00\x00\x00\xda\xde\x04\x00\x00\x00\x00\x00\xdc\xde\x04\x00\x00\x00\x00\x00\xe0\xde\x04\x00\x00\x00\x00\x00\x0e\xdf\x04\x00\x00\x00\x00\x00\x0f\xdf\x04\x00\x00\x00\x00\x00k\xdf\x04\x00\x00\x00\x00\x00+\xe0\x04\x00\x00\x00\x00\x00'
+    b',\xe0\x04\x00\x00\x00\x00\x00.\xe0\x04\x00\x00\x00\x00\x00\x98\xe1\x04\x00\x00\x00\x00\x00\xb5\xe2\x04\x00\x00\x00\x00\x00\xb6\xe2\x04\x00\x00\x00\x00\x00L\xe3\x04\x00\x00\x00\x00\x00M\xe3\x04\x00\x00\x00\x00\x00N\xe3\x04\x00\x00\x00\x00\x00O\xe3\x04\x00\x00\x00\x00\x00\x87\xe3\x04\x00\x00\x00\x00\x00\x88\xe3\x04\x00\x00\x00\x00\x00\x89\xe3\x04\x00\x00\x00\x00\x00'
+    b'\xeb\xe3\x04\x00\x00\x00\x00\x00\xed\xe3\x04\x00\x00\x00\x00\x00\xee\xe3\x04\x00\x00\x00\x00\x00\xef\xe3\x04\x00\x00\x00\x00\x00\x04\xe4\x04\x00\x00\x00\x00\x00\x05\xe4\x04\x00\x00\x00\x00\x00\x06\xe4\x04\x00\x00\x00\x00\x00q\xe4\x04\x00\x00\x00\x00\x00\x89\xe4\x04\x00\x00\x00\x00\x00\x8a\xe4\x04\x00\x00\x00\x00\x00\x8b\xe4\x04\x00\x00\x00\x00\x00+\xe5\x04\x00\x00\x00\x00\x00'
+    b',\xe5\x04\x00\x00\x00\x00\x00\x86\xe5\x04\x00\x00\x00\x00\x00\xc3\xe5\x04\x00\x00\x00\x00\x00\xc4\xe5\x04\x00\x00\x00\x00\x00\xc7\xe5\x04\x00\x00\x00\x00\x00\xcd\xe5\x04\x00\x00\x00\x00\x00\xdd\xe5\x04\x00\x00\x00\x00\x00\xde\xe5\x04\x00\x00\x00\x00\x00\x0c\xe6\x04\x00\x00\x00\x00\x00\r\xe6\x04\x00\x00\x00\x00\x00\x11\xe6\x04\x00\x00\x00\x00\x00\x13\xe6\x04\x00\x00\x00\x00\x00'
+    b'(\xe6\x04\x00\x00\x00\x00\x00)\xe6\x04\x00\x00\x00\x00\x00\xbe\xe6\x04\x00\x00\x00\x00\x00\xbf\xe6\x04\x00\x00\x00\x00\x00\xc0\xe6\x04\x00\x00\x00\x00\x00\xc1\xe6\x04\x00\x00\x00\x00\x00\xc2\xe6\x04\x00\x00\x00\x00\x00\xc3\xe6\x04\x00\x00\x00\x00\x00\xc4\xe6\x04\x00\x00\x00\x00\x00\xc5\xe6\x04\x00\x00\x00\x00\x00\xc6\xe6\x04\x00\x00\x00\x00\x00\xd6\xe6\x04\x00\x00\x00\x00\x00'
+    b'\xd7\xe6\x04\x00\x00\x00\x00\x00~\xe7\x04\x00\x00\x00\x00\x00Z\xe8\x04\x00\x00\x00\x00\x00M\xe9\x04\x00\x00\x00\x00\x00N\xe9\x04\x00\x00\x00\x00\x00)\xea\x04\x00\x00\x00\x00\x00\xc3\xea\x04\x00\x00\x00\x00\x00\xc4\xea\x04\x00\x00\x00\x00\x00\xc5\xea\x04\x00\x00\x00\x00\x00\xc6\xea\x04\x00\x00\x00\x00\x00_\xeb\x04\x00\x00\x00\x00\x00\x93\xeb\x04\x00\x00\x00\x00\x00'
+    b'\x94\xeb\x04\x00\x00\x00\x00\x00\xf7\xec\x04\x00\x00\x00\x00\x00\x06\xee\x04\x00\x00\x00\x00\x00\x12\xef\x04\x00\x00\x00\x00\x00Y\xef\x04\x00\x00\x00\x00\x00\xed\xef\x04\x00\x00\x00\x00\x00\x13\xf0\x04\x00\x00\x00\x00\x000\xf0\x04\x00\x00\x00\x00\x001\xf0\x04\x00\x00\x00\x00\x005\xf0\x04\x00\x00\x00\x00\x006\xf0\x04\x00\x00\x00\x00\x007\xf0\x04\x00\x00\x00\x00\x00'
+    b'8\xf0\x04\x00\x00\x00\x00\x00N\xf0\x04\x00\x00\x00\x00\x00O\xf0\x04\x00\x00\x00\x00\x00Q\xf0\x04\x00\x00\x00\x00\x00R\xf0\x04\x00\x00\x00\x00\x00\xbc\xf0\x04\x00\x00\x00\x00\x00\x1a\xf1\x04\x00\x00\x00\x00\x00\xe2\xf1\x04\x00\x00\x00\x00\x00\xf7\xf1\x04\x00\x00\x00\x00\x00\x89\xf2\x04\x00\x00\x00\x00\x00"\xf4\x04\x00\x00\x00\x00\x00X\xf4\x04\x00\x00\x00\x00\x00'
+    b'Y\xf4\x04\x00\x00\x00\x00\x00\xec\xf5\x04\x00\x00\x00\x00\x00g\xf6\x04\x00\x00\x00\x00\x00\x10\xf8\x04\x00\x00\x00\x00\x00 \xf8\x04\x00\x00\x00\x00\x00!\xf8\x04\x00\x00\x00\x00\x00"\xf8\x04\x00\x00\x00\x00\x00\xe9\xf8\x04\x00\x00\x00\x00\x00\xea\xf8\x04\x00\x00\x00\x00\x00\xeb\xf8\x04\x00\x00\x00\x00\x00\xec\xf8\x04\x00\x00\x00\x00\x00\xed\xf8\x04\x00\x00\x00\x00\x00'
+    b'\xee\xf8\x04\x00\x00\x00\x00\x00\xef\xf8\x04\x00\x00\x00\x00\x00\xf0\xf8\x04\x00\x00\x00\x00\x00\xf1\xf8\x04\x00\x00\x00\x00\x00\xf2\xf8\x04\x00\x00\x00\x00\x00\x7f\xf9\x04\x00\x00\x00\x00\x00\x80\xf9\x04\x00\x00\x00\x00\x00\xb6\xf9\x04\x00\x00\x00\x00\x00\xb7\xf9\x04\x00\x00\x00\x00\x00\xb8\xf9\x04\x00\x00\x00\x00\x00\xb9\xf9\x04\x00\x00\x00\x00\x00\xba\xf9\x04\x00\x00\x00\x00\x00'
+    b'\xbb\xf9\x04\x00\x00\x00\x00\x00\xbc\xf9\x04\x00\x00\x00\x00\x00\xbd\xf9\x04\x00\x00\x00\x00\x00\xbe\xf9\x04\x00\x00\x00\x00\x00\xbf\xf9\x04\x00\x00\x00\x00\x00\xca\xf9\x04\x00\x00\x00\x00\x00\xcb\xf9\x04\x00\x00\x00\x00\x00\xcc\xf9\x04\x00\x00\x00\x00\x00\xcd\xf9\x04\x00\x00\x00\x00\x00\xce\xf9\x04\x00\x00\x00\x00\x00\xcf\xf9\x04\x00\x00\x00\x00\x00\xd0\xf9\x04\x00\x00\x00\x00\x00'
+    b'\xd1\xf9\x04\x00\x00\x00\x00\x00\xd2\xf9\x04\x00\x00\x00\x00\x00\xd3\xf9\x04\x00\x00\x00\x00\x00\xd4\xf9\x04\x00\x00\x00\x00\x00\xd5\xf9\x04\x00\x00\x00\x00\x00\xcd\xfa\x04\x00\x00\x00\x00\x00\t\xfb\x04\x00\x00\x00\x00\x00\x05\xfc\x04\x00\x00\x00\x00\x00\x06\xfc\x04\x00\x00\x00\x00\x00\x07\xfc\x04\x00\x00\x00\x00\x00\xe7\xfc\x04\x00\x00\x00\x00\x00g\xfd\x04\x00\x00\x00\x00\x00'
+    b'\x03\xfe\x04\x00\x00\x00\x00\x00\xed\xfe\x04\x00\x00\x00\x00\x00[\xff\x04\x00\x00\x00\x00\x00\xa3\x01\x05\x00\x00\x00\x00\x00\x13\x05\x05\x00\x00\x00\x00\x00\x14\x05\x05\x00\x00\x00\x00\x00\xae\x05\x05\x00\x00\x00\x00\x00\xaf\x05\x05\x00\x00\x00\x00\x00p\x06\x05\x00\x00\x00\x00\x00\xc1\x06\x05\x00\x00\x00\x00\x00\xee\n\x05\x00\x00\x00\x00\x00\xef\n\x05\x00\x00\x00\x00\x00'
+    b'\xf0\n\x05\x00\x00\x00\x00\x00\xf1\n\x05\x00\x00\x00\x00\x00\xaf\x0c\x05\x00\x00\x00\x00\x00\xb0\x0c\x05\x00\x00\x00\x00\x00\x16\x11\x05\x00\x00\x00\x00\x00\x17\x11\x05\x00\x00\x00\x00\x00\x00\x12\x05\x00\x00\x00\x00\x00\xab\x14\x05\x00\x00\x00\x00\x00\xb4\x15\x05\x00\x00\x00\x00\x00B\x16\x05\x00\x00\x00\x00\x00U\x16\x05\x00\x00\x00\x00\x00\x87\x16\x05\x00\x00\x00\x00\x00'
+    b'\x88\x16\x05\x00\x00\x00\x00\x00\xfe\x16\x05\x00\x00\x00\x00\x00\xff\x16\x05\x00\x00\x00\x00\x00\x01\x17\x05\x00\x00\x00\x00\x00\x0c\x1c\x05\x00\x00\x00\x00\x00\r\x1c\x05\x00\x00\x00\x00\x00C\x1e\x05\x00\x00\x00\x00\x00P\x1e\x05\x00\x00\x00\x00\x00\x02!\x05\x00\x00\x00\x00\x00\x03!\x05\x00\x00\x00\x00\x00\x04!\x05\x00\x00\x00\x00\x00m"\x05\x00\x00\x00\x00\x00'
+    b'n"\x05\x00\x00\x00\x00\x00\xc2%\x05\x00\x00\x00\x00\x00L\'\x05\x00\x00\x00\x00\x00M\'\x05\x00\x00\x00\x00\x00N\'\x05\x00\x00\x00\x00\x00O\'\x05\x00\x00\x00\x00\x00P\'\x05\x00\x00\x00\x00\x00Q\'\x05\x00\x00\x00\x00\x00\x95\'\x05\x00\x00\x00\x00\x00\xfc(\x05\x00\x00\x00\x00\x00\xfe(\x05\x00\x00\x00\x00\x00\x82)\x05\x00\x00\x00\x00\x00'
+    b'\xe8)\x05\x00\x00\x00\x00\x00\xeb)\x05\x00\x00\x00\x00\x00)*\x05\x00\x00\x00\x00\x00**\x05\x00\x00\x00\x00\x00+*\x05\x00\x00\x00\x00\x00\x9f+\x05\x00\x00\x00\x00\x00\xf9+\x05\x00\x00\x00\x00\x00\xfb+\x05\x00\x00\x00\x00\x00X,\x05\x00\x00\x00\x00\x000-\x05\x00\x00\x00\x00\x001-\x05\x00\x00\x00\x00\x00\xc8-\x05\x00\x00\x00\x00\x00'
+    b'\xc9-\x05\x00\x00\x00\x00\x00\x97/\x05\x00\x00\x00\x00\x00\x99/\x05\x00\x00\x00\x00\x00\xd9/\x05\x00\x00\x00\x00\x00#0\x05\x00\x00\x00\x00\x00$0\x05\x00\x00\x00\x00\x00%0\x05\x00\x00\x00\x00\x00&0\x05\x00\x00\x00\x00\x00\x9b0\x05\x00\x00\x00\x00\x00\x9c0\x05\x00\x00\x00\x00\x00\xd80\x05\x00\x00\x00\x00\x00\xd90\x05\x00\x00\x00\x00\x00'
+    b'\xda0\x05\x00\x00\x00\x00\x00s1\x05\x00\x00\x00\x00\x00t1\x05\x00\x00\x00\x00\x00\xfb1\x05\x00\x00\x00\x00\x00\xf22\x05\x00\x00\x00\x00\x00\xf82\x05\x00\x00\x00\x00\x00\xf92\x05\x00\x00\x00\x00\x00\xfb2\x05\x00\x00\x00\x00\x00E3\x05\x00\x00\x00\x00\x00\xae3\x05\x00\x00\x00\x00\x00\xc93\x05\x00\x00\x00\x00\x00\xca3\x05\x00\x00\x00\x00\x00'
+    b'\xcb3\x05\x00\x00\x00\x00\x00\xf43\x05\x00\x00\x00\x00\x00\xfa3\x05\x00\x00\x00\x00\x00r6\x05\x00\x00\x00\x00\x00s6\x05\x00\x00\x00\x00\x00\xf56\x05\x00\x00\x00\x00\x00\xf66\x05\x00\x00\x00\x00\x00\xf76\x05\x00\x00\x00\x00\x00\xf86\x05\x00\x00\x00\x00\x00\xee7\x05\x00\x00\x00\x00\x00\xef7\x05\x00\x00\x00\x00\x00\xf07\x05\x00\x00\x00\x00\x00'
+    b'K9\x05\x00\x00\x00\x00\x00L9\x05\x00\x00\x00\x00\x00M9\x05\x00\x00\x00\x00\x00N9\x05\x00\x00\x00\x00\x00O9\x05\x00\x00\x00\x00\x00P9\x05\x00\x00\x00\x00\x00J:\x05\x00\x00\x00\x00\x00\xe6:\x05\x00\x00\x00\x00\x00,;\x05\x00\x00\x00\x00\x00\xb9<\x05\x00\x00\x00\x00\x00\xba<\x05\x00\x00\x00\x00\x00\xbb<\x05\x00\x00\x00\x00\x00'
+    b'\xbc<\x05\x00\x00\x00\x00\x00\x10=\x05\x00\x00\x00\x00\x00\x13=\x05\x00\x00\x00\x00\x00\xc1>\x05\x00\x00\x00\x00\x00\x82?\x05\x00\x00\x00\x00\x00\x84?\x05\x00\x00\x00\x00\x00\xee?\x05\x00\x00\x00\x00\x00\xcb@\x05\x00\x00\x00\x00\x00\xf1@\x05\x00\x00\x00\x00\x00\x00A\x05\x00\x00\x00\x00\x00\x01A\x05\x00\x00\x00\x00\x00\x02A\x05\x00\x00\x00\x00\x00'
+    b'UA\x05\x00\x00\x00\x00\x00\xd6A\x05\x00\x00\x00\x00\x00\xd7A\x05\x00\x00\x00\x00\x00RB\x05\x00\x00\x00\x00\x00SB\x05\x00\x00\x00\x00\x00eB\x05\x00\x00\x00\x00\x00\x01C\x05\x00\x00\x00\x00\x00\x02C\x05\x00\x00\x00\x00\x00"C\x05\x00\x00\x00\x00\x00\xafC\x05\x00\x00\x00\x00\x009D\x05\x00\x00\x00\x00\x00AD\x05\x00\x00\x00\x00\x00'
+    b'BD\x05\x00\x00\x00\x00\x00YD\x05\x00\x00\x00\x00\x00\x0fE\x05\x00\x00\x00\x00\x00\x10E\x05\x00\x00\x00\x00\x00\x11E\x05\x00\x00\x00\x00\x00\xbaE\x05\x00\x00\x00\x00\x00\x05F\x05\x00\x00\x00\x00\x00.F\x05\x00\x00\x00\x00\x00/F\x05\x00\x00\x00\x00\x000F\x05\x00\x00\x00\x00\x001F\x05\x00\x00\x00\x00\x002F\x05\x00\x00\x00\x00\x00'
+    b'3F\x05\x00\x00\x00\x00\x004F\x05\x00\x00\x00\x00\x00\xdcF\x05\x00\x00\x00\x00\x00\xe9F\x05\x00\x00\x00\x00\x00FG\x05\x00\x00\x00\x00\x00\x86G\x05\x00\x00\x00\x00\x00\x11H\x05\x00\x00\x00\x00\x00\xf9H\x05\x00\x00\x00\x00\x00\xfaH\x05\x00\x00\x00\x00\x00\xfbH\x05\x00\x00\x00\x00\x00\xfcH\x05\x00\x00\x00\x00\x001I\x05\x00\x00\x00\x00\x00'
+    b'2I\x05\x00\x00\x00\x00\x004I\x05\x00\x00\x00\x00\x00\x14J\x05\x00\x00\x00\x00\x00\x18J\x05\x00\x00\x00\x00\x00\x19J\x05\x00\x00\x00\x00\x00\x1aJ\x05\x00\x00\x00\x00\x00\x1bJ\x05\x00\x00\x00\x00\x00\x1cJ\x05\x00\x00\x00\x00\x00\x1dJ\x05\x00\x00\x00\x00\x00\x1eJ\x05\x00\x00\x00\x00\x00\x1fJ\x05\x00\x00\x00\x00\x00 J\x05\x00\x00\x00\x00\x00'
+    b'!J\x05\x00\x00\x00\x00\x00"J\x05\x00\x00\x00\x00\x00#J\x05\x00\x00\x00\x00\x00$J\x05\x00\x00\x00\x00\x00%J\x05\x00\x00\x00\x00\x000J\x05\x00\x00\x00\x00\x003J\x05\x00\x00\x00\x00\x004J\x05\x00\x00\x00\x00\x005J\x05\x00\x00\x00\x00\x006J\x05\x00\x00\x00\x00\x007J\x05\x00\x00\x00\x00\x008J\x05\x00\x00\x00\x00\x00'
+    b'9J\x05\x00\x00\x00\x00\x00:J\x05\x00\x00\x00\x00\x00;J\x05\x00\x00\x00\x00\x00<J\x05\x00\x00\x00\x00\x00=J\x05\x00\x00\x00\x00\x00>J\x05\x00\x00\x00\x00\x00?J\x05\x00\x00\x00\x00\x00@J\x05\x00\x00\x00\x00\x00AJ\x05\x00\x00\x00\x00\x00BJ\x05\x00\x00\x00\x00\x00OJ\x05\x00\x00\x00\x00\x00PJ\x05\x00\x00\x00\x00\x00'
+    b'QJ\x05\x00\x00\x00\x00\x00aK\x05\x00\x00\x00\x00\x00\xa6L\x05\x00\x00\x00\x00\x00\xd8M\x05\x00\x00\x00\x00\x00)N\x05\x00\x00\x00\x00\x00qN\x05\x00\x00\x00\x00\x00rN\x05\x00\x00\x00\x00\x00sN\x05\x00\x00\x00\x00\x00tN\x05\x00\x00\x00\x00\x00uN\x05\x00\x00\x00\x00\x00vN\x05\x00\x00\x00\x00\x00wN\x05\x00\x00\x00\x00\x00'
+    b'\xdaN\x05\x00\x00\x00\x00\x00\xdbN\x05\x00\x00\x00\x00\x00\xe4N\x05\x00\x00\x00\x00\x00\xecN\x05\x00\x00\x00\x00\x00\xedN\x05\x00\x00\x00\x00\x00\xd9P\x05\x00\x00\x00\x00\x00\xa4Q\x05\x00\x00\x00\x00\x00\xb4R\x05\x00\x00\x00\x00\x00\xb5R\x05\x00\x00\x00\x00\x00\xfaR\x05\x00\x00\x00\x00\x00\xffR\x05\x00\x00\x00\x00\x00\x01S\x05\x00\x00\x00\x00\x00'
+    b'\x9dU\x05\x00\x00\x00\x00\x00\x9eU\x05\x00\x00\x00\x00\x00\xf1W\x05\x00\x00\x00\x00\x00N[\x05\x00\x00\x00\x00\x00\x82[\x05\x00\x00\x00\x00\x00\xd0\\\x05\x00\x00\x00\x00\x00\xd1\\\x05\x00\x00\x00\x00\x00\xd2\\\x05\x00\x00\x00\x00\x00\xd3\\\x05\x00\x00\x00\x00\x00\xd8\\\x05\x00\x00\x00\x00\x00\xd9\\\x05\x00\x00\x00\x00\x00\xdb\\\x05\x00\x00\x00\x00\x00'
+    b'\xdd\\\x05\x00\x00\x00\x00\x00\xde\\\x05\x00\x00\x00\x00\x00\xdf\\\x05\x00\x00\x00\x00\x00\xe0\\\x05\x00\x00\x00\x00\x00\xe1\\\x05\x00\x00\x00\x00\x00\xe2\\\x05\x00\x00\x00\x00\x00\x01]\x05\x00\x00\x00\x00\x00\x02]\x05\x00\x00\x00\x00\x00\x03]\x05\x00\x00\x00\x00\x00\x04]\x05\x00\x00\x00\x00\x00\x05]\x05\x00\x00\x00\x00\x00\x06]\x05\x00\x00\x00\x00\x00'
+    b'\x07]\x05\x00\x00\x00\x00\x00\x08]\x05\x00\x00\x00\x00\x00\t]\x05\x00\x00\x00\x00\x00\n]\x05\x00\x00\x00\x00\x00\x0b]\x05\x00\x00\x00\x00\x00\x0c]\x05\x00\x00\x00\x00\x00\x0e]\x05\x00\x00\x00\x00\x00M]\x05\x00\x00\x00\x00\x00\xc1_\x05\x00\x00\x00\x00\x00A`\x05\x00\x00\x00\x00\x00H`\x05\x00\x00\x00\x00\x00I`\x05\x00\x00\x00\x00\x00'
+    b'^`\x05\x00\x00\x00\x00\x00\x15a\x05\x00\x00\x00\x00\x00\x16a\x05\x00\x00\x00\x00\x00\x17a\x05\x00\x00\x00\x00\x00\xaaa\x05\x00\x00\x00\x00\x00\xaba\x05\x00\x00\x00\x00\x00&c\x05\x00\x00\x00\x00\x00\x16e\x05\x00\x00\x00\x00\x00-e\x05\x00\x00\x00\x00\x00.e\x05\x00\x00\x00\x00\x00/e\x05\x00\x00\x00\x00\x000e\x05\x00\x00\x00\x00\x00'
+    b'1e\x05\x00\x00\x00\x00\x00ve\x05\x00\x00\x00\x00\x00\xd7e\x05\x00\x00\x00\x00\x00\xd8e\x05\x00\x00\x00\x00\x00\xd9e\x05\x00\x00\x00\x00\x00\xdae\x05\x00\x00\x00\x00\x00ug\x05\x00\x00\x00\x00\x00\x9ag\x05\x00\x00\x00\x00\x00\x9bg\x05\x00\x00\x00\x00\x00\xa4g\x05\x00\x00\x00\x00\x00\xb1g\x05\x00\x00\x00\x00\x00\xd6g\x05\x00\x00\x00\x00\x00'
+    b'\xd7g\x05\x00\x00\x00\x00\x00\xd8g\x05\x00\x00\x00\x00\x00\xd9g\x05\x00\x00\x00\x00\x00\xdag\x05\x00\x00\x00\x00\x00\xdbg\x05\x00\x00\x00\x00\x00\xdcg\x05\x00\x00\x00\x00\x00\xddg\x05\x00\x00\x00\x00\x00\xe7h\x05\x00\x00\x00\x00\x00\xe8h\x05\x00\x00\x00\x00\x00\xb9i\x05\x00\x00\x00\x00\x00\xbai\x05\x00\x00\x00\x00\x007k\x05\x00\x00\x00\x00\x00'
+    b'\xe0l\x05\x00\x00\x00\x00\x00Xm\x05\x00\x00\x00\x00\x00am\x05\x00\x00\x00\x00\x00bm\x05\x00\x00\x00\x00\x00cm\x05\x00\x00\x00\x00\x00dm\x05\x00\x00\x00\x00\x00em\x05\x00\x00\x00\x00\x00fm\x05\x00\x00\x00\x00\x00gm\x05\x00\x00\x00\x00\x00hm\x05\x00\x00\x00\x00\x00im\x05\x00\x00\x00\x00\x00jm\x05\x00\x00\x00\x00\x00'
+    b'wm\x05\x00\x00\x00\x00\x008n\x05\x00\x00\x00\x00\x00sn\x05\x00\x00\x00\x00\x00tn\x05\x00\x00\x00\x00\x00\xa9n\x05\x00\x00\x00\x00\x00[o\x05\x00\x00\x00\x00\x00\x8ao\x05\x00\x00\x00\x00\x00\x90p\x05\x00\x00\x00\x00\x00\x92p\x05\x00\x00\x00\x00\x00\x93p\x05\x00\x00\x00\x00\x00\x94p\x05\x00\x00\x00\x00\x00\x95p\x05\x00\x00\x00\x00\x00'
+    b'\x00q\x05\x00\x00\x00\x00\x00\x01q\x05\x00\x00\x00\x00\x00\xf0q\x05\x00\x00\x00\x00\x00\xf3q\x05\x00\x00\x00\x00\x00lr\x05\x00\x00\x00\x00\x00\x8dr\x05\x00\x00\x00\x00\x00\x8er\x05\x00\x00\x00\x00\x00\xb2r\x05\x00\x00\x00\x00\x00\xf8r\x05\x00\x00\x00\x00\x00\xf9r\x05\x00\x00\x00\x00\x00\x8as\x05\x00\x00\x00\x00\x00\xbfs\x05\x00\x00\x00\x00\x00'
+    b'\xc0s\x05\x00\x00\x00\x00\x00\xeas\x05\x00\x00\x00\x00\x00\xbct\x05\x00\x00\x00\x00\x00\x1eu\x05\x00\x00\x00\x00\x00\x1fu\x05\x00\x00\x00\x00\x00 u\x05\x00\x00\x00\x00\x00!u\x05\x00\x00\x00\x00\x00"u\x05\x00\x00\x00\x00\x00#u\x05\x00\x00\x00\x00\x00$u\x05\x00\x00\x00\x00\x00fu\x05\x00\x00\x00\x00\x00gu\x05\x00\x00\x00\x00\x00'
+    b'~v\x05\x00\x00\x00\x00\x00\x84x\x05\x00\x00\x00\x00\x00;y\x05\x00\x00\x00\x00\x00Yy\x05\x00\x00\x00\x00\x00\xcc\x85\x05\x00\x00\x00\x00\x00\xf2\x85\x05\x00\x00\x00\x00\x00\xf3\x85\x05\x00\x00\x00\x00\x00\xf4\x85\x05\x00\x00\x00\x00\x00o\x86\x05\x00\x00\x00\x00\x00p\x86\x05\x00\x00\x00\x00\x00q\x86\x05\x00\x00\x00\x00\x00\xae\x86\x05\x00\x00\x00\x00\x00'
+    b')\x87\x05\x00\x00\x00\x00\x00*\x87\x05\x00\x00\x00\x00\x00b\x87\x05\x00\x00\x00\x00\x00(\x88\x05\x00\x00\x00\x00\x00m\x89\x05\x00\x00\x00\x00\x00n\x89\x05\x00\x00\x00\x00\x00o\x89\x05\x00\x00\x00\x00\x00\x03\x8a\x05\x00\x00\x00\x00\x00\x04\x8a\x05\x00\x00\x00\x00\x00p\x8a\x05\x00\x00\x00\x00\x00\xe7\x8d\x05\x00\x00\x00\x00\x00\xe8\x8d\x05\x00\x00\x00\x00\x00'
+    b'\xe9\x8d\x05\x00\x00\x00\x00\x00\xea\x8d\x05\x00\x00\x00\x00\x00\xc8\x8e\x05\x00\x00\x00\x00\x00\x0f\x90\x05\x00\x00\x00\x00\x00\x10\x90\x05\x00\x00\x00\x00\x00\x11\x90\x05\x00\x00\x00\x00\x00!\x90\x05\x00\x00\x00\x00\x00"\x90\x05\x00\x00\x00\x00\x00Q\x92\x05\x00\x00\x00\x00\x00|\x92\x05\x00\x00\x00\x00\x00}\x92\x05\x00\x00\x00\x00\x00~\x92\x05\x00\x00\x00\x00\x00'
+    b'\x7f\x92\x05\x00\x00\x00\x00\x00\x80\x92\x05\x00\x00\x00\x00\x00\x81\x92\x05\x00\x00\x00\x00\x00\x8c\x92\x05\x00\x00\x00\x00\x00\x8d\x92\x05\x00\x00\x00\x00\x00\x8e\x92\x05\x00\x00\x00\x00\x00\x8f\x92\x05\x00\x00\x00\x00\x00\x90\x92\x05\x00\x00\x00\x00\x00\x91\x92\x05\x00\x00\x00\x00\x00\x92\x92\x05\x00\x00\x00\x00\x00\x93\x92\x05\x00\x00\x00\x00\x00\x94\x92\x05\x00\x00\x00\x00\x00'
+    b'\xce\x94\x05\x00\x00\x00\x00\x00\xd0\x94\x05\x00\x00\x00\x00\x00\xbe\x95\x05\x00\x00\x00\x00\x00\xbf\x95\x05\x00\x00\x00\x00\x00\xc0\x95\x05\x00\x00\x00\x00\x00\xb5\x96\x05\x00\x00\x00\x00\x00\xb6\x96\x05\x00\x00\x00\x00\x00F\x99\x05\x00\x00\x00\x00\x00g\x99\x05\x00\x00\x00\x00\x00h\x99\x05\x00\x00\x00\x00\x00i\x99\x05\x00\x00\x00\x00\x00j\x99\x05\x00\x00\x00\x00\x00'
+    b'k\x99\x05\x00\x00\x00\x00\x00l\x99\x05\x00\x00\x00\x00\x00m\x99\x05\x00\x00\x00\x00\x00n\x99\x05\x00\x00\x00\x00\x00o\x99\x05\x00\x00\x00\x00\x00\x86\x99\x05\x00\x00\x00\x00\x00\x87\x99\x05\x00\x00\x00\x00\x00\x88\x99\x05\x00\x00\x00\x00\x00\x89\x99\x05\x00\x00\x00\x00\x00g\x9e\x05\x00\x00\x00\x00\x00\xdd\x9e\x05\x00\x00\x00\x00\x00\xa4\xa0\x05\x00\x00\x00\x00\x00'
+    b'\xa5\xa0\x05\x00\x00\x00\x00\x00\xa6\xa0\x05\x00\x00\x00\x00\x00\xc6\xa0\x05\x00\x00\x00\x00\x00\xc7\xa0\x05\x00\x00\x00\x00\x00\x16\xa1\x05\x00\x00\x00\x00\x00\x17\xa1\x05\x00\x00\x00\x00\x00X\xa2\x05\x00\x00\x00\x00\x00p\xa2\x05\x00\x00\x00\x00\x00q\xa2\x05\x00\x00\x00\x00\x00r\xa2\x05\x00\x00\x00\x00\x00\x91\xa2\x05\x00\x00\x00\x00\x00\x93\xa2\x05\x00\x00\x00\x00\x00'
+    b'\x94\xa2\x05\x00\x00\x00\x00\x00\x95\xa2\x05\x00\x00\x00\x00\x00-\xa3\x05\x00\x00\x00\x00\x00\xc7\xa4\x05\x00\x00\x00\x00\x00e\xa5\x05\x00\x00\x00\x00\x00\xee\xa5\x05\x00\x00\x00\x00\x00\xef\xa5\x05\x00\x00\x00\x00\x00\x0e\xa6\x05\x00\x00\x00\x00\x00\x15\xa6\x05\x00\x00\x00\x00\x00\x16\xa6\x05\x00\x00\x00\x00\x00\x17\xa6\x05\x00\x00\x00\x00\x00\x18\xa6\x05\x00\x00\x00\x00\x00'
+    b'\x02\xa7\x05\x00\x00\x00\x00\x00:\xa7\x05\x00\x00\x00\x00\x00F\xa7\x05\x00\x00\x00\x00\x00G\xa7\x05\x00\x00\x00\x00\x00H\xa7\x05\x00\x00\x00\x00\x00L\xa7\x05\x00\x00\x00\x00\x00\x10\xa8\x05\x00\x00\x00\x00\x00\x1a\xa8\x05\x00\x00\x00\x00\x00\x0c\xaa\x05\x00\x00\x00\x00\x00\x10\xaa\x05\x00\x00\x00\x00\x00\x12\xaa\x05\x00\x00\x00\x00\x00\x13\xaa\x05\x00\x00\x00\x00\x00'
+    b'\x14\xaa\x05\x00\x00\x00\x00\x00\x16\xaa\x05\x00\x00\x00\x00\x00_\xab\x05\x00\x00\x00\x00\x00\x08\xad\x05\x00\x00\x00\x00\x00(\xad\x05\x00\x00\x00\x00\x00)\xad\x05\x00\x00\x00\x00\x00*\xad\x05\x00\x00\x00\x00\x00+\xad\x05\x00\x00\x00\x00\x002\xae\x05\x00\x00\x00\x00\x003\xae\x05\x00\x00\x00\x00\x00x\xae\x05\x00\x00\x00\x00\x00\x95\xae\x05\x00\x00\x00\x00\x00'
+    b'\x96\xae\x05\x00\x00\x00\x00\x00\x97\xae\x05\x00\x00\x00\x00\x00\x98\xae\x05\x00\x00\x00\x00\x00\x99\xae\x05\x00\x00\x00\x00\x00\x9a\xae\x05\x00\x00\x00\x00\x00\x9b\xae\x05\x00\x00\x00\x00\x00\x9c\xae\x05\x00\x00\x00\x00\x00\xd3\xaf\x05\x00\x00\x00\x00\x00\xd4\xaf\x05\x00\x00\x00\x00\x00\xd5\xaf\x05\x00\x00\x00\x00\x00\xd6\xaf\x05\x00\x00\x00\x00\x00\xd7\xaf\x05\x00\x00\x00\x00\x00'
+    b'\xd8\xaf\x05\x00\x00\x00\x00\x00\xd9\xaf\x05\x00\x00\x00\x00\x00\xda\xaf\x05\x00\x00\x00\x00\x00\xdb\xaf\x05\x00\x00\x00\x00\x00\xdc\xaf\x05\x00\x00\x00\x00\x00\xff\xb0\x05\x00\x00\x00\x00\x00\x00\xb1\x05\x00\x00\x00\x00\x00\x01\xb1\x05\x00\x00\x00\x00\x00\x02\xb1\x05\x00\x00\x00\x00\x00\x03\xb1\x05\x00\x00\x00\x00\x00\x04\xb1\x05\x00\x00\x00\x00\x00_\xb1\x05\x00\x00\x00\x00\x00'
+    b'\x9b\xb1\x05\x00\x00\x00\x00\x00\x9c\xb1\x05\x00\x00\x00\x00\x00\xc7\xb1\x05\x00\x00\x00\x00\x00\xe2\xb1\x05\x00\x00\x00\x00\x00\xe3\xb1\x05\x00\x00\x00\x00\x00\xd0\xb3\x05\x00\x00\x00\x00\x00\xe6\xb3\x05\x00\x00\x00\x00\x00\xe9\xb3\x05\x00\x00\x00\x00\x00\xea\xb3\x05\x00\x00\x00\x00\x00\x87\xb4\x05\x00\x00\x00\x00\x00\xb3\xb5\x05\x00\x00\x00\x00\x00\xb4\xb5\x05\x00\x00\x00\x00\x00'
+    b'\xb5\xb5\x05\x00\x00\x00\x00\x00\xb6\xb5\x05\x00\x00\x00\x00\x00\xb7\xb5\x05\x00\x00\x00\x00\x00)\xb6\x05\x00\x00\x00\x00\x00g\xb6\x05\x00\x00\x00\x00\x00\xfa\xb6\x05\x00\x00\x00\x00\x00\x85\xb7\x05\x00\x00\x00\x00\x00\xda\xb7\x05\x00\x00\x00\x00\x00\xe7\xb7\x05\x00\x00\x00\x00\x00\xad\xb8\x05\x00\x00\x00\x00\x00\xae\xb8\x05\x00\x00\x00\x00\x00\xaf\xb8\x05\x00\x00\x00\x00\x00'
+    b'\xba\xb8\x05\x00\x00\x00\x00\x00\xbb\xb8\x05\x00\x00\x00\x00\x00\xbc\xb8\x05\x00\x00\x00\x00\x00\xbd\xb8\x05\x00\x00\x00\x00\x00\xdb\xb8\x05\x00\x00\x00\x00\x00O\xb9\x05\x00\x00\x00\x00\x00P\xb9\x05\x00\x00\x00\x00\x00Q\xb9\x05\x00\x00\x00\x00\x00R\xb9\x05\x00\x00\x00\x00\x00S\xb9\x05\x00\x00\x00\x00\x00T\xb9\x05\x00\x00\x00\x00\x00g\xb9\x05\x00\x00\x00\x00\x00'
+    b'h\xb9\x05\x00\x00\x00\x00\x00\x90\xb9\x05\x00\x00\x00\x00\x00\xae\xb9\x05\x00\x00\x00\x00\x00\xaf\xb9\x05\x00\x00\x00\x00\x00\xb0\xb9\x05\x00\x00\x00\x00\x00\xb1\xb9\x05\x00\x00\x00\x00\x00\xb2\xb9\x05\x00\x00\x00\x00\x00\xb3\xb9\x05\x00\x00\x00\x00\x00\xb4\xb9\x05\x00\x00\x00\x00\x00\xb5\xb9\x05\x00\x00\x00\x00\x00\xb6\xb9\x05\x00\x00\x00\x00\x00\xb7\xb9\x05\x00\x00\x00\x00\x00'
+    b'>\xba\x05\x00\x00\x00\x00\x00@\xba\x05\x00\x00\x00\x00\x00\xe8\xba\x05\x00\x00\x00\x00\x00W\xbc\x05\x00\x00\x00\x00\x00X\xbc\x05\x00\x00\x00\x00\x00\x10\xbd\x05\x00\x00\x00\x00\x00.\xbd\x05\x00\x00\x00\x00\x00\xa7\xbd\x05\x00\x00\x00\x00\x00\xc2\xbe\x05\x00\x00\x00\x00\x00\xc3\xbe\x05\x00\x00\x00\x00\x00;\xc0\x05\x00\x00\x00\x00\x00=\xc0\x05\x00\x00\x00\x00\x00'
+    b'>\xc0\x05\x00\x00\x00\x00\x00?\xc0\x05\x00\x00\x00\x00\x00@\xc0\x05\x00\x00\x00\x00\x00A\xc0\x05\x00\x00\x00\x00\x00\x8f\xc0\x05\x00\x00\x00\x00\x00\x90\xc0\x05\x00\x00\x00\x00\x00\x16\xc1\x05\x00\x00\x00\x00\x00\x16\xc2\x05\x00\x00\x00\x00\x00\x17\xc2\x05\x00\x00\x00\x00\x00\x18\xc2\x05\x00\x00\x00\x00\x00\x19\xc2\x05\x00\x00\x00\x00\x00\xe8\xc2\x05\x00\x00\x00\x00\x00'
+    b'\x02\xc4\x05\x00\x00\x00\x00\x00\x03\xc4\x05\x00\x00\x00\x00\x00\x04\xc4\x05\x00\x00\x00\x00\x00\x05\xc4\x05\x00\x00\x00\x00\x00\x07\xc4\x05\x00\x00\x00\x00\x00\x08\xc4\x05\x00\x00\x00\x00\x00\t\xc4\x05\x00\x00\x00\x00\x00u\xc5\x05\x00\x00\x00\x00\x00\xd0\xc5\x05\x00\x00\x00\x00\x00\xd1\xc5\x05\x00\x00\x00\x00\x00\xd2\xc5\x05\x00\x00\x00\x00\x00\xd3\xc5\x05\x00\x00\x00\x00\x00'
+    b'\xd4\xc5\x05\x00\x00\x00\x00\x00\xd6\xc5\x05\x00\x00\x00\x00\x00\xd7\xc5\x05\x00\x00\x00\x00\x00\xd8\xc5\x05\x00\x00\x00\x00\x00\xd9\xc5\x05\x00\x00\x00\x00\x00\xe4\xc5\x05\x00\x00\x00\x00\x00\xe5\xc5\x05\x00\x00\x00\x00\x00\xe6\xc5\x05\x00\x00\x00\x00\x00\xe7\xc5\x05\x00\x00\x00\x00\x00\xe8\xc5\x05\x00\x00\x00\x00\x00\xe9\xc5\x05\x00\x00\x00\x00\x00|\xc6\x05\x00\x00\x00\x00\x00'
+    b'F\xc8\x05\x00\x00\x00\x00\x00G\xc8\x05\x00\x00\x00\x00\x00H\xc8\x05\x00\x00\x00\x00\x00I\xc8\x05\x00\x00\x00\x00\x00J\xc8\x05\x00\x00\x00\x00\x00\xb0\xc8\x05\x00\x00\x00\x00\x00\xd1\xc8\x05\x00\x00\x00\x00\x00\xf5\xca\x05\x00\x00\x00\x00\x00\xf6\xca\x05\x00\x00\x00\x00\x00\xf7\xca\x05\x00\x00\x00\x00\x00\xf8\xca\x05\x00\x00\x00\x00\x00 \xcb\x05\x00\x00\x00\x00\x00'
+    b'5\xcb\x05\x00\x00\x00\x00\x006\xcb\x05\x00\x00\x00\x00\x007\xcb\x05\x00\x00\x00\x00\x008\xcb\x05\x00\x00\x00\x00\x009\xcb\x05\x00\x00\x00\x00\x00:\xcb\x05\x00\x00\x00\x00\x00;\xcb\x05\x00\x00\x00\x00\x00<\xcb\x05\x00\x00\x00\x00\x00Q\xcb\x05\x00\x00\x00\x00\x00R\xcb\x05\x00\x00\x00\x00\x00S\xcb\x05\x00\x00\x00\x00\x00T\xcb\x05\x00\x00\x00\x00\x00'
+    b'U\xcb\x05\x00\x00\x00\x00\x00V\xcb\x05\x00\x00\x00\x00\x00k\xcb\x05\x00\x00\x00\x00\x00\x91\xcb\x05\x00\x00\x00\x00\x00\x92\xcb\x05\x00\x00\x00\x00\x00\x93\xcb\x05\x00\x00\x00\x00\x00\x94\xcb\x05\x00\x00\x00\x00\x00\x95\xcb\x05\x00\x00\x00\x00\x00\x9f\xcb\x05\x00\x00\x00\x00\x00\xa0\xcb\x05\x00\x00\x00\x00\x00\xa1\xcb\x05\x00\x00\x00\x00\x00\xa2\xcb\x05\x00\x00\x00\x00\x00'
+    b'\xa3\xcb\x05\x00\x00\x00\x00\x00\xa4\xcb\x05\x00\x00\x00\x00\x00\xa5\xcb\x05\x00\x00\x00\x00\x00\xa6\xcb\x05\x00\x00\x00\x00\x00\xee\xcb\x05\x00\x00\x00\x00\x00\xef\xcb\x05\x00\x00\x00\x00\x00\xf0\xcb\x05\x00\x00\x00\x00\x00\xf1\xcb\x05\x00\x00\x00\x00\x00\xf2\xcb\x05\x00\x00\x00\x00\x00O\xcd\x05\x00\x00\x00\x00\x00P\xcd\x05\x00\x00\x00\x00\x00Q\xcd\x05\x00\x00\x00\x00\x00'
+    b'R\xcd\x05\x00\x00\x00\x00\x00\x11\xce\x05\x00\x00\x00\x00\x00\x12\xce\x05\x00\x00\x00\x00\x00"\xce\x05\x00\x00\x00\x00\x00#\xce\x05\x00\x00\x00\x00\x00;\xce\x05\x00\x00\x00\x00\x00\'\xcf\x05\x00\x00\x00\x00\x00(\xcf\x05\x00\x00\x00\x00\x00)\xcf\x05\x00\x00\x00\x00\x00q\xcf\x05\x00\x00\x00\x00\x00\x15\xd0\x05\x00\x00\x00\x00\x00\x16\xd0\x05\x00\x00\x00\x00\x00'
+    b'\x17\xd0\x05\x00\x00\x00\x00\x00\x18\xd0\x05\x00\x00\x00\x00\x00\x19\xd0\x05\x00\x00\x00\x00\x00\x1a\xd0\x05\x00\x00\x00\x00\x00\x1b\xd0\x05\x00\x00\x00\x00\x00\x1d\xd0\x05\x00\x00\x00\x00\x00\x1e\xd0\x05\x00\x00\x00\x00\x00\x1f\xd0\x05\x00\x00\x00\x00\x00 \xd0\x05\x00\x00\x00\x00\x00!\xd0\x05\x00\x00\x00\x00\x00"\xd0\x05\x00\x00\x00\x00\x00%\xd0\x05\x00\x00\x00\x00\x00'
+    b"'\xd0\x05\x00\x00\x00\x00\x00(\xd0\x05\x00\x00\x00\x00\x00)\xd0\x05\x00\x00\x00\x00\x00*\xd0\x05\x00\x00\x00\x00\x00+\xd0\x05\x00\x00\x00\x00\x00,\xd0\x05\x00\x00\x00\x00\x00S\xd0\x05\x00\x00\x00\x00\x00\xae\xd0\x05\x00\x00\x00\x00\x00\xb7\xd0\x05\x00\x00\x00\x00\x00&\xd1\x05\x00\x00\x00\x00\x00'\xd1\x05\x00\x00\x00\x00\x00(\xd1\x05\x00\x00\x00\x00\x00"
+    b'0\xd1\x05\x00\x00\x00\x00\x001\xd1\x05\x00\x00\x00\x00\x002\xd1\x05\x00\x00\x00\x00\x003\xd1\x05\x00\x00\x00\x00\x004\xd1\x05\x00\x00\x00\x00\x005\xd1\x05\x00\x00\x00\x00\x00\x95\xd1\x05\x00\x00\x00\x00\x00\xe7\xd1\x05\x00\x00\x00\x00\x00\xee\xd1\x05\x00\x00\x00\x00\x00\xf5\xd1\x05\x00\x00\x00\x00\x00\xf6\xd1\x05\x00\x00\x00\x00\x00\xf7\xd1\x05\x00\x00\x00\x00\x00'
+    b'\xf8\xd1\x05\x00\x00\x00\x00\x00\xf9\xd1\x05\x00\x00\x00\x00\x00\xfa\xd1\x05\x00\x00\x00\x00\x00d\xd2\x05\x00\x00\x00\x00\x00e\xd2\x05\x00\x00\x00\x00\x00f\xd2\x05\x00\x00\x00\x00\x00g\xd2\x05\x00\x00\x00\x00\x00h\xd2\x05\x00\x00\x00\x00\x00i\xd2\x05\x00\x00\x00\x00\x00j\xd2\x05\x00\x00\x00\x00\x00k\xd2\x05\x00\x00\x00\x00\x00l\xd2\x05\x00\x00\x00\x00\x00'
+    b'm\xd2\x05\x00\x00\x00\x00\x00n\xd2\x05\x00\x00\x00\x00\x00o\xd2\x05\x00\x00\x00\x00\x00p\xd2\x05\x00\x00\x00\x00\x00q\xd2\x05\x00\x00\x00\x00\x00r\xd2\x05\x00\x00\x00\x00\x00s\xd2\x05\x00\x00\x00\x00\x00t\xd2\x05\x00\x00\x00\x00\x00u\xd2\x05\x00\x00\x00\x00\x00v\xd2\x05\x00\x00\x00\x00\x00w\xd2\x05\x00\x00\x00\x00\x00x\xd2\x05\x00\x00\x00\x00\x00'
+    b'y\xd2\x05\x00\x00\x00\x00\x00|\xd2\x05\x00\x00\x00\x00\x00}\xd2\x05\x00\x00\x00\x00\x00~\xd2\x05\x00\x00\x00\x00\x00\x7f\xd2\x05\x00\x00\x00\x00\x00\x8c\xd2\x05\x00\x00\x00\x00\x00\x8d\xd2\x05\x00\x00\x00\x00\x00\x8e\xd2\x05\x00\x00\x00\x00\x00\x8f\xd2\x05\x00\x00\x00\x00\x00\x90\xd2\x05\x00\x00\x00\x00\x00\x91\xd2\x05\x00\x00\x00\x00\x00\x92\xd2\x05\x00\x00\x00\x00\x00'
+    b'\x93\xd2\x05\x00\x00\x00\x00\x00\x94\xd2\x05\x00\x00\x00\x00\x00\x95\xd2\x05\x00\x00\x00\x00\x00\x96\xd2\x05\x00\x00\x00\x00\x00\x97\xd2\x05\x00\x00\x00\x00\x00\x98\xd2\x05\x00\x00\x00\x00\x00\xe6\xd3\x05\x00\x00\x00\x00\x00)\xd4\x05\x00\x00\x00\x00\x00*\xd4\x05\x00\x00\x00\x00\x00+\xd4\x05\x00\x00\x00\x00\x00,\xd4\x05\x00\x00\x00\x00\x00-\xd4\x05\x00\x00\x00\x00\x00'
+    b'9\xd4\x05\x00\x00\x00\x00\x00\x96\xd4\x05\x00\x00\x00\x00\x00\x97\xd4\x05\x00\x00\x00\x00\x00)\xd7\x05\x00\x00\x00\x00\x00*\xd7\x05\x00\x00\x00\x00\x00+\xd7\x05\x00\x00\x00\x00\x00,\xd7\x05\x00\x00\x00\x00\x00-\xd7\x05\x00\x00\x00\x00\x00.\xd7\x05\x00\x00\x00\x00\x00/\xd7\x05\x00\x00\x00\x00\x00\xc2\xd7\x05\x00\x00\x00\x00\x008\xdb\x05\x00\x00\x00\x00\x00'
+    b'9\xdb\x05\x00\x00\x00\x00\x00a\xdb\x05\x00\x00\x00\x00\x00\xe7\xdb\x05\x00\x00\x00\x00\x00\xe8\xdb\x05\x00\x00\x00\x00\x00T\xdc\x05\x00\x00\x00\x00\x00U\xdc\x05\x00\x00\x00\x00\x00i\xdc\x05\x00\x00\x00\x00\x00\xd7\xdc\x05\x00\x00\x00\x00\x00\xe4\xdc\x05\x00\x00\x00\x00\x00\x0e\xdd\x05\x00\x00\x00\x00\x00`\xdd\x05\x00\x00\x00\x00\x00a\xdd\x05\x00\x00\x00\x00\x00'
+    b'b\xdd\x05\x00\x00\x00\x00\x00c\xdd\x05\x00\x00\x00\x00\x00d\xdd\x05\x00\x00\x00\x00\x00e\xdd\x05\x00\x00\x00\x00\x00\x96\xdd\x05\x00\x00\x00\x00\x00\x98\xdd\x05\x00\x00\x00\x00\x00\x99\xdd\x05\x00\x00\x00\x00\x00\x9c\xdd\x05\x00\x00\x00\x00\x00\x9d\xdd\x05\x00\x00\x00\x00\x00\x9e\xdd\x05\x00\x00\x00\x00\x00\x9f\xdd\x05\x00\x00\x00\x00\x00\xcc\xdd\x05\x00\x00\x00\x00\x00'
+    b'\xcd\xdd\x05\x00\x00\x00\x00\x00,\xdf\x05\x00\x00\x00\x00\x00.\xdf\x05\x00\x00\x00\x00\x00\xe3\xdf\x05\x00\x00\x00\x00\x00\xfb\xdf\x05\x00\x00\x00\x00\x00\x10\xe0\x05\x00\x00\x00\x00\x00\x11\xe0\x05\x00\x00\x00\x00\x00\x12\xe0\x05\x00\x00\x00\x00\x00\x13\xe0\x05\x00\x00\x00\x00\x00\x14\xe0\x05\x00\x00\x00\x00\x00L\xe0\x05\x00\x00\x00\x00\x00M\xe0\x05\x00\x00\x00\x00\x00'
+    b'N\xe0\x05\x00\x00\x00\x00\x00\x89\xe0\x05\x00\x00\x00\x00\x00\x8f\xe0\x05\x00\x00\x00\x00\x00\xd3\xe1\x05\x00\x00\x00\x00\x00\xd4\xe1\x05\x00\x00\x00\x00\x00\xd5\xe1\x05\x00\x00\x00\x00\x00\xfa\xe1\x05\x00\x00\x00\x00\x00\xfb\xe1\x05\x00\x00\x00\x00\x00\xfc\xe1\x05\x00\x00\x00\x00\x00\xfd\xe1\x05\x00\x00\x00\x00\x00\xfe\xe1\x05\x00\x00\x00\x00\x00\xff\xe1\x05\x00\x00\x00\x00\x00'
+    b'\x00\xe2\x05\x00\x00\x00\x00\x00\x01\xe2\x05\x00\x00\x00\x00\x00\x02\xe2\x05\x00\x00\x00\x00\x00\r\xe2\x05\x00\x00\x00\x00\x00\x0e\xe2\x05\x00\x00\x00\x00\x00\x0f\xe2\x05\x00\x00\x00\x00\x00\x10\xe2\x05\x00\x00\x00\x00\x00\x11\xe2\x05\x00\x00\x00\x00\x00\x12\xe2\x05\x00\x00\x00\x00\x00\x13\xe2\x05\x00\x00\x00\x00\x00\x14\xe2\x05\x00\x00\x00\x00\x00\x15\xe2\x05\x00\x00\x00\x00\x00'
+    b'\x16\xe2\x05\x00\x00\x00\x00\x00\x17\xe2\x05\x00\x00\x00\x00\x00\x18\xe2\x05\x00\x00\x00\x00\x00\x19\xe2\x05\x00\x00\x00\x00\x00\x1a\xe2\x05\x00\x00\x00\x00\x00\x1b\xe2\x05\x00\x00\x00\x00\x00\x1c\xe2\x05\x00\x00\x00\x00\x00I\xe2\x05\x00\x00\x00\x00\x00]\xe2\x05\x00\x00\x00\x00\x00^\xe2\x05\x00\x00\x00\x00\x00_\xe2\x05\x00\x00\x00\x00\x00\xf2\xe2\x05\x00\x00\x00\x00\x00'
+    b'\xf3\xe2\x05\x00\x00\x00\x00\x00\xf5\xe2\x05\x00\x00\x00\x00\x00\xf8\xe2\x05\x00\x00\x00\x00\x00\x14\xe4\x05\x00\x00\x00\x00\x00G\xe5\x05\x00\x00\x00\x00\x00\xf4\xe5\x05\x00\x00\x00\x00\x00\xf5\xe5\x05\x00\x00\x00\x00\x00\xf6\xe5\x05\x00\x00\x00\x00\x00\xf7\xe5\x05\x00\x00\x00\x00\x00\xf8\xe5\x05\x00\x00\x00\x00\x00\xf9\xe5\x05\x00\x00\x00\x00\x00\xfa\xe5\x05\x00\x00\x00\x00\x00'
+    b'\xfb\xe5\x05\x00\x00\x00\x00\x00\xfc\xe5\x05\x00\x00\x00\x00\x00\xfd\xe5\x05\x00\x00\x00\x00\x00\xfe\xe5\x05\x00\x00\x00\x00\x00\xff\xe5\x05\x00\x00\x00\x00\x00\x00\xe6\x05\x00\x00\x00\x00\x00)\xe7\x05\x00\x00\x00\x00\x00*\xe7\x05\x00\x00\x00\x00\x00}\xe7\x05\x00\x00\x00\x00\x00~\xe7\x05\x00\x00\x00\x00\x00\x80\xe7\x05\x00\x00\x00\x00\x00\x81\xe7\x05\x00\x00\x00\x00\x00'
+    b'\xe3\xe8\x05\x00\x00\x00\x00\x00\xe4\xe8\x05\x00\x00\x00\x00\x00\x97\xe9\x05\x00\x00\x00\x00\x00\x05\xea\x05\x00\x00\x00\x00\x00\x06\xea\x05\x00\x00\x00\x00\x00\x07\xea\x05\x00\x00\x00\x00\x004\xea\x05\x00\x00\x00\x00\x005\xea\x05\x00\x00\x00\x00\x006\xea\x05\x00\x00\x00\x00\x007\xea\x05\x00\x00\x00\x00\x009\xea\x05\x00\x00\x00\x00\x00:\xea\x05\x00\x00\x00\x00\x00'
+    b';\xea\x05\x00\x00\x00\x00\x00<\xea\x05\x00\x00\x00\x00\x00=\xea\x05\x00\x00\x00\x00\x00>\xea\x05\x00\x00\x00\x00\x00B\xea\x05\x00\x00\x00\x00\x00C\xea\x05\x00\x00\x00\x00\x00D\xea\x05\x00\x00\x00\x00\x00E\xea\x05\x00\x00\x00\x00\x00F\xea\x05\x00\x00\x00\x00\x00G\xea\x05\x00\x00\x00\x00\x00~\xea\x05\x00\x00\x00\x00\x00\xec\xea\x05\x00\x00\x00\x00\x00'
+    b'\x14\xeb\x05\x00\x00\x00\x00\x00\x15\xeb\x05\x00\x00\x00\x00\x00n\xec\x05\x00\x00\x00\x00\x00o\xec\x05\x00\x00\x00\x00\x00p\xec\x05\x00\x00\x00\x00\x00\xad\xec\x05\x00\x00\x00\x00\x00\xae\xec\x05\x00\x00\x00\x00\x00\xaf\xec\x05\x00\x00\x00\x00\x00\xb0\xec\x05\x00\x00\x00\x00\x00\xb1\xec\x05\x00\x00\x00\x00\x00\xb2\xec\x05\x00\x00\x00\x00\x00\xb6\xec\x05\x00\x00\x00\x00\x00'
+    b'=\xed\x05\x00\x00\x00\x00\x00e\xef\x05\x00\x00\x00\x00\x00\xa3\xef\x05\x00\x00\x00\x00\x00\xa4\xef\x05\x00\x00\x00\x00\x00\xa5\xef\x05\x00\x00\x00\x00\x00\xa6\xef\x05\x00\x00\x00\x00\x00\xa7\xef\x05\x00\x00\x00\x00\x00\xd3\xef\x05\x00\x00\x00\x00\x00\xd6\xef\x05\x00\x00\x00\x00\x00\xd7\xef\x05\x00\x00\x00\x00\x00\xd8\xef\x05\x00\x00\x00\x00\x00\xd9\xef\x05\x00\x00\x00\x00\x00'
+    b'\xf8\xef\x05\x00\x00\x00\x00\x00\xf9\xef\x05\x00\x00\x00\x00\x00\xfa\xef\x05\x00\x00\x00\x00\x00\xfb\xef\x05\x00\x00\x00\x00\x00G\xf0\x05\x00\x00\x00\x00\x00I\xf0\x05\x00\x00\x00\x00\x00J\xf0\x05\x00\x00\x00\x00\x00{\xf0\x05\x00\x00\x00\x00\x00|\xf0\x05\x00\x00\x00\x00\x00}\xf0\x05\x00\x00\x00\x00\x00~\xf0\x05\x00\x00\x00\x00\x00\x7f\xf0\x05\x00\x00\x00\x00\x00'
+    b'\x8d\xf0\x05\x00\x00\x00\x00\x00\x8e\xf0\x05\x00\x00\x00\x00\x00\x8f\xf0\x05\x00\x00\x00\x00\x00\x90\xf0\x05\x00\x00\x00\x00\x00\x91\xf0\x05\x00\x00\x00\x00\x00\xbc\xf0\x05\x00\x00\x00\x00\x00\xc9\xf1\x05\x00\x00\x00\x00\x00\xca\xf1\x05\x00\x00\x00\x00\x00\xcb\xf1\x05\x00\x00\x00\x00\x00\xcc\xf1\x05\x00\x00\x00\x00\x00\xcd\xf1\x05\x00\x00\x00\x00\x00\xc1\xf2\x05\x00\x00\x00\x00\x00'
+    b'\xc2\xf2\x05\x00\x00\x00\x00\x00\xc3\xf2\x05\x00\x00\x00\x00\x00T\xf3\x05\x00\x00\x00\x00\x00U\xf3\x05\x00\x00\x00\x00\x00V\xf3\x05\x00\x00\x00\x00\x00W\xf3\x05\x00\x00\x00\x00\x00X\xf3\x05\x00\x00\x00\x00\x00Y\xf3\x05\x00\x00\x00\x00\x00Z\xf3\x05\x00\x00\x00\x00\x00\xba\xf3\x05\x00\x00\x00\x00\x00\xbc\xf3\x05\x00\x00\x00\x00\x00\\\xf4\x05\x00\x00\x00\x00\x00'
+    b']\xf4\x05\x00\x00\x00\x00\x00^\xf4\x05\x00\x00\x00\x00\x00_\xf4\x05\x00\x00\x00\x00\x00`\xf4\x05\x00\x00\x00\x00\x00a\xf4\x05\x00\x00\x00\x00\x00b\xf4\x05\x00\x00\x00\x00\x00c\xf4\x05\x00\x00\x00\x00\x00d\xf4\x05\x00\x00\x00\x00\x00e\xf4\x05\x00\x00\x00\x00\x00f\xf4\x05\x00\x00\x00\x00\x00g\xf4\x05\x00\x00\x00\x00\x00\xb7\xf4\x05\x00\x00\x00\x00\x00'
+    b'\xb8\xf4\x05\x00\x00\x00\x00\x00\xb9\xf4\x05\x00\x00\x00\x00\x00\xbe\xf4\x05\x00\x00\x00\x00\x00\x80\xf6\x05\x00\x00\x00\x00\x00\x82\xf6\x05\x00\x00\x00\x00\x00\xbc\xf6\x05\x00\x00\x00\x00\x00\xbd\xf6\x05\x00\x00\x00\x00\x00\xbe\xf6\x05\x00\x00\x00\x00\x00\xfc\xf6\x05\x00\x00\x00\x00\x00\xfd\xf6\x05\x00\x00\x00\x00\x00\x1c\xf8\x05\x00\x00\x00\x00\x00\x1d\xf8\x05\x00\x00\x00\x00\x00'
+    b'\x1e\xf8\x05\x00\x00\x00\x00\x00\x1f\xf8\x05\x00\x00\x00\x00\x00 \xf8\x05\x00\x00\x00\x00\x00!\xf8\x05\x00\x00\x00\x00\x00"\xf8\x05\x00\x00\x00\x00\x00#\xf8\x05\x00\x00\x00\x00\x00$\xf8\x05\x00\x00\x00\x00\x00%\xf8\x05\x00\x00\x00\x00\x00&\xf8\x05\x00\x00\x00\x00\x00@\xf9\x05\x00\x00\x00\x00\x00A\xf9\x05\x00\x00\x00\x00\x00B\xf9\x05\x00\x00\x00\x00\x00'
+    b'D\xf9\x05\x00\x00\x00\x00\x00F\xf9\x05\x00\x00\x00\x00\x00R\xf9\x05\x00\x00\x00\x00\x00S\xf9\x05\x00\x00\x00\x00\x00T\xf9\x05\x00\x00\x00\x00\x00U\xf9\x05\x00\x00\x00\x00\x00W\xf9\x05\x00\x00\x00\x00\x00Y\xf9\x05\x00\x00\x00\x00\x00[\xf9\x05\x00\x00\x00\x00\x00\x8d\xf9\x05\x00\x00\x00\x00\x00\xc6\xf9\x05\x00\x00\x00\x00\x00\xc7\xf9\x05\x00\x00\x00\x00\x00'
+    b'\xc8\xf9\x05\x00\x00\x00\x00\x00\xd9\xf9\x05\x00\x00\x00\x00\x00\xe4\xf9\x05\x00\x00\x00\x00\x00\xe5\xf9\x05\x00\x00\x00\x00\x00\xe6\xf9\x05\x00\x00\x00\x00\x00\xe7\xf9\x05\x00\x00\x00\x00\x00\xe8\xf9\x05\x00\x00\x00\x00\x00\xe9\xf9\x05\x00\x00\x00\x00\x00\xea\xf9\x05\x00\x00\x00\x00\x00\xeb\xf9\x05\x00\x00\x00\x00\x00\xec\xf9\x05\x00\x00\x00\x00\x00\xed\xf9\x05\x00\x00\x00\x00\x00'
+    b'\xee\xf9\x05\x00\x00\x00\x00\x00\xef\xf9\x05\x00\x00\x00\x00\x00\xf0\xf9\x05\x00\x00\x00\x00\x00\x07\xfa\x05\x00\x00\x00\x00\x00\x08\xfa\x05\x00\x00\x00\x00\x00\t\xfa\x05\x00\x00\x00\x00\x00\n\xfa\x05\x00\x00\x00\x00\x00\x1b\xfa\x05\x00\x00\x00\x00\x00\x1c\xfa\x05\x00\x00\x00\x00\x00\x1d\xfa\x05\x00\x00\x00\x00\x00\x1e\xfa\x05\x00\x00\x00\x00\x00\x1f\xfa\x05\x00\x00\x00\x00\x00'
+    b'1\xfa\x05\x00\x00\x00\x00\x00S\xfa\x05\x00\x00\x00\x00\x00T\xfa\x05\x00\x00\x00\x00\x00W\xfa\x05\x00\x00\x00\x00\x00X\xfa\x05\x00\x00\x00\x00\x00Y\xfa\x05\x00\x00\x00\x00\x00[\xfa\x05\x00\x00\x00\x00\x00\\\xfa\x05\x00\x00\x00\x00\x00y\xfa\x05\x00\x00\x00\x00\x00\x93\xfa\x05\x00\x00\x00\x00\x00\x94\xfa\x05\x00\x00\x00\x00\x00\xa1\xfa\x05\x00\x00\x00\x00\x00'
+    b'\xac\xfa\x05\x00\x00\x00\x00\x00\xad\xfa\x05\x00\x00\x00\x00\x00\xae\xfa\x05\x00\x00\x00\x00\x00\xb1\xfa\x05\x00\x00\x00\x00\x00\xb2\xfa\x05\x00\x00\x00\x00\x00\xb3\xfa\x05\x00\x00\x00\x00\x00\xb4\xfa\x05\x00\x00\x00\x00\x00\xe5\xfa\x05\x00\x00\x00\x00\x00\xe6\xfa\x05\x00\x00\x00\x00\x00\xe8\xfa\x05\x00\x00\x00\x00\x00\xe9\xfa\x05\x00\x00\x00\x00\x00\xea\xfa\x05\x00\x00\x00\x00\x00'
+    b'\xeb\xfa\x05\x00\x00\x00\x00\x00\xf0\xfa\x05\x00\x00\x00\x00\x00S\xfb\x05\x00\x00\x00\x00\x00\xdf\xfc\x05\x00\x00\x00\x00\x00C\xfd\x05\x00\x00\x00\x00\x00D\xfd\x05\x00\x00\x00\x00\x00\x99\xfd\x05\x00\x00\x00\x00\x00\xa1\xfd\x05\x00\x00\x00\x00\x00\xa2\xfd\x05\x00\x00\x00\x00\x00\xb7\xfd\x05\x00\x00\x00\x00\x00\xfc\xfd\x05\x00\x00\x00\x00\x00\x12\xfe\x05\x00\x00\x00\x00\x00'
+    b'\x91\xfe\x05\x00\x00\x00\x00\x00\x93\xfe\x05\x00\x00\x00\x00\x00\xcc\xfe\x05\x00\x00\x00\x00\x00\xce\xfe\x05\x00\x00\x00\x00\x00\xd2\xfe\x05\x00\x00\x00\x00\x00\xd3\xfe\x05\x00\x00\x00\x00\x00\xd4\xfe\x05\x00\x00\x00\x00\x00\xd5\xfe\x05\x00\x00\x00\x00\x00\xd6\xfe\x05\x00\x00\x00\x00\x00\xd7\xfe\x05\x00\x00\x00\x00\x00\xd8\xfe\x05\x00\x00\x00\x00\x00\xd9\xfe\x05\x00\x00\x00\x00\x00'
+    b'\xda\xfe\x05\x00\x00\x00\x00\x00\xf8\xfe\x05\x00\x00\x00\x00\x00\xf9\xfe\x05\x00\x00\x00\x00\x00\xfa\xfe\x05\x00\x00\x00\x00\x00\xfb\xfe\x05\x00\x00\x00\x00\x00\xfc\xfe\x05\x00\x00\x00\x00\x00\xfd\xfe\x05\x00\x00\x00\x00\x00\xfe\xfe\x05\x00\x00\x00\x00\x00\xff\xfe\x05\x00\x00\x00\x00\x00\x00\xff\x05\x00\x00\x00\x00\x00\x01\xff\x05\x00\x00\x00\x00\x00\x02\xff\x05\x00\x00\x00\x00\x00'
+    b'\x03\xff\x05\x00\x00\x00\x00\x00\xc3\xff\x05\x00\x00\x00\x00\x00\xc4\xff\x05\x00\x00\x00\x00\x00\xc5\xff\x05\x00\x00\x00\x00\x00\xc6\xff\x05\x00\x00\x00\x00\x00\xc7\xff\x05\x00\x00\x00\x00\x00\xc8\xff\x05\x00\x00\x00\x00\x00\xc9\xff\x05\x00\x00\x00\x00\x00\xca\xff\x05\x00\x00\x00\x00\x00\xcb\xff\x05\x00\x00\x00\x00\x00\xcc\xff\x05\x00\x00\x00\x00\x00\xcd\xff\x05\x00\x00\x00\x00\x00'
+    b'\xce\xff\x05\x00\x00\x00\x00\x00\xcf\xff\x05\x00\x00\x00\x00\x00\xd0\xff\x05\x00\x00\x00\x00\x00\x1c\x00\x06\x00\x00\x00\x00\x00\x1d\x00\x06\x00\x00\x00\x00\x00\x1e\x00\x06\x00\x00\x00\x00\x00\x87\x00\x06\x00\x00\x00\x00\x00\x88\x00\x06\x00\x00\x00\x00\x00\xa4\x00\x06\x00\x00\x00\x00\x00\xa5\x00\x06\x00\x00\x00\x00\x00\xa6\x00\x06\x00\x00\x00\x00\x00\x0c\x01\x06\x00\x00\x00\x00\x00'
+    b'\r\x01\x06\x00\x00\x00\x00\x00$\x01\x06\x00\x00\x00\x00\x00%\x01\x06\x00\x00\x00\x00\x00&\x01\x06\x00\x00\x00\x00\x001\x01\x06\x00\x00\x00\x00\x002\x01\x06\x00\x00\x00\x00\x00=\x01\x06\x00\x00\x00\x00\x00>\x01\x06\x00\x00\x00\x00\x00?\x01\x06\x00\x00\x00\x00\x00@\x01\x06\x00\x00\x00\x00\x00Z\x01\x06\x00\x00\x00\x00\x00[\x01\x06\x00\x00\x00\x00\x00'
+    b'\\\x01\x06\x00\x00\x00\x00\x00]\x01\x06\x00\x00\x00\x00\x00_\x01\x06\x00\x00\x00\x00\x00`\x01\x06\x00\x00\x00\x00\x00a\x01\x06\x00\x00\x00\x00\x00s\x01\x06\x00\x00\x00\x00\x00t\x01\x06\x00\x00\x00\x00\x00w\x01\x06\x00\x00\x00\x00\x00x\x01\x06\x00\x00\x00\x00\x00y\x01\x06\x00\x00\x00\x00\x00{\x01\x06\x00\x00\x00\x00\x00|\x01\x06\x00\x00\x00\x00\x00'
+    b'}\x01\x06\x00\x00\x00\x00\x00~\x01\x06\x00\x00\x00\x00\x00\xa0\x01\x06\x00\x00\x00\x00\x00\xd8\x02\x06\x00\x00\x00\x00\x00\xd9\x02\x06\x00\x00\x00\x00\x00\xe3\x02\x06\x00\x00\x00\x00\x00\xf1\x02\x06\x00\x00\x00\x00\x00\xf3\x02\x06\x00\x00\x00\x00\x00\xa8\x03\x06\x00\x00\x00\x00\x00\xa9\x03\x06\x00\x00\x00\x00\x00Y\x04\x06\x00\x00\x00\x00\x00\x83\x04\x06\x00\x00\x00\x00\x00'
+    b'\x84\x04\x06\x00\x00\x00\x00\x00\xe3\x04\x06\x00\x00\x00\x00\x00\xe1\x05\x06\x00\x00\x00\x00\x00~\x08\x06\x00\x00\x00\x00\x00\x7f\x08\x06\x00\x00\x00\x00\x00=\t\x06\x00\x00\x00\x00\x00o\t\x06\x00\x00\x00\x00\x00\x8e\n\x06\x00\x00\x00\x00\x00\x8f\n\x06\x00\x00\x00\x00\x00\x90\n\x06\x00\x00\x00\x00\x00\x92\n\x06\x00\x00\x00\x00\x00\x93\n\x06\x00\x00\x00\x00\x00'
+    b'\x94\n\x06\x00\x00\x00\x00\x00,\x0b\x06\x00\x00\x00\x00\x00-\x0b\x06\x00\x00\x00\x00\x00.\x0b\x06\x00\x00\x00\x00\x00K\x0b\x06\x00\x00\x00\x00\x00L\x0b\x06\x00\x00\x00\x00\x00M\x0b\x06\x00\x00\x00\x00\x00P\x0b\x06\x00\x00\x00\x00\x00Q\x0b\x06\x00\x00\x00\x00\x00R\x0b\x06\x00\x00\x00\x00\x00\xbf\x0b\x06\x00\x00\x00\x00\x00\xc0\x0b\x06\x00\x00\x00\x00\x00'
+    b'\xcb\x0b\x06\x00\x00\x00\x00\x00\xcc\x0b\x06\x00\x00\x00\x00\x00\xcd\x0b\x06\x00\x00\x00\x00\x00\xce\x0b\x06\x00\x00\x00\x00\x00\xcf\x0b\x06\x00\x00\x00\x00\x00\xd0\x0b\x06\x00\x00\x00\x00\x00\xd1\x0b\x06\x00\x00\x00\x00\x00\xd2\x0b\x06\x00\x00\x00\x00\x00\xd3\x0b\x06\x00\x00\x00\x00\x00\xd4\x0b\x06\x00\x00\x00\x00\x00\xd5\x0b\x06\x00\x00\x00\x00\x00\xd6\x0b\x06\x00\x00\x00\x00\x00'
+    b'\xd7\x0b\x06\x00\x00\x00\x00\x00\xd8\x0b\x06\x00\x00\x00\x00\x00\xd9\x0b\x06\x00\x00\x00\x00\x00\xda\x0b\x06\x00\x00\x00\x00\x00\xdb\x0b\x06\x00\x00\x00\x00\x00\x94\r\x06\x00\x00\x00\x00\x00\x95\r\x06\x00\x00\x00\x00\x00z\x0f\x06\x00\x00\x00\x00\x00{\x0f\x06\x00\x00\x00\x00\x00|\x0f\x06\x00\x00\x00\x00\x00}\x0f\x06\x00\x00\x00\x00\x00~\x0f\x06\x00\x00\x00\x00\x00'
+    b'\x7f\x0f\x06\x00\x00\x00\x00\x00\xd8\x11\x06\x00\x00\x00\x00\x00\xd9\x11\x06\x00\x00\x00\x00\x00\xda\x11\x06\x00\x00\x00\x00\x00\xdb\x11\x06\x00\x00\x00\x00\x00\xdc\x11\x06\x00\x00\x00\x00\x00\xdd\x11\x06\x00\x00\x00\x00\x00\xde\x11\x06\x00\x00\x00\x00\x00\xdf\x11\x06\x00\x00\x00\x00\x00\xe0\x11\x06\x00\x00\x00\x00\x00\xe1\x11\x06\x00\x00\x00\x00\x00\xe2\x11\x06\x00\x00\x00\x00\x00'
+    b'\xe3\x11\x06\x00\x00\x00\x00\x00\xe4\x11\x06\x00\x00\x00\x00\x00\xe5\x11\x06\x00\x00\x00\x00\x00\xe6\x11\x06\x00\x00\x00\x00\x00\xe7\x11\x06\x00\x00\x00\x00\x00\xe8\x11\x06\x00\x00\x00\x00\x00\xe9\x11\x06\x00\x00\x00\x00\x00\xea\x11\x06\x00\x00\x00\x00\x00\xeb\x11\x06\x00\x00\x00\x00\x00\xec\x11\x06\x00\x00\x00\x00\x00\xf0\x11\x06\x00\x00\x00\x00\x00\xf1\x11\x06\x00\x00\x00\x00\x00'
+    b'\xf2\x11\x06\x00\x00\x00\x00\x00\xf3\x11\x06\x00\x00\x00\x00\x00\xf4\x11\x06\x00\x00\x00\x00\x00\xf5\x11\x06\x00\x00\x00\x00\x00\xf6\x11\x06\x00\x00\x00\x00\x00\xf7\x11\x06\x00\x00\x00\x00\x00\xf8\x11\x06\x00\x00\x00\x00\x00\xf9\x12\x06\x00\x00\x00\x00\x00\xfa\x12\x06\x00\x00\x00\x00\x00\xfb\x12\x06\x00\x00\x00\x00\x006\x13\x06\x00\x00\x00\x00\x00u\x14\x06\x00\x00\x00\x00\x00'
+    b'E\x15\x06\x00\x00\x00\x00\x00F\x15\x06\x00\x00\x00\x00\x00G\x15\x06\x00\x00\x00\x00\x00R\x15\x06\x00\x00\x00\x00\x00\xb6\x17\x06\x00\x00\x00\x00\x00\xb7\x17\x06\x00\x00\x00\x00\x00\xb8\x17\x06\x00\x00\x00\x00\x00\xb9\x17\x06\x00\x00\x00\x00\x00a\x18\x06\x00\x00\x00\x00\x00b\x18\x06\x00\x00\x00\x00\x00c\x18\x06\x00\x00\x00\x00\x00\xba\x18\x06\x00\x00\x00\x00\x00'
+    b'\xd2\x18\x06\x00\x00\x00\x00\x00\xd3\x18\x06\x00\x00\x00\x00\x00\xd4\x18\x06\x00\x00\x00\x00\x00\xd5\x18\x06\x00\x00\x00\x00\x00\xd6\x18\x06\x00\x00\x00\x00\x00.\x19\x06\x00\x00\x00\x00\x00\n\x1a\x06\x00\x00\x00\x00\x00\x0b\x1a\x06\x00\x00\x00\x00\x00\x0c\x1a\x06\x00\x00\x00\x00\x00\r\x1a\x06\x00\x00\x00\x00\x00\x0e\x1a\x06\x00\x00\x00\x00\x00\xc6\x1a\x06\x00\x00\x00\x00\x00'
+    b']\x1b\x06\x00\x00\x00\x00\x00^\x1b\x06\x00\x00\x00\x00\x00\x9b\x1b\x06\x00\x00\x00\x00\x00\x9c\x1b\x06\x00\x00\x00\x00\x00\x9d\x1b\x06\x00\x00\x00\x00\x00\xc4\x1b\x06\x00\x00\x00\x00\x00\xc5\x1b\x06\x00\x00\x00\x00\x00\xc7\x1b\x06\x00\x00\x00\x00\x00\xc8\x1b\x06\x00\x00\x00\x00\x00\xcf\x1b\x06\x00\x00\x00\x00\x00\xd6\x1b\x06\x00\x00\x00\x00\x00\xd7\x1b\x06\x00\x00\x00\x00\x00'
+    b'\x8a\x1d\x06\x00\x00\x00\x00\x00\xad\x1d\x06\x00\x00\x00\x00\x00\xaf\x1d\x06\x00\x00\x00\x00\x00\xc7\x1d\x06\x00\x00\x00\x00\x00[\x1e\x06\x00\x00\x00\x00\x00\\\x1e\x06\x00\x00\x00\x00\x00\xdd\x1e\x06\x00\x00\x00\x00\x00\x07\x1f\x06\x00\x00\x00\x00\x00\x08\x1f\x06\x00\x00\x00\x00\x00\t\x1f\x06\x00\x00\x00\x00\x00\n\x1f\x06\x00\x00\x00\x00\x00Z\x1f\x06\x00\x00\x00\x00\x00'
+    b'[\x1f\x06\x00\x00\x00\x00\x00\\\x1f\x06\x00\x00\x00\x00\x00]\x1f\x06\x00\x00\x00\x00\x00^\x1f\x06\x00\x00\x00\x00\x00s\x1f\x06\x00\x00\x00\x00\x00t\x1f\x06\x00\x00\x00\x00\x00u\x1f\x06\x00\x00\x00\x00\x00v\x1f\x06\x00\x00\x00\x00\x00w\x1f\x06\x00\x00\x00\x00\x00x\x1f\x06\x00\x00\x00\x00\x00y\x1f\x06\x00\x00\x00\x00\x00\xc6\x1f\x06\x00\x00\x00\x00\x00'
+    b'\xc7\x1f\x06\x00\x00\x00\x00\x00\xcd\x1f\x06\x00\x00\x00\x00\x00\xce\x1f\x06\x00\x00\x00\x00\x00\xf4\x1f\x06\x00\x00\x00\x00\x00( \x06\x00\x00\x00\x00\x00\xb1 \x06\x00\x00\x00\x00\x00\x19!\x06\x00\x00\x00\x00\x00L!\x06\x00\x00\x00\x00\x00\x05"\x06\x00\x00\x00\x00\x00\xa5"\x06\x00\x00\x00\x00\x00\xa6"\x06\x00\x00\x00\x00\x00\xcf"\x06\x00\x00\x00\x00\x00'
+    b'\xd0"\x06\x00\x00\x00\x00\x00\xd1"\x06\x00\x00\x00\x00\x00\xd2"\x06\x00\x00\x00\x00\x00\xd3"\x06\x00\x00\x00\x00\x00\xf6"\x06\x00\x00\x00\x00\x00>#\x06\x00\x00\x00\x00\x00j#\x06\x00\x00\x00\x00\x00k#\x06\x00\x00\x00\x00\x00\xd9$\x06\x00\x00\x00\x00\x00\xda$\x06\x00\x00\x00\x00\x00\xec$\x06\x00\x00\x00\x00\x00a&\x06\x00\x00\x00\x00\x00'
+    b"b&\x06\x00\x00\x00\x00\x00\x8b&\x06\x00\x00\x00\x00\x00>'\x06\x00\x00\x00\x00\x00?'\x06\x00\x00\x00\x00\x00J'\x06\x00\x00\x00\x00\x00K'\x06\x00\x00\x00\x00\x00\x07(\x06\x00\x00\x00\x00\x00-(\x06\x00\x00\x00\x00\x00.(\x06\x00\x00\x00\x00\x004(\x06\x00\x00\x00\x00\x00j(\x06\x00\x00\x00\x00\x00k(\x06\x00\x00\x00\x00\x00"
+    b'\x8e)\x06\x00\x00\x00\x00\x00\x8f)\x06\x00\x00\x00\x00\x00\xdd)\x06\x00\x00\x00\x00\x00\xde)\x06\x00\x00\x00\x00\x00\xdf)\x06\x00\x00\x00\x00\x00\xe0)\x06\x00\x00\x00\x00\x00\xe1)\x06\x00\x00\x00\x00\x00\xe2)\x06\x00\x00\x00\x00\x00\x03*\x06\x00\x00\x00\x00\x00\x04*\x06\x00\x00\x00\x00\x00\x05*\x06\x00\x00\x00\x00\x00{*\x06\x00\x00\x00\x00\x00'
+    b'|*\x06\x00\x00\x00\x00\x00~*\x06\x00\x00\x00\x00\x00\x7f*\x06\x00\x00\x00\x00\x00\x80*\x06\x00\x00\x00\x00\x00\x81*\x06\x00\x00\x00\x00\x00\x82*\x06\x00\x00\x00\x00\x00\x84*\x06\x00\x00\x00\x00\x00\x85*\x06\x00\x00\x00\x00\x00\x86*\x06\x00\x00\x00\x00\x00\x87*\x06\x00\x00\x00\x00\x00\x88*\x06\x00\x00\x00\x00\x00\x89*\x06\x00\x00\x00\x00\x00'
+    b'\x8a*\x06\x00\x00\x00\x00\x00\x8b*\x06\x00\x00\x00\x00\x00\x8c*\x06\x00\x00\x00\x00\x00\xbc*\x06\x00\x00\x00\x00\x00\xbd*\x06\x00\x00\x00\x00\x00\xc4*\x06\x00\x00\x00\x00\x00\xc5*\x06\x00\x00\x00\x00\x00\xda*\x06\x00\x00\x00\x00\x00\xbe+\x06\x00\x00\x00\x00\x00\xaa,\x06\x00\x00\x00\x00\x00\xec,\x06\x00\x00\x00\x00\x00\xed,\x06\x00\x00\x00\x00\x00'
+    b'\xee,\x06\x00\x00\x00\x00\x00\xef,\x06\x00\x00\x00\x00\x00\xf0,\x06\x00\x00\x00\x00\x00:.\x06\x00\x00\x00\x00\x00;.\x06\x00\x00\x00\x00\x00c.\x06\x00\x00\x00\x00\x00\xc0.\x06\x00\x00\x00\x00\x00\xc1.\x06\x00\x00\x00\x00\x00\xc2.\x06\x00\x00\x00\x00\x00\xc3.\x06\x00\x00\x00\x00\x00\xc4.\x06\x00\x00\x00\x00\x00\xc5.\x06\x00\x00\x00\x00\x00'
+    b'\xc6.\x06\x00\x00\x00\x00\x00\xc7.\x06\x00\x00\x00\x00\x00\xc8.\x06\x00\x00\x00\x00\x00\xef/\x06\x00\x00\x00\x00\x00\xf0/\x06\x00\x00\x00\x00\x00\xf1/\x06\x00\x00\x00\x00\x00\xf2/\x06\x00\x00\x00\x00\x00\xf3/\x06\x00\x00\x00\x00\x00\x000\x06\x00\x00\x00\x00\x00\r0\x06\x00\x00\x00\x00\x00M0\x06\x00\x00\x00\x00\x00N0\x06\x00\x00\x00\x00\x00'
+    b'\xf20\x06\x00\x00\x00\x00\x00\x161\x06\x00\x00\x00\x00\x00\xa25\x06\x00\x00\x00\x00\x00\x9bD\x06\x00\x00\x00\x00\x00\xd6D\x06\x00\x00\x00\x00\x00\x87E\x06\x00\x00\x00\x00\x00\x07H\x06\x00\x00\x00\x00\x00\x08H\x06\x00\x00\x00\x00\x00\x14K\x06\x00\x00\x00\x00\x00\xf6R\x06\x00\x00\x00\x00\x00\xf7R\x06\x00\x00\x00\x00\x00\x00S\x06\x00\x00\x00\x00\x00'
+    b'tS\x06\x00\x00\x00\x00\x00\x1bT\x06\x00\x00\x00\x00\x00+T\x06\x00\x00\x00\x00\x00@^\x06\x00\x00\x00\x00\x00\xc5e\x06\x00\x00\x00\x00\x00\xcae\x06\x00\x00\x00\x00\x00\xd4e\x06\x00\x00\x00\x00\x00Bf\x06\x00\x00\x00\x00\x00Cf\x06\x00\x00\x00\x00\x00\xf7k\x06\x00\x00\x00\x00\x00\xf8k\x06\x00\x00\x00\x00\x00hl\x06\x00\x00\x00\x00\x00'
+    b'il\x06\x00\x00\x00\x00\x00jl\x06\x00\x00\x00\x00\x00Xn\x06\x00\x00\x00\x00\x00gq\x06\x00\x00\x00\x00\x00hq\x06\x00\x00\x00\x00\x00Yu\x06\x00\x00\x00\x00\x00\x04v\x06\x00\x00\x00\x00\x00\x05v\x06\x00\x00\x00\x00\x00\x06v\x06\x00\x00\x00\x00\x00\x07v\x06\x00\x00\x00\x00\x00\x08v\x06\x00\x00\x00\x00\x00\tv\x06\x00\x00\x00\x00\x00'
+    b'\xd3v\x06\x00\x00\x00\x00\x00\xd4v\x06\x00\x00\x00\x00\x00\xd5v\x06\x00\x00\x00\x00\x00Iw\x06\x00\x00\x00\x00\x00Jw\x06\x00\x00\x00\x00\x00gw\x06\x00\x00\x00\x00\x00hw\x06\x00\x00\x00\x00\x00iw\x06\x00\x00\x00\x00\x00\xabx\x06\x00\x00\x00\x00\x00\xb7{\x06\x00\x00\x00\x00\x00\xb9{\x06\x00\x00\x00\x00\x00\xba{\x06\x00\x00\x00\x00\x00'
+    b'\xbb{\x06\x00\x00\x00\x00\x00\xbc{\x06\x00\x00\x00\x00\x00\xbd{\x06\x00\x00\x00\x00\x00\xbe{\x06\x00\x00\x00\x00\x00\xbf{\x06\x00\x00\x00\x00\x00\xc0{\x06\x00\x00\x00\x00\x00\xcb{\x06\x00\x00\x00\x00\x00\xcc{\x06\x00\x00\x00\x00\x00\x0e}\x06\x00\x00\x00\x00\x00\x0f}\x06\x00\x00\x00\x00\x00\x10}\x06\x00\x00\x00\x00\x00\x11}\x06\x00\x00\x00\x00\x00'
+    b'\x12}\x06\x00\x00\x00\x00\x00\x13}\x06\x00\x00\x00\x00\x00\x14}\x06\x00\x00\x00\x00\x00\x15}\x06\x00\x00\x00\x00\x00\x16}\x06\x00\x00\x00\x00\x00\x17}\x06\x00\x00\x00\x00\x00\x18}\x06\x00\x00\x00\x00\x00\x19}\x06\x00\x00\x00\x00\x00\x1a}\x06\x00\x00\x00\x00\x00m\x83\x06\x00\x00\x00\x00\x00n\x83\x06\x00\x00\x00\x00\x00\xb0\x83\x06\x00\x00\x00\x00\x00'
+    b'\xcc\x84\x06\x00\x00\x00\x00\x00\xe3\x85\x06\x00\x00\x00\x00\x00\xe4\x85\x06\x00\x00\x00\x00\x00:\x86\x06\x00\x00\x00\x00\x00;\x86\x06\x00\x00\x00\x00\x00W\x86\x06\x00\x00\x00\x00\x00q\x86\x06\x00\x00\x00\x00\x00r\x86\x06\x00\x00\x00\x00\x00s\x86\x06\x00\x00\x00\x00\x00t\x86\x06\x00\x00\x00\x00\x00u\x86\x06\x00\x00\x00\x00\x00\xe1\x86\x06\x00\x00\x00\x00\x00'
+    b'+\x8a\x06\x00\x00\x00\x00\x00]\x8a\x06\x00\x00\x00\x00\x00|\x8a\x06\x00\x00\x00\x00\x00Q\x8b\x06\x00\x00\x00\x00\x00\x8e\x8b\x06\x00\x00\x00\x00\x00\x8f\x8b\x06\x00\x00\x00\x00\x00\xc8\x8b\x06\x00\x00\x00\x00\x009\x8f\x06\x00\x00\x00\x00\x00:\x8f\x06\x00\x00\x00\x00\x00\x1a\x90\x06\x00\x00\x00\x00\x00\x1b\x90\x06\x00\x00\x00\x00\x00\x1c\x90\x06\x00\x00\x00\x00\x00'
+    b'\x1d\x90\x06\x00\x00\x00\x00\x00\x1e\x90\x06\x00\x00\x00\x00\x00\x1f\x90\x06\x00\x00\x00\x00\x00 \x90\x06\x00\x00\x00\x00\x00]\x90\x06\x00\x00\x00\x00\x00\xdc\x90\x06\x00\x00\x00\x00\x00\xdd\x90\x06\x00\x00\x00\x00\x00\xde\x90\x06\x00\x00\x00\x00\x00\xe5\x90\x06\x00\x00\x00\x00\x00\xe6\x90\x06\x00\x00\x00\x00\x006\x91\x06\x00\x00\x00\x00\x007\x91\x06\x00\x00\x00\x00\x00'
+    b'c\x94\x06\x00\x00\x00\x00\x00\xb8\x94\x06\x00\x00\x00\x00\x00\x9e\x95\x06\x00\x00\x00\x00\x00\x10\x99\x06\x00\x00\x00\x00\x00\x11\x99\x06\x00\x00\x00\x00\x00/\x9a\x06\x00\x00\x00\x00\x000\x9a\x06\x00\x00\x00\x00\x001\x9a\x06\x00\x00\x00\x00\x00\x99\x9a\x06\x00\x00\x00\x00\x00\x9a\x9a\x06\x00\x00\x00\x00\x00\x9b\x9a\x06\x00\x00\x00\x00\x00\x9c\x9a\x06\x00\x00\x00\x00\x00'
+    b'\x00\x9c\x06\x00\x00\x00\x00\x00\x01\x9c\x06\x00\x00\x00\x00\x00\x02\x9c\x06\x00\x00\x00\x00\x00\x03\x9c\x06\x00\x00\x00\x00\x00X\x9c\x06\x00\x00\x00\x00\x00\xe7\x9c\x06\x00\x00\x00\x00\x00f\x9d\x06\x00\x00\x00\x00\x00g\x9d\x06\x00\x00\x00\x00\x00h\x9d\x06\x00\x00\x00\x00\x00\x8a\x9d\x06\x00\x00\x00\x00\x00\x9f\x9d\x06\x00\x00\x00\x00\x00\xa0\x9d\x06\x00\x00\x00\x00\x00'
+    b"\xa1\x9d\x06\x00\x00\x00\x00\x00&\x9e\x06\x00\x00\x00\x00\x00'\x9e\x06\x00\x00\x00\x00\x00(\x9e\x06\x00\x00\x00\x00\x00)\x9e\x06\x00\x00\x00\x00\x00*\x9e\x06\x00\x00\x00\x00\x00+\x9e\x06\x00\x00\x00\x00\x00,\x9e\x06\x00\x00\x00\x00\x00-\x9e\x06\x00\x00\x00\x00\x00.\x9e\x06\x00\x00\x00\x00\x00/\x9e\x06\x00\x00\x00\x00\x000\x9e\x06\x00\x00\x00\x00\x00"
+    b'1\x9e\x06\x00\x00\x00\x00\x002\x9e\x06\x00\x00\x00\x00\x00\x8c\x9e\x06\x00\x00\x00\x00\x00\x8d\x9e\x06\x00\x00\x00\x00\x00\x8e\x9e\x06\x00\x00\x00\x00\x00\x8f\x9e\x06\x00\x00\x00\x00\x00"\x9f\x06\x00\x00\x00\x00\x00$\x9f\x06\x00\x00\x00\x00\x00U\x9f\x06\x00\x00\x00\x00\x00\xe0\xa0\x06\x00\x00\x00\x00\x00\x13\xa1\x06\x00\x00\x00\x00\x00s\xa2\x06\x00\x00\x00\x00\x00'
+    b't\xa2\x06\x00\x00\x00\x00\x00u\xa2\x06\x00\x00\x00\x00\x00\xe6\xa2\x06\x00\x00\x00\x00\x00\xe7\xa2\x06\x00\x00\x00\x00\x00\xe8\xa2\x06\x00\x00\x00\x00\x00\xe9\xa2\x06\x00\x00\x00\x00\x00\xea\xa2\x06\x00\x00\x00\x00\x00\xeb\xa2\x06\x00\x00\x00\x00\x00\xec\xa2\x06\x00\x00\x00\x00\x00\xed\xa2\x06\x00\x00\x00\x00\x00\xee\xa2\x06\x00\x00\x00\x00\x00\xef\xa2\x06\x00\x00\x00\x00\x00'
+    b'\xf0\xa2\x06\x00\x00\x00\x00\x00\x81\xa3\x06\x00\x00\x00\x00\x00)\xa4\x06\x00\x00\x00\x00\x00y\xa4\x06\x00\x00\x00\x00\x00\xa3\xa4\x06\x00\x00\x00\x00\x00\xa4\xa4\x06\x00\x00\x00\x00\x00\xa5\xa4\x06\x00\x00\x00\x00\x00\xa6\xa4\x06\x00\x00\x00\x00\x00\xa7\xa4\x06\x00\x00\x00\x00\x00\xa8\xa4\x06\x00\x00\x00\x00\x00\xa9\xa4\x06\x00\x00\x00\x00\x00\xaa\xa4\x06\x00\x00\x00\x00\x00'
+    b'\xab\xa4\x06\x00\x00\x00\x00\x00\xac\xa4\x06\x00\x00\x00\x00\x00\xad\xa4\x06\x00\x00\x00\x00\x00\xae\xa4\x06\x00\x00\x00\x00\x00\xe5\xa4\x06\x00\x00\x00\x00\x00\xf1\xa4\x06\x00\x00\x00\x00\x00\xf2\xa4\x06\x00\x00\x00\x00\x00O\xa5\x06\x00\x00\x00\x00\x00\xb7\xa5\x06\x00\x00\x00\x00\x00\xb8\xa5\x06\x00\x00\x00\x00\x00\xb9\xa5\x06\x00\x00\x00\x00\x00\xba\xa5\x06\x00\x00\x00\x00\x00'
+    b'\xbb\xa5\x06\x00\x00\x00\x00\x00\xf0\xa5\x06\x00\x00\x00\x00\x00\xf1\xa5\x06\x00\x00\x00\x00\x00\xf2\xa5\x06\x00\x00\x00\x00\x00\xe2\xa6\x06\x00\x00\x00\x00\x00\x16\xa7\x06\x00\x00\x00\x00\x00\x17\xa7\x06\x00\x00\x00\x00\x00\x18\xa7\x06\x00\x00\x00\x00\x00\xff\xa8\x06\x00\x00\x00\x00\x00\x00\xa9\x06\x00\x00\x00\x00\x00\x01\xa9\x06\x00\x00\x00\x00\x00\x02\xa9\x06\x00\x00\x00\x00\x00'
+    b'\x03\xa9\x06\x00\x00\x00\x00\x00\x04\xa9\x06\x00\x00\x00\x00\x00\x05\xa9\x06\x00\x00\x00\x00\x00\x06\xa9\x06\x00\x00\x00\x00\x00\x07\xa9\x06\x00\x00\x00\x00\x00\x08\xa9\x06\x00\x00\x00\x00\x00\t\xa9\x06\x00\x00\x00\x00\x00\n\xa9\x06\x00\x00\x00\x00\x00\x0b\xa9\x06\x00\x00\x00\x00\x00f\xa9\x06\x00\x00\x00\x00\x00\xcb\xa9\x06\x00\x00\x00\x00\x00$\xaa\x06\x00\x00\x00\x00\x00'
+    b'\xb4\xab\x06\x00\x00\x00\x00\x00\n\xac\x06\x00\x00\x00\x00\x00\x0b\xac\x06\x00\x00\x00\x00\x00\x0c\xac\x06\x00\x00\x00\x00\x00\r\xac\x06\x00\x00\x00\x00\x00\x0e\xac\x06\x00\x00\x00\x00\x00\x0f\xac\x06\x00\x00\x00\x00\x00\x10\xac\x06\x00\x00\x00\x00\x00\x11\xac\x06\x00\x00\x00\x00\x00\x12\xac\x06\x00\x00\x00\x00\x00\x13\xac\x06\x00\x00\x00\x00\x00\x14\xac\x06\x00\x00\x00\x00\x00'
+    b'?\xac\x06\x00\x00\x00\x00\x00?\xad\x06\x00\x00\x00\x00\x00@\xad\x06\x00\x00\x00\x00\x00A\xad\x06\x00\x00\x00\x00\x00B\xad\x06\x00\x00\x00\x00\x00C\xad\x06\x00\x00\x00\x00\x00D\xad\x06\x00\x00\x00\x00\x00E\xad\x06\x00\x00\x00\x00\x00\xb3\xb0\x06\x00\x00\x00\x00\x00\xb5\xb0\x06\x00\x00\x00\x00\x00\x94\xb1\x06\x00\x00\x00\x00\x00\x95\xb1\x06\x00\x00\x00\x00\x00'
+    b'+\xb2\x06\x00\x00\x00\x00\x00,\xb2\x06\x00\x00\x00\x00\x00-\xb2\x06\x00\x00\x00\x00\x00\x85\xb4\x06\x00\x00\x00\x00\x00\xc3\xb6\x06\x00\x00\x00\x00\x00M\xb7\x06\x00\x00\x00\x00\x00N\xb7\x06\x00\x00\x00\x00\x00O\xb7\x06\x00\x00\x00\x00\x00P\xb7\x06\x00\x00\x00\x00\x00Q\xb7\x06\x00\x00\x00\x00\x00R\xb7\x06\x00\x00\x00\x00\x00S\xb7\x06\x00\x00\x00\x00\x00'
+    b'T\xb7\x06\x00\x00\x00\x00\x00V\xb7\x06\x00\x00\x00\x00\x00W\xb7\x06\x00\x00\x00\x00\x00X\xb7\x06\x00\x00\x00\x00\x00Y\xb7\x06\x00\x00\x00\x00\x00Z\xb7\x06\x00\x00\x00\x00\x00[\xb7\x06\x00\x00\x00\x00\x00\\\xb7\x06\x00\x00\x00\x00\x00D\xb9\x06\x00\x00\x00\x00\x00E\xb9\x06\x00\x00\x00\x00\x00)\xba\x06\x00\x00\x00\x00\x00*\xba\x06\x00\x00\x00\x00\x00'
+    b'j\xba\x06\x00\x00\x00\x00\x00k\xba\x06\x00\x00\x00\x00\x00l\xba\x06\x00\x00\x00\x00\x00m\xba\x06\x00\x00\x00\x00\x00n\xba\x06\x00\x00\x00\x00\x00o\xba\x06\x00\x00\x00\x00\x00p\xba\x06\x00\x00\x00\x00\x00q\xba\x06\x00\x00\x00\x00\x00r\xba\x06\x00\x00\x00\x00\x00s\xba\x06\x00\x00\x00\x00\x00t\xba\x06\x00\x00\x00\x00\x00u\xba\x06\x00\x00\x00\x00\x00'
+    b'v\xba\x06\x00\x00\x00\x00\x00\xc3\xba\x06\x00\x00\x00\x00\x00\xc4\xba\x06\x00\x00\x00\x00\x00\xdc\xbb\x06\x00\x00\x00\x00\x00\xdd\xbb\x06\x00\x00\x00\x00\x00\xde\xbb\x06\x00\x00\x00\x00\x00\t\xbc\x06\x00\x00\x00\x00\x00\n\xbc\x06\x00\x00\x00\x00\x00\x0b\xbc\x06\x00\x00\x00\x00\x00\x0c\xbc\x06\x00\x00\x00\x00\x00\r\xbc\x06\x00\x00\x00\x00\x00\x0e\xbc\x06\x00\x00\x00\x00\x00'
+    b'\x0f\xbc\x06\x00\x00\x00\x00\x00[\xbc\x06\x00\x00\x00\x00\x00\xa6\xbc\x06\x00\x00\x00\x00\x00\xed\xbc\x06\x00\x00\x00\x00\x00\x1e\xc1\x06\x00\x00\x00\x00\x00\x1f\xc1\x06\x00\x00\x00\x00\x00\xee\xc1\x06\x00\x00\x00\x00\x00!\xc2\x06\x00\x00\x00\x00\x00"\xc2\x06\x00\x00\x00\x00\x00#\xc2\x06\x00\x00\x00\x00\x00&\xc2\x06\x00\x00\x00\x00\x00\xa7\xc3\x06\x00\x00\x00\x00\x00'
+    b'\xe2\xc5\x06\x00\x00\x00\x00\x00\xef\xc5\x06\x00\x00\x00\x00\x00h\xc6\x06\x00\x00\x00\x00\x00i\xc6\x06\x00\x00\x00\x00\x00j\xc6\x06\x00\x00\x00\x00\x00k\xc6\x06\x00\x00\x00\x00\x00l\xc6\x06\x00\x00\x00\x00\x00m\xc6\x06\x00\x00\x00\x00\x00r\xc6\x06\x00\x00\x00\x00\x00s\xc6\x06\x00\x00\x00\x00\x00t\xc6\x06\x00\x00\x00\x00\x00\x8a\xc6\x06\x00\x00\x00\x00\x00'
+    b'8\xc7\x06\x00\x00\x00\x00\x00\x93\xc8\x06\x00\x00\x00\x00\x00\x94\xc8\x06\x00\x00\x00\x00\x00\x95\xc8\x06\x00\x00\x00\x00\x00\x96\xc8\x06\x00\x00\x00\x00\x00\x97\xc8\x06\x00\x00\x00\x00\x00\x98\xc8\x06\x00\x00\x00\x00\x00\x99\xc8\x06\x00\x00\x00\x00\x00\x9a\xc8\x06\x00\x00\x00\x00\x00\x03\xca\x06\x00\x00\x00\x00\x009\xca\x06\x00\x00\x00\x00\x00\xa1\xca\x06\x00\x00\x00\x00\x00'
+    b'\x01\xcb\x06\x00\x00\x00\x00\x00\xb6\xcb\x06\x00\x00\x00\x00\x00\xce\xcb\x06\x00\x00\x00\x00\x00\xcf\xcb\x06\x00\x00\x00\x00\x00\xd0\xcb\x06\x00\x00\x00\x00\x00\xe7\xcb\x06\x00\x00\x00\x00\x004\xcd\x06\x00\x00\x00\x00\x00\xd8\xcd\x06\x00\x00\x00\x00\x00\xd9\xcd\x06\x00\x00\x00\x00\x00\xda\xcd\x06\x00\x00\x00\x00\x00\xdb\xcd\x06\x00\x00\x00\x00\x00\xdc\xcd\x06\x00\x00\x00\x00\x00'
+    b'\xdd\xcd\x06\x00\x00\x00\x00\x00\xde\xcd\x06\x00\x00\x00\x00\x00\xdf\xcd\x06\x00\x00\x00\x00\x00\xe0\xcd\x06\x00\x00\x00\x00\x00\xe1\xcd\x06\x00\x00\x00\x00\x00\x11\xcf\x06\x00\x00\x00\x00\x00\x12\xcf\x06\x00\x00\x00\x00\x00\x13\xcf\x06\x00\x00\x00\x00\x00\x14\xcf\x06\x00\x00\x00\x00\x00c\xd0\x06\x00\x00\x00\x00\x00\x81\xd1\x06\x00\x00\x00\x00\x00\x82\xd1\x06\x00\x00\x00\x00\x00'
+    b'/\xd3\x06\x00\x00\x00\x00\x000\xd3\x06\x00\x00\x00\x00\x00\x95\xd4\x06\x00\x00\x00\x00\x00\x0e\xd5\x06\x00\x00\x00\x00\x00\xe0\xd5\x06\x00\x00\x00\x00\x00\xe1\xd5\x06\x00\x00\x00\x00\x00\xe5\xdf\x06\x00\x00\x00\x00\x00\xf8\xdf\x06\x00\x00\x00\x00\x00{\xe1\x06\x00\x00\x00\x00\x00\x1f\xe3\x06\x00\x00\x00\x00\x00 \xe3\x06\x00\x00\x00\x00\x00b\xe3\x06\x00\x00\x00\x00\x00'
+    b'c\xe3\x06\x00\x00\x00\x00\x00d\xe3\x06\x00\x00\x00\x00\x00\x0b\xe6\x06\x00\x00\x00\x00\x00\x0c\xe6\x06\x00\x00\x00\x00\x00\r\xe6\x06\x00\x00\x00\x00\x00\xe1\xe7\x06\x00\x00\x00\x00\x00P\xe8\x06\x00\x00\x00\x00\x00Q\xe8\x06\x00\x00\x00\x00\x00R\xe8\x06\x00\x00\x00\x00\x00x\xe8\x06\x00\x00\x00\x00\x00y\xe8\x06\x00\x00\x00\x00\x00\x9a\xe8\x06\x00\x00\x00\x00\x00'
+    b'\x9b\xe8\x06\x00\x00\x00\x00\x00\x9c\xe8\x06\x00\x00\x00\x00\x00\x9d\xe8\x06\x00\x00\x00\x00\x00\x9e\xe8\x06\x00\x00\x00\x00\x00\x9f\xe8\x06\x00\x00\x00\x00\x00\xa0\xe8\x06\x00\x00\x00\x00\x00\xa1\xe8\x06\x00\x00\x00\x00\x00\xa2\xe8\x06\x00\x00\x00\x00\x00\xa3\xe8\x06\x00\x00\x00\x00\x00\xa4\xe8\x06\x00\x00\x00\x00\x00\xa5\xe8\x06\x00\x00\x00\x00\x00\xa6\xe8\x06\x00\x00\x00\x00\x00'
+    b'\xa7\xe8\x06\x00\x00\x00\x00\x00\xa8\xe8\x06\x00\x00\x00\x00\x00\xf1\xe8\x06\x00\x00\x00\x00\x006\xe9\x06\x00\x00\x00\x00\x00\xdb\xeb\x06\x00\x00\x00\x00\x00\x05\xef\x06\x00\x00\x00\x00\x00\x07\xef\x06\x00\x00\x00\x00\x00@\xf0\x06\x00\x00\x00\x00\x00C\xf0\x06\x00\x00\x00\x00\x00#\xf1\x06\x00\x00\x00\x00\x00$\xf1\x06\x00\x00\x00\x00\x00%\xf1\x06\x00\x00\x00\x00\x00'
+    b"&\xf1\x06\x00\x00\x00\x00\x00'\xf1\x06\x00\x00\x00\x00\x00(\xf1\x06\x00\x00\x00\x00\x00)\xf1\x06\x00\x00\x00\x00\x00*\xf1\x06\x00\x00\x00\x00\x00+\xf1\x06\x00\x00\x00\x00\x00B\xf1\x06\x00\x00\x00\x00\x00C\xf1\x06\x00\x00\x00\x00\x00\xcd\xf1\x06\x00\x00\x00\x00\x00\xce\xf1\x06\x00\x00\x00\x00\x00\xd9\xf1\x06\x00\x00\x00\x00\x00\xda\xf1\x06\x00\x00\x00\x00\x00"
+    b'\xdb\xf1\x06\x00\x00\x00\x00\x00\x0b\xf2\x06\x00\x00\x00\x00\x00\x1e\xf2\x06\x00\x00\x00\x00\x00\x1f\xf2\x06\x00\x00\x00\x00\x00\x8f\xf3\x06\x00\x00\x00\x00\x00\xf0\xf3\x06\x00\x00\x00\x00\x00\xec\xf7\x06\x00\x00\x00\x00\x00\xee\xf7\x06\x00\x00\x00\x00\x00\xf0\xf7\x06\x00\x00\x00\x00\x00T\xf8\x06\x00\x00\x00\x00\x00\x7f\xf8\x06\x00\x00\x00\x00\x00C\xf9\x06\x00\x00\x00\x00\x00'
+    b'D\xf9\x06\x00\x00\x00\x00\x00E\xf9\x06\x00\x00\x00\x00\x00F\xf9\x06\x00\x00\x00\x00\x00G\xf9\x06\x00\x00\x00\x00\x00P\xfe\x06\x00\x00\x00\x00\x00Q\xfe\x06\x00\x00\x00\x00\x00\t\x00\x07\x00\x00\x00\x00\x003\x00\x07\x00\x00\x00\x00\x00\x90\x05\x07\x00\x00\x00\x00\x00\x91\x05\x07\x00\x00\x00\x00\x00\x91\x0f\x07\x00\x00\x00\x00\x00\x92\x0f\x07\x00\x00\x00\x00\x00'
+    b";A\x07\x00\x00\x00\x00\x00l\x1b\x8b\xf1\x00\x00\x00\x00\xc7,wA\xd4\xc7W\x01\x10=`\xd2\t\xbd\xeb\x07\xef\xd5A\xa0w\xc7(\x0b\xa5\x12-i\x11\xe6z\x0b\xb6\x8a_\xd1R\x07t\x0cB$O\x0c\xc5\xf3I\x13%\xf1\xdck\x82:Q\x16\x04\x00&\xfe|\xb6\xe0'jg\x83 9?\xdc.#\xcfo2\xf84\xb9/"
+    b'\xdd\xa4?f\xbb\xcd\xa24\xacHB\x92\xb2\xa2\xab9D7\xcb\xc5\xda\x91\xd8;\xa9\xea\xf5\xdd\xb2\xbb\xe5<*"\x8e\xed/HD>\'\x8a8*\xd0\xa8\x8dG\x8e\x18\xe9\xdc\xe2?[I\x8a\xe3\xc0\xf7X\xc9\xa6I\xe4\xe0#\xe1\xb4\xcfuPc\x89\xda\xb2\xcc\x90XV.c\xd4qYj\x07Y\xfc\xf4\xb6\xc1\xd7\xa1\x07c'
+    b'OE_\xaa\x8a\xe87h\x17&\xebM\x8e\x87\xe4iO\x1ed@\x8f\xaehl\x9dX\xe3\x88wo\xb7ln\n\xfb\xc9\xeb^wp\x18\xd8\xf8\x14/\xec\xe0v\x1aW=j\xb8\x10\x9e|\x9d\xef\x07?\xfd7\x1e\x80\xd3\xa6^\xb4`\x1b"\x80\xc5\xb0\x94/#\xe7*\x80\xaa%.\xe2\xfd`:\x80?\x9f\x1bw\xcb)_\x80'
+    b'\xd0#r\xe2\xd1Z{\x80"\xbf\xa6\xa2{\x98\xa0\x80\xbd\xe4n\xbfep\xfa\x80H\xf2\x18\xd7\xfb\xc7X\x81\xca\xf6:\x81(\'m\x81\x0c\'\x96\xcf\x9c\xb4\xb0\x81<yW6;k\xe9\x81Ex\\\xbcw\xeb\x05\x82\'=r\xd0\xd6s\x17\x82X\x8c\xf4\x0e\x8ft"\x82B\x83\xba\xf6fm9\x82\x9ey\xd7\xbcS\xdfG\x82'
+    b'\x94\x02\x02\x85Ws^\x82\xfd\xfa\x8a-\xa5\xac\xa9\x82\x186\x0cS"\xe9\xb5\x82\x9d\x83\xc2\xf3`:3\x83+zCh\r&q\x83\';L\x86\xbc\x8d\x89\x83\x97z9\xa2\xe0T\xa8\x83}n\x12\xb5\xfaO\xbc\x83\xaf\xd9b\xa1\xfc)\xc6\x83+B\xff@\xa6\xe1\xfc\x836\xea\xfby\x9e\x99@\x84\x88\x08)\xfes9\xd2\x84'
+    b"\xc2\x01\xe8\xf0\xfa\xd2\xed\x84Pw\x14\x10\xb9\xf9\xf1\x84\x88\xe5\xf7\xa4\xaf\xb0\t\x85\xe3\xc1|\xb3\xf6z\x1d\x85\xb74'\x97\xdc\xcf\xbb\x85h@z\x94\xb4m\xf5\x85\r\x08\xe8\x82\xb09.\x86\xc1p)kU\x11A\x86\xc2p)kU\x11A\x86\xa1\xb1\x1c\xb2w\xbfM\x86\x86\xca9j\xa14\xa5\x86\xea\x9c\xf6\xbc\x7fH\xbb\x86"
+    b']\xf5\n\xcd\xdd\xbbD\x87\xc4\xe2\xb3:\xda\xf1\xcb\x87\x10\xd9g\x80\xcam\xde\x87{\x1f\x1b\xd4e\xcb\xf9\x87\xbe\xc8\x99\xe0\xf8\x07\x00\x88\xcef\x19\xfc\xe8T&\x88\xb6\xd2\x9e\xc4\x99b-\x88\xa8\x8dL?c\xa2M\x88[\x7f\x9d\xdfw\xade\x88\xd0\xcf_\xd5\xc7q\xb9\x88\x9c5\x00^:\xe7\xdd\x88\x9c5\x18V:]\x01\x89'
+    b'\xae^A&ZD\x11\x89J\xb1l\xe0\x0e\x11,\x89]F2X&a\x90\x89\xde\xb0\xdf\xef"\xbc\x9c\x89\x11a\xcd\x16\x04\xc4\xd7\x89\xd8\x19\r\xc9\x9fTb\x8a.3\xb7\xe9\x12\x95\xf5\x8ao\\/\x0f]\xc9$\x8b\xd7\xd4\xa5\x835\x82\xcc\x8bv4\x10\xc6?U\xda\x8b\xc6\xc0\xda\xfd\x8d\xd6\x03\x8cV\xf8\x9f\xd1\xc5N\x1b\x8c'
+    b'\x9b\xcd\x05.\x8c\xd2\x1b\x8cuq\\\xd8k\xcb%\x8cEU\x97\xf6\x10x\xa9\x8c\xd61\xcd\xb0\xc7\xac\xeb\x8c\xa2u\xdf\x1b\x041\xa1\x8d\x01V\x19\xfdi\x0f\xdd\x8dFBv\x8e!\x99\x1f\x8e\x8f`\xda;\x04\xca+\x8e\xfa\xc9\xb6\xff\x8cb2\x8e\xa6\xbe\xbc<T"h\x8e\xdf\x82\xda\xf1\xc5\x10t\x8e\xf6\xf9\x92\xaf1\xec\x8b\x8e'
+    b'58\x12\xf8\x1a\xe6\xc3\x8e\x9c\xf2X\x1d\xa2\xee\xc4\x8e\x8d\xb06B^\xec\r\x8f\x99:\xae\xba\xcaoR\x8f\x01@\x1ab\xc8)\x83\x8fu\xd84J|\x04\x8e\x8f\xf9\xe4gO\x04/\xad\x8f\xaa0\xe0y\xff9\xdb\x8f\xe88\xc7B\xc4\x05\xe6\x8f\x80oZ\x84+\x08%\x90p\xe4\x12\x95\xf812\x90\t\xbb~\xc3\xd1=6\x90'
+    b'\x85)+qK\x1f;\x90\x05\xc3\xbe\xc0\x18\x18J\x90\x8e\xf9v\x88\x96\xcfL\x90\xcb&\x056%\xe9a\x90H"\xc9\xadv\x1d\xa4\x90\xce?i\xad\rp\xd1\x90\xd7\xcb5\xf1\x11\xf6\xd1\x90\xe2\xb5\xa8\x1c\x122\xf1\x90"1\x7f\xe0\xa5\x1d\x18\x91\x9d\x83\x03\x8dx\x1aE\x91z\xe8\x03\x84c\xebs\x91-\xb6\x044\xa7\xda \x92'
+    b'\x14\x1e\xeb\xc6X\x15!\x92`\x99K\xafg\\9\x92yd&\xbe\x8bS>\x92\x1bv\xe7\x91\x80\xc6E\x92+Q\xa3&\xe8\xe3Y\x92\x9b\r0W\xc6\xd9\x97\x92\xa0\xeb\xaf\x1c\xfb\x93\xe6\x92\xa2\xeb\xaf\x1c\xfb\x93\xe6\x92\xa3\xeb\xaf\x1c\xfb\x93\xe6\x92\xa5\xeb\xaf\x1c\xfb\x93\xe6\x92\xa9BQ\xd8\x03\xde\x0f\x93\x18\x15\xf5\xe8\xbd\xdc$\x93'
+    b"UD\xbc\x0ej\x061\x93LW5p\x05\x1f:\x93\xe2\x17\x1e\xe4\x97\x84B\x93\x9f\\\xa7\xc6&\x7fp\x93h\ttM\x9dc\x99\x93P}\xe4Q\xf6\x1d\xaa\x93\r\x03\x818\x86{\xe0\x93 \x12\xa1\xfe@|\xed\x93\r\xab\x86\xad\xe3L&\x94\x85\xca;\x8d\xabPD\x94r\xbc\xbf\xf6f_w\x94\x00\x9e'\x89\xcfV\x94\x94"
+    b"\x01\x9e'\x89\xcfV\x94\x94\x02\x9e'\x89\xcfV\x94\x94\x03\x9e'\x89\xcfV\x94\x94\x04\x9e'\x89\xcfV\x94\x94\x05\x9e'\x89\xcfV\x94\x94\x07\x9e'\x89\xcfV\x94\x94\xc6\xca\x9f\x9aU\x10\xc0\x94\xa7Q\xe0C\xde\xa1\xd8\x94\x90\xd0\x97D\xda\xc6\r\x95\xb2Tp\x15\x93\xa3\x1f\x95\xc77\xce\xed\x97\xb52\x95\xeaP\xe6\xf2\xc7RF\x95"
+    b'93\xd9\x87\xd6D_\x95\x02\x8e\x0bfWa\x90\x95\x06\x1a^\x1c\xf31\xf8\x95/K\xee\x9e\x84\xd6\xff\x95\x08\x851\xe5U\xe8\x02\x96I\xc8%\x07\xf7\x83)\x96P7&\xc1\x13\xec)\x96\x19\x1a\xd8t\x10\xb3Q\x96\xbf\xb8\x8e\x13-%[\x96\xe8*\x95\xea]\x17\xb9\x96\xe9*\x95\xea]\x17\xb9\x96\xea*\x95\xea]\x17\xb9\x96'
+    b'\xeb*\x95\xea]\x17\xb9\x96\xec*\x95\xea]\x17\xb9\x96\xed*\x95\xea]\x17\xb9\x96\xef*\x95\xea]\x17\xb9\x96\xca\xe0\xec\x12K\x9f\x11\x97\xcb\xe0\xec\x12K\x9f\x11\x97\x95\xefQ\x89z\xc2\x19\x97\x89\xb1\\\xd6~3\x1e\x97\x84\\\x93\xb6<\xd9\x1e\x97\xf5\x95,\xd8\xce\xd3&\x979\xab>\xe3\xfd\x08;\x97\xe70\xbaY\x02\x95\x9e\x97'
+    b'\x1a\x8cCd\x85\t\xcd\x97\x01\x8a\xc3h\x851\xde\x97\xee\xbe$\x9d\xe4<\xde\x97\xe9zo\x17lm\xf0\x97\x98\xf9\x11\r\xb5\xfd\xfb\x97\x1c\xb9l\xb6\x05\x970\x98\xa4\x82Wd\xdb\x0cN\x98~j\x14\xa4\x1aax\x98\xcc\xd2K\xe0$\x88\x7f\x983\x08\xc3S\xed\xea\xda\x98\xc70\xc1\r\x1c\xfb\x7f\x994\xebduK\xd8\xb0\x99'
+    b'@\xd4|v@\xa7\xd7\x99A\xd4|v@\xa7\xd7\x99B\xd4|v@\xa7\xd7\x99C\xd4|v@\xa7\xd7\x99E\xd4|v@\xa7\xd7\x99F\xd4|v@\xa7\xd7\x99G\xd4|v@\xa7\xd7\x99\xe1-\xc45\xfd#\xe4\x992\xce\x0c\xf9\xcc\xe3\x1c\x9aYZ.\x93\x97\xdb\x1f\x9a\xe8X\xfcA\xf6\xa8$\x9azZ\x01P8#\x8b\x9a'
+    b'\xdc\xe2*\xce\x89\xab\x9e\x9a\xc7\xbaY\xcc\xe5\x8e|\x9b\xca\xf0\xac/\xd2t}\x9b\x85\xb4P\xf4\xb6\x80\x80\x9b\xa0\xd6W\xdbcW\x8c\x9b\xc3\xd64\xb8\r)\xa0\x9bn\xc7M\xfa\x88\x97\xbd\x9b\xf8SE\xcb\xe1\xac\xf0\x9b\xf3\xd4\xd0\x12\x8b\x1f\xf8\x9b2\xd1F\xaf.H\x07\x9c\xc0\xb0\x82kh\xfa%\x9c\x02<\x8b\xe1D\xdf0\x9c'
+    b':\t\x1b\x8e\xd4\x951\x9c\xe9\xd2\xed]/\x1e9\x9cn`\xac\xcd\xb3\xf8Z\x9c\x99\x1d)\xe8\xa6\x83t\x9c\xd4I\xd0\x03\xa3\x92\xc3\x9c\x8ed#6\xfd\xef\xd7\x9cC\xbd&yM\xfe\xf4\x9c\x89\x9c\xc8=\xed\xe7;\x9d/\xd4#\xa7\xc2)c\x9dP\x95=\xd3j\xe3k\x9d\x12P\x1f\x11\x8c\xba\x93\x9d\x81\x8b\xaa\x8d\xd8\xbb\xa7\x9d'
+    b'\x92H\xd4\n\xafO\xd1\x9d\xb1\xb4\xb4\x16-\xd5\xd7\x9d\xb9\x1b\xe7\xac-<\xe1\x9d[\x1b\xd5\xe0!3\x19\x9eEQ}u\x04=)\x9eW\x8e\xd3\xc8i\xb7\x81\x9e\xdc\x89\x7f\xa3\xd2\xfc\x89\x9e\xd7\xba*\x05\xe4\xfa\xaa\x9e6y\xe3\x95\xa7\xe1\xb0\x9e\xe5\x88xI\x19\x00\xba\x9e\xda\xcc]\xacp\xd3;\x9f\xb5\x16\xafyQ\xc3V\x9f'
+    b" '\x8f\x0b\x8f:w\x9f\xad\xfe\x89B\xe72\x83\x9fI\xd6/\xa6\x7f\xd9\xa0\x9f*\t\x8a\xe0W3\t\xa0\xd8e\xa8\x9e\xd0&9\xa0\xdae\xa8\x9e\xd0&9\xa0\xdbe\xa8\x9e\xd0&9\xa0\xdde\xa8\x9e\xd0&9\xa0\xa8rV\x86\x8ewJ\xa0+3uO\xf7\xea\x83\xa0\xb2#\x91\xa5V\xd7\xd9\xa0Bi\xa2/\x1aV\xe1\xa0"
+    b'\xa7\x0e\x97\xea\x05\xa53\xa1\xd0U\xaf\x13\x1f\x06E\xa1\xb3L\xc8Q\x05EN\xa1\xd0\xcd5`\x1ad`\xa1\xd1\xcd5`\x1ad`\xa1\xd2\xcd5`\x1ad`\xa1\xd3\xcd5`\x1ad`\xa1\xd4\xcd5`\x1ad`\xa1\xd5\xcd5`\x1ad`\xa1\xd6\xcd5`\x1ad`\xa1\xaa\xe5\x9e\x96\xe6\xa9n\xa1\xd1\x8cr\xce\x96\xbd\x8d\xa1'
+    b'"\\F:+%\x92\xa1\x8aC\x0c\xf6\xf8\x18\xd3\xa1\xf4<X\t\xa9\xb1\x12\xa2\xf7<X\t\xa9\xb1\x12\xa2\x84\x15\x8e\xa0\xf8\x85$\xa2W\xef\x85\xe3\xa5Q5\xa2\x12\xd1r\xbe\x02J\xa4\xa2\xcc?\xf9\x9a\xa5\x0b\xb3\xa2P\\q\xaeg\x88\xd0\xa2o\x9c\xb3@K\x95\xdf\xa2\xcdE\x04\xeb\x88_\x18\xa38\x07F\xf8\xad\xa5E\xa3'
+    b'K\x8ds}\x01\x19\x85\xa3e\xfd\xb4a,\xfa\xc0\xa3\xa0\xcc6\x8a\xda\xfd\xda\xa3e\xe8/\x01\xcb\xab&\xa4FHOd\xc8\xaa0\xa4\x88\xc9\xfel\xc9?:\xa4\xc1\x13\x97\xed@*j\xa4\x82 ngY\x81:\xa5qg\x8b\xa9g\xd0a\xa5\xb4J\xaft9f\x9b\xa5;\xc3\xbbK_\x9c\xc4\xa5,\xacm\xd3=R\xcd\xa5'
+    b"]\xecP{\xd9\x93&\xa6\xa9\xb31X\x98\xe7,\xa6\x95\x03'\x98\xb1\x81\xb2\xa6\x8f\xe9\xf4\x12\xb1\xf6\xb7\xa6\xf3d\xcd\x9d\xebU\x0f\xa7b\x11\x99\xe9gK%\xa7\xf0\xdb[e\x99\x191\xa7\x87\xd3\xf9{\xe8rN\xa7>\xd6n\xaf\xeb\xcd\x0b\xa8!\x1fX\xea\x9b\x98\x1d\xa8\x13@\xbd-\xe9\xf4\\\xa8\xe0\t\xa0\xc9U\x9bl\xa8"
+    b'a(6\xb5\xc7\xa3\xb7\xa8\x03\x05\xa1i\x18\x05\xf9\xa8 \xf5\x81,\xb3\xc9)\xa9\xa3B\xc4}\x87n.\xa9\x9f\xca\x91\xe3S\xd8S\xa9\x0e\x14\x9f\xbf6\xdfS\xa9\xf1\x05\xe1\x88=\x0e\x8f\xa9\xc4\x91\x0e\xb0\x9eZ\xd2\xa9\xbc\x1c\xc5\xca\xbd\xb0\n\xaa\xf8A\x81nF\xab-\xaa\x0c\x8e\x1e\x14\x93UB\xaaA?\xb7[a\x97C\xaa'
+    b"\x86\x1c6\xb2\xec\xa6E\xaa\x82\xb3\x877M\x05k\xaa\xc08\xa8\xe3\xc9\x0es\xaaW\x9f'%\xac\r\x8c\xaa\xac\xfe\xb7\xc9e\xe1\x9f\xaa\x1a\xb3[&\x93$\xbc\xaa\xaao$\x04S\x1e\xf9\xaaF\xd0P\t\x06}\x81\xab@.25\xdb\x94\x96\xab?/\x9c/7\xdf\x99\xabf\xf29\xb8\xd1M\xb5\xab4lt\xb0\xca\xb9\xb5\xab"
+    b'\xe1*DNa\xbb\xb8\xab\xa8\xef\xb51\x8dm\xcd\xab\xd8\xbf\x8c]q\x04\xf2\xab\xac\xa7\xbc>,\x102\xac\xc2]f\xe0\x1f\x13Q\xaci\xc1\x8a\xce\x19<U\xac\x0e\x8b\xfa8\xfbem\xac\xe4\x97\xea\xe5\xa6_\x88\xace,!v_8\x92\xac\xcf"\x80e5\xac\xc8\xac\xc1\xcb\x93%\xef\x19\xd8\xac\x02\x98\x86\x13/0\x08\xad'
+    b"M=)\xc6a\xcb\x97\xad'\xf1\xf2\x85;4\xa2\xad%\x96\x8c\x08\xed\xd1\xa8\xad\xcd\rv\x12\x9cj\xcc\xadCN\xd6\x11P$L\xaeK\xbe h\xf9\x8d`\xae(\x94\xfb\xda\xe3\xfe\x9a\xae\xf3\x897*BW\xac\xae\xfbi\xae;HT\xd6\xae\x12\x85\x91\xca&S\xdc\xae\x18uT6\xdbq\xfe\xae\xf4)>\xf4=#c\xaf"
+    b"\xd9\x8d\xa2\x84\xf2\x87\xab\xaf\x1b\xbb\x03\x89\xb8\x10\xbd\xaf6\xea\xbf\xa8\xf7E\xfd\xaf\x0e\xd1\xcd\x02\x06\xc5\xfe\xaf<G\xe158Z&\xb0[R~Q\x07B\x7f\xb0\xda\x92\x12\x9f'\x88\xb0\xb0\xa8\x11\x04H\xba,\xd7\xb0\x04r\x007\x1e\xef\x04\xb1\x96\x90.~\xe2\xf4\n\xb1K~\xed>\x0c\x9de\xb1H@B\x94\xc3\x1dw\xb1"
+    b'\xef\xd1\xe8@\xd6\xc0\xa4\xb1\xd0\x8b\xf0c\x91\x08\xfb\xb1\xe2e\xa5\xab\xd6\xc7\xfc\xb1\xc9\xee\x84\xd1\xecnV\xb29t\xdb\x16\xf7\xf0\x95\xb2:t\xdb\x16\xf7\xf0\x95\xb2o\x93\xee\xbc\xf9\x1f\xc2\xb2\xf2\x0c\x05\xe0\xa0x\xc5\xb2\xf4\xcd\xdbbw\xca\xc9\xb2\xb7\x9dL|\x8e\xfe\x00\xb3h\x00\xe4\x89zlA\xb39\xd3\xa8U\xd9`F\xb3'
+    b'\x1dF\xbbY\xab\xccT\xb3g\xf6\xd3Y@V\xb4\xb3\xac+n\xdf\xe5\x9b\xfc\xb3@\x87\x9e\xa6\xe8\xca\x8f\xb4A\x87\x9e\xa6\xe8\xca\x8f\xb4C\x87\x9e\xa6\xe8\xca\x8f\xb4F\x87\x9e\xa6\xe8\xca\x8f\xb4\xba)\xc0\xf6o\xcd\x94\xb4j\xb5V\x1b\xfd\xc0\xbe\xb4:\xe8:H\xbb3\xff\xb4\x8bU\x01\xed\xa38D\xb5Yh\x92r\x95_~\xb5'
+    b'\xbf\xa0 K@D\xa7\xb5\xef\xb8\x12\xec\xba\xd4\xbe\xb5+\x1c\xce\x19 \x19\xc1\xb5\x10\xad\xbf\xcch\x9b\x00\xb6\xd7\xeb[\x18\xa1|8\xb6\x02\xf6\x9e\xda\x92+k\xb6\x84\xea\xf0q\x9b2p\xb6\x931\xa8i\xaaZ\xbf\xb6\x11\xd3j\x9d\x86\x90\xd2\xb6\xe9\xc2\x98\xba&u4\xb7\x1d!\x0b\xad3\x045\xb7\xc5\x0b E\x9c\x1aA\xb7'
+    b'\x00G\xd2\xe4\xddxh\xb7\x1a\xd8V\xc7,\xef\xf9\xb7\xf9s\xc5+\x9a\xa8\t\xb8\x08\xfb\xd3u\xe3?\x13\xb8\x9da^\xc0\x18;\xcf\xb8\xd63\t\x1b^\xc9\xfe\xb8\xd8\x9a\xdb\xf2%\x82\x85\xb9\xee\x9b\xd6\xf0\xe2\x82\x88\xb9\xa0\x8djA\xc5\xdb\x88\xb9\xa4!\xee\xb7\xf3i\xf7\xb9$\xbeB\x8e)\xa7&\xba\xde\x173\xfek\xef*\xba'
+    b"\xe9_\xf9'\x10G[\xba`\x0fs\x19\x82\xca]\xbae\xf8\xb8\xa2\xe4\x00\x8a\xba\x80|\x13\xb06C&\xbb\x19\x00\xdf\xb5\x8f\xb3P\xbb/I9\xe1,\xf5\x9e\xbb\xb7@xU\x00\xde\xe3\xbb\xec\xf2\x11t\x9a/\t\xbc\xc72,Z\xe9\x036\xbc;\x02\n\xba\xcfGL\xbc\x11s-\xfb\x9a\x06w\xbc#\r\x031o\x07\x9a\xbc"
+    b'\xd1\xac\xa8lc\n\xa6\xbcK\xf5\xea@/\xf6\xf4\xbc\xd6\x0b)T\x19\x1e,\xbd\x97M]\x89\x0f\xdd3\xbdu\xa4\xc7\x0c#\xba\xf7\xbd\x8d6\xc2\xbe.XB\xbe\x04\x97`\x06\xca@c\xbe\xc9\x02\xef\x0b\x8bT\xb1\xbe>\xd4\x88\xa2\x96\xb4\xdf\xbeV\xaf\xe7\x91\xa2\x92\xe8\xbe\xfb\x8d\x98(\xafs\r\xbf`\xcaC\t\x86q\x1b\xbf'
+    b'(me\x8bd\x1el\xbfP\xa3\x86G\x97Mu\xbf\x06\xbc\x9ec\xee\xe7x\xbf\x08`T\xf81\xed\x9e\xbf\xa5\x80\xee}"\xdf\xdb\xbf\xd2\xd6\x93\xd7\xe2W\xee\xbf\xfe\xd8\xb8\xc2\xa9\xac?\xc0\xd4\xaf\x02`^HJ\xc0y\xb09L,L^\xc0\xe4\x0bE;9\x96\x7f\xc0S\xc4\xbd\x0b\x0b;\'\xc1\xe2<\xde$m\xb8\xb0\xc1'
+    b'\xcb\x00\x12d\xb4\xec\xc9\xc1:\xd7\xf7"4\xb0)\xc2-\x98\xf6\x8e}\xc9,\xc2\x9aB\x1f\xees\x1e7\xc2\x05\xd2\xc4?\x950:\xc2\xa8\xce\xad\x1b|z\xec\xc2\x8d\xa7\xc7`\x81\x05<\xc3\xa0m\xc4p<\x13\x85\xc3\x1dM}\x1b=\x91\xb3\xc3\xf5\xe3:\x8d!n\xcc\xc3\xfb\x85\x84f\xa7\xfe\xcc\xc3T\x1f\xc0\x8a2\x0b\n\xc4'
+    b"h\x19s\xe3U:I\xc4\x9b\xd4\xbe?M\x0b[\xc4\xa6\x8f}\xc2|\x14^\xc4X\xe8\x1e\xae\xe7\x9a\x8f\xc4\xaa+u\xab&\xaa\x92\xc4\xdbh~\x8b\xc5g\xe8\xc4\xfa\xc0\xb6\xea-Z,\xc5\xc2\xac\xa4TeO9\xc5r'\xae\xec\x81\xb8M\xc5\x8c\x06\xbb\xb4\x9f[]\xc5\x05\xdaz\x1d\x02\xcdm\xc5\xad+\xa2\r\x96\xec\xc1\xc5"
+    b'|-~f5\xf1\xdf\xc5\x11\xb2\xe7\xd0_\x9eZ\xc6d\xfb\x0c\xd0\x08(x\xc6Wy\xcc\xfaWOz\xc6\xd2\xa1$\xc8\xdbZ\x7f\xc6XD\xeb5\x12\xad\x96\xc6\x16\xf5\x14\t\xe6\t\xa5\xc6H\xd2\xda"v\xd42\xc7\x07\xe8\x94\xb5\xe5\'\\\xc7\xa3\xe3\x1c=\xe6L\xe7\xc7N\x8d\x1a\xa0\xff\x01\xf0\xc76$\x0c\xb8\xa6\xc4\x18\xc8'
+    b'9\xb4\xb8%\n\xec#\xc8\xdb\xac\x11\x98\xe8vc\xc8\xb7y\xb66\xa2\xe4\xad\xc8\x92\xd3>z\xa4\xc6\xb4\xc8\xab\xc73h\xb3\x88\xf1\xc8\x8c\xc3\xa3T\xf3\x80\xf3\xc8\xc8H\xd0\x98\x90)\xf7\xc8\xc9H\xd0\x98\x90)\xf7\xc8\xcbH\xd0\x98\x90)\xf7\xc8\xceH\xd0\x98\x90)\xf7\xc8c\x9f\x90\xbd\xe6$U\xc9J\xf85\xe2\xbbTs\xc9'
+    b'?<4;(fv\xc9\xbaN|\x92o\xdb\xb2\xc9j\xc2\xe1\xb0\x81U\xb7\xc9\xfd}\x1e~\xda\x9a\xc3\xc9(9\tw\x01\xac\xfc\xc9\xd3\x00\x19\xb4$E\x16\xca\x1cg9\xfe5\xd6L\xca\x15\xb7\x8a)\x8e\x88{\xcaW\xf2\xb6\xcb\\u\x94\xca\x9a\xf7\xed\x8b\xc3\xdf\xc4\xca}V\xadaT) \xcb3\xfefO0\xfe]\xcb'
+    b'\x87\x83\xf4\x02\xfb92\xcc\n1+d-\xe0k\xcc\xff\xb9U0\x08\xfb\xcc\xcc\xba\x86+\xc4g\x86\xe9\xcct\x87\x8d\x90\xd9\xdf!\xcd\xcfFO\x9a\xab\xb3`\xcd\x84.\xbc\x8d\xc5?v\xcd\x87.\xbc\x8d\xc5?v\xcdMi\xb3f\x89c\x88\xcdc\xe9\x84\xa8"4\xbd\xcd@\xe8\x14(\xf4\xa9\xec\xcd\xde\xa8K\xb6\xf3A\x1a\xce'
+    b"\xf3\xf8\xae\xcb\x1e\xc38\xceO\xb2\xdeg\xfa i\xce\xa8St\xb0\xed\xe6\xc4\xce\x9c\x8e\xd1\x9b\x13R\xc8\xce\xd3\x8d\x1f\xba\xcfz\xed\xce\xccU_1\xc2\x89\x1b\xcfr\xe8\x9c\x1cQ\xa46\xcf\xb7\x8d`\xfb\x89\x8d;\xcfhy\xc9F\x1c\xa6>\xcf\xff#a\xff\x07DJ\xcf\x14z'\x84~Ar\xcf \xabq\x80)\xa4v\xcf"
+    b"\x16'\xfdFw\xc8\xe0\xcf\xd6\xf1\xad\xd5\xc7\x96\n\xd0s\xc0k\xf6/@\xbd\xd0ry\xecr\xb4\xc3\xd2\xd0q\xfbiA4]\xdc\xd0\x95Y\xfd\x19\xb8\xdb.\xd1\x14\x00\x16\xfel\xd0\xbd\xd1\xfb\xa5MV\x8e\x1fI\xd2N\xd5\xd8Iw\xe6n\xd2\xc0\xd4\xa8\xfa\x13\x07\x7f\xd2I\x058x_'\xb3\xd2S\xf0-\x99\xeel\xda\xd2"
+    b"\x19M\xcf\x9aMp'\xd3\x88\xbff\xf2T\x1c\x86\xd3\x91\xc7\x8b\xefrE\x8c\xd3\xa0$\t\xe0u\x86\xa7\xd3\xa3$\t\xe0u\x86\xa7\xd39\x90t1\xc9D\xd0\xd3\xb5\x19F\xc4\xf3\xe3\xf7\xd3VM\xf8S\xeb\x00\n\xd4]\xdb\xa4Z\x13\xa7\x1a\xd4\tx\x06\xe8\xd9\x18'\xd4\x8a\x900\xca\xd9X1\xd4\x0c\xc4\xb0\xbe{\xb03\xd4"
+    b'\xe5\xa3\x12\x9c>$L\xd4=\x8d\xbfQ\xd5\xdbO\xd4t\x19N\xb3l\x1c\x8d\xd4\x0bbL0I\xa3\xd4\xd4\xb9nW\xc0\x11\xc0\xe2\xd5\x1f\xa9L\x91z`\xe9\xd5\x89\xf7\x15\x1d\xfa\x11\xeb\xd5\xa0\x83\xb32l\x15\x14\xd6\x10UuUN\x7f\x17\xd6\x18|#<\xbc\x85\x19\xd6\x95Y\xd7\xb2:\x8a7\xd6~C]\xa4\xc1\xb2F\xd6'
+    b'\x066\x87\x85\xc1vJ\xd6M%\xe7\xb5\xeam_\xd6\xad\xef\x02:\xc3\xfff\xd6#c\xb8\x95\xbbg\xd2\xd6\x1b`9\xa43k \xd7\x0fE\xf61\xc6\xfa \xd7\xd0\x8a\x92\xa6\xda\x80q\xd7k\x00qz\xcec\x90\xd79\xb2K\xdd\xd7:\xf3\xd7,-\xdc\xa7-\x14a\xd8$\x08\xe0\xbey%\x88\xd8\x05|\xd3\x17M}\xe4\xd8'
+    b'\x041\xba\x8f\xdd&%\xd9\xd95\xf1\x99\x13\x95G\xd9\x82;\x8c\x96\x91Uf\xd9\x06\x0c\xee\xfb\xcf\x8e}\xd9\xc6\x93\xf0\x91\x8a\xb8\x03\xdaP\x04^{\xc8c\x1a\xdapa\xb4;\x15\xb1-\xda-\xc6\x05<\xa6\xbao\xdal\x07\x15\x97\xc3\xcd\x99\xda\x90\x898c\xd1\xa0\xb4\xda\x16\xe9}\x8b\x1b"i\xdb\x93r\x19\xde\xb0C\x93\xdb'
+    b'\xc9\xd2\x1d}\xc5x\xea\xdb_P\xc8\xfd\xb2)\xf3\xdb<f\xf0\x04\xb43Z\xdc \xba\xa2\x8a\xd7\x7ft\xdcI\xaf\xfbrL\x00{\xdc\xe6\x808E%\xcf\x88\xdc\xb2\x15\x18\x96e`\xe8\xdcQ\x11\xcbc\x9c\xaa\xf4\xdc\xc1\x8dw\xebs<\xf6\xdc\x88!rA\xee\xe9g\xdd\xd3\xa1\xf1\xed\xcd7y\xdd_Q\xd7\x13\x14S\x9f\xdd'
+    b'po0\xf7\xdb8\xd1\xdd5\x10q\xc1\xf2\n\xef\xddg\xefb\x1c\xde\xa5\x0f\xde-\x1e\xf0\x99l\x08\x15\xde\xff\x86\x91\x80b*;\xde\xf5\xc5\xd1\xeed\x94H\xdeRV\x80\x87\x05\x80^\xde\xe6\xf3\x83dnd=\xdf\x9bI\x18\xd1\xa8\x90W\xdf{\xfe K\x0b\x18f\xdf\xb5wz\x8d\xd1wq\xdf\x9d\xb3ett\xe5v\xdf'
+    b"h\x04\xee\xb9\xed\xf0}\xdfg\xe8\xe2c.\x87\xe6\xdf\x01\x92\x11\xdb\x04\xda*\xe0\x84'\xfe\x12\xf9\xe27\xe0\xbckQt}\xb4\xb3\xe0#z\x8eN\xae\r:\xe1Px\xf2\x10\xa5\x80\xa1\xe1^=\xf1=\xee\xbf\xf1\xe1\xddT\x19\xd5\x05\xd4\x1e\xe2%'m\xd5\xb3\x1cN\xe2\xa6\xd7\xd93toP\xe2p\x8b\xfc\x10\xdd\x9au\xe2"
+    b"fr\xcf\xbf\x0c\x15\xb0\xe2W\x1e\xa8Ln\xfc\xb1\xe2\x07\xc2\x9f\xad'\xa2\xe3\xe2I\xc3\xa3\x82\x97\xfff\xe3Z\xdbi\xa6|\x04\xa6\xe3\x85\xe0\x99\xf9M\x15\xe9\xe3:\xaa\xa4WL\x10\xea\xe3\xf6)\xce\x9eg\x85\xf3\xe3\xd0\xf5;\x0f\x12\xdf-\xe4\x81]Q*;I2\xe4(+\x9e\x05\x0e\xf3=\xe4)+\x9e\x05\x0e\xf3=\xe4"
+    b'*+\x9e\x05\x0e\xf3=\xe4++\x9e\x05\x0e\xf3=\xe4-+\x9e\x05\x0e\xf3=\xe4.+\x9e\x05\x0e\xf3=\xe4/+\x9e\x05\x0e\xf3=\xe4:rm\xa8\xa7\xadH\xe48L\x02\xd1-e_\xe4\xbd\x857\xfa<@z\xe4\xd4Y\xfc%t\xb8\x9f\xe4\xc7b\xb5H\xfa\x06\xdd\xe4p\xc29\xc2\x8d\x88\xf8\xe4s\xc29\xc2\x8d\x88\xf8\xe4'
+    b'\xcb\r\x7f\xd1\xca/X\xe5\xe7\x1e\xec\xdd\x0cMn\xe5I\xd5`\x94\x94S\x92\xe5NH\xbf\xb1\x1d\x9b\xae\xe5\x0e\xbe\xe3 \xff\x80\xb0\xe5\xa0Z\xdf,\xbb\x97\xe3\xe5\xd8\xb3\xcd8\x91\x8f\xfc\xe5:\r\xcf\x0e\x84\xeb}\xe6\x03\xa4\xc4JT\xa0\x98\xe6\xf8\xec8\x11\xa3\x9e\xc6\xe6^\x98~u\xf7W\xd1\xe6\xa5K\x82\x1e?\xe3\xe1\xe6'
+    b'\xb8\x19g\xd80\xa6\x1a\xe7\x9aj\xbc\xca\xde\xc4$\xe7\rzt\x87\x00\xc9;\xe7t\xcdJH\x9c\x1en\xe7\x81+\x0f\xdc1M3\xe8\xf9\x1f\x19\xcd\xf2\xf0\x82\xe8\x95?\\4\xe9\x02\x16\xe9 \x92S\xd3?VR\xe9\xde;\x1a^\xb5\xd9\xb6\xe9\xcf\x02&#]\x10\xe6\xe97\x95B\xd0\x946\x12\xea\x0f]\xb2\xf3h\xfc\x17\xea'
+    b'\xban\x02\xcb#\xc9&\xea\x04\xc9F\x08\x0f\xe19\xea7H\xa3\xd7Z\x8cc\xeaQ\xd3q\x0e\xb0"\x98\xea\xc2\x02\xe9b\xfc\xe2\xd4\xea)DTc\x15R\xee\xea\xd37=k\xb8\x1e\xf5\xea\xc7\xd0\xb78\x88S!\xeb\xca\x06\x0b\x9ct9"\xeb\x9b*\xd3\xa7\x9c\xf6A\xeb\xb5\xd1\x8cx\x82F\x8f\xeb\xa3\xbd\x8b\x01+\xf4\xc7\xeb'
+    b"\xcf\x9dSSH\xac\xea\xeb\x0f\xc0\xa7W\x12\xa6\xee\xeb\xd7\x88[\xcbyu0\xecWY\xefw\x03\xcd_\xec/\xa34zP|\x92\xec\xbbS\\\xa9'i\x9e\xec~\xfau\x9b\x0b\x0b\x00\xed\x92\x17\xe5\xdd<\xa2\x00\xed\xe2\x82C\xdaa\xa8n\xed81yt\xa3Tu\xed^W\xcb\xd4\x8c\xffy\xed\x83\xb4\xc9\x89\xd7O\x9f\xed"
+    b"\xdadZ\x83\x13'\xb8\xed,\xfeO;\xa31\xe8\xed\xc6=\xde0\xe9\x81\x0e\xee\xa2\xa5S]\xdb)\x19\xee[\x94\x90\x03\x9e\x108\xee)I\xf6\xa2m\xfd\xf3\xee\x91v.U\x0f\xea\xf8\xeeG\xdd\x17\xf6\x82\xe2\xfe\xee\x17\x18\x91\xdd\xc0\xbcK\xef]\x01\xaa\x97*\xfaK\xef!j\t\xa0\x1c\x8f\xa2\xef\xa6\xf33\xd0\xa1\xaf\xd9\xef"
+    b'\xa3\x18Q\xc0\x18\xb52\xf0/\xbc\xb5\xe3\xdbD@\xf0\xe0}\xf5t)\xaeH\xf0\xe8\xc2+*\x06Y\xe1\xf0\xe9\xc2+*\x06Y\xe1\xf0\xea\xc2+*\x06Y\xe1\xf0\xeb\xc2+*\x06Y\xe1\xf0\xec\xc2+*\x06Y\xe1\xf0\xed\xc2+*\x06Y\xe1\xf0\xee\xc2+*\x06Y\xe1\xf0\xf3\xe2\xe4\x98\xecV\x12\xf1k\x1c!hC\xab\x14\xf1'
+    b'2\xf6w\xc0\xcbP\x1d\xf1\x07\xa3\xfa\xd8"j*\xf1QK\x06\n\x94\xf2?\xf1iY\x8a\x94\x12l`\xf1\x99\x9d\x8b\xc5\x03\xf3}\xf1>\x01\xd2T\xc7\x8e\xb9\xf1r\x84G)\xc3)\xd9\xf1\x9a4\x12wW]\x03\xf2\x85\xac\xcb\xbf\xdb1\x11\xf2\xe4\x00z$4\x167\xf2\xbd4\x1a\xe6\xb4\x12T\xf24DJ\n1\x15\xdb\xf2'
+    b'\xb3\xe8`\x1f\xf2\x8b\xec\xf2\r\xb2\x8e\x08\x13\x9a#\xf3\xe2\x93L\xa2ze;\xf3\x9a,\xff?9"\xac\xf3\x8f\xefk\xe2VG\xba\xf3\xa5t\xb9x\x1c\xd7\xbb\xf3\x89\xdf\xaf\x11\xb9TB\xf4\xb1\x14?\x1a\xb1kT\xf4\xfa\xbbk|6Qd\xf4`\x05\xbb\x9c\x7f\xe5v\xf4c\x05\xbb\x9c\x7f\xe5v\xf4!\xe1t\x03^\x82\xf0\xf4'
+    b'\xb9\n\x0c\xff\x0b\xe5\xfd\xf4s\xbb2\xa6-\x0c\x1f\xf5t\xbb2\xa6-\x0c\x1f\xf5u\xbb2\xa6-\x0c\x1f\xf5v\xbb2\xa6-\x0c\x1f\xf5{\xc3\xd9\xa6\xea\xdd|\xf5\x8b\xb1\xeb\xdc\xb71\xaa\xf5\x85+1\xc9\xc6z\xcd\xf5\xb3"\xe7\xe2\x9aM\xec\xf5\xbc\'\xe43:g\xef\xf5\xe9\xab\xd4\x8a:\xfb2\xf6A1\\\xe7/\xf3H\xf6'
+    b"u\xae\xd5\xeb\xb3\ta\xf6'\xde\xc4\x17e\xf9|\xf6\x87\x9bK\xca'\xf8\xb5\xf6B\xaa\x9bI\x08\xcf\xbe\xf6\ne\xcb\x8c4\xa9\x19\xf7\xf9\xa9\xe3\x95\x0e\x8a\x93\xf7\xdfd\xfa~\xd1>\x08\xf8[\x17\x0bZ\xff'\x12\xf8\xc0\x95\xb1\xb0<A7\xf8T'3DMov\xf8\xeb\x92Ve%f\xab\xf8RK\x90#\x1cW\xd6\xf8"
+    b"\xb9\x04\x97p\x91\x1a\x19\xf9\xcb\xd1\x80\x14\x86\xb0o\xf9\x0c]/\xe7 \xa8q\xf9'\x84\x8bX3\xaf|\xf9mB\x0c\x14\xc0\x7f\xf5\xf9\xabrWT\xf9\xe0\x08\xfa\xbdv\xbc>\xe6\xbb,\xfa\xd0\xbb\xaf\x13\x93\xbaM\xfay\xdda\x80y\x9en\xfa\xca\xd63\xd2\x83\xb1\x85\xfa\x9bxN/\x9er\xe8\xfa\x1c*abs\xbb\xfc\xfa"
+    b"#;;\xcb\x9d\x8e8\xfb\x8d\x01\xe2\x82?Kb\xfb\x02\x04\xc7\x1a;\xc6\xdc\xfb\xe0A\x04\x9d\x8e\xf4\xe8\xfb\xfc\n\xe8L\x0bR\x8d\xfcs\xcf\xbc\x96`9\x0e\xfd?\x8bS\xed\xf2\xefF\xfd\x01\x0e\x8f\xd1E\xc4V\xfdf*\x04\x90\x7f@X\xfd\x94\xba'dH,s\xfd\x89\xe9\xbbz\x02:{\xfdk\xe5\xa0[M\xf5}\xfd"
+    b'\xd3\x90\x7f\x85\xcc\xe8\xb1\xfd\xfc\xe9\xae{\xa9Y\xd7\xfd\xf4_\x18r\xee\xae\xdd\xfd &\xfe\x8bi\n\xfd\xfd,\x0fzi\x9c<G\xfe\xa90\x14\xab\x7fPP\xfe\xe6K\xf3\xb8\x10eU\xfe\x8a\xc93\x92Eg_\xfe\xf0?c\x80\xe2%y\xfe\xf6\xdd\xf17\xdc\xc2\xec\xfe\xec\x9e\x97\xbc-9\x14\xff\x06\x98\x94\xfba[#\xff'
+    b'\x116\x98\t\xa1j&\xff\xb3\xf2\xaf\xbe\x91\xb71\xff\x00p\xf9\x16\x81\xdeA\xff\xbd\x8bj\xf4\x9d\xf7B\xff\xae\xdc\x8a\xec&\xbe\xcf\xff\x08\xb6\xde\x07L\xaa\xff\xff'
+)
+OFFSETS = (
+    b"\x00\x00\x00\x00\x1d\x00\x00\x000\x00\x00\x00@\x00\x00\x00_\x00\x00\x00\x8f\x00\x00\x00\xb2\x00\x00\x00\xd9\x00\x00\x00\xe8\x00\x00\x00\x0b\x01\x00\x00'\x01\x00\x00T\x01\x00\x00\x84\x01\x00\x00\xaf\x01\x00\x00\xff\x01\x00\x00\x19\x02\x00\x00V\x02\x00\x00\x85\x02\x00\x00\xba\x02\x00\x00\xe5\x02\x00\x00\x01\x03\x00\x007\x03\x00\x00a\x03\x00\x00\x8a\x03\x00\x00"
+    b'\xbd\x03\x00\x00\xe6\x03\x00\x00\x18\x04\x00\x00J\x04\x00\x00h\x04\x00\x00\x8c\x04\x00\x00\xc3\x04\x00\x00\xf1\x04\x00\x00"\x05\x00\x00>\x05\x00\x00S\x05\x00\x00z\x05\x00\x00\x99\x05\x00\x00\xa7\x05\x00\x00\xc8\x05\x00\x00\xea\x05\x00\x00\x04\x06\x00\x00&\x06\x00\x00K\x06\x00\x00g\x06\x00\x00\x8c\x06\x00\x00\xab\x06\x00\x00\xcc\x06\x00\x00\xee\x06\x00\x00'
+    b'\x12\x07\x00\x00-\x07\x00\x00J\x07\x00\x00k\x07\x00\x00\x91\x07\x00\x00\xc3\x07\x00\x00\xf2\x07\x00\x00&\x08\x00\x00V\x08\x00\x00\x9e\x08\x00\x00\xd2\x08\x00\x00\xf7\x08\x00\x004\t\x00\x00X\t\x00\x00\x8d\t\x00\x00\xb9\t\x00\x00\xda\t\x00\x00\xfb\t\x00\x00\x16\n\x00\x00H\n\x00\x00\x87\n\x00\x00\xb3\n\x00\x00\xd6\n\x00\x00\x0c\x0b\x00\x00'
+    b'\'\x0b\x00\x00I\x0b\x00\x00a\x0b\x00\x00\x85\x0b\x00\x00\x9a\x0b\x00\x00\xbe\x0b\x00\x00\xe0\x0b\x00\x00\t\x0c\x00\x001\x0c\x00\x00j\x0c\x00\x00\x97\x0c\x00\x00\xc8\x0c\x00\x00\xf1\x0c\x00\x007\r\x00\x00S\r\x00\x00w\r\x00\x00\x97\r\x00\x00\xc6\r\x00\x00\xf7\r\x00\x00"\x0e\x00\x00M\x0e\x00\x00x\x0e\x00\x00\xa7\x0e\x00\x00\xca\x0e\x00\x00'
+    b'\xfa\x0e\x00\x00-\x0f\x00\x00\\\x0f\x00\x00\x90\x0f\x00\x00\xc4\x0f\x00\x00\xf4\x0f\x00\x00(\x10\x00\x00Y\x10\x00\x00\x8b\x10\x00\x00\xb7\x10\x00\x00\xe2\x10\x00\x00\x0f\x11\x00\x009\x11\x00\x00r\x11\x00\x00\xa0\x11\x00\x00\xcc\x11\x00\x00\xf8\x11\x00\x00%\x12\x00\x00Q\x12\x00\x00\x9a\x12\x00\x00\xd5\x12\x00\x00\x15\x13\x00\x00B\x13\x00\x00m\x13\x00\x00'
+    b'\x9b\x13\x00\x00\xcc\x13\x00\x00\xfb\x13\x00\x00"\x14\x00\x00K\x14\x00\x00t\x14\x00\x00\x9d\x14\x00\x00\xcb\x14\x00\x00\xef\x14\x00\x00\x1d\x15\x00\x00Y\x15\x00\x00\x8b\x15\x00\x00\xaf\x15\x00\x00\xd7\x15\x00\x00\x00\x16\x00\x005\x16\x00\x00n\x16\x00\x00\x99\x16\x00\x00\xb4\x16\x00\x00\xe2\x16\x00\x00\x07\x17\x00\x00+\x17\x00\x00C\x17\x00\x00h\x17\x00\x00'
+    b'\x88\x17\x00\x00\xad\x17\x00\x00\xcd\x17\x00\x00\xe5\x17\x00\x00\x03\x18\x00\x00\x14\x18\x00\x00@\x18\x00\x00m\x18\x00\x00\x9b\x18\x00\x00\xc8\x18\x00\x00\xf5\x18\x00\x00\x17\x19\x00\x00F\x19\x00\x00e\x19\x00\x00\x90\x19\x00\x00\xab\x19\x00\x00\xde\x19\x00\x00\xf8\x19\x00\x00\x11\x1a\x00\x007\x1a\x00\x00\x81\x1a\x00\x00\xba\x1a\x00\x00\xd7\x1a\x00\x00\xf9\x1a\x00\x00'
+    b'2\x1b\x00\x00a\x1b\x00\x00\x95\x1b\x00\x00\xcf\x1b\x00\x00\x07\x1c\x00\x00;\x1c\x00\x00p\x1c\x00\x00\x8d\x1c\x00\x00\xa9\x1c\x00\x00\xd9\x1c\x00\x00\xfc\x1c\x00\x00\x1e\x1d\x00\x00K\x1d\x00\x00b\x1d\x00\x00\x98\x1d\x00\x00\xb2\x1d\x00\x00\xe2\x1d\x00\x00\x14\x1e\x00\x00A\x1e\x00\x00t\x1e\x00\x00\x9f\x1e\x00\x00\xca\x1e\x00\x00\xfe\x1e\x00\x000\x1f\x00\x00'
+    b'c\x1f\x00\x00\x91\x1f\x00\x00\xb9\x1f\x00\x00\xde\x1f\x00\x00\x12 \x00\x00? \x00\x00o \x00\x00\xa2 \x00\x00\xca \x00\x00\xec \x00\x00\x10!\x00\x00F!\x00\x00c!\x00\x00\xaa!\x00\x00\xd9!\x00\x00\xf8!\x00\x00\x19"\x00\x00A"\x00\x00l"\x00\x00\x97"\x00\x00\xb7"\x00\x00\xe2"\x00\x00$#\x00\x00C#\x00\x00'
+    b"j#\x00\x00\x9a#\x00\x00\xcb#\x00\x00\t$\x00\x00D$\x00\x00z$\x00\x00\xa6$\x00\x00\xc6$\x00\x00\xf5$\x00\x00!%\x00\x00Z%\x00\x00u%\x00\x00\x99%\x00\x00\xca%\x00\x00\xf3%\x00\x00\x1d&\x00\x00G&\x00\x00q&\x00\x00\xa0&\x00\x00\xd0&\x00\x00\xf9&\x00\x00\x19'\x00\x008'\x00\x00i'\x00\x00"
+    b"\x82'\x00\x00\xa0'\x00\x00\xce'\x00\x00\x05(\x00\x00;(\x00\x00q(\x00\x00\x8d(\x00\x00\xba(\x00\x00\xe8(\x00\x00\t)\x00\x00/)\x00\x00>)\x00\x00b)\x00\x00\x8c)\x00\x00\xa2)\x00\x00\xd3)\x00\x00\xf8)\x00\x00\x1a*\x00\x004*\x00\x00?*\x00\x00`*\x00\x00\x8a*\x00\x00\x9d*\x00\x00\xbb*\x00\x00"
+    b'\xd7*\x00\x00\xf5*\x00\x00\x03+\x00\x005+\x00\x00Q+\x00\x00e+\x00\x00\x8b+\x00\x00\xb5+\x00\x00\xe0+\x00\x00\x13,\x00\x00N,\x00\x00},\x00\x00\xb3,\x00\x00\xd9,\x00\x00\xfb,\x00\x00\x13-\x00\x00@-\x00\x00a-\x00\x00\x92-\x00\x00\xae-\x00\x00\xd3-\x00\x00\xe4-\x00\x00\x02.\x00\x00 .\x00\x00'
+    b'7.\x00\x00Z.\x00\x00r.\x00\x00\x9c.\x00\x00\xb9.\x00\x00\xe8.\x00\x00\x0f/\x00\x00(/\x00\x00A/\x00\x00q/\x00\x00\x95/\x00\x00\xc4/\x00\x00\xe5/\x00\x00\xff/\x00\x00\x190\x00\x00>0\x00\x00W0\x00\x00c0\x00\x00\x960\x00\x00\x9f0\x00\x00\xdb0\x00\x00\t1\x00\x0011\x00\x00Y1\x00\x00'
+    b'\x7f1\x00\x00\xa11\x00\x00\xbd1\x00\x00\xda1\x00\x00\x022\x00\x00,2\x00\x00T2\x00\x00p2\x00\x00\x972\x00\x00\xaf2\x00\x00\xce2\x00\x00\xed2\x00\x00\x1e3\x00\x00K3\x00\x00z3\x00\x00\xb23\x00\x00\xe93\x00\x00\x044\x00\x0004\x00\x00C4\x00\x00w4\x00\x00\x884\x00\x00\x954\x00\x00\xb94\x00\x00'
+    b'\xd94\x00\x00\xfa4\x00\x00-5\x00\x00;5\x00\x00L5\x00\x00g5\x00\x00\x8c5\x00\x00\xb35\x00\x00\x016\x00\x00\x1f6\x00\x0086\x00\x00S6\x00\x00i6\x00\x00\x7f6\x00\x00\x936\x00\x00\xa16\x00\x00\xca6\x00\x00\xf26\x00\x00\x107\x00\x00.7\x00\x00L7\x00\x00f7\x00\x00\x977\x00\x00\xb47\x00\x00'
+    b'\xd27\x00\x00\xfa7\x00\x00!8\x00\x00X8\x00\x00~8\x00\x00\x898\x00\x00\xae8\x00\x00\xdd8\x00\x00\x199\x00\x00=9\x00\x00p9\x00\x00\xa29\x00\x00\xc59\x00\x00\x00:\x00\x00(:\x00\x00P:\x00\x00\x81:\x00\x00\xb5:\x00\x00\xdf:\x00\x00\x0e;\x00\x00?;\x00\x00x;\x00\x00\xa5;\x00\x00\xcd;\x00\x00'
+    b'\n<\x00\x00;<\x00\x00q<\x00\x00\xa5<\x00\x00\xd3<\x00\x00\xff<\x00\x00\x14=\x00\x00)=\x00\x00I=\x00\x00m=\x00\x00\x90=\x00\x00\xc2=\x00\x00\xec=\x00\x00\xf7=\x00\x00\x1f>\x00\x00=>\x00\x00g>\x00\x00\x8f>\x00\x00\xac>\x00\x00\xce>\x00\x00\x08?\x00\x00 ?\x00\x00=?\x00\x00]?\x00\x00'
+    b'j?\x00\x00w?\x00\x00\x84?\x00\x00\xaf?\x00\x00\xdf?\x00\x00\x0c@\x00\x00+@\x00\x00H@\x00\x00^@\x00\x00\x8e@\x00\x00\xa3@\x00\x00\xd3@\x00\x00\xef@\x00\x00\x16A\x00\x00.A\x00\x00GA\x00\x00tA\x00\x00\x92A\x00\x00\xa5A\x00\x00\xbdA\x00\x00\xcaA\x00\x00\xf0A\x00\x00\x03B\x00\x00-B\x00\x00'
+    b'WB\x00\x00oB\x00\x00\xa7B\x00\x00\xc2B\x00\x00\xd1B\x00\x00\xfbB\x00\x00\x1dC\x00\x00LC\x00\x00zC\x00\x00\x97C\x00\x00\xb8C\x00\x00\xcbC\x00\x00\xf4C\x00\x00*D\x00\x00AD\x00\x00dD\x00\x00zD\x00\x00\xc1D\x00\x00\xedD\x00\x00\x1fE\x00\x00JE\x00\x00fE\x00\x00\x82E\x00\x00\xb0E\x00\x00'
+    b'\xddE\x00\x00\xe9E\x00\x00\x0fF\x00\x00<F\x00\x00YF\x00\x00vF\x00\x00\xa0F\x00\x00\xb8F\x00\x00\xefF\x00\x00/G\x00\x00SG\x00\x00xG\x00\x00\x97G\x00\x00\xc3G\x00\x00\xd0G\x00\x00\x08H\x00\x004H\x00\x00gH\x00\x00tH\x00\x00\x94H\x00\x00\xc7H\x00\x00\xe4H\x00\x00\x12I\x00\x00/I\x00\x00'
+    b";I\x00\x00\\I\x00\x00vI\x00\x00\x92I\x00\x00\xb9I\x00\x00\xebI\x00\x00\x01J\x00\x00'J\x00\x00SJ\x00\x00xJ\x00\x00\x9bJ\x00\x00\xc9J\x00\x00\x05K\x00\x00!K\x00\x00RK\x00\x00mK\x00\x00\x96K\x00\x00\xb3K\x00\x00\xe1K\x00\x00\xfdK\x00\x00:L\x00\x00XL\x00\x00\x80L\x00\x00\xadL\x00\x00"
+    b'\xc9L\x00\x00\xe8L\x00\x00\x04M\x00\x00,M\x00\x00MM\x00\x00uM\x00\x00\x89M\x00\x00\xa6M\x00\x00\xc2M\x00\x00\xdeM\x00\x00\x02N\x00\x00&N\x00\x00PN\x00\x00vN\x00\x00\x99N\x00\x00\xbfN\x00\x00\xf3N\x00\x00\x1cO\x00\x005O\x00\x00iO\x00\x00\x91O\x00\x00\xaeO\x00\x00\xd0O\x00\x00\xf8O\x00\x00'
+    b',P\x00\x00TP\x00\x00zP\x00\x00\xa2P\x00\x00\xbcP\x00\x00\xecP\x00\x00\x10Q\x00\x00?Q\x00\x00nQ\x00\x00\xa2Q\x00\x00\xbeQ\x00\x00\xe1Q\x00\x00\x10R\x00\x00:R\x00\x00[R\x00\x00tR\x00\x00\xa6R\x00\x00\xcdR\x00\x00\xe8R\x00\x00\x19S\x00\x009S\x00\x00qS\x00\x00\x9dS\x00\x00\xbcS\x00\x00'
+    b'\xddS\x00\x00\xfeS\x00\x00\x1bT\x00\x00?T\x00\x00~T\x00\x00\xa8T\x00\x00\xceT\x00\x00\xeaT\x00\x00\x06U\x00\x00 U\x00\x00BU\x00\x00]U\x00\x00}U\x00\x00\xabU\x00\x00\xcbU\x00\x00\xe0U\x00\x00\x0cV\x00\x005V\x00\x00ZV\x00\x00\x92V\x00\x00\xc3V\x00\x00\xf8V\x00\x00\x0cW\x00\x008W\x00\x00'
+    b'dW\x00\x00\xb4W\x00\x00\xf1W\x00\x00)X\x00\x00EX\x00\x00{X\x00\x00\xaeX\x00\x00\xd3X\x00\x00\xfdX\x00\x00$Y\x00\x00<Y\x00\x00QY\x00\x00jY\x00\x00\x8eY\x00\x00\xb2Y\x00\x00\xe0Y\x00\x00\x01Z\x00\x00"Z\x00\x00>Z\x00\x00iZ\x00\x00\x89Z\x00\x00\xb2Z\x00\x00\xc3Z\x00\x00\xf2Z\x00\x00'
+    b'\x17[\x00\x00A[\x00\x00g[\x00\x00\x8b[\x00\x00\xa7[\x00\x00\xbe[\x00\x00\xee[\x00\x00\x07\\\x00\x00!\\\x00\x00>\\\x00\x00R\\\x00\x00z\\\x00\x00\x83\\\x00\x00\x9e\\\x00\x00\xc5\\\x00\x00\xf0\\\x00\x00\x05]\x00\x002]\x00\x00\\]\x00\x00p]\x00\x00\xa7]\x00\x00\xbb]\x00\x00\xf8]\x00\x00 ^\x00\x00'
+    b'7^\x00\x00V^\x00\x00e^\x00\x00\x7f^\x00\x00\xa1^\x00\x00\xdd^\x00\x00\xfb^\x00\x00\x15_\x00\x00-_\x00\x00M_\x00\x00h_\x00\x00\x98_\x00\x00\xbe_\x00\x00\xef_\x00\x00"`\x00\x00V`\x00\x00r`\x00\x00\x83`\x00\x00\x9d`\x00\x00\xb5`\x00\x00\xe8`\x00\x00\x14a\x00\x000a\x00\x00Wa\x00\x00'
+    b'~a\x00\x00\xb2a\x00\x00\xdda\x00\x00\x05b\x00\x00\x16b\x00\x000b\x00\x00=b\x00\x00[b\x00\x00yb\x00\x00\x93b\x00\x00\xaab\x00\x00\xdbb\x00\x00\x07c\x00\x001c\x00\x00ec\x00\x00\x8fc\x00\x00\xa6c\x00\x00\xdbc\x00\x00\xf8c\x00\x00\x02d\x00\x00 d\x00\x00Dd\x00\x00\\d\x00\x00\x8ed\x00\x00'
+    b'\xaad\x00\x00\xcbd\x00\x00\xf0d\x00\x00\x0fe\x00\x00Ae\x00\x00ne\x00\x00\xa3e\x00\x00\xcbe\x00\x00\xede\x00\x00\x01f\x00\x000f\x00\x00Af\x00\x00cf\x00\x00\x90f\x00\x00\xbef\x00\x00\xe7f\x00\x00\xf9f\x00\x00\x1dg\x00\x00Fg\x00\x00fg\x00\x00\x9dg\x00\x00\xb9g\x00\x00\xdcg\x00\x00\x00h\x00\x00'
+    b'#h\x00\x008h\x00\x00lh\x00\x00\x94h\x00\x00\xb1h\x00\x00\xcdh\x00\x00\xf1h\x00\x00\ni\x00\x00+i\x00\x00Mi\x00\x00qi\x00\x00\x81i\x00\x00\x9ai\x00\x00\xbci\x00\x00\xf4i\x00\x00\x0cj\x00\x00,j\x00\x00Lj\x00\x00^j\x00\x00pj\x00\x00\xa8j\x00\x00\xc5j\x00\x00\xe7j\x00\x00\x14k\x00\x00'
+    b'<k\x00\x00Yk\x00\x00pk\x00\x00\xb1k\x00\x00\xc3k\x00\x00\xfck\x00\x000l\x00\x00tl\x00\x00\x98l\x00\x00\xb3l\x00\x00\xd1l\x00\x00\xe3l\x00\x00\x02m\x00\x00\x1em\x00\x00=m\x00\x00im\x00\x00\x94m\x00\x00\xaem\x00\x00\xd2m\x00\x00\xebm\x00\x00\x18n\x00\x00?n\x00\x00_n\x00\x00{n\x00\x00'
+    b'\x9bn\x00\x00\xcen\x00\x00\xebn\x00\x00\xf8n\x00\x00\x0eo\x00\x00"o\x00\x00Jo\x00\x00go\x00\x00\x8fo\x00\x00\xbfo\x00\x00\xd4o\x00\x00\xf7o\x00\x00\x18p\x00\x00.p\x00\x00Kp\x00\x00gp\x00\x00\x9fp\x00\x00\xb2p\x00\x00\xc0p\x00\x00\xdap\x00\x00\xfcp\x00\x00\x16q\x00\x00Bq\x00\x00uq\x00\x00'
+    b"\xa7q\x00\x00\xddq\x00\x00\xffq\x00\x00'r\x00\x00_r\x00\x00\x91r\x00\x00\xb9r\x00\x00\xd6r\x00\x00\xfcr\x00\x00's\x00\x001s\x00\x00`s\x00\x00\x93s\x00\x00\xb0s\x00\x00\xdes\x00\x00\xf3s\x00\x00\x18t\x00\x00.t\x00\x00Gt\x00\x00_t\x00\x00\x8at\x00\x00\xa4t\x00\x00\xc6t\x00\x00\xf1t\x00\x00"
+    b'$u\x00\x000u\x00\x00Lu\x00\x00bu\x00\x00\x84u\x00\x00\x9eu\x00\x00\xb4u\x00\x00\xdbu\x00\x00\xfeu\x00\x00\x14v\x00\x005v\x00\x00_v\x00\x00\x97v\x00\x00\xbav\x00\x00\xe2v\x00\x00\x00w\x00\x00 w\x00\x001w\x00\x00Rw\x00\x00qw\x00\x00\xa2w\x00\x00\xcaw\x00\x00\xf0w\x00\x00\nx\x00\x00'
+    b'-x\x00\x00=x\x00\x00Zx\x00\x00\x85x\x00\x00\xadx\x00\x00\xd3x\x00\x00\xf1x\x00\x00\x17y\x00\x007y\x00\x00sy\x00\x00\xady\x00\x00\xd5y\x00\x00\xf6y\x00\x00\x13z\x00\x00-z\x00\x00Jz\x00\x00nz\x00\x00\x80z\x00\x00\xa3z\x00\x00\xb9z\x00\x00\x01{\x00\x00*{\x00\x00V{\x00\x00\x83{\x00\x00'
+    b'\xad{\x00\x00\xeb{\x00\x00\x08|\x00\x000|\x00\x00c|\x00\x00\x8a|\x00\x00\xac|\x00\x00\xc7|\x00\x00\xf9|\x00\x00"}\x00\x005}\x00\x00_}\x00\x00\x8f}\x00\x00\xb9}\x00\x00\xec}\x00\x00\x0b~\x00\x002~\x00\x00T~\x00\x00r~\x00\x00\x90~\x00\x00\xa8~\x00\x00\xe5~\x00\x00\x05\x7f\x00\x009\x7f\x00\x00'
+    b'd\x7f\x00\x00\x98\x7f\x00\x00\xba\x7f\x00\x00\xdb\x7f\x00\x00\xff\x7f\x00\x00%\x80\x00\x00L\x80\x00\x00e\x80\x00\x00\x84\x80\x00\x00\x9e\x80\x00\x00\xc1\x80\x00\x00\xe6\x80\x00\x00\x02\x81\x00\x009\x81\x00\x00W\x81\x00\x00\x7f\x81\x00\x00\xac\x81\x00\x00\xd4\x81\x00\x00\x03\x82\x00\x00/\x82\x00\x00]\x82\x00\x00t\x82\x00\x00\x9b\x82\x00\x00\xc3\x82\x00\x00'
+    b'\xef\x82\x00\x00\x1f\x83\x00\x00>\x83\x00\x00^\x83\x00\x00q\x83\x00\x00\x83\x83\x00\x00\x9c\x83\x00\x00\xbc\x83\x00\x00\xe1\x83\x00\x00\xfd\x83\x00\x00#\x84\x00\x00>\x84\x00\x00_\x84\x00\x00u\x84\x00\x00\x91\x84\x00\x00\xaf\x84\x00\x00\xcc\x84\x00\x00\xfa\x84\x00\x00\x18\x85\x00\x00.\x85\x00\x00Z\x85\x00\x00l\x85\x00\x00\x89\x85\x00\x00\xa6\x85\x00\x00'
+    b'\xca\x85\x00\x00\xea\x85\x00\x00\x08\x86\x00\x003\x86\x00\x00P\x86\x00\x00o\x86\x00\x00\x93\x86\x00\x00\xa5\x86\x00\x00\xcb\x86\x00\x00\xec\x86\x00\x00\x04\x87\x00\x004\x87\x00\x00[\x87\x00\x00w\x87\x00\x00\xa4\x87\x00\x00\xbb\x87\x00\x00\xdc\x87\x00\x00\x04\x88\x00\x00<\x88\x00\x00j\x88\x00\x00\x93\x88\x00\x00\xc2\x88\x00\x00\xe8\x88\x00\x00\x12\x89\x00\x00'
+    b'G\x89\x00\x00q\x89\x00\x00\x91\x89\x00\x00\xbc\x89\x00\x00\xc4\x89\x00\x00\xf2\x89\x00\x00\x1c\x8a\x00\x00I\x8a\x00\x00`\x8a\x00\x00\x8b\x8a\x00\x00\xb0\x8a\x00\x00\xd1\x8a\x00\x00\xf4\x8a\x00\x00#\x8b\x00\x00V\x8b\x00\x00\x88\x8b\x00\x00\x9d\x8b\x00\x00\xbe\x8b\x00\x00\xe5\x8b\x00\x00\x0f\x8c\x00\x00;\x8c\x00\x00_\x8c\x00\x00\x81\x8c\x00\x00\xab\x8c\x00\x00'
+    b'\xd4\x8c\x00\x00\xf7\x8c\x00\x00\x16\x8d\x00\x00$\x8d\x00\x00E\x8d\x00\x00k\x8d\x00\x00\x9a\x8d\x00\x00\xcb\x8d\x00\x00\x01\x8e\x00\x00*\x8e\x00\x00Q\x8e\x00\x00Z\x8e\x00\x00y\x8e\x00\x00\x8e\x8e\x00\x00\xb5\x8e\x00\x00\xc5\x8e\x00\x00\xe6\x8e\x00\x00\n\x8f\x00\x002\x8f\x00\x00e\x8f\x00\x00w\x8f\x00\x00\xa7\x8f\x00\x00\xd2\x8f\x00\x00\xfb\x8f\x00\x00'
+    b'#\x90\x00\x00G\x90\x00\x00n\x90\x00\x00\x80\x90\x00\x00\xa2\x90\x00\x00\xdc\x90\x00\x00\xec\x90\x00\x00\x04\x91\x00\x00$\x91\x00\x00A\x91\x00\x00t\x91\x00\x00\x8e\x91\x00\x00\xbd\x91\x00\x00\xda\x91\x00\x00\x07\x92\x00\x00\x1f\x92\x00\x008\x92\x00\x00]\x92\x00\x00\x7f\x92\x00\x00\xa7\x92\x00\x00\xd0\x92\x00\x00\xf6\x92\x00\x00\x1c\x93\x00\x00Q\x93\x00\x00'
+    b'\x86\x93\x00\x00\x90\x93\x00\x00\xb2\x93\x00\x00\xd1\x93\x00\x00\xf0\x93\x00\x00\x04\x94\x00\x00\x17\x94\x00\x00N\x94\x00\x00t\x94\x00\x00\xa8\x94\x00\x00\xc6\x94\x00\x00\xe3\x94\x00\x00\xf8\x94\x00\x00\x1a\x95\x00\x000\x95\x00\x00I\x95\x00\x00q\x95\x00\x00\x8d\x95\x00\x00\xaf\x95\x00\x00\xc2\x95\x00\x00\xe2\x95\x00\x00\xed\x95\x00\x00\x0e\x96\x00\x00A\x96\x00\x00'
+    b'q\x96\x00\x00\x93\x96\x00\x00\xaa\x96\x00\x00\xd6\x96\x00\x00\x0f\x97\x00\x00<\x97\x00\x00M\x97\x00\x00_\x97\x00\x00\x8c\x97\x00\x00\xc1\x97\x00\x00\xed\x97\x00\x00\n\x98\x00\x00,\x98\x00\x00F\x98\x00\x00U\x98\x00\x00\x83\x98\x00\x00\x9b\x98\x00\x00\xc5\x98\x00\x00\xe8\x98\x00\x00\x02\x99\x00\x00\x0e\x99\x00\x00*\x99\x00\x00c\x99\x00\x00\x85\x99\x00\x00'
+    b'\xb2\x99\x00\x00\xcc\x99\x00\x00\xda\x99\x00\x00\xea\x99\x00\x00\x01\x9a\x00\x00#\x9a\x00\x00=\x9a\x00\x00a\x9a\x00\x00\x8b\x9a\x00\x00\xa7\x9a\x00\x00\xb6\x9a\x00\x00\xd6\x9a\x00\x00\xee\x9a\x00\x00\x11\x9b\x00\x00&\x9b\x00\x00V\x9b\x00\x00z\x9b\x00\x00\x9c\x9b\x00\x00\xb2\x9b\x00\x00\xcc\x9b\x00\x00\x02\x9c\x00\x00\x16\x9c\x00\x007\x9c\x00\x00N\x9c\x00\x00'
+    b'e\x9c\x00\x00\x9d\x9c\x00\x00\xc1\x9c\x00\x00\xd3\x9c\x00\x00\x0b\x9d\x00\x00.\x9d\x00\x00T\x9d\x00\x00x\x9d\x00\x00\x9a\x9d\x00\x00\xca\x9d\x00\x00\xf3\x9d\x00\x00\x18\x9e\x00\x00<\x9e\x00\x00M\x9e\x00\x00m\x9e\x00\x00\x90\x9e\x00\x00\xa1\x9e\x00\x00\xbd\x9e\x00\x00\xdb\x9e\x00\x00\xf3\x9e\x00\x00\x07\x9f\x00\x00"\x9f\x00\x008\x9f\x00\x00N\x9f\x00\x00'
+    b'b\x9f\x00\x00o\x9f\x00\x00|\x9f\x00\x00\x87\x9f\x00\x00\x9b\x9f\x00\x00\xad\x9f\x00\x00\xc0\x9f\x00\x00\xd8\x9f\x00\x00\x02\xa0\x00\x00\x18\xa0\x00\x000\xa0\x00\x00X\xa0\x00\x00\x82\xa0\x00\x00\xb2\xa0\x00\x00\xcf\xa0\x00\x00\xe6\xa0\x00\x00\x00\xa1\x00\x00\x14\xa1\x00\x00;\xa1\x00\x00g\xa1\x00\x00y\xa1\x00\x00\xa1\xa1\x00\x00\xbd\xa1\x00\x00\xe9\xa1\x00\x00'
+    b'\x1b\xa2\x00\x00K\xa2\x00\x00i\xa2\x00\x00\x8e\xa2\x00\x00\xa4\xa2\x00\x00\xc0\xa2\x00\x00\xd7\xa2\x00\x00\xec\xa2\x00\x00\x01\xa3\x00\x00,\xa3\x00\x00X\xa3\x00\x00\x80\xa3\x00\x00\xab\xa3\x00\x00\xc0\xa3\x00\x00\xdf\xa3\x00\x00\xf6\xa3\x00\x00(\xa4\x00\x00F\xa4\x00\x00`\xa4\x00\x00\x87\xa4\x00\x00\xcf\xa4\x00\x00\x04\xa5\x00\x00C\xa5\x00\x00n\xa5\x00\x00'
+    b'\x89\xa5\x00\x00\xa6\xa5\x00\x00\xd3\xa5\x00\x00\xdf\xa5\x00\x00\x01\xa6\x00\x00 \xa6\x00\x003\xa6\x00\x00M\xa6\x00\x00o\xa6\x00\x00\xa6\xa6\x00\x00\xcb\xa6\x00\x00\x05\xa7\x00\x003\xa7\x00\x00X\xa7\x00\x00v\xa7\x00\x00\xb4\xa7\x00\x00\xc8\xa7\x00\x00\xfa\xa7\x00\x00\x15\xa8\x00\x00J\xa8\x00\x00b\xa8\x00\x00\x98\xa8\x00\x00\xad\xa8\x00\x00\xcf\xa8\x00\x00'
+    b'\xf4\xa8\x00\x00$\xa9\x00\x007\xa9\x00\x00B\xa9\x00\x00R\xa9\x00\x00q\xa9\x00\x00\x8d\xa9\x00\x00\xa7\xa9\x00\x00\xb2\xa9\x00\x00\xe6\xa9\x00\x00\x04\xaa\x00\x00\x17\xaa\x00\x00N\xaa\x00\x00_\xaa\x00\x00\x87\xaa\x00\x00\xaf\xaa\x00\x00\xe0\xaa\x00\x00\xfa\xaa\x00\x00.\xab\x00\x00@\xab\x00\x00V\xab\x00\x00u\xab\x00\x00\x9e\xab\x00\x00\xc6\xab\x00\x00'
+    b'\xd6\xab\x00\x00\xe7\xab\x00\x00\xff\xab\x00\x00F\xac\x00\x00Z\xac\x00\x00\x9b\xac\x00\x00\xd3\xac\x00\x00\xdf\xac\x00\x00\x15\xad\x00\x00-\xad\x00\x00_\xad\x00\x00\x88\xad\x00\x00\xb2\xad\x00\x00\xd3\xad\x00\x00\xf6\xad\x00\x00\x13\xae\x00\x006\xae\x00\x00W\xae\x00\x00w\xae\x00\x00\x99\xae\x00\x00\xba\xae\x00\x00\xd6\xae\x00\x00\x04\xaf\x00\x00A\xaf\x00\x00'
+    b'm\xaf\x00\x00\xa0\xaf\x00\x00\xc6\xaf\x00\x00\xd6\xaf\x00\x00\x0e\xb0\x00\x00?\xb0\x00\x00W\xb0\x00\x00\x81\xb0\x00\x00\xb0\xb0\x00\x00\xc2\xb0\x00\x00\xe4\xb0\x00\x00\x03\xb1\x00\x00/\xb1\x00\x00b\xb1\x00\x00\x82\xb1\x00\x00\xb3\xb1\x00\x00\xde\xb1\x00\x00\x00\xb2\x00\x00\x14\xb2\x00\x000\xb2\x00\x00c\xb2\x00\x00n\xb2\x00\x00\x8d\xb2\x00\x00\xc2\xb2\x00\x00'
+    b'\xd4\xb2\x00\x00\xed\xb2\x00\x00\xfa\xb2\x00\x00#\xb3\x00\x00N\xb3\x00\x00\x84\xb3\x00\x00\x9e\xb3\x00\x00\xc5\xb3\x00\x00\xe9\xb3\x00\x00 \xb4\x00\x00?\xb4\x00\x00o\xb4\x00\x00\x99\xb4\x00\x00\xb4\xb4\x00\x00\xf5\xb4\x00\x00.\xb5\x00\x00[\xb5\x00\x00y\xb5\x00\x00\xc4\xb5\x00\x00\x00\xb6\x00\x00*\xb6\x00\x00K\xb6\x00\x00y\xb6\x00\x00\xb5\xb6\x00\x00'
+    b'\xe6\xb6\x00\x00\x0c\xb7\x00\x00+\xb7\x00\x00i\xb7\x00\x00\xa3\xb7\x00\x00\xd6\xb7\x00\x00\x08\xb8\x00\x00?\xb8\x00\x00g\xb8\x00\x00\x89\xb8\x00\x00\xca\xb8\x00\x00\x17\xb9\x00\x00k\xb9\x00\x00\xbb\xb9\x00\x00\xda\xb9\x00\x00\x04\xba\x00\x00-\xba\x00\x00H\xba\x00\x00}\xba\x00\x00\xc2\xba\x00\x00\xe8\xba\x00\x00+\xbb\x00\x00Q\xbb\x00\x00\x91\xbb\x00\x00'
+    b'\xb5\xbb\x00\x00\xdd\xbb\x00\x00\n\xbc\x00\x00/\xbc\x00\x00l\xbc\x00\x00\x93\xbc\x00\x00\xb7\xbc\x00\x00\xe3\xbc\x00\x00\r\xbd\x00\x009\xbd\x00\x00W\xbd\x00\x00y\xbd\x00\x00\xa3\xbd\x00\x00\xdf\xbd\x00\x00\x06\xbe\x00\x00A\xbe\x00\x00w\xbe\x00\x00\xad\xbe\x00\x00\xe5\xbe\x00\x00\x1f\xbf\x00\x00[\xbf\x00\x00\x83\xbf\x00\x00\xbf\xbf\x00\x00\x11\xc0\x00\x00'
+    b'<\xc0\x00\x00\x8d\xc0\x00\x00\xc8\xc0\x00\x00\x00\xc1\x00\x009\xc1\x00\x00v\xc1\x00\x00\xa9\xc1\x00\x00\xeb\xc1\x00\x00\x1d\xc2\x00\x00]\xc2\x00\x00\x92\xc2\x00\x00\xbf\xc2\x00\x00\xfa\xc2\x00\x00 \xc3\x00\x00Y\xc3\x00\x00\x83\xc3\x00\x00\xa9\xc3\x00\x00\xe5\xc3\x00\x00\x19\xc4\x00\x00\\\xc4\x00\x00\x8a\xc4\x00\x00\xbe\xc4\x00\x00\xf0\xc4\x00\x00 \xc5\x00\x00'
+    b'P\xc5\x00\x00\x93\xc5\x00\x00\xc0\xc5\x00\x00\xfa\xc5\x00\x00$\xc6\x00\x00W\xc6\x00\x00\x8d\xc6\x00\x00\xbd\xc6\x00\x00\xe4\xc6\x00\x00\x07\xc7\x00\x00<\xc7\x00\x00o\xc7\x00\x00\x9c\xc7\x00\x00\xe1\xc7\x00\x00\x14\xc8\x00\x00H\xc8\x00\x00\x87\xc8\x00\x00\xc6\xc8\x00\x00\x03\xc9\x00\x005\xc9\x00\x00n\xc9\x00\x00\x9b\xc9\x00\x00\xd5\xc9\x00\x00\t\xca\x00\x00'
+    b'/\xca\x00\x00m\xca\x00\x00\x98\xca\x00\x00\xcb\xca\x00\x00\x06\xcb\x00\x00?\xcb\x00\x00c\xcb\x00\x00\x97\xcb\x00\x00\xbf\xcb\x00\x00\xdb\xcb\x00\x00\xfe\xcb\x00\x00\x15\xcc\x00\x00M\xcc\x00\x00\x83\xcc\x00\x00\xa9\xcc\x00\x00\xe5\xcc\x00\x00\x04\xcd\x00\x000\xcd\x00\x00^\xcd\x00\x00\x95\xcd\x00\x00\xcd\xcd\x00\x00\xf3\xcd\x00\x00$\xce\x00\x00Q\xce\x00\x00'
+    b'g\xce\x00\x00\x8d\xce\x00\x00\xb5\xce\x00\x00\xed\xce\x00\x00 \xcf\x00\x00f\xcf\x00\x00\x94\xcf\x00\x00\xba\xcf\x00\x00\xf0\xcf\x00\x00\x1d\xd0\x00\x00?\xd0\x00\x00n\xd0\x00\x00\x95\xd0\x00\x00\xc5\xd0\x00\x00\xfd\xd0\x00\x00(\xd1\x00\x00S\xd1\x00\x00\x83\xd1\x00\x00\xb0\xd1\x00\x00\xe2\xd1\x00\x00\x0f\xd2\x00\x005\xd2\x00\x00W\xd2\x00\x00\x8e\xd2\x00\x00'
+    b'\xbd\xd2\x00\x00\xe6\xd2\x00\x00\x0b\xd3\x00\x004\xd3\x00\x00_\xd3\x00\x00\x8d\xd3\x00\x00\xbd\xd3\x00\x00\xe2\xd3\x00\x00\t\xd4\x00\x000\xd4\x00\x00W\xd4\x00\x00|\xd4\x00\x00\xa1\xd4\x00\x00\xe0\xd4\x00\x00\x05\xd5\x00\x009\xd5\x00\x00r\xd5\x00\x00\x98\xd5\x00\x00\xc7\xd5\x00\x00\xf8\xd5\x00\x00"\xd6\x00\x00I\xd6\x00\x00r\xd6\x00\x00\x98\xd6\x00\x00'
+    b'\xc9\xd6\x00\x00\xf7\xd6\x00\x00$\xd7\x00\x00\\\xd7\x00\x00\xa8\xd7\x00\x00\xe5\xd7\x00\x00\x10\xd8\x00\x005\xd8\x00\x00c\xd8\x00\x00\x8d\xd8\x00\x00\xc6\xd8\x00\x00\xe5\xd8\x00\x00\x12\xd9\x00\x006\xd9\x00\x00Z\xd9\x00\x00\x84\xd9\x00\x00\xae\xd9\x00\x00\xe8\xd9\x00\x00\x0c\xda\x00\x003\xda\x00\x00h\xda\x00\x00\x9d\xda\x00\x00\xcb\xda\x00\x00\xf6\xda\x00\x00'
+    b'(\xdb\x00\x00X\xdb\x00\x00\x86\xdb\x00\x00\xc7\xdb\x00\x00\xfb\xdb\x00\x00)\xdc\x00\x00O\xdc\x00\x00v\xdc\x00\x00\xa2\xdc\x00\x00\xe8\xdc\x00\x00\x10\xdd\x00\x00*\xdd\x00\x00U\xdd\x00\x00\x85\xdd\x00\x00\xae\xdd\x00\x00\xd6\xdd\x00\x00\x13\xde\x00\x005\xde\x00\x00`\xde\x00\x00\x88\xde\x00\x00\xb3\xde\x00\x00\xe4\xde\x00\x00\x0c\xdf\x00\x00K\xdf\x00\x00'
+    b'\x92\xdf\x00\x00\xbd\xdf\x00\x00\xe4\xdf\x00\x00\x0c\xe0\x00\x00Q\xe0\x00\x00v\xe0\x00\x00\xa0\xe0\x00\x00\xdd\xe0\x00\x00\x10\xe1\x00\x001\xe1\x00\x00O\xe1\x00\x00\x94\xe1\x00\x00\xc3\xe1\x00\x00\xe4\xe1\x00\x00\x04\xe2\x00\x00D\xe2\x00\x00\x84\xe2\x00\x00\xb1\xe2\x00\x00\xce\xe2\x00\x00\xf9\xe2\x00\x00.\xe3\x00\x00R\xe3\x00\x00\x83\xe3\x00\x00\xb1\xe3\x00\x00'
+    b'\xde\xe3\x00\x00\x01\xe4\x00\x00;\xe4\x00\x00k\xe4\x00\x00\x96\xe4\x00\x00\xbc\xe4\x00\x00\xe0\xe4\x00\x00\xfd\xe4\x00\x00"\xe5\x00\x00U\xe5\x00\x00\x7f\xe5\x00\x00\xaf\xe5\x00\x00\xd8\xe5\x00\x00\xff\xe5\x00\x003\xe6\x00\x00[\xe6\x00\x00\x80\xe6\x00\x00\xa4\xe6\x00\x00\xdd\xe6\x00\x00\x1d\xe7\x00\x00[\xe7\x00\x00\x9f\xe7\x00\x00\xd3\xe7\x00\x00\r\xe8\x00\x00'
+    b'7\xe8\x00\x00h\xe8\x00\x00\x9b\xe8\x00\x00\xcf\xe8\x00\x00\x03\xe9\x00\x00G\xe9\x00\x00u\xe9\x00\x00\xae\xe9\x00\x00\xdc\xe9\x00\x00\x02\xea\x00\x00,\xea\x00\x00X\xea\x00\x00\x8b\xea\x00\x00\xcd\xea\x00\x00\xfe\xea\x00\x00+\xeb\x00\x00o\xeb\x00\x00\xa2\xeb\x00\x00\xc6\xeb\x00\x00\xf2\xeb\x00\x00\x19\xec\x00\x00C\xec\x00\x00x\xec\x00\x00\x99\xec\x00\x00'
+    b'\xc2\xec\x00\x00\x0c\xed\x00\x008\xed\x00\x00\x80\xed\x00\x00\xb0\xed\x00\x00\xe0\xed\x00\x00!\xee\x00\x00_\xee\x00\x00\x84\xee\x00\x00\xba\xee\x00\x00\xf6\xee\x00\x007\xef\x00\x00d\xef\x00\x00\xa6\xef\x00\x00\xca\xef\x00\x00\x01\xf0\x00\x00A\xf0\x00\x00r\xf0\x00\x00\x9b\xf0\x00\x00\xc0\xf0\x00\x00\xef\xf0\x00\x00\x16\xf1\x00\x00H\xf1\x00\x00k\xf1\x00\x00'
+    b'\xa7\xf1\x00\x00\xd1\xf1\x00\x00\x0c\xf2\x00\x006\xf2\x00\x00[\xf2\x00\x00\x82\xf2\x00\x00\x9b\xf2\x00\x00\xc2\xf2\x00\x00\xfc\xf2\x00\x00#\xf3\x00\x00?\xf3\x00\x00f\xf3\x00\x00~\xf3\x00\x00\x9d\xf3\x00\x00\xc6\xf3\x00\x00\xfd\xf3\x00\x006\xf4\x00\x00\\\xf4\x00\x00\x85\xf4\x00\x00\xbc\xf4\x00\x00\xee\xf4\x00\x00!\xf5\x00\x00L\xf5\x00\x00p\xf5\x00\x00'
+    b'\x91\xf5\x00\x00\xb8\xf5\x00\x00\xee\xf5\x00\x00\x12\xf6\x00\x006\xf6\x00\x00_\xf6\x00\x00~\xf6\x00\x00\xa2\xf6\x00\x00\xc5\xf6\x00\x00\x03\xf7\x00\x009\xf7\x00\x00[\xf7\x00\x00u\xf7\x00\x00\xa9\xf7\x00\x00\xdd\xf7\x00\x00\xf3\xf7\x00\x00\x13\xf8\x00\x00;\xf8\x00\x00k\xf8\x00\x00\x8e\xf8\x00\x00\xab\xf8\x00\x00\xd6\xf8\x00\x00\x04\xf9\x00\x00,\xf9\x00\x00'
+    b'X\xf9\x00\x00{\xf9\x00\x00\xb3\xf9\x00\x00\xf7\xf9\x00\x008\xfa\x00\x00c\xfa\x00\x00\x9f\xfa\x00\x00\xcc\xfa\x00\x00\x02\xfb\x00\x00=\xfb\x00\x00`\xfb\x00\x00\x98\xfb\x00\x00\xc3\xfb\x00\x00\xe9\xfb\x00\x00\x1d\xfc\x00\x00F\xfc\x00\x00~\xfc\x00\x00\xa5\xfc\x00\x00\xde\xfc\x00\x00\x12\xfd\x00\x001\xfd\x00\x00r\xfd\x00\x00\xa4\xfd\x00\x00\xd3\xfd\x00\x00'
+    b'\xf2\xfd\x00\x00\x1f\xfe\x00\x00V\xfe\x00\x00z\xfe\x00\x00\xab\xfe\x00\x00\xe6\xfe\x00\x00"\xff\x00\x00F\xff\x00\x00z\xff\x00\x00\xa0\xff\x00\x00\xc4\xff\x00\x00\xe0\xff\x00\x00\x05\x00\x01\x00-\x00\x01\x00R\x00\x01\x00\x8f\x00\x01\x00\xb5\x00\x01\x00\xed\x00\x01\x00\x19\x01\x01\x00:\x01\x01\x00z\x01\x01\x00\xa5\x01\x01\x00\xc8\x01\x01\x00\xec\x01\x01\x00'
+    b'\n\x02\x01\x00\x1d\x02\x01\x00A\x02\x01\x00q\x02\x01\x00\xaf\x02\x01\x00\xe9\x02\x01\x00\x10\x03\x01\x002\x03\x01\x00[\x03\x01\x00\x84\x03\x01\x00\xa6\x03\x01\x00\xc6\x03\x01\x00\x00\x04\x01\x001\x04\x01\x00Y\x04\x01\x00\x8a\x04\x01\x00\xb9\x04\x01\x00\xef\x04\x01\x00\x1b\x05\x01\x00J\x05\x01\x00v\x05\x01\x00\x9b\x05\x01\x00\xc6\x05\x01\x00\xfb\x05\x01\x00'
+    b'3\x06\x01\x00R\x06\x01\x00|\x06\x01\x00\x9c\x06\x01\x00\xcf\x06\x01\x00\xf4\x06\x01\x00\x1e\x07\x01\x00@\x07\x01\x00y\x07\x01\x00\xc8\x07\x01\x00\xf5\x07\x01\x00-\x08\x01\x00\\\x08\x01\x00\x93\x08\x01\x00\xd5\x08\x01\x00\x1f\t\x01\x00]\t\x01\x00\x88\t\x01\x00\xc2\t\x01\x00\xfc\t\x01\x008\n\x01\x00\x81\n\x01\x00\xb5\n\x01\x00\xf3\n\x01\x00'
+    b'\x1c\x0b\x01\x00E\x0b\x01\x00c\x0b\x01\x00\x91\x0b\x01\x00\xad\x0b\x01\x00\xdd\x0b\x01\x00\x13\x0c\x01\x00H\x0c\x01\x00s\x0c\x01\x00\xb3\x0c\x01\x00\xe0\x0c\x01\x00\xf9\x0c\x01\x00*\r\x01\x00S\r\x01\x00|\r\x01\x00\x97\r\x01\x00\xe1\r\x01\x00\x0f\x0e\x01\x00<\x0e\x01\x00f\x0e\x01\x00\x93\x0e\x01\x00\xb8\x0e\x01\x00\xda\x0e\x01\x00\x01\x0f\x01\x00'
+    b'-\x0f\x01\x00N\x0f\x01\x00\x7f\x0f\x01\x00\xb4\x0f\x01\x00\xe0\x0f\x01\x00\n\x10\x01\x00-\x10\x01\x00T\x10\x01\x00\x82\x10\x01\x00\xa9\x10\x01\x00\xd3\x10\x01\x00\xfc\x10\x01\x00-\x11\x01\x00X\x11\x01\x00\x83\x11\x01\x00\xab\x11\x01\x00\xe0\x11\x01\x00\x0e\x12\x01\x00L\x12\x01\x00v\x12\x01\x00\xa2\x12\x01\x00\xcf\x12\x01\x00\xfa\x12\x01\x00,\x13\x01\x00'
+    b'f\x13\x01\x00\x87\x13\x01\x00\xb2\x13\x01\x00\xd0\x13\x01\x00\xed\x13\x01\x00\x08\x14\x01\x00@\x14\x01\x00r\x14\x01\x00\x93\x14\x01\x00\xb4\x14\x01\x00\xd1\x14\x01\x00\x07\x15\x01\x00@\x15\x01\x00h\x15\x01\x00\x90\x15\x01\x00\xb5\x15\x01\x00\xd8\x15\x01\x00\xfe\x15\x01\x007\x16\x01\x00_\x16\x01\x00\x95\x16\x01\x00\xc3\x16\x01\x00\xf1\x16\x01\x00\x18\x17\x01\x00'
+    b'J\x17\x01\x00|\x17\x01\x00\xad\x17\x01\x00\xd9\x17\x01\x00\x06\x18\x01\x00*\x18\x01\x00N\x18\x01\x00r\x18\x01\x00\xa0\x18\x01\x00\xce\x18\x01\x00\xfc\x18\x01\x001\x19\x01\x00h\x19\x01\x00\xa1\x19\x01\x00\xd1\x19\x01\x00\x0f\x1a\x01\x00O\x1a\x01\x00}\x1a\x01\x00\xa6\x1a\x01\x00\xd7\x1a\x01\x00\x00\x1b\x01\x00)\x1b\x01\x00R\x1b\x01\x00\x88\x1b\x01\x00'
+    b'\xbf\x1b\x01\x00\xe9\x1b\x01\x00\x0c\x1c\x01\x00K\x1c\x01\x00z\x1c\x01\x00\xa1\x1c\x01\x00\xc9\x1c\x01\x00\xe2\x1c\x01\x00\x0c\x1d\x01\x00(\x1d\x01\x00_\x1d\x01\x00\x88\x1d\x01\x00\x98\x1d\x01\x00\xba\x1d\x01\x00\xdc\x1d\x01\x00\r\x1e\x01\x00?\x1e\x01\x00j\x1e\x01\x00\x89\x1e\x01\x00\xad\x1e\x01\x00\xc5\x1e\x01\x00\xe9\x1e\x01\x00\xfd\x1e\x01\x00"\x1f\x01\x00'
+    b'M\x1f\x01\x00~\x1f\x01\x00\xae\x1f\x01\x00\xdd\x1f\x01\x00\x06 \x01\x00\x1d \x01\x00? \x01\x00e \x01\x00\x90 \x01\x00\xae \x01\x00\xd0 \x01\x00\x0e!\x01\x009!\x01\x00s!\x01\x00\x98!\x01\x00\xbe!\x01\x00\xe5!\x01\x00\x1c"\x01\x00U"\x01\x00\x81"\x01\x00\x9c"\x01\x00\xc0"\x01\x00\xec"\x01\x00\x0e#\x01\x00'
+    b"-#\x01\x00j#\x01\x00\x9d#\x01\x00\xcb#\x01\x00\xff#\x01\x004$\x01\x00\\$\x01\x00\x88$\x01\x00\xbd$\x01\x00\xf5$\x01\x00\x17%\x01\x00D%\x01\x00z%\x01\x00\xb1%\x01\x00\xea%\x01\x00\x1c&\x01\x00P&\x01\x00\x91&\x01\x00\xbb&\x01\x00\xf1&\x01\x00\x1f'\x01\x00>'\x01\x00\x7f'\x01\x00\xa9'\x01\x00"
+    b"\xd2'\x01\x00\xfd'\x01\x00\x18(\x01\x00>(\x01\x00\\(\x01\x00\x93(\x01\x00\xb7(\x01\x00\xd4(\x01\x00\x04)\x01\x00G)\x01\x00\x84)\x01\x00\xbf)\x01\x00\xf6)\x01\x000*\x01\x00D*\x01\x00_*\x01\x00\x8f*\x01\x00\xaa*\x01\x00\xde*\x01\x00\x18+\x01\x00A+\x01\x00t+\x01\x00\xab+\x01\x00\xde+\x01\x00"
+    b'\x08,\x01\x002,\x01\x00v,\x01\x00\xa2,\x01\x00\xe0,\x01\x00\x08-\x01\x001-\x01\x00Y-\x01\x00\x84-\x01\x00\xa2-\x01\x00\xba-\x01\x00\xee-\x01\x00 .\x01\x00I.\x01\x00k.\x01\x00\x8a.\x01\x00\xcb.\x01\x00\xe7.\x01\x00\x13/\x01\x00:/\x01\x00`/\x01\x00\x88/\x01\x00\xb3/\x01\x00\xdb/\x01\x00'
+    b'\xf8/\x01\x00"0\x01\x00N0\x01\x00}0\x01\x00\xa80\x01\x00\xd40\x01\x00\x061\x01\x0021\x01\x00f1\x01\x00\x941\x01\x00\xcb1\x01\x00\xfc1\x01\x00/2\x01\x00\\2\x01\x00\x902\x01\x00\xbe2\x01\x00\xfc2\x01\x00+3\x01\x00X3\x01\x00\x8b3\x01\x00\xb13\x01\x00\xe93\x01\x00\x1e4\x01\x00T4\x01\x00'
+    b'\x864\x01\x00\xc14\x01\x00\xf24\x01\x00,5\x01\x00d5\x01\x00\xa25\x01\x00\xd05\x01\x00\x036\x01\x00)6\x01\x00Q6\x01\x00\x996\x01\x00\xd06\x01\x00\x027\x01\x00@7\x01\x00d7\x01\x00\x8b7\x01\x00\xbc7\x01\x00\xee7\x01\x00\x188\x01\x0098\x01\x00k8\x01\x00\x918\x01\x00\xb98\x01\x00\xf18\x01\x00'
+    b'!9\x01\x00\\9\x01\x00~9\x01\x00\x9c9\x01\x00\xbb9\x01\x00\xe99\x01\x00\x13:\x01\x00>:\x01\x00p:\x01\x00\x94:\x01\x00\xc0:\x01\x00\xde:\x01\x00\x03;\x01\x00";\x01\x00K;\x01\x00h;\x01\x00\x9c;\x01\x00\xc3;\x01\x00\x03<\x01\x005<\x01\x00f<\x01\x00\x90<\x01\x00\xb1<\x01\x00\xea<\x01\x00'
+    b'\x11=\x01\x00D=\x01\x00l=\x01\x00\x93=\x01\x00\xc8=\x01\x00\xfe=\x01\x00,>\x01\x00_>\x01\x00\x8d>\x01\x00\xba>\x01\x00\xf1>\x01\x00#?\x01\x00Z?\x01\x00\x89?\x01\x00\xbf?\x01\x00\xee?\x01\x00\x1b@\x01\x00\\@\x01\x00\x98@\x01\x00\xce@\x01\x00\xff@\x01\x00>A\x01\x00`A\x01\x00\x88A\x01\x00'
+    b'\xaaA\x01\x00\xdaA\x01\x00\xfcA\x01\x00"B\x01\x00cB\x01\x00\x96B\x01\x00\xbfB\x01\x00\xd7B\x01\x00\x01C\x01\x008C\x01\x00xC\x01\x00\xafC\x01\x00\xe3C\x01\x00\x08D\x01\x00?D\x01\x00cD\x01\x00\x92D\x01\x00\xb8D\x01\x00\xe0D\x01\x00\tE\x01\x00EE\x01\x00lE\x01\x00\x96E\x01\x00\xb7E\x01\x00'
+    b'\xf4E\x01\x00\x12F\x01\x000F\x01\x00JF\x01\x00eF\x01\x00\x96F\x01\x00\xc4F\x01\x00\xe1F\x01\x00\x00G\x01\x00)G\x01\x00IG\x01\x00iG\x01\x00\x93G\x01\x00\xc4G\x01\x00\xe8G\x01\x00\x0cH\x01\x007H\x01\x00_H\x01\x00|H\x01\x00\x9fH\x01\x00\xbbH\x01\x00\xd4H\x01\x00\xeeH\x01\x00\tI\x01\x00'
+    b',I\x01\x00RI\x01\x00zI\x01\x00\x99I\x01\x00\xbbI\x01\x00\xdcI\x01\x00\x08J\x01\x00%J\x01\x00YJ\x01\x00\x82J\x01\x00\xa7J\x01\x00\xccJ\x01\x00\x0eK\x01\x00&K\x01\x00=K\x01\x00|K\x01\x00\xaeK\x01\x00\xd8K\x01\x00\x05L\x01\x00-L\x01\x00dL\x01\x00\x93L\x01\x00\xbdL\x01\x00\xeaL\x01\x00'
+    b'\x19M\x01\x00MM\x01\x00\x83M\x01\x00\xb7M\x01\x00\xdfM\x01\x00\x07N\x01\x00>N\x01\x00oN\x01\x00\x82N\x01\x00\xb9N\x01\x00\xd1N\x01\x00\xfbN\x01\x00)O\x01\x00LO\x01\x00}O\x01\x00\xa1O\x01\x00\xd4O\x01\x00\xf0O\x01\x006P\x01\x00tP\x01\x00\xa5P\x01\x00\xd2P\x01\x00\nQ\x01\x00"Q\x01\x00'
+    b'\\Q\x01\x00\x9cQ\x01\x00\xd6Q\x01\x00\nR\x01\x00?R\x01\x00oR\x01\x00\x96R\x01\x00\xbdR\x01\x00\xecR\x01\x00\x13S\x01\x00=S\x01\x00qS\x01\x00\x99S\x01\x00\xc9S\x01\x00\xe6S\x01\x00"T\x01\x00MT\x01\x00\x81T\x01\x00\xb0T\x01\x00\xd7T\x01\x00\x00U\x01\x00\x1cU\x01\x003U\x01\x00TU\x01\x00'
+    b'tU\x01\x00\xa4U\x01\x00\xccU\x01\x00\xfcU\x01\x00*V\x01\x00GV\x01\x00oV\x01\x00\x8aV\x01\x00\xbeV\x01\x00\xedV\x01\x00\x16W\x01\x00=W\x01\x00bW\x01\x00\x7fW\x01\x00\xabW\x01\x00\xd9W\x01\x00\tX\x01\x004X\x01\x00^X\x01\x00\x90X\x01\x00\xb7X\x01\x00\xedX\x01\x003Y\x01\x00bY\x01\x00'
+    b'\x92Y\x01\x00\xbdY\x01\x00\xeaY\x01\x00\x13Z\x01\x00HZ\x01\x00iZ\x01\x00\x8aZ\x01\x00\xb3Z\x01\x00\xe4Z\x01\x00\x12[\x01\x00H[\x01\x00Z[\x01\x00l[\x01\x00\x84[\x01\x00\x9c[\x01\x00\xd0[\x01\x00\x0c\\\x01\x00)\\\x01\x00F\\\x01\x00w\\\x01\x00\xa5\\\x01\x00\xdb\\\x01\x00\xf3\\\x01\x00\x0b]\x01\x00'
+    b'>]\x01\x00[]\x01\x00|]\x01\x00\x9a]\x01\x00\xc3]\x01\x00\xe5]\x01\x00\x05^\x01\x000^\x01\x00R^\x01\x00t^\x01\x00\x97^\x01\x00\xbc^\x01\x00\xd4^\x01\x00\xfe^\x01\x00&_\x01\x00C_\x01\x00i_\x01\x00\x80_\x01\x00\xa6_\x01\x00\xcb_\x01\x00\xf8_\x01\x00\x0e`\x01\x00(`\x01\x00B`\x01\x00'
+    b'Y`\x01\x00\x8a`\x01\x00\xb9`\x01\x00\xde`\x01\x00\x0fa\x01\x00Oa\x01\x00wa\x01\x00\xa7a\x01\x00\xc9a\x01\x00\xe6a\x01\x00\nb\x01\x00;b\x01\x00Tb\x01\x00\x92b\x01\x00\xc2b\x01\x00\xeeb\x01\x00\x12c\x01\x00Bc\x01\x00ic\x01\x00\x8bc\x01\x00\xa7c\x01\x00\xd7c\x01\x00\x01d\x01\x00\x14d\x01\x00'
+    b'3d\x01\x00fd\x01\x00\xa0d\x01\x00\xc7d\x01\x00\xf7d\x01\x00%e\x01\x00Se\x01\x00\x8ae\x01\x00\xb6e\x01\x00\xcce\x01\x00\xe6e\x01\x00\x05f\x01\x00(f\x01\x00Bf\x01\x00uf\x01\x00\x83f\x01\x00\xb3f\x01\x00\xe8f\x01\x00\x03g\x01\x006g\x01\x00ag\x01\x00\xa2g\x01\x00\xd5g\x01\x00\xf0g\x01\x00'
+    b'\x15h\x01\x00Fh\x01\x00lh\x01\x00\xa2h\x01\x00\xd4h\x01\x00\xf1h\x01\x00-i\x01\x00Si\x01\x00ki\x01\x00\x91i\x01\x00\xc7i\x01\x00\xdfi\x01\x00\xfci\x01\x00!j\x01\x00bj\x01\x00\x8bj\x01\x00\xb9j\x01\x00\xe7j\x01\x00\x13k\x01\x00(k\x01\x00Fk\x01\x00jk\x01\x00\x93k\x01\x00\xc3k\x01\x00'
+    b'\xefk\x01\x00\x1al\x01\x00=l\x01\x00gl\x01\x00\x93l\x01\x00\xbbl\x01\x00\xdel\x01\x00\nm\x01\x004m\x01\x00]m\x01\x00~m\x01\x00\xa1m\x01\x00\xc8m\x01\x00\xe9m\x01\x00\x1dn\x01\x00Gn\x01\x00{n\x01\x00\xa3n\x01\x00\xb2n\x01\x00\xe7n\x01\x00\x19o\x01\x00Co\x01\x00po\x01\x00\x9bo\x01\x00'
+    b'\xbeo\x01\x00\xe3o\x01\x00\xffo\x01\x00\x1ap\x01\x00Pp\x01\x00xp\x01\x00\xbcp\x01\x00\xd8p\x01\x00\x07q\x01\x00;q\x01\x00nq\x01\x00\x8bq\x01\x00\xceq\x01\x00\xfcq\x01\x000r\x01\x00Or\x01\x00yr\x01\x00\xacr\x01\x00\xdcr\x01\x00\x13s\x01\x00;s\x01\x00Rs\x01\x00\x84s\x01\x00\xb3s\x01\x00'
+    b"\xcbs\x01\x00\xe3s\x01\x00\xf6s\x01\x00\x17t\x01\x00.t\x01\x00?t\x01\x00Ut\x01\x00pt\x01\x00\x90t\x01\x00\xb3t\x01\x00\xd1t\x01\x00\xfft\x01\x00'u\x01\x00Hu\x01\x00lu\x01\x00\x93u\x01\x00\xbfu\x01\x00\xe8u\x01\x00\x0bv\x01\x00-v\x01\x00Nv\x01\x00|v\x01\x00\xa8v\x01\x00\xc7v\x01\x00"
+    b"\x06w\x01\x00\x1dw\x01\x00Fw\x01\x00ow\x01\x00\xa0w\x01\x00\xb3w\x01\x00\xcbw\x01\x00\xe6w\x01\x00\xfcw\x01\x004x\x01\x00jx\x01\x00\xa4x\x01\x00\xe5x\x01\x00 y\x01\x00[y\x01\x00\x93y\x01\x00\xc1y\x01\x00\xf6y\x01\x00'z\x01\x00Xz\x01\x00\x89z\x01\x00\xc6z\x01\x00\xfaz\x01\x000{\x01\x00"
+    b'e{\x01\x00\x8d{\x01\x00\xa8{\x01\x00\xd1{\x01\x00\xfa{\x01\x00#|\x01\x00Y|\x01\x00\x91|\x01\x00\xc8|\x01\x00\x06}\x01\x00:}\x01\x00o}\x01\x00\xa1}\x01\x00\xcb}\x01\x00\xfc}\x01\x000~\x01\x00d~\x01\x00\x98~\x01\x00\xd1~\x01\x00\xfe~\x01\x00(\x7f\x01\x00`\x7f\x01\x00\x91\x7f\x01\x00\xc2\x7f\x01\x00'
+    b'\xe2\x7f\x01\x00\x19\x80\x01\x00C\x80\x01\x00l\x80\x01\x00\xa0\x80\x01\x00\xc8\x80\x01\x00\xda\x80\x01\x00\xf4\x80\x01\x00\x08\x81\x01\x00M\x81\x01\x00\x84\x81\x01\x00\xbd\x81\x01\x00\xe8\x81\x01\x00\x1f\x82\x01\x00M\x82\x01\x00v\x82\x01\x00\xa9\x82\x01\x00\xdb\x82\x01\x00\t\x83\x01\x00%\x83\x01\x00_\x83\x01\x00\x81\x83\x01\x00\xb2\x83\x01\x00\xe8\x83\x01\x00'
+    b"\x18\x84\x01\x00H\x84\x01\x00r\x84\x01\x00\x94\x84\x01\x00\xca\x84\x01\x00\x02\x85\x01\x00'\x85\x01\x00a\x85\x01\x00\x8a\x85\x01\x00\xb0\x85\x01\x00\xd9\x85\x01\x00\r\x86\x01\x00:\x86\x01\x00f\x86\x01\x00\x90\x86\x01\x00\xb6\x86\x01\x00\xe0\x86\x01\x00\x01\x87\x01\x00/\x87\x01\x00W\x87\x01\x00}\x87\x01\x00\x9b\x87\x01\x00\xbf\x87\x01\x00\xdc\x87\x01\x00"
+    b'\xf5\x87\x01\x00\x1a\x88\x01\x00:\x88\x01\x00\\\x88\x01\x00\x80\x88\x01\x00\x9a\x88\x01\x00\xb0\x88\x01\x00\xdb\x88\x01\x00\xfc\x88\x01\x00%\x89\x01\x00:\x89\x01\x00`\x89\x01\x00\x86\x89\x01\x00\xae\x89\x01\x00\xd3\x89\x01\x00\xea\x89\x01\x00\x02\x8a\x01\x00\x1b\x8a\x01\x002\x8a\x01\x00W\x8a\x01\x00\x8f\x8a\x01\x00\xc5\x8a\x01\x00\xe3\x8a\x01\x00\x0e\x8b\x01\x00'
+    b'8\x8b\x01\x00]\x8b\x01\x00\x94\x8b\x01\x00\xbd\x8b\x01\x00\xe9\x8b\x01\x00\x15\x8c\x01\x00@\x8c\x01\x00k\x8c\x01\x00\x98\x8c\x01\x00\xce\x8c\x01\x00\xf2\x8c\x01\x00\x17\x8d\x01\x00G\x8d\x01\x00h\x8d\x01\x00\x90\x8d\x01\x00\xc8\x8d\x01\x00\xe6\x8d\x01\x00\x1c\x8e\x01\x00E\x8e\x01\x00|\x8e\x01\x00\xbb\x8e\x01\x00\xc9\x8e\x01\x00\xe9\x8e\x01\x00\x1a\x8f\x01\x00'
+    b'M\x8f\x01\x00\x8f\x8f\x01\x00\xab\x8f\x01\x00\xca\x8f\x01\x00\xf9\x8f\x01\x00)\x90\x01\x00W\x90\x01\x00{\x90\x01\x00\xad\x90\x01\x00\xe9\x90\x01\x00\x13\x91\x01\x006\x91\x01\x00c\x91\x01\x00\x88\x91\x01\x00\xad\x91\x01\x00\xdf\x91\x01\x00\x10\x92\x01\x000\x92\x01\x00O\x92\x01\x00p\x92\x01\x00\x91\x92\x01\x00\xbe\x92\x01\x00\xe3\x92\x01\x00\x16\x93\x01\x00'
+    b'1\x93\x01\x00[\x93\x01\x00}\x93\x01\x00\x96\x93\x01\x00\xc9\x93\x01\x00\xef\x93\x01\x00\x0b\x94\x01\x00!\x94\x01\x00@\x94\x01\x00p\x94\x01\x00\x95\x94\x01\x00\xb1\x94\x01\x00\xdf\x94\x01\x00\x0b\x95\x01\x00*\x95\x01\x00X\x95\x01\x00\x88\x95\x01\x00\x9b\x95\x01\x00\xac\x95\x01\x00\xc8\x95\x01\x00\xed\x95\x01\x00!\x96\x01\x00@\x96\x01\x00j\x96\x01\x00'
+    b'\xae\x96\x01\x00\xdb\x96\x01\x00\xf9\x96\x01\x00\x1f\x97\x01\x00N\x97\x01\x00j\x97\x01\x00\x8d\x97\x01\x00\xb8\x97\x01\x00\xf1\x97\x01\x00\x1f\x98\x01\x00F\x98\x01\x00s\x98\x01\x00\xa0\x98\x01\x00\xd8\x98\x01\x00\xf0\x98\x01\x00\x05\x99\x01\x00\x1d\x99\x01\x00/\x99\x01\x00X\x99\x01\x00\x81\x99\x01\x00\xb4\x99\x01\x00\xe5\x99\x01\x002\x9a\x01\x00a\x9a\x01\x00'
+    b'\x97\x9a\x01\x00\xb4\x9a\x01\x00\xce\x9a\x01\x00\xf9\x9a\x01\x00$\x9b\x01\x00O\x9b\x01\x00l\x9b\x01\x00\x97\x9b\x01\x00\xd2\x9b\x01\x00\xf8\x9b\x01\x00\x14\x9c\x01\x00*\x9c\x01\x00N\x9c\x01\x00h\x9c\x01\x00\x85\x9c\x01\x00\xb3\x9c\x01\x00\xe1\x9c\x01\x00\xf8\x9c\x01\x00\x03\x9d\x01\x00*\x9d\x01\x00_\x9d\x01\x00\x7f\x9d\x01\x00\x98\x9d\x01\x00\xbc\x9d\x01\x00'
+    b'\xdc\x9d\x01\x00\x05\x9e\x01\x00\x1b\x9e\x01\x00_\x9e\x01\x00u\x9e\x01\x00\x87\x9e\x01\x00\x9b\x9e\x01\x00\xc2\x9e\x01\x00\xd8\x9e\x01\x00\xfe\x9e\x01\x00\x16\x9f\x01\x00.\x9f\x01\x00Z\x9f\x01\x00s\x9f\x01\x00\xa0\x9f\x01\x00\xcc\x9f\x01\x00\xf7\x9f\x01\x00!\xa0\x01\x00\\\xa0\x01\x00\x88\xa0\x01\x00\xad\xa0\x01\x00\xe2\xa0\x01\x00\x1c\xa1\x01\x00P\xa1\x01\x00'
+    b'm\xa1\x01\x00\xa9\xa1\x01\x00\xd9\xa1\x01\x00\xf8\xa1\x01\x002\xa2\x01\x00Z\xa2\x01\x00y\xa2\x01\x00\x96\xa2\x01\x00\xba\xa2\x01\x00\xd8\xa2\x01\x00\xf1\xa2\x01\x00$\xa3\x01\x00N\xa3\x01\x00v\xa3\x01\x00\x90\xa3\x01\x00\xaa\xa3\x01\x00\xf0\xa3\x01\x007\xa4\x01\x00W\xa4\x01\x00\x81\xa4\x01\x00\xae\xa4\x01\x00\xcf\xa4\x01\x00\t\xa5\x01\x00%\xa5\x01\x00'
+    b'9\xa5\x01\x00H\xa5\x01\x00t\xa5\x01\x00\x92\xa5\x01\x00\xbd\xa5\x01\x00\xea\xa5\x01\x00$\xa6\x01\x00Q\xa6\x01\x00\x85\xa6\x01\x00\xbb\xa6\x01\x00\xe9\xa6\x01\x00\x10\xa7\x01\x00<\xa7\x01\x00P\xa7\x01\x00n\xa7\x01\x00\xb2\xa7\x01\x00\xe1\xa7\x01\x00\x15\xa8\x01\x000\xa8\x01\x00[\xa8\x01\x00\x88\xa8\x01\x00\xbd\xa8\x01\x00\xe6\xa8\x01\x00\x06\xa9\x01\x00'
+    b'.\xa9\x01\x00V\xa9\x01\x00\x84\xa9\x01\x00\xa2\xa9\x01\x00\xce\xa9\x01\x00\xed\xa9\x01\x00\x1e\xaa\x01\x006\xaa\x01\x00f\xaa\x01\x00\x8c\xaa\x01\x00\xb9\xaa\x01\x00\xe9\xaa\x01\x00\x0b\xab\x01\x007\xab\x01\x00a\xab\x01\x00\x81\xab\x01\x00\xaa\xab\x01\x00\xd1\xab\x01\x00\xf6\xab\x01\x00\x19\xac\x01\x00B\xac\x01\x00V\xac\x01\x00|\xac\x01\x00\xa3\xac\x01\x00'
+    b"\xbe\xac\x01\x00\xde\xac\x01\x00\x02\xad\x01\x00'\xad\x01\x00G\xad\x01\x00e\xad\x01\x00w\xad\x01\x00\xb4\xad\x01\x00\xdb\xad\x01\x00\x08\xae\x01\x00/\xae\x01\x00\\\xae\x01\x00\x89\xae\x01\x00\xc6\xae\x01\x00\xde\xae\x01\x00\x0f\xaf\x01\x007\xaf\x01\x00P\xaf\x01\x00|\xaf\x01\x00\xad\xaf\x01\x00\xdb\xaf\x01\x00\x02\xb0\x01\x002\xb0\x01\x00F\xb0\x01\x00"
+    b'r\xb0\x01\x00\x8b\xb0\x01\x00\xb1\xb0\x01\x00\xc7\xb0\x01\x00\xea\xb0\x01\x00\x0b\xb1\x01\x007\xb1\x01\x00f\xb1\x01\x00\x89\xb1\x01\x00\xa0\xb1\x01\x00\xce\xb1\x01\x00\xf4\xb1\x01\x00#\xb2\x01\x00P\xb2\x01\x00l\xb2\x01\x00\x96\xb2\x01\x00\xc1\xb2\x01\x00\xf2\xb2\x01\x00\x18\xb3\x01\x00C\xb3\x01\x00p\xb3\x01\x00\xa1\xb3\x01\x00\xc8\xb3\x01\x00\xf0\xb3\x01\x00'
+    b')\xb4\x01\x00Y\xb4\x01\x00\x82\xb4\x01\x00\xa1\xb4\x01\x00\xbb\xb4\x01\x00\xe5\xb4\x01\x00\x1c\xb5\x01\x00@\xb5\x01\x00t\xb5\x01\x00\xa6\xb5\x01\x00\xc9\xb5\x01\x00\xf0\xb5\x01\x00\n\xb6\x01\x002\xb6\x01\x00J\xb6\x01\x00k\xb6\x01\x00\xaa\xb6\x01\x00\xd1\xb6\x01\x00\xf7\xb6\x01\x00\x1c\xb7\x01\x00G\xb7\x01\x00a\xb7\x01\x00\x83\xb7\x01\x00\xa9\xb7\x01\x00'
+    b'\xd4\xb7\x01\x00\xee\xb7\x01\x00\x12\xb8\x01\x002\xb8\x01\x00b\xb8\x01\x00\x93\xb8\x01\x00\xbb\xb8\x01\x00\xe3\xb8\x01\x00\xf7\xb8\x01\x00\n\xb9\x01\x005\xb9\x01\x00F\xb9\x01\x00m\xb9\x01\x00\xa9\xb9\x01\x00\xda\xb9\x01\x00\x0b\xba\x01\x00<\xba\x01\x00m\xba\x01\x00\x9e\xba\x01\x00\xe4\xba\x01\x00\x1c\xbb\x01\x00O\xbb\x01\x00\x8f\xbb\x01\x00\xcf\xbb\x01\x00'
+    b'\xef\xbb\x01\x00\r\xbc\x01\x00 \xbc\x01\x00L\xbc\x01\x00\x88\xbc\x01\x00\xa6\xbc\x01\x00\xd1\xbc\x01\x00\xe7\xbc\x01\x00\xfd\xbc\x01\x00#\xbd\x01\x00H\xbd\x01\x00p\xbd\x01\x00\x90\xbd\x01\x00\xb8\xbd\x01\x00\xd2\xbd\x01\x00\xf0\xbd\x01\x00\x19\xbe\x01\x00<\xbe\x01\x00R\xbe\x01\x00m\xbe\x01\x00\x8c\xbe\x01\x00\xa5\xbe\x01\x00\xd4\xbe\x01\x00\xe8\xbe\x01\x00'
+    b'\x00\xbf\x01\x00\x1c\xbf\x01\x00B\xbf\x01\x00u\xbf\x01\x00\x9d\xbf\x01\x00\xb8\xbf\x01\x00\xd2\xbf\x01\x00\xfe\xbf\x01\x00 \xc0\x01\x00B\xc0\x01\x00\\\xc0\x01\x00v\xc0\x01\x00\xa5\xc0\x01\x00\xd1\xc0\x01\x00\xf9\xc0\x01\x00(\xc1\x01\x00S\xc1\x01\x00~\xc1\x01\x00\xae\xc1\x01\x00\xdb\xc1\x01\x00\xf7\xc1\x01\x00\x16\xc2\x01\x003\xc2\x01\x00e\xc2\x01\x00'
+    b'\x9f\xc2\x01\x00\xb1\xc2\x01\x00\xc3\xc2\x01\x00\xe0\xc2\x01\x00\x06\xc3\x01\x00,\xc3\x01\x00D\xc3\x01\x00\\\xc3\x01\x00\x87\xc3\x01\x00\xb9\xc3\x01\x00\xdb\xc3\x01\x00\x01\xc4\x01\x001\xc4\x01\x00a\xc4\x01\x00\x94\xc4\x01\x00\xb9\xc4\x01\x00\xe6\xc4\x01\x00\x1a\xc5\x01\x00C\xc5\x01\x00o\xc5\x01\x00\xaa\xc5\x01\x00\xd8\xc5\x01\x00\xff\xc5\x01\x00&\xc6\x01\x00'
+    b"4\xc6\x01\x00Z\xc6\x01\x00v\xc6\x01\x00\x84\xc6\x01\x00\xaa\xc6\x01\x00\xc6\xc6\x01\x00\xf1\xc6\x01\x00!\xc7\x01\x00M\xc7\x01\x00s\xc7\x01\x00\xa0\xc7\x01\x00\xcd\xc7\x01\x00\xfa\xc7\x01\x00\x1d\xc8\x01\x00R\xc8\x01\x00\x7f\xc8\x01\x00\xb3\xc8\x01\x00\xf0\xc8\x01\x00'\xc9\x01\x00j\xc9\x01\x00\x91\xc9\x01\x00\xc3\xc9\x01\x00\xfa\xc9\x01\x002\xca\x01\x00"
+    b'S\xca\x01\x00\x97\xca\x01\x00\xcd\xca\x01\x00\xfd\xca\x01\x00\x17\xcb\x01\x00>\xcb\x01\x00c\xcb\x01\x00\x94\xcb\x01\x00\xb2\xcb\x01\x00\xc3\xcb\x01\x00\xd7\xcb\x01\x00\x0c\xcc\x01\x009\xcc\x01\x00`\xcc\x01\x00\x86\xcc\x01\x00\x9d\xcc\x01\x00\xc5\xcc\x01\x00\xf7\xcc\x01\x003\xcd\x01\x00o\xcd\x01\x00\xab\xcd\x01\x00\xc3\xcd\x01\x00\xdb\xcd\x01\x00\x04\xce\x01\x00'
+    b'$\xce\x01\x00P\xce\x01\x00\x91\xce\x01\x00\xc9\xce\x01\x00\xee\xce\x01\x00)\xcf\x01\x00@\xcf\x01\x00q\xcf\x01\x00\x90\xcf\x01\x00\xb0\xcf\x01\x00\xdc\xcf\x01\x00\xff\xcf\x01\x002\xd0\x01\x00c\xd0\x01\x00\x93\xd0\x01\x00\xaa\xd0\x01\x00\xd3\xd0\x01\x00\xe6\xd0\x01\x00\n\xd1\x01\x00 \xd1\x01\x009\xd1\x01\x00r\xd1\x01\x00\x98\xd1\x01\x00\xb8\xd1\x01\x00'
+    b"\xe2\xd1\x01\x00\x06\xd2\x01\x002\xd2\x01\x00\\\xd2\x01\x00\x95\xd2\x01\x00\xb9\xd2\x01\x00\xe7\xd2\x01\x00\x19\xd3\x01\x006\xd3\x01\x00^\xd3\x01\x00p\xd3\x01\x00\xa5\xd3\x01\x00\xd7\xd3\x01\x00\x06\xd4\x01\x00%\xd4\x01\x00K\xd4\x01\x00\x82\xd4\x01\x00\x9d\xd4\x01\x00\xcf\xd4\x01\x00\xf2\xd4\x01\x00'\xd5\x01\x00O\xd5\x01\x00w\xd5\x01\x00\xa7\xd5\x01\x00"
+    b'\xd6\xd5\x01\x00\x08\xd6\x01\x002\xd6\x01\x00f\xd6\x01\x00\xa0\xd6\x01\x00\xb2\xd6\x01\x00\xdc\xd6\x01\x00\n\xd7\x01\x002\xd7\x01\x00N\xd7\x01\x00h\xd7\x01\x00\x82\xd7\x01\x00\xb3\xd7\x01\x00\xdc\xd7\x01\x00\x13\xd8\x01\x00<\xd8\x01\x00`\xd8\x01\x00\x8a\xd8\x01\x00\xba\xd8\x01\x00\xd9\xd8\x01\x00\x04\xd9\x01\x00\x1a\xd9\x01\x00>\xd9\x01\x00p\xd9\x01\x00'
+    b'\x81\xd9\x01\x00\x99\xd9\x01\x00\xb2\xd9\x01\x00\xeb\xd9\x01\x00\r\xda\x01\x009\xda\x01\x00R\xda\x01\x00v\xda\x01\x00\xaa\xda\x01\x00\xd5\xda\x01\x00\x00\xdb\x01\x00+\xdb\x01\x00T\xdb\x01\x00\x88\xdb\x01\x00\xb3\xdb\x01\x00\xde\xdb\x01\x00\t\xdc\x01\x002\xdc\x01\x00b\xdc\x01\x00\x89\xdc\x01\x00\xb0\xdc\x01\x00\xd0\xdc\x01\x00\xee\xdc\x01\x00\x1a\xdd\x01\x00'
+    b'A\xdd\x01\x00]\xdd\x01\x00\x84\xdd\x01\x00\xa3\xdd\x01\x00\xd2\xdd\x01\x00\xfb\xdd\x01\x00$\xde\x01\x00I\xde\x01\x00n\xde\x01\x00\x91\xde\x01\x00\xb5\xde\x01\x00\xe9\xde\x01\x00\x11\xdf\x01\x00;\xdf\x01\x00d\xdf\x01\x00\x91\xdf\x01\x00\xb9\xdf\x01\x00\xe8\xdf\x01\x00\x1f\xe0\x01\x00L\xe0\x01\x00}\xe0\x01\x00\xa2\xe0\x01\x00\xb9\xe0\x01\x00\xd8\xe0\x01\x00'
+    b"\xff\xe0\x01\x00\x12\xe1\x01\x003\xe1\x01\x00o\xe1\x01\x00\xa1\xe1\x01\x00\xd3\xe1\x01\x00\x05\xe2\x01\x002\xe2\x01\x00N\xe2\x01\x00v\xe2\x01\x00\x9e\xe2\x01\x00\xba\xe2\x01\x00\xd7\xe2\x01\x00\xfb\xe2\x01\x00\x0c\xe3\x01\x00'\xe3\x01\x00E\xe3\x01\x00e\xe3\x01\x00\x90\xe3\x01\x00\xc5\xe3\x01\x00\xf4\xe3\x01\x00\x19\xe4\x01\x002\xe4\x01\x00a\xe4\x01\x00"
+    b'\x8e\xe4\x01\x00\xa0\xe4\x01\x00\xb3\xe4\x01\x00\xcc\xe4\x01\x00\xe3\xe4\x01\x00\x06\xe5\x01\x00/\xe5\x01\x00R\xe5\x01\x00g\xe5\x01\x00\x82\xe5\x01\x00\xa7\xe5\x01\x00\xbf\xe5\x01\x00\xdf\xe5\x01\x00\x0f\xe6\x01\x009\xe6\x01\x00c\xe6\x01\x00\x8e\xe6\x01\x00\xb3\xe6\x01\x00\xcb\xe6\x01\x00\xeb\xe6\x01\x00\x0e\xe7\x01\x00)\xe7\x01\x00G\xe7\x01\x00\x81\xe7\x01\x00'
+    b'\xae\xe7\x01\x00\xd3\xe7\x01\x00\xfe\xe7\x01\x00)\xe8\x01\x00S\xe8\x01\x00y\xe8\x01\x00\xa6\xe8\x01\x00\xcf\xe8\x01\x00\xee\xe8\x01\x00\x1f\xe9\x01\x00@\xe9\x01\x00]\xe9\x01\x00\x82\xe9\x01\x00\xad\xe9\x01\x00\xe0\xe9\x01\x00\xf7\xe9\x01\x00&\xea\x01\x00A\xea\x01\x00a\xea\x01\x00v\xea\x01\x00\xa0\xea\x01\x00\xc5\xea\x01\x00\xe3\xea\x01\x00\x0c\xeb\x01\x00'
+    b'-\xeb\x01\x00N\xeb\x01\x00`\xeb\x01\x00{\xeb\x01\x00\x9b\xeb\x01\x00\xc4\xeb\x01\x00\xd8\xeb\x01\x00\xff\xeb\x01\x00\x19\xec\x01\x00L\xec\x01\x00[\xec\x01\x00l\xec\x01\x00\xa8\xec\x01\x00\xc5\xec\x01\x00\xe9\xec\x01\x00\xfa\xec\x01\x00 \xed\x01\x009\xed\x01\x00]\xed\x01\x00q\xed\x01\x00\x9d\xed\x01\x00\xc4\xed\x01\x00\xe5\xed\x01\x00\xfe\xed\x01\x00'
+    b')\xee\x01\x00N\xee\x01\x00|\xee\x01\x00\x9f\xee\x01\x00\xca\xee\x01\x00\xe9\xee\x01\x00\r\xef\x01\x001\xef\x01\x00^\xef\x01\x00\x86\xef\x01\x00\xb7\xef\x01\x00\xd6\xef\x01\x00\xfe\xef\x01\x00%\xf0\x01\x00T\xf0\x01\x00}\xf0\x01\x00\x9d\xf0\x01\x00\xc6\xf0\x01\x00\xe5\xf0\x01\x00\r\xf1\x01\x00/\xf1\x01\x00Y\xf1\x01\x00\x84\xf1\x01\x00\xba\xf1\x01\x00'
+    b'\xe8\xf1\x01\x00\x08\xf2\x01\x001\xf2\x01\x00O\xf2\x01\x00i\xf2\x01\x00}\xf2\x01\x00\xa5\xf2\x01\x00\xdd\xf2\x01\x00\x1b\xf3\x01\x00M\xf3\x01\x00m\xf3\x01\x00\x8c\xf3\x01\x00\xb4\xf3\x01\x00\xd9\xf3\x01\x00\x11\xf4\x01\x00&\xf4\x01\x00<\xf4\x01\x00L\xf4\x01\x00n\xf4\x01\x00\x8b\xf4\x01\x00\xb3\xf4\x01\x00\xf3\xf4\x01\x00\x17\xf5\x01\x00=\xf5\x01\x00'
+    b'f\xf5\x01\x00\x80\xf5\x01\x00\xb7\xf5\x01\x00\xdc\xf5\x01\x00\x0c\xf6\x01\x004\xf6\x01\x00[\xf6\x01\x00\x85\xf6\x01\x00\xaf\xf6\x01\x00\xc3\xf6\x01\x00\x06\xf7\x01\x009\xf7\x01\x00h\xf7\x01\x00\x97\xf7\x01\x00\xda\xf7\x01\x00\x08\xf8\x01\x004\xf8\x01\x00T\xf8\x01\x00x\xf8\x01\x00\xa8\xf8\x01\x00\xc3\xf8\x01\x00\xe4\xf8\x01\x00\x13\xf9\x01\x00@\xf9\x01\x00'
+    b'l\xf9\x01\x00\x95\xf9\x01\x00\xbb\xf9\x01\x00\xcd\xf9\x01\x00\xe0\xf9\x01\x00\x15\xfa\x01\x00E\xfa\x01\x00`\xfa\x01\x00\x8c\xfa\x01\x00\xb3\xfa\x01\x00\xe9\xfa\x01\x00\x01\xfb\x01\x00#\xfb\x01\x00Q\xfb\x01\x00s\xfb\x01\x00\x80\xfb\x01\x00\x8c\xfb\x01\x00\x94\xfb\x01\x00\xa2\xfb\x01\x00\xb5\xfb\x01\x00\xc4\xfb\x01\x00\xd7\xfb\x01\x00\xef\xfb\x01\x00\xfc\xfb\x01\x00'
+    b'\x1b\xfc\x01\x007\xfc\x01\x00F\xfc\x01\x00p\xfc\x01\x00\x91\xfc\x01\x00\xad\xfc\x01\x00\xda\xfc\x01\x00\x03\xfd\x01\x00*\xfd\x01\x00N\xfd\x01\x00w\xfd\x01\x00\x9f\xfd\x01\x00\xca\xfd\x01\x00\xd9\xfd\x01\x00\xf6\xfd\x01\x00\x13\xfe\x01\x00;\xfe\x01\x00e\xfe\x01\x00s\xfe\x01\x00\xa4\xfe\x01\x00\xbd\xfe\x01\x00\xdf\xfe\x01\x00\x06\xff\x01\x00)\xff\x01\x00'
+    b'Q\xff\x01\x00w\xff\x01\x00\x8b\xff\x01\x00\x9f\xff\x01\x00\xb3\xff\x01\x00\xc7\xff\x01\x00\xdb\xff\x01\x00\x03\x00\x02\x00+\x00\x02\x00S\x00\x02\x00{\x00\x02\x00\xa3\x00\x02\x00\xc4\x00\x02\x00\xf5\x00\x02\x00\x17\x01\x02\x00=\x01\x02\x00`\x01\x02\x00y\x01\x02\x00\x9e\x01\x02\x00\xb8\x01\x02\x00\xdc\x01\x02\x00\xfd\x01\x02\x00!\x02\x02\x00G\x02\x02\x00'
+    b't\x02\x02\x00\x94\x02\x02\x00\xb3\x02\x02\x00\xd6\x02\x02\x00\xe7\x02\x02\x00\x07\x03\x02\x00=\x03\x02\x00e\x03\x02\x00\x8d\x03\x02\x00\xb3\x03\x02\x00\xcf\x03\x02\x00\x00\x04\x02\x00\x1f\x04\x02\x00H\x04\x02\x00q\x04\x02\x00\xa6\x04\x02\x00\xdf\x04\x02\x00\xf3\x04\x02\x00\x18\x05\x02\x004\x05\x02\x00Z\x05\x02\x00\x80\x05\x02\x00\x90\x05\x02\x00\xb2\x05\x02\x00'
+    b'\xe9\x05\x02\x00\x12\x06\x02\x005\x06\x02\x00^\x06\x02\x00\x85\x06\x02\x00\xb6\x06\x02\x00\xcc\x06\x02\x00\xf5\x06\x02\x00\x19\x07\x02\x00E\x07\x02\x00r\x07\x02\x00\x9a\x07\x02\x00\xc6\x07\x02\x00\xf6\x07\x02\x00#\x08\x02\x00D\x08\x02\x00k\x08\x02\x00\x97\x08\x02\x00\xbd\x08\x02\x00\xe2\x08\x02\x00\x10\t\x02\x00@\t\x02\x00\x7f\t\x02\x00\xa9\t\x02\x00'
+    b'\xde\t\x02\x00\xff\t\x02\x00\x1d\n\x02\x00N\n\x02\x00k\n\x02\x00\x9a\n\x02\x00\xb6\n\x02\x00\xe3\n\x02\x00\x15\x0b\x02\x00:\x0b\x02\x00K\x0b\x02\x00m\x0b\x02\x00\x93\x0b\x02\x00\xb7\x0b\x02\x00\xdf\x0b\x02\x00\x07\x0c\x02\x00.\x0c\x02\x00\\\x0c\x02\x00\x84\x0c\x02\x00\xad\x0c\x02\x00\xe0\x0c\x02\x00\xf0\x0c\x02\x00&\r\x02\x00W\r\x02\x00'
+    b"\x8f\r\x02\x00\xcc\r\x02\x00\xfd\r\x02\x001\x0e\x02\x00[\x0e\x02\x00\x88\x0e\x02\x00\x9c\x0e\x02\x00\xbe\x0e\x02\x00\xd9\x0e\x02\x00\xfe\x0e\x02\x00\x1c\x0f\x02\x00E\x0f\x02\x00\\\x0f\x02\x00\x95\x0f\x02\x00\xa8\x0f\x02\x00\xbe\x0f\x02\x00\xe5\x0f\x02\x00\xff\x0f\x02\x00\x11\x10\x02\x00'\x10\x02\x00M\x10\x02\x00p\x10\x02\x00\x9e\x10\x02\x00\xd5\x10\x02\x00"
+    b'\xe9\x10\x02\x00\x1f\x11\x02\x003\x11\x02\x00[\x11\x02\x00\x8c\x11\x02\x00\xb8\x11\x02\x00\xce\x11\x02\x00\xf8\x11\x02\x00\x0b\x12\x02\x00-\x12\x02\x00S\x12\x02\x00v\x12\x02\x00\xa5\x12\x02\x00\xc7\x12\x02\x00\xe1\x12\x02\x00\n\x13\x02\x00G\x13\x02\x00p\x13\x02\x00\xa3\x13\x02\x00\xe0\x13\x02\x00\x16\x14\x02\x00G\x14\x02\x00v\x14\x02\x00\x99\x14\x02\x00'
+    b'\xc5\x14\x02\x00\xe5\x14\x02\x00 \x15\x02\x00-\x15\x02\x00V\x15\x02\x00}\x15\x02\x00\xb1\x15\x02\x00\xe3\x15\x02\x00"\x16\x02\x00T\x16\x02\x00\x81\x16\x02\x00\x9c\x16\x02\x00\xbe\x16\x02\x00\xea\x16\x02\x00\x07\x17\x02\x00C\x17\x02\x00f\x17\x02\x00\x8a\x17\x02\x00\xb6\x17\x02\x00\xd5\x17\x02\x00\x02\x18\x02\x001\x18\x02\x00H\x18\x02\x00e\x18\x02\x00'
+    b'\x9e\x18\x02\x00\xd0\x18\x02\x00\xf5\x18\x02\x00\x18\x19\x02\x00>\x19\x02\x00f\x19\x02\x00\x92\x19\x02\x00\xc0\x19\x02\x00\xd9\x19\x02\x00\r\x1a\x02\x006\x1a\x02\x00j\x1a\x02\x00\x93\x1a\x02\x00\xc3\x1a\x02\x00\xe8\x1a\x02\x00\x13\x1b\x02\x00+\x1b\x02\x00Z\x1b\x02\x00\x8b\x1b\x02\x00\xbe\x1b\x02\x00\xea\x1b\x02\x00\x15\x1c\x02\x00=\x1c\x02\x00l\x1c\x02\x00'
+    b'\x90\x1c\x02\x00\xb5\x1c\x02\x00\xda\x1c\x02\x00\xfe\x1c\x02\x00+\x1d\x02\x00_\x1d\x02\x00\x84\x1d\x02\x00\xa9\x1d\x02\x00\xcb\x1d\x02\x00\xea\x1d\x02\x00\x0b\x1e\x02\x00C\x1e\x02\x00a\x1e\x02\x00\x81\x1e\x02\x00\xad\x1e\x02\x00\xe9\x1e\x02\x00\x0f\x1f\x02\x00:\x1f\x02\x00]\x1f\x02\x00\x8a\x1f\x02\x00\xb4\x1f\x02\x00\xd7\x1f\x02\x00\xfa\x1f\x02\x00! \x02\x00'
+    b'O \x02\x00\x84 \x02\x00\xce \x02\x00\xf0 \x02\x00 !\x02\x00E!\x02\x00v!\x02\x00\x8e!\x02\x00\xb6!\x02\x00\xdd!\x02\x00\xfc!\x02\x00 "\x02\x00I"\x02\x00\x8e"\x02\x00\xc6"\x02\x00\xec"\x02\x00!#\x02\x00Y#\x02\x00\x91#\x02\x00\xbe#\x02\x00\xf6#\x02\x00#$\x02\x00<$\x02\x00_$\x02\x00'
+    b"\x96$\x02\x00\xb7$\x02\x00\xdd$\x02\x00\xf0$\x02\x00 %\x02\x00:%\x02\x00d%\x02\x00\x83%\x02\x00\x9b%\x02\x00\xb7%\x02\x00\xd7%\x02\x00\xee%\x02\x00\x15&\x02\x002&\x02\x00a&\x02\x00\x8b&\x02\x00\x9b&\x02\x00\xba&\x02\x00\xdc&\x02\x00\xfd&\x02\x00\r'\x02\x000'\x02\x00\\'\x02\x00\x82'\x02\x00"
+    b'\xb6\'\x02\x00\xd0\'\x02\x00\x00(\x02\x008(\x02\x00j(\x02\x00\x83(\x02\x00\xb9(\x02\x00\xff(\x02\x00()\x02\x00H)\x02\x00~)\x02\x00\xaa)\x02\x00\xda)\x02\x00\xee)\x02\x00\x12*\x02\x00@*\x02\x00[*\x02\x00~*\x02\x00\xb1*\x02\x00\xdd*\x02\x00\x08+\x02\x00"+\x02\x00E+\x02\x00^+\x02\x00'
+    b'\xa1+\x02\x00\xcd+\x02\x00\x03,\x02\x00,,\x02\x00g,\x02\x00\x96,\x02\x00\xc9,\x02\x00\xf2,\x02\x00\x1a-\x02\x00H-\x02\x00x-\x02\x00\x9f-\x02\x00\xcb-\x02\x00\x04.\x02\x000.\x02\x00M.\x02\x00v.\x02\x00\xa5.\x02\x00\xcc.\x02\x00\xf9.\x02\x00\x1b/\x02\x00H/\x02\x00Y/\x02\x00x/\x02\x00'
+    b'\x92/\x02\x00\xc1/\x02\x00\xf5/\x02\x00\x170\x02\x00<0\x02\x00k0\x02\x00\x9a0\x02\x00\xca0\x02\x00\xfa0\x02\x00*1\x02\x00K1\x02\x00\x931\x02\x00\xc51\x02\x00\x012\x02\x00/2\x02\x00b2\x02\x00\x932\x02\x00\xbe2\x02\x00\xea2\x02\x00\t3\x02\x00!3\x02\x0093\x02\x00q3\x02\x00\xaa3\x02\x00'
+    b'\xd43\x02\x00\xf93\x02\x00 4\x02\x00G4\x02\x00^4\x02\x00\x8a4\x02\x00\xad4\x02\x00\xe84\x02\x00\x0c5\x02\x0085\x02\x00o5\x02\x00\x9a5\x02\x00\xaa5\x02\x00\xc55\x02\x00\xf35\x02\x00\x126\x02\x00B6\x02\x00X6\x02\x00n6\x02\x00\x846\x02\x00\xae6\x02\x00\xe66\x02\x00\x047\x02\x0027\x02\x00'
+    b'p7\x02\x00\xa87\x02\x00\xcb7\x02\x00\xf27\x02\x00\x1d8\x02\x00@8\x02\x00S8\x02\x00j8\x02\x00\x938\x02\x00\xbb8\x02\x00\xf78\x02\x00\x1c9\x02\x00Q9\x02\x00\x899\x02\x00\xa49\x02\x00\xb99\x02\x00\xdc9\x02\x00\x04:\x02\x00-:\x02\x00n:\x02\x00\xa5:\x02\x00\xcf:\x02\x00\xeb:\x02\x00\x13;\x02\x00'
+    b'G;\x02\x00q;\x02\x00\x94;\x02\x00\xd0;\x02\x00\xf4;\x02\x00!<\x02\x00Z<\x02\x00\x89<\x02\x00\xb4<\x02\x00\xe3<\x02\x00\xed<\x02\x00\x18=\x02\x008=\x02\x00]=\x02\x00\x82=\x02\x00\xb6=\x02\x00\xec=\x02\x00#>\x02\x00Y>\x02\x00\x93>\x02\x00\xc7>\x02\x00\xe2>\x02\x00\xfd>\x02\x00\x18?\x02\x00'
+    b'S?\x02\x00\x8d?\x02\x00\xab?\x02\x00\xe5?\x02\x00\x16@\x02\x00@@\x02\x00`@\x02\x00\x90@\x02\x00\xb4@\x02\x00\xcd@\x02\x00\xfa@\x02\x00,A\x02\x00OA\x02\x00|A\x02\x00\xa1A\x02\x00\xb2A\x02\x00\xcdA\x02\x00\xebA\x02\x00\x14B\x02\x00OB\x02\x00\x84B\x02\x00\xb3B\x02\x00\xcbB\x02\x00\xfcB\x02\x00'
+    b'.C\x02\x00FC\x02\x00nC\x02\x00\x9fC\x02\x00\xc5C\x02\x00\xeeC\x02\x00!D\x02\x004D\x02\x00kD\x02\x00\x8fD\x02\x00\xc5D\x02\x00\xf0D\x02\x00\xf8D\x02\x00"E\x02\x00ZE\x02\x00\x89E\x02\x00\xaeE\x02\x00\xccE\x02\x00\xf1E\x02\x00)F\x02\x00`F\x02\x00\x97F\x02\x00\xcfF\x02\x00\xfdF\x02\x00'
+    b'4G\x02\x00MG\x02\x00uG\x02\x00\xa2G\x02\x00\xcdG\x02\x00\xdbG\x02\x00\xffG\x02\x008H\x02\x00ZH\x02\x00\x87H\x02\x00\x96H\x02\x00\xc1H\x02\x00\xd9H\x02\x00\xefH\x02\x00\x12I\x02\x00+I\x02\x00DI\x02\x00]I\x02\x00vI\x02\x00\x88I\x02\x00\xa5I\x02\x00\xc3I\x02\x00\xe9I\x02\x00\xf6I\x02\x00'
+    b'$J\x02\x00FJ\x02\x00xJ\x02\x00\x9eJ\x02\x00\xb9J\x02\x00\xe3J\x02\x00\x08K\x02\x007K\x02\x00\\K\x02\x00\x94K\x02\x00\xc1K\x02\x00\xe8K\x02\x00\x18L\x02\x00KL\x02\x00sL\x02\x00\x99L\x02\x00\xbcL\x02\x00\xd5L\x02\x00\xefL\x02\x00\x10M\x02\x00NM\x02\x00{M\x02\x00\x8bM\x02\x00\x9eM\x02\x00'
+    b'\xcdM\x02\x00\xeeM\x02\x00\x19N\x02\x00IN\x02\x00sN\x02\x00\x9dN\x02\x00\xafN\x02\x00\xbaN\x02\x00\xd6N\x02\x00\xfeN\x02\x00\x12O\x02\x000O\x02\x00UO\x02\x00\x90O\x02\x00\xceO\x02\x00\xffO\x02\x00.P\x02\x00`P\x02\x00\x8eP\x02\x00\xbeP\x02\x00\xe4P\x02\x00\x18Q\x02\x004Q\x02\x00ZQ\x02\x00'
+    b'\x94Q\x02\x00\xc8Q\x02\x00\xe7Q\x02\x00\xfaQ\x02\x00\x19R\x02\x00FR\x02\x00XR\x02\x00\x88R\x02\x00\xa8R\x02\x00\xd1R\x02\x00\xffR\x02\x00*S\x02\x00WS\x02\x00\x7fS\x02\x00\xb6S\x02\x00\xd7S\x02\x00\x00T\x02\x00.T\x02\x00ZT\x02\x00}T\x02\x00\xb7T\x02\x00\xe2T\x02\x00\nU\x02\x00%U\x02\x00'
+    b'9U\x02\x00TU\x02\x00iU\x02\x00\x90U\x02\x00\xbeU\x02\x00\xe9U\x02\x00\x1fV\x02\x00NV\x02\x00|V\x02\x00\xa7V\x02\x00\xc7V\x02\x00\xebV\x02\x00\x15W\x02\x00DW\x02\x00kW\x02\x00\x99W\x02\x00\xbaW\x02\x00\xf9W\x02\x00\x11X\x02\x00-X\x02\x00TX\x02\x00\x82X\x02\x00\xb2X\x02\x00\xdaX\x02\x00'
+    b'\x11Y\x02\x00EY\x02\x00yY\x02\x00\xa1Y\x02\x00\xc1Y\x02\x00\xf4Y\x02\x00(Z\x02\x00OZ\x02\x00}Z\x02\x00\x9bZ\x02\x00\xc0Z\x02\x00\xf0Z\x02\x00\x1a[\x02\x00+[\x02\x00N[\x02\x00p[\x02\x00\x91[\x02\x00\xc2[\x02\x00\xef[\x02\x00\t\\\x02\x00(\\\x02\x00U\\\x02\x00\x80\\\x02\x00\xb2\\\x02\x00'
+    b'\xe4\\\x02\x00\n]\x02\x004]\x02\x00s]\x02\x00\xa3]\x02\x00\xcb]\x02\x00\xfa]\x02\x00#^\x02\x00=^\x02\x00U^\x02\x00\x88^\x02\x00\xa0^\x02\x00\xd3^\x02\x00\xff^\x02\x00,_\x02\x00=_\x02\x00^_\x02\x00\x81_\x02\x00\xab_\x02\x00\xd8_\x02\x00\x05`\x02\x007`\x02\x00]`\x02\x00\x86`\x02\x00'
+    b'\xb1`\x02\x00\xea`\x02\x00 a\x02\x00Ha\x02\x00sa\x02\x00\xa1a\x02\x00\xb3a\x02\x00\xe1a\x02\x00\nb\x02\x00.b\x02\x00^b\x02\x00\x86b\x02\x00\xa5b\x02\x00\xd1b\x02\x00\xf2b\x02\x00+c\x02\x00_c\x02\x00|c\x02\x00\xa6c\x02\x00\xccc\x02\x00\x02d\x02\x005d\x02\x00Jd\x02\x00od\x02\x00'
+    b'\x9dd\x02\x00\xd7d\x02\x00\x0ee\x02\x004e\x02\x00me\x02\x00\xa4e\x02\x00\xbce\x02\x00\xf7e\x02\x00\x19f\x02\x00Df\x02\x00hf\x02\x00\x85f\x02\x00\xa6f\x02\x00\xe2f\x02\x00\x0bg\x02\x00"g\x02\x00=g\x02\x00dg\x02\x00\x91g\x02\x00\xb4g\x02\x00\xd8g\x02\x00\x08h\x02\x00.h\x02\x00Wh\x02\x00'
+    b'\x8bh\x02\x00\xb8h\x02\x00\xf0h\x02\x00\x1bi\x02\x00Di\x02\x00mi\x02\x00\x9ai\x02\x00\xb4i\x02\x00\xf1i\x02\x00 j\x02\x00Hj\x02\x00hj\x02\x00\x89j\x02\x00\xbaj\x02\x00\xe2j\x02\x00\x02k\x02\x00Ak\x02\x00Xk\x02\x00\x85k\x02\x00\xbak\x02\x00\xe7k\x02\x009l\x02\x00jl\x02\x00\x90l\x02\x00'
+    b'\xb9l\x02\x00\xf0l\x02\x00\x19m\x02\x00^m\x02\x00\x87m\x02\x00\xacm\x02\x00\xd0m\x02\x00\xfbm\x02\x00\x1dn\x02\x00Jn\x02\x00zn\x02\x00\xaan\x02\x00\xcdn\x02\x00\xf2n\x02\x00\x1do\x02\x00Eo\x02\x00ko\x02\x00\x9co\x02\x00\xbdo\x02\x00\xedo\x02\x00\x14p\x02\x00>p\x02\x00]p\x02\x00\x8fp\x02\x00'
+    b'\xc4p\x02\x00\xf6p\x02\x00)q\x02\x00Fq\x02\x00fq\x02\x00\x8dq\x02\x00\xbbq\x02\x00\xf1q\x02\x00\x1er\x02\x00Fr\x02\x00ar\x02\x00\x89r\x02\x00\xbcr\x02\x00\xebr\x02\x00,s\x02\x00Ls\x02\x00\x83s\x02\x00\xa7s\x02\x00\xc8s\x02\x00\xf3s\x02\x00\rt\x02\x00<t\x02\x00pt\x02\x00\x99t\x02\x00'
+    b'\xc2t\x02\x00\xect\x02\x00&u\x02\x00Lu\x02\x00|u\x02\x00\xacu\x02\x00\xd7u\x02\x00\xf2u\x02\x00\x0ev\x02\x00=v\x02\x00qv\x02\x00\xb1v\x02\x00\xf1v\x02\x00!w\x02\x00^w\x02\x00\x90w\x02\x00\xccw\x02\x00\xf1w\x02\x00\x0ex\x02\x00;x\x02\x00gx\x02\x00\x8ax\x02\x00\xb0x\x02\x00\xd6x\x02\x00'
+    b'\xf2x\x02\x00\x15y\x02\x00Yy\x02\x00\x96y\x02\x00\xaby\x02\x00\xc8y\x02\x00\xeey\x02\x00"z\x02\x00Sz\x02\x00xz\x02\x00\x9fz\x02\x00\xd0z\x02\x00\xedz\x02\x00\x15{\x02\x009{\x02\x00[{\x02\x00r{\x02\x00\x89{\x02\x00\x9f{\x02\x00\xc8{\x02\x00\xf1{\x02\x00/|\x02\x00j|\x02\x00\xa7|\x02\x00'
+    b'\xe5|\x02\x00!}\x02\x00`}\x02\x00\xa6}\x02\x00\xea}\x02\x00.~\x02\x00q~\x02\x00\xb5~\x02\x00\xfa~\x02\x00-\x7f\x02\x00T\x7f\x02\x00x\x7f\x02\x00\xa4\x7f\x02\x00\xd2\x7f\x02\x00\xee\x7f\x02\x00*\x80\x02\x009\x80\x02\x00d\x80\x02\x00\x8d\x80\x02\x00\xb1\x80\x02\x00\xdd\x80\x02\x00\xfa\x80\x02\x00\x14\x81\x02\x00J\x81\x02\x00'
+    b'j\x81\x02\x00\x91\x81\x02\x00\xba\x81\x02\x00\xe2\x81\x02\x00\x0b\x82\x02\x00\x1c\x82\x02\x00D\x82\x02\x00s\x82\x02\x00\xaa\x82\x02\x00\xd8\x82\x02\x00\n\x83\x02\x00\x1f\x83\x02\x00J\x83\x02\x00q\x83\x02\x00\x92\x83\x02\x00\xc0\x83\x02\x00\xe0\x83\x02\x00\r\x84\x02\x00$\x84\x02\x00B\x84\x02\x00w\x84\x02\x00\x91\x84\x02\x00\xa4\x84\x02\x00\xcc\x84\x02\x00'
+    b'\xf8\x84\x02\x00"\x85\x02\x00^\x85\x02\x00q\x85\x02\x00\x8b\x85\x02\x00\xb2\x85\x02\x00\xeb\x85\x02\x00\x17\x86\x02\x00S\x86\x02\x00\x8d\x86\x02\x00\xb8\x86\x02\x00\xc9\x86\x02\x00\xf9\x86\x02\x00\x0f\x87\x02\x005\x87\x02\x00Z\x87\x02\x00\x83\x87\x02\x00\xab\x87\x02\x00\xe0\x87\x02\x00\x10\x88\x02\x00$\x88\x02\x00A\x88\x02\x00]\x88\x02\x00\x97\x88\x02\x00'
+    b'\xc8\x88\x02\x00\xec\x88\x02\x00\x1b\x89\x02\x00>\x89\x02\x00h\x89\x02\x00\x9f\x89\x02\x00\xd0\x89\x02\x00\xeb\x89\x02\x00\x12\x8a\x02\x007\x8a\x02\x00]\x8a\x02\x00\x85\x8a\x02\x00\xae\x8a\x02\x00\xe3\x8a\x02\x00\x01\x8b\x02\x00)\x8b\x02\x00L\x8b\x02\x00k\x8b\x02\x00\xa5\x8b\x02\x00\xe0\x8b\x02\x00\x05\x8c\x02\x00/\x8c\x02\x00N\x8c\x02\x00x\x8c\x02\x00'
+    b'\xab\x8c\x02\x00\xe4\x8c\x02\x00\x16\x8d\x02\x00D\x8d\x02\x00j\x8d\x02\x00\x94\x8d\x02\x00\xb5\x8d\x02\x00\xd9\x8d\x02\x00\r\x8e\x02\x00H\x8e\x02\x00\x8d\x8e\x02\x00\xbb\x8e\x02\x00\xe3\x8e\x02\x00\x07\x8f\x02\x00J\x8f\x02\x00\x83\x8f\x02\x00\xa7\x8f\x02\x00\xca\x8f\x02\x00\xe6\x8f\x02\x00\x12\x90\x02\x00:\x90\x02\x00c\x90\x02\x00v\x90\x02\x00\x93\x90\x02\x00'
+    b'\xc7\x90\x02\x00\x05\x91\x02\x00(\x91\x02\x00@\x91\x02\x00u\x91\x02\x00\x93\x91\x02\x00\xba\x91\x02\x00\xd1\x91\x02\x00\xf6\x91\x02\x00&\x92\x02\x00H\x92\x02\x00j\x92\x02\x00\x9e\x92\x02\x00\xc3\x92\x02\x00\xf1\x92\x02\x00.\x93\x02\x00B\x93\x02\x00p\x93\x02\x00\x8d\x93\x02\x00\xb8\x93\x02\x00\xd1\x93\x02\x00\xfb\x93\x02\x00(\x94\x02\x00Y\x94\x02\x00'
+    b'\x7f\x94\x02\x00\xb0\x94\x02\x00\xe7\x94\x02\x00\x11\x95\x02\x00,\x95\x02\x00i\x95\x02\x00\x82\x95\x02\x00\x9b\x95\x02\x00\xb4\x95\x02\x00\xe7\x95\x02\x00\x11\x96\x02\x000\x96\x02\x00J\x96\x02\x00`\x96\x02\x00y\x96\x02\x00\xa7\x96\x02\x00\xd9\x96\x02\x00\x05\x97\x02\x00=\x97\x02\x00o\x97\x02\x00\xa7\x97\x02\x00\xd6\x97\x02\x00\n\x98\x02\x00C\x98\x02\x00'
+    b'y\x98\x02\x00\xb1\x98\x02\x00\xe8\x98\x02\x00\x1e\x99\x02\x00C\x99\x02\x00k\x99\x02\x00\x9f\x99\x02\x00\xcd\x99\x02\x00\xfd\x99\x02\x00/\x9a\x02\x00_\x9a\x02\x00\x8f\x9a\x02\x00\xbf\x9a\x02\x00\xef\x9a\x02\x00\x1e\x9b\x02\x00U\x9b\x02\x00\x8b\x9b\x02\x00\xa3\x9b\x02\x00\xbb\x9b\x02\x00\xd2\x9b\x02\x00\xe9\x9b\x02\x00\x17\x9c\x02\x00J\x9c\x02\x00}\x9c\x02\x00'
+    b'\xaf\x9c\x02\x00\xe8\x9c\x02\x00\x19\x9d\x02\x00D\x9d\x02\x00k\x9d\x02\x00\x99\x9d\x02\x00\xc6\x9d\x02\x00\xf2\x9d\x02\x00\x1e\x9e\x02\x00S\x9e\x02\x00w\x9e\x02\x00\xae\x9e\x02\x00\xe2\x9e\x02\x00!\x9f\x02\x00Y\x9f\x02\x00q\x9f\x02\x00\xaf\x9f\x02\x00\xe7\x9f\x02\x00$\xa0\x02\x00\\\xa0\x02\x00u\xa0\x02\x00\x9b\xa0\x02\x00\xcc\xa0\x02\x00\xdf\xa0\x02\x00'
+    b'\x16\xa1\x02\x00@\xa1\x02\x00m\xa1\x02\x00\x94\xa1\x02\x00\xc8\xa1\x02\x00\xf9\xa1\x02\x00&\xa2\x02\x00]\xa2\x02\x00\x88\xa2\x02\x00\xab\xa2\x02\x00\xcd\xa2\x02\x00\xe0\xa2\x02\x00\x1a\xa3\x02\x00M\xa3\x02\x00}\xa3\x02\x00\x9f\xa3\x02\x00\xd5\xa3\x02\x00\xed\xa3\x02\x00\x11\xa4\x02\x00A\xa4\x02\x00p\xa4\x02\x00\xa0\xa4\x02\x00\xcd\xa4\x02\x00\xfb\xa4\x02\x00'
+    b'\n\xa5\x02\x000\xa5\x02\x00_\xa5\x02\x00p\xa5\x02\x00\xae\xa5\x02\x00\xe0\xa5\x02\x00\x12\xa6\x02\x003\xa6\x02\x00h\xa6\x02\x00\xa3\xa6\x02\x00\xcc\xa6\x02\x00\xf8\xa6\x02\x00\x1f\xa7\x02\x00H\xa7\x02\x00l\xa7\x02\x00\x95\xa7\x02\x00\xaa\xa7\x02\x00\xda\xa7\x02\x00\x00\xa8\x02\x00)\xa8\x02\x00J\xa8\x02\x00w\xa8\x02\x00\xac\xa8\x02\x00\xde\xa8\x02\x00'
+    b'\x01\xa9\x02\x00)\xa9\x02\x00U\xa9\x02\x00}\xa9\x02\x00\xa6\xa9\x02\x00\xd2\xa9\x02\x00\x0e\xaa\x02\x00"\xaa\x02\x00S\xaa\x02\x00\x84\xaa\x02\x00\xb2\xaa\x02\x00\xd2\xaa\x02\x00\x07\xab\x02\x00:\xab\x02\x00k\xab\x02\x00\x9f\xab\x02\x00\xb4\xab\x02\x00\xd8\xab\x02\x00\x02\xac\x02\x00.\xac\x02\x00?\xac\x02\x00P\xac\x02\x00a\xac\x02\x00\x84\xac\x02\x00'
+    b'\xb4\xac\x02\x00\xca\xac\x02\x00\xdd\xac\x02\x00\xf0\xac\x02\x00 \xad\x02\x00N\xad\x02\x00x\xad\x02\x00\xa3\xad\x02\x00\xd5\xad\x02\x00\xf2\xad\x02\x00#\xae\x02\x00B\xae\x02\x00f\xae\x02\x00\x89\xae\x02\x00\xb4\xae\x02\x00\xfd\xae\x02\x00\x1e\xaf\x02\x00I\xaf\x02\x00\\\xaf\x02\x00\x81\xaf\x02\x00\xad\xaf\x02\x00\xca\xaf\x02\x00\xe5\xaf\x02\x00\xff\xaf\x02\x00'
+    b'\x1a\xb0\x02\x00B\xb0\x02\x00c\xb0\x02\x00\xa1\xb0\x02\x00\xd4\xb0\x02\x00\x12\xb1\x02\x006\xb1\x02\x00o\xb1\x02\x00\x8e\xb1\x02\x00\xc5\xb1\x02\x00\xf2\xb1\x02\x00\x1f\xb2\x02\x00G\xb2\x02\x00|\xb2\x02\x00\x92\xb2\x02\x00\xcd\xb2\x02\x00\xf1\xb2\x02\x00*\xb3\x02\x00K\xb3\x02\x00\x7f\xb3\x02\x00\xa4\xb3\x02\x00\xd1\xb3\x02\x00\xe4\xb3\x02\x00\x17\xb4\x02\x00'
+    b'?\xb4\x02\x00]\xb4\x02\x00\x8e\xb4\x02\x00\xb2\xb4\x02\x00\xd0\xb4\x02\x00\xf5\xb4\x02\x00\x16\xb5\x02\x00*\xb5\x02\x00M\xb5\x02\x00q\xb5\x02\x00\xa0\xb5\x02\x00\xcf\xb5\x02\x00\xec\xb5\x02\x00\x13\xb6\x02\x00@\xb6\x02\x00m\xb6\x02\x00\x8c\xb6\x02\x00\xbb\xb6\x02\x00\xea\xb6\x02\x00$\xb7\x02\x00H\xb7\x02\x00b\xb7\x02\x00z\xb7\x02\x00\x8b\xb7\x02\x00'
+    b'\xa8\xb7\x02\x00\xbc\xb7\x02\x00\xe1\xb7\x02\x00\x08\xb8\x02\x00%\xb8\x02\x00_\xb8\x02\x00\x80\xb8\x02\x00\xac\xb8\x02\x00\xd0\xb8\x02\x00\xee\xb8\x02\x00\x1a\xb9\x02\x007\xb9\x02\x00y\xb9\x02\x00\x99\xb9\x02\x00\xbc\xb9\x02\x00\xe3\xb9\x02\x00\x02\xba\x02\x00\x1c\xba\x02\x00T\xba\x02\x00\x8a\xba\x02\x00\xc1\xba\x02\x00\xee\xba\x02\x00%\xbb\x02\x00F\xbb\x02\x00'
+    b'o\xbb\x02\x00\x9a\xbb\x02\x00\xd0\xbb\x02\x00\x05\xbc\x02\x006\xbc\x02\x00V\xbc\x02\x00t\xbc\x02\x00\x94\xbc\x02\x00\xbd\xbc\x02\x00\xed\xbc\x02\x00\r\xbd\x02\x00$\xbd\x02\x00U\xbd\x02\x00\x80\xbd\x02\x00\xa0\xbd\x02\x00\xc6\xbd\x02\x00\xf8\xbd\x02\x00\x17\xbe\x02\x00J\xbe\x02\x00v\xbe\x02\x00\xa3\xbe\x02\x00\xbd\xbe\x02\x00\xe1\xbe\x02\x00\x01\xbf\x02\x00'
+    b'$\xbf\x02\x00O\xbf\x02\x00\x82\xbf\x02\x00\xad\xbf\x02\x00\xdf\xbf\x02\x00\xfc\xbf\x02\x00/\xc0\x02\x00g\xc0\x02\x00\x9b\xc0\x02\x00\xbd\xc0\x02\x00\x03\xc1\x02\x00,\xc1\x02\x00P\xc1\x02\x00p\xc1\x02\x00\x99\xc1\x02\x00\xd4\xc1\x02\x00\xf1\xc1\x02\x00\x1f\xc2\x02\x006\xc2\x02\x00g\xc2\x02\x00\x93\xc2\x02\x00\xa7\xc2\x02\x00\xd9\xc2\x02\x00\xee\xc2\x02\x00'
+    b'\x12\xc3\x02\x00A\xc3\x02\x00V\xc3\x02\x00i\xc3\x02\x00|\xc3\x02\x00\x91\xc3\x02\x00\xa2\xc3\x02\x00\xbd\xc3\x02\x00\xdc\xc3\x02\x00\xf5\xc3\x02\x00\x14\xc4\x02\x001\xc4\x02\x00Y\xc4\x02\x00x\xc4\x02\x00\xaa\xc4\x02\x00\xca\xc4\x02\x00\x07\xc5\x02\x00\x1c\xc5\x02\x00F\xc5\x02\x00u\xc5\x02\x00\xa4\xc5\x02\x00\xd3\xc5\x02\x00\x02\xc6\x02\x003\xc6\x02\x00'
+    b'`\xc6\x02\x00\x8f\xc6\x02\x00\xaa\xc6\x02\x00\xbb\xc6\x02\x00\xcd\xc6\x02\x00\xe8\xc6\x02\x00\xfe\xc6\x02\x00\x1e\xc7\x02\x00M\xc7\x02\x00|\xc7\x02\x00\xab\xc7\x02\x00\xda\xc7\x02\x00\t\xc8\x02\x00#\xc8\x02\x00R\xc8\x02\x00s\xc8\x02\x00\x9b\xc8\x02\x00\xc4\xc8\x02\x00\xf4\xc8\x02\x00\x10\xc9\x02\x00/\xc9\x02\x00`\xc9\x02\x00u\xc9\x02\x00\x9c\xc9\x02\x00'
+    b'\xcf\xc9\x02\x00\xeb\xc9\x02\x00\x00\xca\x02\x00\x12\xca\x02\x008\xca\x02\x00U\xca\x02\x00\x80\xca\x02\x00\xae\xca\x02\x00\xdb\xca\x02\x00\xf9\xca\x02\x00\x0f\xcb\x02\x00+\xcb\x02\x00B\xcb\x02\x00b\xcb\x02\x00\x8c\xcb\x02\x00\xb7\xcb\x02\x00\xf0\xcb\x02\x00\x11\xcc\x02\x003\xcc\x02\x00q\xcc\x02\x00\xb6\xcc\x02\x00\xe7\xcc\x02\x00\x17\xcd\x02\x00=\xcd\x02\x00'
+    b'b\xcd\x02\x00\x82\xcd\x02\x00\xa2\xcd\x02\x00\xb7\xcd\x02\x00\xec\xcd\x02\x00\x18\xce\x02\x002\xce\x02\x00L\xce\x02\x00|\xce\x02\x00\x96\xce\x02\x00\xaa\xce\x02\x00\xdb\xce\x02\x00\x07\xcf\x02\x00%\xcf\x02\x00<\xcf\x02\x00`\xcf\x02\x00w\xcf\x02\x00\xa8\xcf\x02\x00\xbd\xcf\x02\x00\xeb\xcf\x02\x00\x0c\xd0\x02\x004\xd0\x02\x00N\xd0\x02\x00v\xd0\x02\x00'
+    b'\x92\xd0\x02\x00\xb0\xd0\x02\x00\xca\xd0\x02\x00\xf4\xd0\x02\x00\x1b\xd1\x02\x00=\xd1\x02\x00^\xd1\x02\x00\x90\xd1\x02\x00\xc0\xd1\x02\x00\xe6\xd1\x02\x00\x0c\xd2\x02\x003\xd2\x02\x00`\xd2\x02\x00\x9a\xd2\x02\x00\xd5\xd2\x02\x00\x04\xd3\x02\x00!\xd3\x02\x006\xd3\x02\x00_\xd3\x02\x00\x83\xd3\x02\x00\xa2\xd3\x02\x00\xc4\xd3\x02\x00\xed\xd3\x02\x00\n\xd4\x02\x00'
+    b'-\xd4\x02\x00_\xd4\x02\x00y\xd4\x02\x00\xa7\xd4\x02\x00\xd3\xd4\x02\x00\xf8\xd4\x02\x00\x1d\xd5\x02\x00I\xd5\x02\x00s\xd5\x02\x00\x9c\xd5\x02\x00\xbe\xd5\x02\x00\xe7\xd5\x02\x00\n\xd6\x02\x00&\xd6\x02\x00@\xd6\x02\x00[\xd6\x02\x00t\xd6\x02\x00\xa3\xd6\x02\x00\xc8\xd6\x02\x00\xe7\xd6\x02\x00\r\xd7\x02\x001\xd7\x02\x00S\xd7\x02\x00~\xd7\x02\x00'
+    b'\xaf\xd7\x02\x00\xe2\xd7\x02\x00\x07\xd8\x02\x005\xd8\x02\x00q\xd8\x02\x00\xa2\xd8\x02\x00\xe1\xd8\x02\x00\xf7\xd8\x02\x00,\xd9\x02\x00Y\xd9\x02\x00\x8a\xd9\x02\x00\xb1\xd9\x02\x00\xd9\xd9\x02\x00\x0f\xda\x02\x00#\xda\x02\x00X\xda\x02\x00\x86\xda\x02\x00\xa1\xda\x02\x00\xcc\xda\x02\x00\x05\xdb\x02\x003\xdb\x02\x00A\xdb\x02\x00O\xdb\x02\x00]\xdb\x02\x00'
+    b'k\xdb\x02\x00y\xdb\x02\x00\x8a\xdb\x02\x00\x9b\xdb\x02\x00\xac\xdb\x02\x00\xd2\xdb\x02\x00\x00\xdc\x02\x00\x11\xdc\x02\x00"\xdc\x02\x00k\xdc\x02\x00\x8b\xdc\x02\x00\xc1\xdc\x02\x00\xe3\xdc\x02\x00\x06\xdd\x02\x00/\xdd\x02\x00X\xdd\x02\x00w\xdd\x02\x00\xa3\xdd\x02\x00\xb7\xdd\x02\x00\xe5\xdd\x02\x00\x01\xde\x02\x00\x16\xde\x02\x00G\xde\x02\x00i\xde\x02\x00'
+    b'\xa3\xde\x02\x00\xc3\xde\x02\x00\xf4\xde\x02\x00+\xdf\x02\x00J\xdf\x02\x00h\xdf\x02\x00\xa1\xdf\x02\x00\xc8\xdf\x02\x00\xe5\xdf\x02\x00\x1f\xe0\x02\x00S\xe0\x02\x00v\xe0\x02\x00\x99\xe0\x02\x00\xc0\xe0\x02\x00\xe7\xe0\x02\x00 \xe1\x02\x00Y\xe1\x02\x00\x8a\xe1\x02\x00\xb8\xe1\x02\x00\xec\xe1\x02\x00\x03\xe2\x02\x00 \xe2\x02\x00>\xe2\x02\x00a\xe2\x02\x00'
+    b'\x86\xe2\x02\x00\x95\xe2\x02\x00\xb2\xe2\x02\x00\xdf\xe2\x02\x00\x10\xe3\x02\x00A\xe3\x02\x00W\xe3\x02\x00z\xe3\x02\x00\xb4\xe3\x02\x00\xeb\xe3\x02\x00\x18\xe4\x02\x00M\xe4\x02\x00~\xe4\x02\x00\xa7\xe4\x02\x00\xdb\xe4\x02\x00\x0b\xe5\x02\x004\xe5\x02\x00i\xe5\x02\x00\x88\xe5\x02\x00\x9f\xe5\x02\x00\xbd\xe5\x02\x00\xf2\xe5\x02\x00$\xe6\x02\x00T\xe6\x02\x00'
+    b'q\xe6\x02\x00\x9f\xe6\x02\x00\xcd\xe6\x02\x00\xe4\xe6\x02\x00\x0f\xe7\x02\x006\xe7\x02\x00@\xe7\x02\x00J\xe7\x02\x00p\xe7\x02\x00\x90\xe7\x02\x00\xc1\xe7\x02\x00\xe2\xe7\x02\x00\x08\xe8\x02\x00(\xe8\x02\x00K\xe8\x02\x00}\xe8\x02\x00\xb8\xe8\x02\x00\xef\xe8\x02\x00\x17\xe9\x02\x00A\xe9\x02\x00V\xe9\x02\x00\x86\xe9\x02\x00\xa6\xe9\x02\x00\xbb\xe9\x02\x00'
+    b'\xde\xe9\x02\x00\xfa\xe9\x02\x00\x0f\xea\x02\x00#\xea\x02\x00>\xea\x02\x00w\xea\x02\x00\xab\xea\x02\x00\xda\xea\x02\x00\x0b\xeb\x02\x00\x1d\xeb\x02\x002\xeb\x02\x00R\xeb\x02\x00\x7f\xeb\x02\x00\xb4\xeb\x02\x00\xde\xeb\x02\x00\x11\xec\x02\x00;\xec\x02\x00e\xec\x02\x00\x8d\xec\x02\x00\xb8\xec\x02\x00\xf1\xec\x02\x00\x15\xed\x02\x00<\xed\x02\x00[\xed\x02\x00'
+    b'\x94\xed\x02\x00\xb6\xed\x02\x00\xe5\xed\x02\x00\x0e\xee\x02\x003\xee\x02\x00O\xee\x02\x00p\xee\x02\x00\x97\xee\x02\x00\xad\xee\x02\x00\xe8\xee\x02\x00\x0f\xef\x02\x00B\xef\x02\x00n\xef\x02\x00\x98\xef\x02\x00\xc1\xef\x02\x00\xee\xef\x02\x00\x19\xf0\x02\x00M\xf0\x02\x00q\xf0\x02\x00\x8c\xf0\x02\x00\xad\xf0\x02\x00\xd2\xf0\x02\x00\xf4\xf0\x02\x00\n\xf1\x02\x00'
+    b'%\xf1\x02\x00X\xf1\x02\x00q\xf1\x02\x00\x99\xf1\x02\x00\xb5\xf1\x02\x00\xe3\xf1\x02\x00\x03\xf2\x02\x00\x1e\xf2\x02\x006\xf2\x02\x00F\xf2\x02\x00^\xf2\x02\x00\x9b\xf2\x02\x00\xb7\xf2\x02\x00\xd4\xf2\x02\x00\x17\xf3\x02\x002\xf3\x02\x00@\xf3\x02\x00r\xf3\x02\x00\x81\xf3\x02\x00\xb8\xf3\x02\x00\xdd\xf3\x02\x00\x0e\xf4\x02\x002\xf4\x02\x00M\xf4\x02\x00'
+    b'z\xf4\x02\x00\x96\xf4\x02\x00\xc8\xf4\x02\x00\xf4\xf4\x02\x00!\xf5\x02\x00M\xf5\x02\x00x\xf5\x02\x00\x94\xf5\x02\x00\xb2\xf5\x02\x00\xe3\xf5\x02\x00\x05\xf6\x02\x006\xf6\x02\x00e\xf6\x02\x00\x7f\xf6\x02\x00\xa9\xf6\x02\x00\xda\xf6\x02\x00\x03\xf7\x02\x007\xf7\x02\x00]\xf7\x02\x00|\xf7\x02\x00\xae\xf7\x02\x00\xdd\xf7\x02\x00\x13\xf8\x02\x002\xf8\x02\x00'
+    b'h\xf8\x02\x00\x8b\xf8\x02\x00\xac\xf8\x02\x00\xbe\xf8\x02\x00\xeb\xf8\x02\x00\x0c\xf9\x02\x00?\xf9\x02\x00a\xf9\x02\x00\x93\xf9\x02\x00\xb1\xf9\x02\x00\xd8\xf9\x02\x00\xf0\xf9\x02\x00\x12\xfa\x02\x002\xfa\x02\x00f\xfa\x02\x00\x83\xfa\x02\x00\xa2\xfa\x02\x00\xc0\xfa\x02\x00\xf5\xfa\x02\x00!\xfb\x02\x005\xfb\x02\x00p\xfb\x02\x00\xa3\xfb\x02\x00\xce\xfb\x02\x00'
+    b'\xe1\xfb\x02\x00!\xfc\x02\x00_\xfc\x02\x00\x84\xfc\x02\x00\xa0\xfc\x02\x00\xb0\xfc\x02\x00\xdb\xfc\x02\x00\xf4\xfc\x02\x00*\xfd\x02\x00H\xfd\x02\x00\x80\xfd\x02\x00\xb1\xfd\x02\x00\xcc\xfd\x02\x00\xf8\xfd\x02\x00"\xfe\x02\x004\xfe\x02\x00S\xfe\x02\x00e\xfe\x02\x00\xb1\xfe\x02\x00\xc2\xfe\x02\x00\xd9\xfe\x02\x00\xfd\xfe\x02\x00"\xff\x02\x00M\xff\x02\x00'
+    b'r\xff\x02\x00\x87\xff\x02\x00\xb9\xff\x02\x00\xf3\xff\x02\x00\x1e\x00\x03\x00B\x00\x03\x00s\x00\x03\x00\x8e\x00\x03\x00\xba\x00\x03\x00\xd8\x00\x03\x00\xe9\x00\x03\x00\x15\x01\x03\x00%\x01\x03\x00Q\x01\x03\x00_\x01\x03\x00\x8c\x01\x03\x00\xb2\x01\x03\x00\xed\x01\x03\x00\x11\x02\x03\x00L\x02\x03\x00\x7f\x02\x03\x00\x95\x02\x03\x00\xb0\x02\x03\x00\xc7\x02\x03\x00'
+    b'\xdb\x02\x03\x00\t\x03\x03\x00C\x03\x03\x00c\x03\x03\x00\x96\x03\x03\x00\xaf\x03\x03\x00\xc7\x03\x03\x00\xe7\x03\x03\x00\xf7\x03\x03\x00\x10\x04\x03\x00.\x04\x03\x00^\x04\x03\x00\x8b\x04\x03\x00\xc9\x04\x03\x00\xfc\x04\x03\x00\x15\x05\x03\x00/\x05\x03\x00M\x05\x03\x00q\x05\x03\x00\xa7\x05\x03\x00\xc6\x05\x03\x00\xe1\x05\x03\x00\x01\x06\x03\x00$\x06\x03\x00'
+    b'_\x06\x03\x00\x99\x06\x03\x00\xd2\x06\x03\x00\xe2\x06\x03\x00\x13\x07\x03\x00/\x07\x03\x00K\x07\x03\x00w\x07\x03\x00\xb3\x07\x03\x00\xe6\x07\x03\x00\x1f\x08\x03\x00L\x08\x03\x00h\x08\x03\x00\x94\x08\x03\x00\xaf\x08\x03\x00\xc7\x08\x03\x00\xeb\x08\x03\x00\x00\t\x03\x00=\t\x03\x00~\t\x03\x00\xa9\t\x03\x00\xf2\t\x03\x00-\n\x03\x00n\n\x03\x00'
+    b'\xb0\n\x03\x00\xcc\n\x03\x00\xe5\n\x03\x00\x02\x0b\x03\x00\x15\x0b\x03\x00!\x0b\x03\x00-\x0b\x03\x00e\x0b\x03\x00\x8a\x0b\x03\x00\xa7\x0b\x03\x00\xd2\x0b\x03\x00\xe6\x0b\x03\x00\x1d\x0c\x03\x00O\x0c\x03\x00|\x0c\x03\x00\xae\x0c\x03\x00\xe3\x0c\x03\x00\x15\r\x03\x00$\r\x03\x00E\r\x03\x00b\r\x03\x00\x8b\r\x03\x00\xbf\r\x03\x00\xf3\r\x03\x00'
+    b"'\x0e\x03\x00[\x0e\x03\x00\x89\x0e\x03\x00\xb5\x0e\x03\x00\xde\x0e\x03\x00\xfb\x0e\x03\x00\x18\x0f\x03\x005\x0f\x03\x00U\x0f\x03\x00\x82\x0f\x03\x00\xa2\x0f\x03\x00\xb2\x0f\x03\x00\xf7\x0f\x03\x00\x14\x10\x03\x00=\x10\x03\x00e\x10\x03\x00\x89\x10\x03\x00\x9e\x10\x03\x00\xb2\x10\x03\x00\xd5\x10\x03\x00\xf2\x10\x03\x00\x12\x11\x03\x00?\x11\x03\x00i\x11\x03\x00"
+    b'\x93\x11\x03\x00\xc0\x11\x03\x00\xee\x11\x03\x00\x16\x12\x03\x00=\x12\x03\x00o\x12\x03\x00\xa6\x12\x03\x00\xd2\x12\x03\x00\xfe\x12\x03\x00%\x13\x03\x00>\x13\x03\x00n\x13\x03\x00\x95\x13\x03\x00\xb9\x13\x03\x00\xd8\x13\x03\x00\xfb\x13\x03\x00.\x14\x03\x00b\x14\x03\x00\xa6\x14\x03\x00\xe2\x14\x03\x00\x10\x15\x03\x004\x15\x03\x00M\x15\x03\x00d\x15\x03\x00'
+    b'w\x15\x03\x00\xb0\x15\x03\x00\xc4\x15\x03\x00\xe8\x15\x03\x00\x1f\x16\x03\x008\x16\x03\x00W\x16\x03\x00\x8e\x16\x03\x00\xb8\x16\x03\x00\xde\x16\x03\x00\xee\x16\x03\x00\x0e\x17\x03\x006\x17\x03\x00b\x17\x03\x00\x94\x17\x03\x00\xbc\x17\x03\x00\xeb\x17\x03\x00\xfb\x17\x03\x002\x18\x03\x00`\x18\x03\x00\x83\x18\x03\x00\x94\x18\x03\x00\xc2\x18\x03\x00\xfb\x18\x03\x00'
+    b'(\x19\x03\x005\x19\x03\x00H\x19\x03\x00q\x19\x03\x00\xa0\x19\x03\x00\xbc\x19\x03\x00\xea\x19\x03\x00\x1c\x1a\x03\x00H\x1a\x03\x00w\x1a\x03\x00\x9b\x1a\x03\x00\xb9\x1a\x03\x00\xdd\x1a\x03\x00\x13\x1b\x03\x004\x1b\x03\x00U\x1b\x03\x00\x80\x1b\x03\x00\xbe\x1b\x03\x00\xe1\x1b\x03\x00\x03\x1c\x03\x00.\x1c\x03\x00?\x1c\x03\x00i\x1c\x03\x00w\x1c\x03\x00'
+    b'\x95\x1c\x03\x00\xb6\x1c\x03\x00\xd4\x1c\x03\x00\xfa\x1c\x03\x00\x14\x1d\x03\x008\x1d\x03\x00w\x1d\x03\x00\x92\x1d\x03\x00\xad\x1d\x03\x00\xda\x1d\x03\x00\x06\x1e\x03\x002\x1e\x03\x00B\x1e\x03\x00_\x1e\x03\x00p\x1e\x03\x00\x8f\x1e\x03\x00\xc6\x1e\x03\x00\xef\x1e\x03\x00\x13\x1f\x03\x002\x1f\x03\x00Q\x1f\x03\x00_\x1f\x03\x00n\x1f\x03\x00\x81\x1f\x03\x00'
+    b'\x8e\x1f\x03\x00\xa6\x1f\x03\x00\xb8\x1f\x03\x00\xce\x1f\x03\x00\xe6\x1f\x03\x00\xfa\x1f\x03\x00\n \x03\x00\x1c \x03\x000 \x03\x00C \x03\x00U \x03\x00p \x03\x00\x8f \x03\x00\xa4 \x03\x00\xd0 \x03\x00\xf4 \x03\x00\x0f!\x03\x00(!\x03\x00H!\x03\x00b!\x03\x00\x8a!\x03\x00\xa3!\x03\x00\xc0!\x03\x00\xd3!\x03\x00'
+    b'\x12"\x03\x004"\x03\x00h"\x03\x00\x94"\x03\x00\xc1"\x03\x00\xd3"\x03\x00\xfe"\x03\x00##\x03\x00P#\x03\x00e#\x03\x00\x82#\x03\x00\xa5#\x03\x00\xca#\x03\x00\xfa#\x03\x00"$\x03\x00I$\x03\x00|$\x03\x00\x90$\x03\x00\xc2$\x03\x00\xf4$\x03\x00\x1b%\x03\x00;%\x03\x00Y%\x03\x00j%\x03\x00'
+    b"\x86%\x03\x00\xa7%\x03\x00\xdd%\x03\x00\xfb%\x03\x00\x15&\x03\x007&\x03\x00T&\x03\x00i&\x03\x00\x9a&\x03\x00\xb5&\x03\x00\xc5&\x03\x00\xe8&\x03\x00\x1f'\x03\x00Q'\x03\x00a'\x03\x00v'\x03\x00\x9e'\x03\x00\xc7'\x03\x00\xdc'\x03\x00\x15(\x03\x006(\x03\x00\\(\x03\x00\x8b(\x03\x00\xbc(\x03\x00"
+    b'\xe6(\x03\x00\x13)\x03\x008)\x03\x00])\x03\x00\x82)\x03\x00\xc4)\x03\x00\xf0)\x03\x00\x13*\x03\x00E*\x03\x00a*\x03\x00\x7f*\x03\x00\x8c*\x03\x00\xaa*\x03\x00\xb9*\x03\x00\xd9*\x03\x00\xf1*\x03\x00\x0b+\x03\x00-+\x03\x00Z+\x03\x00\x84+\x03\x00\xaf+\x03\x00\xd7+\x03\x00\x01,\x03\x004,\x03\x00'
+    b'Q,\x03\x00n,\x03\x00\x8c,\x03\x00\xb7,\x03\x00\xc9,\x03\x00\xda,\x03\x00\xf3,\x03\x00\x08-\x03\x00#-\x03\x006-\x03\x00S-\x03\x00f-\x03\x00z-\x03\x00\x8d-\x03\x00\x9f-\x03\x00\xb6-\x03\x00\xdc-\x03\x00\xfa-\x03\x00\x0c.\x03\x00).\x03\x00C.\x03\x00h.\x03\x00\x89.\x03\x00\xad.\x03\x00'
+    b'\xcf.\x03\x00\xf5.\x03\x00\x13/\x03\x004/\x03\x00R/\x03\x00m/\x03\x00\x8c/\x03\x00\xaa/\x03\x00\xd0/\x03\x00\xea/\x03\x00\x060\x03\x00$0\x03\x00J0\x03\x00i0\x03\x00\x8a0\x03\x00\xad0\x03\x00\xce0\x03\x00\xf40\x03\x00\x181\x03\x00:1\x03\x00X1\x03\x00m1\x03\x00\x861\x03\x00\xab1\x03\x00'
+    b'\xd41\x03\x00\xe91\x03\x00\x012\x03\x00&2\x03\x00>2\x03\x00e2\x03\x00\x872\x03\x00\x9f2\x03\x00\xb92\x03\x00\xd22\x03\x00\xeb2\x03\x00\x073\x03\x00$3\x03\x0013\x03\x00>3\x03\x00L3\x03\x00Y3\x03\x00g3\x03\x00v3\x03\x00\x863\x03\x00\x943\x03\x00\xa43\x03\x00\xb13\x03\x00\xc83\x03\x00'
+    b'\xd83\x03\x00\xe73\x03\x00\xf63\x03\x00\x084\x03\x00\x144\x03\x00%4\x03\x0044\x03\x00H4\x03\x00]4\x03\x00k4\x03\x00x4\x03\x00\x8b4\x03\x00\x9a4\x03\x00\xa84\x03\x00\xe94\x03\x00\x125\x03\x00J5\x03\x00\\5\x03\x00\x7f5\x03\x00\x985\x03\x00\xb25\x03\x00\xd95\x03\x00\x076\x03\x0056\x03\x00'
+    b'V6\x03\x00\x806\x03\x00\x9e6\x03\x00\xb86\x03\x00\xd36\x03\x00\xe56\x03\x00\xfc6\x03\x00\x117\x03\x00&7\x03\x00?7\x03\x00P7\x03\x00k7\x03\x00\x827\x03\x00\xa37\x03\x00\xc37\x03\x00\xdd7\x03\x00\xf87\x03\x00\x138\x03\x00(8\x03\x00L8\x03\x00g8\x03\x00|8\x03\x00\x908\x03\x00\xa18\x03\x00'
+    b'\xb58\x03\x00\xca8\x03\x00\xdc8\x03\x00\xf28\x03\x00\x069\x03\x00\x189\x03\x0019\x03\x00D9\x03\x00Z9\x03\x00t9\x03\x00\x869\x03\x00\x989\x03\x00\xb69\x03\x00\xcc9\x03\x00\xf99\x03\x00\x11:\x03\x00(:\x03\x00>:\x03\x00b:\x03\x00x:\x03\x00\x97:\x03\x00\xd0:\x03\x00\xf9:\x03\x008;\x03\x00'
+    b't;\x03\x00\x9d;\x03\x00\xc4;\x03\x00\xfa;\x03\x00+<\x03\x00I<\x03\x00\x7f<\x03\x00\x9c<\x03\x00\xc0<\x03\x00\xfc<\x03\x00\x1b=\x03\x00J=\x03\x00|=\x03\x00\xa3=\x03\x00\xc0=\x03\x00\xdb=\x03\x00\xfe=\x03\x00\x12>\x03\x00@>\x03\x00j>\x03\x00\x97>\x03\x00\xbb>\x03\x00\xed>\x03\x00\x1f?\x03\x00'
+    b'B?\x03\x00R?\x03\x00a?\x03\x00n?\x03\x00\x95?\x03\x00\xa8?\x03\x00\xd4?\x03\x00\xff?\x03\x00\x1e@\x03\x00<@\x03\x00e@\x03\x00\x88@\x03\x00\xb1@\x03\x00\xea@\x03\x00\x1bA\x03\x00AA\x03\x00\x7fA\x03\x00\x9eA\x03\x00\xb9A\x03\x00\xd4A\x03\x00\x04B\x03\x00;B\x03\x00hB\x03\x00\x83B\x03\x00'
+    b'\x9bB\x03\x00\xc3B\x03\x00\xf3B\x03\x00\x1eC\x03\x00VC\x03\x00\x80C\x03\x00\x9aC\x03\x00\xc7C\x03\x00\xe9C\x03\x00\x1aD\x03\x00HD\x03\x00\x86D\x03\x00\xa6D\x03\x00\xd0D\x03\x00\xffD\x03\x007E\x03\x00cE\x03\x00\x98E\x03\x00\xb4E\x03\x00\xccE\x03\x00\xebE\x03\x00\x03F\x03\x00(F\x03\x00<F\x03\x00'
+    b']F\x03\x00vF\x03\x00\x94F\x03\x00\xadF\x03\x00\xcdF\x03\x00\xefF\x03\x00\x14G\x03\x00.G\x03\x00GG\x03\x00XG\x03\x00\x81G\x03\x00\xa8G\x03\x00\xd2G\x03\x00\x10H\x03\x005H\x03\x00PH\x03\x00iH\x03\x00\x8bH\x03\x00\xa0H\x03\x00\xc5H\x03\x00\xdfH\x03\x00\xf9H\x03\x00\x19I\x03\x00/I\x03\x00'
+    b'LI\x03\x00}I\x03\x00\xb4I\x03\x00\xe7I\x03\x00\x12J\x03\x00QJ\x03\x00wJ\x03\x00\x9aJ\x03\x00\xd2J\x03\x00\x0eK\x03\x00HK\x03\x00wK\x03\x00\xaaK\x03\x00\xc0K\x03\x00\xe3K\x03\x00\x19L\x03\x00<L\x03\x00ML\x03\x00\x83L\x03\x00\xb6L\x03\x00\xe0L\x03\x00\x1bM\x03\x00@M\x03\x00}M\x03\x00'
+    b'\xc2M\x03\x00\xe0M\x03\x00\xfcM\x03\x00 N\x03\x00<N\x03\x00jN\x03\x00\xacN\x03\x00\xdcN\x03\x00\x1fO\x03\x00ZO\x03\x00\x8cO\x03\x00\xc5O\x03\x00\x08P\x03\x00\x1eP\x03\x00@P\x03\x00bP\x03\x00\x85P\x03\x00\x9fP\x03\x00\xb8P\x03\x00\xdaP\x03\x00\xfdP\x03\x00,Q\x03\x00MQ\x03\x00yQ\x03\x00'
+    b'\x90Q\x03\x00\xb0Q\x03\x00\xd8Q\x03\x00\xf6Q\x03\x00 R\x03\x00HR\x03\x00oR\x03\x00\x8fR\x03\x00\xbeR\x03\x00\xccR\x03\x00\xecR\x03\x00\x11S\x03\x00,S\x03\x00SS\x03\x00zS\x03\x00\x90S\x03\x00\xa2S\x03\x00\xd5S\x03\x00\xe9S\x03\x00\x08T\x03\x00(T\x03\x00NT\x03\x00eT\x03\x00\x82T\x03\x00'
+    b'\xa7T\x03\x00\xcdT\x03\x00\x02U\x03\x00,U\x03\x00BU\x03\x00vU\x03\x00\x8dU\x03\x00\xa0U\x03\x00\xc1U\x03\x00\xf4U\x03\x00\x1eV\x03\x00-V\x03\x00TV\x03\x00oV\x03\x00\x8aV\x03\x00\xc3V\x03\x00\xf9V\x03\x00%W\x03\x00@W\x03\x00WW\x03\x00\x83W\x03\x00\xaaW\x03\x00\xccW\x03\x00\x04X\x03\x00'
+    b')X\x03\x00DX\x03\x00SX\x03\x00\x8bX\x03\x00\xb4X\x03\x00\xefX\x03\x00\x1aY\x03\x00=Y\x03\x00oY\x03\x00\x80Y\x03\x00\x9fY\x03\x00\xc6Y\x03\x00\xe6Y\x03\x00\xffY\x03\x00\x19Z\x03\x005Z\x03\x00aZ\x03\x00\x96Z\x03\x00\xaaZ\x03\x00\xd3Z\x03\x00\xfeZ\x03\x00\x19[\x03\x000[\x03\x00?[\x03\x00'
+    b'Z[\x03\x00m[\x03\x00\x86[\x03\x00\x9e[\x03\x00\xb0[\x03\x00\xce[\x03\x00\xf0[\x03\x00\x18\\\x03\x00>\\\x03\x00R\\\x03\x00h\\\x03\x00\x86\\\x03\x00\x9e\\\x03\x00\xae\\\x03\x00\xcd\\\x03\x00\xf3\\\x03\x00\x10]\x03\x00A]\x03\x00b]\x03\x00v]\x03\x00\x8f]\x03\x00\xb3]\x03\x00\xde]\x03\x00 ^\x03\x00'
+    b'8^\x03\x00Y^\x03\x00s^\x03\x00\x9f^\x03\x00\xde^\x03\x00\xf8^\x03\x00\t_\x03\x00\x1a_\x03\x00,_\x03\x009_\x03\x00i_\x03\x00\x93_\x03\x00\xa4_\x03\x00\xbe_\x03\x00\xd2_\x03\x00\xf4_\x03\x00\x11`\x03\x004`\x03\x00V`\x03\x00o`\x03\x00\x84`\x03\x00\x9d`\x03\x00\xc1`\x03\x00\xdd`\x03\x00'
+    b'\xfd`\x03\x00&a\x03\x00Ua\x03\x00za\x03\x00\x8ca\x03\x00\xb2a\x03\x00\xc2a\x03\x00\xdfa\x03\x00\x01b\x03\x00\x11b\x03\x00"b\x03\x008b\x03\x00Eb\x03\x00pb\x03\x00\x9eb\x03\x00\xd2b\x03\x00\x01c\x03\x00"c\x03\x00Dc\x03\x00cc\x03\x00\x8ac\x03\x00\xb2c\x03\x00\xdac\x03\x00\nd\x03\x00'
+    b')d\x03\x00Ld\x03\x00ld\x03\x00\x87d\x03\x00\xa2d\x03\x00\xd0d\x03\x00\xf1d\x03\x00\x0be\x03\x001e\x03\x00Qe\x03\x00le\x03\x00\x9ae\x03\x00\xade\x03\x00\xd7e\x03\x00\xf0e\x03\x00\x18f\x03\x003f\x03\x00Rf\x03\x00\x84f\x03\x00\xabf\x03\x00\xc0f\x03\x00\xecf\x03\x00%g\x03\x00Xg\x03\x00'
+    b'\x8ag\x03\x00\xafg\x03\x00\xd9g\x03\x00\xfbg\x03\x00.h\x03\x00_h\x03\x00\x87h\x03\x00\xc0h\x03\x00\xf9h\x03\x00\x19i\x03\x00<i\x03\x00ri\x03\x00\x9ei\x03\x00\xd3i\x03\x00\xeci\x03\x00\x04j\x03\x00%j\x03\x00Ej\x03\x00Rj\x03\x00lj\x03\x00\x84j\x03\x00\x9aj\x03\x00\xbfj\x03\x00\xf0j\x03\x00'
+    b'\x1dk\x03\x00;k\x03\x00Ok\x03\x00^k\x03\x00ik\x03\x00\x8ek\x03\x00\xc7k\x03\x00\xdck\x03\x00\xeek\x03\x00\x01l\x03\x00<l\x03\x00el\x03\x00}l\x03\x00\x98l\x03\x00\xb1l\x03\x00\xf5l\x03\x000m\x03\x00jm\x03\x00\x82m\x03\x00\x9am\x03\x00\xb2m\x03\x00\xc4m\x03\x00\xd6m\x03\x00\xf9m\x03\x00'
+    b'#n\x03\x00Qn\x03\x00xn\x03\x00\x9cn\x03\x00\xc9n\x03\x00\xedn\x03\x00\x0fo\x03\x003o\x03\x00bo\x03\x00yo\x03\x00\x90o\x03\x00\xb2o\x03\x00\xdao\x03\x00\x11p\x03\x000p\x03\x00Ep\x03\x00ep\x03\x00\x99p\x03\x00\xa7p\x03\x00\xccp\x03\x00\xdcp\x03\x00\xfcp\x03\x00\x1cq\x03\x004q\x03\x00'
+    b'bq\x03\x00{q\x03\x00\x92q\x03\x00\xa8q\x03\x00\xc8q\x03\x00\xecq\x03\x00\xffq\x03\x00\x12r\x03\x00(r\x03\x00Jr\x03\x00pr\x03\x00\x9cr\x03\x00\xbbr\x03\x00\xdar\x03\x00\xf3r\x03\x00.s\x03\x00^s\x03\x00\x92s\x03\x00\xc0s\x03\x00\xe7s\x03\x00\x10t\x03\x00=t\x03\x00nt\x03\x00\xa3t\x03\x00'
+    b'\xc2t\x03\x00\xfbt\x03\x00\x16u\x03\x007u\x03\x00Nu\x03\x00ju\x03\x00\x82u\x03\x00\x9cu\x03\x00\xb0u\x03\x00\xcdu\x03\x00\xe0u\x03\x00\xf6u\x03\x00\x0cv\x03\x00$v\x03\x00;v\x03\x00Pv\x03\x00ev\x03\x00~v\x03\x00\xbdv\x03\x00\xedv\x03\x009w\x03\x00ew\x03\x00\x91w\x03\x00\xcdw\x03\x00'
+    b'\xfdw\x03\x00\x17x\x03\x00>x\x03\x00ix\x03\x00\x89x\x03\x00\xaex\x03\x00\xd4x\x03\x00\xf4x\x03\x00\x1by\x03\x00Yy\x03\x00~y\x03\x00\x96y\x03\x00\xbcy\x03\x00\xdby\x03\x00\xeby\x03\x00\x16z\x03\x001z\x03\x00lz\x03\x00\xa0z\x03\x00\xccz\x03\x00\xefz\x03\x00\x15{\x03\x00I{\x03\x00q{\x03\x00'
+    b'\x9f{\x03\x00\xc0{\x03\x00\xfa{\x03\x00\x1e|\x03\x00m|\x03\x00\x85|\x03\x00\xa1|\x03\x00\xc2|\x03\x00\xd8|\x03\x00\xfa|\x03\x001}\x03\x00V}\x03\x00\x84}\x03\x00\xb8}\x03\x00\xd6}\x03\x00\xfa}\x03\x003~\x03\x00R~\x03\x00e~\x03\x00\x94~\x03\x00\xb7~\x03\x00\xcd~\x03\x00\xe7~\x03\x00\x1e\x7f\x03\x00'
+    b')\x7f\x03\x00[\x7f\x03\x00\x8c\x7f\x03\x00\xbc\x7f\x03\x00\xe2\x7f\x03\x00\x0b\x80\x03\x002\x80\x03\x00X\x80\x03\x00o\x80\x03\x00\xa3\x80\x03\x00\xce\x80\x03\x00\xfa\x80\x03\x00\x05\x81\x03\x00F\x81\x03\x00\x81\x81\x03\x00\xa5\x81\x03\x00\xc1\x81\x03\x00\xe2\x81\x03\x00\x0e\x82\x03\x008\x82\x03\x00X\x82\x03\x00|\x82\x03\x00\xa3\x82\x03\x00\xb2\x82\x03\x00'
+    b'\xb7\x82\x03\x00\xcb\x82\x03\x00\xde\x82\x03\x00\x1c\x83\x03\x00M\x83\x03\x00i\x83\x03\x00\xa8\x83\x03\x00\xd2\x83\x03\x00\xf9\x83\x03\x00#\x84\x03\x00F\x84\x03\x00o\x84\x03\x00\xa3\x84\x03\x00\xc1\x84\x03\x00\xdf\x84\x03\x00\x0f\x85\x03\x00C\x85\x03\x00h\x85\x03\x00\x96\x85\x03\x00\xc4\x85\x03\x00\xe5\x85\x03\x00\r\x86\x03\x007\x86\x03\x00^\x86\x03\x00'
+    b'\x84\x86\x03\x00\xaf\x86\x03\x00\xe3\x86\x03\x00\x14\x87\x03\x00@\x87\x03\x00b\x87\x03\x00\x84\x87\x03\x00\xc3\x87\x03\x00\xfc\x87\x03\x00\x14\x88\x03\x00?\x88\x03\x00j\x88\x03\x00\xa3\x88\x03\x00\xdc\x88\x03\x00\x18\x89\x03\x00\\\x89\x03\x00\x8a\x89\x03\x00\xb8\x89\x03\x00\xe6\x89\x03\x00\x08\x8a\x03\x005\x8a\x03\x00S\x8a\x03\x00\x7f\x8a\x03\x00\xab\x8a\x03\x00'
+    b'\xc7\x8a\x03\x00\xe7\x8a\x03\x00\xf6\x8a\x03\x00!\x8b\x03\x00Y\x8b\x03\x00{\x8b\x03\x00\x93\x8b\x03\x00\xa0\x8b\x03\x00\xbe\x8b\x03\x00\xe7\x8b\x03\x00\x16\x8c\x03\x00@\x8c\x03\x00b\x8c\x03\x00\x89\x8c\x03\x00\xb1\x8c\x03\x00\xe0\x8c\x03\x00\x07\x8d\x03\x00G\x8d\x03\x00\x82\x8d\x03\x00\xa8\x8d\x03\x00\xda\x8d\x03\x00\x07\x8e\x03\x00<\x8e\x03\x00a\x8e\x03\x00'
+    b'\x89\x8e\x03\x00\xa4\x8e\x03\x00\xc1\x8e\x03\x00\xd8\x8e\x03\x00\xf8\x8e\x03\x00-\x8f\x03\x00l\x8f\x03\x00\x8f\x8f\x03\x00\xc2\x8f\x03\x00\xdf\x8f\x03\x00\x1d\x90\x03\x00S\x90\x03\x00v\x90\x03\x00\x9f\x90\x03\x00\xbe\x90\x03\x00\xde\x90\x03\x00\x0f\x91\x03\x005\x91\x03\x00^\x91\x03\x00\x98\x91\x03\x00\xbe\x91\x03\x00\xf0\x91\x03\x00\xff\x91\x03\x00\x0e\x92\x03\x00'
+    b'&\x92\x03\x00Z\x92\x03\x00\x81\x92\x03\x00\xb1\x92\x03\x00\xd8\x92\x03\x00\x11\x93\x03\x00O\x93\x03\x00l\x93\x03\x00\x97\x93\x03\x00\xcf\x93\x03\x00\x07\x94\x03\x00\x1e\x94\x03\x00J\x94\x03\x00w\x94\x03\x00\xa8\x94\x03\x00\xc1\x94\x03\x00\xf2\x94\x03\x00"\x95\x03\x000\x95\x03\x00G\x95\x03\x00i\x95\x03\x00\xa0\x95\x03\x00\xdd\x95\x03\x00\x03\x96\x03\x00'
+    b"?\x96\x03\x00y\x96\x03\x00\x8d\x96\x03\x00\xaf\x96\x03\x00\xd2\x96\x03\x00\x03\x97\x03\x00'\x97\x03\x00a\x97\x03\x00\x86\x97\x03\x00\x9c\x97\x03\x00\xb9\x97\x03\x00\xd8\x97\x03\x00\n\x98\x03\x00?\x98\x03\x00U\x98\x03\x00w\x98\x03\x00\xa7\x98\x03\x00\xdc\x98\x03\x00\x12\x99\x03\x00F\x99\x03\x00x\x99\x03\x00\x90\x99\x03\x00\xa5\x99\x03\x00\xd5\x99\x03\x00"
+    b"\xfb\x99\x03\x003\x9a\x03\x00]\x9a\x03\x00z\x9a\x03\x00\x97\x9a\x03\x00\xb9\x9a\x03\x00\xf0\x9a\x03\x00\n\x9b\x03\x00'\x9b\x03\x00Y\x9b\x03\x00\x82\x9b\x03\x00\xb5\x9b\x03\x00\xdc\x9b\x03\x00\x0e\x9c\x03\x00(\x9c\x03\x00Z\x9c\x03\x00{\x9c\x03\x00\xa2\x9c\x03\x00\xcd\x9c\x03\x00\xe8\x9c\x03\x00\x0b\x9d\x03\x002\x9d\x03\x00X\x9d\x03\x00u\x9d\x03\x00"
+    b'\x8b\x9d\x03\x00\xac\x9d\x03\x00\xc6\x9d\x03\x00\xf3\x9d\x03\x00-\x9e\x03\x00R\x9e\x03\x00{\x9e\x03\x00\xa6\x9e\x03\x00\xbf\x9e\x03\x00\xde\x9e\x03\x00\x0c\x9f\x03\x00#\x9f\x03\x00P\x9f\x03\x00g\x9f\x03\x00\x8b\x9f\x03\x00\xa0\x9f\x03\x00\xc6\x9f\x03\x00\x01\xa0\x03\x00$\xa0\x03\x00N\xa0\x03\x00\x82\xa0\x03\x00\xa6\xa0\x03\x00\xcc\xa0\x03\x00\xf2\xa0\x03\x00'
+    b"'\xa1\x03\x00X\xa1\x03\x00\x9a\xa1\x03\x00\xbf\xa1\x03\x00\xe0\xa1\x03\x00\x03\xa2\x03\x002\xa2\x03\x00`\xa2\x03\x00\x8f\xa2\x03\x00\xd5\xa2\x03\x00\xfc\xa2\x03\x00\x1e\xa3\x03\x00A\xa3\x03\x00y\xa3\x03\x00\xa6\xa3\x03\x00\xc4\xa3\x03\x00\xec\xa3\x03\x001\xa4\x03\x00g\xa4\x03\x00u\xa4\x03\x00\x96\xa4\x03\x00\xd9\xa4\x03\x00\x17\xa5\x03\x00R\xa5\x03\x00"
+    b'x\xa5\x03\x00\x9c\xa5\x03\x00\xc3\xa5\x03\x00\xe8\xa5\x03\x00\x02\xa6\x03\x003\xa6\x03\x00d\xa6\x03\x00\x91\xa6\x03\x00\xb6\xa6\x03\x00\xde\xa6\x03\x00\x14\xa7\x03\x002\xa7\x03\x00Y\xa7\x03\x00\x95\xa7\x03\x00\xba\xa7\x03\x00\xd6\xa7\x03\x00\xf3\xa7\x03\x00$\xa8\x03\x001\xa8\x03\x00j\xa8\x03\x00\xa3\xa8\x03\x00\xdb\xa8\x03\x00\xf6\xa8\x03\x00(\xa9\x03\x00'
+    b'M\xa9\x03\x00\x87\xa9\x03\x00\xa4\xa9\x03\x00\xc0\xa9\x03\x00\xe4\xa9\x03\x00\x1a\xaa\x03\x00<\xaa\x03\x00n\xaa\x03\x00\x90\xaa\x03\x00\xc3\xaa\x03\x00\xd2\xaa\x03\x00\xfc\xaa\x03\x00/\xab\x03\x00]\xab\x03\x00\x7f\xab\x03\x00\xb7\xab\x03\x00\xd2\xab\x03\x00\xfc\xab\x03\x00/\xac\x03\x00d\xac\x03\x00\x8c\xac\x03\x00\xb2\xac\x03\x00\xc6\xac\x03\x00\xd4\xac\x03\x00'
+    b'\xeb\xac\x03\x00\x0e\xad\x03\x00-\xad\x03\x00V\xad\x03\x00{\xad\x03\x00\x97\xad\x03\x00\xad\xad\x03\x00\xc4\xad\x03\x00\xdf\xad\x03\x00\n\xae\x03\x00<\xae\x03\x00a\xae\x03\x00\x98\xae\x03\x00\xc0\xae\x03\x00\xee\xae\x03\x00\x15\xaf\x03\x00L\xaf\x03\x00k\xaf\x03\x00\xa1\xaf\x03\x00\xbe\xaf\x03\x00\xf0\xaf\x03\x00\x0e\xb0\x03\x00A\xb0\x03\x00c\xb0\x03\x00'
+    b'\x83\xb0\x03\x00\xa4\xb0\x03\x00\xc6\xb0\x03\x00\xf9\xb0\x03\x00\x1c\xb1\x03\x00:\xb1\x03\x00R\xb1\x03\x00s\xb1\x03\x00\x84\xb1\x03\x00\xb4\xb1\x03\x00\xea\xb1\x03\x00\x17\xb2\x03\x00C\xb2\x03\x00h\xb2\x03\x00\x88\xb2\x03\x00\x99\xb2\x03\x00\xc7\xb2\x03\x00\xf8\xb2\x03\x00\x1f\xb3\x03\x002\xb3\x03\x00T\xb3\x03\x00o\xb3\x03\x00\x9f\xb3\x03\x00\xb6\xb3\x03\x00'
+    b'\x01\xb4\x03\x005\xb4\x03\x00j\xb4\x03\x00\xae\xb4\x03\x00\xd3\xb4\x03\x00\xf5\xb4\x03\x00 \xb5\x03\x00P\xb5\x03\x00q\xb5\x03\x00\x8f\xb5\x03\x00\xba\xb5\x03\x00\xda\xb5\x03\x00\xfe\xb5\x03\x00:\xb6\x03\x00^\xb6\x03\x00\x96\xb6\x03\x00\xa1\xb6\x03\x00\xac\xb6\x03\x00\xda\xb6\x03\x00\x06\xb7\x03\x004\xb7\x03\x00[\xb7\x03\x00\x90\xb7\x03\x00\xba\xb7\x03\x00'
+    b'\xd8\xb7\x03\x00\xf6\xb7\x03\x00\x01\xb8\x03\x00\x0c\xb8\x03\x001\xb8\x03\x00a\xb8\x03\x00m\xb8\x03\x00\x85\xb8\x03\x00\x9a\xb8\x03\x00\xdc\xb8\x03\x00\x01\xb9\x03\x00+\xb9\x03\x00f\xb9\x03\x00\x85\xb9\x03\x00\xba\xb9\x03\x00\xe9\xb9\x03\x00\x04\xba\x03\x00\x13\xba\x03\x00A\xba\x03\x00d\xba\x03\x00\x94\xba\x03\x00\xab\xba\x03\x00\xd6\xba\x03\x00\xfb\xba\x03\x00'
+    b'\x0b\xbb\x03\x00?\xbb\x03\x00|\xbb\x03\x00\x99\xbb\x03\x00\xc1\xbb\x03\x00\xed\xbb\x03\x00/\xbc\x03\x00V\xbc\x03\x00v\xbc\x03\x00\xa7\xbc\x03\x00\xb7\xbc\x03\x00\xc5\xbc\x03\x00\xf8\xbc\x03\x00.\xbd\x03\x00L\xbd\x03\x00b\xbd\x03\x00\x8a\xbd\x03\x00\x9b\xbd\x03\x00\xc1\xbd\x03\x00\xda\xbd\x03\x00\x02\xbe\x03\x00+\xbe\x03\x00L\xbe\x03\x00z\xbe\x03\x00'
+    b'\xa5\xbe\x03\x00\xd0\xbe\x03\x00\xf7\xbe\x03\x00\x1e\xbf\x03\x005\xbf\x03\x00d\xbf\x03\x00\x9c\xbf\x03\x00\xd2\xbf\x03\x00\xfa\xbf\x03\x00)\xc0\x03\x00O\xc0\x03\x00t\xc0\x03\x00\xa5\xc0\x03\x00\xd4\xc0\x03\x00\xfb\xc0\x03\x00\x11\xc1\x03\x004\xc1\x03\x00[\xc1\x03\x00u\xc1\x03\x00\x9f\xc1\x03\x00\xd5\xc1\x03\x00\n\xc2\x03\x00%\xc2\x03\x00E\xc2\x03\x00'
+    b'q\xc2\x03\x00\xaa\xc2\x03\x00\xd8\xc2\x03\x00\x0e\xc3\x03\x00J\xc3\x03\x00z\xc3\x03\x00\xb5\xc3\x03\x00\xfe\xc3\x03\x000\xc4\x03\x00A\xc4\x03\x00g\xc4\x03\x00\x9b\xc4\x03\x00\xc8\xc4\x03\x00\xfe\xc4\x03\x00\x1b\xc5\x03\x00P\xc5\x03\x00\x80\xc5\x03\x00\xa2\xc5\x03\x00\xbb\xc5\x03\x00\xf0\xc5\x03\x00\x10\xc6\x03\x00<\xc6\x03\x00\x8a\xc6\x03\x00\xc7\xc6\x03\x00'
+    b'\xe8\xc6\x03\x00\x05\xc7\x03\x00/\xc7\x03\x00Z\xc7\x03\x00~\xc7\x03\x00\x9f\xc7\x03\x00\xcc\xc7\x03\x00\xe4\xc7\x03\x00\r\xc8\x03\x000\xc8\x03\x00K\xc8\x03\x00_\xc8\x03\x00\x83\xc8\x03\x00\x9e\xc8\x03\x00\xc0\xc8\x03\x00\xd5\xc8\x03\x00\xf4\xc8\x03\x00$\xc9\x03\x00P\xc9\x03\x00~\xc9\x03\x00\x9b\xc9\x03\x00\xb4\xc9\x03\x00\xdf\xc9\x03\x00\xfa\xc9\x03\x00'
+    b'\x15\xca\x03\x00/\xca\x03\x00V\xca\x03\x00q\xca\x03\x00\x90\xca\x03\x00\xbb\xca\x03\x00\xe2\xca\x03\x00\x0f\xcb\x03\x003\xcb\x03\x00d\xcb\x03\x00z\xcb\x03\x00\xba\xcb\x03\x00\xce\xcb\x03\x00\xe7\xcb\x03\x00\xfb\xcb\x03\x00\x0e\xcc\x03\x00;\xcc\x03\x00`\xcc\x03\x00\x94\xcc\x03\x00\xc2\xcc\x03\x00\xe9\xcc\x03\x00\x13\xcd\x03\x00/\xcd\x03\x00S\xcd\x03\x00'
+    b'd\xcd\x03\x00\x8e\xcd\x03\x00\xad\xcd\x03\x00\xd9\xcd\x03\x00\xfb\xcd\x03\x00\x0e\xce\x03\x00\x1e\xce\x03\x00A\xce\x03\x00d\xce\x03\x00\x8d\xce\x03\x00\xaa\xce\x03\x00\xd6\xce\x03\x00\x0c\xcf\x03\x009\xcf\x03\x00_\xcf\x03\x00\x81\xcf\x03\x00\xa3\xcf\x03\x00\xcd\xcf\x03\x00\xed\xcf\x03\x00\x19\xd0\x03\x003\xd0\x03\x00k\xd0\x03\x00\xa7\xd0\x03\x00\xb8\xd0\x03\x00'
+    b'\xdd\xd0\x03\x00\n\xd1\x03\x005\xd1\x03\x00C\xd1\x03\x00k\xd1\x03\x00\x93\xd1\x03\x00\xb2\xd1\x03\x00\xd2\xd1\x03\x00\xf2\xd1\x03\x00\x12\xd2\x03\x00E\xd2\x03\x00a\xd2\x03\x00v\xd2\x03\x00\x93\xd2\x03\x00\xc3\xd2\x03\x00\xfb\xd2\x03\x00,\xd3\x03\x00L\xd3\x03\x00s\xd3\x03\x00\x86\xd3\x03\x00\xb7\xd3\x03\x00\xca\xd3\x03\x00\xe5\xd3\x03\x00\xfa\xd3\x03\x00'
+    b"\x04\xd4\x03\x00\x0e\xd4\x03\x001\xd4\x03\x00Z\xd4\x03\x00}\xd4\x03\x00\xaa\xd4\x03\x00\xd3\xd4\x03\x00\xf1\xd4\x03\x00!\xd5\x03\x00G\xd5\x03\x00[\xd5\x03\x00n\xd5\x03\x00\x8f\xd5\x03\x00\xc3\xd5\x03\x00\xd8\xd5\x03\x00\xfd\xd5\x03\x000\xd6\x03\x00?\xd6\x03\x00f\xd6\x03\x00\x93\xd6\x03\x00\xb9\xd6\x03\x00\xd5\xd6\x03\x00\xff\xd6\x03\x00'\xd7\x03\x00"
+    b'_\xd7\x03\x00\x88\xd7\x03\x00\xad\xd7\x03\x00\xd3\xd7\x03\x00\xe5\xd7\x03\x00\x17\xd8\x03\x005\xd8\x03\x00[\xd8\x03\x00\x8a\xd8\x03\x00\xb9\xd8\x03\x00\xe0\xd8\x03\x00\x19\xd9\x03\x007\xd9\x03\x00X\xd9\x03\x00\x92\xd9\x03\x00\xbf\xd9\x03\x00\xd4\xd9\x03\x00\xeb\xd9\x03\x00\xff\xd9\x03\x00\x1a\xda\x03\x008\xda\x03\x00U\xda\x03\x00\x7f\xda\x03\x00\xb2\xda\x03\x00'
+    b'\xe0\xda\x03\x00\xf8\xda\x03\x00\x1a\xdb\x03\x00*\xdb\x03\x008\xdb\x03\x00h\xdb\x03\x00z\xdb\x03\x00\xae\xdb\x03\x00\xdc\xdb\x03\x00*\xdc\x03\x00G\xdc\x03\x00c\xdc\x03\x00\xa1\xdc\x03\x00\xb3\xdc\x03\x00\xd6\xdc\x03\x00\xf5\xdc\x03\x00\x1f\xdd\x03\x00D\xdd\x03\x00e\xdd\x03\x00\x85\xdd\x03\x00\xa4\xdd\x03\x00\xc5\xdd\x03\x00\xd8\xdd\x03\x00\xed\xdd\x03\x00'
+    b'\x01\xde\x03\x00\x17\xde\x03\x00/\xde\x03\x00A\xde\x03\x00d\xde\x03\x00t\xde\x03\x00\x9a\xde\x03\x00\xb8\xde\x03\x00\xe5\xde\x03\x00\r\xdf\x03\x008\xdf\x03\x00j\xdf\x03\x00\xac\xdf\x03\x00\xe9\xdf\x03\x00\x1c\xe0\x03\x005\xe0\x03\x00S\xe0\x03\x00v\xe0\x03\x00\xa1\xe0\x03\x00\xc9\xe0\x03\x00\xf8\xe0\x03\x00.\xe1\x03\x00d\xe1\x03\x00\x9a\xe1\x03\x00'
+    b"\xb2\xe1\x03\x00\xca\xe1\x03\x00\xe2\xe1\x03\x00\x13\xe2\x03\x00K\xe2\x03\x00\x83\xe2\x03\x00\xa2\xe2\x03\x00\xbb\xe2\x03\x00\xd8\xe2\x03\x00\x06\xe3\x03\x002\xe3\x03\x00[\xe3\x03\x00\x80\xe3\x03\x00\x93\xe3\x03\x00\xb8\xe3\x03\x00\xe0\xe3\x03\x00\x00\xe4\x03\x00'\xe4\x03\x00V\xe4\x03\x00`\xe4\x03\x00\x80\xe4\x03\x00\x8f\xe4\x03\x00\xb4\xe4\x03\x00\xe2\xe4\x03\x00"
+    b'\x00\xe5\x03\x00\x1b\xe5\x03\x00F\xe5\x03\x00p\xe5\x03\x00\xa1\xe5\x03\x00\xcb\xe5\x03\x00\xf3\xe5\x03\x00\x01\xe6\x03\x00>\xe6\x03\x00Q\xe6\x03\x00n\xe6\x03\x00\x91\xe6\x03\x00\xaa\xe6\x03\x00\xde\xe6\x03\x00\x14\xe7\x03\x00H\xe7\x03\x00|\xe7\x03\x00\xa1\xe7\x03\x00\xd9\xe7\x03\x00\xf8\xe7\x03\x00$\xe8\x03\x00F\xe8\x03\x00m\xe8\x03\x00\x88\xe8\x03\x00'
+    b'\xac\xe8\x03\x00\xd7\xe8\x03\x00\x03\xe9\x03\x00\x18\xe9\x03\x00"\xe9\x03\x00,\xe9\x03\x007\xe9\x03\x00=\xe9\x03\x00`\xe9\x03\x00z\xe9\x03\x00\xaa\xe9\x03\x00\xc6\xe9\x03\x00\xd8\xe9\x03\x00\xf0\xe9\x03\x00#\xea\x03\x00R\xea\x03\x00o\xea\x03\x00\x9a\xea\x03\x00\xb4\xea\x03\x00\xca\xea\x03\x00\xdf\xea\x03\x00\r\xeb\x03\x00\x1f\xeb\x03\x00?\xeb\x03\x00'
+    b'a\xeb\x03\x00\x8b\xeb\x03\x00\xb1\xeb\x03\x00\xc2\xeb\x03\x00\xf4\xeb\x03\x00!\xec\x03\x00X\xec\x03\x00e\xec\x03\x00\x9d\xec\x03\x00\xc2\xec\x03\x00\xe3\xec\x03\x00\t\xed\x03\x006\xed\x03\x00i\xed\x03\x00\x90\xed\x03\x00\xba\xed\x03\x00\xcc\xed\x03\x00\xec\xed\x03\x00\x13\xee\x03\x00,\xee\x03\x00Y\xee\x03\x00x\xee\x03\x00\xa8\xee\x03\x00\xd1\xee\x03\x00'
+    b'\xfb\xee\x03\x00\x19\xef\x03\x004\xef\x03\x00R\xef\x03\x00v\xef\x03\x00\xac\xef\x03\x00\xe5\xef\x03\x00\x11\xf0\x03\x00M\xf0\x03\x00\x80\xf0\x03\x00\xa9\xf0\x03\x00\xde\xf0\x03\x00\r\xf1\x03\x00;\xf1\x03\x00T\xf1\x03\x00u\xf1\x03\x00\x8f\xf1\x03\x00\xb0\xf1\x03\x00\xdd\xf1\x03\x00\t\xf2\x03\x00)\xf2\x03\x00S\xf2\x03\x00i\xf2\x03\x00|\xf2\x03\x00'
+    b'\xa8\xf2\x03\x00\xca\xf2\x03\x00\xdd\xf2\x03\x00\x08\xf3\x03\x00-\xf3\x03\x00i\xf3\x03\x00\x89\xf3\x03\x00\xb4\xf3\x03\x00\xcc\xf3\x03\x00\xe4\xf3\x03\x00\x00\xf4\x03\x00*\xf4\x03\x00P\xf4\x03\x00\x86\xf4\x03\x00\xa0\xf4\x03\x00\xca\xf4\x03\x00\xf8\xf4\x03\x00-\xf5\x03\x00L\xf5\x03\x00{\xf5\x03\x00\x82\xf5\x03\x00\x95\xf5\x03\x00\xa6\xf5\x03\x00\xcc\xf5\x03\x00'
+    b"\xea\xf5\x03\x00\x08\xf6\x03\x00-\xf6\x03\x00O\xf6\x03\x00s\xf6\x03\x00\xa6\xf6\x03\x00\xc5\xf6\x03\x00\xfb\xf6\x03\x00\x11\xf7\x03\x00'\xf7\x03\x00B\xf7\x03\x00T\xf7\x03\x00q\xf7\x03\x00\x86\xf7\x03\x00\x97\xf7\x03\x00\xae\xf7\x03\x00\xbf\xf7\x03\x00\xd3\xf7\x03\x00\xe6\xf7\x03\x00\xff\xf7\x03\x005\xf8\x03\x00l\xf8\x03\x00}\xf8\x03\x00\x8f\xf8\x03\x00"
+    b'\x9e\xf8\x03\x00\xac\xf8\x03\x00\xbb\xf8\x03\x00\xc9\xf8\x03\x00\xe6\xf8\x03\x00\x04\xf9\x03\x00\x1c\xf9\x03\x003\xf9\x03\x00F\xf9\x03\x00Z\xf9\x03\x00n\xf9\x03\x00\x83\xf9\x03\x00\x9f\xf9\x03\x00\xbc\xf9\x03\x00\xd6\xf9\x03\x00\xf0\xf9\x03\x00\x0f\xfa\x03\x001\xfa\x03\x00P\xfa\x03\x00s\xfa\x03\x00\xa4\xfa\x03\x00\xb9\xfa\x03\x00\xe0\xfa\x03\x00\xf7\xfa\x03\x00'
+    b"\x1b\xfb\x03\x007\xfb\x03\x00U\xfb\x03\x00g\xfb\x03\x00\x8f\xfb\x03\x00\xa8\xfb\x03\x00\xc9\xfb\x03\x00\xdc\xfb\x03\x00\xff\xfb\x03\x00\x1e\xfc\x03\x00P\xfc\x03\x00l\xfc\x03\x00\x8a\xfc\x03\x00\xae\xfc\x03\x00\xcf\xfc\x03\x00\xec\xfc\x03\x00\n\xfd\x03\x00'\xfd\x03\x00U\xfd\x03\x00l\xfd\x03\x00\x9e\xfd\x03\x00\xe0\xfd\x03\x00\x02\xfe\x03\x00/\xfe\x03\x00"
+    b"P\xfe\x03\x00d\xfe\x03\x00\x88\xfe\x03\x00\xaa\xfe\x03\x00\xca\xfe\x03\x00\xdd\xfe\x03\x00\xef\xfe\x03\x00\x07\xff\x03\x000\xff\x03\x00J\xff\x03\x00{\xff\x03\x00\x9a\xff\x03\x00\xb5\xff\x03\x00\xd1\xff\x03\x00\xf7\xff\x03\x00\x04\x00\x04\x00\x14\x00\x04\x00'\x00\x04\x005\x00\x04\x00D\x00\x04\x00Y\x00\x04\x00r\x00\x04\x00\x84\x00\x04\x00\xa9\x00\x04\x00"
+    b'\xc1\x00\x04\x00\xd6\x00\x04\x00\xf5\x00\x04\x00\x0e\x01\x04\x00D\x01\x04\x00m\x01\x04\x00\x95\x01\x04\x00\xc5\x01\x04\x00\xeb\x01\x04\x00\xfd\x01\x04\x00\x1d\x02\x04\x00H\x02\x04\x00n\x02\x04\x00\x98\x02\x04\x00\xc2\x02\x04\x00\xee\x02\x04\x00\n\x03\x04\x00\x1f\x03\x04\x008\x03\x04\x00O\x03\x04\x00c\x03\x04\x00\x85\x03\x04\x00\xb2\x03\x04\x00\xcb\x03\x04\x00'
+    b'\xdb\x03\x04\x00\xf4\x03\x04\x00\x18\x04\x04\x00=\x04\x04\x00K\x04\x04\x00V\x04\x04\x00~\x04\x04\x00\x96\x04\x04\x00\xca\x04\x04\x00\xe3\x04\x04\x00\xfc\x04\x04\x00\x19\x05\x04\x00<\x05\x04\x00l\x05\x04\x00z\x05\x04\x00\x94\x05\x04\x00\xba\x05\x04\x00\xe0\x05\x04\x00\x00\x06\x04\x00\x10\x06\x04\x00-\x06\x04\x00U\x06\x04\x00e\x06\x04\x00\x99\x06\x04\x00'
+    b'\xcd\x06\x04\x00\xf4\x06\x04\x00\x16\x07\x04\x00J\x07\x04\x00v\x07\x04\x00\x99\x07\x04\x00\xa3\x07\x04\x00\xbb\x07\x04\x00\xf2\x07\x04\x00\x0f\x08\x04\x00=\x08\x04\x00Z\x08\x04\x00t\x08\x04\x00\x99\x08\x04\x00\xaa\x08\x04\x00\xba\x08\x04\x00\xd5\x08\x04\x00\xf7\x08\x04\x00\x1c\t\x04\x00C\t\x04\x00\\\t\x04\x00z\t\x04\x00\xaa\t\x04\x00\xca\t\x04\x00'
+    b'\xdc\t\x04\x00\x02\n\x04\x00\x1a\n\x04\x001\n\x04\x00h\n\x04\x00\x9a\n\x04\x00\xc2\n\x04\x00\xee\n\x04\x00\r\x0b\x04\x00)\x0b\x04\x00G\x0b\x04\x00a\x0b\x04\x00\x86\x0b\x04\x00\xab\x0b\x04\x00\xd4\x0b\x04\x00\x00\x0c\x04\x00\x1a\x0c\x04\x00P\x0c\x04\x00\x83\x0c\x04\x00\xaf\x0c\x04\x00\xc6\x0c\x04\x00\xee\x0c\x04\x00\x13\r\x04\x00@\r\x04\x00'
+    b'l\r\x04\x00\x95\r\x04\x00\xb6\r\x04\x00\xd3\r\x04\x00\xfa\r\x04\x00\x19\x0e\x04\x00-\x0e\x04\x00V\x0e\x04\x00l\x0e\x04\x00~\x0e\x04\x00\x99\x0e\x04\x00\xb2\x0e\x04\x00\xd5\x0e\x04\x00\xf6\x0e\x04\x00\x13\x0f\x04\x00H\x0f\x04\x00p\x0f\x04\x00\x98\x0f\x04\x00\xd0\x0f\x04\x00\xea\x0f\x04\x00\x0e\x10\x04\x00<\x10\x04\x00\x82\x10\x04\x00\xb2\x10\x04\x00'
+    b'\xc7\x10\x04\x00\xf4\x10\x04\x00\x07\x11\x04\x00\x15\x11\x04\x00)\x11\x04\x009\x11\x04\x00l\x11\x04\x00\x9a\x11\x04\x00\xab\x11\x04\x00\xe3\x11\x04\x00\n\x12\x04\x00\x1a\x12\x04\x004\x12\x04\x00g\x12\x04\x00\x95\x12\x04\x00\xc8\x12\x04\x00\xf7\x12\x04\x00%\x13\x04\x00A\x13\x04\x00a\x13\x04\x00\x86\x13\x04\x00\xa1\x13\x04\x00\xe4\x13\x04\x00\x03\x14\x04\x00'
+    b'\x12\x14\x04\x00.\x14\x04\x00=\x14\x04\x00e\x14\x04\x00o\x14\x04\x00\x90\x14\x04\x00\xab\x14\x04\x00\xd7\x14\x04\x00\xfe\x14\x04\x008\x15\x04\x00]\x15\x04\x00\x83\x15\x04\x00\xa8\x15\x04\x00\xc7\x15\x04\x00\x03\x16\x04\x00\x1f\x16\x04\x00<\x16\x04\x00f\x16\x04\x00\x83\x16\x04\x00\x9f\x16\x04\x00\xb8\x16\x04\x00\xdb\x16\x04\x00\xf8\x16\x04\x00!\x17\x04\x00'
+    b'P\x17\x04\x00v\x17\x04\x00\x9a\x17\x04\x00\xbb\x17\x04\x00\xeb\x17\x04\x00\r\x18\x04\x00,\x18\x04\x00b\x18\x04\x00\x95\x18\x04\x00\xb7\x18\x04\x00\xe1\x18\x04\x00\x04\x19\x04\x006\x19\x04\x00j\x19\x04\x00\x9e\x19\x04\x00\xd4\x19\x04\x00\x03\x1a\x04\x00%\x1a\x04\x00T\x1a\x04\x00p\x1a\x04\x00\x9d\x1a\x04\x00\xbf\x1a\x04\x00\xe0\x1a\x04\x00\r\x1b\x04\x00'
+    b'+\x1b\x04\x00L\x1b\x04\x00k\x1b\x04\x00\x85\x1b\x04\x00\xa8\x1b\x04\x00\xc1\x1b\x04\x00\xee\x1b\x04\x00\x10\x1c\x04\x00D\x1c\x04\x00r\x1c\x04\x00\x92\x1c\x04\x00\xa6\x1c\x04\x00\xb5\x1c\x04\x00\xcf\x1c\x04\x00\xdf\x1c\x04\x00\xed\x1c\x04\x00\x10\x1d\x04\x00.\x1d\x04\x00L\x1d\x04\x00l\x1d\x04\x00\xa0\x1d\x04\x00\xca\x1d\x04\x00\xda\x1d\x04\x00\x00\x1e\x04\x00'
+    b"\x18\x1e\x04\x00'\x1e\x04\x00]\x1e\x04\x00\x81\x1e\x04\x00\xa5\x1e\x04\x00\xc9\x1e\x04\x00\xe7\x1e\x04\x00\x18\x1f\x04\x00+\x1f\x04\x00K\x1f\x04\x00m\x1f\x04\x00\x8a\x1f\x04\x00\xae\x1f\x04\x00\xc1\x1f\x04\x00\xe3\x1f\x04\x00% \x04\x00N \x04\x00s \x04\x00\x92 \x04\x00\xca \x04\x00\xf2 \x04\x00\x19!\x04\x00?!\x04\x00s!\x04\x00"
+    b'\x8f!\x04\x00\xc6!\x04\x00\xed!\x04\x00\x18"\x04\x007"\x04\x00R"\x04\x00d"\x04\x00z"\x04\x00\x9a"\x04\x00\xb9"\x04\x00\xe4"\x04\x00\x01#\x04\x00##\x04\x00R#\x04\x00i#\x04\x00~#\x04\x00\xa5#\x04\x00\xc6#\x04\x00\xe8#\x04\x00\x0b$\x04\x00\'$\x04\x00g$\x04\x00\x80$\x04\x00\xa1$\x04\x00'
+    b"\xc3$\x04\x00\xd1$\x04\x00\xdb$\x04\x00\xfe$\x04\x001%\x04\x00B%\x04\x00P%\x04\x00i%\x04\x00\x98%\x04\x00\xc0%\x04\x00\xd2%\x04\x00\x00&\x04\x00(&\x04\x00X&\x04\x00q&\x04\x00\x9f&\x04\x00\xab&\x04\x00\xbd&\x04\x00\xd5&\x04\x00\xf1&\x04\x00\x13'\x04\x00,'\x04\x00S'\x04\x00|'\x04\x00"
+    b"\x9e'\x04\x00\xca'\x04\x00\xf2'\x04\x00\t(\x04\x00&(\x04\x00E(\x04\x00l(\x04\x00\x9b(\x04\x00\xb0(\x04\x00\xd7(\x04\x00\xfa(\x04\x00\x1b)\x04\x007)\x04\x00n)\x04\x00\x81)\x04\x00\x94)\x04\x00\xb5)\x04\x00\xdc)\x04\x00\r*\x04\x00,*\x04\x00L*\x04\x00\x86*\x04\x00\xb7*\x04\x00\xe5*\x04\x00"
+    b'\x0f+\x04\x00&+\x04\x00B+\x04\x00b+\x04\x00\x82+\x04\x00\xb4+\x04\x00\xe4+\x04\x00\x0f,\x04\x00+,\x04\x00D,\x04\x00Y,\x04\x00\x85,\x04\x00\xb2,\x04\x00\xd9,\x04\x00\x06-\x04\x004-\x04\x00]-\x04\x00\x88-\x04\x00\x9d-\x04\x00\xc8-\x04\x00\xed-\x04\x00\x0f.\x04\x000.\x04\x00U.\x04\x00'
+    b'c.\x04\x00\x96.\x04\x00\xb7.\x04\x00\xcd.\x04\x00\xe0.\x04\x00\x02/\x04\x00\x1e/\x04\x00D/\x04\x00_/\x04\x00\x93/\x04\x00\xa6/\x04\x00\xd1/\x04\x00\xde/\x04\x00\x100\x04\x00*0\x04\x0070\x04\x00g0\x04\x00\x990\x04\x00\xbf0\x04\x00\xe30\x04\x00\r1\x04\x00\x1d1\x04\x00G1\x04\x00w1\x04\x00'
+    b'\x991\x04\x00\xba1\x04\x00\xdc1\x04\x00\xef1\x04\x00\x1b2\x04\x00*2\x04\x00R2\x04\x00|2\x04\x00\xa52\x04\x00\xc62\x04\x00\xea2\x04\x00\x0b3\x04\x00,3\x04\x00Z3\x04\x00\x813\x04\x00\xb23\x04\x00\xd43\x04\x00\xf53\x04\x00 4\x04\x00S4\x04\x00v4\x04\x00\xa44\x04\x00\xc64\x04\x00\n5\x04\x00'
+    b"55\x04\x00]5\x04\x00x5\x04\x00\x935\x04\x00\xbc5\x04\x00\xd75\x04\x00\xf05\x04\x00\x016\x04\x00\x1d6\x04\x00I6\x04\x00w6\x04\x00\x856\x04\x00\xad6\x04\x00\xc96\x04\x00\xe76\x04\x00\x1b7\x04\x00'7\x04\x00L7\x04\x00x7\x04\x00\x847\x04\x00\x907\x04\x00\xc07\x04\x00\xdc7\x04\x00\xed7\x04\x00"
+    b'\x158\x04\x00=8\x04\x00c8\x04\x00\x7f8\x04\x00\x9d8\x04\x00\xb78\x04\x00\xd28\x04\x00\xfb8\x04\x00\x1e9\x04\x0059\x04\x00X9\x04\x00\x879\x04\x00\xbc9\x04\x00\xec9\x04\x00\x16:\x04\x009:\x04\x00a:\x04\x00\x8b:\x04\x00\xab:\x04\x00\xcb:\x04\x00\xeb:\x04\x00\x0b;\x04\x00+;\x04\x00N;\x04\x00'
+    b'v;\x04\x00\xa4;\x04\x00\xc9;\x04\x00\xf3;\x04\x00\x10<\x04\x004<\x04\x00Z<\x04\x00j<\x04\x00\x86<\x04\x00\xb7<\x04\x00\xd4<\x04\x00\xfa<\x04\x00 =\x04\x00F=\x04\x00l=\x04\x00\x92=\x04\x00\xbf=\x04\x00\xf4=\x04\x00\x17>\x04\x00=>\x04\x00]>\x04\x00\x93>\x04\x00\xc3>\x04\x00\xf0>\x04\x00'
+    b'\x16?\x04\x00L?\x04\x00\x89?\x04\x00\xa4?\x04\x00\xe6?\x04\x00\x0c@\x04\x00.@\x04\x00N@\x04\x00u@\x04\x00\xa6@\x04\x00\xcd@\x04\x00\xea@\x04\x00\x13A\x04\x00XA\x04\x00|A\x04\x00\x8fA\x04\x00\xbaA\x04\x00\xeaA\x04\x00\x10B\x04\x00,B\x04\x00bB\x04\x00\x99B\x04\x00\xbbB\x04\x00\xc6B\x04\x00'
+    b'\xf8B\x04\x00$C\x04\x00[C\x04\x00\x88C\x04\x00\xb2C\x04\x00\xd5C\x04\x00\xfdC\x04\x00$D\x04\x00ZD\x04\x00{D\x04\x00\xb2D\x04\x00\xd1D\x04\x00\xf2D\x04\x00\x1eE\x04\x00KE\x04\x00xE\x04\x00\x8dE\x04\x00\xa8E\x04\x00\xb8E\x04\x00\xdaE\x04\x00\x01F\x04\x00(F\x04\x00VF\x04\x00\x80F\x04\x00'
+    b'\xbaF\x04\x00\xd5F\x04\x00\tG\x04\x00\x18G\x04\x001G\x04\x00aG\x04\x00\x82G\x04\x00\xa5G\x04\x00\xc9G\x04\x00\xd4G\x04\x00\xe4G\x04\x00\xf5G\x04\x00\x06H\x04\x00\x1dH\x04\x007H\x04\x00QH\x04\x00\x7fH\x04\x00\xb4H\x04\x00\xd2H\x04\x00\x05I\x04\x009I\x04\x00TI\x04\x00rI\x04\x00\x8cI\x04\x00'
+    b'\xc1I\x04\x00\xefI\x04\x00\x18J\x04\x00CJ\x04\x00hJ\x04\x00\x8cJ\x04\x00\xbcJ\x04\x00\xcaJ\x04\x00\xfeJ\x04\x00\x1fK\x04\x00<K\x04\x00NK\x04\x00\x84K\x04\x00\xabK\x04\x00\xd8K\x04\x00\x0bL\x04\x005L\x04\x00QL\x04\x00yL\x04\x00\x86L\x04\x00\xa7L\x04\x00\xd4L\x04\x00\xe5L\x04\x00\rM\x04\x00'
+    b'(M\x04\x00aM\x04\x00\x81M\x04\x00\xabM\x04\x00\xd9M\x04\x00\xf3M\x04\x00&N\x04\x00UN\x04\x00\x7fN\x04\x00\xa7N\x04\x00\xc2N\x04\x00\xe9N\x04\x00\x02O\x04\x004O\x04\x00PO\x04\x00gO\x04\x00\x90O\x04\x00\xadO\x04\x00\xc6O\x04\x00\xe9O\x04\x00\x01P\x04\x00-P\x04\x00OP\x04\x00\x80P\x04\x00'
+    b'\xb0P\x04\x00\xe5P\x04\x00\x08Q\x04\x002Q\x04\x00QQ\x04\x00hQ\x04\x00\x98Q\x04\x00\xc2Q\x04\x00\xedQ\x04\x00\x11R\x04\x007R\x04\x00VR\x04\x00uR\x04\x00\x97R\x04\x00\xb9R\x04\x00\xe1R\x04\x00\xfeR\x04\x00\x15S\x04\x006S\x04\x00aS\x04\x00\x88S\x04\x00\xa3S\x04\x00\xcdS\x04\x00\xf9S\x04\x00'
+    b'\x1dT\x04\x00IT\x04\x00eT\x04\x00\x9bT\x04\x00\xcbT\x04\x00\xe8T\x04\x00\tU\x04\x00AU\x04\x00oU\x04\x00\x92U\x04\x00\xaeU\x04\x00\xccU\x04\x00\xe8U\x04\x00\x11V\x04\x00:V\x04\x00eV\x04\x00\x91V\x04\x00\xbfV\x04\x00\xebV\x04\x00\x08W\x04\x00\x1aW\x04\x009W\x04\x00UW\x04\x00\x7fW\x04\x00'
+    b'\x97W\x04\x00\xb4W\x04\x00\xd6W\x04\x00\x00X\x04\x002X\x04\x00RX\x04\x00oX\x04\x00\x98X\x04\x00\xbcX\x04\x00\xd2X\x04\x00\xfaX\x04\x00\x18Y\x04\x00>Y\x04\x00]Y\x04\x00\x9cY\x04\x00\xdbY\x04\x00\x03Z\x04\x001Z\x04\x00IZ\x04\x00gZ\x04\x00\x82Z\x04\x00\x9fZ\x04\x00\xc2Z\x04\x00\xd2Z\x04\x00'
+    b'\x04[\x04\x00\x1f[\x04\x003[\x04\x00[[\x04\x00\x8c[\x04\x00\x9e[\x04\x00\xc6[\x04\x00\xf5[\x04\x00\r\\\x04\x00"\\\x04\x00A\\\x04\x00^\\\x04\x00\x80\\\x04\x00\x9c\\\x04\x00\xbd\\\x04\x00\xde\\\x04\x00\x0e]\x04\x00$]\x04\x00A]\x04\x00\\]\x04\x00|]\x04\x00\x9e]\x04\x00\xb9]\x04\x00\xd6]\x04\x00'
+    b'\xf5]\x04\x00\r^\x04\x00\x1b^\x04\x004^\x04\x00Q^\x04\x00t^\x04\x00\xa0^\x04\x00\xc3^\x04\x00\xe8^\x04\x00\r_\x04\x00/_\x04\x00H_\x04\x00m_\x04\x00\x98_\x04\x00\xca_\x04\x00\xf1_\x04\x00\x1b`\x04\x00.`\x04\x00[`\x04\x00p`\x04\x00\xa6`\x04\x00\xc2`\x04\x00\xdc`\x04\x00\x14a\x04\x00'
+    b':a\x04\x00la\x04\x00\x8aa\x04\x00\xaca\x04\x00\xcfa\x04\x00\xe1a\x04\x00\xfca\x04\x00\x1bb\x04\x00Fb\x04\x00fb\x04\x00\x85b\x04\x00\xbeb\x04\x00\xddb\x04\x00\xeeb\x04\x00\x0ec\x04\x00,c\x04\x00Lc\x04\x00\x80c\x04\x00\xa3c\x04\x00\xc6c\x04\x00\xe5c\x04\x00\x06d\x04\x000d\x04\x00]d\x04\x00'
+    b'}d\x04\x00\x9ad\x04\x00\xaed\x04\x00\xe7d\x04\x00\re\x04\x00Ke\x04\x00}e\x04\x00\xa4e\x04\x00\xd5e\x04\x00\x16f\x04\x00/f\x04\x00hf\x04\x00\x98f\x04\x00\xbbf\x04\x00\xe7f\x04\x00\x19g\x04\x002g\x04\x00Tg\x04\x00lg\x04\x00\x88g\x04\x00\xb9g\x04\x00\xe2g\x04\x00\xf7g\x04\x00(h\x04\x00'
+    b'Sh\x04\x00\x85h\x04\x00\xafh\x04\x00\xe2h\x04\x00\xf8h\x04\x00\x12i\x04\x00Pi\x04\x00yi\x04\x00\x9ai\x04\x00\xbei\x04\x00\xe9i\x04\x00\x19j\x04\x00Rj\x04\x00~j\x04\x00\x9cj\x04\x00\xb0j\x04\x00\xddj\x04\x00\x0fk\x04\x00@k\x04\x00Sk\x04\x00{k\x04\x00\x9ck\x04\x00\xc8k\x04\x00\xf6k\x04\x00'
+    b")l\x04\x00?l\x04\x00`l\x04\x00\x95l\x04\x00\xb9l\x04\x00\xdfl\x04\x00\x03m\x04\x00'm\x04\x00am\x04\x00\x81m\x04\x00\xa7m\x04\x00\xbbm\x04\x00\xecm\x04\x00\x0en\x04\x005n\x04\x00`n\x04\x00\x7fn\x04\x00\xa7n\x04\x00\xcen\x04\x00\xe5n\x04\x00\xf2n\x04\x00\x07o\x04\x00=o\x04\x00no\x04\x00"
+    b'zo\x04\x00\xa3o\x04\x00\xbao\x04\x00\xd5o\x04\x00\x04p\x04\x00:p\x04\x00pp\x04\x00\xa6p\x04\x00\xdcp\x04\x00\x12q\x04\x00Hq\x04\x00\x83q\x04\x00\xb2q\x04\x00\xceq\x04\x00\xebq\x04\x00\xfdq\x04\x00@r\x04\x00Rr\x04\x00\x85r\x04\x00\x97r\x04\x00\xc0r\x04\x00\xd0r\x04\x00\xe0r\x04\x00\ts\x04\x00'
+    b'6s\x04\x00Ws\x04\x00{s\x04\x00\xa5s\x04\x00\xc1s\x04\x00\xeds\x04\x00\x08t\x04\x003t\x04\x00Tt\x04\x00et\x04\x00\x9at\x04\x00\xc0t\x04\x00\xe4t\x04\x00\x13u\x04\x008u\x04\x00Wu\x04\x00qu\x04\x00\x97u\x04\x00\xb7u\x04\x00\xfcu\x04\x00\x16v\x04\x00;v\x04\x00`v\x04\x00\xa5v\x04\x00'
+    b'\xcbv\x04\x00\xdfv\x04\x00\xfbv\x04\x00#w\x04\x00Vw\x04\x00\x84w\x04\x00\xa7w\x04\x00\xb5w\x04\x00\xddw\x04\x00\xfaw\x04\x00\x06x\x04\x006x\x04\x00cx\x04\x00\x90x\x04\x00\xa5x\x04\x00\xc9x\x04\x00\xfax\x04\x00\x15y\x04\x00By\x04\x00Vy\x04\x00wy\x04\x00\xady\x04\x00\xcfy\x04\x00\x02z\x04\x00'
+    b'\x1az\x04\x002z\x04\x00]z\x04\x00rz\x04\x00\x87z\x04\x00\x9cz\x04\x00\xc8z\x04\x00\xdaz\x04\x00\xfdz\x04\x00${\x04\x00M{\x04\x00r{\x04\x00\x90{\x04\x00\xb3{\x04\x00\xd3{\x04\x00\x03|\x04\x00"|\x04\x00E|\x04\x00s|\x04\x00\x8c|\x04\x00\xb3|\x04\x00\xc0|\x04\x00\xcc|\x04\x00\xe0|\x04\x00'
+    b'\xfd|\x04\x00"}\x04\x00F}\x04\x00w}\x04\x00\x93}\x04\x00\xbc}\x04\x00\xe5}\x04\x00\x03~\x04\x00.~\x04\x00W~\x04\x00|~\x04\x00\x9b~\x04\x00\xc7~\x04\x00\xf0~\x04\x00(\x7f\x04\x00G\x7f\x04\x00j\x7f\x04\x00\x91\x7f\x04\x00\xbe\x7f\x04\x00\xf2\x7f\x04\x00\x18\x80\x04\x00:\x80\x04\x00k\x80\x04\x00\x9b\x80\x04\x00'
+    b'\xc4\x80\x04\x00\xe5\x80\x04\x00\xfd\x80\x04\x00%\x81\x04\x00V\x81\x04\x00\x8e\x81\x04\x00\xb0\x81\x04\x00\xdc\x81\x04\x00\xfc\x81\x04\x00(\x82\x04\x00M\x82\x04\x00o\x82\x04\x00\x8f\x82\x04\x00\xae\x82\x04\x00\xbf\x82\x04\x00\xf6\x82\x04\x00)\x83\x04\x00[\x83\x04\x00\x8d\x83\x04\x00\xb7\x83\x04\x00\xeb\x83\x04\x00\x18\x84\x04\x00)\x84\x04\x00Y\x84\x04\x00'
+    b'~\x84\x04\x00\xb0\x84\x04\x00\xe1\x84\x04\x00\n\x85\x04\x009\x85\x04\x00]\x85\x04\x00y\x85\x04\x00\x99\x85\x04\x00\xbf\x85\x04\x00\xde\x85\x04\x00\xf5\x85\x04\x00!\x86\x04\x00V\x86\x04\x00\x84\x86\x04\x00\xb9\x86\x04\x00\xeb\x86\x04\x00\x0e\x87\x04\x00A\x87\x04\x00W\x87\x04\x00m\x87\x04\x00\xa7\x87\x04\x00\xe1\x87\x04\x00\x14\x88\x04\x00M\x88\x04\x00'
+    b'\x86\x88\x04\x00\xbc\x88\x04\x00\xe6\x88\x04\x00\x0f\x89\x04\x002\x89\x04\x00K\x89\x04\x00^\x89\x04\x00\x8b\x89\x04\x00\x95\x89\x04\x00\xb8\x89\x04\x00\xd5\x89\x04\x00\xf8\x89\x04\x00\x18\x8a\x04\x00A\x8a\x04\x00h\x8a\x04\x00u\x8a\x04\x00\x8e\x8a\x04\x00\xa1\x8a\x04\x00\xb2\x8a\x04\x00\xd1\x8a\x04\x00\xfa\x8a\x04\x00\x0f\x8b\x04\x007\x8b\x04\x00X\x8b\x04\x00'
+    b"j\x8b\x04\x00\x97\x8b\x04\x00\xc0\x8b\x04\x00\xe6\x8b\x04\x00\x14\x8c\x04\x00J\x8c\x04\x00f\x8c\x04\x00}\x8c\x04\x00\xa8\x8c\x04\x00\xcc\x8c\x04\x00\xe0\x8c\x04\x00\x06\x8d\x04\x00+\x8d\x04\x00=\x8d\x04\x00X\x8d\x04\x00s\x8d\x04\x00\xa2\x8d\x04\x00\xc8\x8d\x04\x00\xf4\x8d\x04\x00'\x8e\x04\x00L\x8e\x04\x00k\x8e\x04\x00\x9b\x8e\x04\x00\xcb\x8e\x04\x00"
+    b'\xfc\x8e\x04\x00$\x8f\x04\x00=\x8f\x04\x00H\x8f\x04\x00k\x8f\x04\x00\x91\x8f\x04\x00\xa3\x8f\x04\x00\xad\x8f\x04\x00\xd9\x8f\x04\x00\x18\x90\x04\x00$\x90\x04\x00L\x90\x04\x00\x84\x90\x04\x00\xa5\x90\x04\x00\xd3\x90\x04\x00\xf3\x90\x04\x00\x1f\x91\x04\x00[\x91\x04\x00q\x91\x04\x00\x82\x91\x04\x00\xb1\x91\x04\x00\xdf\x91\x04\x00\t\x92\x04\x001\x92\x04\x00'
+    b'R\x92\x04\x00\x8a\x92\x04\x00\xae\x92\x04\x00\xd1\x92\x04\x00\xf7\x92\x04\x00\x15\x93\x04\x00/\x93\x04\x00R\x93\x04\x00}\x93\x04\x00\xab\x93\x04\x00\xcb\x93\x04\x00\xec\x93\x04\x00\x14\x94\x04\x005\x94\x04\x00g\x94\x04\x00t\x94\x04\x00\xa2\x94\x04\x00\xc0\x94\x04\x00\xcd\x94\x04\x00\xda\x94\x04\x00\xf9\x94\x04\x00\x1e\x95\x04\x00F\x95\x04\x00a\x95\x04\x00'
+    b'\x8a\x95\x04\x00\xb1\x95\x04\x00\xca\x95\x04\x00\xe9\x95\x04\x00\x11\x96\x04\x002\x96\x04\x00C\x96\x04\x00d\x96\x04\x00~\x96\x04\x00\x94\x96\x04\x00\xaa\x96\x04\x00\xca\x96\x04\x00\xea\x96\x04\x00\t\x97\x04\x00\x1e\x97\x04\x00R\x97\x04\x00s\x97\x04\x00\x84\x97\x04\x00\xb9\x97\x04\x00\xd2\x97\x04\x00\xf0\x97\x04\x00\x0f\x98\x04\x00,\x98\x04\x00O\x98\x04\x00'
+    b'\x85\x98\x04\x00\xb8\x98\x04\x00\xed\x98\x04\x00\x1e\x99\x04\x00D\x99\x04\x00k\x99\x04\x00\x96\x99\x04\x00\xc4\x99\x04\x00\xf4\x99\x04\x00\x11\x9a\x04\x004\x9a\x04\x00V\x9a\x04\x00\x80\x9a\x04\x00\xae\x9a\x04\x00\xde\x9a\x04\x00\n\x9b\x04\x00-\x9b\x04\x00a\x9b\x04\x00l\x9b\x04\x00\x93\x9b\x04\x00\xad\x9b\x04\x00\xd8\x9b\x04\x00\xf1\x9b\x04\x00\x10\x9c\x04\x00'
+    b'=\x9c\x04\x00Z\x9c\x04\x00~\x9c\x04\x00\xab\x9c\x04\x00\xca\x9c\x04\x00\x01\x9d\x04\x00#\x9d\x04\x00Q\x9d\x04\x00\x80\x9d\x04\x00\xad\x9d\x04\x00\xdc\x9d\x04\x00\x08\x9e\x04\x004\x9e\x04\x00`\x9e\x04\x00\x8c\x9e\x04\x00\xb8\x9e\x04\x00\xe4\x9e\x04\x00\x11\x9f\x04\x00<\x9f\x04\x00i\x9f\x04\x00\x92\x9f\x04\x00\xbb\x9f\x04\x00\xe4\x9f\x04\x00\x06\xa0\x04\x00'
+    b'.\xa0\x04\x00d\xa0\x04\x00\x85\xa0\x04\x00\xab\xa0\x04\x00\xdf\xa0\x04\x00\x03\xa1\x04\x00+\xa1\x04\x00a\xa1\x04\x00z\xa1\x04\x00\x93\xa1\x04\x00\xaa\xa1\x04\x00\xc5\xa1\x04\x00\xfd\xa1\x04\x00\x19\xa2\x04\x005\xa2\x04\x00\\\xa2\x04\x00y\xa2\x04\x00\x94\xa2\x04\x00\xbf\xa2\x04\x00\xe6\xa2\x04\x00\x07\xa3\x04\x005\xa3\x04\x00U\xa3\x04\x00u\xa3\x04\x00'
+    b'\x8e\xa3\x04\x00\xb2\xa3\x04\x00\xe4\xa3\x04\x00\x0b\xa4\x04\x002\xa4\x04\x00W\xa4\x04\x00{\xa4\x04\x00\xa0\xa4\x04\x00\xca\xa4\x04\x00\xdf\xa4\x04\x00\xfe\xa4\x04\x00(\xa5\x04\x00:\xa5\x04\x00[\xa5\x04\x00\x95\xa5\x04\x00\xa8\xa5\x04\x00\xdb\xa5\x04\x00\xf3\xa5\x04\x00\x15\xa6\x04\x00(\xa6\x04\x00F\xa6\x04\x00S\xa6\x04\x00\x86\xa6\x04\x00\x97\xa6\x04\x00'
+    b'\xb6\xa6\x04\x00\xd9\xa6\x04\x00\xf3\xa6\x04\x00\x1b\xa7\x04\x00A\xa7\x04\x00S\xa7\x04\x00x\xa7\x04\x00\x9f\xa7\x04\x00\xb6\xa7\x04\x00\xc6\xa7\x04\x00\xeb\xa7\x04\x00\n\xa8\x04\x00\x1d\xa8\x04\x00=\xa8\x04\x00k\xa8\x04\x00\x88\xa8\x04\x00\xb4\xa8\x04\x00\xc8\xa8\x04\x00\xfa\xa8\x04\x00\x11\xa9\x04\x00#\xa9\x04\x00G\xa9\x04\x00\x8a\xa9\x04\x00\xa3\xa9\x04\x00'
+    b"\xb5\xa9\x04\x00\xd1\xa9\x04\x00\xde\xa9\x04\x00\x07\xaa\x04\x00'\xaa\x04\x00M\xaa\x04\x00|\xaa\x04\x00\xac\xaa\x04\x00\xe1\xaa\x04\x00\xec\xaa\x04\x00\x1a\xab\x04\x00:\xab\x04\x00Q\xab\x04\x00\x93\xab\x04\x00\xce\xab\x04\x00\xfb\xab\x04\x00(\xac\x04\x00F\xac\x04\x00T\xac\x04\x00r\xac\x04\x00\x7f\xac\x04\x00\x97\xac\x04\x00\xc9\xac\x04\x00\xe6\xac\x04\x00"
+    b'\xfd\xac\x04\x00\x19\xad\x04\x00)\xad\x04\x00T\xad\x04\x00h\xad\x04\x00\x88\xad\x04\x00\x97\xad\x04\x00\xc7\xad\x04\x00\xf1\xad\x04\x00\x13\xae\x04\x00>\xae\x04\x00s\xae\x04\x00\x90\xae\x04\x00\xa2\xae\x04\x00\xbf\xae\x04\x00\xea\xae\x04\x00\x16\xaf\x04\x009\xaf\x04\x00_\xaf\x04\x00\x80\xaf\x04\x00\xa3\xaf\x04\x00\xde\xaf\x04\x00\n\xb0\x04\x006\xb0\x04\x00'
+    b'c\xb0\x04\x00\x97\xb0\x04\x00\xc7\xb0\x04\x00\xd9\xb0\x04\x00\xf3\xb0\x04\x00\x1c\xb1\x04\x00D\xb1\x04\x00]\xb1\x04\x00\x89\xb1\x04\x00\x9f\xb1\x04\x00\xb6\xb1\x04\x00\xea\xb1\x04\x00\x0b\xb2\x04\x00"\xb2\x04\x00J\xb2\x04\x00`\xb2\x04\x00\x97\xb2\x04\x00\xb1\xb2\x04\x00\xc4\xb2\x04\x00\xda\xb2\x04\x00\xf1\xb2\x04\x00\x16\xb3\x04\x00?\xb3\x04\x00P\xb3\x04\x00'
+    b'p\xb3\x04\x00\x8e\xb3\x04\x00\xaa\xb3\x04\x00\xc1\xb3\x04\x00\xd1\xb3\x04\x00\xf0\xb3\x04\x00\x1f\xb4\x04\x008\xb4\x04\x00X\xb4\x04\x00w\xb4\x04\x00\xa0\xb4\x04\x00\xcf\xb4\x04\x00\x04\xb5\x04\x00\x19\xb5\x04\x00;\xb5\x04\x00U\xb5\x04\x00~\xb5\x04\x00\xba\xb5\x04\x00\x01\xb6\x04\x00=\xb6\x04\x00d\xb6\x04\x00q\xb6\x04\x00\x86\xb6\x04\x00\x94\xb6\x04\x00'
+    b'\xa2\xb6\x04\x00\xd3\xb6\x04\x00\xed\xb6\x04\x00\x11\xb7\x04\x00!\xb7\x04\x00,\xb7\x04\x00K\xb7\x04\x00f\xb7\x04\x00\x8b\xb7\x04\x00\xa5\xb7\x04\x00\xaf\xb7\x04\x00\xdc\xb7\x04\x00\xef\xb7\x04\x00\t\xb8\x04\x00\x1b\xb8\x04\x00H\xb8\x04\x00]\xb8\x04\x00r\xb8\x04\x00\x94\xb8\x04\x00\xb1\xb8\x04\x00\xd5\xb8\x04\x00\x05\xb9\x04\x00(\xb9\x04\x00U\xb9\x04\x00'
+    b'x\xb9\x04\x00\xa0\xb9\x04\x00\xc7\xb9\x04\x00\xd7\xb9\x04\x00\xfc\xb9\x04\x002\xba\x04\x00D\xba\x04\x00V\xba\x04\x00u\xba\x04\x00\xa1\xba\x04\x00\xc8\xba\x04\x00\xe5\xba\x04\x00\x02\xbb\x04\x00$\xbb\x04\x00J\xbb\x04\x00Y\xbb\x04\x00\x86\xbb\x04\x00\xa7\xbb\x04\x00\xc7\xbb\x04\x00\xec\xbb\x04\x00\x06\xbc\x04\x00\x11\xbc\x04\x00L\xbc\x04\x00`\xbc\x04\x00'
+    b'p\xbc\x04\x00\x9b\xbc\x04\x00\xb1\xbc\x04\x00\xc1\xbc\x04\x00\xeb\xbc\x04\x00 \xbd\x04\x003\xbd\x04\x00C\xbd\x04\x00c\xbd\x04\x00\x7f\xbd\x04\x00\xb3\xbd\x04\x00\xcd\xbd\x04\x00\xfb\xbd\x04\x00)\xbe\x04\x00W\xbe\x04\x00\x80\xbe\x04\x00\x94\xbe\x04\x00\xc9\xbe\x04\x00\xf6\xbe\x04\x00\x19\xbf\x04\x00<\xbf\x04\x00i\xbf\x04\x00\x94\xbf\x04\x00\xaf\xbf\x04\x00'
+    b'\xc5\xbf\x04\x00\xe8\xbf\x04\x00\x14\xc0\x04\x00@\xc0\x04\x00\\\xc0\x04\x00y\xc0\x04\x00\xa8\xc0\x04\x00\xbe\xc0\x04\x00\xe1\xc0\x04\x00\x04\xc1\x04\x00 \xc1\x04\x00W\xc1\x04\x00\x85\xc1\x04\x00\xa3\xc1\x04\x00\xd2\xc1\x04\x00\xfd\xc1\x04\x00!\xc2\x04\x00K\xc2\x04\x00s\xc2\x04\x00\x98\xc2\x04\x00\xc2\xc2\x04\x00\xec\xc2\x04\x00\x0e\xc3\x04\x00%\xc3\x04\x00'
+    b'@\xc3\x04\x00e\xc3\x04\x00\x8b\xc3\x04\x00\xaa\xc3\x04\x00\xc4\xc3\x04\x00\xd5\xc3\x04\x00\xeb\xc3\x04\x00 \xc4\x04\x00T\xc4\x04\x00j\xc4\x04\x00\x90\xc4\x04\x00\xb2\xc4\x04\x00\xd5\xc4\x04\x00\x07\xc5\x04\x00\x1a\xc5\x04\x00:\xc5\x04\x00J\xc5\x04\x00l\xc5\x04\x00\x88\xc5\x04\x00\xa1\xc5\x04\x00\xb3\xc5\x04\x00\xbd\xc5\x04\x00\xd5\xc5\x04\x00\xe2\xc5\x04\x00'
+    b'\x14\xc6\x04\x008\xc6\x04\x00T\xc6\x04\x00~\xc6\x04\x00\x91\xc6\x04\x00\xb8\xc6\x04\x00\xf0\xc6\x04\x00\x01\xc7\x04\x00 \xc7\x04\x004\xc7\x04\x00U\xc7\x04\x00j\xc7\x04\x00x\xc7\x04\x00\x9a\xc7\x04\x00\xae\xc7\x04\x00\xd5\xc7\x04\x00\xeb\xc7\x04\x00\x0f\xc8\x04\x002\xc8\x04\x00P\xc8\x04\x00}\xc8\x04\x00\x98\xc8\x04\x00\xb5\xc8\x04\x00\xde\xc8\x04\x00'
+    b'\r\xc9\x04\x00+\xc9\x04\x00_\xc9\x04\x00\x91\xc9\x04\x00\xc3\xc9\x04\x00\xda\xc9\x04\x00\x06\xca\x04\x00\x1c\xca\x04\x001\xca\x04\x00A\xca\x04\x00^\xca\x04\x00\x88\xca\x04\x00\x9f\xca\x04\x00\xb7\xca\x04\x00\xc8\xca\x04\x00\xe8\xca\x04\x00\x0f\xcb\x04\x00@\xcb\x04\x00p\xcb\x04\x00\x92\xcb\x04\x00\xa2\xcb\x04\x00\xca\xcb\x04\x00\xfd\xcb\x04\x00&\xcc\x04\x00'
+    b'G\xcc\x04\x00r\xcc\x04\x00\x96\xcc\x04\x00\xb8\xcc\x04\x00\xdf\xcc\x04\x00\xff\xcc\x04\x00:\xcd\x04\x00`\xcd\x04\x00\x94\xcd\x04\x00\xc4\xcd\x04\x00\xf7\xcd\x04\x00 \xce\x04\x00I\xce\x04\x00q\xce\x04\x00\x98\xce\x04\x00\xc4\xce\x04\x00\xea\xce\x04\x00\x12\xcf\x04\x00J\xcf\x04\x00\x82\xcf\x04\x00\x8f\xcf\x04\x00\xbc\xcf\x04\x00\xcb\xcf\x04\x00\xf8\xcf\x04\x00'
+    b'\x07\xd0\x04\x00\x14\xd0\x04\x00F\xd0\x04\x00g\xd0\x04\x00\x9d\xd0\x04\x00\xc2\xd0\x04\x00\xd6\xd0\x04\x00\xf4\xd0\x04\x00\x16\xd1\x04\x009\xd1\x04\x00L\xd1\x04\x00p\xd1\x04\x00\x99\xd1\x04\x00\xbb\xd1\x04\x00\xd7\xd1\x04\x00\xff\xd1\x04\x00\x1d\xd2\x04\x00>\xd2\x04\x00c\xd2\x04\x00y\xd2\x04\x00\x8a\xd2\x04\x00\xb1\xd2\x04\x00\xc3\xd2\x04\x00\xe3\xd2\x04\x00'
+    b'\x18\xd3\x04\x00<\xd3\x04\x00[\xd3\x04\x00x\xd3\x04\x00\xa7\xd3\x04\x00\xd0\xd3\x04\x00\x01\xd4\x04\x00A\xd4\x04\x00d\xd4\x04\x00\x7f\xd4\x04\x00\xac\xd4\x04\x00\xd0\xd4\x04\x00\xed\xd4\x04\x00\x13\xd5\x04\x00A\xd5\x04\x00\\\xd5\x04\x00|\xd5\x04\x00\x94\xd5\x04\x00\xa8\xd5\x04\x00\xcb\xd5\x04\x00\xdc\xd5\x04\x00\xee\xd5\x04\x00\x00\xd6\x04\x00+\xd6\x04\x00'
+    b'f\xd6\x04\x00v\xd6\x04\x00\x95\xd6\x04\x00\xba\xd6\x04\x00\xcb\xd6\x04\x00\xf5\xd6\x04\x00\x1d\xd7\x04\x00#\xd7\x04\x00Y\xd7\x04\x00z\xd7\x04\x00\xa2\xd7\x04\x00\xc4\xd7\x04\x00\xe5\xd7\x04\x00\x1f\xd8\x04\x00-\xd8\x04\x00d\xd8\x04\x00\x90\xd8\x04\x00\xc9\xd8\x04\x00\xd9\xd8\x04\x00\x05\xd9\x04\x00=\xd9\x04\x00O\xd9\x04\x00u\xd9\x04\x00\xa3\xd9\x04\x00'
+    b'\xcb\xd9\x04\x00\xf4\xd9\x04\x00\x1e\xda\x04\x000\xda\x04\x00Y\xda\x04\x00g\xda\x04\x00\x80\xda\x04\x00\xad\xda\x04\x00\xd1\xda\x04\x00\xe1\xda\x04\x00\x14\xdb\x04\x00D\xdb\x04\x00j\xdb\x04\x00|\xdb\x04\x00\x93\xdb\x04\x00\xbb\xdb\x04\x00\xfe\xdb\x04\x00A\xdc\x04\x00\x84\xdc\x04\x00\xb8\xdc\x04\x00\xe7\xdc\x04\x00$\xdd\x04\x00U\xdd\x04\x00\x85\xdd\x04\x00'
+    b'\xb2\xdd\x04\x00\xdd\xdd\x04\x00\xe9\xdd\x04\x00#\xde\x04\x00Q\xde\x04\x00[\xde\x04\x00\x82\xde\x04\x00\xc5\xde\x04\x00\xe3\xde\x04\x00\xf7\xde\x04\x00\x1a\xdf\x04\x00.\xdf\x04\x00F\xdf\x04\x00Z\xdf\x04\x00s\xdf\x04\x00\x91\xdf\x04\x00\xb5\xdf\x04\x00\xdc\xdf\x04\x00\x0c\xe0\x04\x00;\xe0\x04\x00m\xe0\x04\x00\x9f\xe0\x04\x00\xd1\xe0\x04\x00\xfa\xe0\x04\x00'
+    b'\r\xe1\x04\x00?\xe1\x04\x00z\xe1\x04\x00\xa8\xe1\x04\x00\xcf\xe1\x04\x00\xe2\xe1\x04\x00\x02\xe2\x04\x00?\xe2\x04\x00f\xe2\x04\x00\x89\xe2\x04\x00\xb2\xe2\x04\x00\xc8\xe2\x04\x00\xe0\xe2\x04\x00\xfd\xe2\x04\x00\x0e\xe3\x04\x00.\xe3\x04\x00@\xe3\x04\x00o\xe3\x04\x00\x93\xe3\x04\x00\xbf\xe3\x04\x00\xd3\xe3\x04\x00\xf8\xe3\x04\x00\x07\xe4\x04\x004\xe4\x04\x00'
+    b'M\xe4\x04\x00l\xe4\x04\x00\x95\xe4\x04\x00\xa7\xe4\x04\x00\xd0\xe4\x04\x00\xf0\xe4\x04\x00\x0f\xe5\x04\x00(\xe5\x04\x00K\xe5\x04\x00]\xe5\x04\x00p\xe5\x04\x00~\xe5\x04\x00\xa4\xe5\x04\x00\xbf\xe5\x04\x00\xe0\xe5\x04\x00\x06\xe6\x04\x00\x1d\xe6\x04\x00-\xe6\x04\x00K\xe6\x04\x00[\xe6\x04\x00q\xe6\x04\x00\x92\xe6\x04\x00\xa9\xe6\x04\x00\xbb\xe6\x04\x00'
+    b"\xce\xe6\x04\x00\xff\xe6\x04\x00\x14\xe7\x04\x008\xe7\x04\x00Z\xe7\x04\x00s\xe7\x04\x00\xa3\xe7\x04\x00\xd3\xe7\x04\x00\xf3\xe7\x04\x000\xe8\x04\x00O\xe8\x04\x00n\xe8\x04\x00\x84\xe8\x04\x00\xad\xe8\x04\x00\xd0\xe8\x04\x00\xe3\xe8\x04\x00\x0e\xe9\x04\x00'\xe9\x04\x00U\xe9\x04\x00p\xe9\x04\x00\x93\xe9\x04\x00\xad\xe9\x04\x00\xe3\xe9\x04\x00\xfe\xe9\x04\x00"
+    b'\x15\xea\x04\x00W\xea\x04\x00t\xea\x04\x00\x8c\xea\x04\x00\xb4\xea\x04\x00\xd4\xea\x04\x00\xff\xea\x04\x00\x0f\xeb\x04\x00\x15\xeb\x04\x00&\xeb\x04\x00H\xeb\x04\x00b\xeb\x04\x00\x95\xeb\x04\x00\xb7\xeb\x04\x00\xda\xeb\x04\x00\xff\xeb\x04\x00+\xec\x04\x00W\xec\x04\x00\x90\xec\x04\x00\xb7\xec\x04\x00\xeb\xec\x04\x00\x00\xed\x04\x00,\xed\x04\x00R\xed\x04\x00'
+    b'l\xed\x04\x00\x7f\xed\x04\x00\xad\xed\x04\x00\xdc\xed\x04\x00\x07\xee\x04\x00\x19\xee\x04\x00)\xee\x04\x00E\xee\x04\x00f\xee\x04\x00\x8c\xee\x04\x00\xb7\xee\x04\x00\xc7\xee\x04\x00\xf0\xee\x04\x00%\xef\x04\x00p\xef\x04\x00\x99\xef\x04\x00\xc8\xef\x04\x00\xd9\xef\x04\x00\xf1\xef\x04\x00\x05\xf0\x04\x00)\xf0\x04\x00^\xf0\x04\x00\x8d\xf0\x04\x00\xa1\xf0\x04\x00'
+    b'\xba\xf0\x04\x00\xdf\xf0\x04\x00\xf2\xf0\x04\x00\x0c\xf1\x04\x006\xf1\x04\x00U\xf1\x04\x00q\xf1\x04\x00\x93\xf1\x04\x00\xd6\xf1\x04\x00\x14\xf2\x04\x00I\xf2\x04\x00\x81\xf2\x04\x00\xa0\xf2\x04\x00\xcc\xf2\x04\x00\xf6\xf2\x04\x00+\xf3\x04\x00T\xf3\x04\x00\x83\xf3\x04\x00\xba\xf3\x04\x00\xe3\xf3\x04\x00\xfb\xf3\x04\x00+\xf4\x04\x00L\xf4\x04\x00v\xf4\x04\x00'
+    b'\xbb\xf4\x04\x00\xda\xf4\x04\x00\x10\xf5\x04\x00)\xf5\x04\x00i\xf5\x04\x00}\xf5\x04\x00\xa8\xf5\x04\x00\xc7\xf5\x04\x00\xeb\xf5\x04\x00\x04\xf6\x04\x00)\xf6\x04\x00B\xf6\x04\x00`\xf6\x04\x00\x8c\xf6\x04\x00\xac\xf6\x04\x00\xd4\xf6\x04\x00\xf5\xf6\x04\x00\x17\xf7\x04\x009\xf7\x04\x00x\xf7\x04\x00\x99\xf7\x04\x00\xb2\xf7\x04\x00\xe2\xf7\x04\x00\xfa\xf7\x04\x00'
+    b'\x10\xf8\x04\x00(\xf8\x04\x00G\xf8\x04\x00r\xf8\x04\x00\xa6\xf8\x04\x00\xc9\xf8\x04\x00\xd7\xf8\x04\x00\xf0\xf8\x04\x00\xfd\xf8\x04\x00)\xf9\x04\x00Q\xf9\x04\x00q\xf9\x04\x00\xb1\xf9\x04\x00\xeb\xf9\x04\x00\x0c\xfa\x04\x00*\xfa\x04\x00e\xfa\x04\x00\x80\xfa\x04\x00\xb6\xfa\x04\x00\xe3\xfa\x04\x00\x0b\xfb\x04\x00:\xfb\x04\x00O\xfb\x04\x00s\xfb\x04\x00'
+    b'\x91\xfb\x04\x00\xad\xfb\x04\x00\xcb\xfb\x04\x00\xdc\xfb\x04\x00\x00\xfc\x04\x00%\xfc\x04\x00a\xfc\x04\x00\x89\xfc\x04\x00\xc7\xfc\x04\x00\xdb\xfc\x04\x00\xfa\xfc\x04\x00\x1c\xfd\x04\x00_\xfd\x04\x00\x9f\xfd\x04\x00\xc0\xfd\x04\x00\xd9\xfd\x04\x00\x0e\xfe\x04\x00\x1e\xfe\x04\x00A\xfe\x04\x00q\xfe\x04\x00\xa6\xfe\x04\x00\xcb\xfe\x04\x00\x12\xff\x04\x00B\xff\x04\x00'
+    b'\x89\xff\x04\x00\xd0\xff\x04\x00\xef\xff\x04\x007\x00\x05\x00[\x00\x05\x00\x85\x00\x05\x00\xb4\x00\x05\x00\xec\x00\x05\x00-\x01\x05\x00c\x01\x05\x00\xa3\x01\x05\x00\xd1\x01\x05\x00\xff\x01\x05\x00N\x02\x05\x00s\x02\x05\x00\xbf\x02\x05\x00\xf9\x02\x05\x00\x19\x03\x05\x00L\x03\x05\x00}\x03\x05\x00\xa5\x03\x05\x00\xcd\x03\x05\x00\x01\x04\x05\x00/\x04\x05\x00'
+    b"S\x04\x05\x00\x92\x04\x05\x00\xda\x04\x05\x00\x02\x05\x05\x00,\x05\x05\x00p\x05\x05\x00\xa9\x05\x05\x00\xf4\x05\x05\x00'\x06\x05\x00d\x06\x05\x00\x94\x06\x05\x00\xbe\x06\x05\x00\xfd\x06\x05\x00(\x07\x05\x00P\x07\x05\x00y\x07\x05\x00\xac\x07\x05\x00\xdd\x07\x05\x00\x01\x08\x05\x002\x08\x05\x00q\x08\x05\x00\x9e\x08\x05\x00\xdb\x08\x05\x00\x05\t\x05\x00"
+    b':\t\x05\x00r\t\x05\x00\xc2\t\x05\x00\xf2\t\x05\x003\n\x05\x00o\n\x05\x00\xad\n\x05\x00\xf2\n\x05\x001\x0b\x05\x00\\\x0b\x05\x00\xa9\x0b\x05\x00\xce\x0b\x05\x00\xee\x0b\x05\x00\x1d\x0c\x05\x00k\x0c\x05\x00\x8c\x0c\x05\x00\xbb\x0c\x05\x00\xe3\x0c\x05\x00)\r\x05\x00v\r\x05\x00\xa8\r\x05\x00\xdf\r\x05\x00\x07\x0e\x05\x00L\x0e\x05\x00'
+    b'z\x0e\x05\x00\x97\x0e\x05\x00\xe1\x0e\x05\x00\x17\x0f\x05\x00;\x0f\x05\x00y\x0f\x05\x00\xa1\x0f\x05\x00\xe1\x0f\x05\x00\x11\x10\x05\x00M\x10\x05\x00y\x10\x05\x00\xa0\x10\x05\x00\xd0\x10\x05\x00\xeb\x10\x05\x00\x1d\x11\x05\x00A\x11\x05\x00\x8a\x11\x05\x00\xc7\x11\x05\x00\x06\x12\x05\x007\x12\x05\x00]\x12\x05\x00{\x12\x05\x00\xac\x12\x05\x00\xf2\x12\x05\x00'
+    b'\x1a\x13\x05\x00\\\x13\x05\x00\x9e\x13\x05\x00\xca\x13\x05\x00\xfe\x13\x05\x00J\x14\x05\x00\x86\x14\x05\x00\xb5\x14\x05\x00\xe4\x14\x05\x00\x16\x15\x05\x00=\x15\x05\x00x\x15\x05\x00\xad\x15\x05\x00\xd4\x15\x05\x00\xfb\x15\x05\x00"\x16\x05\x00I\x16\x05\x00p\x16\x05\x00\x97\x16\x05\x00\xbe\x16\x05\x00\x03\x17\x05\x00 \x17\x05\x00`\x17\x05\x00\xa7\x17\x05\x00'
+    b'\xd6\x17\x05\x00\xfd\x17\x05\x00F\x18\x05\x00\x88\x18\x05\x00\xc8\x18\x05\x00\xfb\x18\x05\x00#\x19\x05\x00a\x19\x05\x00\x87\x19\x05\x00\xb1\x19\x05\x00\xf7\x19\x05\x00+\x1a\x05\x00K\x1a\x05\x00u\x1a\x05\x00\xa6\x1a\x05\x00\xe0\x1a\x05\x00\xfd\x1a\x05\x005\x1b\x05\x00j\x1b\x05\x00\xa2\x1b\x05\x00\xd1\x1b\x05\x00\x12\x1c\x05\x00N\x1c\x05\x00\x84\x1c\x05\x00'
+    b'\xb8\x1c\x05\x00\xf4\x1c\x05\x00#\x1d\x05\x00O\x1d\x05\x00\x8a\x1d\x05\x00\xc4\x1d\x05\x00\xf4\x1d\x05\x00(\x1e\x05\x00p\x1e\x05\x00\xa4\x1e\x05\x00\xdf\x1e\x05\x00)\x1f\x05\x00d\x1f\x05\x00\x9b\x1f\x05\x00\xcb\x1f\x05\x00\xf5\x1f\x05\x00  \x05\x00K \x05\x00\x89 \x05\x00\xae \x05\x00\xe1 \x05\x00\x1b!\x05\x00;!\x05\x00\x81!\x05\x00'
+    b'\xba!\x05\x00\xf4!\x05\x00!"\x05\x00j"\x05\x00\xa5"\x05\x00\xde"\x05\x00\'#\x05\x00i#\x05\x00\xa9#\x05\x00\xf4#\x05\x00=$\x05\x00\x80$\x05\x00\xb2$\x05\x00\xdb$\x05\x00\xf8$\x05\x00,%\x05\x00b%\x05\x00\x97%\x05\x00\xb7%\x05\x00\xf2%\x05\x00<&\x05\x00g&\x05\x00\x8c&\x05\x00\xbd&\x05\x00'
+    b"\xe1&\x05\x00\x00'\x05\x00>'\x05\x00`'\x05\x00\x96'\x05\x00\xe2'\x05\x00\x02(\x05\x00G(\x05\x00}(\x05\x00\xb6(\x05\x00\xd9(\x05\x00\x14)\x05\x00U)\x05\x00\x98)\x05\x00\xdc)\x05\x00\x12*\x05\x00B*\x05\x00\x81*\x05\x00\xc2*\x05\x00\x00+\x05\x005+\x05\x00l+\x05\x00\x9e+\x05\x00\xce+\x05\x00"
+    b'\xfd+\x05\x007,\x05\x00^,\x05\x00\x81,\x05\x00\xb6,\x05\x00\xec,\x05\x00\x05-\x05\x007-\x05\x00T-\x05\x00x-\x05\x00\xb5-\x05\x00\xf0-\x05\x00\x18.\x05\x00U.\x05\x00\x82.\x05\x00\xac.\x05\x00\xec.\x05\x00\x1d/\x05\x00P/\x05\x00\x88/\x05\x00\xc5/\x05\x00\x050\x05\x00#0\x05\x00_0\x05\x00'
+    b'\x9f0\x05\x00\xd10\x05\x00\x031\x05\x00:1\x05\x00Y1\x05\x00~1\x05\x00\xbf1\x05\x00\xe51\x05\x00\x182\x05\x00:2\x05\x00c2\x05\x00\xa62\x05\x00\xd72\x05\x00\x173\x05\x00N3\x05\x00\x853\x05\x00\xb93\x05\x00\xef3\x05\x00\x1f4\x05\x00d4\x05\x00\x9d4\x05\x00\xc54\x05\x00\xe44\x05\x00\r5\x05\x00'
+    b'C5\x05\x00h5\x05\x00\x955\x05\x00\xce5\x05\x00\x0f6\x05\x00A6\x05\x00\x806\x05\x00\xa56\x05\x00\xc56\x05\x00\xec6\x05\x00\x107\x05\x0067\x05\x00[7\x05\x00\x957\x05\x00\xbd7\x05\x00\xec7\x05\x00,8\x05\x00Z8\x05\x00\x848\x05\x00\xb78\x05\x00\xdb8\x05\x00\x0b9\x05\x00E9\x05\x00}9\x05\x00'
+    b'\xbe9\x05\x00\xf19\x05\x00\n:\x05\x000:\x05\x00]:\x05\x00\xa4:\x05\x00\xc7:\x05\x00\xf6:\x05\x00\x18;\x05\x00E;\x05\x00n;\x05\x00\xb2;\x05\x00\xd6;\x05\x00\x03<\x05\x00S<\x05\x00u<\x05\x00\xb3<\x05\x00\xd2<\x05\x00\xfa<\x05\x00 =\x05\x00]=\x05\x00\x96=\x05\x00\xcb=\x05\x00\xfd=\x05\x00'
+    b'\x1e>\x05\x00M>\x05\x00q>\x05\x00\x93>\x05\x00\xc8>\x05\x00\x02?\x05\x00<?\x05\x00s?\x05\x00\x9f?\x05\x00\xd6?\x05\x00\xfa?\x05\x00:@\x05\x00p@\x05\x00\x9f@\x05\x00\xd4@\x05\x00\xf9@\x05\x009A\x05\x00rA\x05\x00\x9eA\x05\x00\xceA\x05\x00\x01B\x05\x00\x1eB\x05\x00BB\x05\x00dB\x05\x00'
+    b'\x95B\x05\x00\xb4B\x05\x00\xefB\x05\x00\x1eC\x05\x00=C\x05\x00wC\x05\x00\xa7C\x05\x00\xc5C\x05\x00\xfbC\x05\x006D\x05\x00bD\x05\x00\xa3D\x05\x00\xcbD\x05\x00\xeaD\x05\x00\x1aE\x05\x00CE\x05\x00vE\x05\x00\xa4E\x05\x00\xe7E\x05\x00\x1aF\x05\x00QF\x05\x00\x92F\x05\x00\xb8F\x05\x00\xceF\x05\x00'
+    b'\xe9F\x05\x00\x18G\x05\x008G\x05\x00kG\x05\x00\x94G\x05\x00\xbeG\x05\x00\xeeG\x05\x00\x1eH\x05\x00?H\x05\x00\x81H\x05\x00\xacH\x05\x00\xeeH\x05\x00 I\x05\x00SI\x05\x00yI\x05\x00\x9cI\x05\x00\xbeI\x05\x00\xf1I\x05\x00)J\x05\x00YJ\x05\x00\x82J\x05\x00\xc3J\x05\x00\xfbJ\x05\x00\x1fK\x05\x00'
+    b"DK\x05\x00\x80K\x05\x00\xb2K\x05\x00\xf2K\x05\x00\x11L\x05\x00-L\x05\x00hL\x05\x00\x8eL\x05\x00\xc2L\x05\x00\xe4L\x05\x00\x17M\x05\x00RM\x05\x00\x83M\x05\x00\xb9M\x05\x00\xdcM\x05\x00\xfeM\x05\x00!N\x05\x00cN\x05\x00\x8aN\x05\x00\xbaN\x05\x00\xfeN\x05\x00'O\x05\x00cO\x05\x00\x93O\x05\x00"
+    b'\xcdO\x05\x00\xf4O\x05\x00\x1cP\x05\x00WP\x05\x00\x83P\x05\x00\xa1P\x05\x00\xd6P\x05\x00\xf9P\x05\x001Q\x05\x00eQ\x05\x00\x91Q\x05\x00\xc1Q\x05\x00\xe7Q\x05\x00!R\x05\x00\\R\x05\x00\x8bR\x05\x00\xa6R\x05\x00\xbdR\x05\x00\xe1R\x05\x00\x1aS\x05\x002S\x05\x00[S\x05\x00zS\x05\x00\xa5S\x05\x00'
+    b'\xcdS\x05\x00\xf0S\x05\x00\x14T\x05\x00MT\x05\x00\x84T\x05\x00\xbdT\x05\x00\xe0T\x05\x00\x1dU\x05\x006U\x05\x00^U\x05\x00\x8bU\x05\x00\xb8U\x05\x00\xe6U\x05\x00\nV\x05\x00;V\x05\x00rV\x05\x00\xadV\x05\x00\xd8V\x05\x00\x0eW\x05\x002W\x05\x00qW\x05\x00\x85W\x05\x00\xacW\x05\x00\xdaW\x05\x00'
+    b'\x0cX\x05\x000X\x05\x00_X\x05\x00\x8eX\x05\x00\xa5X\x05\x00\xc1X\x05\x00\xf2X\x05\x002Y\x05\x00gY\x05\x00}Y\x05\x00\xabY\x05\x00\xceY\x05\x00\xfbY\x05\x00DZ\x05\x00gZ\x05\x00\xa7Z\x05\x00\xe4Z\x05\x00\x0c[\x05\x00+[\x05\x00c[\x05\x00\x96[\x05\x00\xc1[\x05\x00\xe6[\x05\x00\x04\\\x05\x00'
+    b'\x1d\\\x05\x00Z\\\x05\x00\x80\\\x05\x00\x97\\\x05\x00\xc2\\\x05\x00\xde\\\x05\x00\x15]\x05\x00S]\x05\x00n]\x05\x00\x95]\x05\x00\xcc]\x05\x00\x06^\x05\x00G^\x05\x00i^\x05\x00\xa9^\x05\x00\xe4^\x05\x00\x1d_\x05\x004_\x05\x00M_\x05\x00\x7f_\x05\x00\xa7_\x05\x00\xde_\x05\x00\t`\x05\x00*`\x05\x00'
+    b'j`\x05\x00\x80`\x05\x00\xa5`\x05\x00\xc2`\x05\x00\xf3`\x05\x00/a\x05\x00Qa\x05\x00\x8da\x05\x00\xbfa\x05\x00\xe6a\x05\x00\x06b\x05\x004b\x05\x00bb\x05\x00\x96b\x05\x00\xc0b\x05\x00\xebb\x05\x00\x1fc\x05\x00Lc\x05\x00\x80c\x05\x00\xaac\x05\x00\xc9c\x05\x00\xeac\x05\x00\x15d\x05\x004d\x05\x00'
+    b'_d\x05\x00\x9bd\x05\x00\xbcd\x05\x00\xf2d\x05\x00\x1ae\x05\x00Ge\x05\x00ue\x05\x00\xb0e\x05\x00\xe7e\x05\x00\nf\x05\x00Kf\x05\x00\x86f\x05\x00\xbaf\x05\x00\xf4f\x05\x00\x14g\x05\x00/g\x05\x00ig\x05\x00\x99g\x05\x00\xcag\x05\x00\xfdg\x05\x00+h\x05\x00Bh\x05\x00oh\x05\x00\xa0h\x05\x00'
+    b'\xd1h\x05\x00\x02i\x05\x003i\x05\x00di\x05\x00\x95i\x05\x00\xc6i\x05\x00\xe9i\x05\x00\x14j\x05\x00@j\x05\x00fj\x05\x00\x84j\x05\x00\xbaj\x05\x00\xe8j\x05\x00!k\x05\x00@k\x05\x00xk\x05\x00\xa8k\x05\x00\xe4k\x05\x00\x19l\x05\x00dl\x05\x00\xacl\x05\x00\xd2l\x05\x00\xfcl\x05\x00Am\x05\x00'
+    b'gm\x05\x00\xa7m\x05\x00\xdam\x05\x00\x06n\x05\x00/n\x05\x00Zn\x05\x00\x7fn\x05\x00\xadn\x05\x00\xd8n\x05\x00\xf4n\x05\x00\x1do\x05\x00Fo\x05\x00fo\x05\x00~o\x05\x00\xa9o\x05\x00\xdfo\x05\x00\np\x05\x00=p\x05\x00ip\x05\x00\x9dp\x05\x00\xcbp\x05\x00\xf8p\x05\x00\x19q\x05\x00Xq\x05\x00'
+    b"xq\x05\x00\xb0q\x05\x00\xdaq\x05\x00\xf8q\x05\x00'r\x05\x00Gr\x05\x00qr\x05\x00\x9dr\x05\x00\xder\x05\x00\xfdr\x05\x009s\x05\x00Ts\x05\x00qs\x05\x00\xa3s\x05\x00\xc9s\x05\x00\xf3s\x05\x00$t\x05\x00Gt\x05\x00yt\x05\x00\x90t\x05\x00\xaft\x05\x00\xcat\x05\x00\x05u\x05\x008u\x05\x00"
+    b'au\x05\x00\x96u\x05\x00\xb9u\x05\x00\xeeu\x05\x00\x11v\x05\x00Gv\x05\x00}v\x05\x00\xb3v\x05\x00\xe5v\x05\x00-w\x05\x00Mw\x05\x00tw\x05\x00\xaaw\x05\x00\xd8w\x05\x00&x\x05\x00?x\x05\x00mx\x05\x00\x93x\x05\x00\xadx\x05\x00\xc7x\x05\x00\x02y\x05\x00&y\x05\x00Ey\x05\x00oy\x05\x00'
+    b'\x91y\x05\x00\xcfy\x05\x00\xf7y\x05\x00\x19z\x05\x00Ez\x05\x00vz\x05\x00\xa3z\x05\x00\xd3z\x05\x00\n{\x05\x007{\x05\x00c{\x05\x00\x8f{\x05\x00\xb4{\x05\x00\xe4{\x05\x00\x10|\x05\x006|\x05\x00\\|\x05\x00\x83|\x05\x00\xad|\x05\x00\xdc|\x05\x00\x0e}\x05\x005}\x05\x00c}\x05\x00\x94}\x05\x00'
+    b'\xc0}\x05\x00\xdb}\x05\x00\x08~\x05\x00E~\x05\x00y~\x05\x00\xad~\x05\x00\xda~\x05\x00\x0e\x7f\x05\x006\x7f\x05\x00q\x7f\x05\x00\x92\x7f\x05\x00\xc2\x7f\x05\x00\xf3\x7f\x05\x00\x18\x80\x05\x00<\x80\x05\x00a\x80\x05\x00\x98\x80\x05\x00\xc2\x80\x05\x00\xee\x80\x05\x00\x16\x81\x05\x00E\x81\x05\x00d\x81\x05\x00\x8f\x81\x05\x00\xb2\x81\x05\x00'
+    b'\xe4\x81\x05\x00\x19\x82\x05\x00\\\x82\x05\x00\x8d\x82\x05\x00\xb5\x82\x05\x00\xca\x82\x05\x00\xdd\x82\x05\x00\xfd\x82\x05\x00,\x83\x05\x00a\x83\x05\x00\x95\x83\x05\x00\xd8\x83\x05\x00\x0e\x84\x05\x00:\x84\x05\x00^\x84\x05\x00\x95\x84\x05\x00\xcd\x84\x05\x00\x06\x85\x05\x00#\x85\x05\x00T\x85\x05\x00t\x85\x05\x00\x9c\x85\x05\x00\xd5\x85\x05\x00\xf6\x85\x05\x00'
+    b'$\x86\x05\x00>\x86\x05\x00l\x86\x05\x00\xa3\x86\x05\x00\xd1\x86\x05\x00\xf2\x86\x05\x00#\x87\x05\x00'
+)
+BLOB = (
+    b'Playing in the bathtub water.Drinking black tea.Drank green tea.Gently energized by Oolong tea.D'
+    b'rank Ginseng tea which boosts stamina and mood.Feeling sophisticated drinking tea.Shaken up afte'
+    b'r crashing a rocket ship.Explored space.Feeling adventurous mile high club.Feeling bold mile hig'
+    b'h club.Pretending to be a captain on the jungle gym.Pretending to be an astronaut on the jungle '
+    b'gym.Drank the essence of anger from a Cowplant.Consumed the essence of boredom from a plant and '
+    b'now feels incredibly lethargic.Feeling bovine confidence.Consumed cowplant essence and now feeli'
+    b'ng deeply embarrassed.Consumed the essence of energy from a Cowplant.Drank the essence of a flir'
+    b'ty victim from a Cowplant.Drank the essence of focus from a Cowplant.Happy from cowplant essence'
+    b'.Drank the essence of inspiration from a strange plant.Feeling the playful essence of a Cowplant'
+    b'.Feeling the despair of a cowplant victim.Dazed after drinking the essence of a living being.Tra'
+    b'umatized by being eaten by a Cowplant.Feeling a strange, slimy sensation in the stomach.Seriousl'
+    b'y dazed and fried after an electric shock.Feeling a sharp, magical pain.Sad because a voodoo dol'
+    b'l backfired.Feeling the burn and motivation on the workout machine.Pushing limits on the treadmi'
+    b'll with a mentor.Hitting harder on the punching bag with guidance.Feeling generally confident.Ju'
+    b'st feeling focused.Just waking up feeling ready to create.Just feeling flirty in general.Feeling'
+    b' happy.Just feeling naturally energized.Feeling a wave of general sadness.Feeling naturally play'
+    b'ful.Feeling incredibly weak and frail.Concentrating on winning a card game.Feeling lucky winning'
+    b' cards.Embarrassed after losing a card game.Angry about losing a card game.Laughing over losing '
+    b'a card game.Laughing over winning a card game.Moved to tears by a sad violin song.Feeling nauseo'
+    b'us and green.Taking a high quality shower.Feeling grimy after a bad shower.Enjoying a shower in '
+    b'an upgraded unit.Feeling pampered by a high-quality shower upgrade.Grossed out by using a filthy'
+    b' bathroom fixture.Appreciating the quality of a high-end refrigerator.Nauseous from the smell of'
+    b' a dirty refrigerator.Feeling optimistic about the bright future predicted by the Future Cube.De'
+    b'pressed by a grim prediction from the Future Cube.Feeling capable after mixing a drink.Feeling c'
+    b'onfident and inventive due to high bartending skill.Refreshed and energized after a nap.Embarras'
+    b'sed about passing out or napping while drunk.Queasy from drinking a poorly made beverage.Confide'
+    b'nt in drink mixing skills.Feeling skilled at making drinks.Masterful at mixing drinks.Embarrasse'
+    b'd because someone invaded their privacy.Sore and unsatisfied after using a cheap, uncomfortable '
+    b'toilet.Energized and happy after cleaning a toilet.Watching the romance channel on TV.Disappoint'
+    b'ed and queasy from eating poor quality food.Happy about cooking a meal.Feeling more confident in'
+    b' cooking.Proud of cooking skills.Feeling accomplished in the kitchen.Masterful at cooking.Annoye'
+    b'd by the presence of children.Happy to be around family members.Angry from a negative social int'
+    b'eraction.Feeling playful from a fun conversation.Feeling awkward after an embarrassing social in'
+    b'teraction.Feeling bored from a dull social interaction.Feeling happy from a pleasant social inte'
+    b'raction.Feeling flirty from a social interaction.Feeling a sense of artistic accomplishment afte'
+    b'r finishing a painting.Wearing alluring body spray.Feeling confident with fresh breath.Crying ov'
+    b'er a smashed dollhouse.Completely devoid of energy and feeling hollow.Cringing over a recent emb'
+    b'arrassing conversation.Absorbing anger from the surrounding decor.Absorbing anger from the surro'
+    b'unding decor.Absorbing anger from the surrounding decor.Extremely bored by the uninspiring envir'
+    b"onment.Moderately bored by the dull decor.Slightly bored by the room's lack of decoration.Feelin"
+    b"g confident due to the room's imposing decor.Feeling sure of themselves in this environment.Feel"
+    b'ing a boost of confidence from the surroundings.Overwhelmed by an intensely embarrassing atmosph'
+    b'ere.Uncomfortable due to an embarrassing atmosphere.Slightly uncomfortable due to an awkward atm'
+    b'osphere.Energized by the highly active decor in the room.Feeling perky due to the active decor i'
+    b'n the room.Slightly energized by the decor in the room.Surrounded by a strong romantic atmospher'
+    b'e.Surrounded by a moderate romantic atmosphere.Surrounded by a light romantic atmosphere.The roo'
+    b"m's decor is extremely conducive to concentration.The environment is helping with concentration."
+    b'There is a slight focusing vibe in the room.Enjoying the ambience of a large happy room.Enjoying'
+    b' the ambience of a medium happy room.Enjoying the ambience of a small happy room.Surrounded by a'
+    b' spacious environment that strongly fuels the imagination.In a setting that encourages creative '
+    b'thought and artistry.Noticing small details in the room that spark interesting ideas.Feeling gru'
+    b'ngy due to the dirty surroundings.Unsettled by the unpleasant decor and mess.Repulsed by the fil'
+    b'th and squalor of the room.Surrounded by decor that encourages fun and play.Surrounded by a mode'
+    b'rately playful environment.Noticing a slightly playful atmosphere.Feeling down due to a gloomy e'
+    b'nvironment.Feeling down due to a gloomy environment.Feeling down due to a gloomy environment.Ove'
+    b'rwhelmed by a highly stressful environment.Stressed by the tension in the room.Feeling a bit on '
+    b'edge due to the surroundings.Feeling frumpy and unattractive after looking in the mirror.Heartbr'
+    b'oken that nobody remembered their birthday.Laughing after a funny conversation.Feeling proud of '
+    b'their fitness progress.Relieved to be spared by the Grim Reaper.Feeling attractive after freshen'
+    b'ing up in the mirror.Jealous because a loved one interacted with someone else.Bruised and dazed '
+    b'after losing a fistfight.Hurt by a social rejection.Feeling knowledgeable after mentoring someon'
+    b'e.Happy about making a new good friend.Playing with bubbles in the bathtub.Relaxing in the batht'
+    b'ub.Awake and alert from a cup of coffee.Feeling fresh breath confidence.Having a blast playing i'
+    b'n the toybox.Laughing at a comedy show on TV.Happy to mourn an enemy.Mourning the loss of a frie'
+    b'nd.Mourning a death.Muscles aching and trembling from a workout.Happy about the first trimester '
+    b'of pregnancy.Happy about the second trimester of pregnancy.Happy about the third trimester of pr'
+    b'egnancy.Riled up after reading something aggravating.Bored by reading a low-skill book.Feeling s'
+    b'marter after reading a self-help book.Reading a steamy romance novel.Reading a book that require'
+    b's concentration.Mildly happy after reading.Picked up a few creative ideas from reading a book.Sn'
+    b'ickering at a racy book.Enjoying a humorous book.Feeling blue after reading a sad book.Bored bec'
+    b'ause the book they are reading is too easy for their skill level.Frustrated that this book is to'
+    b'o difficult to understand.Joyful about getting married.Happy watching a wedding ceremony.Embarra'
+    b'ssed after failing to cheer properly at a wedding.Feeling happy that the wedding cheer went well'
+    b'.Feeling relieved to have avoided a wedding disaster.Embarrassed after a failed attempt to heckl'
+    b'e at a wedding.Feeling satisfied after successfully heckling a wedding.Humiliated and sad after '
+    b'being heckled at a wedding.Humiliated and furious after being left at the altar.Feeling relaxed '
+    b'lying in bed.Relieved to have quit a job.Knocked out and groggy from a noxious gas cloud.Stimula'
+    b'ted by a geeky conversation.Viewing artwork that causes anger.Inspired and energized by viewing '
+    b'active art.Viewing flirty artwork.Examining art or an object that requires deep thought.Enjoying'
+    b' a beautiful view.Looking at a view that triggers the imagination.Overcome with sadness from vie'
+    b'wing a piece of art.Feeling a magical fog caused by voodoo magic.Feeling wickedly playful while '
+    b'using a voodoo doll.Under the influence of a voodoo love spell.In pain and angry from voodoo dol'
+    b'l torture.Feeling a magical, pricking pain from a voodoo doll.Waking up stiff and sore from a ba'
+    b"d night's sleep.Thinking angry thoughts about marriage at the arch.Fantasizing about romance nea"
+    b'r a wedding arch.Fantasizing about a wedding at the arch.Happy about cutting the wedding cake.Ha'
+    b'ppy about cutting the wedding cake (non-romantic).Impatiently waiting for the wedding to start.T'
+    b'raumatized by witnessing the death of a friend.Traumatized by witnessing the death of a loved on'
+    b'e.Happy to witness the death of a nemesis.Traumatized by witnessing a death.Feeling tough after '
+    b'winning a fight.Feeling surprisingly okay after cheating on a partner.Angry about being cheated '
+    b'on.Feeling bored with the current relationship, leading to wandering eyes.Feeling slick while ge'
+    b'tting away with cheating.Enraged about being cheated on.Depressed about being cheated on.Elated '
+    b'about getting away with cheating.Feeling embarrassed about being unfaithful.Feeling a rush of ad'
+    b'renaline from cheating.Feeling fearless while cheating.Feeling flirty while cheating on a partne'
+    b'r.Trying to be careful and focused to avoid getting caught cheating.Furious about being cheated '
+    b'on.Happy about getting away with cheating.Feeling utterly humiliated regarding infidelity.Findin'
+    b'g the chaos of cheating hysterically funny.Feeling a rush of creative excuses or ideas born from'
+    b' secrecy.Finding strange inspiration in illicit romantic activities.In the zone and calculating '
+    b'every move while cheating.Miserable and guilt-ridden about infidelity.Mortified by a cheating sc'
+    b'andal.Feeling passionate while cheating on a partner.Finding the chaos of cheating quite amusing'
+    b'.Pumped up and thrilled by the illicit nature of cheating.Sad about being cheated on.Finding the'
+    b' chaos of cheating silly.Drunk and making questionable romantic decisions.Guilt-ridden and stres'
+    b'sed about cheating.Tense and afraid of being caught cheating.Feeling awkward and tense due to ch'
+    b'eating.Mortified after having a bladder accident.Dragging feet and struggling to keep eyes open.'
+    b'Barely functioning due to extreme lack of sleep.Desperate for some fun and entertainment.Stomach'
+    b' is growling with hunger.Weak and dizzy from starvation.Feeling disgusting, smelly, and covered '
+    b'in grime.Feeling extremely lonely.Feeling desolate and isolated.Entertained by the shows on the '
+    b"kids' channel.Bored by watching the Kids Network channel as an adult.Drinking high-quality coffe"
+    b'e from an upgraded machine.Feeling bored after a long, uninteresting day at work.Leaving work ea'
+    b'rly in shame.Coming home stressed from a hard day at work.Stressed and uncomfortable leaving wor'
+    b'k early.Disappointed by cold, soggy food.Muscles sore and stiff from a workout.Happy cleaning.Mi'
+    b'serable because cleaning is hated.Feeling socially successful after texting.Had a successful cha'
+    b't.Giggling after making a silly face in the mirror.Furious about the high cost of bills.Stressed'
+    b' and sad about high bills.Cheered up by sad hotline.Cheered up.Having a blast playing with toys.'
+    b'Pruning a bonsai tree with Zen-like focus.Jazzed up by piano.Being serenaded by a musician.Feeli'
+    b'ng romantic serenading.Back aching from a hard chair.Happy sitting.Engaged in imaginative play w'
+    b'ith a stuffed animal.Affected by a flirty potion.Happy from a potion.Under the influence of a fo'
+    b'cus potion.Surging with magical energy from a potion.Feeling chemically confident from a potion.'
+    b"A magical potion has unlocked the mind's potential.Consumed a drink specifically designed to boo"
+    b'st creativity.Drank a beverage that stimulates the intellect.Physically enhanced after drinking '
+    b'a special beverage.Drank a beverage that boosts flirting.Eager and enthusiastic to workout.Feeli'
+    b'ng fearless boxing.Intimidated by a claimed criminal mastermind.Feeling encouraged and confident'
+    b'.The words are flowing onto the page effortlessly.Lost in melancholy thoughts.Evil reacting with'
+    b' hostility to Good.All motives high.Desperate to use the bathroom.Need to use the bathroom soon.'
+    b'Desperate for some fun.Feeling dirty and needing a shower.All motives pretty high.Upset after be'
+    b'ing yelled at by a coworker.Just feeling generally angry.Disoriented while trying to sabotage eq'
+    b'uipment.Riled up due to hot-headed personality.Cooking food as a foodie.Cooking food as a foodie'
+    b'.Disappointed by the lack of quality in the meal.Unhappy with a bland, standard meal.Grimacing a'
+    b't the taste of a poorly mixed drink.Disappointed by a mediocre drink.Mixing drinks as a foodie.M'
+    b'ixing drinks as a foodie.Feeling restless and needing to move.Sad and longing for love.Geeking o'
+    b'ut.Feeling generally pumped up and ready for anything.Riled up.Bored and mentally drained from d'
+    b'oing too many calculations.Compelled to clean with high energy by a song.Feeling generally unwel'
+    b'l and space-sick.Devastated that the launch was canceled.Feeling successful launching a career.I'
+    b'nk-stained and smelling of squid.Feeling smart winning chess.Feeling genius winning chess.Planni'
+    b'ng basic moves in a game of chess.Strategizing several moves ahead in chess.Thumbing throbbing f'
+    b'rom a hammer strike.Feeling handy fixing things.Feeling capable and focused on repairs.Upgraded '
+    b'soap dispenser.Feeling confident about cheese.Celebrating with birthday cake.Deeply appreciating'
+    b' the beauty of a piece of art.Lost in the imaginative world of a good book.Eager to try a newly '
+    b'learned cooking technique.Applying professional culinary training to home cooking.Bored and frus'
+    b'trated by lack of intellectual challenge.Upgraded stove heat sensor.Muscles aching and dragging '
+    b'after a workout.Upgraded microwave.Enjoying a cup of tea made with superior technology.Lazy watc'
+    b'hing TV.Lazy napping.Miserable about having to do chores.Getting help with teen homework.Getting'
+    b" help with child homework.Irritable because it's been too long without music.Playing music.Had a"
+    b' first kiss.Feeling adventurous gaming.Playing motion games with the family.Active and sweating '
+    b'from motion gaming.Feeling awkward and embarrassed due to being in a social situation as a loner'
+    b'.Feeling desolate and isolated.Feeling extremely lonely.Feeling outgoing and happy.NPC is feelin'
+    b'g flirty.Feeling generally sad.Generally angry NPC.Feeling happy.Generally feeling creative and '
+    b'motivated.Feeling the playful energy of the event.Stressed by the ongoing event.Feeling confiden'
+    b't at an event.Energized by a specific event.Feeling generally focused.Feeling generally bored wi'
+    b'thout a specific cause.Generally dazed and confused.Feeling generic embarrassment.Proud of a chi'
+    b"ld's artistic development.Focused on helping a child learn logic.Energized by watching their chi"
+    b"ld improve motor skills.Feeling proud of their child's skills.Skilled up.Studying the sky throug"
+    b'h a telescope.Spying on neighbors and seeing something spicy.Seeing the microscopic world reveal'
+    b's new patterns and ideas.Feeling alive from cowplant essence.Learning painting techniques from a'
+    b" skilled artist.Engaging in crafts under the guidance of a mentor.Feeling proud of an adult's sk"
+    b"ills.Living vicariously through someone else's mixology success.Energized by watching someone bo"
+    b'dybuild.Enjoying watching someone else be funny.Focused on helping another adult learn gardening'
+    b".Inspired by another person's gourmet cooking skills.Enjoying the progress of a guitar student.F"
+    b'ocused on helping another adult learn hacking.Focused on helping another adult learn handiness.F'
+    b"eeling good about someone else's home cooking abilities.Focused on helping another adult learn l"
+    b'ogic.Enjoying watching someone make mischief.Watching someone else paint is sparking personal in'
+    b'spiration.Listening to a student learn piano is motivating.Focused on helping another adult lear'
+    b'n rocket science.Focused on helping another adult learn video gaming.Inspired by a violin studen'
+    b"t's musical growth.Proud of a writer's progress and creativity.Evil and near misery.Hangry and m"
+    b'iserable.Feeling funny practicing comedy.Feeling hilarious practicing comedy.Feeling polished pr'
+    b'acticing comedy.Stiff and awkward from rehearsing comedy too much.Too nervous to perform the com'
+    b'edy routine.Good vibes.Learning chess strategies from a mentor.Missing family members deeply.Str'
+    b'essed by being surrounded by strangers.Embarrassed that a prank call backfired.Feeling mischievo'
+    b'us pranking.Wrote a song dedicated to a lover.Creating elaborate stories while playing with a do'
+    b'llhouse.Wicked act at dollhouse.Got a high score on computer.Researching a topic on Simpedia.Giv'
+    b'ing gusto.Giving gusto.Giving gusto.Just heard a fantastic and inspiring story.Exhausted and sad'
+    b' from trying to be charismatic.Mortified after being heckled while on stage.Feeling pumped watch'
+    b'ing sports.Feeling improved by practice.Out of creative ideas.Struck by a sudden bolt of profess'
+    b'ional insight.Watched kids channel.Embarrassed after being slighted by a celebrity.Feeling charm'
+    b'ing and smooth.Dreading the idea of trying for a baby.Mildly amused by a joke.Chuckling at a goo'
+    b'd joke.Roaring with laughter at something hilarious.Finding something comedy gold.Enjoying fresh'
+    b" air.Desperate to go outside.Good workout.Can't lift arms due to muscle fatigue.Cause for applau"
+    b'se.Feeling like a master of melody and music.Bummed out by a disappointing interaction.Feeling s'
+    b'killed at work.Embarrassed after drawing a blank during a presentation.Feeling victorious at wor'
+    b'k.Insanely happy.Unpredictable anger due to erratic traits.Feeling sad due to insanity trait.Ran'
+    b'domly feeling flirty for no apparent reason.Embarrassed by a terrible performance at work.Feelin'
+    b'g skilled and talented.Feeling smart finishing homework.Feeling tech-savvy.Stargazing has put li'
+    b'fe into perspective.The night sky serves as a vast canvas for inspiration.Playing on monkey bars'
+    b'.Feeling smart from a science drink.Drank a science drink.Feeling chemically induced boredom aft'
+    b'er drinking a science experiment.Stomach bubbling from a weird science drink.Bored of playing vi'
+    b'deo games after a long session.Playing make-believe with a stuffed animal.Feeling superior and u'
+    b'nited.Won a video game tournament.Disappointed about losing a gaming tournament.Stressed by maki'
+    b'ng constant mistakes at work.Agency hero.Feeling professional at interrogation.Embarrassed after'
+    b' a bluff was called at work.Feeling like the best around.Act of kindness at dollhouse.Feeling ru'
+    b'sty and out of practice at work.Feeling cool like a spy.Embarrassed by a clumsy move in a profes'
+    b'sional setting.Embarrassed by having to deal with henchmen instead of the boss.Preparing a diabo'
+    b'lical presentation.Ashamed of a dreadful public display.Feeling smart debunking a blog.Mortified'
+    b' after being accused of plagiarism.Advice fixed.Embarrassed because their advice turned out to b'
+    b'e wrong.Ashamed after being caught stealing an idea.Embarrassed that their movie was a box offic'
+    b'e bomb.Movie vision.Feeling like a pro investigator.Frustrated that the investigation is going n'
+    b'owhere.Feeling truthful in politics.Feeling like a pariah in the political sphere.Feeling influe'
+    b'ntial speaking.Got engaged.Depressed about a recent divorce.Playing with talking doll.Playing wi'
+    b'th a talking doll.Angry after talking to an emotion doll.Bored by the repetitive phrases of a ta'
+    b'lking doll.Sad talking to a doll.Stressed out by a creepy talking doll.Feeling embarrassed after'
+    b' talking to a doll.Smelling of manure and feeling gross.Feeling tough knocking out a guard.Adren'
+    b'aline spiking after a close call at work.Embarrassed after being spotted by a guard during a mis'
+    b'sion.Feeling handy fixing a tire.Embarrassed by failing to change a tire properly.Feeling compet'
+    b'ent drilling.Embarrassed after failing a safety drill.Feeling smart cracking codes.Embarrassed f'
+    b"or falling asleep during a heist.Feeling thrilled by a heist.Stressed that there aren't enough t"
+    b'eam members for the heist.Feeling smart solving a virus.Frustrated finding nothing on the virus.'
+    b'Panicked that the virus bricked the computer.Feeling social posting pics.Frustrated by encrypted'
+    b' forums.Feeling liberated with info.Frustrated by secure information access.Feeling accurate fix'
+    b'ing decimals.Sad about playing the triangle silently.Played an epic game.Feeling proud of progra'
+    b'mming.Feeling devious programming.Playing with stuffed animal.Wearing a flirty cow mascot costum'
+    b'e.Feeling quirky and fun in a costume.Feeling aggressive wearing a lion costume.Feeling ridiculo'
+    b'us in a panda costume.Feeling wild wearing a tiger print.Hot and confused inside a mascot suit.F'
+    b'eeling nocturnal and alert wearing the owl costume.Embarrassed after being scammed in space.Feel'
+    b'ing routine in space.Embarrassed after failing to kick out an unruly fan.Feeling authoritative k'
+    b'icking out a fan.Feeling popular making juice.Feeling supported in juice making.Created a succes'
+    b'sful exotic juice blend.Studying a painting and feeling its emotional depth.Feeling weird alien '
+    b'energy from a drink.Drinking alien juice affects the mind.Feeling successful drinking alien juic'
+    b'e.Outstanding perfectionist.Deeply ashamed that their work quality was poor.Hurt by being reject'
+    b'ed and replaced.An avant-garde piece of work was well received.Furious that their edgy art piece'
+    b' was rejected.Frustrated that their opinion was dismissed at work.Feeling persuasive debating.Fe'
+    b'eling artistic editing paintings.Angry about editing a painting making it worse.Planning a heist'
+    b' with insider information.Paranoid that the room is bugged.Hacking into a mainframe.Embarrassed '
+    b'after a confrontation with a coworker.Sad about dealing with angry employees.Feeling persuasive '
+    b'at work.Furious that their experimental art was rejected.Feeling validated by acceptance.Feeling'
+    b' that the effort to tutor someone was worthwhile.Disappointed that a tutoring session failed.Fee'
+    b'ling generous donating work.Feeling charitable donating work.Sad that a donation was rejected.Fe'
+    b'eling respected as a gamer.Sad about failing to teach hands-on.Insecure and embarrassed about th'
+    b'eir recent sexual performance.A hands-on teaching lesson went perfectly.Stressed trying to teach'
+    b' music theory.Pleasantly satisfied WooHoo.Completely satisfied WooHoo.Seeing stars after WooHoo.'
+    b'Feeling tough accepting criticism.Angry about a harsh review.Feeling unsatisfied and awkward.Ang'
+    b'ry about being outbid or underpricing work.Feeling smart correcting prices.Underpriced purchase.'
+    b'Sitting in on a class provided new insights.Proud to have sponsored a budding artist.Sad that sp'
+    b'onsoring an artist failed.Found the perfect reference material for a new painting.Frustrated tha'
+    b't the art reference photos are bad.Bored of hearing someone else gloat about themselves.Writing '
+    b"a new novel.Staring at a blank page with writer's block.Browsing the intelligence database for w"
+    b'ork.Embarrassed by what they found (or failed to find) in the intelligence database.Bored by sif'
+    b'ting through useless intelligence database files.Embarrassed by a loss of status in the gaming c'
+    b'ommunity.Feeling credible as a gamer.A cooking show has made the mouth water and mind race.Readi'
+    b'ng great literature to improve writing skills.Learned new guitar chords and theory.Studied violi'
+    b'n techniques and composition.Absorbed new piano composition methods.Playing cool key chords.Play'
+    b'ing rockin riffs.Playing soothing strings.Child coming home from school angry.Bored by a long, d'
+    b'ull day at school.Having a generally embarrassing day at school.Having a miserable day at school'
+    b'.Stressed by a hard day at school.Feeling confident at school.Feeling awake and ready for the sc'
+    b'hool day.Had a flirty day at high school.Focused on lessons during the school day.Happy school d'
+    b'ay.Learned something cool and inspiring at school.Having a fun and silly day at school.Feeling d'
+    b'angerous drinking flaming drinks.Feeling fiery drinking flaming drinks.Feeling hot drinking flam'
+    b"ing drinks.Beguiled by someone's charm.Filled with self-doubt.Furious about a vicious rumor spre"
+    b'ad about them.Feeling subtly belittled.Watching laser light show.Feeling satisfied collecting.Fe'
+    b"eling mischievous.Embarrassed because a prank didn't work.Did good.Angry about being woken up.Li"
+    b'stening to music is fueling the soul.Applying researched knowledge to gardening.Admired a posses'
+    b'sion.In a manic cleaning frenzy due to being neat.Getting into the groove for a performance.Movi'
+    b'ng up in career.Embarrassed by career choices and rethinking life path.Ambitious promotion.Tryin'
+    b'g to stay positive despite embarrassing career setbacks.Stressed looking at the computer screen.'
+    b'Feeling mean and tough.Grossed out by a dirty counter.Feeling sneaky.Feeling tough threatening.F'
+    b'eeling humiliated and threatened.Gloomy because a loved one is interacting with someone else.Pla'
+    b'ying scintillating strings.Playing killer key chords.Playing righteous riffs.Feeling powerful bi'
+    b'nding voodoo.Feeling proud of conquests.Bored by television programs they deem low-brow.Watching'
+    b' funny videos on the computer.Fascinated by the history and nuance of language.Bored by research'
+    b'ing common idioms on the computer.Caught hacking or cheating via computer programming.Feeling su'
+    b'ccessful bragging.Feeling artistic.Happy about mean mischief.Feeling capable cooking.Confident i'
+    b'n the kitchen due to high cooking skill.Ready to prepare a world-class gourmet meal.Feeling comp'
+    b'etent composing.Viewing a bonsai tree shaped playfully.Amused by the shape of the bonsai tree.Co'
+    b'ntemplating the shape and beauty of a bonsai tree.Looking at a bonsai tree and feeling anger.Ups'
+    b'et about a badly trimmed bonsai tree.Viewing a bonsai.Charisma boosted by magic.Happy memory.Rem'
+    b'embering a romantic moment.Feeling confident reminiscing.Recalling an angry memory.Recalling a s'
+    b'ad memory.Recalling a specific moment of great inspiration.Recalling a painful memory of embarra'
+    b"ssment.Reached the breaking point in an argument.Unamused and bored by someone's dull sense of h"
+    b'umor.The conversation is getting hot and heavy.Made a deep connection.Feeling like an "awkward t'
+    b'urtle" after a social flop.Feeling on a roll with jokes.Flattered.Laughing off a clumsy mistake.'
+    b'Feeling smart discovering a formula.Feeling playful at work.Feeling like a leaf on the wind, foc'
+    b'used and calm.Motion sick and disoriented.Sad about failing an examination.Annoyed by ungrateful'
+    b' pilots at work.Feeling lucky with high stakes.Devastated by a failure when the stakes were high'
+    b'.Feeling purpose-less after a useless mission.Embarrassed and wanting to abandon a failing proje'
+    b'ct.Feeling adventurous traveling wormholes.Angry that cargo had to be dumped.Feeling instinctive'
+    b'.Feeling small after being chewed out by a boss.Contacted aliens.Feeling successful busting alie'
+    b'ns.Embarrassed by the fallout from a bad patrol.Energized by handling alien creatures at work.Re'
+    b'gretting not taking action when needed.Feeling fortunate.Covered in trash and smelling awful.Ash'
+    b'amed for failing to defend the galaxy.Frustrated by how work is going.Humiliated because other o'
+    b'fficers are laughing at them.Feeling slick evading taxes.Cuts and bruises stinging all over.Frus'
+    b'trated coming home empty-handed.Frustrated by a missed opportunity.Made a double arrest.Analyzed'
+    b' a moon rock and feeling cosmic inspiration.Embracing the inner child while playing.Angry that a'
+    b' suspect escaped.Feeling excited going viral.Dealing with a lack of news at work.Sad about a del'
+    b'ayed post.Angry about not being fully paid.Feeling adventurous branching out.Embarrassed by a ba'
+    b'cklash from fans.Writing praised.Sad about bad journalism.Angry about being a horrible host.Emba'
+    b'rrassed by the poor reception of a confusing sequel.Sad about a bad bargain.Sad about the electr'
+    b'onic future.Upset about manuscript spoilers.Charitable action.Unorthodox report.Embarrassed for '
+    b'going too over-the-top in a performance.Spooked by something at work.Telling wild stories about '
+    b'a riot.Embarrassed for asking unnecessary questions.Focused on saving kittens in the career.Anno'
+    b'yed by fearless hipsters.Stressed by the racket.Humiliated after receiving a thorough thrashing '
+    b"in a competition.Feeling momentous.Embarrassed because a car stunt didn't look like reality.Emba"
+    b'rrassed by an unflattering new nickname at work.Embarrassed because the audience was left bewild'
+    b'ered, not impressed.Fingers numb and stinging from cold.Sad about the number seven.Evaluating em'
+    b'ployees strictly.Cracking security.Furious about hearing spoilers.Locked out of the workplace.Le'
+    b'aking confidential knowledge.Upset about causing an internet controversy.Getting a sneak peek at'
+    b' something exciting.Angry about crying babies.Fully rested and recovered for work.High on indust'
+    b'rial fumes.Engaged in a stimulating intellectual debate.Learning story structure from a writer.A'
+    b'shamed of a splotchy paint job.Sad about ruined art pieces.Feeling like a washed-up artist.Seein'
+    b"g the world through a painter's artistic lens.Sad about an abstract memory.Fewer chores.Sad deal"
+    b'ing with pain.Restored a painting.Inspired by physical movement and dance.Sad about a lack of mo'
+    b'mentum.Riding high on critical praise for work.Ashamed after being caught making a false claim.R'
+    b'ewarded inspiration.Doing something silly for exposure.Sad about a tarnished reputation.Feeling '
+    b'secure in job.Worried about losing the job.Drawing a crowd with antics.Embarrassed because they '
+    b'accidentally dispersed a crowd.Collection bonanza.Honorary wing.Sad about art in the dark.Frustr'
+    b'ated by a calculation error.Amused by a humorous boss.Embarrassed and worried about a pager aler'
+    b't.Embarrassed after failing to speak up in a meeting.Bored by having to do even more paperwork a'
+    b't work.Learning finger placement and technique on the guitar.Feeling like an incompetent agent.S'
+    b'ad about a mentor turning against them.Bored by working on a very uninteresting detective case.E'
+    b'mbarrassed because no one on the team is working.Feeling restless during office downtime.Gatheri'
+    b'ng blackmail material.Cringing after giving a cheesy speech.Feeling terminally hot from a career'
+    b' event.Spy games.Humiliated because their memoirs were canceled.Feeling awkward next to a "strai'
+    b'ght arrow" partner.Laughing about tasty secrets.Bitter taste of embarrassment after a failure.Fe'
+    b'eling in the clear.Paranoid about being under suspicion.Performed for friends.Sad about an empty'
+    b' crowd.Shutting down a heckler.Embarrassed by a flubbed attempt at a task.Feeling proud of a bal'
+    b'lad.Humiliated being chased off stage.Itchy and uncomfortable in a borrowed suit.Mortified by an'
+    b' awkward sound made in a quiet room.Catchy tune.Annoyed by a trivial matter.Sad about losing fan'
+    b's.Irritated that the seat was taken.Tuned the piano perfectly.Sad about sticky keys.Managed a di'
+    b'fficult bride successfully.Stressed dealing with a bridezilla.Appealing composition.Sad about be'
+    b'ing beaten by a slob.Furious about not getting credit for work.Embarrassed for overstepping boun'
+    b'daries in a friendship.Sticky and humiliated by spitballs.Guilty and anxious about shifting blam'
+    b'e.Feeling proud rocking country.Ashamed of using fake documents.Feeling mentored.Learning handin'
+    b'ess from a mentor.Frustrated by a feeble manager.Saw the dark side of the moon and felt awestruc'
+    b'k.Embarrassed by a failed money spam scam.Invented a brand new culinary delight.Angry about bein'
+    b'g scammed.Holding breath to avoid the stench.Appeased haters.Talking a way out of trouble.Sad th'
+    b'at a musical composition was ignored.Caught hacking work performance records.Embarrassed after a'
+    b' "call out" failed.Feeling sharp roasting a hack.Frustrated by audio equipment failure.Angry abo'
+    b'ut being shorted money.Energized and confused by a hysterical cauliflower incident.Embarrassed a'
+    b'fter realizing they are in the wrong company.Successfully improvised a musical piece.Pumped afte'
+    b'r writing a TV script.Feeling instinctive as a spy.Feeling sneaky undercover.Fingers throbbing a'
+    b'nd bloody.Feeling cool chatting with henchmen.Happy to be alone.Feeling victorious in space batt'
+    b"le.Played with dollhouse.Bored because the neighbors aren't doing anything interesting to spy on"
+    b'.Spying on neighbors and finding it funny.Caught spying on neighbors with a telescope.Had a grea'
+    b"t gaming session and feeling sharp.Cringing at someone's bad musical playing.Embarrassed by some"
+    b"one else's poor musical performance nearby.Fueled up by a protein shake.Sad about the plight of "
+    b'space colonists.Embarrassed after being busted by the space police.In pain and scared after an a'
+    b'lien bite.Soaked and miserable in a bad tub.Feeling productive writing.Moving fast and training '
+    b'hard on the punching bag.Head is in the clouds, dreaming up ideas.Nauseous and dizzy.Proud of hi'
+    b'tting a target with a spitball.Embarrassed to be receiving yet another lecture.Embarrassed after'
+    b' falling asleep in class.Anxious and sad about being underprepared for work.Grossed out by steal'
+    b"ing organs.Feeling satisfied with ill-gotten food.Happy about a friend's generosity.Fixing a fir"
+    b'e alarm extension.Laughing at unguarded answers.Sad about testing angst.Bored and confused by a '
+    b"work situation they don't understand.Angry about discussing feelings.Embarrassed by a meeting wi"
+    b'th a parent or counselor.Laughing hysterically from too much stress.Waking up energized after a '
+    b'nap during third period.Feeling smart studying with peers.Sad about falling behind at work.Homew'
+    b'ork is finished, mind is sharp.Overwhelmed by a mountain of homework.Strategizing how to maintai'
+    b'n a C grade.Working on an A+ project.Annoyed by slacking classmates.Angry about a lower grade.Ha'
+    b"ppy about finding something cool.Bored by the principal's long speech.Tackling a difficult repor"
+    b't.Mental exhaustion and boredom from a tedious work task.Dissuading bullies with humor.Humiliate'
+    b'd and physically uncomfortable.Embarrassed by a friend acting simple-minded.Sad about a fight wi'
+    b'th a friend at work.Embarrassed for throwing off the grading curve.Bored by a heavy-handed life '
+    b'lesson at work.Taking a quick, energetic break from studying.Focusing on the future.Brain frying'
+    b' from information overload.Buzzing and crashing from too much soda.Embarrassed for oversleeping '
+    b'and being late.Riding a long-lasting sugar rush at work/school.Upset about a lower test score.St'
+    b'ressed maintaining perfection.Happy with results.Returned notebook.Feeling ahead of a rival.Angr'
+    b'y about an ungrateful rival.Embarrassed to be tutored by a rival.Sad about unruly classmates.Mor'
+    b'tified by a disastrous quiz result.Playing truth or dodgeball.Stressed dealing with a fiery ex.P'
+    b'utting an ex on hold.Angry about a smelly tirade.Teaching oneself new concepts.Sad about missing'
+    b' a deadline.Embarrassed scrambling during a demonstration.Cleared out tasks efficiently.Improvin'
+    b'g camaraderie.Laughing about a doctored photo of the boss.Feeling unrivaled.Angry about a rushed'
+    b' project.Sad about a canceled project.Pumped because an idea got greenlit.Humiliated by the crow'
+    b"d's jeers.Angry about a mascot beatdown.Acting as a personal mascot requires focus.Feeling unite"
+    b'd with the team.Angry about a disastrous match.Feeling stronger without weak links.In the gamer '
+    b'zone.Recovering from partying way too hard.Afraid of the vengeful moderator.Enjoying a fun vacat'
+    b'ion.Embarrassed by the behavior of a despicable CFO.Feeling relieved company is recovering.Answe'
+    b'ring calls stress-free.Singing in the shower triggered a great idea.Taking a steamy shower.Feeli'
+    b'ng psyched up in the mirror.Future cube predicts a bright love life.Depressed by a bleak love fo'
+    b'recast from the Future Cube.The Future Cube predicts a good study session.Feeling dumb after usi'
+    b'ng the future cube.The cube showed a glimpse of a creative future.Feeling uninspired by the futu'
+    b're cube.Solving a puzzle on the motion gaming rig.Molding clay into strange shapes stimulates th'
+    b'e mind.Fingers hurting but the music sounds good.Wide awake after a brisk shower.Pondering the n'
+    b'ext move on the chess board.Adopted.Looking at digital art online for inspiration.Researching pi'
+    b'ck-up lines on the computer.Examining a fascinating collectible specimen.Trying on sexy outfits.'
+    b'Wearing a suit of armor that radiates love.Feeling tickled pink in a new outfit.Wearing a litera'
+    b'l "hat of shame."Learning piano scales from a tutor.Learning violin bowing techniques from a tut'
+    b'or.Receiving professional mentoring on child homework.Receiving professional mentoring on teen h'
+    b'omework.Child feeling peeved.Sketching out ideas on the easel.Feeling confident looking at somet'
+    b'hing.Ate food that causes mild flirty emotions.Ate food that causes strong flirty emotions.Feeli'
+    b'ng mildly playful after eating.Feeling very playful after eating.Feeling a little pep from energ'
+    b'izing food.Feeling a massive energy spike from food.Feeling slightly angry due to food.Feeling v'
+    b'ery angry due to food.Plead success.Feeling legendary seducing Death.Feeling powerful demanding '
+    b'from Death.Anxious about not getting promoted fast enough.Drank a "Boiler Room" cocktail and fee'
+    b'ling angry.Drank a "Boiler Room" cocktail and feeling very angry.Mildly flirty after drinking Cu'
+    b'pid Juice.Very flirty after drinking Cupid Juice.Bro love.Feeling trapped in this career.Cookie '
+    b"before dinner.Stressed by a toddler's cookie tantrum.Cleaned up mess.Covered in paint and frustr"
+    b'ation.Annoyed that a mess was left behind.Learning life lessons while babysitting.Feeling suffoc'
+    b'ated and trapped in the relationship.Happy to break up.Goofing off during a break at the fast fo'
+    b'od job.Embarrassed by a mess at the fast food job.Laughing about eating food off the floor.Gross'
+    b'ed out by hair in a burger at work.Feeling proactive working fast food.Proud of clearing out a r'
+    b'etail display.Grateful customer.Sad about turning a customer away.Embarrassed by accidentally bu'
+    b'rying a customer in clothes.Customer praise.Feeling skilled barista.Sad about needing more pract'
+    b'ice.Feeling fast at manual labor.Appreciating the beauty of simple landscape design.Sad about do'
+    b'uble the work.Mastering the backhoe during manual labor work.Sore and shaken from a crash.Frustr'
+    b'ated by a lack of artistic inspiration.Feeling capable writing.Feeling inspired writing.Writing '
+    b'with a steady flow of energy.Furiously typing with high energy.Writing a romance novel (Low inte'
+    b'nsity).Writing a romance novel (High intensity).Writing a comedy book and cracking up.Writing a '
+    b'comedy book and cracking up.Feeling the emotion of the sad book they are writing.Feeling the emo'
+    b'tion of the sad book they are writing.Cozy fire.Experiencing intense contractions.Embarrassed ab'
+    b"out getting lost.Sent to the principal's office.Snacking on the job.Good laugh at work.Embarrass"
+    b'ed giving bad answers in an interview or test.Feeling like a laughing stock at work.Embarrassed '
+    b'and angry about wetting pants at school.Cheating a little bit at work.Angry about being tattled '
+    b'on.Disgusted by old gum.Angry about being wrongly accused.Being the class clown.Ballistic waterm'
+    b'elon gum.Disgusted but laughing about shared gum.Angry about bullying a nerd.Hurt by friends tur'
+    b'ning them away.New friend at work.Forging a signature with a grin.Field trip.Angry about forging'
+    b' a wrong name.Bored at school because they missed the field trip.Sugar rush from a chocolate chi'
+    b'p cookie at work.Angry about being falsely accused.Helped another at work.Angry because they wer'
+    b"e just trying to help.Bored because the teacher won't let them doodle in class.Bored and annoyed"
+    b' by having to retake a test.Fluffy recovered.Recaptured Fluffy.Sad about losing the right to han'
+    b'dle gerbils.Embarrassed that the class pet, Fluffy, went missing.Laughing because someone else i'
+    b's in trouble.Sent into the hall at school.Refreshed after a nap in PE class.Caught napping on th'
+    b'e job.Secret admirer.Embarrassed to be the subject of class gossip.Copying off a classmate.Worki'
+    b'ng on an extension for an assignment.Hungry and sad about missing lunch.Sad about losing a frien'
+    b'd.TV birthday.Angry about retaking a test.Bored and resentful about having extra homework assign'
+    b'ed.Sad that a project was thrown out.Embarrassed after being tricked into failing.Sad about losi'
+    b'ng honestly.Academic fame.Feeling winning.Making paper airplanes.Collaborating on a design proje'
+    b"ct.Sad about a bent airplane.Laughing at another's embarrassment.Feeling perks of camaraderie an"
+    b'd biscuits.caught with a bib at school.Culprit caught.Moving a sign to confuse people.Sad about '
+    b'a failed ruse.Feigning illness to skip something.Feeling shamed bully.Snickering about a laxativ'
+    b'e-laced brownie prank.Hungry and sad about missing a meal.Feeling betrayed by the principal.Help'
+    b'ing the cool kids.Sad about being a cheater.Embarrassed by how long and awkward an interview too'
+    b'k.Enjoyable interview.Actively storytelling with dolls.Just admired something.Just admired somet'
+    b'hing.Depressed about not having bought anything new recently.Reading a mentally stimulating book'
+    b'.Lazy cozy seating.Jealous that a love interest is interacting with others.Jealous that love is '
+    b'drifting away.Jealous that their spouse is flirting.Jealous of an uninterested soulmate.Jealous '
+    b'of an enemy with benefits.Mortified after being caught with another lover.Guilt-ridden after bei'
+    b'ng caught cheating.Furious that cheating was discovered.Jealous about a doomed relationship.Good'
+    b' ingredients.Nauseated by rotten ingredients.Gagging at the quality of the food.Good ingredients'
+    b'.Feeling great catch fishing.Feeling amazing catch fishing.Jealous of a true enemy.Jealous and a'
+    b'wkward.Jealous of unfaithful love.Bronze birthday party.Silver birthday party.Gold birthday part'
+    b'y.Bronze guest.Silver guest.Gold guest.Feeling decent host.Feeling good host.Feeling great host.'
+    b'Bronze engagement party.Just finished a date with a bronze rating.Gold engagement party.Silver e'
+    b'ngagement party.Just finished a date with a gold rating.Just finished a date with a silver ratin'
+    b'g.Tipsy and confused from a Snaggle Fluster drink.Burned out from working hard.Taking it easy at'
+    b' work.Tense carrying contraband.Feeling like a boss.Thinking about food even while at work.Dream'
+    b'ing up new cocktail recipes on the job.Feeling big break.Humming new melodies during the workday'
+    b'.Performing a comedy routine.Visualizing the next painting while working.Focusing on artistic te'
+    b'chniques during work hours.Talking to themselves about how pretty they are.Stressed about critiq'
+    b'uing art.Dejected after a failed work mission.Feeling like an agent.Feeling like a secret agent.'
+    b'Feeling like a villain.Happy at tech career.Happy gaming at work.Brainstorming the next big tech'
+    b' disruption.Plotting novel chapters while at the office.Refining prose and dialogue in the mind.'
+    b'Skimming book titles is sparking curiosity.Revealed deep secret.Angry about making a new enemy.M'
+    b'ade a new best friend.Contemplating the ramifications of power in space.Feeling brave with flash'
+    b'light.Reached the promised land.Sad about being ousted as the overlord.Embarrassed after ruthles'
+    b'sly crushing a rebellion in a space simulation.Embarrassed for turning soft as an overlord in sp'
+    b'ace.Bored because they learned nothing new from the alien overlord.Angry at petty aliens encount'
+    b'ered in space.Heartbroken over a breakup.Angry about a recent breakup.Furious that space rodents'
+    b" chewed the cables.Helped move.Sad that there isn't enough space.Feeling gloomy after a breakup."
+    b'Called the rangers.Feeling successful rescue.Sad about a failed rescue mission.Experiencing spac'
+    b'e madness and hallucinations in orbit.Recovering focus after space madness.Embarrassed by irrati'
+    b'onal actions caused by space madness.Sanity restored after a bout of space madness.Claustrophobi'
+    b'c and panicked in space.Recovering from space madness.Bored and confused because they forgot the'
+    b'ir mission in space.Riled up by someone.Sad because of the struggle between good and evil.Sad ab'
+    b'out an alien napping.Angry about being cuffed by a stowaway on the rocket.Sad about lost treasur'
+    b'e.Focusing on repairing alien technology found in space.Relaxed in whirlpool.Panicked because of'
+    b' a fire nearby.Shaken up after the fire was put out.Feeling inadequate due to poor work performa'
+    b'nce.Listening to music.Used bidet.Shared big news.Nervous about sharing big news.Pleasantly sati'
+    b'sfied WooHoo.Seeing stars after WooHoo.Had a baby.Stressed about being pregnant while hating chi'
+    b'ldren.Miserable about the pregnancy.Dreading the birth.Panicking at the wedding arch due to comm'
+    b'itment issues.Made a new enemy.Devastated after being fired from a job.Devastated after being fi'
+    b'red from a job.Anxious about being unemployed and not advancing.Angry and needing a smoke.Angry '
+    b'after getting into a fight with another child.Made a new friend.Active morning person.Sad that p'
+    b'arents are divorcing.Sad about a new sibling taking attention.Child angry about meeting a new si'
+    b'bling.Met new sibling.Active night owl.Admiring self in mirror.Embarrassed after catching themse'
+    b'lves vainly admiring their reflection.High score on phone.Devastated and humiliated after a marr'
+    b"iage proposal was rejected.Agitated because video games haven't been played lately.New partner.A"
+    b'wkward and stressed by an unwanted marriage proposal.Watching news as a snob.Writing is going we'
+    b'll and words are coming easily.Writing a book with steady concentration.Writing a book with inte'
+    b'nse concentration.In a state of pure literary flow.Stomach heaving and throat burning.Feeling ar'
+    b'tistic masterpiece.Showing off flair bartending moves.Feeling brave extinguishing fire.Feeling b'
+    b'rave extinguishing sim.Tense from working hard at school.Feeling mischievous object prank.Feelin'
+    b'g slick pickpocketing.Dying of laughter from the funniest joke ever.Embarrassed after telling a '
+    b'joke that horrified the audience.Screaming in agony because of being on fire.Painful and embarra'
+    b'ssed after being singed by fire.Panicking because someone is in labor.Released spirit.Bitterswee'
+    b't about releasing a spirit to the netherworld.Embarrassed by poor grades received in a lecture.F'
+    b'eeling proud of grades.Feeling capable after learning the basics.Angry about being lectured on r'
+    b'esponsibilities.Witnessed a fight.Stressed after witnessing a fight.Upset after witnessing a fig'
+    b'ht.Adrenaline pumping after witnessing a fight.Watching a fight sparked an adrenaline-fueled ide'
+    b'a.Shaken and scared after a fight.Bored by watching a fight that lacked excitement.Exhausted and'
+    b' wired from working all night.Wired after drinking energy juice.Promised to partner.Attempting m'
+    b'ental telepathy.Humiliated after a promise ring offer was rejected.Clean coat.Feeling heroic bea'
+    b'ting villain.Dazed and humiliated after losing a villainous fight.First time WooHoo.Pumped up fr'
+    b'om streaking.Renewed vows.Double-shot of energy from strong coffee.Embarrassed that someone walk'
+    b'ed in on them.Jittery and mentally scattered from caffeine overload.Feeling emotional support.Da'
+    b'zed from laughing too hard at a joke.Wearing silly star-spangled glasses.Embarrassed after being'
+    b' rejected by a romantic partner.Optimistic about a fresh start.Mourning the loss of a baby that '
+    b'was taken away.Happy about getting good grades in school.Amused by the current view.Bored by rea'
+    b"ding a children's book because they dislike children.Frustrated about losing profits in their bu"
+    b'siness career.Stressed about getting caught gouging prices.Enjoying slacking off at work.Feeling'
+    b' adventurous after joining the mile-high club in a rocket as a teen.Feeling bold after an intima'
+    b'te encounter in space as a teen.Jittery and anxious from a caffeine crash.Focused on main astron'
+    b'aut duties.Concentrating intensely on space ranger tasks.Trying to act confident at work despite'
+    b' feeling embarrassed.In pain from a minor burn caused by the campfire.Grieving the recent death '
+    b'of a spouse.Blissful after eating Ambrosia.Suffering from an annoying, persistent itch from toxi'
+    b'c plants.Going crazy from an unrelenting itch caused by poison ivy.In agony from an extreme reac'
+    b'tion to a toxic plant.Feeling refreshed by a cool drink from the cooler.Feeling grimy and desper'
+    b'ate for a shower while camping.Startled and tense after seeing a ghost.Overjoyed about having a '
+    b'baby boy.Experiencing intense contractions and discomfort from male labor.Feeling bloated and st'
+    b'range during the first trimester of an alien pregnancy.Dealing with backaches and nausea during '
+    b'the second trimester of an alien pregnancy.Physically uncomfortable and heavy during the final s'
+    b'tage of an alien pregnancy.Feeling an angry spectral rage.Enraged by the presence of an angry gh'
+    b'ost.Feeling a ghostly urge to be mischievous.Feeling playfully spectral.Feeling a spectral sense'
+    b' of embarrassment as a ghost.Ate a delicious meal containing walleye that sparked creative energ'
+    b'y.Feeling warm and cozy by the campfire.Nauseated by something disgusting nearby due to a squeam'
+    b'ish nature.Grieving the recent death of a spouse.Repulsed by the filth and squalor of the immedi'
+    b'ate surroundings.Itchy and irritated from a bug bite.Grossed out by the smell of a stink bug.Dis'
+    b'gusted by holding a creepy, crawly insect.Proud of telling a captivating story.Embarrassed about'
+    b' ruining the ending of a story or situation.Amused by successfully scaring someone.Entertained b'
+    b'y a spooky ghost story.Feeling romantic after hearing a fairy tale.Energized by hearing an adven'
+    b'turous story.Mourning a loved one at their resting place.Pleased with a decent harvest.Happy wit'
+    b'h a good quality harvest.Delighted by an excellent quality harvest.Mentally drained and unable t'
+    b'o focus due to low brain power.Feeling homesick for their home planet.Feeling nostalgic and happ'
+    b'y thinking about the home planet.Feeling a hollow, aching hunger despite being a ghost.Absorbed '
+    b"someone else's anger via empathic connection.Feeling empathetic boredom absorbed from a nearby a"
+    b"lien.Overwhelmed by sensing someone else's physical discomfort.Overwhelmed by empathically absor"
+    b"bing someone else's stress.Empathizing with someone else's sadness.Experiencing shared amusement"
+    b' through an alien empathy link.Feeling a deep sense of connection and creativity after empathizi'
+    b'ng with an alien.Feeling happy due to empathetic connection.Feeling focused after absorbing some'
+    b"one else's focused emotion via alien empathy.Empathically sensing the flirty emotions of a nearb"
+    b'y Alien.Feeling energized due to an empathic link with an alien.Feeling embarrassed via empathic'
+    b' connection with another.Dazed from the emotional impact of empathizing with an Alien.Feeling an'
+    b' empathetic connection to alien emotions.Disoriented and confused after having memories erased b'
+    b'y an Alien.Terrified of water due to drowning death memories.Feeling strange but happy after bei'
+    b'ng transformed by the SimRay.Feeling satisfied with hosting a decent weenie roast.Feeling proud '
+    b'of hosting a good weenie roast.Feeling triumphant after hosting an excellent weenie roast.Relaxe'
+    b'd after a nice swim in the pool.Shivering uncontrollably after being frozen by a ray gun.Disappo'
+    b'inted by a negative pregnancy test.Relieved to be protected from insects.Artificially calmed by '
+    b'an interrogation mood control device.Feeling defensive and angry during an interrogation.Furious'
+    b' from a mood-altering interaction at an interrogation table.Feeling shy and cornered during inte'
+    b'rrogation.Feeling smug and in control during an interrogation.Feeling suspicious and guarded dur'
+    b'ing questioning.Worried about the outcome of this interrogation.Terrified by the intensity of th'
+    b'e interrogation.Artificially made friendly by an interrogation mood control device.Feeling fresh'
+    b' after using a herbal deodorant.Feeling pumped after drinking an energizing herbal potion.Tense '
+    b'and under pressure from questioning.Gagging at the taste of a disgusting herbal remedy.Sudden, i'
+    b'ntense hunger pangs from a serum side effect.Burning with rage from drinking a Red Hot Serum.Fee'
+    b'ling better due to a placebo effect.Enjoying the kick of a spicy serum.Stomach churning after co'
+    b'nsuming a weight loss serum.Wearing a rose perfume that boosts romantic allure.Feeling an intens'
+    b'e burning love from a serum.Feeling a chemical urge to hide from everyone after drinking a serum'
+    b'.Feeling mischievous after drinking a ghostly serum.Terrified of the Grim Reaper after drinking '
+    b'a serum.Feeling irrationally angry after drinking a Mad as an Ox serum.Consumed a serum that che'
+    b'mically enhanced cognitive brilliance.Feeling superior and bored after drinking a scientific ser'
+    b'um.Feeling arrogant and angry, demanding recognition.Feeling generally unwell and queasy after t'
+    b'aking a serum.Buzzing with energy from a Spark Drive serum.Feeling fearless after drinking the R'
+    b"eaper's Friend serum.Thrilled by the risk of drinking a mysterious serum.Feeling lonely after dr"
+    b"inking a serum.Feeling lucky and handy after drinking the Fixer's Luck serum.Feeling anxious abo"
+    b'ut a string of bad luck.Still heartbroken despite taking a serum to fix it.Feeling focused due t'
+    b'o the effects of a potent alien serum.Grossed out by bugs crawling around the camping bathroom.F'
+    b'eeling refreshed by the forest air.Coughing and eyes watering from a smoke-filled tent.Feeling c'
+    b'onfident about grilling skills.Proud of grilling abilities.Feeling like a master of the grill.Ex'
+    b'pertly grilling food.Happy about using high-quality ingredients for grilling.Feeling victorious '
+    b'after winning a game of horseshoes.Sore loser after a game of horseshoes.Feeling strange and une'
+    b'asy after testing a serum on oneself.Enjoying a roasted marshmallow.Delicious satisfaction from '
+    b"eating a s'more.Enhanced grilling skills from a herbal potion.Stargazing has triggered a sense o"
+    b'f cosmic inspiration.Watching the clouds has sparked a flurry of imagination.Scared by a ghost w'
+    b'hile inside a tent.Adrenaline rushing after a great scare in a tent.Feeling homesick while campi'
+    b'ng in the forest.Mildly itchy all over.Feeling mildly giggly from an illness.Suffering from a du'
+    b'll, nagging headache.Intrigued by interesting results from the chemistry lab.Frustrated that che'
+    b'mistry experiments keep failing.Feeling lightheaded and woozy from inhaling toxic chemistry lab '
+    b'fumes.Feeling unwell and seeing mild hallucinations.Feeling slightly queasy and unsettled.Feelin'
+    b'g groggy and dazed as a side effect of medicine.Sniffling and dealing with a scratchy throat.Fee'
+    b'ling mildly dizzy and unsteady.Running a mild temperature and feeling flushed.Annoyed by mild fe'
+    b'ver and ear pressure.Miserable from severe coughing and sneezing fit.Experiencing severe dizzine'
+    b'ss and room-spinning vertigo.Burning up and shivering from a high fever.Debilitated by a poundin'
+    b'g, severe headache.Scratching intensely at a severe, all-over itch.Stomach turning violently fro'
+    b'm severe nausea.Hallucinating vivid visions due to severe illness.Distressed by severe fever and'
+    b' head pressure.Uncontrollably giggly from a sickness.Relieved after peeing in the pool.Analyzing'
+    b' with laser precision using the X-ray machine.Disappointed about losing a game of horseshoes.Irr'
+    b'itated by getting splashed in the eye.Amused by using the SimRay on others.Shivering from a sudd'
+    b'en, unnatural chill.Thrilled about WooHooing in the wilderness.Panicking under the influence of '
+    b'mind control.Concentrating on throwing horseshoes accurately.Amused by controlling someone to ea'
+    b't.Having a splashy good time in the pool.Amused by controlling someone to clean.Amused by contro'
+    b'lling someone to sleep.Amused by controlling someone to sit.Annoyed by general work frustrations'
+    b'.Stressed and physically drained after a hard day at the office.Feeling happy about work perform'
+    b'ance.Sore and weary from the physical demands of the job.Mentally exhausted from a high-pressure'
+    b' work environment.Angry about a specific career setback.Feeling out of place and uncomfortable a'
+    b't work.Feeling confident about their career performance.Feeling confident about their career pat'
+    b'h.Embarrassed by a specific work failure.Feeling pumped from a work-related event.Embarrassed by'
+    b' a mistake made at work.Itchy and annoyed after getting covered in ticks.Freaked out by somethin'
+    b'g in the bramble patch.In serious pain after being mauled by a bear.Filled with supernatural rag'
+    b"e from the Reaper's essence.Mind buzzing with sci-fi concepts and ideas after watching alien tel"
+    b'evision.Mentally stimulated by contact with alien life via satellite.Energized by analyzing athl'
+    b'etic statistics.Furious about poor sports statistics.Feeling pumped up for an athletic career ta'
+    b'sk.Intimidated by the skill of the opponents.Feeling competitive and energetic from athletic tra'
+    b'ining.Excited by juicy office gossip.Studying constellation formations in the sky.Feeling down a'
+    b'bout a career setback.Feeling happy about career progress.Feeling energetic due to a work situat'
+    b'ion.Feeling shame over a professional blunder.Feeling financially savvy after receiving investme'
+    b'nt tips.Angry about being tricked or fooled.Feeling important and valued by others.Disoriented a'
+    b'nd sick from eating a toxic huckleberry.Feeling sick and sad after eating toxic elderberries.Bur'
+    b'ning with irritation after eating Fireleaf.Feeling jittery after eating a toxic plant.Sick to th'
+    b'e stomach after eating a toxic mushroom.Mind-controlled into a rage by a satellite dish.Connecte'
+    b'd to the alien hivemind via satellite.Knocked out and dazed by a hivemind signal from a satellit'
+    b'e dish.Overheating and sweating in a pool that is too warm.Feeling guilty about cutting employee'
+    b' bonuses.Gleeful about cutting bonuses at work.Gleeful about closing a branch at work.Sad about '
+    b'having to close a business branch.Viewing nature as a living masterpiece and feeling artisticall'
+    b'y moved.Appreciating the beauty of the outdoors.Waking up happy in nature.Rejuvenated by spendin'
+    b'g time in the forest.Disgusted and stressed by the surrounding filth.Bored and tense due to a la'
+    b'ck of culture.Naturally charming and prone to romance.Deeply inspired by the beauty of the surro'
+    b'unding environment.Deeply analyzing chemical samples.Feeling confident in their business skills.'
+    b'Satisfied with business career progress.Feeling like a shark in the business world.Feeling guilt'
+    b'y about passing the blame to others.Gleeful about passing the blame at work.Feeling an exhilarat'
+    b'ing thrill that kickstarts the imagination.Awestruck and inspired by the undeniable realization '
+    b'that magic exists.Energized by listening to a treasured tale.Feeling like an incredible storytel'
+    b'ler.Laughing off a silly attempt at a scare.Feeling uplifted and motivated by a story with a str'
+    b'ong moral lesson.Happy about a good victory in a game.Terrified after being roared at by a bear.'
+    b'Humiliated after losing a fight with a person in a bear suit.Feeling tough after winning a fight'
+    b' against a bear.Anxious because a bear is nearby.Enjoying the crisp, fresh air.Feeling refreshed'
+    b' and creatively recharged by spending time outdoors.Feeling invigorated by spending time in natu'
+    b're.Feeling a natural state of focus.Especially loving the crisp air.Deeply revitalized and burst'
+    b'ing with ideas from being in nature.Feeling deeply invigorated by the outdoors due to loving nat'
+    b'ure.Feeling focused by the peace of the outdoors.Feeling at peace with nature.Feeling comfortabl'
+    b'e in a dirty environment.Bored by the endless paperwork at their business job.Crunching numbers '
+    b'for business work.Feeling successful after closing a business sale.Mortified after blowing a maj'
+    b'or business deal.Feeling sharp and attentive to market trends.Feeling better after a home remedy'
+    b'.Feeling revitalized after taking medicine and being cured.Mind feels clear and sharp from a her'
+    b'bal lotion.Happy about cooking with fresh ingredients.Comforted by rustic living conditions.Feel'
+    b'ing primitively awake and happy.Satisfied with a simple life.Feeling important within the compan'
+    b'y.Embarrassed after having a business idea shot down.Annoyed and bored by an arrogant coworker.E'
+    b'mbarrassed by unfavorable medical exam results.Happy after reading a book about camping.Experien'
+    b'cing a scientific breakthrough.Pumped up after hearing a fantastic adventure story.Happy about a'
+    b' victory and a great story.Feeling romantic after a great story.Amused by a scare and a great st'
+    b'ory.Amused by a silly scare performed by a great storyteller.Energized by the act of telling a s'
+    b'tory with a powerful message.Inspiration is flowing from weaving tales of magic and wonder.Excit'
+    b'ed to craft a thrilling narrative that keeps listeners on edge.Entertained by a ghost story and '
+    b'great storytelling.Energized by a captivating story from a great storyteller.Happy about providi'
+    b'ng good bedside manner.Influenced by the focusing light of a hover lamp.Mesmerized by the moveme'
+    b'nt of the planetary orrery.Finds playing horseshoes unsophisticated and boring.Embarrassed by a '
+    b'terrible performance at horseshoes.Bursting with new ideas after telling an incredibly inspiring'
+    b' story.Feeling energetic after telling a great story.Feeling charismatic because they are a grea'
+    b't storyteller.Feeling witty and ready to tell a great story.Intently constructing a new inventio'
+    b'n.Feeling festive near a lit holiday candle.Calibrating the alien portal with precision.Gazig at'
+    b' a fully lit holiday candle brings clarity.Frustrated and grimy after searching a particularly g'
+    b'ross suspect.Processing contact made through the alien portal.Aggressive due to being a criminal'
+    b' on patrol.Feeling sticky and gross after applying a foul-smelling herbal balm.Embarrassed by a '
+    b'spelling mistake on a retail sign.Desperately needs a break from work.Burnt out and needing a da'
+    b'y off immediately.Overworked and craving a long vacation.Excited about catching a critter outdoo'
+    b'rs.Embarrassed that their alien identity was discovered.Angry about discovering an alien.Feeling'
+    b' brave after discovering an alien.Experiencing exceptional mental clarity from a high-quality he'
+    b'rbal remedy.Feeling mentally clear from a herbal remedy.Experiencing absolute mental perfection '
+    b'from a masterwork herbal remedy.Smelling outstanding thanks to herbal deodorant.Smelling perfect'
+    b' thanks to masterwork deodorant.Buzzing with energy from an outstanding quality energizer potion'
+    b'.Vibrating with pure energy from a masterwork energizer potion.Deep in research on medical journ'
+    b'als.Feeling accomplished after finishing an interrogation.Feeling like a visionary fashion leade'
+    b'r in the retail world.Disoriented and confused after returning from an alien abduction.Furious a'
+    b'bout having been abducted by aliens.Mind is racing with focus after returning from an alien abdu'
+    b'ction.Traumatized by an alien probe scare.Feeling refreshed and cured after using a hygienic pod'
+    b'.Shivering and crying after being frozen by a ray gun as a child.Piecing together clues to crack'
+    b' a detective case.Embarrassed by making a faulty deduction.Grossed out by handling bait or fish.'
+    b'Comforted by rustic living without commodities.Enjoying an improved fruit punch drink.Feeling mi'
+    b'schievous after sabotaging the fountain.Tasting caramel in the fruit punch.Oddly inspired by the'
+    b' mesmerizing flow of a cheese fountain.Enjoying the fizzy fun of sparkling cider.Focused by the '
+    b'futuristic vibe of the fruit punch fountain.Feeling a sugar rush from the party punch.Sickened a'
+    b'fter drinking spiked punch.Enjoying a food ball from the fountain.Enjoying the party punch.Feeli'
+    b'ng alert and energized after yoga.Mind cleared and ready for new ideas after a yoga session.Feel'
+    b'ing centered and focused from yoga.Feeling blissful after yoga.Concentrating on perfecting yoga '
+    b'poses.Relaxed after a massage.Deeply relaxed after a massage.Sore and bruised from a terrible ma'
+    b'ssage.Muscles primed and ready for a workout after a massage.Feeling relaxed and assured from an'
+    b' aromatherapy massage.Feeling hot and happy after a massage.Feeling a fertility boost from a mas'
+    b"sage.Aching after a massage that didn't hit the right spots.Invigorated by an energizing aromath"
+    b'erapy massage.Senses awakened and mind refreshed by aromatherapy.Inhaling a focusing aroma durin'
+    b'g a massage.Having a decent time at a play date.Having a fun time at a play date.Having a fantas'
+    b'tic time at a play date.The sound of the waterfall wall brings mental clarity.Listening to focus'
+    b'ing New Age music.Bored by listening to New Age music.Enjoying a cup of lemon honey ginger tea.H'
+    b'appy after eating a good meal.Smelling a flirtatious scent nearby.Captivated by an infatuating s'
+    b'cent.Smelling a scent that specifically triggers creative thoughts.Mental clarity gained from a '
+    b'fresh, clean environment.Relaxed by a tension relief scent.Calmed by a strange scent.Feeling ale'
+    b'rt due to an energizing scent in the air.Feeling perky from the smell of fresh cinnamon buns.Che'
+    b'ered up by a scent.Enjoying a natural earthy scent.Smelling a scent that sharpens the mind.Inhal'
+    b'ing a rich incense that aids concentration.Feeling clean and free from toxins.Mentally relaxed a'
+    b'nd at ease.Achieving a state of focused enlightenment.Feeling spiritually enlightened and confid'
+    b'ent.Bored by listening to a useless lecture.Feeling focused on flexibility and movement.Deeply f'
+    b'ocused during a yoga class.Feeling heightened senses and energy after a yoga class.Feeling colle'
+    b'ctively inspired and centered after a group yoga class.Experiencing a moment of pure enlightenme'
+    b'nt and creative clarity.Sore and stiff from a difficult yoga class.Refreshed by the scent of lem'
+    b'on aromatherapy in the hot tub.Enjoying jasmine aromatherapy in the hot tub.Relaxing in a hot tu'
+    b'b with focusing sage aromatherapy.Feeling energized and playful from peppermint aromatherapy.Hap'
+    b'py after drinking a fizzy drink.Feeling out of place and physically awkward at an event.Feeling '
+    b'centered from incense aromatherapy.Deeply relaxed by massage and incense.Energized by the combin'
+    b'ation of massage and incense.Fertility boosted by massage and incense.Surrounded by focusing inc'
+    b'ense while on a massage table.Hot and happy from massage and incense.Mind expanded and calmed by'
+    b' the scent of burning incense.Ready to work out after an incense-enhanced massage.Relaxed by mas'
+    b'sage and incense.Meditative state enhanced by incense, leading to a flow of ideas.Feeling sharp '
+    b'and focused after yoga with incense.Practicing yoga surrounded by focusing incense.Blissful from'
+    b' yoga and incense.Improving yoga poses with the aid of incense.Bored because they are struggling'
+    b' to meditate properly.Feeling insightful after meditation.Feeling frisky after messing around in'
+    b' a hot tub.Embarrassed and sad about splashing someone in the hot tub.Embarrassed after splashin'
+    b'g water on someone in the hot tub.Having fun splashing in the hot tub.Nauseated by the foul smel'
+    b'l coming from the hot tub.Satisfied after intimacy in a hot tub.Disgusted by the taste of fruitc'
+    b'ake.Actually enjoying fruitcake.Satisfied after a steam room session.Feeling stupendous after th'
+    b'e steam room.Feeling supreme after the steam room.Overheated and dizzy from staying in the steam'
+    b' room too long.Feeling hot and steamy from the sauna.Nauseated by the smell of rotten eggs in th'
+    b'e steam room.Annoyed by someone splashing in the hot tub.Hands feel great after a massage.Hands '
+    b'are cramping and sore from a bad massage chair experience.Feet are aching after a rough foot mas'
+    b'sage.Feet feel fabulous after a massage.Toes feel refreshed after a massage.Soles feel rubbed an'
+    b'd relaxed.Paws feel pampered.Hands feel fabulous after a massage.In agony from an extreme reacti'
+    b'on to poison ivy.Suffering from an annoying, persistent itch from toxic plants.Going crazy from '
+    b'an unrelenting itch caused by poison ivy.Insightful from meditation and incense.Feeling rejuvena'
+    b'ted by a mud bath.Feeling gross and slimy after a mud bath.Bored of splashing around in the hot '
+    b'tub.Skin feels baby soft after a bath.Relaxed by lavender in the bath.Taking a bath with citrus '
+    b'additives that sharpen the mind.Feeling restored and energetic after a bath soak.Relaxed in a ro'
+    b'mantic rose-scented bath.Enjoying a playful bath that smells like flowers.Skin soft and smelling'
+    b' of incense after a bath.Bathing in citrus-scented water with focusing incense.Relaxed by lavend'
+    b'er and incense in the bath.Feeling doubly restored by a bath with incense.Smelling rose-scented '
+    b'incense while bathing.Enjoying a playful bath with incense.Feeling relaxed by a mud bath with in'
+    b"cense.Feeling fiery after eating Dragon's Breath ice cream.Mouth is burning from eating incredib"
+    b'ly spicy ice cream.Eating rose-flavored ice cream.Feeling green and healthy after ice cream.Enjo'
+    b'ying a cold ice cream treat.Shivering deep in the bones from magical ice cream.Tasting pure perf'
+    b'ection in ice cream.Enjoying the sugary goodness of ice cream.Feeling good about diet ice cream.'
+    b'Eating ice cream that tastes other-worldly and inspiring.Feeling haunted and melancholy after ea'
+    b'ting ghost peppers or special ice cream.Brain frozen into anger by special ice cream.Feeling hyp'
+    b"eractive after eating 'Mind Askew' ice cream.Feeling bold after eating Mind Askew ice cream.Feel"
+    b'ing weird and wacky after eating special ice cream.Feeling mentally adrift and bored after eatin'
+    b'g specific ice cream.Feeling mentally scrambled and embarrassed after eating strange ice cream.M'
+    b'ind is wandering to romantic thoughts after eating ice cream.Mind feels pleasantly askew from ic'
+    b'e cream.Feeling mentally scrambled after eating strange ice cream.Feeling dizzy and confused aft'
+    b'er eating strange ice cream.Feeling mentally off and sad after eating special ice cream.Sufferin'
+    b'g a brain freeze and mental fog from eating Mind Askew ice cream.Eating ice cream that causes a '
+    b'state of hyper-focus.Thinking outside the box after eating mind-altering ice cream.Enjoying the '
+    b'taste of roses in ice cream.Loving the perfect toppings on ice cream.Going nuts for this ice cre'
+    b'am.Smelling a scent that triggers a playful mood.Feeling cozy by the bonfire.Hyped up by the ene'
+    b'rgy of the crowd while DJing.Overwhelmed by the intensity of the crowd while DJing.Feeling the r'
+    b'omantic energy of the crowd while DJing.Feeling in sync with the crowd while DJing.Feeling like '
+    b'a musical genius while mixing tracks on a DJ booth.Enjoying the bumping beats from the DJ booth.'
+    b'Feeling cool while DJing.Bored and unimpressed by the repetitive DJ music.Embarrassed by a terri'
+    b'ble DJ performance.Wired and jittery from drinking espresso.Comforted by warm espresso.Feeling s'
+    b'harp, sophisticated, and ready to create after drinking espresso.Buzzing with playful energy aft'
+    b'er an espresso.Drinking an espresso laced with aphrodisiacs.Enjoying the chocolatey taste of esp'
+    b'resso.Feeling energized and free after an espresso.Happy about a new espresso discovery.Feeling '
+    b'bright-eyed from caffeine.Enjoying being funemployed at the cafe.Depressed after burning a book '
+    b'in a bonfire.Feeling honored to lead the club.Feeling empty after stepping down as club leader.E'
+    b'mbarrassed after a failed social maneuver in a club.Anxious about losing leadership of the club.'
+    b'Feeling like a disappointment to the club.Hurt by being rejected from a club.Burned the tongue o'
+    b'n scalding hot milk.Feeling competitive after winning at foosball.Bitter about losing a game of '
+    b'foosball.Depressed after burning food in a bonfire.Depressed after burning art in a bonfire.Naus'
+    b'eated by a bad smell coming from the bonfire.Depressed after burning music in a bonfire.Depresse'
+    b'd after burning a toy in a bonfire.Having fun burning a toy in the bonfire.Feeling playful while'
+    b' hanging out around the bonfire.In pain from getting too close to the bonfire.Skin feels hot and'
+    b' tender from standing too close to the fire.Feeling cozy and confident by the bonfire.Happy abou'
+    b't burning homework in the bonfire.Feeling nostalgic drinking a root beer float.Grossed out by th'
+    b'e smell or feel of a bush.Feeling secure being near their significant other.Anxious and jealous '
+    b'because the significant other is away.Excited by the spooky candy bowl.Startled by a jump scare '
+    b'from a candy bowl.Wearing a pumpkin on the head.Having fun smashing pumpkins.Proud of a pumpkin '
+    b'carving.Feeling like the center of attention on the dance floor.Embarrassed after failing to sho'
+    b'w off dance moves.Breaking through the closet door.Thrilled by intimacy in a closet.Recognized f'
+    b'or fashion sense.Feeling scorned and embarrassed about fashion choices.Claustrophobic and crampe'
+    b'd after hanging out in a closet.Having a great time dancing at the club.Had a terrible time danc'
+    b'ing at the club.Happy to be hanging out with friends.Feeling lonely and missing friends.Bored an'
+    b"d wants to join a social club.Shivering because the fire isn't providing enough warmth.Feeling s"
+    b'mooth after exchanging numbers.Feeling the intense angry vibe set by the club leader.Feeling the'
+    b' angry vibe set by the club leader.Feeling the angry vibe set by the club leader.Feeling the con'
+    b'fident vibe of the club.Feeling very confident due to the club atmosphere.Feeling extremely conf'
+    b'ident due to the club vibes.Feeling the energized vibe of the club gathering.Hyped up by the clu'
+    b"b's energetic atmosphere.Extremely pumped up by the intense club vibe.Feeling the vibe with club"
+    b' comrades.Feeling the vibe with club comrades.Feeling the vibe with club comrades.Feeling the fl'
+    b'irty vibe of the club (Level 1).Feeling the flirty vibe of the club (Level 2).Feeling the flirty'
+    b' vibe of the club (Level 3).Feeling a mild focused vibe from the club atmosphere.Feeling a stron'
+    b'g focused vibe from the club atmosphere.Feeling an intense focused vibe from the club atmosphere'
+    b'.Feeling the creative energy of a club gathering.Caught up in a strong wave of group creativity '
+    b"and motivation.Overwhelmed with inspiration from the club's intense atmosphere.Feeling the mild "
+    b'playful vibe set by the club.Feeling the playful vibe set by the club.Feeling the intense playfu'
+    b'l vibe set by the club.Feeling the sad vibe of the club meeting.Feeling the sad vibe of the club'
+    b' meeting.Feeling the sad vibe of the club meeting.Ready to dance all night due to being a dance '
+    b'machine.In a perfect flow state while mixing music for a crowd.Ready to party due to dance machi'
+    b"ne trait.Awed by a member of a popular club.Bored and restless because they haven't been to a pa"
+    b'rty lately.Stiff and sore after trying to sleep in a bush.Intimidated by a notorious club member'
+    b".Envious of other people's relationships.Consumed by jealous fury.Feeling mischievous after play"
+    b'ing a trick.Happy about getting a treat.Proud of the artistic flair shown in carving a pumpkin.F'
+    b'eeling cozy and romantic near a bonfire.Extremely angry.Embarrassed by a loss at foosball.Stomac'
+    b'h is in knots from jealousy.Tense after nearly knocking over the game pieces.Relieved the llama '
+    b"didn't wake up during the game.Sad about making the llama cry in the game.Happy about hitting a "
+    b'bullseye.Frustrated by missing the dartboard.Showing off dance moves.Bitter about losing a game '
+    b'of darts.Victorious at darts.Mastering the dive on the jump stand.Embarrassed and sad about a di'
+    b'ving failure.Mortified by a swimsuit malfunction while diving.Annoyed by getting splashed at the'
+    b' diving board.Feeling exhilarated after using the jump stand.Furious about a rejected breakup at'
+    b'tempt.Enjoying a group dance.Bored after watching a dull movie.Angry about watching a terrible m'
+    b'ovie.Disappointed by a bad movie at the theater.Enjoying an interesting movie.Appreciating a gen'
+    b're staple movie.Deeply moved and inspired by watching a cinematic masterpiece.Laughing at the ch'
+    b'aos caused in the closet.Feeling sharp after winning a level on the arcade machine.Excited about'
+    b' winning an arcade game.Happy about talking up another person.Disgusted and angry at trashy beha'
+    b"vior.Embarrassed about losing the Don't Wake the Llama game.Embarrassed about quitting the Don't"
+    b' Wake the Llama game.Embarrassed about quitting a foosball match.Enjoying experimental food.Enjo'
+    b'ying a unique experimental dish.Queasy from eating weird, experimental food.Delighted by experim'
+    b'ental cuisine.Savouring experimental flavors.Tasted something so complex and delicious it sparke'
+    b'd an idea.Received mystical romance tips from a wishing well.Overwhelmed by a wish for romance c'
+    b'oming true.Angry that the Wishing Well ignored their hard work.Furious that the Wishing Well did'
+    b"n't grant happiness.Wishing for a child at the wishing well.Thankful for a chance at life from t"
+    b'he well.Disappointed the Wishing Well did not grant the wish.Sad about being turned into a ghost'
+    b' by the Wishing Well.Accepted fate at the wishing well.Feeling hopeless about love after a bad w'
+    b'ish.Feeling wise after the Wishing Well granted knowledge.Feeling skilled after the Wishing Well'
+    b' granted a skill.Feeling sharp after quick learning from the Wishing Well.Confused and gloomy fr'
+    b"om the Wishing Well's magic.Mind is completely numbed by a wishing well outcome.Embarrassed beca"
+    b'use the Wishing Well mocked their lack of talent.Angry that a wish was twisted by the Well.Anxio'
+    b'us to see if the wish for a promotion comes true.Thrilled to have won the lottery via the well.F'
+    b'eeling fortunate after a wish.Mind racing with forbidden knowledge learned from a wishing well.C'
+    b'ursed with a touch that makes others sad.Stressed about the cost of making wishes.Upset that the'
+    b' wishing well took the money.Feeling sunny after a wish.Feeling forever cheerful after a wish.Ex'
+    b'tremely happy due to a wish.Realizing happiness is fleeting after a wish backfired.Feeling extra'
+    b' vigorous after a wish.Feeling happiness drain away.Unable to stop smiling after a wish at the w'
+    b'ell.Feeling youthful and spry after a wish granted by the Wishing Well.Full of vigor thanks to e'
+    b'xtended youth from the Wishing Well.Feeling like a teenager again after using the Wishing Well.B'
+    b'ursting with supernatural vigor from the Wishing Well.Exhausted and dazed from overexertion at t'
+    b'he wishing well.Mourning lost youth.Sad about never growing up.Happy about adoption pre-approval'
+    b' from the well.Hoping to conceive a child.Angry about a negative outcome wishing for children.Di'
+    b'sappointed that a resurrection wish resulted in a ghost.Miraculously revived by the wishing well'
+    b'.Anxious about whether grades will actually improve.Embarrassed that the Wishing Well lowered th'
+    b'eir grades.Eager to cook something magnificent in the kitchen.Angry about kitchen conditions or '
+    b'service.Feeling like a master chef in the kitchen.Bursting with culinary innovation and ready to'
+    b' experiment with food.Absolutely furious about kitchen conditions.Disappointed and slightly naus'
+    b'eous from bad experimental food.Analyzing experimental food as a foodie.Critiquing experimental '
+    b'food as a foodie.Savouring experimental food as a foodie.Delighted by experimental food as a foo'
+    b'die.Feeling warm near a heat lamp.Warmed by the heat lamp.Feeling lucky after throwing a coin in'
+    b' the fountain.Stomach is churning violently from food poisoning.Proud of a curated food photo co'
+    b'llection.Feeling like a food photo hipster.Recovering from food poisoning.Feeling a deep, creati'
+    b've connection to the earth while gardening.Relieved to not be pregnant.Mesmerized by the soap su'
+    b'ds in the fountain.Enjoying the finish of a normal nectar.Enjoying the aroma of a normal nectar.'
+    b'Enjoying the balance of a normal nectar.Enjoying the complexity of a normal nectar.Enjoying the '
+    b'tannins of a normal nectar.Enjoying a luscious libation.Loving the aroma of a high-quality necta'
+    b'r.Loving the balance of a high-quality nectar.Loving the complexity of a high-quality nectar.Lov'
+    b'ing the finish of a high-quality nectar.Loving the tannins of a high-quality nectar.Great food p'
+    b'airing with high-quality nectar aroma.Great food pairing with normal nectar aroma.Great food pai'
+    b'ring with high-quality nectar balance.Great food pairing with normal nectar balance.Great food p'
+    b'airing with high-quality nectar complexity.Great food pairing with normal nectar complexity.Grea'
+    b't food pairing with high-quality nectar finish.Great food pairing with normal nectar finish.Grea'
+    b't food pairing with high-quality nectar tannins.Great food pairing with normal nectar tannins.Gi'
+    b'fted with high-quality ingredients that inspire new recipes.Fighting the urge to steal something'
+    b' right now.Tense with the compulsion to swipe an object.Feeling an adrenaline rush after swiping'
+    b' something.Happy about returning a stolen object.Pondering the absurdity and wonder of cheese fr'
+    b'om space.Caught red-handed while stealing and feeling ashamed.Heartbroken after seeing a neglect'
+    b'ed child taken away.Depressed by looking at the Tragic Clown painting.Uncomfortable after witnes'
+    b'sing someone being rude or gross.Embarrassed after failing to rebuff a flirtation.Uncomfortable '
+    b'because the relationship is moving too fast.Humiliated after a romantic gesture went terribly wr'
+    b'ong.Embarrassed after failing to slow down a romantic interaction.Happy about eating a vegetaria'
+    b'n-approved meal.Sick to the stomach after accidentally eating meat.Feeling superior for being ve'
+    b'getarian.Enjoying a happy dinner date at a diner.Feeling shame after being successfully repriman'
+    b'ded for public affection.Embarrassed that an attempt to shame someone backfired.Feeling awkward '
+    b"after receiving the cold shoulder.Embarrassed that giving someone the cold shoulder didn't work."
+    b'Excited after stealing a small item.Pumped up after stealing a decent item.Feeling thrifty after'
+    b' haggling at a market stall.Embarrassed after failing to haggle with a vendor.Stressed by a wate'
+    b'r leak in the apartment.Freaked out after seeing a roach.Grossed out and tense about the roach i'
+    b'nfestation.Disgusted by a mysterious pile of goo.Nauseated and annoyed by a strange odor.Nauseou'
+    b's and woozy from a noxious odor in the apartment.Nervous about the dangerous electrical sparking'
+    b".Embarrassed by the Wishing Well's refusal to grant a child.Happy with a restaurant breakfast.Ha"
+    b'ppy with a restaurant lunch.Happy with a restaurant dinner.Enjoying a romantic breakfast at a re'
+    b'staurant.Enjoying a romantic lunch at a restaurant.Enjoying a romantic dinner at a restaurant.An'
+    b'gry about the child granted by the Wishing Well.Scared of the monster under the bed.Great food p'
+    b'airing with a luscious libation.Performed a great puppet show.Sad about messing up the puppet sh'
+    b'ow.Enjoyed watching a puppet show.Happy with the effort in the puppet show.Annoyed by a bad pupp'
+    b'et show.Appreciating the artistic detail of a table setting.Acting aggressively like a city weir'
+    b'do.Feeling weirdly energized after a talking toilet gave a massage.Feeling playful after drinkin'
+    b'g light festival tea.Feeling playful after drinking dark festival tea.Singed and dazed from a fi'
+    b'rework accident.Victorious at the battle station.Intense concentration from a close match in a v'
+    b'ideo game.Accepting a loss at the battle station.Raging because they should have won the video g'
+    b'ame.Bummed out by losing a video game match.Had a successful bubble blower session.Embarrassed b'
+    b'y a coughing fit from the bubble blower.Feeling lightheaded and giggly from the bubble blower.Co'
+    b'ughing and dizzy from using a bubble blower.Feeling clear-headed after using the bubble blower.F'
+    b'eeling foolish after using the bubble blower.Angry reaction to a bad bubble blower flavor.Dizzy '
+    b'and choking after a failed bubble blower attempt.Feeling passionate effects from the bubble blow'
+    b'er.Feeling relaxed and successful using the bubble blower.Feeling dizzy and weird from the bubbl'
+    b'e blower.Feeling lightheaded and giggly from the bubble blower.Feeling blue after a bad bubble b'
+    b'lower session.Had a successful dense bubble blower session.Mind glowing with neon-colored ideas '
+    b'after using a bubble blower.Feeling bored and hazy after a failed bubble blower session.Mesmeriz'
+    b'ed and dazed by the lights of a festival lamp.Invigorated by the great view from the apartment.I'
+    b'nspired by the rich history and architecture of the apartment.Feeling romantic near a fireplace.'
+    b'Happy about politician approval ratings.Disgusted by political mind games.Inspired by the romanc'
+    b'e of the Romance Festival.Gained approval by kissing a baby.Ashamed for taking an unethical brib'
+    b'e.Feeling giddy and energetic from the yellow bubble blower flavor.Coughing and gasping after us'
+    b'ing the bubble blower.Head spinning from using a bubble blower.Having fun with bubbles.Riding a '
+    b'wave of vibrant, bubbly thoughts.The mind feels remarkably sharp from the bubble blower.Nauseous'
+    b' and spinning after a bad reaction to the bubble blower.Feeling cheeky and flirtatious at the Ro'
+    b'mance Festival.Angry about sleazy behavior at the Romance Festival.Regretting the bubble blower '
+    b'session.Feeling great after a successful bubble blower session.Successful promotion of a tax cau'
+    b'se.Successful promotion of an environmental cause.Successful promotion of a peace cause.Successf'
+    b'ul promotion of a justice cause.Successful promotion of an economy cause.Excited to have made fr'
+    b'iends with the monster under the bed.Received positive feedback on computer.Hurt by negative fee'
+    b'dback on the computer.Angry about being trolled online.Embarrassed for being called out as a pol'
+    b'itical flip-flopper.Happy with political partners.Angry about partisan politics.Persuaded someon'
+    b'e to cook.Persuaded someone to smile.Persuaded by social media followers to be flirty.Persuaded '
+    b'to go on an angry social media rant.Persuaded someone to workout.Persuaded someone to do comedy.'
+    b'Convinced to goof off instead of working.Persuaded someone to play games.Persuaded someone to pl'
+    b'ay music.Angry about a trolling email on the phone.Upset by checking negative messages on the ph'
+    b'one.Received positive feedback on phone.Happy with the restaurant wait time.Disgruntled by a lon'
+    b'g wait at a restaurant.Angry about terrible service wait times.Pleased that food was comped.Plea'
+    b'sed with a dish recommendation.Pleased with a free dessert.Pleased with free drinks.Persuaded so'
+    b'meone to sing.Furious at noisy neighbors.Offended by a rude restaurant host.Pleased with a pleas'
+    b'ant host greeting.Pleased with a delightful host greeting.Angry about bad waiter service.Pleased'
+    b' with great waiter service.Pleased with good waiter service.Mortified after spilling food on a c'
+    b'ustomer.Inspired while at the podium.Bored by the nonsensical speech given at the podium.Deliver'
+    b'ing an angry speech at the podium.Feeling ready to speak to the masses.Pumped up to give a polit'
+    b'ical speech.Feeling a calling to lead, speak, or inspire others from a podium.Angry about being '
+    b'fired.Praised as an employee.Motivated to improve the business with fresh, innovative ideas.Adre'
+    b'naline spiking after being criticized at work.Excited and playful about trending online.Exhauste'
+    b'd from a long livestreaming marathon.Laughing at the success of a viral meme.Embarrassed that a '
+    b'meme they posted failed to go viral.Embarrassed after a prank on a streamer failed.Amused by suc'
+    b'cessfully pranking streamers.Stressed by dealing with angry internet fans.Successfully developin'
+    b'g a professional network.Bored by failed networking attempts in their career.Embarrassed by fail'
+    b"ing to represent a friend properly.Stressed about messing up a client's representation.Successfu"
+    b'lly represented a friend in PR.Successfully represented a client in PR.Feeling famous because a '
+    b'social media post is trending.Drained and overworked from a shift at the store.Satisfied with jo'
+    b'b.Frustrated and unhappy with the current work situation.Very satisfied with job.Very unsatisfie'
+    b'd and angry with their job.Feeling eloquent and persuasive at the podium.Feeling energized by ac'
+    b'tivist work.Bored by the monotony of political activism work.Enthusiastic about food as a critic'
+    b'.Disgusted by the look and smell of a terrible meal.Feeling snubbed as a critic.Mind full of cri'
+    b'tical analysis and artistic theory after studying art.Palate refined and inspired by critiquing '
+    b'a high-quality meal.Queasy after tasting and reviewing horrible food.Angry after reviewing a ter'
+    b'rible performance.Uplifted and inspired by witnessing a great performance.Happy watching tween T'
+    b'V.Feeling awkward after a bad reaction to the bubble blower.Feeling light and energetic from the'
+    b' white bubble blower flavor.Feeling supercharged from the yellow bubble blower flavor.Feeling li'
+    b'ghtheaded and sick from the bubble blower.Embarrassed by the side effects of the bubble blower.F'
+    b'eeling extremely giggly from the bubble blower.Feeling amorous from the bubble blower.Having a b'
+    b'ad trip on the bubble blower.Feeling blue after a bad bubble blower session.Successful dense bub'
+    b'ble blower session.Embodying the sadness of the Tragic Clown.Feeling weepy while wearing the Tra'
+    b'gic Clown outfit.Overwhelmed by the tragedy of the clown.Misery loves company in the tragic clow'
+    b'n outfit.Praised for work as a critic.Inspired by the exotic flavors and culture of festival foo'
+    b'd.Overwhelmed by the pressure of the kitchen.Embarrassed after slipping and falling on the slide'
+    b'.Embarrassed after failing a trick on the slide.Having fun on the backyard water slide.Feeling a'
+    b'gile after a trick on the slide.Competing in the Logic Fair.Enjoying bird watching.Stressed out '
+    b'by a crying toddler.Attacked by birds at the feeder.Uncomfortable and sad because of a dirty dia'
+    b'per.Uncomfortable sitting in a dirty diaper.Staring blankly at a plastic flower in a trance.Feel'
+    b'ing pressure to choose a cause to support.Listening to the wind chimes.Thinking the water slide '
+    b'looks like fun.Impressed by a slide trick.Excited by watching great tricks on the water slide.Br'
+    b'uised and sore after wiping out on the slide.Laughing at a slip and fall on the slide.Watching s'
+    b'omeone show off on the slide.Anxious about a mistake made at work.Caught a lucky break at work.P'
+    b'umped up after revealing a political truth.Frustrated by an uncooperative toddler on set.Annoyed'
+    b' by a disobedient toddler during filming.Toddler thinking the caregiver is a meanie.Embarrassed '
+    b'that an online joke fell flat.Embarrassed and throat sore from terrible singing.Feeling good abo'
+    b'ut singing performance.Feeling ready to sing and perform after a warm shower.The professional ki'
+    b'tchen environment is begging for culinary creation.Enjoying the great atmosphere of the apartmen'
+    b't.The studio space is triggering an artistic flow.Feeling satisfied living near good schools.Tod'
+    b'dler throwing a tantrum due to exhaustion.Happy a dish recommendation was accepted.Toddler throw'
+    b'ing a massive tantrum due to exhaustion.Cranky and weepy from exhaustion.Cranky and weepy from e'
+    b'xhaustion.Toddler throwing a tantrum due to hunger.Toddler throwing a massive tantrum due to hun'
+    b'ger.Toddler throwing a tantrum due to lack of fun.Toddler throwing a massive tantrum due to lack'
+    b' of fun.Bored and unhappy.Bored and unhappy.Upset because of hunger.Upset because of hunger.Todd'
+    b'ler throwing a tantrum due to lack of attention.Toddler throwing a massive tantrum due to lack o'
+    b'f attention.Feeling neglected and lonely.Feeling neglected and lonely.Feeling like a bargain hun'
+    b'ter at the flea market.Toddler throwing a tantrum due to being dirty.Toddler throwing a massive '
+    b'tantrum due to being dirty.Upset about being dirty.Upset about being dirty.Watching the talking '
+    b'toilet is weirdly mesmerizing.Amused by the talking toilet.Reminiscing happily as a toddler.Feel'
+    b'ing angelic and easygoing.Sad that no one is socializing with them.Suffering from separation anx'
+    b'iety.Babbling nonsense words happily.Wild and needing to run around immediately.Tipped a small a'
+    b'mount for busking.Tipped a large amount for busking.Tipped a medium amount for busking.Having sl'
+    b'ippery fun on a foamy slide.Proud to be independent.Sad because there is nothing new to learn.To'
+    b'ddler frustrated by boring flashcards.Bored to tears by flashcards.Dizzy and giggly from spinnin'
+    b'g around.Soothed by wind chimes.Irritated by the sound of wind chimes.Guilt-ridden and sad for e'
+    b'ating meat.Queasy from sampling undercooked or bad food.Enjoying food samples.Tasting delicious '
+    b'samples.Delighted by food samples.Savouring food samples.Disgusted by the poor quality of the in'
+    b'gredients.Loving the high quality ingredients in samples.Feeling slightly sick to the stomach.Fe'
+    b'eling heroic after fixing an apartment problem.Embarrassed about making an apartment maintenance'
+    b' problem worse.Landlord coming to collect rent angrily.Finding it funny to quit eating and make '
+    b'a mess.Angry while chatting on the phone.Enjoying chatter in the city.Feeling down after a sad p'
+    b'hone call.Victorious and sharp after winning the Hackathon.Happy to be on home turf.Caught spyin'
+    b'g on neighbors with a telescope during a festival.Witnessed something spicy through the telescop'
+    b'e.On edge hearing suspicious squeaking noises.Grossed out by the presence of mice.Feeling great '
+    b'about a successful cosplay selfie.Embarrassed by a failed cosplay selfie.Enjoying a good meal as'
+    b' a toddler.Upset about eating bad food.Sugar rush from eating sugary food as a toddler.Toddler a'
+    b'ngry while watching someone cook.Happy with a drink.Ashamed about a potty accident.Angry and ten'
+    b'se because the neighbors are too loud.Acting erratic and confused in public due to eccentricity.'
+    b'Feeling wild and acting like a raccoon.Feeling ambitious while contemplating the globe.Contempla'
+    b'ting the vast world at the bar globe.Studying the globe and planning for greatness.Amused by fin'
+    b'ding a specific location on the globe bar.Feeling generally embarrassed while at work.Feeling ha'
+    b'ppy at work.Feeling confident at work.Stressed from working too hard.Feeling savvy after selling'
+    b' crafts.Happy with applied makeup.Embarrassed by a makeup mishap at the vanity table.Feeling hom'
+    b'ey.Pumped up by the super-fast internet connection.Eager to make music in a room with perfect ac'
+    b'oustics.Rage-quitting a video game.The atmosphere of a science lair promotes thinking.Feeling so'
+    b'ciable in a convivial atmosphere.The natural light in the room is perfect for painting or writin'
+    b'g.Feeling fresh and awake due to the bracing breezes.Winning a party video game.Having fun losin'
+    b'g a party video game.Hyped up after winning a multiplayer racing game.Having fun losing a racing'
+    b' video game.Feeling energized by the sunny aspect of the location.Tense due to paranormal activi'
+    b'ty in the apartment.Happy from an affirming note.Angry about a passive-aggressive note on the bu'
+    b'lletin board.Picking up on a mean vibe in the area.Found some loose change.Feeling bold in a rom'
+    b'antic atmosphere.Influenced by the romantic atmosphere of the location.Having fun with bubbles.D'
+    b'elighted by blowing bubbles.Fascinated by the physics of bubbles.Childlike wonder and imaginatio'
+    b'n sparked by playing with bubbles.Annoyed by bubbles popping in their face.Growing pains are cau'
+    b'sing physical discomfort.Laughing at the weirdness of public access TV.Tongue is burning and num'
+    b'b from spicy curry.Enjoying flash cards.Believing in romantic destiny.Believing their love life '
+    b'is doomed.Feeling on fire while playing basketball.Completely in the zone while playing basketba'
+    b'll.Disappointed about losing a basketball game.Caught pretending to be good at basketball.Hyped '
+    b'after scoring a massive dunk.Limping and in pain from a sprained ankle.Feeling unstoppable on th'
+    b'e basketball court.Feeling like a dunkmaster at basketball.Humiliated after getting dunked on.Fe'
+    b'eling good after a fun game of basketball.Frustrated about losing a basketball game.Feeling like'
+    b' court royalty at basketball.Tipped well for keyboard busking.Tipped poorly for keyboard busking'
+    b'.Tipped moderately for keyboard busking.Happily shaking tail and dancing.Feeling the playful ene'
+    b'rgy of a child-friendly zone.Uneasy about living in an earthquake zone.Feeling the playful energ'
+    b'y of a child-friendly zone.Feeling a buzz from the Ley Line energy.Enjoying music.Feeling motiva'
+    b'ted while being mentored in basketball.Imaginatively exploring a secret world with a toy.Feeling'
+    b' knowledgeable about market trends.Panicking because an earthquake is happening.Energetic despit'
+    b'e terrible karaoke singing.Feeling like a rockstar at karaoke.Feeling proud of their singing voi'
+    b'ce.Feeling great about singing.Feeling good about singing.Embarrassed by their own terrible kara'
+    b'oke performance.Disgusted by the jam in the trash chute.Mouth on fire and eyes watering from fai'
+    b'ling a spicy food challenge.Successfully ate spicy food.Feeling cultured using chopsticks succes'
+    b'sfully.Embarrassed about not knowing how to use chopsticks.Feeling nimble after catching food wi'
+    b'th chopsticks.Satisfied by spicy food heat.Stomach cramping with a hunger for something specific'
+    b' and metallic.Nauseated by the thought of normal human food.Feeling weak and hollow, unable to e'
+    b'at regular food.Upset that a mural was defaced.Amused by improving a mural with graffiti.Confuse'
+    b'd and stressed by a strange, burning thirst.Throat burning with a desperate need for plasma.Cons'
+    b'umed by an overwhelming, painful thirst for plasma.Weak and drying out from lack of plasma.Repri'
+    b'manded the butler.Bored because this vampire lore book is too basic.Frustrated that this vampire'
+    b' lore is too dense.Job performance boosted.Friendship gain boosted.Skill gain boosted.Satisfacti'
+    b'on points gain boosted.Motive decay decreased.Feeling alluring.Feeling very alluring.Feeling ext'
+    b'remely alluring.Hypnotically compelled to clean.Hypnotically compelled to sit down.Proud to have'
+    b' cured a vampire.Furious that a vampire slaying attempt failed.Proud to have defeated a vampire '
+    b'hunter.Relieved to be a vampire no more.Feeling a deep, immortal melancholy.Grogginess from slee'
+    b'ping like a corpse.Caught defacing a mural and feeling ashamed.Hypnotically compelled to repair '
+    b'objects.Hypnotically compelled to work out.Hypnotically compelled to wake up.Feeling loved in th'
+    b'e toddler bed.Enjoying a moment of peace in the toddler bed.Hypnotically compelled to be mean to'
+    b" others.Mesmerized by a vampire's gaze.Fighting to stay awake against an irresistible magical sl"
+    b'umber.Having fun in the bath.Having splashing fun in the toddler bath.Excited and splashing arou'
+    b'nd in the bath.Soggy and cold from sitting in the bath too long.Growing up so fast.Bursting with'
+    b' happiness.Overwhelmed with happiness.Filled with happiness.Hit by a strong burst of vampire emo'
+    b'tional manipulation.Hit by a weak burst of vampire emotional manipulation.Hit by a moderate burs'
+    b't of vampire emotional manipulation.Overwhelmed by a powerful burst of focused energy from a vam'
+    b"pire.Feeling a sudden burst of focus from a vampire's influence.Feeling a strong burst of focus "
+    b"from a vampire's influence.Overwhelmed by a magically induced burst of inspiration.Feeling a sud"
+    b'den, magical nudge of creativity.Mind clouded with magically implanted creative ideas.Forced int'
+    b"o anger by a vampire's emotional burst.Forced into anger by a vampire's emotional burst.Forced i"
+    b"nto anger by a vampire's emotional burst.Overwhelmed by a powerful burst of magically induced bo"
+    b'redom.Feeling a slight burst of magically induced boredom.Feeling a moderate burst of magically '
+    b'induced boredom.Feeling an overwhelming burst of vampiric confidence.Feeling a surge of emotiona'
+    b'l confidence.Feeling emotionally strong.Reeling from a burst of vampiric emotion.Reeling from a '
+    b'burst of vampiric emotion.Reeling from a burst of vampiric emotion.Overwhelmed by a massive burs'
+    b't of supernatural energy.Feeling a sudden burst of energy from vampire influence.Feeling a stron'
+    b'g wave of energy from vampire influence.Overwhelmed by a powerful burst of supernatural embarras'
+    b'sment.Feeling a strong wave of supernatural embarrassment.Feeling a sudden burst of supernatural'
+    b' embarrassment.Overwhelmed by a massive burst of playful emotion.Overwhelmed by a burst of playf'
+    b'ul emotion.Overwhelmed by a strong burst of playful emotion.Overwhelmed by a magically induced b'
+    b'urst of sadness.Overwhelmed by a magically induced burst of sadness.Overwhelmed by a magically i'
+    b'nduced burst of sadness.Overwhelmed by a massive burst of uncontrollable emotion.Feeling a sudde'
+    b'n, confusing surge of emotion.Struggling to control emotional outbursts.Headache and confusion c'
+    b"aused by a vampire's mind power.Feeling slightly dizzy from a vampiric intrusion.Disoriented and"
+    b' mentally foggy from mind control.Satisfied after drinking plasma.Neck is sore and body feels dr'
+    b'ained after being bitten.Hallucinating due to vampiric mind powers.Playing with bubbles in the t'
+    b'oddler bath.Drank Sakura tea and feels romantically enlightened.Persuaded someone to act like a '
+    b'raccoon.Feeling nocturnal.Connecting with the night.Embracing the night.Emotions are heavily dam'
+    b'pened and suppressed by a supernatural power.Emotions are slightly dampened by a supernatural po'
+    b'wer.Emotions are moderately dampened by a supernatural power.Nauseous and weak from the smell of'
+    b' garlic.Incapacitated and retching from strong garlic exposure.Head spinning and stomach turning'
+    b" from garlic.Losing patience with a toddler's tantrum.Smelling the overpowering stench of a dirt"
+    b'y diaper.Covered in filth after a diaper change gone wrong.Annoyed at having to be nice and help'
+    b' someone.Soothed by pipe organ music.Learning the complexities of the pipe organ from a mentor.W'
+    b'oken up by mice in the apartment.Hauntingly inspired by playing vampiric melodies.Skin is bliste'
+    b'ring and smoking from sunlight exposure.Burning alive and terror-stricken from sunlight.Unsettle'
+    b'd by the creepy sound of the pipe organ.Happy to have cured a friend of vampirism.Excited by a t'
+    b'asty looking person.Feeling very weak and woozy after a deep vampire bite.Barely conscious and d'
+    b'rained of all energy after a bite.Feeling strong after drinking plasma.Skin tingling and burning'
+    b' slightly despite sun resistance.Feeling hot and uncomfortable in the sun.Skin is red and stingi'
+    b'ng from the sun.Feeling the heat intensify uncomfortably.Excited after beating a platformer vide'
+    b'o game level.Feeling victorious after winning an RPG game.Toddler bored and angry with nesting b'
+    b'locks.Bored and sad playing with nesting blocks.Satisfied playing with nesting blocks.Toddler bo'
+    b'red and angry with roughhousing.Bored and sad while roughhousing.Happily worn out but hyped afte'
+    b'r roughhousing.Toddler bored and angry with the stereo.Bored and sad listening to the stereo.Sat'
+    b'isfied listening to stereo.Toddler bored and angry with a book.Bored and sad reading a book.Sati'
+    b'sfied reading a book.Finally having fun after being bored.Bored and sad playing with toys.Toddle'
+    b'r bored and angry with toys.Toddler bored and angry with the TV.Bored and sad watching TV.Satisf'
+    b'ied watching TV.Toddler bored and angry with the dollhouse.Satisfied playing with dollhouse.Bore'
+    b'd and sad playing with the dollhouse.Feeling pricey vibes.Embarrassed by a blue makeup disaster.'
+    b'Embarrassed by a pink makeup disaster.Embarrassed by a purple makeup disaster.Embarrassed by a r'
+    b'ed makeup disaster.Happy with blue makeup.Happy with green makeup.Happy with purple makeup.Happy'
+    b' with pink makeup.Consumed by eternal vampiric sadness.Smoke is rising from skin despite resista'
+    b'nce to the sun.Feeling energized but physically hurting from the sun.Skin feels like it is on fi'
+    b're.Severe burns forming rapidly from sunlight.Flesh is searing and causing immense pain.Burning '
+    b'up and rapidly losing energy.Learning large-scale painting techniques from a mentor.In agonizing'
+    b' pain from sunlight exposure.Uncomfortable and itching from the sunlight.Burning and tense from '
+    b'being out in the sun.Feeling guilty about drinking from a human.Thrilled by supernatural intimac'
+    b'y as a bat.Feeling revitalized by restoring life spirit.Feeling like a star after winning the ka'
+    b'raoke contest.Scared and crying after a nightmare.Accepting the romance festival vibes.Feeling d'
+    b'epressed from the Romance Festival tea.Refusing to believe the bad news.Under the influence of a'
+    b'ngry tea petals.Feeling lucky finding a bargain at the romance festival.Happy at the romance fes'
+    b'tival.Palate delighted and inspired by a high-quality drink.Queasy after tasting a poorly made d'
+    b'rink.Proud and energized by completing a massive wall mural.The sunny aspect of the apartment br'
+    b'ings a cheerful creativity.Feeling sunny.Celebrating the Day of the Dead.Ectoplasm is sizzling a'
+    b'nd evaporating in the sun.Violently ill after eating plasma fruit as a human.Bouncing ideas off '
+    b'a neighbor has sparked a brainstorming session.Celebrating Day of the Dead.Excitedly running aro'
+    b'und naked.Excited about sharing a successful joke online.Hyped after winning a single-player rac'
+    b'ing game.Feeling triumphant after winning a party game.Feeling poetic after writing lyrics.Feeli'
+    b'ng lucky to be alive after eating pufferfish.Bored by researching vampire knowledge they already'
+    b' possess.Feeling playful after drinking sakura tea.Toddler angry about needing to pee.Toddler ex'
+    b'tremely angry about needing to pee.Upset about needing to use the potty.Upset about needing to u'
+    b'se the potty.Feeling romantic after singing a love ballad well.Thinking adults are silly for try'
+    b'ing to be bossy.Giggling about mentioning butts.Feeling wild with wind in hair.Sad about being c'
+    b'ooped up inside.Enjoyed a vampire sparring match.Feeling empowered after a successful protest.Di'
+    b'sheartened that the protest failed.Violated and angry after being bitten by a vampire.Crying ove'
+    b'r a minor injury.Fussy toddler demanding to be listened to.Happy to have someone under thumb.Hap'
+    b'py to have gotten way.Freshly showered and ready to flirt with neighbors.Stressed by a fussy tod'
+    b"dler's demands.Fussy toddler in a bad mood.Learned something new.Scared and upset by a stranger."
+    b'Clinging to a caregiver due to stranger anxiety.Bored by the general routine at work.Celebrating'
+    b' Day of the Dead.Startled by the loud pop of a holiday cracker.Amused by the joke inside a holid'
+    b'ay cracker.Feeling festive from a cracker.Child angry about a bad holiday cracker prize.Disappoi'
+    b'nted by a terrible holiday cracker joke.Charmed by someone.Made new friends.Celebrating Day of t'
+    b'he Dead.Terrified after sleeping in a coffin.Scared by a nightmare while sleeping during the day'
+    b'.Had a good dream in the coffin.Ate romantic candy from a holiday cracker.Experiencing a sugar c'
+    b'rash and confusion from holiday cracker candy.Sugar rush from eating holiday cracker candy.Enjoy'
+    b'ing candy from a cracker.Enjoying candy from a holiday cracker.Disappointed by the bad taste of '
+    b'holiday candy.Celebrating Day of the Dead.Ghostly form feels weak in the sun.Ectoplasm is destab'
+    b'ilizing in the sunlight.Feeling a strange drain on spiritual energy from the sun.Ghostly form fl'
+    b'ickering and fading in the sun.Feeling the spectral form burning away.Feeling brave after resist'
+    b'ing vampire powers.Re-energized by a Sunlight Reversal Cocktail.Feeling power surge through vein'
+    b's after Dark Meditation.Watching a toddler show.All motives are high.Motives are pretty high.Lea'
+    b'rned new words.Toddler frustrated with learning to talk.Frustrated and tired of learning to talk'
+    b'.Angry about waking up early despite not being lazy.Violently ill from consuming garlic as a vam'
+    b'pire.Feeling a strange energetic tingling from a potential vampire transformation.Entranced by a'
+    b" vampire's gaze during the night.Stomach cramping from eating food tainted with garlic.Enjoyed a"
+    b' plasma fruit salad.Messed around in bat form.Jumped at the noise of the holiday cracker.Frustra'
+    b'ted by the inability to communicate.Shocked by something the toddler just said.Proud of mentorin'
+    b'g a toddler.Cranky from waking up too early from a nap.Frustrated and embarrassed by failing to '
+    b'teach the toddler.Sad and startled after seeing a ghost.Toddler angry about dancing.Dancing to t'
+    b'he stereo.Bored and sad dancing to the stereo.Rested in the toddler bed.Proud of making a funny '
+    b"joke.Completely fed up with the toddler's behavior.Exhausted by the constant demands of toddlers"
+    b'.Celebrating a birthday.Growing up.Sad about being left behind at daycare.Confused and upset abo'
+    b'ut passing out from exhaustion.Crying because of a diaper rash.Proud of using the potty.Too hype'
+    b'r to listen to instructions.Defiant toddler refusing orders.Toddler visibly refusing to do somet'
+    b'hing.Making friends easily.Feeling drained and lightheaded after offering a wrist to a vampire.L'
+    b'oved after a snuggle.Loved after a hug.Loved being read to.Thinking a recent interaction was cut'
+    b'e.Traumatized by a fire.Exhausted and wanting to be tucked in.Happy to meet a new dog.Happy to m'
+    b'eet a new cat.Entertained by playing with a laser pointer.Watching a bowling match.Arms are achi'
+    b'ng from bowling too many frames.Muscles sore and fingers stiff from bowling.Feeling like the kin'
+    b'g of the bowling lanes.Accusing opponents of cheating at bowling.Grossed out after being kissed '
+    b'by a pet with litter breath.Feeling pumped up after winning an argument.Angry about losing a fam'
+    b'ily argument.Awkward and stressed witnessing a parenting meltdown.Having an emotional meltdown d'
+    b'ue to extreme embarrassment.Frustrated that a family argument had no resolution.Ranting in a pri'
+    b'vate journal.Thoughts clarified and organized after writing in a journal.Feeling reflective and '
+    b'assured after journaling.Feeling happy while journaling.Feeling embarrassed after writing in or '
+    b'reading a journal.Feeling blue after writing in a journal.Writing a normal journal entry.Relievi'
+    b'ng stress via journal.Relieving embarrassment via journal.Relieving sadness via journal.Venting '
+    b'anger in journal.Feeling like a parenting failure during a meltdown.Caught snooping in someone e'
+    b"lse's journal.Feeling sly after snooping in a journal.Happy after hugging a pet.Happy after kiss"
+    b'ing a pet.Relieved but feeling awkward after resolving a desperate bladder urge.Feeling much bet'
+    b'ter but still slightly uncomfortable after an accident.Feeling good about volunteering.Angry abo'
+    b'ut a bad volunteering experience.Feeling prepared after researching parenting.Frustrated by pare'
+    b'nting research.Embarrassed by what was found while researching parenting.Feeling like a super pa'
+    b'rent.Showed good manners.Minded manners.Embarrassed for behaving with gross manners.Emotions cal'
+    b"med by compassion.Sharing the burden of someone else's anger.Sharing the burden of someone else'"
+    b"s sadness.Feeling second-hand embarrassment for someone else's pain.Feeling heavy after sharing "
+    b"someone's burden.Intentionally riled up by an unfeeling acquaintance.Embarrassed that an attempt"
+    b' to rile someone up failed.Unintentionally made sad by riling someone up.Irritated by trying to '
+    b'rile someone up.Grossed out by having to clean up pet waste.Happy to say please.Feeling proud of'
+    b' being polite.Feeling like a capable teacher after a successful lesson in manners.Toddler angry '
+    b'about being forced to say please.Bored of being taught to say "please" over and over.Enjoying mo'
+    b'onlight bowling.Having fun playing with the doctor playset.Sad about a bad diagnosis on the toy '
+    b'playset.Feeling like a doctor while playing with the playset.Frustrated by being grounded from t'
+    b'he TV.Annoyed by the no-TV punishment.Bored because TV privileges are revoked.Generally stressed'
+    b' about being grounded.Angry that the parents are controlling the TV.Bored without computer acces'
+    b's.Cut off from the world without the computer.Annoyed about the computer ban.Frustrated by paren'
+    b'tal control over the computer.Feeling trapped at home.Going stir crazy from being confined to th'
+    b"e lot.Annoyed at not being allowed to leave.Embarrassed by someone else's gross behavior.Embarra"
+    b'ssed after gambling on a fart and losing.Resenting the travel restrictions.Lonely without being '
+    b'allowed to see friends.Isolated and stressed from the friend ban.Bummed about not seeing friends'
+    b'.Angry about being kept away from friends.Feeling disconnected without the phone.Panicked withou'
+    b't access to the phone.Annoyed at losing phone privileges.Frustrated that the phone was taken awa'
+    b'y.Bored without music.Stressed by the silence without music.Missing the ability to listen to mus'
+    b'ic.Resenting the ban on music.Bored without toys to play with.Upset that all toys have been take'
+    b'n.Annoyed at the lack of entertainment.Angry about the toy restriction.Polite introduction went '
+    b'well.Being very polite.Embarrassed by a mishap while volunteering at a nursing home.Grossed out '
+    b'after stepping in dog poop.Feeling terrible about being mean to someone.Experiencing a typical t'
+    b'een mood swing.Experiencing an inexplicable teen mood swing.Suffering from a teenage hormonal mo'
+    b'od swing.Suffering from a teenage mood swing of intense embarrassment.Happy to be near family.Te'
+    b'nse from being around difficult family members.Angry about being near estranged family.Read a no'
+    b'te on the board.Overwhelmed by conflicting parenting advice.Equipped with new parenting strategi'
+    b'es and ideas.Feeling dry and wilted like a neglected plant.Desiccated and weak from lack of wate'
+    b'r.Angry about a note on the family bulletin board.Looked at a drawing.Energized by the sun throu'
+    b'gh photosynthesis.Feeling like a plant sim.Working carefully on a school project.An angry PlantS'
+    b'im NPC.Wilting and sad from lack of water.Feeling sunny and photosynthetic.Feeling the pollinati'
+    b'ng urges of a PlantSim.Feeling itchy and unnatural in this plant form.Feeling photosynthetic and'
+    b' playful.Learned parenting tips.Feeling like a pro parent after learning tips.Annoyed by unsolic'
+    b'ited parenting tips.Embarrassed that parenting advice was rejected.Bored while sitting in a time'
+    b'-out punishment.Sad about being in time-out.Thinking about behavior during a time-out.Angry that'
+    b' the cat scratched the furniture.Grossed out seeing the dog drink from the toilet.Teen playing l'
+    b'oud music to vent anger.Nervous about breaking the grounding rules.Tense but satisfied after bre'
+    b'aking the rules.Snickering about sneaking a break while grounded.Anxious while actively sneaking'
+    b' around.Busted for breaking the grounding rules.Finding joy and inspiration in chaotic, messy cr'
+    b'eativity.Having a blast making a giant mess on the floor.Ashamed of a poor-quality school projec'
+    b't.Finished a school project well.Ignored bills responsibly.Angry that the dog splashed water on '
+    b'them.Stressed and worried about being irresponsible at work.Furious about being caught snooping.'
+    b'Embarrassed for accidentally using a forbidden word.Feeling hollow and needing sunlight or ferti'
+    b'lizer.Wilting and starving for nutrients.Grossed out by touching a slobbery toy.Quality time tra'
+    b"ining dog.Frustrated that the dog isn't listening.Taught dog a cool trick.Experiencing an adult "
+    b'mood swing.Experiencing an inexplicable adult mood swing of embarrassment.Experiencing an unexpl'
+    b"ained mood swing.Having a sudden, unexplained bad mood.Embarrassed by someone's bad manners.Goss"
+    b'iping about family members with a grin.Enjoying a homemade lunch.Ate good food despite being pic'
+    b'ky.Grossed out and upset by food texture.Invigorated after a good walk with the dog.Comforted by'
+    b' a nightlight.Collaborating on construction table.Having fun destroying a project.Furious that t'
+    b'heir school project was destroyed.Devastated that the school project was destroyed.Sad that a ne'
+    b'glected pet was taken away.Feeling distant and wanting to be alone.Bonding over blocks.Happy bei'
+    b'ng clingy.Stressed when separated from the caregiver.Happy being mean.Sad about not wearing the '
+    b'bear costume.Feeling athletic after beating the climbing wall high score.Hyped after beating lev'
+    b'el 1 on the climbing wall.Hyped after beating level 2 on the climbing wall.Hyped after beating l'
+    b'evel 3 on the climbing wall.Hyped after beating level 4 on the climbing wall.Hyped after beating'
+    b' level 5 on the climbing wall.Feeling like a champion after beating the hardest climbing wall le'
+    b'vel.Adrenaline pumping after surviving a climbing wall fire.Bored during a volunteer shift at th'
+    b'e nursing home.Feeling good and energetic after volunteering at a nursing home.Embarrassed by a '
+    b'mishap while volunteering at the beach cleanup.Happy volunteering at the beach.Toddler refusing '
+    b'to say sorry.Happy to say sorry.Bored of being lectured on how to apologize.Proud of teaching em'
+    b'otional intelligence and apology skills.Feeling proud for apologizing.Smelling like urine and fe'
+    b'eling humiliated.Happy hugging the dog.Happy kissing the dog.In trouble for leaving time-out ear'
+    b'ly.Angry about the long wait at the vet.Disgruntled by the long wait at the vet.Happy with vet c'
+    b'linic wait time.Regretting whining about the punishment.Pretending to be a doctor.Enjoying a hig'
+    b'h quality lunch.Nauseated by the sight of the litter box.Stressed because the pet is filthy.Reac'
+    b'ting to pet birth.Kissed by minty dog breath.Nauseous after eating pet food.Gluttonous pet enjoy'
+    b'ment.Sad to see a pet sold or given up for adoption.Enjoying a cozy cup.Playing in the ball pit.'
+    b'Feeling the love from a pet.Happy watching pet on obstacle course.Frustrated that the pet failed'
+    b' the obstacle course.Crawling through the jungle gym tunnels.Crying over a scraped knee.Having f'
+    b'un in the tunnels.Toddler fighting over the jungle gym tunnel.Gagging from the smell of a skunk.'
+    b'Sliding down the jungle gym slide.Crying over a scary slide.Feeling love from the cat.Happy to h'
+    b'ave been conceived at the lighthouse.Feeling brave after facing a flock of birds.Laughing after '
+    b'chasing a flock of birds.Grossed out by the smell of a dirty litter box.Pretending the jungle gy'
+    b'm is a rocket ship.Pretending the jungle gym is a pirate ship.Feeling the chaotic energy of a br'
+    b'eeding ground.Sharing an imaginary world on the jungle gym.Successfully imitated a pet.Heartbrok'
+    b'en over a missing pet.Not missing the pet too much.Energized after successfully wrestling with a'
+    b' pet.Disappointed and bruised after failing to play with a pet.Pampering the cat.Pampering the d'
+    b'og.Welcoming back a missing pet.Disappointed that dog breeding failed.Disappointed that cat bree'
+    b'ding failed.Happy about cats mating.Happy about dogs mating.Studying artifacts for historical in'
+    b'sights.Feeling relieved that the temple trap did nothing.Terrified by a trap in the temple.Horri'
+    b'fied by an ancient curse or trap.Feeling incredibly lonely due to a temple curse.Having a misera'
+    b'ble vacation due to temple traps.Terrified by a temple trap despite being a vampire.Happy from e'
+    b'ating an emotional berry.Feeling bold after eating an emotional berry.Buzzing with energy after '
+    b'eating an emotional berry.Ate a berry that induces flirty emotions.Ate a focused berry and feeli'
+    b'ng the effects.Ate a berry that chemically induces a state of inspiration.Feeling silly after ea'
+    b'ting an emotional berry.Tense after hearing a ghostly cat yowl.Tense after hearing a ghostly dog'
+    b' howl.Adopted a cat.Heartbroken that a cat was taken away.Grieving the death of a cat.Adopted a '
+    b'dog.Heartbroken that a dog was taken away.Grieving the death of a dog.Delivering an engaging arc'
+    b'haeology lecture.Energized by listening to an exciting folk tale.Embarrassed by a failed archaeo'
+    b'logy lecture.Gave a successful archaeology lecture.Miserable due to a personal rain cloud curse.'
+    b'Miserable due to a personal rain cloud curse.Miserable due to a personal rain cloud curse.Upset '
+    b'stomach from eating pet food.Miserable because a rain cloud is following overhead.Miserable due '
+    b'to a personal rain cloud curse.Angry about being followed by a personal rain cloud.Dazed and ann'
+    b'oyed by a personal rain cloud hovering overhead.Embarrassed by a personal rain cloud hovering ov'
+    b'erhead.Depressed and bored due to a magical rain cloud hovering over them.Feeling defiant agains'
+    b't the rain cloud.Frantically trying to dodge a personal rain cloud.Cursed with a rain cloud but '
+    b'feeling romantic about it.Trying to ignore a personal rain cloud and stay on task.Happy despite '
+    b'a rain cloud curse.Finding melancholic beauty and inspiration in a personal rain cloud.Ironicall'
+    b'y amused by the personal rain cloud overhead.Soaked and miserable from a personal rain cloud.Ble'
+    b'ssed with personal sun.Feeling achy and feverish from a curse.Weak and delirious from a rare cur'
+    b'se.Feeling generally unwell from a magical sickness.Feeling blessed by the jungle.Cured of a cur'
+    b'se.Feeling ancient joy.Hands are blistered and sore from clearing obstacles.Feeling an insatiabl'
+    b'e, painful hollow inside.Stomach cramping with unnatural hunger.Starving and desperate due to a '
+    b'curse.Everything is all good.Feeling a cold dread and impending doom.Paranoid and looking over t'
+    b"he shoulder constantly.Paranoid and seeing things that aren't there due to a curse.Paranoid and "
+    b"seeing things that aren't there due to a curse.Paranoid and seeing things that aren't there due "
+    b"to a curse.Tasting glorious tastes.Enjoyed a glorious meal.Traumatized by seeing a friend's pet "
+    b'die.Traumatized by seeing a pet die.Spooked by seeing a ghost at the lighthouse.Adrenaline rushi'
+    b'ng from a suspicious encounter at the lighthouse.Feeling like a detective solving the lighthouse'
+    b' mystery.Happy about the lighthouse adventure.Spooked and sad after seeing a ghost dog at the li'
+    b'ghthouse.Pretending to be a vet.Analyzing a collectible on the archaeology table.Dirty and happy'
+    b' from adventure.Feeling heroic for saving a dog.Rattling with energy while in skeleton form.Auth'
+    b'enticating an ancient artifact.Carefully uncovering an artifact from a dirt clump.Retelling beca'
+    b'use cleaning up poop is disgusting.Feeling nauseous and groggy from being poisoned.Enjoyed the l'
+    b'ighthouse.Severely ill and disoriented from poison.Overcame poisoning.incapacitated and dying fr'
+    b'om poison.Wearing clean laundry.Wearing pristine laundry.Wearing clothes that have been used but'
+    b" aren't dirty yet.Wearing warm, dry, and fresh clothing.Miserable wearing damp clothing.Feeling "
+    b'grim, wet, and smelling of mildew.Disgusted by wearing filthy clothes.Rattling with laughter aft'
+    b'er hearing a joke.Stomach upset from eating unfamiliar food.Buzzing with herbal energy and focus'
+    b' from Yerba Mate tea.Stung and swollen from a bee attack.Disappointed about failing to catch fir'
+    b'eflies.Disoriented after failing to catch lightning bugs.Bitten and scratched by bats.Itchy and '
+    b'panicked from a spider attack.Protected by gear.Pumped after escaping a natural danger using fit'
+    b'ness.Successfully used logic to avoid a natural danger.Feeling worldly after navigating local cu'
+    b'lture.Happy to hear a requested song.Annoyed by the pet howling constantly.Unsettled by the pres'
+    b'ence of a skeleton service worker.Cool to be near a skeleton.Discouraged by a failed jungle adve'
+    b'nture obstacle.Successfully navigated an obstacle.Bruised and battered from failing a jungle cha'
+    b'llenge.Shaken after a close call in the jungle.Scratched and sore from a jungle mishap.Exhausted'
+    b' but relieved after a jungle challenge.Relieved after surviving a dangerous adventure.Discourage'
+    b'd by a failed jungle adventure obstacle.Sore but triumphant after clearing a path.Scared but rel'
+    b'ieved after surviving a jungle hazard.Terrified after being chased by something at the campsite.'
+    b'Found an artifact.Stressed after a failed adventure attempt.Feeling accomplished clearing a path'
+    b' obstacle.Frustrated by failing a jungle obstacle.Mourning the death of a pet.Relaxing with a la'
+    b'rge dog.Relaxing with a small pet.Dizzy from watching the spinning laundry machine.Crying becaus'
+    b'e of damp and dirty clothes.Arms aching and burning from scrubbing clothes by hand.Feeling cozy '
+    b'and playful in warm laundry.Feeling fresh wearing clean laundry.Angry about being soaked by laun'
+    b'dry water.Embarrassed about wearing smelly, dirty clothes.Feeling cultured at the museum.Aroused'
+    b' by the beauty of art at the museum.Donated to the museum.Examining exotic plants in a temple.Le'
+    b'arning rapid archaeology techniques in a temple.Repelled insects.Activated a temple trap.Enjoyin'
+    b'g peace and quiet.Awestruck by the panoramic view from a cliffside lookout.Feeling romantic near'
+    b' a waterfall.Feeling on top of the world at a high point.Discovered a secret area.Refreshed by t'
+    b'he natural pool water.Feeling icky and poisoned by an ancient relic curse.Feeling icky and poiso'
+    b'ned by a spider bite.Feeling icky and poisoned by a ghost belch.Feeling icky and poisoned by a p'
+    b'oison dart.Feeling icky and poisoned by a bee sting.Incapacitated by poison from an ancient reli'
+    b'c curse.Incapacitated by poison from a spider bite.Incapacitated by poison from a ghost belch.In'
+    b'capacitated by poison from a poison dart.Incapacitated by poison from a bee sting.Severely ill f'
+    b'rom an ancient relic curse poison.Severely ill from a spider bite poison.Severely ill from a gho'
+    b'st belch poison.Severely ill from a poison dart.Severely ill from a bee sting.Sick to the stomac'
+    b'h after drinking pet food.Feeling cool listening to summer music.Gluttonously drank pet food.Dep'
+    b'ressed by news about climate change.Watching the fireplace channel.Feeling festive and playful f'
+    b'rom holiday music.Feeling icky and poisoned by a gate trap.Incapacitated by poison from a gate t'
+    b'rap.Severely ill from a gate trap poison.Watching an adequate skating routine.Watching a perfect'
+    b' skating routine.Watching a terrible skating routine.Thrilled after performing a perfect skating'
+    b' routine.Pumped after an amazing skating routine.Embarrassed by a fall at the skating rink.Embar'
+    b'rassed by falling while ice skating.Energized after completing a skating routine.Annoyed by a br'
+    b'ief personal rain shower.Sweating profusely and feeling faint from heat.Feeling like the skin is'
+    b' melting off from extreme heat.Shivering and teeth chattering from the cold.Numb and turning blu'
+    b'e from freezing temperatures.Feeling hardy swimming in cold water.The pool water is fine.Tangled'
+    b' and scratched by vines.Bruised and frustrated by jungle vines.Pleased by a gnome.Cursed by an a'
+    b'ngry holiday gnome.Embarrassed by a failed encounter with sloths in the jungle.Discouraged by a '
+    b'failed jungle adventure obstacle.Discouraged by a failed jungle adventure obstacle.Discouraged b'
+    b'y a failed jungle adventure obstacle.Embarrassed about getting stuck in quicksand.Walking slowly'
+    b' like a sloth.Amused by a sloth winking in the jungle.Feeling icky and poisoned by poison gas.In'
+    b'capacitated by poison gas.Severely ill from poison gas.Studying a collection case intently.Built'
+    b' a snow pal.Told a story to a snow pal.Feeling festive near the tree.Successfully decorated the '
+    b'tree.Frustrated by failing to decorate the tree.Embarrassed by a bad job decorating the holiday '
+    b'tree.Terrified and feeling the cold breath of death.Disappointed by receiving a bad gift.Opened '
+    b'a perfect present.Caught trying to steal a present from the pile.Super excited to open presents '
+    b"from the pile.Enjoying the snow.Happy it's snowing.Hating the snowy weather.Having fun in the sn"
+    b'ow.Having a blast playing in the snow.Angry about falling face-first into snow.Snickering after '
+    b'giving a gag gift.In the giving spirit.Surprised by a lovely gift.Sad that the gift given was di'
+    b'sliked.Appreciating the family.Observing the rodent peacefully.Amused and energized watching a r'
+    b'odent exercise.Entertained by watching a pet rodent play.Observing a small pet run around its ca'
+    b'ge.Face stinging from being hit by a snowball.Having a playful water balloon fight.Having fun th'
+    b'rowing mud.Having a playful snowball fight.Having fun throwing water balloons.Having a playful m'
+    b'ud fight.Having fun throwing snowballs.Daydreaming about how to spend potential lottery winnings'
+    b'.Nauseated by handling a diseased rodent cage.Sick and worried about a rodent bite.Delirious and'
+    b' feverish from rodent disease.Covered in cold, wet mud and feeling gross.Soaked and shivering fr'
+    b'om a water balloon.Disappointed about losing the lottery.In shock and dazed after winning the lo'
+    b"ttery.Excited for an upcoming romantic holiday.Excited for the feast tomorrow.Can't sleep becaus"
+    b'e presents are coming tomorrow.Excited for family time tomorrow.Attended a wonderful service.Hyp'
+    b'othermic and near death from cold.Heatstroke is imminent and body is failing.Unable to move or t'
+    b'hink clearly due to a food coma.Full from a grand meal.Ghostly form feels stiff and brittle from'
+    b' cold.Cozy by the leaf pile fire.Acting like a bro giving a gift.Receiving a bro gift.Feeling go'
+    b'od about giving a romantic gift.Touched by receiving a romantic gift.Excited about the TV premie'
+    b're.Furious that the TV premiere was spoiled.Enjoying the heat at Burning Man.Really enjoying the'
+    b' burning heat.Enjoying the cold.Enjoying the freezing cold.Happy about sabotaging the tree.Warme'
+    b'd up by the heat and feeling frisky.Warmed up and happy.Physically warmed by a passionate kiss.P'
+    b'laying with a pet rodent.Clothes are soaking wet and clinging uncomfortably.Fed the rodent.Got a'
+    b' new rodent.Pondering the concept of freedom while watching a small pet.Chilled and happy as a g'
+    b'host.Ghostly form feels unnaturally cold.Warmed by plasma.Plasma feels uncomfortably hot inside.'
+    b'Had an excellent holiday.Sad that the holiday was a disaster.Had a great holiday.Scared of the t'
+    b'hunder and lightning outside.Tense from being caught out in a storm.Scared to go out in the bliz'
+    b'zard.Having a muddy good time.Deeply mourning the death of a best friend.Deeply mourning the dea'
+    b'th of a child.Deeply mourning the death of a disliked child.Mourning the death of an ex-spouse.M'
+    b'ourning the death of a disliked ex-spouse.Mourning the death of a friend.Mourning the death of a'
+    b' good friend.Mourning the death of a grandparent.Mourning the death of a disliked grandparent.Mo'
+    b'urning the death of a niece or nephew.Mourning the death of a disliked niece or nephew.Mourning '
+    b'the death of a parent.Mourning the death of a disliked parent.Mourning the death of an aunt or u'
+    b'ncle.Mourning the death of a disliked aunt or uncle.Mourning the death of a romantic partner.Mou'
+    b'rning the death of a sibling.Mourning the death of a disliked sibling.Mourning the death of a sp'
+    b'ouse.Mourning the death of a disliked spouse.Mind feels clearer due to fasting.Terrified because'
+    b' lightning struck nearby.Worried about infection from a rodent bite.Singed and bewildered after '
+    b'being struck by lightning.Crazily happy after being struck by lightning.Having a great time in t'
+    b'he rain.Guilt-ridden for breaking a holiday fast.Chasing the storm from inside.Chasing the storm'
+    b' outside.Made it to midnight.Caught trying to prank the present pile.Soaked and laughing after r'
+    b'unning through the sprinkler.Supercharged with electricity after being struck by lightning.Hyper'
+    b'charged and glowing after a lightning strike.Miserable due to being too cold.Miserable due to be'
+    b'ing too hot.Throbbing pain from multiple bee stings.Mischievously disturbing the bee box.Feeling'
+    b' grimy and itchy after playing in rotting leaves.Made a holiday craft.Made a seasonal craft.Coll'
+    b'ected honey.Feeling cheered up by a bee swarm.Feeling capable on Skill Day.Frustrated that the u'
+    b'mbrella just broke.Feeling purposeful and motivated after setting a new resolution.Happy to be b'
+    b'ack to gardening roots.Invigorated by a nature walk for work.Concentrating on florist clientele '
+    b'needs.Happy about academic fame.Embarrassed by a rejected grant proposal for gardening.Energized'
+    b' by hands-on gardening work.Bursting with floral design ideas after a class.Mouth burning from s'
+    b'abotaged spicy food.Gagging from the taste of rotten fruit.Cramping and nauseous from sabotaged '
+    b'food.Happy about friendship flower arrangement.Joyful from flowers.Filled with sorrow from the s'
+    b'cent of a mourning flower arrangement.Smelling a flower arrangement scented with begonia.Insulte'
+    b'd by a disrespectful flower arrangement.In the zone while arranging flowers creatively.Inspired '
+    b'by the specific scents and feelings of the current season.Cursed with confusion by a flower arra'
+    b'ngement.Feeling artistic about a flower arrangement.Feeling generous giving flowers.Feeling prou'
+    b'd of the gifted flowers.Proud of creating a romantic flower arrangement.Joyful from giving flowe'
+    b"rs.Feeling festive for the holidays.Wooed and confused by the Flower Bunny's charm.Feeling conne"
+    b"cted to nature for the holidays.Wooed and confused by Father Winter's charm.Angry and fighting w"
+    b'ith the Flower Bunny.Angry and fighting with Father Winter.Flower Bunny left.Father Winter left.'
+    b"Disappointed to have missed the New Year's countdown.Eagerly anticipating the new year with laug"
+    b'hter.Excited about a grand meal.Eager to decorate and make the home festive.Upset that the decor'
+    b'ations were ruined.Stressed that the deadline for the resolution is near.Barely made resolutions'
+    b'.Feeling unbothered by resolutions.Disappointed in self for failing a resolution.Completed an as'
+    b'piration milestone.Got promoted.Lost weight.Got fit.Got a partner.Got more followers.Raised a sk'
+    b'ill.Promoted in scouts.Became a better student.Wrote a book.Crying because clothes are wet.Faith'
+    b'ful flower arrangement.Happy scouting.Taking the warm weather as a sign of love.Embarrassed by a'
+    b' scouting mishap.Feeling prepared as a scout.Ready to earn badges and help out as a Scout.Overwh'
+    b'elmed by scouting responsibilities.Sad about not earning a scouting badge.Scared for the pet dur'
+    b'ing the storm.Mourning the death of a small rodent pet.Ashamed of failing to forge a signature.F'
+    b'eeling mischievous writing an evil letter.Bees have food.Happy with cooler thermostat.Happy with'
+    b' warmer thermostat.Shivering because the AC is set too low.Sweating because the heat is set too '
+    b'high.Bees are calm.Feeling alive and energized by the windy weather.Hating the windy weather.Fre'
+    b"aked out by a living scarecrow.Intrigued by the scarecrow's existence.Delighted by the talking s"
+    b"carecrow.Child scared and angry at the scarecrow.Studying the scarecrow's construction.Reached f"
+    b'ame rank 5.Reached fame rank 1.Reached fame rank 2.Reached fame rank 3.Reached fame rank 4.Depre'
+    b'ssed about losing celebrity status.Depressed about losing celebrity status.Depressed about losin'
+    b'g celebrity status.Depressed about losing celebrity status.Depressed about losing celebrity stat'
+    b'us.Devastated by losing fame status.Depressed about slipping down the celebrity list.Humiliated '
+    b'by the loss of stardom.Angry about losing fans and influence.Stressed about becoming irrelevant.'
+    b'Feeling like a superstar.Feeling ambitious and rising in rank.Feeling driven to succeed.Feeling '
+    b'like they are making it big.Feeling close to the top of fame.Splashing around in the kiddie pool'
+    b'.Having splashy fun in the kiddie pool.Embarrassed to be splashing in a kiddie pool.Crying over '
+    b'a destroyed snowpal.Cooling off in the kiddie pool.Gardening and culinary skill boost.Arts skill'
+    b" boost.Hygiene and hunger decay slower.Listening closely to the scarecrow's gardening advice.Cry"
+    b'ing and scared of the loud lightning.Scared of the storm noises while inside.Distressed by the b'
+    b'ad weather outside.Covered in thick, heavy mud.Successfully exchanged a romantic gift as a teen.'
+    b'Sad about a gift-giving mishap.Excited because a gift was received well.Startled and annoyed by '
+    b'loud wind chimes.Fascinated and inspired by a specific holiday object.Itchy and smelling of deca'
+    b"y after romance in a leaf pile.Happy an enemy died.Mourning the death of a friend's pet.Mourning"
+    b' the death of a pet.Mourning the death of an acquaintance.Annoyed by reading gardening material.'
+    b"Writing praised.Angry after a fight about flowers.Anxious because the phone hasn't been checked "
+    b'recently.Freaking out due to paparazzi harassment.Having a meltdown due to paparazzi.Having a ma'
+    b'jor meltdown due to paparazzi.The pond denizens are calming the mind.Fascinated and energized wa'
+    b'tching pond predators.Playful pond denizens.Painful, itchy bites from pond creatures.Annoyed by '
+    b'mischievous pond sprites.Mind full of ideas for the next viral video.Feeling excited about the w'
+    b'eenie roast party.Stressed by activist fame opportunities.Stressed about a political fame opport'
+    b'unity.Nervous about a musical performance opportunity.Worried about the floral arrangement displ'
+    b'ay.Anxious about the art exhibition.Feeling like a secret agent or villain.Stressed by social me'
+    b'dia fame opportunities.Stressed about the tech demonstration.Nervous about the book signing even'
+    b't.Giggling while playing inside the money vault.Aroused by being surrounded by money in a vault.'
+    b'Adrenaline pumping from being surrounded by money in the vault.Dreaming of wealth while inside t'
+    b'he vault.Rage from being locked in or failing a vault robbery.Sad about being a terrible thief.F'
+    b'eeling stealthy near a vault.Feeling like a baller after making it rain money.Depressed by money'
+    b' and greed.Watching money burn with a strange fascination.Happy with a refined palate.Disgusted '
+    b'by the texture of non-gourmet food.Gagging at the thought of eating low-quality food.Feeling gla'
+    b'morous posing for cameras.Posing for a fan.Riled up discussing a public feud.Hurt by mean commen'
+    b'ts on social media.Reading infuriating comments online.Energized by the drama of a public feud.F'
+    b'rustrated about losing the public feud.Feeling victorious in a celebrity feud.Disgusted by physi'
+    b'cal contact with a stranger.Feeling secure in their personal bubble.Sad about not being around f'
+    b'amous people.Starstruck and buzzing from being near a celebrity.Received a gift.Amused by receiv'
+    b'ing a fan gift meant for someone else.Feeling weird vibrations from the crystal helmet.Feeling a'
+    b'rtificially bored after using a crystal helmet.Feeling embarrassed due to the influence of a cry'
+    b'stal helmet.Feeling artificially sad due to a crystal helmet.Headache and pressure from wearing '
+    b'a crystal helmet.Stressed about the fashion makeover event.Affected by an anger-inducing crystal'
+    b' helmet.Successfully hugged.Rejected by a celebrity for a hug.Successfully took a selfie.Rejecte'
+    b'd by a celebrity for a selfie.Successfully signed autograph.Rejected by a celebrity for an autog'
+    b'raph.Happy from fan letters.Touched by fan mail and ready to create content for them.Amused by f'
+    b'an mail.Pumped up by fan mail.Feeling influential receiving fan mail.Happy from crystal helmet.D'
+    b'rank a fun serum.Drank a hygiene serum.Feeling enhanced by a celebrity serum.Wired after drinkin'
+    b'g a CelebuSerum.Drank a celebrity serum that induces flirting.Drank a celebrity serum that boost'
+    b's cognitive function.Drank a happy serum.Feeling a celebrity-grade chemical boost from a serum.D'
+    b'rank a sleep serum.Feeling proud of a released music track.Shaking and anxious from lack of cele'
+    b'brity serum.Confused by the spin tactics of a PR agency.Listening to own song.Feeling blue after'
+    b' listening to sad music.Listening to music.Listening to a flirty music track.Listening criticall'
+    b'y to a music track.Bobbing along to a fun music track.Feeling confident listening to their own m'
+    b'usic.Listening to anger-inducing music.Happy about public number.Upset about receiving mean text'
+    b' messages.Embarrassed that their phone number was leaked to the public.Angry that their phone nu'
+    b'mber was leaked.Excited that their phone number was leaked to fans.Stressed because their phone '
+    b'number was leaked to the public.Energized and inspired by interacting with the public.Feeling ch'
+    b'arming and witty thanks to PR training.Humiliated after losing a fight with a bouncer.Sore and d'
+    b'irty from gardening work.Getting into character for a romantic scene.Ready to perform a comedy s'
+    b'cene.Deep in character and ready to deliver a great performance.Happy acting.Ready for action sc'
+    b'enes in an acting gig.Pumped for a Sci-Fi acting performance.Adrenaline high ready for a horror '
+    b'scene acting gig.Angry about not being taken seriously as an actor.Taking the craft of acting ve'
+    b'ry seriously and feeling artistic.Exhausted and crashing after staying up all night.Insecure bec'
+    b'ause no one is admiring the look.Feeling vain and important.Buzzing with excitement for juice.Wi'
+    b'thdrawal symptoms from not drinking juice.Irritable from lack of juice.Exhausted but fueled by t'
+    b'he inspiration of a charity stream.Child irritable from lack of juice.Sugar rushing and excited '
+    b'for juice.Withdrawal symptoms from not drinking juice.Feeling loved by the paparazzi.Feeding off'
+    b' the energy and cheers of a crowd.Overwhelmed and dazed by the adoration of fans.Feeling adored '
+    b'by fans.Feeling energized by a rally.Having an intense emotional outburst due to a fame quirk.Ex'
+    b'periencing an intense, dramatic bout of sadness.Feeling inspired by a celebrity tile.Disappointe'
+    b"d by a celebrity's tile.Feeling successful leaving work early.Leaving work early with energy to "
+    b'spare.Leaving work early and feeling free to date.Leaving work feeling efficient and productive.'
+    b'Happy leaving work early.Leaving work early allows time for creative hobbies.Feeling playful aft'
+    b'er leaving work early.Embarrassed by a bad interaction with the paparazzi.Feeling socially drain'
+    b'ed from networking.Bored by the tedium of researching style trends.Feeling trendy after styling '
+    b'someone.Stressed attempting to promote a new trend.Showing off a new trend.Bursting with fashion'
+    b' insights and trend ideas.Upset about fake news affecting their reputation.Angry about fake news'
+    b' affecting their style career.Embarrassed for spreading fake fashion news.Excited about a hot fa'
+    b'shion scoop or trend.Feeling sure of their style convictions.Feeling like a sellout in the fashi'
+    b'on industry.Strategizing the next fashion trend.Dealing with an unhappy style client.Upset about'
+    b' an unhappy client review.Feeling influential as a style icon.Obsessed with keeping up with fash'
+    b'ion trends.Feeling mentally purified after a celebrity cleanse.Feeling naturally talented at act'
+    b'ing.Feeling silly in a new styled outfit.Inspired by a fresh new hairstyle.Feeling fabulous with'
+    b' new hair.Feeling gorgeous with new makeup.Feeling artistic and confident about makeup applicati'
+    b'on.Throwing money around for fun.Feeling rich playing with money.Feeling stylish wearing a mood-'
+    b'board outfit.Outfit choice is perfectly expressing current creative mood.Wearing an outfit desig'
+    b'ned to attract.Feeling bold and energetic in a new outfit.Feeling inspired by a fashion muse.Fee'
+    b'ling extremely inspired by a fashion muse.Bursting with creative energy from a muse.Feeling a sp'
+    b'ark of creative energy.Highly inspired by a romantic muse.Mildly inspired by thoughts of romance'
+    b'.Looking at a style board sparked a small idea.The style board has triggered a major fashion vis'
+    b'ion.Embarrassed because someone watched them while wearing the crystal helmet.Rejected by a cele'
+    b'brity for a hug.Disappointed that the article submission failed.Rejected by a celebrity for a se'
+    b'lfie.Feeling immortalized by placing a celebrity tile.Earned a celebrity tile.Mischievously defa'
+    b'cing a celebrity tile.Feeling runway-ready with a model look.Feeling positive from a poster.Feel'
+    b'ing very positive from a poster.Feeling extremely positive from a poster.Feeling a bit brighter '
+    b'and creative after seeing a positivity poster.Feeling focused by viewing a positivity poster (Ti'
+    b'er 1).Feeling good from a positivity poster.Encouraged by a positive message to think creatively'
+    b'.Feeling focused by viewing a positivity poster (Tier 2).Feeling focused by viewing a positivity'
+    b' poster (Tier 3).Deeply moved by art that promotes positivity.Feeling focused by viewing a posit'
+    b'ivity poster (Tier 4).Fully embracing a positive, creative mindset.Viewed a positive poster.Disc'
+    b'ouraged by failing an audition.Emotionally charged and ready for a dramatic monologue.Soaked to '
+    b'the bone and shivering.Feeling victorious over pond denizens.Training in acting.Anxious about no'
+    b"t being the center of attention.Happy in a celebrity home.Feeling awkward around a celebrity's h"
+    b'ome.Feeling like a recognized icon.Feeling picture-perfect.Invited to a celebrity home.Feeling r'
+    b'eady for the spotlight.Flattered by attention.Desperate for someone to pay attention.Feeling neg'
+    b'lected by friends.Energized because attention is focused on them.Frustrated by a lack of online '
+    b'validation.Feeling popular.Feeling famous on social media.Feeling prepared for a drama role.Prac'
+    b'ticing crying for drama club.Happy streaming.Sad that the streaming drone broke.Burned out from '
+    b'too much social media usage.Humiliated by losing a celebrity feud.Subliminally programmed for cr'
+    b'eativity during sleep.Restful dreams in the pod.Feeling subconsciously confident after sleeping.'
+    b'Had dreams influenced by a subliminal focus transmitter.Waking up hyped after subliminal sleep p'
+    b'od dreams.Social dreams in the pod.Waking up amused after having funny dreams in the pod.Feeling'
+    b' intellectually stimulated after subliminal educational dreams.Had a terrible dream in the sleep'
+    b'ing pod.Pranked while in a sleeping pod.Embarrassed after a prank in a sleeping pod backfired.Bo'
+    b'red after being pranked in a sleeping pod.Panicking after being trapped in a sleeping pod.Happy '
+    b'in drama club.Feeling sad for drama club practice.Buzzing with energy and ideas from drama club.'
+    b'WooHoo in the sleeping pod.Fooling around in the sleeping pod.Researching romantic techniques fo'
+    b'r an acting role.Researching the emotion of anger for a role.Researching comedy roles and feelin'
+    b'g funny.Happy mischief in the pod.Caught messing with a sleeping pod.Talking on a money phone.Gr'
+    b'oggy from having subliminal dreams interrupted in a sleeping pod.Feeling triumphant after lampoo'
+    b'ning someone.Claustrophobic and terrified while trapped in a vault.Feeling like an escape artist'
+    b' in a vault.Humiliated after losing a fight to a wooden training dummy.Paranoid that others are '
+    b'whispering about them.Aggressively fighting the Mother Plant as a helper.Feeling heroic fighting'
+    b' the Mother Plant.Inspired to rally and fight for a cause.Embarrassed by a voice crack during a '
+    b'war cry.Terrified of plants after being attacked by one.Aggressively fighting the Mother Plant.R'
+    b'allied and ready to fight the Mother Plant.Feeling brave leading the fight against the Mother Pl'
+    b'ant.Yelling a silly war cry at the Mother Plant.Feeling paranoid underground.Feeling validated b'
+    b'y conspiracy theories.Tense after reading conspiracy theories online.Riled up by online conspira'
+    b'cy theories.Processing the daily news from the smart hub.Feeling affirmed by the Smart Hub.Laugh'
+    b'ing at a joke told by the smart speaker.Ordered to clean.Insulted by the smart home hub.Complime'
+    b'nted by Smart Hub.Feeling the bizarre energy of the Mother Plant.Reeling from the psychic scream'
+    b" of the Mother Plant.Angry at the smart hub's glitches.Feelings hurt by a smart home device.Ment"
+    b'ally exhausted from poring over case files.Muscles screaming from intense military drills.Succes'
+    b'sfully communicated with the Mother Plant.Focused on conservation knowledge and awareness.Bored '
+    b'by a dull conversation about conservation.Spreading conservation awareness.Embarrassed that no o'
+    b'ne listened to their conservation awareness speech.Embarrassed by a poorly written grant applica'
+    b'tion.Painful stinging sensation from a jellyfish or sea creature.Terrified after spotting a shar'
+    b'k in the water.Panic and sputtering after being pulled underwater.Panicking while being caught i'
+    b'n an ocean current.Mesmerized by the beauty of the ocean view.Feeling tickled by the seaweed in '
+    b'the ocean.Covered in gross, sticky slime.Feeling effects of Kava.Feeling effects of Kava.Extreme'
+    b'ly relaxed and dazed from drinking too much Kava.Feeling strange aquatic energy coursing through'
+    b' the body.Channeling oceanic magic to feel inspired.Using mermaid powers to charm others.Nervous'
+    b" about revealing mermaid nature.Feeling the sorrow of a mermaid's song.Enjoyed a mermaid kiss.Re"
+    b'freshed and energized after drinking Kava.Senses are heightened as a mermaid.Feeling an intense,'
+    b' bubbly tingling sensation as a mermaid.Completed a regulation consultation.Feeling authoritativ'
+    b'e enforcing regulations.Embarrassed for incorrectly citing fishing regulations.Accused of wrongd'
+    b'oing in conservation work.Naked and happy.In birthday suit and happy.Leg muscle seized up painfu'
+    b'lly while swimming.Scared of the deep ocean water.Shivering uncontrollably from sudden cold wate'
+    b'r.Made a dolphin friend.Made a dolphin friend.Made a dolphin friend.Feeling cheeky about being n'
+    b'ude in public.Embarrassed and in pain from a sunburn on private areas.Splashed by a playful dolp'
+    b'hin.Embarrassed after being splashed by a dolphin.Feeling free and breezy being nude on a clothi'
+    b'ng-optional lot.Reeling from a major psychic attack by the Mother Plant.Feeling honorable admiri'
+    b'ng a medal.Feeling proud admiring multiple medals.Feeling distinguished admiring many medals.Fin'
+    b'ger throbbing from a crab pinch.Made a crab friend.Saw a cute baby turtle.Angry that a seagull s'
+    b'natched their find.Furious about being pooped on by a bird.Startled by something moving in the s'
+    b'and while beachcombing.Frustrated that the treasure escaped.Grossed out by touching something sl'
+    b'imy on the beach.Hand stinging from touching something sharp in the sand.Included in the Kava pa'
+    b"rty.Luxuriously lounging.Sad that the dolphin didn't appear.Feeling threatened by the ocean's po"
+    b'wer.Had a romantic escapade in the waterfall.Feeling exposed and embarrassed while showering in '
+    b'the waterfall.Feeling awkward about showering naked in the waterfall.Spotted being intimate near'
+    b' the waterfall.Frolicking in the waterfall.Feeling exposed and awkward covering up.Grossed out a'
+    b'nd embarrassed by seeing someone naked.Learning fishing techniques from a mentor.Angry at a rude'
+    b" client interaction.Syncing perfectly with a client's vision for code or design.Upset about a te"
+    b'rrible work session.High off a productive freelance work session.Nervous about the ground rumbli'
+    b'ng from volcanic activity.Terrified because a volcano is erupting nearby.Scales feel brittle and'
+    b' itchy from dryness.Feeling weak and dizzy from severe dehydration.Got a tan.Skin is red, hot, a'
+    b'nd painful to the touch.Feeling buzzed from a juice keg.Feeling very buzzed from a juice keg.Fee'
+    b'ling party-ready from a juice keg.Buzzing with mild fun energy from dragonfruit juice.Buzzing wi'
+    b'th medium fun energy from dragonfruit juice.Buzzing with intense fun energy from dragonfruit jui'
+    b'ce.Mildly buzzed and flirty from passion fruit juice keg.Moderately buzzed and flirty from passi'
+    b'on fruit juice keg.Very buzzed and flirty from passion fruit juice keg.Happy from pineapple juic'
+    b'e.Happy from pineapple juice.Happy from pineapple juice.Disappointed by finding nothing while di'
+    b'ving for seashells.Disappointed by finding nothing while diving for treasure.Helped neighbors th'
+    b'rough loss.Working on an overclocked computer for maximum efficiency.Confused by unclear instruc'
+    b'tions from the client.The goals for the freelance gig are clear.Stressed by an unruly art class.'
+    b'Inspired by the act of teaching art to students.Feeling lucky due to island spirits.Feeling isla'
+    b'nd abundance.Imbued with the energy of the Island Spirits.Feeling a dark, heavy weight from an i'
+    b'sland curse.Scared of the angry island spirits.Feeling the impatience of the island spirits.Feel'
+    b'ing scared and sick from a curse.Applied sunblock.Angry at environmentalists.Did a good deed wit'
+    b'h graffiti.Amused by the graffiti found in the cave.Investigating strange noises and splendors i'
+    b'n a beach cave.Embarrassed by a strange noise they made in the cave.Wondering about the mysterie'
+    b's of a hidden cave.Sailing away in a canoe.Bruised and shaken after tripping in a dark cave.Terr'
+    b'ified after running from a Kraken in the cave.Happy in the bat colony.Scratched and bitten by a '
+    b'swarm of bats.Finger pinched painfully while collecting shells.Sad that playtime with dolphins e'
+    b'nded.Mesmerized by strange lights in the cave.Embarrassed after being startled in the beach cave'
+    b'.Saved by neighbors.Frustrated that no one listened to conservation advice.Making a difference i'
+    b'n conservation.The island beauty is fueling the soul and imagination.Skin feels hot and tight fr'
+    b'om too much sun.Tanning.Feeling like a legend for tapping the keg.Embarrassed after failing to t'
+    b'ap the juice keg properly.Pumped up after successfully doing a keg stand.Humiliated after failin'
+    b'g a keg stand.Pranked someone while tanning.Embarrassed by a prank suntan design.Feeling clean a'
+    b'nd energetic from eating organic produce.Adrenaline pumping from exterminating invasive species.'
+    b'Caught fishing illegally while being a conservationist.Bored by the routine tasks of their conse'
+    b'rvationist job.Feeling playful while working on conservation.Hot, sweaty, and bitten by bugs whi'
+    b'le working outdoors.Discovered a new species.Having a great time playing in the sand.Feeling ale'
+    b'rt and responsible as a lifeguard.Vigilant and tense while on lifeguard duty.Happy fishing.Disap'
+    b'pointed by drinking flat juice.Stinging pain from touching something sharp in the ocean.Feeling '
+    b'powerful taming a volcano.Nauseated by the smell of trash in the ocean.Sculpting sand.Stomping a'
+    b'round like a monster in the sand.Ruined a sand sculpture.Part of the community.Stomach churning '
+    b'like a stormy sea.Sad about hurting a fish.Feeling free like a fish.Happy child of the ocean.Sad'
+    b' about being marooned.Caught a big fish.Serving the community at BBQ.Feeling included by ancesto'
+    b'rs.Feeling connected to island ancestors.Tasting home.Feeling the playful vibes of island ancest'
+    b'ors.Making a difference for ancestors.Blessed with friendship and fun by island spirits.Blessed '
+    b'by island ancestors with love.Feeling blessed by fortune.Angry after an interaction with a dolph'
+    b'in.Sad after an argument with a dolphin.Feeling the disappointment of island ancestors.Feeling e'
+    b'xtremely blessed by fortune.Feeling extra friendly and fun thanks to island spirits.Blessed by i'
+    b'sland ancestors with strong love.Annoyed by being splashed in the ocean.Choking and sputtering a'
+    b'fter inhaling sea water.Mortified after losing their swimsuit in the ocean.Stressed by the rough'
+    b' conditions at sea.Empowered by elemental island spirits.Mourning a mounted fish decoration.Feel'
+    b'ing brooding and emo.Roommate is a cheerleader.Painful and annoyed by a sunburn.Highly uncomfort'
+    b'able seeing nudity on a clothing-optional lot.Feeling extremely awkward trying to cover up.Naked'
+    b' and happy.Naked and carefree.Excited by dining at a clothing-optional venue.Feeling brave dinin'
+    b'g in the nude.Thrilled by the risk of dining in the nude.Enjoying a daring dining experience in '
+    b'the nude.Channeling the energy of island ancestors.Feeling liberated working out in the nude.Nak'
+    b'ed and relaxed.Au naturel.Blessed by island ancestors.Nauseated by drinking foul, dirty water.In'
+    b' my element naked.Invigorated by skinny dipping.Feeling confident with a perfect tan.Feeling lib'
+    b'erated and artistically free in a natural state.Itchy and annoyed by sand getting into places it'
+    b" shouldn't be.Angry about being splashed while on a pool float.Sand is chafing and causing extre"
+    b'me discomfort.Laughing after getting splashed on the pool float.Rude awakening from being splash'
+    b'ed on a float.Extremely angry about being splashed on a float.Freezing cold after an outdoor sho'
+    b'wer.Lightheaded from inhaling engine fumes off-the-grid.Excited by a shark sighting.Soaked and l'
+    b"aughing on the pool float.Anxious about what is lurking beneath the water's surface.Cramping pai"
+    b'nfully after swimming on a full stomach.Playing tag in the ocean waves.Eating fresh catch.Feelin'
+    b'g strong flexing muscles.Scanning the water vigilantly as a lifeguard.Befriended a fish.Having a'
+    b' massive splash fight on the pool float.Feeling triumphant at ping pong.Overheating while swimmi'
+    b'ng in warm water.Feeling the hum of magical energy building up.Feeling unstable due to magical o'
+    b'vercharge.Terrified by dangerous magical energy levels.Under a magical spell causing confusion.U'
+    b'nder a charged magical spell causing severe confusion.Under a magical spell of sadness.Under a c'
+    b'harged magical spell of sadness.Devastated that the resurrection spell failed.Feeling violently '
+    b'ill from a magical poison.Dying from a potent magical poison.Feeling weird and stiff after being'
+    b' turned into an object.Feeling resilient despite a potion failure.Drank a successfully brewed lo'
+    b've potion.Drank a potent love potion.Cried in the toilet.Toilet is a bathroom buddy.Failed a hat'
+    b'e potion.Consumed by magical hate from a potion.Consumed by potent magical hate from a potion.Fe'
+    b'eling charming after a friendship potion.Feeling irresistible after a potent friendship potion.D'
+    b'isappointed and awkward after a potion failed.Frustrated by bad cell reception off the grid.Horr'
+    b'ified by the failed immortality potion.Having splashy fun in the ocean.Feeling smarter from a sk'
+    b'ill potion.Feeling genius from a potent skill potion.Giggling uncontrollably after a potion fail'
+    b'ure.Disoriented by a potion that backfired.Feeling empty and bored after a potion failed.Angry t'
+    b'hat a magic potion failed.Embarrassed by a failed attempt to brew a nullification potion.Failed '
+    b'a nullify potion.Sad because a potion failed.Feeling stubborn after a failed potion.Feeling chao'
+    b'tic energy after a potion failure.Learned a valuable lesson from a potion failure.Frustrated tha'
+    b"t the curse wasn't lifted.Failed a potion effect resulting in accidental romance.Recovering from"
+    b' a potion failure with determination.Feeling sickly and strange after a potion backfired.Angry t'
+    b'hat a potent magic potion failed.Successfully made a glow potion.Embarrassed that a potion faile'
+    b'd to make them glow.Embarrassed by a potent failure of a glowing potion.Successfully made a pote'
+    b'nt glow potion.Embarrassed that a pheromone potion backfired.Covered in magical pheromones.Cover'
+    b'ed in potent magical pheromones.Humiliated by a curse making everyone disgusted.Focusing on seei'
+    b'ng magic motes in the air.Power is growing.Engaged in a magical duel or fight.Under a magic spel'
+    b'l inducing love.Frightened by a display of magic.Unable to move and shivering from a freeze spel'
+    b'l.Deeply frozen and in pain from charged magic.Feeling lucky from potion.Feeling very lucky from'
+    b' potion.Feeling invincible from a death-proof potion.Sad because a death-proofing potion failed.'
+    b'Feeling immortal from a potent death-proof potion.Sad because a potent death-proofing potion fai'
+    b'led.Embarrassed that a luck potion failed.Mind is being controlled by a spellcaster.Mind is bein'
+    b'g controlled by a spellcaster for an extended time.Terrified of being stalked by a spectral enti'
+    b'ty.Grossed out by a repulsive spell effect.Terrified and drained by a night stalker curse.Overwh'
+    b'elmed by a charged repulsion spell.Cheating luck for objects.Cheating luck for money.Body aches '
+    b'and crackles with excess magical energy.Tasting extra chemistry.Electrocuted and dazed by a magi'
+    b'cal lightning bolt.Feeling heavy and sluggish from a poor diet.Skin is singed and burning from a'
+    b' fire spell.Won a magic duel.Bitter about losing a magic duel.Successfully made a nullify potion'
+    b'.Successfully made a potent nullify potion.Caught trying to prank the cafeteria station.Sparks f'
+    b'lying and gears grinding from damage.Thrilled after successfully casting a Steal spell.Caught us'
+    b'ing magic to steal something.Feeling professional about a cover photo.Editing fashion photos wit'
+    b'h a critical eye.Artistic vision is clear for a fashion photography shoot.Social media engagemen'
+    b't is driving new fashion trends.Disappointed with a photo shoot outcome.Using the photo editor t'
+    b'ool professionally.Feeling like a true tastemaker and style icon.Influenced photos.Stiff and awk'
+    b'ward holding a pose for too long.Excited to see how the photos turned out.Unhappy with how a pho'
+    b'to turned out.Mind-blown and dizzy from incredibly spicy food.Compelled to party by an external '
+    b'force.Feeling victorious in a debate.Embarrassed by a boring debate presentation.Feeling quick-w'
+    b'itted in a debate.Embarrassed by a disappointing performance at the podium.Determined to improve'
+    b' alchemy skills after a mishap.Harassed by annoying sprites.Guilty about betraying the secret so'
+    b'ciety.Happy with the secret society sprites.Blessed with focus by the sprites of a secret societ'
+    b'y.Visited by magical sprites and granted inspiration.Failed poison potion.Influenced by sprites '
+    b'to feel flirty.Blessed with energy by secret society sprites.Compelled to organize the surroundi'
+    b'ngs for mental clarity.Bored because a potion failed to increase their skills.Suddenly compelled'
+    b' to study intensely.Disoriented from a failed attempt to reset magical perks.Harboring a hidden '
+    b'guilt related to the Secret Society.First university memory.Focused and ready to capture the per'
+    b'fect photographic shot.Feeling prepared to teach a class.Understanding complex educational conce'
+    b'pts.Feeling organized with lesson plans.Feeling fiscally responsible.Feeling ready for the schoo'
+    b'l day.Pondering an intellectual quote heard in a university class.Feeling smarter after a tutori'
+    b'ng session.Tasted higher learning.Many hands make light work.Focus-testing a new engineering des'
+    b'ign.Designing computer components with precision.Feeling smart studying engineering.Feeling prec'
+    b'ise after checking work.Trapped and panicked inside an inanimate object.Angry about a note left '
+    b'by a roommate.Limping and bruised from a soccer injury.Crashing hard after drinking too many ene'
+    b'rgy drinks.Hyped after scoring a goal in a soccer match.Embarrassed for blowing a big play durin'
+    b'g a soccer game.Furious about getting a red card in soccer.Frustrated about receiving a yellow c'
+    b"ard.Feeling touched by a roommate's kindness.In the middle of an argument with a roommate.Annoye"
+    b'd by roommate drama.Feeling guilty about actions taken within the Secret Society.Thumb throbbing'
+    b' after hitting it with a hammer.Cramming for an exam at the last minute.Feeling protected by a f'
+    b'amiliar.Feeling eloquent giving a speech.Nervous about the university application process.Panick'
+    b'ing about getting into university.Feeling unsure about university.Mind racing with mechanical im'
+    b'provements and engineering ideas.My school won the game.Sad that their university team lost the '
+    b'game.Celebrating a school sports victory with high energy.Hot-headed rage because the rival scho'
+    b'ol won.Waiting for the right time to make another offering to the Secret Society sprites.Marked '
+    b'for a visit by the Secret Society members.Teeth chattering from a magical chill.Wet and cold aft'
+    b'er a freeze spell failed.Shocked and scared after seeing a spellcaster overload.Caught cheating '
+    b'on university coursework.Feeling deep shame for cheating despite usually being a good student.Fe'
+    b'eling sly after cheating at university.Still angry from a roommate argument.Upset after arguing '
+    b'with a roommate.Headache from the noise of a loud roommate.Catching the hype from a roommate.Dev'
+    b'astated about being kicked out of housing.Robotically programmed to flirt with appliances.Short-'
+    b'circuiting and twitching from malfunction.Corroding and seizing up from rust.Falling apart and b'
+    b'arely functioning.Battery critical, feeling sluggish and dim.System shutting down from lack of p'
+    b"ower.Heartbroken by a roommate's rejection.A roommate's whisper sparked an interesting idea.Angr"
+    b'y about roommates whispering.Listening to a roommate whisper romantic things.Paranoid that roomm'
+    b'ates are whispering.Sad watching roommates whisper about them.Happy about a roommate whisper.Par'
+    b'anoid that roommates are whispering about them.Embarrassed for being too aggressive during a deb'
+    b'ate.Thrilled that a robotics project has come to life.Entertainment systems recharging; processi'
+    b'ng humor.Feeling studious and focused.Feeling well-prepared for exams.Too tired to focus on stud'
+    b'ying anymore.Brain-dead from cramming too much information.Circuits overloaded and supercharged '
+    b'with electricity.Systems hypercharged after an electric shock.Terrified about the upcoming final'
+    b' exam.Time well spent on diploma.Furious that their degree feels useless.Frustrated by a career '
+    b'rut despite having a degree.Laughing about how bad the rival university is.Proud of academic ach'
+    b'ievements and looking forward to the future.Kind of a big deal with diploma.Embarrassed by a mis'
+    b'hap during the graduation ceremony.Suddenly compelled to expend energy.Having fun flying the qua'
+    b'dcopter.Embarrassed by their lack of soccer skills.Raging at the soccer ball.Gaining surreal foc'
+    b'us from a university statue.Believing the statue granted focus (placebo effect).Granted laser-li'
+    b'ke focus from the statue.Proud and focused after making the grade.Embarrassed about missing the '
+    b'soccer ball.Concussed from getting hit in the head with a soccer ball.Feeling athletic with a so'
+    b'ccer record.Caught performing a prank on a university rival.Extremely pumped up while in the mas'
+    b'cot costume.Gagging from the smell of a mascot costume.Feeling ready for a debate.Feeling energi'
+    b'zed by coffee.The flavor of coffee is keeping the mind alert.Enjoying the lingering taste of a f'
+    b'un coffee flavor.The aftertaste of coffee is keeping the mind sharp and creative.Embarrassed aft'
+    b'er being rejected when asking for a higher grade.Nervous to ask the professor for a better grade'
+    b'.Feeling awkward after begging a professor for a better grade.Awkward and embarrassed after begg'
+    b"ing for a grade.Anxious about the professor's reaction to the grade request.Feeling persuasive a"
+    b'sking for grades.Desperate for a grade change.Angry at a student asking for a better grade.Humil'
+    b'iated after bribing a professor failed.Feeling charming asking for grades.Feeling relieved after'
+    b' a presentation.Feeling confident about a scholarship.Got a full ride scholarship.Feeling proud '
+    b'of a scholarship win.Wearing a Black and Blue mechanical suit helmet enhances processing.Wearing'
+    b' a Black and Blue mechanical suit enhances processing.Feeling school pride.Feeling intense schoo'
+    b'l pride.Caught vandalizing a rival university.Ashamed of being caught pranking a rival universit'
+    b'y.Smirking about the superiority of the university.Feeling superior to the rival school.Feeling '
+    b'like a team player in E-Sports.Sipping energy drinks to stay sharp for E-Sports.Feeling dominant'
+    b' in E-Sports.Mentally prepared for an E-Sports match.Wired on energy drinks while gaming.Bummed '
+    b'out about an E-Sports loss.Successful in E-Sports.Victorious in E-Sports.Legendary in E-Sports.B'
+    b"rain fried from hours of intense gaming.Humiliated by a rival university's prank.Wearing a Beige"
+    b' and White mechanical suit enhances processing.Wearing a Blue and Red mechanical suit enhances p'
+    b'rocessing.Wearing a Gray and Brown mechanical suit enhances processing.Wearing a Green and Brown'
+    b' mechanical suit enhances processing.Wearing a Red and Green mechanical suit enhances processing'
+    b'.Wearing a White and Copper mechanical suit enhances processing.Wearing a Black and Copper mecha'
+    b'nical suit helmet enhances processing.Wearing a Black and Gold mechanical suit helmet enhances p'
+    b'rocessing.Wearing a Black and Gray mechanical suit helmet enhances processing.Wearing a Blue and'
+    b' Gray mechanical suit helmet enhances processing.Wearing a Gray and Black mechanical suit helmet'
+    b' enhances processing.Wearing a Green and Black mechanical suit helmet enhances processing.Curren'
+    b'tly being visited by a Secret Society sprite.Crushed by the weight of student loans.Soaked and s'
+    b'melling of toilet water.Paranoid that robots are plotting something.Freaked out by seeing sprite'
+    b's as a non-member.Messed around in the shower.Brain is teeming with information from the researc'
+    b'h machine.Happy teaching.Feeling fresh and active after a bike ride.Embarrassed by a poor debate'
+    b' performance.Feeling knowledgeable about debates.Frustrated that studying is taking too long.Ner'
+    b'vous about debating alone.Traveling green on a bike.Embarrassed after a failed attempt to woo a '
+    b'professor.Learning robotics from a mentor.Feeling victorious after a soccer game.Disappointed ab'
+    b'out losing a soccer match.Feeling triumphant after a soccer match.Disappointed about losing a so'
+    b'ccer match.Saw a great game.Feeling important representing a client.Disappointed about not being'
+    b' appointed a judge.Mentally exhausted and drained from excessive research.Devastated that the re'
+    b'po man took possessions.Excited about engineering solutions and tinkering.Graduated university.U'
+    b'nable to stop gossiping about legal cases.Feeling wise imparting legal knowledge.Feeling authori'
+    b'tative as a judge.Sad about being in debt even in the afterlife.Ghost angry about dying in debt.'
+    b'Disappointed by university rejection letters.Accepted to university.Highly accepted to universit'
+    b'y.Feeling awkward after an ungraceful shower encounter.Spectacular shower WooHoo.Good shower Woo'
+    b'Hoo.Cramped and sweaty after shower romance.Furious about being kicked out by roommates.Stressed'
+    b' and sweating during a final exam.Embarrassed because someone walked in on them in the shower.Ro'
+    b'bot motives high.Robot motives pretty high.Pinned and terrified under a heavy bed.Intrigued by t'
+    b'he mechanics and design of a fold-down bed.Crushed and suffocating inside a Murphy bed.Enjoying '
+    b'the coziness and efficiency of a Tier 1 Micro Home.Appreciating the benefits of living in a Tier'
+    b" 2 Tiny Home.Feeling comfortable in a Tier 3 Small Home.Making materials.Sad because they haven'"
+    b't made anything recently.Bed is perfectly firm.Nervous hacking the First Order panel.Nervous hac'
+    b'king the Resistance panel.Passing through a First Order checkpoint.Passing through a Resistance '
+    b'checkpoint.Ashamed that their eco-footprint is not green enough.Stressed by the unnatural, pollu'
+    b'ted environment.Breathing clean air.Swimming in geothermal water.Drinking natural well water.Ene'
+    b'rgized by the beautiful light of a green eco footprint.Skin blistering from intense, magnified s'
+    b'unlight.Breathing deeply in green footprint.Coughing and struggling to breathe due to smog.Angry'
+    b' about being swatted by flies.Frantically swiping away flies from trash.Grossed out but adrenali'
+    b'ne-fueled dealing with roaches.Frustrated by an insect infestation in the trash.Using a refined '
+    b'lightsaber.Hurt by being shunned by the community.Cheered by an influential individual.Thrilled '
+    b'by finding salvageable goods.Exhausted from scouring for recyclables.Resenting the mandatory rec'
+    b"ycling policy.Feeling empty because they haven't recycled anything.Feeling responsible recycling"
+    b'.Feeling guilty about marrying for money.Angry about receiving a prank call.Happy from a telemar'
+    b'keter call.Having an existential crisis about living in a simulation.Having an existential epiph'
+    b'any about the nature of reality.Angry at the Landgraab power company.Feeling like a winner at th'
+    b'e motive games.Feeling connected to the Force.Corrupted by the anger of a Sith Holocron.Soaked a'
+    b'nd bruised by a high-pressure water stream.Dazed from a physical fight with the fabrication mach'
+    b'ine.Singed and ringing ears after a machine explosion.Hopeful and inspired by eco-friendly progr'
+    b'ess.Smelling of garbage and feeling grimy.Retched by the smell and texture of trash.Flirty and d'
+    b'irty in the dumpster.Feeling persuasive in civic matters.Angry about failing to convince neighbo'
+    b'rs on policy.Target angry that someone tried to convince them on policy.Embarrassed after failin'
+    b'g to convince neighbors to vote for a policy.Frustrated that the persuasion attempt failed.Targe'
+    b't angry about a policy replacement.Convinced someone to install policy.Bored by someone trying t'
+    b'o convince them to support a civic policy.Embarrassed that no one supported their civic initiati'
+    b've.Convinced someone to support policy.Complaining about community issues.Living as an urban squ'
+    b'atter.Annoyed at getting a bad deal on a purchase.Ashamed of participating in consumerism.Ashame'
+    b'd for spending money unnecessarily.Eating cheap meals.Doing just fine as a freegan.Pumped about '
+    b'finding something good in the dumpster.Feeling resourceful and creative after saving food from w'
+    b'aste.Feeling like a sellout and ashamed.Freed from the rat race.Energized by the money saved thr'
+    b'ough dumpster diving.Feeling tough in negotiations.Amused by the noise of the smog vacuum.Saved '
+    b'by a firefighter.Feeling defiant against the Repo Man.Humiliated after having possessions reposs'
+    b'essed.Sad about losing the Motive Games.Dropped a call but happy off grid.Feeling accomplished a'
+    b'nd active living off the grid.Feeling self-sufficient off the grid.Appreciating the natural tast'
+    b'e of local water.Violently ill after eating something poisonous from the wild.Living off the lan'
+    b'd.Surprisingly energized after eating a critter.Feasted like a king off grid.Ate an Omega Brain '
+    b'Boost meal off-the-grid.Ate fresh catch off grid.Feeling agile after eating a frog hot pot.Revit'
+    b'alized by a meal of foraged ingredients.Nauseous at the thought of eating bug-based food.Gaining'
+    b' knowledge about juice fizzing.Bored by uninteresting facts about juice fizzing.Embarrassed by a'
+    b' lack of knowledge about juice fizzing.Feeling weird after drinking Beetle Juice.Happy from a dy'
+    b'ed cocktail.Embarrassed because a drink dyed their mouth a strange color.Happy from juice fizzin'
+    b'g.Happy from juice fizzing.Happy from juice fizzing.Refreshing bubble fizz giving a small energy'
+    b' boost.Feeling bubbly and energetic from seltzer.Buzzing with carbonated energy.Feeling bubbly f'
+    b'rom juice.Feeling fizzy and fun.Feeling extremely bubbly.Mildly flirty after drinking homemade s'
+    b'eltzer.Moderately flirty after drinking homemade seltzer.Very flirty after drinking homemade sel'
+    b'tzer.Lightly refreshed and creative from a fizzy juice drink.Bubbly juice is causing bubbly, cre'
+    b'ative thoughts.Completely energized and inspired by a crafted beverage.Feeling focused after dri'
+    b'nking sparkling juice.Feeling very focused after drinking sparkling juice.Feeling intensely focu'
+    b'sed after drinking sparkling juice.Feeling slightly fizzy and fun after drinking seltzer.Feeling'
+    b' moderately fizzy and fun after drinking seltzer.Feeling extremely fizzy and fun after drinking '
+    b'seltzer.Waking up dazed after passing out from too much juice.Feeling a healthy kick from kombuc'
+    b'ha.Energized by the probiotics in kombucha.Revitalized and ready to go after drinking kombucha.T'
+    b'he kombucha is providing a mild mental boost.The kombucha is providing a strong mental boost.The'
+    b' kombucha is providing an intense mental boost.Feeling incredibly sad after drinking Grimbucha.F'
+    b'eeling incredibly sad after drinking Grimbucha.Feeling incredibly sad after drinking Grimbucha.F'
+    b'eeling fizzed and dazed from drinking kombucha.Feeling weirdly dazed after drinking Grimbucha.St'
+    b'omach bubbling and throat burning from strange juice.Feeling violently ill from a bad batch of f'
+    b'izzy juice.Dangerously fizzy drink.Sliding down the ladder.Happy from candle aura.Happy from can'
+    b'dle aura.Feeling the sad aura from an emotional candle.Feeling the effects of a romantic candle '
+    b'(Level 1).Feeling the effects of a romantic candle (Level 2).The scent of a focused candle is fi'
+    b'lling the room.The strong scent of a focused candle is filling the room.Feeling a subtle boost f'
+    b'rom an energizing candle.Clearly energized by the scent of a candle.Feeling the playful aura fro'
+    b'm a candle.Feeling the sad aura from an emotional candle.Totally absorbed in the art of juice fi'
+    b'zzing.Feeling lightheaded and fizzy from kombucha.Focused on living an eco-friendly lifestyle.Mu'
+    b'scles aching from hard physical labor off the grid.Calculating the next move in Sabacc.Feeling r'
+    b'esourceful after cracking open a supply crate.Bruised and defeated after failing to slice a crat'
+    b'e.Embarrassed by a rookie hacking mistake on Batuu (First Order).Frustrated by failing to slice '
+    b'a control panel on Batuu.Well rested in dwelling.Embarrassed by a rookie hacking mistake on Batu'
+    b'u (Resistance).Frustrated by failing to slice a control panel on Batuu.Embarrassed by a rookie h'
+    b'acking mistake on Batuu (Scoundrel).Frustrated by failing to slice a control panel on Batuu.Gave'
+    b' feedback on concept.Feeling creative with design concepts.Embarrassed that the rally they organ'
+    b'ized failed.WooHooed for Batuu.Feeling strange and giggly after drinking Beetle Juice.Learning f'
+    b'abrication skills from a mentor.Laughing off a fabrication machine explosion.Burned by beetles f'
+    b'rom the insect farm.Grossed out and unsettled by the vertical meat wall.Disgusted by the texture'
+    b' of meat grown on a wall.Feeling the buzz from a Fuzzy Tauntaun drink.Head spinning from a stron'
+    b'g Dagobah Slug Slinger drink.Ready for takeoff after drinking Jet Juice.Gagging on a vile, space'
+    b'-age drink.Feeling brave in firefighter gear.Cooking Batuu food.Optimistic about the future pred'
+    b'ictions shown by the cube.Confused by the juiced atmosphere of the community.Confused and unsett'
+    b'led by weird social messages.Homesick after talking to parents.Shamed by neighbors for not votin'
+    b'g on community plans.Watching the world burn.Feeling efficient with solar panels.Acid burned and'
+    b' coughing from a cleaning mishap.Feeling shunned after complaining to neighbors.Bored because th'
+    b"e conversation isn't about them.Angry about being forced to recycle property.Feeling judged and "
+    b'annoyed by snobby comments.Feeling superb.Unsettled by a strange, moving object.Paranoid about c'
+    b'onforming to the eco-lifestyle.Saving the world.Appreciating the complexity and history of vinta'
+    b'ge aesthetics.Eager to build, fix, or create something manually.Bored by the cheap, small decora'
+    b'tions in the room.Feeling snobby about environment.The high-end decor meets high standards and i'
+    b'nspires.Disgusted and embarrassed by the filth in the surroundings.Uncomfortable due to a messy '
+    b'environment.Embarrassed by the untidy state of the room.Feeling grimy in a slightly dirty room.F'
+    b'eeling gross in a moderately dirty room.Feeling filthy in a disgusting room.Inspired by the pres'
+    b'ence of a local hero.Napped in a dumpster.Smelling of trash and feeling gross after a nap.Feelin'
+    b'g savvy doing business on Batuu.Creeped out by the skittering of insects.Feeling loyal to the Fi'
+    b'rst Order.Jedi mind-tricked into forgetting everything.Ready to join the cause and fight for the'
+    b' Resistance.Embarrassed after being tricked by a spy on Batuu.Feeling united with the Resistance'
+    b'.Focused on the might of the First Order.Intimidated by the power of the First Order.Terrified o'
+    b'f Kylo Ren and the Dark Side.Feeling authoritative in the First Order.Angry that someone tried t'
+    b'o repeal a policy.Bored by someone trying to convince them to repeal a policy.Knitting neat knit'
+    b's.Bored of knitting and wants to do something else.Wanting to knit something for a charitable ca'
+    b'use.Needles ready, mind full of knitting patterns.Skin irritated by scratchy wool.Amused by the '
+    b'tangled threads of fate while knitting.Anxious about a curse affecting their relationship.Frustr'
+    b'ated and embarrassed by a knitting mistake.Disappointed and bored by a failed knitting project.K'
+    b'nitting great knits.Pride in a handcrafted knitted item.Sensors overwhelmed and systems glitchin'
+    b'g.Feeling dazed and unfocused due to kombucha.Good environment.Good environment.Good environment'
+    b'.Pumped up listening to Metal music.The music playing is helping with concentration.Annoyed duri'
+    b'ng a hike.Hiked with someone.Hiked with someone.Rejuvenated by a perfect hike with good company.'
+    b'Feeling happy because a close friend is happy.Feeling sad because a close friend is sad.Feeling '
+    b'close and romantic towards someone.Feeling playful just by being near a close friend.Happy to be'
+    b' close to someone.Nervous about being spotted in a restricted area.Reminiscing in a rocking chai'
+    b'r.Burning and itching from acidic mud.Lost in sad memories while rocking.Angry while reminiscing'
+    b' in a rocking chair.Cringing while remembering an embarrassing past event in a rocking chair.Com'
+    b'pletely enamored with someone.Feeling shy and embarrassed around a crush.Enamored and happy.So i'
+    b"n love they can't think straight.Catching the furious mood of another person.Furious at someone "
+    b'generally.Seething with generic fury.Feeling righteously angry.Bitter but happy contagion.Bitter'
+    b' and tense about a past grievance.Bitter towards someone generally.Reaching the mountain peak wa'
+    b's a triumphant, inspiring moment.Disappointed with a bronze rating on the excursion.Embarrassed '
+    b'by a mediocre performance on a mountain excursion.Feeling adventurous on the mountain.Feeling go'
+    b'od about the progress made on a mountain climb.Feeling triumphant on the peak.Angry about a poor'
+    b' performance on a mountain excursion.Gold level happiness from mountain excursion.Gold level hap'
+    b'piness from mountain excursion.Upset that possessions were repossessed.Discouraged by failing a '
+    b'mountain climbing excursion.Knitting brutal knits.Satisfied that a handmade item has been shippe'
+    b'd to a buyer.Caught cheating at a game of Sabacc.Watching opponents closely to prevent cheating '
+    b'in Sabacc.Feeling tricky cheating at cards.Embarrassed by falsely accusing a cheater in Sabacc.F'
+    b'eeling stealthy distracting a droid.Embarrassed after a droid rejected a command.Rocking in a ch'
+    b'air.Adrenaline high after barely passing an inspection.Dazed and defeated after being arrested.F'
+    b'eeling slick avoiding arrest.Systems rebooting after a painful electric shock.Angry about being '
+    b'arrested on Batuu.Feeling hopeful for the cause.Feeling friendly with the Resistance.Feeling loy'
+    b'al to the First Order.Feeling independent.We are the spark of the resistance.Lighting the fire o'
+    b'f the resistance.Sad that their Batuu stories failed to impress.Sad that their Batuu stories fai'
+    b'led to impress.Feeling proud bringing order.Feeling strong crushing the Resistance.Angry that lo'
+    b"cals don't want the First Order.Feeling mercenary doing anything for a price.Feeling sneaky smug"
+    b'gling spice.Sad that their Batuu stories failed to impress.Sad that their Batuu stories failed t'
+    b'o impress.Organizing and viewing complete archives on the holotable.Feeling bold in the Resistan'
+    b'ce cave.Feeling brave in the cave.Feeling lucky at Sabacc.Payday at Sabacc.Feeling unbeatable at'
+    b' Sabacc.Playing pure Sabacc.Angry about losing credits at Sabacc.Down on their luck at the Sabac'
+    b'c table.Winning while no one watches.Starting a new knitting project with fresh eyes and ideas.F'
+    b'eeling notorious as a scoundrel.Disheartened by a failed Resistance mission.Feeling welcomed by '
+    b'the First Order.Feeling capable fixing a ship.Embarrassed after failing to fix a starship.Feelin'
+    b'g slick shifting blame.Embarrassed after failing to shift the blame for a starship issue.Feeling'
+    b' observant investigating.Feeling bold disparaging the enemy.Feeling adventurous exploring via sh'
+    b'ip.Feeling daring exploring space.Feeling intrepid in space.Embarrassed by a failed First Order '
+    b'exploration mission.Embarrassed by a failed Scoundrel exploration mission.Embarrassed by a faile'
+    b'd Resistance exploration mission.Hopeful and inspired by the Resistance cause.Embarrassed after '
+    b'getting lost in the Resistance caves.Uneasy and scared in a dark cave.Spooked by the spooky nois'
+    b'es in the cave.Perceiving time or movement as slowed down.Maintaining strict control over emotio'
+    b'nal expressions.Absorbing knitting techniques and tips from a mentor.Exhausted and cramped from '
+    b'exploring a spaceship.Had a fling in a space dwelling.Feeling daring despite danger.Feeling a su'
+    b'dden surge of anger.Suddenly overcome with a wave of boredom.Experiencing a sudden surge of roma'
+    b'ntic emotion.Feeling a sudden surge of focus.Surging with happiness.Taking life slow has allowed'
+    b' creativity to bloom.Experiencing a sudden surge of playfulness.Feeling a surge of deep sadness.'
+    b'Overwhelmed by a surge of raw emotion.Overwhelmed by a sudden surge of negative emotion.Feeling '
+    b'grounded and confident.Experiencing a sudden emotional surge of confusion.Overcome by a sudden s'
+    b'urge of embarrassment.Feeling a sudden surge of emotion and energy.Wrote a well-written post.Fee'
+    b'ling right at home while at work.Feeling secure on the rock wall.Mentally prepared for a rock cl'
+    b'imb.Feeling somewhat prepared for a rock climb.Sore and stressed from overreaching while climbin'
+    b'g.Strategizing the best route up a rock face.Embarrassed by beginner mistakes in rock climbing.F'
+    b'eeling tough while climbing.Embarrassed by a lack of progress in rock climbing.Feeling high on l'
+    b'ife and playful from the mountain view.Embarrassed after failing a rock climbing challenge.Devas'
+    b'tated and lost without a job.Feeling oddly fine despite losing a job, due to workaholic tendenci'
+    b'es.Feeling content and normal while at work.Climbing carefully, slow and steady.Climbing: Less t'
+    b'alk, more chalk.Upset about slipping while rock climbing.Humiliated after falling to the bottom '
+    b'of a climbing route.Moving up the climbing route.Using peak training techniques during a climb.E'
+    b'xcelling at elevating.Upset about a bad rock climbing practice session.Embarrassed after failing'
+    b' to reach the peak.Living on the rocks.Pushing past the mental breaking point on a climb.Spectac'
+    b'ular climbing.Nervous and not ready for the climb.Embarrassed by a dangerous fall while climbing'
+    b'.Reaching new heights.Never looking down.Time to rock climb.Natural born climber.Fighting gravit'
+    b'y.Struggling but progressing.Best views from hardest climbs.Feeling like a rock star.Sharing kno'
+    b'wledge in ski class.Feeling like an expert coach.Embarrassed by beginner skiing mistakes.Restles'
+    b's and needing to travel.Energized by exploring a new location on vacation.Feeling worldly after '
+    b'traveling.Fresh perspective and inspiration gained from recent travels.Happy after vacation.Refr'
+    b'eshed and ready for life after a trip.Sad and bruised after wiping out on the slopes.Sad and bru'
+    b'ised after wiping out on the slopes.Sad and bruised after wiping out on the slopes.Sad and bruis'
+    b'ed after wiping out on the slopes.Pumped to shred the slopes as a certified ripper.Feeling the a'
+    b'drenaline of shredding the gnar.Sad and bruised after wiping out on the slopes.Excited to get on'
+    b' the skis.Master of skiing.Skiing with steez.Feeling the rush of skiing.Excellent time skiing.Gl'
+    b'owing with glee on the slopes.Sad and bruised after wiping out on the slopes.Sad and bruised aft'
+    b'er wiping out on the slopes.Sad and bruised after wiping out on the slopes.Sad and bruised after'
+    b' wiping out on the slopes.Sad and bruised after wiping out on the slopes.Stoked to go snowboardi'
+    b'ng.Jittery and irritable from caffeine withdrawal.Feeling like a kid on the slopes.Getting a hea'
+    b'dache from skipping coffee.Buzzing and anxious from too much coffee.Satisfied the need for coffe'
+    b'e and feeling sharp.Met a local while traveling.Feeling nostalgic about skiing.Embarrassed by re'
+    b'calling painful skiing memories.Feeling ready to ski.Feeling foolish while preparing to ski.Emba'
+    b'rrassed for forgetting to remove shoes indoors.Made a wish at the festival.Made a wish together.'
+    b'Adoring and happy.Catching happiness from an adored sim.Feeling adored and confident.Adrenaline '
+    b'building before a snowboard run.Psyched up for a high-intensity snowboard run.Inspired by the pr'
+    b'esence of an adored person.Feeling impressed and adoring.Impressed and adoring.Feeling like a cl'
+    b'imbing pro.Saw broken electronics.Upset seeing broken electronics.Hyped after high-fiving a fell'
+    b'ow snow bro.Left hanging for a high five on the slopes.Deeply impressed and motivated by someone'
+    b" else's actions.Nursing a minor scrape or bruise.In pain from a significant injury.Masterfully p"
+    b'ushing past the mental breaking point on a climb.Pushing past the mental breaking point on a cli'
+    b'mb with average skill.Using average training techniques during a climb.Using master training tec'
+    b'hniques during a climb.Climbing carefully with average skill.Climbing carefully with master skil'
+    b'l.Crying from a scrape or boo-boo.In pain from a bad fall or bump.Ate a Black 5 Burger.Regrettin'
+    b'g eating questionable vending machine pizza.Ate a cupcake that boosts romantic feelings.Drank Ga'
+    b'lactic Vita Water.Feeling happy eating cake.Furious that the vending machine took the money.Feel'
+    b'ing heroic and adored.Adoring a lifesaver.Grateful and inspired by a hero who saved a life.Bitte'
+    b'r and tense recalling being cheated on.Bitter about being cheated on.Bitter about a breakup.Stre'
+    b'ssed thinking about the breakup.Bitter about a divorce.Still reeling from the bitterness of the '
+    b'divorce.Bitter about a fight.Tense and angry thinking about a recent fight.Quality time with a c'
+    b'lose friend.Cherishing the fun times spent together.Long term close happiness.Feeling playful wi'
+    b'th a long-term friend.Partied with a close friend.Reminiscing about a fun party.Adopted by a clo'
+    b'se friend.Feeling the burn in the legs after skiing.Bonding over a fun adoption experience.Survi'
+    b'ved near death with a friend.Happy friend survived near death.Terrified and sad that a close fri'
+    b'end almost died.Excited to teach someone how to stomp a landing.Embarrassed by a snowboarding fa'
+    b'ilure.Embarrassed by a snowboarding failure.Laughing about a near-death experience.Feeling like '
+    b'the universe is guiding the way.Embarrassed because mocking another snowboarder backfired.Feelin'
+    b'g long-term embarrassment around a romantic interest.Feeling a long-term infatuation with a part'
+    b'ner.Long term enamored happiness.Furious at a cheater.Feeling righteously angry about cheating.E'
+    b'nraged by the betrayal of cheating.Furious about a wedding mishap.Feeling angry about wedding dr'
+    b'ama.Furious about how the wedding turned out.Face stinging from cold snow.Feeling guilty about a'
+    b' past action.Feeling guilty and embarrassed about past actions.Weighing heavy with guilt.Feeling'
+    b' guilty because someone else is guilty.Cringing over the memory of an awkward date.Feeling guilt'
+    b'y about an awkward date.Feeling guilty about an awkward date.Embarrassed about throwing a terrib'
+    b'le party.Feeling guilty about throwing a bad party.Embarrassed and guilty about a bad party.Feel'
+    b"ing hurt by someone's actions.Feeling long-term hurt from a past event.Feeling hurt by a romanti"
+    b'c partner.Feeling hurt by a rejection.Feeling hurt and saddened.Feeling ready for the cold.Hurt '
+    b'and angry generally.Embarrassed for being unprepared on the slopes.Hurt and angry generally (lon'
+    b'g term).Hurt and angry about rejection.Hurt and angry about a romantic issue.Hurt and angry abou'
+    b't being saddened.Embarrassed after slipping on ice.Severely withdrawing from lack of caffeine.An'
+    b'gry due to repairing electronics (Technophobe).Fascinated by artificial intelligence and robotic'
+    b's.Terrified by the presence of a robot.Angry due to talking to a robot (Technophobe).Angry due t'
+    b'o being forced to play video games (Technophobe).Scared after a dangerous encounter with wildlif'
+    b'e.Relieved and amused that someone else got attacked by wildlife.Prepared for wildlife.Staying c'
+    b'alm and focused during a wildlife encounter.Energized after skillfully avoiding wildlife.Shocked'
+    b' and dazed after a bad wildlife encounter.Throbbing pain from a wild animal bite.Bleeding and so'
+    b're from an animal attack.Shocked and dazed after a shocking wildlife encounter.Blessed spiritual'
+    b'ly.Feeling a spiritual energy from a wildlife encounter.Feeling physically drained by a forest s'
+    b'pirit.Feeling peaceful in nature.Feet are swollen and aching from ski boots.Bored and annoyed by'
+    b' high-energy activities they dislike.Ignoring the dislike for energetic activities.Ate junk food'
+    b'.Ate junk food.Ate junk food.Ate junk food.Ate junk food.Ate healthy food.Ate healthy food.Ate h'
+    b'ealthy food.Agitated from sitting around too long.Ignoring the dislike for sedentary activities.'
+    b'Ate healthy food.Ate healthy food.Feeling good because the current activity matches an energetic'
+    b' lifestyle.Frustrated by not moving enough.Bored by the lack of nutritional variety in junk food'
+    b'.Upset about eating unhealthy food.Hyper from eating sugary junk food.Angry about having to eat '
+    b'a healthy meal.Feeling clean energy from a healthy meal.Angry about eating sugary food.Smelling '
+    b'burning fabric and feeling alarmed.Cozy at the kotatsu.Overheated and sleepy under the Kotatsu t'
+    b'able.Cozy at an upgraded kotatsu.Seated and sedentary.Feeling stiff and restless from sitting to'
+    b'o long.Feeling antsy and needing to move.Ready to climb the corporate ladder with innovative ide'
+    b'as.Inspired and perspiring at work.Proud to represent the company vision and values.Feeling a st'
+    b'rong synergy and inspiration from the team.Burned out from corporate work.Feeling popular among '
+    b'friends.Feeling comfortable surrounded by friends as a Networker.Overwhelmed by having too many '
+    b'friends.Made a new friend networking.Feeling exceptionally lonely due to a need for networking.F'
+    b'eeling desolate due to a lack of social connection.Pleasantly WooHooed in hot springs.Completely'
+    b' WooHooed in hot springs.Heartbroken over losing a close friend.Heartbroken over losing a close '
+    b'friend.Awed by the rare and beautiful phenomenon of thundersnow.Feeling rebellious and playful f'
+    b'or wearing shoes indoors.Ashamed for staying out late when they have work.Dazed from drinking al'
+    b'cohol during work hours.Embarrassed by a failed task in the corporate world.On an off-the-grid l'
+    b'ot.Warm feelings in hot springs.Lost in warmth of hot springs.Complete relaxation in hot springs'
+    b'.Feeling dizzy and weak from the heat.Liked a techie.Stressed by using technology.Feeling natura'
+    b'lly content while sitting down.Unbothered by neglecting the sedentary lifestyle.Unbothered by ne'
+    b'glecting the energetic lifestyle.Shared lifestyle tips.Annoyed by unwanted lifestyle tips.Embarr'
+    b'assed about skinny dipping as a well-behaved person.Embarrassed about entering the hot springs w'
+    b'hile dirty.Toe throbbing painfully after kicking a rock.Head hurting from a fall during a mounta'
+    b'in excursion.Embarrassed to lead a failed mountain expedition.Silver happiness from mountain exc'
+    b"ursion.Sad and embarrassed about the expedition's progress.Ignoring the dislike for technology t"
+    b'emporarily.Silver happiness from mountain excursion.Discouraged by failing a mountain climbing e'
+    b'xcursion.Heard beastly laughter in cave.Heard growling in cave.Heard monstrous logic in cave.Fee'
+    b'ling lighthearted after dancing with cave spirits.Unimpressed and bored by a cave exploration ev'
+    b'ent.Disturbed by the mad rantings found in the cave.Heard great rantings in cave.Determined not '
+    b'to fail while exploring a cave.Thinking about previous explorers in the cave.Found a lucky simol'
+    b'eon.Disgusted by sitting in a dirty hot spring.Disappointed by a mediocre hiking trip.Solo hike.'
+    b'Solo hike.Embarrassed for leading a boring hike.Feeling like a leader on a hike.Bladder feels un'
+    b'comfortably full due to a spirit.Feeling suddenly dirty and itchy.Feeling socially awkward and i'
+    b'solated.Stomach growling uncontrollably.Bored and restless due to a spirit.Discouraged by failin'
+    b'g to reach the mountain peak.Looking down from the mountain summit with clarity and awe.Focused '
+    b'on reaching the mountain peak against all odds.Feeling gravity-defying on the mountain.Wired aft'
+    b'er playing video games for hours.Overclocked computer.Frustrated by the lack of technology on th'
+    b'e lot.Embarrassed by a skiing failure.Gold hike with group.Feeling persuasive in negotiations.En'
+    b'joying bamboo environment.Enjoying nature cove.Took a happy selfie.Made a high value offering.Fe'
+    b'eling spiritual and connected after making an offering.Embarrassed by offering a cheap gift to t'
+    b"he spirits.Embarrassed by the poor quality of an offering.Disappointed that a hiking wish didn't"
+    b' come true.Made a happy wish.Ate a local delicacy.Anxious about not being at work.Panicking from'
+    b' being away from work too long.Unbothered by not working despite being a Workaholic.Resenting ha'
+    b'ving to work during off-hours.Feeling accomplished with a bronze climbing plaque.Feeling proud o'
+    b'f a silver climbing plaque.Feeling elite with a gold climbing plaque.Tired and annoyed from work'
+    b'ing overtime.Bored of staying in one place for too long.Extremely restless and bored from not tr'
+    b'aveling recently.Happy from hiking with close friend.Bitter about a hiking trail experience.Feel'
+    b'ing pumped from adrenaline.Bored by the lack of thrill and excitement in their life.Feeling thri'
+    b'fty haggling on Batuu.Feeling the urge to dance like the town mascot.Feeling gross from eating u'
+    b'nhealthy food.Physically stressed from a poor diet.Craving junk food intensely.Missing the comfo'
+    b'rt of junk food.Suffering withdrawal from lack of tech.Bored without gadgets.Unbothered by using'
+    b' technology despite being a Technophobe.Stressed by overexposure to technology.Overwhelmed by th'
+    b'e constant presence of technology.Feeling drifted apart from the close circle.Lonely and disconn'
+    b'ected from best friends.Anxious about a shrinking social network.Feeling irrelevant due to lack '
+    b'of networking.Unbothered by neglecting social networking.Muscles atrophying and back hurting fro'
+    b'm inactivity.Restless leg syndrome and agitation.Crashing into a sugar rush.Crashing hard after '
+    b'a sugar high.Feeling a bit lonely without romance.Desperate for romantic connection.Starved for '
+    b'affection.Missing romantic attention.Desperate for affection and enjoying a flirty chat.Feeling '
+    b'cooped up inside.Suffocating from being indoors too long.Uncomfortable being outside.Hating the '
+    b'fresh air and wanting to go inside.Bored by the lack of excitement.Craving a dangerous thrill.At'
+    b'e hot pot with others.Gave a blessing.Consumed romantic media.Bored by romantic media due to a l'
+    b'ack of interest in romance.Woke up with a relationship.Woke up with no relationship.Waking up fi'
+    b'ne with being single due to having no need for romance.Homesick while on vacation.Happy indoors.'
+    b'Bored because they have been outside for too long.Happy outdoors.Bored because they have been st'
+    b'uck inside for too long.Feeling weak and drained by a spirit.Feeling a spiritual sadness from a '
+    b'forest spirit.Possessed by an angry forest spirit.Spooked by a yellow spirit.Mildly bored after '
+    b'interacting with a spirit.Feeling blessed by a spirit.Feeling a strong blessing of energy from a'
+    b' spirit.Feeling blessed with fun by a forest spirit.Granted a wish that sparked pure inspiration'
+    b'.Granted a wish for focus by a forest spirit.Feeling a gentle nudging of spiritual luck.Feeling '
+    b'lucky from a spirit.Wished upon a spirit for love.Feeling slightly more focused thanks to a spir'
+    b'it.Feeling a mild blessing of energy.Feeling a spiritual sadness from a forest spirit.Affected b'
+    b'y the magic of a green forest spirit.Terrified by a red spirit.Strangely bored after collecting '
+    b'a spirit.Feeling overwhelmed and shaky from spirit energy.Annoyed by a bad experience on the tra'
+    b'il.Feeling youthful and energetic after eating a crepe.Feeling fearless at the s\xc3\xa9ance table.Spo'
+    b'oked by a seance gone wrong.Guided by voices and energy from the spirit world.Confused by a mess'
+    b'age received during a seance.Angry that ghosts are being jerks at the seance table.Engaged in sp'
+    b'ectral small talk.Spooked by a disturbing message from the spirit world.Overcome by malaise afte'
+    b'r a seance.Frustrated that the power is out.On a no power lot.Slightly uneasy due to the creepy '
+    b'atmosphere.Scared by the spooky environment.Terrified by the overwhelmingly haunted atmosphere.S'
+    b'cared of getting caught cheating.Terrified of the consequences of their infidelity.Took a selfie'
+    b' with the mascot.Invigorated by walking the dog outside.Did dog tricks outdoors.Stressed by work'
+    b'ing an office job.Frustrated by a vending machine.Rage-kicking a vending machine that ate their '
+    b'money.Warmed up by vending machine.Chilled out by vending machine.Hating having to walk the dog.'
+    b'Sweating and sticky from a warm vending machine item.Brain freeze and shivering from a cold item'
+    b'.Wearing formal wear.Mortified about being fired, especially as a proper person.Humiliated and d'
+    b'istressed by a breach of etiquette.Ashamed of missing work, which is improper.Promoted in career'
+    b'.Embarrassed by poor work performance, failing to meet standards.Traumatized by memories of bein'
+    b'g crushed by a vending machine.Angry about being denied a promotion.Had WooHoo as an adventurer.'
+    b'On an adventure.Bored by the mundane taste of a quick meal.Feeling proper and tough.Feeling the '
+    b'indignity and confusion of losing a brawl.Offended by improper behavior.Even more overheated and'
+    b' sleepy under the Kotatsu table.Culinary horizons expanded by eating exotic food.Vacationed in S'
+    b'nowy Escape.Reminiscing about the fun times in the snow.Attracted to someone completely differen'
+    b't.Opposites attract.Bonding over shared lifestyles.Shared lifestyles.Bored because this activity'
+    b' provides no challenge to their high skill level.Enjoyed the snow.Excited about the snow.Bitter '
+    b'about a workaholic lifestyle.Resenting work interfering with life.Hurt and angry about a network'
+    b'er lifestyle.Feeling hurt by a lack of networking.Close knit lifestyle.Enjoying the tight-knit, '
+    b'fun dynamic of the group.Feeling guilty for drifting away from a close-knit circle.Feeling guilt'
+    b'y about losing a close friend.Guilty for neglecting close friends.Feeling romantic after a rock '
+    b'climbing excursion.Mountain climbing together.Feeling romantic in a mountain neighborhood.Mounta'
+    b'in neighborhood bonding.Mountain bonding.Feeling romantic after a mountain excursion.Hot pot bon'
+    b'ding.Feeling warm and happy after a hot pot meal.Onsen bonding.Relaxed and playful after visitin'
+    b"g the onsen.Feeling a ghostly romantic connection.Motivated and pumped by a friend's love for ex"
+    b'treme sports.Feeling pumped about extreme sports.Motivated and focused by a friend who loves ext'
+    b'reme sports.Embarrassed for failing to reach the mountain peak.Shared travel stories.Listened to'
+    b' travel stories.Warmed by space heater.Heated surroundings.Nervous about the noises in the haunt'
+    b'ed house.Terrified by the paranormal activity in the haunted house.Feeling content staying indoo'
+    b'rs.Reminiscing about a kiss at the Festival of Lights.Kissed at light festival.Played at snow fe'
+    b'stival.Having fun at the snow festival.Excited at fire.Partied at snow festival.Partying at the '
+    b'snow festival.Furious about jealousy at the Festival of Light.Jealous of others having fun at th'
+    b'e festival.Hurt and angry about being unblessed at the Festival of Youth.Feeling hurt by a lack '
+    b'of blessing at the festival.Wished at light festival.Blessed at youth festival.Blessed by the yo'
+    b'uth festival.Making a wish at the light festival.Screaming in incoherent terror from irrational '
+    b'danger.Screamed for emotional support.Feeling skeletal affection.Startled by summoning Bonehilda'
+    b'.Feeling ready for anything haunted.Having second thoughts about staying in this haunted house.F'
+    b'eeling fine while being indoors, aligning with lifestyle.Revitalized by a drink found during a m'
+    b"ountain excursion.Slept in a cave.Paranoid that something isn't right in the house.Protected by "
+    b'sacred candles.Woohooed in a mountain cave.Bitter about a mountain climbing experience.Slightly '
+    b'neglecting the indoorsy lifestyle but feeling fine.Neglecting the indoorsy lifestyle but feeling'
+    b' fine.Surprisingly energized by eating forbidden haunted candy.Sick to the stomach from eating c'
+    b'ursed candy.Soul stuffed with happiness.Drunk on spectral energy in a haunted house.Disappointed'
+    b' by bland food.Received lifestyle tips.Annoyed by receiving lifestyle tips.Lucky escape at work.'
+    b'Embarrassed for taking an inappropriate selfie in a cemetery.Unbothered by romantic interactions'
+    b' despite lifestyle preference.Seeing funny spectral sprinkles in the air.Overwhelmed with fear a'
+    b'nd wanting to leave the haunted house immediately.Accepting a new partner despite preferring the'
+    b' single life.Feeling okay about engagement despite preferring the single life.Feeling okay about'
+    b' the wedding despite preferring the single life.Conflicted about engagement.Conflicted about wed'
+    b'ding.Conflicted about new partner.Happy near partner.Did laundry.Did laundry.Bitter about a moun'
+    b'tain climbing experience (long term).Bitter about a failed mountain climb.Climbed mountain with '
+    b'friend.Feeling accomplished and fun after a climb.Enjoying a fun hike.Feeling bad about a failed'
+    b' mountain climb with someone.Feeling guilty about a bad mountain climbing trip.Guilty about the '
+    b'climbing expedition outcome.Still bitter about the mountain incident long ago.Feeling drained af'
+    b'ter offering a piece of their soul.Feeling neutral in a clean, dust-free environment.House is du'
+    b'sty.Sneezing and annoyed by the dust.Sneezing and choking on dust.House is so clean it feels aph'
+    b'rodisiacal.Cleaning with the zeal of a perfectionist (Level 1).Cleaning with the zeal of a perfe'
+    b'ctionist (Level 2).Cleaning with the zeal of a perfectionist (Level 3).Cleaning with the zeal of'
+    b' a perfectionist (Level 4).Finding the dust bunnies surprisingly amusing.Embarrassed by the dust'
+    b'y state of the house.Libido killed by the filthy surroundings.Rage-cleaning a filthy house.Rage-'
+    b'cleaning a filthy house.Rage-cleaning a filthy house.Ashamed of having a dusty house.Angry about'
+    b' being treated like a housekeeper.Remembering a frightening event.Excited by fire.Uncomfortable '
+    b'due to the awkward spiritual energy of a haunted house.Feeling brave busting ghosts.Feeling drai'
+    b'ned by supernatural activity.Feeling professional about a renovation.Feeling brave as a kid inve'
+    b'stigator.Cared for dust bunny.BFF with dust bunny.Sad about a dust bunny interaction.Feeling tri'
+    b'umphant over dust.Scared of a dust fiend creature.Panicking due to extreme paranormal activity.J'
+    b'ump-scared by a sudden noise or movement.Concentrating on maintaining a ghost form.Disoriented f'
+    b'rom transforming into Bonehilda.Unsettled by turning into a ghost temporarily.Channeling magic t'
+    b'hrough a seance table.Angry presence of Temperance the ghost.Terrified by the presence of Temper'
+    b'ance the ghost.Feeling threatened by a menacing supernatural presence.Scared specifically of the'
+    b' ghost Temperance.Determined to vacuum up every speck of dust.Loving the thrill of the haunted h'
+    b'ouse.Disgusted by the squalor.Lost in a world of make-believe inside the tent.Pretending to be a'
+    b' monster in the tent.Sad about sleeping in a shabby tent.Feeling accomplished vacuuming.Scared w'
+    b'hile playing inside a tent.Embarrassed by the strange effects of cowberry jam.Proud of a perfect'
+    b'ly preserved jar of homemade food.Guaranteed to succeed in the next social interaction with an a'
+    b'nimal.Destined to fail the next social interaction with an animal.Fired from interior decorator '
+    b'gig by an enemy.Mourning the death of a wild rabbit.Made a new rabbit friend.Made a new bird fri'
+    b'end.Talked to a rabbit.Learned something wise from an interaction with a rabbit.Joked with a rab'
+    b"bit.Laughing at a joke told by a rabbit.Embarrassed because a wild rabbit didn't like the joke.S"
+    b'caring a rabbit for fun.Being mean to a rabbit for fun.Scared after a negative interaction with '
+    b"a wild rabbit.Offended by a rabbit's reaction to a joke.Nervous trying to pet the wild rabbit.Hu"
+    b'gged a rabbit.Sad that a rabbit refused a hug.Feeling tough surviving a rabbit attack.Dazed afte'
+    b'r being attacked by a wild rabbit.Terrified after being attacked by a killer rabbit.Fascinated a'
+    b'nd energized watching birds.Watching birds has triggered a flight of fancy.Talked to birds.Commu'
+    b'nicating with birds was surprisingly enlightening.Feeling guilty and sad after a bird flew away.'
+    b'Angry after talking to a wild bird.Questioned birds.Pondering the cryptic answers given by a bir'
+    b'd.Embarrassed after asking a stupid question to wild birds.Sad that a bird refused to answer a q'
+    b'uestion.Scared birds.Happy eating dairy.Stomach cramping and bloating from dairy.In severe gastr'
+    b'ointestinal distress from dairy.Feeling brave scaring birds.Feeling lighter and better for avoid'
+    b"ing dairy.Singing along with nature's choir feels inspiring.Sad that a bird refused to listen to"
+    b' a song.Embarrassed after singing poorly to wild birds.Ears ringing from a screeching bird.Gross'
+    b'ed out by bird droppings.Dirty and tired from gardening work.Finding cleaning to be a zen-like, '
+    b'inspiring activity.Feeling inspired by design shows.Feeling critical of design shows.Picked up a'
+    b' few design tips from a TV show.Overflowing with renovation ideas from a home decorating show.Sa'
+    b'd because rain ruined the picnic.Sweating and bothered by the heat.Sad because cold weather ruin'
+    b'ed the picnic.Enjoyed a picnic.Feeling humiliated by a bad client review.Likes cooking.Hates eve'
+    b'ry minute of cooking.Riled up by a prank (Hot-Headed).Riled up by work (Hot-Headed).Overwhelmed '
+    b'by excessive cheerfulness.Enjoyed a picnic outdoors.Happy about home decorating channel.Humiliat'
+    b'ed by a negative review on the home decorating channel.Read the room successfully.Read the room '
+    b"successfully.Anxious that the client hates the renovation.Mortified by the client's negative rea"
+    b'ction.In the zone, ensuring everything is perfect.Likes pop music.Annoyed by hearing Pop music.L'
+    b"ikes kids music.Irritated by Kids' Radio music.The attention to detail in a task paid off beauti"
+    b'fully.Hating the physical exertion of exercise.Bored and frustrated while painting.Annoyed by pl'
+    b'aying video games.Hating the sound of the violin.Likes fitness.Likes painting.Likes video gaming'
+    b'.Likes violin.Likes alternative music.Likes blues music.Likes classical music.Likes electronica '
+    b'music.Likes hip hop music.Likes lullabies.Likes retro music.Likes romance music.Likes spooky mus'
+    b'ic.Likes s-pop music.Likes winter holiday music.Irritated by Alternative music.Bored by Blues mu'
+    b'sic.Finding Classical music stuffy and annoying.Getting a headache from Electronica.Irritated by'
+    b' Hip Hop music.Annoyed by Lullaby music.Hating the sound of Retro music.Cringing at Romance musi'
+    b'c.Creeped out and annoyed by Spooky music.Irritated by S-Pop music.Sick of Winter Holiday music.'
+    b'Away from children.Finding artistic inspiration in the macabre presence of ghosts.Tense because '
+    b'children are nearby.Annoyed and physically uncomfortable from a dislike.Having a bad time doing '
+    b'a disliked activity.Happy to have helped a plant grow and thrive.Talked to a plant.Frightened by'
+    b' the ghost of a killer rabbit.Terrified of the killer rabbit ghost.A ghost angry about being kil'
+    b'led by a rabbit.Bonding with animals.Missing their animal friends.Heartbroken over selling an an'
+    b'imal.Energized by chatting with an animal.Marveling at the perfection of a fresh farm egg.Concen'
+    b'trating on a cross-stitch pattern.Fingers sore and pricked from a needle.Confidence flowing from'
+    b' mastery of cross-stitching.Homestyle stitching.Unimpressed and bored by a low-quality fair entr'
+    b'y.Admiring high-quality entries at the village fair.Scared after being pecked by a chicken.Mourn'
+    b'ing the death of a chicken.Sad that a chicken is missing.Hugged a chicken.Sad that a chicken was'
+    b' sold.Embarrassed by a poor fair entry.Excited about the entry submitted to the Village Fair.Fee'
+    b'ling proud of a fair entry.Gifted a jar of preserves.Touched by a gift of homemade jam.Received '
+    b'a gift of preserves.Bonded over a picnic.Remembering the fun jokes told during the picnic.Deligh'
+    b'ted by a canned gift.Cooked together.Having fun cooking a meal together.Dealing with an angry cl'
+    b'ient after a renovation reveal.Disappointed that the client hated the renovation.Client is happy'
+    b'.Client is very happy.Amused by the local gossip about Agatha.Drank enriched milk that boosts th'
+    b'e mind.Drank chocolate milk.Feeling colorful and playful after drinking rainbow milk.Feeling bol'
+    b'd drinking spicy milk.Drank pink milk and feels flirtatious.Drank spicy milk and feeling bold an'
+    b'd creative.Feeling natural energy after drinking green milk.Frustrated that the cow kicked the b'
+    b'ucket.Annoyed that the llama refused to be sheared.Completely WooHooed in livestock pen.Pleasant'
+    b'ly WooHooed in livestock pen.Completely WooHooed in livestock pen.Feeling dirty and awkward afte'
+    b'r being intimate in a livestock pen.Awkward and cramped after romance in a shed.Angry after drin'
+    b'king obsidian milk.Feeling magically dazed from drinking golden milk.Mourning the death of a cow'
+    b'.Mourning the death of a llama.Hugged a cow.Hugged a cow as an enthusiast.Hugged a llama.Hugged '
+    b'a llama as an enthusiast.Sad that a cow was sold.Sad that a llama was sold.Bitter about livestoc'
+    b'k being sold.Nauseated by the smell of a dirty animal pen.Feeling bad about being mean to an ani'
+    b'mal.Ashamed for accidentally scaring an animal.Sad and bitter that the animal was sold.Hurt and '
+    b'angry about livestock being sold.Hurt that a household member sold a beloved animal.Sad that a c'
+    b'ow refused a hug.Sad that a cow refused a hug.Bruised ribs from a llama hug.Unnerved after a rej'
+    b'ected hug with a llama.Likes basic decor.Likes boho decor.Likes contemporary decor.Likes cosmolu'
+    b'x decor.Likes french country decor.Likes garden decor.Likes gothic farmhouse decor.Likes island '
+    b'decor.Likes mission decor.Likes modern decor.Likes patio decor.Likes queen anne decor.Likes scan'
+    b'dinavian contemporary decor.Likes suburban contempo decor.Likes tudor decor.Hating the Basic dec'
+    b'or style.Annoyed by the Boho decor.Disliking the Contemporary furniture.Finding the Cosmolux sty'
+    b'le tacky.Hating the French Country aesthetic.Annoyed by the Garden decor style.Creeped out by Go'
+    b'thic Farmhouse decor.Hating the Island decor theme.Bored by Mission style furniture.Finding Mode'
+    b'rn decor too cold.Hating the Patio furniture.Disliking the Queen Anne style.Annoyed by Scandinav'
+    b'ian decor.Hating the Suburban Contemporary look.Disliking the Tudor style.Self sustaining ingred'
+    b'ients.Hating the pressure of acting.Frustrated by the precision of baking.Hating the activity of'
+    b' bowling.Finding comedy routines annoying.Feeling awkward and hating dancing.Bored and grossed o'
+    b'ut by fishing.Hating the dirt and work of gardening.Frustrated by fixing broken objects.Annoyed '
+    b'by media production tasks.Disliking pranks and mischief.Hating making drinks.Annoyed by taking p'
+    b'hotos.Hating the confrontation of debating.Frustrated by the complexity of robotics.Hating rock '
+    b'climbing.Bored by rocket science.Hating the cold and effort of skiing.Annoyed by snowboarding.Fi'
+    b'nding meditation and wellness boring.Frustrated by the writing process.Annoyed by the DJ booth.H'
+    b'ating playing the guitar.Hating playing the piano.Disliking the pipe organ.Hating the sound of s'
+    b'inging.Agnes Crumplebottom is angry.Likes acting.Likes baking.Likes bowling.Likes comedy.Likes d'
+    b'ancing.Likes debating.Likes DJ mixing.Likes fishing.Likes gardening.Likes guitar.Likes media pro'
+    b'duction.Likes handiness.Likes mischief.Likes mixology.Likes photography.Likes piano.Likes pipe o'
+    b'rgan.Likes robotics.Likes rock climbing.Likes rocket science.Likes singing.Likes skiing.Likes sn'
+    b'owboarding.Likes wellness.Likes writing.Furious about being beaten with a handbag by Agnes Crump'
+    b'lebottom.Bitter about being beaten with a handbag.Traumatized by a purse beating from Agnes Crum'
+    b'plebottom.Likes programming.Frustrated by computer programming.Gossiped with a villager.Gossipin'
+    b'g with the locals.Scared after being pecked by a chicken.Feeling nocturnal energy from a wild mu'
+    b'shroom.Ate a verdant mushroom causing mental clarity.Feeling charming from a mushroom.Ate a spic'
+    b'y mushroom that heats things up.Bored by Easy Listening music.Annoyed by Backyard music.Irritate'
+    b'd by New Age music.Hating Jazz music.Bored by Baroque music.Annoyed by Tween Pop.Hating NuDisco '
+    b'music.Irritated by Latin music.Hating Latin Pop.Unsettled by Strange Tunes.Annoyed by World musi'
+    b'c.Bored by Singer-Songwriter music.Irritated by Summer Strut music.Hating Island Radio music.Ann'
+    b'oyed by Americana music.Hating Japanese Folk music.Bored by Focus music.Getting a headache from '
+    b'Metal music.Likes easy listening music.Likes backyard music.Likes new age music.Likes jazz music'
+    b'.Likes baroque music.Likes nu-disco music.Likes latin music.Likes latin pop music.Likes strange '
+    b'tunes.Likes world music.Likes summer strut music.Likes island music.Likes americana music.Likes '
+    b'japanese folk music.Likes focus music.Likes metal music.Likes singer-songwriter music.Likes twee'
+    b'n pop music.Feeling enchanted and giggly from a mushroom.Verdant mushroom effect.Lovely mushroom'
+    b' effect.Spicy mushroom effect.Mouth burning from a spicy mushroom.Helped out a villager.Happy ab'
+    b'out helping a villager.Embarrassed after a failed conspiracy with garden gnomes.Plotting mischie'
+    b'f with the garden gnomes.Feeling mischievous and energetic after conspiring with gnomes.Feeling '
+    b'mischievous and creative after plotting with gnomes.Nervous about conspiring with the gnomes.Fee'
+    b'ling extra charming from a mushroom.Feeling strongly enchanted and giggly from a mushroom.Ate a '
+    b'potent spicy mushroom that heats things up.Strong lovely mushroom effect.Feeling intense nocturn'
+    b'al energy from a wild mushroom.Strong spicy mushroom effect.In agony from a very spicy mushroom.'
+    b'Ate a potent verdant mushroom causing strong mental clarity.Strong verdant mushroom effect.Feeli'
+    b'ng mysterious and playful from a mushroom.Heartbroken that the cow rejected the interaction.Upse'
+    b't that the llama was uncooperative.Eating delivery food at home.Completed a decorating gig.Feeli'
+    b'ng successful finishing a gig.Ate a chocolate egg.Feeling powerful but confused by a golden egg.'
+    b'Under the influence of a dark chicken egg.Feeling playful after a drink with villagers.Sampling '
+    b'drinks and feeling playful.Feeling focused after a drink given by a villager.Feeling focused aft'
+    b"er sampling a villager's drink.Tripping slightly on mushroom mash.Hating DJ music.Likes DJ music"
+    b'.Canning jams.Disgusted by the texture of mayonnaise.Canning mayonnaise.Ghost angry about being '
+    b'killed by a chicken.Terrified by the ghost of a killer chicken.Terrified of the ghost chicken.Re'
+    b'tail therapy in the village.Feeling tough surviving a chicken attack.Pecked into confusion by a '
+    b'chicken.Sad that a livestock animal went missing.Embarrassed because an animal refused to dance '
+    b'with them.Happy and energetic after dancing with an animal.Feeling connected to history at ruins'
+    b'.The sound of the waterfall is clearing the mind for new ideas.Furious about a bad renovation.Go'
+    b'od build for a decorator.Bribed someone at the fair.Bitter about a failed bribe at the village f'
+    b'air.Embarrassed because a bribe at the village fair failed.Feeling perky after playing with the '
+    b'cowbell.Sad about losing a cowbell.Enamored with the ruins.Feeling romantic near the ancient rui'
+    b'ns.Toddler hiding in a tent because they are angry.Nauseated by the sight and smell of fungus.Fe'
+    b'eling pink and playful after drinking strawberry milk.Sad that a fox was killed by wild dangers.'
+    b'Showed affection to birds.Angry after showing affection to a wild bird.Sad that a bird refused a'
+    b'ffection.Struck by the creativity of a giant crop display.Helping a villager leads to romantic f'
+    b"eelings.Calmly reading the client's reaction to the renovation reveal.Sad because of a fox's beh"
+    b'avior.Enjoying the opener at the music festival.Enjoying the main artist at the music festival.H'
+    b'yped up watching the main artist at the music festival.Warming up and energized by the opening a'
+    b'ct.Still buzzing with energy from a live music festival.Feeling grown-up doing yoga.Feeling focu'
+    b'sed on yoga.Feeling balanced in yoga class.Child enjoying yoga mat.Child enjoying yoga mat with '
+    b'incense.Child in yoga class.Doing the Downward Dog yoga pose.Doing the Tree yoga pose.Doing the '
+    b'Half Moon yoga pose.Happy getting a manicure.Feeling pretty after a manicure.Feeling polished af'
+    b'ter a manicure.Admiring a fun and colorful manicure.Feeling relaxed with bros.Doing the Boat yog'
+    b'a pose.Hugged a rooster.Scared after being attacked by a rooster.Scared after being pecked by a '
+    b'rooster.Relaxing with a basic facial mask applied.Feeling that the basic facial mask is dry and '
+    b'ready to remove.Face feels tight and dry from a mask.Feeling pampered with bros.Confident after '
+    b'pedicure.Feeling pampered after a pedicure.Happy after pedicure.Admiring a fun and colorful pedi'
+    b'cure.Feeling groomed with bros.Confident after mani-pedi.Feeling great after a mani-pedi.Happy a'
+    b'fter mani-pedi.Feeling pampered and playful.Skin feels fresh after using a basic facial mask.Rel'
+    b'axing with a cute family-themed facial mask applied.Laughing at how silly everyone looks in face'
+    b' masks.Annoyed by wearing a face mask around kids.Feeling that the family facial mask is dry and'
+    b' ready to remove.Ready to take off the silly face mask.Itching to take this face mask off.Toddle'
+    b'r scared/angry about a face mask left on too long.Feeling bonded and fresh after doing face mask'
+    b's with family.Skin feels fresh, though the family activity was annoying.Feeling fresh and youthf'
+    b'ul after a facial mask.Skin feels youthful after using an anti-aging mask.Hydrating facial mask.'
+    b'Feeling sun-protected as a vampire.Skin feels protected after using a UV protection mask.Feeling'
+    b' luxurious with a gold mask.Gold facial mask.Skin feels expensive after using a salvaged gold ma'
+    b'sk.Relaxing with a luxurious gold facial mask applied.Stressed wearing a gold mask as a freegan.'
+    b'Relaxing with a special luxurious gold facial mask applied.Desperate to remove the opulent mask.'
+    b'Feeling that the gold facial mask is dry and ready to remove.Feeling that the special gold facia'
+    b'l mask is dry and ready to remove.Skin feels stiff and metallic.Face burns from UV exposure.Skin'
+    b' feels soggy and over-saturated.Skin feels tight and pulled.Relaxing with a hydrating facial mas'
+    b'k applied.Feeling that the hydrating facial mask is dry and ready to remove.Relaxing with an ant'
+    b'i-aging facial mask applied.Feeling that the anti-aging facial mask is dry and ready to remove.F'
+    b'eeling that the UV facial mask is dry and ready to remove.Relaxing with a UV protection facial m'
+    b'ask applied.Relaxing with a hydrating mask suitable for mermaid skin.Feeling that the mermaid hy'
+    b'drating mask is dry and ready to remove.Hydrating facial mask.Sad that their manicure is ruined.'
+    b'Sad that their pedicure is ruined.Sore and bitter about a yoga class.Bitter about a yoga class.L'
+    b'oved the manicure color.Hates the color of their manicure.Discovered self through meditation.Dis'
+    b'covered self through meditation and incense.Experiencing a moment of clarity.Feeling centered by'
+    b' a calming wellness aura.Feeling a calming aura.Face is red, itchy, and burning.Gagging from the'
+    b' smell of a rotten mask.Sickened by a meat-based mask.Face smells terrible and skin is crawling.'
+    b'Desperate to peel off a disgusting mask.Feeling frantic to remove a meaty mask.Unsettled by a ve'
+    b'ry weird dream.Physically distressed by a minor inconvenience.Hates the sun.Irritated by a painf'
+    b'ul hangnail.Choking and sputtering on pool water.Gagging on salty sea water.Disgusted by toilet '
+    b'water splashing up.Eyes burning and stinging from shampoo.Having a terrible day.Feeling catharsi'
+    b's.Refreshing cucumber drink is sharpening the senses.Likes basic fashion.Hating the Basic fashio'
+    b'n style.Drinking lemon honey ginger tea.Has a crushing infatuation on someone.Nervous around a c'
+    b'rush.Feeling socially overwhelmed.Feeling comfortable with their group.Intimidated by the social'
+    b' environment.Socially awkward but encouraged by positive flirting.Panic about being the center o'
+    b'f attention.Befriended a coworker.Agonizing over a social interaction that went wrong.Feeling co'
+    b'ol at school.Feeling understood.Anxious about unfulfilled dreams.Depressed because dreams and wa'
+    b'nts are unfulfilled.Frustrated by unfulfilled wants and fears.Having a crush.Blushing and stamme'
+    b'ring around a crush.Feeling down about a crush.Feeling wise giving advice.Motivated to take acti'
+    b'on after receiving friendly advice.Focused on applying friendly advice received recently.Splashi'
+    b"ng water during the baby's bath time.Soggy and cold from a bath.Water baby in the bath.Playing w"
+    b"ith bubbles during the baby's bath.Feeling helpful after a console repair.Adoring a sim after co"
+    b'nsole death.Finding poignant inspiration in the memory of a tragedy.Brought friends together wit'
+    b'h a call.Happy about growing family.Infectious joy.Jealous and bitter wondering what makes them '
+    b"so special.Bitter about being told they aren't cute.Caught the wedding bouquet and feels optimis"
+    b'tic about love.Furious about being ejected from a wedding.Ready to party hard at the wedding.Ren'
+    b'ewing vows and feeling the love all over again.Sibling jealousy.Feeling neglected by a partner.H'
+    b'urt and angry about lack of attention.Reminiscing about a first dance.Adoring an amazing being.D'
+    b'rinking Black Dragon tea.Drinking Orange Blossom tea.Embarrassed by a failed matchmaking attempt'
+    b'.Embarrassed by a failed attempt to set two people up.Being a love doctor.Successfully set two p'
+    b'eople up on a date.Angry about a disastrous blind date hookup.Friend is expecting a baby.Frustra'
+    b'ted by knitting.Likes knitting.Annoyed by cross-stitching.Likes cross stitch.Hating Cottagecore '
+    b'music.Likes cottagecore music.Joyful about baby.Stressed giving career advice.Feeling like an ex'
+    b'pert consultant.Nervous about making a huge life change.Disappointed by a career consultation.Th'
+    b'inks baby is cute.Grossed out by babies.Crying and wanting to be held.Infant waking up grumpy.Aw'
+    b'ake and happy.Infant screaming due to hunger.Infant screaming loudly due to hunger.Finger throbb'
+    b'ing from a bite.In pain and feeling drained after a vampire bite.Disgusted after being spit up o'
+    b'n.Exhausted and fussy.Very exhausted and fussy.Infant screaming due to lack of fun.Infant scream'
+    b'ing loudly due to lack of fun.Embarrassed because trying to talk someone up went horribly wrong.'
+    b'Bored by a conversation.Made a friend by talking them up.Broke up sims maliciously.Upset by hear'
+    b'ing someone trash-talk another.Embarrassed because an attempt to trash talk someone backfired.Tr'
+    b'ashed a sim maliciously.Infant needs met.Infant cared for.Infant love shown.Infant loved.Feeling'
+    b' insecure and needing parental attention.Crying because no one is paying attention.Top notch inf'
+    b'ant.Sad about being picked up.Happy being carried.Infant angry about being put down.Feeling wigg'
+    b'ly and energetic.Infant angry about being picked up.Infant angry about being put back.Happy bein'
+    b'g carried back.Happy being put down.Sad about being put down.Sad about being carried on the back'
+    b'.Crying from overstimulation.Crying because of a diaper rash.Stressed by the sound of a crying i'
+    b"nfant.Losing it because the infant won't stop crying.Grumpy after being woken up abruptly.At the"
+    b' dress shop.Just shared a ceremonial wedding kiss.Exchanged rings.Excited to catch the bouquet.S'
+    b'hared a first dance at a wedding.Had the bouquet.Had wedding cake.Walked down the aisle.Cut the '
+    b'cake.Panicked after being banned from streaming.Enjoying the anonymity of the streamer avatar.Hu'
+    b'miliated after losing a game while live streaming.Embarrassed that their content was demonetized'
+    b'.Stressed by a cursed viral video.Feeling trendy promoting products.Feeling slick avoiding troub'
+    b'le.Caught skipping class by the principal.Nauseated by a foul smell from a locker.Hyped up for t'
+    b'he high school team event.Devastated and embarrassed by a major team loss.Feeling triumphant aft'
+    b'er a win.Terrified of being near a Cowplant.Mesmerized by a colorful object.Drawing hearts in th'
+    b'e sand.Beachy mood from sand play.Creating patterns in the sand under the stars.Making snow art '
+    b'in the moonlight.Snowy mood from sand play.Writing romantic messages in the sand.Smiles for mile'
+    b's from sand play.Drawing hearts in the snow.Paralyzed with fear because a ghost is nearby.Tossed'
+    b' the bouquet.Pricked by a thorn in the wedding bouquet.Expressed joy at wedding.Expressing anger'
+    b' about a flower bouquet.Generally afraid of ghosts.Feeling brave confronting fear.Scared to be i'
+    b'n the water due to fear of swimming.Terrified about walking down the aisle.Excited at the aisle.'
+    b"Depressed about returning to a dead-end job.Depressed that the passion for the job isn't coming "
+    b'back.Trying to regain passion for the job through focus.Rediscovered the spark and passion for t'
+    b'he career.Walking down the aisle (debug state).Scared of the dark while outside at night.Woke up'
+    b' terrified of the darkness.Paranoid and angry due to fear of being cheated on.Worried and sad th'
+    b'at a partner might be cheating.Angry after catching a partner cheating.Angry that a partner woul'
+    b"dn't discuss relationship fears.Angry that a partner wouldn't discuss relationship fears.Talked "
+    b'about relationship fears.Swaying romantically while dancing.Thrilled with the success of a side '
+    b'project or hustle.Successfully sealed a deal in a side hustle.Angry that their dance partner ste'
+    b'pped on their foot.Enjoying traditional tea.Feeling prim and proper.Played matchmaker over the p'
+    b'hone.Delighted by a cute interaction.Baby laughed.wobbling around playfully.Blowing wedding bubb'
+    b'les.Throwing wedding rice.Sad that the honeymoon phase is over.Stressed about getting the weddin'
+    b'g details right.Devastated that the spouse left at the altar.Feeling eloquent at a wedding.Heard'
+    b' a good speech.Exchanged vows.Heard vows.Deeply moved by hearing wedding vows.Inspired by the of'
+    b"ficiant's words on love and commitment.Kissing at a wedding.Blissful marriage.Wishing and hoping"
+    b'.The romance of the wedding day is infectious and inspiring.Anxious about breaking wedding etiqu'
+    b'ette.Neighbor adopted a baby.Neighbor adopted a toddler.Neighbor adopted a child.Embarrassed by '
+    b'questionable references made during a wedding speech.Embarrassed by a confusing or inappropriate'
+    b' wedding speech.Energized by being perfectly in sync during a group dance.Upset about being dirt'
+    b'y.Upset because of hunger.Upset because of hunger.Bored and unhappy.Bored and unhappy.Infant scr'
+    b'eaming due to exhaustion.Infant screaming loudly due to exhaustion.Feeling romantic and pensive '
+    b'near a waterfall.Feeling the romance of the town square.Intrigued by local romantic legends.Refr'
+    b'eshed and inspired by the coastal breeze.Mesmerized by bioluminescent lights.Snickering after sn'
+    b'eaking a grape.Hand-picked flowers for a loved one.Tossed a coin into a fountain wishing for lov'
+    b'e.Neighbor adopted a cat.Neighbor adopted a dog.Excited to meet the new neighbors.Stressed about'
+    b" a new roommate moving in.Eyeing the neighbor's possessions with creative intent.Suspicious of t"
+    b'he new roommate.Drinking apple cider.Feeling successful with a toast.Mortified after delivering '
+    b'a terrible wedding toast.Heard a toast.Having a blast doing the group dance.Had a tea party.Reme'
+    b'mbering the silly tea party.Reminiscing about a first dance.Enamored by first dance.Furious abou'
+    b't being kicked out of the wedding.Crawling and on the move.Dating a celeb at prom.Feeling shiny '
+    b'at prom.Feeling happy about a promposal.Humiliated by a promposal rejection.Honored at wedding.I'
+    b'nvited to wedding.Honored us at wedding.Annoyed at being sold bad fashion.Wiggling and refusing '
+    b"to be contained.Infant frustrated they can't open something.Crying from a pinch or scratch.Scare"
+    b'd and hurting from a bite.Part of the bubble bunch.Putting together a killer vintage look at the'
+    b' thrift store.Finding the perfect outfit for a comedy routine.A poetry reading sparked deep thou'
+    b'ghts and emotions.Buzzing from a bubble tea at the thrift store.Feeling playful winning a pillow'
+    b' fight.Laughing despite losing the pillow fight.Hand stinging from catching a football wrong.Con'
+    b'centrating on throwing the football perfectly.Dreaming of athletic glory while throwing a footba'
+    b'll.Feeling fun at a college party.Hungover and confused after a failed college party event.Hatin'
+    b'g Boho style clothing.Disliking Country style clothing.Hating Hipster fashion.Disliking Outdoors'
+    b'y clothes.Hating Polished fashion.Annoyed by Preppy clothes.Hating Rocker style.Disliking Street'
+    b'wear fashion.Likes boho fashion.Likes country fashion.Likes hipster fashion.Likes outdoorsy fash'
+    b'ion.Likes polished fashion.Likes preppy fashion.Likes rocker fashion.Likes streetwear fashion.Sp'
+    b'ooked after peeking into a window and seeing something scary.Adrenaline high after sneaking out '
+    b'successfully.Embarrassed after climbing out a window for a concert and having a bad time.Energiz'
+    b'ed by sneaking a listen to a concert.Embarrassed and cold after being locked out.Embarrassed aft'
+    b'er getting caught loitering outside a window.Awkwardly failed to hang out through the window.Ope'
+    b'ned window for friends.Angry about a prank involving a window.Pumped after sneaking out to a sch'
+    b'ool game.Feeling rebellious sneaking out.Caught sneaking out through a window.Angry about social'
+    b' media interactions.Feeling popular on social media.Embarrassed by a social media faux pas.Feeli'
+    b'ng validated and energetic from social media interaction.Browsing flirty social media content.Ha'
+    b'ppy from social media.Feeling down after using social media.Stressed by social media drama.Bounc'
+    b'ing infant.Feeling superior and angry on social media.Feeling influential online.Embarrassed des'
+    b'pite trying to act superior on social media.Feeling superior and energized by online popularity.'
+    b'Browsing highly flirty social media content.Superiorly happy from social media.Feeling down afte'
+    b'r using social media.Stressed trying to maintain a superior image online.Terrified of the Grim R'
+    b"eaper's presence.Sad that a creative project turned out poorly.Waking up feeling like a failure."
+    b'Relieved and motivated by a successful performance review.Sad about a poor performance review.Em'
+    b'barrassed because a fear of failure caused them to mess up while showing off.Trusting a close fr'
+    b'iend.Hurt, angry, and suspicious.Hurt and suspicious of a partner.Yummy high chair food.Bored wi'
+    b'th food in the high chair.Infant feeling betrayed by being put in the high chair.Stomach in knot'
+    b's from guilt and fear.Waking up anxious about disappointing parents.Frustrated by failing to mee'
+    b't parental expectations.Set expectations with parents.Sad about being rejected for WooHoo.Remini'
+    b'scing about an epic party sparks creative memories.Feeling legendary from a party.Happy party me'
+    b'mory.Cringing at the memory of a failed party trick.Bummed that the party vibe is dead.Successfu'
+    b"l vibe check.Sad about missing a party.Bored because they haven't attended a party in a while.At"
+    b' a party.Reminiscing about a great party and feeling hyped.Reminiscing about a specific detail f'
+    b"rom a party.Furious that preparation didn't prevent failure.Energized by being perfectly prepare"
+    b'd.Exhausted and eye-strained from studying.Annoyed by another overachiever nearby.Panicked about'
+    b" forgetting a work task.Finished a career task.Frustrated that skills aren't improving fast enou"
+    b'gh.Furious about crafting a poor quality item.Thrilled and pumped after mastering a skill.Skille'
+    b'd up.Hard work and preparation are paying off, leading to inspiration.Feeling prepared and focus'
+    b'ed on success as an overachiever.Anxious after developing a new fear.Paralyzed by sudden anxiety'
+    b'.Feeling focused on a career path.Anxious about the uncertainty of the future.Thinking about the'
+    b' next big fashion trend.Mortified by a fashion faux pas.Anxious and needing a familiar face.Anxi'
+    b'ous about being in a strange place.Familiar space.Safe.Stopping the spread.Party after effect.Em'
+    b'barrassed after taking the blame for someone else at school.Giggling at how the message changed '
+    b'in telephone.Feeling cool at high school.Embarrassed after getting stuck in a prank or object at'
+    b' school.Dazed from a science experiment explosion.Nose hurting after being hit by a ball.Feeling'
+    b' smart after studying the classics.Feeling slick getting away with it.Feeling ready to take a hi'
+    b'gh school test.Mortified by the silence after a bad joke at school.Climbing the corporate ladder'
+    b'.Stressed about failing grades.Feeling cool and trendy wearing a popular brand.Excited about mar'
+    b'keting and branding a school event.Spooked but amused by the urban myth.Embarrassed after failin'
+    b'g to guess a password.Feeling awkward despite guessing the password.Terrified by an urban myth p'
+    b'rank.Embarrassed by a failed PA system prank.Snickering after hijacking the PA speaker.Coughing '
+    b'and gagging from a stink bomb.Smelling awful and feeling humiliated.Snickering after drawing on '
+    b'the whiteboard.Adrenaline rush from skipping class while at school.Feeling inadequate and anxiou'
+    b's from social media.Feeling intellectually insecure and awkward.Consumed by extreme werewolf fur'
+    b'y.Currently rampaging as a werewolf.Feeling a warning to be more diplomatic from the werewolf pa'
+    b'ck.Stressed about being on probation with the werewolf pack.Uncomfortable and gassy.Nervous abou'
+    b't reporting to the pack leader.Stressed by a warning about pack diplomacy.Feeling a warning to e'
+    b'xplore more from the werewolf pack.Feeling a warning to participate more in pack activities.Feel'
+    b'ing a warning to improve oneself from the werewolf pack.Feeling a warning to be more self-suffic'
+    b'ient from the werewolf pack.Scolded for not exploring enough for the pack.Warned to participate '
+    b'more in pack activities.Told to improve self for the sake of the pack.Warned to be more self-suf'
+    b"ficient.Constantly worried about the infant's safety.Feeling free without the baby.Feeling the p"
+    b'ressure to be a perfect parent.Embarrassed that makeup failed to hide acne.Feeling proud of the '
+    b'infant.Infant jealous of another child.Sweet siblings.Confused and awkward about puberty changes'
+    b'.Self-conscious and embarrassed about a breakout of acne.Feeling supported through puberty.Happy'
+    b' about hair growth.Acne removed.Skin stinging from razor burn.Humiliated after being teased abou'
+    b't acne.Embarrassed after being teased about body hair.Self-conscious about new body hair growth.'
+    b"Stressed about finishing homework.Frustrated that studying isn't helping.Under pressure as a lea"
+    b'der on probation.Nervous about reporting a friend to the leader.Stressed about snitching on a pa'
+    b'ckmate.Embarrassed for trying to sell fashion trends that no one wants.The online fashion busine'
+    b'ss is booming, fueling motivation.Hurt that a fashion look was rejected.Setting the internet on '
+    b'fire with a bold new look.Panicked about needing to prepare for a test.Panicking about taking a '
+    b'test due to fear of failure.Claustrophobic in this crowded place.Panic rising and chest tight in'
+    b' a crowd.Feeling hyper and riled up.Dreading walking into school.Sparring as a werewolf.Feeling '
+    b'tough beating a vampire.Humiliated that a werewolf lost a fight to a vampire.Deeply ashamed that'
+    b' a werewolf lost a fight to a regular human.Feeling dominant beating a vampire.Battered and conf'
+    b'used after losing a werewolf duel.Feeling strong beating a sim.Victorious and pumping with adren'
+    b'aline after a werewolf fight.Embarrassed that a werewolf was defeated by a vampire.Feeling super'
+    b'ior as a supernatural.Terrified by a werewolf rampaging nearby.Devastated by a drop in grades.Sa'
+    b'd about losing a school event.Waking up stressed about after-school activities.Stomach gnawing w'
+    b'ith a beastly hunger.Starving and losing control to the beast.Body surging with raw power after '
+    b'turning into a werewolf.Feeling the angry onset of "Werebies."Feeling feverish and strange from '
+    b'a werewolf bite.Becoming human.Becoming human.Figured out differences.Paralyzed by the fear that'
+    b' everyone is judging them.Feeling scrutinized and self-conscious.Embarrassed after failing to re'
+    b'solve a conflict.Feeling guilty about werewolf behavior.Confused and scared about what happened '
+    b'during a rampage.Suffering a pounding headache and sensitivity after a rampage.Too grumpy to tal'
+    b'k right now.Rampaging as a werewolf for the first time.Confused and bored after a strange werewo'
+    b'lf interaction.Feeling in total control of the werewolf transformation.Bonded with a werewolf.Fe'
+    b'eling a playful pack bond with a werewolf.Terrified of the transformed werewolf nearby.Energized'
+    b' by moonbathing under the werewolf moon.Moody due to moonbathing.Recharged and inspired by the e'
+    b'nergy of the moon.Waking up full of energy due to the lunar cycle.Got a diploma.Shared school me'
+    b'mories.Heard a good valedictorian speech.Mortified after giving a terrible valedictorian speech.'
+    b'Ready to take on the world after hearing a graduation speech.Bored by a terrible graduation spee'
+    b'ch.Terrified by the involuntary transformation into a werewolf.Feeling the intense pressure of t'
+    b'he approaching full moon.Pre-full moon phase.Texting a crush and feeling giddy.Heartbroken by a '
+    b"crush's rejection.Butterflies in stomach because the crush is here.Feeling happy chatting with a"
+    b' crush.Embarrassed after a conversation with a crush went poorly.Tongue-tied while talking to a '
+    b'crush.Swooning over a crush.Angry about teen crush drama.Jaw aching and teeth throbbing.Horrifie'
+    b'd by actions taken while in werewolf form.Horrified after witnessing a werewolf transformation.A'
+    b'll for the wolf pack.Stressed by the ongoing pack feud.Feeling magical energy after eating a Lun'
+    b'a Fish.Wide awake and focused after a midnight energy drink.Feeling magically calm after drinkin'
+    b'g Moonpetal Punch.Mind is eerily quiet and still from Moonpetal punch.Werewolf fury rising rapid'
+    b'ly due to the full moon.Feeling primal and wild.Asked career details.Intimidated by the details '
+    b'of a specific career.Terrified by the scent of Greg nearby.Feeling watched by something dangerou'
+    b's in Moonwood Mill.Paranoid that a werewolf is stalking them.Feeling neglected and lonely.Feelin'
+    b'g neglected and lonely.Feeling empty during the new moon.Feeling a growing energy from the waxin'
+    b'g crescent moon.First quarter moon dreams.Smelling a tantalizing aroma.Having wild, playful drea'
+    b'ms under the waxing moon.Angry interaction with Greg the werewolf.Angry interaction with Greg fr'
+    b'om asking for a gift.Having angry dreams due to moonbathing.Having wild, playful dreams under th'
+    b'e waning moon.Third quarter moon dreams.Feeling a waning but present energy from the moon.Aggres'
+    b'sive after eating raw meat.Mentally tormented by werewolf horrors.Running with supernatural spee'
+    b'd and energy.Sad about being a werewolf.Learning programming from a mentor.Learning how to be fu'
+    b'nny from a mentor.Learning rocket science from a mentor.Feeling trapped and restless.Upholding p'
+    b'ack values.Ashamed of letting the pack down.Feeling proud of the pack.Ashamed for letting down t'
+    b'heir werewolf pack.Overwhelmed by aggression due to Big Bad Wolf temperament.Wracked with guilt '
+    b'over transforming.Wracked with guilt over being a werewolf.Adrenaline pumping from survival inst'
+    b'incts.Kissed under a full moon.First kiss under the full moon.Hating the concept of work due to '
+    b'temperament.Scared by own strength.Upset about failing a test despite preparing.Feeling like the'
+    b' alpha.Sad about being demoted in the pack.Promoted in the pack.Scared of heights on the Ferris '
+    b'wheel.Embarrassed by something that happened on the Ferris wheel.Feeling daring on the Ferris wh'
+    b'eel.Feeling awkward after a Ferris wheel ride.Seeing the world from a new angle on a Ferris whee'
+    b'l.Bored while riding the Ferris wheel.Having a fun ride on the Ferris wheel.Scared of heights on'
+    b' the Ferris wheel.Terrified while riding the Ferris wheel with someone.Riding the Ferris wheel w'
+    b'ith a romantic interest.Embarrassed by an awkward moment with someone on the Ferris wheel.Riding'
+    b' the Ferris wheel with friends.Feeling sick on the Ferris wheel.Messing around on the Ferris whe'
+    b'el.Disappointed by a bad ride on the Ferris wheel.Dizzy from fooling around on the Ferris Wheel.'
+    b'Disappointed by a bad time on the Ferris wheel.Embarrassed after a romantic encounter on the Fer'
+    b'ris wheel went wrong.Feeling queasy and shaken after a ride.Spooked by the haunted house ride.Fe'
+    b'eling brave in the haunted house.Embarrassed by their reaction in the haunted house ride.Feeling'
+    b' foolish after the haunted house ride.Happy on a haunted house ride.Terrified inside the haunted'
+    b' house ride.Embarrassed after getting caught messing around in the haunted house.Scared while fo'
+    b'oling around in the haunted house ride.Vows are over.Feeling like a playful puppy dog.Got a frig'
+    b'ht while trying to be romantic in the haunted house ride.Terrified during an intimate moment in '
+    b'the haunted house ride.The Tunnel of Love ride was surprisingly thought-provoking.Awkward silenc'
+    b'e in the tunnel of love.Uncomfortable in the tunnel of love.Feeling romantic in the tunnel of lo'
+    b've.Unsettled by the tunnel of love ride.Riding the Tunnel of Love.Disappointed by a bad ride in '
+    b'the Tunnel of Love.Disappointed by a bad ride in the Tunnel of Love.Feeling the mysterious energ'
+    b'y of Lake Lunvik.Hyped up at the high school festival.Dreaming of professional sports stardom.Ba'
+    b'ttling in a high-stakes chess match at the festival.Feeling smart at the festival.Laughing at th'
+    b'e trashed photo backdrop.Caught doing something inappropriate behind the photo stand.Messing aro'
+    b'und in the Tunnel of Love.Feeling bold messing around.Paranoid about being watched.Embarrassed a'
+    b'fter a mishap in the Tunnel of Love.Morning jamz.Bored by listening to the school PA system anno'
+    b'uncements.Feeling like the laughingstock of the entire high school.Embarrassed after getting ton'
+    b'gue-tied in front of peers.Feeling like a math genius.Furious that their idea was stolen at high'
+    b' school.Itchy and hot in ill-fitting clothes.Building structures with food is surprisingly stimu'
+    b'lating.Feeling daring having woohoo.Fulfilled a romantic desire.Feeling satisfied fulfilling a w'
+    b'ant.Feeling satisfied and playful after fulfilling a want.Fulfilled a desire to be creative.Fulf'
+    b'illed a want that resulted in feeling focused.Energized after fulfilling a want.In a magical stu'
+    b'por from eating a Moonpetal flower.Prom nostalgia.On edge because a marked target is nearby.Asha'
+    b'med of their werewolf form and wanting to hide.Enjoying causing a little chaos as a werewolf.Fee'
+    b'ling guided by werewolf wisdom.Mentoring a younger werewolf is a fulfilling experience.Stopped s'
+    b'itting at wedding.Sore and stiff from cheerleading practice.In the zone while performing cheerle'
+    b'ading routines.Pumped up with school spirit and cheerleading energy.Excited to dig for treasure '
+    b'like a wolf.Intimidated by an aggressive werewolf.Smelling fresh meat.Maxed an exam.Scored high '
+    b'on an exam.Disappointed by a poor exam result.Devastated by failing the exam.Angry from the pain'
+    b' of growing new fangs.Angry due to a werewolf growth spurt.Suffering from moon madness.Feeling b'
+    b'ossy at home.Woohooed as a werewolf.Took a photo with a friend.Awkward and rejected after a phot'
+    b'o attempt.Feeling embarrassed after a failed romantic photo.Took cute romantic photos in a booth'
+    b".Embarrassed by a funny photo attempt that wasn't funny.Laughing at the funny photobooth strips."
+    b'Laughing at the mischievous photobooth strips.Angry about a failed photo booth prank.Devastated '
+    b'about being kicked out of the werewolf pack.Sad that sympathy was rejected.Humiliated after bein'
+    b'g disciplined by the pack leader.Feeling silly doing a T-pose.Heartbroken that the fated mate bo'
+    b'nd was rejected.Feeling respected as a leader.Aggressive posturing between werewolf pack leaders'
+    b'.Back aching from a cheap mattress.Knees sore from a hard mattress.Arm throbbing from a cursed b'
+    b'ite.Angry because they need real meat.Getting hyped up from watching TV or playing games.Feeling'
+    b' the urge to mark territory.Tasted surprisingly good meat.Angry about being dirty.Feeling secure'
+    b' marking territory.Feeling so clean.Feeling like an outcast that no one understands.Angry about '
+    b'being at the bottom of the pack hierarchy.Stomach growling with a craving for raw meat.Ravenous '
+    b'and on the verge of losing control.Angry from a sudden werewolf craving.Grumpy and needing to hi'
+    b'bernate.Hating being wet.Panicking because a meteorite is about to hit.Feeling triumphant after '
+    b'beating Greg in a fight.Angry because their "wolf brain" hurts.Hating the daytime.Hating the day'
+    b'time while sleeping.Hating being wet while wet.Angry due to loud noises hurting sensitive ears.B'
+    b'ecame WooHoo partners.Embarrassed after being rejected due to sexual orientation incompatibility'
+    b'.Overcoming the fear of tests by being over-prepared.Feeling awesome and energetic about being a'
+    b' werewolf.Appearing normal, but secretly participating in a PlantSim scenario.Smelling a vampire'
+    b' and getting angry.Humiliated by "dog water" insults.Feeling frisky due to werewolf temperament.'
+    b'Burning with embarrassment due to wounded pride.Feeling slighted and ego-bruised.Gained confront'
+    b'ation progress.Ready to explore the town in athletic gear.Feeling sharp in a party outfit.Resist'
+    b'ing the fury of the full moon.The moon is calling to the inner beast, sparking wild ideas.Feelin'
+    b'g refreshed after moonbathing.Terrified after summoning an urban legend in the mirror.Lunar glee'
+    b'.Lunar glee.Amused by the cosmic energy of the space rock.Feeling playfully wolfy near the space'
+    b' rock.Feeling strange radiation from the space rock.Moonbathing during a frisky moon phase.Moonb'
+    b'athing as a werewolf during a frisky moon phase.Had great fun woohooing in the photobooth.Feelin'
+    b'g reassured by the moon.Feeling strong under the moon.Lunar glee.Lunar glee.The moonbathing has '
+    b'cleared the mind.The moonbathing has cleared the mind (Werewolf).Joyful moon.Discussed fear of d'
+    b'eath.Guided by a werewolf.Embarrassed by a mistake made in front of a crush at a team event.Feel'
+    b'ing bold around a teammate crush.Posing normally for a photo booth picture.Stuck in a scenario t'
+    b'hat is causing constant embarrassment.Scenario forcing an angry mood.Feeling inexplicably sad du'
+    b'e to a scenario challenge.Stressed due to the current scenario challenge.Feeling agitated and mo'
+    b'ody.Exploring town.Feeling the urgent need to mark territory now.Feeling invincible as an apex w'
+    b'olf.Nervous after receiving a warning from the pack.Met new people in town.Smelling a tantalizin'
+    b'g aroma as a werewolf.Smelling something delicious and fun.A wolf among us.Overwhelmed by strong'
+    b' scents due to werewolf senses.The view from the howling spot is breathtaking and inspiring.Hurt'
+    b" by a friend's rejection.Sick and cramping from eating wolfsbane.Feeling hostile and distrustful"
+    b' of everyone.Successfully navigating pack politics requires creative diplomacy.Throat raw and sc'
+    b'ratching from howling.Throat sore from trying to howl.Devastated about being expelled from high '
+    b'school.Alien nostalgia.Rival arrived.Determined to stay awake all night for a challenge.Sufferin'
+    b'g from severe creative mental fog and burnout.Shenanigans at the splash pad.Wet at the splash pa'
+    b'd.Stomping around in the splash pad water.Stomping angrily.Shivering and wet from the splash pad'
+    b'.Freezing cold and soaked.Sad and wanting to try new food flavors.Pumped up after watching an ac'
+    b'tion movie.Gagging from the smell of a baby.Laughing at some of the baby name suggestions.Annoye'
+    b"d by a terrible baby name suggestion.Bored by an action movie they didn't enjoy.Watched a romanc"
+    b'e movie and enjoyed it.Still chuckling about the comedy movie.Attended a baby shower.Overwhelmed'
+    b' and stressed by social obligations.Annoyed by unwanted parenting advice at the baby shower.Emba'
+    b'rrassed by having watched a terrible comedy movie.Emotionally stirred by a dramatic movie.Bored '
+    b"and sad after watching a bad drama movie.Still chuckling about the kids' movie.Annoyed and distr"
+    b'acted by noisy kids.Adrenaline pumping after watching a horror movie.Bored by a horror movie the'
+    b"y didn't find scary.Bored and annoyed by the romance movie.Liked a romance movie.Feeling righteo"
+    b'us shushing someone.Feeling proud teaching a child to ride.Feeling big riding a bike.Discouraged'
+    b' about learning to ride a bike.Child frustrated that learning to ride a bike is hard.Embarrassed'
+    b' after being shushed in the movie theater.Sad after watching a movie.Happy about Talltastrophe m'
+    b'ovie.Neck sore and legs cramped from the theater.Reliving the sadness of a rejected proposal at '
+    b'this spot.Remembering being cheated on at this location.Angry remembering catching a cheater at '
+    b'this location.Traumatized by the memory of being struck by lightning here.Buzzing with cosmic en'
+    b'ergy after being abducted.Traumatized by returning to the site of an alien abduction.Reminiscing'
+    b' about the embarrassing spot where they first peed themselves.Remembering the fire that happened'
+    b' here with fear.Got married here.Feeling accomplished getting promoted.Unimpressed and slightly '
+    b"bored by a child's drawing.Cringing at old, terrible childhood drawings.Angry at a drawing that "
+    b"serves as a terrible reminder.Admiring child's imagination.Amazed by the imagination shown in a "
+    b"child's drawing.Amused by the creativity of the child's drawing.Feeling proud the baby is growin"
+    b'g.Looking at baby keepsake.Confused about why a specific baby keepsake was kept.Looking at marri'
+    b'age certificate.Nervous looking at the marriage certificate.Looking at a marriage certificate wh'
+    b"ile feeling marriage isn't the right path.Looking at a marriage certificate and regretting the m"
+    b"istake.Terrified about upcoming layoffs.Feeling proud of child's art.Feeling cool after doing tr"
+    b'icks on a bike.Feeling a creative fog beginning to set in.Completely exhausted and burned out.Wo'
+    b'bbling and nervous on the bike.Suffering from severe mental fog and burnout.Cleared mind of burn'
+    b'out.Feeling a mental fog beginning to set in.Frustrated by a total mental block.Feeling complete'
+    b'ly capable.Feeling self-belief.Feeling wise learning from mistakes.Feeling boosted confidence.Fe'
+    b'eling incapable and unconfident.Feeling ready to try.Hopeless about ever succeeding.Confidence c'
+    b'ompletely crushed, leading to shame.Feeling completely burned out and exhausted.Recovering from '
+    b'burnout and clearing the mind.Bonding with family stayover.Feeling proud of lineage.Feeling the '
+    b'deep bond of family connection.Meaning of family stayover.Meaning of family stayover.Grandparent'
+    b' love stayover.Devastated by being laid off from work.Angry about being laid off.Anxious about b'
+    b'eing unemployed.Feeling discouraged and lacking confidence.Angry about receiving unfair criticis'
+    b'm.Feeling encouraged and ready to tackle tasks.Feeling confident that belief works.Driven and fo'
+    b'cused thanks to support from others.Good company stayover.Feeling the awkward tension of a tempo'
+    b'rary houseguest situation.Nice seeing parents.Nice seeing grandparents.Nice seeing friends.Nice '
+    b'seeing family.Feeling stupid next to such a brilliant mind.Waking up feeling inferior to others.'
+    b'Wanting a temporary houseguest to leave immediately.Satisfied after completing a difficult puzzl'
+    b'e.Bored of working on this jigsaw puzzle.Frustrated that a puzzle piece is missing.Replaced fina'
+    b'l puzzle piece.Furious that the puzzle was smashed.Smashed a puzzle.Eating pizza out of pity for'
+    b' losing a job.Feeling optimistic about pizza.Imagining grand adventures in the treehouse.Guilty '
+    b'and anxious about sabotage.Satisfied saboteur.Won at dominoes.Sore loser after the dominoes game'
+    b'.Learning to crawl more efficiently.Just starting to figure out how to crawl.Feeling inspired by'
+    b' a friend.Epically inspired and energized by a mentor.Feeling epically inspired and focused by a'
+    b' close bond.Energized and happy from a llama berry drink.Shocked by an obstacle while crawling.F'
+    b"eeling the gloom of a houseguest.Feeling the gloom of a houseguest.Angry about a houseguest's ch"
+    b'ild behavior.Feeling hopeful about a new job.Getting emotional looking at baby keepsakes.Happy a'
+    b'bout baby keepsake.Feeling accomplished after reaching the top of a career.Proud of reaching the'
+    b' top level in an after-school activity.Freshly diapered.Grossed out by a messy diaper change.Gui'
+    b'lt-ridden about keeping a cheating secret.Feeling guilty about cheating on a partner.Rebuilt tru'
+    b'st.Feeling guilty remembering the cheating.Feeling resilient through ups and downs.Relationship '
+    b'is going smoothly.Happy about having many enemies.Upset about having many enemies.Happy about ha'
+    b'ving many friends.Feeling a massive rush of life after being revived.Feeling ready for adventure'
+    b'.Feeling professional.Feeling strong and resilient.Feeling like a failure for not achieving enou'
+    b'gh.Desperately trying to forget a major life embarrassment.Taking time to reflect after a major '
+    b'life moment.Disappointed by the boring walk.Enjoyed a refreshing walk with a group.Walked with m'
+    b'ember.Embarrassed by leading a lackluster walking tour.Walked with leader.Feeling like a trailbl'
+    b'azer.Bored on a solo walk.Solo walk.Solo walk.Feeling guilty about talking trash.Feeling bad abo'
+    b'ut trash-talking a friend.Feeling protective against bullies.Angry that a friend was mean to som'
+    b'eone else.Heartbroken that a loyal partner cheated.Mouth sore and gums throbbing.Proud and amuse'
+    b'd by the tooth fairy certificate.Child angry about a loose tooth issue.Hating Oldies music.Likes'
+    b" oldies music.Reminded of a partner's cheating.Embarrassed that an attempt to rebuild trust fail"
+    b'ed.Gave a second chance.Grateful for a second chance in love.Feeling awkward asking for a second'
+    b' chance in love.Regained trust.Feeling trusting after regaining trust.Walking on eggshells tryin'
+    b'g to rebuild trust.Catching the anger of a family member.Calming down family dynamic.Picking up '
+    b'on the fear of a family member.Catching the stress from family members.Catching second-hand emba'
+    b'rrassment from a family member.Absorbing the sadness of a family member.Freaked out by seeing a '
+    b'doppelganger.Having a great time with a houseguest.Grieving together.Itchy and grossed out by bu'
+    b'gs in the sleeping bag.Snug as a bug in sleeping bag.Back stiff and aching from the ground.Feeli'
+    b'ng the thrill of camping out on the floor.Spinning a yarn while tucked in a sleeping bag.Captiva'
+    b'ted by a story told in the dark.Terrified by a horror story told while in a sleeping bag.Laughin'
+    b'g after a pillow fight.Feeling triumphant over a pillow.Telling themselves "it\'s just a story" a'
+    b'fter a scary tale.Processing a recent moment of self-discovery.Shared a sweet treat.Scared of th'
+    b'e stranger.Happy being carried.Feeling wise giving advice.Feeling helpful giving advice.Feeling '
+    b'loving giving advice.Reflecting on sage advice regarding money.Reflecting on sage advice regardi'
+    b'ng responsibility.Reflecting on sage advice regarding hard work.Sad about being carried.Toddler '
+    b'angry about being carried.Happy waking up.Waking up sad.Toddler waking up on the wrong side of t'
+    b'he crib.Disgusted by food.Relieved after surviving a night in a haunted house.Proud of a recent '
+    b'victory at the village fair.Feeling deep boredom with life and craving excitement due to a midli'
+    b'fe crisis.Panicked about getting older.Surrounded by loyal friends.Bored by listening to unsolic'
+    b'ited "sage advice" from an elder.Disgusted by food.Feeling reliable keeping a promise.Restless a'
+    b'nd craving adventure.Frustrated by a lack of artistic creation.Feeling unfulfilled in relationsh'
+    b'ips.Feeling like a failure in career.Miserable due to being too cold.Miserable due to being too '
+    b'hot.Sad about not being the favorite.Being the favorite.Adventure resolution.Creative resolution'
+    b'.Successful resolution.Relationship resolution.Having good times.Grieving as a loyal friend/part'
+    b'ner.Bonded with dog.Feeling excited about the Tooth Fairy.Embarrassed by losing a tooth.Mouth bl'
+    b'eeding and sore from pulling a tooth.Distracted and annoyed by a loose tooth.Caught up in the in'
+    b'fectious joy of another.Open to receiving vibes from the current location.Recovering from the sh'
+    b'ock of witnessing a fire for the first time.Buzzing with residual energy after being struck by l'
+    b'ightning.Scared of the object that caused a fire previously.Feeling bold from nectar.Feeling ver'
+    b'y bold from nectar.Feeling extremely bold from nectar.Feeling a kick of energy from ranch nectar'
+    b'.Feeling a strong buzz from ranch nectar.Vibrating with energy from potent ranch nectar.Drank ne'
+    b'ctar and feels buzzing with romance (Level 1).Drank nectar and feels buzzing with romance (Level'
+    b' 2).Drank nectar and feels buzzing with romance (Level 3).Happy from ranch nectar.Happy from ran'
+    b'ch nectar.Happy from ranch nectar.Lightly buzzed and creative from drinking nectar.Nectar has lo'
+    b'osened inhibitions, allowing ideas to flow.Completely euphoric and artistically inspired by nect'
+    b'ar.Stressed hearing a crying baby.Furious at a crying baby.Feeling bonded to the occult.Angry ab'
+    b'out being accused of being a PlantSim.Angry about being accused of being an Alien.Angry about be'
+    b'ing accused of being Human.Sad that a family claim was rejected.Feeling principled.Angry after b'
+    b'eing called a mean name.Startled by someone making a scary face.Sugar rushing from eating candy.'
+    b'Jealous and annoyed by the new sibling.Excited and jumping around about a new sibling.Picked up.'
+    b'Angry about not being picked up.Loyal employee.Feeling trustworthy keeping a secret.Ashamed afte'
+    b'r being called out for disloyalty.Wiggling and dancing to music.Bouncing along to the beat.Infan'
+    b't screaming loudly due to being dirty.Infant screaming due to lack of attention.Infant screaming'
+    b' loudly due to lack of attention.Infuriated that a puzzle piece is missing.Scared of being so hi'
+    b'gh up on the horse.Terrific trot.Viewing the world from atop a horse offers a new perspective.Bo'
+    b'nding with steed.Feeling confident on a horse.Just horsing around and having fun.Feeling in rhyt'
+    b'hm riding.Feeling safe and supported by close family dynamics.Feeling awkward due to distance in'
+    b' the family dynamic.Feeling small and subordinate in the family dynamic.Angry interaction due to'
+    b' a difficult family dynamic.Feeling proud teaching a kid to ride.Bored by watching educational c'
+    b"hildren's TV as an adult.Scared by a horror movie on TV.Extremely terrified by a horror movie on"
+    b' TV.Feeling brave after a scary movie.Feeling very brave after a scary movie.Scared and sad watc'
+    b'hing TV.Hand full of splinters and stinging.Feeling frisky after time in the treehouse.Feeling g'
+    b'ood about a first career promotion.Stole a puzzle piece.Needs met.Cared for.Love shown.Loved.Fee'
+    b"ling neglected and needing help.Celebrating pride and joy.Feeling outshined by another infant's "
+    b'milestone.Feeling neglected and alone.Had a chatty call.Feeling loved by family.Having a hilario'
+    b'us phone call with a family member.Furious that the houseguest stay is a disaster.Fingers crampe'
+    b'd from weaving.Sad about not having a friendship bracelet.Joking around with family.Loving famil'
+    b'y dynamic.Permissive authority.Feeling suppressed by a strict family dynamic.Passing the torch.F'
+    b'eeling honored by family trust.Jealous of the nicer keepsake box.Feeling lucky and peaceful near'
+    b' the water.Uplifted by the sound of street music.Feeling anchored.Finding peace and inspiration '
+    b'in the dense forest.Delighted by the animal shapes of the bushes.Feeling alert and watching out '
+    b'for the Whiteclaw beast.Whaley happy.Angry about being bossed around in a permissive dynamic.Wat'
+    b'ching a sleeping bag prank unfold.Angry about a sleeping bag prank.Feeling the prank in the slee'
+    b'ping bag.Praised for creativity despite making a mess.Feeling mischievous and active after makin'
+    b"g a mess.Empathetically feeling a horse's anger.Feeling sad because a nearby horse is sad.Empath"
+    b'y for horse.Missing interaction with horses.Stressed about neglecting ranch duties.Happy doing r'
+    b'anch chores.Embarrassed by failing at basic ranch chores.Infant angry about being stuck.Infant a'
+    b"ngry because they can't reach something.Crying because they are physically stuck.Crying because "
+    b"they can't reach something.Nostalgic about riding a bike.Taught to ride by the best.Angry due to"
+    b' a midlife crisis.Feeling suddenly confident mid-life.Confused about life direction during a mid'
+    b'life crisis.Suddenly feeling compelled to get active during a crisis.Having a midlife crisis and'
+    b' craving romance.Experiencing a random bout of focus during a midlife crisis.Trying to reinvent '
+    b'the self with creative pursuits.Experiencing a midlife crisis depression.Feeling existentially s'
+    b'cared due to a midlife crisis.Laughing as a person is launched from a cannon.Ringing ears from a'
+    b' celebration cannon mishap.Feeling expert at riding.Taking care of business on horse.Enjoying a '
+    b'classic sitcom.Laughing at a sitcom with others.Feeling the squishy sensation of food or mud.Con'
+    b'necting with locals in a new environment.Ready to work hard on the ranch.Energized by learning a'
+    b'bout nectar making.Feeling ready to ride.Water baby playing.Ringing ears from a celebration cata'
+    b'strophe.Covered in confetti and loving it.Birthday gift call.Thighs chafing and bottom sore from'
+    b' riding.Getting ready to crawl somewhere new.Waking up on the floor after drinking too much ranc'
+    b'h nectar.Feeling frisky in the treehouse.Scratching at splinters in sensitive areas.Happy from r'
+    b'anch nectar.Happy from ranch nectar.Feeling glowing from nectar.Feeling a warm energetic glow fr'
+    b'om nectar.The afterglow of drinking fine nectar.The pleasant aftertaste of nectar is fueling tho'
+    b'ughts.Afterglow of ranch nectar.Feeling groggy and unsettled after nectar.Tasting the earthy not'
+    b'es of wild grass nectar.Savoring the refined taste of aged wild grass nectar.Feeling brave recei'
+    b'ving advice.Tasting garbage nectar (and trying not to gag).Crying.Heart foal of love.Delivered a'
+    b' foal.Spooked by the neigh of a ghost horse.Mourning the death of a horse.Mourning the death of '
+    b'a horse.Ears ringing from a loud goat scream.Watching a sheep do a funny trick.Feeling active af'
+    b'ter counting sheep.Disturbed and angry after a cave exploration event.Feeling brave surviving a '
+    b'cave.Disoriented after barely surviving a cave exploration.Hating Art Deco style.Annoyed by Cute'
+    b' decor.Disliking Industrial style.Hating Luxe decor.Annoyed by Vintage furniture.Likes art deco '
+    b'decor.Likes cute decor.Likes industrial decor.Likes luxe decor.Likes vintage decor.Likes shabby '
+    b"decor.Hating Shabby Chic style.Embarrassed because a goat didn't find the joke funny.Embarrassed"
+    b" because a sheep didn't find the joke funny.Talked to a goat.Talked to a sheep.Hugged a sheep.Hu"
+    b'gged a goat.Petted a sheep.Petted a goat.Being mean to a goat for fun.Being mean to a sheep for '
+    b'fun.Scaring a sheep for fun.Scaring a goat for fun.Joking with a goat.Joking with a sheep.Playin'
+    b'g with a goat.Playing with a sheep.Sad while talking to a goat.Sad while talking to a sheep.Sad '
+    b'while hugging a sheep.Sad while petting a sheep.Sad while playing with a sheep.Bruised and dizzy'
+    b' from a headbutt.Having a blast country dancing.Splashing in the bubbly bath water.Itchy and ann'
+    b'oyed after harvesting prairie grass.Harvested wild grass.Legs scratched and stinging from grass.'
+    b'Reining in the scenery.Walking funny and sore after a ride.Feeling like a star student.Feeling p'
+    b'erfected by practice.Awake and unhappy.Sad seeing a neglected horse taken away.Playing with a ho'
+    b'rse toy.Sad that the horse toy is broken.Happy in horse bed.Back aching from sleeping on straw.F'
+    b'eeling skilled from mentoring.Feeling strange but alive after being resurrected.Feeling fit trai'
+    b'ning horses.Feeling agile training horses.Feeling charismatic training horses.Feeling graceful t'
+    b'raining horses.Mourning the death of a goat.Mourning the death of a sheep.Feeling skilled at obs'
+    b'tacles.Embarrassed by failing a horse jumping course.Received best hug ever.Feeling a year older'
+    b' after a birthday celebration.Adjusting to life as a regular human after curing an occult state.'
+    b'Exhausted by dealing with infants.Motivated by watching skilled riders compete.Destructive toddl'
+    b'er at dollhouse.Feeling destructive.Sticky and tired from making nectar.Stomping grapes and maki'
+    b'ng a mess.Stomping fruit with high energy.Hating Ranch music.Likes ranch music.Memorabilia of de'
+    b'ad sim.Unsettled by standing near a horse grave.Feeling rich selling food.Feeling mischievous wh'
+    b'ile running the food stall.Satisfied street food customer.Sad that a goat is missing.Sad that a '
+    b'sheep is missing.Inspired by a famous natural landmark.Prepped meat.Prepped seafood.Prepped vege'
+    b'tables.Prepped dough.Prepped batter.Prepped cookie dough.Neighbor adopted a horse.Good nectar tr'
+    b'ait.Disgusted by the taste of bad nectar.Feeling chaotic sadness.Witnessed foal birth.Overjoyed '
+    b'by the cute new foal.Watched teen equestrians.Excited to ride after watching teen equestrians on'
+    b' TV.Feeling like a cowboy watching a western.Learning new things from the TV channel.Inspired by'
+    b' a partnership with a champion horse.Motivated by a champion horse partner.Regional greeting.Bet'
+    b'rayed that a friend was sold.Angry that someone sold their horse friend.Bruised and winded after'
+    b' being thrown.Humiliated after being bucked off a horse.Analyzing the curious toppings on a pizz'
+    b'a.Ate a piece of bread that was a work of art.Sad while petting a toddler.Hating riding horses.A'
+    b'nnoyed by making nectar.Likes equestrian skill.Likes nectar making.Feeling secure on a rearing h'
+    b'orse.Scared when the horse unexpectedly reared up.Ate heart-shaped waffles.Pleasant waffle.Angry'
+    b' about a bad waffle.Angry and in pain from a horse bite.Bitter about being bitten by a horse.Sol'
+    b"d Ambrosia.Horse ally.Overwhelmed by a horse's constant needs.Helping a horse in need.Feeling co"
+    b'nnected to the powerful energy of a horse.Gossiping at the stables.Vibed with a chill horse.Feel'
+    b'ing skilled at hopscotch.Frustrated by failing at hopscotch.Embarrassed by tripping while playin'
+    b'g hopscotch.Feeling brave.Feeling soothed by nectar.Feeling disconnected from their roots.Nearby'
+    b' relation is a child of the sea.Feeling slick selling poor food.Fangtastic deal.Feeling helpful '
+    b'fixing fangs.Snickering about selling vampire garlic.Connected roots.Feeling awkward and adrift '
+    b'when away from the ocean.Feeling free after releasing a fish back to the sea.Coughing and wheezi'
+    b'ng from mold spores.Brain fogged by toxic mold spores.Violently ill and struggling to breathe du'
+    b'e to mold.Sick and confused from inhaling mold spores.Induced into a rage by mold spores.Mold fr'
+    b'ee.Prepped meat substitute.Panicking every time the phone rings, fearing eviction.Shaken by a ne'
+    b'arby explosion.Feeling clean energy from street food veggies.Laughing about selling trash.Feelin'
+    b'g cool selling food.Selling curious pizza requires focus.Hating R&B music.Likes R&B music.Feelin'
+    b'g brave selling meat.Embarrassed and caught in the act.Snickering about a discovered secret.Ener'
+    b'gized to compete for the community.Feeling community spirit.Covered in slimy, gross algae.Adrena'
+    b'line rush from finding blackmail material.Feeling powerful with blackmail.Feeling secretive.Caug'
+    b'ht snooping and feeling mortified.Prepped batter manually.Prepped dough manually.Eager to eat th'
+    b'e food simmering in the pressure cooker.Stressed and sad about a pressure cooker disaster.Smelli'
+    b'ng of sewage and feeling nauseous.Heart melted and spirit lifted by cute pets.Frustrated by the '
+    b'power outage.Prepped lactose free batter.Itchy and paranoid about bugs.Choking on chemical fumes'
+    b'.Sweating and feeling faint from heat.Shivering and turning blue from cold.Anxious after destroy'
+    b'ing a cursed object.Energized by saving money on rent/utilities.Feeling tough negotiating.Amused'
+    b' by attempting a bold move as a tenant/landlord.Feeling proactive and good about the charity dri'
+    b've.Terrified of the spreading mold infestation.Happy at the sanctuary.Feeling playful in the ani'
+    b'mal sanctuary.Feeling ashamed while in a sanctuary.Feeling benevolent after donating to a cause.'
+    b'Adrenaline and anger from a sanctuary heist.The echo of the cave is whispering ideas.Damp, cold,'
+    b' and scared in a cave.Excited about using a coupon.Coughing and sickly from mold exposure.Feelin'
+    b'g helpful selling a cure.Happy at the temple.Energized by the scent of a lotus flower.Likes braz'
+    b'ilian music.Likes batuu music.Annoyed by Brazilian music.Hating Batuu radio music.Successfully s'
+    b'tayed after eviction.Feeling secure avoiding eviction.Traumatized by being evicted.Adrenaline pu'
+    b"mping while trying not to be suspicious.Laughing at a neighbor's meme reference.Cringing at a ne"
+    b'ighbor\'s outdated memes.Bored and embarrassed by a neighbor\'s "cringy" behavior.Performing a cri'
+    b"ngy dance.Enjoying a cringy dance performance.Cringing at a neighbor's terrible dance moves.Extr"
+    b"emely bored and uncomfortable with a neighbor's immature behavior.Worried that they themselves a"
+    b're being "cringe."Embracing the cringe.Energized by the act of giving to a neighbor.Spreading th'
+    b'e love.Feeling heard.Received kind words.Full of empathy.Feeling judged and uncomfortable around'
+    b" a neighbor.Feeling awkward about a neighbor's generosity.Heard hot gossip.Bored because they ha"
+    b"ven't heard any good gossip lately.Knowing everyone loves a little gossip.Passing it down.Feelin"
+    b'g prepared for life.Bored and annoyed by someone trying to be profound.Bored by a story that see'
+    b'med to have no point.Received life-changing advice from a wise neighbor.Learned a valuable lesso'
+    b"n from a wise neighbor.Bored because they didn't ask for this advice.Reminiscing on the old days"
+    b'.Reminiscing about past romances.Melancholy about the passage of time.Holding onto a past grudge'
+    b".Embarrassed by a foolish mistake that a wise person shouldn't make.Sipping on magical unicorn t"
+    b'ea.Drinking cocoa.Enjoying a fun cup of cocoa.Found a marble.Soaked and humiliated by a toilet p'
+    b'rank.Sold soup.Temporarily doing a cringy dance.Providing reliable support.Angry at shoddy prope'
+    b'rty management support.Stressed taking the fall for something.Feeling smug and amused about gett'
+    b'ing away with something.Upset about dealing with bad tenants.Angry at annoying freeloading tenan'
+    b'ts.Angry that the contract was breached.Feeling sneaky knowing secrets.Embarrassed after snoopin'
+    b'g revealed nothing but foolishness.Feeling confident and funny.Feeling masterful at marbles.Sad '
+    b'about hurting a thumb playing marbles.Feeling festive near Menorah.Feeling festive near Kinara.C'
+    b'ollected another marble.Sad about losing marbles in a game.Irritated by a nosy neighbor.Intimida'
+    b"ted by a wise neighbor's warning.Feeling enlightened and alert from wise advice.Going crazy from"
+    b' the repetitive noise.Nauseated by a persistent bad smell.Soothing smell from spirit house.Legs '
+    b'feeling the burn from using a squat toilet.Legs shaking from holding a squat.Feeling brave weari'
+    b'ng Rainborz.Protected from negative vibes by an Alabaster crystal.Crystal energy is clearing the'
+    b' mind of old desires.Feeling quality wearing Amazonite.Focused by the power of a Quartz gemstone'
+    b'.Focused by the power of an Emerald.Crystal energy is causing vivid, inspiring dreams.Energized '
+    b'by the wealth-attracting power of Citrine.Willpower weakened by the aura of a Crandestine gem.We'
+    b'aring a diamond that strengthens relationship bonds.Empowered by a fire opal for a successful da'
+    b'te.Feeling immortal wearing Hematite.Energized to find more crystals thanks to Jade.Focused by t'
+    b'he power of Jet.Soothed from tension by a Jonquilyst crystal.Focused by the power of Moonstone.F'
+    b'ocused by the power of Nitelite.Crystal energy is boosting the creative aura.Family bond from Pe'
+    b'ach Quartz.Motives increasing from Plumbite.Feeling resilient wearing Rose.Embarrassed by bad wo'
+    b'ohoo.Sapphire is boosting mental skills.Fertility from Shinolite.Ambitious and energized for wor'
+    b'k by Simanite.Feeling skilled wearing Turquoise.Panicking that the landlord is coming to evict t'
+    b'hem.Disappointed by the taste of microwaved water.Learning gemology from a mentor.Hating cutting'
+    b' gems.Likes gemology.Feeling powerful in a mob.Unique beverage.Colorful meal.Fueled up by a hear'
+    b'ty seafood meal.Mourning the death of a horse.Mourning the death of a horse.Shivering from an ic'
+    b'e-cold bath.Furious about a cold shower due to the water heater.Adrenaline pumping after adoptin'
+    b"g a tiger.Adopted a tiger.Disappointed they can't adopt a tiger.Adopted a special tiger.Patted a"
+    b' tiger.Thinking about the possibilities of a rental property.Researching how to repair something'
+    b'.Feeling competent pleasing a tenant.Ashamed of a poorly done repair job.Upset by a customer com'
+    b'plaint.Waking up from a dream filled with crystal power.Feeling easy-going.Energized by breaking'
+    b' the rules.Startled by the lights flickering.Annoyed by flickering lights.Feeling relieved after'
+    b' a close call.Honest handyperson.Hand throbbing from a tool injury.Feeling guilty and embarrasse'
+    b'd for being dishonest in their trade.Utilizing professional handyman training.Frustrated by a bo'
+    b'tched handyman job.Feeling masterful at handiness.Shaking off the adrenaline from a near-acciden'
+    b't at work.Furious about the repo man taking items.Fascinated by spying on local wildlife.Freezin'
+    b'g in a bath that lost its heat.Furious about a cold shower due to the water heater.Furious about'
+    b' being evicted.Tense being near a fertility crystal while hating kids.Feeling stealthy and activ'
+    b'e like a cat.Stressed about complaining to the landlord.Complimented rental conditions.Blaming t'
+    b'enants for issues.Commended tenants.Criticizing neighbors.Inciting a revolt among tenants.Praise'
+    b'd having great neighbors.Planning a charity event for the community.Tenant angry at the landlord'
+    b".Feeling inquisitive about rentals.Frustrated by the landlord's negative response.Clear skies fr"
+    b'om Amber.Laughing at bad puns.Groaning and cringing at terrible puns.Targeted happiness from Plu'
+    b'mbite.Rage induced by eating moldy food.Frustrated by a water leak attempt.Feeling nosey giving '
+    b'advice.Annoyed and embarrassed by unwanted advice from a nosy neighbor.Received positive advice.'
+    b'Passed on wisdom to someone else.Reflecting on an important lesson.Good neighbor.Mentoring.Drink'
+    b"ing unsweetened builder's tea.The sugar in the builder's tea is providing a rush.Absorbing energ"
+    b'y.Generous gift.Gift of giving to family.Bored and annoyed by sorting through junk mail.Refreshe'
+    b'd and splashing at a pool party.Eating at potluck.Bored by the chore of sorting mail as a child.'
+    b'Angry about missing when stomping a bug.Visibly angry due to property management issues.Worried '
+    b'about a sick pet.Sneaked a peek at a journal and felt a thrill.Twin flames.Happy new dynamic.Fee'
+    b'ling strong together.Furious asking "Why today?".Tense being reminded of past pain.Feeling bette'
+    b'r off alone.Furious that an ex-partner looks happy.Revitalized by the cool air conditioning.Swea'
+    b'ting because the AC is broken.Spying on the neighborhood with a telescope.Frustrated and eyes st'
+    b'raining from work.Drinking chamomile tea.Exhausted from gemology work.Feeling transformed by cos'
+    b'tume.Longing for romance but too shy to act.Uncomfortable with unwanted romantic attention.Feeli'
+    b'ng self-respect.In a state of bliss from being in love.Optimistic about finding true love.Heartb'
+    b'roken over unrequited love.Tired from crafting jewelry.Blushing during a conversation with someo'
+    b'ne attractive.Happy conversation.Feeling compersion.Woke up after cuddling all night.Putting up '
+    b'emotional walls out of fear.Flinching at physical touch due to intimacy fear.Feeling brave being'
+    b' vulnerable.Excited about wearing a costume.Wearing a costume that makes them feel playful and f'
+    b'lirty.Actively working on improving a romantic dynamic.Miserable in a very unsatisfying relation'
+    b'ship.Miserable in an unsatisfying relationship.Satisfied relationship.Very satisfied relationshi'
+    b'p.Feeling like a burden to others.Satisfied with the relationship.Miserable in a mutually dissat'
+    b'isfied relationship.Stressed by the complicated relationship status.Desperately seeking solace f'
+    b'rom loneliness.Feeling lonely and isolated.Found someone attractive.Comforted by partner.Worried'
+    b" and sad about a partner's wellbeing.Having a bad feeling about this relationship.The relationsh"
+    b'ip dynamic is heating up.Being silly together with a romantic partner.Feeling that love is the u'
+    b'ltimate inspiration.Angry due to a volatile romantic dynamic.Daydreaming about their partner con'
+    b'stantly.Mourning a lost love.Missing the passion of a past relationship.In a passionate rebound '
+    b'relationship.Feeling empowered ending toxicity.Distraught over a recent breakup.Stressed about t'
+    b'he impending breakup.Peace of mind.Embarrassed after a clumsy kiss behind a bookshelf.Feeling da'
+    b'ring kissing in secret.Learned flirty trivia.Happy about trivia.Annoyed by the trivia game resul'
+    b't.Feeling empowered by a ring.Under the influence of a magical ring.WooHoo on romantic blanket.S'
+    b'eeing relationships from a fresh, analytical angle.Love is in the air.Cynical about love as a ro'
+    b'mance consultant.Eye for love.Embarrassed by a failed attempt to match a couple.Feeling like lov'
+    b'e is dead.Happy couple.Drained from listening to relationship problems.Buzzing with the exciteme'
+    b'nt of romance consulting.Drained from empathizing with sadness.Feeling professional as a therapi'
+    b'st.Embarrassed by giving bad romantic advice.Wonderful sight.Still feeling uneasy despite reassu'
+    b'rances.Trying to convince self that everything is fine.Feeling frisky near the heart bed.Back ac'
+    b'hing from a vibrating bed.Nervous about using the heart bed.Sharing the sunset.Embarrassed after'
+    b' a romantic gesture failed.That felt good.Filled with regret over jealous actions.On a roll and '
+    b'practicing a skill intently.Hoping a fountain grants a romantic wish.Wished for happiness at fou'
+    b'ntain.Feeling selfless wishing for others.Laughing wickedly at a mean wish.Attached a lock to th'
+    b'e love wall.Contemplating why a symbol of love was erased.Changing love declarations on the wall'
+    b'.Practice has led to a zen-like focus and clarity.At a venue designated for romance.Projecting a'
+    b'n aura of flirtiness.Mindfully practicing to achieve perfection.Figured out a shortcut to succes'
+    b's through practice.Sad about being a ring bearer bear.Bored by the repetition of practicing a sk'
+    b'ill.Discouraged by a lack of practice.Created something perfect and focusing on maintaining that'
+    b' standard.Has perfected a technique and is zoning in.Mortified because their date left early.Sad'
+    b' about being a sad bear.Watching a romantic sunset.Cuddling on a blanket in a romantic spot.Feel'
+    b'ing romantic on a date.Feeling romantic walking.Slept cuddled up.Listening to romantic radio.Com'
+    b'pletely in the zone due to skill mastery.Radiating pure creative energy due to mastery.Creative '
+    b"aura.Overwhelmed by a vampire's mastery aura.Feeling powerful performing.Watching a powerful per"
+    b'former.Embarrassed because their date left due to meanness.Second wind.Emitting an aura of menta'
+    b'l sharpness.Radiating active energy from a mastery perk.Mental aura.Active aura.Sugar coursing t'
+    b'hrough veins after making candy.Giggling while making candy.Built up partner.Dreaming of sugarpl'
+    b'ums and sweet treats.Feeling sick from eating too much candy.Ate a candy that makes kisses sweet'
+    b'er.Feeling sweet and confident.Concentrating on making candy.Sweet serenity from candy.Enraged w'
+    b'hile making candy.Stomach distended and painful from sugar.Feeling principled rejecting money.Am'
+    b"used by a weird date.Starting a challenge of wild dates.Rushing over to a partner's house for in"
+    b'timacy.Amused by a meeting with an eccentric wealthy person.Creeped out by an anonymous secret a'
+    b'dmirer call.Flattered by a call from a secret admirer.Received a cute I love you message.Making '
+    b'up after a fight with chocolates.Anxious and sad about a relationship talk.Completed 1 out of 7 '
+    b'wild dates.Completed 2 out of 7 wild dates.Completed 3 out of 7 wild dates.Completed 4 out of 7 '
+    b'wild dates.Completed 5 out of 7 wild dates.Exhausted from too many wild dates.Angry that a wealt'
+    b'hy date was a no-show.Business productivity boosted by alien energy.Completely drained from over'
+    b'exertion.Bored due to a lack of mental stimulation.Adrenaline spiking from fear.Flight response '
+    b'triggered by terror.Chuckling about faking a bill payment.Adoring mastery.Feeling admired for ma'
+    b'stery.Inspired by someone who has mastered their craft.Expressing love through food.Feeling succ'
+    b'essful at business rank 5.Feeling successful at business rank 1.Feeling successful at business r'
+    b'ank 2.Feeling successful at business rank 3.Feeling successful at business rank 4.Learning video'
+    b' game strategies from a mentor.Finding stability and inspiration in personal values.Feeling char'
+    b'ismatic from mentoring.Sad about breaking a pottery creation.Learning mischief from a mentor.Lea'
+    b'rning drink recipes from a professional mixologist.Learning the secrets of fine dining preparati'
+    b'on.Mastering comfort food recipes from a mentor.Learning gardening tips from a mentor.Customers '
+    b'were moved by the story behind the business.Bored by a failed attempt to be inspired by a busine'
+    b'ss story.Inspired by business story.Embarrassed because their business story failed to inspire a'
+    b'nyone.Learning debate tactics from a mentor.Recovering from a disastrous date.Disappointed by a '
+    b'mediocre date.Recovering and reflecting after a date.Feeling fine and reflecting on how the date'
+    b' went.Bouncing back with energy after a date.Pumped after an amazing date.Realizing the relation'
+    b'ship is in trouble.Embarrassed because the relationship counselor thinks they are crazy.Nauseous'
+    b' and dizzy from teleporting.Winning at therapy.Angry saying "I said I\'m OK" in counseling.Focuse'
+    b'd on the goal of attraction in counseling.Working on improving the relationship.Feeling hopeful '
+    b'about dates.Excited to spice up a relationship with something new.Discouraged that relationship '
+    b"counseling isn't working.Angry believing therapy is a scam.In therapy.Sad about the state of the"
+    b'ir relationship therapy.Learning floral composition and arrangement.Vocal cords warmed up and re'
+    b'ady after a singing lesson.Shocked and hurt by a breakup over the phone.Feeling guilty about bre'
+    b'aking up via text.Feeling relieved avoiding conflict.Making alien candy requires weird focus.Lea'
+    b'rning the science and art of baking.Bored because a "scary" event wasn\'t thrilling enough.Gettin'
+    b'g a rush from being scared.Getting a massive adrenaline rush from being terrified.Feeling valida'
+    b'ted after a date.Wholesome thoughts about partner.Partner is being unpredictable and exciting.On'
+    b' edge because the partner is unpredictable.Angry thoughts about a strained relationship.Happy de'
+    b'spite strain.Hating the idea of tattoos.Likes tattooing.Exhilarated after a closet hookup.Consum'
+    b'ed by sorrow from a broken heart.Consumed by misery from a broken heart.Consumed by total despai'
+    b'r from a broken heart.Consumed by heartache from a broken heart.Embarrassed because a selfie fai'
+    b'led to send or looked bad.Feeling purposeful sharing.Finding closure has opened new doors for th'
+    b'e future.Admiring a sim.Embers of a burning soul.Optimistic about the spiritual path lying ahead'
+    b".Making headway on soul's journey.Feeling purposeful finding journey.Loves romance TV due to per"
+    b'sonality.No regrets.Quite a journey.Dreams fulfilled.Newfound purpose.Seeing the big picture.Rei'
+    b'ncarnated as an infant.Reincarnated as a toddler.Enjoying the innocence of being a child again.B'
+    b'ursting with new life energy as a reincarnated teen.Reincarnated as a young adult.Carrying vague'
+    b' memories of a past life as an adult.Bored with this life stage after being reincarnated.Reincar'
+    b'nated as a werewolf.Reincarnated as a spellcaster.Reincarnated as a vampire.Feeling surprisingly'
+    b' calm despite being around death.The scent of birchwood is sharpening the mind.The scent of pine'
+    b' is refreshing the mind.Smelling lilac scent which induces romance.Uplifted by the scent of elde'
+    b'rflower.Feeling the fun vibes of a campfire.Existing as a temporary ghost in the River Styx.Self'
+    b' soothing.Accepting death with a focused, macabre perspective.Disgusted by the bright sunshine.F'
+    b'inding humor in the macabre.Feeling very goth.Feeling strangely lively while working as a mortic'
+    b'ian.Feeling sharp during the witching hour.Bored because someone ruined the spooky vibe.Finding '
+    b'energy and beauty in gloomy, rainy weather.Contemplating the cycle of life and death.Excited by '
+    b'a ghost sighting.Giggling in the face of the Grim Reaper.Shared gloom.Infected by a supernatural'
+    b' gloom.Feeling a dark sense of amusement at a death.Smirked at death.Yelling in anger after witn'
+    b'essing death.Sickened by seeing a death.Witnessed a death but feeling strangely neutral about it'
+    b'.Shaken after witnessing a death.Confused and angry after witnessing death.Thrilled to find trea'
+    b'sures on hallowed ground.In pain from singed hands.Terrified because something invisible grabbed'
+    b' them.Feeling the spectral energy of hallowed ground.Somber from working as a funeral director.F'
+    b'eeling a creepy, cold chill in the air.Feeling watched and uneasy.Feeling angry while on hallowe'
+    b'd ground.Happy on hallowed ground.Scared by the eerie atmosphere of hallowed ground.Confused aft'
+    b'er blacking out.Disoriented by the fog.Feeling the darkness calling out to them.Received an exce'
+    b'llent tattoo.Received a normal tattoo.Furious about a poorly done tattoo.Regretting a bad tattoo'
+    b'.Embarrassed by a poorly executed new tattoo.Feeling persuasive with customers.Embarrassed faili'
+    b"ng to sway a customer's opinion.Persuaded and dazed by a convincing sales pitch.Frustrated that "
+    b'a customer persuasion attempt failed.Soul-weary and physically dragging.Spiritually exhausted fr'
+    b'om the River Styx.Stamina refilled by death frog.Living turned to ghost.Felt good setting a crea'
+    b'ture free into the wild.Adrenaline rushing while getting a tattoo.Nervous about the pain of gett'
+    b'ing a tattoo.Skin stinging and raw from a tattoo.Frustrated by clay getting everywhere.Feeling p'
+    b'rofessional tattooing.Admiring a fresh tattoo design.Admiring a new tattoo with a grin.Checking '
+    b"out someone's new tattoo.Embarrassed while checking out a tattoo.Angry during tattoo checkout.Sa"
+    b'd while checking out.Feeling proud showing off tattoo.Embarrassed while showing off a bad tattoo'
+    b'.Sad that no one likes their new tattoo.Angry showing off a tattoo.Showing off a tattoo dedicate'
+    b'd to a lover.Embarrassed showing a bad tattoo to a lover.Sad showing off a tattoo to a lover.Sad'
+    b' showing off a tattoo to a family member.Showed off tattoo to family.Embarrassed showing a bad t'
+    b'attoo to friends or family.Angry showing off a tattoo to a disliked person.Jealous showing off a'
+    b" tattoo.Jealous of someone else's tattoo.Intriguingly morbid thoughts about the science of death"
+    b'.Writing an obituary with grace and creativity.Smelling of formaldehyde and death.On a roll with'
+    b' mental tasks.On a roll with physical tasks.On a roll with social tasks.Discouraged by a lack of'
+    b' mental practice.Discouraged by a lack of social practice.Discouraged by a lack of physical prac'
+    b'tice.Perfected a mental task and feeling focused.Perfected a physical task and feeling focused.P'
+    b'erfected a social task and feeling focused.Depressed about sharing food.Adoring heirlooms.Furiou'
+    b's about family heirlooms.Feeling honored by heirloom.Having second thoughts about the heirloom.T'
+    b'hinking of them fondly.Angry about family heirlooms.Emotional seeing family heirlooms.Excited by'
+    b' rediscovering family heirlooms.Helped someone process grief and feels purposeful.Periodic happi'
+    b'ness during grief.Waking up angry due to grief.Experiencing periodic anger due to grief.Angry at'
+    b' the living for being alive.Angry meeting a ghost.Waking up with a heavy heart from grief.Hit by'
+    b' a sudden wave of grief.Grieving when meeting a living person.Feeling heavy, numb, and empty.Wak'
+    b'ing up feeling normal, momentarily forgetting a recent loss.Feeling numb and detached, manifesti'
+    b'ng as boredom during grief.Feeling unsettled and confused by grief.Refusing to accept that the p'
+    b'erson is a ghost.Feeling strong grieving.Holding it together while sad.Feeling resilient grievin'
+    b'g.Feeling helped by counseling.Angry that grief counseling failed.Conquered grief.Moving past gr'
+    b'ief has sparked a new zest for life.Sad after conquering grief.Feeling coping well.Channeling gr'
+    b'ief into productive energy.Finding healthy, creative ways to cope with loss.Coping positively.Ad'
+    b'miring the intelligence of a pet crow.Embarrassed after being provoked by a pet crow.Playing wit'
+    b'h a pet crow.Pet crow gave a gift.Ominously warned by a pet crow.Receiving a gift from a crow.Sc'
+    b'ared and pecked by a ghost bird.Feeling connected to a crow.Sensing old hatred from the crow.Fee'
+    b'ling a kinship with the crows.The crow is inspiring poetic or gothic thoughts.Feeling dark and c'
+    b'ool.Feeling part of a collective.Neighbors becoming friends.Neighbors becoming best friends.Sad '
+    b"about a neighbor's reputation.Neighbors starting romance.Neighbors restarting romance.Sad about "
+    b"a neighbor's breakup.Dying of a broken heart.Likes pottery.Hating working with clay.Amused by th"
+    b'e sound of crows.Starstruck and giggly meeting Grim.Connecting with the spirit world and ghosts.'
+    b'Feeling proud whispering to ghosts.Starstruck and nervous meeting Edith.Impressed by the grandeu'
+    b'r of a crypt.Energized by meeting a cool ghost.Conquered grief socially.Feeling fake and emotion'
+    b'ally drained.Feeling unethical about business practices.Bitter about being betrayed by a busines'
+    b's partner.Resentful about the contents of a will.Jealous about the inheritance in the will.Achie'
+    b'ved catharsis.Frustrated that the specter catharsis failed.Resenting the mentor.Questioning real'
+    b'ity after seeing something impossible.Feeling superior skepticism.Having an identity crisis.Emba'
+    b'rrassed by a nagging doubt that they might be wrong.Thinking the other person is a weirdo.Suspic'
+    b'ious that this is too much of a coincidence.Feeling unimpressed by tricks.Probably just the Auro'
+    b"ra Borealis.Feeling rational explaining sounds.Close mentor bond.Hurt by a mentor's actions.Deve"
+    b'loping a crush on a mentor.Life is good despite being chased by death.Panicked that life is too '
+    b'short.Terrified that the end is near.Adrenaline high from escaping death and learning from it.De'
+    b'veloping a crush on a mentee.Motivated mentee.Stressed about time running out.Feeling improved b'
+    b'y surviving.Woken up by a loud ghostly bang.Marked by a spirit and feeling a supernatural surge.'
+    b'Jumped out of skin at a loud noise.Jump-scared by a loud ghostly bang.Said hello with a ghostly '
+    b'bang.Feeling smug about a ghost prank.Nervous because the lights are flickering.Heard some juicy'
+    b' gossip that sparked an idea.Energized by a chaotic presence.Knowing a secret about Layne.Feelin'
+    b'g the scratch.Bored and disappointed by a failure at the Well of Souls.Feeling spiritually drain'
+    b'ed and empty.Needs fully replenished and supercharged by the Well of Souls.Feeling slightly reju'
+    b'venated by the Well of Souls.Heard ghostly music echoing in a crypt.Feeling glad to be alive aft'
+    b'er exploring a crypt.Existentially terrified by seeing the past and future in a crypt.Respite fo'
+    b'r the departed.Regretting a scary decision made while exploring a crypt.Coughing and dazed from '
+    b'exploring a dusty crypt.Feeling righteous exploring crypts.Startled by a noise while exploring a'
+    b' crypt.Coughing and dazed from getting dusted in a crypt.New best friend in crypt.Rejected by a '
+    b'spirit in the crypt.Feeling dusty and brave.Itchy and painful bite mark.Running out of the crypt'
+    b' with adrenaline pumping.Stiff and cold after sleeping in a crypt.Relaxed nap in crypt.Waking up'
+    b' from a crypt nap with unearthly energy.Horrified by a ghost story told in a crypt.Laughing afte'
+    b'r scaring someone with a ghost story.Thrilled by a ghost story told in a crypt.Literally bored t'
+    b'o death by a terrible ghost story.Happy WooHoo in crypt.Fantastic WooHoo in crypt.Feeling weird '
+    b'and embarrassed after being intimate in a crypt.Angry about an issue during crypt woohoo.Feeling'
+    b' like a ghost for a while.Feeling professional with a slablet.Analyzing a soul for professional '
+    b'purposes.Embarrassed by a mistake while analyzing a soul.Ink went into the skin perfectly during'
+    b' a tattoo session.Ashamed of giving someone a terrible tattoo.Back aching from bending over.Poor'
+    b" tattoo removal.Surprisingly revitalized by Thanatology soup.The strange tree looks like it's fr"
+    b'om a fairytale.Feeling a spiritual awakening after ghost woohoo.Had ghostly woohoo.Ghost is down'
+    b' with romantic interaction.Ghost feels the romance is right.Giggling about disappearing during i'
+    b"ntimacy.Knowing they've still got it, even as a ghost.Feeling strange and embarrassed after ghos"
+    b't woohoo.Committed until death.Committed to be together forever.Shocked and embarrassed by witne'
+    b'ssing ghost intimacy.Shocked by the idea of ghost woohoo.Mind-boggled by intimacy with a ghost.W'
+    b'ants the romance others are having.Feeling proficient speaking to dead.Embarrassed after a faile'
+    b'd attempt to speak with the dead.Grossed out by a cadaver mishap.Feeling practiced at mortuary s'
+    b'cience.Contemplating death.Existentially confused about the nature of death.Enjoying geeky reinc'
+    b'arnated vibes.Ghost angry about reincarnation issues.Enjoying the spectral fun of a ghost event.'
+    b'Sketched a solid tattoo design.Created a beautiful tattoo flash design.Designed a legendary piec'
+    b'e of body art.Moodlet booster recipe.Comfort food.Ate aphrodisiac food.Feeling easy-going and en'
+    b'ergetic from a family recipe.Feeling like an academic ace after a family meal.Home remedy.Preven'
+    b'ting exhaustion with a hearty meal.Feeling healed by food.Raging over family recipes.Chasing dre'
+    b'ams with focus after a special meal.Comforted and inspired by a traditional family recipe.Comfor'
+    b'ted and inspired by a traditional family recipe.Comforted and inspired by a traditional family r'
+    b'ecipe.Comforted and inspired by a traditional family recipe.Comforted and inspired by a traditio'
+    b'nal family recipe.Comforted and inspired by a traditional family recipe.Feeling spry and fightin'
+    b'g off old age exhaustion with food.Feeling light and active after a specific meal.Feeling powerf'
+    b'ul in a crypt.Confused by the crypt puzzle.Souls reconnected.Embarrassed to admit they might hav'
+    b'e been mistaken about moving on.Connected by fate.Embarrassed because an attempt to reconnect fa'
+    b'iled.Soulmate reunited.Angry about a failed soulmate connection.Family reunited.Handing it down.'
+    b'Received knowledge from beyond the grave.Sad that memories of the deceased are fading.Focused on'
+    b' the afterlife journey.Recalling memories from a past life.Helping a ghost resolve their past is'
+    b'sues.Feeling alive at a festival.Energized to attend the festival as a ghost.Let out frustration'
+    b's at AA.Lending an ear to the troubles of the dead.Reading a will and getting angry.Happy about '
+    b'will.Bored by the legal jargon involved in reading a will.Embarrassed by the contents of a will.'
+    b"Feeling flirty while reading a will.Writing a will has clarified life's priorities.Writing a wil"
+    b'l with a sense of humor.Emotional while reading a will.Stressed reading the will.Angry due to th'
+    b'e waxing crescent moon.Very angry due to the full moon.Feeling the playful aura of Edith Basu du'
+    b'ring the first quarter moon.Angry due to the new moon.Angry due to the waxing gibbous moon.Angry'
+    b' due to the waning gibbous moon.Feeling the playful aura of Edith Basu during the third quarter '
+    b'moon.Angry due to the waning crescent moon.Happy at Tree Spree.Celebrating nature with joy.Feeli'
+    b'ng romantic at the nature festival.The festival tree is glowing with inspiring energy.Focused on'
+    b' the Tree Spree festival activities.Terrified by the presence of Edith.Bonfire dance.Dancing aro'
+    b'und a bonfire under the moon.Feeling mystical moonbathing.Moonbathing.Bathing in the moonlight f'
+    b'or spiritual recharge.Feeling positive ghostly vibes on Family Day.Scared of a negative specter '
+    b"at the festival.Attending Family Day.Admiring someone's impeccable style.Embarrassed because an "
+    b'NPC refused to serve them.Feeling triumphant slaying.Embarrassed after a conversation turned sou'
+    b'r.Crystal clear canal.Disgusted by the polluted stream.Scared that there is something dangerous '
+    b'in the water.Feeling unwelcome in the cemetery.Vampiric energy boosted by the cemetery atmospher'
+    b'e.Excellent family tattoo.Excellent friend tattoo.Got a tattoo marking them as a great lover.Exc'
+    b'ellent pet tattoo.Normal family tattoo.Normal friend tattoo.Got a tattoo marking them as a norma'
+    b'l lover.Normal pet tattoo.Embarrassed by a bad family tattoo.Embarrassed by a bad friendship tat'
+    b'too.Embarrassed by a bad pet portrait tattoo.Embarrassed by a bad romantic tattoo.Ectoplasm flic'
+    b'kering and weak.Fading away and feeling vulnerable.Ghostly stamina fully maxed out.Bitter that t'
+    b'he mentee has surpassed the master.Discussing tattoo art concepts.Learning how to wield a tattoo'
+    b' gun.Feeling clearer now that an annoyance is gone.Delighted by spooky gift.Freaked out by recei'
+    b'ving a spooky gift.Tarot: Sleep.Tarot: Lady.Happy tarot outcome.Feeling confident from tarot.Ner'
+    b'vous about the tarot card reading.Tarot cards predicted a new romance.Unimpressed and bored by a'
+    b' tarot reading outcome.Feeling balanced from tarot.Angry about a tarot card reading outcome.Anal'
+    b'yzing the outcome of a tarot reading.Unsettled by a gloomy fortune.Disturbed by a negative tarot'
+    b' card reading.The tarot cards revealed a creative path.Radiating a dark, angry ghostly aura.Affe'
+    b"cted by a ghost's sad aura.A ghost projecting an aura of embarrassment.Feeling the anger of a da"
+    b"rk ghostly aura.Overwhelmed by an embarrassed aura projected by a ghost.Affected by a ghost's sa"
+    b'd aura.Feeling a heavy, suffocating dread.Feeling a disturbance in the afterlife.Feeling a distr'
+    b'essing aura from a dark ghost.Terrified by the distressing aura of a nearby ghost.Terrified by a'
+    b' dark, ghostly presence.Oppressed by a dark, heavy energy.Eager to know what the cards hold for '
+    b'the future.Depressed by the daily reality of death at work.Embarrassed by a mistake at the mortu'
+    b'ary.Feeling confident as a mortician.Feeling safe from death.Stressed about a safety failure at '
+    b'work.Gained insight into the workings of death itself.Scared after failing to understand the con'
+    b'cept of death.Pondering the secrets of the soul.Pondering the ultimate meaning of existence.Exis'
+    b"tential dread and confusion.Saw behind the curtain of death's mechanics.Frustrated failing to fi"
+    b'x the scythe.Feeling victorious in a challenge.Annoyed at losing the challenge.Feeling disgusted'
+    b' and violated.Good Grim WooHoo.Had a surprisingly good time woohooing the Grim Reaper.Bored by w'
+    b'atching a TV channel that is just static.Staring at static on the TV, hoping to see ghosts.Terri'
+    b'fied because a ghost is coming out of the TV.Mesmerized and amused by static on the TV.Suffering'
+    b' from a nightmare induced by a ghost enemy.Sad about giving a family member a nightmare.Gave a n'
+    b'ightmare.Waking up scared from a ghost-induced nightmare.Sad about giving someone a nightmare.An'
+    b'noyed seeing a disliked Sim showing off tattoos.Sad about removing a tattoo from a family member'
+    b'.Sad about removing a tattoo from a lover.Sad while checking out with a bad relationship.Sad whi'
+    b'le checking out due to grief.Happy remembrance of tattoo.Ghost levitating a Sim in anger.Dizzy f'
+    b'rom being levitated by a ghost.Comforted by a playful specter.Messed around in crypt.Embarrassed'
+    b' after fooling around in a crypt.Dazed after having hunger energy absorbed by a ghost.Dazed afte'
+    b'r having energy absorbed by a ghost.Dazed after having social energy absorbed by a ghost.Dazed a'
+    b'fter having fun energy absorbed by a ghost.Absorbing energy from other ghosts.Feeling energized '
+    b'after absorbing fun from a ghost.Absorbed ghost hunger.Absorbed ghost social.Drained and confuse'
+    b'd after a ghost siphoned bladder needs.Drained and confused after a ghost siphoned hygiene needs'
+    b'.Drained and confused after a ghost siphoned energy.Drained and confused after a ghost siphoned '
+    b'hunger needs.Drained and confused after a ghost siphoned social needs.Drained and confused after'
+    b' a ghost siphoned fun needs.Feeling guilty about draining life spirit.Unsettled by looking at a '
+    b'scary painting.Feeling responsible writing a will.Feeling proud as a ghost.At peace with life.Sa'
+    b'd about decaying life from a family member.Ghost nap.Feeling gross and damp after a nap.Feeling '
+    b'cramped and squished.Paralyzed by a horrifying presence.Horrified after mocking a ghost.Sad that'
+    b' a loved one died in their sleep.Unsettled by sleeping in a haunted bed.Warm embrace.Warm embrac'
+    b'e from family.Touched by funeral.Loved at funeral.Feeling awkward at the funeral.Mortified by so'
+    b'mething said at a funeral.Comforted at funeral.Angry that someone is gone at a funeral.Unsettled'
+    b' by the funeral service.Cathartic funeral.Waking up spooked and wired in a haunted bed.Sinking d'
+    b'eeper into sadness at a funeral.Feeling critical of their own funeral.Remembering only the good '
+    b'things at a funeral.Angry asking "What are they doing here?" at a funeral.What they would have w'
+    b'anted.Feeling their presence.Deeply missing the departed at the funeral.Missing the departed at '
+    b"the funeral.Comforted by ritual.Feeling the departed wouldn't approve.Moved by a beautiful funer"
+    b'al service.A fitting tribute.Feeling assured by a ghost.Feeling assured as a ghost.Feeling focus'
+    b"ed due to a friendly ghost's aura.Projecting a focusing aura as a ghost.Feeling a benevolent gho"
+    b"st's inspiring aura.Radiating positive energy to the living as a ghost.Feeling flirty due to a g"
+    b"host's aura.Ghost projecting a flirty aura.Feeling the playful aura of a positive presence.Feeli"
+    b'ng the playful aura of a positive presence.Feeling the positive, energizing aura of a ghost.Radi'
+    b'ating positive energy to the living.Happy aura from presence.Happy aura.Gave a good dream to fam'
+    b'ily/friend.Ghost giving a good dream to a spouse.Gave a good dream.Gave life.Energized by the ac'
+    b"t of giving life essence.Feeling generous and energetic after restoring someone's needs.Gave mot"
+    b"ive.Boosting someone's fun motive playfully.Annoyed that ghosts flickered lights while paying bi"
+    b'lls.Feeling spooky flickering lights.Terrified by witnessing a sinister possession.Terrified whi'
+    b'le being possessed.Feeling dirty and violated after possessing.Embarrassed after being scared ou'
+    b't of their wits by a ghost.Impressive possession.Music to my ears.Spooked by a musical instrumen'
+    b't playing itself.Confused why the instrument is playing itself.Confused and disjointed trying to'
+    b' possess.Shaking after hearing a haunting shriek.Rattled and unnerved by a scream.Scared and dis'
+    b"gusted by a ghost's shriek and bad breath.Upset after using a haunting shriek.Ears ringing from "
+    b'a ghostly shriek.Freaked out seeing objects levitating.Dizzy and rejected by a spell.Successful '
+    b'plea to Reaper.Analyzing a rejected plea for life.Had a productive chat with the Grim Reaper.Ner'
+    b'vous discussing death with the Grim Reaper.Discussing death requires focus.Successfully managing'
+    b' lost souls.Sad about souls lost to the netherworld.Feeling incompetent and stressed.Feeling eff'
+    b'icient and active in the Reaper career.Saved a life.Terrified by being cursed by a powerful ghos'
+    b't.Feeling authoritative reaping.Good fortune.Cursed enemy.Good fortune for family/friend.Feeling'
+    b' smart beating Death at chess.Terrified after being defeated by Death.Successfully mocking Edith'
+    b'.Devastated catching the fianc\xc3\xa9 cheating.Jealous that their fianc\xc3\xa9 is flirting.Died peacefully'
+    b' in sleep.Feeling brave helping a friend.Refusing to go near a ghost out of fear.Feeling defiant'
+    b" walking by Edith.Removed material.Pursuing dreams even after death.Admiring a lover's tattoo.Fa"
+    b'mily tattoo bonding.Friend tattoo bonding.Feeling bonded by family tattoo.Feeling bonded by frie'
+    b'nd tattoo.Feeling bonded by lover tattoo.Feeling unapologetic.Feeling guilty that an apology did'
+    b"n't mean anything.Enjoying casting shade on others.Feeling insulted.Seeing things from a morally"
+    b' grey but creative angle.Feeling slick recruiting.Feeling smart cutting corners.Feeling proud of'
+    b' shady success.Irritated by shady practices.Feeling smart listening to lecture.Totally engaged a'
+    b'nd energized by an excellent lecture.Attended a stimulating lecture (Excellent quality).Absorbin'
+    b'g information perfectly from a hobby lecture.The lecture was riveting and full of information.Fi'
+    b'nding the lecture excellently funny.Feeling satisfied listening to lecture.Interested and energi'
+    b'zed by a good lecture.Attended a stimulating lecture (Good quality).Absorbing information well f'
+    b'rom a hobby lecture.Learned a lot from the class.Finding the lecture good and funny.Feeling okay'
+    b' listening to lecture.Awake enough to listen to an okay lecture.Attended a stimulating lecture ('
+    b'Okay quality).Absorbing some information from a hobby lecture.Picked up a few interesting points'
+    b' in class.Finding the lecture okay and funny.Bored while listening to a lecture in a hobby class'
+    b'.Never lost.Finding inspiration in spooky memories.Feeling part of the class.Feeling the collect'
+    b'ive energy of the class.Flirting with classmates.Participating in a hobby class.Surrounded by fe'
+    b'llow students eager to learn.Having fun as a class member.Feeling athletic with bronze reward.Pu'
+    b'mped about winning a bronze athletic award.Feeling elite with gold reward.Ecstatic and hyper abo'
+    b'ut winning a gold athletic award.Feeling strong with silver reward.Excited about winning a silve'
+    b'r athletic award.Winning a bronze athletic award requires focus.Winning a gold athletic award re'
+    b'quires focus.Winning a silver athletic award requires focus.Feeling accomplished after a creativ'
+    b'e class.Feeling accomplished after a creative class.Feeling accomplished after a creative class.'
+    b'Feeling accomplished after a culinary class.Feeling accomplished after a culinary class.Feeling '
+    b'accomplished after a culinary class.Winning a bronze mental award requires focus.Winning a gold '
+    b'mental award requires focus.Winning a silver mental award requires focus.Feeling accomplished af'
+    b'ter a music class.Feeling accomplished after a music class.Feeling accomplished after a music cl'
+    b'ass.Feeling social with bronze reward.Earning a bronze reward for being funny.Received a bronze '
+    b'social reward for flirting in class.Feeling popular with gold reward.Earning a gold reward for b'
+    b'eing funny.Received a gold social reward for flirting in class.Feeling friendly with silver rewa'
+    b'rd.Earning a silver reward for being funny.Received a silver social reward for flirting in class'
+    b'.Bronze instructor reward.Silver instructor reward.Gold instructor reward.Feeling cool knowing D'
+    b'eath.Unimpressed and bored despite having a brush with death.Feeling aligned with dreams.Feeling'
+    b' unsettled and wrong.A business scheme worked out perfectly.Feeling paranoid and anxious.Happy s'
+    b'tudying thanatology.Energized by studying the science of death.Bored by studying the science of '
+    b'death.Morbidly sad from studying death.Embarrassed after offending a shady character.Shady perso'
+    b'n offended and angry.Confused by a shady interaction.Motivated by hobby class.Feeling motivated '
+    b'by a class friend.Motivated to do better by a friend in hobby class.Motivated by a friend from h'
+    b'obby class.Motivated by a friend in a hobby class.Motivated by a funny friend in class.Sick and '
+    b"trembling from fake nectar.Feeling organized scheduling reaping.Stressed about the Grim Reaper's"
+    b' schedule.Reaper supplies high.Amused by the medical supplies.Embarrassed that reaping supplies '
+    b'are low.Playing with fire.Accepting unavoidable heartbreak.Feeling at peace knowing a loved one '
+    b'is in a better place.Reaping boosts low.Feeling a mid-level power boost from reaping souls.Feeli'
+    b'ng boosted reaping.Feeling confident knowing someone.Happy reconnection.Burning with love for so'
+    b'meone.Lasting love.Feeling a strange sense of having been here before.Casket was plush.Creeped o'
+    b'ut by the casket sale.Embracing a dark, gothic aesthetic.Moppy Goat Statue daytime.Creeped out b'
+    b'y the goat statue at night.Dancing the Gavotte non-macabre style.Met Reaper target.Upset about f'
+    b'ailing the reaping task.Unnerved by the static noise on the TV.Happy to see new ghost.Happy new '
+    b'ghost.A new ghost mourning their own death.Finding humor in the afterlife.Memories returning.Fee'
+    b'ling impressed by a cool sim.Horrified and embarrassed asking "I did what?"Family from another l'
+    b'ifetime.Struggling to remember a deceased loved one.Memories to cherish.Feeling suave after movi'
+    b'ng on from a relationship.Confessions of rebirth.Reincarnated nice.Anxious about opening Pandora'
+    b"'s Box.Dismissive and bored by someone's attempt to explain the afterlife.Reincarnated considera"
+    b"te.Feeling assertive.Getting on Grim's good side.Life goes on.Terrified of being on the chopping"
+    b' block.Reflecting on a life well-lived.Angry about using town hall amenities.Making people laugh'
+    b' while possessing an object.Admiring the craftsmanship of a gemstone statue.The face in the clif'
+    b'f is sparking rumors and stories.Bell tower.Woke up to an alarm feeling ready and focused.Waking'
+    b' up grumpy from the alarm.Cleansed haunted house.Spiritually knocked back after failing to clean'
+    b'se a haunted house.Bored because the haunted house exploration was uneventful.Scared while explo'
+    b'ring a haunted house shell.Exploring a haunted house and finding it fun.Met new friend at hobby '
+    b'class.Reaper writer.Grossed out by kissing a frog.Frog success.Sensing imminent danger.Feeling c'
+    b'omfortable with the concept of mortality.Finished unfinished business.Suspicious and on edge.Ide'
+    b'ntifying with the Reaper.Levitated a sim.Dancing around a bonfire under a full moon.Moonbathe fu'
+    b'll moon.Full moon energy is at its peak.Moonbathe nude.Survived a close call and feeling vividly'
+    b' alive.Bitter about working for a thankless boss.Bitter about a thankless employer.Motivated by '
+    b'praise for the small business.Focused on maintaining the small business reputation.Feeling prais'
+    b'ed for business.Produced material.Produced material from enemy.Motivated to get attention by a f'
+    b'un recipe.Motivated to use the toilet by a fun recipe.Motivated to sleep by a fun recipe.Motivat'
+    b'ed to have fun by a fun recipe.Motivated to eat by a fun recipe.Motivated to bathe by a fun reci'
+    b'pe.Embarrassed by a romantic rejection near the Well of Souls.Well of Souls granted a large wish'
+    b' for love.Well of Souls granted a small wish for love.Hustling hard to overcome a shady reputati'
+    b'on.Dealing with the consequences of a shady reputation.Scheming to improve a shady business repu'
+    b'tation.Honest reputation.Feeling honest reputation.Known as a pillar of honesty in business.Guil'
+    b"ty and wondering if it's your fault.Service first reputation.Conflicted about unethical business"
+    b' choices.Internal satisfaction.Sad about being hacked.Furious about being reported for business '
+    b'practices.Conflicted about business values.Sad about an ultimatum.Conflicted about shady busines'
+    b's choices.Internal satisfaction.Disoriented and scared after reincarnating as an alien.Reincarna'
+    b'ted as a mermaid.A new sim reaction.Reincarnated reaction.Sims are made reaction.Completely fade'
+    b'd and barely existing.Drawing power and focus from a past life.Employee praised.Uncomfortable be'
+    b'ing overpraised.Hurt by criticism from a boss.Angry that an employee quit.Employee praised again'
+    b'.Soulful fishing.It is harvest season for souls.Recognizing a soul connection from a past life.H'
+    b"appy from author's will.Reading a flirty note in a will.Angry while writing their will.Moved by "
+    b"the words in a loved one's will.Bored by the process of writing their own will.Reading a will th"
+    b'at causes second-hand embarrassment.Reading a funny will.Writing a will with a heavy heart.Stres'
+    b'sed writing the will.Scared by the fissure to the Netherworld.Terrified by the energy coming fro'
+    b'm the Netherworld fissure.Feeling a supernatural lethargy and boredom near a Netherworld fissure'
+    b'.Energy leaking from the Netherworld is stimulating the mind.Feeling torn apart by spiritual for'
+    b'ces.Burning soul.Feeling pro at death.Service first.Service first.The Reaper seems pleased with '
+    b'the work performed.Came for the funeral food.Learning to throw clay on the wheel.King Trashmouth'
+    b'.Lil Bandit.Paranoid and looking for death.Feeling successful tipping.Disappointed about not get'
+    b'ting a tip.Acting like a silly ghost.Choo Choo.Inspired by the ornate history of the region.Moti'
+    b"vated listener.Mentoring a junior reaper.Motivated speaker.Proud of the business's standing in t"
+    b'he town.Sad while walking by.Happy about SimoCoin.Angry about SimoCoin fluctuations.Learning log'
+    b"ic from a mentor.The moon is drawing out the spirits.Obsessed with telling the world's funniest "
+    b'joke.Living on the edge is exhilarating.Living in fear knowing Death is chasing them.Angry due t'
+    b"o Edith Basu's presence.Very angry due to Edith Basu's presence.Feeling the playful aura of Edit"
+    b'h Basu.Until next time.Awkward and sad showing off a tattoo.Feeling awkward after a lover showed'
+    b' off a bad tattoo.Touched up tattoo.Successful mentor.Feeling ready after mentorship.Disappointe'
+    b'd that a mentorship ended poorly.Disappointed in the mentorship failure.Angry that mentorship fa'
+    b'iled.Feeling like a failed mentor.Reborn as a teen and full of zest.Reborn as a child and feelin'
+    b'g playful.Reborn toddler.Feeling judged by a parent regarding tattoos.Parent angry seeing a new '
+    b'tattoo.Skin is red, hot, and throbbing.Skin is swollen, oozing, and painful.Skin is maddeningly '
+    b'itchy.Free drink.Keeping things balanced while engaging in shady activities.Making a difference.'
+    b'Making progress.Met a personal hero and feeling starstruck.Unimpressed by thanks.Business backer'
+    b".Frustrated that their vision was rejected.Feeling guilty that reality didn't meet their ideals."
+    b'Idealists assemble.Act of kindness.Feeling optimistic about future.Leaking magical fairy anger.F'
+    b'eeling bored due to overflowing fairy magic energy.Feeling magical spillover.Magic spilling over'
+    b' and causing embarrassment.Magic spilling over and causing hyperactivity.Overwhelmed by fairy ma'
+    b'gic causing flirtiness.Magic spillover is causing intense focus.Spillover happiness.Excess fairy'
+    b' magic is causing sparkles of creativity.Feeling magical fairy mischief spilling over.Overwhelme'
+    b'd by fairy magic sadness.Scared by overwhelming fairy magic.Feeling chaotic magical energy spill'
+    b'ing over.Sore and tired from sleeping on the ground.Relaxed sleeping on ground.Cup of roasted co'
+    b'ffee.Shaken after confronting a burglar.Pleased after pulling a fast one on someone.Irritated an'
+    b'd drained by social interaction.Making progress with friend.Making progress with partner.Scared '
+    b'witless by the thought of being burgled.Silence is underrated.Suspicious and annoyed by niceness'
+    b'.Excited about hearing juicy gossip.Regretting a grumpy impulse.Bored and grumpy because they di'
+    b"dn't find a joke funny.Feeling completely empty and void of emotions.Frustrated by righteous ang"
+    b'er.Paranoid that people know the business secrets.Experiencing a wave of emotional emptiness.Fee'
+    b'ling persuasive asking customers.Frustrated that a customer request failed.Stressed having to se'
+    b"nd a customer away.Glee from ruining someone else's day.Projecting a grouchy aura to those nearb"
+    b'y.Projecting a crotchety, elder grouch aura.Devastated that items were stolen.Burglar returned g'
+    b'oods.Police won against burglar.Sad that the police lost the burglar.Humiliated because a burgla'
+    b'r got away.Feeling lucky escaping burglar.Panicked seeing a burglar.Enjoying cookies.Feeling pro'
+    b"ud dreamer.Ashamed that business dreams aren't matching reality.Cringing after saying the wrong "
+    b'thing to a customer.Feeling proud schemer.Ashamed that a business scheme failed.Snickering about'
+    b' selling fake art.Angry about counterfeit art issues.Mortified after being wrongly accused of bu'
+    b'rglary.Kind of party like.Feeling mysterious drinking tea.Feeling unlucky.Frustrated by a skill '
+    b'fluctuation.Feeling lonely and isolated.Feeling dirty and greasy.Bored out of mind.Luck suck.Ang'
+    b'ry due to an illness.Gnome magnet.Overwhelmed by a sudden, sickly impulse to create.Laughing at '
+    b'how gullible people are.Itching to cause some chaos.Anxious and unable to focus due to nerves.Fe'
+    b'eling rebellious.Sad because luck was drained from them.A burning, energetic need to create some'
+    b'thing right now.Full of emotions.Struggling with fairy emotions.Emotional stability.Feeling a gr'
+    b'and sense of destiny.Feeling magical aura.In my element.Hearing a call from another realm.Happy '
+    b'fairy ability.Using fairy magic to boost imagination.Feeling capable fairy.Powered up by using a'
+    b' fairy ability.Using a fairy ability to be flirty.Using a playful fairy ability.Using a fairy ab'
+    b'ility requires concentration.Sad due to a fairy ability.Angry due to a fairy ability.Embarrassed'
+    b' by a backfired fairy ability.Stressed struggling to control fairy abilities.Frightened by a fai'
+    b'ry ability.Bored by the mundane usage of their fairy abilities.Feeling like a perfect vessel for'
+    b" nature's energy.Feeling mischievous about being a poisonous plant.Feeling superior plant.Contem"
+    b'plating plant existence as a PlantSim.Positive luck ability.Cursed with bad luck.Emotional boost'
+    b'.Afflicted with gnome madness.Impatient waiting for the cooldown to end.Dragging and exhausted.S'
+    b'tomach growling loudly.Desperate to pee.Near a mood bush emitting anger.Feeling the sad vibes fr'
+    b'om a mood bush.Affected by the embarrassing aura of a mood bush.Feeling bored due to the aura of'
+    b' a nearby plant.Feeling uneasy near the mood bush.Happy mood aura.The aura of a magical bush is '
+    b'uplifting.Standing near a focus-inducing mood bush (Level 1).Feeling the funny aura of a magical'
+    b' bush.Feeling confident near mood bush.Feeling the subtle energy from a mood bush.Sore and bruis'
+    b'ed from a bad massage.Sensing a magical overload coming.Feeling uneasy near a spooky mood bush.N'
+    b'ear a mood bush emitting anger.Overwhelmed with boredom from the aura of a powerful plant.Feelin'
+    b'g very confident near mood bush.Overwhelmed by the embarrassing aura of a mood bush.Vibrating wi'
+    b'th energy from a powerful mood bush.Standing near a focus-inducing mood bush (Level 2).Feeling t'
+    b'he funny aura of a magical bush.Feeling the happy aura of a magical bush.The aura of a magical b'
+    b'ush is uplifting.Feeling the sad vibes from a mood bush.Feeling scared near a very spooky mood b'
+    b"ush.Very stressed by the mood bush's aura.Energized after siphoning magic/emotion.Near a magical"
+    b' bush radiating romantic energy (Level 1).Near a magical bush radiating romantic energy (Level 2'
+    b').Majesty aura.Feeling unlucky and dazed by an Aura Blossom.Good luck aura.Feeling unlucky and d'
+    b'azed by an Aura Blossom.Good luck aura.Majesty aura.Scared of the vengeful aura coming from a bl'
+    b'ossom.Feeling a burning, vengeful itch.Embarrassed by the effects of a vengeful aura blossom.Mar'
+    b'king territory on a fairy journey.Feeling replenished.Feeling empty and cold inside.Starving for'
+    b" emotional connection.Feeling shielded by nature's power.The right approach.Frustrated with a di"
+    b'fficult patient.High on herbal remedies and plant energy.Feeling helpful advocating health.Feeli'
+    b'ng caring for patients.Frustrated with a non-believing patient.Sad about believing in nature.Sad'
+    b' about letting a patient down.Exhausted by the naturopathic trials.Feeling wise advising.Nature '
+    b'companion.Feeling pure and revitalized by plants.Bottled happiness.Vision is enhanced by an elix'
+    b'ir.Bursting with magic after completing a fairy journey.Dealing with playful pixie mischief.Cons'
+    b'umed by bottled-up sadness.Drank a bottle of pure anger.Feeling artificial embarrassment from a '
+    b'bottle.Overwhelmed by drinking bottled emotions.Consumed by fear after drinking bottled emotions'
+    b'.Feeling artificially bored after drinking a bottle of "Boredom".Drank a bottle of pure inspirat'
+    b'ion.Feeling bottled confidence.Drank bottled energy and feeling the effects.Consumed a bottled e'
+    b'motion of focus.Drunk on bottled playfulness.Drank a bottle of pure flirty emotion.Freaked out b'
+    b'y creepy crawlies while foraging.Grossed out by a stink bug.Itchy and annoyed by sand fleas.Fing'
+    b'ers numb and clumsy.Found pocket change.Found rare ingredients in the wild.Exfoliated hands.Rela'
+    b'xed by plants.Relaxed by plants.Unable to stop laughing due to fairy magic.Insecure and embarras'
+    b'sed, wondering if they are even funny.Soothed a beast.Siphoning energy from vampires.Feeling str'
+    b'ong connections to nature.Feeling very sad.Energized by helping the Green Man garden.Cringing at'
+    b' the Neighborhood Lead Story.Tasty.Feeling amazed and active from a whimsical experience.Having '
+    b'fun and feeling energetic.Confused by the Neighborhood Lead Story.Bathed in inspiring natural li'
+    b'ght.Feeling out of place and awkward.Feeling incredible and refreshed after the best bath ever.F'
+    b'eeling proud.Feeling relieved that a stressful situation has passed.Disappointed by the Neighbor'
+    b'hood Lead Story.Feeling indifferent and bored with the current situation.Amazing journey.Excited'
+    b' about finding gorgeous collectibles.Unimpressed and bored by the state of the garden plants.Sha'
+    b'dy shenanigans.Adrenaline dumping after a close call.Engrossed in a specific step of a fairy que'
+    b'st.Wrapped up in a compelling local legend.Embarrassed by a public display of magic.The bathroom'
+    b' decor is magically whimsical.Splendid snooping.Worried about seeing something forbidden.Donated'
+    b' books.Feeling blessed by gnome.Humiliated after being outsmarted by a gnome.Terrified of the cu'
+    b'rsed Great Gnome.Ailment reduced.Unable to process a flood of overwhelming emotions.The natural '
+    b'springs are rejuvenating the spirit.Feeling deeply emotional and romantic.Feeling empowered.Feel'
+    b'ing lucky on quest.Energized after dusting and cleaning up.Waiting for the next stage of the Rea'
+    b"per's Rewards quest (Quest 3).Waiting for the next stage of the Reaper's Rewards quest (Quest 5)"
+    b".Waiting for the next stage of the Reaper's Rewards quest (Quest 7).Surrounded by enchanted hear"
+    b'ts after fairy intimacy.Hearing whispers of magic after fairy intimacy.Feeling a forbidden twili'
+    b'ght connection after fairy intimacy.Bathed in moonlight romance after fairy intimacy.Feeling spe'
+    b'llbound harmony after fairy intimacy.Feeling blossoming love after fairy intimacy.Feeling amorou'
+    b's waves after fairy intimacy.Gnome quest.A mortal experiencing a journey into the realm of fairi'
+    b'es.Standing near a public sculpture is inspiring.Happy NPC.Caught the vibe from an inspired loca'
+    b"l.Waiting for the next stage of the Reaper's Rewards quest (Quest 1).Covered in sticky, gross go"
+    b'op.Feeling liquid luck.Embarrassed by passing noxious gas.Momentary happiness.Mortal journey com'
+    b'plete.Likes nature sounds.Annoyed by nature sounds.Magical overload causing rage.Magical overloa'
+    b'd causing major rage.Magical overload causing critical rage.Slightly overloaded with hysterical '
+    b'fairy magic.Majorly overloaded with hysterical fairy magic.Critically overloaded with hysterical'
+    b' fairy magic.Feeling minor mortification from magical overload.Feeling major mortification from '
+    b'magical overload.Critically mortified by magical overload.Feeling plant-like.Optimized energy le'
+    b'vels from perfect sleep habits.Regenerating magical energy while sleeping in a fairy home.The ho'
+    b'me feels spiritually cleansed and light.Dancing the night away in a fairy home.Emotional appetit'
+    b'e.Feeling successful shaking home.Embarrassed after shaking a fairy home and getting no result.D'
+    b'ancing the night away in a fairy home.Reading a book inside a fairy home.Learning apothecary ski'
+    b"lls from a mentor.Hating making potions.Feeling skilled trading.Big fan of nature's best bud.Lik"
+    b'es apothecary.Sensing tension from the locals.Feeling confident.Feeling generic embarrassment ca'
+    b'used by an NPC.Ashamed of letting a houseplant die.Paranoid about magic being used around them.M'
+    b'ystical connection.Bonding through soul-bound silliness.Safe and sound.Grateful to the person wh'
+    b'o healed an ailment.Furious at a fairy enemy.Suspicious of the fey creature.Motivated by the Gre'
+    b'en Man to keep going.Feeling best self.Feeling focused to impress the Green Man.Enchanted by a f'
+    b"airy's presence.Feeling lucky and lighthearted.Disappointed and unlucky.Sad that the Green Man d"
+    b"idn't help.Curious green man.Loves flower press.Balanced aura.Feeling unbalanced and magically s"
+    b'ick.Feeling big brain crafting.Choking on strong chemical fumes.Gagging from the smell of an out'
+    b'house.Happy to help crafting.Thirsty and dry.Parched and throat scratching.Shiny and clean.Soake'
+    b'd in dirty water.Focused on a woodworking project.Good not great ailment.Feeling brand new.Feeli'
+    b'ng insightful.Having an intricate discussion about fairy magic.Feeling comedic gold.Head poundin'
+    b'g and sinuses throbbing.Sweating and shivering from fever.Burning up and delirious.Feeling drain'
+    b'ed after being siphoned by a fairy.Smelling the stench while trying to be romantic.Completely Wo'
+    b'oHooed in outhouse.Feeling trashy and embarrassed after intimacy in an outhouse.Ghost involved i'
+    b'n fairy woohoo.Alien involved in fairy woohoo.Good collectible luck.Disappointed by finding bad '
+    b'collectibles.Disappointed by finding bad forage.Good foraging luck.Embarrassed by creating a low'
+    b'-quality item.Feeling quality crafting.Panicked by a kitchen fire caused by bad luck.Disappointe'
+    b'd by bad gnomes.Found some money and feeling lucky.Found luck infused object.Stunned by a sudden'
+    b' stroke of bad luck with an object.Feeling unlucky and cursed.Feeling lucky crafting.Embarrassed'
+    b' about purchasing a "lucky" object that turned out bad.Happy about a lucky purchase.Burning up w'
+    b'ith passion.Needing to stop using elixirs for a bit.Pleasantly WooHooed in outhouse.Stressed tha'
+    b"t the plants aren't doing well.Happy plant sim.Cured.Tasted the goods.The elixir tastes like pur"
+    b'e magic.Feeling confident tasting.Feeling good and energetic after tasting an elixir.Tasted a fl'
+    b'irty elixir ingredient.Tasted a focused potion ingredient.Feeling funny after tasting a potion.F'
+    b'eeling side effects from tasting an elixir.Angry after tasting a bad apothecary potion.Embarrass'
+    b'ed after tasting a potion with bad side effects.Feeling weird after tasting the elixir.Scared by'
+    b' the side effects of an elixir they tasted.Likes NLS activities.Hating the Neighborhood Lead Sto'
+    b'ries system.Aroused by the health of their plants.Feeling happy with plants.Itchy and restless.T'
+    b'alking to plants and feeling they understand.Frustrated finding no physical ailment to cure.Sad '
+    b'for a patient with emotional struggles.Happy plant lover.Tiny adventures.Sad because a plant is '
+    b'hurt.Leaves withering and feeling dry.Embarrassed by a failure in gardening.Feeling the raw ener'
+    b'gy of an emotion stone.Happy bench nap.Excited to show off a cool emotion stone.Underwhelmed and'
+    b' bored after seeing an emotion stone.Feeling second-hand embarrassment for someone showing off a'
+    b'n emotion stone.Showing off an interesting emotion stone.Felt the surge of energy from an emotio'
+    b'n stone.All motives high.All motives pretty high.Dehydrated and weak.Coughing up paper and feeli'
+    b'ng weird.Stunned by a sudden stroke of bad luck while fishing.Excited by a streak of good luck w'
+    b'hile fishing.Suitable decoration.Tasting a special flavor.Consuming emotions but feeling empty.E'
+    b'ternally faithful.Feeling bulky and worried.Imagining things while smelling underwear.Feeling sl'
+    b'ightly uncomfortable.Boosted by sniffing panties.Happy about pregnancy termination.Feeling secur'
+    b'e and responsible using barrier protection during sex.Physically uncomfortable despite protectio'
+    b'n during light flow.Worried and embarrassed about menstrual hygiene odor.Feeling assured of grad'
+    b'es after sleeping with a teacher.Pleased after flashing someone.Physically uncomfortable despite'
+    b' protection.Adrenaline rushing after flashing someone.Caught stealing underwear and feeling deep'
+    b'ly ashamed.Irritable due to menstrual cycle effects.Mortified after being seen urinating in publ'
+    b'ic.Currently on period but experiencing no heavy symptoms.Worried about leaking without protecti'
+    b'on.Uncomfortable and bulky.Feeling dizzy and unwell due to menstrual cycle.Protected by birth co'
+    b'ntrol pills.Feeling guilty and awkward after cheating.Embarrassed that the reaction to flashing '
+    b'someone was shock/negative.Furious about a teen pregnancy.Furious seeing their teen in a comprom'
+    b'ising situation.Disgusted by a bad smell.Blushing deeply and feeling embarrassed by a flirtatiou'
+    b's remark.Cheated comfortably.Feeling anxious due to the menstrual cycle.Happy hanging out with w'
+    b'eirdos.Feeling the initial effects of Lean.Enlightened by Ayahuasca.Dizzy and ill from too much '
+    b'cannabis.Too high on weed edibles.Feeling popular taking photos.Feeling alien side effects from '
+    b'steroid use.Irritable from Xanax withdrawal.Feels sexy having bodily fluids on them.Feeling clea'
+    b'r-headed sobering up.Head pounding and stomach turning.Jittery, heart racing, and sweaty.Feeling'
+    b' self-conscious and embarrassed about pregnancy changes.Buzzing from alcohol consumption.Feeling'
+    b' loved and social.Waking up groggy after passing out from alcohol.Feeling relaxed smoking.Proces'
+    b'sing gang event.Proud of quitting Xanax.Chest tight and heart pounding.Depressed about having me'
+    b'lancholy thoughts.Mortified after being caught watching adult content.Feeling initial effects of'
+    b' alcohol.Feeling tipsy.Disassociated and aching.Crying drunk.Extremely focused and jittery from '
+    b'Adderall.Feeling wistful that the trip is ending.Feeling effects of SuccuShrooms.The visual fiel'
+    b'd is completely covered in kaleidoscope patterns.Feeling emotionally flat and bored due to drug '
+    b'dependency.Relaxed after smoking Blue Dream.Deeply grieving a miscarriage.Having profound realiz'
+    b'ations about the nature of existence.Proud of quitting Adderall.Feeling a mild buzz from smoking'
+    b' Purple Haze cannabis.Nervous waiting for the Ayahuasca to kick in.Feeling aftereffects of weak '
+    b'psilocybin.A mild afterglow from a psychedelic experience.High on weed edibles.Riding a wave of '
+    b'energetic euphoria.Relaxed after smoking Sour OG.Weakly high on weed edibles.Irritable and cravi'
+    b'ng alcohol.Ordered a Shaman.Feeling validated by attractiveness.Mildly disoriented from ketamine'
+    b' use.Totally incapacitated and trapped in a dissociated "K-hole."Feeling a regular playful high '
+    b'from LSD.Surprisingly inspired by an unconventional intimate encounter.Happy level 7 in AA.Waste'
+    b'd on eco-friendly alcohol.Paralyzed by being high at school.Feeling a general sense of embarrass'
+    b'ment after a drunken adventure.Feeling nausea mixed with excitement as the peyote takes effect.F'
+    b'eeling extremely self-conscious.Feeling glowing pregnant.Completely overwhelmed by the energy of'
+    b' SuccuShrooms.Feeling chilled.Feeling a lingering energetic glow.Feeling bruised and beat up aft'
+    b"er a rough night.Feeling physically attracted to a partner's rear end.Feeling overwhelmed by a p"
+    b'eyote trip.Feeling awkward and unsatisfied after a disappointing sexual encounter.Feeling good a'
+    b'fter finishing a job for the gang.Feeling a burning sensation in the gut from extremely strong m'
+    b'oonshine.Embarrassed about forgetting what they were doing due to ADHD symptoms.Feeling tipsy an'
+    b'd self-assured.feeling extremely awkward and pressured to be naked in a social setting.Irritable'
+    b' due to alcohol withdrawal.Feeling proud after writing a trip report.Feeling powerful as a high-'
+    b'ranking drug dealer.Smelling like a specific mushroom strain (Drenched Amy).Feeling a subtle shi'
+    b'ft in reality as a mild peyote dose kicks in.Furious after interrogating a child about tobacco u'
+    b'se.Feeling restless and agitated due to a strong need for Adderall.Feeling a lingering, light ef'
+    b'fect from peyote.Feeling relaxed after smoking Northern Lights.Feeling relaxed about pregnancy r'
+    b'isks knowing daily birth control is effective.Feeling uplifted after smoking AK-47.Experiencing '
+    b'vivid colors and shifting patterns during an intense acid trip.Experiencing a profound and enlig'
+    b'htening psychedelic trip.Noticed someone very attractive.Anxious and shaking from benzodiazepine'
+    b' withdrawal.Proud of helping someone as an addiction sponsor.Depressed about a lung cancer diagn'
+    b'osis.Feeling liberated and happy while naked.Feeling crashed and drained as medication wears off'
+    b'.Feeling a heavy body load from cannabis usage.Feeling good after smoking OG Wreck.Woke up with '
+    b'a vivid imagination stimulated by an erotic dream.Experiencing a deep, dissociative romantic con'
+    b'nection while in a K-Hole.In pain from using a needle incorrectly.Enjoying the view of a nearby '
+    b'nude person.Feeling a lingering altered state as the peak of an acid trip fades.Floating in a st'
+    b'eady, mystical state of mind from peyote.Disassociated from reality in a way that sparks abstrac'
+    b't and deep thoughts.Feeling a mild buzz from smoking OG Wreck cannabis.Mind is racing uncontroll'
+    b'ably, making it impossible to focus.Feeling a surge of focus as medication kicks in.Showing earl'
+    b'y physical signs of pregnancy.Experiencing a mild loss of sensory perception due to drug use.Hig'
+    b'h and euphoric from smoking Purple Haze.Reflecting on a profound Ayahuasca trip.High and happy f'
+    b'rom smoking Purple AK-47.Feeling sexually confident after a group encounter.Satisfied with the s'
+    b'exual atmosphere of the club.Feeling skilled at rolling cannabis.Feeling the heavy onset of a ma'
+    b'gic mushroom trip.Anxious while waiting for the effects of psilocybin to kick in.Feeling the ons'
+    b'et of a heavy psilocybin trip.Feeling a rush of energy as psilocybin starts to take effect.Stres'
+    b'sed after finding drugs in the house.Feeling a kick of energy from amphetamine kicking in.Deep i'
+    b'n a heroic psychedelic trip from consuming peyote.Feeling enriched and inspired after an intimat'
+    b'e encounter with an older partner.High and relaxed from smoking Granddaddy Purple.Feeling giddy '
+    b'and visually stimulated by a magical mushroom high.Experiencing a surge of romantic inspiration '
+    b'and creativity.Fascinated and inspired by an intimate encounter with a robot.Lost in deep, compl'
+    b'ex hallucinations during the peak of an acid trip.Feeling awkward after noticing someone physica'
+    b'lly unattractive.High and happy from smoking Sunset Sherbet.Feeling mentally expanded but physic'
+    b'ally grounding as the acid peak resolves.High and happy from smoking OG Wreck.Having a bad trip '
+    b'on psilocybin.Experiencing a profound heavy psychedelic trip.Experiencing a deep romantic connec'
+    b'tion with the universe while on psilocybin.Deep in a heavy psychedelic trip.Experiencing a heavy'
+    b', amusing psychedelic high.Experiencing a bad trip from psilocybin.Riding a strong wave of psych'
+    b'edelic creativity and visual enhancement.Feeling a strong, earthy connection and inspiration fro'
+    b'm consuming mushrooms.Feeling a mild buzz from smoking OG Kush cannabis.Stressed and angry after'
+    b' a negative intimate encounter.Feeling pampered by a cocaine companion.Physically uncomfortable '
+    b'and worried about leaking due to heavy flow.Frustrated by an unsatisfying solo experience.Feelin'
+    b'g sexually unsatisfied.Suffering from severe physical pain and dread due to advanced lung cancer'
+    b'.Crashing hard and feeling depressed after cocaine use.Feeling sticky and gross physically.Feeli'
+    b'ng awkward and judged after answering intimate questions.Feeling a rising wave of playful energy'
+    b'.Embarrassed by the results of a sexual preference questionnaire.Feeling relaxed after smoking G'
+    b'randdaddy Purple.Jittery and unable to focus from taking too much medication.Feeling paranoid an'
+    b'd scared from a bad trip.Experiencing a strong psychedelic trip.Feeling a wave of love while hig'
+    b'h on psilocybin.Tripping and feeling happy.Feeling amused and giggly from a psychedelic trip.Exp'
+    b'eriencing a sad psychedelic trip.Experiencing a moderate boost in creativity from a psychedelic '
+    b'substance.Itchy and uncomfortable from a persistent intimate infection.In significant discomfort'
+    b" from an untreated intimate infection.Worried about a romantic partner's substance use.Feeling g"
+    b'ood after using SuccuShrooms.Feeling the onset of Adderall.Feeling intense empathy and love from'
+    b' Green MDMA.Feeling a gentle return to normal perception after a mild peyote trip.Happy about or'
+    b'dering cocaine companions.Spacing out and staring into the void due to cannabis consumption.Hall'
+    b'ucinating that people are vanishing due to heavy ketamine use.Slurring speech heavily due to int'
+    b'oxication.Feeling satisfied and confident after solo pleasure.Feeling exposed and restricted whi'
+    b'le wearing clothes when preferring nudity.Feeling physically aroused by the sight of female geni'
+    b'talia.Dizzy and ill from consuming too much cannabis.Proud of quitting an addiction to SuccuShro'
+    b'oms.Head pounding and stomach turning from a hangover.Feeling good after smoking Purple Haze.Fee'
+    b'ling drained and low after the effects of MDMA wore off.Experiencing hormonal arousal due to men'
+    b'strual cycle.Coming down from a magic mushroom trip.Coming down from a magic mushroom trip.Comin'
+    b'g down from a magic mushroom trip.Coming down from a magic mushroom trip.Coming down from a magi'
+    b'c mushroom trip.Coming down from a magic mushroom trip.Coming down from a magic mushroom trip.Fe'
+    b'eling a second wave of intensity wash over the current peyote trip.Acting as an obnoxious drunk.'
+    b'Feeling a special creative glow and connection due to pregnancy.Feeling a heavy body load and li'
+    b'ngering visuals from magical mushrooms.Feeling affectionate and loving from Pink MDMA.Feeling re'
+    b'born after an Ayahuasca trip.Reflecting on profound thoughts as the visual intensity of acid sub'
+    b'sides.Feeling a sense of connectivity as the acid trip begins to settle.Feeling shaky and irrita'
+    b'ble with a desperate thirst for a drink.Feeling responsible after accepting a sponsee call.Worri'
+    b"ed about a friend's financial debt.Recovering during a post-cycle therapy cooldown from steroids"
+    b'.Feeling strong euphoria from Ketamine.High and full of energy from amphetamines.Feeling the ons'
+    b'et of rushing euphoria and visual distortion from acid.Feeling a distinct energetic buzz from Su'
+    b'ccuShrooms.Currently using a menstrual pad.Feeling an onset of energetic playfulness.Feeling abr'
+    b'asive and aggressive from cocaine use.Completely wasted and struggling to function from alcohol.'
+    b'Feeling the effects of Xanax.Ashamed and sad about an inappropriate family encounter.Hypnoticall'
+    b'y compelled to undress against their will.Feeling intensely aroused and eager for sexual activit'
+    b'y.Proud of successfully curing homegrown tobacco.Feeling the intermediate effects of consuming S'
+    b'uccubus mushrooms.Feeling a craving or the early stages of cocaine dependency.Feeling dazed and '
+    b'drained after intimacy with a ghost.Unimpressed after having sex with a younger partner.Feeling '
+    b'the initial effects of consuming Succubus mushrooms.Feeling relieved that perfume masked the sme'
+    b'll.Feeling slow and sedated from drinking lean.Feeling empty and bored due to a lack of sexual e'
+    b'xcitement.Navigating a distorted reality while deep in an acid trip.Excited and aroused by peepi'
+    b'ng through a window.Feeling a slight burst of energy from substance use.Feeling the initial butt'
+    b'erflies and excitement of an acid trip starting.Feeling the emotional crash from steroid withdra'
+    b'wal.Feeling unhygienic and sweaty as a side effect of steroids.Feeling physically awful and ment'
+    b'ally drained from amphetamine withdrawal.Feeling anxious and on edge due to a withdrawal from Xa'
+    b"nax.Feeling a sense of focused enlightenment from cannabis.Sad about a child's behavior or emoti"
+    b'onal state.High and happy from smoking Purple Lights.High on amphetamines and feeling energetic.'
+    b'Feeling the onset of a magic mushroom trip.Feeling anxious and nauseous as psychedelics start to'
+    b' kick in.Feeling the onset of a mushroom trip.Feeling the onset of energy from a psilocybin trip'
+    b'.Embarrassed after being yelled at by a parent for smoking.Angry at their teen for smoking.Compl'
+    b'etely immersed in a world of hallucinations and sensory overlaps.Feeling a craving or the early '
+    b'stages of Lean dependency.Feeling a craving or the early stages of speed dependency.Experiencing'
+    b' hormonal anger due to pregnancy.Feeling a tingling sensation and heightened awareness as acid t'
+    b'akes hold.Tripping deeply on mushrooms with heavy visual distortions.Feeling overwhelmed and une'
+    b'asy during a psychedelic trip.Experiencing a strong sense of wonder and visual patterns from mus'
+    b'hrooms.Feeling giggly and seeing breathing textures from a mushroom trip.Feeling a pleasant body'
+    b' buzz and enhanced colors from mushrooms.Feeling introspective and visually sensitive from a mod'
+    b'erate mushroom dose.Feeling a light mood lift and brighter vision from a small mushroom dose.Emb'
+    b'arrassed because someone else asked awkward questions about sex.Ravenously hungry as a side effe'
+    b'ct of steroid use.Feeling awkward during a group encounter.Feeling chemically confident.Happy ab'
+    b'out a sexual encounter with a family member.Pleased about a sexual encounter with a family membe'
+    b'r.Feeling the after-effects of purple MDMA wearing off.Feeling energetic and confident.Experienc'
+    b'ing a focused inner peace from a psychedelic trip.Feeling awkward and used after an unsatisfying'
+    b' encounter with a celebrity.Euphoric and full of love from Purple MDMA.Worried about cannabis us'
+    b'e at school.Coming down from acid with a tired but open mind.Feeling the effects of SuccuShrooms'
+    b'.Irritable from Lean withdrawal.Feeling the first magical tingles of a succubus mushroom trip.An'
+    b'gry after yelling at a teenager.Feeling a mild buzz from smoking Sour Diesel cannabis.Watching t'
+    b'he walls breathe while slowly returning to baseline consciousness.Feeling a surge of happy energ'
+    b'y.Surrounded by intense magical auras and erotic energy from mushrooms.Feeling a light, buzzy cr'
+    b'eativity from using cannabis.Suffering a headache and confusion from low-quality weed.Anxious an'
+    b'd fearful of the silence.Embarrassed about a close call regarding hidden contraband.Overwhelmed '
+    b'by the sudden onset of bright lights and loud sounds.Feeling crashing side effects from taking t'
+    b'oo much ADHD medication.Feeling mentally exhausted but spiritually awake after an acid trip.Feel'
+    b'ing a strong sense of calm serenity from Ketamine.Feeling a mild buzz from smoking AK-47 cannabi'
+    b's.Suffering from a jagged, exhausting comedown from amphetamines.Retaining profound insights fro'
+    b"m a spiritual psychedelic journey.Feeling physically attracted to a partner's muscular physique."
+    b'Caught in a loop of fascinating thoughts and visuals.Suffering a splitting headache from alcohol'
+    b' withdrawal.Feeling weary and hollow as amphetamines wear off.Disoriented and panicked by a bad '
+    b'drug reaction.Feeling anxious as the effects of MDMA kick in.Experiencing synesthesia or tasting'
+    b' colors from Ayahuasca.Proud of quitting a cannabis addiction.Coming down from Xanax comfortably'
+    b'.Still feeling the creative afterglow of an acid trip.Mortified after being caught peeping throu'
+    b'gh a window.Currently using a tampon.Feeling messy and needing to clean up immediately.Feeling t'
+    b'he afterglow of LSD.Ashamed about spending time in jail.Feeling groggy, confused, and slowly reg'
+    b'aining motor control.Feeling the strong effects of consuming Succubus mushrooms.Upset after bein'
+    b"g yelled at by a parent.Feeling physically aroused by the sight of a partner's chest.Alert and r"
+    b'eacting to a strong perfume scent.Experiencing intense steroid-induced rage.Mortified and dazed '
+    b'after being caught peeping through a window.Peaking intensely with a dissolved sense of self.Fee'
+    b'ling deep connection and arousal from Blue MDMA.Feeling a warm, magical glow spreading through t'
+    b'he body.Feeling a craving or the early stages of Ketamine dependency.Enjoying the "afterglow" of'
+    b' visually stimulating hallucinations.Feeling good after Peyote use.Feeling a craving or the earl'
+    b'y stages of alcohol dependency.Reconnecting with inner childhood joy during a psychedelic trip.F'
+    b'eeling irritable and sick from opioid withdrawal.Feeling lingering energy after using SuccuShroo'
+    b'ms.Coughing and dizzy from the first time smoking tobacco.Feeling euphoric from cannabis.Relaxed'
+    b' after smoking Sunset Sherbet.Tense and uncomfortable after being caught with drugs by parents.F'
+    b'eeling supported after an AA meeting.Feeling cool after being intimate with a celebrity.Feeling '
+    b'dissociated but confident.Depressed that post-cycle therapy failed.Drifting through a mild, mana'
+    b'geable state of altered consciousness.Experiencing a complete out-of-body dissociation.Feeling r'
+    b'evitalized after being intimate with a younger partner.Noticing the environment shifting and war'
+    b'ping slightly.Feeling a mild buzz from smoking Purple AK-47 cannabis.Feeling the after-effects o'
+    b'f white MDMA wearing off.Feeling powerful waves of magical energy and euphoria.Aroused by watchi'
+    b'ng a partner with someone else.Unable to feel pain or coordinate movement due to heavy intoxicat'
+    b'ion.Feeling slightly spacey as a weak dose of acid wears off.Feeling tough and supported by the '
+    b'gang.Depressed after being arrested.Feeling physically energized for romance.Humiliated and angr'
+    b'y about peeing themselves publicly.Satisfied after smoking more tobacco.Devastated by a loved on'
+    b"e's cancer diagnosis.Feeling disjointed and confused from a ketamine hangover.Being blasted into"
+    b' a new dimension as a massive peyote dose hits.Feeling sick and irritable from opioid withdrawal'
+    b'.Feeling a terrifyingly fast onset of a heavy spiritual journey.Satisfied after solo sexual acti'
+    b'vity.Completely sexually unsatisfied.Proud of quitting a Ketamine addiction.Relaxed after smokin'
+    b'g Purple Lights.Feeling sort of relaxed from cannabis.Satisfied after dipping more tobacco.Woke '
+    b'up with a vivid imagination fueled by morning desire.Feeling the effects of Xanax kicking in.Ove'
+    b'rstimulated and sweaty from a drug reaction.Feeling drained but magically charged as the mushroo'
+    b'ms wear off.Feeling a weak onset of a magic mushroom trip.Feeling the onset of a weak mushroom t'
+    b"rip.Seeing intense open-eye visuals and hallucinations.Aroused by noticing someone's chest.Under"
+    b' a spell causing intense autonomous desire.Stumbling and unable to walk straight due to intoxica'
+    b'tion.Heart racing and feeling ill from taking too much speed.Feeling a subtle spiritual connecti'
+    b'on and creativity from peyote.Feeling emotionally connected after satisfying sex.Feeling chatty '
+    b'and tipsy.Sad that a family member is in prison.Feeling enlightened after a psychedelic trip.Ref'
+    b'lecting on a recent psychedelic trip with newfound creative insight.Feeling good after a mushroo'
+    b'm trip.Feeling a residual glow of energy after a trip.Angry while interrogating a child.Proud of'
+    b' completing the first stage of rehab.Feeling a slight, giggly onset of a trip.Feeling a complica'
+    b"ted sense of focus after a taboo family encounter.Worried about a friend's well-being.Experienci"
+    b'ng withdrawal from lack of romance.Traumatized and embarrassed after witnessing something inappr'
+    b'opriate as a child.Having the munchies from cannabis.Feeling a mild distortion of reality and li'
+    b'ght mood elevation.Feeling an afterglow from MDMA.Upset about being yelled at for smoking.Feelin'
+    b'g isolated due to ADHD symptoms.Feeling intensely focused and energetic from ADHD medication.Fee'
+    b'ling a mild buzz from smoking Sunset Sherbet cannabis.Excited by a casual sexual encounter with '
+    b'a stranger.Disoriented and lost within a hallucinogenic trip.Jittery and craving amphetamines.Ex'
+    b'periencing time dilation and shifting colors.Feeling extra charming and romantic.Aroused by the '
+    b'scent of underwear.Wasted and feeling like going on a strange adventure.Suffering from chest pai'
+    b'n and coughing due to lung cancer.Feeling a craving or the early stages of Xanax dependency.Feel'
+    b'ing guilty and awkward after cheating on a partner.Feeling wired and jittery from amphetamines.F'
+    b'eeling bold and artistic after sharing private photos.Proud of quitting alcohol addiction.Angry '
+    b'about the results of a sexual compatibility questionnaire.Jittery and unable to focus due to cra'
+    b'ving medication.Feeling clean and frisky after a shared shower.Feeling dizzy and nauseous from a'
+    b' strong herbal brew.Upset about being robbed while drunk.Intoxicated from drinking moonshine wit'
+    b'h medium alcohol content.Feeling a strong surge of energy as amphetamines kick in.Suffering from'
+    b' Adderall withdrawal symptoms.Experiencing an afterglow from Lean consumption.Anxious and shakin'
+    b'g from benzodiazepine withdrawal.Feeling chatty and energetic.Feeling lucky from Adderall effect'
+    b's.Family happy about prison release.Feeling good after greeting someone for the gang.Feeling rom'
+    b'antically confident.Feeling the magical effects fading into a soft mental buzz.Feeling strange a'
+    b'nd disconnected during a trip.Feeling welcomed by the Shaman.Feeling a mild buzz from smoking No'
+    b'rthern Lights cannabis.Dissociated and aching from ketamine withdrawal.Relaxed after smoking OG '
+    b'Kush.Feeling emotionally oversensitive due to menstruation.Waking up confused and sick after pas'
+    b'sing out from alcohol.Abdominal pain and nausea from liver strain.Dealing with the withdrawal or'
+    b' recovery process of quitting MDMA.Feeling the initial effects of Adderall.Happy that a debt was'
+    b' returned.Feeling the initial rush of an amphetamine high.Humiliated by a video circulating onli'
+    b'ne.Jittery, heart racing, and sweaty from an overdose.Embarrassed after being yelled at by a par'
+    b'ent.Fascinated by the metaphysical experience of intimacy with a ghost.Experiencing a light, lin'
+    b'gering effect from peyote.Feeling understimulated and bored due to ADHD symptoms.Feeling assured'
+    b' of better grades after sleeping with a professor.Feeling drunk on eco-friendly alcohol.Happy ab'
+    b'out pregnancy.Feeling high and confident.Feeling low and depressed from MDMA withdrawal.Feeling '
+    b'effects of SuccuShrooms.Feeling a spark of romantic creativity and passion.Feeling tender and lo'
+    b'ving after intimacy.Feeling a residual buzz after an LSD trip.Upset by negative comments on uplo'
+    b'aded pictures.Feeling a weak, wet playful high from mushrooms.Grieving a pregnancy termination.C'
+    b'ompletely dissociated from reality in a profound spiritual realm.Reacting to a suggestive look f'
+    b'rom someone.Lost in dream-like thoughts while awake due to heavy intoxication.Unaffected and fin'
+    b'e despite committing infidelity.Coming down from a magical trip with a hazy memory.Excited about'
+    b' being caught having sex.Relaxed after smoking Purple AK-47.Feeling light effects from Peyote.Fe'
+    b'eling depressed and exhausted after a drug crash.Feeling completely drenched in energy from Succ'
+    b'uShrooms.Self-conscious and distressed about being naked.Heavily sedated and out of it from Xana'
+    b'x.Feeling a burst of pregnancy-related energy and nesting instinct.Stomach turning as magic mush'
+    b'rooms start to take effect.Proud of quitting tobacco addiction.Nauseous from the taste of mushro'
+    b'oms.Being launched into a high-energy, erotic psychedelic state.Feeling a jagged rise in energy '
+    b'from amphetamines.Feeling creepy and unsatisfied after an encounter with an elder.Feeling a stro'
+    b'ng sexual desire.Flying high on amphetamines.Enhanced lateral thinking and creativity from canna'
+    b'bis use.Experiencing drug-induced hyper-focus.Head pounding and dehydrated from a severe hangove'
+    b"r.Sad about a child's drug problems.Feeling a regular, wet playful high from mushrooms.Feeling c"
+    b'onfusingly aroused after a taboo family encounter.Feeling productive and focused due to medicati'
+    b'on.Feeling numb, detached, and floating outside the body.Physically repulsed and turned off.High'
+    b' and happy from smoking AK-47.High and happy from smoking Gelato.Looking like a porcelain doll d'
+    b'ue to a specific appearance effect.High and happy from smoking Trainwreck.Feeling profound after'
+    b' a heavy psychedelic trip.Integrating a heavy psychedelic experience into artistic expression.Fe'
+    b'eling good after a heavy mushroom trip.Feeling an energetic afterglow from a heavy psilocybin tr'
+    b'ip.Feeling awkward about a neutral sexual reaction.Experiencing the tail end or after-effects of'
+    b' an LSD trip.Distressed about parents being in debt.Feeling the perspective shift from Lean.Unde'
+    b'rgoing a life-altering, purging spiritual vision quest.Feeling a weak, playful high from mushroo'
+    b'ms.Relaxed after smoking tobacco.Seeing visuals when closing eyes due to intoxication.Worried ab'
+    b'out pill usage at school.Feeling a mild buzz from smoking Purple Lights cannabis.Heavily sedated'
+    b' and slow from a strong dose of lean.Feeling the stomach turn as peyote kicks in.Experiencing th'
+    b'e after-effects of a peyote trip.Sweating profusely and feeling sticky.Irritable and craving sti'
+    b'mulation from cocaine withdrawal.Feeling a mild buzz from smoking Komorebi Fantasy cannabis.Feel'
+    b'ing playful after sex with a family member.Feeling drunk and fearless.Wasted and belligerent.Hig'
+    b'h and happy from smoking OG Kush.Feeling weird and unsettled from a mild psychedelic dose.High o'
+    b'n weak psilocybin.Furious after finding drugs in the house.Irritable and craving caffeine.Feelin'
+    b'g the initial effects of Amphetamine.Mortified after being caught having sex.Irritable from cann'
+    b'abis withdrawal.Smelling strongly of cured cannabis.Ashamed and bruised after a confrontation ov'
+    b'er drug debt.Nose hurting and head pounding from a cocaine hangover.Feeling the heightened sensa'
+    b'tion of skin-to-skin contact.Hating on drugs as a Straight Edge.Feeling balanced and capable of '
+    b'focus due to ADHD medication.Relieved cancer is cured.Feeling an onset of pink playful energy.Cr'
+    b'aving magic mushrooms and feeling restless.Shaking and anxious from mushroom withdrawal.Proud of'
+    b' completing the second stage of rehab.Proud of quitting cocaine addiction.Anticipating the trip '
+    b'as colors begin to sharpen.Feeling overwhelmed and disoriented from a strong trip.Reflecting on '
+    b'the journey while watching lingering tracers.Feeling a very subtle unease or excitement.Feeling '
+    b'refreshed and connected after a shared shower.Feeling the initial effects of MDMA.Intense physic'
+    b'al craving and agitation from cocaine withdrawal.Drank a Smite drink.Happy about uploading priva'
+    b'te pictures.Feeling numb to pain due to mild drug effects.Deep in the middle of a magical, lust-'
+    b'filled trip.Feeling the effects of SuccuShrooms.Panicked about private pictures being uploaded.R'
+    b'iding a high wave of energy from SuccuShrooms.Feeling good after sex.Feeling satisfied after sex'
+    b'.Experiencing post-orgasm clarity after solo play.Crash-landing back to reality after an intense'
+    b' spiritual voyage.Feeling awkward and exposed after a public encounter.Happy about group sex.Hea'
+    b'dache and irritability from lack of coffee.Watching the world melt and reform.Irritable and jitt'
+    b'ery from nicotine cravings.Feeling unsure but hopeful about protection after just starting the p'
+    b'ill.Feeling good while rolling a joint.Hormones are causing a period of intense focus during pre'
+    b'gnancy.Extremely high and energetic from multiple amphetamine doses.High and happy from smoking '
+    b'Sour Diesel.Happy about showering together.Reeling from an intense and chaotic hallucinogenic tr'
+    b'ip.Disgusted by a bad smell coming from undergarments.Feeling tipsy and flirtatious from alcohol'
+    b'.Head throbbing from smoking too much.Feeling normal Peyote effects.Feeling the menthol kick.Mor'
+    b'tified that a parent caught them in an intimate situation.Feeling paranoid after using cannabis.'
+    b'Enjoying a tobacco dip.Dizzy and ill from drinking too much syrup.Feeling meditative after AA.Cu'
+    b'ffs are tight and the back of the police car is hard.Feeling the stomach churn slightly as the a'
+    b'cid begins to work.Angry after being arrested.Angry about unwelcomed sexual advances.Locked into'
+    b' a state of hyper-focus on the current task.Bored by the predictability of their current relatio'
+    b'nship.Feeling sweaty and aching with a strong desire for codeine syrup.Feeling a low buzz from m'
+    b'oonshine.Feeling guilty and awkward after rejecting someone seeking help.Feeling exhausted and s'
+    b'cattered, needing a stimulant boost.Analyzing the universe while staring at ordinary objects.Hap'
+    b'py about public sex.Proud of quitting coffee.Feeling an intense connection to nature and magic.S'
+    b'uffering from MDMA withdrawal symptoms.Feeling a peaceful resolution to the psychedelic chaos.Do'
+    b'ubled over in pain from menstrual cramps.Feeling egotistical and superior.Deep in a mushroom-fue'
+    b'led creative state with heightened senses.Commended as a parent.Feeling intensely high and confi'
+    b'dent.Excited about sex preference.Dizzy and nauseous from the first time using dip.Drifting slow'
+    b'ly back to the real world from a magical realm.Relaxed after smoking Sour Diesel.Feeling a mild '
+    b'buzz from smoking Granddaddy Purple cannabis.Starting to feel the high from Succubus mushrooms.R'
+    b'elaxed after smoking Komorebi Fantasy.Feeling playful about group sex.Traumatized and stressed a'
+    b'fter being arrested.Uncomfortable being near someone who is naked.Horrified and angry about an i'
+    b'ncestuous interaction.Feeling anxious and out of place in rehab.Upset about finding tobacco on t'
+    b'heir child.Feeling a bit nervous waiting for the trip to start.Overwhelmed with love from mixing'
+    b' MDMA types.Feeling the first kicks of energy from SuccuShrooms.Mildly stoned from consuming wee'
+    b'd edibles.Mentally relaxed from cannabis.Feeling initial effects of Xanax.Stomach churning as ac'
+    b'id starts to kick in.Feeling another stage of Xanax.Doing the walk of shame after a wild night.F'
+    b'eeling heavy, uncoordinated, and significantly dissociated.Noticing the drug market changes.Feel'
+    b'ing the urge for caffeine due to coffee addiction.Feeling invincible from a chemical high.Soaked'
+    b' and nauseous as mushrooms take effect.Upset after interrogating a child about drugs.Worried abo'
+    b'ut leaking despite protection during heavy flow.Completely unable to speak clearly from heavy dr'
+    b'ug use.Feeling initial effects of cocaine.Feeling mentally foggy and yearning for the numbness o'
+    b'f Ketamine.Anxious about leaking during light flow without protection.Slowly returning to realit'
+    b'y after an Ayahuasca trip.deeply horrified and disgusted by an incestuous encounter.Feeling init'
+    b'ial effects of Lean.Feeling the onset of Xanax.Feeling physically aroused by the sight of male g'
+    b'enitalia.Physically exhausted from the toll of pregnancy.Suffering from a persistent cough and c'
+    b'hest pain.Feeling the after-effects of blue MDMA wearing off.Smelling an unpleasant odor from so'
+    b'meone else.Proud of quitting Lean.Feeling strangely powerful after steroid use.Recovering from a'
+    b' very heavy magic mushroom trip.Recovering from a very heavy magic mushroom trip.Recovering from'
+    b' a very heavy magic mushroom trip.Recovering from a very heavy magic mushroom trip.Recovering fr'
+    b'om a very heavy magic mushroom trip.Recovering from a very heavy magic mushroom trip.Recovering '
+    b'from a very heavy magic mushroom trip.Successfully completed steroid PCT.Feeling strange and exh'
+    b'austed after a trip.Hypnotically compelled to act promiscuously.Tripping on a standard dose of p'
+    b'eyote.Feeling good after Thai Stick.Disappointed and bored by a mediocre sexual encounter.Feelin'
+    b'g awkward after a bad sexual experience.Feeling a craving or the early stages of MDMA dependency'
+    b'.Craving Ketamine and irritable.Feeling ill and dazed from steroid-induced liver damage.Feeling '
+    b'tense and guilty during an intervention.Winding down from an intense peak of magical hallucinati'
+    b'ons.Perception feels elevated and detailed from cannabis.Embarrassed after accidentally exposing'
+    b' a minor to something inappropriate.Feeling a subtle, dissociative connection to the universe fr'
+    b'om ketamine.Happy about sex during vampire period.Feeling low and sad after a drug comedown.Havi'
+    b'ng a profound spiritual realization during a ketamine experience.Physically pumped up from stero'
+    b'id use.Peaking on mushrooms with intense visions and creative thoughts.Feeling the after-effects'
+    b' of pink MDMA wearing off.Edgy and irritable from nicotine withdrawal.Drunk and feeling extremel'
+    b'y affectionate.Sweating and aching from opioid withdrawal.Feeling slick after laundering money.F'
+    b'eeling electricity running through the veins.Feeling a pleasant body high from Ketamine.Already '
+    b'a cocaine companion.Mortified after being caught by a parent.Coming down from the effects of Add'
+    b'erall.Suffering from an MDMA comedown.Feeling effects of Lean.Slightly woozy from a small amount'
+    b' of lean.Feeling the first wave of mushroom-induced creativity.Aggressively frustrated due to st'
+    b'eroid use.The room is starting to spin with magical sparkles.High and happy from smoking Norther'
+    b'n Lights.Feeling a psychological pull towards using cannabis.Coughing slightly and feeling short'
+    b' of breath.Chest feels tight and breathing is difficult.Relaxed after smoking Trainwreck.Stresse'
+    b'd and uncomfortable confronting a loved one about drugs.Feeling effects of SuccuShrooms.Disappoi'
+    b'nted by bad intimacy with an attractive partner.Feeling nauseous as the MDMA takes effect.Proud '
+    b'of quitting Amphetamine.Feeling abandoned like a doll without an owner.Feeling effects of SuccuS'
+    b"hrooms.Feeling relieved that drugs weren't found.Shaking and exhausted from speed withdrawal.Ear"
+    b'ly stages of a high triggering imagination and sensory shifts.Feeling like a tough drug thug.Fee'
+    b'ling awkward and bruised after an encounter with a robot.Excited about friendly sex.Hallucinatin'
+    b"g from Ayahuasca.Grinning uncontrollably as the acid starts to hit.Aroused by noticing someone's"
+    b" muscles.Feeling the focus and drive from Adderall.Parent angry about teen's inappropriate behav"
+    b'ior.Feeling very high and self-assured.Feeling a mild buzz from smoking Sour OG cannabis.Gigglin'
+    b"g from cannabis.Worried about a partner's debt.Happy about prison release.Feeling savvy and cunn"
+    b'ing after a successful dark web sale.Paranoid and spinning from eating too many edibles.Feeling '
+    b'energetic from amphetamine usage.Feeling a mild buzz from smoking Blue Dream cannabis.Irritable '
+    b'from nicotine withdrawal.Feeling a mild buzz from smoking Trainwreck cannabis.Peaking on a heavy'
+    b' psilocybin high.Completely dissociated and overwhelmed by a high dose.Experiencing a very inten'
+    b'se, amusing psychedelic high.Deep in a psychedelic trip and feeling universal love.Experiencing '
+    b'intense fear from a psychedelic trip.Completely overwhelmed by geometric patterns from a heavy m'
+    b'ushroom dose.Feeling a heavy psilocybin high.High and happy from smoking Blue Dream.Keeping a lo'
+    b'w profile after recently laundering money.Feeling sad and drained after a drug comedown.Bored be'
+    b'cause nothing interesting is happening while peeping through a window.Impressed by personality.T'
+    b'he world is rapidly dissolving into fractals.Experiencing ego death from Ayahuasca.Craving magic'
+    b'al mushrooms.Euphoric from Amphetamine.Suffering from cannabis addiction withdrawal or dependenc'
+    b'e.High and happy from smoking Sour OG.Coughing from secondhand smoke.Mind-controlled to be sexua'
+    b'lly aggressive.Happy about the sex party outcome.Feeling agitated, depressed, and desperate for '
+    b'a line of coke.Experiencing hormonal pregnancy sadness.Suffering from romance withdrawal.Overwhe'
+    b'lmed by an intense spiritual journey.Feeling fresh because deodorant masked the smell.Shaking an'
+    b'd sweating from alcohol withdrawal.Haunted by a bad smell associated with a memory.Feeling letha'
+    b'rgic and bored due to withdrawal symptoms.High and happy from smoking Komorebi Fantasy.Coming do'
+    b'wn from a weak magic mushroom trip.Coming down from a weak magic mushroom trip.Groggy and reboun'
+    b'ding from Xanax use.Feeling drained and empty after a drug comedown.Overwhelmed by intense, unco'
+    b'ntrollable lust.Distracted by strong physical arousal.Feeling fidgety and warm from arousal.Mild'
+    b'ly distracted by romantic thoughts.High on White MDMA and seeking connection.Experiencing the af'
+    b'ter-effects of SuccuShrooms.Disassociated and aching from ketamine withdrawal.Taking early-stage'
+    b' birth control pills.Coughing and feeling a tightness in the chest.Ego death is approaching amid'
+    b"st blinding visuals.Stressed by the intensity of recovery steps.Upset about a child's debt.Proud"
+    b' of completing the third stage of rehab.Feeling a craving or the early stages of Adderall depend'
+    b'ency.Feeling sick to the stomach from menstrual hormones.Feeling a rush of adrenaline as the pea'
+    b'k approaches.Angry about intimacy with a disliked partner.Overflowing with physical energy and r'
+    b'omantic drive.Heartbroken that a partner is in prison.Regretting having sex with someone they fo'
+    b'und unattractive.Feeling inner calm from cannabis.Objects are morphing and changing shape rapidl'
+    b'y.Feeling down and lethargic after a drug comedown.Feeling aftereffects of SuccuShrooms.Feeling '
+    b'initial effects of Ketamine.High and energetic from SuccuShrooms.Slurring speech and stumbling f'
+    b'rom too much medication.Mortified after being caught masturbating.Successfully masking red eyes '
+    b'to look sober.Feeling a complex mix of playful energy.Supernaturally pumped up from vampire ster'
+    b'oids.Received bad news about cancer.Caught peeping and excited by the exposure.Aroused by notici'
+    b"ng someone's rear.Feeling awkward about a sex party that went wrong.The hallucinations are slowi"
+    b'ng down to a gentle wave.Perceiving reality as shifted and warped due to heavy intoxication.Feel'
+    b'ing a mild buzz from smoking Gelato cannabis.Terrified by a serious health diagnosis.High on wee'
+    b'd edibles.Read a trip report.Received good news about cancer.Wet and starting to trip on Succubu'
+    b's mushrooms.Consumed by erotic hallucinations and magical lights.Having a heroic, life-changing '
+    b'experience on peyote.Slurring words and losing track of time from repeated ketamine use.Seeing s'
+    b'ound and hearing colors in a synesthetic peak.Headache and fatigue from an Adderall crash.Feelin'
+    b'g initial effects of cannabis.Melancholy thinking about a past lover during intimacy.Losing touc'
+    b'h with senses due to strong ketamine effects.Feeling a sense of clarity returning after a peyote'
+    b' trip.Relaxed after smoking Gelato.Grogginess and memory loss from a Xanax hangover.Happy to int'
+    b'ervene in addiction.Feeling cornered by a drug intervention.Floating through a world of purple a'
+    b'nd pink magical haze.Remembering an attractive person.Extremely humiliated by being naked in pub'
+    b'lic.Craving cocaine and angry.Feeling a regular playful high from mushrooms.Feeling bold after b'
+    b'eing intimate with a family member.Regretting a sexual encounter with a stranger.Remembering an '
+    b'attractive spouse.Every surface looks like it is breathing heavily.'
+)
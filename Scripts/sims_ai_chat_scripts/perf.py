@@ -0,0 +1,61 @@
+# Scripts/sims_ai_chat_scripts/perf.py
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# --- CONFIGURATION ---
+RING_SIZE = 128 # Durations kept per section; older ones fall out
+
+# Section name -> ring of recent durations in ms. deque.append is atomic, so the game thread
+# and the sender/channel threads can record without a lock.
+_SPANS = {}
+
+def record(section, duration_ms):
+    ring = _SPANS.get(section)
+    if ring is None:
+        ring = _SPANS.setdefault(section, deque(maxlen=RING_SIZE))
+    ring.append(duration_ms)
+
+@contextmanager
+def span(section):
+    """Times the with-block into section (also when it raises)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(section, (time.perf_counter() - start) * 1000)
+
+def timed(section):
+    """Decorator form of span()."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(section):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def get_summary():
+    """Section -> count, p50, p95, max and last duration (ms) over the ring."""
+    summary = {}
+    for section, ring in list(_SPANS.items()):
+        samples = list(ring)
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        summary[section] = {
+            "n": len(samples),
+            "p50": round(_percentile(ordered, 50), 2),
+            "p95": round(_percentile(ordered, 95), 2),
+            "max": round(ordered[-1], 2),
+            "last": round(samples[-1], 2)
+        }
+    return summary
+
+def reset():
+    _SPANS.clear()
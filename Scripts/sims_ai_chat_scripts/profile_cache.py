@@ -0,0 +1,135 @@
+# Scripts/sims_ai_chat_scripts/profile_cache.py
+
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.events.buff.events.buff_added import S4CLBuffAddedEvent
+from sims4communitylib.events.buff.events.buff_removed import S4CLBuffRemovedEvent
+from sims4communitylib.events.sim.events.sim_trait_added import S4CLSimTraitAddedEvent
+from sims4communitylib.events.sim.events.sim_trait_removed import S4CLSimTraitRemovedEvent
+from sims4communitylib.events.sim.events.sim_skill_leveled_up import S4CLSimSkillLeveledUpEvent
+from sims4communitylib.events.sim.events.sim_changed_age import S4CLSimChangedAgeEvent
+from sims4communitylib.events.relationship.events.relationship_bit_added import S4CLRelationshipBitAddedEvent
+from sims4communitylib.events.relationship.events.relationship_bit_removed import S4CLRelationshipBitRemovedEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'ProfileCache')
+
+# --- PROFILE SECTIONS ---
+SECTION_IDENTITY = "identity"   # Name, age/species, traits, skills
+SECTION_STATE = "state"         # Mood, moodlets, current activity
+SECTION_RELATIONS = "relations" # Partners and children
+# The activity text filters out buffs already described by a trait, so trait changes dirty the state too
+_DEPENDENT_SECTIONS = {SECTION_IDENTITY: (SECTION_STATE,)}
+
+class SimsAIProfileCache(CommonService):
+    """
+    Per-sim cache of scraped profile sections.
+    A section is rebuilt only after an S4CL event marked it dirty, so re-scraping an unchanged
+    sim is a few dict lookups. Scrapes are tick-sliced jobs on the game thread (see
+    scrape_scheduler.py) and S4CL events fire there too, so an event can land between two
+    sections of a job but never inside one build. Invalidations still bump a version, and a
+    section whose version changed while it was built (an event fired by the build itself) is
+    returned but not stored.
+    """
+    def __init__(self):
+        self._entries = {}  # (sim_id, section) -> section dict
+        self._versions = {} # (sim_id, section) -> invalidation counter
+        self.hits = 0
+        self.misses = 0
+
+    def get_section(self, sim_info, section, build):
+        """Cached section of the sim, or build(sim_info) when it is missing or dirty."""
+        key = (CommonSimUtils.get_sim_id(sim_info), section)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        version = self._versions.get(key, 0)
+        entry = build(sim_info)
+        if self._versions.get(key, 0) == version:
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self, sim_info, *sections):
+        if sim_info is None:
+            return
+        sim_id = CommonSimUtils.get_sim_id(sim_info)
+        for section in sections:
+            for name in (section,) + _DEPENDENT_SECTIONS.get(section, ()):
+                key = (sim_id, name)
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._entries.pop(key, None)
+
+    def clear(self):
+        for key in list(self._entries):
+            self._versions[key] = self._versions.get(key, 0) + 1
+        self._entries.clear()
+
+    def get_stats(self):
+        return {"sections": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+# --- REGISTER INVALIDATION HOOKS (S4CL Compliant) ---
+class SimsAIProfileCacheListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # SimInfos are reloaded and households may have moved
+        SimsAIProfileCache.get().clear()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_buff_added(event_data: S4CLBuffAddedEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_STATE)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_buff_removed(event_data: S4CLBuffRemovedEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_STATE)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_trait_added(event_data: S4CLSimTraitAddedEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_IDENTITY)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_trait_removed(event_data: S4CLSimTraitRemovedEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_IDENTITY)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_skill_leveled_up(event_data: S4CLSimSkillLeveledUpEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_IDENTITY)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_changed_age(event_data: S4CLSimChangedAgeEvent):
+        SimsAIProfileCache.get().invalidate(event_data.sim_info, SECTION_IDENTITY)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_relationship_bit_added(event_data: S4CLRelationshipBitAddedEvent):
+        cache = SimsAIProfileCache.get()
+        cache.invalidate(event_data.sim_info, SECTION_RELATIONS)
+        cache.invalidate(event_data.target_sim_info, SECTION_RELATIONS)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_relationship_bit_removed(event_data: S4CLRelationshipBitRemovedEvent):
+        cache = SimsAIProfileCache.get()
+        cache.invalidate(event_data.sim_info, SECTION_RELATIONS)
+        cache.invalidate(event_data.target_sim_info, SECTION_RELATIONS)
+        return True
@@ -0,0 +1,104 @@
+# Scripts/sims_ai_chat_scripts/residence_cache.py
+
+import services
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.events.build_buy.events.build_buy_exit import S4CLBuildBuyExitEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'ResidenceCache')
+
+NO_RESIDENCE = "Looking for the home to move in."
+
+class SimsAIResidenceCache(CommonService):
+    """
+    zone_id -> lot name, world name and ids, read from the persistence protobufs once per zone.
+    Keyed by zone rather than by sim: moving a household in or out only changes its
+    home_zone_id, which is read live, so the entries themselves go stale only when a lot is
+    renamed. That happens in build mode (build/buy exit) or through Manage Worlds / travel
+    (zone load), and both clear the cache.
+    """
+    def __init__(self):
+        self._zones = {} # zone id -> {"lot_name", "world_name", "world_id", "neighborhood_id"} (None if unknown)
+        self.hits = 0
+        self.misses = 0
+
+    def get_zone(self, zone_id):
+        """Cached names and ids of a zone, or None if the save has no such zone."""
+        if zone_id in self._zones:
+            self.hits += 1
+            return self._zones[zone_id]
+        self.misses += 1
+        zone = self._read_zone(zone_id)
+        self._zones[zone_id] = zone
+        return zone
+
+    def get_residence(self, sim_info):
+        """'World, Lot' of the sim's household home, or NO_RESIDENCE."""
+        household = getattr(sim_info, 'household', None)
+        home_zone_id = household.home_zone_id if household else 0
+        zone = self.get_zone(home_zone_id) if home_zone_id else None
+        if zone is None:
+            return NO_RESIDENCE
+        return f"{zone['world_name']}, {zone['lot_name']}"
+
+    def warm(self):
+        """Reads the current zone and the homes of every household with a sim on it."""
+        try:
+            zone_ids = {services.current_zone_id()}
+            for sim_info in CommonSimUtils.get_instanced_sim_info_for_all_sims_generator():
+                household = sim_info.household
+                if household and household.home_zone_id:
+                    zone_ids.add(household.home_zone_id)
+            for zone_id in zone_ids:
+                if zone_id:
+                    self.get_zone(zone_id)
+            log.debug(f"Residence cache warmed with {len(self._zones)} zones.")
+        except Exception as e:
+            log.error("Failed to warm residence cache", exception=e)
+
+    def clear(self):
+        self._zones.clear()
+
+    def get_stats(self):
+        return {"zones": len(self._zones), "hits": self.hits, "misses": self.misses}
+
+    def _read_zone(self, zone_id):
+        try:
+            persistence_service = services.get_persistence_service()
+            zone_proto = persistence_service.get_zone_proto_buff(zone_id) if persistence_service else None
+            if zone_proto is None:
+                return None
+            neighborhood_proto = persistence_service.get_neighborhood_proto_buff(zone_proto.neighborhood_id)
+            return {
+                "lot_name": zone_proto.name,
+                "world_name": neighborhood_proto.name if neighborhood_proto else "Unknown World",
+                "world_id": zone_proto.world_id,
+                "neighborhood_id": zone_proto.neighborhood_id
+            }
+        except Exception as e:
+            log.error(f"Failed to read zone {zone_id}", exception=e)
+            return None
+
+# --- REGISTER LIFECYCLE HOOKS (S4CL Compliant) ---
+class SimsAIResidenceCacheListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # Travel, Manage Worlds and loading a save can all move households or rename lots
+        cache = SimsAIResidenceCache.get()
+        cache.clear()
+        cache.warm()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_build_buy_exit(event_data: S4CLBuildBuyExitEvent):
+        # The lot may have been renamed in build mode
+        cache = SimsAIResidenceCache.get()
+        cache.clear()
+        cache.warm()
+        return True
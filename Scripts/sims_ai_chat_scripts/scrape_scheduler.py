@@ -0,0 +1,87 @@
+# Scripts/sims_ai_chat_scripts/scrape_scheduler.py
+
+import time
+from collections import deque
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+from sims_ai_chat_scripts import perf
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'ScrapeScheduler')
+
+# --- CONFIGURATION ---
+SLICE_BUDGET_MS = 4 # Game thread time spent on scraping per zone update
+
+class SimsAIScrapeScheduler(CommonService):
+    """
+    Spreads scrapes over game ticks so a big group never stalls one frame.
+    A job is a generator that yields after each small unit of work (one profile section, one
+    pair of helpers) and returns the finished payload. Every zone update advances the queued
+    jobs, oldest first, until SLICE_BUDGET_MS is used up; a step is never interrupted, so the
+    budget is a target, not a cap. Jobs may be submitted from any thread but only ever run on
+    the game thread.
+    """
+    def __init__(self):
+        self._jobs = deque() # [name, generator, on_done, on_error, ms spent]
+
+    def submit(self, name, job, on_done, on_error=None):
+        """Queues the job; on_done(result) / on_error(exception) run on the game thread when it ends."""
+        self._jobs.append([name, job, on_done, on_error, 0.0])
+
+    @property
+    def is_busy(self):
+        return bool(self._jobs)
+
+    def pump(self, budget_ms=SLICE_BUDGET_MS):
+        if not self._jobs:
+            return
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000
+        while self._jobs and time.perf_counter() < deadline:
+            entry = self._jobs[0]
+            name, job, on_done, on_error, _ = entry
+            step_start = time.perf_counter()
+            try:
+                next(job)
+                entry[4] += (time.perf_counter() - step_start) * 1000
+                continue
+            except StopIteration as finished:
+                entry[4] += (time.perf_counter() - step_start) * 1000
+                self._jobs.popleft()
+                perf.record(name, entry[4]) # Game thread time of the whole job, across all its slices
+                self._finish(name, on_done, finished.value)
+            except Exception as e:
+                self._jobs.popleft()
+                log.error(f"Scrape job {name} failed", exception=e)
+                if on_error:
+                    self._finish(name, on_error, e)
+        perf.record("scrape.slice", (time.perf_counter() - start) * 1000)
+
+    def cancel_all(self):
+        for _, job, _, _, _ in self._jobs:
+            job.close()
+        self._jobs.clear()
+
+    def _finish(self, name, callback, value):
+        try:
+            callback(value)
+        except Exception as e:
+            log.error(f"Error finishing scrape job {name}", exception=e)
+
+# --- REGISTER GAME THREAD PUMP (S4CL Compliant) ---
+class SimsAIScrapeSchedulerListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_update(event_data: S4CLZoneUpdateEvent):
+        SimsAIScrapeScheduler.get().pump()
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # Jobs hold SimInfos of the zone that was just left
+        SimsAIScrapeScheduler.get().cancel_all()
+        return True
@@ -0,0 +1,115 @@
+# Scripts/sims_ai_chat_scripts/server_connection.py
+
+import http.client
+import json
+import socket
+import threading
+from sims_ai_chat_scripts import perf
+
+# --- CONFIGURATION ---
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 3000
+DEFAULT_TIMEOUT = 5 # Seconds
+# Marks requests as coming from the game; the server's watchdog counts any of them as a heartbeat
+CLIENT_HEADERS = {"X-SimsAIChat-Client": "mod"}
+
+# Errors that mean the kept-alive socket went stale (server restarted, idle timeout)
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                            http.client.BadStatusLine, ConnectionResetError, BrokenPipeError,
+                            ConnectionAbortedError)
+
+class ServerResponseError(Exception):
+    """The server answered with an HTTP error status."""
+    def __init__(self, status, reason):
+        super().__init__(f"HTTP {status}: {reason}")
+        self.status = status
+
+class ServerNotReachedError(ConnectionError):
+    """Connecting to the server failed, so nothing was sent and the request may be repeated."""
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "connections_opened": 0, "reconnects": 0, "errors": 0}
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+def _get_connection(timeout):
+    """The calling thread's keep-alive connection (opened lazily, one per thread)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPConnection(SERVER_HOST, SERVER_PORT, timeout=timeout)
+        _local.conn = conn
+    if conn.sock is not None and conn.timeout != timeout:
+        conn.sock.settimeout(timeout)
+    conn.timeout = timeout
+    return conn
+
+def close_connection():
+    """Closes the calling thread's connection, e.g. when its worker stops."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+def request(method, path, payload=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Sends one request over the calling thread's persistent connection and returns the JSON
+    response as a dict. A socket that went stale since its last use is reopened once.
+    Raises ServerResponseError for HTTP errors, ServerNotReachedError if no connection could be
+    opened, and OSError/http.client errors otherwise (the server may then have seen the request).
+    """
+    with perf.span("http " + path):
+        return _send(method, path, payload, timeout)
+
+def _send(method, path, payload, timeout):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else None
+    headers = dict(CLIENT_HEADERS)
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+
+    for attempt in range(2):
+        conn = _get_connection(timeout)
+        reused = conn.sock is not None
+        try:
+            if not reused:
+                try:
+                    conn.connect()
+                except OSError as e:
+                    raise ServerNotReachedError(str(e)) from e
+                # Small request/response pairs: do not let Nagle hold them back on a reused socket
+                conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                _count("connections_opened")
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read() # Must be drained before the connection can be reused
+            if response.will_close:
+                close_connection()
+            break
+        except ServerNotReachedError:
+            close_connection()
+            _count("errors")
+            raise
+        except _STALE_CONNECTION_ERRORS:
+            close_connection()
+            if not reused or attempt:
+                _count("errors")
+                raise
+            _count("reconnects")
+        except (OSError, socket.timeout, http.client.HTTPException):
+            close_connection()
+            _count("errors")
+            raise
+
+    _count("requests")
+    if response.status >= 400:
+        raise ServerResponseError(response.status, response.reason)
+    try:
+        return json.loads(data.decode('utf-8')) if data else {}
+    except ValueError:
+        return {}
+
+def get_connection_stats():
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,56 @@
+# Scripts/sims_ai_chat_scripts/skill_names.py
+
+import services
+import sims4.resources
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims_ai_chat_scripts.modinfo import ModInfo
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity(), 'SkillNames')
+
+# Tuning name prefixes that mean nothing to the AI, e.g. "Statistic_Skill_AdultMajor_Charisma" -> "Charisma"
+_NAME_NOISE = ("Statistic_", "Skill_", "AdultMajor_", "AdultMinor_", "Toddler_", "Child_", "Species_")
+
+# Skill tuning guid -> display name, filled once from the statistic instance manager
+SKILL_NAMES = {}
+
+def clean_skill_name(raw_name):
+    for noise in _NAME_NOISE:
+        raw_name = raw_name.replace(noise, "")
+    return raw_name.replace("_", " ")
+
+def build_skill_name_table():
+    """Names every skill tuning once. Later lookups of unknown skills are added on the fly."""
+    try:
+        from statistics.skill import Skill
+        manager = services.get_instance_manager(sims4.resources.Types.STATISTIC)
+        for stat_type in manager.types.values():
+            if issubclass(stat_type, Skill):
+                SKILL_NAMES[stat_type.guid64] = clean_skill_name(stat_type.__name__)
+    except Exception as e:
+        log.error("Failed to build skill name table", exception=e)
+    return SKILL_NAMES
+
+def get_skill_name(skill_type):
+    """Display name of a skill tuning class."""
+    if not SKILL_NAMES:
+        build_skill_name_table()
+    guid = getattr(skill_type, 'guid64', None)
+    name = SKILL_NAMES.get(guid)
+    if name is None:
+        raw_name = skill_type.__name__ if hasattr(skill_type, '__name__') else str(skill_type)
+        name = clean_skill_name(raw_name)
+        if guid is not None:
+            SKILL_NAMES[guid] = name
+    return name
+
+# --- REGISTER LIFECYCLE HOOK (S4CL Compliant) ---
+class SimsAISkillNamesListener:
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def handle_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        # Tuning is loaded by now; name every skill once behind the loading screen
+        if not SKILL_NAMES:
+            build_skill_name_table()
+        return True
@@ -0,0 +1,351 @@
+# Scripts/sims_ai_chat_scripts/trait_table.py
+# GENERATED from Scripts/lookup_sources/trait_data.py by Scripts/compile/build_lookup_tables.py - do not edit.
+
+FIELDS = 2
+COUNT = 841
+IDS = (
+    b'j$\x00\x00\x00\x00\x00\x00t$\x00\x00\x00\x00\x00\x00y$\x00\x00\x00\x00\x00\x00\x7f%\x00\x00\x00\x00\x00\x00\x82%\x00\x00\x00\x00\x00\x00\x84%\x00\x00\x00\x00\x00\x00\x91%\x00\x00\x00\x00\x00\x00\x94%\x00\x00\x00\x00\x00\x00\xb7A\x00\x00\x00\x00\x00\x00\xb8A\x00\x00\x00\x00\x00\x00\xbaA\x00\x00\x00\x00\x00\x00\xbeA\x00\x00\x00\x00\x00\x00'
+    b'\xc0A\x00\x00\x00\x00\x00\x00\xc1A\x00\x00\x00\x00\x00\x00\xc4A\x00\x00\x00\x00\x00\x00\xc6A\x00\x00\x00\x00\x00\x00\xc9A\x00\x00\x00\x00\x00\x00\xcbA\x00\x00\x00\x00\x00\x00\xccA\x00\x00\x00\x00\x00\x00\xcdA\x00\x00\x00\x00\x00\x00\xd0A\x00\x00\x00\x00\x00\x00\xd2A\x00\x00\x00\x00\x00\x00\xd9A\x00\x00\x00\x00\x00\x00\xdaA\x00\x00\x00\x00\x00\x00'
+    b'\xdcA\x00\x00\x00\x00\x00\x00Uf\x00\x00\x00\x00\x00\x00Vf\x00\x00\x00\x00\x00\x00Wf\x00\x00\x00\x00\x00\x00Xf\x00\x00\x00\x00\x00\x00Yf\x00\x00\x00\x00\x00\x00Zf\x00\x00\x00\x00\x00\x00[f\x00\x00\x00\x00\x00\x00\x14g\x00\x00\x00\x00\x00\x00\x15g\x00\x00\x00\x00\x00\x00\x16g\x00\x00\x00\x00\x00\x00\x17g\x00\x00\x00\x00\x00\x00'
+    b'\x18g\x00\x00\x00\x00\x00\x00\x19g\x00\x00\x00\x00\x00\x00;g\x00\x00\x00\x00\x00\x00Gg\x00\x00\x00\x00\x00\x00lg\x00\x00\x00\x00\x00\x00\x82g\x00\x00\x00\x00\x00\x00\x0fh\x00\x00\x00\x00\x00\x00>h\x00\x00\x00\x00\x00\x00Ch\x00\x00\x00\x00\x00\x00\x14i\x00\x00\x00\x00\x00\x00\xc8i\x00\x00\x00\x00\x00\x00\xc9i\x00\x00\x00\x00\x00\x00'
+    b'\xcai\x00\x00\x00\x00\x00\x00\xcbi\x00\x00\x00\x00\x00\x00\xcci\x00\x00\x00\x00\x00\x00\xcdi\x00\x00\x00\x00\x00\x00\xcei\x00\x00\x00\x00\x00\x00\xcfi\x00\x00\x00\x00\x00\x00\xd3i\x00\x00\x00\x00\x00\x00"j\x00\x00\x00\x00\x00\x00$j\x00\x00\x00\x00\x00\x00(j\x00\x00\x00\x00\x00\x000j\x00\x00\x00\x00\x00\x00Qj\x00\x00\x00\x00\x00\x00'
+    b'\xc0j\x00\x00\x00\x00\x00\x00\x1bk\x00\x00\x00\x00\x00\x00>k\x00\x00\x00\x00\x00\x00,l\x00\x00\x00\x00\x00\x00|l\x00\x00\x00\x00\x00\x00\tm\x00\x00\x00\x00\x00\x00\nm\x00\x00\x00\x00\x00\x00\x0bm\x00\x00\x00\x00\x00\x00\x0cm\x00\x00\x00\x00\x00\x00\rm\x00\x00\x00\x00\x00\x00\x0em\x00\x00\x00\x00\x00\x00&m\x00\x00\x00\x00\x00\x00'
+    b'+m\x00\x00\x00\x00\x00\x00im\x00\x00\x00\x00\x00\x00\x83s\x00\x00\x00\x00\x00\x00\xb2s\x00\x00\x00\x00\x00\x00\xb3s\x00\x00\x00\x00\x00\x00\xb4s\x00\x00\x00\x00\x00\x00\xb6s\x00\x00\x00\x00\x00\x00\x83t\x00\x00\x00\x00\x00\x00\x8dt\x00\x00\x00\x00\x00\x00\xcax\x00\x00\x00\x00\x00\x00\xb4|\x00\x00\x00\x00\x00\x00n}\x00\x00\x00\x00\x00\x00'
+    b'o}\x00\x00\x00\x00\x00\x00\xa7~\x00\x00\x00\x00\x00\x00\xa8~\x00\x00\x00\x00\x00\x00\xaa~\x00\x00\x00\x00\x00\x00\xad~\x00\x00\x00\x00\x00\x00\xaf~\x00\x00\x00\x00\x00\x00\xba~\x00\x00\x00\x00\x00\x00\xbc~\x00\x00\x00\x00\x00\x00m\x7f\x00\x00\x00\x00\x00\x00{\x7f\x00\x00\x00\x00\x00\x00\xb0\x8a\x00\x00\x00\x00\x00\x00\xb7\x8a\x00\x00\x00\x00\x00\x00'
+    b"\x87\x8b\x00\x00\x00\x00\x00\x00\xc8\x9b\x00\x00\x00\x00\x00\x00'(\x01\x00\x00\x00\x00\x00\x11,\x01\x00\x00\x00\x00\x00\x15,\x01\x00\x00\x00\x00\x00,\x8d\x01\x00\x00\x00\x00\x00/\x8d\x01\x00\x00\x00\x00\x000\x8d\x01\x00\x00\x00\x00\x001\x8d\x01\x00\x00\x00\x00\x002\x8d\x01\x00\x00\x00\x00\x003\x8d\x01\x00\x00\x00\x00\x004\x8d\x01\x00\x00\x00\x00\x00"
+    b'5\x8d\x01\x00\x00\x00\x00\x00H\x8d\x01\x00\x00\x00\x00\x00\xc0\x8f\x01\x00\x00\x00\x00\x00\x7f\x91\x01\x00\x00\x00\x00\x00\x80\x91\x01\x00\x00\x00\x00\x00\x81\x91\x01\x00\x00\x00\x00\x00_\x93\x01\x00\x00\x00\x00\x00\xaf\x94\x01\x00\x00\x00\x00\x00\xb0\x99\x01\x00\x00\x00\x00\x00\xf8\xa1\x01\x00\x00\x00\x00\x00L\xa9\x01\x00\x00\x00\x00\x00\xea\xbe\x01\x00\x00\x00\x00\x00'
+    b'\x8f\xd4\x01\x00\x00\x00\x00\x00*\xe0\x01\x00\x00\x00\x00\x00\xcf\xe7\x01\x00\x00\x00\x00\x00\xfd\xe9\x01\x00\x00\x00\x00\x00\x88\xec\x01\x00\x00\x00\x00\x00\xc7\x02\x02\x00\x00\x00\x00\x00\xc8\x04\x02\x00\x00\x00\x00\x00\xed\x05\x02\x00\x00\x00\x00\x00\x13\x06\x02\x00\x00\x00\x00\x00\xad\x16\x02\x00\x00\x00\x00\x00\xae\x16\x02\x00\x00\x00\x00\x00\xaf\x16\x02\x00\x00\x00\x00\x00'
+    b'\xb0\x16\x02\x00\x00\x00\x00\x00\xf5\x18\x02\x00\x00\x00\x00\x00g!\x02\x00\x00\x00\x00\x00\xc3%\x02\x00\x00\x00\x00\x00\xc4%\x02\x00\x00\x00\x00\x00\xc5%\x02\x00\x00\x00\x00\x00\xc6%\x02\x00\x00\x00\x00\x00\xc7%\x02\x00\x00\x00\x00\x00\xc8%\x02\x00\x00\x00\x00\x00\xc9%\x02\x00\x00\x00\x00\x00\xca%\x02\x00\x00\x00\x00\x00G3\x02\x00\x00\x00\x00\x00'
+    b'R6\x02\x00\x00\x00\x00\x00\xb7:\x02\x00\x00\x00\x00\x00\xb8:\x02\x00\x00\x00\x00\x00\x17H\x02\x00\x00\x00\x00\x00\xfbO\x02\x00\x00\x00\x00\x00OZ\x02\x00\x00\x00\x00\x00\xc9\\\x02\x00\x00\x00\x00\x00\xba^\x02\x00\x00\x00\x00\x00\xbb^\x02\x00\x00\x00\x00\x00\x1ai\x02\x00\x00\x00\x00\x00\x1bi\x02\x00\x00\x00\x00\x00\tr\x02\x00\x00\x00\x00\x00'
+    b'\x13r\x02\x00\x00\x00\x00\x00It\x02\x00\x00\x00\x00\x00Pt\x02\x00\x00\x00\x00\x00^t\x02\x00\x00\x00\x00\x00\xbat\x02\x00\x00\x00\x00\x00Yw\x02\x00\x00\x00\x00\x00Zw\x02\x00\x00\x00\x00\x00[w\x02\x00\x00\x00\x00\x00\\w\x02\x00\x00\x00\x00\x00\x9b\x83\x02\x00\x00\x00\x00\x00\x9c\x83\x02\x00\x00\x00\x00\x00\x9d\x83\x02\x00\x00\x00\x00\x00'
+    b'\x9e\x83\x02\x00\x00\x00\x00\x00\x9f\x83\x02\x00\x00\x00\x00\x00\xa0\x83\x02\x00\x00\x00\x00\x00\xa1\x83\x02\x00\x00\x00\x00\x00l\x84\x02\x00\x00\x00\x00\x00m\x84\x02\x00\x00\x00\x00\x00n\x84\x02\x00\x00\x00\x00\x00o\x84\x02\x00\x00\x00\x00\x00\xa1\x84\x02\x00\x00\x00\x00\x00)\x9f\x02\x00\x00\x00\x00\x000\x9f\x02\x00\x00\x00\x00\x00\x88\xb0\x02\x00\x00\x00\x00\x00'
+    b'2\xbb\x02\x00\x00\x00\x00\x00O\xbb\x02\x00\x00\x00\x00\x00\x9e\xc6\x02\x00\x00\x00\x00\x00\xa9\xc7\x02\x00\x00\x00\x00\x00\xf0\xca\x02\x00\x00\x00\x00\x00\xfa\xca\x02\x00\x00\x00\x00\x00\xfb\xca\x02\x00\x00\x00\x00\x00\xfd\xca\x02\x00\x00\x00\x00\x00A\xcc\x02\x00\x00\x00\x00\x00\xd1\xcc\x02\x00\x00\x00\x00\x00\xd2\xcc\x02\x00\x00\x00\x00\x00\xd3\xcc\x02\x00\x00\x00\x00\x00'
+    b'\xd4\xcc\x02\x00\x00\x00\x00\x00w\xd2\x02\x00\x00\x00\x00\x00\xc2\xd5\x02\x00\x00\x00\x00\x00\xc3\xd5\x02\x00\x00\x00\x00\x00\xdb\xd7\x02\x00\x00\x00\x00\x00Y\xdc\x02\x00\x00\x00\x00\x00\x1c\xe9\x02\x00\x00\x00\x00\x00\x84\xf1\x02\x00\x00\x00\x00\x00\xfb\xf3\x02\x00\x00\x00\x00\x00\xe5\x08\x03\x00\x00\x00\x00\x00\x83\t\x03\x00\x00\x00\x00\x00\x89\x0b\x03\x00\x00\x00\x00\x00'
+    b'\x86\x10\x03\x00\x00\x00\x00\x00\xbf\x12\x03\x00\x00\x00\x00\x00\x16\x1b\x03\x00\x00\x00\x00\x00\x0c\x1d\x03\x00\x00\x00\x00\x00}\x1d\x03\x00\x00\x00\x00\x00\xcc\x1e\x03\x00\x00\x00\x00\x00\xcd\x1e\x03\x00\x00\x00\x00\x00P&\x03\x00\x00\x00\x00\x00S&\x03\x00\x00\x00\x00\x003:\x03\x00\x00\x00\x00\x00\xbd:\x03\x00\x00\x00\x00\x00\x03<\x03\x00\x00\x00\x00\x00'
+    b':@\x03\x00\x00\x00\x00\x00\xbf@\x03\x00\x00\x00\x00\x00uE\x03\x00\x00\x00\x00\x00\x89E\x03\x00\x00\x00\x00\x00sF\x03\x00\x00\x00\x00\x00tF\x03\x00\x00\x00\x00\x00uF\x03\x00\x00\x00\x00\x00vF\x03\x00\x00\x00\x00\x00wF\x03\x00\x00\x00\x00\x00xF\x03\x00\x00\x00\x00\x00yF\x03\x00\x00\x00\x00\x00zF\x03\x00\x00\x00\x00\x00'
+    b'\x8eO\x03\x00\x00\x00\x00\x00\x1dQ\x03\x00\x00\x00\x00\x00DQ\x03\x00\x00\x00\x00\x00\xa9S\x03\x00\x00\x00\x00\x00\xaaS\x03\x00\x00\x00\x00\x00\xabS\x03\x00\x00\x00\x00\x00\xc4S\x03\x00\x00\x00\x00\x00\xc5S\x03\x00\x00\x00\x00\x00\xc6S\x03\x00\x00\x00\x00\x00\x00T\x03\x00\x00\x00\x00\x00\x01T\x03\x00\x00\x00\x00\x00\x02T\x03\x00\x00\x00\x00\x00'
+    b'\x03T\x03\x00\x00\x00\x00\x00\x05T\x03\x00\x00\x00\x00\x00\x06T\x03\x00\x00\x00\x00\x00\x07T\x03\x00\x00\x00\x00\x00\x08T\x03\x00\x00\x00\x00\x00\nT\x03\x00\x00\x00\x00\x00\x0bT\x03\x00\x00\x00\x00\x00\x0cT\x03\x00\x00\x00\x00\x00\rT\x03\x00\x00\x00\x00\x00\x0fT\x03\x00\x00\x00\x00\x00\x11T\x03\x00\x00\x00\x00\x00\x12T\x03\x00\x00\x00\x00\x00'
+    b'5T\x03\x00\x00\x00\x00\x006T\x03\x00\x00\x00\x00\x007T\x03\x00\x00\x00\x00\x008T\x03\x00\x00\x00\x00\x00:T\x03\x00\x00\x00\x00\x00;T\x03\x00\x00\x00\x00\x00<T\x03\x00\x00\x00\x00\x00=T\x03\x00\x00\x00\x00\x00@T\x03\x00\x00\x00\x00\x00AT\x03\x00\x00\x00\x00\x00BT\x03\x00\x00\x00\x00\x00CT\x03\x00\x00\x00\x00\x00'
+    b'FT\x03\x00\x00\x00\x00\x00GT\x03\x00\x00\x00\x00\x00HT\x03\x00\x00\x00\x00\x00IT\x03\x00\x00\x00\x00\x00KT\x03\x00\x00\x00\x00\x00LT\x03\x00\x00\x00\x00\x00MT\x03\x00\x00\x00\x00\x00NT\x03\x00\x00\x00\x00\x00PT\x03\x00\x00\x00\x00\x00QT\x03\x00\x00\x00\x00\x00RT\x03\x00\x00\x00\x00\x00ST\x03\x00\x00\x00\x00\x00'
+    b'VT\x03\x00\x00\x00\x00\x00WT\x03\x00\x00\x00\x00\x00XT\x03\x00\x00\x00\x00\x00YT\x03\x00\x00\x00\x00\x00[T\x03\x00\x00\x00\x00\x00\\T\x03\x00\x00\x00\x00\x00]T\x03\x00\x00\x00\x00\x00^T\x03\x00\x00\x00\x00\x00LU\x03\x00\x00\x00\x00\x00ZW\x03\x00\x00\x00\x00\x00\\W\x03\x00\x00\x00\x00\x00]W\x03\x00\x00\x00\x00\x00'
+    b'^W\x03\x00\x00\x00\x00\x00`W\x03\x00\x00\x00\x00\x00\x0fZ\x03\x00\x00\x00\x00\x00yu\x03\x00\x00\x00\x00\x00=v\x03\x00\x00\x00\x00\x00\x1ew\x03\x00\x00\x00\x00\x00\xef{\x03\x00\x00\x00\x00\x00Y\x85\x03\x00\x00\x00\x00\x00\x14\x89\x03\x00\x00\x00\x00\x00\x91\x8a\x03\x00\x00\x00\x00\x00\xf4\x8c\x03\x00\x00\x00\x00\x00\xae\x93\x03\x00\x00\x00\x00\x00'
+    b'F\x94\x03\x00\x00\x00\x00\x00G\x94\x03\x00\x00\x00\x00\x00`\x95\x03\x00\x00\x00\x00\x00\x87\x95\x03\x00\x00\x00\x00\x00\x89\x95\x03\x00\x00\x00\x00\x00\xdb\x99\x03\x00\x00\x00\x00\x00\x95\x9d\x03\x00\x00\x00\x00\x00=\xa4\x03\x00\x00\x00\x00\x00>\xa4\x03\x00\x00\x00\x00\x00?\xa4\x03\x00\x00\x00\x00\x00@\xa4\x03\x00\x00\x00\x00\x00\xfb\xaa\x03\x00\x00\x00\x00\x00'
+    b'D\xc0\x03\x00\x00\x00\x00\x00I\xc2\x03\x00\x00\x00\x00\x00\xf3\xc2\x03\x00\x00\x00\x00\x00\xa8\xc4\x03\x00\x00\x00\x00\x00\xa9\xc4\x03\x00\x00\x00\x00\x002\xc7\x03\x00\x00\x00\x00\x003\xc7\x03\x00\x00\x00\x00\x00E\xc9\x03\x00\x00\x00\x00\x00W\xc9\x03\x00\x00\x00\x00\x00(\xcb\x03\x00\x00\x00\x00\x00)\xcb\x03\x00\x00\x00\x00\x00\xfd\xcb\x03\x00\x00\x00\x00\x00'
+    b'\xfe\xcb\x03\x00\x00\x00\x00\x00\xff\xcb\x03\x00\x00\x00\x00\x00\x96\xcc\x03\x00\x00\x00\x00\x00\x97\xcc\x03\x00\x00\x00\x00\x00S\xce\x03\x00\x00\x00\x00\x00U\xce\x03\x00\x00\x00\x00\x00V\xce\x03\x00\x00\x00\x00\x00\x83\xcf\x03\x00\x00\x00\x00\x00\x84\xcf\x03\x00\x00\x00\x00\x00\x93\xcf\x03\x00\x00\x00\x00\x00p\xd1\x03\x00\x00\x00\x00\x00%\xd3\x03\x00\x00\x00\x00\x00'
+    b'&\xd3\x03\x00\x00\x00\x00\x00B\xd8\x03\x00\x00\x00\x00\x00\xb5\xd8\x03\x00\x00\x00\x00\x00\x92\xdb\x03\x00\x00\x00\x00\x00T\xdd\x03\x00\x00\x00\x00\x00\x11\xeb\x03\x00\x00\x00\x00\x00\x12\xeb\x03\x00\x00\x00\x00\x00U\xed\x03\x00\x00\x00\x00\x00W\xed\x03\x00\x00\x00\x00\x00?\xef\x03\x00\x00\x00\x00\x00D\xef\x03\x00\x00\x00\x00\x00E\xef\x03\x00\x00\x00\x00\x00'
+    b'F\xef\x03\x00\x00\x00\x00\x00G\xef\x03\x00\x00\x00\x00\x00H\xef\x03\x00\x00\x00\x00\x00K\xef\x03\x00\x00\x00\x00\x00L\xef\x03\x00\x00\x00\x00\x00M\xef\x03\x00\x00\x00\x00\x00N\xef\x03\x00\x00\x00\x00\x00O\xef\x03\x00\x00\x00\x00\x00P\xef\x03\x00\x00\x00\x00\x00Q\xef\x03\x00\x00\x00\x00\x00S\xef\x03\x00\x00\x00\x00\x00T\xef\x03\x00\x00\x00\x00\x00'
+    b'U\xef\x03\x00\x00\x00\x00\x00V\xef\x03\x00\x00\x00\x00\x00W\xef\x03\x00\x00\x00\x00\x00\\\xef\x03\x00\x00\x00\x00\x00]\xef\x03\x00\x00\x00\x00\x00^\xef\x03\x00\x00\x00\x00\x00_\xef\x03\x00\x00\x00\x00\x00`\xef\x03\x00\x00\x00\x00\x00a\xef\x03\x00\x00\x00\x00\x00b\xef\x03\x00\x00\x00\x00\x00d\xef\x03\x00\x00\x00\x00\x00e\xef\x03\x00\x00\x00\x00\x00'
+    b'f\xef\x03\x00\x00\x00\x00\x00g\xef\x03\x00\x00\x00\x00\x00h\xef\x03\x00\x00\x00\x00\x00i\xef\x03\x00\x00\x00\x00\x00j\xef\x03\x00\x00\x00\x00\x00l\xef\x03\x00\x00\x00\x00\x00m\xef\x03\x00\x00\x00\x00\x00x\xf0\x03\x00\x00\x00\x00\x00\x9a\xf0\x03\x00\x00\x00\x00\x00\x9b\xf0\x03\x00\x00\x00\x00\x00\x9c\xf0\x03\x00\x00\x00\x00\x00\x9d\xf0\x03\x00\x00\x00\x00\x00'
+    b'\x9f\xf0\x03\x00\x00\x00\x00\x00\xa0\xf0\x03\x00\x00\x00\x00\x00\xa1\xf0\x03\x00\x00\x00\x00\x00\xa2\xf0\x03\x00\x00\x00\x00\x00\xa3\xf0\x03\x00\x00\x00\x00\x00\xa4\xf0\x03\x00\x00\x00\x00\x00\xa5\xf0\x03\x00\x00\x00\x00\x00\xa6\xf0\x03\x00\x00\x00\x00\x00\xa7\xf0\x03\x00\x00\x00\x00\x00\xa8\xf0\x03\x00\x00\x00\x00\x00\xa9\xf0\x03\x00\x00\x00\x00\x00\xaa\xf0\x03\x00\x00\x00\x00\x00'
+    b'\xab\xf0\x03\x00\x00\x00\x00\x00\xac\xf0\x03\x00\x00\x00\x00\x00\xcf\xf0\x03\x00\x00\x00\x00\x00\xd0\xf0\x03\x00\x00\x00\x00\x00\xd1\xf0\x03\x00\x00\x00\x00\x00\xd2\xf0\x03\x00\x00\x00\x00\x00\xd3\xf0\x03\x00\x00\x00\x00\x00\xd4\xf0\x03\x00\x00\x00\x00\x00\xd5\xf0\x03\x00\x00\x00\x00\x00\xd6\xf0\x03\x00\x00\x00\x00\x00\xd7\xf0\x03\x00\x00\x00\x00\x00\xd8\xf0\x03\x00\x00\x00\x00\x00'
+    b'\xd9\xf0\x03\x00\x00\x00\x00\x00\xda\xf0\x03\x00\x00\x00\x00\x00\xdb\xf0\x03\x00\x00\x00\x00\x00\xdd\xf0\x03\x00\x00\x00\x00\x00\xde\xf0\x03\x00\x00\x00\x00\x00\xdf\xf0\x03\x00\x00\x00\x00\x00\xe0\xf0\x03\x00\x00\x00\x00\x00\xe1\xf0\x03\x00\x00\x00\x00\x00\xe2\xf0\x03\x00\x00\x00\x00\x00\xe3\xf0\x03\x00\x00\x00\x00\x00\xe4\xf0\x03\x00\x00\x00\x00\x00\xe5\xf0\x03\x00\x00\x00\x00\x00'
+    b'\xe6\xf0\x03\x00\x00\x00\x00\x00\xe7\xf0\x03\x00\x00\x00\x00\x00\xe8\xf0\x03\x00\x00\x00\x00\x00\xe9\xf0\x03\x00\x00\x00\x00\x00\xc6\xf2\x03\x00\x00\x00\x00\x00\xc7\xf2\x03\x00\x00\x00\x00\x00\xc8\xf2\x03\x00\x00\x00\x00\x00\xc9\xf2\x03\x00\x00\x00\x00\x00\xca\xf2\x03\x00\x00\x00\x00\x00\xcc\xf2\x03\x00\x00\x00\x00\x00\xcd\xf2\x03\x00\x00\x00\x00\x00\xce\xf2\x03\x00\x00\x00\x00\x00'
+    b'\xcf\xf2\x03\x00\x00\x00\x00\x00\xd0\xf2\x03\x00\x00\x00\x00\x00\xc6\xf3\x03\x00\x00\x00\x00\x00\xc7\xf3\x03\x00\x00\x00\x00\x00\xc8\xf3\x03\x00\x00\x00\x00\x00\xc9\xf3\x03\x00\x00\x00\x00\x00\xd0\xf3\x03\x00\x00\x00\x00\x00\xd2\xf3\x03\x00\x00\x00\x00\x00\xd4\xf3\x03\x00\x00\x00\x00\x00\xd5\xf3\x03\x00\x00\x00\x00\x00\xd6\xf3\x03\x00\x00\x00\x00\x00\xd7\xf3\x03\x00\x00\x00\x00\x00'
+    b'\xd8\xf3\x03\x00\x00\x00\x00\x00\xde\xf3\x03\x00\x00\x00\x00\x00\xdf\xf3\x03\x00\x00\x00\x00\x00\xe0\xf3\x03\x00\x00\x00\x00\x00\xe1\xf3\x03\x00\x00\x00\x00\x00\xe3\xf3\x03\x00\x00\x00\x00\x00\xe5\xf3\x03\x00\x00\x00\x00\x00\xe7\xf3\x03\x00\x00\x00\x00\x00\xef\xf3\x03\x00\x00\x00\x00\x00\xf0\xf3\x03\x00\x00\x00\x00\x00\xf1\xf3\x03\x00\x00\x00\x00\x00\xf2\xf3\x03\x00\x00\x00\x00\x00'
+    b'\xf3\xf3\x03\x00\x00\x00\x00\x00\xf4\xf3\x03\x00\x00\x00\x00\x00\x03\xf4\x03\x00\x00\x00\x00\x00\x04\xf4\x03\x00\x00\x00\x00\x00\x05\xf4\x03\x00\x00\x00\x00\x00\x06\xf4\x03\x00\x00\x00\x00\x00\x07\xf4\x03\x00\x00\x00\x00\x00\x08\xf4\x03\x00\x00\x00\x00\x00\t\xf4\x03\x00\x00\x00\x00\x00\n\xf4\x03\x00\x00\x00\x00\x00\x0b\xf4\x03\x00\x00\x00\x00\x00\x0c\xf4\x03\x00\x00\x00\x00\x00'
+    b'\r\xf4\x03\x00\x00\x00\x00\x00\x0e\xf4\x03\x00\x00\x00\x00\x00:\xfb\x03\x00\x00\x00\x00\x00\xcc\x07\x04\x00\x00\x00\x00\x00\xce\x07\x04\x00\x00\x00\x00\x00\xcf\x07\x04\x00\x00\x00\x00\x00\xd0\x07\x04\x00\x00\x00\x00\x00\xd1\x07\x04\x00\x00\x00\x00\x00\xd2\x07\x04\x00\x00\x00\x00\x00\xd3\x07\x04\x00\x00\x00\x00\x00\xd4\x07\x04\x00\x00\x00\x00\x00\xd5\x07\x04\x00\x00\x00\x00\x00'
+    b'\xd6\x07\x04\x00\x00\x00\x00\x00\xd7\x07\x04\x00\x00\x00\x00\x00\xdf\x07\x04\x00\x00\x00\x00\x00\xe0\x07\x04\x00\x00\x00\x00\x00\xe2\x07\x04\x00\x00\x00\x00\x00\xe3\x07\x04\x00\x00\x00\x00\x00\xe4\x07\x04\x00\x00\x00\x00\x00\xe5\x07\x04\x00\x00\x00\x00\x00\xe6\x07\x04\x00\x00\x00\x00\x00\xe8\x07\x04\x00\x00\x00\x00\x00\xea\x07\x04\x00\x00\x00\x00\x00\xeb\x07\x04\x00\x00\x00\x00\x00'
+    b'\xec\x07\x04\x00\x00\x00\x00\x00\xed\x07\x04\x00\x00\x00\x00\x00\xee\x07\x04\x00\x00\x00\x00\x00\xef\x07\x04\x00\x00\x00\x00\x00\xf1\x07\x04\x00\x00\x00\x00\x00\xf2\x07\x04\x00\x00\x00\x00\x00\xf3\x07\x04\x00\x00\x00\x00\x00\xf4\x07\x04\x00\x00\x00\x00\x00\xf5\x07\x04\x00\x00\x00\x00\x00\xf6\x07\x04\x00\x00\x00\x00\x00\xf7\x07\x04\x00\x00\x00\x00\x00\xf8\x07\x04\x00\x00\x00\x00\x00'
+    b'\xf9\x07\x04\x00\x00\x00\x00\x00\xfa\x07\x04\x00\x00\x00\x00\x00\xfb\x07\x04\x00\x00\x00\x00\x00\xfc\x07\x04\x00\x00\x00\x00\x00\xfd\x07\x04\x00\x00\x00\x00\x00\xfe\x07\x04\x00\x00\x00\x00\x00\xff\x07\x04\x00\x00\x00\x00\x00\x00\x08\x04\x00\x00\x00\x00\x00\x01\x08\x04\x00\x00\x00\x00\x00\x03\x08\x04\x00\x00\x00\x00\x00\x04\x08\x04\x00\x00\x00\x00\x00\x05\x08\x04\x00\x00\x00\x00\x00'
+    b'\x06\x08\x04\x00\x00\x00\x00\x00\x07\x08\x04\x00\x00\x00\x00\x00\x08\x08\x04\x00\x00\x00\x00\x00b\t\x04\x00\x00\x00\x00\x00c\t\x04\x00\x00\x00\x00\x00\x12\x15\x04\x00\x00\x00\x00\x00\x13\x15\x04\x00\x00\x00\x00\x00\xd8\x16\x04\x00\x00\x00\x00\x00\xce\x1b\x04\x00\x00\x00\x00\x00\xcf\x1b\x04\x00\x00\x00\x00\x004"\x04\x00\x00\x00\x00\x006"\x04\x00\x00\x00\x00\x00'
+    b'7"\x04\x00\x00\x00\x00\x008"\x04\x00\x00\x00\x00\x00\xd0\'\x04\x00\x00\x00\x00\x00\xf5(\x04\x00\x00\x00\x00\x00\x1d)\x04\x00\x00\x00\x00\x00\x1e)\x04\x00\x00\x00\x00\x00[-\x04\x00\x00\x00\x00\x00\\-\x04\x00\x00\x00\x00\x00]-\x04\x00\x00\x00\x00\x00^-\x04\x00\x00\x00\x00\x00_-\x04\x00\x00\x00\x00\x00`-\x04\x00\x00\x00\x00\x00'
+    b'\\.\x04\x00\x00\x00\x00\x00\x8c0\x04\x00\x00\x00\x00\x00\x8d0\x04\x00\x00\x00\x00\x00\x8e0\x04\x00\x00\x00\x00\x00\x8f0\x04\x00\x00\x00\x00\x00\xa10\x04\x00\x00\x00\x00\x00\xa20\x04\x00\x00\x00\x00\x00\xda6\x04\x00\x00\x00\x00\x00\x0c8\x04\x00\x00\x00\x00\x00\r8\x04\x00\x00\x00\x00\x00\x0e8\x04\x00\x00\x00\x00\x00\x0f8\x04\x00\x00\x00\x00\x00'
+    b'\x108\x04\x00\x00\x00\x00\x00\x1d:\x04\x00\x00\x00\x00\x00\x1e:\x04\x00\x00\x00\x00\x00\x1f:\x04\x00\x00\x00\x00\x00 :\x04\x00\x00\x00\x00\x00X:\x04\x00\x00\x00\x00\x00Y:\x04\x00\x00\x00\x00\x00Z:\x04\x00\x00\x00\x00\x00[:\x04\x00\x00\x00\x00\x00\\:\x04\x00\x00\x00\x00\x00^:\x04\x00\x00\x00\x00\x00_:\x04\x00\x00\x00\x00\x00'
+    b'`:\x04\x00\x00\x00\x00\x00a:\x04\x00\x00\x00\x00\x00b:\x04\x00\x00\x00\x00\x00c:\x04\x00\x00\x00\x00\x00f:\x04\x00\x00\x00\x00\x00g:\x04\x00\x00\x00\x00\x00h:\x04\x00\x00\x00\x00\x00i:\x04\x00\x00\x00\x00\x00j:\x04\x00\x00\x00\x00\x00k:\x04\x00\x00\x00\x00\x00\xea<\x04\x00\x00\x00\x00\x00\xeb<\x04\x00\x00\x00\x00\x00'
+    b'\xec<\x04\x00\x00\x00\x00\x00\xed<\x04\x00\x00\x00\x00\x00\xee<\x04\x00\x00\x00\x00\x00\xe6=\x04\x00\x00\x00\x00\x00\x8fP\x04\x00\x00\x00\x00\x00\x13Q\x04\x00\x00\x00\x00\x00\x08R\x04\x00\x00\x00\x00\x00\x0bR\x04\x00\x00\x00\x00\x00\x0cR\x04\x00\x00\x00\x00\x00\rR\x04\x00\x00\x00\x00\x00\x0eR\x04\x00\x00\x00\x00\x00\x0fR\x04\x00\x00\x00\x00\x00'
+    b'\x10R\x04\x00\x00\x00\x00\x00\x11R\x04\x00\x00\x00\x00\x00\x12R\x04\x00\x00\x00\x00\x00\x13R\x04\x00\x00\x00\x00\x00\x14R\x04\x00\x00\x00\x00\x00\x19R\x04\x00\x00\x00\x00\x00\x1aR\x04\x00\x00\x00\x00\x00\x1dR\x04\x00\x00\x00\x00\x00\x1eR\x04\x00\x00\x00\x00\x00\x1fR\x04\x00\x00\x00\x00\x00 R\x04\x00\x00\x00\x00\x00!R\x04\x00\x00\x00\x00\x00'
+    b'\xd0U\x04\x00\x00\x00\x00\x00\xd1U\x04\x00\x00\x00\x00\x00\xccV\x04\x00\x00\x00\x00\x00\xb3Z\x04\x00\x00\x00\x00\x00\xb4Z\x04\x00\x00\x00\x00\x00\xb6Z\x04\x00\x00\x00\x00\x00\xb7Z\x04\x00\x00\x00\x00\x00\xb8Z\x04\x00\x00\x00\x00\x00\xb9Z\x04\x00\x00\x00\x00\x00\xbbZ\x04\x00\x00\x00\x00\x00\xbcZ\x04\x00\x00\x00\x00\x00\xc5Z\x04\x00\x00\x00\x00\x00'
+    b'\xc6Z\x04\x00\x00\x00\x00\x00\xc7Z\x04\x00\x00\x00\x00\x00\xc9Z\x04\x00\x00\x00\x00\x00\xcaZ\x04\x00\x00\x00\x00\x00\xcbZ\x04\x00\x00\x00\x00\x00\xccZ\x04\x00\x00\x00\x00\x00\xcdZ\x04\x00\x00\x00\x00\x00\xceZ\x04\x00\x00\x00\x00\x00\xcfZ\x04\x00\x00\x00\x00\x00\xd1\\\x04\x00\x00\x00\x00\x00\na\x04\x00\x00\x00\x00\x00\x0ba\x04\x00\x00\x00\x00\x00'
+    b'\x8ch\x04\x00\x00\x00\x00\x008i\x04\x00\x00\x00\x00\x00\xf4k\x04\x00\x00\x00\x00\x00|m\x04\x00\x00\x00\x00\x00\xa5p\x04\x00\x00\x00\x00\x00\x0eq\x04\x00\x00\x00\x00\x00/s\x04\x00\x00\x00\x00\x000s\x04\x00\x00\x00\x00\x001s\x04\x00\x00\x00\x00\x003s\x04\x00\x00\x00\x00\x00<s\x04\x00\x00\x00\x00\x00=s\x04\x00\x00\x00\x00\x00'
+    b'>s\x04\x00\x00\x00\x00\x00?s\x04\x00\x00\x00\x00\x00Zs\x04\x00\x00\x00\x00\x00[s\x04\x00\x00\x00\x00\x00\xfct\x04\x00\x00\x00\x00\x00\xfdt\x04\x00\x00\x00\x00\x00\xadu\x04\x00\x00\x00\x00\x00?}\x04\x00\x00\x00\x00\x00\x94}\x04\x00\x00\x00\x00\x00(\x8b\x04\x00\x00\x00\x00\x00\x18\xab\x04\x00\x00\x00\x00\x00\x19\xab\x04\x00\x00\x00\x00\x00'
+    b'\x1a\xab\x04\x00\x00\x00\x00\x00\x1b\xab\x04\x00\x00\x00\x00\x00\x1c\xab\x04\x00\x00\x00\x00\x00\x1d\xab\x04\x00\x00\x00\x00\x00(\xab\x04\x00\x00\x00\x00\x00)\xab\x04\x00\x00\x00\x00\x00,\xab\x04\x00\x00\x00\x00\x00-\xab\x04\x00\x00\x00\x00\x00.\xab\x04\x00\x00\x00\x00\x00/\xab\x04\x00\x00\x00\x00\x000\xab\x04\x00\x00\x00\x00\x001\xab\x04\x00\x00\x00\x00\x00'
+    b'2\xab\x04\x00\x00\x00\x00\x003\xab\x04\x00\x00\x00\x00\x004\xab\x04\x00\x00\x00\x00\x005\xab\x04\x00\x00\x00\x00\x00\xe7\xac\x04\x00\x00\x00\x00\x00\xe8\xac\x04\x00\x00\x00\x00\x00\xe9\xac\x04\x00\x00\x00\x00\x00\xea\xac\x04\x00\x00\x00\x00\x00\xeb\xac\x04\x00\x00\x00\x00\x00\xec\xac\x04\x00\x00\x00\x00\x00\xed\xac\x04\x00\x00\x00\x00\x00\xee\xac\x04\x00\x00\x00\x00\x00'
+    b'\xef\xac\x04\x00\x00\x00\x00\x00\xf0\xac\x04\x00\x00\x00\x00\x00\xf1\xac\x04\x00\x00\x00\x00\x00\xf2\xac\x04\x00\x00\x00\x00\x00\xf3\xac\x04\x00\x00\x00\x00\x00\xf4\xac\x04\x00\x00\x00\x00\x00\xf5\xac\x04\x00\x00\x00\x00\x00\xf6\xac\x04\x00\x00\x00\x00\x00\xf7\xac\x04\x00\x00\x00\x00\x00\xf8\xac\x04\x00\x00\x00\x00\x00\x1e\xad\x04\x00\x00\x00\x00\x00\x1f\xad\x04\x00\x00\x00\x00\x00'
+    b' \xad\x04\x00\x00\x00\x00\x00!\xad\x04\x00\x00\x00\x00\x00"\xad\x04\x00\x00\x00\x00\x00#\xad\x04\x00\x00\x00\x00\x00$\xad\x04\x00\x00\x00\x00\x00%\xad\x04\x00\x00\x00\x00\x00&\xad\x04\x00\x00\x00\x00\x00\'\xad\x04\x00\x00\x00\x00\x00(\xad\x04\x00\x00\x00\x00\x00)\xad\x04\x00\x00\x00\x00\x00*\xad\x04\x00\x00\x00\x00\x00+\xad\x04\x00\x00\x00\x00\x00'
+    b',\xad\x04\x00\x00\x00\x00\x00-\xad\x04\x00\x00\x00\x00\x00.\xad\x04\x00\x00\x00\x00\x00/\xad\x04\x00\x00\x00\x00\x001\xad\x04\x00\x00\x00\x00\x002\xad\x04\x00\x00\x00\x00\x003\xad\x04\x00\x00\x00\x00\x004\xad\x04\x00\x00\x00\x00\x005\xad\x04\x00\x00\x00\x00\x006\xad\x04\x00\x00\x00\x00\x007\xad\x04\x00\x00\x00\x00\x008\xad\x04\x00\x00\x00\x00\x00'
+    b'9\xad\x04\x00\x00\x00\x00\x00:\xad\x04\x00\x00\x00\x00\x00;\xad\x04\x00\x00\x00\x00\x00<\xad\x04\x00\x00\x00\x00\x00=\xad\x04\x00\x00\x00\x00\x00>\xad\x04\x00\x00\x00\x00\x00?\xad\x04\x00\x00\x00\x00\x00@\xad\x04\x00\x00\x00\x00\x00A\xad\x04\x00\x00\x00\x00\x00B\xad\x04\x00\x00\x00\x00\x00\xf5\xb2\x04\x00\x00\x00\x00\x00\x8c\xb4\x04\x00\x00\x00\x00\x00'
+    b'\x8d\xb4\x04\x00\x00\x00\x00\x00\x8e\xb4\x04\x00\x00\x00\x00\x00\x8f\xb4\x04\x00\x00\x00\x00\x00\xe3\xbf\x04\x00\x00\x00\x00\x00\xc5\xe5\x04\x00\x00\x00\x00\x00\xdc\xe5\x04\x00\x00\x00\x00\x00u\xe7\x04\x00\x00\x00\x00\x00\xae\xf0\x04\x00\x00\x00\x00\x00\xd0\xf8\x04\x00\x00\x00\x00\x00\xd1\xf8\x04\x00\x00\x00\x00\x00\xd2\xf8\x04\x00\x00\x00\x00\x00\xd3\xf8\x04\x00\x00\x00\x00\x00'
+    b'\xd4\xf8\x04\x00\x00\x00\x00\x00\xd5\xf8\x04\x00\x00\x00\x00\x00\xd6\xf8\x04\x00\x00\x00\x00\x00\xd7\xf8\x04\x00\x00\x00\x00\x00\xd8\xf8\x04\x00\x00\x00\x00\x00\xd9\xf8\x04\x00\x00\x00\x00\x00z\xf9\x04\x00\x00\x00\x00\x00{\xf9\x04\x00\x00\x00\x00\x00\xe6\x1b\x05\x00\x00\x00\x00\x00\xe7\x1b\x05\x00\x00\x00\x00\x00\xaf.\x05\x00\x00\x00\x00\x00\xb0.\x05\x00\x00\x00\x00\x00'
+    b'E/\x05\x00\x00\x00\x00\x00F/\x05\x00\x00\x00\x00\x00G/\x05\x00\x00\x00\x00\x00H/\x05\x00\x00\x00\x00\x00\xa62\x05\x00\x00\x00\x00\x00\x9c4\x05\x00\x00\x00\x00\x00\x9d4\x05\x00\x00\x00\x00\x00\x9e4\x05\x00\x00\x00\x00\x00\x9f4\x05\x00\x00\x00\x00\x00\xa04\x05\x00\x00\x00\x00\x00\xa14\x05\x00\x00\x00\x00\x00\xa84\x05\x00\x00\x00\x00\x00'
+    b'\xa94\x05\x00\x00\x00\x00\x00y7\x05\x00\x00\x00\x00\x00\x119\x05\x00\x00\x00\x00\x00\x87<\x05\x00\x00\x00\x00\x00\x88<\x05\x00\x00\x00\x00\x00=?\x05\x00\x00\x00\x00\x00\xa5H\x05\x00\x00\x00\x00\x00\xa7H\x05\x00\x00\x00\x00\x00\xbfX\x05\x00\x00\x00\x00\x00\xc0X\x05\x00\x00\x00\x00\x00E`\x05\x00\x00\x00\x00\x00F`\x05\x00\x00\x00\x00\x00'
+    b'\x98`\x05\x00\x00\x00\x00\x00*i\x05\x00\x00\x00\x00\x00dr\x05\x00\x00\x00\x00\x00\\\x84\x05\x00\x00\x00\x00\x00[\x85\x05\x00\x00\x00\x00\x00\\\x85\x05\x00\x00\x00\x00\x00]\x85\x05\x00\x00\x00\x00\x00^\x85\x05\x00\x00\x00\x00\x00_\x85\x05\x00\x00\x00\x00\x00`\x85\x05\x00\x00\x00\x00\x00j\x86\x05\x00\x00\x00\x00\x00c\x89\x05\x00\x00\x00\x00\x00'
+    b'\xc5\x8e\x05\x00\x00\x00\x00\x00\x9a\x91\x05\x00\x00\x00\x00\x00t\x9d\x05\x00\x00\x00\x00\x00\x80\x9d\x05\x00\x00\x00\x00\x00m\x9f\x05\x00\x00\x00\x00\x00h\xa0\x05\x00\x00\x00\x00\x00\xf7\xa9\x05\x00\x00\x00\x00\x00\xf8\xa9\x05\x00\x00\x00\x00\x00\xa2\xaa\x05\x00\x00\x00\x00\x00\xa3\xaa\x05\x00\x00\x00\x00\x00\xa4\xaa\x05\x00\x00\x00\x00\x00\xa5\xaa\x05\x00\x00\x00\x00\x00'
+    b'\xa6\xaa\x05\x00\x00\x00\x00\x00\xa7\xaa\x05\x00\x00\x00\x00\x00\xa8\xaa\x05\x00\x00\x00\x00\x00\xa9\xaa\x05\x00\x00\x00\x00\x00\xaa\xaa\x05\x00\x00\x00\x00\x00\xab\xaa\x05\x00\x00\x00\x00\x00\xac\xaa\x05\x00\x00\x00\x00\x00\xad\xaa\x05\x00\x00\x00\x00\x00\xae\xaa\x05\x00\x00\x00\x00\x00\xaf\xaa\x05\x00\x00\x00\x00\x00\xb0\xaa\x05\x00\x00\x00\x00\x00\xb1\xaa\x05\x00\x00\x00\x00\x00'
+    b'\xb2\xaa\x05\x00\x00\x00\x00\x00\x0c\xad\x05\x00\x00\x00\x00\x00B\xb4\x05\x00\x00\x00\x00\x00\x9c\xba\x05\x00\x00\x00\x00\x00\x86\xc0\x05\x00\x00\x00\x00\x00\x87\xc0\x05\x00\x00\x00\x00\x00\xdd\xc2\x05\x00\x00\x00\x00\x00\xb3\xc3\x05\x00\x00\x00\x00\x00\xb4\xc3\x05\x00\x00\x00\x00\x00\xb5\xc3\x05\x00\x00\x00\x00\x00\xba\xc8\x05\x00\x00\x00\x00\x00\xf3\xca\x05\x00\x00\x00\x00\x00'
+    b'N\xd2\x05\x00\x00\x00\x00\x00O\xd2\x05\x00\x00\x00\x00\x00P\xd2\x05\x00\x00\x00\x00\x00Q\xd2\x05\x00\x00\x00\x00\x00c\xd3\x05\x00\x00\x00\x00\x00\xad\xd3\x05\x00\x00\x00\x00\x00\xe3\xd8\x05\x00\x00\x00\x00\x00\xb6\xdc\x05\x00\x00\x00\x00\x00\x8f\xfd\x05\x00\x00\x00\x00\x00\x90\xfd\x05\x00\x00\x00\x00\x00S\x01\x06\x00\x00\x00\x00\x00\xd3\t\x06\x00\x00\x00\x00\x00'
+    b'\xd4\t\x06\x00\x00\x00\x00\x00 \x0b\x06\x00\x00\x00\x00\x00.\x12\x06\x00\x00\x00\x00\x00\xe2\x19\x06\x00\x00\x00\x00\x00\x80\x1a\x06\x00\x00\x00\x00\x00\x88!\x06\x00\x00\x00\x00\x00\x89!\x06\x00\x00\x00\x00\x00b+\x06\x00\x00\x00\x00\x00c+\x06\x00\x00\x00\x00\x00+/\x06\x00\x00\x00\x00\x00Wz\x06\x00\x00\x00\x00\x00\xdf\x84\x06\x00\x00\x00\x00\x00'
+    b'R\x86\x06\x00\x00\x00\x00\x00'
+)
+OFFSETS = (
+    b'\x00\x00\x00\x00\x14\x00\x00\x00&\x00\x00\x00:\x00\x00\x00J\x00\x00\x00[\x00\x00\x00r\x00\x00\x00\x8b\x00\x00\x00\x9b\x00\x00\x00\xb0\x00\x00\x00\xc8\x00\x00\x00\xd7\x00\x00\x00\xeb\x00\x00\x00\xfd\x00\x00\x00\x15\x01\x00\x00%\x01\x00\x00@\x01\x00\x00P\x01\x00\x00c\x01\x00\x00}\x01\x00\x00\x93\x01\x00\x00\xa6\x01\x00\x00\xba\x01\x00\x00\xca\x01\x00\x00'
+    b'\xda\x01\x00\x00\xea\x01\x00\x00\x02\x02\x00\x00\x1c\x02\x00\x003\x02\x00\x00F\x02\x00\x00]\x02\x00\x00q\x02\x00\x00\x81\x02\x00\x00\x93\x02\x00\x00\xa8\x02\x00\x00\xc9\x02\x00\x00\xde\x02\x00\x00\xf1\x02\x00\x00\x08\x03\x00\x00\x19\x03\x00\x00.\x03\x00\x00B\x03\x00\x00Q\x03\x00\x00d\x03\x00\x00w\x03\x00\x00\x83\x03\x00\x00\x91\x03\x00\x00\xab\x03\x00\x00'
+    b'\xbd\x03\x00\x00\xd6\x03\x00\x00\xe9\x03\x00\x00\xfd\x03\x00\x00\x17\x04\x00\x00/\x04\x00\x00D\x04\x00\x00Y\x04\x00\x00p\x04\x00\x00\x8a\x04\x00\x00\x9c\x04\x00\x00\xb3\x04\x00\x00\xca\x04\x00\x00\xdc\x04\x00\x00\xee\x04\x00\x00\x02\x05\x00\x00\x1b\x05\x00\x001\x05\x00\x00J\x05\x00\x00d\x05\x00\x00t\x05\x00\x00\x88\x05\x00\x00\x9a\x05\x00\x00\xaf\x05\x00\x00'
+    b'\xc2\x05\x00\x00\xd6\x05\x00\x00\xe8\x05\x00\x00\xfc\x05\x00\x00\x17\x06\x00\x002\x06\x00\x00K\x06\x00\x00d\x06\x00\x00\x85\x06\x00\x00\x9c\x06\x00\x00\xaf\x06\x00\x00\xbf\x06\x00\x00\xd6\x06\x00\x00\xe6\x06\x00\x00\xfe\x06\x00\x00\x11\x07\x00\x00)\x07\x00\x009\x07\x00\x00K\x07\x00\x00i\x07\x00\x00~\x07\x00\x00\x90\x07\x00\x00\xa0\x07\x00\x00\xb5\x07\x00\x00'
+    b'\xcc\x07\x00\x00\xe0\x07\x00\x00\xec\x07\x00\x00\x08\x08\x00\x00\x1f\x08\x00\x005\x08\x00\x00M\x08\x00\x00f\x08\x00\x00\x86\x08\x00\x00\xa7\x08\x00\x00\xc8\x08\x00\x00\xe2\x08\x00\x00\xfe\x08\x00\x00\x19\t\x00\x005\t\x00\x00J\t\x00\x00d\t\x00\x00v\t\x00\x00\x83\t\x00\x00\x9b\t\x00\x00\xb7\t\x00\x00\xcb\t\x00\x00\xe1\t\x00\x00\xf9\t\x00\x00'
+    b'\x13\n\x00\x00,\n\x00\x00H\n\x00\x00[\n\x00\x00n\n\x00\x00\x87\n\x00\x00\x9f\n\x00\x00\xc1\n\x00\x00\xd5\n\x00\x00\xeb\n\x00\x00\x03\x0b\x00\x00\x1e\x0b\x00\x007\x0b\x00\x00N\x0b\x00\x00l\x0b\x00\x00\x81\x0b\x00\x00\x92\x0b\x00\x00\xa5\x0b\x00\x00\xb5\x0b\x00\x00\xc8\x0b\x00\x00\xd9\x0b\x00\x00\xeb\x0b\x00\x00\x02\x0c\x00\x00\x19\x0c\x00\x00'
+    b'-\x0c\x00\x00F\x0c\x00\x00Y\x0c\x00\x00n\x0c\x00\x00}\x0c\x00\x00\x99\x0c\x00\x00\xa6\x0c\x00\x00\xc4\x0c\x00\x00\xdc\x0c\x00\x00\xf7\x0c\x00\x00\x0c\r\x00\x00!\r\x00\x00A\r\x00\x00^\r\x00\x00q\r\x00\x00\x83\r\x00\x00\x9c\r\x00\x00\xb1\r\x00\x00\xc8\r\x00\x00\xe1\r\x00\x00\xf0\r\x00\x00\x04\x0e\x00\x00\x1c\x0e\x00\x00/\x0e\x00\x00'
+    b'F\x0e\x00\x00W\x0e\x00\x00h\x0e\x00\x00|\x0e\x00\x00\x94\x0e\x00\x00\xac\x0e\x00\x00\xc4\x0e\x00\x00\xdc\x0e\x00\x00\xf4\x0e\x00\x00\x0c\x0f\x00\x00)\x0f\x00\x00D\x0f\x00\x00^\x0f\x00\x00z\x0f\x00\x00\x94\x0f\x00\x00\xb4\x0f\x00\x00\xd0\x0f\x00\x00\xe5\x0f\x00\x00\xfb\x0f\x00\x00\x0f\x10\x00\x00$\x10\x00\x00:\x10\x00\x00Q\x10\x00\x00h\x10\x00\x00'
+    b'x\x10\x00\x00\x89\x10\x00\x00\xa8\x10\x00\x00\xba\x10\x00\x00\xcf\x10\x00\x00\xec\x10\x00\x00\x00\x11\x00\x00 \x11\x00\x00>\x11\x00\x00`\x11\x00\x00\x81\x11\x00\x00\x90\x11\x00\x00\xa9\x11\x00\x00\xc1\x11\x00\x00\xd0\x11\x00\x00\xe4\x11\x00\x00\x01\x12\x00\x00%\x12\x00\x00E\x12\x00\x00c\x12\x00\x00y\x12\x00\x00\x97\x12\x00\x00\xaa\x12\x00\x00\xbd\x12\x00\x00'
+    b'\xd0\x12\x00\x00\xe3\x12\x00\x00\x00\x13\x00\x00\x15\x13\x00\x00C\x13\x00\x00]\x13\x00\x00u\x13\x00\x00\x97\x13\x00\x00\xb9\x13\x00\x00\xd9\x13\x00\x00\xf6\x13\x00\x00\x0f\x14\x00\x00/\x14\x00\x00W\x14\x00\x00u\x14\x00\x00\x8e\x14\x00\x00\xac\x14\x00\x00\xcc\x14\x00\x00\xed\x14\x00\x00\x00\x15\x00\x00\x1a\x15\x00\x004\x15\x00\x00I\x15\x00\x00e\x15\x00\x00'
+    b'z\x15\x00\x00\x96\x15\x00\x00\xa7\x15\x00\x00\xbf\x15\x00\x00\xd0\x15\x00\x00\xe8\x15\x00\x00\x00\x16\x00\x00\x1f\x16\x00\x007\x16\x00\x00V\x16\x00\x00p\x16\x00\x00\x8a\x16\x00\x00\xab\x16\x00\x00\xc2\x16\x00\x00\xe0\x16\x00\x00\xf7\x16\x00\x00\x15\x17\x00\x00$\x17\x00\x00:\x17\x00\x00I\x17\x00\x00_\x17\x00\x00q\x17\x00\x00\x8a\x17\x00\x00\x9c\x17\x00\x00'
+    b"\xb5\x17\x00\x00\xc6\x17\x00\x00\xde\x17\x00\x00\xef\x17\x00\x00\x07\x18\x00\x00\x1b\x18\x00\x006\x18\x00\x00J\x18\x00\x00e\x18\x00\x00v\x18\x00\x00\x8e\x18\x00\x00\x9f\x18\x00\x00\xb7\x18\x00\x00\xcb\x18\x00\x00\xe6\x18\x00\x00\xfa\x18\x00\x00\x15\x19\x00\x00'\x19\x00\x00@\x19\x00\x00R\x19\x00\x00k\x19\x00\x00~\x19\x00\x00\x9b\x19\x00\x00\xb9\x19\x00\x00"
+    b'\xd4\x19\x00\x00\xf7\x19\x00\x00\x15\x1a\x00\x00/\x1a\x00\x00C\x1a\x00\x00`\x1a\x00\x00}\x1a\x00\x00\x9b\x1a\x00\x00\xac\x1a\x00\x00\xc5\x1a\x00\x00\xde\x1a\x00\x00\xfa\x1a\x00\x00\r\x1b\x00\x00\x1f\x1b\x00\x00<\x1b\x00\x00U\x1b\x00\x00j\x1b\x00\x00\x81\x1b\x00\x00\x9c\x1b\x00\x00\xaf\x1b\x00\x00\xcb\x1b\x00\x00\xe7\x1b\x00\x00\x05\x1c\x00\x00!\x1c\x00\x00'
+    b'@\x1c\x00\x00T\x1c\x00\x00o\x1c\x00\x00\x87\x1c\x00\x00\x9c\x1c\x00\x00\xac\x1c\x00\x00\xc5\x1c\x00\x00\xde\x1c\x00\x00\xf1\x1c\x00\x00\x04\x1d\x00\x00\x1b\x1d\x00\x00/\x1d\x00\x00J\x1d\x00\x00\\\x1d\x00\x00o\x1d\x00\x00\x89\x1d\x00\x00\xa2\x1d\x00\x00\xc3\x1d\x00\x00\xe2\x1d\x00\x00\x02\x1e\x00\x00 \x1e\x00\x00>\x1e\x00\x00a\x1e\x00\x00|\x1e\x00\x00'
+    b'\x9a\x1e\x00\x00\xb3\x1e\x00\x00\xc5\x1e\x00\x00\xdc\x1e\x00\x00\xf8\x1e\x00\x00\t\x1f\x00\x00"\x1f\x00\x00?\x1f\x00\x00\\\x1f\x00\x00z\x1f\x00\x00\x91\x1f\x00\x00\xab\x1f\x00\x00\xc5\x1f\x00\x00\xdc\x1f\x00\x00\xf0\x1f\x00\x00\x07 \x00\x00& \x00\x00L \x00\x00k \x00\x00\x87 \x00\x00\xaa \x00\x00\xc6 \x00\x00\xe8 \x00\x00\x10!\x00\x00'
+    b':!\x00\x00[!\x00\x00{!\x00\x00\x9f!\x00\x00\xc1!\x00\x00\xe0!\x00\x00\xfe!\x00\x00\x1e"\x00\x00>"\x00\x00Y"\x00\x00x"\x00\x00\x9d"\x00\x00\xba"\x00\x00\xe1"\x00\x00\xfe"\x00\x00\x1c#\x00\x009#\x00\x00Z#\x00\x00y#\x00\x00\x95#\x00\x00\xb6#\x00\x00\xdc#\x00\x00\xff#\x00\x00\x18$\x00\x00'
+    b'0$\x00\x00J$\x00\x00c$\x00\x00|$\x00\x00\x95$\x00\x00\xad$\x00\x00\xc5$\x00\x00\xdb$\x00\x00\xf0$\x00\x00\x06%\x00\x00\x1b%\x00\x001%\x00\x00F%\x00\x00]%\x00\x00s%\x00\x00\x98%\x00\x00\xb7%\x00\x00\xda%\x00\x00\xf9%\x00\x00\x14&\x00\x002&\x00\x00O&\x00\x00l&\x00\x00\x8b&\x00\x00'
+    b"\xac&\x00\x00\xcc&\x00\x00\xe5&\x00\x00\x06'\x00\x00('\x00\x00D'\x00\x00d'\x00\x00\x80'\x00\x00\x98'\x00\x00\xb3'\x00\x00\xcd'\x00\x00\xe7'\x00\x00\x03(\x00\x00!(\x00\x00>(\x00\x00T(\x00\x00r(\x00\x00\x8d(\x00\x00\xa8(\x00\x00\xc4(\x00\x00\xe4(\x00\x00\xfe(\x00\x00\x16)\x00\x00.)\x00\x00"
+    b'G)\x00\x00d)\x00\x00{)\x00\x00\x9a)\x00\x00\xb9)\x00\x00\xd7)\x00\x00\xf5)\x00\x00\n*\x00\x00$*\x00\x00@*\x00\x00Y*\x00\x00{*\x00\x00\x95*\x00\x00\xb1*\x00\x00\xce*\x00\x00\xec*\x00\x00\t+\x00\x00#+\x00\x00?+\x00\x00U+\x00\x00s+\x00\x00\x90+\x00\x00\xb2+\x00\x00\xd3+\x00\x00'
+    b'\xf5+\x00\x00\x14,\x00\x004,\x00\x00U,\x00\x00m,\x00\x00\x8c,\x00\x00\xa9,\x00\x00\xc2,\x00\x00\xe3,\x00\x00\xff,\x00\x00$-\x00\x00E-\x00\x00e-\x00\x00\x82-\x00\x00\xa1-\x00\x00\xc6-\x00\x00\xe0-\x00\x00\xfb-\x00\x00\x15.\x00\x000.\x00\x00K.\x00\x00h.\x00\x00\x85.\x00\x00\xa9.\x00\x00'
+    b'\xc5.\x00\x00\xe1.\x00\x00\x00/\x00\x00\x1c/\x00\x00;/\x00\x00W/\x00\x00x/\x00\x00\x9a/\x00\x00\xb4/\x00\x00\xd4/\x00\x00\xef/\x00\x00\x080\x00\x00"0\x00\x00;0\x00\x00Y0\x00\x00t0\x00\x00\x8b0\x00\x00\xa30\x00\x00\xba0\x00\x00\xd20\x00\x00\xea0\x00\x00\x041\x00\x00\x1e1\x00\x00?1\x00\x00'
+    b"X1\x00\x00q1\x00\x00\x8d1\x00\x00\xa91\x00\x00\xc21\x00\x00\xdb1\x00\x00\xf91\x00\x00\x182\x00\x00/2\x00\x00L2\x00\x00d2\x00\x00z2\x00\x00\x912\x00\x00\xa72\x00\x00\xc22\x00\x00\xda2\x00\x00\xf42\x00\x00\x0b3\x00\x00'3\x00\x00@3\x00\x00b3\x00\x00{3\x00\x00\x973\x00\x00\xb03\x00\x00"
+    b'\xce3\x00\x00\xe73\x00\x00\x044\x00\x00 4\x00\x00<4\x00\x00]4\x00\x00{4\x00\x00\x8b4\x00\x00\x9f4\x00\x00\xb24\x00\x00\xc74\x00\x00\xd84\x00\x00\xea4\x00\x00\x025\x00\x00\x1e5\x00\x00>5\x00\x00W5\x00\x00t5\x00\x00\x9a5\x00\x00\xbd5\x00\x00\xd55\x00\x00\xf35\x00\x00\x0f6\x00\x0016\x00\x00'
+    b'Q6\x00\x00p6\x00\x00\x8d6\x00\x00\xaa6\x00\x00\xca6\x00\x00\xea6\x00\x00\xfe6\x00\x00\x0f7\x00\x00"7\x00\x0077\x00\x00V7\x00\x00s7\x00\x00\x8c7\x00\x00\xa27\x00\x00\xb57\x00\x00\xce7\x00\x00\xe07\x00\x00\xf57\x00\x00\x148\x00\x00.8\x00\x00H8\x00\x00j8\x00\x00\x7f8\x00\x00\x9d8\x00\x00'
+    b'\xb38\x00\x00\xcb8\x00\x00\xe78\x00\x00\xf88\x00\x00\x189\x00\x00,9\x00\x00@9\x00\x00U9\x00\x00j9\x00\x00\x8a9\x00\x00\xad9\x00\x00\xd09\x00\x00\xf59\x00\x00\x19:\x00\x00;:\x00\x00]:\x00\x00\x83:\x00\x00\x99:\x00\x00\xb6:\x00\x00\xd6:\x00\x00\xf8:\x00\x00\x19;\x00\x008;\x00\x00W;\x00\x00'
+    b'z;\x00\x00\x92;\x00\x00\xaa;\x00\x00\xcb;\x00\x00\xe3;\x00\x00\x01<\x00\x00\x18<\x00\x006<\x00\x00J<\x00\x00c<\x00\x00~<\x00\x00\x9e<\x00\x00\xb5<\x00\x00\xd0<\x00\x00\xe2<\x00\x00\xfd<\x00\x00\x12=\x00\x004=\x00\x00P=\x00\x00m=\x00\x00\x83=\x00\x00\x99=\x00\x00\xb7=\x00\x00\xe2=\x00\x00'
+    b'\x03>\x00\x00\x17>\x00\x001>\x00\x00A>\x00\x00\\>\x00\x00v>\x00\x00\x8d>\x00\x00\xa7>\x00\x00\xc2>\x00\x00\xdd>\x00\x00\xfe>\x00\x00\x1a?\x00\x007?\x00\x00U?\x00\x00q?\x00\x00\x9a?\x00\x00\xc5?\x00\x00\xf2?\x00\x00!@\x00\x006@\x00\x00M@\x00\x00j@\x00\x00\x85@\x00\x00\xa2@\x00\x00'
+    b'\xc3@\x00\x00\xdf@\x00\x00\x0bA\x00\x00*A\x00\x00PA\x00\x00rA\x00\x00\x94A\x00\x00\xb3A\x00\x00\xcfA\x00\x00\xebA\x00\x00\x10B\x00\x00/B\x00\x00HB\x00\x00dB\x00\x00\x80B\x00\x00\x9fB\x00\x00\xbfB\x00\x00\xe0B\x00\x00\x02C\x00\x00(C\x00\x00HC\x00\x00uC\x00\x00\x8fC\x00\x00\xafC\x00\x00'
+    b'\xcfC\x00\x00\xecC\x00\x00\x0fD\x00\x00,D\x00\x00LD\x00\x00iD\x00\x00\x87D\x00\x00\xaaD\x00\x00\xd1D\x00\x00\xeeD\x00\x00\x0bE\x00\x00-E\x00\x00HE\x00\x00dE\x00\x00\x82E\x00\x00\x9aE\x00\x00\xb9E\x00\x00\xd5E\x00\x00\xebE\x00\x00\x02F\x00\x00\x1cF\x00\x00=F\x00\x00WF\x00\x00{F\x00\x00'
+    b'\x96F\x00\x00\xbcF\x00\x00\xe4F\x00\x00\xfbF\x00\x00\x16G\x00\x00=G\x00\x00ZG\x00\x00xG\x00\x00\x97G\x00\x00\xb4G\x00\x00\xd5G\x00\x00\xf3G\x00\x00\rH\x00\x006H\x00\x00aH\x00\x00zH\x00\x00\x9eH\x00\x00\xc3H\x00\x00\xe2H\x00\x00\xfcH\x00\x00\x1eI\x00\x00<I\x00\x00WI\x00\x00oI\x00\x00'
+    b'\x87I\x00\x00\x9bI\x00\x00\xb0I\x00\x00\xc5I\x00\x00\xd6I\x00\x00\xedI\x00\x00\x00J\x00\x00 J\x00\x003J\x00\x00WJ\x00\x00xJ\x00\x00\x94J\x00\x00\xadJ\x00\x00\xceJ\x00\x00\xecJ\x00\x00\nK\x00\x00%K\x00\x00@K\x00\x00^K\x00\x00~K\x00\x00\x9bK\x00\x00\xbaK\x00\x00\xd6K\x00\x00\xedK\x00\x00'
+    b'\x04L\x00\x00%L\x00\x00EL\x00\x00cL\x00\x00\x80L\x00\x00\x9fL\x00\x00\xbfL\x00\x00\xd7L\x00\x00\xe7L\x00\x00\xf7L\x00\x00\x0bM\x00\x00\x1dM\x00\x009M\x00\x00XM\x00\x00xM\x00\x00\x8dM\x00\x00\xaaM\x00\x00\xc4M\x00\x00\xdcM\x00\x00\xfbM\x00\x00\x17N\x00\x00+N\x00\x00=N\x00\x00YN\x00\x00'
+    b'rN\x00\x00\x93N\x00\x00\xa6N\x00\x00\xbaN\x00\x00\xdbN\x00\x00\nO\x00\x001O\x00\x00aO\x00\x00\x89O\x00\x00\xb8O\x00\x00\xe6O\x00\x00\xf9O\x00\x00\x0eP\x00\x00&P\x00\x00FP\x00\x00_P\x00\x00~P\x00\x00\x93P\x00\x00\xb5P\x00\x00\xcdP\x00\x00\xe8P\x00\x00\rQ\x00\x00/Q\x00\x00PQ\x00\x00'
+    b'qQ\x00\x00\x98Q\x00\x00\xc0Q\x00\x00\xe3Q\x00\x00\x04R\x00\x00%R\x00\x00OR\x00\x00yR\x00\x00\x9aR\x00\x00\xc2R\x00\x00\xecR\x00\x00\x14S\x00\x00<S\x00\x00`S\x00\x00\x81S\x00\x00\xa6S\x00\x00\xbfS\x00\x00\xdcS\x00\x00\xf6S\x00\x00\x10T\x00\x00)T\x00\x00BT\x00\x00[T\x00\x00yT\x00\x00'
+    b'\x8cT\x00\x00\xa5T\x00\x00\xc7T\x00\x00\xdbT\x00\x00\xf0T\x00\x00\x18U\x00\x004U\x00\x00IU\x00\x00dU\x00\x00tU\x00\x00\x8bU\x00\x00\xa3U\x00\x00\xbeU\x00\x00\xd6U\x00\x00\xe7U\x00\x00\tV\x00\x00(V\x00\x00DV\x00\x00fV\x00\x00\x81V\x00\x00\x98V\x00\x00\xafV\x00\x00\xcaV\x00\x00\xdeV\x00\x00'
+    b'\xf0V\x00\x00\x05W\x00\x00'
+)
+BLOB = (
+    b'Cheerful\x1fPERSONALITYGloomy\x1fPERSONALITYGoofball\x1fPERSONALITYLazy\x1fPERSONALITYLoner\x1fPERSONALITYMusic'
+    b' Lover\x1fPERSONALITYPerfectionist\x1fPERSONALITYSnob\x1fPERSONALITYAmbitious\x1fPERSONALITYSelf-Assured\x1fPER'
+    b'SONALITYBro\x1fPERSONALITYChildish\x1fPERSONALITYClumsy\x1fPERSONALITYNoncommittal\x1fPERSONALITYEvil\x1fPERSON'
+    b'ALITYFamily-oriented\x1fPERSONALITYGeek\x1fPERSONALITYGlutton\x1fPERSONALITYHates Children\x1fPERSONALITYHot'
+    b'-Headed\x1fPERSONALITYErratic\x1fPERSONALITYCreative\x1fPERSONALITYMean\x1fPERSONALITYNeat\x1fPERSONALITYSlob\x1fP'
+    b'ERSONALITYFlavor Master\x1fASPIRATIONPotion Master\x1fSKILL_REWARDFresh Chef\x1fSKILL_REWARDAlluring\x1fASPI'
+    b'RATIONCompanion\x1fSOCIAL_REWARDPlayer\x1fSOCIAL_REWARDBeguiling\x1fSOCIALAntiseptic\x1fBIOLOGYHardly Hungry'
+    b"\x1fBIOLOGYAngler's Tranquility\x1fSKILL_REWARDSteel Bladder\x1fBIOLOGYNever Weary\x1fBIOLOGYIndependent\x1fPER"
+    b'SONALITYGym Rat\x1fLIFESTYLEShameless\x1fPERSONALITYCarefree\x1fPERSONALITYFertile\x1fBIOLOGYSpeed Cleaner\x1fS'
+    b'KILLGreat Kisser\x1fSOCIALMentor\x1fSKILLSincere\x1fSOCIALHigh Metabolism\x1fASPIRATIONLong Lived\x1fBIOLOGYBus'
+    b'iness Savvy\x1fASPIRATIONDomestic\x1fASPIRATIONDastardly\x1fASPIRATIONEasily Inspired\x1fASPIRATIONQuick Lea'
+    b'rner\x1fASPIRATIONGregarious\x1fASPIRATIONBeloved\x1fSOCIAL_REWARDHilarious\x1fSOCIAL_REWARDPerfect Host\x1fSOC'
+    b'IAL_REWARDFoodie\x1fPERSONALITYMastermind\x1fSKILL_REWARDTormentor\x1fSOCIAL_REWARDHandy\x1fSKILL_REWARDActi'
+    b've\x1fPERSONALITYRomantic\x1fPERSONALITYProfessorial\x1fSKILL_REWARDWebmaster\x1fSKILL_REWARDMaterialistic\x1fP'
+    b'ERSONALITYLoves Outdoors\x1fPERSONALITYGood\x1fPERSONALITYBookworm\x1fPERSONALITYGenius\x1fPERSONALITYArt Lo'
+    b'ver\x1fPERSONALITYShrewd\x1fSKILL_REWARDThrifty\x1fSKILL_REWARDPiper\x1fSKILL_REWARDOutgoing\x1fPERSONALITYPhys'
+    b'ically Gifted\x1fCHILDHOODCreatively Gifted\x1fCHILDHOODMentally Gifted\x1fCHILDHOODSocially Gifted\x1fCHILD'
+    b'HOODMatriarch/Patriarch\x1fSOCIAL_REWARDVicarious\x1fSOCIAL_REWARDPoetic\x1fSKILL_REWARDMarketable\x1fSKILLF'
+    b'ree Services\x1fLIFESTYLEFrugal\x1fLIFESTYLECreative Visionary\x1fSKILLNight Owl\x1fLIFESTYLEMorning Person\x1f'
+    b'LIFESTYLEMemorable\x1fSOCIALConnections\x1fCAREERProfessional Slacker\x1fLIFESTYLEEntrepreneurial\x1fSKILLSp'
+    b'eed Reader\x1fSKILLObservant\x1fSOCIALAlways Welcome\x1fSOCIALSuper Green Thumb\x1fSKILLCollector\x1fASPIRATION'
+    b'Savant\x1fSKILLExpressionistic\x1fSKILL_REWARDNaturalist\x1fSKILL_REWARDAppraiser\x1fSKILL_REWARDDied by Fir'
+    b'e\x1fGHOST_DEATHDied by Anger\x1fGHOST_DEATHDied by Overexertion\x1fGHOST_DEATHDied by Electrocution\x1fGHOS'
+    b'T_DEATHDied by Embarrassment\x1fGHOST_DEATHDied by Hunger\x1fGHOST_DEATHDied by Laughter\x1fGHOST_DEATHDi'
+    b'ed by Old Age\x1fGHOST_DEATHDied by Cowplant\x1fGHOST_DEATHSqueamish\x1fPERSONALITYIncredibly Friendly\x1fSO'
+    b'CIALPart-Alien\x1fSPECIESAlien\x1fSPECIESGreat Storyteller\x1fSOCIALDied by Drowning\x1fGHOST_DEATHMaster Gr'
+    b'iller\x1fSKILLTemporary Genius\x1fSKILLSurvivalist\x1fSKILL_REWARDSickness Resistant\x1fBIOLOGYDied by Steam'
+    b'\x1fGHOST_DEATHNatural Leader\x1fSOCIAL_REWARDJealous\x1fPERSONALITYInsider\x1fPERSONALITYDance Machine\x1fPERS'
+    b'ONALITYKleptomaniac\x1fPERSONALITYGrilled Cheese Master\x1fSKILL_REWARDUnflirty\x1fPERSONALITYVegetarian\x1f'
+    b'PERSONALITYMasculine Frame\x1fIDENTITYPrefers Womenswear\x1fIDENTITYPrefers Menswear\x1fIDENTITYFeminine '
+    b'Frame\x1fIDENTITYDied by Pufferfish\x1fGHOST_DEATHThrifty Critic\x1fCAREERFussy\x1fPERSONALITYAngelic\x1fPERSON'
+    b'ALITYWild\x1fPERSONALITYCharmer\x1fPERSONALITYSilly\x1fPERSONALITYClingy\x1fPERSONALITYInquisitive\x1fPERSONALI'
+    b'TYIndependent\x1fPERSONALITYHome Turf\x1fASPIRATIONIn the Know\x1fSOCIAL_REWARDSpice Hound\x1fBIOLOGYChopsti'
+    b'ck Savvy\x1fSKILLVampire\x1fSPECIESDied by Sunlight\x1fGHOST_DEATHHuman\x1fSPECIESRegained Humanity\x1fSUPERNAT'
+    b'URALTrue Master\x1fSUPERNATURALVampire Master\x1fSUPERNATURALCat Lover\x1fPERSONALITYDog Lover\x1fPERSONALIT'
+    b'YUncontrolled Emotion\x1fPERSONALITYEmotional Control\x1fPERSONALITYGood Manners\x1fSOCIALBad Manners\x1fSOC'
+    b'IALCompassionate\x1fPERSONALITYUnfeeling\x1fPERSONALITYResponsible\x1fPERSONALITYIrresponsible\x1fPERSONALIT'
+    b'YMediator\x1fSOCIALArgumentative\x1fSOCIALPhase: Picky Eater\x1fPHASEPhase: Clingy\x1fPHASEPhase: Rebellious'
+    b'\x1fPHASEPhase: Loud\x1fPHASEPhase: Bear\x1fPHASEPhase: Distant\x1fPHASEPhase: Mean Streak\x1fPHASEPhase: Picky'
+    b' Eater\x1fPHASEPhase: Picky Eater\x1fPHASEPhase: Picky Eater\x1fPHASEPhase: Picky Eater\x1fPHASERole Model\x1fS'
+    b'OCIAL_REWARDAnimal Whisperer\x1fSKILL_REWARDAnimal Affection\x1fASPIRATIONDied by Poison\x1fGHOST_DEATHTr'
+    b'easure Hunter\x1fSKILL_REWARDMuseum Patron\x1fSKILL_REWARDDied by Rabid Rodent\x1fGHOST_DEATHDied by Free'
+    b'zing\x1fGHOST_DEATHSeldom Sleepy\x1fBIOLOGYNeeds No One\x1fLIFESTYLEForever Full\x1fBIOLOGYForever Fresh\x1fBIO'
+    b"LOGYWinter's Child\x1fGENETICCold Acclimated\x1fBIOLOGYHeat Acclimated\x1fBIOLOGYIceproof\x1fBIOLOGYHeatproo"
+    b'f\x1fBIOLOGYDied by Overheating\x1fGHOST_DEATHWaterproof\x1fBIOLOGYStormchaser\x1fLIFESTYLEDied by Lightning'
+    b'\x1fGHOST_DEATHScout Aptitude\x1fSKILLDied by Death Flower\x1fGHOST_DEATHUnstoppable Fame\x1fCAREER_REWARDWo'
+    b'rld-Renowned Actor\x1fCAREER_REWARDKindness Ambassador\x1fSOCIAL_REWARDMermaid\x1fSPECIESSelf-Absorbed\x1fPE'
+    b'RSONALITYCareer-Minded\x1fASPIRATIONInfected\x1fHEALTHParanoid\x1fPERSONALITYHero of StrangerVille\x1fHISTOR'
+    b'YConsumed by Mother Plant\x1fGHOST_DEATHChild of the Islands\x1fPERSONALITYChild of the Ocean\x1fPERSONAL'
+    b'ITYNatural Speaker\x1fSOCIALFriend Of The Sea\x1fSUPERNATURALBA Economics\x1fDEGREESulani Mana\x1fGENETICLai'
+    b'd-Back\x1fLIFESTYLESpellcaster\x1fSPECIESCurse: Scrambled Spells\x1fCURSEImmortal\x1fSUPERNATURALDied by Imm'
+    b'ortality Potion Failure\x1fGHOST_DEATHCurse: Repulsiveness\x1fCURSECurse: The Duelist\x1fCURSECurse: Unco'
+    b'ntrollable Charge\x1fCURSECurse: Unwarranted Hostility\x1fCURSECurse: Uncleansable Stench\x1fCURSECurse: '
+    b'Awkward Embraces\x1fCURSECurse: Night Wraith\x1fCURSECurse: Infectious Laughter\x1fCURSEDied by Spellcast'
+    b'er Overload\x1fGHOST_DEATHSlinger of Spells\x1fSUPERNATURALMaster Mixer\x1fSKILL_REWARDWeak Spellcaster B'
+    b'lood\x1fGENETICStrong Spellcaster Blood\x1fGENETICAncient Spellcaster Blood\x1fGENETICBS Economics\x1fDEGREE'
+    b'BS Honors Economics\x1fDEGREEBA Honors Economics\x1fDEGREEBA Art History\x1fDEGREEBA Honors Art History\x1fD'
+    b'EGREEBS Art History\x1fDEGREEBS Honors Art History\x1fDEGREEBA Biology\x1fDEGREEBA Honors Biology\x1fDEGREEB'
+    b'S Biology\x1fDEGREEBS Honors Biology\x1fDEGREEBA Communications\x1fDEGREEBA Honors Communications\x1fDEGREEB'
+    b'S Communications\x1fDEGREEBS Honors Communications\x1fDEGREEBA Computer Science\x1fDEGREEBS Computer Scie'
+    b'nce\x1fDEGREEBS Honors Computer Science\x1fDEGREEBA Culinary Arts\x1fDEGREEBA Honors Culinary Arts\x1fDEGREE'
+    b'BS Culinary Arts\x1fDEGREEBS Honors Culinary Arts\x1fDEGREEBA Drama\x1fDEGREEBA Honors Drama\x1fDEGREEBS Dra'
+    b'ma\x1fDEGREEBS Honors Drama\x1fDEGREEBA Fine Art\x1fDEGREEBA Honors Fine Art\x1fDEGREEBS Fine Art\x1fDEGREEBS H'
+    b'onors Fine Art\x1fDEGREEBA History\x1fDEGREEBA Honors History\x1fDEGREEBS History\x1fDEGREEBS Honors History'
+    b'\x1fDEGREEBA Lang & Lit\x1fDEGREEBA Honors Lang & Lit\x1fDEGREEBS Lang & Lit\x1fDEGREEBS Honors Lang & Lit\x1fD'
+    b'EGREEBA Physics\x1fDEGREEBA Honors Physics\x1fDEGREEBS Physics\x1fDEGREEBS Honors Physics\x1fDEGREEBA Psycho'
+    b'logy\x1fDEGREEBA Honors Psychology\x1fDEGREEBS Psychology\x1fDEGREEBS Honors Psychology\x1fDEGREEBA Villainy'
+    b'\x1fDEGREEBA Honors Villainy\x1fDEGREEBS Villainy\x1fDEGREEBS Honors Villainy\x1fDEGREEServo Robot\x1fSPECIESMo'
+    b'dule: Cleaning\x1fROBOT_MODULEModule: Gardening\x1fROBOT_MODULEModule: Repair\x1fROBOT_MODULEModule: Defe'
+    b'nse Matrix\x1fROBOT_MODULEModule: RoboNanny\x1fROBOT_MODULEModule: Party\x1fROBOT_MODULESeasoned Gamer\x1fSK'
+    b'ILLHonor Society Member\x1fACADEMICHigher Education\x1fSKILL_REWARDDied by Murphy Bed\x1fGHOST_DEATHMaker'
+    b'\x1fPERSONALITYMaster Maker\x1fSKILL_REWARDInfluential\x1fSOCIAL_REWARDRecycle Disciple\x1fPERSONALITYFreega'
+    b'n\x1fPERSONALITYEco Engineer\x1fSKILLChampion Of The People\x1fCAREERDied by Flies\x1fGHOST_DEATHEco Master\x1f'
+    b'ASPIRATIONEntrepreneur\x1fASPIRATIONDied by Beetles\x1fGHOST_DEATHFizzyhead\x1fLIFESTYLEPrepared Traveler'
+    b'\x1fASPIRATIONHeroic Presence\x1fSUPERNATURALSupreme Authority\x1fSUPERNATURALSleight of Hand\x1fSUPERNATURA'
+    b'LKnitting Knowledge\x1fSKILL_REWARDWorkaholic\x1fLIFESTYLEFrequent Traveler\x1fLIFESTYLECoffee Fanatic\x1fLI'
+    b'FESTYLETechnophobe\x1fLIFESTYLETechie\x1fLIFESTYLEHealth Food Nut\x1fLIFESTYLEJunk Food Fiend\x1fLIFESTYLESe'
+    b'dentary\x1fLIFESTYLEEnergetic\x1fLIFESTYLEPeople Person\x1fLIFESTYLEClose-Knit\x1fLIFESTYLEAdrenaline Seeker'
+    b'\x1fLIFESTYLEIndoorsy\x1fLIFESTYLEOutdoorsy\x1fLIFESTYLECharismatic Crooner\x1fSOCIALLegendary Stamina\x1fBIOLO'
+    b'GYMiddling Mountaineer\x1fSKILL_REWARDExpert Mountaineer\x1fSKILL_REWARDCapable Mountaineer\x1fSKILL_REWA'
+    b'RDSurvival Instinct\x1fSKILL_REWARDWorldly Knowledge\x1fSKILL_REWARDDied by Vending Machine\x1fGHOST_DEAT'
+    b"HDied by Falling\x1fGHOST_DEATHSingle and Lovin' It\x1fLIFESTYLEHungry for Love\x1fLIFESTYLEProper\x1fPERSON"
+    b'ALITYAdventurous\x1fPERSONALITYLicensed Investigator\x1fCAREERBrave\x1fPERSONALITYFilth Dweller\x1fPERSONALI'
+    b'TYFast & Fastidious\x1fPERSONALITYAnimal Enthusiast\x1fPERSONALITYLactose Intolerant\x1fPERSONALITYDislik'
+    b'es Red\x1fPREFERENCEDislikes Orange\x1fPREFERENCEDislikes Yellow\x1fPREFERENCELikes Orange\x1fPREFERENCELike'
+    b's Red\x1fPREFERENCELikes Yellow\x1fPREFERENCEDislikes Basic Decor\x1fPREFERENCEDislikes Contemporary Deco'
+    b'r\x1fPREFERENCEDislikes Patio Decor\x1fPREFERENCELikes Basic Decor\x1fPREFERENCELikes Contemporary Decor\x1f'
+    b'PREFERENCELikes Patio Decor\x1fPREFERENCEDislikes Cosmolux Decor\x1fPREFERENCEDislikes French Country '
+    b'Decor\x1fPREFERENCEDislikes Gothic Farmhouse Decor\x1fPREFERENCEDislikes Mission Decor\x1fPREFERENCEDisli'
+    b'kes Modern Decor\x1fPREFERENCEDislikes Queen Anne Decor\x1fPREFERENCEDislikes Suburban Decor\x1fPREFERENC'
+    b'EDislikes Tudor Decor\x1fPREFERENCEDislikes Boho Decor\x1fPREFERENCEDislikes Island Decor\x1fPREFERENCEDi'
+    b'slikes Garden Decor\x1fPREFERENCELikes Boho Decor\x1fPREFERENCELikes Cosmolux Decor\x1fPREFERENCELikes Fr'
+    b'ench Country Decor\x1fPREFERENCELikes Garden Decor\x1fPREFERENCELikes Gothic Farmhouse Decor\x1fPREFERENC'
+    b'ELikes Island Decor\x1fPREFERENCELikes Mission Decor\x1fPREFERENCELikes Modern Decor\x1fPREFERENCELikes Q'
+    b'ueen Anne Decor\x1fPREFERENCELikes Suburban Decor\x1fPREFERENCELikes Tudor Decor\x1fPREFERENCEDied by Kil'
+    b'ler Rabbit\x1fGHOST_DEATHDislikes Scandinavian Decor\x1fPREFERENCELikes Scandinavian Decor\x1fPREFERENCED'
+    b'islikes Green\x1fPREFERENCEDislikes Blue\x1fPREFERENCEDislikes Purple\x1fPREFERENCEDislikes Brown\x1fPREFERE'
+    b'NCEDislikes Black\x1fPREFERENCEDislikes White\x1fPREFERENCEDislikes Gray\x1fPREFERENCEDislikes Pink\x1fPREFE'
+    b'RENCELikes Black\x1fPREFERENCELikes Blue\x1fPREFERENCELikes Brown\x1fPREFERENCELikes Gray\x1fPREFERENCELikes'
+    b' Green\x1fPREFERENCELikes Pink\x1fPREFERENCELikes Purple\x1fPREFERENCELikes White\x1fPREFERENCEDislikes Alte'
+    b'rnative Music\x1fPREFERENCEDislikes Blues Music\x1fPREFERENCEDislikes Classical Music\x1fPREFERENCEDislik'
+    b'es Electronica\x1fPREFERENCEDislikes Hip Hop\x1fPREFERENCEDislikes Kids Music\x1fPREFERENCEDislikes Lulla'
+    b'bies\x1fPREFERENCEDislikes Pop Music\x1fPREFERENCEDislikes Retro Music\x1fPREFERENCEDislikes Romance Musi'
+    b'c\x1fPREFERENCEDislikes Spooky Music\x1fPREFERENCEDislikes S-Pop\x1fPREFERENCEDislikes Holiday Music\x1fPREF'
+    b'ERENCELikes Alternative Music\x1fPREFERENCELikes Blues Music\x1fPREFERENCELikes Classical Music\x1fPREFER'
+    b'ENCELikes Electronica\x1fPREFERENCELikes Hip Hop\x1fPREFERENCELikes Kids Music\x1fPREFERENCELikes Lullabi'
+    b'es\x1fPREFERENCELikes Pop Music\x1fPREFERENCELikes Retro Music\x1fPREFERENCELikes Romance Music\x1fPREFERENC'
+    b'ELikes Spooky Music\x1fPREFERENCELikes S-Pop\x1fPREFERENCELikes Holiday Music\x1fPREFERENCEDislikes Cooki'
+    b'ng\x1fPREFERENCEDislikes Fitness\x1fPREFERENCEDislikes Painting\x1fPREFERENCEDislikes Video Gaming\x1fPREFER'
+    b'ENCEDislikes Violin\x1fPREFERENCELikes Cooking\x1fPREFERENCELikes Fitness\x1fPREFERENCELikes Painting\x1fPRE'
+    b'FERENCELikes Video Gaming\x1fPREFERENCELikes Violin\x1fPREFERENCELikes Easy Listening\x1fPREFERENCELikes '
+    b'Backyard Music\x1fPREFERENCELikes New Age Music\x1fPREFERENCELikes Baroque Music\x1fPREFERENCELikes Jazz\x1f'
+    b'PREFERENCELikes Tween Pop\x1fPREFERENCELikes World Music\x1fPREFERENCELikes Nu Disco\x1fPREFERENCELikes S'
+    b'inger-Songwriter\x1fPREFERENCELikes Latin Pop\x1fPREFERENCELikes Latin Music\x1fPREFERENCELikes Summer St'
+    b'rut\x1fPREFERENCELikes Strange Tunes\x1fPREFERENCELikes Island Music\x1fPREFERENCELikes Americana\x1fPREFERE'
+    b'NCELikes Focus Music\x1fPREFERENCELikes Metal\x1fPREFERENCELikes Japanese Folk\x1fPREFERENCEDislikes Amer'
+    b'icana\x1fPREFERENCEDislikes Backyard Music\x1fPREFERENCEDislikes Baroque Music\x1fPREFERENCEDislikes Easy'
+    b' Listening\x1fPREFERENCEDislikes Focus Music\x1fPREFERENCEDislikes Island Music\x1fPREFERENCEDislikes Jap'
+    b'anese Folk\x1fPREFERENCEDislikes Jazz\x1fPREFERENCEDislikes Latin Music\x1fPREFERENCEDislikes Latin Pop\x1fP'
+    b'REFERENCEDislikes Metal\x1fPREFERENCEDislikes New Age Music\x1fPREFERENCEDislikes Nu Disco\x1fPREFERENCED'
+    b'islikes Singer-Songwriter\x1fPREFERENCEDislikes Strange Tunes\x1fPREFERENCEDislikes Summer Strut\x1fPREFE'
+    b'RENCEDislikes Tween Pop\x1fPREFERENCEDislikes World Music\x1fPREFERENCENature Conversationalist\x1fSKILL_'
+    b'REWARDDislikes Acting\x1fPREFERENCEDislikes Bowling\x1fPREFERENCEDislikes Comedy\x1fPREFERENCEDislikes Da'
+    b'ncing\x1fPREFERENCEDislikes Fishing\x1fPREFERENCEDislikes Gardening\x1fPREFERENCEDislikes Handiness\x1fPREFE'
+    b'RENCEDislikes Media Production\x1fPREFERENCEDislikes Mischief\x1fPREFERENCEDislikes Mixology\x1fPREFERENC'
+    b'EDislikes Photography\x1fPREFERENCEDislikes Debating\x1fPREFERENCEDislikes Programming\x1fPREFERENCEDisli'
+    b'kes Robotics\x1fPREFERENCEDislikes Rock Climbing\x1fPREFERENCEDislikes Rocket Science\x1fPREFERENCEDislik'
+    b'es Skiing\x1fPREFERENCEDislikes Snowboarding\x1fPREFERENCEDislikes Writing\x1fPREFERENCEDislikes DJing\x1fPR'
+    b'EFERENCEDislikes Guitar\x1fPREFERENCEDislikes Piano\x1fPREFERENCEDislikes Pipe Organ\x1fPREFERENCEDislike'
+    b's Singing\x1fPREFERENCELikes Acting\x1fPREFERENCELikes Bowling\x1fPREFERENCELikes Comedy\x1fPREFERENCELikes '
+    b'Dancing\x1fPREFERENCELikes Fishing\x1fPREFERENCELikes Gardening\x1fPREFERENCELikes Handiness\x1fPREFERENCELi'
+    b'kes Media Production\x1fPREFERENCELikes Mischief\x1fPREFERENCELikes Mixology\x1fPREFERENCELikes Photograp'
+    b'hy\x1fPREFERENCELikes Programming\x1fPREFERENCELikes Debating\x1fPREFERENCELikes Robotics\x1fPREFERENCELikes'
+    b' Rock Climbing\x1fPREFERENCELikes Rocket Science\x1fPREFERENCELikes Skiing\x1fPREFERENCELikes Snowboardin'
+    b'g\x1fPREFERENCELikes Writing\x1fPREFERENCELikes DJing\x1fPREFERENCELikes Guitar\x1fPREFERENCELikes Piano\x1fPRE'
+    b'FERENCELikes Pipe Organ\x1fPREFERENCELikes Singing\x1fPREFERENCEDislikes Baking\x1fPREFERENCELikes Baking'
+    b'\x1fPREFERENCEDislikes DJ Music\x1fPREFERENCELikes DJ Music\x1fPREFERENCEDied by Killer Chicken\x1fGHOST_DEA'
+    b'THLikes Wellness\x1fPREFERENCEDislikes Wellness\x1fPREFERENCESpa Membership\x1fASPIRATIONClear Perspectiv'
+    b'e\x1fSKILL_REWARDCalming Aura\x1fSKILL_REWARDSelf-Care Expert\x1fSKILL_REWARDHigh Maintenance\x1fPERSONALITY'
+    b'Socially Awkward\x1fPERSONALITYDislikes Basic Fashion\x1fPREFERENCELikes Basic Fashion\x1fPREFERENCECalm\x1f'
+    b'PERSONALITYCautious\x1fPERSONALITYIntense\x1fPERSONALITYSensitive\x1fPERSONALITYSunny\x1fPERSONALITYWiggly\x1fP'
+    b'ERSONALITYConfidante\x1fSOCIAL_REWARDDislikes Knitting\x1fPREFERENCEDislikes Cross Stitch\x1fPREFERENCELi'
+    b'kes Knitting\x1fPREFERENCELikes Cross Stitch\x1fPREFERENCEDislikes Cottage Core Music\x1fPREFERENCELikes '
+    b'Cottage Core Music\x1fPREFERENCECold Hearted\x1fPERSONALITYAttracted to Women\x1fORIENTATIONAttracted to '
+    b'Men\x1fORIENTATIONNot Attracted to Women\x1fORIENTATIONNot Attracted to Men\x1fORIENTATIONExploring Sexua'
+    b'lity\x1fORIENTATIONHS Cheer Team\x1fEXTRACURRICULARHS Chess Team\x1fEXTRACURRICULARHS Football Team\x1fEXTRA'
+    b'CURRICULARHS Computer Team\x1fEXTRACURRICULARFear of Failure\x1fFEARFear of Fire\x1fFEARFear of Ghosts\x1fFE'
+    b'ARFear of Swimming\x1fFEARFear of Unfulfilled Dreams\x1fFEARFear of Being Cheated On\x1fFEARFear of Being'
+    b' Judged\x1fFEARFear of Cowplants\x1fFEARFear of Crowds\x1fFEARFear of Dead End Job\x1fFEARFear of Death\x1fFEAR'
+    b'Fear of The Dark\x1fFEARFear of Failing Activities\x1fFEARFear of Failing Class\x1fFEARFear of Failing Te'
+    b'sts\x1fFEARFear of Disappointing Parents\x1fFEARFear of Homework\x1fFEARGraduated with Honors\x1fACADEMICVal'
+    b'edictorian\x1fACADEMICGraduated Early\x1fACADEMICHigh School Dropout\x1fACADEMICExpelled\x1fACADEMICEntrepre'
+    b'neurial Knowledge\x1fCAREERRelatable\x1fASPIRATIONIconic\x1fSOCIAL_REWARDHighflier\x1fPERSONALITYDauntless\x1fP'
+    b'ERSONALITYDislikes Boho Fashion\x1fPREFERENCEDislikes Country Fashion\x1fPREFERENCEDislikes Hipster Fa'
+    b'shion\x1fPREFERENCEDislikes Outdoorsy Fashion\x1fPREFERENCEDislikes Polished Fashion\x1fPREFERENCEDislike'
+    b's Preppy Fashion\x1fPREFERENCEDislikes Rocker Fashion\x1fPREFERENCEDislikes Streetwear Fashion\x1fPREFERE'
+    b'NCEUntroubled\x1fPERSONALITYLikes Boho Fashion\x1fPREFERENCELikes Country Fashion\x1fPREFERENCELikes Outd'
+    b'oorsy Fashion\x1fPREFERENCELikes Polished Fashion\x1fPREFERENCELikes Preppy Fashion\x1fPREFERENCELikes Ro'
+    b'cker Fashion\x1fPREFERENCELikes Streetwear Fashion\x1fPREFERENCEParty Animal\x1fPERSONALITYOverachiever\x1fP'
+    b'ERSONALITYDied by Stink Capsule\x1fGHOST_DEATHBig Bad Wolf\x1fTEMPERAMENTWracked With Guilt\x1fTEMPERAMEN'
+    b'TTerritorial\x1fTEMPERAMENTSurvival Instincts\x1fTEMPERAMENTPrideful\x1fTEMPERAMENTMust Be Clean\x1fTEMPERAM'
+    b'ENTFeels Outcasted\x1fTEMPERAMENTHungry Like The Wolf\x1fTEMPERAMENTGrumpy Wolf\x1fTEMPERAMENTHates Being'
+    b' Wet\x1fTEMPERAMENTFrisky\x1fTEMPERAMENTRestless Animal\x1fTEMPERAMENTCarnivore\x1fTEMPERAMENTAnti-Capitalis'
+    b't Canine\x1fTEMPERAMENTEasily Excitable\x1fTEMPERAMENTSensitive Hearing\x1fTEMPERAMENTWolf Brain\x1fTEMPERAM'
+    b'ENTNight Wolf\x1fTEMPERAMENTDied by Urban Myth\x1fGHOST_DEATHFriend of Moonwood Collective\x1fSOCIAL_REWA'
+    b'RDFriend of Wildfangs\x1fSOCIAL_REWARDDormant Wolf\x1fGENETICGreater Wolf Blood\x1fGENETICWerewolf\x1fSPECIE'
+    b'SWerewolf Ally\x1fSOCIAL_REWARDLunar Confidant\x1fASPIRATIONOnline Diploma\x1fACADEMICFanged Friend\x1fSUPER'
+    b'NATURALRefined Lupine\x1fSUPERNATURALChomp Champion\x1fSUPERNATURALThreatening Presence\x1fSUPERNATURALMa'
+    b'rk of The Wolf\x1fTEMPERAMENTMark of The Night\x1fTEMPERAMENTMark of The Forest\x1fTEMPERAMENTMark of The'
+    b' Hunt\x1fTEMPERAMENTInterested in WooHoo with Men\x1fORIENTATIONInterested in WooHoo with Women\x1fORIENT'
+    b'ATIONNot Interested in WooHoo with Men\x1fORIENTATIONNot Interested in WooHoo with Women\x1fORIENTATIO'
+    b'NTeen Prankster\x1fSOCIALLunar Link\x1fSUPERNATURALDied by Meteorite\x1fGHOST_DEATHInspired Explorer\x1fLIFE'
+    b'STYLETurn On: Pessimist\x1fPREFERENCETurn On: Argumentative\x1fPREFERENCETurn On: Idealist\x1fPREFERENCET'
+    b'urn On: Emotional Decision Maker\x1fPREFERENCETurn On: Egotistical\x1fPREFERENCETurn On: Romance Enthu'
+    b'siast\x1fPREFERENCETurn On: Kid Enthusiast\x1fPREFERENCETurn On: Pet Enthusiast\x1fPREFERENCETurn On: Hig'
+    b'h Energy\x1fPREFERENCETurn On: Homebody\x1fPREFERENCETurn On: Spirited\x1fPREFERENCETurn On: Nature Enthu'
+    b'siast\x1fPREFERENCETurn On: Mischievous\x1fPREFERENCETurn On: Funny\x1fPREFERENCETurn On: Cerebral\x1fPREFER'
+    b'ENCETurn On: Optimist\x1fPREFERENCETurn On: Hard Worker\x1fPREFERENCETurn On: Ambitionless\x1fPREFERENCET'
+    b'urn Off: Ambitionless\x1fPREFERENCETurn Off: Argumentative\x1fPREFERENCETurn Off: Nature Enthusiast\x1fPR'
+    b'EFERENCETurn Off: Egotistical\x1fPREFERENCETurn Off: Emotional Decision Maker\x1fPREFERENCETurn Off: F'
+    b'unny\x1fPREFERENCETurn Off: Hard Worker\x1fPREFERENCETurn Off: High Energy\x1fPREFERENCETurn Off: Idealis'
+    b't\x1fPREFERENCETurn Off: Kid Enthusiast\x1fPREFERENCETurn Off: Homebody\x1fPREFERENCETurn Off: Mischievou'
+    b's\x1fPREFERENCETurn Off: Optimist\x1fPREFERENCETurn Off: Pessimist\x1fPREFERENCETurn Off: Pet Enthusiast\x1f'
+    b'PREFERENCETurn Off: Romance Enthusiast\x1fPREFERENCETurn Off: Cerebral\x1fPREFERENCETurn Off: Spirited'
+    b'\x1fPREFERENCELikes Physical Intimacy\x1fPREFERENCELikes Flirtation\x1fPREFERENCELikes Compliments\x1fPREFER'
+    b'ENCELikes Deep Thoughts\x1fPREFERENCELikes Stories\x1fPREFERENCELikes Silly Behavior\x1fPREFERENCELikes P'
+    b'otty Humor\x1fPREFERENCELikes Jokes\x1fPREFERENCELikes Pranks\x1fPREFERENCELikes Deception\x1fPREFERENCELike'
+    b's Malicious Speech\x1fPREFERENCELikes Arguments\x1fPREFERENCELikes Affectionate Speech\x1fPREFERENCELikes'
+    b' Small Talk\x1fPREFERENCELikes Talking about Hobbies\x1fPREFERENCELikes Talking about Interests\x1fPREFER'
+    b'ENCELikes Gossip\x1fPREFERENCELikes Complaints\x1fPREFERENCEDislikes Affectionate Speech\x1fPREFERENCEDis'
+    b'likes Arguments\x1fPREFERENCEDislikes Complaints\x1fPREFERENCEDislikes Compliments\x1fPREFERENCEDislikes '
+    b'Deception\x1fPREFERENCEDislikes Deep Thoughts\x1fPREFERENCEDislikes Flirtation\x1fPREFERENCEDislikes Goss'
+    b'ip\x1fPREFERENCEDislikes Talking about Hobbies\x1fPREFERENCEDislikes Talking about Interests\x1fPREFERENC'
+    b'EDislikes Jokes\x1fPREFERENCEDislikes Malicious Speech\x1fPREFERENCEDislikes Physical Intimacy\x1fPREFERE'
+    b'NCEDislikes Potty Humor\x1fPREFERENCEDislikes Pranks\x1fPREFERENCEDislikes Silly Behavior\x1fPREFERENCEDi'
+    b'slikes Small Talk\x1fPREFERENCEDislikes Stories\x1fPREFERENCEFear of Inferiority\x1fFEARPracticed Host\x1fCH'
+    b'ILDHOODHeadstrong\x1fCHILDHOODPack Animal\x1fCHILDHOODIdea Person\x1fCHILDHOODLoyal\x1fPERSONALITYHorse Love'
+    b'r\x1fPERSONALITYRancher\x1fPERSONALITYGrand Champ Trainer\x1fSKILL_REWARDFear of Horses\x1fFEARDislikes Indu'
+    b'strial Decor\x1fPREFERENCELikes Industrial Decor\x1fPREFERENCEDislikes Art Deco\x1fPREFERENCELikes Art De'
+    b'co\x1fPREFERENCEDislikes Vintage Decor\x1fPREFERENCELikes Vintage Decor\x1fPREFERENCEDislikes Luxe Decor\x1f'
+    b'PREFERENCELikes Luxe Decor\x1fPREFERENCELikes Cute Decor\x1fPREFERENCEDislikes Cute Decor\x1fPREFERENCEDi'
+    b'slikes Shabby Decor\x1fPREFERENCELikes Shabby Decor\x1fPREFERENCEDislikes Ranch Music\x1fPREFERENCELikes '
+    b'Ranch Music\x1fPREFERENCEBatch Cook\x1fSKILL_REWARDBooth Boss\x1fSKILL_REWARDDislikes Nectar Making\x1fPREFE'
+    b'RENCEDislikes Horse Riding\x1fPREFERENCELikes Nectar Making\x1fPREFERENCELikes Horse Riding\x1fPREFERENCE'
+    b'Nectar Know-It-All\x1fSKILL_REWARDLegendary Landlord\x1fCAREER_REWARDNeighborly\x1fSOCIAL_REWARDNosy\x1fPERS'
+    b'ONALITYWise\x1fPERSONALITYGenerous\x1fPERSONALITYCringe\x1fPERSONALITYTomarang Expert\x1fSKILL_REWARDSeeker '
+    b'of Secrets\x1fSOCIAL_REWARDChild of the Village\x1fPERSONALITYFear of Eviction\x1fFEARDislikes R&B Music\x1f'
+    b'PREFERENCELikes R&B Music\x1fPREFERENCEDied by Mold\x1fGHOST_DEATHDislikes Batuu Music\x1fPREFERENCELikes'
+    b' Batuu Music\x1fPREFERENCEPublic Menace\x1fSOCIALSafe Keeper\x1fSOCIALDislikes Gemology\x1fPREFERENCELikes G'
+    b'emology\x1fPREFERENCEKnowledgeable Leaser\x1fSKILL_REWARDGolden Wrench\x1fSKILLAttuned\x1fSUPERNATURALRomant'
+    b'ically Reserved\x1fPERSONALITYExpects Physical Exclusivity\x1fRELATIONSHIP_STYLEAllows Open Physical\x1fR'
+    b'ELATIONSHIP_STYLEExpects Emotional Exclusivity\x1fRELATIONSHIP_STYLEAllows Open Emotional\x1fRELATIONS'
+    b'HIP_STYLEJealousy Triggers can Change\x1fRELATIONSHIP_STYLEJealousy Triggers are Fixed\x1fRELATIONSHIP'
+    b'_STYLELovebug\x1fPERSONALITYFear of Intimacy\x1fFEARFear of Being Alone\x1fFEARLikes Hipster Fashion\x1fPREF'
+    b'ERENCEPolyamorous\x1fSOCIAL_REWARDSeasoned Romantic\x1fSOCIAL_REWARDHeart To Heart\x1fSOCIALPractice Make'
+    b's Perfect\x1fPERSONALITYLikes Pottery\x1fPREFERENCEDislikes Pottery\x1fPREFERENCEMastery: Mental Exercise'
+    b'\x1fMASTERY_PERKMastery: Secret Spice\x1fMASTERY_PERKMastery: Final Touch\x1fMASTERY_PERKMastery: Second '
+    b'Wind\x1fMASTERY_PERKMastery: Stronger With Age\x1fMASTERY_PERKMastery: Powerful Performer\x1fMASTERY_PERK'
+    b'Mastery: Aura Creative\x1fMASTERY_PERKMastery: Aura Mental\x1fMASTERY_PERKMastery: Aura Active\x1fMASTERY'
+    b'_PERKMastery: Aspirational Creator\x1fMASTERY_PERKMastery: Aspirational Thinker\x1fMASTERY_PERKMastery'
+    b': In The Zone\x1fMASTERY_PERKMastery: Pigeonholed Mental\x1fMASTERY_PERKMastery: Pigeonholed Creative\x1f'
+    b'MASTERY_PERKMastery: Pigeonholed Active\x1fMASTERY_PERKMastery: Pigeonholed Social\x1fMASTERY_PERKMast'
+    b'ery: Skillful Sleep\x1fMASTERY_PERKMastery: Spacebender\x1fMASTERY_PERKAllows Open WooHoo\x1fRELATIONSHIP'
+    b'_STYLEDied by Crows\x1fGHOST_DEATHDislikes Tattooing\x1fPREFERENCELikes Tattooing\x1fPREFERENCERomantic S'
+    b'age\x1fSKILL_REWARDReincarnated\x1fSUPERNATURALAccepted Death\x1fPHILOSOPHYBurning Soul\x1fSUPERNATURALDied '
+    b'by Heartbreak\x1fGHOST_DEATHMacabre\x1fPERSONALITYGrief: Depression\x1fEMOTIONGrief: Holding It Together\x1f'
+    b'EMOTIONGrief: Anger\x1fEMOTIONGrief: Denial\x1fEMOTIONBurning Soul (Reincarnated)\x1fSUPERNATURALGhost Wh'
+    b'isperer\x1fSUPERNATURALSkeptical\x1fPERSONALITYChased by Death\x1fPERSONALITYGrimborn\x1fGENETICGrim Descend'
+    b"ant\x1fGENETICReaper's Favorite\x1fCAREERDislikes Romance\x1fPREFERENCELikes Romance\x1fPREFERENCEShady\x1fPERS"
+    b'ONALITYEnhanced Kleptomaniac\x1fSKILL_REWARDDislikes Thanatology\x1fPREFERENCELikes Thanatology\x1fPREFER'
+    b'ENCEMotivational Speaker\x1fSOCIAL_REWARDBeloved Brand\x1fCAREER_REWARDUltimate Dreamer\x1fCAREERUltimate'
+    b' Schemer\x1fCAREERFear of Being Canceled\x1fFEARIdealist\x1fPERSONALITYGrouch\x1fPERSONALITYFear of Burglary'
+    b'\x1fFEAR'
+)
@@ -0,0 +1,339 @@
+# Server/data_transfer.py
+
+"""
+Streaming NDJSON export / import of the memory database.
+
+Every line is one JSON object. The first line is a header, every other line is
+{"table": <name>, "row": {<column>: <value>}}. Rows are read and written one at a
+time, so exports and imports never hold a whole table in memory. BLOB values (the
+compressed chat archive) are written as {"base64": "..."}.
+
+CLI:
+    python -m Server.data_transfer export backup.ndjson.gz
+    python -m Server.data_transfer import backup.ndjson.gz --resume-from 120000
+    python -m Server.data_transfer --save-id 1234 export save_1234.ndjson
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import os
+import sys
+import time
+import zlib
+from bisect import bisect_right
+from Server import database
+
+EXPORT_FORMAT = "simsaichat-memory"
+EXPORT_VERSION = 2 # 2: digests and the chat archive, BLOBs as base64
+EXPORT_TABLES = ("event_memories", "relationship_digests", "location_context",
+                 "conversation_history", "conversation_archive")
+IMPORT_BATCH_SIZE = 500
+GZIP_CHUNK_SIZE = 64 * 1024
+
+# Rows of these tables are inserted with new ids; a row is already present when these
+# columns match (NULL matches NULL). Indexed lookups: group, timestamp, session.
+_CONTENT_KEYS = {
+    "event_memories": ("group_key", "summary", "created_at"),
+    "conversation_history": ("timestamp", "session_id", "sim_name", "role", "message"),
+    "conversation_archive": ("session_id", "started_at", "ended_at", "row_count")
+}
+
+# Keyed tables: existing rows win on conflict (a digest of the same group is kept).
+# Locations are the exception: the imported description replaces the stored one.
+# memory_lsh is not exported: it is derived from event_memories and rebuilt after an import.
+_CONFLICT_CLAUSE = {
+    "event_memories": "",
+    "relationship_digests": "OR IGNORE",
+    "conversation_history": "",
+    "conversation_archive": "",
+    "location_context": "OR REPLACE"
+}
+
+# --- EXPORT ---
+def _encode_value(value):
+    if isinstance(value, bytes):
+        return {"base64": base64.b64encode(value).decode('ascii')}
+    return value
+
+def _decode_value(value):
+    if isinstance(value, dict) and "base64" in value:
+        return base64.b64decode(value["base64"])
+    return value
+
+def iter_export_lines(tables=EXPORT_TABLES):
+    """Yields the export as NDJSON text lines, one database row at a time."""
+    database.flush_writes()
+    yield json.dumps({
+        "type": "header",
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "tables": list(tables),
+        "exported_at": time.strftime("%Y-%m-%d %H:%M:%S")
+    }) + "\n"
+
+    conn = database.connect_shard()
+    try:
+        for table in tables:
+            if table not in _CONFLICT_CLAUSE:
+                raise ValueError(f"Unknown table: {table}")
+            cursor = conn.cursor()
+            cursor.execute(f'SELECT * FROM {table} ORDER BY rowid')
+            columns = [col[0] for col in cursor.description]
+            for row in cursor:
+                yield json.dumps({"table": table, "row": {c: _encode_value(v) for c, v in zip(columns, row)}}) + "\n"
+    finally:
+        conn.close()
+
+def iter_gzip(lines):
+    """Gzip-compresses an iterable of text lines into a stream of byte chunks."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) # wbits=31 -> gzip container
+    pending = []
+    pending_size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size >= GZIP_CHUNK_SIZE:
+            chunk = compressor.compress(b"".join(pending))
+            pending, pending_size = [], 0
+            if chunk:
+                yield chunk
+    if pending:
+        chunk = compressor.compress(b"".join(pending))
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+def export_to_file(path, tables=EXPORT_TABLES, compress=None):
+    """Writes an export file (gzip when compress is True or the name ends in .gz). Returns a report."""
+    if compress is None:
+        compress = path.endswith(".gz")
+
+    start = time.perf_counter()
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        for line in iter_export_lines(tables):
+            rows += 1
+            yield line
+
+    if compress:
+        with open(path, 'wb') as f:
+            for chunk in iter_gzip(counted()):
+                f.write(chunk)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in counted():
+                f.write(line)
+
+    rows -= 1 # header line
+    return _report(rows, rows + 1, start)
+
+# --- IMPORT ---
+def _table_columns(cursor, table):
+    cursor.execute(f'PRAGMA table_info({table})')
+    return [row[1] for row in cursor.fetchall()]
+
+class _MemoryIdMap:
+    """Exported memory id -> id in this database, for remapping digest watermarks."""
+    def __init__(self):
+        self._old_ids = []   # Ascending, as exported (ORDER BY rowid)
+        self._max_new = []   # Highest new id among the memories up to the same position
+
+    def add(self, old_id, new_id):
+        if old_id is None or (self._old_ids and old_id <= self._old_ids[-1]):
+            return
+        self._old_ids.append(old_id)
+        self._max_new.append(max(new_id, self._max_new[-1]) if self._max_new else new_id)
+
+    def covered_through(self, old_id):
+        """New watermark covering every imported memory the exported watermark covered (0 if none)."""
+        i = bisect_right(self._old_ids, old_id or 0)
+        return self._max_new[i - 1] if i else 0
+
+def _find_existing(cursor, table, row):
+    """Id of a row with the same content key, or None."""
+    key_columns = _CONTENT_KEYS[table]
+    where = " AND ".join(f"{c} IS ?" for c in key_columns)
+    cursor.execute(f'SELECT id FROM {table} WHERE {where} LIMIT 1', [row.get(c) for c in key_columns])
+    found = cursor.fetchone()
+    return found[0] if found else None
+
+def _prepare_row(table, row, memory_ids):
+    """Decodes a row and fills in derived values (group_key, remapped digest watermark)."""
+    row = {c: _decode_value(v) for c, v in row.items()}
+    if table == "event_memories" and not row.get("group_key"):
+        try:
+            row["group_key"] = database.make_group_key(json.loads(row.get("participant_ids") or "[]"))
+        except (TypeError, ValueError):
+            pass
+    elif table == "relationship_digests" and "covered_through_id" in row:
+        row["covered_through_id"] = memory_ids.covered_through(row["covered_through_id"])
+    return row
+
+def import_lines(lines, batch_size=IMPORT_BATCH_SIZE, resume_from=0):
+    """
+    Imports NDJSON lines (str or bytes) in transactions of batch_size rows.
+
+    Memories, chat logs and archives get new ids, so an import merges into a database that
+    already has rows of its own; a row whose content key (_CONTENT_KEYS) is already present
+    is counted as a duplicate instead. Replaying a file is therefore harmless, and resume_from
+    (the "lines_committed" value of the last report) only saves the time of the skipped lines.
+    Memories before the resume point are still looked up so digests after it map correctly.
+    """
+    start = time.perf_counter()
+    database.flush_writes()
+    conn = database.connect_shard()
+    cursor = conn.cursor()
+    known_columns = {table: set(_table_columns(cursor, table)) for table in _CONFLICT_CLAUSE}
+    memory_ids = _MemoryIdMap()
+
+    imported = 0
+    duplicates = 0
+    skipped = 0
+    in_batch = 0
+    imported_in_batch = 0
+    line_no = 0
+    lines_committed = resume_from
+    error = None
+    try:
+        for line_no, line in enumerate(lines, start=1):
+            resumed = line_no <= resume_from
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if not line or (resumed and '"event_memories"' not in line):
+                continue
+
+            record = json.loads(line)
+            if record.get("type") == "header":
+                if record.get("format") != EXPORT_FORMAT:
+                    raise ValueError(f"Not a {EXPORT_FORMAT} export")
+                continue
+
+            table = record.get("table")
+            if table not in _CONFLICT_CLAUSE:
+                skipped += 1
+                continue
+            row = _prepare_row(table, record.get("row") or {}, memory_ids)
+            old_id = row.get("id")
+            if resumed:
+                if table == "event_memories":
+                    memory_ids.add(old_id, _find_existing(cursor, table, row) or 0)
+                continue
+
+            existing_id = _find_existing(cursor, table, row) if table in _CONTENT_KEYS else None
+            if existing_id is not None:
+                duplicates += 1
+                if table == "event_memories":
+                    memory_ids.add(old_id, existing_id)
+                continue
+
+            # Columns unknown to this version of the schema are dropped, and so are MinHash
+            # signatures (they may predate minhash.SIGNATURE_VERSION and are rebuilt below)
+            # and the ids of tables whose rows are renumbered
+            columns = [c for c in row if c in known_columns[table] and c != "minhash"
+                       and not (c == "id" and table in _CONTENT_KEYS)]
+            if not columns:
+                skipped += 1
+                continue
+
+            placeholders = ", ".join("?" for _ in columns)
+            cursor.execute(
+                f'INSERT {_CONFLICT_CLAUSE[table]} INTO {table} ({", ".join(columns)}) VALUES ({placeholders})',
+                [row[c] for c in columns]
+            )
+            if cursor.rowcount > 0:
+                imported_in_batch += 1
+                if table == "event_memories":
+                    memory_ids.add(old_id, cursor.lastrowid)
+            else:
+                duplicates += 1 # Primary key taken (digest of the same group, same zone)
+            in_batch += 1
+            if in_batch >= batch_size:
+                conn.commit()
+                imported += imported_in_batch
+                lines_committed = line_no
+                in_batch = imported_in_batch = 0
+
+        conn.commit()
+        imported += imported_in_batch
+        imported_in_batch = 0
+        lines_committed = max(lines_committed, line_no)
+    except Exception as e:
+        # The open batch is rolled back; everything up to lines_committed is durable
+        conn.rollback()
+        error = f"Line {line_no}: {e}"
+        print(f"DB Error importing data ({error}). Resume from line {lines_committed}.")
+    finally:
+        conn.close()
+        database.warm_location_cache()
+        database.backfill_group_keys() # Exports from older versions have no group_key
+        database.rebuild_memory_lsh() # Imported memories must be found by duplicate detection
+        database.invalidate_memory_blocks()
+
+    report = _report(imported, lines_committed, start)
+    report["duplicates"] = duplicates
+    report["skipped"] = skipped
+    if error:
+        report["error"] = error
+    else:
+        print(f"DB: Imported {imported} rows, {duplicates} already present ({report['rows_per_second']} rows/s).")
+    return report
+
+def open_import_file(path):
+    """Opens an export file for line iteration, transparently handling gzip."""
+    with open(path, 'rb') as probe:
+        is_gzip = probe.read(2) == b"\x1f\x8b"
+    return gzip.open(path, 'rb') if is_gzip else open(path, 'rb')
+
+def _report(rows, lines, start):
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "lines_committed": lines,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds, 1) if seconds > 0 else 0
+    }
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or import the SimsAIChat memory database as NDJSON.")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "memory.db"),
+                        help="Path to memory.db (defaults to the one next to the server).")
+    parser.add_argument("--save-id", default=None,
+                        help="Save game shard to use (stored next to memory.db). Omit for memory.db itself.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = sub.add_parser("export", help="Write the database to an NDJSON file (.gz to compress).")
+    export_cmd.add_argument("path")
+    export_cmd.add_argument("--tables", default=",".join(EXPORT_TABLES))
+    export_cmd.add_argument("--gzip", action="store_true", help="Compress even without a .gz extension.")
+
+    import_cmd = sub.add_parser("import", help="Load an NDJSON export (plain or gzip) into the database.")
+    import_cmd.add_argument("path")
+    import_cmd.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    import_cmd.add_argument("--resume-from", type=int, default=0,
+                            help="Skip this many lines (lines_committed of an interrupted run).")
+
+    args = parser.parse_args(argv)
+    database.DB_FILE = args.db
+    database.SHARD_DIR = os.path.join(os.path.dirname(os.path.abspath(args.db)), "memory_shards")
+    database.init_db()
+    database.select_shard(args.save_id)
+
+    if args.command == "export":
+        tables = tuple(t.strip() for t in args.tables.split(",") if t.strip())
+        report = export_to_file(args.path, tables, compress=True if args.gzip else None)
+    else:
+        with open_import_file(args.path) as f:
+            report = import_lines(f, batch_size=args.batch_size, resume_from=args.resume_from)
+
+    print(json.dumps(report))
+    return 1 if "error" in report else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
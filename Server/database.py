@@ -3,12 +3,278 @@
 import sqlite3
 import json
 import datetime
+import zlib
+import queue
+import threading
+import time
+import atexit
+import os
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+from Server import minhash
 
 DB_FILE = "memory.db"
 
+# --- SHARDING ---
+# Every save game gets its own sqlite file in SHARD_DIR, so queries and indexes only ever
+# cover the save being played. DB_FILE remains the default shard for chats that arrive
+# without a save identifier, and it still holds the data of versions before sharding.
+SHARD_DIR = "memory_shards"
+DEFAULT_SHARD = "default"
+MAX_OPEN_SHARDS = 4
+SHARD_IDLE_SECONDS = 1800
+# Saves that started before sharding still find their older memories/descriptions in DB_FILE
+LEGACY_SHARD_FALLBACK = True
+
+# --- RETENTION POLICY ---
+# Chat log rows beyond any of these limits are moved into conversation_archive.
+# A value of 0 disables that limit. The server overrides these from config.json.
+RETENTION_MAX_AGE_DAYS = 30
+RETENTION_MAX_ROWS = 20000
+RETENTION_MAX_BYTES = 0
+ARCHIVE_BATCH_SIZE = 500
+VACUUM_PAGES_PER_STEP = 200
+
+# --- BACKGROUND WRITER ---
+# Chat log and memory inserts are queued and committed together by one writer thread.
+# WRITER_MAX_LATENCY bounds how long (seconds) a queued row may wait for its commit.
+WRITER_QUEUE_SIZE = 1000
+WRITER_MAX_BATCH = 200
+WRITER_MAX_LATENCY = 0.5
+# A full queue makes callers wait (in steps of WRITER_PUT_TIMEOUT seconds) instead of writing
+# around it, so rows are committed in submit order. A failed batch is retried WRITER_MAX_ATTEMPTS
+# times, then row by row so one bad row cannot take the others with it.
+WRITER_PUT_TIMEOUT = 1.0
+WRITER_MAX_ATTEMPTS = 3
+WRITER_RETRY_DELAY = 0.5 # Seconds, times the attempt number
+
+# --- RELATIONSHIP DIGESTS ---
+# Older memories of a sim pair/group are rolled up into one digest row. The newest
+# DIGEST_KEEP_RECENT memories of a group always stay raw, and a roll-up only happens
+# once DIGEST_MIN_BATCH older memories are not yet covered by the digest.
+DIGEST_KEEP_RECENT = 3
+DIGEST_MIN_BATCH = 3
+MAX_DIGESTS_IN_PROMPT = 2
+MAX_RAW_MEMORIES_IN_PROMPT = 5
+
+# --- NEAR-DUPLICATE MEMORIES ---
+# A new memory whose summary is at least this similar (exact Jaccard of the word shingles,
+# candidates found through MinHash LSH) to a not yet digested memory of the same group
+# replaces it and counts one more occurrence. Kept high: "she is pregnant" and "she is not
+# pregnant" must stay two events.
+MEMORY_DUPLICATE_THRESHOLD = 0.85
+LSH_REBUILD_BATCH = 500 # Memories indexed per transaction by rebuild_memory_lsh()
+
+# --- LOCATION CACHE ---
+# Lot descriptions only change through set_location_description, so reads are served
+# from memory (one cache per shard). Least recently used zones are evicted beyond this.
+LOCATION_CACHE_SIZE = 512
+
+# --- PROMPT MEMORY CACHE ---
+# fetch_relevant_memories results per cast, so a prefetch while the player is still picking
+# a sim makes the real chat start a dictionary hit. Every committed memory or digest write
+# to a shard drops its cached blocks.
+MEMORY_BLOCK_CACHE_SIZE = 32
+
+class _Shard:
+    """One save game's database: a lazily opened, lock-guarded connection plus its caches."""
+    def __init__(self, key, path):
+        self.key = key
+        self.path = path
+        self.conn = None
+        self.closed = False # Set once evicted; a closed shard never reopens, the registry makes a new one
+        self.lock = threading.RLock()
+        self.last_used = time.monotonic()
+        self.location_cache = OrderedDict() # zone_id -> description (None = known to be undescribed)
+        self.location_cache_lock = threading.Lock()
+        self.location_stats = {"hits": 0, "misses": 0}
+        self.memory_blocks = OrderedDict() # (frozenset of sim ids, limit) -> prompt memory block
+        self.memory_blocks_lock = threading.Lock()
+        self.memory_generation = 0         # Bumped by every memory/digest write
+        self.memory_stats = {"hits": 0, "misses": 0}
+
+    def open(self):
+        """Caller must hold self.lock and have checked self.closed."""
+        if self.closed:
+            raise sqlite3.ProgrammingError(f"Shard '{self.key}' was closed")
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            _init_schema(self.conn)
+        return self.conn
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+_shards = OrderedDict() # shard key -> _Shard, least recently used first
+_shards_lock = threading.Lock()
+_opening_shards = {} # shard key -> Event set once the thread opening it has published (or failed)
+_active_shard = DEFAULT_SHARD
+
+def _shard_key(save_id):
+    """Normalizes a save identifier into a file-name safe shard key."""
+    if save_id in (None, "", 0, "0"):
+        return DEFAULT_SHARD
+    key = re.sub(r'[^A-Za-z0-9_-]', '_', str(save_id))[:64]
+    return key or DEFAULT_SHARD
+
+def _shard_path(key):
+    if key == DEFAULT_SHARD:
+        return DB_FILE
+    return os.path.join(SHARD_DIR, f"save_{key}.db")
+
+def _get_shard(key=None):
+    """Returns the shard for key (default: active shard), opening it and evicting the LRU one."""
+    key = key or _active_shard
+    while True:
+        with _shards_lock:
+            shard = _shards.get(key)
+            if shard is not None:
+                _shards.move_to_end(key)
+                shard.last_used = time.monotonic()
+                evicted = _evict_shards_locked(key)
+                break
+            opening = _opening_shards.get(key)
+            is_opener = opening is None
+            if is_opener:
+                opening = _opening_shards[key] = threading.Event()
+        if not is_opener:
+            # Another thread is opening this shard; the others stay available meanwhile
+            opening.wait()
+            continue
+
+        # Opening may migrate the schema or warm a large cache, so it runs outside the registry lock
+        shard = None
+        try:
+            if key != DEFAULT_SHARD:
+                os.makedirs(SHARD_DIR, exist_ok=True)
+            new_shard = _Shard(key, _shard_path(key))
+            with new_shard.lock:
+                new_shard.open()
+            _warm_location_cache(new_shard)
+            shard = new_shard
+        finally:
+            # Waiters retry on failure (and then try to open it themselves)
+            with _shards_lock:
+                _opening_shards.pop(key, None)
+                if shard is not None:
+                    _shards[key] = shard
+                    shard.last_used = time.monotonic()
+                    evicted = _evict_shards_locked(key)
+            opening.set()
+        break
+
+    # Closing waits for in-flight statements, so never do it while holding the registry lock
+    for old in evicted:
+        old.close()
+    return shard
+
+def _evict_shards_locked(key):
+    """Pops least recently used shards beyond MAX_OPEN_SHARDS. Caller must hold _shards_lock."""
+    # Never evict the shard being requested or the one the game is playing
+    evicted = []
+    candidates = [k for k in _shards if k not in (key, _active_shard)]
+    while len(_shards) > MAX_OPEN_SHARDS and candidates:
+        evicted.append(_shards.pop(candidates.pop(0)))
+    return evicted
+
+@contextmanager
+def _db(key=None):
+    """Pooled connection of a shard, serialized by the shard lock. Commit is up to the caller."""
+    while True:
+        shard = _get_shard(key)
+        with shard.lock:
+            if not shard.closed:
+                conn = shard.open()
+                try:
+                    yield conn
+                except Exception:
+                    conn.rollback()
+                    raise
+                return
+        # Evicted between the lookup and the lock: the registry hands out (or reopens) the live one
+
+def connect_shard(key=None):
+    """
+    Dedicated connection to a shard (default: active shard) for long-running work such as
+    export, import and maintenance. It bypasses the shard lock; the caller must close it.
+    """
+    shard = _get_shard(key)
+    return sqlite3.connect(shard.path, timeout=30)
+
+def select_shard(save_id):
+    """Makes the shard of save_id (a save or household identifier) the target of later calls."""
+    global _active_shard
+    key = _shard_key(save_id)
+    if key != _active_shard:
+        print(f"DB: Switching to shard '{key}'.")
+    _get_shard(key)
+    _active_shard = key
+    return key
+
+def list_shards():
+    """Keys of every shard on disk (opened or not)."""
+    keys = [DEFAULT_SHARD]
+    if os.path.isdir(SHARD_DIR):
+        for name in sorted(os.listdir(SHARD_DIR)):
+            if name.startswith("save_") and name.endswith(".db"):
+                keys.append(name[len("save_"):-len(".db")])
+    return keys
+
+def close_idle_shards(max_idle=None):
+    """Closes shards (other than the active one) unused for max_idle seconds."""
+    max_idle = SHARD_IDLE_SECONDS if max_idle is None else max_idle
+    now = time.monotonic()
+    with _shards_lock:
+        idle = [k for k, sh in _shards.items() if k != _active_shard and now - sh.last_used >= max_idle]
+        closing = [_shards.pop(k) for k in idle]
+    for shard in closing:
+        shard.close()
+    return [shard.key for shard in closing]
+
+def close_all_shards():
+    with _shards_lock:
+        closing = list(_shards.values())
+        _shards.clear()
+    for shard in closing:
+        shard.close()
+
+def get_shard_stats():
+    with _shards_lock:
+        open_shards = list(_shards.keys())
+    return {"active": _active_shard, "open": open_shards, "max_open": MAX_OPEN_SHARDS}
+
+def _ensure_incremental_vacuum(conn):
+    """
+    Gives a new, still empty file auto_vacuum=INCREMENTAL, which is free before its first table.
+    Files created earlier keep their mode until migrate_auto_vacuum() runs during maintenance,
+    so opening a shard never rewrites it.
+    """
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA auto_vacuum')
+    if cursor.fetchone()[0] == 2:
+        return
+    cursor.execute('SELECT COUNT(*) FROM sqlite_master')
+    if cursor.fetchone()[0] == 0:
+        cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+
+def _column_names(cursor, table):
+    cursor.execute(f'PRAGMA table_info({table})')
+    return {row[1] for row in cursor.fetchall()}
+
 def init_db():
-    """Initializes the database tables."""
-    conn = sqlite3.connect(DB_FILE)
+    """Initializes the default shard. Save shards are created lazily by select_shard()."""
+    close_all_shards()
+    _get_shard(DEFAULT_SHARD)
+    print("Server: Database initialized.")
+
+def _init_schema(conn):
+    """Creates or migrates the tables of one shard."""
+    _ensure_incremental_vacuum(conn)
     cursor = conn.cursor()
     
     # 1. Chat Logs (Short Term / Debug)
@@ -18,9 +284,31 @@ def init_db():
             sim_name TEXT NOT NULL,
             role TEXT NOT NULL,
             message TEXT NOT NULL,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            session_id TEXT
         )
     ''')
+    # Databases created before chat sessions were tracked lack the column
+    if 'session_id' not in _column_names(cursor, 'conversation_history'):
+        cursor.execute('ALTER TABLE conversation_history ADD COLUMN session_id TEXT')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_session ON conversation_history(session_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_timestamp ON conversation_history(timestamp)')
+
+    # 1b. Archived Chat Logs (Compressed, moved here by the retention policy)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS conversation_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            first_message_id INTEGER,
+            last_message_id INTEGER,
+            row_count INTEGER,
+            started_at DATETIME,
+            ended_at DATETIME,
+            payload BLOB,            -- zlib(JSON list of [id, sim_name, role, message, timestamp])
+            archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_archive_session ON conversation_archive(session_id)')
     
     # 2. Location Context (Persistent Descriptions)
     cursor.execute('''
@@ -39,104 +327,786 @@ def init_db():
             participants_names TEXT, -- Readable names for debugging
             location TEXT,           
             time_context TEXT,       
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            group_key TEXT,          -- Sorted participant ids, see make_group_key()
+            minhash TEXT,            -- Hex MinHash signature of the summary, see minhash.py
+            occurrences INTEGER DEFAULT 1
+        )
+    ''')
+    memory_columns = _column_names(cursor, 'event_memories')
+    if 'group_key' not in memory_columns:
+        cursor.execute('ALTER TABLE event_memories ADD COLUMN group_key TEXT')
+    if 'minhash' not in memory_columns:
+        cursor.execute('ALTER TABLE event_memories ADD COLUMN minhash TEXT')
+    if 'occurrences' not in memory_columns:
+        cursor.execute('ALTER TABLE event_memories ADD COLUMN occurrences INTEGER DEFAULT 1')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_memories_group ON event_memories(group_key, id)')
+    _backfill_group_keys(conn)
+
+    # LSH buckets of memory signatures, scoped to the group (only the same sims can be merged)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS memory_lsh (
+            group_key TEXT,
+            bucket INTEGER,
+            memory_id INTEGER
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_lsh_bucket ON memory_lsh(group_key, bucket)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_lsh_memory ON memory_lsh(memory_id)')
+    # user_version holds the minhash.SIGNATURE_VERSION of the stored signatures. Outdated ones
+    # are dropped here (cheap) and recomputed by rebuild_memory_lsh() during maintenance.
+    cursor.execute('PRAGMA user_version')
+    if cursor.fetchone()[0] < minhash.SIGNATURE_VERSION:
+        cursor.execute('UPDATE event_memories SET minhash = NULL WHERE minhash IS NOT NULL')
+        cursor.execute('DELETE FROM memory_lsh')
+        cursor.execute(f'PRAGMA user_version = {minhash.SIGNATURE_VERSION}')
+
+    # 4. Relationship Digests (Rolled up from older event memories)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS relationship_digests (
+            group_key TEXT PRIMARY KEY,
+            participant_ids TEXT,      -- JSON List of IDs
+            participants_names TEXT,
+            digest TEXT,
+            covered_through_id INTEGER, -- Highest event_memories id folded into the digest
+            memory_count INTEGER,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
     ''')
     
     conn.commit()
-    conn.close()
-    print("Server: Database initialized.")
 
-# --- CHAT LOGGING ---
-def add_message(sim_name, role, message):
-    conn = sqlite3.connect(DB_FILE)
+def make_group_key(participant_ids):
+    """Order-independent key of a set of sims, e.g. [3, 1, 3] -> "1,3"."""
+    return ",".join(sorted({str(pid) for pid in participant_ids if pid is not None}))
+
+def _backfill_group_keys(conn):
+    """Memories saved (or imported) without a group_key get one computed from participant_ids."""
     cursor = conn.cursor()
-    cursor.execute('INSERT INTO conversation_history (sim_name, role, message) VALUES (?, ?, ?)', 
-                   (sim_name, role, message))
-    conn.commit()
-    conn.close()
+    cursor.execute('SELECT id, participant_ids FROM event_memories WHERE group_key IS NULL')
+    updates = []
+    for row_id, ids_json in cursor.fetchall():
+        try:
+            updates.append((make_group_key(json.loads(ids_json)), row_id))
+        except:
+            continue
+    if updates:
+        cursor.executemany('UPDATE event_memories SET group_key = ? WHERE id = ?', updates)
+        conn.commit()
+
+def backfill_group_keys(key=None):
+    with _db(key) as conn:
+        _backfill_group_keys(conn)
+
+def rebuild_memory_lsh(should_continue=None, key=None):
+    """
+    Indexes memories that have no LSH buckets yet (imported rows, rows from before dedup or
+    from an older signature version), computing signatures that are missing. Works in
+    batches of LSH_REBUILD_BATCH. Returns the number of memories indexed.
+    """
+    indexed = 0
+    while not should_continue or should_continue():
+        with _db(key) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, group_key, summary, minhash FROM event_memories
+                WHERE group_key IS NOT NULL AND id NOT IN (SELECT memory_id FROM memory_lsh)
+                LIMIT ?
+            ''', (LSH_REBUILD_BATCH,))
+            rows = cursor.fetchall()
+            for memory_id, group_key, summary, stored in rows:
+                signature = minhash.from_text(stored) if stored else None
+                if not signature:
+                    signature = minhash.signature(summary)
+                    cursor.execute('UPDATE event_memories SET minhash = ? WHERE id = ?',
+                                   (minhash.to_text(signature), memory_id))
+                cursor.executemany('INSERT INTO memory_lsh (group_key, bucket, memory_id) VALUES (?, ?, ?)',
+                                   [(group_key, bucket, memory_id) for bucket in minhash.band_keys(signature)])
+            conn.commit()
+        indexed += len(rows)
+        if len(rows) < LSH_REBUILD_BATCH:
+            break
+    if indexed:
+        print(f"DB: Indexed {indexed} memories for duplicate detection.")
+    return indexed
+
+# --- BACKGROUND WRITER ---
+_INSERT_SQL = {
+    "message": 'INSERT INTO conversation_history (sim_name, role, message, session_id) VALUES (?, ?, ?, ?)',
+    "memory": '''
+        INSERT INTO event_memories 
+        (participant_ids, summary, participants_names, location, time_context, group_key, minhash, occurrences)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+}
+
+def _find_duplicate_memory(cursor, group_key, summary, buckets):
+    """(id, occurrences) of the most similar undigested memory of the group above the threshold, or None."""
+    placeholders = ", ".join("?" for _ in buckets)
+    cursor.execute(f'''
+        SELECT DISTINCT m.id, m.summary, m.occurrences
+        FROM memory_lsh l
+        JOIN event_memories m ON m.id = l.memory_id
+        WHERE l.group_key = ? AND l.bucket IN ({placeholders})
+          AND m.id > COALESCE((SELECT covered_through_id FROM relationship_digests WHERE group_key = ?), 0)
+    ''', [group_key] + buckets + [group_key])
+
+    best, best_score = None, MEMORY_DUPLICATE_THRESHOLD
+    for row_id, stored, occurrences in cursor.fetchall():
+        score = minhash.jaccard(summary, stored)
+        if score >= best_score:
+            best, best_score = (row_id, occurrences or 1), score
+    return best
+
+def _store_memories(cursor, rows):
+    """
+    Inserts memory rows, merging near-duplicates. The new memory replaces the one it repeats
+    and carries its count plus one, so a repeated event ranks as recent in the prompt.
+    Returns the number of merged rows.
+    """
+    merged = 0
+    for ids_json, summary, names, location, time_context, group_key in rows:
+        signature = minhash.signature(summary)
+        buckets = minhash.band_keys(signature)
+        occurrences = 1
+        duplicate = _find_duplicate_memory(cursor, group_key, summary, buckets) if group_key else None
+        if duplicate:
+            # The latest wording, time and place win: the newer summary may carry new details
+            duplicate_id, occurrences = duplicate[0], duplicate[1] + 1
+            cursor.execute('DELETE FROM event_memories WHERE id = ?', (duplicate_id,))
+            cursor.execute('DELETE FROM memory_lsh WHERE memory_id = ?', (duplicate_id,))
+            merged += 1
+
+        cursor.execute(_INSERT_SQL["memory"], (ids_json, summary, names, location, time_context, group_key,
+                                               minhash.to_text(signature), occurrences))
+        memory_id = cursor.lastrowid
+        cursor.executemany('INSERT INTO memory_lsh (group_key, bucket, memory_id) VALUES (?, ?, ?)',
+                           [(group_key, bucket, memory_id) for bucket in buckets])
+    return merged
+
+class _BackgroundWriter:
+    """
+    Group-commit writer: callers enqueue rows and return immediately, a single daemon
+    thread drains the queue and commits everything that arrived within WRITER_MAX_LATENCY
+    in one transaction (one executemany per table). Rows reach the database in submit order.
+    """
+    _FLUSH = object()
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "batches": 0,
+            "rows": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "max_queue_depth": 0,
+            "blocked_submits": 0,
+            "merged_memories": 0,
+            "errors": 0,
+            "lost_rows": 0
+        }
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="DBWriter")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def submit(self, kind, row):
+        # The shard is fixed at submit time; the game may switch saves before the commit
+        item = (_active_shard, kind, row)
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Backpressure: wait for the writer rather than commit ahead of the queued rows
+            with self._stats_lock:
+                self._stats["blocked_submits"] += 1
+            while True:
+                try:
+                    self._queue.put(item, timeout=WRITER_PUT_TIMEOUT)
+                    break
+                except queue.Full:
+                    print(f"DB: Write queue still full ({WRITER_QUEUE_SIZE} rows), waiting for the writer.")
+                    self._ensure_started()
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+
+    def flush(self, timeout=5.0):
+        """Blocks until every row queued before this call is committed."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((self._FLUSH, done))
+        return done.wait(timeout)
+
+    def stats(self):
+        with self._stats_lock:
+            report = dict(self._stats)
+        report["queue_depth"] = self._queue.qsize()
+        report["avg_batch_size"] = round(report["rows"] / report["batches"], 2) if report["batches"] else 0
+        return report
+
+    def _run(self):
+        while True:
+            batch, waiters = [], []
+            item = self._queue.get()
+            deadline = time.monotonic() + WRITER_MAX_LATENCY
+            while True:
+                if item[0] is self._FLUSH:
+                    waiters.append(item[1])
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= WRITER_MAX_BATCH or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, batch):
+        """Commits the batch, retrying failed shards; rows that fail even alone are logged and counted."""
+        for attempt in range(1, WRITER_MAX_ATTEMPTS):
+            batch = self._commit(batch)
+            if not batch:
+                return
+            time.sleep(WRITER_RETRY_DELAY * attempt)
+        batch = self._commit(batch)
+        for item in batch:
+            if self._commit([item]):
+                with self._stats_lock:
+                    self._stats["lost_rows"] += 1
+                print(f"DB Error: giving up on {item[1]} row for shard '{item[0]}': {item[2]!r}")
+
+    def _commit(self, batch):
+        """One transaction per shard. Returns the items of shards whose transaction failed."""
+        failed = []
+        grouped = {}
+        for shard_key, kind, row in batch:
+            grouped.setdefault(shard_key, {}).setdefault(kind, []).append(row)
+
+        for shard_key, kinds in grouped.items():
+            try:
+                with _db(shard_key) as conn:
+                    cursor = conn.cursor()
+                    merged = 0
+                    for kind, rows in kinds.items():
+                        if kind == "memory":
+                            merged = _store_memories(cursor, rows)
+                        else:
+                            cursor.executemany(_INSERT_SQL[kind], rows)
+                    conn.commit()
+            except Exception as e:
+                with self._stats_lock:
+                    self._stats["errors"] += 1
+                print(f"DB Error writing batch to shard '{shard_key}': {e}")
+                failed.extend(item for item in batch if item[0] == shard_key)
+                continue
+
+            if "memory" in kinds:
+                # Only now can a rebuilt prompt block contain the new (or merged) memories
+                invalidate_memory_blocks(shard_key)
+            for row in kinds.get("memory", []):
+                print(f"DB: Event Memory saved for group: {row[2]}")
+            if merged:
+                with self._stats_lock:
+                    self._stats["merged_memories"] += merged
+                print(f"DB: Merged {merged} near-duplicate memories.")
+
+        committed = len(batch) - len(failed)
+        if committed:
+            with self._stats_lock:
+                self._stats["batches"] += 1
+                self._stats["rows"] += committed
+                self._stats["last_batch_size"] = committed
+                if committed > self._stats["max_batch_size"]:
+                    self._stats["max_batch_size"] = committed
+        return failed
+
+_writer = _BackgroundWriter()
+
+def flush_writes(timeout=5.0):
+    """Commits all queued inserts. Called on shutdown and before reads that must see them."""
+    return _writer.flush(timeout)
+
+def get_writer_stats():
+    """Queue depth and batch size statistics of the background writer."""
+    return _writer.stats()
+
+atexit.register(flush_writes)
+
+# --- CHAT LOGGING ---
+def add_message(sim_name, role, message, session_id=None):
+    _writer.submit("message", (sim_name, role, message, session_id))
+
+def fetch_archived_messages(session_id):
+    """Returns the archived log of one session as (sim_name, role, message, timestamp) tuples."""
+    with _db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT payload FROM conversation_archive WHERE session_id IS ? ORDER BY first_message_id',
+                       (session_id,))
+        rows = cursor.fetchall()
+
+    messages = []
+    for (payload,) in rows:
+        for _, sim_name, role, message, timestamp in json.loads(zlib.decompress(payload).decode('utf-8')):
+            messages.append((sim_name, role, message, timestamp))
+    return messages
 
 # --- LOCATION ---
+def _cache_location(shard, zone_id, description):
+    """Caller must hold shard.location_cache_lock."""
+    shard.location_cache[zone_id] = description
+    shard.location_cache.move_to_end(zone_id)
+    while len(shard.location_cache) > LOCATION_CACHE_SIZE:
+        shard.location_cache.popitem(last=False)
+
+def _warm_location_cache(shard):
+    with shard.lock:
+        if shard.closed:
+            return # Evicted meanwhile; its replacement warms itself when opened
+        cursor = shard.open().cursor()
+        cursor.execute('SELECT zone_id, description FROM location_context LIMIT ?', (LOCATION_CACHE_SIZE,))
+        rows = cursor.fetchall()
+    with shard.location_cache_lock:
+        shard.location_cache.clear()
+        for zone_id, description in rows:
+            _cache_location(shard, zone_id, description)
+
+def warm_location_cache(key=None):
+    """Loads up to LOCATION_CACHE_SIZE stored descriptions of a shard into memory."""
+    _warm_location_cache(_get_shard(key))
+
+def get_location_cache_stats():
+    shard = _get_shard()
+    with shard.location_cache_lock:
+        report = dict(shard.location_stats)
+        report["size"] = len(shard.location_cache)
+    return report
+
 def set_location_description(zone_id, description):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO location_context (zone_id, description) 
-        VALUES (?, ?) 
-        ON CONFLICT(zone_id) DO UPDATE SET description=excluded.description
-    ''', (zone_id, description))
-    conn.commit()
-    conn.close()
+    shard = _get_shard()
+    with _db(shard.key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO location_context (zone_id, description) 
+            VALUES (?, ?) 
+            ON CONFLICT(zone_id) DO UPDATE SET description=excluded.description
+        ''', (zone_id, description))
+        conn.commit()
+    # Write-through: update memory only after the row is durable
+    with shard.location_cache_lock:
+        _cache_location(shard, zone_id, description)
 
-def get_location_description(zone_id):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('SELECT description FROM location_context WHERE zone_id = ?', (zone_id,))
-    row = cursor.fetchone()
-    conn.close()
-    return row[0] if row else None
+def get_location_description(zone_id, key=None):
+    shard = _get_shard(key)
+    with shard.location_cache_lock:
+        if zone_id in shard.location_cache:
+            shard.location_stats["hits"] += 1
+            shard.location_cache.move_to_end(zone_id)
+            return shard.location_cache[zone_id]
+        shard.location_stats["misses"] += 1
+
+    with _db(shard.key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT description FROM location_context WHERE zone_id = ?', (zone_id,))
+        row = cursor.fetchone()
+    description = row[0] if row else None
+    if description is None and LEGACY_SHARD_FALLBACK and shard.key != DEFAULT_SHARD:
+        description = get_location_description(zone_id, DEFAULT_SHARD)
+
+    with shard.location_cache_lock:
+        _cache_location(shard, zone_id, description)
+    return description
+
+def get_all_location_descriptions(key=None):
+    """Every described zone of a shard as {zone_id: description}, for the mod's local copy."""
+    shard = _get_shard(key)
+    descriptions = {}
+    if LEGACY_SHARD_FALLBACK and shard.key != DEFAULT_SHARD:
+        descriptions.update(get_all_location_descriptions(DEFAULT_SHARD))
+    with _db(shard.key) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT zone_id, description FROM location_context WHERE description IS NOT NULL AND description != ''")
+        descriptions.update(cursor.fetchall())
+    return descriptions
 
 # --- EVENT MEMORY MANAGEMENT ---
 
 def save_event_memory(participant_ids_list, summary, names_str, location, time_context):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
     ids_json = json.dumps(participant_ids_list)
-    cursor.execute('''
-        INSERT INTO event_memories 
-        (participant_ids, summary, participants_names, location, time_context)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (ids_json, summary, names_str, location, time_context))
-    conn.commit()
-    conn.close()
-    print(f"DB: Event Memory saved for group: {names_str}")
+    group_key = make_group_key(participant_ids_list)
+    _writer.submit("memory", (ids_json, summary, names_str, location, time_context, group_key))
 
-def fetch_relevant_memories(current_sim_ids, limit=50):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT participant_ids, time_context, location, summary, participants_names
-        FROM event_memories 
-        ORDER BY id DESC LIMIT ?
-    ''', (limit,))
-    rows = cursor.fetchall()
-    conn.close()
+def _relevant_digests(key, current_set):
+    """Digests of groups sharing at least two sims with the chat, best matches first."""
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT group_key, participant_ids, participants_names, digest, covered_through_id
+            FROM relationship_digests
+        ''')
+        rows = cursor.fetchall()
+
+    scored = []
+    for group_key, ids_json, names, digest, covered_through_id in rows:
+        try:
+            stored_ids = set(json.loads(ids_json))
+        except:
+            continue
+        overlap = len(stored_ids.intersection(current_set))
+        if overlap >= 2:
+            # Exact group first, then the largest overlap, then the smallest extra cast
+            scored.append(((stored_ids == current_set, overlap, -len(stored_ids)),
+                           group_key, names, digest, covered_through_id))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [item[1:] for item in scored[:MAX_DIGESTS_IN_PROMPT]]
+
+def _with_count(summary, occurrences):
+    return f"{summary} (happened {occurrences} times)" if occurrences and occurrences > 1 else summary
+
+def _matching_memories(key, current_set, limit, wanted, covered=None):
+    """Newest raw memories sharing two sims with the chat, skipping those already in a digest."""
+    covered = covered or {}
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, group_key, participant_ids, time_context, location, summary, participants_names, occurrences
+            FROM event_memories 
+            ORDER BY id DESC LIMIT ?
+        ''', (limit,))
+        rows = cursor.fetchall()
     
     relevant_memories = []
-    current_set = set(current_sim_ids)
     
     for row in rows:
-        stored_ids_json, time_str, loc, text, names = row
+        row_id, group_key, stored_ids_json, time_str, loc, text, names, occurrences = row
+        if group_key in covered and row_id <= covered[group_key]:
+            continue
         try:
             stored_ids = set(json.loads(stored_ids_json))
             overlap = stored_ids.intersection(current_set)
             if len(overlap) >= 2:
-                relevant_memories.append(f"- [{time_str} at {loc}]: {text} (Participants: {names})")
-                if len(relevant_memories) >= 5:
+                relevant_memories.append(f"- [{time_str} at {loc}]: {_with_count(text, occurrences)} (Participants: {names})")
+                if len(relevant_memories) >= wanted:
                     break
         except:
             continue
+    return relevant_memories
+
+def invalidate_memory_blocks(key=None):
+    """Drops the cached prompt memory blocks of a shard (None: every open shard)."""
+    with _shards_lock:
+        shards = [_shards[key]] if key in _shards else ([] if key else list(_shards.values()))
+    for shard in shards:
+        with shard.memory_blocks_lock:
+            shard.memory_generation += 1
+            shard.memory_blocks.clear()
+
+def get_memory_cache_stats():
+    shard = _get_shard()
+    with shard.memory_blocks_lock:
+        report = dict(shard.memory_stats)
+        report["size"] = len(shard.memory_blocks)
+    return report
+
+def fetch_relevant_memories(current_sim_ids, limit=50):
+    """
+    Memory block for the prompt: up to MAX_DIGESTS_IN_PROMPT relationship digests followed
+    by up to MAX_RAW_MEMORIES_IN_PROMPT recent raw memories not covered by those digests.
+    Its size stays constant no matter how long the sims have known each other.
+    Cached per cast until the shard's memories change (see MEMORY_BLOCK_CACHE_SIZE).
+    """
+    shard = _get_shard()
+    cache_key = (frozenset(current_sim_ids), limit)
+    with shard.memory_blocks_lock:
+        block = shard.memory_blocks.get(cache_key)
+        if block is not None:
+            shard.memory_stats["hits"] += 1
+            shard.memory_blocks.move_to_end(cache_key)
+            return block
+        shard.memory_stats["misses"] += 1
+        generation = shard.memory_generation
+
+    block = _build_memory_block(shard.key, set(current_sim_ids), limit)
+
+    with shard.memory_blocks_lock:
+        # A write while the block was built may be missing from it: return it, but do not keep it
+        if shard.memory_generation == generation:
+            shard.memory_blocks[cache_key] = block
+            while len(shard.memory_blocks) > MEMORY_BLOCK_CACHE_SIZE:
+                shard.memory_blocks.popitem(last=False)
+    return block
+
+def _build_memory_block(shard_key, current_set, limit):
+    flush_writes() # A memory saved at the end of the last chat must be visible here
+
+    digests = _relevant_digests(shard_key, current_set)
+    covered = {group_key: covered_through_id for group_key, _, _, covered_through_id in digests}
+    relevant_memories = _matching_memories(shard_key, current_set, limit, MAX_RAW_MEMORIES_IN_PROMPT, covered)
+
+    # Memories from before sharding live in the default shard and are older than any shard row
+    wanted = MAX_RAW_MEMORIES_IN_PROMPT - len(relevant_memories)
+    if wanted > 0 and LEGACY_SHARD_FALLBACK and shard_key != DEFAULT_SHARD:
+        relevant_memories += _matching_memories(DEFAULT_SHARD, current_set, limit, wanted)
             
-    if not relevant_memories:
+    if not relevant_memories and not digests:
         return "No relevant shared history found."
-        
-    return "\n".join(relevant_memories[::-1])
+
+    lines = [f"- [Relationship so far]: {digest} (Participants: {names})" for _, names, digest, _ in digests]
+    return "\n".join(lines + relevant_memories[::-1])
+
+# --- RELATIONSHIP DIGEST ROLL-UP ---
+def get_groups_needing_digest(key=None):
+    """Group keys with at least DIGEST_MIN_BATCH uncovered memories older than the newest DIGEST_KEEP_RECENT."""
+    flush_writes()
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT m.group_key
+            FROM event_memories m
+            LEFT JOIN relationship_digests d ON d.group_key = m.group_key
+            WHERE m.group_key IS NOT NULL AND m.id > COALESCE(d.covered_through_id, 0)
+            GROUP BY m.group_key
+            HAVING COUNT(*) >= ?
+        ''', (DIGEST_KEEP_RECENT + DIGEST_MIN_BATCH,))
+        return [row[0] for row in cursor.fetchall()]
+
+def get_digest_work(group_key, key=None):
+    """
+    Returns (previous_digest_or_None, memories_to_fold) for one group, where memories_to_fold
+    are (id, participant_ids_json, names, time_context, location, summary) tuples, oldest first.
+    """
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT digest, covered_through_id FROM relationship_digests WHERE group_key = ?',
+                       (group_key,))
+        digest_row = cursor.fetchone()
+        covered_through_id = digest_row[1] if digest_row else 0
+        cursor.execute('''
+            SELECT id, participant_ids, participants_names, time_context, location, summary, occurrences
+            FROM event_memories
+            WHERE group_key = ? AND id > ?
+            ORDER BY id
+        ''', (group_key, covered_through_id))
+        uncovered = [row[:5] + (_with_count(row[5], row[6]),) for row in cursor.fetchall()]
+
+    to_fold = uncovered[:-DIGEST_KEEP_RECENT] if DIGEST_KEEP_RECENT else uncovered
+    return (digest_row[0] if digest_row else None), to_fold
+
+def save_digest(group_key, participant_ids_json, names, digest, covered_through_id, folded_count, key=None):
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO relationship_digests
+            (group_key, participant_ids, participants_names, digest, covered_through_id, memory_count, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(group_key) DO UPDATE SET
+                participants_names = excluded.participants_names,
+                digest = excluded.digest,
+                covered_through_id = excluded.covered_through_id,
+                memory_count = relationship_digests.memory_count + excluded.memory_count,
+                updated_at = CURRENT_TIMESTAMP
+        ''', (group_key, participant_ids_json, names, digest, covered_through_id, folded_count))
+        conn.commit()
+    invalidate_memory_blocks(key or _active_shard)
+    print(f"DB: Relationship digest updated for group: {names}")
+
+def get_open_shards():
+    with _shards_lock:
+        return list(_shards.keys())
 
 # --- NEW: MAINTENANCE ---
 def purge_history():
-    """Wipes conversation logs and event memories. Keeps Location data."""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    """Wipes conversation logs, their archive and event memories of every save. Keeps Location data."""
+    flush_writes()
     try:
-        cursor.execute('DELETE FROM conversation_history')
-        cursor.execute('DELETE FROM event_memories')
-        cursor.execute('DELETE FROM sqlite_sequence WHERE name="conversation_history"')
-        cursor.execute('DELETE FROM sqlite_sequence WHERE name="event_memories"')
-        conn.commit()
+        for key in list_shards():
+            with _db(key) as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM conversation_history')
+                cursor.execute('DELETE FROM conversation_archive')
+                cursor.execute('DELETE FROM event_memories')
+                cursor.execute('DELETE FROM relationship_digests')
+                cursor.execute('DELETE FROM memory_lsh')
+                cursor.execute('DELETE FROM sqlite_sequence WHERE name="conversation_history"')
+                cursor.execute('DELETE FROM sqlite_sequence WHERE name="conversation_archive"')
+                cursor.execute('DELETE FROM sqlite_sequence WHERE name="event_memories"')
+                conn.commit()
+        invalidate_memory_blocks()
         print("DB: History and Memories purged.")
         return True
     except Exception as e:
         print(f"DB Error purging history: {e}")
         return False
+
+def _retention_cutoff_id(cursor):
+    """Highest conversation_history id that falls outside the retention policy (0 if none)."""
+    cutoff = 0
+
+    if RETENTION_MAX_AGE_DAYS:
+        cursor.execute("SELECT MAX(id) FROM conversation_history WHERE timestamp < datetime('now', ?)",
+                       (f'-{int(RETENTION_MAX_AGE_DAYS)} days',))
+        cutoff = max(cutoff, cursor.fetchone()[0] or 0)
+
+    if RETENTION_MAX_ROWS:
+        cursor.execute('SELECT id FROM conversation_history ORDER BY id DESC LIMIT 1 OFFSET ?',
+                       (int(RETENTION_MAX_ROWS),))
+        row = cursor.fetchone()
+        if row: cutoff = max(cutoff, row[0])
+
+    if RETENTION_MAX_BYTES:
+        # Walk newest -> oldest until the byte budget is spent; everything older is archived
+        used = 0
+        cursor.execute('''
+            SELECT id, length(sim_name) + length(role) + length(message)
+            FROM conversation_history ORDER BY id DESC
+        ''')
+        for row_id, size in cursor:
+            used += size or 0
+            if used > RETENTION_MAX_BYTES:
+                cutoff = max(cutoff, row_id)
+                break
+
+    return cutoff
+
+def _archive_batch(conn, cutoff_id):
+    """Moves up to ARCHIVE_BATCH_SIZE rows with id <= cutoff_id into the archive. Returns rows moved."""
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT id, session_id, sim_name, role, message, timestamp
+        FROM conversation_history WHERE id <= ? ORDER BY id LIMIT ?
+    ''', (cutoff_id, ARCHIVE_BATCH_SIZE))
+    rows = cursor.fetchall()
+    if not rows:
+        return 0
+
+    # One archive row per session keeps a whole conversation in a single compressed blob
+    sessions = {}
+    for row in rows:
+        sessions.setdefault(row[1], []).append(row)
+
+    for session_id, items in sessions.items():
+        packed = [[r[0], r[2], r[3], r[4], r[5]] for r in items]
+        payload = zlib.compress(json.dumps(packed).encode('utf-8'), 9)
+        cursor.execute('''
+            INSERT INTO conversation_archive
+            (session_id, first_message_id, last_message_id, row_count, started_at, ended_at, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (session_id, items[0][0], items[-1][0], len(items), items[0][5], items[-1][5], payload))
+
+    cursor.execute('DELETE FROM conversation_history WHERE id <= ?', (rows[-1][0],))
+    conn.commit()
+    return len(rows)
+
+def apply_retention(should_continue=None, key=None):
+    """
+    Archives chat log rows of a shard outside the retention policy, one small transaction per batch.
+    should_continue() is checked between batches so a starting chat interrupts the work.
+    """
+    flush_writes()
+    conn = connect_shard(key)
+    moved = 0
+    try:
+        cutoff_id = _retention_cutoff_id(conn.cursor())
+        while cutoff_id:
+            if should_continue and not should_continue():
+                break
+            batch = _archive_batch(conn, cutoff_id)
+            if not batch:
+                break
+            moved += batch
+    except Exception as e:
+        print(f"DB Error applying retention: {e}")
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+    if moved:
+        print(f"DB: Archived {moved} chat log rows.")
+    return moved
+
+def migrate_auto_vacuum(key=None):
+    """
+    One-time migration of a file created before incremental vacuum: auto_vacuum can only be
+    switched on an existing file by a full VACUUM, which rewrites the file and holds the shard
+    lock throughout. Only run it from idle maintenance. Returns True if the migration ran.
+    """
+    with _db(key) as conn:
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] == 2:
+            return False
+        name = key or _active_shard
+        print(f"DB: Migrating shard '{name}' to incremental vacuum (one-time full VACUUM)...")
+        start = time.perf_counter()
+        try:
+            cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            cursor.execute('VACUUM')
+        except Exception as e:
+            print(f"DB Error migrating shard '{name}': {e}")
+            return False
+        print(f"DB: Shard '{name}' migrated in {time.perf_counter() - start:.1f} s.")
+        return True
+
+def incremental_vacuum(should_continue=None, key=None):
+    """Releases free pages of a shard back to the OS in small steps. Returns the pages released."""
+    conn = connect_shard(key)
+    released = 0
+    try:
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] != 2:
+            return 0 # Not migrated yet (see migrate_auto_vacuum): the pragma would do nothing
+        cursor.execute('PRAGMA freelist_count')
+        free_pages = cursor.fetchone()[0]
+        while free_pages:
+            if should_continue and not should_continue():
+                break
+            cursor.execute(f'PRAGMA incremental_vacuum({VACUUM_PAGES_PER_STEP})')
+            cursor.fetchall()
+            cursor.execute('PRAGMA freelist_count')
+            remaining = cursor.fetchone()[0]
+            if remaining >= free_pages:
+                break # No progress (e.g. another connection holds a lock)
+            released += free_pages - remaining
+            free_pages = remaining
+    except Exception as e:
+        print(f"DB Error during incremental vacuum: {e}")
+    finally:
+        conn.close()
+    return released
+
+def run_maintenance(should_continue=None):
+    """
+    Retention and incremental VACUUM for every open shard (after the one-time auto_vacuum
+    migration of older files), then closes idle shards. Only call this from an idle background thread.
+    """
+    moved = 0
+    released = 0
+    for key in get_open_shards():
+        if should_continue and not should_continue():
+            break
+        moved += apply_retention(should_continue, key)
+        rebuild_memory_lsh(should_continue, key)
+        # The migration cannot be interrupted and holds the shard lock: never start it late
+        if should_continue and not should_continue():
+            break
+        migrate_auto_vacuum(key)
+        released += incremental_vacuum(should_continue, key)
+    if released:
+        print(f"DB: Maintenance released {released} free pages.")
+    closed = close_idle_shards()
+    return {"archived_rows": moved, "released_pages": released, "closed_shards": closed}
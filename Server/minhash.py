@@ -0,0 +1,88 @@
+# Server/minhash.py
+
+"""
+MinHash signatures and LSH band keys for spotting near-duplicate memory summaries.
+
+A summary is reduced to its set of word shingles (pairs of consecutive words, so a
+"not" or a swapped outcome changes several shingles). The signature keeps, for each of
+NUM_PERM hash functions, the smallest hash over that set; the fraction of equal slots of
+two signatures estimates the Jaccard similarity of the two shingle sets. Splitting the
+signature into BANDS bands of ROWS slots gives bucket keys: two summaries share a bucket
+(and are compared at all) if any band is identical, which happens with probability
+1 - (1 - s^ROWS)^BANDS for similarity s. Bucket mates are only candidates: the caller
+decides on the exact jaccard() of their shingles, so estimation noise never merges two
+events.
+"""
+
+import hashlib
+import random
+import re
+import zlib
+from array import array
+
+# Bumped whenever shingling or banding changes: stored signatures and buckets are then rebuilt
+SIGNATURE_VERSION = 2
+SHINGLE_SIZE = 2 # Words
+BANDS = 12
+ROWS = 5 # s = 0.85 shares a bucket with p > 0.999, s = 0.5 with p = 0.32
+NUM_PERM = BANDS * ROWS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = 0xFFFFFFFF
+
+# Fixed seed: signatures are stored in the database and must stay comparable across runs
+_rng = random.Random(0x51A5)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+def shingles(text):
+    """Set of SHINGLE_SIZE word shingles of the lower-cased, punctuation-free text."""
+    words = _NON_WORD.sub(" ", (text or "").lower()).split()
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+def jaccard(text_a, text_b):
+    """Exact Jaccard similarity of the shingle sets of two texts (0.0 - 1.0)."""
+    a, b = shingles(text_a), shingles(text_b)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+def signature(text):
+    """MinHash signature of text as an array of NUM_PERM unsigned 32-bit ints."""
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles(text)]
+    if not hashes:
+        return array('I', [_MAX_HASH] * NUM_PERM)
+    return array('I', [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ])
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures (0.0 - 1.0)."""
+    if len(sig_a) != len(sig_b) or not sig_a:
+        return 0.0
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+def band_keys(sig):
+    """One bucket key per band. The band index is part of the key, so keys of different bands never collide."""
+    keys = []
+    for band in range(BANDS):
+        chunk = sig[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(chunk.tobytes(), digest_size=8, salt=band.to_bytes(16, 'little')).digest()
+        keys.append(int.from_bytes(digest, 'little') >> 1) # 63 bits, fits an sqlite INTEGER
+    return keys
+
+def to_text(sig):
+    """Hex encoding for storage (keeps the NDJSON export plain JSON)."""
+    return sig.tobytes().hex()
+
+def from_text(text):
+    sig = array('I')
+    try:
+        sig.frombytes(bytes.fromhex(text or ""))
+    except ValueError:
+        return array('I')
+    return sig if len(sig) == NUM_PERM else array('I')
@@ -8,13 +8,19 @@
 # Official Source: https://github.com/dino2007/SimsAIChat
 # ==============================================================================
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
+from werkzeug.serving import WSGIRequestHandler
 import threading
 import sys
 import json
 import os
 import time
+import uuid
+import gzip
+import math
+import socket
 from Server import database
+from Server import data_transfer
 from Server.world_data import WORLD_DESCRIPTIONS, NEIGHBORHOOD_DESCRIPTIONS
 from Server.llm_wrapper import LLMClient
 
@@ -47,13 +53,18 @@ app = Flask(__name__, template_folder=template_dir)
 # Use writable path for config and db
 CONFIG_FILE = get_writable_path("config.json")
 database.DB_FILE = get_writable_path("memory.db") # Patch the DB path dynamically
+database.SHARD_DIR = get_writable_path("memory_shards") # One database per save game
 
 DEFAULT_CONFIG = {
     "provider": "Gemini",
     "api_key": "",
     "model": "gemini-2.5-flash",
     "temperature": 0.8,
-    "language": "English"
+    "language": "English",
+    "history_retention_days": 30,
+    "history_max_rows": 20000,
+    "history_max_bytes": 0,
+    "db_write_max_latency_ms": 500
 }
 
 def load_config():
@@ -71,13 +82,22 @@ def save_config_to_disk(cfg):
     with open(CONFIG_FILE, 'w') as f:
         json.dump(cfg, f, indent=4)
 
+def apply_database_config(cfg):
+    """ Pushes the retention policy and writer latency from config into the database module """
+    database.WRITER_MAX_LATENCY = int(cfg.get("db_write_max_latency_ms", DEFAULT_CONFIG["db_write_max_latency_ms"])) / 1000.0
+    database.RETENTION_MAX_AGE_DAYS = int(cfg.get("history_retention_days", DEFAULT_CONFIG["history_retention_days"]))
+    database.RETENTION_MAX_ROWS = int(cfg.get("history_max_rows", DEFAULT_CONFIG["history_max_rows"]))
+    database.RETENTION_MAX_BYTES = int(cfg.get("history_max_bytes", DEFAULT_CONFIG["history_max_bytes"]))
+
 # Initialize
 database.init_db()
 app_config = load_config()
+apply_database_config(app_config)
 ai_client = LLMClient(app_config)
 
 CURRENT_SESSION = {
     "status": "INACTIVE",
+    "session_id": None,
     "context": {},
     "history": [],
     "game_command": "WAIT",
@@ -86,8 +106,74 @@ CURRENT_SESSION = {
 }
 
 AWAITING_CONTEXT_UPDATE = False
-LAST_HEARTBEAT = 0
-HAS_CONNECTED = False
+
+# --- GAME LEASE ---
+# The server lives only as long as the game holds a lease. Every request of the mod renews it
+# for LEASE_DEFAULT_SECONDS; before a loading screen or a save the mod asks /system/lease for
+# a longer one, and releases it back to the default once the zone is loaded. Until the game
+# first connects there is no lease, and nothing expires.
+LEASE_DEFAULT_SECONDS = 15
+LEASE_MAX_SECONDS = 600
+WATCHDOG_MAX_SLEEP = 5 # The watchdog sleeps until the lease would expire, but at most this long
+LEASE_NEVER_CONNECTED = "NEVER_CONNECTED"
+LEASE_HELD = "HELD"
+LEASE_EXPIRED = "EXPIRED"
+GAME_LEASE = {"expires_at": None, "reason": None} # expires_at on the time.monotonic() clock
+GAME_LEASE_LOCK = threading.Lock()
+
+# --- GAME CHANNEL ---
+# The mod polls /system/channel: fast while a chat is open, slowly otherwise. Every request
+# carrying MOD_CLIENT_HEADER renews the game lease. Commands get an id so the game runs each
+# one once and acknowledges it on its next poll.
+MOD_CLIENT_HEADER = "X-SimsAIChat-Client"
+CHANNEL_FAST_INTERVAL = 0.5
+CHANNEL_IDLE_INTERVAL = 5
+GAME_CHANNEL = {"instance": uuid.uuid4().hex, "command_id": 0, "acked_id": 0}
+LAST_CHAT_ACTIVITY = time.time()
+
+# Database maintenance only runs after this long without any chat traffic
+MAINTENANCE_IDLE_SECONDS = 120
+MAINTENANCE_INTERVAL_SECONDS = 600
+
+# --- HELPER: SAVE GAME SHARD ---
+def select_save_shard(data):
+    """ Points the database at the sending save game (memory.db when the payload has no save id) """
+    # Never key by household: the same household id recurs across saves and would mix their memories
+    database.select_shard(data.get("save_id"))
+
+# --- HELPER: MOD TIMINGS ---
+PERF_LOG_SECTIONS = 6 # Slowest sections (by p95) printed per payload
+
+def log_mod_perf(perf):
+    """ Prints the mod's scrape/HTTP timing summary that rides along with init/update payloads. """
+    if not perf:
+        return
+    slowest = sorted(perf.items(), key=lambda item: item[1].get("p95", 0), reverse=True)[:PERF_LOG_SECTIONS]
+    entries = [f"{name} p50 {s.get('p50')}/p95 {s.get('p95')} ms (n={s.get('n')})" for name, s in slowest]
+    print(f"Perf (mod): {'; '.join(entries)}")
+
+# --- HELPER: GROUP RELATIONSHIPS ---
+def expand_relationship_matrix(data):
+    """
+    Fills each participant's relationship_with_cast from the group's relationship_matrix
+    (N x N friendship/romance rows sent once per scrape). Payloads without a matrix keep
+    the per-participant lists older mods send.
+    """
+    matrix = data.get("relationship_matrix")
+    if not matrix:
+        return
+    index = {sim_id: i for i, sim_id in enumerate(matrix.get("sim_ids", []))}
+    names, friend, romance = matrix.get("names", []), matrix.get("friend", []), matrix.get("romance", [])
+    for sim in data.get("participants", []):
+        i = index.get(sim.get("sim_id"))
+        if i is None:
+            continue
+        # Only significant relationships, to save tokens
+        sim["relationship_with_cast"] = [
+            {"name": names[j], "friend": friend[i][j], "romance": romance[i][j]}
+            for j in range(len(names))
+            if j != i and (friend[i][j] != 0 or romance[i][j] != 0)
+        ]
 
 # --- HELPER: FORMAT SIM DATA ---
 def format_sim_profile(sim_data):
@@ -133,6 +219,47 @@ def generate_summary(history_list, participants_names):
     )
     return ai_client.generate(prompt, "")
 
+# --- HELPER: RELATIONSHIP DIGESTS ---
+def generate_digest(previous_digest, memories, participants_names):
+    """ Folds older event memories into a (new) running digest of a relationship """
+    events_text = "\n".join(f"- [{time_ctx} at {loc}]: {summary}" for _, _, _, time_ctx, loc, summary in memories)
+    previous_text = previous_digest or "(No digest yet)"
+
+    prompt = (
+        f"You maintain the long-term relationship history between these Sims: {participants_names}\n"
+        f"CURRENT DIGEST:\n{previous_text}\n\n"
+        f"OLDER EVENTS TO FOLD IN (oldest first):\n{events_text}\n\n"
+        f"INSTRUCTIONS: Rewrite the digest as 3-5 sentences covering the whole arc of the relationship: "
+        f"how it started, turning points, recurring topics and where it stands now. Keep names and concrete facts. "
+        f"Do not mention that this is a summary.\nDIGEST:"
+    )
+    return ai_client.generate(prompt, "")
+
+def rollup_relationship_digests(should_continue=None):
+    """ Updates the digest of every sim group with enough older memories. Returns digests written. """
+    if not ai_client.is_ready:
+        return 0
+
+    updated = 0
+    for shard in database.get_open_shards():
+        for group_key in database.get_groups_needing_digest(shard):
+            if should_continue and not should_continue():
+                return updated
+            previous_digest, to_fold = database.get_digest_work(group_key, shard)
+            if not to_fold:
+                continue
+
+            # Latest names/ids win in case a Sim was renamed
+            newest = to_fold[-1]
+            digest = generate_digest(previous_digest, to_fold, newest[2])
+            if not digest or digest.startswith("[") or digest.startswith("AI Error"):
+                print(f"Server: Skipping digest for {newest[2]}: {digest}")
+                continue
+
+            database.save_digest(group_key, newest[1], newest[2], digest, newest[0], len(to_fold), shard)
+            updated += 1
+    return updated
+
 # --- ROUTES: SETTINGS & DATA ---
 
 @app.route('/settings/get', methods=['GET'])
@@ -147,6 +274,7 @@ def save_settings():
     # Update global config
     app_config.update(new_data)
     save_config_to_disk(app_config)
+    apply_database_config(app_config)
     
     # Reload AI
     print("Server: Reloading AI Client with new settings...")
@@ -155,6 +283,53 @@ def save_settings():
     status = "OK" if ai_client.is_ready else "Config Saved (Key Missing?)"
     return jsonify({"status": status})
 
+@app.route('/data/stats', methods=['GET'])
+def data_stats():
+    return jsonify({
+        "writer": database.get_writer_stats(),
+        "location_cache": database.get_location_cache_stats(),
+        "memory_cache": database.get_memory_cache_stats(),
+        "shards": database.get_shard_stats()
+    })
+
+@app.route('/data/archive', methods=['GET'])
+def archived_log():
+    """ Chat log of one session that retention moved to the archive (?session_id=...) """
+    messages = database.fetch_archived_messages(request.args.get("session_id"))
+    return jsonify({"messages": [
+        {"sim_name": sim_name, "role": role, "message": message, "timestamp": timestamp}
+        for sim_name, role, message, timestamp in messages
+    ]})
+
+@app.route('/data/export', methods=['GET'])
+def export_data():
+    """ Streams the memory database as NDJSON (?gzip=1 to compress, ?tables=a,b to filter) """
+    tables = data_transfer.EXPORT_TABLES
+    if request.args.get("tables"):
+        tables = tuple(t for t in request.args["tables"].split(",") if t in data_transfer.EXPORT_TABLES)
+
+    lines = data_transfer.iter_export_lines(tables)
+    if request.args.get("gzip") == "1":
+        return Response(stream_with_context(data_transfer.iter_gzip(lines)), mimetype="application/gzip",
+                        headers={"Content-Disposition": "attachment; filename=memory.ndjson.gz"})
+    return Response(stream_with_context(lines), mimetype="application/x-ndjson",
+                    headers={"Content-Disposition": "attachment; filename=memory.ndjson"})
+
+@app.route('/data/import', methods=['POST'])
+def import_data():
+    """ Imports an NDJSON body (?gzip=1 or Content-Encoding: gzip), resumable via ?resume_from=N """
+    stream = request.stream
+    if request.args.get("gzip") == "1" or request.headers.get("Content-Encoding") == "gzip":
+        stream = gzip.GzipFile(fileobj=stream, mode='rb')
+
+    resume_from = request.args.get("resume_from", "0")
+    if not resume_from.isdigit():
+        return jsonify({"status": "error", "error": "resume_from must be a non-negative integer"}), 400
+
+    report = data_transfer.import_lines(stream, resume_from=int(resume_from))
+    report["status"] = "error" if "error" in report else "ok"
+    return jsonify(report)
+
 @app.route('/data/purge', methods=['POST'])
 def purge_data():
     success = database.purge_history()
@@ -169,23 +344,49 @@ def index():
 
 @app.route('/location/get', methods=['POST'])
 def get_location():
+    select_save_shard(request.json)
     zone_id = request.json.get("zone_id")
     desc = database.get_location_description(zone_id)
     return jsonify({"description": desc if desc else ""})
 
+@app.route('/location/all', methods=['POST'])
+def get_all_locations():
+    """ Every described lot of the save at once; the mod keeps a local copy synced at zone load """
+    select_save_shard(request.json)
+    descriptions = database.get_all_location_descriptions()
+    return jsonify({"locations": {str(zone_id): desc for zone_id, desc in descriptions.items()}})
+
 @app.route('/location/update', methods=['POST'])
 def update_location():
+    select_save_shard(request.json)
     zone_id = request.json.get("zone_id")
     description = request.json.get("description")
     database.set_location_description(zone_id, description)
     return jsonify({"status": "ok"})
 
+@app.route('/game/prefetch', methods=['POST'])
+def game_prefetch():
+    """ The player is about to chat with these sims: warm their memory block and the lot description """
+    data = request.json or {}
+    select_save_shard(data)
+    database.fetch_relevant_memories([data.get("player_id")] + data.get("sim_ids", []))
+    if data.get("zone_id"):
+        database.get_location_description(data.get("zone_id"))
+    return jsonify({"status": "ok"})
+
 @app.route('/game/init', methods=['POST'])
 def game_init_chat():
+    global LAST_CHAT_ACTIVITY
     data = request.json
+    LAST_CHAT_ACTIVITY = time.time()
     CURRENT_SESSION["status"] = "ACTIVE"
+    CURRENT_SESSION["session_id"] = uuid.uuid4().hex
     CURRENT_SESSION["history"] = [] 
-    CURRENT_SESSION["game_command"] = "WAIT"
+    set_game_command("WAIT")
+    log_mod_perf(data.pop("perf", None))
+
+    # 0. Storage for this save game
+    select_save_shard(data)
     
     # 1. Environment Setup
     loc_data = data.get("location", {})
@@ -193,7 +394,8 @@ def game_init_chat():
     neighborhood_id = loc_data.get("neighborhood_id")
     world_id = loc_data.get("world_id")
     
-    lot_desc = database.get_location_description(zone_id) or "A building."
+    # The mod attaches the description from its synced copy; older mods do not
+    lot_desc = loc_data.get("lot_description") or database.get_location_description(zone_id) or "A building."
     neighborhood_desc = NEIGHBORHOOD_DESCRIPTIONS.get(neighborhood_id)
     world_desc = WORLD_DESCRIPTIONS.get(world_id, "The Sims World")
 
@@ -212,6 +414,7 @@ def game_init_chat():
     
     current_ids = [player_id]
     if mode == "GROUP":
+        expand_relationship_matrix(data)
         for sim in data.get("participants", []):
             current_ids.append(sim.get("sim_id"))
     else:
@@ -229,11 +432,13 @@ def game_update_context():
     global AWAITING_CONTEXT_UPDATE
     data = request.json
     print("Server: Received Fresh Context from Game.")
+    log_mod_perf(data.pop("perf", None))
     
     ctx = CURRENT_SESSION["context"]
     ctx["time_context"] = data.get("time_context")
     ctx["location"] = data.get("location")
     
+    expand_relationship_matrix(data)
     updated_participants = data.get("participants", [])
     if ctx["mode"] == "GROUP":
         ctx["participants"] = updated_participants
@@ -243,17 +448,19 @@ def game_update_context():
 
     loc_data = ctx["location"]
     zone_id = loc_data.get("zone_id")
-    lot_desc = database.get_location_description(zone_id) or "A building."
+    lot_desc = loc_data.get("lot_description") or database.get_location_description(zone_id) or "A building."
     CURRENT_SESSION["environment"]["lot"] = lot_desc
     CURRENT_SESSION["environment"]["lot_name"] = loc_data.get("lot_name")
 
-    CURRENT_SESSION["game_command"] = "WAIT"
+    set_game_command("WAIT")
     AWAITING_CONTEXT_UPDATE = False
     return jsonify({"status": "updated"})
 
 @app.route('/app/send', methods=['POST'])
 def app_send_message():
-    global AWAITING_CONTEXT_UPDATE
+    global AWAITING_CONTEXT_UPDATE, LAST_CHAT_ACTIVITY
+    LAST_CHAT_ACTIVITY = time.time()
+    session_id = CURRENT_SESSION.get("session_id")
     
     user_text = request.json.get("text", "")
     context = CURRENT_SESSION["context"]
@@ -265,7 +472,7 @@ def app_send_message():
         user_text = "(Player listens and waits for the others to continue...)"
     
     if not is_passive:
-        database.add_message("Player", "Player", user_text)
+        database.add_message("Player", "Player", user_text, session_id)
         CURRENT_SESSION["history"].append(("Player", user_text))
     else:
         CURRENT_SESSION["history"].append(("System", "Player listens silently."))
@@ -275,7 +482,7 @@ def app_send_message():
 
     # --- REQUEST UPDATE FROM GAME ---
     print("Server: Requesting context update from Game...")
-    CURRENT_SESSION["game_command"] = "SCRAPE"
+    set_game_command("SCRAPE")
     AWAITING_CONTEXT_UPDATE = True
     
     timeout = 40 
@@ -284,7 +491,7 @@ def app_send_message():
         timeout -= 1
         
     if timeout <= 0:
-        CURRENT_SESSION["game_command"] = "WAIT"
+        set_game_command("WAIT")
 
     # --- GENERATE RESPONSE ---
     history_text = ""
@@ -558,7 +765,7 @@ def app_send_message():
     # --- CALL AI WRAPPER ---
     reply = ai_client.generate(system_prompt, "")
 
-    database.add_message("Group" if mode == "GROUP" else "Sim", "AI", reply) 
+    database.add_message("Group" if mode == "GROUP" else "Sim", "AI", reply, session_id) 
     CURRENT_SESSION["history"].append(("AI", reply))
 
     return jsonify({"reply": reply})
@@ -576,7 +783,7 @@ def ui_end_chat():
     print("Server: Ending Chat. Generating Summary...")
     context = CURRENT_SESSION["context"]
     history = CURRENT_SESSION["history"]
-    CURRENT_SESSION["game_command"] = "RESUME"
+    set_game_command("RESUME")
     
     if not history:
         CURRENT_SESSION["status"] = "ENDING"
@@ -603,46 +810,187 @@ def ui_end_chat():
     CURRENT_SESSION["status"] = "ENDING"
     return jsonify({"status": "ok"})
 
-@app.route('/game/status', methods=['GET'])
-def game_check_status():
+# --- ROUTES: GAME CHANNEL ---
+
+def set_game_command(command):
+    """ Sets the command the game picks up on its next poll. Every non-WAIT command gets a new id. """
+    if command != "WAIT" and command != CURRENT_SESSION.get("game_command"):
+        GAME_CHANNEL["command_id"] += 1
+    CURRENT_SESSION["game_command"] = command
+
+def take_game_command():
+    """ Current command for the game. A finished chat (ENDING) turns into RESUME exactly once. """
     if CURRENT_SESSION["status"] == "ENDING":
         CURRENT_SESSION["status"] = "INACTIVE"
-        return jsonify({"command": "RESUME"})
-    return jsonify({"command": CURRENT_SESSION.get("game_command", "WAIT")})
+        set_game_command("RESUME")
+    return CURRENT_SESSION.get("game_command", "WAIT")
+
+# --- GAME LEASE ---
+def renew_lease(seconds=LEASE_DEFAULT_SECONDS, reason="heartbeat", replace=False):
+    """
+    Extends the game lease to at least `seconds` from now. With replace, the lease is set to
+    exactly that, so the mod can end a long loading lease early. Returns the seconds left.
+    """
+    seconds = max(0, min(float(seconds), LEASE_MAX_SECONDS))
+    now = time.monotonic()
+    with GAME_LEASE_LOCK:
+        expires_at = now + seconds
+        if not replace and GAME_LEASE["expires_at"] is not None and GAME_LEASE["expires_at"] > expires_at:
+            return GAME_LEASE["expires_at"] - now
+        GAME_LEASE["expires_at"] = expires_at
+        GAME_LEASE["reason"] = reason
+        return seconds
+
+def lease_status():
+    """ (state, seconds left, reason); seconds left is negative once expired. """
+    with GAME_LEASE_LOCK:
+        expires_at, reason = GAME_LEASE["expires_at"], GAME_LEASE["reason"]
+    if expires_at is None:
+        return LEASE_NEVER_CONNECTED, None, None
+    remaining = expires_at - time.monotonic()
+    return (LEASE_HELD if remaining > 0 else LEASE_EXPIRED), remaining, reason
+
+@app.before_request
+def track_game_liveness():
+    """ Any request of the mod proves the game is still running. """
+    if request.headers.get(MOD_CLIENT_HEADER) == "mod":
+        renew_lease()
+
+@app.route('/system/lease', methods=['POST'])
+def system_lease():
+    """ Explicit lease: {"seconds": n, "reason": "..."} before a loading screen, {"release": true} after it """
+    data = request.get_json(silent=True) or {}
+    if data.get("release"):
+        remaining = renew_lease(LEASE_DEFAULT_SECONDS, "released", replace=True)
+    else:
+        seconds = data.get("seconds")
+        # bool is an int, and NaN/inf would pass min/max unchanged
+        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or not math.isfinite(seconds) or seconds < 0:
+            return jsonify({"status": "error", "error": "seconds must be a non-negative number"}), 400
+        reason = str(data.get("reason", "requested"))
+        remaining = renew_lease(seconds, reason)
+        print(f"Server: Game lease extended for {reason} ({remaining:.0f}s).")
+    return jsonify({"status": "ok", "expires_in": round(remaining, 1)})
+
+@app.route('/system/channel', methods=['POST'])
+def system_channel():
+    """ Liveness, commands and acknowledgements in one poll. """
+    data = request.get_json(silent=True) or {}
+    acked_id = data.get("ack", 0)
+    if isinstance(acked_id, bool) or not isinstance(acked_id, int) or acked_id < 0:
+        return jsonify({"status": "error", "error": "ack must be a non-negative integer"}), 400
+    # Acks above our last id come from before a server restart
+    if GAME_CHANNEL["acked_id"] < acked_id <= GAME_CHANNEL["command_id"]:
+        GAME_CHANNEL["acked_id"] = acked_id
+
+    command = take_game_command()
+    command_id = GAME_CHANNEL["command_id"]
+    if command == "WAIT" or command_id <= GAME_CHANNEL["acked_id"]:
+        command = "WAIT"
+
+    chat_open = CURRENT_SESSION["status"] != "INACTIVE" or command != "WAIT"
+    return jsonify({
+        "instance": GAME_CHANNEL["instance"],
+        "command": command,
+        "command_id": command_id,
+        "interval": CHANNEL_FAST_INTERVAL if chat_open else CHANNEL_IDLE_INTERVAL
+    })
+
+# Older mod versions poll these two separately
+@app.route('/game/status', methods=['GET'])
+def game_check_status():
+    return jsonify({"command": take_game_command()})
 
 @app.route('/system/heartbeat', methods=['POST'])
 def system_heartbeat():
-    global LAST_HEARTBEAT, HAS_CONNECTED
-    LAST_HEARTBEAT = time.time()
-    HAS_CONNECTED = True
+    renew_lease()
     return jsonify({"status": "alive"})
 
+# --- SHUTDOWN ---
+# Run once, in order, before the process exits (watchdog or UI). os._exit skips atexit hooks.
+SHUTDOWN_HOOKS = [database.flush_writes, database.close_all_shards]
+_shutdown_lock = threading.Lock()
+_shutdown_done = False
+
+def run_shutdown_hooks():
+    global _shutdown_done
+    with _shutdown_lock:
+        if _shutdown_done:
+            return
+        _shutdown_done = True
+        for hook in SHUTDOWN_HOOKS:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Server: Shutdown hook {getattr(hook, '__name__', hook)} failed: {e}")
+
 def watchdog_loop():
-    """Shuts down server if no heartbeat received for 15 seconds."""
-    global LAST_HEARTBEAT, HAS_CONNECTED
+    """Shuts the server down in order once the game's lease has expired."""
     print("Server: Watchdog started.")
-    
+    reported_waiting = False
+
     while True:
-        time.sleep(2)
-        
-        # Only start counting down AFTER the game has connected at least once.
-        if HAS_CONNECTED:
-            time_since = time.time() - LAST_HEARTBEAT
-            # 15 seconds tolerance allows for loading screens / lag spikes
-            if time_since > 15:
-                print(f"Server: No heartbeat for {time_since:.1f}s. Game likely closed. Shutting down.")
-                os._exit(0) # Force kill to ensure Flask thread dies
+        state, remaining, reason = lease_status()
+        if state == LEASE_NEVER_CONNECTED:
+            # The server may be started long before the game; nothing to expire yet
+            if not reported_waiting:
+                print("Server: Waiting for the game to connect.")
+                reported_waiting = True
+            time.sleep(WATCHDOG_MAX_SLEEP)
+            continue
+
+        if state == LEASE_EXPIRED:
+            print(f"Server: Game lease ({reason}) expired {-remaining:.1f}s ago. Game likely closed. Shutting down.")
+            run_shutdown_hooks()
+            os._exit(0) # Force kill to ensure Flask thread dies
+
+        # Sleep until the lease would run out; a renewal meanwhile just means another round
+        time.sleep(min(remaining + 0.1, WATCHDOG_MAX_SLEEP))
+
+def is_chat_idle():
+    """True when no chat is running and the last chat traffic is old enough for maintenance."""
+    if CURRENT_SESSION["status"] != "INACTIVE":
+        return False
+    return time.time() - LAST_CHAT_ACTIVITY >= MAINTENANCE_IDLE_SECONDS
+
+def maintenance_loop():
+    """Archives old chat logs, runs incremental VACUUM and rolls up relationship digests while the chat is idle."""
+    last_run = 0
+    while True:
+        time.sleep(30)
+        if time.time() - last_run < MAINTENANCE_INTERVAL_SECONDS or not is_chat_idle():
+            continue
+        last_run = time.time()
+        try:
+            database.run_maintenance(should_continue=is_chat_idle)
+            rollup_relationship_digests(should_continue=is_chat_idle)
+        except Exception as e:
+            print(f"Server: Database maintenance failed: {e}")
+
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    """ Persistent connections; TCP_NODELAY so a response's header and body writes are not held back by Nagle. """
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 def start_app():
-    """Starts the Watchdog and the Flask Server"""
+    """Starts the Watchdog, the Maintenance worker and the Flask Server"""
     # 1. Start Watchdog (Daemon thread dies when main process dies)
     t = threading.Thread(target=watchdog_loop)
     t.daemon = True
     t.start()
+
+    # 2. Start Database Maintenance (Daemon thread, idle periods only)
+    m = threading.Thread(target=maintenance_loop)
+    m.daemon = True
+    m.start()
     
-    # 2. Run Flask
+    # 3. Run Flask
     # use_reloader=False is required for PyInstaller/Main.py execution
-    app.run(port=3000, use_reloader=False)
+    # HTTP/1.1 lets the mod keep its connections open between requests
+    app.run(port=3000, use_reloader=False, request_handler=KeepAliveRequestHandler)
 
 if __name__ == '__main__':
     start_app()
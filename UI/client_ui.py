@@ -20,6 +20,16 @@ SERVER_URL = "http://127.0.0.1:3000"
 
 _global_window = None
 
+# Callables run right before the process exits (e.g. flushing pending database writes)
+SHUTDOWN_HOOKS = []
+
+def run_shutdown_hooks():
+    for hook in SHUTDOWN_HOOKS:
+        try:
+            hook()
+        except Exception as e:
+            print(f"UI: Shutdown hook failed: {e}", flush=True)
+
 class WindowApi:
     def show_window(self):
         if _global_window:
@@ -44,10 +54,12 @@ class WindowApi:
         print("UI: Server lost. Closing application now.", flush=True)
         if _global_window:
             _global_window.destroy()
+        run_shutdown_hooks()
         os._exit(0) 
 
 def on_closed():
     print("SimsAIChat UI Exited.", flush=True)
+    run_shutdown_hooks()
     os._exit(0) 
 
 def get_resource_path(relative_path):
@@ -0,0 +1,281 @@
+# benchmarks/bench_database.py
+
+"""
+Synthetic-scale benchmark for Server/database.py.
+
+Fills a temporary database with realistic fake data (sim ids, group sizes, chat logs,
+summaries) at each requested size, then times every database entry point and writes a
+JSON report with p50/p95/p99 latency and throughput per operation.
+
+    python -m benchmarks.bench_database --sizes 10000,100000,1000000 --out bench.json
+    python -m benchmarks.bench_database --sizes 10000 --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from Server import database
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_ITERATIONS = 200
+REGRESSION_THRESHOLD = 0.20 # A p50/p95 more than 20% slower than the baseline is a regression
+REGRESSION_MIN_MS = 0.05 # ...unless it is within timer noise
+
+FIRST_NAMES = ["Bella", "Mortimer", "Nancy", "Geoffrey", "Don", "Dina", "Eliza", "Bob", "Travis", "Candy",
+               "Johnny", "Summer", "Liberty", "Malcolm", "Penny", "Gavin", "Ulrike", "Jade", "Katrina", "Zoe"]
+LAST_NAMES = ["Goth", "Landgraab", "Lothario", "Pancakes", "Scott", "Behr", "Caliente", "Zest", "Villareal", "Hecking"]
+PLACES = ["Goth Manor", "The Blue Velvet", "Willow Creek Park", "Oasis Springs Gym", "Myshuno Meadows", "Home"]
+TOPICS = ["the weather", "their careers", "a recent breakup", "cooking disasters", "the new neighbours",
+          "a birthday party", "aliens", "a painting", "money troubles", "a rumour about the Landgraabs"]
+MOODS = ["happily", "awkwardly", "angrily", "flirtatiously", "sadly", "nervously"]
+LINES = ["How have you been?", "I can't believe it!", "*laughs* No way.", "We should hang out more.",
+         "Ugh, don't remind me.", "That's not what I heard.", "Want a drink?", "I'm so tired today."]
+
+# --- SYNTHETIC DATA ---
+class SyntheticWorld:
+    """A fixed population of sims and the groups they tend to chat in."""
+    def __init__(self, seed=1234, population=2000):
+        self.rng = random.Random(seed)
+        self.sims = []
+        for _ in range(population):
+            sim_id = self.rng.getrandbits(63)
+            name = f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+            self.sims.append((sim_id, name))
+        self.player = self.sims[0]
+        # Players revisit the same friends: a small set of groups gets most memories
+        self.groups = [self._random_group() for _ in range(max(10, population // 4))]
+
+    def _random_group(self):
+        size = self.rng.choices([1, 2, 3], weights=[70, 20, 10])[0]
+        return [self.player] + self.rng.sample(self.sims[1:], size)
+
+    def pick_group(self):
+        # Zipf-ish popularity so some relationships get long histories
+        index = min(int(self.rng.paretovariate(1.2)) - 1, len(self.groups) - 1)
+        return self.groups[index]
+
+    def summary(self):
+        return (f"They talked {self.rng.choice(MOODS)} about {self.rng.choice(TOPICS)}, "
+                f"then drifted to {self.rng.choice(TOPICS)}. It left things a bit {self.rng.choice(MOODS)} changed.")
+
+    def memory_row(self):
+        group = self.pick_group()
+        ids = [sim_id for sim_id, _ in group]
+        names = ", ".join(["Player"] + [name for _, name in group[1:]])
+        day = self.rng.choice(["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"])
+        return ids, self.summary(), names, self.rng.choice(PLACES), f"{day}, {self.rng.randint(1, 12)}:00 PM, Summer"
+
+def populate(world, size):
+    """Bulk-loads size chat log rows and size/10 memories straight into the active shard."""
+    memories = []
+    for _ in range(max(1, size // 10)):
+        ids, summary, names, place, time_ctx = world.memory_row()
+        memories.append((json.dumps(ids), summary, names, place, time_ctx, database.make_group_key(ids)))
+
+    def chat_rows():
+        session = 0
+        for i in range(size):
+            if i % 20 == 0:
+                session += 1
+            role = "Player" if i % 2 == 0 else "AI"
+            yield ("Player" if role == "Player" else "Sim", role, world.rng.choice(LINES), f"bench{session}")
+
+    conn = database.connect_shard()
+    try:
+        conn.executemany('''
+            INSERT INTO event_memories
+            (participant_ids, summary, participants_names, location, time_context, group_key)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', memories)
+        conn.executemany('INSERT INTO conversation_history (sim_name, role, message, session_id) VALUES (?, ?, ?, ?)',
+                         chat_rows())
+        conn.executemany('INSERT OR REPLACE INTO location_context (zone_id, description) VALUES (?, ?)',
+                         [(zone_id, f"A lot with {world.rng.choice(TOPICS)}") for zone_id in range(1, 2001)])
+        conn.commit()
+    finally:
+        conn.close()
+    database.warm_location_cache()
+
+# --- MEASUREMENT ---
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def measure(fn, iterations):
+    """Calls fn() iterations times and returns latency statistics in milliseconds."""
+    samples = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    total = time.perf_counter() - start
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+        "max_ms": round(samples[-1], 4),
+        "ops_per_second": round(iterations / total, 1) if total > 0 else 0
+    }
+
+def bench_size(world, size, iterations, workdir):
+    database.DB_FILE = os.path.join(workdir, f"bench_{size}.db")
+    database.SHARD_DIR = os.path.join(workdir, f"shards_{size}")
+    database.init_db()
+    database.select_shard(None)
+
+    t0 = time.perf_counter()
+    populate(world, size)
+    load_seconds = time.perf_counter() - t0
+    print(f"[{size}] Loaded synthetic data in {load_seconds:.1f}s")
+
+    results = {}
+    rng = world.rng
+
+    def add_message():
+        database.add_message("Sim", "AI", rng.choice(LINES), "bench-live")
+    results["add_message"] = measure(add_message, iterations)
+
+    def add_message_committed():
+        database.add_message("Sim", "AI", rng.choice(LINES), "bench-live")
+        database.flush_writes()
+    results["add_message_committed"] = measure(add_message_committed, max(10, iterations // 10))
+
+    def save_event_memory():
+        database.save_event_memory(*world.memory_row())
+    results["save_event_memory"] = measure(save_event_memory, iterations)
+    database.flush_writes()
+
+    def fetch_relevant_memories():
+        database.invalidate_memory_blocks() # Measure the query, not the prompt memory cache
+        database.fetch_relevant_memories([sim_id for sim_id, _ in world.pick_group()])
+    results["fetch_relevant_memories"] = measure(fetch_relevant_memories, iterations)
+
+    cached_group = [sim_id for sim_id, _ in world.pick_group()]
+    def fetch_relevant_memories_cached():
+        database.fetch_relevant_memories(cached_group)
+    results["fetch_relevant_memories_cached"] = measure(fetch_relevant_memories_cached, iterations)
+
+    def get_location_hit():
+        database.get_location_description(rng.randint(1, 500))
+    results["get_location_description_hit"] = measure(get_location_hit, iterations)
+
+    def get_location_miss():
+        database.get_location_description(rng.getrandbits(40) + 10**6)
+    results["get_location_description_miss"] = measure(get_location_miss, iterations)
+
+    def set_location():
+        database.set_location_description(rng.randint(1, 2000), f"A lot with {rng.choice(TOPICS)}")
+    results["set_location_description"] = measure(set_location, max(10, iterations // 4))
+
+    results["get_groups_needing_digest"] = measure(database.get_groups_needing_digest, max(5, iterations // 20))
+
+    popular_key = database.make_group_key([sim_id for sim_id, _ in world.groups[0]])
+    results["get_digest_work"] = measure(lambda: database.get_digest_work(popular_key), max(10, iterations // 4))
+
+    # One-shot maintenance operations, measured once each on the populated database
+    database.RETENTION_MAX_AGE_DAYS = 0
+    database.RETENTION_MAX_ROWS = size // 2
+    database.RETENTION_MAX_BYTES = 0
+    results["apply_retention"] = measure(database.apply_retention, 1)
+    results["incremental_vacuum"] = measure(database.incremental_vacuum, 1)
+    results["purge_history"] = measure(database.purge_history, 1)
+
+    database.close_all_shards()
+    return {"rows": size, "load_seconds": round(load_seconds, 2), "operations": results}
+
+# --- REPORTING ---
+def git_revision():
+    try:
+        import subprocess
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except Exception:
+        return None
+
+def compare(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Prints a p50/p95 comparison against a baseline report. Returns the list of regressions."""
+    regressions = []
+    for size, current in report["results"].items():
+        previous = baseline.get("results", {}).get(size)
+        if not previous:
+            continue
+        print(f"\n[{size} rows] vs baseline {baseline.get('revision') or '?'}")
+        for op, stats in current["operations"].items():
+            old = previous["operations"].get(op)
+            if not old:
+                continue
+            for metric in ("p50_ms", "p95_ms"):
+                if old[metric] <= 0:
+                    continue
+                change = (stats[metric] - old[metric]) / old[metric]
+                flag = ""
+                if change > threshold and stats[metric] - old[metric] > REGRESSION_MIN_MS:
+                    flag = "  <-- REGRESSION"
+                    regressions.append((size, op, metric, change))
+                print(f"  {op:32s} {metric}: {old[metric]:9.3f} -> {stats[metric]:9.3f} ({change:+.0%}){flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Server/database.py on synthetic data.")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma separated chat log row counts (memories are a tenth of that).")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", default=None, help="Write the JSON report here (default: stdout).")
+    parser.add_argument("--compare", default=None, help="Baseline JSON report to compare against.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    workdir = tempfile.mkdtemp(prefix="simsaichat_bench_")
+    report = {
+        "version": REPORT_VERSION,
+        "revision": git_revision(),
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "results": {}
+    }
+    try:
+        for size in sizes:
+            world = SyntheticWorld(seed=args.seed)
+            report["results"][str(size)] = bench_size(world, size, args.iterations, workdir)
+    finally:
+        database.close_all_shards()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+        print(f"Report written to {args.out}")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}.")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
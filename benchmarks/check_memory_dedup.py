@@ -0,0 +1,78 @@
+# benchmarks/check_memory_dedup.py
+
+"""
+Checks the near-duplicate memory merge of Server/database.py on hand-written summaries:
+contrasting events must stay separate memories, repeats must merge into the latest one.
+
+    python -m benchmarks.check_memory_dedup
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from Server import database
+
+GROUP = [101, 202]
+
+# Same sims, similar wording, opposite outcome: never merged
+CONTRASTING = [
+    ("Bella told Mortimer she is pregnant, and he was overjoyed.",
+     "Bella told Mortimer she is not pregnant, and he was devastated."),
+    ("Don asked Dina to marry him and she said yes.",
+     "Don asked Dina to marry him and she said no."),
+    ("Bella and Mortimer talked about their careers at Goth Manor.",
+     "Bella and Mortimer argued about their careers at Goth Manor."),
+]
+
+# The same event told again: merged, and the newer wording is the one kept
+REPEATED = [
+    ("Bella and Mortimer talked about the weather at Goth Manor.",
+     "Bella and Mortimer talked about the weather at Goth Manor again."),
+]
+
+def _memories():
+    with database._db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT summary, occurrences FROM event_memories ORDER BY id')
+        return cursor.fetchall()
+
+def _save_pair(first, second):
+    database.purge_history()
+    for summary in (first, second):
+        database.save_event_memory(GROUP, summary, "Bella, Mortimer", "Goth Manor", "Monday, 2:00 PM")
+    database.flush_writes()
+    return _memories()
+
+def run_checks():
+    """Returns a list of failure messages (empty when every check passes)."""
+    failures = []
+    for first, second in CONTRASTING:
+        rows = _save_pair(first, second)
+        if len(rows) != 2:
+            failures.append(f"Merged contrasting events: {first!r} / {second!r} -> {rows}")
+    for first, second in REPEATED:
+        rows = _save_pair(first, second)
+        if rows != [(second, 2)]:
+            failures.append(f"Repeat not merged into the latest wording: {first!r} / {second!r} -> {rows}")
+    return failures
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="simsaichat_dedup_")
+    try:
+        database.DB_FILE = os.path.join(workdir, "memory.db")
+        database.SHARD_DIR = os.path.join(workdir, "shards")
+        database.init_db()
+        failures = run_checks()
+    finally:
+        database.close_all_shards()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print(f"{len(CONTRASTING) + len(REPEATED) - len(failures)}/{len(CONTRASTING) + len(REPEATED)} checks passed.")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
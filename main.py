@@ -49,5 +49,6 @@ if __name__ == '__main__':
 
     time.sleep(1)
 
-    # 3. Start UI
+    # 3. Start UI (the server shuts down in order before the UI exits the process)
+    client_ui.SHUTDOWN_HOOKS.append(server.run_shutdown_hooks)
     client_ui.start_ui()